@@ -76,4 +76,5 @@ class CableInfo(ConductorInfo):
     _enums = {"constructionKind": "CableConstructionKind", "outerJacketKind": "CableOuterJacketKind", "shieldMaterial": "CableShieldMaterialKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Balanced.Element import RefList
 
 class ConductorInfo(IdentifiedObject):
     """Conductor data.
@@ -50,11 +51,11 @@ class ConductorInfo(IdentifiedObject):
         #: Usage of this conductor. Values are: "secondary", "other", "distribution", "transmission"
         self.usage = usage
 
-        self._WireArrangements = []
-        self.WireArrangements = [] if WireArrangements is None else WireArrangements
+        if WireArrangements is not None:
+            self.WireArrangements = WireArrangements
 
-        self._ConductorSegments = []
-        self.ConductorSegments = [] if ConductorSegments is None else ConductorSegments
+        if ConductorSegments is not None:
+            self.ConductorSegments = ConductorSegments
 
         super(ConductorInfo, self).__init__(*args, **kw_args)
 
@@ -64,6 +65,7 @@ class ConductorInfo(IdentifiedObject):
     _enums = {"insulationMaterial": "ConductorInsulationKind", "usage": "ConductorUsageKind"}
     _refs = ["WireArrangements", "ConductorSegments"]
     _many_refs = ["WireArrangements", "ConductorSegments"]
+    _inverses = {"WireArrangements": "ConductorInfo", "ConductorSegments": "ConductorInfo"}
 
     def getWireArrangements(self):
         """All wire arrangements (single wires) that make this conductor.
@@ -71,7 +73,8 @@ class ConductorInfo(IdentifiedObject):
         return self._WireArrangements
 
     def setWireArrangements(self, value):
-        for x in self._WireArrangements:
+        value = RefList(value)
+        for x in list(self._WireArrangements):
             x.ConductorInfo = None
         for y in value:
             y._ConductorInfo = self
@@ -93,7 +96,8 @@ class ConductorInfo(IdentifiedObject):
         return self._ConductorSegments
 
     def setConductorSegments(self, value):
-        for x in self._ConductorSegments:
+        value = RefList(value)
+        for x in list(self._ConductorSegments):
             x.ConductorInfo = None
         for y in value:
             y._ConductorInfo = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61968.AssetModels.DistributionWindingTest import DistributionWindingTest
+from CIM14.CDPSM.Balanced.Element import RefList
 
 class ShortCircuitTest(DistributionWindingTest):
     """Short-circuit test results include load losses and leakage impedances. For three-phase windings, the excitation can be positive sequence (the default) or zero sequence. There must be at least one short-circuited ('to') winding.
@@ -45,8 +46,8 @@ class ShortCircuitTest(DistributionWindingTest):
         #: Load losses from a positive-sequence or single-phase short-circuit test.
         self.loadLoss = loadLoss
 
-        self._ShortedWindingSpecs = []
-        self.ShortedWindingSpecs = [] if ShortedWindingSpecs is None else ShortedWindingSpecs
+        if ShortedWindingSpecs is not None:
+            self.ShortedWindingSpecs = ShortedWindingSpecs
 
         super(ShortCircuitTest, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class ShortCircuitTest(DistributionWindingTest):
     _enums = {}
     _refs = ["ShortedWindingSpecs"]
     _many_refs = ["ShortedWindingSpecs"]
+    _inverses = {"ShortedWindingSpecs": "ShortCircuitTests"}
 
     def getShortedWindingSpecs(self):
         """All windings short-circuited during this test.
@@ -64,20 +66,19 @@ class ShortCircuitTest(DistributionWindingTest):
 
     def setShortedWindingSpecs(self, value):
         for p in self._ShortedWindingSpecs:
-            filtered = [q for q in p.ShortCircuitTests if q != self]
-            self._ShortedWindingSpecs._ShortCircuitTests = filtered
+            p._ShortCircuitTests.discard(self)
         for r in value:
             if self not in r._ShortCircuitTests:
-                r._ShortCircuitTests.append(self)
-        self._ShortedWindingSpecs = value
+                r._reflist("_ShortCircuitTests").append(self)
+        self._ShortedWindingSpecs = RefList(value)
 
     ShortedWindingSpecs = property(getShortedWindingSpecs, setShortedWindingSpecs)
 
     def addShortedWindingSpecs(self, *ShortedWindingSpecs):
         for obj in ShortedWindingSpecs:
             if self not in obj._ShortCircuitTests:
-                obj._ShortCircuitTests.append(self)
-            self._ShortedWindingSpecs.append(obj)
+                obj._reflist("_ShortCircuitTests").append(self)
+            self._reflist("_ShortedWindingSpecs").append(obj)
 
     def removeShortedWindingSpecs(self, *ShortedWindingSpecs):
         for obj in ShortedWindingSpecs:
@@ -21,19 +21,8 @@
 """This package is an extension of Assets package and contains the core information classes that support asset management and different network and work planning applications with specialized documentation classes describing assets of a particular product model made by a manufacturer. There are typically many instances of an asset associated with a single asset model. It also contains 'lightweight' *Info classes, which hold model attributes that can be referenced by not only Assets but also by ConductingEquipments.
 """
 
-from CIM14.CDPSM.Balanced.IEC61968.AssetModels.TransformerInfo import TransformerInfo
-from CIM14.CDPSM.Balanced.IEC61968.AssetModels.ToWindingSpec import ToWindingSpec
-from CIM14.CDPSM.Balanced.IEC61968.AssetModels.WireArrangement import WireArrangement
-from CIM14.CDPSM.Balanced.IEC61968.AssetModels.CableInfo import CableInfo
-from CIM14.CDPSM.Balanced.IEC61968.AssetModels.OpenCircuitTest import OpenCircuitTest
-from CIM14.CDPSM.Balanced.IEC61968.AssetModels.ConcentricNeutralCableInfo import ConcentricNeutralCableInfo
-from CIM14.CDPSM.Balanced.IEC61968.AssetModels.ConductorInfo import ConductorInfo
-from CIM14.CDPSM.Balanced.IEC61968.AssetModels.DistributionWindingTest import DistributionWindingTest
-from CIM14.CDPSM.Balanced.IEC61968.AssetModels.WireType import WireType
-from CIM14.CDPSM.Balanced.IEC61968.AssetModels.WindingInfo import WindingInfo
-from CIM14.CDPSM.Balanced.IEC61968.AssetModels.OverheadConductorInfo import OverheadConductorInfo
-from CIM14.CDPSM.Balanced.IEC61968.AssetModels.TapeShieldCableInfo import TapeShieldCableInfo
-from CIM14.CDPSM.Balanced.IEC61968.AssetModels.ShortCircuitTest import ShortCircuitTest
+import sys
+from CIM14.CDPSM.Balanced.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#AssetModels"
 nsPrefix = "cimAssetModels"
@@ -68,3 +57,20 @@ class CableConstructionKind(str):
     """Values are: solid, stranded, other, segmental, compacted, sector, compressed
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "TransformerInfo",
+    "ToWindingSpec",
+    "WireArrangement",
+    "CableInfo",
+    "OpenCircuitTest",
+    "ConcentricNeutralCableInfo",
+    "ConductorInfo",
+    "DistributionWindingTest",
+    "WireType",
+    "WindingInfo",
+    "OverheadConductorInfo",
+    "TapeShieldCableInfo",
+    "ShortCircuitTest",
+])
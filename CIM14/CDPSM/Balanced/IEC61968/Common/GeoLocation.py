@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61968.Common.Location import Location
+from CIM14.CDPSM.Balanced.Element import RefList
 
 class GeoLocation(Location):
     """Geographical location.
@@ -29,8 +30,8 @@ class GeoLocation(Location):
 
         @param PowerSystemResources: All power system resources at this geographical location.
         """
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         super(GeoLocation, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class GeoLocation(Location):
     _enums = {}
     _refs = ["PowerSystemResources"]
     _many_refs = ["PowerSystemResources"]
+    _inverses = {"PowerSystemResources": "GeoLocation"}
 
     def getPowerSystemResources(self):
         """All power system resources at this geographical location.
@@ -47,7 +49,8 @@ class GeoLocation(Location):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
-        for x in self._PowerSystemResources:
+        value = RefList(value)
+        for x in list(self._PowerSystemResources):
             x.GeoLocation = None
         for y in value:
             y._GeoLocation = self
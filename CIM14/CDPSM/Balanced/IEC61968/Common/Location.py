@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Balanced.Element import RefList
 
 class Location(IdentifiedObject):
     """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It may be: - Spatial location of an actual or planned structure, or a set of point-oriented structures (as a substation, structure, building, town, etc.) or diagram objects, which may be defined as a point or polygon, or, - Path of an underground or overhead conductor, or a linear diagram object.
@@ -29,8 +30,8 @@ class Location(IdentifiedObject):
 
         @param PositionPoints: Sequence of position points describing this location.
         """
-        self._PositionPoints = []
-        self.PositionPoints = [] if PositionPoints is None else PositionPoints
+        if PositionPoints is not None:
+            self.PositionPoints = PositionPoints
 
         super(Location, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class Location(IdentifiedObject):
     _enums = {}
     _refs = ["PositionPoints"]
     _many_refs = ["PositionPoints"]
+    _inverses = {"PositionPoints": "Location"}
 
     def getPositionPoints(self):
         """Sequence of position points describing this location.
@@ -47,7 +49,8 @@ class Location(IdentifiedObject):
         return self._PositionPoints
 
     def setPositionPoints(self, value):
-        for x in self._PositionPoints:
+        value = RefList(value)
+        for x in list(self._PositionPoints):
             x.Location = None
         for y in value:
             y._Location = self
@@ -80,4 +80,5 @@ class DistributionTapChanger(RatioTapChanger):
     _enums = {"monitoredPhase": "PhaseCode"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
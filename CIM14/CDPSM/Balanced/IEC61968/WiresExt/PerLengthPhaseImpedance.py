@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Balanced.Element import RefList
 
 class PerLengthPhaseImpedance(IdentifiedObject):
     """Impedance and admittance parameters per unit length for n-wire unbalanced lines, in matrix form.
@@ -34,11 +35,11 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         #: Number of phase, neutral, and other wires retained. Constrains the number of matrix elements and the phase codes that can be used with this matrix.
         self.conductorCount = conductorCount
 
-        self._PhaseImpedanceData = []
-        self.PhaseImpedanceData = [] if PhaseImpedanceData is None else PhaseImpedanceData
+        if PhaseImpedanceData is not None:
+            self.PhaseImpedanceData = PhaseImpedanceData
 
-        self._ConductorSegments = []
-        self.ConductorSegments = [] if ConductorSegments is None else ConductorSegments
+        if ConductorSegments is not None:
+            self.ConductorSegments = ConductorSegments
 
         super(PerLengthPhaseImpedance, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class PerLengthPhaseImpedance(IdentifiedObject):
     _enums = {}
     _refs = ["PhaseImpedanceData", "ConductorSegments"]
     _many_refs = ["PhaseImpedanceData", "ConductorSegments"]
+    _inverses = {"PhaseImpedanceData": "PhaseImpedance", "ConductorSegments": "PhaseImpedance"}
 
     def getPhaseImpedanceData(self):
         """All data that belong to this conductor phase impedance.
@@ -55,7 +57,8 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         return self._PhaseImpedanceData
 
     def setPhaseImpedanceData(self, value):
-        for x in self._PhaseImpedanceData:
+        value = RefList(value)
+        for x in list(self._PhaseImpedanceData):
             x.PhaseImpedance = None
         for y in value:
             y._PhaseImpedance = self
@@ -77,7 +80,8 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         return self._ConductorSegments
 
     def setConductorSegments(self, value):
-        for x in self._ConductorSegments:
+        value = RefList(value)
+        for x in list(self._ConductorSegments):
             x.PhaseImpedance = None
         for y in value:
             y._PhaseImpedance = self
@@ -56,6 +56,7 @@ class PhaseImpedanceData(Element):
     _enums = {}
     _refs = ["PhaseImpedance"]
     _many_refs = []
+    _inverses = {"PhaseImpedance": "PhaseImpedanceData"}
 
     def getPhaseImpedance(self):
         """Conductor phase impedance to which this data belongs.
@@ -64,13 +65,12 @@ class PhaseImpedanceData(Element):
 
     def setPhaseImpedance(self, value):
         if self._PhaseImpedance is not None:
-            filtered = [x for x in self.PhaseImpedance.PhaseImpedanceData if x != self]
-            self._PhaseImpedance._PhaseImpedanceData = filtered
+            self._PhaseImpedance._PhaseImpedanceData.discard(self)
 
         self._PhaseImpedance = value
         if self._PhaseImpedance is not None:
             if self not in self._PhaseImpedance._PhaseImpedanceData:
-                self._PhaseImpedance._PhaseImpedanceData.append(self)
+                self._PhaseImpedance._reflist("_PhaseImpedanceData").append(self)
 
     PhaseImpedance = property(getPhaseImpedance, setPhaseImpedance)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.Equipment import Equipment
+from CIM14.CDPSM.Balanced.Element import RefList
 
 class ConductingEquipment(Equipment):
     """The parts of the power system that are designed to carry current or that are conductively connected therewith. ConductingEquipment is contained within an EquipmentContainer that may be a Substation, or a VoltageLevel or a Bay within a Substation.
@@ -34,8 +35,8 @@ class ConductingEquipment(Equipment):
         #: Describes the phases carried by a conducting equipment. Values are: "ABC", "splitSecondary2N", "ABN", "CN", "ACN", "BC", "AN", "BN", "AB", "splitSecondary1N", "N", "C", "AC", "ABCN", "splitSecondary12N", "A", "B", "BCN"
         self.phases = phases
 
-        self._Terminals = []
-        self.Terminals = [] if Terminals is None else Terminals
+        if Terminals is not None:
+            self.Terminals = Terminals
 
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
@@ -48,6 +49,7 @@ class ConductingEquipment(Equipment):
     _enums = {"phases": "PhaseCode"}
     _refs = ["Terminals", "BaseVoltage"]
     _many_refs = ["Terminals"]
+    _inverses = {"Terminals": "ConductingEquipment", "BaseVoltage": "ConductingEquipment"}
 
     def getTerminals(self):
         """ConductingEquipment has 1 or 2 terminals that may be connected to other ConductingEquipment terminals via ConnectivityNodes
@@ -55,7 +57,8 @@ class ConductingEquipment(Equipment):
         return self._Terminals
 
     def setTerminals(self, value):
-        for x in self._Terminals:
+        value = RefList(value)
+        for x in list(self._Terminals):
             x.ConductingEquipment = None
         for y in value:
             y._ConductingEquipment = self
@@ -78,13 +81,12 @@ class ConductingEquipment(Equipment):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.ConductingEquipment if x != self]
-            self._BaseVoltage._ConductingEquipment = filtered
+            self._BaseVoltage._ConductingEquipment.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
             if self not in self._BaseVoltage._ConductingEquipment:
-                self._BaseVoltage._ConductingEquipment.append(self)
+                self._BaseVoltage._reflist("_ConductingEquipment").append(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
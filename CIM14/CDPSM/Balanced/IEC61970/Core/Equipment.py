@@ -44,6 +44,7 @@ class Equipment(PowerSystemResource):
     _enums = {}
     _refs = ["EquipmentContainer"]
     _many_refs = []
+    _inverses = {"EquipmentContainer": "Equipments"}
 
     def getEquipmentContainer(self):
         """The association is used in the naming hierarchy.
@@ -52,13 +53,12 @@ class Equipment(PowerSystemResource):
 
     def setEquipmentContainer(self, value):
         if self._EquipmentContainer is not None:
-            filtered = [x for x in self.EquipmentContainer.Equipments if x != self]
-            self._EquipmentContainer._Equipments = filtered
+            self._EquipmentContainer._Equipments.discard(self)
 
         self._EquipmentContainer = value
         if self._EquipmentContainer is not None:
             if self not in self._EquipmentContainer._Equipments:
-                self._EquipmentContainer._Equipments.append(self)
+                self._EquipmentContainer._reflist("_Equipments").append(self)
 
     EquipmentContainer = property(getEquipmentContainer, setEquipmentContainer)
 
@@ -56,4 +56,5 @@ class IdentifiedObject(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -52,6 +52,7 @@ class Terminal(IdentifiedObject):
     _enums = {}
     _refs = ["ConductingEquipment", "ConnectivityNode"]
     _many_refs = []
+    _inverses = {"ConductingEquipment": "Terminals", "ConnectivityNode": "Terminals"}
 
     def getConductingEquipment(self):
         """ConductingEquipment has 1 or 2 terminals that may be connected to other ConductingEquipment terminals via ConnectivityNodes
@@ -60,13 +61,12 @@ class Terminal(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.Terminals if x != self]
-            self._ConductingEquipment._Terminals = filtered
+            self._ConductingEquipment._Terminals.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
             if self not in self._ConductingEquipment._Terminals:
-                self._ConductingEquipment._Terminals.append(self)
+                self._ConductingEquipment._reflist("_Terminals").append(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
@@ -77,13 +77,12 @@ class Terminal(IdentifiedObject):
 
     def setConnectivityNode(self, value):
         if self._ConnectivityNode is not None:
-            filtered = [x for x in self.ConnectivityNode.Terminals if x != self]
-            self._ConnectivityNode._Terminals = filtered
+            self._ConnectivityNode._Terminals.discard(self)
 
         self._ConnectivityNode = value
         if self._ConnectivityNode is not None:
             if self not in self._ConnectivityNode._Terminals:
-                self._ConnectivityNode._Terminals.append(self)
+                self._ConnectivityNode._reflist("_Terminals").append(self)
 
     ConnectivityNode = property(getConnectivityNode, setConnectivityNode)
 
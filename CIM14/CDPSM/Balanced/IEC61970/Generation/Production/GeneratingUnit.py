@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.Equipment import Equipment
+from CIM14.CDPSM.Balanced.Element import RefList
 
 class GeneratingUnit(Equipment):
     """A single or set of synchronous machines for converting mechanical power into alternating-current power. For example, individual machines within a set may be defined for scheduling purposes while a single control signal is derived for the set. In this case there would be a GeneratingUnit for each member of the set and an additional GeneratingUnit corresponding to the set.
@@ -41,8 +42,8 @@ class GeneratingUnit(Equipment):
         #: Default Initial active power  which is used to store a powerflow result for the initial active power for this unit in this network configuration
         self.initialP = initialP
 
-        self._SynchronousMachines = []
-        self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
+        if SynchronousMachines is not None:
+            self.SynchronousMachines = SynchronousMachines
 
         super(GeneratingUnit, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class GeneratingUnit(Equipment):
     _enums = {"genControlSource": "GeneratorControlSource"}
     _refs = ["SynchronousMachines"]
     _many_refs = ["SynchronousMachines"]
+    _inverses = {"SynchronousMachines": "GeneratingUnit"}
 
     def getSynchronousMachines(self):
         """A synchronous machine may operate as a generator and as such becomes a member of a generating unit
@@ -59,7 +61,8 @@ class GeneratingUnit(Equipment):
         return self._SynchronousMachines
 
     def setSynchronousMachines(self, value):
-        for x in self._SynchronousMachines:
+        value = RefList(value)
+        for x in list(self._SynchronousMachines):
             x.GeneratingUnit = None
         for y in value:
             y._GeneratingUnit = self
@@ -21,7 +21,15 @@
 """This package contains packages that have information for Unit Commitment and Economic Dispatch of Hydro and Thermal Generating Units, Load Forecasting, Automatic Generation Control, and Unit Modeling for Dynamic Training Simulator.
 """
 
+import sys
+from CIM14.CDPSM.Balanced.Element import LazyModule
+
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Generation"
 nsPrefix = "cimGeneration"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+], [
+    "Production",
+])
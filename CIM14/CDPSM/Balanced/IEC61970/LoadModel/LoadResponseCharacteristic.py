@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Balanced.Element import RefList
 
 class LoadResponseCharacteristic(IdentifiedObject):
     """Models the characteristic response of the load demand due to to changes in system conditions such as voltage and frequency. This is not related to demand response.  If LoadResponseCharacteristic.exponentModel is True, the voltage exponents are specified and used as to calculate:  Active power component = Pnominal * (Voltage/cim:BaseVoltage.nominalVoltage) ** cim:LoadResponseCharacteristic.pVoltageExponent  Reactive power component = Qnominal * (Voltage/cim:BaseVoltage.nominalVoltage)** cim:LoadResponseCharacteristic.qVoltageExponent  Where  * means 'multiply' and ** is 'raised to power of'.
@@ -73,8 +74,8 @@ class LoadResponseCharacteristic(IdentifiedObject):
         #: Portion of active power load modeled as constant impedance.  Used only if the useExponentModel is false.    This value is noralized against the sum of pZ, pI, and pP.
         self.pConstantImpedance = pConstantImpedance
 
-        self._EnergyConsumer = []
-        self.EnergyConsumer = [] if EnergyConsumer is None else EnergyConsumer
+        if EnergyConsumer is not None:
+            self.EnergyConsumer = EnergyConsumer
 
         super(LoadResponseCharacteristic, self).__init__(*args, **kw_args)
 
@@ -84,6 +85,7 @@ class LoadResponseCharacteristic(IdentifiedObject):
     _enums = {}
     _refs = ["EnergyConsumer"]
     _many_refs = ["EnergyConsumer"]
+    _inverses = {"EnergyConsumer": "LoadResponse"}
 
     def getEnergyConsumer(self):
         """The set of loads that have the response characteristics.
@@ -91,7 +93,8 @@ class LoadResponseCharacteristic(IdentifiedObject):
         return self._EnergyConsumer
 
     def setEnergyConsumer(self, value):
-        for x in self._EnergyConsumer:
+        value = RefList(value)
+        for x in list(self._EnergyConsumer):
             x.LoadResponse = None
         for y in value:
             y._LoadResponse = self
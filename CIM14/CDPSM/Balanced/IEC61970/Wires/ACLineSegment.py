@@ -60,4 +60,5 @@ class ACLineSegment(Conductor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
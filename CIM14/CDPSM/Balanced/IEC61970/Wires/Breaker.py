@@ -40,4 +40,5 @@ class Breaker(Switch):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -60,6 +60,7 @@ class EnergyConsumer(ConductingEquipment):
     _enums = {}
     _refs = ["LoadResponse"]
     _many_refs = []
+    _inverses = {"LoadResponse": "EnergyConsumer"}
 
     def getLoadResponse(self):
         """The load response characteristic of this load.
@@ -68,13 +69,12 @@ class EnergyConsumer(ConductingEquipment):
 
     def setLoadResponse(self, value):
         if self._LoadResponse is not None:
-            filtered = [x for x in self.LoadResponse.EnergyConsumer if x != self]
-            self._LoadResponse._EnergyConsumer = filtered
+            self._LoadResponse._EnergyConsumer.discard(self)
 
         self._LoadResponse = value
         if self._LoadResponse is not None:
             if self not in self._LoadResponse._EnergyConsumer:
-                self._LoadResponse._EnergyConsumer.append(self)
+                self._LoadResponse._reflist("_EnergyConsumer").append(self)
 
     LoadResponse = property(getLoadResponse, setLoadResponse)
 
@@ -52,4 +52,5 @@ class EnergySource(ConductingEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.GIS_Connectivity.Element import RefList
 
 class ToWindingSpec(IdentifiedObject):
     """For short-circuit tests, specifies the winding and tap for all short-circuited windings.  For open-circuit tests, specifies the winding, tap, induced voltage, and induced angle for any non-excited windings that were measured during the test. This won't apply if only the exciting current and no-load losses were measured.
@@ -43,11 +44,11 @@ class ToWindingSpec(IdentifiedObject):
         #: (if open-circuit test) Phase shift measured at the open-circuited 'to' winding, with the 'from' winding set to the 'from' winding's rated voltage and all other windings open-circuited.
         self.phaseShift = phaseShift
 
-        self._OpenCircuitTests = []
-        self.OpenCircuitTests = [] if OpenCircuitTests is None else OpenCircuitTests
+        if OpenCircuitTests is not None:
+            self.OpenCircuitTests = OpenCircuitTests
 
-        self._ShortCircuitTests = []
-        self.ShortCircuitTests = [] if ShortCircuitTests is None else ShortCircuitTests
+        if ShortCircuitTests is not None:
+            self.ShortCircuitTests = ShortCircuitTests
 
         self._ToWinding = None
         self.ToWinding = ToWinding
@@ -60,6 +61,7 @@ class ToWindingSpec(IdentifiedObject):
     _enums = {}
     _refs = ["OpenCircuitTests", "ShortCircuitTests", "ToWinding"]
     _many_refs = ["OpenCircuitTests", "ShortCircuitTests"]
+    _inverses = {"OpenCircuitTests": "MeasuredWindingSpecs", "ShortCircuitTests": "ShortedWindingSpecs", "ToWinding": "ToWindingSpecs"}
 
     def getOpenCircuitTests(self):
         """All open-circuit tests in which this winding was measured.
@@ -68,20 +70,19 @@ class ToWindingSpec(IdentifiedObject):
 
     def setOpenCircuitTests(self, value):
         for p in self._OpenCircuitTests:
-            filtered = [q for q in p.MeasuredWindingSpecs if q != self]
-            self._OpenCircuitTests._MeasuredWindingSpecs = filtered
+            p._MeasuredWindingSpecs.discard(self)
         for r in value:
             if self not in r._MeasuredWindingSpecs:
-                r._MeasuredWindingSpecs.append(self)
-        self._OpenCircuitTests = value
+                r._reflist("_MeasuredWindingSpecs").append(self)
+        self._OpenCircuitTests = RefList(value)
 
     OpenCircuitTests = property(getOpenCircuitTests, setOpenCircuitTests)
 
     def addOpenCircuitTests(self, *OpenCircuitTests):
         for obj in OpenCircuitTests:
             if self not in obj._MeasuredWindingSpecs:
-                obj._MeasuredWindingSpecs.append(self)
-            self._OpenCircuitTests.append(obj)
+                obj._reflist("_MeasuredWindingSpecs").append(self)
+            self._reflist("_OpenCircuitTests").append(obj)
 
     def removeOpenCircuitTests(self, *OpenCircuitTests):
         for obj in OpenCircuitTests:
@@ -96,20 +97,19 @@ class ToWindingSpec(IdentifiedObject):
 
     def setShortCircuitTests(self, value):
         for p in self._ShortCircuitTests:
-            filtered = [q for q in p.ShortedWindingSpecs if q != self]
-            self._ShortCircuitTests._ShortedWindingSpecs = filtered
+            p._ShortedWindingSpecs.discard(self)
         for r in value:
             if self not in r._ShortedWindingSpecs:
-                r._ShortedWindingSpecs.append(self)
-        self._ShortCircuitTests = value
+                r._reflist("_ShortedWindingSpecs").append(self)
+        self._ShortCircuitTests = RefList(value)
 
     ShortCircuitTests = property(getShortCircuitTests, setShortCircuitTests)
 
     def addShortCircuitTests(self, *ShortCircuitTests):
         for obj in ShortCircuitTests:
             if self not in obj._ShortedWindingSpecs:
-                obj._ShortedWindingSpecs.append(self)
-            self._ShortCircuitTests.append(obj)
+                obj._reflist("_ShortedWindingSpecs").append(self)
+            self._reflist("_ShortCircuitTests").append(obj)
 
     def removeShortCircuitTests(self, *ShortCircuitTests):
         for obj in ShortCircuitTests:
@@ -124,13 +124,12 @@ class ToWindingSpec(IdentifiedObject):
 
     def setToWinding(self, value):
         if self._ToWinding is not None:
-            filtered = [x for x in self.ToWinding.ToWindingSpecs if x != self]
-            self._ToWinding._ToWindingSpecs = filtered
+            self._ToWinding._ToWindingSpecs.discard(self)
 
         self._ToWinding = value
         if self._ToWinding is not None:
             if self not in self._ToWinding._ToWindingSpecs:
-                self._ToWinding._ToWindingSpecs.append(self)
+                self._ToWinding._reflist("_ToWindingSpecs").append(self)
 
     ToWinding = property(getToWinding, setToWinding)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.GIS_Connectivity.Element import RefList
 
 class TransformerInfo(IdentifiedObject):
     """Set of transformer data, from an equipment library.
@@ -29,8 +30,8 @@ class TransformerInfo(IdentifiedObject):
 
         @param Transformers: All transformers that can be described with this transformer data.
         """
-        self._Transformers = []
-        self.Transformers = [] if Transformers is None else Transformers
+        if Transformers is not None:
+            self.Transformers = Transformers
 
         super(TransformerInfo, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class TransformerInfo(IdentifiedObject):
     _enums = {}
     _refs = ["Transformers"]
     _many_refs = ["Transformers"]
+    _inverses = {"Transformers": "TransformerInfo"}
 
     def getTransformers(self):
         """All transformers that can be described with this transformer data.
@@ -47,7 +49,8 @@ class TransformerInfo(IdentifiedObject):
         return self._Transformers
 
     def setTransformers(self, value):
-        for x in self._Transformers:
+        value = RefList(value)
+        for x in list(self._Transformers):
             x.TransformerInfo = None
         for y in value:
             y._TransformerInfo = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.GIS_Connectivity.Element import RefList
 
 class WindingInfo(IdentifiedObject):
     """Winding data.
@@ -43,14 +44,14 @@ class WindingInfo(IdentifiedObject):
         #: Kind of connection of this winding. Values are: "I", "Z", "Yn", "Y", "A", "D", "Zn"
         self.connectionKind = connectionKind
 
-        self._WindingTests = []
-        self.WindingTests = [] if WindingTests is None else WindingTests
+        if WindingTests is not None:
+            self.WindingTests = WindingTests
 
-        self._ToWindingSpecs = []
-        self.ToWindingSpecs = [] if ToWindingSpecs is None else ToWindingSpecs
+        if ToWindingSpecs is not None:
+            self.ToWindingSpecs = ToWindingSpecs
 
-        self._Windings = []
-        self.Windings = [] if Windings is None else Windings
+        if Windings is not None:
+            self.Windings = Windings
 
         super(WindingInfo, self).__init__(*args, **kw_args)
 
@@ -60,6 +61,7 @@ class WindingInfo(IdentifiedObject):
     _enums = {"connectionKind": "WindingConnection"}
     _refs = ["WindingTests", "ToWindingSpecs", "Windings"]
     _many_refs = ["WindingTests", "ToWindingSpecs", "Windings"]
+    _inverses = {"WindingTests": "FromWinding", "ToWindingSpecs": "ToWinding", "Windings": "WindingInfo"}
 
     def getWindingTests(self):
         """All winding tests during which voltage or current was applied to this winding.
@@ -67,7 +69,8 @@ class WindingInfo(IdentifiedObject):
         return self._WindingTests
 
     def setWindingTests(self, value):
-        for x in self._WindingTests:
+        value = RefList(value)
+        for x in list(self._WindingTests):
             x.FromWinding = None
         for y in value:
             y._FromWinding = self
@@ -89,7 +92,8 @@ class WindingInfo(IdentifiedObject):
         return self._ToWindingSpecs
 
     def setToWindingSpecs(self, value):
-        for x in self._ToWindingSpecs:
+        value = RefList(value)
+        for x in list(self._ToWindingSpecs):
             x.ToWinding = None
         for y in value:
             y._ToWinding = self
@@ -111,7 +115,8 @@ class WindingInfo(IdentifiedObject):
         return self._Windings
 
     def setWindings(self, value):
-        for x in self._Windings:
+        value = RefList(value)
+        for x in list(self._Windings):
             x.WindingInfo = None
         for y in value:
             y._WindingInfo = self
@@ -36,4 +36,5 @@ class DistributionTapChanger(RatioTapChanger):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
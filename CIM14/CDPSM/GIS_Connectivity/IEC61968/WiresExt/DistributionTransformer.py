@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.Equipment import Equipment
+from CIM14.CDPSM.GIS_Connectivity.Element import RefList
 
 class DistributionTransformer(Equipment):
     """An assembly of two or more coupled windings that transform electrical power between voltage levels. Supports both balanced and unbalanced winding connections. This class differs from Wires::PowerTransformer as follows: - it is part of a TransformerBank - it draws parameters exclusively from TransformerInfo and its associated classes.
@@ -34,8 +35,8 @@ class DistributionTransformer(Equipment):
         self._TransformerInfo = None
         self.TransformerInfo = TransformerInfo
 
-        self._Windings = []
-        self.Windings = [] if Windings is None else Windings
+        if Windings is not None:
+            self.Windings = Windings
 
         self._TransformerBank = None
         self.TransformerBank = TransformerBank
@@ -48,6 +49,7 @@ class DistributionTransformer(Equipment):
     _enums = {}
     _refs = ["TransformerInfo", "Windings", "TransformerBank"]
     _many_refs = ["Windings"]
+    _inverses = {"TransformerInfo": "Transformers", "Windings": "Transformer", "TransformerBank": "Transformers"}
 
     def getTransformerInfo(self):
         """Transformer data.
@@ -56,13 +58,12 @@ class DistributionTransformer(Equipment):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.Transformers if x != self]
-            self._TransformerInfo._Transformers = filtered
+            self._TransformerInfo._Transformers.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
             if self not in self._TransformerInfo._Transformers:
-                self._TransformerInfo._Transformers.append(self)
+                self._TransformerInfo._reflist("_Transformers").append(self)
 
     TransformerInfo = property(getTransformerInfo, setTransformerInfo)
 
@@ -72,7 +73,8 @@ class DistributionTransformer(Equipment):
         return self._Windings
 
     def setWindings(self, value):
-        for x in self._Windings:
+        value = RefList(value)
+        for x in list(self._Windings):
             x.Transformer = None
         for y in value:
             y._Transformer = self
@@ -95,13 +97,12 @@ class DistributionTransformer(Equipment):
 
     def setTransformerBank(self, value):
         if self._TransformerBank is not None:
-            filtered = [x for x in self.TransformerBank.Transformers if x != self]
-            self._TransformerBank._Transformers = filtered
+            self._TransformerBank._Transformers.discard(self)
 
         self._TransformerBank = value
         if self._TransformerBank is not None:
             if self not in self._TransformerBank._Transformers:
-                self._TransformerBank._Transformers.append(self)
+                self._TransformerBank._reflist("_Transformers").append(self)
 
     TransformerBank = property(getTransformerBank, setTransformerBank)
 
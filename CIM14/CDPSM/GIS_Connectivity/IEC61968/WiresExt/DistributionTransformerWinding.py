@@ -48,6 +48,7 @@ class DistributionTransformerWinding(ConductingEquipment):
     _enums = {}
     _refs = ["WindingInfo", "Transformer", "RatioTapChanger"]
     _many_refs = []
+    _inverses = {"WindingInfo": "Windings", "Transformer": "Windings", "RatioTapChanger": "Winding"}
 
     def getWindingInfo(self):
         """Data for this winding.
@@ -56,13 +57,12 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setWindingInfo(self, value):
         if self._WindingInfo is not None:
-            filtered = [x for x in self.WindingInfo.Windings if x != self]
-            self._WindingInfo._Windings = filtered
+            self._WindingInfo._Windings.discard(self)
 
         self._WindingInfo = value
         if self._WindingInfo is not None:
             if self not in self._WindingInfo._Windings:
-                self._WindingInfo._Windings.append(self)
+                self._WindingInfo._reflist("_Windings").append(self)
 
     WindingInfo = property(getWindingInfo, setWindingInfo)
 
@@ -73,13 +73,12 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setTransformer(self, value):
         if self._Transformer is not None:
-            filtered = [x for x in self.Transformer.Windings if x != self]
-            self._Transformer._Windings = filtered
+            self._Transformer._Windings.discard(self)
 
         self._Transformer = value
         if self._Transformer is not None:
             if self not in self._Transformer._Windings:
-                self._Transformer._Windings.append(self)
+                self._Transformer._reflist("_Windings").append(self)
 
     Transformer = property(getTransformer, setTransformer)
 
@@ -68,4 +68,5 @@ class WindingPiImpedance(IdentifiedObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -21,16 +21,21 @@
 """This package contains the information classes that extend IEC61970::Wires package with power system resources required for distribution network modelling, including unbalanced networks.
 """
 
-from CIM14.CDPSM.GIS_Connectivity.IEC61968.WiresExt.DistributionTransformerWinding import DistributionTransformerWinding
-from CIM14.CDPSM.GIS_Connectivity.IEC61968.WiresExt.DistributionLineSegment import DistributionLineSegment
-from CIM14.CDPSM.GIS_Connectivity.IEC61968.WiresExt.WindingPiImpedance import WindingPiImpedance
-from CIM14.CDPSM.GIS_Connectivity.IEC61968.WiresExt.DistributionTapChanger import DistributionTapChanger
-from CIM14.CDPSM.GIS_Connectivity.IEC61968.WiresExt.PerLengthSequenceImpedance import PerLengthSequenceImpedance
-from CIM14.CDPSM.GIS_Connectivity.IEC61968.WiresExt.TransformerBank import TransformerBank
-from CIM14.CDPSM.GIS_Connectivity.IEC61968.WiresExt.PerLengthPhaseImpedance import PerLengthPhaseImpedance
-from CIM14.CDPSM.GIS_Connectivity.IEC61968.WiresExt.DistributionTransformer import DistributionTransformer
-from CIM14.CDPSM.GIS_Connectivity.IEC61968.WiresExt.PhaseImpedanceData import PhaseImpedanceData
+import sys
+from CIM14.CDPSM.GIS_Connectivity.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#WiresExt"
 nsPrefix = "cimWiresExt"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "DistributionTransformerWinding",
+    "DistributionLineSegment",
+    "WindingPiImpedance",
+    "DistributionTapChanger",
+    "PerLengthSequenceImpedance",
+    "TransformerBank",
+    "PerLengthPhaseImpedance",
+    "DistributionTransformer",
+    "PhaseImpedanceData",
+])
@@ -21,7 +21,17 @@
 """The IEC 61968 subpackages of the CIM are developed, standardized and maintained by IEC TC57 Working Group 14: System Interfaces for Distribution Management (WG14). Currently, normative parts of the model support the needs of information exchange defined in IEC 61968-9: 'Interfaces for Meter Reading and Control' and in IEC 61968-13: 'CIM RDF Model exchange format for distribution.'
 """
 
+import sys
+from CIM14.CDPSM.GIS_Connectivity.Element import LazyModule
+
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#IEC61968"
 nsPrefix = "cimIEC61968"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+], [
+    "AssetModels",
+    "Common",
+    "WiresExt",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.GIS_Connectivity.Element import RefList
 
 class BaseVoltage(IdentifiedObject):
     """Collection of BaseVoltages which is used to verify that the BusbarSection.BaseVoltage and other voltage attributes in the CIM are given a value existing in the collection.
@@ -34,11 +35,11 @@ class BaseVoltage(IdentifiedObject):
         #: The PowerSystemResource's base voltage.
         self.nominalVoltage = nominalVoltage
 
-        self._ConductingEquipment = []
-        self.ConductingEquipment = [] if ConductingEquipment is None else ConductingEquipment
+        if ConductingEquipment is not None:
+            self.ConductingEquipment = ConductingEquipment
 
-        self._VoltageLevel = []
-        self.VoltageLevel = [] if VoltageLevel is None else VoltageLevel
+        if VoltageLevel is not None:
+            self.VoltageLevel = VoltageLevel
 
         super(BaseVoltage, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class BaseVoltage(IdentifiedObject):
     _enums = {}
     _refs = ["ConductingEquipment", "VoltageLevel"]
     _many_refs = ["ConductingEquipment", "VoltageLevel"]
+    _inverses = {"ConductingEquipment": "BaseVoltage", "VoltageLevel": "BaseVoltage"}
 
     def getConductingEquipment(self):
         """Use association to ConductingEquipment only when there is no VoltageLevel container used.
@@ -55,7 +57,8 @@ class BaseVoltage(IdentifiedObject):
         return self._ConductingEquipment
 
     def setConductingEquipment(self, value):
-        for x in self._ConductingEquipment:
+        value = RefList(value)
+        for x in list(self._ConductingEquipment):
             x.BaseVoltage = None
         for y in value:
             y._BaseVoltage = self
@@ -77,7 +80,8 @@ class BaseVoltage(IdentifiedObject):
         return self._VoltageLevel
 
     def setVoltageLevel(self, value):
-        for x in self._VoltageLevel:
+        value = RefList(value)
+        for x in list(self._VoltageLevel):
             x.BaseVoltage = None
         for y in value:
             y._BaseVoltage = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.CDPSM.GIS_Connectivity.Element import RefList
 
 class ConnectivityNodeContainer(PowerSystemResource):
     """A base class for all objects that may contain ConnectivityNodes or TopologicalNodes.
@@ -29,8 +30,8 @@ class ConnectivityNodeContainer(PowerSystemResource):
 
         @param ConnectivityNodes: Connectivity nodes contained by this container.
         """
-        self._ConnectivityNodes = []
-        self.ConnectivityNodes = [] if ConnectivityNodes is None else ConnectivityNodes
+        if ConnectivityNodes is not None:
+            self.ConnectivityNodes = ConnectivityNodes
 
         super(ConnectivityNodeContainer, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class ConnectivityNodeContainer(PowerSystemResource):
     _enums = {}
     _refs = ["ConnectivityNodes"]
     _many_refs = ["ConnectivityNodes"]
+    _inverses = {"ConnectivityNodes": "ConnectivityNodeContainer"}
 
     def getConnectivityNodes(self):
         """Connectivity nodes contained by this container.
@@ -47,7 +49,8 @@ class ConnectivityNodeContainer(PowerSystemResource):
         return self._ConnectivityNodes
 
     def setConnectivityNodes(self, value):
-        for x in self._ConnectivityNodes:
+        value = RefList(value)
+        for x in list(self._ConnectivityNodes):
             x.ConnectivityNodeContainer = None
         for y in value:
             y._ConnectivityNodeContainer = self
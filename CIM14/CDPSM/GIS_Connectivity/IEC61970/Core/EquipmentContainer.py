@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.ConnectivityNodeContainer import ConnectivityNodeContainer
+from CIM14.CDPSM.GIS_Connectivity.Element import RefList
 
 class EquipmentContainer(ConnectivityNodeContainer):
     """A modeling construct to provide a root class for all Equipment classes
@@ -29,8 +30,8 @@ class EquipmentContainer(ConnectivityNodeContainer):
 
         @param Equipments: The association is used in the naming hierarchy.
         """
-        self._Equipments = []
-        self.Equipments = [] if Equipments is None else Equipments
+        if Equipments is not None:
+            self.Equipments = Equipments
 
         super(EquipmentContainer, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class EquipmentContainer(ConnectivityNodeContainer):
     _enums = {}
     _refs = ["Equipments"]
     _many_refs = ["Equipments"]
+    _inverses = {"Equipments": "EquipmentContainer"}
 
     def getEquipments(self):
         """The association is used in the naming hierarchy.
@@ -47,7 +49,8 @@ class EquipmentContainer(ConnectivityNodeContainer):
         return self._Equipments
 
     def setEquipments(self, value):
-        for x in self._Equipments:
+        value = RefList(value)
+        for x in list(self._Equipments):
             x.EquipmentContainer = None
         for y in value:
             y._EquipmentContainer = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.GIS_Connectivity.Element import RefList
 
 class SubGeographicalRegion(IdentifiedObject):
     """A subset of a geographical region of a power system network model.
@@ -34,11 +35,11 @@ class SubGeographicalRegion(IdentifiedObject):
         self._Region = None
         self.Region = Region
 
-        self._Lines = []
-        self.Lines = [] if Lines is None else Lines
+        if Lines is not None:
+            self.Lines = Lines
 
-        self._Substations = []
-        self.Substations = [] if Substations is None else Substations
+        if Substations is not None:
+            self.Substations = Substations
 
         super(SubGeographicalRegion, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class SubGeographicalRegion(IdentifiedObject):
     _enums = {}
     _refs = ["Region", "Lines", "Substations"]
     _many_refs = ["Lines", "Substations"]
+    _inverses = {"Region": "Regions", "Lines": "Region", "Substations": "Region"}
 
     def getRegion(self):
         """The association is used in the naming hierarchy.
@@ -56,13 +58,12 @@ class SubGeographicalRegion(IdentifiedObject):
 
     def setRegion(self, value):
         if self._Region is not None:
-            filtered = [x for x in self.Region.Regions if x != self]
-            self._Region._Regions = filtered
+            self._Region._Regions.discard(self)
 
         self._Region = value
         if self._Region is not None:
             if self not in self._Region._Regions:
-                self._Region._Regions.append(self)
+                self._Region._reflist("_Regions").append(self)
 
     Region = property(getRegion, setRegion)
 
@@ -72,7 +73,8 @@ class SubGeographicalRegion(IdentifiedObject):
         return self._Lines
 
     def setLines(self, value):
-        for x in self._Lines:
+        value = RefList(value)
+        for x in list(self._Lines):
             x.Region = None
         for y in value:
             y._Region = self
@@ -94,7 +96,8 @@ class SubGeographicalRegion(IdentifiedObject):
         return self._Substations
 
     def setSubstations(self, value):
-        for x in self._Substations:
+        value = RefList(value)
+        for x in list(self._Substations):
             x.Region = None
         for y in value:
             y._Region = self
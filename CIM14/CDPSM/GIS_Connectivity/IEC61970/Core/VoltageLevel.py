@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.EquipmentContainer import EquipmentContainer
+from CIM14.CDPSM.GIS_Connectivity.Element import RefList
 
 class VoltageLevel(EquipmentContainer):
     """A collection of equipment at one common system voltage forming a switchgear. The equipment typically consist of breakers, busbars, instrumentation, control, regulation and protection devices as well as assemblies of all these.
@@ -42,8 +43,8 @@ class VoltageLevel(EquipmentContainer):
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
 
-        self._Bays = []
-        self.Bays = [] if Bays is None else Bays
+        if Bays is not None:
+            self.Bays = Bays
 
         self._Substation = None
         self.Substation = Substation
@@ -56,6 +57,7 @@ class VoltageLevel(EquipmentContainer):
     _enums = {}
     _refs = ["BaseVoltage", "Bays", "Substation"]
     _many_refs = ["Bays"]
+    _inverses = {"BaseVoltage": "VoltageLevel", "Bays": "VoltageLevel", "Substation": "VoltageLevels"}
 
     def getBaseVoltage(self):
         """The base voltage used for all equipment within the VoltageLevel.
@@ -64,13 +66,12 @@ class VoltageLevel(EquipmentContainer):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.VoltageLevel if x != self]
-            self._BaseVoltage._VoltageLevel = filtered
+            self._BaseVoltage._VoltageLevel.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
             if self not in self._BaseVoltage._VoltageLevel:
-                self._BaseVoltage._VoltageLevel.append(self)
+                self._BaseVoltage._reflist("_VoltageLevel").append(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
@@ -80,7 +81,8 @@ class VoltageLevel(EquipmentContainer):
         return self._Bays
 
     def setBays(self, value):
-        for x in self._Bays:
+        value = RefList(value)
+        for x in list(self._Bays):
             x.VoltageLevel = None
         for y in value:
             y._VoltageLevel = self
@@ -103,13 +105,12 @@ class VoltageLevel(EquipmentContainer):
 
     def setSubstation(self, value):
         if self._Substation is not None:
-            filtered = [x for x in self.Substation.VoltageLevels if x != self]
-            self._Substation._VoltageLevels = filtered
+            self._Substation._VoltageLevels.discard(self)
 
         self._Substation = value
         if self._Substation is not None:
             if self not in self._Substation._VoltageLevels:
-                self._Substation._VoltageLevels.append(self)
+                self._Substation._reflist("_VoltageLevels").append(self)
 
     Substation = property(getSubstation, setSubstation)
 
@@ -21,20 +21,8 @@
 """Contains the core PowerSystemResource and ConductingEquipment entities shared by all applications plus common collections of those entities. Not all applications require all the Core entities.  This package does not depend on any other package except the Domain package, but most of the other packages have associations and generalizations that depend on it.
 """
 
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.ConnectivityNodeContainer import ConnectivityNodeContainer
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.VoltageLevel import VoltageLevel
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.Bay import Bay
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.Equipment import Equipment
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.BaseVoltage import BaseVoltage
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.PSRType import PSRType
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.EquipmentContainer import EquipmentContainer
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.Substation import Substation
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.ConductingEquipment import ConductingEquipment
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.SubGeographicalRegion import SubGeographicalRegion
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.Terminal import Terminal
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.GeographicalRegion import GeographicalRegion
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.Core.PowerSystemResource import PowerSystemResource
+import sys
+from CIM14.CDPSM.GIS_Connectivity.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Core"
 nsPrefix = "cimCore"
@@ -44,3 +32,21 @@ class PhaseCode(str):
     """Values are: ABC, splitSecondary2N, ABN, CN, ACN, BC, AN, BN, AB, splitSecondary1N, N, C, AC, ABCN, splitSecondary12N, A, B, BCN
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ConnectivityNodeContainer",
+    "VoltageLevel",
+    "Bay",
+    "Equipment",
+    "BaseVoltage",
+    "PSRType",
+    "EquipmentContainer",
+    "IdentifiedObject",
+    "Substation",
+    "ConductingEquipment",
+    "SubGeographicalRegion",
+    "Terminal",
+    "GeographicalRegion",
+    "PowerSystemResource",
+])
@@ -80,4 +80,5 @@ class LoadResponseCharacteristic(IdentifiedObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
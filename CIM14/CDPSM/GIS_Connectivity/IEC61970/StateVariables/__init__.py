@@ -21,8 +21,13 @@
 """State variables for analysis solutions such as powerflow.
 """
 
-from CIM14.CDPSM.GIS_Connectivity.IEC61970.StateVariables.SvTapStep import SvTapStep
+import sys
+from CIM14.CDPSM.GIS_Connectivity.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#StateVariables"
 nsPrefix = "cimStateVariables"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "SvTapStep",
+])
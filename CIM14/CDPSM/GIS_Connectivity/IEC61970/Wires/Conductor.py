@@ -40,4 +40,5 @@ class Conductor(ConductingEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -48,4 +48,5 @@ class EnergyConsumer(ConductingEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -44,6 +44,7 @@ class RatioTapChanger(TapChanger):
     _enums = {"tculControlMode": "TransformerControlMode"}
     _refs = ["Winding"]
     _many_refs = []
+    _inverses = {"Winding": "RatioTapChanger"}
 
     def getWinding(self):
         """Winding to which this ratio tap changer belongs.
@@ -44,4 +44,5 @@ class ShuntCompensator(ConductingEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
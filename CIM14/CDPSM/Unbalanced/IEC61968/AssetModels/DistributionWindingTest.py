@@ -44,6 +44,7 @@ class DistributionWindingTest(IdentifiedObject):
     _enums = {}
     _refs = ["FromWinding"]
     _many_refs = []
+    _inverses = {"FromWinding": "WindingTests"}
 
     def getFromWinding(self):
         """Winding that voltage or current is applied to during the test.
@@ -52,13 +53,12 @@ class DistributionWindingTest(IdentifiedObject):
 
     def setFromWinding(self, value):
         if self._FromWinding is not None:
-            filtered = [x for x in self.FromWinding.WindingTests if x != self]
-            self._FromWinding._WindingTests = filtered
+            self._FromWinding._WindingTests.discard(self)
 
         self._FromWinding = value
         if self._FromWinding is not None:
             if self not in self._FromWinding._WindingTests:
-                self._FromWinding._WindingTests.append(self)
+                self._FromWinding._reflist("_WindingTests").append(self)
 
     FromWinding = property(getFromWinding, setFromWinding)
 
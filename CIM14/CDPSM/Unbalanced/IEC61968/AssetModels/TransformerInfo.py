@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Unbalanced.Element import RefList
 
 class TransformerInfo(IdentifiedObject):
     """Set of transformer data, from an equipment library.
@@ -30,11 +31,11 @@ class TransformerInfo(IdentifiedObject):
         @param Transformers: All transformers that can be described with this transformer data.
         @param WindingInfos: Data for all the windings described by this transformer data.
         """
-        self._Transformers = []
-        self.Transformers = [] if Transformers is None else Transformers
+        if Transformers is not None:
+            self.Transformers = Transformers
 
-        self._WindingInfos = []
-        self.WindingInfos = [] if WindingInfos is None else WindingInfos
+        if WindingInfos is not None:
+            self.WindingInfos = WindingInfos
 
         super(TransformerInfo, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class TransformerInfo(IdentifiedObject):
     _enums = {}
     _refs = ["Transformers", "WindingInfos"]
     _many_refs = ["Transformers", "WindingInfos"]
+    _inverses = {"Transformers": "TransformerInfo", "WindingInfos": "TransformerInfo"}
 
     def getTransformers(self):
         """All transformers that can be described with this transformer data.
@@ -51,7 +53,8 @@ class TransformerInfo(IdentifiedObject):
         return self._Transformers
 
     def setTransformers(self, value):
-        for x in self._Transformers:
+        value = RefList(value)
+        for x in list(self._Transformers):
             x.TransformerInfo = None
         for y in value:
             y._TransformerInfo = self
@@ -73,7 +76,8 @@ class TransformerInfo(IdentifiedObject):
         return self._WindingInfos
 
     def setWindingInfos(self, value):
-        for x in self._WindingInfos:
+        value = RefList(value)
+        for x in list(self._WindingInfos):
             x.TransformerInfo = None
         for y in value:
             y._TransformerInfo = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Unbalanced.Element import RefList
 
 class WindingInfo(IdentifiedObject):
     """Winding data.
@@ -68,17 +69,17 @@ class WindingInfo(IdentifiedObject):
         #: Apparent power that this winding can carry for a short period of time.
         self.shortTermS = shortTermS
 
-        self._WindingTests = []
-        self.WindingTests = [] if WindingTests is None else WindingTests
+        if WindingTests is not None:
+            self.WindingTests = WindingTests
 
-        self._ToWindingSpecs = []
-        self.ToWindingSpecs = [] if ToWindingSpecs is None else ToWindingSpecs
+        if ToWindingSpecs is not None:
+            self.ToWindingSpecs = ToWindingSpecs
 
         self._TransformerInfo = None
         self.TransformerInfo = TransformerInfo
 
-        self._Windings = []
-        self.Windings = [] if Windings is None else Windings
+        if Windings is not None:
+            self.Windings = Windings
 
         super(WindingInfo, self).__init__(*args, **kw_args)
 
@@ -88,6 +89,7 @@ class WindingInfo(IdentifiedObject):
     _enums = {"connectionKind": "WindingConnection"}
     _refs = ["WindingTests", "ToWindingSpecs", "TransformerInfo", "Windings"]
     _many_refs = ["WindingTests", "ToWindingSpecs", "Windings"]
+    _inverses = {"WindingTests": "FromWinding", "ToWindingSpecs": "ToWinding", "TransformerInfo": "WindingInfos", "Windings": "WindingInfo"}
 
     def getWindingTests(self):
         """All winding tests during which voltage or current was applied to this winding.
@@ -95,7 +97,8 @@ class WindingInfo(IdentifiedObject):
         return self._WindingTests
 
     def setWindingTests(self, value):
-        for x in self._WindingTests:
+        value = RefList(value)
+        for x in list(self._WindingTests):
             x.FromWinding = None
         for y in value:
             y._FromWinding = self
@@ -117,7 +120,8 @@ class WindingInfo(IdentifiedObject):
         return self._ToWindingSpecs
 
     def setToWindingSpecs(self, value):
-        for x in self._ToWindingSpecs:
+        value = RefList(value)
+        for x in list(self._ToWindingSpecs):
             x.ToWinding = None
         for y in value:
             y._ToWinding = self
@@ -140,13 +144,12 @@ class WindingInfo(IdentifiedObject):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.WindingInfos if x != self]
-            self._TransformerInfo._WindingInfos = filtered
+            self._TransformerInfo._WindingInfos.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
             if self not in self._TransformerInfo._WindingInfos:
-                self._TransformerInfo._WindingInfos.append(self)
+                self._TransformerInfo._reflist("_WindingInfos").append(self)
 
     TransformerInfo = property(getTransformerInfo, setTransformerInfo)
 
@@ -156,7 +159,8 @@ class WindingInfo(IdentifiedObject):
         return self._Windings
 
     def setWindings(self, value):
-        for x in self._Windings:
+        value = RefList(value)
+        for x in list(self._Windings):
             x.WindingInfo = None
         for y in value:
             y._WindingInfo = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Unbalanced.Element import RefList
 
 class WireType(IdentifiedObject):
     """Wire conductor (per IEEE specs). A specific type of wire or combination of wires, not insulated from each other, suitable for carrying electrical current.
@@ -78,11 +79,11 @@ class WireType(IdentifiedObject):
         #: Current carrying capacity of the wire under stated thermal conditions.
         self.ratedCurrent = ratedCurrent
 
-        self._ConcentricNeutralCableInfos = []
-        self.ConcentricNeutralCableInfos = [] if ConcentricNeutralCableInfos is None else ConcentricNeutralCableInfos
+        if ConcentricNeutralCableInfos is not None:
+            self.ConcentricNeutralCableInfos = ConcentricNeutralCableInfos
 
-        self._WireArrangements = []
-        self.WireArrangements = [] if WireArrangements is None else WireArrangements
+        if WireArrangements is not None:
+            self.WireArrangements = WireArrangements
 
         super(WireType, self).__init__(*args, **kw_args)
 
@@ -92,6 +93,7 @@ class WireType(IdentifiedObject):
     _enums = {"material": "ConductorMaterialKind"}
     _refs = ["ConcentricNeutralCableInfos", "WireArrangements"]
     _many_refs = ["ConcentricNeutralCableInfos", "WireArrangements"]
+    _inverses = {"ConcentricNeutralCableInfos": "WireType", "WireArrangements": "WireType"}
 
     def getConcentricNeutralCableInfos(self):
         """All concentric neutral cables using this wire type.
@@ -99,7 +101,8 @@ class WireType(IdentifiedObject):
         return self._ConcentricNeutralCableInfos
 
     def setConcentricNeutralCableInfos(self, value):
-        for x in self._ConcentricNeutralCableInfos:
+        value = RefList(value)
+        for x in list(self._ConcentricNeutralCableInfos):
             x.WireType = None
         for y in value:
             y._WireType = self
@@ -121,7 +124,8 @@ class WireType(IdentifiedObject):
         return self._WireArrangements
 
     def setWireArrangements(self, value):
-        for x in self._WireArrangements:
+        value = RefList(value)
+        for x in list(self._WireArrangements):
             x.WireType = None
         for y in value:
             y._WireType = self
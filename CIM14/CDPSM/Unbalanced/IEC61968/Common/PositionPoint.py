@@ -52,6 +52,7 @@ class PositionPoint(Element):
     _enums = {}
     _refs = ["Location"]
     _many_refs = []
+    _inverses = {"Location": "PositionPoints"}
 
     def getLocation(self):
         """Location that this position point describes.
@@ -60,13 +61,12 @@ class PositionPoint(Element):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PositionPoints if x != self]
-            self._Location._PositionPoints = filtered
+            self._Location._PositionPoints.discard(self)
 
         self._Location = value
         if self._Location is not None:
             if self not in self._Location._PositionPoints:
-                self._Location._PositionPoints.append(self)
+                self._Location._reflist("_PositionPoints").append(self)
 
     Location = property(getLocation, setLocation)
 
@@ -21,10 +21,15 @@
 """This package contains the information classes that support distribution management in general.
 """
 
-from CIM14.CDPSM.Unbalanced.IEC61968.Common.GeoLocation import GeoLocation
-from CIM14.CDPSM.Unbalanced.IEC61968.Common.Location import Location
-from CIM14.CDPSM.Unbalanced.IEC61968.Common.PositionPoint import PositionPoint
+import sys
+from CIM14.CDPSM.Unbalanced.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Common"
 nsPrefix = "cimCommon"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "GeoLocation",
+    "Location",
+    "PositionPoint",
+])
@@ -64,6 +64,7 @@ class DistributionTransformerWinding(ConductingEquipment):
     _enums = {}
     _refs = ["WindingInfo", "Transformer", "RatioTapChanger", "PiImpedance"]
     _many_refs = []
+    _inverses = {"WindingInfo": "Windings", "Transformer": "Windings", "RatioTapChanger": "Winding", "PiImpedance": "Windings"}
 
     def getWindingInfo(self):
         """Data for this winding.
@@ -72,13 +73,12 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setWindingInfo(self, value):
         if self._WindingInfo is not None:
-            filtered = [x for x in self.WindingInfo.Windings if x != self]
-            self._WindingInfo._Windings = filtered
+            self._WindingInfo._Windings.discard(self)
 
         self._WindingInfo = value
         if self._WindingInfo is not None:
             if self not in self._WindingInfo._Windings:
-                self._WindingInfo._Windings.append(self)
+                self._WindingInfo._reflist("_Windings").append(self)
 
     WindingInfo = property(getWindingInfo, setWindingInfo)
 
@@ -89,13 +89,12 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setTransformer(self, value):
         if self._Transformer is not None:
-            filtered = [x for x in self.Transformer.Windings if x != self]
-            self._Transformer._Windings = filtered
+            self._Transformer._Windings.discard(self)
 
         self._Transformer = value
         if self._Transformer is not None:
             if self not in self._Transformer._Windings:
-                self._Transformer._Windings.append(self)
+                self._Transformer._reflist("_Windings").append(self)
 
     Transformer = property(getTransformer, setTransformer)
 
@@ -122,13 +121,12 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setPiImpedance(self, value):
         if self._PiImpedance is not None:
-            filtered = [x for x in self.PiImpedance.Windings if x != self]
-            self._PiImpedance._Windings = filtered
+            self._PiImpedance._Windings.discard(self)
 
         self._PiImpedance = value
         if self._PiImpedance is not None:
             if self not in self._PiImpedance._Windings:
-                self._PiImpedance._Windings.append(self)
+                self._PiImpedance._reflist("_Windings").append(self)
 
     PiImpedance = property(getPiImpedance, setPiImpedance)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Unbalanced.Element import RefList
 
 class PerLengthSequenceImpedance(IdentifiedObject):
     """Sequence impedance and admittance parameters per unit length, for transposed lines of 1, 2, or 3 phases. For 1-phase lines, define x=x0=xself. For 2-phase lines, define x=xs-xm and x0=xs+xm.
@@ -53,8 +54,8 @@ class PerLengthSequenceImpedance(IdentifiedObject):
         #: Positive sequence shunt (charging) susceptance, per unit of length.
         self.bch = bch
 
-        self._ConductorSegments = []
-        self.ConductorSegments = [] if ConductorSegments is None else ConductorSegments
+        if ConductorSegments is not None:
+            self.ConductorSegments = ConductorSegments
 
         super(PerLengthSequenceImpedance, self).__init__(*args, **kw_args)
 
@@ -64,6 +65,7 @@ class PerLengthSequenceImpedance(IdentifiedObject):
     _enums = {}
     _refs = ["ConductorSegments"]
     _many_refs = ["ConductorSegments"]
+    _inverses = {"ConductorSegments": "SequenceImpedance"}
 
     def getConductorSegments(self):
         """All conductor segments described by this sequence impedance.
@@ -71,7 +73,8 @@ class PerLengthSequenceImpedance(IdentifiedObject):
         return self._ConductorSegments
 
     def setConductorSegments(self, value):
-        for x in self._ConductorSegments:
+        value = RefList(value)
+        for x in list(self._ConductorSegments):
             x.SequenceImpedance = None
         for y in value:
             y._SequenceImpedance = self
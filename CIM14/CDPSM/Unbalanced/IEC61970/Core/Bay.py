@@ -40,6 +40,7 @@ class Bay(EquipmentContainer):
     _enums = {}
     _refs = ["VoltageLevel"]
     _many_refs = []
+    _inverses = {"VoltageLevel": "Bays"}
 
     def getVoltageLevel(self):
         """The association is used in the naming hierarchy.
@@ -48,13 +49,12 @@ class Bay(EquipmentContainer):
 
     def setVoltageLevel(self, value):
         if self._VoltageLevel is not None:
-            filtered = [x for x in self.VoltageLevel.Bays if x != self]
-            self._VoltageLevel._Bays = filtered
+            self._VoltageLevel._Bays.discard(self)
 
         self._VoltageLevel = value
         if self._VoltageLevel is not None:
             if self not in self._VoltageLevel._Bays:
-                self._VoltageLevel._Bays.append(self)
+                self._VoltageLevel._reflist("_Bays").append(self)
 
     VoltageLevel = property(getVoltageLevel, setVoltageLevel)
 
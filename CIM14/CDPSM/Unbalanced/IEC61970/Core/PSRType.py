@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CDPSM.Unbalanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CDPSM.Unbalanced.Element import RefList
 
 class PSRType(IdentifiedObject):
     """Classifying instances of the same class, e.g. overhead and underground ACLineSegments. This classification mechanism is intended to provide flexibility outside the scope of this standard, i.e. provide customisation that is non standard.
@@ -29,8 +30,8 @@ class PSRType(IdentifiedObject):
 
         @param PowerSystemResources: Power system resources classified with this PSRType.
         """
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         super(PSRType, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class PSRType(IdentifiedObject):
     _enums = {}
     _refs = ["PowerSystemResources"]
     _many_refs = ["PowerSystemResources"]
+    _inverses = {"PowerSystemResources": "PSRType"}
 
     def getPowerSystemResources(self):
         """Power system resources classified with this PSRType.
@@ -47,7 +49,8 @@ class PSRType(IdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
-        for x in self._PowerSystemResources:
+        value = RefList(value)
+        for x in list(self._PowerSystemResources):
             x.PSRType = None
         for y in value:
             y._PSRType = self
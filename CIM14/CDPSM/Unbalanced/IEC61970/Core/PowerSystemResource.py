@@ -44,6 +44,7 @@ class PowerSystemResource(IdentifiedObject):
     _enums = {}
     _refs = ["GeoLocation", "PSRType"]
     _many_refs = []
+    _inverses = {"GeoLocation": "PowerSystemResources", "PSRType": "PowerSystemResources"}
 
     def getGeoLocation(self):
         """Geographical location of this power system resource.
@@ -52,13 +53,12 @@ class PowerSystemResource(IdentifiedObject):
 
     def setGeoLocation(self, value):
         if self._GeoLocation is not None:
-            filtered = [x for x in self.GeoLocation.PowerSystemResources if x != self]
-            self._GeoLocation._PowerSystemResources = filtered
+            self._GeoLocation._PowerSystemResources.discard(self)
 
         self._GeoLocation = value
         if self._GeoLocation is not None:
             if self not in self._GeoLocation._PowerSystemResources:
-                self._GeoLocation._PowerSystemResources.append(self)
+                self._GeoLocation._reflist("_PowerSystemResources").append(self)
 
     GeoLocation = property(getGeoLocation, setGeoLocation)
 
@@ -69,13 +69,12 @@ class PowerSystemResource(IdentifiedObject):
 
     def setPSRType(self, value):
         if self._PSRType is not None:
-            filtered = [x for x in self.PSRType.PowerSystemResources if x != self]
-            self._PSRType._PowerSystemResources = filtered
+            self._PSRType._PowerSystemResources.discard(self)
 
         self._PSRType = value
         if self._PSRType is not None:
             if self not in self._PSRType._PowerSystemResources:
-                self._PSRType._PowerSystemResources.append(self)
+                self._PSRType._reflist("_PowerSystemResources").append(self)
 
     PSRType = property(getPSRType, setPSRType)
 
@@ -21,7 +21,8 @@
 """The production package is responsible for classes which describe various kinds of generators. These classes also provide production costing information which is used to economically allocate demand among committed units and calculate reserve quantities.
 """
 
-from CIM14.CDPSM.Unbalanced.IEC61970.Generation.Production.GeneratingUnit import GeneratingUnit
+import sys
+from CIM14.CDPSM.Unbalanced.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Production"
 nsPrefix = "cimProduction"
@@ -31,3 +32,8 @@ class GeneratorControlSource(str):
     """Values are: onAGC, unavailable, plantControl, offAGC
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "GeneratingUnit",
+])
@@ -36,4 +36,5 @@ class BusbarSection(ConductingEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
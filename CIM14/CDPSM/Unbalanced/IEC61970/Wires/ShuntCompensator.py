@@ -56,4 +56,5 @@ class ShuntCompensator(ConductingEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -60,6 +60,7 @@ class SynchronousMachine(ConductingEquipment):
     _enums = {"operatingMode": "SynchronousMachineOperatingMode", "type": "SynchronousMachineType"}
     _refs = ["GeneratingUnit"]
     _many_refs = []
+    _inverses = {"GeneratingUnit": "SynchronousMachines"}
 
     def getGeneratingUnit(self):
         """A synchronous machine may operate as a generator and as such becomes a member of a generating unit
@@ -68,13 +69,12 @@ class SynchronousMachine(ConductingEquipment):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.SynchronousMachines if x != self]
-            self._GeneratingUnit._SynchronousMachines = filtered
+            self._GeneratingUnit._SynchronousMachines.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
             if self not in self._GeneratingUnit._SynchronousMachines:
-                self._GeneratingUnit._SynchronousMachines.append(self)
+                self._GeneratingUnit._reflist("_SynchronousMachines").append(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
@@ -80,6 +80,7 @@ class TapChanger(PowerSystemResource):
     _enums = {}
     _refs = ["SvTapStep"]
     _many_refs = []
+    _inverses = {"SvTapStep": "TapChanger"}
 
     def getSvTapStep(self):
         """The tap step state associated with the tap changer.
@@ -21,22 +21,8 @@
 """An extension to the Core and Topology package that models information on the electrical characteristics of Transmission and Distribution networks. This package is used by network applications such as State Estimation, Load Flow and Optimal Power Flow.
 """
 
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.BusbarSection import BusbarSection
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.LoadBreakSwitch import LoadBreakSwitch
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.TapChanger import TapChanger
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.Fuse import Fuse
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.Junction import Junction
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.ACLineSegment import ACLineSegment
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.Disconnector import Disconnector
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.EnergySource import EnergySource
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.SynchronousMachine import SynchronousMachine
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.RatioTapChanger import RatioTapChanger
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.EnergyConsumer import EnergyConsumer
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.Switch import Switch
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.Line import Line
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.ShuntCompensator import ShuntCompensator
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.Breaker import Breaker
-from CIM14.CDPSM.Unbalanced.IEC61970.Wires.Conductor import Conductor
+import sys
+from CIM14.CDPSM.Unbalanced.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Wires"
 nsPrefix = "cimWires"
@@ -61,3 +47,23 @@ class SynchronousMachineOperatingMode(str):
     """Values are: condenser, generator
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "BusbarSection",
+    "LoadBreakSwitch",
+    "TapChanger",
+    "Fuse",
+    "Junction",
+    "ACLineSegment",
+    "Disconnector",
+    "EnergySource",
+    "SynchronousMachine",
+    "RatioTapChanger",
+    "EnergyConsumer",
+    "Switch",
+    "Line",
+    "ShuntCompensator",
+    "Breaker",
+    "Conductor",
+])
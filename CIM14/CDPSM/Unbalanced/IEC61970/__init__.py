@@ -19,8 +19,20 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.CDPSM.Unbalanced.IEC61970.IEC61970CIMVersion import IEC61970CIMVersion
+import sys
+from CIM14.CDPSM.Unbalanced.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#IEC61970"
 nsPrefix = "cimIEC61970"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "IEC61970CIMVersion",
+], [
+    "Core",
+    "Generation",
+    "LoadModel",
+    "StateVariables",
+    "Topology",
+    "Wires",
+])
@@ -21,7 +21,8 @@
 """
 """
 
-from CIM14.CDPSM.Unbalanced.Element import Element
+import sys
+from CIM14.CDPSM.Unbalanced.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile/CDPSM/Unbalanced"
 nsPrefix = "unbal"
@@ -202,3 +203,11 @@ class CIMGDay(str):
 
 class CIMGYearMonth(str):
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Element",
+], [
+    "IEC61968",
+    "IEC61970",
+])
@@ -20,6 +20,16 @@
 
 
 
+
+import sys
+from CIM14.Element import LazyModule
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile/CDPSM"
 nsPrefix = "cdpsm"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+], [
+    "Balanced",
+    "GIS_Connectivity",
+    "Unbalanced",
+])
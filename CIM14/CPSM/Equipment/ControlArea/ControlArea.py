@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.PowerSystemResource import PowerSystemResource
+from CIM14.CPSM.Equipment.Element import RefList
 
 class ControlArea(PowerSystemResource):
     """A <b>control area </b>is a grouping of <b>generating units</b> and/or loads and a cutset of tie lines (as <b>terminals</b>) which may be used for a variety of purposes including automatic generation control, powerflow solution area interchange control specification, and input to load forecasting.   Note that any number of overlapping control area specifications can be superimposed on the physical model.
@@ -43,14 +44,14 @@ class ControlArea(PowerSystemResource):
         #: Active power net interchange tolerance
         self.pTolerance = pTolerance
 
-        self._ControlAreaGeneratingUnit = []
-        self.ControlAreaGeneratingUnit = [] if ControlAreaGeneratingUnit is None else ControlAreaGeneratingUnit
+        if ControlAreaGeneratingUnit is not None:
+            self.ControlAreaGeneratingUnit = ControlAreaGeneratingUnit
 
         self._EnergyArea = None
         self.EnergyArea = EnergyArea
 
-        self._TieFlow = []
-        self.TieFlow = [] if TieFlow is None else TieFlow
+        if TieFlow is not None:
+            self.TieFlow = TieFlow
 
         super(ControlArea, self).__init__(*args, **kw_args)
 
@@ -60,6 +61,7 @@ class ControlArea(PowerSystemResource):
     _enums = {"type": "ControlAreaTypeKind"}
     _refs = ["ControlAreaGeneratingUnit", "EnergyArea", "TieFlow"]
     _many_refs = ["ControlAreaGeneratingUnit", "TieFlow"]
+    _inverses = {"ControlAreaGeneratingUnit": "ControlArea", "EnergyArea": "ControlArea", "TieFlow": "ControlArea"}
 
     def getControlAreaGeneratingUnit(self):
         """The generating unit specificaitons for the control area.
@@ -67,7 +69,8 @@ class ControlArea(PowerSystemResource):
         return self._ControlAreaGeneratingUnit
 
     def setControlAreaGeneratingUnit(self, value):
-        for x in self._ControlAreaGeneratingUnit:
+        value = RefList(value)
+        for x in list(self._ControlAreaGeneratingUnit):
             x.ControlArea = None
         for y in value:
             y._ControlArea = self
@@ -105,7 +108,8 @@ class ControlArea(PowerSystemResource):
         return self._TieFlow
 
     def setTieFlow(self, value):
-        for x in self._TieFlow:
+        value = RefList(value)
+        for x in list(self._TieFlow):
             x.ControlArea = None
         for y in value:
             y._ControlArea = self
@@ -44,6 +44,7 @@ class ControlAreaGeneratingUnit(Element):
     _enums = {}
     _refs = ["ControlArea", "GeneratingUnit"]
     _many_refs = []
+    _inverses = {"ControlArea": "ControlAreaGeneratingUnit", "GeneratingUnit": "ControlAreaGeneratingUnit"}
 
     def getControlArea(self):
         """The parent control area for the generating unit specifications.
@@ -52,13 +53,12 @@ class ControlAreaGeneratingUnit(Element):
 
     def setControlArea(self, value):
         if self._ControlArea is not None:
-            filtered = [x for x in self.ControlArea.ControlAreaGeneratingUnit if x != self]
-            self._ControlArea._ControlAreaGeneratingUnit = filtered
+            self._ControlArea._ControlAreaGeneratingUnit.discard(self)
 
         self._ControlArea = value
         if self._ControlArea is not None:
             if self not in self._ControlArea._ControlAreaGeneratingUnit:
-                self._ControlArea._ControlAreaGeneratingUnit.append(self)
+                self._ControlArea._reflist("_ControlAreaGeneratingUnit").append(self)
 
     ControlArea = property(getControlArea, setControlArea)
 
@@ -69,13 +69,12 @@ class ControlAreaGeneratingUnit(Element):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.ControlAreaGeneratingUnit if x != self]
-            self._GeneratingUnit._ControlAreaGeneratingUnit = filtered
+            self._GeneratingUnit._ControlAreaGeneratingUnit.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
             if self not in self._GeneratingUnit._ControlAreaGeneratingUnit:
-                self._GeneratingUnit._ControlAreaGeneratingUnit.append(self)
+                self._GeneratingUnit._reflist("_ControlAreaGeneratingUnit").append(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
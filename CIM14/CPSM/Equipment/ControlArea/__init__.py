@@ -21,9 +21,8 @@
 """The ControlArea package models area specifications which can be used for a variety of purposes.  The package as a whole models potentially overlapping control area specifications for the purpose of actual generation control, load forecast area load capture, or powerflow based analysis.
 """
 
-from CIM14.CPSM.Equipment.ControlArea.ControlAreaGeneratingUnit import ControlAreaGeneratingUnit
-from CIM14.CPSM.Equipment.ControlArea.TieFlow import TieFlow
-from CIM14.CPSM.Equipment.ControlArea.ControlArea import ControlArea
+import sys
+from CIM14.CPSM.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#ControlArea"
 nsPrefix = "cimControlArea"
@@ -33,3 +32,10 @@ class ControlAreaTypeKind(str):
     """Values are: Interchange, Forecast, AGC
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ControlAreaGeneratingUnit",
+    "TieFlow",
+    "ControlArea",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.Equipment import Equipment
+from CIM14.CPSM.Equipment.Element import RefList
 
 class ConductingEquipment(Equipment):
     """The parts of the power system that are designed to carry current or that are conductively connected therewith. ConductingEquipment is contained within an EquipmentContainer that may be a Substation, or a VoltageLevel or a Bay within a Substation.
@@ -30,8 +31,8 @@ class ConductingEquipment(Equipment):
         @param Terminals: ConductingEquipment has 1 or 2 terminals that may be connected to other ConductingEquipment terminals via ConnectivityNodes
         @param BaseVoltage: Use association to ConductingEquipment only when there is no VoltageLevel container used.
         """
-        self._Terminals = []
-        self.Terminals = [] if Terminals is None else Terminals
+        if Terminals is not None:
+            self.Terminals = Terminals
 
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
@@ -44,6 +45,7 @@ class ConductingEquipment(Equipment):
     _enums = {}
     _refs = ["Terminals", "BaseVoltage"]
     _many_refs = ["Terminals"]
+    _inverses = {"Terminals": "ConductingEquipment", "BaseVoltage": "ConductingEquipment"}
 
     def getTerminals(self):
         """ConductingEquipment has 1 or 2 terminals that may be connected to other ConductingEquipment terminals via ConnectivityNodes
@@ -51,7 +53,8 @@ class ConductingEquipment(Equipment):
         return self._Terminals
 
     def setTerminals(self, value):
-        for x in self._Terminals:
+        value = RefList(value)
+        for x in list(self._Terminals):
             x.ConductingEquipment = None
         for y in value:
             y._ConductingEquipment = self
@@ -74,13 +77,12 @@ class ConductingEquipment(Equipment):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.ConductingEquipment if x != self]
-            self._BaseVoltage._ConductingEquipment = filtered
+            self._BaseVoltage._ConductingEquipment.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
             if self not in self._BaseVoltage._ConductingEquipment:
-                self._BaseVoltage._ConductingEquipment.append(self)
+                self._BaseVoltage._reflist("_ConductingEquipment").append(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import RefList
 
 class ConnectivityNode(IdentifiedObject):
     """Connectivity nodes are points where terminals of conducting equipment are connected together with zero impedance.- [R3.2] is - satisfied by navigation to SubControlArea. - [R3.3] is satisfied by navigation to BaseVoltage. - [R3.5] is satisfied by navigation to VoltageLevel - By convention, ConnectivityNodes may only be placed within VoltageLevels. 
@@ -30,8 +31,8 @@ class ConnectivityNode(IdentifiedObject):
         @param Terminals: Terminals interconnect with zero impedance at a node.  Measurements on a node apply to all of its terminals.
         @param ConnectivityNodeContainer: Container of this connectivity node.
         """
-        self._Terminals = []
-        self.Terminals = [] if Terminals is None else Terminals
+        if Terminals is not None:
+            self.Terminals = Terminals
 
         self._ConnectivityNodeContainer = None
         self.ConnectivityNodeContainer = ConnectivityNodeContainer
@@ -44,6 +45,7 @@ class ConnectivityNode(IdentifiedObject):
     _enums = {}
     _refs = ["Terminals", "ConnectivityNodeContainer"]
     _many_refs = ["Terminals"]
+    _inverses = {"Terminals": "ConnectivityNode", "ConnectivityNodeContainer": "ConnectivityNodes"}
 
     def getTerminals(self):
         """Terminals interconnect with zero impedance at a node.  Measurements on a node apply to all of its terminals.
@@ -51,7 +53,8 @@ class ConnectivityNode(IdentifiedObject):
         return self._Terminals
 
     def setTerminals(self, value):
-        for x in self._Terminals:
+        value = RefList(value)
+        for x in list(self._Terminals):
             x.ConnectivityNode = None
         for y in value:
             y._ConnectivityNode = self
@@ -74,13 +77,12 @@ class ConnectivityNode(IdentifiedObject):
 
     def setConnectivityNodeContainer(self, value):
         if self._ConnectivityNodeContainer is not None:
-            filtered = [x for x in self.ConnectivityNodeContainer.ConnectivityNodes if x != self]
-            self._ConnectivityNodeContainer._ConnectivityNodes = filtered
+            self._ConnectivityNodeContainer._ConnectivityNodes.discard(self)
 
         self._ConnectivityNodeContainer = value
         if self._ConnectivityNodeContainer is not None:
             if self not in self._ConnectivityNodeContainer._ConnectivityNodes:
-                self._ConnectivityNodeContainer._ConnectivityNodes.append(self)
+                self._ConnectivityNodeContainer._reflist("_ConnectivityNodes").append(self)
 
     ConnectivityNodeContainer = property(getConnectivityNodeContainer, setConnectivityNodeContainer)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import RefList
 
 class Curve(IdentifiedObject):
     """A multi-purpose curve or functional relationship between an independent variable (X-axis) and dependent (Y-axis) variables.
@@ -49,8 +50,8 @@ class Curve(IdentifiedObject):
         #: The X-axis units of measure. Values are: "A", "rad", "none", "g", "W/Hz", "V", "m2", "VA", "VArh", "N", "Pa", "VAh", "F", "H", "Hz-1", "W/s", "J", "m", "S", "min", "deg", "J/s", "s", "Wh", "m3", "oC", "V/VAr", "s-1", "h", "W", "ohm", "Hz", "VAr", "kg/J"
         self.xUnit = xUnit
 
-        self._CurveDatas = []
-        self.CurveDatas = [] if CurveDatas is None else CurveDatas
+        if CurveDatas is not None:
+            self.CurveDatas = CurveDatas
 
         super(Curve, self).__init__(*args, **kw_args)
 
@@ -60,6 +61,7 @@ class Curve(IdentifiedObject):
     _enums = {"y1Unit": "UnitSymbol", "y2Unit": "UnitSymbol", "y3Unit": "UnitSymbol", "curveStyle": "CurveStyle", "xUnit": "UnitSymbol"}
     _refs = ["CurveDatas"]
     _many_refs = ["CurveDatas"]
+    _inverses = {"CurveDatas": "Curve"}
 
     def getCurveDatas(self):
         """The point data values that define a curve
@@ -67,7 +69,8 @@ class Curve(IdentifiedObject):
         return self._CurveDatas
 
     def setCurveDatas(self, value):
-        for x in self._CurveDatas:
+        value = RefList(value)
+        for x in list(self._CurveDatas):
             x.Curve = None
         for y in value:
             y._Curve = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import RefList
 
 class PowerSystemResource(IdentifiedObject):
     """A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a  Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.
@@ -29,8 +30,8 @@ class PowerSystemResource(IdentifiedObject):
 
         @param Measurements: The Measurements that are included in the naming hierarchy where the PSR is the containing object
         """
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         super(PowerSystemResource, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class PowerSystemResource(IdentifiedObject):
     _enums = {}
     _refs = ["Measurements"]
     _many_refs = ["Measurements"]
+    _inverses = {"Measurements": "PowerSystemResource"}
 
     def getMeasurements(self):
         """The Measurements that are included in the naming hierarchy where the PSR is the containing object
@@ -47,7 +49,8 @@ class PowerSystemResource(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
-        for x in self._Measurements:
+        value = RefList(value)
+        for x in list(self._Measurements):
             x.PowerSystemResource = None
         for y in value:
             y._PowerSystemResource = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.BasicIntervalSchedule import BasicIntervalSchedule
+from CIM14.CPSM.Equipment.Element import RefList
 
 class RegularIntervalSchedule(BasicIntervalSchedule):
     """The schedule has TimePoints where the time between them is constant.
@@ -37,8 +38,8 @@ class RegularIntervalSchedule(BasicIntervalSchedule):
         #: The time for the last time point.
         self.endTime = endTime
 
-        self._TimePoints = []
-        self.TimePoints = [] if TimePoints is None else TimePoints
+        if TimePoints is not None:
+            self.TimePoints = TimePoints
 
         super(RegularIntervalSchedule, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class RegularIntervalSchedule(BasicIntervalSchedule):
     _enums = {}
     _refs = ["TimePoints"]
     _many_refs = ["TimePoints"]
+    _inverses = {"TimePoints": "IntervalSchedule"}
 
     def getTimePoints(self):
         """The point data values that define a curve
@@ -55,7 +57,8 @@ class RegularIntervalSchedule(BasicIntervalSchedule):
         return self._TimePoints
 
     def setTimePoints(self, value):
-        for x in self._TimePoints:
+        value = RefList(value)
+        for x in list(self._TimePoints):
             x.IntervalSchedule = None
         for y in value:
             y._IntervalSchedule = self
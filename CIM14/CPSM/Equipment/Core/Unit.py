@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.CPSM.Equipment.Element import RefList
 
 class Unit(IdentifiedObject):
     """Quantity being measured. The Unit.name shall be unique among all specified quantities and describe the quantity. The Unit.aliasName is meant to be used for localization.-  The Unit class is used to define the unit of measure (MW, kV, MVA, etc.) of a Measurement.  A Measurement must be associated with one and only one Unit.  The valid values for Unit.name are defined in Normative String Tables. 
@@ -29,8 +30,8 @@ class Unit(IdentifiedObject):
 
         @param Measurements: The Measurements having the Unit
         """
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         super(Unit, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class Unit(IdentifiedObject):
     _enums = {}
     _refs = ["Measurements"]
     _many_refs = ["Measurements"]
+    _inverses = {"Measurements": "Unit"}
 
     def getMeasurements(self):
         """The Measurements having the Unit
@@ -47,7 +49,8 @@ class Unit(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
-        for x in self._Measurements:
+        value = RefList(value)
+        for x in list(self._Measurements):
             x.Unit = None
         for y in value:
             y._Unit = self
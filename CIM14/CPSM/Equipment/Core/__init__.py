@@ -21,26 +21,8 @@
 """Contains the core PowerSystemResource and ConductingEquipment entities shared by all applications plus common collections of those entities. Not all applications require all the Core entities.  This package does not depend on any other package except the Domain package, but most of the other packages have associations and generalizations that depend on it.
 """
 
-from CIM14.CPSM.Equipment.Core.ConnectivityNodeContainer import ConnectivityNodeContainer
-from CIM14.CPSM.Equipment.Core.RegularIntervalSchedule import RegularIntervalSchedule
-from CIM14.CPSM.Equipment.Core.RegularTimePoint import RegularTimePoint
-from CIM14.CPSM.Equipment.Core.Bay import Bay
-from CIM14.CPSM.Equipment.Core.Equipment import Equipment
-from CIM14.CPSM.Equipment.Core.EquipmentContainer import EquipmentContainer
-from CIM14.CPSM.Equipment.Core.IdentifiedObject import IdentifiedObject
-from CIM14.CPSM.Equipment.Core.SubGeographicalRegion import SubGeographicalRegion
-from CIM14.CPSM.Equipment.Core.PowerSystemResource import PowerSystemResource
-from CIM14.CPSM.Equipment.Core.BasicIntervalSchedule import BasicIntervalSchedule
-from CIM14.CPSM.Equipment.Core.Curve import Curve
-from CIM14.CPSM.Equipment.Core.VoltageLevel import VoltageLevel
-from CIM14.CPSM.Equipment.Core.Unit import Unit
-from CIM14.CPSM.Equipment.Core.BaseVoltage import BaseVoltage
-from CIM14.CPSM.Equipment.Core.ConnectivityNode import ConnectivityNode
-from CIM14.CPSM.Equipment.Core.Substation import Substation
-from CIM14.CPSM.Equipment.Core.ConductingEquipment import ConductingEquipment
-from CIM14.CPSM.Equipment.Core.Terminal import Terminal
-from CIM14.CPSM.Equipment.Core.GeographicalRegion import GeographicalRegion
-from CIM14.CPSM.Equipment.Core.CurveData import CurveData
+import sys
+from CIM14.CPSM.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Core"
 nsPrefix = "cimCore"
@@ -50,3 +32,27 @@ class CurveStyle(str):
     """Values are: straightLineYValues, rampYValue, constantYValue, formula
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ConnectivityNodeContainer",
+    "RegularIntervalSchedule",
+    "RegularTimePoint",
+    "Bay",
+    "Equipment",
+    "EquipmentContainer",
+    "IdentifiedObject",
+    "SubGeographicalRegion",
+    "PowerSystemResource",
+    "BasicIntervalSchedule",
+    "Curve",
+    "VoltageLevel",
+    "Unit",
+    "BaseVoltage",
+    "ConnectivityNode",
+    "Substation",
+    "ConductingEquipment",
+    "Terminal",
+    "GeographicalRegion",
+    "CurveData",
+])
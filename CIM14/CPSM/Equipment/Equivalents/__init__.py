@@ -21,12 +21,17 @@
 """The equivalents package models equivalent networks.
 """
 
-from CIM14.CPSM.Equipment.Equivalents.EquivalentShunt import EquivalentShunt
-from CIM14.CPSM.Equipment.Equivalents.EquivalentBranch import EquivalentBranch
-from CIM14.CPSM.Equipment.Equivalents.EquivalentInjection import EquivalentInjection
-from CIM14.CPSM.Equipment.Equivalents.EquivalentEquipment import EquivalentEquipment
-from CIM14.CPSM.Equipment.Equivalents.EquivalentNetwork import EquivalentNetwork
+import sys
+from CIM14.CPSM.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Equivalents"
 nsPrefix = "cimEquivalents"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "EquivalentShunt",
+    "EquivalentBranch",
+    "EquivalentInjection",
+    "EquivalentEquipment",
+    "EquivalentNetwork",
+])
@@ -44,6 +44,7 @@ class FossilFuel(IdentifiedObject):
     _enums = {"fossilFuelType": "FuelType"}
     _refs = ["ThermalGeneratingUnit"]
     _many_refs = []
+    _inverses = {"ThermalGeneratingUnit": "FossilFuels"}
 
     def getThermalGeneratingUnit(self):
         """A thermal generating unit may have one or more fossil fuels
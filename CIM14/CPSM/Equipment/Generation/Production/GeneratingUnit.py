@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.Equipment import Equipment
+from CIM14.CPSM.Equipment.Element import RefList
 
 class GeneratingUnit(Equipment):
     """A single or set of synchronous machines for converting mechanical power into alternating-current power. For example, individual machines within a set may be defined for scheduling purposes while a single control signal is derived for the set. In this case there would be a GeneratingUnit for each member of the set and an additional GeneratingUnit corresponding to the set.-  To define a GeneratingUnit requires defining the initial real power injection, net real power limits, and the status of the unit.  The initial injection is defined using  the attribute “initialP”. -  The net real power limits can be defined in three ways; 1) with the attributes “maxOperatingP” and “minOperatingP”, or 2) with the attribute  “ratedNetMaxP” or 3) with the attributes “ratedGrossMinP” and “ratedGrossMaxP” used in conjunction with an associated GrossToNetActivePowerCurve. -  The control status of the unit is defined with the attribute “genControlSource”, but it is not required.  The participation factor attributes “longPF”, “normalPF”, and “shortPF” are not required. -  The GeneratingUnit class should only be used in cases where the more specific classes, HydroGeneratingUnit and ThermalGeneratingUnit, do not apply. -  The attributes governorSCD, maximumAllowableSpinningReserve, nominalP, startupCost, and variableCost are not required. 
@@ -91,14 +92,14 @@ class GeneratingUnit(Equipment):
         #: Generating unit economic participation factor
         self.normalPF = normalPF
 
-        self._SynchronousMachines = []
-        self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
+        if SynchronousMachines is not None:
+            self.SynchronousMachines = SynchronousMachines
 
-        self._ControlAreaGeneratingUnit = []
-        self.ControlAreaGeneratingUnit = [] if ControlAreaGeneratingUnit is None else ControlAreaGeneratingUnit
+        if ControlAreaGeneratingUnit is not None:
+            self.ControlAreaGeneratingUnit = ControlAreaGeneratingUnit
 
-        self._GrossToNetActivePowerCurves = []
-        self.GrossToNetActivePowerCurves = [] if GrossToNetActivePowerCurves is None else GrossToNetActivePowerCurves
+        if GrossToNetActivePowerCurves is not None:
+            self.GrossToNetActivePowerCurves = GrossToNetActivePowerCurves
 
         super(GeneratingUnit, self).__init__(*args, **kw_args)
 
@@ -108,6 +109,7 @@ class GeneratingUnit(Equipment):
     _enums = {"genControlSource": "GeneratorControlSource"}
     _refs = ["SynchronousMachines", "ControlAreaGeneratingUnit", "GrossToNetActivePowerCurves"]
     _many_refs = ["SynchronousMachines", "ControlAreaGeneratingUnit", "GrossToNetActivePowerCurves"]
+    _inverses = {"SynchronousMachines": "GeneratingUnit", "ControlAreaGeneratingUnit": "GeneratingUnit", "GrossToNetActivePowerCurves": "GeneratingUnit"}
 
     def getSynchronousMachines(self):
         """A synchronous machine may operate as a generator and as such becomes a member of a generating unit
@@ -115,7 +117,8 @@ class GeneratingUnit(Equipment):
         return self._SynchronousMachines
 
     def setSynchronousMachines(self, value):
-        for x in self._SynchronousMachines:
+        value = RefList(value)
+        for x in list(self._SynchronousMachines):
             x.GeneratingUnit = None
         for y in value:
             y._GeneratingUnit = self
@@ -137,7 +140,8 @@ class GeneratingUnit(Equipment):
         return self._ControlAreaGeneratingUnit
 
     def setControlAreaGeneratingUnit(self, value):
-        for x in self._ControlAreaGeneratingUnit:
+        value = RefList(value)
+        for x in list(self._ControlAreaGeneratingUnit):
             x.GeneratingUnit = None
         for y in value:
             y._GeneratingUnit = self
@@ -159,7 +163,8 @@ class GeneratingUnit(Equipment):
         return self._GrossToNetActivePowerCurves
 
     def setGrossToNetActivePowerCurves(self, value):
-        for x in self._GrossToNetActivePowerCurves:
+        value = RefList(value)
+        for x in list(self._GrossToNetActivePowerCurves):
             x.GeneratingUnit = None
         for y in value:
             y._GeneratingUnit = self
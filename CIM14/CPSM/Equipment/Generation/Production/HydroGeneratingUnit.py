@@ -36,4 +36,5 @@ class HydroGeneratingUnit(GeneratingUnit):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
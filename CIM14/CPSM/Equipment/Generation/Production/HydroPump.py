@@ -40,6 +40,7 @@ class HydroPump(PowerSystemResource):
     _enums = {}
     _refs = ["SynchronousMachine"]
     _many_refs = []
+    _inverses = {"SynchronousMachine": "HydroPump"}
 
     def getSynchronousMachine(self):
         """The synchronous machine drives the turbine which moves the water from a low elevation to a higher elevation. The direction of machine rotation for pumping may or may not be the same as for generating.
@@ -40,6 +40,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
     _enums = {}
     _refs = ["FossilFuels"]
     _many_refs = []
+    _inverses = {"FossilFuels": "ThermalGeneratingUnit"}
 
     def getFossilFuels(self):
         """A thermal generating unit may have one or more fossil fuels
@@ -21,14 +21,8 @@
 """The production package is responsible for classes which describe various kinds of generators. These classes also provide production costing information which is used to economically allocate demand among committed units and calculate reserve quantities.
 """
 
-from CIM14.CPSM.Equipment.Generation.Production.FossilFuel import FossilFuel
-from CIM14.CPSM.Equipment.Generation.Production.HydroGeneratingUnit import HydroGeneratingUnit
-from CIM14.CPSM.Equipment.Generation.Production.GrossToNetActivePowerCurve import GrossToNetActivePowerCurve
-from CIM14.CPSM.Equipment.Generation.Production.ThermalGeneratingUnit import ThermalGeneratingUnit
-from CIM14.CPSM.Equipment.Generation.Production.HydroPump import HydroPump
-from CIM14.CPSM.Equipment.Generation.Production.WindGeneratingUnit import WindGeneratingUnit
-from CIM14.CPSM.Equipment.Generation.Production.GeneratingUnit import GeneratingUnit
-from CIM14.CPSM.Equipment.Generation.Production.NuclearGeneratingUnit import NuclearGeneratingUnit
+import sys
+from CIM14.CPSM.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Production"
 nsPrefix = "cimProduction"
@@ -43,3 +37,15 @@ class GeneratorControlSource(str):
     """Values are: onAGC, unavailable, plantControl, offAGC
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "FossilFuel",
+    "HydroGeneratingUnit",
+    "GrossToNetActivePowerCurve",
+    "ThermalGeneratingUnit",
+    "HydroPump",
+    "WindGeneratingUnit",
+    "GeneratingUnit",
+    "NuclearGeneratingUnit",
+])
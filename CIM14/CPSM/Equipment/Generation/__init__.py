@@ -21,7 +21,15 @@
 """The Generation Dynamics package contains prime movers, such as turbines and boilers, which are needed for simulation and educational purposes.
 """
 
+import sys
+from CIM14.CPSM.Equipment.Element import LazyModule
+
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Generation"
 nsPrefix = "cimGeneration"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+], [
+    "Production",
+])
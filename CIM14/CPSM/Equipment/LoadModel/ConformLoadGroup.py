@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.LoadModel.LoadGroup import LoadGroup
+from CIM14.CPSM.Equipment.Element import RefList
 
 class ConformLoadGroup(LoadGroup):
     """A group of loads conforming to an allocation pattern.
@@ -30,11 +31,11 @@ class ConformLoadGroup(LoadGroup):
         @param EnergyConsumers: Conform loads assigned to this ConformLoadGroup.
         @param ConformLoadSchedules: The ConformLoadSchedules in the ConformLoadGroup.
         """
-        self._EnergyConsumers = []
-        self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
+        if EnergyConsumers is not None:
+            self.EnergyConsumers = EnergyConsumers
 
-        self._ConformLoadSchedules = []
-        self.ConformLoadSchedules = [] if ConformLoadSchedules is None else ConformLoadSchedules
+        if ConformLoadSchedules is not None:
+            self.ConformLoadSchedules = ConformLoadSchedules
 
         super(ConformLoadGroup, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class ConformLoadGroup(LoadGroup):
     _enums = {}
     _refs = ["EnergyConsumers", "ConformLoadSchedules"]
     _many_refs = ["EnergyConsumers", "ConformLoadSchedules"]
+    _inverses = {"EnergyConsumers": "LoadGroup", "ConformLoadSchedules": "ConformLoadGroup"}
 
     def getEnergyConsumers(self):
         """Conform loads assigned to this ConformLoadGroup.
@@ -51,7 +53,8 @@ class ConformLoadGroup(LoadGroup):
         return self._EnergyConsumers
 
     def setEnergyConsumers(self, value):
-        for x in self._EnergyConsumers:
+        value = RefList(value)
+        for x in list(self._EnergyConsumers):
             x.LoadGroup = None
         for y in value:
             y._LoadGroup = self
@@ -73,7 +76,8 @@ class ConformLoadGroup(LoadGroup):
         return self._ConformLoadSchedules
 
     def setConformLoadSchedules(self, value):
-        for x in self._ConformLoadSchedules:
+        value = RefList(value)
+        for x in list(self._ConformLoadSchedules):
             x.ConformLoadGroup = None
         for y in value:
             y._ConformLoadGroup = self
@@ -40,6 +40,7 @@ class ConformLoadSchedule(SeasonDayTypeSchedule):
     _enums = {}
     _refs = ["ConformLoadGroup"]
     _many_refs = []
+    _inverses = {"ConformLoadGroup": "ConformLoadSchedules"}
 
     def getConformLoadGroup(self):
         """The ConformLoadGroup where the ConformLoadSchedule belongs.
@@ -48,13 +49,12 @@ class ConformLoadSchedule(SeasonDayTypeSchedule):
 
     def setConformLoadGroup(self, value):
         if self._ConformLoadGroup is not None:
-            filtered = [x for x in self.ConformLoadGroup.ConformLoadSchedules if x != self]
-            self._ConformLoadGroup._ConformLoadSchedules = filtered
+            self._ConformLoadGroup._ConformLoadSchedules.discard(self)
 
         self._ConformLoadGroup = value
         if self._ConformLoadGroup is not None:
             if self not in self._ConformLoadGroup._ConformLoadSchedules:
-                self._ConformLoadGroup._ConformLoadSchedules.append(self)
+                self._ConformLoadGroup._reflist("_ConformLoadSchedules").append(self)
 
     ConformLoadGroup = property(getConformLoadGroup, setConformLoadGroup)
 
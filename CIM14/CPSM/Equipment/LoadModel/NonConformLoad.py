@@ -40,6 +40,7 @@ class NonConformLoad(EnergyConsumer):
     _enums = {}
     _refs = ["LoadGroup"]
     _many_refs = []
+    _inverses = {"LoadGroup": "EnergyConsumers"}
 
     def getLoadGroup(self):
         """Group of this ConformLoad.
@@ -48,13 +49,12 @@ class NonConformLoad(EnergyConsumer):
 
     def setLoadGroup(self, value):
         if self._LoadGroup is not None:
-            filtered = [x for x in self.LoadGroup.EnergyConsumers if x != self]
-            self._LoadGroup._EnergyConsumers = filtered
+            self._LoadGroup._EnergyConsumers.discard(self)
 
         self._LoadGroup = value
         if self._LoadGroup is not None:
             if self not in self._LoadGroup._EnergyConsumers:
-                self._LoadGroup._EnergyConsumers.append(self)
+                self._LoadGroup._reflist("_EnergyConsumers").append(self)
 
     LoadGroup = property(getLoadGroup, setLoadGroup)
 
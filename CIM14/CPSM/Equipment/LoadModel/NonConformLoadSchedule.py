@@ -40,6 +40,7 @@ class NonConformLoadSchedule(SeasonDayTypeSchedule):
     _enums = {}
     _refs = ["NonConformLoadGroup"]
     _many_refs = []
+    _inverses = {"NonConformLoadGroup": "NonConformLoadSchedules"}
 
     def getNonConformLoadGroup(self):
         """The NonConformLoadGroup where the NonConformLoadSchedule belongs.
@@ -48,13 +49,12 @@ class NonConformLoadSchedule(SeasonDayTypeSchedule):
 
     def setNonConformLoadGroup(self, value):
         if self._NonConformLoadGroup is not None:
-            filtered = [x for x in self.NonConformLoadGroup.NonConformLoadSchedules if x != self]
-            self._NonConformLoadGroup._NonConformLoadSchedules = filtered
+            self._NonConformLoadGroup._NonConformLoadSchedules.discard(self)
 
         self._NonConformLoadGroup = value
         if self._NonConformLoadGroup is not None:
             if self not in self._NonConformLoadGroup._NonConformLoadSchedules:
-                self._NonConformLoadGroup._NonConformLoadSchedules.append(self)
+                self._NonConformLoadGroup._reflist("_NonConformLoadSchedules").append(self)
 
     NonConformLoadGroup = property(getNonConformLoadGroup, setNonConformLoadGroup)
 
@@ -21,21 +21,8 @@
 """This package is responsible for modeling the energy consumers and the system load as curves and associated curve data. Special circumstances that may affect the load, such as seasons and daytypes, are also included here.  This information is used by Load Forecasting and Load Management.
 """
 
-from CIM14.CPSM.Equipment.LoadModel.EnergyArea import EnergyArea
-from CIM14.CPSM.Equipment.LoadModel.Season import Season
-from CIM14.CPSM.Equipment.LoadModel.SubLoadArea import SubLoadArea
-from CIM14.CPSM.Equipment.LoadModel.NonConformLoadSchedule import NonConformLoadSchedule
-from CIM14.CPSM.Equipment.LoadModel.LoadResponseCharacteristic import LoadResponseCharacteristic
-from CIM14.CPSM.Equipment.LoadModel.ConformLoadSchedule import ConformLoadSchedule
-from CIM14.CPSM.Equipment.LoadModel.NonConformLoadGroup import NonConformLoadGroup
-from CIM14.CPSM.Equipment.LoadModel.ConformLoadGroup import ConformLoadGroup
-from CIM14.CPSM.Equipment.LoadModel.ConformLoad import ConformLoad
-from CIM14.CPSM.Equipment.LoadModel.NonConformLoad import NonConformLoad
-from CIM14.CPSM.Equipment.LoadModel.StationSupply import StationSupply
-from CIM14.CPSM.Equipment.LoadModel.SeasonDayTypeSchedule import SeasonDayTypeSchedule
-from CIM14.CPSM.Equipment.LoadModel.LoadArea import LoadArea
-from CIM14.CPSM.Equipment.LoadModel.DayType import DayType
-from CIM14.CPSM.Equipment.LoadModel.LoadGroup import LoadGroup
+import sys
+from CIM14.CPSM.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#LoadModel"
 nsPrefix = "cimLoadModel"
@@ -45,3 +32,22 @@ class SeasonName(str):
     """Values are: fall, winter, spring, summer
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "EnergyArea",
+    "Season",
+    "SubLoadArea",
+    "NonConformLoadSchedule",
+    "LoadResponseCharacteristic",
+    "ConformLoadSchedule",
+    "NonConformLoadGroup",
+    "ConformLoadGroup",
+    "ConformLoad",
+    "NonConformLoad",
+    "StationSupply",
+    "SeasonDayTypeSchedule",
+    "LoadArea",
+    "DayType",
+    "LoadGroup",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Meas.Measurement import Measurement
+from CIM14.CPSM.Equipment.Element import RefList
 
 class Accumulator(Measurement):
     """Accumulator represents a accumulated (counted) Measurement, e.g. an energy value.-  The association to Terminal may not be required depending on how the Measurement is being used.  See section Use of Measurement Class for details. -  The MeasurementType class is used to define the quantity being measured (Voltage, ThreePhaseActivePower, etc.) by a Measurement.  A Measurement must be associated with one and only one measurementType.  The valid values for MeasurementType.name are defined in Normative String Tables. 
@@ -29,8 +30,8 @@ class Accumulator(Measurement):
 
         @param AccumulatorValues: The values connected to this measurement.
         """
-        self._AccumulatorValues = []
-        self.AccumulatorValues = [] if AccumulatorValues is None else AccumulatorValues
+        if AccumulatorValues is not None:
+            self.AccumulatorValues = AccumulatorValues
 
         super(Accumulator, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class Accumulator(Measurement):
     _enums = {}
     _refs = ["AccumulatorValues"]
     _many_refs = ["AccumulatorValues"]
+    _inverses = {"AccumulatorValues": "Accumulator"}
 
     def getAccumulatorValues(self):
         """The values connected to this measurement.
@@ -47,7 +49,8 @@ class Accumulator(Measurement):
         return self._AccumulatorValues
 
     def setAccumulatorValues(self, value):
-        for x in self._AccumulatorValues:
+        value = RefList(value)
+        for x in list(self._AccumulatorValues):
             x.Accumulator = None
         for y in value:
             y._Accumulator = self
@@ -40,6 +40,7 @@ class AccumulatorValue(MeasurementValue):
     _enums = {}
     _refs = ["Accumulator"]
     _many_refs = []
+    _inverses = {"Accumulator": "AccumulatorValues"}
 
     def getAccumulator(self):
         """Measurement to which this value is connected.
@@ -48,13 +49,12 @@ class AccumulatorValue(MeasurementValue):
 
     def setAccumulator(self, value):
         if self._Accumulator is not None:
-            filtered = [x for x in self.Accumulator.AccumulatorValues if x != self]
-            self._Accumulator._AccumulatorValues = filtered
+            self._Accumulator._AccumulatorValues.discard(self)
 
         self._Accumulator = value
         if self._Accumulator is not None:
             if self not in self._Accumulator._AccumulatorValues:
-                self._Accumulator._AccumulatorValues.append(self)
+                self._Accumulator._reflist("_AccumulatorValues").append(self)
 
     Accumulator = property(getAccumulator, setAccumulator)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Meas.Measurement import Measurement
+from CIM14.CPSM.Equipment.Element import RefList
 
 class Analog(Measurement):
     """Analog represents an analog Measurement.-  The positiveFlowIn attribute is only required if the Measurement measures a directional flow of power. -  The association to Terminal may not be required depending on how the Measurement is being used.  See section Use of Measurement Class for details. -  The MeasurementType class is used to define the quantity being measured (Voltage, ThreePhaseActivePower, etc.) by a Measurement.  A Measurement must be associated with one and only one measurementType.  The valid values for MeasurementType.name are defined in Normative String Tables. 
@@ -33,8 +34,8 @@ class Analog(Measurement):
         #: If true then this measurement is an active power, reactive power or current with the convention that a positive value measured at the Terminal means power is flowing into the related PowerSystemResource.
         self.positiveFlowIn = positiveFlowIn
 
-        self._AnalogValues = []
-        self.AnalogValues = [] if AnalogValues is None else AnalogValues
+        if AnalogValues is not None:
+            self.AnalogValues = AnalogValues
 
         super(Analog, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class Analog(Measurement):
     _enums = {}
     _refs = ["AnalogValues"]
     _many_refs = ["AnalogValues"]
+    _inverses = {"AnalogValues": "Analog"}
 
     def getAnalogValues(self):
         """The values connected to this measurement.
@@ -51,7 +53,8 @@ class Analog(Measurement):
         return self._AnalogValues
 
     def setAnalogValues(self, value):
-        for x in self._AnalogValues:
+        value = RefList(value)
+        for x in list(self._AnalogValues):
             x.Analog = None
         for y in value:
             y._Analog = self
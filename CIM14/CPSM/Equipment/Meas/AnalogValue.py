@@ -40,6 +40,7 @@ class AnalogValue(MeasurementValue):
     _enums = {}
     _refs = ["Analog"]
     _many_refs = []
+    _inverses = {"Analog": "AnalogValues"}
 
     def getAnalog(self):
         """Measurement to which this value is connected.
@@ -48,13 +49,12 @@ class AnalogValue(MeasurementValue):
 
     def setAnalog(self, value):
         if self._Analog is not None:
-            filtered = [x for x in self.Analog.AnalogValues if x != self]
-            self._Analog._AnalogValues = filtered
+            self._Analog._AnalogValues.discard(self)
 
         self._Analog = value
         if self._Analog is not None:
             if self not in self._Analog._AnalogValues:
-                self._Analog._AnalogValues.append(self)
+                self._Analog._reflist("_AnalogValues").append(self)
 
     Analog = property(getAnalog, setAnalog)
 
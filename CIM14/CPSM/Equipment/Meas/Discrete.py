@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Meas.Measurement import Measurement
+from CIM14.CPSM.Equipment.Element import RefList
 
 class Discrete(Measurement):
     """Discrete represents a discrete Measurement, i.e. a Measurement reprsenting discrete values, e.g. a Breaker position.-  The association to Terminal may not be required depending on how the Measurement is being used.  See section Use of Measurement Class for details. -  The MeasurementType class is used to define the quantity being measured (Voltage, ThreePhaseActivePower, etc.) by a Measurement.  A Measurement must be associated with one and only one measurementType.  The valid values for the MeasurementType name are defined in Normative String Tables. 
@@ -29,8 +30,8 @@ class Discrete(Measurement):
 
         @param DiscreteValues: The values connected to this measurement.
         """
-        self._DiscreteValues = []
-        self.DiscreteValues = [] if DiscreteValues is None else DiscreteValues
+        if DiscreteValues is not None:
+            self.DiscreteValues = DiscreteValues
 
         super(Discrete, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class Discrete(Measurement):
     _enums = {}
     _refs = ["DiscreteValues"]
     _many_refs = ["DiscreteValues"]
+    _inverses = {"DiscreteValues": "Discrete"}
 
     def getDiscreteValues(self):
         """The values connected to this measurement.
@@ -47,7 +49,8 @@ class Discrete(Measurement):
         return self._DiscreteValues
 
     def setDiscreteValues(self, value):
-        for x in self._DiscreteValues:
+        value = RefList(value)
+        for x in list(self._DiscreteValues):
             x.Discrete = None
         for y in value:
             y._Discrete = self
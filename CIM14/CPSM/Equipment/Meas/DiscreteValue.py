@@ -40,6 +40,7 @@ class DiscreteValue(MeasurementValue):
     _enums = {}
     _refs = ["Discrete"]
     _many_refs = []
+    _inverses = {"Discrete": "DiscreteValues"}
 
     def getDiscrete(self):
         """Measurement to which this value is connected.
@@ -48,13 +49,12 @@ class DiscreteValue(MeasurementValue):
 
     def setDiscrete(self, value):
         if self._Discrete is not None:
-            filtered = [x for x in self.Discrete.DiscreteValues if x != self]
-            self._Discrete._DiscreteValues = filtered
+            self._Discrete._DiscreteValues.discard(self)
 
         self._Discrete = value
         if self._Discrete is not None:
             if self not in self._Discrete._DiscreteValues:
-                self._Discrete._DiscreteValues.append(self)
+                self._Discrete._reflist("_DiscreteValues").append(self)
 
     Discrete = property(getDiscrete, setDiscrete)
 
@@ -40,6 +40,7 @@ class MeasurementValue(IdentifiedObject):
     _enums = {}
     _refs = ["MeasurementValueSource"]
     _many_refs = []
+    _inverses = {"MeasurementValueSource": "MeasurementValues"}
 
     def getMeasurementValueSource(self):
         """A reference to the type of source that updates the MeasurementValue, e.g. SCADA, CCLink, manual, etc. User conventions for the names of sources are contained in the introduction to IEC 61970-301.
@@ -48,13 +49,12 @@ class MeasurementValue(IdentifiedObject):
 
     def setMeasurementValueSource(self, value):
         if self._MeasurementValueSource is not None:
-            filtered = [x for x in self.MeasurementValueSource.MeasurementValues if x != self]
-            self._MeasurementValueSource._MeasurementValues = filtered
+            self._MeasurementValueSource._MeasurementValues.discard(self)
 
         self._MeasurementValueSource = value
         if self._MeasurementValueSource is not None:
             if self not in self._MeasurementValueSource._MeasurementValues:
-                self._MeasurementValueSource._MeasurementValues.append(self)
+                self._MeasurementValueSource._reflist("_MeasurementValues").append(self)
 
     MeasurementValueSource = property(getMeasurementValueSource, setMeasurementValueSource)
 
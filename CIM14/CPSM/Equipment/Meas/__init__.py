@@ -21,16 +21,21 @@
 """Contains entities that describe dynamic measurement data exchanged between applications.
 """
 
-from CIM14.CPSM.Equipment.Meas.AccumulatorValue import AccumulatorValue
-from CIM14.CPSM.Equipment.Meas.Accumulator import Accumulator
-from CIM14.CPSM.Equipment.Meas.Discrete import Discrete
-from CIM14.CPSM.Equipment.Meas.AnalogValue import AnalogValue
-from CIM14.CPSM.Equipment.Meas.Analog import Analog
-from CIM14.CPSM.Equipment.Meas.MeasurementValueSource import MeasurementValueSource
-from CIM14.CPSM.Equipment.Meas.Measurement import Measurement
-from CIM14.CPSM.Equipment.Meas.DiscreteValue import DiscreteValue
-from CIM14.CPSM.Equipment.Meas.MeasurementValue import MeasurementValue
+import sys
+from CIM14.CPSM.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Meas"
 nsPrefix = "cimMeas"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "AccumulatorValue",
+    "Accumulator",
+    "Discrete",
+    "AnalogValue",
+    "Analog",
+    "MeasurementValueSource",
+    "Measurement",
+    "DiscreteValue",
+    "MeasurementValue",
+])
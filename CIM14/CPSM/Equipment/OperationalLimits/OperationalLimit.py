@@ -44,6 +44,7 @@ class OperationalLimit(IdentifiedObject):
     _enums = {}
     _refs = ["OperationalLimitSet"]
     _many_refs = []
+    _inverses = {"OperationalLimitSet": "OperationalLimitValue"}
 
     def getOperationalLimitSet(self):
         """The limit set to which the limit values belong.
@@ -52,13 +53,12 @@ class OperationalLimit(IdentifiedObject):
 
     def setOperationalLimitSet(self, value):
         if self._OperationalLimitSet is not None:
-            filtered = [x for x in self.OperationalLimitSet.OperationalLimitValue if x != self]
-            self._OperationalLimitSet._OperationalLimitValue = filtered
+            self._OperationalLimitSet._OperationalLimitValue.discard(self)
 
         self._OperationalLimitSet = value
         if self._OperationalLimitSet is not None:
             if self not in self._OperationalLimitSet._OperationalLimitValue:
-                self._OperationalLimitSet._OperationalLimitValue.append(self)
+                self._OperationalLimitSet._reflist("_OperationalLimitValue").append(self)
 
     OperationalLimitSet = property(getOperationalLimitSet, setOperationalLimitSet)
 
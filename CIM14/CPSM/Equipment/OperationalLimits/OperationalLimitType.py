@@ -44,4 +44,5 @@ class OperationalLimitType(IdentifiedObject):
     _enums = {"direction": "OperationalLimitDirectionKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
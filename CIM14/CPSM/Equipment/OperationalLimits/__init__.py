@@ -21,13 +21,8 @@
 """The OperationalLimits package models a specification of limits associated with equipment and other operational entities.
 """
 
-from CIM14.CPSM.Equipment.OperationalLimits.ApparentPowerLimit import ApparentPowerLimit
-from CIM14.CPSM.Equipment.OperationalLimits.OperationalLimit import OperationalLimit
-from CIM14.CPSM.Equipment.OperationalLimits.CurrentLimit import CurrentLimit
-from CIM14.CPSM.Equipment.OperationalLimits.VoltageLimit import VoltageLimit
-from CIM14.CPSM.Equipment.OperationalLimits.ActivePowerLimit import ActivePowerLimit
-from CIM14.CPSM.Equipment.OperationalLimits.OperationalLimitSet import OperationalLimitSet
-from CIM14.CPSM.Equipment.OperationalLimits.OperationalLimitType import OperationalLimitType
+import sys
+from CIM14.CPSM.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#OperationalLimits"
 nsPrefix = "cimOperationalLimits"
@@ -37,3 +32,14 @@ class OperationalLimitDirectionKind(str):
     """Values are: high, absoluteValue, low
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ApparentPowerLimit",
+    "OperationalLimit",
+    "CurrentLimit",
+    "VoltageLimit",
+    "ActivePowerLimit",
+    "OperationalLimitSet",
+    "OperationalLimitType",
+])
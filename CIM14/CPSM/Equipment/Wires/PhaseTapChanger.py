@@ -72,6 +72,7 @@ class PhaseTapChanger(TapChanger):
     _enums = {"phaseTapChangerType": "PhaseTapChangerKind"}
     _refs = ["TransformerWinding", "PhaseVariationCurve"]
     _many_refs = []
+    _inverses = {"TransformerWinding": "PhaseTapChanger", "PhaseVariationCurve": "PhaseTapChanger"}
 
     def getTransformerWinding(self):
         """The transformer winding to which the phase tap changer belongs.
@@ -40,6 +40,7 @@ class PhaseVariationCurve(Curve):
     _enums = {}
     _refs = ["PhaseTapChanger"]
     _many_refs = []
+    _inverses = {"PhaseTapChanger": "PhaseVariationCurve"}
 
     def getPhaseTapChanger(self):
         """A PhaseVariationCurve defines phase shift changes for a PhaseTapChanger.
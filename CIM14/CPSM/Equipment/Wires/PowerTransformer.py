@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.Equipment import Equipment
+from CIM14.CPSM.Equipment.Element import RefList
 
 class PowerTransformer(Equipment):
     """An electrical device consisting of  two or more coupled windings, with or without a magnetic core, for introducing mutual coupling between electric circuits. Transformers can be used to control voltage and phase shift (active power flow).A PowerTransformer can be either two winding or three winding. -  A two winding transformer has two TransformerWindings -  A three winding transformer has three TransformerWindings 
@@ -29,8 +30,8 @@ class PowerTransformer(Equipment):
 
         @param TransformerWindings: A transformer has windings
         """
-        self._TransformerWindings = []
-        self.TransformerWindings = [] if TransformerWindings is None else TransformerWindings
+        if TransformerWindings is not None:
+            self.TransformerWindings = TransformerWindings
 
         super(PowerTransformer, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class PowerTransformer(Equipment):
     _enums = {}
     _refs = ["TransformerWindings"]
     _many_refs = ["TransformerWindings"]
+    _inverses = {"TransformerWindings": "PowerTransformer"}
 
     def getTransformerWindings(self):
         """A transformer has windings
@@ -47,7 +49,8 @@ class PowerTransformer(Equipment):
         return self._TransformerWindings
 
     def setTransformerWindings(self, value):
-        for x in self._TransformerWindings:
+        value = RefList(value)
+        for x in list(self._TransformerWindings):
             x.PowerTransformer = None
         for y in value:
             y._PowerTransformer = self
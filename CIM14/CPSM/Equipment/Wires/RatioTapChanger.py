@@ -48,6 +48,7 @@ class RatioTapChanger(TapChanger):
     _enums = {"tculControlMode": "TransformerControlMode"}
     _refs = ["RatioVariationCurve", "TransformerWinding"]
     _many_refs = []
+    _inverses = {"RatioVariationCurve": "RatioTapChanger", "TransformerWinding": "RatioTapChanger"}
 
     def getRatioVariationCurve(self):
         """A RatioTapChanger can have an associated RatioVariationCurve to define tap ratio variations with tap step changes.
@@ -40,6 +40,7 @@ class RatioVariationCurve(Curve):
     _enums = {}
     _refs = ["RatioTapChanger"]
     _many_refs = []
+    _inverses = {"RatioTapChanger": "RatioVariationCurve"}
 
     def getRatioTapChanger(self):
         """A RatioVariationCurve defines tap ratio changes for a RatioTapChanger.
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.Curve import Curve
+from CIM14.CPSM.Equipment.Element import RefList
 
 class ReactiveCapabilityCurve(Curve):
     """Reactive power rating envelope versus the synchronous machine's active power, in both the generating and motoring modes. For each active power value there is a corresponding high and low reactive power limit  value. Typically there will be a separate curve for each coolant condition, such as hydrogen pressure.  The Y1 axis values represent reactive minimum and the Y2 axis values represent reactive maximum.-  ReactiveCapabilityCurves are not required if the reactive power limits of the SynchronousMachine do not vary with real power output. -  By convention, the Y1 axis values represent reactive minimum and the Y2 axis values represent reactive maximum. -  Because the x value will always be specified in MW and the y values will always be specified in MVAr, the xMultiplier, y1Multiplier, and y2Multiplier attributes do not need to be supplied. 
@@ -29,8 +30,8 @@ class ReactiveCapabilityCurve(Curve):
 
         @param InitiallyUsedBySynchronousMachines: Synchronous machines using this curve as default.
         """
-        self._InitiallyUsedBySynchronousMachines = []
-        self.InitiallyUsedBySynchronousMachines = [] if InitiallyUsedBySynchronousMachines is None else InitiallyUsedBySynchronousMachines
+        if InitiallyUsedBySynchronousMachines is not None:
+            self.InitiallyUsedBySynchronousMachines = InitiallyUsedBySynchronousMachines
 
         super(ReactiveCapabilityCurve, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class ReactiveCapabilityCurve(Curve):
     _enums = {}
     _refs = ["InitiallyUsedBySynchronousMachines"]
     _many_refs = ["InitiallyUsedBySynchronousMachines"]
+    _inverses = {"InitiallyUsedBySynchronousMachines": "InitialReactiveCapabilityCurve"}
 
     def getInitiallyUsedBySynchronousMachines(self):
         """Synchronous machines using this curve as default.
@@ -47,7 +49,8 @@ class ReactiveCapabilityCurve(Curve):
         return self._InitiallyUsedBySynchronousMachines
 
     def setInitiallyUsedBySynchronousMachines(self, value):
-        for x in self._InitiallyUsedBySynchronousMachines:
+        value = RefList(value)
+        for x in list(self._InitiallyUsedBySynchronousMachines):
             x.InitialReactiveCapabilityCurve = None
         for y in value:
             y._InitialReactiveCapabilityCurve = self
@@ -40,6 +40,7 @@ class RegulatingCondEq(ConductingEquipment):
     _enums = {}
     _refs = ["RegulatingControl"]
     _many_refs = []
+    _inverses = {"RegulatingControl": "RegulatingCondEq"}
 
     def getRegulatingControl(self):
         """The regulating control scheme in which this equipment participates.
@@ -48,13 +49,12 @@ class RegulatingCondEq(ConductingEquipment):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulatingCondEq if x != self]
-            self._RegulatingControl._RegulatingCondEq = filtered
+            self._RegulatingControl._RegulatingCondEq.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
             if self not in self._RegulatingControl._RegulatingCondEq:
-                self._RegulatingControl._RegulatingCondEq.append(self)
+                self._RegulatingControl._reflist("_RegulatingCondEq").append(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
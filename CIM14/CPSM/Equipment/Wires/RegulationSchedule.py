@@ -40,6 +40,7 @@ class RegulationSchedule(SeasonDayTypeSchedule):
     _enums = {}
     _refs = ["RegulatingControl"]
     _many_refs = []
+    _inverses = {"RegulatingControl": "RegulationSchedule"}
 
     def getRegulatingControl(self):
         """Regulating controls that have this Schedule.
@@ -48,13 +49,12 @@ class RegulationSchedule(SeasonDayTypeSchedule):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulationSchedule if x != self]
-            self._RegulatingControl._RegulationSchedule = filtered
+            self._RegulatingControl._RegulationSchedule.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
             if self not in self._RegulatingControl._RegulationSchedule:
-                self._RegulatingControl._RegulationSchedule.append(self)
+                self._RegulatingControl._reflist("_RegulationSchedule").append(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
@@ -96,6 +96,7 @@ class SynchronousMachine(RegulatingCondEq):
     _enums = {"operatingMode": "SynchronousMachineOperatingMode", "type": "SynchronousMachineType"}
     _refs = ["InitialReactiveCapabilityCurve", "HydroPump", "GeneratingUnit"]
     _many_refs = []
+    _inverses = {"InitialReactiveCapabilityCurve": "InitiallyUsedBySynchronousMachines", "HydroPump": "SynchronousMachine", "GeneratingUnit": "SynchronousMachines"}
 
     def getInitialReactiveCapabilityCurve(self):
         """The default ReactiveCapabilityCurve for use by a SynchronousMachine
@@ -104,13 +105,12 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setInitialReactiveCapabilityCurve(self, value):
         if self._InitialReactiveCapabilityCurve is not None:
-            filtered = [x for x in self.InitialReactiveCapabilityCurve.InitiallyUsedBySynchronousMachines if x != self]
-            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines = filtered
+            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.discard(self)
 
         self._InitialReactiveCapabilityCurve = value
         if self._InitialReactiveCapabilityCurve is not None:
             if self not in self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines:
-                self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.append(self)
+                self._InitialReactiveCapabilityCurve._reflist("_InitiallyUsedBySynchronousMachines").append(self)
 
     InitialReactiveCapabilityCurve = property(getInitialReactiveCapabilityCurve, setInitialReactiveCapabilityCurve)
 
@@ -137,13 +137,12 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.SynchronousMachines if x != self]
-            self._GeneratingUnit._SynchronousMachines = filtered
+            self._GeneratingUnit._SynchronousMachines.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
             if self not in self._GeneratingUnit._SynchronousMachines:
-                self._GeneratingUnit._SynchronousMachines.append(self)
+                self._GeneratingUnit._reflist("_SynchronousMachines").append(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
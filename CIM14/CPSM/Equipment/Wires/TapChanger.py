@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.CPSM.Equipment.Core.PowerSystemResource import PowerSystemResource
+from CIM14.CPSM.Equipment.Element import RefList
 
 class TapChanger(PowerSystemResource):
     """Mechanism for changing transformer winding tap positions.
@@ -63,8 +64,8 @@ class TapChanger(PowerSystemResource):
         #: Highest possible tap step position, advance from neutral
         self.highStep = highStep
 
-        self._TapSchedules = []
-        self.TapSchedules = [] if TapSchedules is None else TapSchedules
+        if TapSchedules is not None:
+            self.TapSchedules = TapSchedules
 
         self._ImpedanceVariationCurve = None
         self.ImpedanceVariationCurve = ImpedanceVariationCurve
@@ -80,6 +81,7 @@ class TapChanger(PowerSystemResource):
     _enums = {}
     _refs = ["TapSchedules", "ImpedanceVariationCurve", "RegulatingControl"]
     _many_refs = ["TapSchedules"]
+    _inverses = {"TapSchedules": "TapChanger", "ImpedanceVariationCurve": "TapChanger", "RegulatingControl": "TapChanger"}
 
     def getTapSchedules(self):
         """A TapChanger can have TapSchedules.
@@ -87,7 +89,8 @@ class TapChanger(PowerSystemResource):
         return self._TapSchedules
 
     def setTapSchedules(self, value):
-        for x in self._TapSchedules:
+        value = RefList(value)
+        for x in list(self._TapSchedules):
             x.TapChanger = None
         for y in value:
             y._TapChanger = self
@@ -125,13 +128,12 @@ class TapChanger(PowerSystemResource):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.TapChanger if x != self]
-            self._RegulatingControl._TapChanger = filtered
+            self._RegulatingControl._TapChanger.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
             if self not in self._RegulatingControl._TapChanger:
-                self._RegulatingControl._TapChanger.append(self)
+                self._RegulatingControl._reflist("_TapChanger").append(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
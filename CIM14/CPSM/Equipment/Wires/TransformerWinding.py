@@ -100,6 +100,7 @@ class TransformerWinding(ConductingEquipment):
     _enums = {"connectionType": "WindingConnection", "windingType": "WindingType"}
     _refs = ["RatioTapChanger", "PhaseTapChanger", "PowerTransformer"]
     _many_refs = []
+    _inverses = {"RatioTapChanger": "TransformerWinding", "PhaseTapChanger": "TransformerWinding", "PowerTransformer": "TransformerWindings"}
 
     def getRatioTapChanger(self):
         """The ratio tap changer associated with the transformer winding.
@@ -140,13 +141,12 @@ class TransformerWinding(ConductingEquipment):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.TransformerWindings if x != self]
-            self._PowerTransformer._TransformerWindings = filtered
+            self._PowerTransformer._TransformerWindings.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
             if self not in self._PowerTransformer._TransformerWindings:
-                self._PowerTransformer._TransformerWindings.append(self)
+                self._PowerTransformer._reflist("_TransformerWindings").append(self)
 
     PowerTransformer = property(getPowerTransformer, setPowerTransformer)
 
@@ -21,34 +21,8 @@
 """An extension to the Core and Topology package that models information on the electrical characteristics of Transmission and Distribution networks. This package is used by network applications such as State Estimation, Load Flow and Optimal Power Flow.
 """
 
-from CIM14.CPSM.Equipment.Wires.LoadBreakSwitch import LoadBreakSwitch
-from CIM14.CPSM.Equipment.Wires.TransformerWinding import TransformerWinding
-from CIM14.CPSM.Equipment.Wires.SwitchSchedule import SwitchSchedule
-from CIM14.CPSM.Equipment.Wires.PhaseVariationCurve import PhaseVariationCurve
-from CIM14.CPSM.Equipment.Wires.RegulatingControl import RegulatingControl
-from CIM14.CPSM.Equipment.Wires.ACLineSegment import ACLineSegment
-from CIM14.CPSM.Equipment.Wires.PhaseTapChanger import PhaseTapChanger
-from CIM14.CPSM.Equipment.Wires.SeriesCompensator import SeriesCompensator
-from CIM14.CPSM.Equipment.Wires.PowerTransformer import PowerTransformer
-from CIM14.CPSM.Equipment.Wires.EnergyConsumer import EnergyConsumer
-from CIM14.CPSM.Equipment.Wires.Switch import Switch
-from CIM14.CPSM.Equipment.Wires.RegulationSchedule import RegulationSchedule
-from CIM14.CPSM.Equipment.Wires.ShuntCompensator import ShuntCompensator
-from CIM14.CPSM.Equipment.Wires.Conductor import Conductor
-from CIM14.CPSM.Equipment.Wires.BusbarSection import BusbarSection
-from CIM14.CPSM.Equipment.Wires.TapChanger import TapChanger
-from CIM14.CPSM.Equipment.Wires.ImpedanceVariationCurve import ImpedanceVariationCurve
-from CIM14.CPSM.Equipment.Wires.ReactiveCapabilityCurve import ReactiveCapabilityCurve
-from CIM14.CPSM.Equipment.Wires.Disconnector import Disconnector
-from CIM14.CPSM.Equipment.Wires.RatioVariationCurve import RatioVariationCurve
-from CIM14.CPSM.Equipment.Wires.TapSchedule import TapSchedule
-from CIM14.CPSM.Equipment.Wires.MutualCoupling import MutualCoupling
-from CIM14.CPSM.Equipment.Wires.SynchronousMachine import SynchronousMachine
-from CIM14.CPSM.Equipment.Wires.RatioTapChanger import RatioTapChanger
-from CIM14.CPSM.Equipment.Wires.RegulatingCondEq import RegulatingCondEq
-from CIM14.CPSM.Equipment.Wires.Line import Line
-from CIM14.CPSM.Equipment.Wires.StaticVarCompensator import StaticVarCompensator
-from CIM14.CPSM.Equipment.Wires.Breaker import Breaker
+import sys
+from CIM14.CPSM.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Wires"
 nsPrefix = "cimWires"
@@ -93,3 +67,35 @@ class PhaseTapChangerKind(str):
     """Values are: asymmetrical, symmetrical, unknown
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "LoadBreakSwitch",
+    "TransformerWinding",
+    "SwitchSchedule",
+    "PhaseVariationCurve",
+    "RegulatingControl",
+    "ACLineSegment",
+    "PhaseTapChanger",
+    "SeriesCompensator",
+    "PowerTransformer",
+    "EnergyConsumer",
+    "Switch",
+    "RegulationSchedule",
+    "ShuntCompensator",
+    "Conductor",
+    "BusbarSection",
+    "TapChanger",
+    "ImpedanceVariationCurve",
+    "ReactiveCapabilityCurve",
+    "Disconnector",
+    "RatioVariationCurve",
+    "TapSchedule",
+    "MutualCoupling",
+    "SynchronousMachine",
+    "RatioTapChanger",
+    "RegulatingCondEq",
+    "Line",
+    "StaticVarCompensator",
+    "Breaker",
+])
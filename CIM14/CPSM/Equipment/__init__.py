@@ -21,8 +21,8 @@
 """
 """
 
-from CIM14.CPSM.Equipment.Element import Element
-from CIM14.CPSM.Equipment.IEC61970CIMVersion import IEC61970CIMVersion
+import sys
+from CIM14.CPSM.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile/CPSM/Equipment"
 nsPrefix = "eq"
@@ -154,3 +154,19 @@ class CIMGDay(str):
 
 class CIMGYearMonth(str):
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Element",
+    "IEC61970CIMVersion",
+], [
+    "ControlArea",
+    "Core",
+    "Domain",
+    "Equivalents",
+    "Generation",
+    "LoadModel",
+    "Meas",
+    "OperationalLimits",
+    "Wires",
+])
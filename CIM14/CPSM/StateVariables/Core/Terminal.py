@@ -40,6 +40,7 @@ class Terminal(Element):
     _enums = {}
     _refs = ["SvPowerFlow"]
     _many_refs = []
+    _inverses = {"SvPowerFlow": "Terminal"}
 
     def getSvPowerFlow(self):
         """The power flow state associated with the terminal.
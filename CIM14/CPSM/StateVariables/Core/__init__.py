@@ -21,8 +21,13 @@
 """Contains the core PowerSystemResource and ConductingEquipment entities shared by all applications plus common collections of those entities. Not all applications require all the Core entities.  This package does not depend on any other package except the Domain package, but most of the other packages have associations and generalizations that depend on it.
 """
 
-from CIM14.CPSM.StateVariables.Core.Terminal import Terminal
+import sys
+from CIM14.CPSM.StateVariables.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Core"
 nsPrefix = "cimCore"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Terminal",
+])
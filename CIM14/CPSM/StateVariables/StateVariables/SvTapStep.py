@@ -48,6 +48,7 @@ class SvTapStep(Element):
     _enums = {}
     _refs = ["TapChanger"]
     _many_refs = []
+    _inverses = {"TapChanger": "SvTapStep"}
 
     def getTapChanger(self):
         """The tap changer associated with the tap step state.
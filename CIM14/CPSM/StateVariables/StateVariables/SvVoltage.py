@@ -48,6 +48,7 @@ class SvVoltage(Element):
     _enums = {}
     _refs = ["TopologicalNode"]
     _many_refs = []
+    _inverses = {"TopologicalNode": "SvVoltage"}
 
     def getTopologicalNode(self):
         """The topological node associated with the voltage state.
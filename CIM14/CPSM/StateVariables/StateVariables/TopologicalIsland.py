@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.CPSM.StateVariables.Element import Element
+from CIM14.CPSM.StateVariables.Element import Element, RefList
 
 class TopologicalIsland(Element):
     """An electrically connected subset of the network. Topological islands can change as the current network state changes (i.e. switch or Terminal.connected status changes).
@@ -33,8 +33,8 @@ class TopologicalIsland(Element):
         self._AngleRef_TopologicalNode = None
         self.AngleRef_TopologicalNode = AngleRef_TopologicalNode
 
-        self._TopologicalNodes = []
-        self.TopologicalNodes = [] if TopologicalNodes is None else TopologicalNodes
+        if TopologicalNodes is not None:
+            self.TopologicalNodes = TopologicalNodes
 
         super(TopologicalIsland, self).__init__(*args, **kw_args)
 
@@ -44,6 +44,7 @@ class TopologicalIsland(Element):
     _enums = {}
     _refs = ["AngleRef_TopologicalNode", "TopologicalNodes"]
     _many_refs = ["TopologicalNodes"]
+    _inverses = {"AngleRef_TopologicalNode": "AngleRef_TopologicalIsland", "TopologicalNodes": "TopologicalIsland"}
 
     def getAngleRef_TopologicalNode(self):
         """The angle reference for the island.   Normally there is one TopologicalNode that is selected as the angle reference for each island.   Other reference schemes exist, so the association is optional.
@@ -67,7 +68,8 @@ class TopologicalIsland(Element):
         return self._TopologicalNodes
 
     def setTopologicalNodes(self, value):
-        for x in self._TopologicalNodes:
+        value = RefList(value)
+        for x in list(self._TopologicalNodes):
             x.TopologicalIsland = None
         for y in value:
             y._TopologicalIsland = self
@@ -21,14 +21,19 @@
 """State variables for analysis solutions such as powerflow.
 """
 
-from CIM14.CPSM.StateVariables.StateVariables.SvTapStep import SvTapStep
-from CIM14.CPSM.StateVariables.StateVariables.SvInjection import SvInjection
-from CIM14.CPSM.StateVariables.StateVariables.SvVoltage import SvVoltage
-from CIM14.CPSM.StateVariables.StateVariables.TopologicalIsland import TopologicalIsland
-from CIM14.CPSM.StateVariables.StateVariables.SvPowerFlow import SvPowerFlow
-from CIM14.CPSM.StateVariables.StateVariables.SvShortCircuit import SvShortCircuit
-from CIM14.CPSM.StateVariables.StateVariables.SvShuntCompensatorSections import SvShuntCompensatorSections
+import sys
+from CIM14.CPSM.StateVariables.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#StateVariables"
 nsPrefix = "cimStateVariables"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "SvTapStep",
+    "SvInjection",
+    "SvVoltage",
+    "TopologicalIsland",
+    "SvPowerFlow",
+    "SvShortCircuit",
+    "SvShuntCompensatorSections",
+])
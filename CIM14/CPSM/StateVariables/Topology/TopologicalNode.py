@@ -56,6 +56,7 @@ class TopologicalNode(Element):
     _enums = {}
     _refs = ["TopologicalIsland", "SvShortCircuit", "SvVoltage", "SvInjection", "AngleRef_TopologicalIsland"]
     _many_refs = []
+    _inverses = {"TopologicalIsland": "TopologicalNodes", "SvShortCircuit": "TopologicalNode", "SvVoltage": "TopologicalNode", "SvInjection": "TopologicalNode", "AngleRef_TopologicalIsland": "AngleRef_TopologicalNode"}
 
     def getTopologicalIsland(self):
         """A topological node belongs to a topological island
@@ -64,13 +65,12 @@ class TopologicalNode(Element):
 
     def setTopologicalIsland(self, value):
         if self._TopologicalIsland is not None:
-            filtered = [x for x in self.TopologicalIsland.TopologicalNodes if x != self]
-            self._TopologicalIsland._TopologicalNodes = filtered
+            self._TopologicalIsland._TopologicalNodes.discard(self)
 
         self._TopologicalIsland = value
         if self._TopologicalIsland is not None:
             if self not in self._TopologicalIsland._TopologicalNodes:
-                self._TopologicalIsland._TopologicalNodes.append(self)
+                self._TopologicalIsland._reflist("_TopologicalNodes").append(self)
 
     TopologicalIsland = property(getTopologicalIsland, setTopologicalIsland)
 
@@ -21,8 +21,13 @@
 """An extension to the Core Package that in association with the Terminal class models Connectivity, that is the physical definition of how equipment is connected together. In addition it models Topology, that is the logical definition of how equipment is connected via closed switches. The Topology definition is independent of the other electrical characteristics.
 """
 
-from CIM14.CPSM.StateVariables.Topology.TopologicalNode import TopologicalNode
+import sys
+from CIM14.CPSM.StateVariables.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Topology"
 nsPrefix = "cimTopology"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "TopologicalNode",
+])
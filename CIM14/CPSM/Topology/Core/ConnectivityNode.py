@@ -40,6 +40,7 @@ class ConnectivityNode(IdentifiedObject):
     _enums = {}
     _refs = ["TopologicalNode"]
     _many_refs = []
+    _inverses = {"TopologicalNode": "ConnectivityNodes"}
 
     def getTopologicalNode(self):
         """Several ConnectivityNode(s) may combine together to form a single TopologicalNode, depending on the current state of the network.
@@ -48,13 +49,12 @@ class ConnectivityNode(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         if self._TopologicalNode is not None:
-            filtered = [x for x in self.TopologicalNode.ConnectivityNodes if x != self]
-            self._TopologicalNode._ConnectivityNodes = filtered
+            self._TopologicalNode._ConnectivityNodes.discard(self)
 
         self._TopologicalNode = value
         if self._TopologicalNode is not None:
             if self not in self._TopologicalNode._ConnectivityNodes:
-                self._TopologicalNode._ConnectivityNodes.append(self)
+                self._TopologicalNode._reflist("_ConnectivityNodes").append(self)
 
     TopologicalNode = property(getTopologicalNode, setTopologicalNode)
 
@@ -44,6 +44,7 @@ class Terminal(IdentifiedObject):
     _enums = {}
     _refs = ["TopologicalNode"]
     _many_refs = []
+    _inverses = {"TopologicalNode": "Terminal"}
 
     def getTopologicalNode(self):
         """The topological node associated with the terminal.   This can be used as an alternative to the connectivity node path to topological node, thus making it unneccesary to model connedtivity nodes in some cases.   Note that the if connectivity nodes are in the model, this association would proably not be used.
@@ -52,13 +53,12 @@ class Terminal(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         if self._TopologicalNode is not None:
-            filtered = [x for x in self.TopologicalNode.Terminal if x != self]
-            self._TopologicalNode._Terminal = filtered
+            self._TopologicalNode._Terminal.discard(self)
 
         self._TopologicalNode = value
         if self._TopologicalNode is not None:
             if self not in self._TopologicalNode._Terminal:
-                self._TopologicalNode._Terminal.append(self)
+                self._TopologicalNode._reflist("_Terminal").append(self)
 
     TopologicalNode = property(getTopologicalNode, setTopologicalNode)
 
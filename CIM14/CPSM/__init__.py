@@ -20,6 +20,16 @@
 
 
 
+
+import sys
+from CIM14.Element import LazyModule
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile/CPSM"
 nsPrefix = "cpsm"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+], [
+    "Equipment",
+    "StateVariables",
+    "Topology",
+])
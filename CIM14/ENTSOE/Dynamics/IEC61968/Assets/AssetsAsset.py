@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class AssetsAsset(CoreIdentifiedObject):
 
@@ -27,8 +28,8 @@ class AssetsAsset(CoreIdentifiedObject):
 
         @param PowerSystemResources: 
         """
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         super(AssetsAsset, self).__init__(*args, **kw_args)
 
@@ -38,6 +39,7 @@ class AssetsAsset(CoreIdentifiedObject):
     _enums = {}
     _refs = ["PowerSystemResources"]
     _many_refs = ["PowerSystemResources"]
+    _inverses = {"PowerSystemResources": "Assets"}
 
     def getPowerSystemResources(self):
         """
@@ -46,20 +48,19 @@ class AssetsAsset(CoreIdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.Assets if q != self]
-            self._PowerSystemResources._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
             if self not in r._Assets:
-                r._Assets.append(self)
-        self._PowerSystemResources = value
+                r._reflist("_Assets").append(self)
+        self._PowerSystemResources = RefList(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
             if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._PowerSystemResources.append(obj)
+                obj._reflist("_Assets").append(self)
+            self._reflist("_PowerSystemResources").append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
@@ -19,8 +19,13 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61968.Assets.AssetsAsset import AssetsAsset
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Assets"
 nsPrefix = "cimAssets"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "AssetsAsset",
+])
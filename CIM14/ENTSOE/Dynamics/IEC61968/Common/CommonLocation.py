@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class CommonLocation(CoreIdentifiedObject):
 
@@ -27,8 +28,8 @@ class CommonLocation(CoreIdentifiedObject):
 
         @param PowerSystemResources: 
         """
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         super(CommonLocation, self).__init__(*args, **kw_args)
 
@@ -38,6 +39,7 @@ class CommonLocation(CoreIdentifiedObject):
     _enums = {}
     _refs = ["PowerSystemResources"]
     _many_refs = ["PowerSystemResources"]
+    _inverses = {"PowerSystemResources": "Location"}
 
     def getPowerSystemResources(self):
         """
@@ -45,7 +47,8 @@ class CommonLocation(CoreIdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
-        for x in self._PowerSystemResources:
+        value = RefList(value)
+        for x in list(self._PowerSystemResources):
             x.Location = None
         for y in value:
             y._Location = self
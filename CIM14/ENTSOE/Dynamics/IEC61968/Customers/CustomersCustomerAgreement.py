@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class CustomersCustomerAgreement(CoreIdentifiedObject):
 
@@ -27,8 +28,8 @@ class CustomersCustomerAgreement(CoreIdentifiedObject):
 
         @param Equipments: 
         """
-        self._Equipments = []
-        self.Equipments = [] if Equipments is None else Equipments
+        if Equipments is not None:
+            self.Equipments = Equipments
 
         super(CustomersCustomerAgreement, self).__init__(*args, **kw_args)
 
@@ -38,6 +39,7 @@ class CustomersCustomerAgreement(CoreIdentifiedObject):
     _enums = {}
     _refs = ["Equipments"]
     _many_refs = ["Equipments"]
+    _inverses = {"Equipments": "CustomerAgreements"}
 
     def getEquipments(self):
         """
@@ -46,20 +48,19 @@ class CustomersCustomerAgreement(CoreIdentifiedObject):
 
     def setEquipments(self, value):
         for p in self._Equipments:
-            filtered = [q for q in p.CustomerAgreements if q != self]
-            self._Equipments._CustomerAgreements = filtered
+            p._CustomerAgreements.discard(self)
         for r in value:
             if self not in r._CustomerAgreements:
-                r._CustomerAgreements.append(self)
-        self._Equipments = value
+                r._reflist("_CustomerAgreements").append(self)
+        self._Equipments = RefList(value)
 
     Equipments = property(getEquipments, setEquipments)
 
     def addEquipments(self, *Equipments):
         for obj in Equipments:
             if self not in obj._CustomerAgreements:
-                obj._CustomerAgreements.append(self)
-            self._Equipments.append(obj)
+                obj._reflist("_CustomerAgreements").append(self)
+            self._reflist("_Equipments").append(obj)
 
     def removeEquipments(self, *Equipments):
         for obj in Equipments:
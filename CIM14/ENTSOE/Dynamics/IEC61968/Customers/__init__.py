@@ -19,8 +19,13 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61968.Customers.CustomersCustomerAgreement import CustomersCustomerAgreement
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Customers"
 nsPrefix = "cimCustomers"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "CustomersCustomerAgreement",
+])
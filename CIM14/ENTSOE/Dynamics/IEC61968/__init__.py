@@ -20,6 +20,16 @@
 
 
 
+
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#IEC61968"
 nsPrefix = "cimIEC61968"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+], [
+    "Assets",
+    "Common",
+    "Customers",
+])
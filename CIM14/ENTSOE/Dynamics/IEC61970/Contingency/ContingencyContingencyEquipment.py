@@ -38,6 +38,7 @@ class ContingencyContingencyEquipment(CoreIdentifiedObject):
     _enums = {}
     _refs = ["Equipment"]
     _many_refs = []
+    _inverses = {"Equipment": "ContingencyEquipment"}
 
     def getEquipment(self):
         """
@@ -46,13 +47,12 @@ class ContingencyContingencyEquipment(CoreIdentifiedObject):
 
     def setEquipment(self, value):
         if self._Equipment is not None:
-            filtered = [x for x in self.Equipment.ContingencyEquipment if x != self]
-            self._Equipment._ContingencyEquipment = filtered
+            self._Equipment._ContingencyEquipment.discard(self)
 
         self._Equipment = value
         if self._Equipment is not None:
             if self not in self._Equipment._ContingencyEquipment:
-                self._Equipment._ContingencyEquipment.append(self)
+                self._Equipment._reflist("_ContingencyEquipment").append(self)
 
     Equipment = property(getEquipment, setEquipment)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class CoreBaseVoltage(CoreIdentifiedObject):
 
@@ -27,8 +28,8 @@ class CoreBaseVoltage(CoreIdentifiedObject):
 
         @param ConductingEquipment: 
         """
-        self._ConductingEquipment = []
-        self.ConductingEquipment = [] if ConductingEquipment is None else ConductingEquipment
+        if ConductingEquipment is not None:
+            self.ConductingEquipment = ConductingEquipment
 
         super(CoreBaseVoltage, self).__init__(*args, **kw_args)
 
@@ -38,6 +39,7 @@ class CoreBaseVoltage(CoreIdentifiedObject):
     _enums = {}
     _refs = ["ConductingEquipment"]
     _many_refs = ["ConductingEquipment"]
+    _inverses = {"ConductingEquipment": "BaseVoltage"}
 
     def getConductingEquipment(self):
         """
@@ -45,7 +47,8 @@ class CoreBaseVoltage(CoreIdentifiedObject):
         return self._ConductingEquipment
 
     def setConductingEquipment(self, value):
-        for x in self._ConductingEquipment:
+        value = RefList(value)
+        for x in list(self._ConductingEquipment):
             x.BaseVoltage = None
         for y in value:
             y._BaseVoltage = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreEquipment import CoreEquipment
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class CoreConductingEquipment(CoreEquipment):
 
@@ -38,14 +39,14 @@ class CoreConductingEquipment(CoreEquipment):
         self._SvStatus = None
         self.SvStatus = SvStatus
 
-        self._ClearanceTags = []
-        self.ClearanceTags = [] if ClearanceTags is None else ClearanceTags
+        if ClearanceTags is not None:
+            self.ClearanceTags = ClearanceTags
 
-        self._Terminals = []
-        self.Terminals = [] if Terminals is None else Terminals
+        if Terminals is not None:
+            self.Terminals = Terminals
 
-        self._ProtectionEquipments = []
-        self.ProtectionEquipments = [] if ProtectionEquipments is None else ProtectionEquipments
+        if ProtectionEquipments is not None:
+            self.ProtectionEquipments = ProtectionEquipments
 
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
@@ -58,6 +59,7 @@ class CoreConductingEquipment(CoreEquipment):
     _enums = {"phases": "CorePhaseCode"}
     _refs = ["SvStatus", "ClearanceTags", "Terminals", "ProtectionEquipments", "BaseVoltage"]
     _many_refs = ["ClearanceTags", "Terminals", "ProtectionEquipments"]
+    _inverses = {"SvStatus": "ConductingEquipment", "ClearanceTags": "ConductingEquipment", "Terminals": "ConductingEquipment", "ProtectionEquipments": "ConductingEquipments", "BaseVoltage": "ConductingEquipment"}
 
     def getSvStatus(self):
         
@@ -79,7 +81,8 @@ class CoreConductingEquipment(CoreEquipment):
         return self._ClearanceTags
 
     def setClearanceTags(self, value):
-        for x in self._ClearanceTags:
+        value = RefList(value)
+        for x in list(self._ClearanceTags):
             x.ConductingEquipment = None
         for y in value:
             y._ConductingEquipment = self
@@ -100,7 +103,8 @@ class CoreConductingEquipment(CoreEquipment):
         return self._Terminals
 
     def setTerminals(self, value):
-        for x in self._Terminals:
+        value = RefList(value)
+        for x in list(self._Terminals):
             x.ConductingEquipment = None
         for y in value:
             y._ConductingEquipment = self
@@ -122,20 +126,19 @@ class CoreConductingEquipment(CoreEquipment):
 
     def setProtectionEquipments(self, value):
         for p in self._ProtectionEquipments:
-            filtered = [q for q in p.ConductingEquipments if q != self]
-            self._ProtectionEquipments._ConductingEquipments = filtered
+            p._ConductingEquipments.discard(self)
         for r in value:
             if self not in r._ConductingEquipments:
-                r._ConductingEquipments.append(self)
-        self._ProtectionEquipments = value
+                r._reflist("_ConductingEquipments").append(self)
+        self._ProtectionEquipments = RefList(value)
 
     ProtectionEquipments = property(getProtectionEquipments, setProtectionEquipments)
 
     def addProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
             if self not in obj._ConductingEquipments:
-                obj._ConductingEquipments.append(self)
-            self._ProtectionEquipments.append(obj)
+                obj._reflist("_ConductingEquipments").append(self)
+            self._reflist("_ProtectionEquipments").append(obj)
 
     def removeProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
@@ -149,13 +152,12 @@ class CoreConductingEquipment(CoreEquipment):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.ConductingEquipment if x != self]
-            self._BaseVoltage._ConductingEquipment = filtered
+            self._BaseVoltage._ConductingEquipment.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
             if self not in self._BaseVoltage._ConductingEquipment:
-                self._BaseVoltage._ConductingEquipment.append(self)
+                self._BaseVoltage._reflist("_ConductingEquipment").append(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
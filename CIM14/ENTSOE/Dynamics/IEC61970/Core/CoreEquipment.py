@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CorePowerSystemResource import CorePowerSystemResource
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class CoreEquipment(CorePowerSystemResource):
 
@@ -38,17 +39,17 @@ class CoreEquipment(CorePowerSystemResource):
 
         self.aggregate = aggregate
 
-        self._ContingencyEquipment = []
-        self.ContingencyEquipment = [] if ContingencyEquipment is None else ContingencyEquipment
+        if ContingencyEquipment is not None:
+            self.ContingencyEquipment = ContingencyEquipment
 
         self._EquipmentContainer = None
         self.EquipmentContainer = EquipmentContainer
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._OperationalLimitSet = []
-        self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
+        if OperationalLimitSet is not None:
+            self.OperationalLimitSet = OperationalLimitSet
 
         super(CoreEquipment, self).__init__(*args, **kw_args)
 
@@ -58,13 +59,15 @@ class CoreEquipment(CorePowerSystemResource):
     _enums = {}
     _refs = ["ContingencyEquipment", "EquipmentContainer", "CustomerAgreements", "OperationalLimitSet"]
     _many_refs = ["ContingencyEquipment", "CustomerAgreements", "OperationalLimitSet"]
+    _inverses = {"ContingencyEquipment": "Equipment", "EquipmentContainer": "Equipments", "CustomerAgreements": "Equipments", "OperationalLimitSet": "Equipment"}
 
     def getContingencyEquipment(self):
         
         return self._ContingencyEquipment
 
     def setContingencyEquipment(self, value):
-        for x in self._ContingencyEquipment:
+        value = RefList(value)
+        for x in list(self._ContingencyEquipment):
             x.Equipment = None
         for y in value:
             y._Equipment = self
@@ -86,13 +89,12 @@ class CoreEquipment(CorePowerSystemResource):
 
     def setEquipmentContainer(self, value):
         if self._EquipmentContainer is not None:
-            filtered = [x for x in self.EquipmentContainer.Equipments if x != self]
-            self._EquipmentContainer._Equipments = filtered
+            self._EquipmentContainer._Equipments.discard(self)
 
         self._EquipmentContainer = value
         if self._EquipmentContainer is not None:
             if self not in self._EquipmentContainer._Equipments:
-                self._EquipmentContainer._Equipments.append(self)
+                self._EquipmentContainer._reflist("_Equipments").append(self)
 
     EquipmentContainer = property(getEquipmentContainer, setEquipmentContainer)
 
@@ -102,20 +104,19 @@ class CoreEquipment(CorePowerSystemResource):
 
     def setCustomerAgreements(self, value):
         for p in self._CustomerAgreements:
-            filtered = [q for q in p.Equipments if q != self]
-            self._CustomerAgreements._Equipments = filtered
+            p._Equipments.discard(self)
         for r in value:
             if self not in r._Equipments:
-                r._Equipments.append(self)
-        self._CustomerAgreements = value
+                r._reflist("_Equipments").append(self)
+        self._CustomerAgreements = RefList(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
             if self not in obj._Equipments:
-                obj._Equipments.append(self)
-            self._CustomerAgreements.append(obj)
+                obj._reflist("_Equipments").append(self)
+            self._reflist("_CustomerAgreements").append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
@@ -128,7 +129,8 @@ class CoreEquipment(CorePowerSystemResource):
         return self._OperationalLimitSet
 
     def setOperationalLimitSet(self, value):
-        for x in self._OperationalLimitSet:
+        value = RefList(value)
+        for x in list(self._OperationalLimitSet):
             x.Equipment = None
         for y in value:
             y._Equipment = self
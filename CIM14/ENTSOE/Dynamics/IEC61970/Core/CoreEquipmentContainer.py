@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CorePowerSystemResource import CorePowerSystemResource
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class CoreEquipmentContainer(CorePowerSystemResource):
 
@@ -27,8 +28,8 @@ class CoreEquipmentContainer(CorePowerSystemResource):
 
         @param Equipments: 
         """
-        self._Equipments = []
-        self.Equipments = [] if Equipments is None else Equipments
+        if Equipments is not None:
+            self.Equipments = Equipments
 
         super(CoreEquipmentContainer, self).__init__(*args, **kw_args)
 
@@ -38,6 +39,7 @@ class CoreEquipmentContainer(CorePowerSystemResource):
     _enums = {}
     _refs = ["Equipments"]
     _many_refs = ["Equipments"]
+    _inverses = {"Equipments": "EquipmentContainer"}
 
     def getEquipments(self):
         """
@@ -45,7 +47,8 @@ class CoreEquipmentContainer(CorePowerSystemResource):
         return self._Equipments
 
     def setEquipments(self, value):
-        for x in self._Equipments:
+        value = RefList(value)
+        for x in list(self._Equipments):
             x.EquipmentContainer = None
         for y in value:
             y._EquipmentContainer = self
@@ -62,6 +62,7 @@ class CoreIdentifiedObject(Element):
     _enums = {}
     _refs = ["ModelingAuthoritySet"]
     _many_refs = []
+    _inverses = {"ModelingAuthoritySet": "IdentifiedObjects"}
 
     def getModelingAuthoritySet(self):
         
@@ -69,13 +70,12 @@ class CoreIdentifiedObject(Element):
 
     def setModelingAuthoritySet(self, value):
         if self._ModelingAuthoritySet is not None:
-            filtered = [x for x in self.ModelingAuthoritySet.IdentifiedObjects if x != self]
-            self._ModelingAuthoritySet._IdentifiedObjects = filtered
+            self._ModelingAuthoritySet._IdentifiedObjects.discard(self)
 
         self._ModelingAuthoritySet = value
         if self._ModelingAuthoritySet is not None:
             if self not in self._ModelingAuthoritySet._IdentifiedObjects:
-                self._ModelingAuthoritySet._IdentifiedObjects.append(self)
+                self._ModelingAuthoritySet._reflist("_IdentifiedObjects").append(self)
 
     ModelingAuthoritySet = property(getModelingAuthoritySet, setModelingAuthoritySet)
 
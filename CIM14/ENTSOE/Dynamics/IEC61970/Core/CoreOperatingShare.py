@@ -38,6 +38,7 @@ class CoreOperatingShare(Element):
     _enums = {}
     _refs = ["PowerSystemResource"]
     _many_refs = []
+    _inverses = {"PowerSystemResource": "OperatingShare"}
 
     def getPowerSystemResource(self):
         """
@@ -46,13 +47,12 @@ class CoreOperatingShare(Element):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.OperatingShare if x != self]
-            self._PowerSystemResource._OperatingShare = filtered
+            self._PowerSystemResource._OperatingShare.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
             if self not in self._PowerSystemResource._OperatingShare:
-                self._PowerSystemResource._OperatingShare.append(self)
+                self._PowerSystemResource._reflist("_OperatingShare").append(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class CorePSRType(CoreIdentifiedObject):
 
@@ -27,8 +28,8 @@ class CorePSRType(CoreIdentifiedObject):
 
         @param PowerSystemResources: 
         """
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         super(CorePSRType, self).__init__(*args, **kw_args)
 
@@ -38,6 +39,7 @@ class CorePSRType(CoreIdentifiedObject):
     _enums = {}
     _refs = ["PowerSystemResources"]
     _many_refs = ["PowerSystemResources"]
+    _inverses = {"PowerSystemResources": "PSRType"}
 
     def getPowerSystemResources(self):
         """
@@ -45,7 +47,8 @@ class CorePSRType(CoreIdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
-        for x in self._PowerSystemResources:
+        value = RefList(value)
+        for x in list(self._PowerSystemResources):
             x.PSRType = None
         for y in value:
             y._PSRType = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class CorePsrList(CoreIdentifiedObject):
 
@@ -27,8 +28,8 @@ class CorePsrList(CoreIdentifiedObject):
 
         @param PowerSystemResources: 
         """
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         super(CorePsrList, self).__init__(*args, **kw_args)
 
@@ -38,6 +39,7 @@ class CorePsrList(CoreIdentifiedObject):
     _enums = {}
     _refs = ["PowerSystemResources"]
     _many_refs = ["PowerSystemResources"]
+    _inverses = {"PowerSystemResources": "PsrLists"}
 
     def getPowerSystemResources(self):
         """
@@ -46,20 +48,19 @@ class CorePsrList(CoreIdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.PsrLists if q != self]
-            self._PowerSystemResources._PsrLists = filtered
+            p._PsrLists.discard(self)
         for r in value:
             if self not in r._PsrLists:
-                r._PsrLists.append(self)
-        self._PowerSystemResources = value
+                r._reflist("_PsrLists").append(self)
+        self._PowerSystemResources = RefList(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
             if self not in obj._PsrLists:
-                obj._PsrLists.append(self)
-            self._PowerSystemResources.append(obj)
+                obj._reflist("_PsrLists").append(self)
+            self._reflist("_PowerSystemResources").append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
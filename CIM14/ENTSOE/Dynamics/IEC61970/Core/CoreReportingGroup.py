@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class CoreReportingGroup(CoreIdentifiedObject):
 
@@ -27,8 +28,8 @@ class CoreReportingGroup(CoreIdentifiedObject):
 
         @param PowerSystemResource: 
         """
-        self._PowerSystemResource = []
-        self.PowerSystemResource = [] if PowerSystemResource is None else PowerSystemResource
+        if PowerSystemResource is not None:
+            self.PowerSystemResource = PowerSystemResource
 
         super(CoreReportingGroup, self).__init__(*args, **kw_args)
 
@@ -38,6 +39,7 @@ class CoreReportingGroup(CoreIdentifiedObject):
     _enums = {}
     _refs = ["PowerSystemResource"]
     _many_refs = ["PowerSystemResource"]
+    _inverses = {"PowerSystemResource": "ReportingGroup"}
 
     def getPowerSystemResource(self):
         """
@@ -46,20 +48,19 @@ class CoreReportingGroup(CoreIdentifiedObject):
 
     def setPowerSystemResource(self, value):
         for p in self._PowerSystemResource:
-            filtered = [q for q in p.ReportingGroup if q != self]
-            self._PowerSystemResource._ReportingGroup = filtered
+            p._ReportingGroup.discard(self)
         for r in value:
             if self not in r._ReportingGroup:
-                r._ReportingGroup.append(self)
-        self._PowerSystemResource = value
+                r._reflist("_ReportingGroup").append(self)
+        self._PowerSystemResource = RefList(value)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
     def addPowerSystemResource(self, *PowerSystemResource):
         for obj in PowerSystemResource:
             if self not in obj._ReportingGroup:
-                obj._ReportingGroup.append(self)
-            self._PowerSystemResource.append(obj)
+                obj._reflist("_ReportingGroup").append(self)
+            self._reflist("_PowerSystemResource").append(obj)
 
     def removePowerSystemResource(self, *PowerSystemResource):
         for obj in PowerSystemResource:
@@ -38,6 +38,7 @@ class CoreTerminal(CoreIdentifiedObject):
     _enums = {}
     _refs = ["ConductingEquipment"]
     _many_refs = []
+    _inverses = {"ConductingEquipment": "Terminals"}
 
     def getConductingEquipment(self):
         """
@@ -46,13 +47,12 @@ class CoreTerminal(CoreIdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.Terminals if x != self]
-            self._ConductingEquipment._Terminals = filtered
+            self._ConductingEquipment._Terminals.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
             if self not in self._ConductingEquipment._Terminals:
-                self._ConductingEquipment._Terminals.append(self)
+                self._ConductingEquipment._reflist("_Terminals").append(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
@@ -19,17 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreEquipment import CoreEquipment
-from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
-from CIM14.ENTSOE.Dynamics.IEC61970.Core.CorePSRType import CorePSRType
-from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreBaseVoltage import CoreBaseVoltage
-from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreEquipmentContainer import CoreEquipmentContainer
-from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreTerminal import CoreTerminal
-from CIM14.ENTSOE.Dynamics.IEC61970.Core.CorePowerSystemResource import CorePowerSystemResource
-from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreOperatingShare import CoreOperatingShare
-from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreReportingGroup import CoreReportingGroup
-from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreConductingEquipment import CoreConductingEquipment
-from CIM14.ENTSOE.Dynamics.IEC61970.Core.CorePsrList import CorePsrList
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Core"
 nsPrefix = "cimCore"
@@ -39,3 +30,18 @@ class CorePhaseCode(str):
     """Values are: ABC, splitSecondary2N, ABN, CN, ACN, BC, AN, BN, AB, splitSecondary1N, N, C, AC, ABCN, splitSecondary12N, A, B, BCN
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "CoreEquipment",
+    "CoreIdentifiedObject",
+    "CorePSRType",
+    "CoreBaseVoltage",
+    "CoreEquipmentContainer",
+    "CoreTerminal",
+    "CorePowerSystemResource",
+    "CoreOperatingShare",
+    "CoreReportingGroup",
+    "CoreConductingEquipment",
+    "CorePsrList",
+])
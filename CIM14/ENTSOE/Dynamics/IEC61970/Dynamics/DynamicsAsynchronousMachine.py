@@ -74,4 +74,5 @@ class DynamicsAsynchronousMachine(DynamicsRotatingMachine):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -38,4 +38,5 @@ class DynamicsAttributeBlockParameter(DynamicsMetaBlockParameter):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
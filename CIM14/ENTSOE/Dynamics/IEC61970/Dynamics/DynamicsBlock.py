@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CorePowerSystemResource import CorePowerSystemResource
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class DynamicsBlock(CorePowerSystemResource):
 
@@ -39,14 +40,14 @@ class DynamicsBlock(CorePowerSystemResource):
 
         self.positiveFlowIn = positiveFlowIn
 
-        self._BlockParameter = []
-        self.BlockParameter = [] if BlockParameter is None else BlockParameter
+        if BlockParameter is not None:
+            self.BlockParameter = BlockParameter
 
         self._PowerSystemResource = None
         self.PowerSystemResource = PowerSystemResource
 
-        self._BlockConnection = []
-        self.BlockConnection = [] if BlockConnection is None else BlockConnection
+        if BlockConnection is not None:
+            self.BlockConnection = BlockConnection
 
         self._MemberOf_BlockConnectivity = None
         self.MemberOf_BlockConnectivity = MemberOf_BlockConnectivity
@@ -62,6 +63,7 @@ class DynamicsBlock(CorePowerSystemResource):
     _enums = {}
     _refs = ["BlockParameter", "PowerSystemResource", "BlockConnection", "MemberOf_BlockConnectivity", "MetaBlock"]
     _many_refs = ["BlockParameter", "BlockConnection"]
+    _inverses = {"BlockParameter": "MemberOf_Block", "PowerSystemResource": "Block", "BlockConnection": "Block", "MemberOf_BlockConnectivity": "Block", "MetaBlock": "Block"}
 
     def getBlockParameter(self):
         """
@@ -69,7 +71,8 @@ class DynamicsBlock(CorePowerSystemResource):
         return self._BlockParameter
 
     def setBlockParameter(self, value):
-        for x in self._BlockParameter:
+        value = RefList(value)
+        for x in list(self._BlockParameter):
             x.MemberOf_Block = None
         for y in value:
             y._MemberOf_Block = self
@@ -91,13 +94,12 @@ class DynamicsBlock(CorePowerSystemResource):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Block if x != self]
-            self._PowerSystemResource._Block = filtered
+            self._PowerSystemResource._Block.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
             if self not in self._PowerSystemResource._Block:
-                self._PowerSystemResource._Block.append(self)
+                self._PowerSystemResource._reflist("_Block").append(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -107,7 +109,8 @@ class DynamicsBlock(CorePowerSystemResource):
         return self._BlockConnection
 
     def setBlockConnection(self, value):
-        for x in self._BlockConnection:
+        value = RefList(value)
+        for x in list(self._BlockConnection):
             x.Block = None
         for y in value:
             y._Block = self
@@ -129,13 +132,12 @@ class DynamicsBlock(CorePowerSystemResource):
 
     def setMemberOf_BlockConnectivity(self, value):
         if self._MemberOf_BlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_BlockConnectivity.Block if x != self]
-            self._MemberOf_BlockConnectivity._Block = filtered
+            self._MemberOf_BlockConnectivity._Block.discard(self)
 
         self._MemberOf_BlockConnectivity = value
         if self._MemberOf_BlockConnectivity is not None:
             if self not in self._MemberOf_BlockConnectivity._Block:
-                self._MemberOf_BlockConnectivity._Block.append(self)
+                self._MemberOf_BlockConnectivity._reflist("_Block").append(self)
 
     MemberOf_BlockConnectivity = property(getMemberOf_BlockConnectivity, setMemberOf_BlockConnectivity)
 
@@ -145,13 +147,12 @@ class DynamicsBlock(CorePowerSystemResource):
 
     def setMetaBlock(self, value):
         if self._MetaBlock is not None:
-            filtered = [x for x in self.MetaBlock.Block if x != self]
-            self._MetaBlock._Block = filtered
+            self._MetaBlock._Block.discard(self)
 
         self._MetaBlock = value
         if self._MetaBlock is not None:
             if self not in self._MetaBlock._Block:
-                self._MetaBlock._Block.append(self)
+                self._MetaBlock._reflist("_Block").append(self)
 
     MetaBlock = property(getMetaBlock, setMetaBlock)
 
@@ -46,6 +46,7 @@ class DynamicsBlockConnection(CoreIdentifiedObject):
     _enums = {}
     _refs = ["MemberOf_BlockConnectivity", "MetaBlockConnection", "Block"]
     _many_refs = []
+    _inverses = {"MemberOf_BlockConnectivity": "BlockConnection", "MetaBlockConnection": "BlockConnection", "Block": "BlockConnection"}
 
     def getMemberOf_BlockConnectivity(self):
         
@@ -53,13 +54,12 @@ class DynamicsBlockConnection(CoreIdentifiedObject):
 
     def setMemberOf_BlockConnectivity(self, value):
         if self._MemberOf_BlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_BlockConnectivity.BlockConnection if x != self]
-            self._MemberOf_BlockConnectivity._BlockConnection = filtered
+            self._MemberOf_BlockConnectivity._BlockConnection.discard(self)
 
         self._MemberOf_BlockConnectivity = value
         if self._MemberOf_BlockConnectivity is not None:
             if self not in self._MemberOf_BlockConnectivity._BlockConnection:
-                self._MemberOf_BlockConnectivity._BlockConnection.append(self)
+                self._MemberOf_BlockConnectivity._reflist("_BlockConnection").append(self)
 
     MemberOf_BlockConnectivity = property(getMemberOf_BlockConnectivity, setMemberOf_BlockConnectivity)
 
@@ -69,13 +69,12 @@ class DynamicsBlockConnection(CoreIdentifiedObject):
 
     def setMetaBlockConnection(self, value):
         if self._MetaBlockConnection is not None:
-            filtered = [x for x in self.MetaBlockConnection.BlockConnection if x != self]
-            self._MetaBlockConnection._BlockConnection = filtered
+            self._MetaBlockConnection._BlockConnection.discard(self)
 
         self._MetaBlockConnection = value
         if self._MetaBlockConnection is not None:
             if self not in self._MetaBlockConnection._BlockConnection:
-                self._MetaBlockConnection._BlockConnection.append(self)
+                self._MetaBlockConnection._reflist("_BlockConnection").append(self)
 
     MetaBlockConnection = property(getMetaBlockConnection, setMetaBlockConnection)
 
@@ -85,13 +84,12 @@ class DynamicsBlockConnection(CoreIdentifiedObject):
 
     def setBlock(self, value):
         if self._Block is not None:
-            filtered = [x for x in self.Block.BlockConnection if x != self]
-            self._Block._BlockConnection = filtered
+            self._Block._BlockConnection.discard(self)
 
         self._Block = value
         if self._Block is not None:
             if self not in self._Block._BlockConnection:
-                self._Block._BlockConnection.append(self)
+                self._Block._reflist("_BlockConnection").append(self)
 
     Block = property(getBlock, setBlock)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class DynamicsBlockConnectivity(CoreIdentifiedObject):
 
@@ -29,11 +30,11 @@ class DynamicsBlockConnectivity(CoreIdentifiedObject):
         @param BlockConnection: 
         @param MetaBlockConnectivity:
         """
-        self._Block = []
-        self.Block = [] if Block is None else Block
+        if Block is not None:
+            self.Block = Block
 
-        self._BlockConnection = []
-        self.BlockConnection = [] if BlockConnection is None else BlockConnection
+        if BlockConnection is not None:
+            self.BlockConnection = BlockConnection
 
         self._MetaBlockConnectivity = None
         self.MetaBlockConnectivity = MetaBlockConnectivity
@@ -46,6 +47,7 @@ class DynamicsBlockConnectivity(CoreIdentifiedObject):
     _enums = {}
     _refs = ["Block", "BlockConnection", "MetaBlockConnectivity"]
     _many_refs = ["Block", "BlockConnection"]
+    _inverses = {"Block": "MemberOf_BlockConnectivity", "BlockConnection": "MemberOf_BlockConnectivity", "MetaBlockConnectivity": "BlockConnectivity"}
 
     def getBlock(self):
         """
@@ -53,7 +55,8 @@ class DynamicsBlockConnectivity(CoreIdentifiedObject):
         return self._Block
 
     def setBlock(self, value):
-        for x in self._Block:
+        value = RefList(value)
+        for x in list(self._Block):
             x.MemberOf_BlockConnectivity = None
         for y in value:
             y._MemberOf_BlockConnectivity = self
@@ -75,7 +78,8 @@ class DynamicsBlockConnectivity(CoreIdentifiedObject):
         return self._BlockConnection
 
     def setBlockConnection(self, value):
-        for x in self._BlockConnection:
+        value = RefList(value)
+        for x in list(self._BlockConnection):
             x.MemberOf_BlockConnectivity = None
         for y in value:
             y._MemberOf_BlockConnectivity = self
@@ -97,13 +101,12 @@ class DynamicsBlockConnectivity(CoreIdentifiedObject):
 
     def setMetaBlockConnectivity(self, value):
         if self._MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MetaBlockConnectivity.BlockConnectivity if x != self]
-            self._MetaBlockConnectivity._BlockConnectivity = filtered
+            self._MetaBlockConnectivity._BlockConnectivity.discard(self)
 
         self._MetaBlockConnectivity = value
         if self._MetaBlockConnectivity is not None:
             if self not in self._MetaBlockConnectivity._BlockConnectivity:
-                self._MetaBlockConnectivity._BlockConnectivity.append(self)
+                self._MetaBlockConnectivity._reflist("_BlockConnectivity").append(self)
 
     MetaBlockConnectivity = property(getMetaBlockConnectivity, setMetaBlockConnectivity)
 
@@ -50,6 +50,7 @@ class DynamicsBlockParameter(CoreIdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockParameter", "MemberOf_MetaBlockReference", "MemberOf_Block"]
     _many_refs = []
+    _inverses = {"MetaBlockParameter": "BlockParameter", "MemberOf_MetaBlockReference": "BlockParameter", "MemberOf_Block": "BlockParameter"}
 
     def getMetaBlockParameter(self):
         
@@ -57,13 +58,12 @@ class DynamicsBlockParameter(CoreIdentifiedObject):
 
     def setMetaBlockParameter(self, value):
         if self._MetaBlockParameter is not None:
-            filtered = [x for x in self.MetaBlockParameter.BlockParameter if x != self]
-            self._MetaBlockParameter._BlockParameter = filtered
+            self._MetaBlockParameter._BlockParameter.discard(self)
 
         self._MetaBlockParameter = value
         if self._MetaBlockParameter is not None:
             if self not in self._MetaBlockParameter._BlockParameter:
-                self._MetaBlockParameter._BlockParameter.append(self)
+                self._MetaBlockParameter._reflist("_BlockParameter").append(self)
 
     MetaBlockParameter = property(getMetaBlockParameter, setMetaBlockParameter)
 
@@ -73,13 +73,12 @@ class DynamicsBlockParameter(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.BlockParameter if x != self]
-            self._MemberOf_MetaBlockReference._BlockParameter = filtered
+            self._MemberOf_MetaBlockReference._BlockParameter.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
             if self not in self._MemberOf_MetaBlockReference._BlockParameter:
-                self._MemberOf_MetaBlockReference._BlockParameter.append(self)
+                self._MemberOf_MetaBlockReference._reflist("_BlockParameter").append(self)
 
     MemberOf_MetaBlockReference = property(getMemberOf_MetaBlockReference, setMemberOf_MetaBlockReference)
 
@@ -89,13 +88,12 @@ class DynamicsBlockParameter(CoreIdentifiedObject):
 
     def setMemberOf_Block(self, value):
         if self._MemberOf_Block is not None:
-            filtered = [x for x in self.MemberOf_Block.BlockParameter if x != self]
-            self._MemberOf_Block._BlockParameter = filtered
+            self._MemberOf_Block._BlockParameter.discard(self)
 
         self._MemberOf_Block = value
         if self._MemberOf_Block is not None:
             if self not in self._MemberOf_Block._BlockParameter:
-                self._MemberOf_Block._BlockParameter.append(self)
+                self._MemberOf_Block._reflist("_BlockParameter").append(self)
 
     MemberOf_Block = property(getMemberOf_Block, setMemberOf_Block)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class DynamicsMetaBlock(CoreIdentifiedObject):
 
@@ -41,26 +42,26 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
 
         self.proprietary = proprietary
 
-        self._Block = []
-        self.Block = [] if Block is None else Block
+        if Block is not None:
+            self.Block = Block
 
-        self._MetaBlockSignal = []
-        self.MetaBlockSignal = [] if MetaBlockSignal is None else MetaBlockSignal
+        if MetaBlockSignal is not None:
+            self.MetaBlockSignal = MetaBlockSignal
 
-        self._MetaBlockReference = []
-        self.MetaBlockReference = [] if MetaBlockReference is None else MetaBlockReference
+        if MetaBlockReference is not None:
+            self.MetaBlockReference = MetaBlockReference
 
-        self._MetaBlockParameter = []
-        self.MetaBlockParameter = [] if MetaBlockParameter is None else MetaBlockParameter
+        if MetaBlockParameter is not None:
+            self.MetaBlockParameter = MetaBlockParameter
 
-        self._MetaBlockOutput = []
-        self.MetaBlockOutput = [] if MetaBlockOutput is None else MetaBlockOutput
+        if MetaBlockOutput is not None:
+            self.MetaBlockOutput = MetaBlockOutput
 
-        self._MetaBlockInput = []
-        self.MetaBlockInput = [] if MetaBlockInput is None else MetaBlockInput
+        if MetaBlockInput is not None:
+            self.MetaBlockInput = MetaBlockInput
 
-        self._MetaBlockState = []
-        self.MetaBlockState = [] if MetaBlockState is None else MetaBlockState
+        if MetaBlockState is not None:
+            self.MetaBlockState = MetaBlockState
 
         super(DynamicsMetaBlock, self).__init__(*args, **kw_args)
 
@@ -70,6 +71,7 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
     _enums = {"blockKind": "DynamicsBlockKind"}
     _refs = ["Block", "MetaBlockSignal", "MetaBlockReference", "MetaBlockParameter", "MetaBlockOutput", "MetaBlockInput", "MetaBlockState"]
     _many_refs = ["Block", "MetaBlockSignal", "MetaBlockReference", "MetaBlockParameter", "MetaBlockOutput", "MetaBlockInput", "MetaBlockState"]
+    _inverses = {"Block": "MetaBlock", "MetaBlockSignal": "MemberOf_MetaBlock", "MetaBlockReference": "MemberOf_MetaBlock", "MetaBlockParameter": "MemberOf_MetaBlock", "MetaBlockOutput": "MemberOf_MetaBlock", "MetaBlockInput": "MemberOf_MetaBlock", "MetaBlockState": "MemberOf_MetaBlock"}
 
     def getBlock(self):
         """
@@ -77,7 +79,8 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._Block
 
     def setBlock(self, value):
-        for x in self._Block:
+        value = RefList(value)
+        for x in list(self._Block):
             x.MetaBlock = None
         for y in value:
             y._MetaBlock = self
@@ -99,7 +102,8 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._MetaBlockSignal
 
     def setMetaBlockSignal(self, value):
-        for x in self._MetaBlockSignal:
+        value = RefList(value)
+        for x in list(self._MetaBlockSignal):
             x.MemberOf_MetaBlock = None
         for y in value:
             y._MemberOf_MetaBlock = self
@@ -121,7 +125,8 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._MetaBlockReference
 
     def setMetaBlockReference(self, value):
-        for x in self._MetaBlockReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockReference):
             x.MemberOf_MetaBlock = None
         for y in value:
             y._MemberOf_MetaBlock = self
@@ -143,7 +148,8 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._MetaBlockParameter
 
     def setMetaBlockParameter(self, value):
-        for x in self._MetaBlockParameter:
+        value = RefList(value)
+        for x in list(self._MetaBlockParameter):
             x.MemberOf_MetaBlock = None
         for y in value:
             y._MemberOf_MetaBlock = self
@@ -165,7 +171,8 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._MetaBlockOutput
 
     def setMetaBlockOutput(self, value):
-        for x in self._MetaBlockOutput:
+        value = RefList(value)
+        for x in list(self._MetaBlockOutput):
             x.MemberOf_MetaBlock = None
         for y in value:
             y._MemberOf_MetaBlock = self
@@ -187,7 +194,8 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._MetaBlockInput
 
     def setMetaBlockInput(self, value):
-        for x in self._MetaBlockInput:
+        value = RefList(value)
+        for x in list(self._MetaBlockInput):
             x.MemberOf_MetaBlock = None
         for y in value:
             y._MemberOf_MetaBlock = self
@@ -209,7 +217,8 @@ class DynamicsMetaBlock(CoreIdentifiedObject):
         return self._MetaBlockState
 
     def setMetaBlockState(self, value):
-        for x in self._MetaBlockState:
+        value = RefList(value)
+        for x in list(self._MetaBlockState):
             x.MemberOf_MetaBlock = None
         for y in value:
             y._MemberOf_MetaBlock = self
@@ -42,6 +42,7 @@ class DynamicsMetaBlockConInput(CoreIdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockConSignal", "MemberOf_MetaBlockConnection"]
     _many_refs = []
+    _inverses = {"MetaBlockConSignal": "MetaBlockConInput", "MemberOf_MetaBlockConnection": "MetaBlockConInput"}
 
     def getMetaBlockConSignal(self):
         """
@@ -65,13 +66,12 @@ class DynamicsMetaBlockConInput(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockConnection(self, value):
         if self._MemberOf_MetaBlockConnection is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnection.MetaBlockConInput if x != self]
-            self._MemberOf_MetaBlockConnection._MetaBlockConInput = filtered
+            self._MemberOf_MetaBlockConnection._MetaBlockConInput.discard(self)
 
         self._MemberOf_MetaBlockConnection = value
         if self._MemberOf_MetaBlockConnection is not None:
             if self not in self._MemberOf_MetaBlockConnection._MetaBlockConInput:
-                self._MemberOf_MetaBlockConnection._MetaBlockConInput.append(self)
+                self._MemberOf_MetaBlockConnection._reflist("_MetaBlockConInput").append(self)
 
     MemberOf_MetaBlockConnection = property(getMemberOf_MetaBlockConnection, setMemberOf_MetaBlockConnection)
 
@@ -42,6 +42,7 @@ class DynamicsMetaBlockConSignal(CoreIdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockConInput", "MetaBlockConOutput"]
     _many_refs = []
+    _inverses = {"MetaBlockConInput": "MetaBlockConSignal", "MetaBlockConOutput": "MetaBlockConSignal"}
 
     def getMetaBlockConInput(self):
         
@@ -64,13 +65,12 @@ class DynamicsMetaBlockConSignal(CoreIdentifiedObject):
 
     def setMetaBlockConOutput(self, value):
         if self._MetaBlockConOutput is not None:
-            filtered = [x for x in self.MetaBlockConOutput.MetaBlockConSignal if x != self]
-            self._MetaBlockConOutput._MetaBlockConSignal = filtered
+            self._MetaBlockConOutput._MetaBlockConSignal.discard(self)
 
         self._MetaBlockConOutput = value
         if self._MetaBlockConOutput is not None:
             if self not in self._MetaBlockConOutput._MetaBlockConSignal:
-                self._MetaBlockConOutput._MetaBlockConSignal.append(self)
+                self._MetaBlockConOutput._reflist("_MetaBlockConSignal").append(self)
 
     MetaBlockConOutput = property(getMetaBlockConOutput, setMetaBlockConOutput)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
 
@@ -34,29 +35,29 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         @param StandardControlBlock_MetaBlockOutputReference: 
         @param MetaBlockOutputReference: 
         """
-        self._MetaBlockParameterReference = []
-        self.MetaBlockParameterReference = [] if MetaBlockParameterReference is None else MetaBlockParameterReference
+        if MetaBlockParameterReference is not None:
+            self.MetaBlockParameterReference = MetaBlockParameterReference
 
-        self._StandardControlBlock_MetaBlockInputReference = []
-        self.StandardControlBlock_MetaBlockInputReference = [] if StandardControlBlock_MetaBlockInputReference is None else StandardControlBlock_MetaBlockInputReference
+        if StandardControlBlock_MetaBlockInputReference is not None:
+            self.StandardControlBlock_MetaBlockInputReference = StandardControlBlock_MetaBlockInputReference
 
-        self._MetaBlockStateReference = []
-        self.MetaBlockStateReference = [] if MetaBlockStateReference is None else MetaBlockStateReference
+        if MetaBlockStateReference is not None:
+            self.MetaBlockStateReference = MetaBlockStateReference
 
-        self._StandardControlBlock_MetaBlockStateReference = []
-        self.StandardControlBlock_MetaBlockStateReference = [] if StandardControlBlock_MetaBlockStateReference is None else StandardControlBlock_MetaBlockStateReference
+        if StandardControlBlock_MetaBlockStateReference is not None:
+            self.StandardControlBlock_MetaBlockStateReference = StandardControlBlock_MetaBlockStateReference
 
-        self._MetaBlockInputReference = []
-        self.MetaBlockInputReference = [] if MetaBlockInputReference is None else MetaBlockInputReference
+        if MetaBlockInputReference is not None:
+            self.MetaBlockInputReference = MetaBlockInputReference
 
-        self._StandardControlBlock_MetaBlockParameterReference = []
-        self.StandardControlBlock_MetaBlockParameterReference = [] if StandardControlBlock_MetaBlockParameterReference is None else StandardControlBlock_MetaBlockParameterReference
+        if StandardControlBlock_MetaBlockParameterReference is not None:
+            self.StandardControlBlock_MetaBlockParameterReference = StandardControlBlock_MetaBlockParameterReference
 
-        self._StandardControlBlock_MetaBlockOutputReference = []
-        self.StandardControlBlock_MetaBlockOutputReference = [] if StandardControlBlock_MetaBlockOutputReference is None else StandardControlBlock_MetaBlockOutputReference
+        if StandardControlBlock_MetaBlockOutputReference is not None:
+            self.StandardControlBlock_MetaBlockOutputReference = StandardControlBlock_MetaBlockOutputReference
 
-        self._MetaBlockOutputReference = []
-        self.MetaBlockOutputReference = [] if MetaBlockOutputReference is None else MetaBlockOutputReference
+        if MetaBlockOutputReference is not None:
+            self.MetaBlockOutputReference = MetaBlockOutputReference
 
         super(DynamicsMetaBlockConnectable, self).__init__(*args, **kw_args)
 
@@ -66,6 +67,7 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockParameterReference", "StandardControlBlock_MetaBlockInputReference", "MetaBlockStateReference", "StandardControlBlock_MetaBlockStateReference", "MetaBlockInputReference", "StandardControlBlock_MetaBlockParameterReference", "StandardControlBlock_MetaBlockOutputReference", "MetaBlockOutputReference"]
     _many_refs = ["MetaBlockParameterReference", "StandardControlBlock_MetaBlockInputReference", "MetaBlockStateReference", "StandardControlBlock_MetaBlockStateReference", "MetaBlockInputReference", "StandardControlBlock_MetaBlockParameterReference", "StandardControlBlock_MetaBlockOutputReference", "MetaBlockOutputReference"]
+    _inverses = {"MetaBlockParameterReference": "MetaBlockConnectable", "StandardControlBlock_MetaBlockInputReference": "StandardControlBlock_MetaBlockConnectable", "MetaBlockStateReference": "MetaBlockConnectable", "StandardControlBlock_MetaBlockStateReference": "StandardControlBlock_MetaBlockConnectable", "MetaBlockInputReference": "MetaBlockConnectable", "StandardControlBlock_MetaBlockParameterReference": "StandardControlBlock_MetaBlockConnectable", "StandardControlBlock_MetaBlockOutputReference": "StandardControlBlock_MetaBlockConnectable", "MetaBlockOutputReference": "MetaBlockConnectable"}
 
     def getMetaBlockParameterReference(self):
         """
@@ -73,7 +75,8 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._MetaBlockParameterReference
 
     def setMetaBlockParameterReference(self, value):
-        for x in self._MetaBlockParameterReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockParameterReference):
             x.MetaBlockConnectable = None
         for y in value:
             y._MetaBlockConnectable = self
@@ -95,7 +98,8 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._StandardControlBlock_MetaBlockInputReference
 
     def setStandardControlBlock_MetaBlockInputReference(self, value):
-        for x in self._StandardControlBlock_MetaBlockInputReference:
+        value = RefList(value)
+        for x in list(self._StandardControlBlock_MetaBlockInputReference):
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
             y._StandardControlBlock_MetaBlockConnectable = self
@@ -117,7 +121,8 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._MetaBlockStateReference
 
     def setMetaBlockStateReference(self, value):
-        for x in self._MetaBlockStateReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockStateReference):
             x.MetaBlockConnectable = None
         for y in value:
             y._MetaBlockConnectable = self
@@ -139,7 +144,8 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._StandardControlBlock_MetaBlockStateReference
 
     def setStandardControlBlock_MetaBlockStateReference(self, value):
-        for x in self._StandardControlBlock_MetaBlockStateReference:
+        value = RefList(value)
+        for x in list(self._StandardControlBlock_MetaBlockStateReference):
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
             y._StandardControlBlock_MetaBlockConnectable = self
@@ -161,7 +167,8 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._MetaBlockInputReference
 
     def setMetaBlockInputReference(self, value):
-        for x in self._MetaBlockInputReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockInputReference):
             x.MetaBlockConnectable = None
         for y in value:
             y._MetaBlockConnectable = self
@@ -183,7 +190,8 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._StandardControlBlock_MetaBlockParameterReference
 
     def setStandardControlBlock_MetaBlockParameterReference(self, value):
-        for x in self._StandardControlBlock_MetaBlockParameterReference:
+        value = RefList(value)
+        for x in list(self._StandardControlBlock_MetaBlockParameterReference):
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
             y._StandardControlBlock_MetaBlockConnectable = self
@@ -205,7 +213,8 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._StandardControlBlock_MetaBlockOutputReference
 
     def setStandardControlBlock_MetaBlockOutputReference(self, value):
-        for x in self._StandardControlBlock_MetaBlockOutputReference:
+        value = RefList(value)
+        for x in list(self._StandardControlBlock_MetaBlockOutputReference):
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
             y._StandardControlBlock_MetaBlockConnectable = self
@@ -227,7 +236,8 @@ class DynamicsMetaBlockConnectable(CoreIdentifiedObject):
         return self._MetaBlockOutputReference
 
     def setMetaBlockOutputReference(self, value):
-        for x in self._MetaBlockOutputReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockOutputReference):
             x.MetaBlockConnectable = None
         for y in value:
             y._MetaBlockConnectable = self
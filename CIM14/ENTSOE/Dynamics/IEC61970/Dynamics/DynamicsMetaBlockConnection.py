@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class DynamicsMetaBlockConnection(CoreIdentifiedObject):
 
@@ -30,17 +31,17 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
         @param BlockConnection: 
         @param MetaBlockConInput: 
         """
-        self._MetaBlockConOutput = []
-        self.MetaBlockConOutput = [] if MetaBlockConOutput is None else MetaBlockConOutput
+        if MetaBlockConOutput is not None:
+            self.MetaBlockConOutput = MetaBlockConOutput
 
         self._MemberOf_MetaBlockConnectivity = None
         self.MemberOf_MetaBlockConnectivity = MemberOf_MetaBlockConnectivity
 
-        self._BlockConnection = []
-        self.BlockConnection = [] if BlockConnection is None else BlockConnection
+        if BlockConnection is not None:
+            self.BlockConnection = BlockConnection
 
-        self._MetaBlockConInput = []
-        self.MetaBlockConInput = [] if MetaBlockConInput is None else MetaBlockConInput
+        if MetaBlockConInput is not None:
+            self.MetaBlockConInput = MetaBlockConInput
 
         super(DynamicsMetaBlockConnection, self).__init__(*args, **kw_args)
 
@@ -50,6 +51,7 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockConOutput", "MemberOf_MetaBlockConnectivity", "BlockConnection", "MetaBlockConInput"]
     _many_refs = ["MetaBlockConOutput", "BlockConnection", "MetaBlockConInput"]
+    _inverses = {"MetaBlockConOutput": "MemberOf_MetaBlockConnection", "MemberOf_MetaBlockConnectivity": "MetaBlockConnection", "BlockConnection": "MetaBlockConnection", "MetaBlockConInput": "MemberOf_MetaBlockConnection"}
 
     def getMetaBlockConOutput(self):
         """
@@ -57,7 +59,8 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
         return self._MetaBlockConOutput
 
     def setMetaBlockConOutput(self, value):
-        for x in self._MetaBlockConOutput:
+        value = RefList(value)
+        for x in list(self._MetaBlockConOutput):
             x.MemberOf_MetaBlockConnection = None
         for y in value:
             y._MemberOf_MetaBlockConnection = self
@@ -79,13 +82,12 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockConnectivity(self, value):
         if self._MemberOf_MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnectivity.MetaBlockConnection if x != self]
-            self._MemberOf_MetaBlockConnectivity._MetaBlockConnection = filtered
+            self._MemberOf_MetaBlockConnectivity._MetaBlockConnection.discard(self)
 
         self._MemberOf_MetaBlockConnectivity = value
         if self._MemberOf_MetaBlockConnectivity is not None:
             if self not in self._MemberOf_MetaBlockConnectivity._MetaBlockConnection:
-                self._MemberOf_MetaBlockConnectivity._MetaBlockConnection.append(self)
+                self._MemberOf_MetaBlockConnectivity._reflist("_MetaBlockConnection").append(self)
 
     MemberOf_MetaBlockConnectivity = property(getMemberOf_MetaBlockConnectivity, setMemberOf_MetaBlockConnectivity)
 
@@ -95,7 +97,8 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
         return self._BlockConnection
 
     def setBlockConnection(self, value):
-        for x in self._BlockConnection:
+        value = RefList(value)
+        for x in list(self._BlockConnection):
             x.MetaBlockConnection = None
         for y in value:
             y._MetaBlockConnection = self
@@ -117,7 +120,8 @@ class DynamicsMetaBlockConnection(CoreIdentifiedObject):
         return self._MetaBlockConInput
 
     def setMetaBlockConInput(self, value):
-        for x in self._MetaBlockConInput:
+        value = RefList(value)
+        for x in list(self._MetaBlockConInput):
             x.MemberOf_MetaBlockConnection = None
         for y in value:
             y._MemberOf_MetaBlockConnection = self
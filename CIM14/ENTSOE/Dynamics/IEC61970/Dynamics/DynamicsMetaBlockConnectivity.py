@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class DynamicsMetaBlockConnectivity(CoreIdentifiedObject):
 
@@ -28,11 +29,11 @@ class DynamicsMetaBlockConnectivity(CoreIdentifiedObject):
         @param BlockConnectivity: 
         @param MetaBlockConnection: 
         """
-        self._BlockConnectivity = []
-        self.BlockConnectivity = [] if BlockConnectivity is None else BlockConnectivity
+        if BlockConnectivity is not None:
+            self.BlockConnectivity = BlockConnectivity
 
-        self._MetaBlockConnection = []
-        self.MetaBlockConnection = [] if MetaBlockConnection is None else MetaBlockConnection
+        if MetaBlockConnection is not None:
+            self.MetaBlockConnection = MetaBlockConnection
 
         super(DynamicsMetaBlockConnectivity, self).__init__(*args, **kw_args)
 
@@ -42,6 +43,7 @@ class DynamicsMetaBlockConnectivity(CoreIdentifiedObject):
     _enums = {}
     _refs = ["BlockConnectivity", "MetaBlockConnection"]
     _many_refs = ["BlockConnectivity", "MetaBlockConnection"]
+    _inverses = {"BlockConnectivity": "MetaBlockConnectivity", "MetaBlockConnection": "MemberOf_MetaBlockConnectivity"}
 
     def getBlockConnectivity(self):
         """
@@ -49,7 +51,8 @@ class DynamicsMetaBlockConnectivity(CoreIdentifiedObject):
         return self._BlockConnectivity
 
     def setBlockConnectivity(self, value):
-        for x in self._BlockConnectivity:
+        value = RefList(value)
+        for x in list(self._BlockConnectivity):
             x.MetaBlockConnectivity = None
         for y in value:
             y._MetaBlockConnectivity = self
@@ -71,7 +74,8 @@ class DynamicsMetaBlockConnectivity(CoreIdentifiedObject):
         return self._MetaBlockConnection
 
     def setMetaBlockConnection(self, value):
-        for x in self._MetaBlockConnection:
+        value = RefList(value)
+        for x in list(self._MetaBlockConnection):
             x.MemberOf_MetaBlockConnectivity = None
         for y in value:
             y._MemberOf_MetaBlockConnectivity = self
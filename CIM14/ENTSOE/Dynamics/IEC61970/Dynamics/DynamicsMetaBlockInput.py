@@ -38,6 +38,7 @@ class DynamicsMetaBlockInput(DynamicsMetaBlockConnectable):
     _enums = {}
     _refs = ["MemberOf_MetaBlock"]
     _many_refs = []
+    _inverses = {"MemberOf_MetaBlock": "MetaBlockInput"}
 
     def getMemberOf_MetaBlock(self):
         
@@ -45,13 +46,12 @@ class DynamicsMetaBlockInput(DynamicsMetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockInput if x != self]
-            self._MemberOf_MetaBlock._MetaBlockInput = filtered
+            self._MemberOf_MetaBlock._MetaBlockInput.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
             if self not in self._MemberOf_MetaBlock._MetaBlockInput:
-                self._MemberOf_MetaBlock._MetaBlockInput.append(self)
+                self._MemberOf_MetaBlock._reflist("_MetaBlockInput").append(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -50,6 +50,7 @@ class DynamicsMetaBlockInputReference(CoreIdentifiedObject):
     _enums = {}
     _refs = ["MemberOf_MetaBlockReference", "MetaBlockSignal", "MetaBlockConnectable", "StandardControlBlock_MetaBlockConnectable"]
     _many_refs = []
+    _inverses = {"MemberOf_MetaBlockReference": "MetaBlockInputReference", "MetaBlockSignal": "From", "MetaBlockConnectable": "MetaBlockInputReference", "StandardControlBlock_MetaBlockConnectable": "StandardControlBlock_MetaBlockInputReference"}
 
     def getMemberOf_MetaBlockReference(self):
         
@@ -57,13 +58,12 @@ class DynamicsMetaBlockInputReference(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.MetaBlockInputReference if x != self]
-            self._MemberOf_MetaBlockReference._MetaBlockInputReference = filtered
+            self._MemberOf_MetaBlockReference._MetaBlockInputReference.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
             if self not in self._MemberOf_MetaBlockReference._MetaBlockInputReference:
-                self._MemberOf_MetaBlockReference._MetaBlockInputReference.append(self)
+                self._MemberOf_MetaBlockReference._reflist("_MetaBlockInputReference").append(self)
 
     MemberOf_MetaBlockReference = property(getMemberOf_MetaBlockReference, setMemberOf_MetaBlockReference)
 
@@ -89,13 +89,12 @@ class DynamicsMetaBlockInputReference(CoreIdentifiedObject):
 
     def setMetaBlockConnectable(self, value):
         if self._MetaBlockConnectable is not None:
-            filtered = [x for x in self.MetaBlockConnectable.MetaBlockInputReference if x != self]
-            self._MetaBlockConnectable._MetaBlockInputReference = filtered
+            self._MetaBlockConnectable._MetaBlockInputReference.discard(self)
 
         self._MetaBlockConnectable = value
         if self._MetaBlockConnectable is not None:
             if self not in self._MetaBlockConnectable._MetaBlockInputReference:
-                self._MetaBlockConnectable._MetaBlockInputReference.append(self)
+                self._MetaBlockConnectable._reflist("_MetaBlockInputReference").append(self)
 
     MetaBlockConnectable = property(getMetaBlockConnectable, setMetaBlockConnectable)
 
@@ -105,13 +104,12 @@ class DynamicsMetaBlockInputReference(CoreIdentifiedObject):
 
     def setStandardControlBlock_MetaBlockConnectable(self, value):
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            filtered = [x for x in self.StandardControlBlock_MetaBlockConnectable.StandardControlBlock_MetaBlockInputReference if x != self]
-            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockInputReference = filtered
+            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockInputReference.discard(self)
 
         self._StandardControlBlock_MetaBlockConnectable = value
         if self._StandardControlBlock_MetaBlockConnectable is not None:
             if self not in self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockInputReference:
-                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockInputReference.append(self)
+                self._StandardControlBlock_MetaBlockConnectable._reflist("_StandardControlBlock_MetaBlockInputReference").append(self)
 
     StandardControlBlock_MetaBlockConnectable = property(getStandardControlBlock_MetaBlockConnectable, setStandardControlBlock_MetaBlockConnectable)
 
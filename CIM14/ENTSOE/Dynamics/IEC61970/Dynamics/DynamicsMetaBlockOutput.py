@@ -38,6 +38,7 @@ class DynamicsMetaBlockOutput(DynamicsMetaBlockConnectable):
     _enums = {}
     _refs = ["MemberOf_MetaBlock"]
     _many_refs = []
+    _inverses = {"MemberOf_MetaBlock": "MetaBlockOutput"}
 
     def getMemberOf_MetaBlock(self):
         
@@ -45,13 +46,12 @@ class DynamicsMetaBlockOutput(DynamicsMetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockOutput if x != self]
-            self._MemberOf_MetaBlock._MetaBlockOutput = filtered
+            self._MemberOf_MetaBlock._MetaBlockOutput.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
             if self not in self._MemberOf_MetaBlock._MetaBlockOutput:
-                self._MemberOf_MetaBlock._MetaBlockOutput.append(self)
+                self._MemberOf_MetaBlock._reflist("_MetaBlockOutput").append(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockConnectable import DynamicsMetaBlockConnectable
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class DynamicsMetaBlockParameter(DynamicsMetaBlockConnectable):
 
@@ -31,8 +32,8 @@ class DynamicsMetaBlockParameter(DynamicsMetaBlockConnectable):
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
 
-        self._BlockParameter = []
-        self.BlockParameter = [] if BlockParameter is None else BlockParameter
+        if BlockParameter is not None:
+            self.BlockParameter = BlockParameter
 
         super(DynamicsMetaBlockParameter, self).__init__(*args, **kw_args)
 
@@ -42,6 +43,7 @@ class DynamicsMetaBlockParameter(DynamicsMetaBlockConnectable):
     _enums = {}
     _refs = ["MemberOf_MetaBlock", "BlockParameter"]
     _many_refs = ["BlockParameter"]
+    _inverses = {"MemberOf_MetaBlock": "MetaBlockParameter", "BlockParameter": "MetaBlockParameter"}
 
     def getMemberOf_MetaBlock(self):
         
@@ -49,13 +51,12 @@ class DynamicsMetaBlockParameter(DynamicsMetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockParameter if x != self]
-            self._MemberOf_MetaBlock._MetaBlockParameter = filtered
+            self._MemberOf_MetaBlock._MetaBlockParameter.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
             if self not in self._MemberOf_MetaBlock._MetaBlockParameter:
-                self._MemberOf_MetaBlock._MetaBlockParameter.append(self)
+                self._MemberOf_MetaBlock._reflist("_MetaBlockParameter").append(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -65,7 +66,8 @@ class DynamicsMetaBlockParameter(DynamicsMetaBlockConnectable):
         return self._BlockParameter
 
     def setBlockParameter(self, value):
-        for x in self._BlockParameter:
+        value = RefList(value)
+        for x in list(self._BlockParameter):
             x.MetaBlockParameter = None
         for y in value:
             y._MetaBlockParameter = self
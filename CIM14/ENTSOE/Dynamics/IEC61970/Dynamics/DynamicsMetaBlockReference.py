@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
@@ -37,25 +38,25 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
         self.equationType = equationType
 
-        self._MetaBlockStateReference = []
-        self.MetaBlockStateReference = [] if MetaBlockStateReference is None else MetaBlockStateReference
+        if MetaBlockStateReference is not None:
+            self.MetaBlockStateReference = MetaBlockStateReference
 
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
 
-        self._MetaBlockInputReference = []
-        self.MetaBlockInputReference = [] if MetaBlockInputReference is None else MetaBlockInputReference
+        if MetaBlockInputReference is not None:
+            self.MetaBlockInputReference = MetaBlockInputReference
 
-        self._BlockParameter = []
-        self.BlockParameter = [] if BlockParameter is None else BlockParameter
+        if BlockParameter is not None:
+            self.BlockParameter = BlockParameter
 
         self.MetaBlock = [] if MetaBlock is None else MetaBlock
 
-        self._MetaBlockOutputReference = []
-        self.MetaBlockOutputReference = [] if MetaBlockOutputReference is None else MetaBlockOutputReference
+        if MetaBlockOutputReference is not None:
+            self.MetaBlockOutputReference = MetaBlockOutputReference
 
-        self._MetaBlockParameterReference = []
-        self.MetaBlockParameterReference = [] if MetaBlockParameterReference is None else MetaBlockParameterReference
+        if MetaBlockParameterReference is not None:
+            self.MetaBlockParameterReference = MetaBlockParameterReference
 
         super(DynamicsMetaBlockReference, self).__init__(*args, **kw_args)
 
@@ -65,6 +66,7 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockStateReference", "MemberOf_MetaBlock", "MetaBlockInputReference", "BlockParameter", "MetaBlock", "MetaBlockOutputReference", "MetaBlockParameterReference"]
     _many_refs = ["MetaBlockStateReference", "MetaBlockInputReference", "BlockParameter", "MetaBlock", "MetaBlockOutputReference", "MetaBlockParameterReference"]
+    _inverses = {"MetaBlockStateReference": "MemberOf_MetaBlockReference", "MemberOf_MetaBlock": "MetaBlockReference", "MetaBlockInputReference": "MemberOf_MetaBlockReference", "BlockParameter": "MemberOf_MetaBlockReference", "MetaBlockOutputReference": "MemberOf_MetaBlockReference", "MetaBlockParameterReference": "MemberOf_MetaBlockReference"}
 
     def getMetaBlockStateReference(self):
         """
@@ -72,7 +74,8 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
         return self._MetaBlockStateReference
 
     def setMetaBlockStateReference(self, value):
-        for x in self._MetaBlockStateReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockStateReference):
             x.MemberOf_MetaBlockReference = None
         for y in value:
             y._MemberOf_MetaBlockReference = self
@@ -94,13 +97,12 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockReference if x != self]
-            self._MemberOf_MetaBlock._MetaBlockReference = filtered
+            self._MemberOf_MetaBlock._MetaBlockReference.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
             if self not in self._MemberOf_MetaBlock._MetaBlockReference:
-                self._MemberOf_MetaBlock._MetaBlockReference.append(self)
+                self._MemberOf_MetaBlock._reflist("_MetaBlockReference").append(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -110,7 +112,8 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
         return self._MetaBlockInputReference
 
     def setMetaBlockInputReference(self, value):
-        for x in self._MetaBlockInputReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockInputReference):
             x.MemberOf_MetaBlockReference = None
         for y in value:
             y._MemberOf_MetaBlockReference = self
@@ -132,7 +135,8 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
         return self._BlockParameter
 
     def setBlockParameter(self, value):
-        for x in self._BlockParameter:
+        value = RefList(value)
+        for x in list(self._BlockParameter):
             x.MemberOf_MetaBlockReference = None
         for y in value:
             y._MemberOf_MetaBlockReference = self
@@ -162,7 +166,8 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
         return self._MetaBlockOutputReference
 
     def setMetaBlockOutputReference(self, value):
-        for x in self._MetaBlockOutputReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockOutputReference):
             x.MemberOf_MetaBlockReference = None
         for y in value:
             y._MemberOf_MetaBlockReference = self
@@ -184,7 +189,8 @@ class DynamicsMetaBlockReference(CoreIdentifiedObject):
         return self._MetaBlockParameterReference
 
     def setMetaBlockParameterReference(self, value):
-        for x in self._MetaBlockParameterReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockParameterReference):
             x.MemberOf_MetaBlockReference = None
         for y in value:
             y._MemberOf_MetaBlockReference = self
@@ -46,6 +46,7 @@ class DynamicsMetaBlockSignal(CoreIdentifiedObject):
     _enums = {}
     _refs = ["To", "From", "MemberOf_MetaBlock"]
     _many_refs = []
+    _inverses = {"To": "MetaBlockSignal", "From": "MetaBlockSignal", "MemberOf_MetaBlock": "MetaBlockSignal"}
 
     def getTo(self):
         
@@ -53,13 +54,12 @@ class DynamicsMetaBlockSignal(CoreIdentifiedObject):
 
     def setTo(self, value):
         if self._To is not None:
-            filtered = [x for x in self.To.MetaBlockSignal if x != self]
-            self._To._MetaBlockSignal = filtered
+            self._To._MetaBlockSignal.discard(self)
 
         self._To = value
         if self._To is not None:
             if self not in self._To._MetaBlockSignal:
-                self._To._MetaBlockSignal.append(self)
+                self._To._reflist("_MetaBlockSignal").append(self)
 
     To = property(getTo, setTo)
 
@@ -84,13 +84,12 @@ class DynamicsMetaBlockSignal(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockSignal if x != self]
-            self._MemberOf_MetaBlock._MetaBlockSignal = filtered
+            self._MemberOf_MetaBlock._MetaBlockSignal.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
             if self not in self._MemberOf_MetaBlock._MetaBlockSignal:
-                self._MemberOf_MetaBlock._MetaBlockSignal.append(self)
+                self._MemberOf_MetaBlock._reflist("_MetaBlockSignal").append(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -50,6 +50,7 @@ class DynamicsMetaBlockStateReference(CoreIdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockConnectable", "StandardControlBlock_MetaBlockConnectable", "MemberOf_MetaBlockReference"]
     _many_refs = []
+    _inverses = {"MetaBlockConnectable": "MetaBlockStateReference", "StandardControlBlock_MetaBlockConnectable": "StandardControlBlock_MetaBlockStateReference", "MemberOf_MetaBlockReference": "MetaBlockStateReference"}
 
     def getMetaBlockConnectable(self):
         
@@ -57,13 +58,12 @@ class DynamicsMetaBlockStateReference(CoreIdentifiedObject):
 
     def setMetaBlockConnectable(self, value):
         if self._MetaBlockConnectable is not None:
-            filtered = [x for x in self.MetaBlockConnectable.MetaBlockStateReference if x != self]
-            self._MetaBlockConnectable._MetaBlockStateReference = filtered
+            self._MetaBlockConnectable._MetaBlockStateReference.discard(self)
 
         self._MetaBlockConnectable = value
         if self._MetaBlockConnectable is not None:
             if self not in self._MetaBlockConnectable._MetaBlockStateReference:
-                self._MetaBlockConnectable._MetaBlockStateReference.append(self)
+                self._MetaBlockConnectable._reflist("_MetaBlockStateReference").append(self)
 
     MetaBlockConnectable = property(getMetaBlockConnectable, setMetaBlockConnectable)
 
@@ -73,13 +73,12 @@ class DynamicsMetaBlockStateReference(CoreIdentifiedObject):
 
     def setStandardControlBlock_MetaBlockConnectable(self, value):
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            filtered = [x for x in self.StandardControlBlock_MetaBlockConnectable.StandardControlBlock_MetaBlockStateReference if x != self]
-            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference = filtered
+            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference.discard(self)
 
         self._StandardControlBlock_MetaBlockConnectable = value
         if self._StandardControlBlock_MetaBlockConnectable is not None:
             if self not in self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference:
-                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference.append(self)
+                self._StandardControlBlock_MetaBlockConnectable._reflist("_StandardControlBlock_MetaBlockStateReference").append(self)
 
     StandardControlBlock_MetaBlockConnectable = property(getStandardControlBlock_MetaBlockConnectable, setStandardControlBlock_MetaBlockConnectable)
 
@@ -89,13 +88,12 @@ class DynamicsMetaBlockStateReference(CoreIdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.MetaBlockStateReference if x != self]
-            self._MemberOf_MetaBlockReference._MetaBlockStateReference = filtered
+            self._MemberOf_MetaBlockReference._MetaBlockStateReference.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
             if self not in self._MemberOf_MetaBlockReference._MetaBlockStateReference:
-                self._MemberOf_MetaBlockReference._MetaBlockStateReference.append(self)
+                self._MemberOf_MetaBlockReference._reflist("_MetaBlockStateReference").append(self)
 
     MemberOf_MetaBlockReference = property(getMemberOf_MetaBlockReference, setMemberOf_MetaBlockReference)
 
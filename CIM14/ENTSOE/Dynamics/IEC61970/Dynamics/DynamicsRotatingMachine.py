@@ -66,4 +66,5 @@ class DynamicsRotatingMachine(WiresRegulatingCondEq):
     _enums = {"parametersFormType": "GeneratorsParametersFormType"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
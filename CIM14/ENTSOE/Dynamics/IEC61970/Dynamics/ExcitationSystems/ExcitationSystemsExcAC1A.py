@@ -110,4 +110,5 @@ class ExcitationSystemsExcAC1A(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
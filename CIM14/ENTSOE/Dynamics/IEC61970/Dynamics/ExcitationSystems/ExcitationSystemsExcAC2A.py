@@ -122,4 +122,5 @@ class ExcitationSystemsExcAC2A(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
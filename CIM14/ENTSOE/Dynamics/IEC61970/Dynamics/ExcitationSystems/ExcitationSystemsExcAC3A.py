@@ -122,4 +122,5 @@ class ExcitationSystemsExcAC3A(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
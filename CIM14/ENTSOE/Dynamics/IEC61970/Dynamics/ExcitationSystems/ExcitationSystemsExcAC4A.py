@@ -74,4 +74,5 @@ class ExcitationSystemsExcAC4A(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
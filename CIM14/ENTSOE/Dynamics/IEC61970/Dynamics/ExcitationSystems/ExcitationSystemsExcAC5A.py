@@ -94,4 +94,5 @@ class ExcitationSystemsExcAC5A(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
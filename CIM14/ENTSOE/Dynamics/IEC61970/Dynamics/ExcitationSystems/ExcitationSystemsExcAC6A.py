@@ -126,4 +126,5 @@ class ExcitationSystemsExcAC6A(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -142,4 +142,5 @@ class ExcitationSystemsExcAC7B(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -114,4 +114,5 @@ class ExcitationSystemsExcAC8B(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -102,4 +102,5 @@ class ExcitationSystemsExcDC1A(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
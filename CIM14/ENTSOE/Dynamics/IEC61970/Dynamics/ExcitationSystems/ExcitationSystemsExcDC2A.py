@@ -102,4 +102,5 @@ class ExcitationSystemsExcDC2A(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -82,4 +82,5 @@ class ExcitationSystemsExcDC3A(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
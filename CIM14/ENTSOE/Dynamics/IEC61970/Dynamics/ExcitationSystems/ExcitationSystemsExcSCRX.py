@@ -66,4 +66,5 @@ class ExcitationSystemsExcSCRX(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
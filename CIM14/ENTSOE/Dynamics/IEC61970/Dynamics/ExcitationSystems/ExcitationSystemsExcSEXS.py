@@ -74,4 +74,5 @@ class ExcitationSystemsExcSEXS(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -114,4 +114,5 @@ class ExcitationSystemsExcST1A(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -98,4 +98,5 @@ class ExcitationSystemsExcST2A(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -118,4 +118,5 @@ class ExcitationSystemsExcST3A(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -106,4 +106,5 @@ class ExcitationSystemsExcST5B(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
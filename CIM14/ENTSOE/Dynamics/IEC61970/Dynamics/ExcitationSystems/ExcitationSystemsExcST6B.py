@@ -102,4 +102,5 @@ class ExcitationSystemsExcST6B(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -102,4 +102,5 @@ class ExcitationSystemsExcST7B(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
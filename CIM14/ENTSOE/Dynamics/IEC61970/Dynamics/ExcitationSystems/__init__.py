@@ -19,28 +19,33 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcDC4B import ExcitationSystemsExcDC4B
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcDC2A import ExcitationSystemsExcDC2A
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcDC1A import ExcitationSystemsExcDC1A
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcAC3A import ExcitationSystemsExcAC3A
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcAC2A import ExcitationSystemsExcAC2A
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcAC1A import ExcitationSystemsExcAC1A
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcAC8B import ExcitationSystemsExcAC8B
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcST5B import ExcitationSystemsExcST5B
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcAC7B import ExcitationSystemsExcAC7B
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcAC4A import ExcitationSystemsExcAC4A
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcST4B import ExcitationSystemsExcST4B
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcST6B import ExcitationSystemsExcST6B
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcAC6A import ExcitationSystemsExcAC6A
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcAC5A import ExcitationSystemsExcAC5A
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcSCRX import ExcitationSystemsExcSCRX
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcSEXS import ExcitationSystemsExcSEXS
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcST7B import ExcitationSystemsExcST7B
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcST2A import ExcitationSystemsExcST2A
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcST1A import ExcitationSystemsExcST1A
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcDC3A import ExcitationSystemsExcDC3A
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.ExcitationSystems.ExcitationSystemsExcST3A import ExcitationSystemsExcST3A
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#ExcitationSystems"
 nsPrefix = "cimExcitationSystems"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ExcitationSystemsExcDC4B",
+    "ExcitationSystemsExcDC2A",
+    "ExcitationSystemsExcDC1A",
+    "ExcitationSystemsExcAC3A",
+    "ExcitationSystemsExcAC2A",
+    "ExcitationSystemsExcAC1A",
+    "ExcitationSystemsExcAC8B",
+    "ExcitationSystemsExcST5B",
+    "ExcitationSystemsExcAC7B",
+    "ExcitationSystemsExcAC4A",
+    "ExcitationSystemsExcST4B",
+    "ExcitationSystemsExcST6B",
+    "ExcitationSystemsExcAC6A",
+    "ExcitationSystemsExcAC5A",
+    "ExcitationSystemsExcSCRX",
+    "ExcitationSystemsExcSEXS",
+    "ExcitationSystemsExcST7B",
+    "ExcitationSystemsExcST2A",
+    "ExcitationSystemsExcST1A",
+    "ExcitationSystemsExcDC3A",
+    "ExcitationSystemsExcST3A",
+])
@@ -38,4 +38,5 @@ class GeneratorsGenEquiv(DynamicsRotatingMachine):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
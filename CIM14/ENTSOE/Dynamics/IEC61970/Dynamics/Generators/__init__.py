@@ -19,7 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.Generators.GeneratorsGenEquiv import GeneratorsGenEquiv
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Generators"
 nsPrefix = "cimGenerators"
@@ -29,3 +30,8 @@ class GeneratorsParametersFormType(str):
     """Values are: equivalentCircuit, timeConstantReactance
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "GeneratorsGenEquiv",
+])
@@ -86,4 +86,5 @@ class LoadsLoadMotor(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
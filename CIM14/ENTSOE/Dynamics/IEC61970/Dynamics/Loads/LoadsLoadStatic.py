@@ -102,4 +102,5 @@ class LoadsLoadStatic(CorePowerSystemResource):
     _enums = {"staticLoadType": "LoadsStaticLoadType"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
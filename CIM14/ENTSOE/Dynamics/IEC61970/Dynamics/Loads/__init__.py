@@ -19,8 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.Loads.LoadsLoadStatic import LoadsLoadStatic
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.Loads.LoadsLoadMotor import LoadsLoadMotor
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Loads"
 nsPrefix = "cimLoads"
@@ -28,3 +28,9 @@ nsPrefix = "cimLoads"
 
 class LoadsStaticLoadType(str):
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "LoadsLoadStatic",
+    "LoadsLoadMotor",
+])
@@ -50,4 +50,5 @@ class MotorsMechLoad1(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
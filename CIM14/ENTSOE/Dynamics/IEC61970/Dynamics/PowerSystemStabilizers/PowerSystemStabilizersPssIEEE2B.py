@@ -158,4 +158,5 @@ class PowerSystemStabilizersPssIEEE2B(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
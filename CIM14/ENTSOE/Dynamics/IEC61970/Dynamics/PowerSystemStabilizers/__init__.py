@@ -19,8 +19,13 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.PowerSystemStabilizers.PowerSystemStabilizersPssIEEE2B import PowerSystemStabilizersPssIEEE2B
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#PowerSystemStabilizers"
 nsPrefix = "cimPowerSystemStabilizers"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "PowerSystemStabilizersPssIEEE2B",
+])
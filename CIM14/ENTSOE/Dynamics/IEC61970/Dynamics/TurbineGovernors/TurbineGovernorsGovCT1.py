@@ -178,4 +178,5 @@ class TurbineGovernorsGovCT1(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
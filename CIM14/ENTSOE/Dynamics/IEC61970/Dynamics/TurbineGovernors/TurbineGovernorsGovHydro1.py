@@ -86,4 +86,5 @@ class TurbineGovernorsGovHydro1(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
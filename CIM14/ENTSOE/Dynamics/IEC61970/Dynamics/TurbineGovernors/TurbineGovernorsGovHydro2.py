@@ -150,4 +150,5 @@ class TurbineGovernorsGovHydro2(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
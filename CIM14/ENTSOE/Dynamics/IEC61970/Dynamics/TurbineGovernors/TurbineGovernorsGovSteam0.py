@@ -66,4 +66,5 @@ class TurbineGovernorsGovSteam0(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
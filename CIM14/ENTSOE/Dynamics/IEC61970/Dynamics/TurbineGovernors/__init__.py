@@ -19,12 +19,17 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.TurbineGovernors.TurbineGovernorsGovHydro2 import TurbineGovernorsGovHydro2
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.TurbineGovernors.TurbineGovernorsGovSteam0 import TurbineGovernorsGovSteam0
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.TurbineGovernors.TurbineGovernorsGovHydro1 import TurbineGovernorsGovHydro1
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.TurbineGovernors.TurbineGovernorsGovSteam1 import TurbineGovernorsGovSteam1
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.TurbineGovernors.TurbineGovernorsGovCT1 import TurbineGovernorsGovCT1
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#TurbineGovernors"
 nsPrefix = "cimTurbineGovernors"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "TurbineGovernorsGovHydro2",
+    "TurbineGovernorsGovSteam0",
+    "TurbineGovernorsGovHydro1",
+    "TurbineGovernorsGovSteam1",
+    "TurbineGovernorsGovCT1",
+])
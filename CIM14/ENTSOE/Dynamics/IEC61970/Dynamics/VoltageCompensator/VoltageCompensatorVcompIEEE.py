@@ -42,4 +42,5 @@ class VoltageCompensatorVcompIEEE(CorePowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
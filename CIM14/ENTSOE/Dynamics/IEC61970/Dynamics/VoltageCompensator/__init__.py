@@ -19,9 +19,14 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.VoltageCompensator.VoltageCompensatorVcompCross import VoltageCompensatorVcompCross
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.VoltageCompensator.VoltageCompensatorVcompIEEE import VoltageCompensatorVcompIEEE
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#VoltageCompensator"
 nsPrefix = "cimVoltageCompensator"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "VoltageCompensatorVcompCross",
+    "VoltageCompensatorVcompIEEE",
+])
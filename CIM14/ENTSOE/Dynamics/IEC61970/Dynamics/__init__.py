@@ -19,30 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockState import DynamicsMetaBlockState
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockConSignal import DynamicsMetaBlockConSignal
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockReference import DynamicsMetaBlockReference
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockSignal import DynamicsMetaBlockSignal
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsAttributeBlockParameter import DynamicsAttributeBlockParameter
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockConnection import DynamicsMetaBlockConnection
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockConOutput import DynamicsMetaBlockConOutput
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockInput import DynamicsMetaBlockInput
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockOutputReference import DynamicsMetaBlockOutputReference
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockStateReference import DynamicsMetaBlockStateReference
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsBlockConnection import DynamicsBlockConnection
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockConnectivity import DynamicsMetaBlockConnectivity
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlock import DynamicsMetaBlock
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockConInput import DynamicsMetaBlockConInput
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockParameter import DynamicsMetaBlockParameter
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockConnectable import DynamicsMetaBlockConnectable
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockInputReference import DynamicsMetaBlockInputReference
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsRotatingMachine import DynamicsRotatingMachine
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsBlockConnectivity import DynamicsBlockConnectivity
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockParameterReference import DynamicsMetaBlockParameterReference
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsAsynchronousMachine import DynamicsAsynchronousMachine
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsBlockParameter import DynamicsBlockParameter
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsBlock import DynamicsBlock
-from CIM14.ENTSOE.Dynamics.IEC61970.Dynamics.DynamicsMetaBlockOutput import DynamicsMetaBlockOutput
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Dynamics"
 nsPrefix = "cimDynamics"
@@ -50,3 +28,39 @@ nsPrefix = "cimDynamics"
 
 class DynamicsBlockKind(str):
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "DynamicsMetaBlockState",
+    "DynamicsMetaBlockConSignal",
+    "DynamicsMetaBlockReference",
+    "DynamicsMetaBlockSignal",
+    "DynamicsAttributeBlockParameter",
+    "DynamicsMetaBlockConnection",
+    "DynamicsMetaBlockConOutput",
+    "DynamicsMetaBlockInput",
+    "DynamicsMetaBlockOutputReference",
+    "DynamicsMetaBlockStateReference",
+    "DynamicsBlockConnection",
+    "DynamicsMetaBlockConnectivity",
+    "DynamicsMetaBlock",
+    "DynamicsMetaBlockConInput",
+    "DynamicsMetaBlockParameter",
+    "DynamicsMetaBlockConnectable",
+    "DynamicsMetaBlockInputReference",
+    "DynamicsRotatingMachine",
+    "DynamicsBlockConnectivity",
+    "DynamicsMetaBlockParameterReference",
+    "DynamicsAsynchronousMachine",
+    "DynamicsBlockParameter",
+    "DynamicsBlock",
+    "DynamicsMetaBlockOutput",
+], [
+    "ExcitationSystems",
+    "Generators",
+    "Loads",
+    "Motors",
+    "PowerSystemStabilizers",
+    "TurbineGovernors",
+    "VoltageCompensator",
+])
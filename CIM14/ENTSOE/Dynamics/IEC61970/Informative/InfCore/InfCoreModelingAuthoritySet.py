@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreIdentifiedObject import CoreIdentifiedObject
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class InfCoreModelingAuthoritySet(CoreIdentifiedObject):
 
@@ -27,8 +28,8 @@ class InfCoreModelingAuthoritySet(CoreIdentifiedObject):
 
         @param IdentifiedObjects: 
         """
-        self._IdentifiedObjects = []
-        self.IdentifiedObjects = [] if IdentifiedObjects is None else IdentifiedObjects
+        if IdentifiedObjects is not None:
+            self.IdentifiedObjects = IdentifiedObjects
 
         super(InfCoreModelingAuthoritySet, self).__init__(*args, **kw_args)
 
@@ -38,6 +39,7 @@ class InfCoreModelingAuthoritySet(CoreIdentifiedObject):
     _enums = {}
     _refs = ["IdentifiedObjects"]
     _many_refs = ["IdentifiedObjects"]
+    _inverses = {"IdentifiedObjects": "ModelingAuthoritySet"}
 
     def getIdentifiedObjects(self):
         """
@@ -45,7 +47,8 @@ class InfCoreModelingAuthoritySet(CoreIdentifiedObject):
         return self._IdentifiedObjects
 
     def setIdentifiedObjects(self, value):
-        for x in self._IdentifiedObjects:
+        value = RefList(value)
+        for x in list(self._IdentifiedObjects):
             x.ModelingAuthoritySet = None
         for y in value:
             y._ModelingAuthoritySet = self
@@ -38,6 +38,7 @@ class MeasControl(CoreIdentifiedObject):
     _enums = {}
     _refs = ["RegulatingCondEq"]
     _many_refs = []
+    _inverses = {"RegulatingCondEq": "Controls"}
 
     def getRegulatingCondEq(self):
         """
@@ -46,13 +47,12 @@ class MeasControl(CoreIdentifiedObject):
 
     def setRegulatingCondEq(self, value):
         if self._RegulatingCondEq is not None:
-            filtered = [x for x in self.RegulatingCondEq.Controls if x != self]
-            self._RegulatingCondEq._Controls = filtered
+            self._RegulatingCondEq._Controls.discard(self)
 
         self._RegulatingCondEq = value
         if self._RegulatingCondEq is not None:
             if self not in self._RegulatingCondEq._Controls:
-                self._RegulatingCondEq._Controls.append(self)
+                self._RegulatingCondEq._reflist("_Controls").append(self)
 
     RegulatingCondEq = property(getRegulatingCondEq, setRegulatingCondEq)
 
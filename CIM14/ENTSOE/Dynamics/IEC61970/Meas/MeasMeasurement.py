@@ -38,6 +38,7 @@ class MeasMeasurement(CoreIdentifiedObject):
     _enums = {}
     _refs = ["PowerSystemResource"]
     _many_refs = []
+    _inverses = {"PowerSystemResource": "Measurements"}
 
     def getPowerSystemResource(self):
         """
@@ -46,13 +47,12 @@ class MeasMeasurement(CoreIdentifiedObject):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Measurements if x != self]
-            self._PowerSystemResource._Measurements = filtered
+            self._PowerSystemResource._Measurements.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
             if self not in self._PowerSystemResource._Measurements:
-                self._PowerSystemResource._Measurements.append(self)
+                self._PowerSystemResource._reflist("_Measurements").append(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
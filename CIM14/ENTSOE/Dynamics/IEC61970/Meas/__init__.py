@@ -19,9 +19,14 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61970.Meas.MeasMeasurement import MeasMeasurement
-from CIM14.ENTSOE.Dynamics.IEC61970.Meas.MeasControl import MeasControl
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Meas"
 nsPrefix = "cimMeas"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "MeasMeasurement",
+    "MeasControl",
+])
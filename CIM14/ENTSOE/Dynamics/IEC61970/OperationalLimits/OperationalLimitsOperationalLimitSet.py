@@ -38,6 +38,7 @@ class OperationalLimitsOperationalLimitSet(CoreIdentifiedObject):
     _enums = {}
     _refs = ["Equipment"]
     _many_refs = []
+    _inverses = {"Equipment": "OperationalLimitSet"}
 
     def getEquipment(self):
         """
@@ -46,13 +47,12 @@ class OperationalLimitsOperationalLimitSet(CoreIdentifiedObject):
 
     def setEquipment(self, value):
         if self._Equipment is not None:
-            filtered = [x for x in self.Equipment.OperationalLimitSet if x != self]
-            self._Equipment._OperationalLimitSet = filtered
+            self._Equipment._OperationalLimitSet.discard(self)
 
         self._Equipment = value
         if self._Equipment is not None:
             if self not in self._Equipment._OperationalLimitSet:
-                self._Equipment._OperationalLimitSet.append(self)
+                self._Equipment._reflist("_OperationalLimitSet").append(self)
 
     Equipment = property(getEquipment, setEquipment)
 
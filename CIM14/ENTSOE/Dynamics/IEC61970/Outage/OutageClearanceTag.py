@@ -38,6 +38,7 @@ class OutageClearanceTag(CoreIdentifiedObject):
     _enums = {}
     _refs = ["ConductingEquipment"]
     _many_refs = []
+    _inverses = {"ConductingEquipment": "ClearanceTags"}
 
     def getConductingEquipment(self):
         """
@@ -46,13 +47,12 @@ class OutageClearanceTag(CoreIdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.ClearanceTags if x != self]
-            self._ConductingEquipment._ClearanceTags = filtered
+            self._ConductingEquipment._ClearanceTags.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
             if self not in self._ConductingEquipment._ClearanceTags:
-                self._ConductingEquipment._ClearanceTags.append(self)
+                self._ConductingEquipment._reflist("_ClearanceTags").append(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
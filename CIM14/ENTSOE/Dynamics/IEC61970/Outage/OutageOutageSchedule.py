@@ -38,6 +38,7 @@ class OutageOutageSchedule(CoreIdentifiedObject):
     _enums = {}
     _refs = ["PowerSystemResource"]
     _many_refs = []
+    _inverses = {"PowerSystemResource": "OutageSchedule"}
 
     def getPowerSystemResource(self):
         """
@@ -19,9 +19,14 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61970.Outage.OutageOutageSchedule import OutageOutageSchedule
-from CIM14.ENTSOE.Dynamics.IEC61970.Outage.OutageClearanceTag import OutageClearanceTag
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Outage"
 nsPrefix = "cimOutage"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "OutageOutageSchedule",
+    "OutageClearanceTag",
+])
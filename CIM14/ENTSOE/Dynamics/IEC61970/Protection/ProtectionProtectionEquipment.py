@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreEquipment import CoreEquipment
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class ProtectionProtectionEquipment(CoreEquipment):
 
@@ -27,8 +28,8 @@ class ProtectionProtectionEquipment(CoreEquipment):
 
         @param ConductingEquipments: 
         """
-        self._ConductingEquipments = []
-        self.ConductingEquipments = [] if ConductingEquipments is None else ConductingEquipments
+        if ConductingEquipments is not None:
+            self.ConductingEquipments = ConductingEquipments
 
         super(ProtectionProtectionEquipment, self).__init__(*args, **kw_args)
 
@@ -38,6 +39,7 @@ class ProtectionProtectionEquipment(CoreEquipment):
     _enums = {}
     _refs = ["ConductingEquipments"]
     _many_refs = ["ConductingEquipments"]
+    _inverses = {"ConductingEquipments": "ProtectionEquipments"}
 
     def getConductingEquipments(self):
         """
@@ -46,20 +48,19 @@ class ProtectionProtectionEquipment(CoreEquipment):
 
     def setConductingEquipments(self, value):
         for p in self._ConductingEquipments:
-            filtered = [q for q in p.ProtectionEquipments if q != self]
-            self._ConductingEquipments._ProtectionEquipments = filtered
+            p._ProtectionEquipments.discard(self)
         for r in value:
             if self not in r._ProtectionEquipments:
-                r._ProtectionEquipments.append(self)
-        self._ConductingEquipments = value
+                r._reflist("_ProtectionEquipments").append(self)
+        self._ConductingEquipments = RefList(value)
 
     ConductingEquipments = property(getConductingEquipments, setConductingEquipments)
 
     def addConductingEquipments(self, *ConductingEquipments):
         for obj in ConductingEquipments:
             if self not in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.append(self)
-            self._ConductingEquipments.append(obj)
+                obj._reflist("_ProtectionEquipments").append(self)
+            self._reflist("_ConductingEquipments").append(obj)
 
     def removeConductingEquipments(self, *ConductingEquipments):
         for obj in ConductingEquipments:
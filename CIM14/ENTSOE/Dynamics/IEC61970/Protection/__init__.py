@@ -19,8 +19,13 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61970.Protection.ProtectionProtectionEquipment import ProtectionProtectionEquipment
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Protection"
 nsPrefix = "cimProtection"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ProtectionProtectionEquipment",
+])
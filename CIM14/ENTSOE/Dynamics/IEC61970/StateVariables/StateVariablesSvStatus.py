@@ -38,6 +38,7 @@ class StateVariablesSvStatus(Element):
     _enums = {}
     _refs = ["ConductingEquipment"]
     _many_refs = []
+    _inverses = {"ConductingEquipment": "SvStatus"}
 
     def getConductingEquipment(self):
         """
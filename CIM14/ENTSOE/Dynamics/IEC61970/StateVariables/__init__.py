@@ -19,8 +19,13 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61970.StateVariables.StateVariablesSvStatus import StateVariablesSvStatus
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#StateVariables"
 nsPrefix = "cimStateVariables"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "StateVariablesSvStatus",
+])
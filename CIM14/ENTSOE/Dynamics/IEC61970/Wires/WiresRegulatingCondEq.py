@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CoreConductingEquipment import CoreConductingEquipment
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class WiresRegulatingCondEq(CoreConductingEquipment):
 
@@ -28,8 +29,8 @@ class WiresRegulatingCondEq(CoreConductingEquipment):
         @param Controls:
         @param RegulatingControl:
         """
-        self._Controls = []
-        self.Controls = [] if Controls is None else Controls
+        if Controls is not None:
+            self.Controls = Controls
 
         self._RegulatingControl = None
         self.RegulatingControl = RegulatingControl
@@ -42,13 +43,15 @@ class WiresRegulatingCondEq(CoreConductingEquipment):
     _enums = {}
     _refs = ["Controls", "RegulatingControl"]
     _many_refs = ["Controls"]
+    _inverses = {"Controls": "RegulatingCondEq", "RegulatingControl": "RegulatingCondEq"}
 
     def getControls(self):
         
         return self._Controls
 
     def setControls(self, value):
-        for x in self._Controls:
+        value = RefList(value)
+        for x in list(self._Controls):
             x.RegulatingCondEq = None
         for y in value:
             y._RegulatingCondEq = self
@@ -70,13 +73,12 @@ class WiresRegulatingCondEq(CoreConductingEquipment):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulatingCondEq if x != self]
-            self._RegulatingControl._RegulatingCondEq = filtered
+            self._RegulatingControl._RegulatingCondEq.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
             if self not in self._RegulatingControl._RegulatingCondEq:
-                self._RegulatingControl._RegulatingCondEq.append(self)
+                self._RegulatingControl._reflist("_RegulatingCondEq").append(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
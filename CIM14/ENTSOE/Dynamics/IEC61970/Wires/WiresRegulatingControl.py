@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Dynamics.IEC61970.Core.CorePowerSystemResource import CorePowerSystemResource
+from CIM14.ENTSOE.Dynamics.Element import RefList
 
 class WiresRegulatingControl(CorePowerSystemResource):
 
@@ -27,8 +28,8 @@ class WiresRegulatingControl(CorePowerSystemResource):
 
         @param RegulatingCondEq: 
         """
-        self._RegulatingCondEq = []
-        self.RegulatingCondEq = [] if RegulatingCondEq is None else RegulatingCondEq
+        if RegulatingCondEq is not None:
+            self.RegulatingCondEq = RegulatingCondEq
 
         super(WiresRegulatingControl, self).__init__(*args, **kw_args)
 
@@ -38,6 +39,7 @@ class WiresRegulatingControl(CorePowerSystemResource):
     _enums = {}
     _refs = ["RegulatingCondEq"]
     _many_refs = ["RegulatingCondEq"]
+    _inverses = {"RegulatingCondEq": "RegulatingControl"}
 
     def getRegulatingCondEq(self):
         """
@@ -45,7 +47,8 @@ class WiresRegulatingControl(CorePowerSystemResource):
         return self._RegulatingCondEq
 
     def setRegulatingCondEq(self, value):
-        for x in self._RegulatingCondEq:
+        value = RefList(value)
+        for x in list(self._RegulatingCondEq):
             x.RegulatingControl = None
         for y in value:
             y._RegulatingControl = self
@@ -58,4 +58,5 @@ class WiresSynchronousMachine(DynamicsRotatingMachine):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,10 +19,15 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.ENTSOE.Dynamics.IEC61970.Wires.WiresSynchronousMachine import WiresSynchronousMachine
-from CIM14.ENTSOE.Dynamics.IEC61970.Wires.WiresRegulatingControl import WiresRegulatingControl
-from CIM14.ENTSOE.Dynamics.IEC61970.Wires.WiresRegulatingCondEq import WiresRegulatingCondEq
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Wires"
 nsPrefix = "cimWires"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "WiresSynchronousMachine",
+    "WiresRegulatingControl",
+    "WiresRegulatingCondEq",
+])
@@ -20,6 +20,23 @@
 
 
 
+
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#IEC61970"
 nsPrefix = "cimIEC61970"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+], [
+    "Contingency",
+    "Core",
+    "Dynamics",
+    "Informative",
+    "Meas",
+    "OperationalLimits",
+    "Outage",
+    "Protection",
+    "StateVariables",
+    "Wires",
+])
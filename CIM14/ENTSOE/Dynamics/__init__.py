@@ -21,8 +21,8 @@
 """
 """
 
-from CIM14.ENTSOE.Dynamics.Element import Element
-from CIM14.ENTSOE.Dynamics.Thing import Thing
+import sys
+from CIM14.ENTSOE.Dynamics.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile/ENTSOE/Dynamics"
 nsPrefix = "dyn"
@@ -163,3 +163,12 @@ class CIMGDay(str):
 
 class CIMGYearMonth(str):
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Element",
+    "Thing",
+], [
+    "IEC61968",
+    "IEC61970",
+])
@@ -48,6 +48,7 @@ class TieFlow(Element):
     _enums = {}
     _refs = ["ControlArea", "Terminal"]
     _many_refs = []
+    _inverses = {"ControlArea": "TieFlow", "Terminal": "TieFlow"}
 
     def getControlArea(self):
         """The control area of the tie flows.
@@ -56,13 +57,12 @@ class TieFlow(Element):
 
     def setControlArea(self, value):
         if self._ControlArea is not None:
-            filtered = [x for x in self.ControlArea.TieFlow if x != self]
-            self._ControlArea._TieFlow = filtered
+            self._ControlArea._TieFlow.discard(self)
 
         self._ControlArea = value
         if self._ControlArea is not None:
             if self not in self._ControlArea._TieFlow:
-                self._ControlArea._TieFlow.append(self)
+                self._ControlArea._reflist("_TieFlow").append(self)
 
     ControlArea = property(getControlArea, setControlArea)
 
@@ -73,13 +73,12 @@ class TieFlow(Element):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.TieFlow if x != self]
-            self._Terminal._TieFlow = filtered
+            self._Terminal._TieFlow.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._TieFlow:
-                self._Terminal._TieFlow.append(self)
+                self._Terminal._reflist("_TieFlow").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -48,4 +48,5 @@ class BasicIntervalSchedule(IdentifiedObject):
     _enums = {"value1Unit": "UnitSymbol", "value2Unit": "UnitSymbol"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.ENTSOE.Equipment.Element import RefList
 
 class ConnectivityNode(IdentifiedObject):
     """Connectivity nodes are points where terminals of conducting equipment are connected together with zero impedance.
@@ -29,8 +30,8 @@ class ConnectivityNode(IdentifiedObject):
 
         @param Terminals: Terminals interconnect with zero impedance at a node.  Measurements on a node apply to all of its terminals.
         """
-        self._Terminals = []
-        self.Terminals = [] if Terminals is None else Terminals
+        if Terminals is not None:
+            self.Terminals = Terminals
 
         super(ConnectivityNode, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class ConnectivityNode(IdentifiedObject):
     _enums = {}
     _refs = ["Terminals"]
     _many_refs = ["Terminals"]
+    _inverses = {"Terminals": "ConnectivityNode"}
 
     def getTerminals(self):
         """Terminals interconnect with zero impedance at a node.  Measurements on a node apply to all of its terminals.
@@ -47,7 +49,8 @@ class ConnectivityNode(IdentifiedObject):
         return self._Terminals
 
     def setTerminals(self, value):
-        for x in self._Terminals:
+        value = RefList(value)
+        for x in list(self._Terminals):
             x.ConnectivityNode = None
         for y in value:
             y._ConnectivityNode = self
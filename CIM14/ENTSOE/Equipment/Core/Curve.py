@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.ENTSOE.Equipment.Element import RefList
 
 class Curve(IdentifiedObject):
     """A multi-purpose curve or functional relationship between an independent variable (X-axis) and dependent (Y-axis) variables.
@@ -41,8 +42,8 @@ class Curve(IdentifiedObject):
         #: The X-axis units of measure. Values are: "A", "rad", "none", "g", "W/Hz", "V", "m2", "VA", "VArh", "N", "Pa", "VAh", "F", "H", "Hz-1", "W/s", "J", "m", "S", "min", "deg", "J/s", "s", "Wh", "m3", "oC", "V/VAr", "s-1", "h", "W", "ohm", "Hz", "VAr", "kg/J"
         self.xUnit = xUnit
 
-        self._CurveDatas = []
-        self.CurveDatas = [] if CurveDatas is None else CurveDatas
+        if CurveDatas is not None:
+            self.CurveDatas = CurveDatas
 
         super(Curve, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class Curve(IdentifiedObject):
     _enums = {"y1Unit": "UnitSymbol", "curveStyle": "CurveStyle", "xUnit": "UnitSymbol"}
     _refs = ["CurveDatas"]
     _many_refs = ["CurveDatas"]
+    _inverses = {"CurveDatas": "Curve"}
 
     def getCurveDatas(self):
         """The point data values that define a curve
@@ -59,7 +61,8 @@ class Curve(IdentifiedObject):
         return self._CurveDatas
 
     def setCurveDatas(self, value):
-        for x in self._CurveDatas:
+        value = RefList(value)
+        for x in list(self._CurveDatas):
             x.Curve = None
         for y in value:
             y._Curve = self
@@ -52,6 +52,7 @@ class CurveData(Element):
     _enums = {}
     _refs = ["Curve"]
     _many_refs = []
+    _inverses = {"Curve": "CurveDatas"}
 
     def getCurve(self):
         """The Curve defined by this CurveData.
@@ -60,13 +61,12 @@ class CurveData(Element):
 
     def setCurve(self, value):
         if self._Curve is not None:
-            filtered = [x for x in self.Curve.CurveDatas if x != self]
-            self._Curve._CurveDatas = filtered
+            self._Curve._CurveDatas.discard(self)
 
         self._Curve = value
         if self._Curve is not None:
             if self not in self._Curve._CurveDatas:
-                self._Curve._CurveDatas.append(self)
+                self._Curve._reflist("_CurveDatas").append(self)
 
     Curve = property(getCurve, setCurve)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.PowerSystemResource import PowerSystemResource
+from CIM14.ENTSOE.Equipment.Element import RefList
 
 class Equipment(PowerSystemResource):
     """The parts of a power system that are physical devices, electronic or mechanical
@@ -34,8 +35,8 @@ class Equipment(PowerSystemResource):
         #: The single instance of equipment represents multiple pieces of equipment that have been modeled together as an aggregate.  Examples would be PowerTransformers or SychronousMachines operating in parallel modeled as a single aggregate PowerTransformer or aggregate SynchronousMachine.  This is not to be used to indicate equipment that is part of a group of interdependent equipment produced by a network production program.For ENTSO-E, the TSOs will use this flag for equivalent equipment. This Boolean flag indicates that this equipment (element) of the power system model is obtained by a network reduction procedure.  If the flag is set to 'true', the equipment is treated as an equivalent.  This flag provides an alternative way of representing an aggregated (equivalent) element by allowing usage of all available attributes for a given class instead of usage of dedicated classes for equivalent equipment that have a limited number of attributes.  Do not use this attribute for TransformerWinding, BusBarSection, EquivalentBranch, EquivalentShunt and EquivalentInjection.
         self.aggregate = aggregate
 
-        self._OperationalLimitSet = []
-        self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
+        if OperationalLimitSet is not None:
+            self.OperationalLimitSet = OperationalLimitSet
 
         self._EquipmentContainer = None
         self.EquipmentContainer = EquipmentContainer
@@ -48,6 +49,7 @@ class Equipment(PowerSystemResource):
     _enums = {}
     _refs = ["OperationalLimitSet", "EquipmentContainer"]
     _many_refs = ["OperationalLimitSet"]
+    _inverses = {"OperationalLimitSet": "Equipment", "EquipmentContainer": "Equipments"}
 
     def getOperationalLimitSet(self):
         """The equipment limit sets associated with the equipment.
@@ -55,7 +57,8 @@ class Equipment(PowerSystemResource):
         return self._OperationalLimitSet
 
     def setOperationalLimitSet(self, value):
-        for x in self._OperationalLimitSet:
+        value = RefList(value)
+        for x in list(self._OperationalLimitSet):
             x.Equipment = None
         for y in value:
             y._Equipment = self
@@ -78,13 +81,12 @@ class Equipment(PowerSystemResource):
 
     def setEquipmentContainer(self, value):
         if self._EquipmentContainer is not None:
-            filtered = [x for x in self.EquipmentContainer.Equipments if x != self]
-            self._EquipmentContainer._Equipments = filtered
+            self._EquipmentContainer._Equipments.discard(self)
 
         self._EquipmentContainer = value
         if self._EquipmentContainer is not None:
             if self not in self._EquipmentContainer._Equipments:
-                self._EquipmentContainer._Equipments.append(self)
+                self._EquipmentContainer._reflist("_Equipments").append(self)
 
     EquipmentContainer = property(getEquipmentContainer, setEquipmentContainer)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.ENTSOE.Equipment.Element import RefList
 
 class GeographicalRegion(IdentifiedObject):
     """A geographical region of a power system network model.
@@ -29,8 +30,8 @@ class GeographicalRegion(IdentifiedObject):
 
         @param Regions: The association is used in the naming hierarchy.
         """
-        self._Regions = []
-        self.Regions = [] if Regions is None else Regions
+        if Regions is not None:
+            self.Regions = Regions
 
         super(GeographicalRegion, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class GeographicalRegion(IdentifiedObject):
     _enums = {}
     _refs = ["Regions"]
     _many_refs = ["Regions"]
+    _inverses = {"Regions": "Region"}
 
     def getRegions(self):
         """The association is used in the naming hierarchy.
@@ -47,7 +49,8 @@ class GeographicalRegion(IdentifiedObject):
         return self._Regions
 
     def setRegions(self, value):
-        for x in self._Regions:
+        value = RefList(value)
+        for x in list(self._Regions):
             x.Region = None
         for y in value:
             y._Region = self
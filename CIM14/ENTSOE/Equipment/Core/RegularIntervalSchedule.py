@@ -44,4 +44,5 @@ class RegularIntervalSchedule(BasicIntervalSchedule):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.EquipmentContainer import EquipmentContainer
+from CIM14.ENTSOE.Equipment.Element import RefList
 
 class Substation(EquipmentContainer):
     """A collection of equipment for purposes other than generation or utilization, through which electric energy in bulk is passed for the purposes of switching or modifying its characteristics.
@@ -33,8 +34,8 @@ class Substation(EquipmentContainer):
         self._Region = None
         self.Region = Region
 
-        self._VoltageLevels = []
-        self.VoltageLevels = [] if VoltageLevels is None else VoltageLevels
+        if VoltageLevels is not None:
+            self.VoltageLevels = VoltageLevels
 
         super(Substation, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class Substation(EquipmentContainer):
     _enums = {}
     _refs = ["Region", "VoltageLevels"]
     _many_refs = ["VoltageLevels"]
+    _inverses = {"Region": "Substations", "VoltageLevels": "Substation"}
 
     def getRegion(self):
         """The association is used in the naming hierarchy.
@@ -52,13 +54,12 @@ class Substation(EquipmentContainer):
 
     def setRegion(self, value):
         if self._Region is not None:
-            filtered = [x for x in self.Region.Substations if x != self]
-            self._Region._Substations = filtered
+            self._Region._Substations.discard(self)
 
         self._Region = value
         if self._Region is not None:
             if self not in self._Region._Substations:
-                self._Region._Substations.append(self)
+                self._Region._reflist("_Substations").append(self)
 
     Region = property(getRegion, setRegion)
 
@@ -68,7 +69,8 @@ class Substation(EquipmentContainer):
         return self._VoltageLevels
 
     def setVoltageLevels(self, value):
-        for x in self._VoltageLevels:
+        value = RefList(value)
+        for x in list(self._VoltageLevels):
             x.Substation = None
         for y in value:
             y._Substation = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.ENTSOE.Equipment.Element import RefList
 
 class Terminal(IdentifiedObject):
     """An electrical connection point to a piece of conducting equipment. Terminals are connected at physical connection points called 'connectivity nodes'.For UCTE profile, the terminal associated with the limit is always required, and thus there is no need to exchange the associated Equipment which can always be derived from the terminal.
@@ -40,29 +41,29 @@ class Terminal(IdentifiedObject):
         #: The orientation of the terminal connections for a multiple terminal conducting equipment.  The sequence numbering starts with 1 and additional terminals should follow in increasing order.   The first terminal is the 'starting point' for a two terminal branch.   In the case of class TransformerWinding only one terminal is used so its sequenceNumber must be 1.
         self.sequenceNumber = sequenceNumber
 
-        self._OperationalLimitSet = []
-        self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
+        if OperationalLimitSet is not None:
+            self.OperationalLimitSet = OperationalLimitSet
 
         self._ConductingEquipment = None
         self.ConductingEquipment = ConductingEquipment
 
-        self._HasFirst_MutualCoupling = []
-        self.HasFirst_MutualCoupling = [] if HasFirst_MutualCoupling is None else HasFirst_MutualCoupling
+        if HasFirst_MutualCoupling is not None:
+            self.HasFirst_MutualCoupling = HasFirst_MutualCoupling
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         self._ConnectivityNode = None
         self.ConnectivityNode = ConnectivityNode
 
-        self._RegulatingControl = []
-        self.RegulatingControl = [] if RegulatingControl is None else RegulatingControl
+        if RegulatingControl is not None:
+            self.RegulatingControl = RegulatingControl
 
-        self._TieFlow = []
-        self.TieFlow = [] if TieFlow is None else TieFlow
+        if TieFlow is not None:
+            self.TieFlow = TieFlow
 
-        self._HasSecond_MutualCoupling = []
-        self.HasSecond_MutualCoupling = [] if HasSecond_MutualCoupling is None else HasSecond_MutualCoupling
+        if HasSecond_MutualCoupling is not None:
+            self.HasSecond_MutualCoupling = HasSecond_MutualCoupling
 
         super(Terminal, self).__init__(*args, **kw_args)
 
@@ -72,6 +73,7 @@ class Terminal(IdentifiedObject):
     _enums = {}
     _refs = ["OperationalLimitSet", "ConductingEquipment", "HasFirst_MutualCoupling", "Measurements", "ConnectivityNode", "RegulatingControl", "TieFlow", "HasSecond_MutualCoupling"]
     _many_refs = ["OperationalLimitSet", "HasFirst_MutualCoupling", "Measurements", "RegulatingControl", "TieFlow", "HasSecond_MutualCoupling"]
+    _inverses = {"OperationalLimitSet": "Terminal", "ConductingEquipment": "Terminals", "HasFirst_MutualCoupling": "First_Terminal", "Measurements": "Terminal", "ConnectivityNode": "Terminals", "RegulatingControl": "Terminal", "TieFlow": "Terminal", "HasSecond_MutualCoupling": "Second_Terminal"}
 
     def getOperationalLimitSet(self):
         """The operatinal limits sets that applie specifically to this terminal.  Other operational limits sets may apply to this terminal through the association to Equipment.
@@ -79,7 +81,8 @@ class Terminal(IdentifiedObject):
         return self._OperationalLimitSet
 
     def setOperationalLimitSet(self, value):
-        for x in self._OperationalLimitSet:
+        value = RefList(value)
+        for x in list(self._OperationalLimitSet):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -102,13 +105,12 @@ class Terminal(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.Terminals if x != self]
-            self._ConductingEquipment._Terminals = filtered
+            self._ConductingEquipment._Terminals.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
             if self not in self._ConductingEquipment._Terminals:
-                self._ConductingEquipment._Terminals.append(self)
+                self._ConductingEquipment._reflist("_Terminals").append(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
@@ -118,7 +120,8 @@ class Terminal(IdentifiedObject):
         return self._HasFirst_MutualCoupling
 
     def setHasFirst_MutualCoupling(self, value):
-        for x in self._HasFirst_MutualCoupling:
+        value = RefList(value)
+        for x in list(self._HasFirst_MutualCoupling):
             x.First_Terminal = None
         for y in value:
             y._First_Terminal = self
@@ -140,7 +143,8 @@ class Terminal(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
-        for x in self._Measurements:
+        value = RefList(value)
+        for x in list(self._Measurements):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -163,13 +167,12 @@ class Terminal(IdentifiedObject):
 
     def setConnectivityNode(self, value):
         if self._ConnectivityNode is not None:
-            filtered = [x for x in self.ConnectivityNode.Terminals if x != self]
-            self._ConnectivityNode._Terminals = filtered
+            self._ConnectivityNode._Terminals.discard(self)
 
         self._ConnectivityNode = value
         if self._ConnectivityNode is not None:
             if self not in self._ConnectivityNode._Terminals:
-                self._ConnectivityNode._Terminals.append(self)
+                self._ConnectivityNode._reflist("_Terminals").append(self)
 
     ConnectivityNode = property(getConnectivityNode, setConnectivityNode)
 
@@ -179,7 +182,8 @@ class Terminal(IdentifiedObject):
         return self._RegulatingControl
 
     def setRegulatingControl(self, value):
-        for x in self._RegulatingControl:
+        value = RefList(value)
+        for x in list(self._RegulatingControl):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -201,7 +205,8 @@ class Terminal(IdentifiedObject):
         return self._TieFlow
 
     def setTieFlow(self, value):
-        for x in self._TieFlow:
+        value = RefList(value)
+        for x in list(self._TieFlow):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -223,7 +228,8 @@ class Terminal(IdentifiedObject):
         return self._HasSecond_MutualCoupling
 
     def setHasSecond_MutualCoupling(self, value):
-        for x in self._HasSecond_MutualCoupling:
+        value = RefList(value)
+        for x in list(self._HasSecond_MutualCoupling):
             x.Second_Terminal = None
         for y in value:
             y._Second_Terminal = self
@@ -52,6 +52,7 @@ class VoltageLevel(EquipmentContainer):
     _enums = {}
     _refs = ["BaseVoltage", "Substation"]
     _many_refs = []
+    _inverses = {"BaseVoltage": "VoltageLevel", "Substation": "VoltageLevels"}
 
     def getBaseVoltage(self):
         """The base voltage used for all equipment within the VoltageLevel.
@@ -60,13 +61,12 @@ class VoltageLevel(EquipmentContainer):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.VoltageLevel if x != self]
-            self._BaseVoltage._VoltageLevel = filtered
+            self._BaseVoltage._VoltageLevel.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
             if self not in self._BaseVoltage._VoltageLevel:
-                self._BaseVoltage._VoltageLevel.append(self)
+                self._BaseVoltage._reflist("_VoltageLevel").append(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
@@ -77,13 +77,12 @@ class VoltageLevel(EquipmentContainer):
 
     def setSubstation(self, value):
         if self._Substation is not None:
-            filtered = [x for x in self.Substation.VoltageLevels if x != self]
-            self._Substation._VoltageLevels = filtered
+            self._Substation._VoltageLevels.discard(self)
 
         self._Substation = value
         if self._Substation is not None:
             if self not in self._Substation._VoltageLevels:
-                self._Substation._VoltageLevels.append(self)
+                self._Substation._reflist("_VoltageLevels").append(self)
 
     Substation = property(getSubstation, setSubstation)
 
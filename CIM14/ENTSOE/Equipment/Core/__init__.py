@@ -21,24 +21,8 @@
 """Contains the core PowerSystemResource and ConductingEquipment entities shared by all applications plus common collections of those entities. Not all applications require all the Core entities.  This package does not depend on any other package except the Domain package, but most of the other packages have associations and generalizations that depend on it.
 """
 
-from CIM14.ENTSOE.Equipment.Core.Curve import Curve
-from CIM14.ENTSOE.Equipment.Core.ConnectivityNodeContainer import ConnectivityNodeContainer
-from CIM14.ENTSOE.Equipment.Core.RegularIntervalSchedule import RegularIntervalSchedule
-from CIM14.ENTSOE.Equipment.Core.VoltageLevel import VoltageLevel
-from CIM14.ENTSOE.Equipment.Core.Unit import Unit
-from CIM14.ENTSOE.Equipment.Core.Equipment import Equipment
-from CIM14.ENTSOE.Equipment.Core.BaseVoltage import BaseVoltage
-from CIM14.ENTSOE.Equipment.Core.ConnectivityNode import ConnectivityNode
-from CIM14.ENTSOE.Equipment.Core.EquipmentContainer import EquipmentContainer
-from CIM14.ENTSOE.Equipment.Core.IdentifiedObject import IdentifiedObject
-from CIM14.ENTSOE.Equipment.Core.Substation import Substation
-from CIM14.ENTSOE.Equipment.Core.ConductingEquipment import ConductingEquipment
-from CIM14.ENTSOE.Equipment.Core.SubGeographicalRegion import SubGeographicalRegion
-from CIM14.ENTSOE.Equipment.Core.Terminal import Terminal
-from CIM14.ENTSOE.Equipment.Core.GeographicalRegion import GeographicalRegion
-from CIM14.ENTSOE.Equipment.Core.PowerSystemResource import PowerSystemResource
-from CIM14.ENTSOE.Equipment.Core.CurveData import CurveData
-from CIM14.ENTSOE.Equipment.Core.BasicIntervalSchedule import BasicIntervalSchedule
+import sys
+from CIM14.ENTSOE.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Core"
 nsPrefix = "cimCore"
@@ -48,3 +32,25 @@ class CurveStyle(str):
     """Values are: straightLineYValues, rampYValue, constantYValue, formula
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Curve",
+    "ConnectivityNodeContainer",
+    "RegularIntervalSchedule",
+    "VoltageLevel",
+    "Unit",
+    "Equipment",
+    "BaseVoltage",
+    "ConnectivityNode",
+    "EquipmentContainer",
+    "IdentifiedObject",
+    "Substation",
+    "ConductingEquipment",
+    "SubGeographicalRegion",
+    "Terminal",
+    "GeographicalRegion",
+    "PowerSystemResource",
+    "CurveData",
+    "BasicIntervalSchedule",
+])
@@ -21,9 +21,14 @@
 """The equivalents package models equivalent networks.
 """
 
-from CIM14.ENTSOE.Equipment.Equivalents.EquivalentEquipment import EquivalentEquipment
-from CIM14.ENTSOE.Equipment.Equivalents.EquivalentNetwork import EquivalentNetwork
+import sys
+from CIM14.ENTSOE.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Equivalents"
 nsPrefix = "cimEquivalents"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "EquivalentEquipment",
+    "EquivalentNetwork",
+])
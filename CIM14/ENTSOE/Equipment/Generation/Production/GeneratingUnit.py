@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.Equipment import Equipment
+from CIM14.ENTSOE.Equipment.Element import RefList
 
 class GeneratingUnit(Equipment):
     """A single or set of synchronous machines for converting mechanical power into alternating-current power. For example, individual machines within a set may be defined for scheduling purposes while a single control signal is derived for the set. In this case there would be a GeneratingUnit for each member of the set and an additional GeneratingUnit corresponding to the set.For the 2010 ENTSOE IOP, this is required for Synchronous Machine. -  To define a GeneratingUnit requires defining the initial real power injection, net real power limits, and the status of the unit.  The initial injection is defined using  the attribute “initialP”. -  The net real power limits can be defined in three ways; 1) with the attributes “maxOperatingP” and “minOperatingP”, or 2) with the attribute  “ratedNetMaxP” or 3) with the attributes “ratedGrossMinP” and “ratedGrossMaxP” used in conjunction with an associated GrossToNetActivePowerCurve. -  The control status of the unit is defined with the attribute “genControlSource”, but it is not required.  The participation factor attributes “longPF”, “normalPF”, and “shortPF” are not required. -  The GeneratingUnit class should only be used in cases where the more specific classes, HydroGeneratingUnit and ThermalGeneratingUnit, do not apply. -  The attributes governorSCD, maximumAllowableSpinningReserve, nominalP, startupCost, and variableCost are not required. 
@@ -90,11 +91,11 @@ class GeneratingUnit(Equipment):
         #: Generating unit economic participation factor
         self.normalPF = normalPF
 
-        self._SynchronousMachines = []
-        self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
+        if SynchronousMachines is not None:
+            self.SynchronousMachines = SynchronousMachines
 
-        self._ControlAreaGeneratingUnit = []
-        self.ControlAreaGeneratingUnit = [] if ControlAreaGeneratingUnit is None else ControlAreaGeneratingUnit
+        if ControlAreaGeneratingUnit is not None:
+            self.ControlAreaGeneratingUnit = ControlAreaGeneratingUnit
 
         super(GeneratingUnit, self).__init__(*args, **kw_args)
 
@@ -104,6 +105,7 @@ class GeneratingUnit(Equipment):
     _enums = {"genControlSource": "GeneratorControlSource"}
     _refs = ["SynchronousMachines", "ControlAreaGeneratingUnit"]
     _many_refs = ["SynchronousMachines", "ControlAreaGeneratingUnit"]
+    _inverses = {"SynchronousMachines": "GeneratingUnit", "ControlAreaGeneratingUnit": "GeneratingUnit"}
 
     def getSynchronousMachines(self):
         """A synchronous machine may operate as a generator and as such becomes a member of a generating unit
@@ -111,7 +113,8 @@ class GeneratingUnit(Equipment):
         return self._SynchronousMachines
 
     def setSynchronousMachines(self, value):
-        for x in self._SynchronousMachines:
+        value = RefList(value)
+        for x in list(self._SynchronousMachines):
             x.GeneratingUnit = None
         for y in value:
             y._GeneratingUnit = self
@@ -133,7 +136,8 @@ class GeneratingUnit(Equipment):
         return self._ControlAreaGeneratingUnit
 
     def setControlAreaGeneratingUnit(self, value):
-        for x in self._ControlAreaGeneratingUnit:
+        value = RefList(value)
+        for x in list(self._ControlAreaGeneratingUnit):
             x.GeneratingUnit = None
         for y in value:
             y._GeneratingUnit = self
@@ -36,4 +36,5 @@ class NuclearGeneratingUnit(GeneratingUnit):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class WindGeneratingUnit(GeneratingUnit):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -40,6 +40,7 @@ class LoadGroup(IdentifiedObject):
     _enums = {}
     _refs = ["SubLoadArea"]
     _many_refs = []
+    _inverses = {"SubLoadArea": "LoadGroups"}
 
     def getSubLoadArea(self):
         """The SubLoadArea where the Loadgroup belongs.
@@ -48,13 +49,12 @@ class LoadGroup(IdentifiedObject):
 
     def setSubLoadArea(self, value):
         if self._SubLoadArea is not None:
-            filtered = [x for x in self.SubLoadArea.LoadGroups if x != self]
-            self._SubLoadArea._LoadGroups = filtered
+            self._SubLoadArea._LoadGroups.discard(self)
 
         self._SubLoadArea = value
         if self._SubLoadArea is not None:
             if self not in self._SubLoadArea._LoadGroups:
-                self._SubLoadArea._LoadGroups.append(self)
+                self._SubLoadArea._reflist("_LoadGroups").append(self)
 
     SubLoadArea = property(getSubLoadArea, setSubLoadArea)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.LoadModel.LoadGroup import LoadGroup
+from CIM14.ENTSOE.Equipment.Element import RefList
 
 class NonConformLoadGroup(LoadGroup):
     """Loads that do not follow a daily and seasonal load variation pattern.
@@ -29,8 +30,8 @@ class NonConformLoadGroup(LoadGroup):
 
         @param EnergyConsumers: Conform loads assigned to this ConformLoadGroup.
         """
-        self._EnergyConsumers = []
-        self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
+        if EnergyConsumers is not None:
+            self.EnergyConsumers = EnergyConsumers
 
         super(NonConformLoadGroup, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class NonConformLoadGroup(LoadGroup):
     _enums = {}
     _refs = ["EnergyConsumers"]
     _many_refs = ["EnergyConsumers"]
+    _inverses = {"EnergyConsumers": "LoadGroup"}
 
     def getEnergyConsumers(self):
         """Conform loads assigned to this ConformLoadGroup.
@@ -47,7 +49,8 @@ class NonConformLoadGroup(LoadGroup):
         return self._EnergyConsumers
 
     def setEnergyConsumers(self, value):
-        for x in self._EnergyConsumers:
+        value = RefList(value)
+        for x in list(self._EnergyConsumers):
             x.LoadGroup = None
         for y in value:
             y._LoadGroup = self
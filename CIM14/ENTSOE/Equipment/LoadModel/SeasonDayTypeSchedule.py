@@ -44,6 +44,7 @@ class SeasonDayTypeSchedule(RegularIntervalSchedule):
     _enums = {}
     _refs = ["DayType", "Season"]
     _many_refs = []
+    _inverses = {"DayType": "SeasonDayTypeSchedules", "Season": "SeasonDayTypeSchedules"}
 
     def getDayType(self):
         """DayType for the Schedule.
@@ -52,13 +53,12 @@ class SeasonDayTypeSchedule(RegularIntervalSchedule):
 
     def setDayType(self, value):
         if self._DayType is not None:
-            filtered = [x for x in self.DayType.SeasonDayTypeSchedules if x != self]
-            self._DayType._SeasonDayTypeSchedules = filtered
+            self._DayType._SeasonDayTypeSchedules.discard(self)
 
         self._DayType = value
         if self._DayType is not None:
             if self not in self._DayType._SeasonDayTypeSchedules:
-                self._DayType._SeasonDayTypeSchedules.append(self)
+                self._DayType._reflist("_SeasonDayTypeSchedules").append(self)
 
     DayType = property(getDayType, setDayType)
 
@@ -69,13 +69,12 @@ class SeasonDayTypeSchedule(RegularIntervalSchedule):
 
     def setSeason(self, value):
         if self._Season is not None:
-            filtered = [x for x in self.Season.SeasonDayTypeSchedules if x != self]
-            self._Season._SeasonDayTypeSchedules = filtered
+            self._Season._SeasonDayTypeSchedules.discard(self)
 
         self._Season = value
         if self._Season is not None:
             if self not in self._Season._SeasonDayTypeSchedules:
-                self._Season._SeasonDayTypeSchedules.append(self)
+                self._Season._reflist("_SeasonDayTypeSchedules").append(self)
 
     Season = property(getSeason, setSeason)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.LoadModel.EnergyArea import EnergyArea
+from CIM14.ENTSOE.Equipment.Element import RefList
 
 class SubLoadArea(EnergyArea):
     """The class is the second level in a hierarchical structure for grouping of loads for the purpose of load flow load scaling.
@@ -29,8 +30,8 @@ class SubLoadArea(EnergyArea):
 
         @param LoadGroups: The Loadgroups in the SubLoadArea.
         """
-        self._LoadGroups = []
-        self.LoadGroups = [] if LoadGroups is None else LoadGroups
+        if LoadGroups is not None:
+            self.LoadGroups = LoadGroups
 
         super(SubLoadArea, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class SubLoadArea(EnergyArea):
     _enums = {}
     _refs = ["LoadGroups"]
     _many_refs = ["LoadGroups"]
+    _inverses = {"LoadGroups": "SubLoadArea"}
 
     def getLoadGroups(self):
         """The Loadgroups in the SubLoadArea.
@@ -47,7 +49,8 @@ class SubLoadArea(EnergyArea):
         return self._LoadGroups
 
     def setLoadGroups(self, value):
-        for x in self._LoadGroups:
+        value = RefList(value)
+        for x in list(self._LoadGroups):
             x.SubLoadArea = None
         for y in value:
             y._SubLoadArea = self
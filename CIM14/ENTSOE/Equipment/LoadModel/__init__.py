@@ -21,17 +21,8 @@
 """This package is responsible for modeling the energy consumers and the system load as curves and associated curve data. Special circumstances that may affect the load, such as seasons and daytypes, are also included here.  This information is used by Load Forecasting and Load Management.
 """
 
-from CIM14.ENTSOE.Equipment.LoadModel.NonConformLoad import NonConformLoad
-from CIM14.ENTSOE.Equipment.LoadModel.EnergyArea import EnergyArea
-from CIM14.ENTSOE.Equipment.LoadModel.Season import Season
-from CIM14.ENTSOE.Equipment.LoadModel.SubLoadArea import SubLoadArea
-from CIM14.ENTSOE.Equipment.LoadModel.LoadResponseCharacteristic import LoadResponseCharacteristic
-from CIM14.ENTSOE.Equipment.LoadModel.NonConformLoadGroup import NonConformLoadGroup
-from CIM14.ENTSOE.Equipment.LoadModel.SeasonDayTypeSchedule import SeasonDayTypeSchedule
-from CIM14.ENTSOE.Equipment.LoadModel.ConformLoadGroup import ConformLoadGroup
-from CIM14.ENTSOE.Equipment.LoadModel.DayType import DayType
-from CIM14.ENTSOE.Equipment.LoadModel.LoadGroup import LoadGroup
-from CIM14.ENTSOE.Equipment.LoadModel.ConformLoad import ConformLoad
+import sys
+from CIM14.ENTSOE.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#LoadModel"
 nsPrefix = "cimLoadModel"
@@ -41,3 +32,18 @@ class SeasonName(str):
     """Values are: fall, winter, spring, summer
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "NonConformLoad",
+    "EnergyArea",
+    "Season",
+    "SubLoadArea",
+    "LoadResponseCharacteristic",
+    "NonConformLoadGroup",
+    "SeasonDayTypeSchedule",
+    "ConformLoadGroup",
+    "DayType",
+    "LoadGroup",
+    "ConformLoad",
+])
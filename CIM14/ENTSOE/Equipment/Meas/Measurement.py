@@ -52,6 +52,7 @@ class Measurement(IdentifiedObject):
     _enums = {}
     _refs = ["Unit", "Terminal", "PowerSystemResource"]
     _many_refs = []
+    _inverses = {"Unit": "Measurements", "Terminal": "Measurements", "PowerSystemResource": "Measurements"}
 
     def getUnit(self):
         """The Unit for the Measurement
@@ -60,13 +61,12 @@ class Measurement(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.Measurements if x != self]
-            self._Unit._Measurements = filtered
+            self._Unit._Measurements.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
             if self not in self._Unit._Measurements:
-                self._Unit._Measurements.append(self)
+                self._Unit._reflist("_Measurements").append(self)
 
     Unit = property(getUnit, setUnit)
 
@@ -77,13 +77,12 @@ class Measurement(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.Measurements if x != self]
-            self._Terminal._Measurements = filtered
+            self._Terminal._Measurements.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._Measurements:
-                self._Terminal._Measurements.append(self)
+                self._Terminal._reflist("_Measurements").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -94,13 +93,12 @@ class Measurement(IdentifiedObject):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Measurements if x != self]
-            self._PowerSystemResource._Measurements = filtered
+            self._PowerSystemResource._Measurements.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
             if self not in self._PowerSystemResource._Measurements:
-                self._PowerSystemResource._Measurements.append(self)
+                self._PowerSystemResource._reflist("_Measurements").append(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
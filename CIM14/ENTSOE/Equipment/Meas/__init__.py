@@ -21,10 +21,15 @@
 """Contains entities that describe dynamic measurement data exchanged between applications.
 """
 
-from CIM14.ENTSOE.Equipment.Meas.Measurement import Measurement
-from CIM14.ENTSOE.Equipment.Meas.MeasurementValueSource import MeasurementValueSource
-from CIM14.ENTSOE.Equipment.Meas.MeasurementValue import MeasurementValue
+import sys
+from CIM14.ENTSOE.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Meas"
 nsPrefix = "cimMeas"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Measurement",
+    "MeasurementValueSource",
+    "MeasurementValue",
+])
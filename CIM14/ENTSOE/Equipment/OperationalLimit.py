@@ -34,4 +34,5 @@ class OperationalLimit(OperationalLimit):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -40,4 +40,5 @@ class CurrentLimit(OperationalLimit):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.IdentifiedObject import IdentifiedObject
+from CIM14.ENTSOE.Equipment.Element import RefList
 
 class OperationalLimitSet(IdentifiedObject):
     """A set of limits associated with equipmnet.  Sets of limits might apply to a specific temperature, or season for example. A set of limits may contain may different severities of limit levels that would apply to the same equipment.   The set may contain limits of different types such as apparent power and current limits or high and low voltage limits  that are logically applied together as a set.
@@ -37,8 +38,8 @@ class OperationalLimitSet(IdentifiedObject):
         self._Equipment = None
         self.Equipment = Equipment
 
-        self._OperationalLimitValue = []
-        self.OperationalLimitValue = [] if OperationalLimitValue is None else OperationalLimitValue
+        if OperationalLimitValue is not None:
+            self.OperationalLimitValue = OperationalLimitValue
 
         super(OperationalLimitSet, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class OperationalLimitSet(IdentifiedObject):
     _enums = {}
     _refs = ["Terminal", "Equipment", "OperationalLimitValue"]
     _many_refs = ["OperationalLimitValue"]
+    _inverses = {"Terminal": "OperationalLimitSet", "Equipment": "OperationalLimitSet", "OperationalLimitValue": "OperationalLimitSet"}
 
     def getTerminal(self):
         """The terminal specifically associated to this operational limit set.  If no terminal is associated, all terminals of the equipment are implied.For UCTE profile, the terminal associated with the limit is always required, and thus there is no need to exchange the associated Equipment which can always be derived from the terminal.
@@ -56,13 +58,12 @@ class OperationalLimitSet(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.OperationalLimitSet if x != self]
-            self._Terminal._OperationalLimitSet = filtered
+            self._Terminal._OperationalLimitSet.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._OperationalLimitSet:
-                self._Terminal._OperationalLimitSet.append(self)
+                self._Terminal._reflist("_OperationalLimitSet").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -73,13 +74,12 @@ class OperationalLimitSet(IdentifiedObject):
 
     def setEquipment(self, value):
         if self._Equipment is not None:
-            filtered = [x for x in self.Equipment.OperationalLimitSet if x != self]
-            self._Equipment._OperationalLimitSet = filtered
+            self._Equipment._OperationalLimitSet.discard(self)
 
         self._Equipment = value
         if self._Equipment is not None:
             if self not in self._Equipment._OperationalLimitSet:
-                self._Equipment._OperationalLimitSet.append(self)
+                self._Equipment._reflist("_OperationalLimitSet").append(self)
 
     Equipment = property(getEquipment, setEquipment)
 
@@ -89,7 +89,8 @@ class OperationalLimitSet(IdentifiedObject):
         return self._OperationalLimitValue
 
     def setOperationalLimitValue(self, value):
-        for x in self._OperationalLimitValue:
+        value = RefList(value)
+        for x in list(self._OperationalLimitValue):
             x.OperationalLimitSet = None
         for y in value:
             y._OperationalLimitSet = self
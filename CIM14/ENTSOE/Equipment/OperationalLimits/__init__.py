@@ -21,11 +21,8 @@
 """The OperationalLimits package models a specification of limits associated with equipment and other operational entities.
 """
 
-from CIM14.ENTSOE.Equipment.OperationalLimits.VoltageLimit import VoltageLimit
-from CIM14.ENTSOE.Equipment.OperationalLimits.CurrentLimit import CurrentLimit
-from CIM14.ENTSOE.Equipment.OperationalLimits.OperationalLimit import OperationalLimit
-from CIM14.ENTSOE.Equipment.OperationalLimits.OperationalLimitSet import OperationalLimitSet
-from CIM14.ENTSOE.Equipment.OperationalLimits.OperationalLimitType import OperationalLimitType
+import sys
+from CIM14.ENTSOE.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#OperationalLimits"
 nsPrefix = "cimOperationalLimits"
@@ -35,3 +32,12 @@ class OperationalLimitDirectionKind(str):
     """Values are: high, absoluteValue, low
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "VoltageLimit",
+    "CurrentLimit",
+    "OperationalLimit",
+    "OperationalLimitSet",
+    "OperationalLimitType",
+])
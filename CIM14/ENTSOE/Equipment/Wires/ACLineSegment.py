@@ -68,4 +68,5 @@ class ACLineSegment(Conductor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -40,4 +40,5 @@ class LoadBreakSwitch(Switch):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
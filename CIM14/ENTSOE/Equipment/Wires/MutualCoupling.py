@@ -76,6 +76,7 @@ class MutualCoupling(IdentifiedObject):
     _enums = {}
     _refs = ["Second_Terminal", "First_Terminal"]
     _many_refs = []
+    _inverses = {"Second_Terminal": "HasSecond_MutualCoupling", "First_Terminal": "HasFirst_MutualCoupling"}
 
     def getSecond_Terminal(self):
         """The starting terminal for the calculation of distances along the second branch of the mutual coupling.
@@ -84,13 +85,12 @@ class MutualCoupling(IdentifiedObject):
 
     def setSecond_Terminal(self, value):
         if self._Second_Terminal is not None:
-            filtered = [x for x in self.Second_Terminal.HasSecond_MutualCoupling if x != self]
-            self._Second_Terminal._HasSecond_MutualCoupling = filtered
+            self._Second_Terminal._HasSecond_MutualCoupling.discard(self)
 
         self._Second_Terminal = value
         if self._Second_Terminal is not None:
             if self not in self._Second_Terminal._HasSecond_MutualCoupling:
-                self._Second_Terminal._HasSecond_MutualCoupling.append(self)
+                self._Second_Terminal._reflist("_HasSecond_MutualCoupling").append(self)
 
     Second_Terminal = property(getSecond_Terminal, setSecond_Terminal)
 
@@ -101,13 +101,12 @@ class MutualCoupling(IdentifiedObject):
 
     def setFirst_Terminal(self, value):
         if self._First_Terminal is not None:
-            filtered = [x for x in self.First_Terminal.HasFirst_MutualCoupling if x != self]
-            self._First_Terminal._HasFirst_MutualCoupling = filtered
+            self._First_Terminal._HasFirst_MutualCoupling.discard(self)
 
         self._First_Terminal = value
         if self._First_Terminal is not None:
             if self not in self._First_Terminal._HasFirst_MutualCoupling:
-                self._First_Terminal._HasFirst_MutualCoupling.append(self)
+                self._First_Terminal._reflist("_HasFirst_MutualCoupling").append(self)
 
     First_Terminal = property(getFirst_Terminal, setFirst_Terminal)
 
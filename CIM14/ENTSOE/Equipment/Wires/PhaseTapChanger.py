@@ -68,6 +68,7 @@ class PhaseTapChanger(TapChanger):
     _enums = {"phaseTapChangerType": "PhaseTapChangerKind"}
     _refs = ["TransformerWinding"]
     _many_refs = []
+    _inverses = {"TransformerWinding": "PhaseTapChanger"}
 
     def getTransformerWinding(self):
         """The transformer winding to which the phase tap changer belongs.
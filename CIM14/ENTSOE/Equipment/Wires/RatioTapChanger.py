@@ -44,6 +44,7 @@ class RatioTapChanger(TapChanger):
     _enums = {"tculControlMode": "TransformerControlMode"}
     _refs = ["TransformerWinding"]
     _many_refs = []
+    _inverses = {"TransformerWinding": "RatioTapChanger"}
 
     def getTransformerWinding(self):
         """The transformer winding to which the ratio tap changer belongs.
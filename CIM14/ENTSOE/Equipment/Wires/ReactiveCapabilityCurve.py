@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.Curve import Curve
+from CIM14.ENTSOE.Equipment.Element import RefList
 
 class ReactiveCapabilityCurve(Curve):
     """Reactive power rating envelope versus the synchronous machine's active power, in both the generating and motoring modes. For each active power value there is a corresponding high and low reactive power limit  value. Typically there will be a separate curve for each coolant condition, such as hydrogen pressure.  The Y1 axis values represent reactive minimum and the Y2 axis values represent reactive maximum.-  ReactiveCapabilityCurves are not required if the reactive power limits of the SynchronousMachine do not vary with real power output. -  By convention, the Y1 axis values represent reactive minimum and the Y2 axis values represent reactive maximum. -  Because the x value will always be specified in MW and the y values will always be specified in MVAr, the xMultiplier, y1Multiplier, and y2Multiplier attributes do not need to be supplied. 
@@ -33,8 +34,8 @@ class ReactiveCapabilityCurve(Curve):
         #: The Y2-axis units of measure. Values are: "A", "rad", "none", "g", "W/Hz", "V", "m2", "VA", "VArh", "N", "Pa", "VAh", "F", "H", "Hz-1", "W/s", "J", "m", "S", "min", "deg", "J/s", "s", "Wh", "m3", "oC", "V/VAr", "s-1", "h", "W", "ohm", "Hz", "VAr", "kg/J"
         self.y2Unit = y2Unit
 
-        self._InitiallyUsedBySynchronousMachines = []
-        self.InitiallyUsedBySynchronousMachines = [] if InitiallyUsedBySynchronousMachines is None else InitiallyUsedBySynchronousMachines
+        if InitiallyUsedBySynchronousMachines is not None:
+            self.InitiallyUsedBySynchronousMachines = InitiallyUsedBySynchronousMachines
 
         super(ReactiveCapabilityCurve, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class ReactiveCapabilityCurve(Curve):
     _enums = {"y2Unit": "UnitSymbol"}
     _refs = ["InitiallyUsedBySynchronousMachines"]
     _many_refs = ["InitiallyUsedBySynchronousMachines"]
+    _inverses = {"InitiallyUsedBySynchronousMachines": "InitialReactiveCapabilityCurve"}
 
     def getInitiallyUsedBySynchronousMachines(self):
         """Synchronous machines using this curve as default.
@@ -51,7 +53,8 @@ class ReactiveCapabilityCurve(Curve):
         return self._InitiallyUsedBySynchronousMachines
 
     def setInitiallyUsedBySynchronousMachines(self, value):
-        for x in self._InitiallyUsedBySynchronousMachines:
+        value = RefList(value)
+        for x in list(self._InitiallyUsedBySynchronousMachines):
             x.InitialReactiveCapabilityCurve = None
         for y in value:
             y._InitialReactiveCapabilityCurve = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Equipment.Core.PowerSystemResource import PowerSystemResource
+from CIM14.ENTSOE.Equipment.Element import RefList
 
 class RegulatingControl(PowerSystemResource):
     """Specifies a set of equipment that works together to control a power system quantity such as voltage or flow.
@@ -50,11 +51,11 @@ class RegulatingControl(PowerSystemResource):
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._RegulatingCondEq = []
-        self.RegulatingCondEq = [] if RegulatingCondEq is None else RegulatingCondEq
+        if RegulatingCondEq is not None:
+            self.RegulatingCondEq = RegulatingCondEq
 
-        self._TapChanger = []
-        self.TapChanger = [] if TapChanger is None else TapChanger
+        if TapChanger is not None:
+            self.TapChanger = TapChanger
 
         super(RegulatingControl, self).__init__(*args, **kw_args)
 
@@ -64,6 +65,7 @@ class RegulatingControl(PowerSystemResource):
     _enums = {"mode": "RegulatingControlModeKind"}
     _refs = ["Terminal", "RegulatingCondEq", "TapChanger"]
     _many_refs = ["RegulatingCondEq", "TapChanger"]
+    _inverses = {"Terminal": "RegulatingControl", "RegulatingCondEq": "RegulatingControl", "TapChanger": "RegulatingControl"}
 
     def getTerminal(self):
         """The terminal associated with this regulating control.
@@ -72,13 +74,12 @@ class RegulatingControl(PowerSystemResource):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.RegulatingControl if x != self]
-            self._Terminal._RegulatingControl = filtered
+            self._Terminal._RegulatingControl.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._RegulatingControl:
-                self._Terminal._RegulatingControl.append(self)
+                self._Terminal._reflist("_RegulatingControl").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -88,7 +89,8 @@ class RegulatingControl(PowerSystemResource):
         return self._RegulatingCondEq
 
     def setRegulatingCondEq(self, value):
-        for x in self._RegulatingCondEq:
+        value = RefList(value)
+        for x in list(self._RegulatingCondEq):
             x.RegulatingControl = None
         for y in value:
             y._RegulatingControl = self
@@ -110,7 +112,8 @@ class RegulatingControl(PowerSystemResource):
         return self._TapChanger
 
     def setTapChanger(self, value):
-        for x in self._TapChanger:
+        value = RefList(value)
+        for x in list(self._TapChanger):
             x.RegulatingControl = None
         for y in value:
             y._RegulatingControl = self
@@ -64,4 +64,5 @@ class ShuntCompensator(RegulatingCondEq):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -56,4 +56,5 @@ class StaticVarCompensator(RegulatingCondEq):
     _enums = {"sVCControlMode": "SVCControlMode"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
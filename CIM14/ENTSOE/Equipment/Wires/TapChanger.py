@@ -72,6 +72,7 @@ class TapChanger(PowerSystemResource):
     _enums = {}
     _refs = ["RegulatingControl"]
     _many_refs = []
+    _inverses = {"RegulatingControl": "TapChanger"}
 
     def getRegulatingControl(self):
         
@@ -79,13 +80,12 @@ class TapChanger(PowerSystemResource):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.TapChanger if x != self]
-            self._RegulatingControl._TapChanger = filtered
+            self._RegulatingControl._TapChanger.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
             if self not in self._RegulatingControl._TapChanger:
-                self._RegulatingControl._TapChanger.append(self)
+                self._RegulatingControl._reflist("_TapChanger").append(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
@@ -21,28 +21,8 @@
 """An extension to the Core and Topology package that models information on the electrical characteristics of Transmission and Distribution networks. This package is used by network applications such as State Estimation, Load Flow and Optimal Power Flow.
 """
 
-from CIM14.ENTSOE.Equipment.Wires.BusbarSection import BusbarSection
-from CIM14.ENTSOE.Equipment.Wires.LoadBreakSwitch import LoadBreakSwitch
-from CIM14.ENTSOE.Equipment.Wires.TapChanger import TapChanger
-from CIM14.ENTSOE.Equipment.Wires.TransformerWinding import TransformerWinding
-from CIM14.ENTSOE.Equipment.Wires.RegulatingControl import RegulatingControl
-from CIM14.ENTSOE.Equipment.Wires.ReactiveCapabilityCurve import ReactiveCapabilityCurve
-from CIM14.ENTSOE.Equipment.Wires.ACLineSegment import ACLineSegment
-from CIM14.ENTSOE.Equipment.Wires.Disconnector import Disconnector
-from CIM14.ENTSOE.Equipment.Wires.PhaseTapChanger import PhaseTapChanger
-from CIM14.ENTSOE.Equipment.Wires.SeriesCompensator import SeriesCompensator
-from CIM14.ENTSOE.Equipment.Wires.MutualCoupling import MutualCoupling
-from CIM14.ENTSOE.Equipment.Wires.SynchronousMachine import SynchronousMachine
-from CIM14.ENTSOE.Equipment.Wires.RatioTapChanger import RatioTapChanger
-from CIM14.ENTSOE.Equipment.Wires.PowerTransformer import PowerTransformer
-from CIM14.ENTSOE.Equipment.Wires.EnergyConsumer import EnergyConsumer
-from CIM14.ENTSOE.Equipment.Wires.Switch import Switch
-from CIM14.ENTSOE.Equipment.Wires.RegulatingCondEq import RegulatingCondEq
-from CIM14.ENTSOE.Equipment.Wires.Line import Line
-from CIM14.ENTSOE.Equipment.Wires.StaticVarCompensator import StaticVarCompensator
-from CIM14.ENTSOE.Equipment.Wires.ShuntCompensator import ShuntCompensator
-from CIM14.ENTSOE.Equipment.Wires.Breaker import Breaker
-from CIM14.ENTSOE.Equipment.Wires.Conductor import Conductor
+import sys
+from CIM14.ENTSOE.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Wires"
 nsPrefix = "cimWires"
@@ -87,3 +67,29 @@ class PhaseTapChangerKind(str):
     """Values are: asymmetrical, symmetrical, unknown
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "BusbarSection",
+    "LoadBreakSwitch",
+    "TapChanger",
+    "TransformerWinding",
+    "RegulatingControl",
+    "ReactiveCapabilityCurve",
+    "ACLineSegment",
+    "Disconnector",
+    "PhaseTapChanger",
+    "SeriesCompensator",
+    "MutualCoupling",
+    "SynchronousMachine",
+    "RatioTapChanger",
+    "PowerTransformer",
+    "EnergyConsumer",
+    "Switch",
+    "RegulatingCondEq",
+    "Line",
+    "StaticVarCompensator",
+    "ShuntCompensator",
+    "Breaker",
+    "Conductor",
+])
@@ -21,9 +21,8 @@
 """
 """
 
-from CIM14.ENTSOE.Equipment.Element import Element
-from CIM14.ENTSOE.Equipment.OperationalLimit import OperationalLimit
-from CIM14.ENTSOE.Equipment.IEC61970CIMVersion import IEC61970CIMVersion
+import sys
+from CIM14.ENTSOE.Equipment.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile/ENTSOE/Equipment"
 nsPrefix = "eq"
@@ -132,3 +131,20 @@ class CIMGDay(str):
 
 class CIMGYearMonth(str):
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Element",
+    "OperationalLimit",
+    "IEC61970CIMVersion",
+], [
+    "ControlArea",
+    "Core",
+    "Domain",
+    "Equivalents",
+    "Generation",
+    "LoadModel",
+    "Meas",
+    "OperationalLimits",
+    "Wires",
+])
@@ -48,6 +48,7 @@ class SvPowerFlow(Element):
     _enums = {}
     _refs = ["Terminal"]
     _many_refs = []
+    _inverses = {"Terminal": "SvPowerFlow"}
 
     def getTerminal(self):
         """The terminal associated with the power flow state.
@@ -56,6 +56,7 @@ class SvShortCircuit(Element):
     _enums = {}
     _refs = ["TopologicalNode"]
     _many_refs = []
+    _inverses = {"TopologicalNode": "SvShortCircuit"}
 
     def getTopologicalNode(self):
         """The topological node associated with the short circuit state.
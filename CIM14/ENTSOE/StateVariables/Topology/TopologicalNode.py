@@ -48,6 +48,7 @@ class TopologicalNode(Element):
     _enums = {}
     _refs = ["SvShortCircuit", "SvVoltage", "SvInjection"]
     _many_refs = []
+    _inverses = {"SvShortCircuit": "TopologicalNode", "SvVoltage": "TopologicalNode", "SvInjection": "TopologicalNode"}
 
     def getSvShortCircuit(self):
         """The short circuit state associated with the topological node.
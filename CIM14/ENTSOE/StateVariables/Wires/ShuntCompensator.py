@@ -40,6 +40,7 @@ class ShuntCompensator(Element):
     _enums = {}
     _refs = ["SvShuntCompensatorSections"]
     _many_refs = []
+    _inverses = {"SvShuntCompensatorSections": "ShuntCompensator"}
 
     def getSvShuntCompensatorSections(self):
         """The state for the number of shunt compensator sections in service.
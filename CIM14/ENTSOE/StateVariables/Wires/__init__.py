@@ -21,9 +21,14 @@
 """An extension to the Core and Topology package that models information on the electrical characteristics of Transmission and Distribution networks. This package is used by network applications such as State Estimation, Load Flow and Optimal Power Flow.
 """
 
-from CIM14.ENTSOE.StateVariables.Wires.ShuntCompensator import ShuntCompensator
-from CIM14.ENTSOE.StateVariables.Wires.TapChanger import TapChanger
+import sys
+from CIM14.ENTSOE.StateVariables.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile#Wires"
 nsPrefix = "cimWires"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ShuntCompensator",
+    "TapChanger",
+])
@@ -21,7 +21,8 @@
 """
 """
 
-from CIM14.ENTSOE.StateVariables.Element import Element
+import sys
+from CIM14.ENTSOE.StateVariables.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile/ENTSOE/StateVariables"
 nsPrefix = "sv"
@@ -92,3 +93,13 @@ class CIMGDay(str):
 
 class CIMGYearMonth(str):
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Element",
+], [
+    "Core",
+    "StateVariables",
+    "Topology",
+    "Wires",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Topology.Core.IdentifiedObject import IdentifiedObject
+from CIM14.ENTSOE.Topology.Element import RefList
 
 class BaseVoltage(IdentifiedObject):
     """Defines a nominal base voltage which is referenced in the system.
@@ -29,8 +30,8 @@ class BaseVoltage(IdentifiedObject):
 
         @param TopologicalNode: The topological nodes at the base voltage.
         """
-        self._TopologicalNode = []
-        self.TopologicalNode = [] if TopologicalNode is None else TopologicalNode
+        if TopologicalNode is not None:
+            self.TopologicalNode = TopologicalNode
 
         super(BaseVoltage, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class BaseVoltage(IdentifiedObject):
     _enums = {}
     _refs = ["TopologicalNode"]
     _many_refs = ["TopologicalNode"]
+    _inverses = {"TopologicalNode": "BaseVoltage"}
 
     def getTopologicalNode(self):
         """The topological nodes at the base voltage.
@@ -47,7 +49,8 @@ class BaseVoltage(IdentifiedObject):
         return self._TopologicalNode
 
     def setTopologicalNode(self, value):
-        for x in self._TopologicalNode:
+        value = RefList(value)
+        for x in list(self._TopologicalNode):
             x.BaseVoltage = None
         for y in value:
             y._BaseVoltage = self
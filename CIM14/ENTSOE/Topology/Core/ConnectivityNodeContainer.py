@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Topology.Core.IdentifiedObject import IdentifiedObject
+from CIM14.ENTSOE.Topology.Element import RefList
 
 class ConnectivityNodeContainer(IdentifiedObject):
     """A base class for all objects that may contain ConnectivityNodes or TopologicalNodes.
@@ -29,8 +30,8 @@ class ConnectivityNodeContainer(IdentifiedObject):
 
         @param TopologicalNode: The topological nodes which belong to this connectivity node container.
         """
-        self._TopologicalNode = []
-        self.TopologicalNode = [] if TopologicalNode is None else TopologicalNode
+        if TopologicalNode is not None:
+            self.TopologicalNode = TopologicalNode
 
         super(ConnectivityNodeContainer, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class ConnectivityNodeContainer(IdentifiedObject):
     _enums = {}
     _refs = ["TopologicalNode"]
     _many_refs = ["TopologicalNode"]
+    _inverses = {"TopologicalNode": "ConnectivityNodeContainer"}
 
     def getTopologicalNode(self):
         """The topological nodes which belong to this connectivity node container.
@@ -47,7 +49,8 @@ class ConnectivityNodeContainer(IdentifiedObject):
         return self._TopologicalNode
 
     def setTopologicalNode(self, value):
-        for x in self._TopologicalNode:
+        value = RefList(value)
+        for x in list(self._TopologicalNode):
             x.ConnectivityNodeContainer = None
         for y in value:
             y._ConnectivityNodeContainer = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.ENTSOE.Topology.Core.IdentifiedObject import IdentifiedObject
+from CIM14.ENTSOE.Topology.Element import RefList
 
 class TopologicalNode(IdentifiedObject):
     """For a detailed substation model a TopologicalNode is a set of connectivity nodes that, in the current network state, are connected together through any type of closed switches, including  jumpers. Topological nodes changes as the current network state changes (i.e., switches, breakers, etc. change state). For a planning model switch statuses are not used to form TopologicalNodes. Instead they are manually created or deleted in a model builder tool. TopologialNodes maintained this way are also called 'busses'.
@@ -37,8 +38,8 @@ class TopologicalNode(IdentifiedObject):
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
 
-        self._Terminal = []
-        self.Terminal = [] if Terminal is None else Terminal
+        if Terminal is not None:
+            self.Terminal = Terminal
 
         super(TopologicalNode, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class TopologicalNode(IdentifiedObject):
     _enums = {}
     _refs = ["ConnectivityNodeContainer", "BaseVoltage", "Terminal"]
     _many_refs = ["Terminal"]
+    _inverses = {"ConnectivityNodeContainer": "TopologicalNode", "BaseVoltage": "TopologicalNode", "Terminal": "TopologicalNode"}
 
     def getConnectivityNodeContainer(self):
         """The connectivity node container to which the toplogical node belongs.
@@ -56,13 +58,12 @@ class TopologicalNode(IdentifiedObject):
 
     def setConnectivityNodeContainer(self, value):
         if self._ConnectivityNodeContainer is not None:
-            filtered = [x for x in self.ConnectivityNodeContainer.TopologicalNode if x != self]
-            self._ConnectivityNodeContainer._TopologicalNode = filtered
+            self._ConnectivityNodeContainer._TopologicalNode.discard(self)
 
         self._ConnectivityNodeContainer = value
         if self._ConnectivityNodeContainer is not None:
             if self not in self._ConnectivityNodeContainer._TopologicalNode:
-                self._ConnectivityNodeContainer._TopologicalNode.append(self)
+                self._ConnectivityNodeContainer._reflist("_TopologicalNode").append(self)
 
     ConnectivityNodeContainer = property(getConnectivityNodeContainer, setConnectivityNodeContainer)
 
@@ -73,13 +74,12 @@ class TopologicalNode(IdentifiedObject):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.TopologicalNode if x != self]
-            self._BaseVoltage._TopologicalNode = filtered
+            self._BaseVoltage._TopologicalNode.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
             if self not in self._BaseVoltage._TopologicalNode:
-                self._BaseVoltage._TopologicalNode.append(self)
+                self._BaseVoltage._reflist("_TopologicalNode").append(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
@@ -89,7 +89,8 @@ class TopologicalNode(IdentifiedObject):
         return self._Terminal
 
     def setTerminal(self, value):
-        for x in self._Terminal:
+        value = RefList(value)
+        for x in list(self._Terminal):
             x.TopologicalNode = None
         for y in value:
             y._TopologicalNode = self
@@ -21,7 +21,8 @@
 """
 """
 
-from CIM14.ENTSOE.Topology.Element import Element
+import sys
+from CIM14.ENTSOE.Topology.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile/ENTSOE/Topology"
 nsPrefix = "topo"
@@ -62,3 +63,11 @@ class CIMGDay(str):
 
 class CIMGYearMonth(str):
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Element",
+], [
+    "Core",
+    "Topology",
+])
@@ -20,6 +20,17 @@
 
 
 
+
+import sys
+from CIM14.Element import LazyModule
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14?profile=http://iec.ch/TC57/2007/profile/ENTSOE"
 nsPrefix = "entsoe"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+], [
+    "Dynamics",
+    "Equipment",
+    "StateVariables",
+    "Topology",
+])
@@ -56,4 +56,5 @@ class AssetModel(IdentifiedObject):
     _enums = {"usageKind": "AssetModelUsageKind", "corporateStandardKind": "CorporateStandardKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
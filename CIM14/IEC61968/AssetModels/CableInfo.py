@@ -76,4 +76,5 @@ class CableInfo(ConductorInfo):
     _enums = {"constructionKind": "CableConstructionKind", "shieldMaterial": "CableShieldMaterialKind", "outerJacketKind": "CableOuterJacketKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -48,6 +48,7 @@ class ConcentricNeutralCableInfo(CableInfo):
     _enums = {}
     _refs = ["WireType"]
     _many_refs = []
+    _inverses = {"WireType": "ConcentricNeutralCableInfos"}
 
     def getWireType(self):
         """Wire type used for this concentric neutral cable.
@@ -56,13 +57,12 @@ class ConcentricNeutralCableInfo(CableInfo):
 
     def setWireType(self, value):
         if self._WireType is not None:
-            filtered = [x for x in self.WireType.ConcentricNeutralCableInfos if x != self]
-            self._WireType._ConcentricNeutralCableInfos = filtered
+            self._WireType._ConcentricNeutralCableInfos.discard(self)
 
         self._WireType = value
         if self._WireType is not None:
             if self not in self._WireType._ConcentricNeutralCableInfos:
-                self._WireType._ConcentricNeutralCableInfos.append(self)
+                self._WireType._reflist("_ConcentricNeutralCableInfos").append(self)
 
     WireType = property(getWireType, setWireType)
 
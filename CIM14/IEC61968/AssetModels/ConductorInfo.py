@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class ConductorInfo(IdentifiedObject):
     """Conductor data.
@@ -50,11 +51,11 @@ class ConductorInfo(IdentifiedObject):
         #: Number of phases (including neutral) to be retained. Any wires beyond this number should be reduced into the earth return.
         self.phaseCount = phaseCount
 
-        self._ConductorSegments = []
-        self.ConductorSegments = [] if ConductorSegments is None else ConductorSegments
+        if ConductorSegments is not None:
+            self.ConductorSegments = ConductorSegments
 
-        self._WireArrangements = []
-        self.WireArrangements = [] if WireArrangements is None else WireArrangements
+        if WireArrangements is not None:
+            self.WireArrangements = WireArrangements
 
         super(ConductorInfo, self).__init__(*args, **kw_args)
 
@@ -64,6 +65,7 @@ class ConductorInfo(IdentifiedObject):
     _enums = {"usage": "ConductorUsageKind", "insulationMaterial": "ConductorInsulationKind"}
     _refs = ["ConductorSegments", "WireArrangements"]
     _many_refs = ["ConductorSegments", "WireArrangements"]
+    _inverses = {"ConductorSegments": "ConductorInfo", "WireArrangements": "ConductorInfo"}
 
     def getConductorSegments(self):
         """All conductor segments described by this conductor data.
@@ -71,7 +73,8 @@ class ConductorInfo(IdentifiedObject):
         return self._ConductorSegments
 
     def setConductorSegments(self, value):
-        for x in self._ConductorSegments:
+        value = RefList(value)
+        for x in list(self._ConductorSegments):
             x.ConductorInfo = None
         for y in value:
             y._ConductorInfo = self
@@ -93,7 +96,8 @@ class ConductorInfo(IdentifiedObject):
         return self._WireArrangements
 
     def setWireArrangements(self, value):
-        for x in self._WireArrangements:
+        value = RefList(value)
+        for x in list(self._WireArrangements):
             x.ConductorInfo = None
         for y in value:
             y._ConductorInfo = self
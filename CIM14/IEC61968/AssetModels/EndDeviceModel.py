@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.AssetModels.AssetModel import AssetModel
+from CIM14.Element import RefList
 
 class EndDeviceModel(AssetModel):
     """Documentation for particular end device product model made by a manufacturer.
@@ -29,8 +30,8 @@ class EndDeviceModel(AssetModel):
 
         @param EndDeviceAssets: All end device assets being of this model.
         """
-        self._EndDeviceAssets = []
-        self.EndDeviceAssets = [] if EndDeviceAssets is None else EndDeviceAssets
+        if EndDeviceAssets is not None:
+            self.EndDeviceAssets = EndDeviceAssets
 
         super(EndDeviceModel, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class EndDeviceModel(AssetModel):
     _enums = {}
     _refs = ["EndDeviceAssets"]
     _many_refs = ["EndDeviceAssets"]
+    _inverses = {"EndDeviceAssets": "EndDeviceModel"}
 
     def getEndDeviceAssets(self):
         """All end device assets being of this model.
@@ -47,7 +49,8 @@ class EndDeviceModel(AssetModel):
         return self._EndDeviceAssets
 
     def setEndDeviceAssets(self, value):
-        for x in self._EndDeviceAssets:
+        value = RefList(value)
+        for x in list(self._EndDeviceAssets):
             x.EndDeviceModel = None
         for y in value:
             y._EndDeviceModel = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.AssetModels.DistributionWindingTest import DistributionWindingTest
+from CIM14.Element import RefList
 
 class OpenCircuitTest(DistributionWindingTest):
     """Open-circuit test results may include no-load losses, exciting current, phase shifts, and induced voltage. For three-phase windings, the excitation can be positive sequence (the default) or zero sequence. For induced voltage and phase shifts, use the associated ToWindingSpec class.
@@ -45,8 +46,8 @@ class OpenCircuitTest(DistributionWindingTest):
         #: Exciting current measured from a positive-sequence or single-phase open-circuit (excitation) test.
         self.excitingCurrent = excitingCurrent
 
-        self._MeasuredWindingSpecs = []
-        self.MeasuredWindingSpecs = [] if MeasuredWindingSpecs is None else MeasuredWindingSpecs
+        if MeasuredWindingSpecs is not None:
+            self.MeasuredWindingSpecs = MeasuredWindingSpecs
 
         super(OpenCircuitTest, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class OpenCircuitTest(DistributionWindingTest):
     _enums = {}
     _refs = ["MeasuredWindingSpecs"]
     _many_refs = ["MeasuredWindingSpecs"]
+    _inverses = {"MeasuredWindingSpecs": "OpenCircuitTests"}
 
     def getMeasuredWindingSpecs(self):
         """All other windings measured during this test.
@@ -64,20 +66,19 @@ class OpenCircuitTest(DistributionWindingTest):
 
     def setMeasuredWindingSpecs(self, value):
         for p in self._MeasuredWindingSpecs:
-            filtered = [q for q in p.OpenCircuitTests if q != self]
-            self._MeasuredWindingSpecs._OpenCircuitTests = filtered
+            p._OpenCircuitTests.discard(self)
         for r in value:
             if self not in r._OpenCircuitTests:
-                r._OpenCircuitTests.append(self)
-        self._MeasuredWindingSpecs = value
+                r._reflist("_OpenCircuitTests").append(self)
+        self._MeasuredWindingSpecs = RefList(value)
 
     MeasuredWindingSpecs = property(getMeasuredWindingSpecs, setMeasuredWindingSpecs)
 
     def addMeasuredWindingSpecs(self, *MeasuredWindingSpecs):
         for obj in MeasuredWindingSpecs:
             if self not in obj._OpenCircuitTests:
-                obj._OpenCircuitTests.append(self)
-            self._MeasuredWindingSpecs.append(obj)
+                obj._reflist("_OpenCircuitTests").append(self)
+            self._reflist("_MeasuredWindingSpecs").append(obj)
 
     def removeMeasuredWindingSpecs(self, *MeasuredWindingSpecs):
         for obj in MeasuredWindingSpecs:
@@ -48,4 +48,5 @@ class OverheadConductorInfo(ConductorInfo):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
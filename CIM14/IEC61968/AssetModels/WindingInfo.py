@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class WindingInfo(IdentifiedObject):
     """Winding data.
@@ -68,17 +69,17 @@ class WindingInfo(IdentifiedObject):
         #: Apparent power that this winding can carry for a short period of time.
         self.shortTermS = shortTermS
 
-        self._Windings = []
-        self.Windings = [] if Windings is None else Windings
+        if Windings is not None:
+            self.Windings = Windings
 
-        self._WindingTests = []
-        self.WindingTests = [] if WindingTests is None else WindingTests
+        if WindingTests is not None:
+            self.WindingTests = WindingTests
 
         self._TransformerInfo = None
         self.TransformerInfo = TransformerInfo
 
-        self._ToWindingSpecs = []
-        self.ToWindingSpecs = [] if ToWindingSpecs is None else ToWindingSpecs
+        if ToWindingSpecs is not None:
+            self.ToWindingSpecs = ToWindingSpecs
 
         super(WindingInfo, self).__init__(*args, **kw_args)
 
@@ -88,6 +89,7 @@ class WindingInfo(IdentifiedObject):
     _enums = {"connectionKind": "WindingConnection"}
     _refs = ["Windings", "WindingTests", "TransformerInfo", "ToWindingSpecs"]
     _many_refs = ["Windings", "WindingTests", "ToWindingSpecs"]
+    _inverses = {"Windings": "WindingInfo", "WindingTests": "FromWinding", "TransformerInfo": "WindingInfos", "ToWindingSpecs": "ToWinding"}
 
     def getWindings(self):
         """All windings described by this winding data.
@@ -95,7 +97,8 @@ class WindingInfo(IdentifiedObject):
         return self._Windings
 
     def setWindings(self, value):
-        for x in self._Windings:
+        value = RefList(value)
+        for x in list(self._Windings):
             x.WindingInfo = None
         for y in value:
             y._WindingInfo = self
@@ -117,7 +120,8 @@ class WindingInfo(IdentifiedObject):
         return self._WindingTests
 
     def setWindingTests(self, value):
-        for x in self._WindingTests:
+        value = RefList(value)
+        for x in list(self._WindingTests):
             x.FromWinding = None
         for y in value:
             y._FromWinding = self
@@ -140,13 +144,12 @@ class WindingInfo(IdentifiedObject):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.WindingInfos if x != self]
-            self._TransformerInfo._WindingInfos = filtered
+            self._TransformerInfo._WindingInfos.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
             if self not in self._TransformerInfo._WindingInfos:
-                self._TransformerInfo._WindingInfos.append(self)
+                self._TransformerInfo._reflist("_WindingInfos").append(self)
 
     TransformerInfo = property(getTransformerInfo, setTransformerInfo)
 
@@ -156,7 +159,8 @@ class WindingInfo(IdentifiedObject):
         return self._ToWindingSpecs
 
     def setToWindingSpecs(self, value):
-        for x in self._ToWindingSpecs:
+        value = RefList(value)
+        for x in list(self._ToWindingSpecs):
             x.ToWinding = None
         for y in value:
             y._ToWinding = self
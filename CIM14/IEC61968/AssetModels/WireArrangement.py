@@ -56,6 +56,7 @@ class WireArrangement(IdentifiedObject):
     _enums = {}
     _refs = ["WireType", "ConductorInfo"]
     _many_refs = []
+    _inverses = {"WireType": "WireArrangements", "ConductorInfo": "WireArrangements"}
 
     def getWireType(self):
         """Wire type used for this wire arrangement.
@@ -64,13 +65,12 @@ class WireArrangement(IdentifiedObject):
 
     def setWireType(self, value):
         if self._WireType is not None:
-            filtered = [x for x in self.WireType.WireArrangements if x != self]
-            self._WireType._WireArrangements = filtered
+            self._WireType._WireArrangements.discard(self)
 
         self._WireType = value
         if self._WireType is not None:
             if self not in self._WireType._WireArrangements:
-                self._WireType._WireArrangements.append(self)
+                self._WireType._reflist("_WireArrangements").append(self)
 
     WireType = property(getWireType, setWireType)
 
@@ -81,13 +81,12 @@ class WireArrangement(IdentifiedObject):
 
     def setConductorInfo(self, value):
         if self._ConductorInfo is not None:
-            filtered = [x for x in self.ConductorInfo.WireArrangements if x != self]
-            self._ConductorInfo._WireArrangements = filtered
+            self._ConductorInfo._WireArrangements.discard(self)
 
         self._ConductorInfo = value
         if self._ConductorInfo is not None:
             if self not in self._ConductorInfo._WireArrangements:
-                self._ConductorInfo._WireArrangements.append(self)
+                self._ConductorInfo._reflist("_WireArrangements").append(self)
 
     ConductorInfo = property(getConductorInfo, setConductorInfo)
 
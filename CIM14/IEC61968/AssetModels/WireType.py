@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class WireType(IdentifiedObject):
     """Wire conductor (per IEEE specs). A specific type of wire or combination of wires, not insulated from each other, suitable for carrying electrical current.
@@ -78,11 +79,11 @@ class WireType(IdentifiedObject):
         #: Number of strands in the wire.
         self.strandCount = strandCount
 
-        self._WireArrangements = []
-        self.WireArrangements = [] if WireArrangements is None else WireArrangements
+        if WireArrangements is not None:
+            self.WireArrangements = WireArrangements
 
-        self._ConcentricNeutralCableInfos = []
-        self.ConcentricNeutralCableInfos = [] if ConcentricNeutralCableInfos is None else ConcentricNeutralCableInfos
+        if ConcentricNeutralCableInfos is not None:
+            self.ConcentricNeutralCableInfos = ConcentricNeutralCableInfos
 
         super(WireType, self).__init__(*args, **kw_args)
 
@@ -92,6 +93,7 @@ class WireType(IdentifiedObject):
     _enums = {"material": "ConductorMaterialKind"}
     _refs = ["WireArrangements", "ConcentricNeutralCableInfos"]
     _many_refs = ["WireArrangements", "ConcentricNeutralCableInfos"]
+    _inverses = {"WireArrangements": "WireType", "ConcentricNeutralCableInfos": "WireType"}
 
     def getWireArrangements(self):
         """All wire arrangements using this wire type.
@@ -99,7 +101,8 @@ class WireType(IdentifiedObject):
         return self._WireArrangements
 
     def setWireArrangements(self, value):
-        for x in self._WireArrangements:
+        value = RefList(value)
+        for x in list(self._WireArrangements):
             x.WireType = None
         for y in value:
             y._WireType = self
@@ -121,7 +124,8 @@ class WireType(IdentifiedObject):
         return self._ConcentricNeutralCableInfos
 
     def setConcentricNeutralCableInfos(self, value):
-        for x in self._ConcentricNeutralCableInfos:
+        value = RefList(value)
+        for x in list(self._ConcentricNeutralCableInfos):
             x.WireType = None
         for y in value:
             y._WireType = self
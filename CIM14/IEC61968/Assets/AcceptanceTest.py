@@ -48,4 +48,5 @@ class AcceptanceTest(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class Asset(IdentifiedObject):
     """Tangible resource of the utility, including power system equipment, cabinets, buildings, etc. For electrical network equipment, the role of the asset is defined through PowerSystemResource and its subclasses, defined mainly in the Wires model (refer to IEC61970-301 and model package IEC61970::Wires). Asset description places emphasis on the physical characteristics of the equipment fulfilling that role.
@@ -87,33 +88,33 @@ class Asset(IdentifiedObject):
         #: Condition of asset in inventory or at time of installation. Examples include new, rebuilt, overhaul required, other. Refer to inspection data for information on the most current condition of the asset.
         self.initialCondition = initialCondition
 
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
-        self._Properties = []
-        self.Properties = [] if Properties is None else Properties
+        if Properties is not None:
+            self.Properties = Properties
 
         self.acceptanceTest = acceptanceTest
 
-        self._ActivityRecords = []
-        self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
+        if ActivityRecords is not None:
+            self.ActivityRecords = ActivityRecords
 
         self._Location = None
         self.Location = Location
 
-        self._AssetFunctions = []
-        self.AssetFunctions = [] if AssetFunctions is None else AssetFunctions
+        if AssetFunctions is not None:
+            self.AssetFunctions = AssetFunctions
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         self._AssetContainer = None
         self.AssetContainer = AssetContainer
 
         self.status = status
 
-        self._Ratings = []
-        self.Ratings = [] if Ratings is None else Ratings
+        if Ratings is not None:
+            self.Ratings = Ratings
 
         self.electronicAddress = electronicAddress
 
@@ -125,6 +126,7 @@ class Asset(IdentifiedObject):
     _enums = {}
     _refs = ["PowerSystemResources", "Properties", "acceptanceTest", "ActivityRecords", "Location", "AssetFunctions", "Measurements", "AssetContainer", "status", "Ratings", "electronicAddress"]
     _many_refs = ["PowerSystemResources", "Properties", "ActivityRecords", "AssetFunctions", "Measurements", "Ratings"]
+    _inverses = {"PowerSystemResources": "Assets", "Properties": "PropertyAssets", "ActivityRecords": "Assets", "Location": "Assets", "AssetFunctions": "Asset", "Measurements": "Asset", "AssetContainer": "Assets", "Ratings": "RatingAssets"}
 
     def getPowerSystemResources(self):
         """All power system resources used to electrically model this asset. For example, transformer asset is electrically modelled with a transformer and its windings and tap changer.
@@ -133,20 +135,19 @@ class Asset(IdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.Assets if q != self]
-            self._PowerSystemResources._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
             if self not in r._Assets:
-                r._Assets.append(self)
-        self._PowerSystemResources = value
+                r._reflist("_Assets").append(self)
+        self._PowerSystemResources = RefList(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
             if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._PowerSystemResources.append(obj)
+                obj._reflist("_Assets").append(self)
+            self._reflist("_PowerSystemResources").append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
@@ -161,20 +162,19 @@ class Asset(IdentifiedObject):
 
     def setProperties(self, value):
         for p in self._Properties:
-            filtered = [q for q in p.PropertyAssets if q != self]
-            self._Properties._PropertyAssets = filtered
+            p._PropertyAssets.discard(self)
         for r in value:
             if self not in r._PropertyAssets:
-                r._PropertyAssets.append(self)
-        self._Properties = value
+                r._reflist("_PropertyAssets").append(self)
+        self._Properties = RefList(value)
 
     Properties = property(getProperties, setProperties)
 
     def addProperties(self, *Properties):
         for obj in Properties:
             if self not in obj._PropertyAssets:
-                obj._PropertyAssets.append(self)
-            self._Properties.append(obj)
+                obj._reflist("_PropertyAssets").append(self)
+            self._reflist("_Properties").append(obj)
 
     def removeProperties(self, *Properties):
         for obj in Properties:
@@ -192,20 +192,19 @@ class Asset(IdentifiedObject):
 
     def setActivityRecords(self, value):
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Assets if q != self]
-            self._ActivityRecords._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
             if self not in r._Assets:
-                r._Assets.append(self)
-        self._ActivityRecords = value
+                r._reflist("_Assets").append(self)
+        self._ActivityRecords = RefList(value)
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
             if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ActivityRecords.append(obj)
+                obj._reflist("_Assets").append(self)
+            self._reflist("_ActivityRecords").append(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
@@ -220,13 +219,12 @@ class Asset(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.Assets if x != self]
-            self._Location._Assets = filtered
+            self._Location._Assets.discard(self)
 
         self._Location = value
         if self._Location is not None:
             if self not in self._Location._Assets:
-                self._Location._Assets.append(self)
+                self._Location._reflist("_Assets").append(self)
 
     Location = property(getLocation, setLocation)
 
@@ -235,7 +233,8 @@ class Asset(IdentifiedObject):
         return self._AssetFunctions
 
     def setAssetFunctions(self, value):
-        for x in self._AssetFunctions:
+        value = RefList(value)
+        for x in list(self._AssetFunctions):
             x.Asset = None
         for y in value:
             y._Asset = self
@@ -256,7 +255,8 @@ class Asset(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
-        for x in self._Measurements:
+        value = RefList(value)
+        for x in list(self._Measurements):
             x.Asset = None
         for y in value:
             y._Asset = self
@@ -278,13 +278,12 @@ class Asset(IdentifiedObject):
 
     def setAssetContainer(self, value):
         if self._AssetContainer is not None:
-            filtered = [x for x in self.AssetContainer.Assets if x != self]
-            self._AssetContainer._Assets = filtered
+            self._AssetContainer._Assets.discard(self)
 
         self._AssetContainer = value
         if self._AssetContainer is not None:
             if self not in self._AssetContainer._Assets:
-                self._AssetContainer._Assets.append(self)
+                self._AssetContainer._reflist("_Assets").append(self)
 
     AssetContainer = property(getAssetContainer, setAssetContainer)
 
@@ -298,20 +297,19 @@ class Asset(IdentifiedObject):
 
     def setRatings(self, value):
         for p in self._Ratings:
-            filtered = [q for q in p.RatingAssets if q != self]
-            self._Ratings._RatingAssets = filtered
+            p._RatingAssets.discard(self)
         for r in value:
             if self not in r._RatingAssets:
-                r._RatingAssets.append(self)
-        self._Ratings = value
+                r._reflist("_RatingAssets").append(self)
+        self._Ratings = RefList(value)
 
     Ratings = property(getRatings, setRatings)
 
     def addRatings(self, *Ratings):
         for obj in Ratings:
             if self not in obj._RatingAssets:
-                obj._RatingAssets.append(self)
-            self._Ratings.append(obj)
+                obj._reflist("_RatingAssets").append(self)
+            self._reflist("_Ratings").append(obj)
 
     def removeRatings(self, *Ratings):
         for obj in Ratings:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Assets.Asset import Asset
+from CIM14.Element import RefList
 
 class AssetContainer(Asset):
     """Asset that is aggregation of other assets such as conductors, transformers, switchgear, land, fences, buildings, equipment, vehicles, etc.
@@ -30,11 +31,11 @@ class AssetContainer(Asset):
         @param Seals: All seals applied to this asset container.
         @param Assets:
         """
-        self._Seals = []
-        self.Seals = [] if Seals is None else Seals
+        if Seals is not None:
+            self.Seals = Seals
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
         super(AssetContainer, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class AssetContainer(Asset):
     _enums = {}
     _refs = ["Seals", "Assets"]
     _many_refs = ["Seals", "Assets"]
+    _inverses = {"Seals": "AssetContainer", "Assets": "AssetContainer"}
 
     def getSeals(self):
         """All seals applied to this asset container.
@@ -51,7 +53,8 @@ class AssetContainer(Asset):
         return self._Seals
 
     def setSeals(self, value):
-        for x in self._Seals:
+        value = RefList(value)
+        for x in list(self._Seals):
             x.AssetContainer = None
         for y in value:
             y._AssetContainer = self
@@ -72,7 +75,8 @@ class AssetContainer(Asset):
         return self._Assets
 
     def setAssets(self, value):
-        for x in self._Assets:
+        value = RefList(value)
+        for x in list(self._Assets):
             x.AssetContainer = None
         for y in value:
             y._AssetContainer = self
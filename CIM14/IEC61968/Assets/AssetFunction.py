@@ -60,6 +60,7 @@ class AssetFunction(IdentifiedObject):
     _enums = {}
     _refs = ["Asset"]
     _many_refs = []
+    _inverses = {"Asset": "AssetFunctions"}
 
     def getAsset(self):
         
@@ -67,13 +68,12 @@ class AssetFunction(IdentifiedObject):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.AssetFunctions if x != self]
-            self._Asset._AssetFunctions = filtered
+            self._Asset._AssetFunctions.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
             if self not in self._Asset._AssetFunctions:
-                self._Asset._AssetFunctions.append(self)
+                self._Asset._reflist("_AssetFunctions").append(self)
 
     Asset = property(getAsset, setAsset)
 
@@ -36,4 +36,5 @@ class ComMediaAsset(Asset):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -56,6 +56,7 @@ class Seal(IdentifiedObject):
     _enums = {"kind": "SealKind", "condition": "SealConditionKind"}
     _refs = ["AssetContainer"]
     _many_refs = []
+    _inverses = {"AssetContainer": "Seals"}
 
     def getAssetContainer(self):
         """Asset container to which this seal is applied.
@@ -64,13 +65,12 @@ class Seal(IdentifiedObject):
 
     def setAssetContainer(self, value):
         if self._AssetContainer is not None:
-            filtered = [x for x in self.AssetContainer.Seals if x != self]
-            self._AssetContainer._Seals = filtered
+            self._AssetContainer._Seals.discard(self)
 
         self._AssetContainer = value
         if self._AssetContainer is not None:
             if self not in self._AssetContainer._Seals:
-                self._AssetContainer._Seals.append(self)
+                self._AssetContainer._reflist("_Seals").append(self)
 
     AssetContainer = property(getAssetContainer, setAssetContainer)
 
@@ -21,12 +21,8 @@
 """This package contains the core information classes that support asset management applications with specialized classes for asset-level models for objects (as opposed to power system resource models, mainly defined in IEC61970::Wires package).
 """
 
-from CIM14.IEC61968.Assets.AssetFunction import AssetFunction
-from CIM14.IEC61968.Assets.Asset import Asset
-from CIM14.IEC61968.Assets.AssetContainer import AssetContainer
-from CIM14.IEC61968.Assets.AcceptanceTest import AcceptanceTest
-from CIM14.IEC61968.Assets.Seal import Seal
-from CIM14.IEC61968.Assets.ComMediaAsset import ComMediaAsset
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Assets"
 nsPrefix = "cimAssets"
@@ -43,3 +39,13 @@ class SealConditionKind(str):
     Values are: open, broken, missing, other, locked
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "AssetFunction",
+    "Asset",
+    "AssetContainer",
+    "AcceptanceTest",
+    "Seal",
+    "ComMediaAsset",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class ActivityRecord(IdentifiedObject):
     """Records activity for an entity at a point in time; activity may be for an event that has already occurred or for a planned activity.
@@ -47,11 +48,11 @@ class ActivityRecord(IdentifiedObject):
         #: Category of event resulting in this activity record.
         self.category = category
 
-        self._Documents = []
-        self.Documents = [] if Documents is None else Documents
+        if Documents is not None:
+            self.Documents = Documents
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
         self.status = status
 
@@ -63,6 +64,7 @@ class ActivityRecord(IdentifiedObject):
     _enums = {}
     _refs = ["Documents", "Assets", "status"]
     _many_refs = ["Documents", "Assets"]
+    _inverses = {"Documents": "ActivityRecords", "Assets": "ActivityRecords"}
 
     def getDocuments(self):
         """All documents for which this activity record has been created.
@@ -71,20 +73,19 @@ class ActivityRecord(IdentifiedObject):
 
     def setDocuments(self, value):
         for p in self._Documents:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Documents._ActivityRecords = filtered
+            p._ActivityRecords.discard(self)
         for r in value:
             if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
-        self._Documents = value
+                r._reflist("_ActivityRecords").append(self)
+        self._Documents = RefList(value)
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
         for obj in Documents:
             if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Documents.append(obj)
+                obj._reflist("_ActivityRecords").append(self)
+            self._reflist("_Documents").append(obj)
 
     def removeDocuments(self, *Documents):
         for obj in Documents:
@@ -99,20 +100,19 @@ class ActivityRecord(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Assets._ActivityRecords = filtered
+            p._ActivityRecords.discard(self)
         for r in value:
             if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
-        self._Assets = value
+                r._reflist("_ActivityRecords").append(self)
+        self._Assets = RefList(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
             if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Assets.append(obj)
+                obj._reflist("_ActivityRecords").append(self)
+            self._reflist("_Assets").append(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
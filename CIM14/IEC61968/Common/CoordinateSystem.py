@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, RefList
 
 class CoordinateSystem(Element):
     """Coordinate reference system.
@@ -37,8 +37,8 @@ class CoordinateSystem(Element):
         self._Location = None
         self.Location = Location
 
-        self._PositionPoints = []
-        self.PositionPoints = [] if PositionPoints is None else PositionPoints
+        if PositionPoints is not None:
+            self.PositionPoints = PositionPoints
 
         super(CoordinateSystem, self).__init__(*args, **kw_args)
 
@@ -48,6 +48,7 @@ class CoordinateSystem(Element):
     _enums = {}
     _refs = ["Location", "PositionPoints"]
     _many_refs = ["PositionPoints"]
+    _inverses = {"Location": "CoordinateSystems", "PositionPoints": "CoordinateSystem"}
 
     def getLocation(self):
         """Location described by using position points in this coordinate system.
@@ -56,13 +57,12 @@ class CoordinateSystem(Element):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.CoordinateSystems if x != self]
-            self._Location._CoordinateSystems = filtered
+            self._Location._CoordinateSystems.discard(self)
 
         self._Location = value
         if self._Location is not None:
             if self not in self._Location._CoordinateSystems:
-                self._Location._CoordinateSystems.append(self)
+                self._Location._reflist("_CoordinateSystems").append(self)
 
     Location = property(getLocation, setLocation)
 
@@ -72,7 +72,8 @@ class CoordinateSystem(Element):
         return self._PositionPoints
 
     def setPositionPoints(self, value):
-        for x in self._PositionPoints:
+        value = RefList(value)
+        for x in list(self._PositionPoints):
             x.CoordinateSystem = None
         for y in value:
             y._CoordinateSystem = self
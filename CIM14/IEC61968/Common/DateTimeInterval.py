@@ -44,4 +44,5 @@ class DateTimeInterval(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
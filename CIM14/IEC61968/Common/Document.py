@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class Document(IdentifiedObject):
     """Parent class for different groupings of information collected and managed as a part of a business process. It will frequently contain references to other objects, such as assets, people and power system resources.
@@ -61,13 +62,13 @@ class Document(IdentifiedObject):
 
         self.status = status
 
-        self._ActivityRecords = []
-        self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
+        if ActivityRecords is not None:
+            self.ActivityRecords = ActivityRecords
 
         self.docStatus = docStatus
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         super(Document, self).__init__(*args, **kw_args)
 
@@ -77,6 +78,7 @@ class Document(IdentifiedObject):
     _enums = {}
     _refs = ["electronicAddress", "status", "ActivityRecords", "docStatus", "Measurements"]
     _many_refs = ["ActivityRecords", "Measurements"]
+    _inverses = {"ActivityRecords": "Documents", "Measurements": "Documents"}
 
     # Electronic address.
     electronicAddress = None
@@ -91,20 +93,19 @@ class Document(IdentifiedObject):
 
     def setActivityRecords(self, value):
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Documents if q != self]
-            self._ActivityRecords._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
             if self not in r._Documents:
-                r._Documents.append(self)
-        self._ActivityRecords = value
+                r._reflist("_Documents").append(self)
+        self._ActivityRecords = RefList(value)
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
             if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._ActivityRecords.append(obj)
+                obj._reflist("_Documents").append(self)
+            self._reflist("_ActivityRecords").append(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
@@ -122,20 +123,19 @@ class Document(IdentifiedObject):
 
     def setMeasurements(self, value):
         for p in self._Measurements:
-            filtered = [q for q in p.Documents if q != self]
-            self._Measurements._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
             if self not in r._Documents:
-                r._Documents.append(self)
-        self._Measurements = value
+                r._reflist("_Documents").append(self)
+        self._Measurements = RefList(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
         for obj in Measurements:
             if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._Measurements.append(obj)
+                obj._reflist("_Documents").append(self)
+            self._reflist("_Measurements").append(obj)
 
     def removeMeasurements(self, *Measurements):
         for obj in Measurements:
@@ -63,6 +63,7 @@ class ElectronicAddress(Element):
     _enums = {}
     _refs = ["status"]
     _many_refs = []
+    _inverses = {}
 
     # Status of this electronic address.
     status = None
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class Location(IdentifiedObject):
     """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It is defined with one or more postition points (coordinates) in a given coordinate system.
@@ -55,22 +56,22 @@ class Location(IdentifiedObject):
         #: Category by utility's corporate standards and practices, relative to the location itself (e.g., geographical, functional accounting, etc., not a given property that happens to exist at that location).
         self.category = category
 
-        self._PositionPoints = []
-        self.PositionPoints = [] if PositionPoints is None else PositionPoints
+        if PositionPoints is not None:
+            self.PositionPoints = PositionPoints
 
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
-        self._CoordinateSystems = []
-        self.CoordinateSystems = [] if CoordinateSystems is None else CoordinateSystems
+        if CoordinateSystems is not None:
+            self.CoordinateSystems = CoordinateSystems
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         self.secondaryAddress = secondaryAddress
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
         self.phone2 = phone2
 
@@ -90,6 +91,7 @@ class Location(IdentifiedObject):
     _enums = {}
     _refs = ["PositionPoints", "PowerSystemResources", "CoordinateSystems", "Measurements", "secondaryAddress", "Assets", "phone2", "electronicAddress", "phone1", "mainAddress", "status"]
     _many_refs = ["PositionPoints", "PowerSystemResources", "CoordinateSystems", "Measurements", "Assets"]
+    _inverses = {"PositionPoints": "Location", "PowerSystemResources": "Location", "CoordinateSystems": "Location", "Measurements": "Locations", "Assets": "Location"}
 
     def getPositionPoints(self):
         """Sequence of position points describing this location.
@@ -97,7 +99,8 @@ class Location(IdentifiedObject):
         return self._PositionPoints
 
     def setPositionPoints(self, value):
-        for x in self._PositionPoints:
+        value = RefList(value)
+        for x in list(self._PositionPoints):
             x.Location = None
         for y in value:
             y._Location = self
@@ -119,7 +122,8 @@ class Location(IdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
-        for x in self._PowerSystemResources:
+        value = RefList(value)
+        for x in list(self._PowerSystemResources):
             x.Location = None
         for y in value:
             y._Location = self
@@ -141,7 +145,8 @@ class Location(IdentifiedObject):
         return self._CoordinateSystems
 
     def setCoordinateSystems(self, value):
-        for x in self._CoordinateSystems:
+        value = RefList(value)
+        for x in list(self._CoordinateSystems):
             x.Location = None
         for y in value:
             y._Location = self
@@ -163,20 +168,19 @@ class Location(IdentifiedObject):
 
     def setMeasurements(self, value):
         for p in self._Measurements:
-            filtered = [q for q in p.Locations if q != self]
-            self._Measurements._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
             if self not in r._Locations:
-                r._Locations.append(self)
-        self._Measurements = value
+                r._reflist("_Locations").append(self)
+        self._Measurements = RefList(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
         for obj in Measurements:
             if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Measurements.append(obj)
+                obj._reflist("_Locations").append(self)
+            self._reflist("_Measurements").append(obj)
 
     def removeMeasurements(self, *Measurements):
         for obj in Measurements:
@@ -193,7 +197,8 @@ class Location(IdentifiedObject):
         return self._Assets
 
     def setAssets(self, value):
-        for x in self._Assets:
+        value = RefList(value)
+        for x in list(self._Assets):
             x.Location = None
         for y in value:
             y._Location = self
@@ -51,6 +51,7 @@ class Organisation(IdentifiedObject):
     _enums = {}
     _refs = ["electronicAddress", "streetAddress", "phone2", "phone1", "postalAddress"]
     _many_refs = []
+    _inverses = {}
 
     # Electronic address.
     electronicAddress = None
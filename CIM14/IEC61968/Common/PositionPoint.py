@@ -60,6 +60,7 @@ class PositionPoint(Element):
     _enums = {}
     _refs = ["Location", "CoordinateSystem"]
     _many_refs = []
+    _inverses = {"Location": "PositionPoints", "CoordinateSystem": "PositionPoints"}
 
     def getLocation(self):
         """Location that this position point describes.
@@ -68,13 +69,12 @@ class PositionPoint(Element):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PositionPoints if x != self]
-            self._Location._PositionPoints = filtered
+            self._Location._PositionPoints.discard(self)
 
         self._Location = value
         if self._Location is not None:
             if self not in self._Location._PositionPoints:
-                self._Location._PositionPoints.append(self)
+                self._Location._reflist("_PositionPoints").append(self)
 
     Location = property(getLocation, setLocation)
 
@@ -85,13 +85,12 @@ class PositionPoint(Element):
 
     def setCoordinateSystem(self, value):
         if self._CoordinateSystem is not None:
-            filtered = [x for x in self.CoordinateSystem.PositionPoints if x != self]
-            self._CoordinateSystem._PositionPoints = filtered
+            self._CoordinateSystem._PositionPoints.discard(self)
 
         self._CoordinateSystem = value
         if self._CoordinateSystem is not None:
             if self not in self._CoordinateSystem._PositionPoints:
-                self._CoordinateSystem._PositionPoints.append(self)
+                self._CoordinateSystem._reflist("_PositionPoints").append(self)
 
     CoordinateSystem = property(getCoordinateSystem, setCoordinateSystem)
 
@@ -50,6 +50,7 @@ class PostalAddress(Element):
     _enums = {}
     _refs = ["streetDetail", "townDetail"]
     _many_refs = []
+    _inverses = {}
 
     # Street detail.
     streetDetail = None
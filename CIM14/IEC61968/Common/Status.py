@@ -52,4 +52,5 @@ class Status(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -45,6 +45,7 @@ class StreetAddress(Element):
     _enums = {}
     _refs = ["status", "townDetail", "streetDetail"]
     _many_refs = []
+    _inverses = {}
 
     # Status of this address.
     status = None
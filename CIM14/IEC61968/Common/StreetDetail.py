@@ -76,4 +76,5 @@ class StreetDetail(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -58,6 +58,7 @@ class TimePoint(IdentifiedObject):
     _enums = {}
     _refs = ["TimeSchedule", "status", "window"]
     _many_refs = []
+    _inverses = {"TimeSchedule": "TimePoints"}
 
     def getTimeSchedule(self):
         """Time schedule owning this time point.
@@ -66,13 +67,12 @@ class TimePoint(IdentifiedObject):
 
     def setTimeSchedule(self, value):
         if self._TimeSchedule is not None:
-            filtered = [x for x in self.TimeSchedule.TimePoints if x != self]
-            self._TimeSchedule._TimePoints = filtered
+            self._TimeSchedule._TimePoints.discard(self)
 
         self._TimeSchedule = value
         if self._TimeSchedule is not None:
             if self not in self._TimeSchedule._TimePoints:
-                self._TimeSchedule._TimePoints.append(self)
+                self._TimeSchedule._reflist("_TimePoints").append(self)
 
     TimeSchedule = property(getTimeSchedule, setTimeSchedule)
 
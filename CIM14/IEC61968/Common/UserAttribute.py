@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, RefList
 
 class UserAttribute(Element):
     """Generic name-value pair class, with optional sequence number and units for value; can be used to model parts of information exchange when concrete types are not known in advance.
@@ -43,14 +43,14 @@ class UserAttribute(Element):
         #: Name of an attribute.
         self.name = name
 
-        self._PropertyAssets = []
-        self.PropertyAssets = [] if PropertyAssets is None else PropertyAssets
+        if PropertyAssets is not None:
+            self.PropertyAssets = PropertyAssets
 
         self._Transaction = None
         self.Transaction = Transaction
 
-        self._RatingAssets = []
-        self.RatingAssets = [] if RatingAssets is None else RatingAssets
+        if RatingAssets is not None:
+            self.RatingAssets = RatingAssets
 
         super(UserAttribute, self).__init__(*args, **kw_args)
 
@@ -60,6 +60,7 @@ class UserAttribute(Element):
     _enums = {}
     _refs = ["PropertyAssets", "Transaction", "RatingAssets"]
     _many_refs = ["PropertyAssets", "RatingAssets"]
+    _inverses = {"PropertyAssets": "Properties", "Transaction": "UserAttributes", "RatingAssets": "Ratings"}
 
     def getPropertyAssets(self):
         
@@ -67,20 +68,19 @@ class UserAttribute(Element):
 
     def setPropertyAssets(self, value):
         for p in self._PropertyAssets:
-            filtered = [q for q in p.Properties if q != self]
-            self._PropertyAssets._Properties = filtered
+            p._Properties.discard(self)
         for r in value:
             if self not in r._Properties:
-                r._Properties.append(self)
-        self._PropertyAssets = value
+                r._reflist("_Properties").append(self)
+        self._PropertyAssets = RefList(value)
 
     PropertyAssets = property(getPropertyAssets, setPropertyAssets)
 
     def addPropertyAssets(self, *PropertyAssets):
         for obj in PropertyAssets:
             if self not in obj._Properties:
-                obj._Properties.append(self)
-            self._PropertyAssets.append(obj)
+                obj._reflist("_Properties").append(self)
+            self._reflist("_PropertyAssets").append(obj)
 
     def removePropertyAssets(self, *PropertyAssets):
         for obj in PropertyAssets:
@@ -95,13 +95,12 @@ class UserAttribute(Element):
 
     def setTransaction(self, value):
         if self._Transaction is not None:
-            filtered = [x for x in self.Transaction.UserAttributes if x != self]
-            self._Transaction._UserAttributes = filtered
+            self._Transaction._UserAttributes.discard(self)
 
         self._Transaction = value
         if self._Transaction is not None:
             if self not in self._Transaction._UserAttributes:
-                self._Transaction._UserAttributes.append(self)
+                self._Transaction._reflist("_UserAttributes").append(self)
 
     Transaction = property(getTransaction, setTransaction)
 
@@ -111,20 +110,19 @@ class UserAttribute(Element):
 
     def setRatingAssets(self, value):
         for p in self._RatingAssets:
-            filtered = [q for q in p.Ratings if q != self]
-            self._RatingAssets._Ratings = filtered
+            p._Ratings.discard(self)
         for r in value:
             if self not in r._Ratings:
-                r._Ratings.append(self)
-        self._RatingAssets = value
+                r._reflist("_Ratings").append(self)
+        self._RatingAssets = RefList(value)
 
     RatingAssets = property(getRatingAssets, setRatingAssets)
 
     def addRatingAssets(self, *RatingAssets):
         for obj in RatingAssets:
             if self not in obj._Ratings:
-                obj._Ratings.append(self)
-            self._RatingAssets.append(obj)
+                obj._reflist("_Ratings").append(self)
+            self._reflist("_RatingAssets").append(obj)
 
     def removeRatingAssets(self, *RatingAssets):
         for obj in RatingAssets:
@@ -21,25 +21,30 @@
 """This package contains the information classes that support distribution management in general.
 """
 
-from CIM14.IEC61968.Common.Organisation import Organisation
-from CIM14.IEC61968.Common.Status import Status
-from CIM14.IEC61968.Common.Document import Document
-from CIM14.IEC61968.Common.TimeSchedule import TimeSchedule
-from CIM14.IEC61968.Common.TownDetail import TownDetail
-from CIM14.IEC61968.Common.Location import Location
-from CIM14.IEC61968.Common.PostalAddress import PostalAddress
-from CIM14.IEC61968.Common.PositionPoint import PositionPoint
-from CIM14.IEC61968.Common.ActivityRecord import ActivityRecord
-from CIM14.IEC61968.Common.StreetAddress import StreetAddress
-from CIM14.IEC61968.Common.TimePoint import TimePoint
-from CIM14.IEC61968.Common.Agreement import Agreement
-from CIM14.IEC61968.Common.DateTimeInterval import DateTimeInterval
-from CIM14.IEC61968.Common.StreetDetail import StreetDetail
-from CIM14.IEC61968.Common.ElectronicAddress import ElectronicAddress
-from CIM14.IEC61968.Common.TelephoneNumber import TelephoneNumber
-from CIM14.IEC61968.Common.UserAttribute import UserAttribute
-from CIM14.IEC61968.Common.CoordinateSystem import CoordinateSystem
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Common"
 nsPrefix = "cimCommon"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Organisation",
+    "Status",
+    "Document",
+    "TimeSchedule",
+    "TownDetail",
+    "Location",
+    "PostalAddress",
+    "PositionPoint",
+    "ActivityRecord",
+    "StreetAddress",
+    "TimePoint",
+    "Agreement",
+    "DateTimeInterval",
+    "StreetDetail",
+    "ElectronicAddress",
+    "TelephoneNumber",
+    "UserAttribute",
+    "CoordinateSystem",
+])
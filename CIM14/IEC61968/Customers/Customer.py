@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Organisation import Organisation
+from CIM14.Element import RefList
 
 class Customer(Organisation):
     """Organisation receiving services from ServiceSupplier.
@@ -50,14 +51,14 @@ class Customer(Organisation):
 
         self.status = status
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        if Works is not None:
+            self.Works = Works
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._EndDeviceAssets = []
-        self.EndDeviceAssets = [] if EndDeviceAssets is None else EndDeviceAssets
+        if EndDeviceAssets is not None:
+            self.EndDeviceAssets = EndDeviceAssets
 
         super(Customer, self).__init__(*args, **kw_args)
 
@@ -67,6 +68,7 @@ class Customer(Organisation):
     _enums = {"kind": "CustomerKind"}
     _refs = ["status", "Works", "CustomerAgreements", "EndDeviceAssets"]
     _many_refs = ["Works", "CustomerAgreements", "EndDeviceAssets"]
+    _inverses = {"Works": "Customers", "CustomerAgreements": "Customer", "EndDeviceAssets": "Customer"}
 
     # Status of this customer.
     status = None
@@ -78,20 +80,19 @@ class Customer(Organisation):
 
     def setWorks(self, value):
         for p in self._Works:
-            filtered = [q for q in p.Customers if q != self]
-            self._Works._Customers = filtered
+            p._Customers.discard(self)
         for r in value:
             if self not in r._Customers:
-                r._Customers.append(self)
-        self._Works = value
+                r._reflist("_Customers").append(self)
+        self._Works = RefList(value)
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
         for obj in Works:
             if self not in obj._Customers:
-                obj._Customers.append(self)
-            self._Works.append(obj)
+                obj._reflist("_Customers").append(self)
+            self._reflist("_Works").append(obj)
 
     def removeWorks(self, *Works):
         for obj in Works:
@@ -105,7 +106,8 @@ class Customer(Organisation):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
-        for x in self._CustomerAgreements:
+        value = RefList(value)
+        for x in list(self._CustomerAgreements):
             x.Customer = None
         for y in value:
             y._Customer = self
@@ -127,7 +129,8 @@ class Customer(Organisation):
         return self._EndDeviceAssets
 
     def setEndDeviceAssets(self, value):
-        for x in self._EndDeviceAssets:
+        value = RefList(value)
+        for x in list(self._EndDeviceAssets):
             x.Customer = None
         for y in value:
             y._Customer = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from CIM14.Element import RefList
 
 class CustomerAccount(Document):
     """Assignment of a group of products and services purchased by the Customer through a CustomerAgreement, used as a mechanism for customer billing and payment. It contains common information from the various types of CustomerAgreements to create billings (invoices) for a Customer and receive payment.
@@ -30,11 +31,11 @@ class CustomerAccount(Document):
         @param PaymentTransactions: All payment transactions for this customer account.
         @param CustomerAgreements: All agreements for this customer account.
         """
-        self._PaymentTransactions = []
-        self.PaymentTransactions = [] if PaymentTransactions is None else PaymentTransactions
+        if PaymentTransactions is not None:
+            self.PaymentTransactions = PaymentTransactions
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
         super(CustomerAccount, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class CustomerAccount(Document):
     _enums = {}
     _refs = ["PaymentTransactions", "CustomerAgreements"]
     _many_refs = ["PaymentTransactions", "CustomerAgreements"]
+    _inverses = {"PaymentTransactions": "CustomerAccount", "CustomerAgreements": "CustomerAccount"}
 
     def getPaymentTransactions(self):
         """All payment transactions for this customer account.
@@ -51,7 +53,8 @@ class CustomerAccount(Document):
         return self._PaymentTransactions
 
     def setPaymentTransactions(self, value):
-        for x in self._PaymentTransactions:
+        value = RefList(value)
+        for x in list(self._PaymentTransactions):
             x.CustomerAccount = None
         for y in value:
             y._CustomerAccount = self
@@ -73,7 +76,8 @@ class CustomerAccount(Document):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
-        for x in self._CustomerAgreements:
+        value = RefList(value)
+        for x in list(self._CustomerAgreements):
             x.CustomerAccount = None
         for y in value:
             y._CustomerAccount = self
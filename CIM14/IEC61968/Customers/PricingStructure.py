@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from CIM14.Element import RefList
 
 class PricingStructure(Document):
     """Grouping of pricing components and prices used in the creation of customer charges and the eligibility criteria under which these terms may be offered to a customer. The reasons for grouping include state, customer classification, site characteristics, classification (i.e. fee price structure, deposit price structure, electric service price structure, etc.) and accounting requirements.
@@ -57,20 +58,20 @@ class PricingStructure(Document):
         #: Absolute maximum valid non-demand usage quantity used in validating a customer's billed non-demand usage.
         self.dailyCeilingUsage = dailyCeilingUsage
 
-        self._Transactions = []
-        self.Transactions = [] if Transactions is None else Transactions
+        if Transactions is not None:
+            self.Transactions = Transactions
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
         self._ServiceCategory = None
         self.ServiceCategory = ServiceCategory
 
-        self._Tariffs = []
-        self.Tariffs = [] if Tariffs is None else Tariffs
+        if Tariffs is not None:
+            self.Tariffs = Tariffs
 
         super(PricingStructure, self).__init__(*args, **kw_args)
 
@@ -80,6 +81,7 @@ class PricingStructure(Document):
     _enums = {"revenueKind": "RevenueKind"}
     _refs = ["Transactions", "ServiceDeliveryPoints", "CustomerAgreements", "ServiceCategory", "Tariffs"]
     _many_refs = ["Transactions", "ServiceDeliveryPoints", "CustomerAgreements", "Tariffs"]
+    _inverses = {"Transactions": "PricingStructure", "ServiceDeliveryPoints": "PricingStructures", "CustomerAgreements": "PricingStructures", "ServiceCategory": "PricingStructures", "Tariffs": "PricingStructures"}
 
     def getTransactions(self):
         """All transactions applying this pricing structure.
@@ -87,7 +89,8 @@ class PricingStructure(Document):
         return self._Transactions
 
     def setTransactions(self, value):
-        for x in self._Transactions:
+        value = RefList(value)
+        for x in list(self._Transactions):
             x.PricingStructure = None
         for y in value:
             y._PricingStructure = self
@@ -110,20 +113,19 @@ class PricingStructure(Document):
 
     def setServiceDeliveryPoints(self, value):
         for p in self._ServiceDeliveryPoints:
-            filtered = [q for q in p.PricingStructures if q != self]
-            self._ServiceDeliveryPoints._PricingStructures = filtered
+            p._PricingStructures.discard(self)
         for r in value:
             if self not in r._PricingStructures:
-                r._PricingStructures.append(self)
-        self._ServiceDeliveryPoints = value
+                r._reflist("_PricingStructures").append(self)
+        self._ServiceDeliveryPoints = RefList(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
         for obj in ServiceDeliveryPoints:
             if self not in obj._PricingStructures:
-                obj._PricingStructures.append(self)
-            self._ServiceDeliveryPoints.append(obj)
+                obj._reflist("_PricingStructures").append(self)
+            self._reflist("_ServiceDeliveryPoints").append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
         for obj in ServiceDeliveryPoints:
@@ -138,20 +140,19 @@ class PricingStructure(Document):
 
     def setCustomerAgreements(self, value):
         for p in self._CustomerAgreements:
-            filtered = [q for q in p.PricingStructures if q != self]
-            self._CustomerAgreements._PricingStructures = filtered
+            p._PricingStructures.discard(self)
         for r in value:
             if self not in r._PricingStructures:
-                r._PricingStructures.append(self)
-        self._CustomerAgreements = value
+                r._reflist("_PricingStructures").append(self)
+        self._CustomerAgreements = RefList(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
             if self not in obj._PricingStructures:
-                obj._PricingStructures.append(self)
-            self._CustomerAgreements.append(obj)
+                obj._reflist("_PricingStructures").append(self)
+            self._reflist("_CustomerAgreements").append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
@@ -166,13 +167,12 @@ class PricingStructure(Document):
 
     def setServiceCategory(self, value):
         if self._ServiceCategory is not None:
-            filtered = [x for x in self.ServiceCategory.PricingStructures if x != self]
-            self._ServiceCategory._PricingStructures = filtered
+            self._ServiceCategory._PricingStructures.discard(self)
 
         self._ServiceCategory = value
         if self._ServiceCategory is not None:
             if self not in self._ServiceCategory._PricingStructures:
-                self._ServiceCategory._PricingStructures.append(self)
+                self._ServiceCategory._reflist("_PricingStructures").append(self)
 
     ServiceCategory = property(getServiceCategory, setServiceCategory)
 
@@ -183,20 +183,19 @@ class PricingStructure(Document):
 
     def setTariffs(self, value):
         for p in self._Tariffs:
-            filtered = [q for q in p.PricingStructures if q != self]
-            self._Tariffs._PricingStructures = filtered
+            p._PricingStructures.discard(self)
         for r in value:
             if self not in r._PricingStructures:
-                r._PricingStructures.append(self)
-        self._Tariffs = value
+                r._reflist("_PricingStructures").append(self)
+        self._Tariffs = RefList(value)
 
     Tariffs = property(getTariffs, setTariffs)
 
     def addTariffs(self, *Tariffs):
         for obj in Tariffs:
             if self not in obj._PricingStructures:
-                obj._PricingStructures.append(self)
-            self._Tariffs.append(obj)
+                obj._reflist("_PricingStructures").append(self)
+            self._reflist("_Tariffs").append(obj)
 
     def removeTariffs(self, *Tariffs):
         for obj in Tariffs:
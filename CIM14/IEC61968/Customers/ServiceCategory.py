@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class ServiceCategory(IdentifiedObject):
     """Category of service provided to the customer.
@@ -35,14 +36,14 @@ class ServiceCategory(IdentifiedObject):
         #: Kind of service. Values are: "water", "time", "electricity", "heat", "rates", "gas", "internet", "refuse", "other", "tvLicence", "sewerage"
         self.kind = kind
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._PricingStructures = []
-        self.PricingStructures = [] if PricingStructures is None else PricingStructures
+        if PricingStructures is not None:
+            self.PricingStructures = PricingStructures
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         super(ServiceCategory, self).__init__(*args, **kw_args)
 
@@ -52,13 +53,15 @@ class ServiceCategory(IdentifiedObject):
     _enums = {"kind": "ServiceKind"}
     _refs = ["CustomerAgreements", "PricingStructures", "ServiceDeliveryPoints"]
     _many_refs = ["CustomerAgreements", "PricingStructures", "ServiceDeliveryPoints"]
+    _inverses = {"CustomerAgreements": "ServiceCategory", "PricingStructures": "ServiceCategory", "ServiceDeliveryPoints": "ServiceCategory"}
 
     def getCustomerAgreements(self):
         
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
-        for x in self._CustomerAgreements:
+        value = RefList(value)
+        for x in list(self._CustomerAgreements):
             x.ServiceCategory = None
         for y in value:
             y._ServiceCategory = self
@@ -80,7 +83,8 @@ class ServiceCategory(IdentifiedObject):
         return self._PricingStructures
 
     def setPricingStructures(self, value):
-        for x in self._PricingStructures:
+        value = RefList(value)
+        for x in list(self._PricingStructures):
             x.ServiceCategory = None
         for y in value:
             y._ServiceCategory = self
@@ -102,7 +106,8 @@ class ServiceCategory(IdentifiedObject):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
-        for x in self._ServiceDeliveryPoints:
+        value = RefList(value)
+        for x in list(self._ServiceDeliveryPoints):
             x.ServiceCategory = None
         for y in value:
             y._ServiceCategory = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Location import Location
+from CIM14.Element import RefList
 
 class ServiceLocation(Location):
     """A customer ServiceLocation has one or more ServiceDeliveryPoint(s), which in turn relate to Meters. The location may be a point or a polygon, depending on the specific circumstances. For distribution, the ServiceLocation is typically the location of the utility customer's premise. Because a customer's premise may have one or more meters, the ServiceDeliveryPoint is used to define the actual conducting equipment that the EndDeviceAsset attaches to at the utility customer's ServiceLocation. For transmission, it is the point(s) of interconnection on the transmission provider's transmission system where capacity and/or energy transmitted by the transmission provider is made available to the receiving party.
@@ -43,14 +44,14 @@ class ServiceLocation(Location):
         #: True if inspection is needed of facilities at this service location. This could be requested by a customer, due to suspected tampering, environmental concerns (e.g., a fire in the vicinity), or to correct incompatible data.
         self.needsInspection = needsInspection
 
-        self._EndDeviceAssets = []
-        self.EndDeviceAssets = [] if EndDeviceAssets is None else EndDeviceAssets
+        if EndDeviceAssets is not None:
+            self.EndDeviceAssets = EndDeviceAssets
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         super(ServiceLocation, self).__init__(*args, **kw_args)
 
@@ -60,6 +61,7 @@ class ServiceLocation(Location):
     _enums = {}
     _refs = ["EndDeviceAssets", "CustomerAgreements", "ServiceDeliveryPoints"]
     _many_refs = ["EndDeviceAssets", "CustomerAgreements", "ServiceDeliveryPoints"]
+    _inverses = {"EndDeviceAssets": "ServiceLocation", "CustomerAgreements": "ServiceLocations", "ServiceDeliveryPoints": "ServiceLocation"}
 
     def getEndDeviceAssets(self):
         """All end device assets that measure the service delivered to this service location.
@@ -67,7 +69,8 @@ class ServiceLocation(Location):
         return self._EndDeviceAssets
 
     def setEndDeviceAssets(self, value):
-        for x in self._EndDeviceAssets:
+        value = RefList(value)
+        for x in list(self._EndDeviceAssets):
             x.ServiceLocation = None
         for y in value:
             y._ServiceLocation = self
@@ -90,20 +93,19 @@ class ServiceLocation(Location):
 
     def setCustomerAgreements(self, value):
         for p in self._CustomerAgreements:
-            filtered = [q for q in p.ServiceLocations if q != self]
-            self._CustomerAgreements._ServiceLocations = filtered
+            p._ServiceLocations.discard(self)
         for r in value:
             if self not in r._ServiceLocations:
-                r._ServiceLocations.append(self)
-        self._CustomerAgreements = value
+                r._reflist("_ServiceLocations").append(self)
+        self._CustomerAgreements = RefList(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
             if self not in obj._ServiceLocations:
-                obj._ServiceLocations.append(self)
-            self._CustomerAgreements.append(obj)
+                obj._reflist("_ServiceLocations").append(self)
+            self._reflist("_CustomerAgreements").append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
@@ -117,7 +119,8 @@ class ServiceLocation(Location):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
-        for x in self._ServiceDeliveryPoints:
+        value = RefList(value)
+        for x in list(self._ServiceDeliveryPoints):
             x.ServiceLocation = None
         for y in value:
             y._ServiceLocation = self
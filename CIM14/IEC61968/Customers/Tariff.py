@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from CIM14.Element import RefList
 
 class Tariff(Document):
     """Document, approved by the responsible regulatory agency, listing the terms and conditions, including a schedule of prices, under which utility services will be provided. It has a unique number within the state or province. For Rate Schedules it is frequently allocated by the affiliated Public Utilities Commission.
@@ -38,11 +39,11 @@ class Tariff(Document):
         #: (if tariff became inactive) Date tariff was terminated.
         self.endDate = endDate
 
-        self._TariffProfiles = []
-        self.TariffProfiles = [] if TariffProfiles is None else TariffProfiles
+        if TariffProfiles is not None:
+            self.TariffProfiles = TariffProfiles
 
-        self._PricingStructures = []
-        self.PricingStructures = [] if PricingStructures is None else PricingStructures
+        if PricingStructures is not None:
+            self.PricingStructures = PricingStructures
 
         super(Tariff, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class Tariff(Document):
     _enums = {}
     _refs = ["TariffProfiles", "PricingStructures"]
     _many_refs = ["TariffProfiles", "PricingStructures"]
+    _inverses = {"TariffProfiles": "Tariffs", "PricingStructures": "Tariffs"}
 
     def getTariffProfiles(self):
         """All tariff profiles using this tariff.
@@ -60,20 +62,19 @@ class Tariff(Document):
 
     def setTariffProfiles(self, value):
         for p in self._TariffProfiles:
-            filtered = [q for q in p.Tariffs if q != self]
-            self._TariffProfiles._Tariffs = filtered
+            p._Tariffs.discard(self)
         for r in value:
             if self not in r._Tariffs:
-                r._Tariffs.append(self)
-        self._TariffProfiles = value
+                r._reflist("_Tariffs").append(self)
+        self._TariffProfiles = RefList(value)
 
     TariffProfiles = property(getTariffProfiles, setTariffProfiles)
 
     def addTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
             if self not in obj._Tariffs:
-                obj._Tariffs.append(self)
-            self._TariffProfiles.append(obj)
+                obj._reflist("_Tariffs").append(self)
+            self._reflist("_TariffProfiles").append(obj)
 
     def removeTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
@@ -88,20 +89,19 @@ class Tariff(Document):
 
     def setPricingStructures(self, value):
         for p in self._PricingStructures:
-            filtered = [q for q in p.Tariffs if q != self]
-            self._PricingStructures._Tariffs = filtered
+            p._Tariffs.discard(self)
         for r in value:
             if self not in r._Tariffs:
-                r._Tariffs.append(self)
-        self._PricingStructures = value
+                r._reflist("_Tariffs").append(self)
+        self._PricingStructures = RefList(value)
 
     PricingStructures = property(getPricingStructures, setPricingStructures)
 
     def addPricingStructures(self, *PricingStructures):
         for obj in PricingStructures:
             if self not in obj._Tariffs:
-                obj._Tariffs.append(self)
-            self._PricingStructures.append(obj)
+                obj._reflist("_Tariffs").append(self)
+            self._reflist("_PricingStructures").append(obj)
 
     def removePricingStructures(self, *PricingStructures):
         for obj in PricingStructures:
@@ -21,13 +21,8 @@
 """This package contains the core information classes that support customer billing applications.
 """
 
-from CIM14.IEC61968.Customers.Customer import Customer
-from CIM14.IEC61968.Customers.CustomerAccount import CustomerAccount
-from CIM14.IEC61968.Customers.ServiceCategory import ServiceCategory
-from CIM14.IEC61968.Customers.PricingStructure import PricingStructure
-from CIM14.IEC61968.Customers.ServiceLocation import ServiceLocation
-from CIM14.IEC61968.Customers.CustomerAgreement import CustomerAgreement
-from CIM14.IEC61968.Customers.Tariff import Tariff
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Customers"
 nsPrefix = "cimCustomers"
@@ -50,3 +45,14 @@ class ServiceKind(str):
     Values are: water, time, electricity, heat, rates, gas, internet, refuse, other, tvLicence, sewerage
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Customer",
+    "CustomerAccount",
+    "ServiceCategory",
+    "PricingStructure",
+    "ServiceLocation",
+    "CustomerAgreement",
+    "Tariff",
+])
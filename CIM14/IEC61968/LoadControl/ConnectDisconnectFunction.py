@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Metering.DeviceFunction import DeviceFunction
+from CIM14.Element import RefList
 
 class ConnectDisconnectFunction(DeviceFunction):
     """A function that will disconnect or reconnect the customer's load under defined conditions.
@@ -60,8 +61,8 @@ class ConnectDisconnectFunction(DeviceFunction):
 
         self.rcdInfo = rcdInfo
 
-        self._Switches = []
-        self.Switches = [] if Switches is None else Switches
+        if Switches is not None:
+            self.Switches = Switches
 
         super(ConnectDisconnectFunction, self).__init__(*args, **kw_args)
 
@@ -71,6 +72,7 @@ class ConnectDisconnectFunction(DeviceFunction):
     _enums = {}
     _refs = ["rcdInfo", "Switches"]
     _many_refs = ["Switches"]
+    _inverses = {"Switches": "ConnectDisconnectFunctions"}
 
     # Information on remote connect disconnect switch.
     rcdInfo = None
@@ -81,20 +83,19 @@ class ConnectDisconnectFunction(DeviceFunction):
 
     def setSwitches(self, value):
         for p in self._Switches:
-            filtered = [q for q in p.ConnectDisconnectFunctions if q != self]
-            self._Switches._ConnectDisconnectFunctions = filtered
+            p._ConnectDisconnectFunctions.discard(self)
         for r in value:
             if self not in r._ConnectDisconnectFunctions:
-                r._ConnectDisconnectFunctions.append(self)
-        self._Switches = value
+                r._reflist("_ConnectDisconnectFunctions").append(self)
+        self._Switches = RefList(value)
 
     Switches = property(getSwitches, setSwitches)
 
     def addSwitches(self, *Switches):
         for obj in Switches:
             if self not in obj._ConnectDisconnectFunctions:
-                obj._ConnectDisconnectFunctions.append(self)
-            self._Switches.append(obj)
+                obj._reflist("_ConnectDisconnectFunctions").append(self)
+            self._reflist("_Switches").append(obj)
 
     def removeSwitches(self, *Switches):
         for obj in Switches:
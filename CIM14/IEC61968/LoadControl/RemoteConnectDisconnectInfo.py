@@ -84,4 +84,5 @@ class RemoteConnectDisconnectInfo(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -21,9 +21,14 @@
 """This package is an extension of the Metering package and contains the information classes that support specialized applications such as demand-side management using load control equipment. These classes are generally associated with the point where a service is delivered to the customer.
 """
 
-from CIM14.IEC61968.LoadControl.RemoteConnectDisconnectInfo import RemoteConnectDisconnectInfo
-from CIM14.IEC61968.LoadControl.ConnectDisconnectFunction import ConnectDisconnectFunction
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#LoadControl"
 nsPrefix = "cimLoadControl"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "RemoteConnectDisconnectInfo",
+    "ConnectDisconnectFunction",
+])
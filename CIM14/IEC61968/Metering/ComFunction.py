@@ -48,4 +48,5 @@ class ComFunction(DeviceFunction):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Assets.AssetFunction import AssetFunction
+from CIM14.Element import RefList
 
 class DeviceFunction(AssetFunction):
     """Function performed by a device such as a meter, communication equipment, controllers, etc.
@@ -38,11 +39,11 @@ class DeviceFunction(AssetFunction):
         self._EndDeviceAsset = None
         self.EndDeviceAsset = EndDeviceAsset
 
-        self._Registers = []
-        self.Registers = [] if Registers is None else Registers
+        if Registers is not None:
+            self.Registers = Registers
 
-        self._EndDeviceEvents = []
-        self.EndDeviceEvents = [] if EndDeviceEvents is None else EndDeviceEvents
+        if EndDeviceEvents is not None:
+            self.EndDeviceEvents = EndDeviceEvents
 
         super(DeviceFunction, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class DeviceFunction(AssetFunction):
     _enums = {}
     _refs = ["EndDeviceAsset", "Registers", "EndDeviceEvents"]
     _many_refs = ["Registers", "EndDeviceEvents"]
+    _inverses = {"EndDeviceAsset": "DeviceFunctions", "Registers": "DeviceFunction", "EndDeviceEvents": "DeviceFunction"}
 
     def getEndDeviceAsset(self):
         """End device asset that performs this function.
@@ -60,13 +62,12 @@ class DeviceFunction(AssetFunction):
 
     def setEndDeviceAsset(self, value):
         if self._EndDeviceAsset is not None:
-            filtered = [x for x in self.EndDeviceAsset.DeviceFunctions if x != self]
-            self._EndDeviceAsset._DeviceFunctions = filtered
+            self._EndDeviceAsset._DeviceFunctions.discard(self)
 
         self._EndDeviceAsset = value
         if self._EndDeviceAsset is not None:
             if self not in self._EndDeviceAsset._DeviceFunctions:
-                self._EndDeviceAsset._DeviceFunctions.append(self)
+                self._EndDeviceAsset._reflist("_DeviceFunctions").append(self)
 
     EndDeviceAsset = property(getEndDeviceAsset, setEndDeviceAsset)
 
@@ -76,7 +77,8 @@ class DeviceFunction(AssetFunction):
         return self._Registers
 
     def setRegisters(self, value):
-        for x in self._Registers:
+        value = RefList(value)
+        for x in list(self._Registers):
             x.DeviceFunction = None
         for y in value:
             y._DeviceFunction = self
@@ -98,7 +100,8 @@ class DeviceFunction(AssetFunction):
         return self._EndDeviceEvents
 
     def setEndDeviceEvents(self, value):
-        for x in self._EndDeviceEvents:
+        value = RefList(value)
+        for x in list(self._EndDeviceEvents):
             x.DeviceFunction = None
         for y in value:
             y._DeviceFunction = self
@@ -48,4 +48,5 @@ class DynamicDemand(Element):
     _enums = {"kind": "DemandKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
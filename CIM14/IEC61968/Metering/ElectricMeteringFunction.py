@@ -80,4 +80,5 @@ class ElectricMeteringFunction(DeviceFunction):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Assets.AssetContainer import AssetContainer
+from CIM14.Element import RefList
 
 class EndDeviceAsset(AssetContainer):
     """AssetContainer that performs one or more end device functions. One type of EndDeviceAsset is a MeterAsset which can perform metering, load management, connect/disconnect, accounting functions, etc. Some EndDeviceAssets, such as ones monitoring and controlling air conditioner, refrigerator, pool pumps may be connected to a MeterAsset. All EndDeviceAssets may have communication capability defined by the associated ComFunction(s). An EndDeviceAsset may be owned by a consumer, a service provider, utility or otherwise. There may be a related end device function that identifies a sensor or control point within a metering application or communications systems (e.g., water, gas, electricity). Some devices may use an optical port that conforms to the ANSI C12.18 standard for communications.
@@ -92,8 +93,8 @@ class EndDeviceAsset(AssetContainer):
         #: True if this end device asset is capable of supporting load control functions through either the meter or the AMR option. To determine whether this functionality is installed and enabled, check the 'DeviceFunction.disabled' attribute of the respective function contained by this end device asset.
         self.loadControl = loadControl
 
-        self._EndDeviceGroups = []
-        self.EndDeviceGroups = [] if EndDeviceGroups is None else EndDeviceGroups
+        if EndDeviceGroups is not None:
+            self.EndDeviceGroups = EndDeviceGroups
 
         self._ServiceLocation = None
         self.ServiceLocation = ServiceLocation
@@ -101,17 +102,17 @@ class EndDeviceAsset(AssetContainer):
         self._EndDeviceModel = None
         self.EndDeviceModel = EndDeviceModel
 
-        self._DeviceFunctions = []
-        self.DeviceFunctions = [] if DeviceFunctions is None else DeviceFunctions
+        if DeviceFunctions is not None:
+            self.DeviceFunctions = DeviceFunctions
 
         self._ServiceDeliveryPoint = None
         self.ServiceDeliveryPoint = ServiceDeliveryPoint
 
-        self._Readings = []
-        self.Readings = [] if Readings is None else Readings
+        if Readings is not None:
+            self.Readings = Readings
 
-        self._EndDeviceControls = []
-        self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
+        if EndDeviceControls is not None:
+            self.EndDeviceControls = EndDeviceControls
 
         self._Customer = None
         self.Customer = Customer
@@ -124,6 +125,7 @@ class EndDeviceAsset(AssetContainer):
     _enums = {}
     _refs = ["EndDeviceGroups", "ServiceLocation", "EndDeviceModel", "DeviceFunctions", "ServiceDeliveryPoint", "Readings", "EndDeviceControls", "Customer"]
     _many_refs = ["EndDeviceGroups", "DeviceFunctions", "Readings", "EndDeviceControls"]
+    _inverses = {"EndDeviceGroups": "EndDeviceAssets", "ServiceLocation": "EndDeviceAssets", "EndDeviceModel": "EndDeviceAssets", "DeviceFunctions": "EndDeviceAsset", "ServiceDeliveryPoint": "EndDeviceAssets", "Readings": "EndDeviceAsset", "EndDeviceControls": "EndDeviceAsset", "Customer": "EndDeviceAssets"}
 
     def getEndDeviceGroups(self):
         """All end device groups referring to this end device asset.
@@ -132,20 +134,19 @@ class EndDeviceAsset(AssetContainer):
 
     def setEndDeviceGroups(self, value):
         for p in self._EndDeviceGroups:
-            filtered = [q for q in p.EndDeviceAssets if q != self]
-            self._EndDeviceGroups._EndDeviceAssets = filtered
+            p._EndDeviceAssets.discard(self)
         for r in value:
             if self not in r._EndDeviceAssets:
-                r._EndDeviceAssets.append(self)
-        self._EndDeviceGroups = value
+                r._reflist("_EndDeviceAssets").append(self)
+        self._EndDeviceGroups = RefList(value)
 
     EndDeviceGroups = property(getEndDeviceGroups, setEndDeviceGroups)
 
     def addEndDeviceGroups(self, *EndDeviceGroups):
         for obj in EndDeviceGroups:
             if self not in obj._EndDeviceAssets:
-                obj._EndDeviceAssets.append(self)
-            self._EndDeviceGroups.append(obj)
+                obj._reflist("_EndDeviceAssets").append(self)
+            self._reflist("_EndDeviceGroups").append(obj)
 
     def removeEndDeviceGroups(self, *EndDeviceGroups):
         for obj in EndDeviceGroups:
@@ -160,13 +161,12 @@ class EndDeviceAsset(AssetContainer):
 
     def setServiceLocation(self, value):
         if self._ServiceLocation is not None:
-            filtered = [x for x in self.ServiceLocation.EndDeviceAssets if x != self]
-            self._ServiceLocation._EndDeviceAssets = filtered
+            self._ServiceLocation._EndDeviceAssets.discard(self)
 
         self._ServiceLocation = value
         if self._ServiceLocation is not None:
             if self not in self._ServiceLocation._EndDeviceAssets:
-                self._ServiceLocation._EndDeviceAssets.append(self)
+                self._ServiceLocation._reflist("_EndDeviceAssets").append(self)
 
     ServiceLocation = property(getServiceLocation, setServiceLocation)
 
@@ -177,13 +177,12 @@ class EndDeviceAsset(AssetContainer):
 
     def setEndDeviceModel(self, value):
         if self._EndDeviceModel is not None:
-            filtered = [x for x in self.EndDeviceModel.EndDeviceAssets if x != self]
-            self._EndDeviceModel._EndDeviceAssets = filtered
+            self._EndDeviceModel._EndDeviceAssets.discard(self)
 
         self._EndDeviceModel = value
         if self._EndDeviceModel is not None:
             if self not in self._EndDeviceModel._EndDeviceAssets:
-                self._EndDeviceModel._EndDeviceAssets.append(self)
+                self._EndDeviceModel._reflist("_EndDeviceAssets").append(self)
 
     EndDeviceModel = property(getEndDeviceModel, setEndDeviceModel)
 
@@ -193,7 +192,8 @@ class EndDeviceAsset(AssetContainer):
         return self._DeviceFunctions
 
     def setDeviceFunctions(self, value):
-        for x in self._DeviceFunctions:
+        value = RefList(value)
+        for x in list(self._DeviceFunctions):
             x.EndDeviceAsset = None
         for y in value:
             y._EndDeviceAsset = self
@@ -216,13 +216,12 @@ class EndDeviceAsset(AssetContainer):
 
     def setServiceDeliveryPoint(self, value):
         if self._ServiceDeliveryPoint is not None:
-            filtered = [x for x in self.ServiceDeliveryPoint.EndDeviceAssets if x != self]
-            self._ServiceDeliveryPoint._EndDeviceAssets = filtered
+            self._ServiceDeliveryPoint._EndDeviceAssets.discard(self)
 
         self._ServiceDeliveryPoint = value
         if self._ServiceDeliveryPoint is not None:
             if self not in self._ServiceDeliveryPoint._EndDeviceAssets:
-                self._ServiceDeliveryPoint._EndDeviceAssets.append(self)
+                self._ServiceDeliveryPoint._reflist("_EndDeviceAssets").append(self)
 
     ServiceDeliveryPoint = property(getServiceDeliveryPoint, setServiceDeliveryPoint)
 
@@ -231,7 +230,8 @@ class EndDeviceAsset(AssetContainer):
         return self._Readings
 
     def setReadings(self, value):
-        for x in self._Readings:
+        value = RefList(value)
+        for x in list(self._Readings):
             x.EndDeviceAsset = None
         for y in value:
             y._EndDeviceAsset = self
@@ -253,7 +253,8 @@ class EndDeviceAsset(AssetContainer):
         return self._EndDeviceControls
 
     def setEndDeviceControls(self, value):
-        for x in self._EndDeviceControls:
+        value = RefList(value)
+        for x in list(self._EndDeviceControls):
             x.EndDeviceAsset = None
         for y in value:
             y._EndDeviceAsset = self
@@ -276,13 +277,12 @@ class EndDeviceAsset(AssetContainer):
 
     def setCustomer(self, value):
         if self._Customer is not None:
-            filtered = [x for x in self.Customer.EndDeviceAssets if x != self]
-            self._Customer._EndDeviceAssets = filtered
+            self._Customer._EndDeviceAssets.discard(self)
 
         self._Customer = value
         if self._Customer is not None:
             if self not in self._Customer._EndDeviceAssets:
-                self._Customer._EndDeviceAssets.append(self)
+                self._Customer._reflist("_EndDeviceAssets").append(self)
 
     Customer = property(getCustomer, setCustomer)
 
@@ -71,6 +71,7 @@ class EndDeviceControl(IdentifiedObject):
     _enums = {}
     _refs = ["EndDeviceGroup", "DemandResponseProgram", "CustomerAgreement", "EndDeviceAsset", "scheduledInterval"]
     _many_refs = []
+    _inverses = {"EndDeviceGroup": "EndDeviceControls", "DemandResponseProgram": "EndDeviceControls", "CustomerAgreement": "EndDeviceControls", "EndDeviceAsset": "EndDeviceControls"}
 
     def getEndDeviceGroup(self):
         """End device group receiving commands from this end device control.
@@ -79,13 +80,12 @@ class EndDeviceControl(IdentifiedObject):
 
     def setEndDeviceGroup(self, value):
         if self._EndDeviceGroup is not None:
-            filtered = [x for x in self.EndDeviceGroup.EndDeviceControls if x != self]
-            self._EndDeviceGroup._EndDeviceControls = filtered
+            self._EndDeviceGroup._EndDeviceControls.discard(self)
 
         self._EndDeviceGroup = value
         if self._EndDeviceGroup is not None:
             if self not in self._EndDeviceGroup._EndDeviceControls:
-                self._EndDeviceGroup._EndDeviceControls.append(self)
+                self._EndDeviceGroup._reflist("_EndDeviceControls").append(self)
 
     EndDeviceGroup = property(getEndDeviceGroup, setEndDeviceGroup)
 
@@ -96,13 +96,12 @@ class EndDeviceControl(IdentifiedObject):
 
     def setDemandResponseProgram(self, value):
         if self._DemandResponseProgram is not None:
-            filtered = [x for x in self.DemandResponseProgram.EndDeviceControls if x != self]
-            self._DemandResponseProgram._EndDeviceControls = filtered
+            self._DemandResponseProgram._EndDeviceControls.discard(self)
 
         self._DemandResponseProgram = value
         if self._DemandResponseProgram is not None:
             if self not in self._DemandResponseProgram._EndDeviceControls:
-                self._DemandResponseProgram._EndDeviceControls.append(self)
+                self._DemandResponseProgram._reflist("_EndDeviceControls").append(self)
 
     DemandResponseProgram = property(getDemandResponseProgram, setDemandResponseProgram)
 
@@ -113,13 +112,12 @@ class EndDeviceControl(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.EndDeviceControls if x != self]
-            self._CustomerAgreement._EndDeviceControls = filtered
+            self._CustomerAgreement._EndDeviceControls.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
             if self not in self._CustomerAgreement._EndDeviceControls:
-                self._CustomerAgreement._EndDeviceControls.append(self)
+                self._CustomerAgreement._reflist("_EndDeviceControls").append(self)
 
     CustomerAgreement = property(getCustomerAgreement, setCustomerAgreement)
 
@@ -130,13 +128,12 @@ class EndDeviceControl(IdentifiedObject):
 
     def setEndDeviceAsset(self, value):
         if self._EndDeviceAsset is not None:
-            filtered = [x for x in self.EndDeviceAsset.EndDeviceControls if x != self]
-            self._EndDeviceAsset._EndDeviceControls = filtered
+            self._EndDeviceAsset._EndDeviceControls.discard(self)
 
         self._EndDeviceAsset = value
         if self._EndDeviceAsset is not None:
             if self not in self._EndDeviceAsset._EndDeviceControls:
-                self._EndDeviceAsset._EndDeviceControls.append(self)
+                self._EndDeviceAsset._reflist("_EndDeviceControls").append(self)
 
     EndDeviceAsset = property(getEndDeviceAsset, setEndDeviceAsset)
 
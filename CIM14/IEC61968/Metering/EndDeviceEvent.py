@@ -48,6 +48,7 @@ class EndDeviceEvent(ActivityRecord):
     _enums = {}
     _refs = ["MeterReading", "DeviceFunction"]
     _many_refs = []
+    _inverses = {"MeterReading": "EndDeviceEvents", "DeviceFunction": "EndDeviceEvents"}
 
     def getMeterReading(self):
         """Set of measured values to which this event applies.
@@ -56,13 +57,12 @@ class EndDeviceEvent(ActivityRecord):
 
     def setMeterReading(self, value):
         if self._MeterReading is not None:
-            filtered = [x for x in self.MeterReading.EndDeviceEvents if x != self]
-            self._MeterReading._EndDeviceEvents = filtered
+            self._MeterReading._EndDeviceEvents.discard(self)
 
         self._MeterReading = value
         if self._MeterReading is not None:
             if self not in self._MeterReading._EndDeviceEvents:
-                self._MeterReading._EndDeviceEvents.append(self)
+                self._MeterReading._reflist("_EndDeviceEvents").append(self)
 
     MeterReading = property(getMeterReading, setMeterReading)
 
@@ -73,13 +73,12 @@ class EndDeviceEvent(ActivityRecord):
 
     def setDeviceFunction(self, value):
         if self._DeviceFunction is not None:
-            filtered = [x for x in self.DeviceFunction.EndDeviceEvents if x != self]
-            self._DeviceFunction._EndDeviceEvents = filtered
+            self._DeviceFunction._EndDeviceEvents.discard(self)
 
         self._DeviceFunction = value
         if self._DeviceFunction is not None:
             if self not in self._DeviceFunction._EndDeviceEvents:
-                self._DeviceFunction._EndDeviceEvents.append(self)
+                self._DeviceFunction._reflist("_EndDeviceEvents").append(self)
 
     DeviceFunction = property(getDeviceFunction, setDeviceFunction)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class EndDeviceGroup(IdentifiedObject):
     """Abstraction for management of group communications within a two-way AMR system or the data for a group of related meters. Commands can be issued to all of the meters that belong to a meter group using a defined group address and the underlying AMR communication infrastructure.
@@ -35,11 +36,11 @@ class EndDeviceGroup(IdentifiedObject):
         #: Address of this end device group.
         self.groupAddress = groupAddress
 
-        self._EndDeviceAssets = []
-        self.EndDeviceAssets = [] if EndDeviceAssets is None else EndDeviceAssets
+        if EndDeviceAssets is not None:
+            self.EndDeviceAssets = EndDeviceAssets
 
-        self._EndDeviceControls = []
-        self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
+        if EndDeviceControls is not None:
+            self.EndDeviceControls = EndDeviceControls
 
         self._DemandResponseProgram = None
         self.DemandResponseProgram = DemandResponseProgram
@@ -52,6 +53,7 @@ class EndDeviceGroup(IdentifiedObject):
     _enums = {}
     _refs = ["EndDeviceAssets", "EndDeviceControls", "DemandResponseProgram"]
     _many_refs = ["EndDeviceAssets", "EndDeviceControls"]
+    _inverses = {"EndDeviceAssets": "EndDeviceGroups", "EndDeviceControls": "EndDeviceGroup", "DemandResponseProgram": "EndDeviceGroups"}
 
     def getEndDeviceAssets(self):
         """All end device assets this end device group refers to.
@@ -60,20 +62,19 @@ class EndDeviceGroup(IdentifiedObject):
 
     def setEndDeviceAssets(self, value):
         for p in self._EndDeviceAssets:
-            filtered = [q for q in p.EndDeviceGroups if q != self]
-            self._EndDeviceAssets._EndDeviceGroups = filtered
+            p._EndDeviceGroups.discard(self)
         for r in value:
             if self not in r._EndDeviceGroups:
-                r._EndDeviceGroups.append(self)
-        self._EndDeviceAssets = value
+                r._reflist("_EndDeviceGroups").append(self)
+        self._EndDeviceAssets = RefList(value)
 
     EndDeviceAssets = property(getEndDeviceAssets, setEndDeviceAssets)
 
     def addEndDeviceAssets(self, *EndDeviceAssets):
         for obj in EndDeviceAssets:
             if self not in obj._EndDeviceGroups:
-                obj._EndDeviceGroups.append(self)
-            self._EndDeviceAssets.append(obj)
+                obj._reflist("_EndDeviceGroups").append(self)
+            self._reflist("_EndDeviceAssets").append(obj)
 
     def removeEndDeviceAssets(self, *EndDeviceAssets):
         for obj in EndDeviceAssets:
@@ -87,7 +88,8 @@ class EndDeviceGroup(IdentifiedObject):
         return self._EndDeviceControls
 
     def setEndDeviceControls(self, value):
-        for x in self._EndDeviceControls:
+        value = RefList(value)
+        for x in list(self._EndDeviceControls):
             x.EndDeviceGroup = None
         for y in value:
             y._EndDeviceGroup = self
@@ -110,13 +112,12 @@ class EndDeviceGroup(IdentifiedObject):
 
     def setDemandResponseProgram(self, value):
         if self._DemandResponseProgram is not None:
-            filtered = [x for x in self.DemandResponseProgram.EndDeviceGroups if x != self]
-            self._DemandResponseProgram._EndDeviceGroups = filtered
+            self._DemandResponseProgram._EndDeviceGroups.discard(self)
 
         self._DemandResponseProgram = value
         if self._DemandResponseProgram is not None:
             if self not in self._DemandResponseProgram._EndDeviceGroups:
-                self._DemandResponseProgram._EndDeviceGroups.append(self)
+                self._DemandResponseProgram._reflist("_EndDeviceGroups").append(self)
 
     DemandResponseProgram = property(getDemandResponseProgram, setDemandResponseProgram)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Metering.EndDeviceAsset import EndDeviceAsset
+from CIM14.Element import RefList
 
 class MeterAsset(EndDeviceAsset):
     """Physical asset that performs the metering role of the ServiceDeliveryPoint. Used for measuring consumption and detection of events.
@@ -44,17 +45,17 @@ class MeterAsset(EndDeviceAsset):
         #: Meter form designation per ANSI C12.10 or other applicable standard. An alphanumeric designation denoting the circuit arrangement for which the meter is applicable and its specific terminal arrangement.
         self.formNumber = formNumber
 
-        self._MeterReplacementWorks = []
-        self.MeterReplacementWorks = [] if MeterReplacementWorks is None else MeterReplacementWorks
+        if MeterReplacementWorks is not None:
+            self.MeterReplacementWorks = MeterReplacementWorks
 
-        self._MeterServiceWorks = []
-        self.MeterServiceWorks = [] if MeterServiceWorks is None else MeterServiceWorks
+        if MeterServiceWorks is not None:
+            self.MeterServiceWorks = MeterServiceWorks
 
-        self._MeterReadings = []
-        self.MeterReadings = [] if MeterReadings is None else MeterReadings
+        if MeterReadings is not None:
+            self.MeterReadings = MeterReadings
 
-        self._VendingTransactions = []
-        self.VendingTransactions = [] if VendingTransactions is None else VendingTransactions
+        if VendingTransactions is not None:
+            self.VendingTransactions = VendingTransactions
 
         super(MeterAsset, self).__init__(*args, **kw_args)
 
@@ -64,6 +65,7 @@ class MeterAsset(EndDeviceAsset):
     _enums = {}
     _refs = ["MeterReplacementWorks", "MeterServiceWorks", "MeterReadings", "VendingTransactions"]
     _many_refs = ["MeterReplacementWorks", "MeterServiceWorks", "MeterReadings", "VendingTransactions"]
+    _inverses = {"MeterReplacementWorks": "OldMeterAsset", "MeterServiceWorks": "MeterAsset", "MeterReadings": "MeterAsset", "VendingTransactions": "MeterAsset"}
 
     def getMeterReplacementWorks(self):
         """All works on replacement of this old meter asset.
@@ -71,7 +73,8 @@ class MeterAsset(EndDeviceAsset):
         return self._MeterReplacementWorks
 
     def setMeterReplacementWorks(self, value):
-        for x in self._MeterReplacementWorks:
+        value = RefList(value)
+        for x in list(self._MeterReplacementWorks):
             x.OldMeterAsset = None
         for y in value:
             y._OldMeterAsset = self
@@ -93,7 +96,8 @@ class MeterAsset(EndDeviceAsset):
         return self._MeterServiceWorks
 
     def setMeterServiceWorks(self, value):
-        for x in self._MeterServiceWorks:
+        value = RefList(value)
+        for x in list(self._MeterServiceWorks):
             x.MeterAsset = None
         for y in value:
             y._MeterAsset = self
@@ -115,7 +119,8 @@ class MeterAsset(EndDeviceAsset):
         return self._MeterReadings
 
     def setMeterReadings(self, value):
-        for x in self._MeterReadings:
+        value = RefList(value)
+        for x in list(self._MeterReadings):
             x.MeterAsset = None
         for y in value:
             y._MeterAsset = self
@@ -137,7 +142,8 @@ class MeterAsset(EndDeviceAsset):
         return self._VendingTransactions
 
     def setVendingTransactions(self, value):
-        for x in self._VendingTransactions:
+        value = RefList(value)
+        for x in list(self._VendingTransactions):
             x.MeterAsset = None
         for y in value:
             y._MeterAsset = self
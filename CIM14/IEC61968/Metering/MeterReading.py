@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class MeterReading(IdentifiedObject):
     """Set of values obtained from the meter.
@@ -35,8 +36,8 @@ class MeterReading(IdentifiedObject):
         @param ServiceDeliveryPoint: Service delivery point from which this meter reading (set of values) has been obtained.
         @param valuesInterval: Date and time interval of the data items contained within this meter reading.
         """
-        self._IntervalBlocks = []
-        self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
+        if IntervalBlocks is not None:
+            self.IntervalBlocks = IntervalBlocks
 
         self._CustomerAgreement = None
         self.CustomerAgreement = CustomerAgreement
@@ -44,11 +45,11 @@ class MeterReading(IdentifiedObject):
         self._MeterAsset = None
         self.MeterAsset = MeterAsset
 
-        self._EndDeviceEvents = []
-        self.EndDeviceEvents = [] if EndDeviceEvents is None else EndDeviceEvents
+        if EndDeviceEvents is not None:
+            self.EndDeviceEvents = EndDeviceEvents
 
-        self._Readings = []
-        self.Readings = [] if Readings is None else Readings
+        if Readings is not None:
+            self.Readings = Readings
 
         self._ServiceDeliveryPoint = None
         self.ServiceDeliveryPoint = ServiceDeliveryPoint
@@ -63,6 +64,7 @@ class MeterReading(IdentifiedObject):
     _enums = {}
     _refs = ["IntervalBlocks", "CustomerAgreement", "MeterAsset", "EndDeviceEvents", "Readings", "ServiceDeliveryPoint", "valuesInterval"]
     _many_refs = ["IntervalBlocks", "EndDeviceEvents", "Readings"]
+    _inverses = {"IntervalBlocks": "MeterReading", "CustomerAgreement": "MeterReadings", "MeterAsset": "MeterReadings", "EndDeviceEvents": "MeterReading", "Readings": "MeterReadings", "ServiceDeliveryPoint": "MeterReadings"}
 
     def getIntervalBlocks(self):
         """All interval blocks contained in this meter reading.
@@ -70,7 +72,8 @@ class MeterReading(IdentifiedObject):
         return self._IntervalBlocks
 
     def setIntervalBlocks(self, value):
-        for x in self._IntervalBlocks:
+        value = RefList(value)
+        for x in list(self._IntervalBlocks):
             x.MeterReading = None
         for y in value:
             y._MeterReading = self
@@ -93,13 +96,12 @@ class MeterReading(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.MeterReadings if x != self]
-            self._CustomerAgreement._MeterReadings = filtered
+            self._CustomerAgreement._MeterReadings.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
             if self not in self._CustomerAgreement._MeterReadings:
-                self._CustomerAgreement._MeterReadings.append(self)
+                self._CustomerAgreement._reflist("_MeterReadings").append(self)
 
     CustomerAgreement = property(getCustomerAgreement, setCustomerAgreement)
 
@@ -110,13 +112,12 @@ class MeterReading(IdentifiedObject):
 
     def setMeterAsset(self, value):
         if self._MeterAsset is not None:
-            filtered = [x for x in self.MeterAsset.MeterReadings if x != self]
-            self._MeterAsset._MeterReadings = filtered
+            self._MeterAsset._MeterReadings.discard(self)
 
         self._MeterAsset = value
         if self._MeterAsset is not None:
             if self not in self._MeterAsset._MeterReadings:
-                self._MeterAsset._MeterReadings.append(self)
+                self._MeterAsset._reflist("_MeterReadings").append(self)
 
     MeterAsset = property(getMeterAsset, setMeterAsset)
 
@@ -126,7 +127,8 @@ class MeterReading(IdentifiedObject):
         return self._EndDeviceEvents
 
     def setEndDeviceEvents(self, value):
-        for x in self._EndDeviceEvents:
+        value = RefList(value)
+        for x in list(self._EndDeviceEvents):
             x.MeterReading = None
         for y in value:
             y._MeterReading = self
@@ -149,20 +151,19 @@ class MeterReading(IdentifiedObject):
 
     def setReadings(self, value):
         for p in self._Readings:
-            filtered = [q for q in p.MeterReadings if q != self]
-            self._Readings._MeterReadings = filtered
+            p._MeterReadings.discard(self)
         for r in value:
             if self not in r._MeterReadings:
-                r._MeterReadings.append(self)
-        self._Readings = value
+                r._reflist("_MeterReadings").append(self)
+        self._Readings = RefList(value)
 
     Readings = property(getReadings, setReadings)
 
     def addReadings(self, *Readings):
         for obj in Readings:
             if self not in obj._MeterReadings:
-                obj._MeterReadings.append(self)
-            self._Readings.append(obj)
+                obj._reflist("_MeterReadings").append(self)
+            self._reflist("_Readings").append(obj)
 
     def removeReadings(self, *Readings):
         for obj in Readings:
@@ -177,13 +178,12 @@ class MeterReading(IdentifiedObject):
 
     def setServiceDeliveryPoint(self, value):
         if self._ServiceDeliveryPoint is not None:
-            filtered = [x for x in self.ServiceDeliveryPoint.MeterReadings if x != self]
-            self._ServiceDeliveryPoint._MeterReadings = filtered
+            self._ServiceDeliveryPoint._MeterReadings.discard(self)
 
         self._ServiceDeliveryPoint = value
         if self._ServiceDeliveryPoint is not None:
             if self not in self._ServiceDeliveryPoint._MeterReadings:
-                self._ServiceDeliveryPoint._MeterReadings.append(self)
+                self._ServiceDeliveryPoint._reflist("_MeterReadings").append(self)
 
     ServiceDeliveryPoint = property(getServiceDeliveryPoint, setServiceDeliveryPoint)
 
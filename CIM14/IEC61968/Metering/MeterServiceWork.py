@@ -44,6 +44,7 @@ class MeterServiceWork(Work):
     _enums = {}
     _refs = ["OldMeterAsset", "MeterAsset"]
     _many_refs = []
+    _inverses = {"OldMeterAsset": "MeterReplacementWorks", "MeterAsset": "MeterServiceWorks"}
 
     def getOldMeterAsset(self):
         """Old meter asset replaced by this work.
@@ -52,13 +53,12 @@ class MeterServiceWork(Work):
 
     def setOldMeterAsset(self, value):
         if self._OldMeterAsset is not None:
-            filtered = [x for x in self.OldMeterAsset.MeterReplacementWorks if x != self]
-            self._OldMeterAsset._MeterReplacementWorks = filtered
+            self._OldMeterAsset._MeterReplacementWorks.discard(self)
 
         self._OldMeterAsset = value
         if self._OldMeterAsset is not None:
             if self not in self._OldMeterAsset._MeterReplacementWorks:
-                self._OldMeterAsset._MeterReplacementWorks.append(self)
+                self._OldMeterAsset._reflist("_MeterReplacementWorks").append(self)
 
     OldMeterAsset = property(getOldMeterAsset, setOldMeterAsset)
 
@@ -69,13 +69,12 @@ class MeterServiceWork(Work):
 
     def setMeterAsset(self, value):
         if self._MeterAsset is not None:
-            filtered = [x for x in self.MeterAsset.MeterServiceWorks if x != self]
-            self._MeterAsset._MeterServiceWorks = filtered
+            self._MeterAsset._MeterServiceWorks.discard(self)
 
         self._MeterAsset = value
         if self._MeterAsset is not None:
             if self not in self._MeterAsset._MeterServiceWorks:
-                self._MeterAsset._MeterServiceWorks.append(self)
+                self._MeterAsset._reflist("_MeterServiceWorks").append(self)
 
     MeterAsset = property(getMeterAsset, setMeterAsset)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Meas.MeasurementValue import MeasurementValue
+from CIM14.Element import RefList
 
 class Reading(MeasurementValue):
     """Specific value measured by a meter or other asset. Each Reading is associated with a specific ReadingType.
@@ -39,14 +40,14 @@ class Reading(MeasurementValue):
         self._ReadingType = None
         self.ReadingType = ReadingType
 
-        self._ReadingQualities = []
-        self.ReadingQualities = [] if ReadingQualities is None else ReadingQualities
+        if ReadingQualities is not None:
+            self.ReadingQualities = ReadingQualities
 
         self._EndDeviceAsset = None
         self.EndDeviceAsset = EndDeviceAsset
 
-        self._MeterReadings = []
-        self.MeterReadings = [] if MeterReadings is None else MeterReadings
+        if MeterReadings is not None:
+            self.MeterReadings = MeterReadings
 
         super(Reading, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class Reading(MeasurementValue):
     _enums = {}
     _refs = ["ReadingType", "ReadingQualities", "EndDeviceAsset", "MeterReadings"]
     _many_refs = ["ReadingQualities", "MeterReadings"]
+    _inverses = {"ReadingType": "Readings", "ReadingQualities": "Reading", "EndDeviceAsset": "Readings", "MeterReadings": "Readings"}
 
     def getReadingType(self):
         """Type information for this reading value.
@@ -64,13 +66,12 @@ class Reading(MeasurementValue):
 
     def setReadingType(self, value):
         if self._ReadingType is not None:
-            filtered = [x for x in self.ReadingType.Readings if x != self]
-            self._ReadingType._Readings = filtered
+            self._ReadingType._Readings.discard(self)
 
         self._ReadingType = value
         if self._ReadingType is not None:
             if self not in self._ReadingType._Readings:
-                self._ReadingType._Readings.append(self)
+                self._ReadingType._reflist("_Readings").append(self)
 
     ReadingType = property(getReadingType, setReadingType)
 
@@ -80,7 +81,8 @@ class Reading(MeasurementValue):
         return self._ReadingQualities
 
     def setReadingQualities(self, value):
-        for x in self._ReadingQualities:
+        value = RefList(value)
+        for x in list(self._ReadingQualities):
             x.Reading = None
         for y in value:
             y._Reading = self
@@ -102,13 +104,12 @@ class Reading(MeasurementValue):
 
     def setEndDeviceAsset(self, value):
         if self._EndDeviceAsset is not None:
-            filtered = [x for x in self.EndDeviceAsset.Readings if x != self]
-            self._EndDeviceAsset._Readings = filtered
+            self._EndDeviceAsset._Readings.discard(self)
 
         self._EndDeviceAsset = value
         if self._EndDeviceAsset is not None:
             if self not in self._EndDeviceAsset._Readings:
-                self._EndDeviceAsset._Readings.append(self)
+                self._EndDeviceAsset._reflist("_Readings").append(self)
 
     EndDeviceAsset = property(getEndDeviceAsset, setEndDeviceAsset)
 
@@ -119,20 +120,19 @@ class Reading(MeasurementValue):
 
     def setMeterReadings(self, value):
         for p in self._MeterReadings:
-            filtered = [q for q in p.Readings if q != self]
-            self._MeterReadings._Readings = filtered
+            p._Readings.discard(self)
         for r in value:
             if self not in r._Readings:
-                r._Readings.append(self)
-        self._MeterReadings = value
+                r._reflist("_Readings").append(self)
+        self._MeterReadings = RefList(value)
 
     MeterReadings = property(getMeterReadings, setMeterReadings)
 
     def addMeterReadings(self, *MeterReadings):
         for obj in MeterReadings:
             if self not in obj._Readings:
-                obj._Readings.append(self)
-            self._MeterReadings.append(obj)
+                obj._reflist("_Readings").append(self)
+            self._reflist("_MeterReadings").append(obj)
 
     def removeMeterReadings(self, *MeterReadings):
         for obj in MeterReadings:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class ReadingType(IdentifiedObject):
     """Type of data conveyed by a specific Reading.
@@ -65,13 +66,13 @@ class ReadingType(IdentifiedObject):
         #: (if incremental reading value) Length of increment interval.
         self.intervalLength = intervalLength
 
-        self._Readings = []
-        self.Readings = [] if Readings is None else Readings
+        if Readings is not None:
+            self.Readings = Readings
 
         self.dynamicConfiguration = dynamicConfiguration
 
-        self._IntervalBlocks = []
-        self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
+        if IntervalBlocks is not None:
+            self.IntervalBlocks = IntervalBlocks
 
         self._Pending = None
         self.Pending = Pending
@@ -87,6 +88,7 @@ class ReadingType(IdentifiedObject):
     _enums = {"multiplier": "UnitMultiplier", "kind": "ReadingKind", "unit": "UnitSymbol"}
     _refs = ["Readings", "dynamicConfiguration", "IntervalBlocks", "Pending", "Register"]
     _many_refs = ["Readings", "IntervalBlocks"]
+    _inverses = {"Readings": "ReadingType", "IntervalBlocks": "ReadingType", "Pending": "ReadingType", "Register": "ReadingType"}
 
     def getReadings(self):
         """All reading values with this type information.
@@ -94,7 +96,8 @@ class ReadingType(IdentifiedObject):
         return self._Readings
 
     def setReadings(self, value):
-        for x in self._Readings:
+        value = RefList(value)
+        for x in list(self._Readings):
             x.ReadingType = None
         for y in value:
             y._ReadingType = self
@@ -119,7 +122,8 @@ class ReadingType(IdentifiedObject):
         return self._IntervalBlocks
 
     def setIntervalBlocks(self, value):
-        for x in self._IntervalBlocks:
+        value = RefList(value)
+        for x in list(self._IntervalBlocks):
             x.ReadingType = None
         for y in value:
             y._ReadingType = self
@@ -52,6 +52,7 @@ class Register(IdentifiedObject):
     _enums = {}
     _refs = ["ReadingType", "DeviceFunction"]
     _many_refs = []
+    _inverses = {"ReadingType": "Register", "DeviceFunction": "Registers"}
 
     def getReadingType(self):
         """Reading type for values displayed by this register.
@@ -76,13 +77,12 @@ class Register(IdentifiedObject):
 
     def setDeviceFunction(self, value):
         if self._DeviceFunction is not None:
-            filtered = [x for x in self.DeviceFunction.Registers if x != self]
-            self._DeviceFunction._Registers = filtered
+            self._DeviceFunction._Registers.discard(self)
 
         self._DeviceFunction = value
         if self._DeviceFunction is not None:
             if self not in self._DeviceFunction._Registers:
-                self._DeviceFunction._Registers.append(self)
+                self._DeviceFunction._reflist("_Registers").append(self)
 
     DeviceFunction = property(getDeviceFunction, setDeviceFunction)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Location import Location
+from CIM14.Element import RefList
 
 class SDPLocation(Location):
     """Location of an individual service delivery point. For residential or most businesses, it is typically the location of a meter on the customer's premises. For transmission, it is the point(s) of interconnection on the transmission provider's transmission system where capacity and/or energy transmitted by the transmission provider is made available to the receiving party. The point(s) of delivery is specified in the Service Agreement.
@@ -45,8 +46,8 @@ class SDPLocation(Location):
         #: Method for the service person to access this service delivery point location. For example, a description of where to obtain a key if the facility is unmanned and secured.
         self.accessMethod = accessMethod
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         super(SDPLocation, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class SDPLocation(Location):
     _enums = {}
     _refs = ["ServiceDeliveryPoints"]
     _many_refs = ["ServiceDeliveryPoints"]
+    _inverses = {"ServiceDeliveryPoints": "SDPLocations"}
 
     def getServiceDeliveryPoints(self):
         """All service delivery points at this location.
@@ -64,20 +66,19 @@ class SDPLocation(Location):
 
     def setServiceDeliveryPoints(self, value):
         for p in self._ServiceDeliveryPoints:
-            filtered = [q for q in p.SDPLocations if q != self]
-            self._ServiceDeliveryPoints._SDPLocations = filtered
+            p._SDPLocations.discard(self)
         for r in value:
             if self not in r._SDPLocations:
-                r._SDPLocations.append(self)
-        self._ServiceDeliveryPoints = value
+                r._reflist("_SDPLocations").append(self)
+        self._ServiceDeliveryPoints = RefList(value)
 
     ServiceDeliveryPoints = property(getServiceDeliveryPoints, setServiceDeliveryPoints)
 
     def addServiceDeliveryPoints(self, *ServiceDeliveryPoints):
         for obj in ServiceDeliveryPoints:
             if self not in obj._SDPLocations:
-                obj._SDPLocations.append(self)
-            self._ServiceDeliveryPoints.append(obj)
+                obj._reflist("_SDPLocations").append(self)
+            self._reflist("_ServiceDeliveryPoints").append(obj)
 
     def removeServiceDeliveryPoints(self, *ServiceDeliveryPoints):
         for obj in ServiceDeliveryPoints:
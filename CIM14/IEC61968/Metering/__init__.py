@@ -21,27 +21,8 @@
 """This package contains the core information classes that support end device applications with specialized classes for metering equipment and remote reading functions. These classes are generally associated with the point where a service is delivered to the customer.
 """
 
-from CIM14.IEC61968.Metering.DeviceFunction import DeviceFunction
-from CIM14.IEC61968.Metering.ComFunction import ComFunction
-from CIM14.IEC61968.Metering.Register import Register
-from CIM14.IEC61968.Metering.EndDeviceControl import EndDeviceControl
-from CIM14.IEC61968.Metering.Reading import Reading
-from CIM14.IEC61968.Metering.EndDeviceAsset import EndDeviceAsset
-from CIM14.IEC61968.Metering.MeterAsset import MeterAsset
-from CIM14.IEC61968.Metering.ElectricMeteringFunction import ElectricMeteringFunction
-from CIM14.IEC61968.Metering.EndDeviceGroup import EndDeviceGroup
-from CIM14.IEC61968.Metering.Pending import Pending
-from CIM14.IEC61968.Metering.IntervalReading import IntervalReading
-from CIM14.IEC61968.Metering.MeterReading import MeterReading
-from CIM14.IEC61968.Metering.DemandResponseProgram import DemandResponseProgram
-from CIM14.IEC61968.Metering.EndDeviceEvent import EndDeviceEvent
-from CIM14.IEC61968.Metering.DynamicDemand import DynamicDemand
-from CIM14.IEC61968.Metering.MeterServiceWork import MeterServiceWork
-from CIM14.IEC61968.Metering.ServiceDeliveryPoint import ServiceDeliveryPoint
-from CIM14.IEC61968.Metering.ReadingType import ReadingType
-from CIM14.IEC61968.Metering.SDPLocation import SDPLocation
-from CIM14.IEC61968.Metering.ReadingQuality import ReadingQuality
-from CIM14.IEC61968.Metering.IntervalBlock import IntervalBlock
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Metering"
 nsPrefix = "cimMetering"
@@ -58,3 +39,28 @@ class DemandKind(str):
     Values are: logarithmic, fixedBlock, rollingBlock
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "DeviceFunction",
+    "ComFunction",
+    "Register",
+    "EndDeviceControl",
+    "Reading",
+    "EndDeviceAsset",
+    "MeterAsset",
+    "ElectricMeteringFunction",
+    "EndDeviceGroup",
+    "Pending",
+    "IntervalReading",
+    "MeterReading",
+    "DemandResponseProgram",
+    "EndDeviceEvent",
+    "DynamicDemand",
+    "MeterServiceWork",
+    "ServiceDeliveryPoint",
+    "ReadingType",
+    "SDPLocation",
+    "ReadingQuality",
+    "IntervalBlock",
+])
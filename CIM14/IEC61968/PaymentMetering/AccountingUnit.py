@@ -52,4 +52,5 @@ class AccountingUnit(Element):
     _enums = {"multiplier": "UnitMultiplier", "monetaryUnit": "Currency"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
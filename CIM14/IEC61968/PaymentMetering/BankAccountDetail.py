@@ -56,4 +56,5 @@ class BankAccountDetail(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
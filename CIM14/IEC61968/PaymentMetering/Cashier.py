@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class Cashier(IdentifiedObject):
     """The operator of the point of sale for the duration of CashierShift. Cashier is under the exclusive management control of Vendor.
@@ -31,8 +32,8 @@ class Cashier(IdentifiedObject):
         @param electronicAddress: Electronic address.
         @param Vendor: Vendor that manages this Cachier.
         """
-        self._CashierShifts = []
-        self.CashierShifts = [] if CashierShifts is None else CashierShifts
+        if CashierShifts is not None:
+            self.CashierShifts = CashierShifts
 
         self.electronicAddress = electronicAddress
 
@@ -47,6 +48,7 @@ class Cashier(IdentifiedObject):
     _enums = {}
     _refs = ["CashierShifts", "electronicAddress", "Vendor"]
     _many_refs = ["CashierShifts"]
+    _inverses = {"CashierShifts": "Cashier", "Vendor": "Cashiers"}
 
     def getCashierShifts(self):
         """All shifts operated by this cashier.
@@ -54,7 +56,8 @@ class Cashier(IdentifiedObject):
         return self._CashierShifts
 
     def setCashierShifts(self, value):
-        for x in self._CashierShifts:
+        value = RefList(value)
+        for x in list(self._CashierShifts):
             x.Cashier = None
         for y in value:
             y._Cashier = self
@@ -80,13 +83,12 @@ class Cashier(IdentifiedObject):
 
     def setVendor(self, value):
         if self._Vendor is not None:
-            filtered = [x for x in self.Vendor.Cashiers if x != self]
-            self._Vendor._Cashiers = filtered
+            self._Vendor._Cashiers.discard(self)
 
         self._Vendor = value
         if self._Vendor is not None:
             if self not in self._Vendor._Cashiers:
-                self._Vendor._Cashiers.append(self)
+                self._Vendor._reflist("_Cashiers").append(self)
 
     Vendor = property(getVendor, setVendor)
 
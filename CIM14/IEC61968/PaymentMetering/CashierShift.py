@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.PaymentMetering.Shift import Shift
+from CIM14.Element import RefList
 
 class CashierShift(Shift):
     """The operating shift for a cashier, during which he may transact against the CashierShift, subject to VendorShift being open.
@@ -36,11 +37,11 @@ class CashierShift(Shift):
         #: The amount of cash that the cashier brings with him to start his shift and that he will take away at the end of his shift; i.e. the cash float does not get banked.
         self.cashFloat = cashFloat
 
-        self._Receipts = []
-        self.Receipts = [] if Receipts is None else Receipts
+        if Receipts is not None:
+            self.Receipts = Receipts
 
-        self._Transactions = []
-        self.Transactions = [] if Transactions is None else Transactions
+        if Transactions is not None:
+            self.Transactions = Transactions
 
         self._Cashier = None
         self.Cashier = Cashier
@@ -56,6 +57,7 @@ class CashierShift(Shift):
     _enums = {}
     _refs = ["Receipts", "Transactions", "Cashier", "PointOfSale"]
     _many_refs = ["Receipts", "Transactions"]
+    _inverses = {"Receipts": "CashierShift", "Transactions": "CashierShift", "Cashier": "CashierShifts", "PointOfSale": "CashierShifts"}
 
     def getReceipts(self):
         """All Receipts recorded for this Shift.
@@ -63,7 +65,8 @@ class CashierShift(Shift):
         return self._Receipts
 
     def setReceipts(self, value):
-        for x in self._Receipts:
+        value = RefList(value)
+        for x in list(self._Receipts):
             x.CashierShift = None
         for y in value:
             y._CashierShift = self
@@ -84,7 +87,8 @@ class CashierShift(Shift):
         return self._Transactions
 
     def setTransactions(self, value):
-        for x in self._Transactions:
+        value = RefList(value)
+        for x in list(self._Transactions):
             x.CashierShift = None
         for y in value:
             y._CashierShift = self
@@ -107,13 +111,12 @@ class CashierShift(Shift):
 
     def setCashier(self, value):
         if self._Cashier is not None:
-            filtered = [x for x in self.Cashier.CashierShifts if x != self]
-            self._Cashier._CashierShifts = filtered
+            self._Cashier._CashierShifts.discard(self)
 
         self._Cashier = value
         if self._Cashier is not None:
             if self not in self._Cashier._CashierShifts:
-                self._Cashier._CashierShifts.append(self)
+                self._Cashier._reflist("_CashierShifts").append(self)
 
     Cashier = property(getCashier, setCashier)
 
@@ -124,13 +127,12 @@ class CashierShift(Shift):
 
     def setPointOfSale(self, value):
         if self._PointOfSale is not None:
-            filtered = [x for x in self.PointOfSale.CashierShifts if x != self]
-            self._PointOfSale._CashierShifts = filtered
+            self._PointOfSale._CashierShifts.discard(self)
 
         self._PointOfSale = value
         if self._PointOfSale is not None:
             if self not in self._PointOfSale._CashierShifts:
-                self._PointOfSale._CashierShifts.append(self)
+                self._PointOfSale._reflist("_CashierShifts").append(self)
 
     PointOfSale = property(getPointOfSale, setPointOfSale)
 
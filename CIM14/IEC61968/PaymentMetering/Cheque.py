@@ -59,6 +59,7 @@ class Cheque(Element):
     _enums = {"kind": "ChequeKind"}
     _refs = ["Tender", "bankAccountDetail"]
     _many_refs = []
+    _inverses = {"Tender": "Cheque"}
 
     def getTender(self):
         """Payment tender the cheque is being used for.
@@ -56,4 +56,5 @@ class Due(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -52,4 +52,5 @@ class LineDetail(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from CIM14.Element import RefList
 
 class MerchantAccount(Document):
     """The operating account controlled by MerchantAgreement, against which Vendor may vend tokens or receipt payments. Transactions via VendorShift debit the account and bank deposits via BankStatement credit the account.
@@ -40,17 +41,17 @@ class MerchantAccount(Document):
         #: The current operating balance of this account.
         self.currentBalance = currentBalance
 
-        self._VendorShifts = []
-        self.VendorShifts = [] if VendorShifts is None else VendorShifts
+        if VendorShifts is not None:
+            self.VendorShifts = VendorShifts
 
         self._MerchantAgreement = None
         self.MerchantAgreement = MerchantAgreement
 
-        self._Vendors = []
-        self.Vendors = [] if Vendors is None else Vendors
+        if Vendors is not None:
+            self.Vendors = Vendors
 
-        self._Transactors = []
-        self.Transactors = [] if Transactors is None else Transactors
+        if Transactors is not None:
+            self.Transactors = Transactors
 
         super(MerchantAccount, self).__init__(*args, **kw_args)
 
@@ -60,6 +61,7 @@ class MerchantAccount(Document):
     _enums = {}
     _refs = ["VendorShifts", "MerchantAgreement", "Vendors", "Transactors"]
     _many_refs = ["VendorShifts", "Vendors", "Transactors"]
+    _inverses = {"VendorShifts": "MerchantAccount", "MerchantAgreement": "MerchantAccounts", "Vendors": "MerchantAccount", "Transactors": "MerchantAccounts"}
 
     def getVendorShifts(self):
         """All vendor shifts that operate on this merchant account.
@@ -67,7 +69,8 @@ class MerchantAccount(Document):
         return self._VendorShifts
 
     def setVendorShifts(self, value):
-        for x in self._VendorShifts:
+        value = RefList(value)
+        for x in list(self._VendorShifts):
             x.MerchantAccount = None
         for y in value:
             y._MerchantAccount = self
@@ -90,13 +93,12 @@ class MerchantAccount(Document):
 
     def setMerchantAgreement(self, value):
         if self._MerchantAgreement is not None:
-            filtered = [x for x in self.MerchantAgreement.MerchantAccounts if x != self]
-            self._MerchantAgreement._MerchantAccounts = filtered
+            self._MerchantAgreement._MerchantAccounts.discard(self)
 
         self._MerchantAgreement = value
         if self._MerchantAgreement is not None:
             if self not in self._MerchantAgreement._MerchantAccounts:
-                self._MerchantAgreement._MerchantAccounts.append(self)
+                self._MerchantAgreement._reflist("_MerchantAccounts").append(self)
 
     MerchantAgreement = property(getMerchantAgreement, setMerchantAgreement)
 
@@ -106,7 +108,8 @@ class MerchantAccount(Document):
         return self._Vendors
 
     def setVendors(self, value):
-        for x in self._Vendors:
+        value = RefList(value)
+        for x in list(self._Vendors):
             x.MerchantAccount = None
         for y in value:
             y._MerchantAccount = self
@@ -129,20 +132,19 @@ class MerchantAccount(Document):
 
     def setTransactors(self, value):
         for p in self._Transactors:
-            filtered = [q for q in p.MerchantAccounts if q != self]
-            self._Transactors._MerchantAccounts = filtered
+            p._MerchantAccounts.discard(self)
         for r in value:
             if self not in r._MerchantAccounts:
-                r._MerchantAccounts.append(self)
-        self._Transactors = value
+                r._reflist("_MerchantAccounts").append(self)
+        self._Transactors = RefList(value)
 
     Transactors = property(getTransactors, setTransactors)
 
     def addTransactors(self, *Transactors):
         for obj in Transactors:
             if self not in obj._MerchantAccounts:
-                obj._MerchantAccounts.append(self)
-            self._Transactors.append(obj)
+                obj._reflist("_MerchantAccounts").append(self)
+            self._reflist("_Transactors").append(obj)
 
     def removeTransactors(self, *Transactors):
         for obj in Transactors:
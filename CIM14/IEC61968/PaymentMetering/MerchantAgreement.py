@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Agreement import Agreement
+from CIM14.Element import RefList
 
 class MerchantAgreement(Agreement):
     """A formal controlling contractual agreement between Supplier and Merchant, in terms of which Merchant is authorised to vend tokens and receipt payments on behalf of Supplier. Merchant is accountable to Supplier for revenue collected at PointOfSale.
@@ -29,8 +30,8 @@ class MerchantAgreement(Agreement):
 
         @param MerchantAccounts: All merchant accounts instantiated as a result of this merchant agreement.
         """
-        self._MerchantAccounts = []
-        self.MerchantAccounts = [] if MerchantAccounts is None else MerchantAccounts
+        if MerchantAccounts is not None:
+            self.MerchantAccounts = MerchantAccounts
 
         super(MerchantAgreement, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class MerchantAgreement(Agreement):
     _enums = {}
     _refs = ["MerchantAccounts"]
     _many_refs = ["MerchantAccounts"]
+    _inverses = {"MerchantAccounts": "MerchantAgreement"}
 
     def getMerchantAccounts(self):
         """All merchant accounts instantiated as a result of this merchant agreement.
@@ -47,7 +49,8 @@ class MerchantAgreement(Agreement):
         return self._MerchantAccounts
 
     def setMerchantAccounts(self, value):
-        for x in self._MerchantAccounts:
+        value = RefList(value)
+        for x in list(self._MerchantAccounts):
             x.MerchantAgreement = None
         for y in value:
             y._MerchantAgreement = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class PointOfSale(IdentifiedObject):
     """Logical point where transactions take place with operational interaction between Cashier and the payment system; in certain cases PointOfSale interacts directly with the end customer, in which case Cashier might not be a real person: for example a self-service kiosk or over the internet.
@@ -37,8 +38,8 @@ class PointOfSale(IdentifiedObject):
         self._Vendor = None
         self.Vendor = Vendor
 
-        self._CashierShifts = []
-        self.CashierShifts = [] if CashierShifts is None else CashierShifts
+        if CashierShifts is not None:
+            self.CashierShifts = CashierShifts
 
         super(PointOfSale, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class PointOfSale(IdentifiedObject):
     _enums = {}
     _refs = ["Vendor", "CashierShifts"]
     _many_refs = ["CashierShifts"]
+    _inverses = {"Vendor": "PointOfSales", "CashierShifts": "PointOfSale"}
 
     def getVendor(self):
         """Vendor that controls this PointOfSale.
@@ -56,13 +58,12 @@ class PointOfSale(IdentifiedObject):
 
     def setVendor(self, value):
         if self._Vendor is not None:
-            filtered = [x for x in self.Vendor.PointOfSales if x != self]
-            self._Vendor._PointOfSales = filtered
+            self._Vendor._PointOfSales.discard(self)
 
         self._Vendor = value
         if self._Vendor is not None:
             if self not in self._Vendor._PointOfSales:
-                self._Vendor._PointOfSales.append(self)
+                self._Vendor._reflist("_PointOfSales").append(self)
 
     Vendor = property(getVendor, setVendor)
 
@@ -72,7 +73,8 @@ class PointOfSale(IdentifiedObject):
         return self._CashierShifts
 
     def setCashierShifts(self, value):
-        for x in self._CashierShifts:
+        value = RefList(value)
+        for x in list(self._CashierShifts):
             x.PointOfSale = None
         for y in value:
             y._PointOfSale = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class Receipt(IdentifiedObject):
     """Record of total receipted payment from customer.
@@ -40,14 +41,14 @@ class Receipt(IdentifiedObject):
         self._CashierShift = None
         self.CashierShift = CashierShift
 
-        self._Tenders = []
-        self.Tenders = [] if Tenders is None else Tenders
+        if Tenders is not None:
+            self.Tenders = Tenders
 
         self._VendorShift = None
         self.VendorShift = VendorShift
 
-        self._Transactions = []
-        self.Transactions = [] if Transactions is None else Transactions
+        if Transactions is not None:
+            self.Transactions = Transactions
 
         self.line = line
 
@@ -59,6 +60,7 @@ class Receipt(IdentifiedObject):
     _enums = {}
     _refs = ["CashierShift", "Tenders", "VendorShift", "Transactions", "line"]
     _many_refs = ["Tenders", "Transactions"]
+    _inverses = {"CashierShift": "Receipts", "Tenders": "Receipt", "VendorShift": "Receipts", "Transactions": "Receipt"}
 
     def getCashierShift(self):
         """Cashier shift during which this receipt was recorded.
@@ -67,13 +69,12 @@ class Receipt(IdentifiedObject):
 
     def setCashierShift(self, value):
         if self._CashierShift is not None:
-            filtered = [x for x in self.CashierShift.Receipts if x != self]
-            self._CashierShift._Receipts = filtered
+            self._CashierShift._Receipts.discard(self)
 
         self._CashierShift = value
         if self._CashierShift is not None:
             if self not in self._CashierShift._Receipts:
-                self._CashierShift._Receipts.append(self)
+                self._CashierShift._reflist("_Receipts").append(self)
 
     CashierShift = property(getCashierShift, setCashierShift)
 
@@ -83,7 +84,8 @@ class Receipt(IdentifiedObject):
         return self._Tenders
 
     def setTenders(self, value):
-        for x in self._Tenders:
+        value = RefList(value)
+        for x in list(self._Tenders):
             x.Receipt = None
         for y in value:
             y._Receipt = self
@@ -106,13 +108,12 @@ class Receipt(IdentifiedObject):
 
     def setVendorShift(self, value):
         if self._VendorShift is not None:
-            filtered = [x for x in self.VendorShift.Receipts if x != self]
-            self._VendorShift._Receipts = filtered
+            self._VendorShift._Receipts.discard(self)
 
         self._VendorShift = value
         if self._VendorShift is not None:
             if self not in self._VendorShift._Receipts:
-                self._VendorShift._Receipts.append(self)
+                self._VendorShift._reflist("_Receipts").append(self)
 
     VendorShift = property(getVendorShift, setVendorShift)
 
@@ -122,7 +123,8 @@ class Receipt(IdentifiedObject):
         return self._Transactions
 
     def setTransactions(self, value):
-        for x in self._Transactions:
+        value = RefList(value)
+        for x in list(self._Transactions):
             x.Receipt = None
         for y in value:
             y._Receipt = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Organisation import Organisation
+from CIM14.Element import RefList
 
 class ServiceSupplier(Organisation):
     """Organisation that provides services to Customers.
@@ -38,11 +39,11 @@ class ServiceSupplier(Organisation):
         #: Unique transaction reference prefix number issued to an entity by the International Standards Organisation for the purpose of tagging onto electronic financial transactions, as defined in ISO/IEC 7812-1 and ISO/IEC 7812-2.
         self.issuerIdentificationNumber = issuerIdentificationNumber
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         super(ServiceSupplier, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class ServiceSupplier(Organisation):
     _enums = {"kind": "SupplierKind"}
     _refs = ["CustomerAgreements", "ServiceDeliveryPoints"]
     _many_refs = ["CustomerAgreements", "ServiceDeliveryPoints"]
+    _inverses = {"CustomerAgreements": "ServiceSupplier", "ServiceDeliveryPoints": "ServiceSupplier"}
 
     def getCustomerAgreements(self):
         """All customer agreements of this service supplier.
@@ -59,7 +61,8 @@ class ServiceSupplier(Organisation):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
-        for x in self._CustomerAgreements:
+        value = RefList(value)
+        for x in list(self._CustomerAgreements):
             x.ServiceSupplier = None
         for y in value:
             y._ServiceSupplier = self
@@ -81,7 +84,8 @@ class ServiceSupplier(Organisation):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
-        for x in self._ServiceDeliveryPoints:
+        value = RefList(value)
+        for x in list(self._ServiceDeliveryPoints):
             x.ServiceSupplier = None
         for y in value:
             y._ServiceSupplier = self
@@ -59,6 +59,7 @@ class Shift(IdentifiedObject):
     _enums = {}
     _refs = ["activityInterval"]
     _many_refs = []
+    _inverses = {}
 
     # Interval for activity of this shift.
     activityInterval = None
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, RefList
 
 class TimeTariffInterval(Element):
     """One of a sequence of time intervals defined in terms of real time. It is typically used in association with TariffProfile to define the intervals in a time of use tariff structure, where startDateTime simultaneously determines the starting point of this interval and the ending point of the previous interval.
@@ -38,11 +38,11 @@ class TimeTariffInterval(Element):
         #: A real time marker that defines the starting time (typically it is the time of day) for this interval. The interval extends to the start of the next interval or until it is reset to the start of the first interval by TariffProfile.tariffCycle.
         self.startDateTime = startDateTime
 
-        self._TariffProfiles = []
-        self.TariffProfiles = [] if TariffProfiles is None else TariffProfiles
+        if TariffProfiles is not None:
+            self.TariffProfiles = TariffProfiles
 
-        self._Charges = []
-        self.Charges = [] if Charges is None else Charges
+        if Charges is not None:
+            self.Charges = Charges
 
         super(TimeTariffInterval, self).__init__(*args, **kw_args)
 
@@ -52,6 +52,7 @@ class TimeTariffInterval(Element):
     _enums = {}
     _refs = ["TariffProfiles", "Charges"]
     _many_refs = ["TariffProfiles", "Charges"]
+    _inverses = {"TariffProfiles": "TimeTariffIntervals", "Charges": "TimeTariffIntervals"}
 
     def getTariffProfiles(self):
         """All tariff profiles defined by this time tariff interval.
@@ -60,20 +61,19 @@ class TimeTariffInterval(Element):
 
     def setTariffProfiles(self, value):
         for p in self._TariffProfiles:
-            filtered = [q for q in p.TimeTariffIntervals if q != self]
-            self._TariffProfiles._TimeTariffIntervals = filtered
+            p._TimeTariffIntervals.discard(self)
         for r in value:
             if self not in r._TimeTariffIntervals:
-                r._TimeTariffIntervals.append(self)
-        self._TariffProfiles = value
+                r._reflist("_TimeTariffIntervals").append(self)
+        self._TariffProfiles = RefList(value)
 
     TariffProfiles = property(getTariffProfiles, setTariffProfiles)
 
     def addTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
             if self not in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.append(self)
-            self._TariffProfiles.append(obj)
+                obj._reflist("_TimeTariffIntervals").append(self)
+            self._reflist("_TariffProfiles").append(obj)
 
     def removeTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
@@ -88,20 +88,19 @@ class TimeTariffInterval(Element):
 
     def setCharges(self, value):
         for p in self._Charges:
-            filtered = [q for q in p.TimeTariffIntervals if q != self]
-            self._Charges._TimeTariffIntervals = filtered
+            p._TimeTariffIntervals.discard(self)
         for r in value:
             if self not in r._TimeTariffIntervals:
-                r._TimeTariffIntervals.append(self)
-        self._Charges = value
+                r._reflist("_TimeTariffIntervals").append(self)
+        self._Charges = RefList(value)
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
         for obj in Charges:
             if self not in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.append(self)
-            self._Charges.append(obj)
+                obj._reflist("_TimeTariffIntervals").append(self)
+            self._reflist("_Charges").append(obj)
 
     def removeCharges(self, *Charges):
         for obj in Charges:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class Transaction(IdentifiedObject):
     """The record of details of payment for service or token sale.
@@ -68,8 +69,8 @@ class Transaction(IdentifiedObject):
         self._PricingStructure = None
         self.PricingStructure = PricingStructure
 
-        self._UserAttributes = []
-        self.UserAttributes = [] if UserAttributes is None else UserAttributes
+        if UserAttributes is not None:
+            self.UserAttributes = UserAttributes
 
         self._CustomerAccount = None
         self.CustomerAccount = CustomerAccount
@@ -99,6 +100,7 @@ class Transaction(IdentifiedObject):
     _enums = {"kind": "TransactionKind"}
     _refs = ["PricingStructure", "UserAttributes", "CustomerAccount", "CashierShift", "VendorShift", "MeterAsset", "AuxiliaryAccount", "line", "Receipt"]
     _many_refs = ["UserAttributes"]
+    _inverses = {"PricingStructure": "Transactions", "UserAttributes": "Transaction", "CustomerAccount": "PaymentTransactions", "CashierShift": "Transactions", "VendorShift": "Transactions", "MeterAsset": "VendingTransactions", "AuxiliaryAccount": "PaymentTransactions", "Receipt": "Transactions"}
 
     def getPricingStructure(self):
         """Pricing structure applicable for this transaction.
@@ -107,13 +109,12 @@ class Transaction(IdentifiedObject):
 
     def setPricingStructure(self, value):
         if self._PricingStructure is not None:
-            filtered = [x for x in self.PricingStructure.Transactions if x != self]
-            self._PricingStructure._Transactions = filtered
+            self._PricingStructure._Transactions.discard(self)
 
         self._PricingStructure = value
         if self._PricingStructure is not None:
             if self not in self._PricingStructure._Transactions:
-                self._PricingStructure._Transactions.append(self)
+                self._PricingStructure._reflist("_Transactions").append(self)
 
     PricingStructure = property(getPricingStructure, setPricingStructure)
 
@@ -123,7 +124,8 @@ class Transaction(IdentifiedObject):
         return self._UserAttributes
 
     def setUserAttributes(self, value):
-        for x in self._UserAttributes:
+        value = RefList(value)
+        for x in list(self._UserAttributes):
             x.Transaction = None
         for y in value:
             y._Transaction = self
@@ -146,13 +148,12 @@ class Transaction(IdentifiedObject):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.PaymentTransactions if x != self]
-            self._CustomerAccount._PaymentTransactions = filtered
+            self._CustomerAccount._PaymentTransactions.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
             if self not in self._CustomerAccount._PaymentTransactions:
-                self._CustomerAccount._PaymentTransactions.append(self)
+                self._CustomerAccount._reflist("_PaymentTransactions").append(self)
 
     CustomerAccount = property(getCustomerAccount, setCustomerAccount)
 
@@ -163,13 +164,12 @@ class Transaction(IdentifiedObject):
 
     def setCashierShift(self, value):
         if self._CashierShift is not None:
-            filtered = [x for x in self.CashierShift.Transactions if x != self]
-            self._CashierShift._Transactions = filtered
+            self._CashierShift._Transactions.discard(self)
 
         self._CashierShift = value
         if self._CashierShift is not None:
             if self not in self._CashierShift._Transactions:
-                self._CashierShift._Transactions.append(self)
+                self._CashierShift._reflist("_Transactions").append(self)
 
     CashierShift = property(getCashierShift, setCashierShift)
 
@@ -180,13 +180,12 @@ class Transaction(IdentifiedObject):
 
     def setVendorShift(self, value):
         if self._VendorShift is not None:
-            filtered = [x for x in self.VendorShift.Transactions if x != self]
-            self._VendorShift._Transactions = filtered
+            self._VendorShift._Transactions.discard(self)
 
         self._VendorShift = value
         if self._VendorShift is not None:
             if self not in self._VendorShift._Transactions:
-                self._VendorShift._Transactions.append(self)
+                self._VendorShift._reflist("_Transactions").append(self)
 
     VendorShift = property(getVendorShift, setVendorShift)
 
@@ -197,13 +196,12 @@ class Transaction(IdentifiedObject):
 
     def setMeterAsset(self, value):
         if self._MeterAsset is not None:
-            filtered = [x for x in self.MeterAsset.VendingTransactions if x != self]
-            self._MeterAsset._VendingTransactions = filtered
+            self._MeterAsset._VendingTransactions.discard(self)
 
         self._MeterAsset = value
         if self._MeterAsset is not None:
             if self not in self._MeterAsset._VendingTransactions:
-                self._MeterAsset._VendingTransactions.append(self)
+                self._MeterAsset._reflist("_VendingTransactions").append(self)
 
     MeterAsset = property(getMeterAsset, setMeterAsset)
 
@@ -214,13 +212,12 @@ class Transaction(IdentifiedObject):
 
     def setAuxiliaryAccount(self, value):
         if self._AuxiliaryAccount is not None:
-            filtered = [x for x in self.AuxiliaryAccount.PaymentTransactions if x != self]
-            self._AuxiliaryAccount._PaymentTransactions = filtered
+            self._AuxiliaryAccount._PaymentTransactions.discard(self)
 
         self._AuxiliaryAccount = value
         if self._AuxiliaryAccount is not None:
             if self not in self._AuxiliaryAccount._PaymentTransactions:
-                self._AuxiliaryAccount._PaymentTransactions.append(self)
+                self._AuxiliaryAccount._reflist("_PaymentTransactions").append(self)
 
     AuxiliaryAccount = property(getAuxiliaryAccount, setAuxiliaryAccount)
 
@@ -234,13 +231,12 @@ class Transaction(IdentifiedObject):
 
     def setReceipt(self, value):
         if self._Receipt is not None:
-            filtered = [x for x in self.Receipt.Transactions if x != self]
-            self._Receipt._Transactions = filtered
+            self._Receipt._Transactions.discard(self)
 
         self._Receipt = value
         if self._Receipt is not None:
             if self not in self._Receipt._Transactions:
-                self._Receipt._Transactions.append(self)
+                self._Receipt._reflist("_Transactions").append(self)
 
     Receipt = property(getReceipt, setReceipt)
 
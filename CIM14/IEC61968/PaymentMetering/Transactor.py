@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class Transactor(IdentifiedObject):
     """The entity that ultimately executes the transaction and who is in control of the process; typically this is embodied in secure software running on a server that may employ secure hardware encryption devices for secure transaction processing.
@@ -29,8 +30,8 @@ class Transactor(IdentifiedObject):
 
         @param MerchantAccounts: All merchant accounts registered with this transactor.
         """
-        self._MerchantAccounts = []
-        self.MerchantAccounts = [] if MerchantAccounts is None else MerchantAccounts
+        if MerchantAccounts is not None:
+            self.MerchantAccounts = MerchantAccounts
 
         super(Transactor, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class Transactor(IdentifiedObject):
     _enums = {}
     _refs = ["MerchantAccounts"]
     _many_refs = ["MerchantAccounts"]
+    _inverses = {"MerchantAccounts": "Transactors"}
 
     def getMerchantAccounts(self):
         """All merchant accounts registered with this transactor.
@@ -48,20 +50,19 @@ class Transactor(IdentifiedObject):
 
     def setMerchantAccounts(self, value):
         for p in self._MerchantAccounts:
-            filtered = [q for q in p.Transactors if q != self]
-            self._MerchantAccounts._Transactors = filtered
+            p._Transactors.discard(self)
         for r in value:
             if self not in r._Transactors:
-                r._Transactors.append(self)
-        self._MerchantAccounts = value
+                r._reflist("_Transactors").append(self)
+        self._MerchantAccounts = RefList(value)
 
     MerchantAccounts = property(getMerchantAccounts, setMerchantAccounts)
 
     def addMerchantAccounts(self, *MerchantAccounts):
         for obj in MerchantAccounts:
             if self not in obj._Transactors:
-                obj._Transactors.append(self)
-            self._MerchantAccounts.append(obj)
+                obj._reflist("_Transactors").append(self)
+            self._reflist("_MerchantAccounts").append(obj)
 
     def removeMerchantAccounts(self, *MerchantAccounts):
         for obj in MerchantAccounts:
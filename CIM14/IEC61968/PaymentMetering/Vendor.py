@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class Vendor(IdentifiedObject):
     """The entity that owns PointOfSale and contracts with Cashier to receipt payments and vend tokens using the payment system. Vendor has a private contract with and is managed by Merchant who is a type of Organisation. Vendor is accountable to Merchant for revenue collected, who is in turn accountable to Supplier.
@@ -32,17 +33,17 @@ class Vendor(IdentifiedObject):
         @param Cashiers: All Cachiers managed by this Vendor.
         @param VendorShifts: All vendor shifts opened and owned by this vendor.
         """
-        self._PointOfSales = []
-        self.PointOfSales = [] if PointOfSales is None else PointOfSales
+        if PointOfSales is not None:
+            self.PointOfSales = PointOfSales
 
         self._MerchantAccount = None
         self.MerchantAccount = MerchantAccount
 
-        self._Cashiers = []
-        self.Cashiers = [] if Cashiers is None else Cashiers
+        if Cashiers is not None:
+            self.Cashiers = Cashiers
 
-        self._VendorShifts = []
-        self.VendorShifts = [] if VendorShifts is None else VendorShifts
+        if VendorShifts is not None:
+            self.VendorShifts = VendorShifts
 
         super(Vendor, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class Vendor(IdentifiedObject):
     _enums = {}
     _refs = ["PointOfSales", "MerchantAccount", "Cashiers", "VendorShifts"]
     _many_refs = ["PointOfSales", "Cashiers", "VendorShifts"]
+    _inverses = {"PointOfSales": "Vendor", "MerchantAccount": "Vendors", "Cashiers": "Vendor", "VendorShifts": "Vendor"}
 
     def getPointOfSales(self):
         """All points of sale this Vendor controls.
@@ -59,7 +61,8 @@ class Vendor(IdentifiedObject):
         return self._PointOfSales
 
     def setPointOfSales(self, value):
-        for x in self._PointOfSales:
+        value = RefList(value)
+        for x in list(self._PointOfSales):
             x.Vendor = None
         for y in value:
             y._Vendor = self
@@ -82,13 +85,12 @@ class Vendor(IdentifiedObject):
 
     def setMerchantAccount(self, value):
         if self._MerchantAccount is not None:
-            filtered = [x for x in self.MerchantAccount.Vendors if x != self]
-            self._MerchantAccount._Vendors = filtered
+            self._MerchantAccount._Vendors.discard(self)
 
         self._MerchantAccount = value
         if self._MerchantAccount is not None:
             if self not in self._MerchantAccount._Vendors:
-                self._MerchantAccount._Vendors.append(self)
+                self._MerchantAccount._reflist("_Vendors").append(self)
 
     MerchantAccount = property(getMerchantAccount, setMerchantAccount)
 
@@ -98,7 +100,8 @@ class Vendor(IdentifiedObject):
         return self._Cashiers
 
     def setCashiers(self, value):
-        for x in self._Cashiers:
+        value = RefList(value)
+        for x in list(self._Cashiers):
             x.Vendor = None
         for y in value:
             y._Vendor = self
@@ -120,7 +123,8 @@ class Vendor(IdentifiedObject):
         return self._VendorShifts
 
     def setVendorShifts(self, value):
-        for x in self._VendorShifts:
+        value = RefList(value)
+        for x in list(self._VendorShifts):
             x.Vendor = None
         for y in value:
             y._Vendor = self
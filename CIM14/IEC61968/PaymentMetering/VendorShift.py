@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.PaymentMetering.Shift import Shift
+from CIM14.Element import RefList
 
 class VendorShift(Shift):
     """The operating shift for a vendor during which he may transact against the merchant's account. It aggregates transactions and receipts during the shift and periodically debits a merchant account. The totals in VendorShift should always = sum of totals aggregated in all cashier shifts that were open under the particular vendor shift.
@@ -43,11 +44,11 @@ class VendorShift(Shift):
         self._MerchantAccount = None
         self.MerchantAccount = MerchantAccount
 
-        self._Transactions = []
-        self.Transactions = [] if Transactions is None else Transactions
+        if Transactions is not None:
+            self.Transactions = Transactions
 
-        self._Receipts = []
-        self.Receipts = [] if Receipts is None else Receipts
+        if Receipts is not None:
+            self.Receipts = Receipts
 
         self._Vendor = None
         self.Vendor = Vendor
@@ -60,6 +61,7 @@ class VendorShift(Shift):
     _enums = {}
     _refs = ["MerchantAccount", "Transactions", "Receipts", "Vendor"]
     _many_refs = ["Transactions", "Receipts"]
+    _inverses = {"MerchantAccount": "VendorShifts", "Transactions": "VendorShift", "Receipts": "VendorShift", "Vendor": "VendorShifts"}
 
     def getMerchantAccount(self):
         """Merchant account this vendor shift periodically debits (based on aggregated transactions).
@@ -68,13 +70,12 @@ class VendorShift(Shift):
 
     def setMerchantAccount(self, value):
         if self._MerchantAccount is not None:
-            filtered = [x for x in self.MerchantAccount.VendorShifts if x != self]
-            self._MerchantAccount._VendorShifts = filtered
+            self._MerchantAccount._VendorShifts.discard(self)
 
         self._MerchantAccount = value
         if self._MerchantAccount is not None:
             if self not in self._MerchantAccount._VendorShifts:
-                self._MerchantAccount._VendorShifts.append(self)
+                self._MerchantAccount._reflist("_VendorShifts").append(self)
 
     MerchantAccount = property(getMerchantAccount, setMerchantAccount)
 
@@ -83,7 +84,8 @@ class VendorShift(Shift):
         return self._Transactions
 
     def setTransactions(self, value):
-        for x in self._Transactions:
+        value = RefList(value)
+        for x in list(self._Transactions):
             x.VendorShift = None
         for y in value:
             y._VendorShift = self
@@ -104,7 +106,8 @@ class VendorShift(Shift):
         return self._Receipts
 
     def setReceipts(self, value):
-        for x in self._Receipts:
+        value = RefList(value)
+        for x in list(self._Receipts):
             x.VendorShift = None
         for y in value:
             y._VendorShift = self
@@ -127,13 +130,12 @@ class VendorShift(Shift):
 
     def setVendor(self, value):
         if self._Vendor is not None:
-            filtered = [x for x in self.Vendor.VendorShifts if x != self]
-            self._Vendor._VendorShifts = filtered
+            self._Vendor._VendorShifts.discard(self)
 
         self._Vendor = value
         if self._Vendor is not None:
             if self not in self._Vendor._VendorShifts:
-                self._Vendor._VendorShifts.append(self)
+                self._Vendor._reflist("_VendorShifts").append(self)
 
     Vendor = property(getVendor, setVendor)
 
@@ -21,32 +21,8 @@
 """This package contains only diagrams, drawn by hand from PaymentMetering-related XSDs that are in Part 9 document. Entry points into the schema are filled with green. Non-used associations are light grey.
 """
 
-from CIM14.IEC61968.PaymentMetering.ServiceSupplier import ServiceSupplier
-from CIM14.IEC61968.PaymentMetering.Shift import Shift
-from CIM14.IEC61968.PaymentMetering.Tender import Tender
-from CIM14.IEC61968.PaymentMetering.TariffProfile import TariffProfile
-from CIM14.IEC61968.PaymentMetering.ConsumptionTariffInterval import ConsumptionTariffInterval
-from CIM14.IEC61968.PaymentMetering.BankAccountDetail import BankAccountDetail
-from CIM14.IEC61968.PaymentMetering.Cheque import Cheque
-from CIM14.IEC61968.PaymentMetering.CashierShift import CashierShift
-from CIM14.IEC61968.PaymentMetering.Due import Due
-from CIM14.IEC61968.PaymentMetering.AccountingUnit import AccountingUnit
-from CIM14.IEC61968.PaymentMetering.Card import Card
-from CIM14.IEC61968.PaymentMetering.AuxiliaryAccount import AuxiliaryAccount
-from CIM14.IEC61968.PaymentMetering.MerchantAgreement import MerchantAgreement
-from CIM14.IEC61968.PaymentMetering.LineDetail import LineDetail
-from CIM14.IEC61968.PaymentMetering.Transactor import Transactor
-from CIM14.IEC61968.PaymentMetering.MerchantAccount import MerchantAccount
-from CIM14.IEC61968.PaymentMetering.Vendor import Vendor
-from CIM14.IEC61968.PaymentMetering.Transaction import Transaction
-from CIM14.IEC61968.PaymentMetering.Charge import Charge
-from CIM14.IEC61968.PaymentMetering.VendorShift import VendorShift
-from CIM14.IEC61968.PaymentMetering.TimeTariffInterval import TimeTariffInterval
-from CIM14.IEC61968.PaymentMetering.Cashier import Cashier
-from CIM14.IEC61968.PaymentMetering.PointOfSale import PointOfSale
-from CIM14.IEC61968.PaymentMetering.Receipt import Receipt
-from CIM14.IEC61968.PaymentMetering.AuxiliaryAgreement import AuxiliaryAgreement
-from CIM14.IEC61968.PaymentMetering.AccountMovement import AccountMovement
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#PaymentMetering"
 nsPrefix = "cimPaymentMetering"
@@ -87,3 +63,33 @@ class TenderKind(str):
     Values are: cash, unspecified, card, other, cheque
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ServiceSupplier",
+    "Shift",
+    "Tender",
+    "TariffProfile",
+    "ConsumptionTariffInterval",
+    "BankAccountDetail",
+    "Cheque",
+    "CashierShift",
+    "Due",
+    "AccountingUnit",
+    "Card",
+    "AuxiliaryAccount",
+    "MerchantAgreement",
+    "LineDetail",
+    "Transactor",
+    "MerchantAccount",
+    "Vendor",
+    "Transaction",
+    "Charge",
+    "VendorShift",
+    "TimeTariffInterval",
+    "Cashier",
+    "PointOfSale",
+    "Receipt",
+    "AuxiliaryAgreement",
+    "AccountMovement",
+])
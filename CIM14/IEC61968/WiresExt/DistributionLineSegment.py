@@ -48,6 +48,7 @@ class DistributionLineSegment(ACLineSegment):
     _enums = {}
     _refs = ["ConductorInfo", "PhaseImpedance", "SequenceImpedance"]
     _many_refs = []
+    _inverses = {"ConductorInfo": "ConductorSegments", "PhaseImpedance": "ConductorSegments", "SequenceImpedance": "ConductorSegments"}
 
     def getConductorInfo(self):
         """Conductor data of this conductor segment.
@@ -56,13 +57,12 @@ class DistributionLineSegment(ACLineSegment):
 
     def setConductorInfo(self, value):
         if self._ConductorInfo is not None:
-            filtered = [x for x in self.ConductorInfo.ConductorSegments if x != self]
-            self._ConductorInfo._ConductorSegments = filtered
+            self._ConductorInfo._ConductorSegments.discard(self)
 
         self._ConductorInfo = value
         if self._ConductorInfo is not None:
             if self not in self._ConductorInfo._ConductorSegments:
-                self._ConductorInfo._ConductorSegments.append(self)
+                self._ConductorInfo._reflist("_ConductorSegments").append(self)
 
     ConductorInfo = property(getConductorInfo, setConductorInfo)
 
@@ -73,13 +73,12 @@ class DistributionLineSegment(ACLineSegment):
 
     def setPhaseImpedance(self, value):
         if self._PhaseImpedance is not None:
-            filtered = [x for x in self.PhaseImpedance.ConductorSegments if x != self]
-            self._PhaseImpedance._ConductorSegments = filtered
+            self._PhaseImpedance._ConductorSegments.discard(self)
 
         self._PhaseImpedance = value
         if self._PhaseImpedance is not None:
             if self not in self._PhaseImpedance._ConductorSegments:
-                self._PhaseImpedance._ConductorSegments.append(self)
+                self._PhaseImpedance._reflist("_ConductorSegments").append(self)
 
     PhaseImpedance = property(getPhaseImpedance, setPhaseImpedance)
 
@@ -90,13 +89,12 @@ class DistributionLineSegment(ACLineSegment):
 
     def setSequenceImpedance(self, value):
         if self._SequenceImpedance is not None:
-            filtered = [x for x in self.SequenceImpedance.ConductorSegments if x != self]
-            self._SequenceImpedance._ConductorSegments = filtered
+            self._SequenceImpedance._ConductorSegments.discard(self)
 
         self._SequenceImpedance = value
         if self._SequenceImpedance is not None:
             if self not in self._SequenceImpedance._ConductorSegments:
-                self._SequenceImpedance._ConductorSegments.append(self)
+                self._SequenceImpedance._reflist("_ConductorSegments").append(self)
 
     SequenceImpedance = property(getSequenceImpedance, setSequenceImpedance)
 
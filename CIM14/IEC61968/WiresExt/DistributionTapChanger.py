@@ -84,4 +84,5 @@ class DistributionTapChanger(RatioTapChanger):
     _enums = {"monitoredPhase": "PhaseCode"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from CIM14.Element import RefList
 
 class DistributionTransformer(Equipment):
     """An assembly of two or more coupled windings that transform electrical power between voltage levels. Supports both balanced and unbalanced winding connections. This class differs from Wires::PowerTransformer as follows: - it is part of a TransformerBank - it draws parameters exclusively from TransformerInfo and its associated classes.
@@ -32,11 +33,11 @@ class DistributionTransformer(Equipment):
         @param TransformerBank: Bank this transformer belongs to.
         @param TransformerInfo: Transformer data.
         """
-        self._Windings = []
-        self.Windings = [] if Windings is None else Windings
+        if Windings is not None:
+            self.Windings = Windings
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         self._TransformerBank = None
         self.TransformerBank = TransformerBank
@@ -52,6 +53,7 @@ class DistributionTransformer(Equipment):
     _enums = {}
     _refs = ["Windings", "ServiceDeliveryPoints", "TransformerBank", "TransformerInfo"]
     _many_refs = ["Windings", "ServiceDeliveryPoints"]
+    _inverses = {"Windings": "Transformer", "ServiceDeliveryPoints": "Transformer", "TransformerBank": "Transformers", "TransformerInfo": "Transformers"}
 
     def getWindings(self):
         """All windings of this transformer.
@@ -59,7 +61,8 @@ class DistributionTransformer(Equipment):
         return self._Windings
 
     def setWindings(self, value):
-        for x in self._Windings:
+        value = RefList(value)
+        for x in list(self._Windings):
             x.Transformer = None
         for y in value:
             y._Transformer = self
@@ -81,7 +84,8 @@ class DistributionTransformer(Equipment):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
-        for x in self._ServiceDeliveryPoints:
+        value = RefList(value)
+        for x in list(self._ServiceDeliveryPoints):
             x.Transformer = None
         for y in value:
             y._Transformer = self
@@ -104,13 +108,12 @@ class DistributionTransformer(Equipment):
 
     def setTransformerBank(self, value):
         if self._TransformerBank is not None:
-            filtered = [x for x in self.TransformerBank.Transformers if x != self]
-            self._TransformerBank._Transformers = filtered
+            self._TransformerBank._Transformers.discard(self)
 
         self._TransformerBank = value
         if self._TransformerBank is not None:
             if self not in self._TransformerBank._Transformers:
-                self._TransformerBank._Transformers.append(self)
+                self._TransformerBank._reflist("_Transformers").append(self)
 
     TransformerBank = property(getTransformerBank, setTransformerBank)
 
@@ -121,13 +124,12 @@ class DistributionTransformer(Equipment):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.Transformers if x != self]
-            self._TransformerInfo._Transformers = filtered
+            self._TransformerInfo._Transformers.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
             if self not in self._TransformerInfo._Transformers:
-                self._TransformerInfo._Transformers.append(self)
+                self._TransformerInfo._reflist("_Transformers").append(self)
 
     TransformerInfo = property(getTransformerInfo, setTransformerInfo)
 
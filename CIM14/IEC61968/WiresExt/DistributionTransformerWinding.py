@@ -68,6 +68,7 @@ class DistributionTransformerWinding(ConductingEquipment):
     _enums = {}
     _refs = ["Transformer", "WindingInfo", "RatioTapChanger", "PiImpedance", "PhaseTapChanger"]
     _many_refs = []
+    _inverses = {"Transformer": "Windings", "WindingInfo": "Windings", "RatioTapChanger": "Winding", "PiImpedance": "Windings", "PhaseTapChanger": "Winding"}
 
     def getTransformer(self):
         """Transformer this winding belongs to.
@@ -76,13 +77,12 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setTransformer(self, value):
         if self._Transformer is not None:
-            filtered = [x for x in self.Transformer.Windings if x != self]
-            self._Transformer._Windings = filtered
+            self._Transformer._Windings.discard(self)
 
         self._Transformer = value
         if self._Transformer is not None:
             if self not in self._Transformer._Windings:
-                self._Transformer._Windings.append(self)
+                self._Transformer._reflist("_Windings").append(self)
 
     Transformer = property(getTransformer, setTransformer)
 
@@ -93,13 +93,12 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setWindingInfo(self, value):
         if self._WindingInfo is not None:
-            filtered = [x for x in self.WindingInfo.Windings if x != self]
-            self._WindingInfo._Windings = filtered
+            self._WindingInfo._Windings.discard(self)
 
         self._WindingInfo = value
         if self._WindingInfo is not None:
             if self not in self._WindingInfo._Windings:
-                self._WindingInfo._Windings.append(self)
+                self._WindingInfo._reflist("_Windings").append(self)
 
     WindingInfo = property(getWindingInfo, setWindingInfo)
 
@@ -126,13 +125,12 @@ class DistributionTransformerWinding(ConductingEquipment):
 
     def setPiImpedance(self, value):
         if self._PiImpedance is not None:
-            filtered = [x for x in self.PiImpedance.Windings if x != self]
-            self._PiImpedance._Windings = filtered
+            self._PiImpedance._Windings.discard(self)
 
         self._PiImpedance = value
         if self._PiImpedance is not None:
             if self not in self._PiImpedance._Windings:
-                self._PiImpedance._Windings.append(self)
+                self._PiImpedance._reflist("_Windings").append(self)
 
     PiImpedance = property(getPiImpedance, setPiImpedance)
 
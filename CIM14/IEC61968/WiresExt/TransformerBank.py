@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from CIM14.Element import RefList
 
 class TransformerBank(Equipment):
     """An assembly of transformers that are connected together. For three-phase transformers, there would be one transformer per bank. For banks of single-phase transformers, there will be more than one transformer per bank, and they need not be identical.
@@ -33,8 +34,8 @@ class TransformerBank(Equipment):
         #: Vector group of the bank for protective relaying, e.g., Dyn1. For unbalanced transformers, this may not be simply determined from the constituent winding connections.
         self.vectorGroup = vectorGroup
 
-        self._Transformers = []
-        self.Transformers = [] if Transformers is None else Transformers
+        if Transformers is not None:
+            self.Transformers = Transformers
 
         super(TransformerBank, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class TransformerBank(Equipment):
     _enums = {}
     _refs = ["Transformers"]
     _many_refs = ["Transformers"]
+    _inverses = {"Transformers": "TransformerBank"}
 
     def getTransformers(self):
         """All transformers that belong to this bank.
@@ -51,7 +53,8 @@ class TransformerBank(Equipment):
         return self._Transformers
 
     def setTransformers(self, value):
-        for x in self._Transformers:
+        value = RefList(value)
+        for x in list(self._Transformers):
             x.TransformerBank = None
         for y in value:
             y._TransformerBank = self
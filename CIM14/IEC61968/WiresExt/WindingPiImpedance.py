@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class WindingPiImpedance(IdentifiedObject):
     """Transformer Pi-model impedance that accurately reflects impedance for transformers with 2 or 3 windings. For transformers with 4 or more windings, you must use TransformerInfo.
@@ -61,8 +62,8 @@ class WindingPiImpedance(IdentifiedObject):
         #: Zero sequence magnetizing branch conductance.
         self.g0 = g0
 
-        self._Windings = []
-        self.Windings = [] if Windings is None else Windings
+        if Windings is not None:
+            self.Windings = Windings
 
         super(WindingPiImpedance, self).__init__(*args, **kw_args)
 
@@ -72,6 +73,7 @@ class WindingPiImpedance(IdentifiedObject):
     _enums = {}
     _refs = ["Windings"]
     _many_refs = ["Windings"]
+    _inverses = {"Windings": "PiImpedance"}
 
     def getWindings(self):
         """All windings having this Pi impedance.
@@ -79,7 +81,8 @@ class WindingPiImpedance(IdentifiedObject):
         return self._Windings
 
     def setWindings(self, value):
-        for x in self._Windings:
+        value = RefList(value)
+        for x in list(self._Windings):
             x.PiImpedance = None
         for y in value:
             y._PiImpedance = self
@@ -21,16 +21,21 @@
 """Contains only diagrams to be discussed with WG13, for consolidating T&amp;D models.
 """
 
-from CIM14.IEC61968.WiresExt.TransformerBank import TransformerBank
-from CIM14.IEC61968.WiresExt.PhaseImpedanceData import PhaseImpedanceData
-from CIM14.IEC61968.WiresExt.DistributionTapChanger import DistributionTapChanger
-from CIM14.IEC61968.WiresExt.PerLengthPhaseImpedance import PerLengthPhaseImpedance
-from CIM14.IEC61968.WiresExt.PerLengthSequenceImpedance import PerLengthSequenceImpedance
-from CIM14.IEC61968.WiresExt.WindingPiImpedance import WindingPiImpedance
-from CIM14.IEC61968.WiresExt.DistributionLineSegment import DistributionLineSegment
-from CIM14.IEC61968.WiresExt.DistributionTransformer import DistributionTransformer
-from CIM14.IEC61968.WiresExt.DistributionTransformerWinding import DistributionTransformerWinding
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#WiresExt"
 nsPrefix = "cimWiresExt"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "TransformerBank",
+    "PhaseImpedanceData",
+    "DistributionTapChanger",
+    "PerLengthPhaseImpedance",
+    "PerLengthSequenceImpedance",
+    "WindingPiImpedance",
+    "DistributionLineSegment",
+    "DistributionTransformer",
+    "DistributionTransformerWinding",
+])
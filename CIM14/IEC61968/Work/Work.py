@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61968.Common.Document import Document
+from CIM14.Element import RefList
 
 class Work(Document):
     """Document used to request, initiate, track and record work. This is synonymous with Work Breakdown Structure (WBS), which is traversed through the (currently informative) recursive association of Work. Note that the work name is equal to the WBS name, which is given in the inherited 'name' attribute.
@@ -41,8 +42,8 @@ class Work(Document):
         #: Date and time work was requested.
         self.requestDateTime = requestDateTime
 
-        self._Customers = []
-        self.Customers = [] if Customers is None else Customers
+        if Customers is not None:
+            self.Customers = Customers
 
         super(Work, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class Work(Document):
     _enums = {"kind": "WorkKind"}
     _refs = ["Customers"]
     _many_refs = ["Customers"]
+    _inverses = {"Customers": "Works"}
 
     def getCustomers(self):
         """All the customers for which this work is performed.
@@ -60,20 +62,19 @@ class Work(Document):
 
     def setCustomers(self, value):
         for p in self._Customers:
-            filtered = [q for q in p.Works if q != self]
-            self._Customers._Works = filtered
+            p._Works.discard(self)
         for r in value:
             if self not in r._Works:
-                r._Works.append(self)
-        self._Customers = value
+                r._reflist("_Works").append(self)
+        self._Customers = RefList(value)
 
     Customers = property(getCustomers, setCustomers)
 
     def addCustomers(self, *Customers):
         for obj in Customers:
             if self not in obj._Works:
-                obj._Works.append(self)
-            self._Customers.append(obj)
+                obj._reflist("_Works").append(self)
+            self._reflist("_Customers").append(obj)
 
     def removeCustomers(self, *Customers):
         for obj in Customers:
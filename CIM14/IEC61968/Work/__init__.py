@@ -21,7 +21,8 @@
 """This package contains the core information classes that support work management and network extension planning applications.
 """
 
-from CIM14.IEC61968.Work.Work import Work
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Work"
 nsPrefix = "cimWork"
@@ -32,3 +33,8 @@ class WorkKind(str):
     Values are: construction, maintenance, reconnect, meter, service, disconnect, inspection, other
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Work",
+])
@@ -21,8 +21,23 @@
 """This package contains the information classes that extend IEC61970::Wires package with power system resources required for distribution network modelling, including unbalanced networks.
 """
 
-from CIM14.IEC61968.IEC61968CIMVersion import IEC61968CIMVersion
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#IEC61968"
 nsPrefix = "cimIEC61968"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "IEC61968CIMVersion",
+], [
+    "AssetModels",
+    "Assets",
+    "Common",
+    "Customers",
+    "LoadControl",
+    "Metering",
+    "PaymentMetering",
+    "WiresExt",
+    "Work",
+])
@@ -40,6 +40,7 @@ class ContingencyElement(IdentifiedObject):
     _enums = {}
     _refs = ["Contingency"]
     _many_refs = []
+    _inverses = {"Contingency": "ContingencyElement"}
 
     def getContingency(self):
         """A contingency element belongs to one contingency.
@@ -48,13 +49,12 @@ class ContingencyElement(IdentifiedObject):
 
     def setContingency(self, value):
         if self._Contingency is not None:
-            filtered = [x for x in self.Contingency.ContingencyElement if x != self]
-            self._Contingency._ContingencyElement = filtered
+            self._Contingency._ContingencyElement.discard(self)
 
         self._Contingency = value
         if self._Contingency is not None:
             if self not in self._Contingency._ContingencyElement:
-                self._Contingency._ContingencyElement.append(self)
+                self._Contingency._reflist("_ContingencyElement").append(self)
 
     Contingency = property(getContingency, setContingency)
 
@@ -21,9 +21,8 @@
 """Contingencies to be studied.
 """
 
-from CIM14.IEC61970.Contingency.ContingencyElement import ContingencyElement
-from CIM14.IEC61970.Contingency.ContingencyEquipment import ContingencyEquipment
-from CIM14.IEC61970.Contingency.Contingency import Contingency
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Contingency"
 nsPrefix = "cimContingency"
@@ -34,3 +33,10 @@ class ContingencyEquipmentStatusKind(str):
     Values are: outOfService, inService
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ContingencyElement",
+    "ContingencyEquipment",
+    "Contingency",
+])
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, RefList
 
 class TieFlow(Element):
     """A flow specification in terms of location and direction for a control area.
@@ -38,8 +38,8 @@ class TieFlow(Element):
         self._ControlArea = None
         self.ControlArea = ControlArea
 
-        self._AltTieMeas = []
-        self.AltTieMeas = [] if AltTieMeas is None else AltTieMeas
+        if AltTieMeas is not None:
+            self.AltTieMeas = AltTieMeas
 
         self._Terminal = None
         self.Terminal = Terminal
@@ -52,6 +52,7 @@ class TieFlow(Element):
     _enums = {}
     _refs = ["ControlArea", "AltTieMeas", "Terminal"]
     _many_refs = ["AltTieMeas"]
+    _inverses = {"ControlArea": "TieFlow", "AltTieMeas": "TieFlow", "Terminal": "TieFlow"}
 
     def getControlArea(self):
         """The control area of the tie flows.
@@ -60,13 +61,12 @@ class TieFlow(Element):
 
     def setControlArea(self, value):
         if self._ControlArea is not None:
-            filtered = [x for x in self.ControlArea.TieFlow if x != self]
-            self._ControlArea._TieFlow = filtered
+            self._ControlArea._TieFlow.discard(self)
 
         self._ControlArea = value
         if self._ControlArea is not None:
             if self not in self._ControlArea._TieFlow:
-                self._ControlArea._TieFlow.append(self)
+                self._ControlArea._reflist("_TieFlow").append(self)
 
     ControlArea = property(getControlArea, setControlArea)
 
@@ -76,7 +76,8 @@ class TieFlow(Element):
         return self._AltTieMeas
 
     def setAltTieMeas(self, value):
-        for x in self._AltTieMeas:
+        value = RefList(value)
+        for x in list(self._AltTieMeas):
             x.TieFlow = None
         for y in value:
             y._TieFlow = self
@@ -99,13 +100,12 @@ class TieFlow(Element):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.TieFlow if x != self]
-            self._Terminal._TieFlow = filtered
+            self._Terminal._TieFlow.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._TieFlow:
-                self._Terminal._TieFlow.append(self)
+                self._Terminal._reflist("_TieFlow").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
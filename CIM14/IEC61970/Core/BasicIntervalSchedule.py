@@ -56,4 +56,5 @@ class BasicIntervalSchedule(IdentifiedObject):
     _enums = {"value2Multiplier": "UnitMultiplier", "value2Unit": "UnitSymbol", "value1Multiplier": "UnitMultiplier", "value1Unit": "UnitSymbol"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
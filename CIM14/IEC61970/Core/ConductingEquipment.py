@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from CIM14.Element import RefList
 
 class ConductingEquipment(Equipment):
     """The parts of the power system that are designed to carry current or that are conductively connected therewith. ConductingEquipment is contained within an EquipmentContainer that may be a Substation, or a VoltageLevel or a Bay within a Substation.
@@ -37,20 +38,20 @@ class ConductingEquipment(Equipment):
         #: Describes the phases carried by a conducting equipment. Values are: "A", "AC", "AN", "ABCN", "B", "C", "BN", "CN", "splitSecondary12N", "ABC", "splitSecondary2N", "N", "ABN", "BC", "BCN", "AB", "splitSecondary1N", "ACN"
         self.phases = phases
 
-        self._ClearanceTags = []
-        self.ClearanceTags = [] if ClearanceTags is None else ClearanceTags
+        if ClearanceTags is not None:
+            self.ClearanceTags = ClearanceTags
 
         self._SvStatus = None
         self.SvStatus = SvStatus
 
-        self._Terminals = []
-        self.Terminals = [] if Terminals is None else Terminals
+        if Terminals is not None:
+            self.Terminals = Terminals
 
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
 
-        self._ProtectionEquipments = []
-        self.ProtectionEquipments = [] if ProtectionEquipments is None else ProtectionEquipments
+        if ProtectionEquipments is not None:
+            self.ProtectionEquipments = ProtectionEquipments
 
         super(ConductingEquipment, self).__init__(*args, **kw_args)
 
@@ -60,6 +61,7 @@ class ConductingEquipment(Equipment):
     _enums = {"phases": "PhaseCode"}
     _refs = ["ClearanceTags", "SvStatus", "Terminals", "BaseVoltage", "ProtectionEquipments"]
     _many_refs = ["ClearanceTags", "Terminals", "ProtectionEquipments"]
+    _inverses = {"ClearanceTags": "ConductingEquipment", "SvStatus": "ConductingEquipment", "Terminals": "ConductingEquipment", "BaseVoltage": "ConductingEquipment", "ProtectionEquipments": "ConductingEquipments"}
 
     def getClearanceTags(self):
         """Conducting equipment may have multiple clearance tags for authorized field work
@@ -67,7 +69,8 @@ class ConductingEquipment(Equipment):
         return self._ClearanceTags
 
     def setClearanceTags(self, value):
-        for x in self._ClearanceTags:
+        value = RefList(value)
+        for x in list(self._ClearanceTags):
             x.ConductingEquipment = None
         for y in value:
             y._ConductingEquipment = self
@@ -105,7 +108,8 @@ class ConductingEquipment(Equipment):
         return self._Terminals
 
     def setTerminals(self, value):
-        for x in self._Terminals:
+        value = RefList(value)
+        for x in list(self._Terminals):
             x.ConductingEquipment = None
         for y in value:
             y._ConductingEquipment = self
@@ -128,13 +132,12 @@ class ConductingEquipment(Equipment):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.ConductingEquipment if x != self]
-            self._BaseVoltage._ConductingEquipment = filtered
+            self._BaseVoltage._ConductingEquipment.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
             if self not in self._BaseVoltage._ConductingEquipment:
-                self._BaseVoltage._ConductingEquipment.append(self)
+                self._BaseVoltage._reflist("_ConductingEquipment").append(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
@@ -145,20 +148,19 @@ class ConductingEquipment(Equipment):
 
     def setProtectionEquipments(self, value):
         for p in self._ProtectionEquipments:
-            filtered = [q for q in p.ConductingEquipments if q != self]
-            self._ProtectionEquipments._ConductingEquipments = filtered
+            p._ConductingEquipments.discard(self)
         for r in value:
             if self not in r._ConductingEquipments:
-                r._ConductingEquipments.append(self)
-        self._ProtectionEquipments = value
+                r._reflist("_ConductingEquipments").append(self)
+        self._ProtectionEquipments = RefList(value)
 
     ProtectionEquipments = property(getProtectionEquipments, setProtectionEquipments)
 
     def addProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
             if self not in obj._ConductingEquipments:
-                obj._ConductingEquipments.append(self)
-            self._ProtectionEquipments.append(obj)
+                obj._reflist("_ConductingEquipments").append(self)
+            self._reflist("_ProtectionEquipments").append(obj)
 
     def removeProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
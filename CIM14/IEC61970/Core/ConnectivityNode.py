@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class ConnectivityNode(IdentifiedObject):
     """Connectivity nodes are points where terminals of conducting equipment are connected together with zero impedance.
@@ -41,8 +42,8 @@ class ConnectivityNode(IdentifiedObject):
         self._ConnectivityNodeContainer = None
         self.ConnectivityNodeContainer = ConnectivityNodeContainer
 
-        self._Terminals = []
-        self.Terminals = [] if Terminals is None else Terminals
+        if Terminals is not None:
+            self.Terminals = Terminals
 
         super(ConnectivityNode, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class ConnectivityNode(IdentifiedObject):
     _enums = {}
     _refs = ["TopologicalNode", "BusNameMarker", "ConnectivityNodeContainer", "Terminals"]
     _many_refs = ["Terminals"]
+    _inverses = {"TopologicalNode": "ConnectivityNodes", "BusNameMarker": "ConnectivityNode", "ConnectivityNodeContainer": "ConnectivityNodes", "Terminals": "ConnectivityNode"}
 
     def getTopologicalNode(self):
         """Several ConnectivityNode(s) may combine together to form a single TopologicalNode, depending on the current state of the network.
@@ -60,13 +62,12 @@ class ConnectivityNode(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         if self._TopologicalNode is not None:
-            filtered = [x for x in self.TopologicalNode.ConnectivityNodes if x != self]
-            self._TopologicalNode._ConnectivityNodes = filtered
+            self._TopologicalNode._ConnectivityNodes.discard(self)
 
         self._TopologicalNode = value
         if self._TopologicalNode is not None:
             if self not in self._TopologicalNode._ConnectivityNodes:
-                self._TopologicalNode._ConnectivityNodes.append(self)
+                self._TopologicalNode._reflist("_ConnectivityNodes").append(self)
 
     TopologicalNode = property(getTopologicalNode, setTopologicalNode)
 
@@ -77,13 +78,12 @@ class ConnectivityNode(IdentifiedObject):
 
     def setBusNameMarker(self, value):
         if self._BusNameMarker is not None:
-            filtered = [x for x in self.BusNameMarker.ConnectivityNode if x != self]
-            self._BusNameMarker._ConnectivityNode = filtered
+            self._BusNameMarker._ConnectivityNode.discard(self)
 
         self._BusNameMarker = value
         if self._BusNameMarker is not None:
             if self not in self._BusNameMarker._ConnectivityNode:
-                self._BusNameMarker._ConnectivityNode.append(self)
+                self._BusNameMarker._reflist("_ConnectivityNode").append(self)
 
     BusNameMarker = property(getBusNameMarker, setBusNameMarker)
 
@@ -94,13 +94,12 @@ class ConnectivityNode(IdentifiedObject):
 
     def setConnectivityNodeContainer(self, value):
         if self._ConnectivityNodeContainer is not None:
-            filtered = [x for x in self.ConnectivityNodeContainer.ConnectivityNodes if x != self]
-            self._ConnectivityNodeContainer._ConnectivityNodes = filtered
+            self._ConnectivityNodeContainer._ConnectivityNodes.discard(self)
 
         self._ConnectivityNodeContainer = value
         if self._ConnectivityNodeContainer is not None:
             if self not in self._ConnectivityNodeContainer._ConnectivityNodes:
-                self._ConnectivityNodeContainer._ConnectivityNodes.append(self)
+                self._ConnectivityNodeContainer._reflist("_ConnectivityNodes").append(self)
 
     ConnectivityNodeContainer = property(getConnectivityNodeContainer, setConnectivityNodeContainer)
 
@@ -110,7 +109,8 @@ class ConnectivityNode(IdentifiedObject):
         return self._Terminals
 
     def setTerminals(self, value):
-        for x in self._Terminals:
+        value = RefList(value)
+        for x in list(self._Terminals):
             x.ConnectivityNode = None
         for y in value:
             y._ConnectivityNode = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class Curve(IdentifiedObject):
     """A multi-purpose curve or functional relationship between an independent variable (X-axis) and dependent (Y-axis) variables.
@@ -65,8 +66,8 @@ class Curve(IdentifiedObject):
         #: The Y2-axis units of measure. Values are: "N", "VArh", "VA", "none", "m3", "kg/J", "deg", "W/Hz", "g", "Wh", "W/s", "Pa", "V/VAr", "ohm", "h", "F", "H", "m2", "VAr", "A", "rad", "s", "S", "VAh", "Hz", "oC", "s-1", "min", "J", "Hz-1", "J/s", "m", "W", "V"
         self.y2Unit = y2Unit
 
-        self._CurveDatas = []
-        self.CurveDatas = [] if CurveDatas is None else CurveDatas
+        if CurveDatas is not None:
+            self.CurveDatas = CurveDatas
 
         super(Curve, self).__init__(*args, **kw_args)
 
@@ -76,6 +77,7 @@ class Curve(IdentifiedObject):
     _enums = {"y2Multiplier": "UnitMultiplier", "y3Multiplier": "UnitMultiplier", "y1Unit": "UnitSymbol", "xMultiplier": "UnitMultiplier", "y3Unit": "UnitSymbol", "xUnit": "UnitSymbol", "y1Multiplier": "UnitMultiplier", "curveStyle": "CurveStyle", "y2Unit": "UnitSymbol"}
     _refs = ["CurveDatas"]
     _many_refs = ["CurveDatas"]
+    _inverses = {"CurveDatas": "Curve"}
 
     def getCurveDatas(self):
         """The point data values that define a curve
@@ -83,7 +85,8 @@ class Curve(IdentifiedObject):
         return self._CurveDatas
 
     def setCurveDatas(self, value):
-        for x in self._CurveDatas:
+        value = RefList(value)
+        for x in list(self._CurveDatas):
             x.Curve = None
         for y in value:
             y._Curve = self
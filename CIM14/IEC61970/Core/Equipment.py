@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import RefList
 
 class Equipment(PowerSystemResource):
     """The parts of a power system that are physical devices, electronic or mechanical
@@ -40,17 +41,17 @@ class Equipment(PowerSystemResource):
         #: The single instance of equipment represents multiple pieces of equipment that have been modeled together as an aggregate.  Examples would be PowerTransformers or SychronousMachines operating in parallel modeled as a single aggregate PowerTransformer or aggregate SynchronousMachine.  This is not to be used to indicate equipment that is part of a group of interdependent equipment produced by a network production program.
         self.aggregate = aggregate
 
-        self._OperationalLimitSet = []
-        self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
+        if OperationalLimitSet is not None:
+            self.OperationalLimitSet = OperationalLimitSet
 
-        self._ContingencyEquipment = []
-        self.ContingencyEquipment = [] if ContingencyEquipment is None else ContingencyEquipment
+        if ContingencyEquipment is not None:
+            self.ContingencyEquipment = ContingencyEquipment
 
         self._EquipmentContainer = None
         self.EquipmentContainer = EquipmentContainer
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
         super(Equipment, self).__init__(*args, **kw_args)
 
@@ -60,6 +61,7 @@ class Equipment(PowerSystemResource):
     _enums = {}
     _refs = ["OperationalLimitSet", "ContingencyEquipment", "EquipmentContainer", "CustomerAgreements"]
     _many_refs = ["OperationalLimitSet", "ContingencyEquipment", "CustomerAgreements"]
+    _inverses = {"OperationalLimitSet": "Equipment", "ContingencyEquipment": "Equipment", "EquipmentContainer": "Equipments", "CustomerAgreements": "Equipments"}
 
     def getOperationalLimitSet(self):
         """The equipment limit sets associated with the equipment.
@@ -67,7 +69,8 @@ class Equipment(PowerSystemResource):
         return self._OperationalLimitSet
 
     def setOperationalLimitSet(self, value):
-        for x in self._OperationalLimitSet:
+        value = RefList(value)
+        for x in list(self._OperationalLimitSet):
             x.Equipment = None
         for y in value:
             y._Equipment = self
@@ -89,7 +92,8 @@ class Equipment(PowerSystemResource):
         return self._ContingencyEquipment
 
     def setContingencyEquipment(self, value):
-        for x in self._ContingencyEquipment:
+        value = RefList(value)
+        for x in list(self._ContingencyEquipment):
             x.Equipment = None
         for y in value:
             y._Equipment = self
@@ -112,13 +116,12 @@ class Equipment(PowerSystemResource):
 
     def setEquipmentContainer(self, value):
         if self._EquipmentContainer is not None:
-            filtered = [x for x in self.EquipmentContainer.Equipments if x != self]
-            self._EquipmentContainer._Equipments = filtered
+            self._EquipmentContainer._Equipments.discard(self)
 
         self._EquipmentContainer = value
         if self._EquipmentContainer is not None:
             if self not in self._EquipmentContainer._Equipments:
-                self._EquipmentContainer._Equipments.append(self)
+                self._EquipmentContainer._reflist("_Equipments").append(self)
 
     EquipmentContainer = property(getEquipmentContainer, setEquipmentContainer)
 
@@ -128,20 +131,19 @@ class Equipment(PowerSystemResource):
 
     def setCustomerAgreements(self, value):
         for p in self._CustomerAgreements:
-            filtered = [q for q in p.Equipments if q != self]
-            self._CustomerAgreements._Equipments = filtered
+            p._Equipments.discard(self)
         for r in value:
             if self not in r._Equipments:
-                r._Equipments.append(self)
-        self._CustomerAgreements = value
+                r._reflist("_Equipments").append(self)
+        self._CustomerAgreements = RefList(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
             if self not in obj._Equipments:
-                obj._Equipments.append(self)
-            self._CustomerAgreements.append(obj)
+                obj._reflist("_Equipments").append(self)
+            self._reflist("_CustomerAgreements").append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
@@ -64,6 +64,7 @@ class IdentifiedObject(Element):
     _enums = {}
     _refs = ["ModelingAuthoritySet"]
     _many_refs = []
+    _inverses = {"ModelingAuthoritySet": "IdentifiedObjects"}
 
     def getModelingAuthoritySet(self):
         """An IdentifiedObject belongs to a Modeling Authority Set for purposes of defining a group of data maintained by the same Modeling Authority.
@@ -72,13 +73,12 @@ class IdentifiedObject(Element):
 
     def setModelingAuthoritySet(self, value):
         if self._ModelingAuthoritySet is not None:
-            filtered = [x for x in self.ModelingAuthoritySet.IdentifiedObjects if x != self]
-            self._ModelingAuthoritySet._IdentifiedObjects = filtered
+            self._ModelingAuthoritySet._IdentifiedObjects.discard(self)
 
         self._ModelingAuthoritySet = value
         if self._ModelingAuthoritySet is not None:
             if self not in self._ModelingAuthoritySet._IdentifiedObjects:
-                self._ModelingAuthoritySet._IdentifiedObjects.append(self)
+                self._ModelingAuthoritySet._reflist("_IdentifiedObjects").append(self)
 
     ModelingAuthoritySet = property(getModelingAuthoritySet, setModelingAuthoritySet)
 
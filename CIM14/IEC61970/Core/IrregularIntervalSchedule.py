@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.BasicIntervalSchedule import BasicIntervalSchedule
+from CIM14.Element import RefList
 
 class IrregularIntervalSchedule(BasicIntervalSchedule):
     """The schedule has TimePoints where the time between them varies.
@@ -29,8 +30,8 @@ class IrregularIntervalSchedule(BasicIntervalSchedule):
 
         @param TimePoints: The point data values that define a curve
         """
-        self._TimePoints = []
-        self.TimePoints = [] if TimePoints is None else TimePoints
+        if TimePoints is not None:
+            self.TimePoints = TimePoints
 
         super(IrregularIntervalSchedule, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class IrregularIntervalSchedule(BasicIntervalSchedule):
     _enums = {}
     _refs = ["TimePoints"]
     _many_refs = ["TimePoints"]
+    _inverses = {"TimePoints": "IntervalSchedule"}
 
     def getTimePoints(self):
         """The point data values that define a curve
@@ -47,7 +49,8 @@ class IrregularIntervalSchedule(BasicIntervalSchedule):
         return self._TimePoints
 
     def setTimePoints(self, value):
-        for x in self._TimePoints:
+        value = RefList(value)
+        for x in list(self._TimePoints):
             x.IntervalSchedule = None
         for y in value:
             y._IntervalSchedule = self
@@ -52,6 +52,7 @@ class IrregularTimePoint(Element):
     _enums = {}
     _refs = ["IntervalSchedule"]
     _many_refs = []
+    _inverses = {"IntervalSchedule": "TimePoints"}
 
     def getIntervalSchedule(self):
         """An IrregularTimePoint belongs to an IrregularIntervalSchedule.
@@ -60,13 +61,12 @@ class IrregularTimePoint(Element):
 
     def setIntervalSchedule(self, value):
         if self._IntervalSchedule is not None:
-            filtered = [x for x in self.IntervalSchedule.TimePoints if x != self]
-            self._IntervalSchedule._TimePoints = filtered
+            self._IntervalSchedule._TimePoints.discard(self)
 
         self._IntervalSchedule = value
         if self._IntervalSchedule is not None:
             if self not in self._IntervalSchedule._TimePoints:
-                self._IntervalSchedule._TimePoints.append(self)
+                self._IntervalSchedule._reflist("_TimePoints").append(self)
 
     IntervalSchedule = property(getIntervalSchedule, setIntervalSchedule)
 
@@ -48,6 +48,7 @@ class OperatingShare(Element):
     _enums = {}
     _refs = ["PowerSystemResource", "OperatingParticipant"]
     _many_refs = []
+    _inverses = {"PowerSystemResource": "OperatingShare", "OperatingParticipant": "OperatingShare"}
 
     def getPowerSystemResource(self):
         """The PowerSystemResource to which the attribues apply.   The percentage ownership of all owners of a PowerSystemResource should add to 100%.
@@ -56,13 +57,12 @@ class OperatingShare(Element):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.OperatingShare if x != self]
-            self._PowerSystemResource._OperatingShare = filtered
+            self._PowerSystemResource._OperatingShare.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
             if self not in self._PowerSystemResource._OperatingShare:
-                self._PowerSystemResource._OperatingShare.append(self)
+                self._PowerSystemResource._reflist("_OperatingShare").append(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -73,13 +73,12 @@ class OperatingShare(Element):
 
     def setOperatingParticipant(self, value):
         if self._OperatingParticipant is not None:
-            filtered = [x for x in self.OperatingParticipant.OperatingShare if x != self]
-            self._OperatingParticipant._OperatingShare = filtered
+            self._OperatingParticipant._OperatingShare.discard(self)
 
         self._OperatingParticipant = value
         if self._OperatingParticipant is not None:
             if self not in self._OperatingParticipant._OperatingShare:
-                self._OperatingParticipant._OperatingShare.append(self)
+                self._OperatingParticipant._reflist("_OperatingShare").append(self)
 
     OperatingParticipant = property(getOperatingParticipant, setOperatingParticipant)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class PowerSystemResource(IdentifiedObject):
     """A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a  Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.
@@ -40,26 +41,26 @@ class PowerSystemResource(IdentifiedObject):
         self._Location = None
         self.Location = Location
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
-        self._PsrLists = []
-        self.PsrLists = [] if PsrLists is None else PsrLists
+        if PsrLists is not None:
+            self.PsrLists = PsrLists
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
-        self._OperatingShare = []
-        self.OperatingShare = [] if OperatingShare is None else OperatingShare
+        if OperatingShare is not None:
+            self.OperatingShare = OperatingShare
 
         self._OutageSchedule = None
         self.OutageSchedule = OutageSchedule
 
-        self._ReportingGroup = []
-        self.ReportingGroup = [] if ReportingGroup is None else ReportingGroup
+        if ReportingGroup is not None:
+            self.ReportingGroup = ReportingGroup
 
-        self._Block = []
-        self.Block = [] if Block is None else Block
+        if Block is not None:
+            self.Block = Block
 
         self._PSRType = None
         self.PSRType = PSRType
@@ -72,6 +73,7 @@ class PowerSystemResource(IdentifiedObject):
     _enums = {}
     _refs = ["Location", "Assets", "PsrLists", "Measurements", "OperatingShare", "OutageSchedule", "ReportingGroup", "Block", "PSRType"]
     _many_refs = ["Assets", "PsrLists", "Measurements", "OperatingShare", "ReportingGroup", "Block"]
+    _inverses = {"Location": "PowerSystemResources", "Assets": "PowerSystemResources", "PsrLists": "PowerSystemResources", "Measurements": "PowerSystemResource", "OperatingShare": "PowerSystemResource", "OutageSchedule": "PowerSystemResource", "ReportingGroup": "PowerSystemResource", "Block": "PowerSystemResource", "PSRType": "PowerSystemResources"}
 
     def getLocation(self):
         """Location of this power system resource.
@@ -80,13 +82,12 @@ class PowerSystemResource(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PowerSystemResources if x != self]
-            self._Location._PowerSystemResources = filtered
+            self._Location._PowerSystemResources.discard(self)
 
         self._Location = value
         if self._Location is not None:
             if self not in self._Location._PowerSystemResources:
-                self._Location._PowerSystemResources.append(self)
+                self._Location._reflist("_PowerSystemResources").append(self)
 
     Location = property(getLocation, setLocation)
 
@@ -97,20 +98,19 @@ class PowerSystemResource(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._Assets._PowerSystemResources = filtered
+            p._PowerSystemResources.discard(self)
         for r in value:
             if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
-        self._Assets = value
+                r._reflist("_PowerSystemResources").append(self)
+        self._Assets = RefList(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
             if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._Assets.append(obj)
+                obj._reflist("_PowerSystemResources").append(self)
+            self._reflist("_Assets").append(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
@@ -124,20 +124,19 @@ class PowerSystemResource(IdentifiedObject):
 
     def setPsrLists(self, value):
         for p in self._PsrLists:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._PsrLists._PowerSystemResources = filtered
+            p._PowerSystemResources.discard(self)
         for r in value:
             if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
-        self._PsrLists = value
+                r._reflist("_PowerSystemResources").append(self)
+        self._PsrLists = RefList(value)
 
     PsrLists = property(getPsrLists, setPsrLists)
 
     def addPsrLists(self, *PsrLists):
         for obj in PsrLists:
             if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._PsrLists.append(obj)
+                obj._reflist("_PowerSystemResources").append(self)
+            self._reflist("_PsrLists").append(obj)
 
     def removePsrLists(self, *PsrLists):
         for obj in PsrLists:
@@ -151,7 +150,8 @@ class PowerSystemResource(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
-        for x in self._Measurements:
+        value = RefList(value)
+        for x in list(self._Measurements):
             x.PowerSystemResource = None
         for y in value:
             y._PowerSystemResource = self
@@ -173,7 +173,8 @@ class PowerSystemResource(IdentifiedObject):
         return self._OperatingShare
 
     def setOperatingShare(self, value):
-        for x in self._OperatingShare:
+        value = RefList(value)
+        for x in list(self._OperatingShare):
             x.PowerSystemResource = None
         for y in value:
             y._PowerSystemResource = self
@@ -212,20 +213,19 @@ class PowerSystemResource(IdentifiedObject):
 
     def setReportingGroup(self, value):
         for p in self._ReportingGroup:
-            filtered = [q for q in p.PowerSystemResource if q != self]
-            self._ReportingGroup._PowerSystemResource = filtered
+            p._PowerSystemResource.discard(self)
         for r in value:
             if self not in r._PowerSystemResource:
-                r._PowerSystemResource.append(self)
-        self._ReportingGroup = value
+                r._reflist("_PowerSystemResource").append(self)
+        self._ReportingGroup = RefList(value)
 
     ReportingGroup = property(getReportingGroup, setReportingGroup)
 
     def addReportingGroup(self, *ReportingGroup):
         for obj in ReportingGroup:
             if self not in obj._PowerSystemResource:
-                obj._PowerSystemResource.append(self)
-            self._ReportingGroup.append(obj)
+                obj._reflist("_PowerSystemResource").append(self)
+            self._reflist("_ReportingGroup").append(obj)
 
     def removeReportingGroup(self, *ReportingGroup):
         for obj in ReportingGroup:
@@ -239,7 +239,8 @@ class PowerSystemResource(IdentifiedObject):
         return self._Block
 
     def setBlock(self, value):
-        for x in self._Block:
+        value = RefList(value)
+        for x in list(self._Block):
             x.PowerSystemResource = None
         for y in value:
             y._PowerSystemResource = self
@@ -262,13 +263,12 @@ class PowerSystemResource(IdentifiedObject):
 
     def setPSRType(self, value):
         if self._PSRType is not None:
-            filtered = [x for x in self.PSRType.PowerSystemResources if x != self]
-            self._PSRType._PowerSystemResources = filtered
+            self._PSRType._PowerSystemResources.discard(self)
 
         self._PSRType = value
         if self._PSRType is not None:
             if self not in self._PSRType._PowerSystemResources:
-                self._PSRType._PowerSystemResources.append(self)
+                self._PSRType._reflist("_PowerSystemResources").append(self)
 
     PSRType = property(getPSRType, setPSRType)
 
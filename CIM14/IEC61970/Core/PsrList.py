@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class PsrList(IdentifiedObject):
     """Arbitrary list of PowerSystemResources. Can be used for various purposes, including grouping for report generation.
@@ -33,8 +34,8 @@ class PsrList(IdentifiedObject):
         #: Type of power system resources in this list.
         self.typePSRList = typePSRList
 
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         super(PsrList, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class PsrList(IdentifiedObject):
     _enums = {}
     _refs = ["PowerSystemResources"]
     _many_refs = ["PowerSystemResources"]
+    _inverses = {"PowerSystemResources": "PsrLists"}
 
     def getPowerSystemResources(self):
         
@@ -51,20 +53,19 @@ class PsrList(IdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.PsrLists if q != self]
-            self._PowerSystemResources._PsrLists = filtered
+            p._PsrLists.discard(self)
         for r in value:
             if self not in r._PsrLists:
-                r._PsrLists.append(self)
-        self._PowerSystemResources = value
+                r._reflist("_PsrLists").append(self)
+        self._PowerSystemResources = RefList(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
             if self not in obj._PsrLists:
-                obj._PsrLists.append(self)
-            self._PowerSystemResources.append(obj)
+                obj._reflist("_PsrLists").append(self)
+            self._reflist("_PowerSystemResources").append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
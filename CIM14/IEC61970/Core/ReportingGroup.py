@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class ReportingGroup(IdentifiedObject):
     """A reporting group is used for various ad-hoc groupings used for reporting.
@@ -35,14 +36,14 @@ class ReportingGroup(IdentifiedObject):
         self._ReportingSuperGroup = None
         self.ReportingSuperGroup = ReportingSuperGroup
 
-        self._TopologicalNode = []
-        self.TopologicalNode = [] if TopologicalNode is None else TopologicalNode
+        if TopologicalNode is not None:
+            self.TopologicalNode = TopologicalNode
 
-        self._BusNameMarker = []
-        self.BusNameMarker = [] if BusNameMarker is None else BusNameMarker
+        if BusNameMarker is not None:
+            self.BusNameMarker = BusNameMarker
 
-        self._PowerSystemResource = []
-        self.PowerSystemResource = [] if PowerSystemResource is None else PowerSystemResource
+        if PowerSystemResource is not None:
+            self.PowerSystemResource = PowerSystemResource
 
         super(ReportingGroup, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class ReportingGroup(IdentifiedObject):
     _enums = {}
     _refs = ["ReportingSuperGroup", "TopologicalNode", "BusNameMarker", "PowerSystemResource"]
     _many_refs = ["TopologicalNode", "BusNameMarker", "PowerSystemResource"]
+    _inverses = {"ReportingSuperGroup": "ReportingGroup", "TopologicalNode": "ReportingGroup", "BusNameMarker": "ReportingGroup", "PowerSystemResource": "ReportingGroup"}
 
     def getReportingSuperGroup(self):
         """Reporting super group to which this reporting group belongs.
@@ -60,13 +62,12 @@ class ReportingGroup(IdentifiedObject):
 
     def setReportingSuperGroup(self, value):
         if self._ReportingSuperGroup is not None:
-            filtered = [x for x in self.ReportingSuperGroup.ReportingGroup if x != self]
-            self._ReportingSuperGroup._ReportingGroup = filtered
+            self._ReportingSuperGroup._ReportingGroup.discard(self)
 
         self._ReportingSuperGroup = value
         if self._ReportingSuperGroup is not None:
             if self not in self._ReportingSuperGroup._ReportingGroup:
-                self._ReportingSuperGroup._ReportingGroup.append(self)
+                self._ReportingSuperGroup._reflist("_ReportingGroup").append(self)
 
     ReportingSuperGroup = property(getReportingSuperGroup, setReportingSuperGroup)
 
@@ -76,7 +77,8 @@ class ReportingGroup(IdentifiedObject):
         return self._TopologicalNode
 
     def setTopologicalNode(self, value):
-        for x in self._TopologicalNode:
+        value = RefList(value)
+        for x in list(self._TopologicalNode):
             x.ReportingGroup = None
         for y in value:
             y._ReportingGroup = self
@@ -98,7 +100,8 @@ class ReportingGroup(IdentifiedObject):
         return self._BusNameMarker
 
     def setBusNameMarker(self, value):
-        for x in self._BusNameMarker:
+        value = RefList(value)
+        for x in list(self._BusNameMarker):
             x.ReportingGroup = None
         for y in value:
             y._ReportingGroup = self
@@ -121,20 +124,19 @@ class ReportingGroup(IdentifiedObject):
 
     def setPowerSystemResource(self, value):
         for p in self._PowerSystemResource:
-            filtered = [q for q in p.ReportingGroup if q != self]
-            self._PowerSystemResource._ReportingGroup = filtered
+            p._ReportingGroup.discard(self)
         for r in value:
             if self not in r._ReportingGroup:
-                r._ReportingGroup.append(self)
-        self._PowerSystemResource = value
+                r._reflist("_ReportingGroup").append(self)
+        self._PowerSystemResource = RefList(value)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
     def addPowerSystemResource(self, *PowerSystemResource):
         for obj in PowerSystemResource:
             if self not in obj._ReportingGroup:
-                obj._ReportingGroup.append(self)
-            self._PowerSystemResource.append(obj)
+                obj._reflist("_ReportingGroup").append(self)
+            self._reflist("_PowerSystemResource").append(obj)
 
     def removePowerSystemResource(self, *PowerSystemResource):
         for obj in PowerSystemResource:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.EquipmentContainer import EquipmentContainer
+from CIM14.Element import RefList
 
 class Substation(EquipmentContainer):
     """A collection of equipment for purposes other than generation or utilization, through which electric energy in bulk is passed for the purposes of switching or modifying its characteristics.
@@ -31,11 +32,11 @@ class Substation(EquipmentContainer):
         @param Bays: The association is used in the naming hierarchy.
         @param Region: The association is used in the naming hierarchy.
         """
-        self._VoltageLevels = []
-        self.VoltageLevels = [] if VoltageLevels is None else VoltageLevels
+        if VoltageLevels is not None:
+            self.VoltageLevels = VoltageLevels
 
-        self._Bays = []
-        self.Bays = [] if Bays is None else Bays
+        if Bays is not None:
+            self.Bays = Bays
 
         self._Region = None
         self.Region = Region
@@ -48,6 +49,7 @@ class Substation(EquipmentContainer):
     _enums = {}
     _refs = ["VoltageLevels", "Bays", "Region"]
     _many_refs = ["VoltageLevels", "Bays"]
+    _inverses = {"VoltageLevels": "Substation", "Bays": "Substation", "Region": "Substations"}
 
     def getVoltageLevels(self):
         """The association is used in the naming hierarchy.
@@ -55,7 +57,8 @@ class Substation(EquipmentContainer):
         return self._VoltageLevels
 
     def setVoltageLevels(self, value):
-        for x in self._VoltageLevels:
+        value = RefList(value)
+        for x in list(self._VoltageLevels):
             x.Substation = None
         for y in value:
             y._Substation = self
@@ -77,7 +80,8 @@ class Substation(EquipmentContainer):
         return self._Bays
 
     def setBays(self, value):
-        for x in self._Bays:
+        value = RefList(value)
+        for x in list(self._Bays):
             x.Substation = None
         for y in value:
             y._Substation = self
@@ -100,13 +104,12 @@ class Substation(EquipmentContainer):
 
     def setRegion(self, value):
         if self._Region is not None:
-            filtered = [x for x in self.Region.Substations if x != self]
-            self._Region._Substations = filtered
+            self._Region._Substations.discard(self)
 
         self._Region = value
         if self._Region is not None:
             if self not in self._Region._Substations:
-                self._Region._Substations.append(self)
+                self._Region._reflist("_Substations").append(self)
 
     Region = property(getRegion, setRegion)
 
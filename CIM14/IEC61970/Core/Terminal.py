@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class Terminal(IdentifiedObject):
     """An electrical connection point to a piece of conducting equipment. Terminals are connected at physical connection points called 'connectivity nodes'.
@@ -51,29 +52,29 @@ class Terminal(IdentifiedObject):
         self._TopologicalNode = None
         self.TopologicalNode = TopologicalNode
 
-        self._Block = []
-        self.Block = [] if Block is None else Block
+        if Block is not None:
+            self.Block = Block
 
-        self._OperationalLimitSet = []
-        self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
+        if OperationalLimitSet is not None:
+            self.OperationalLimitSet = OperationalLimitSet
 
-        self._HasSecond_MutualCoupling = []
-        self.HasSecond_MutualCoupling = [] if HasSecond_MutualCoupling is None else HasSecond_MutualCoupling
+        if HasSecond_MutualCoupling is not None:
+            self.HasSecond_MutualCoupling = HasSecond_MutualCoupling
 
-        self._RegulatingControl = []
-        self.RegulatingControl = [] if RegulatingControl is None else RegulatingControl
+        if RegulatingControl is not None:
+            self.RegulatingControl = RegulatingControl
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
-        self._BranchGroupTerminal = []
-        self.BranchGroupTerminal = [] if BranchGroupTerminal is None else BranchGroupTerminal
+        if BranchGroupTerminal is not None:
+            self.BranchGroupTerminal = BranchGroupTerminal
 
         self._ConductingEquipment = None
         self.ConductingEquipment = ConductingEquipment
 
-        self._HasFirst_MutualCoupling = []
-        self.HasFirst_MutualCoupling = [] if HasFirst_MutualCoupling is None else HasFirst_MutualCoupling
+        if HasFirst_MutualCoupling is not None:
+            self.HasFirst_MutualCoupling = HasFirst_MutualCoupling
 
         self._SvPowerFlow = None
         self.SvPowerFlow = SvPowerFlow
@@ -81,8 +82,8 @@ class Terminal(IdentifiedObject):
         self._ConnectivityNode = None
         self.ConnectivityNode = ConnectivityNode
 
-        self._TieFlow = []
-        self.TieFlow = [] if TieFlow is None else TieFlow
+        if TieFlow is not None:
+            self.TieFlow = TieFlow
 
         super(Terminal, self).__init__(*args, **kw_args)
 
@@ -92,6 +93,7 @@ class Terminal(IdentifiedObject):
     _enums = {}
     _refs = ["TopologicalNode", "Block", "OperationalLimitSet", "HasSecond_MutualCoupling", "RegulatingControl", "Measurements", "BranchGroupTerminal", "ConductingEquipment", "HasFirst_MutualCoupling", "SvPowerFlow", "ConnectivityNode", "TieFlow"]
     _many_refs = ["Block", "OperationalLimitSet", "HasSecond_MutualCoupling", "RegulatingControl", "Measurements", "BranchGroupTerminal", "HasFirst_MutualCoupling", "TieFlow"]
+    _inverses = {"TopologicalNode": "Terminal", "Block": "Terminal", "OperationalLimitSet": "Terminal", "HasSecond_MutualCoupling": "Second_Terminal", "RegulatingControl": "Terminal", "Measurements": "Terminal", "BranchGroupTerminal": "Terminal", "ConductingEquipment": "Terminals", "HasFirst_MutualCoupling": "First_Terminal", "SvPowerFlow": "Terminal", "ConnectivityNode": "Terminals", "TieFlow": "Terminal"}
 
     def getTopologicalNode(self):
         """The topological node associated with the terminal.   This can be used as an alternative to the connectivity node path to topological node, thus making it unneccesary to model connedtivity nodes in some cases.   Note that the if connectivity nodes are in the model, this association would proably not be used.
@@ -100,13 +102,12 @@ class Terminal(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         if self._TopologicalNode is not None:
-            filtered = [x for x in self.TopologicalNode.Terminal if x != self]
-            self._TopologicalNode._Terminal = filtered
+            self._TopologicalNode._Terminal.discard(self)
 
         self._TopologicalNode = value
         if self._TopologicalNode is not None:
             if self not in self._TopologicalNode._Terminal:
-                self._TopologicalNode._Terminal.append(self)
+                self._TopologicalNode._reflist("_Terminal").append(self)
 
     TopologicalNode = property(getTopologicalNode, setTopologicalNode)
 
@@ -116,7 +117,8 @@ class Terminal(IdentifiedObject):
         return self._Block
 
     def setBlock(self, value):
-        for x in self._Block:
+        value = RefList(value)
+        for x in list(self._Block):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -138,7 +140,8 @@ class Terminal(IdentifiedObject):
         return self._OperationalLimitSet
 
     def setOperationalLimitSet(self, value):
-        for x in self._OperationalLimitSet:
+        value = RefList(value)
+        for x in list(self._OperationalLimitSet):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -160,7 +163,8 @@ class Terminal(IdentifiedObject):
         return self._HasSecond_MutualCoupling
 
     def setHasSecond_MutualCoupling(self, value):
-        for x in self._HasSecond_MutualCoupling:
+        value = RefList(value)
+        for x in list(self._HasSecond_MutualCoupling):
             x.Second_Terminal = None
         for y in value:
             y._Second_Terminal = self
@@ -182,7 +186,8 @@ class Terminal(IdentifiedObject):
         return self._RegulatingControl
 
     def setRegulatingControl(self, value):
-        for x in self._RegulatingControl:
+        value = RefList(value)
+        for x in list(self._RegulatingControl):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -204,7 +209,8 @@ class Terminal(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
-        for x in self._Measurements:
+        value = RefList(value)
+        for x in list(self._Measurements):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -226,7 +232,8 @@ class Terminal(IdentifiedObject):
         return self._BranchGroupTerminal
 
     def setBranchGroupTerminal(self, value):
-        for x in self._BranchGroupTerminal:
+        value = RefList(value)
+        for x in list(self._BranchGroupTerminal):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -249,13 +256,12 @@ class Terminal(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.Terminals if x != self]
-            self._ConductingEquipment._Terminals = filtered
+            self._ConductingEquipment._Terminals.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
             if self not in self._ConductingEquipment._Terminals:
-                self._ConductingEquipment._Terminals.append(self)
+                self._ConductingEquipment._reflist("_Terminals").append(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
@@ -265,7 +271,8 @@ class Terminal(IdentifiedObject):
         return self._HasFirst_MutualCoupling
 
     def setHasFirst_MutualCoupling(self, value):
-        for x in self._HasFirst_MutualCoupling:
+        value = RefList(value)
+        for x in list(self._HasFirst_MutualCoupling):
             x.First_Terminal = None
         for y in value:
             y._First_Terminal = self
@@ -304,13 +311,12 @@ class Terminal(IdentifiedObject):
 
     def setConnectivityNode(self, value):
         if self._ConnectivityNode is not None:
-            filtered = [x for x in self.ConnectivityNode.Terminals if x != self]
-            self._ConnectivityNode._Terminals = filtered
+            self._ConnectivityNode._Terminals.discard(self)
 
         self._ConnectivityNode = value
         if self._ConnectivityNode is not None:
             if self not in self._ConnectivityNode._Terminals:
-                self._ConnectivityNode._Terminals.append(self)
+                self._ConnectivityNode._reflist("_Terminals").append(self)
 
     ConnectivityNode = property(getConnectivityNode, setConnectivityNode)
 
@@ -320,7 +326,8 @@ class Terminal(IdentifiedObject):
         return self._TieFlow
 
     def setTieFlow(self, value):
-        for x in self._TieFlow:
+        value = RefList(value)
+        for x in list(self._TieFlow):
             x.Terminal = None
         for y in value:
             y._Terminal = self
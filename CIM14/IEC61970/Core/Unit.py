@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class Unit(IdentifiedObject):
     """Quantity being measured. The Unit.name shall be unique among all specified quantities and describe the quantity. The Unit.aliasName is meant to be used for localization.
@@ -33,20 +34,20 @@ class Unit(IdentifiedObject):
         @param MetaBlockConInput:
         @param ProtectionEquipments: The Protection Equipments having the Unit.
         """
-        self._Controls = []
-        self.Controls = [] if Controls is None else Controls
+        if Controls is not None:
+            self.Controls = Controls
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
-        self._MetaBlockConOutput = []
-        self.MetaBlockConOutput = [] if MetaBlockConOutput is None else MetaBlockConOutput
+        if MetaBlockConOutput is not None:
+            self.MetaBlockConOutput = MetaBlockConOutput
 
-        self._MetaBlockConInput = []
-        self.MetaBlockConInput = [] if MetaBlockConInput is None else MetaBlockConInput
+        if MetaBlockConInput is not None:
+            self.MetaBlockConInput = MetaBlockConInput
 
-        self._ProtectionEquipments = []
-        self.ProtectionEquipments = [] if ProtectionEquipments is None else ProtectionEquipments
+        if ProtectionEquipments is not None:
+            self.ProtectionEquipments = ProtectionEquipments
 
         super(Unit, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class Unit(IdentifiedObject):
     _enums = {}
     _refs = ["Controls", "Measurements", "MetaBlockConOutput", "MetaBlockConInput", "ProtectionEquipments"]
     _many_refs = ["Controls", "Measurements", "MetaBlockConOutput", "MetaBlockConInput", "ProtectionEquipments"]
+    _inverses = {"Controls": "Unit", "Measurements": "Unit", "MetaBlockConOutput": "Unit", "MetaBlockConInput": "Unit", "ProtectionEquipments": "Unit"}
 
     def getControls(self):
         """The Controls having the Unit.
@@ -63,7 +65,8 @@ class Unit(IdentifiedObject):
         return self._Controls
 
     def setControls(self, value):
-        for x in self._Controls:
+        value = RefList(value)
+        for x in list(self._Controls):
             x.Unit = None
         for y in value:
             y._Unit = self
@@ -85,7 +88,8 @@ class Unit(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
-        for x in self._Measurements:
+        value = RefList(value)
+        for x in list(self._Measurements):
             x.Unit = None
         for y in value:
             y._Unit = self
@@ -106,7 +110,8 @@ class Unit(IdentifiedObject):
         return self._MetaBlockConOutput
 
     def setMetaBlockConOutput(self, value):
-        for x in self._MetaBlockConOutput:
+        value = RefList(value)
+        for x in list(self._MetaBlockConOutput):
             x.Unit = None
         for y in value:
             y._Unit = self
@@ -127,7 +132,8 @@ class Unit(IdentifiedObject):
         return self._MetaBlockConInput
 
     def setMetaBlockConInput(self, value):
-        for x in self._MetaBlockConInput:
+        value = RefList(value)
+        for x in list(self._MetaBlockConInput):
             x.Unit = None
         for y in value:
             y._Unit = self
@@ -149,7 +155,8 @@ class Unit(IdentifiedObject):
         return self._ProtectionEquipments
 
     def setProtectionEquipments(self, value):
-        for x in self._ProtectionEquipments:
+        value = RefList(value)
+        for x in list(self._ProtectionEquipments):
             x.Unit = None
         for y in value:
             y._Unit = self
@@ -21,35 +21,8 @@
 """Contains the core PowerSystemResource and ConductingEquipment entities shared by all applications plus common collections of those entities. Not all applications require all the Core entities.  This package does not depend on any other package except the Domain package, but most of the other packages have associations and generalizations that depend on it.
 """
 
-from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
-from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
-from CIM14.IEC61970.Core.Equipment import Equipment
-from CIM14.IEC61970.Core.ConductingEquipment import ConductingEquipment
-from CIM14.IEC61970.Core.Curve import Curve
-from CIM14.IEC61970.Core.BasicIntervalSchedule import BasicIntervalSchedule
-from CIM14.IEC61970.Core.IrregularIntervalSchedule import IrregularIntervalSchedule
-from CIM14.IEC61970.Core.RegularIntervalSchedule import RegularIntervalSchedule
-from CIM14.IEC61970.Core.ConnectivityNodeContainer import ConnectivityNodeContainer
-from CIM14.IEC61970.Core.EquipmentContainer import EquipmentContainer
-from CIM14.IEC61970.Core.CurveData import CurveData
-from CIM14.IEC61970.Core.Bay import Bay
-from CIM14.IEC61970.Core.PSRType import PSRType
-from CIM14.IEC61970.Core.GeographicalRegion import GeographicalRegion
-from CIM14.IEC61970.Core.Terminal import Terminal
-from CIM14.IEC61970.Core.OperatingParticipant import OperatingParticipant
-from CIM14.IEC61970.Core.VoltageLevel import VoltageLevel
-from CIM14.IEC61970.Core.ConnectivityNode import ConnectivityNode
-from CIM14.IEC61970.Core.BasePower import BasePower
-from CIM14.IEC61970.Core.Unit import Unit
-from CIM14.IEC61970.Core.BaseVoltage import BaseVoltage
-from CIM14.IEC61970.Core.SubGeographicalRegion import SubGeographicalRegion
-from CIM14.IEC61970.Core.PsrList import PsrList
-from CIM14.IEC61970.Core.Substation import Substation
-from CIM14.IEC61970.Core.ReportingGroup import ReportingGroup
-from CIM14.IEC61970.Core.ReportingSuperGroup import ReportingSuperGroup
-from CIM14.IEC61970.Core.RegularTimePoint import RegularTimePoint
-from CIM14.IEC61970.Core.IrregularTimePoint import IrregularTimePoint
-from CIM14.IEC61970.Core.OperatingShare import OperatingShare
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Core"
 nsPrefix = "cimCore"
@@ -84,3 +57,36 @@ class BusbarConfiguration(str):
     Values are: mainWithTransfer, ringBus, singleBus, doubleBus
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "IdentifiedObject",
+    "PowerSystemResource",
+    "Equipment",
+    "ConductingEquipment",
+    "Curve",
+    "BasicIntervalSchedule",
+    "IrregularIntervalSchedule",
+    "RegularIntervalSchedule",
+    "ConnectivityNodeContainer",
+    "EquipmentContainer",
+    "CurveData",
+    "Bay",
+    "PSRType",
+    "GeographicalRegion",
+    "Terminal",
+    "OperatingParticipant",
+    "VoltageLevel",
+    "ConnectivityNode",
+    "BasePower",
+    "Unit",
+    "BaseVoltage",
+    "SubGeographicalRegion",
+    "PsrList",
+    "Substation",
+    "ReportingGroup",
+    "ReportingSuperGroup",
+    "RegularTimePoint",
+    "IrregularTimePoint",
+    "OperatingShare",
+])
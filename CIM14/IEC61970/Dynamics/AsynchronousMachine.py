@@ -76,4 +76,5 @@ class AsynchronousMachine(RotatingMachine):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
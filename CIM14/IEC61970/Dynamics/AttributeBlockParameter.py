@@ -40,4 +40,5 @@ class AttributeBlockParameter(MetaBlockParameter):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
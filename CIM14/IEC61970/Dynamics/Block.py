@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import RefList
 
 class Block(PowerSystemResource):
     """A specific usage of a dynamics block, supplied with parameters and any linkages to the power system static model that are required.     Sometimes a block is used to simply specify a location of input or output from dyanmics equations to the static model.
@@ -52,11 +53,11 @@ class Block(PowerSystemResource):
         self._MemberOf_BlockConnectivity = None
         self.MemberOf_BlockConnectivity = MemberOf_BlockConnectivity
 
-        self._blockUsageInputReference0 = []
-        self.blockUsageInputReference0 = [] if blockUsageInputReference0 is None else blockUsageInputReference0
+        if blockUsageInputReference0 is not None:
+            self.blockUsageInputReference0 = blockUsageInputReference0
 
-        self._BlockUsageOutputReference = []
-        self.BlockUsageOutputReference = [] if BlockUsageOutputReference is None else BlockUsageOutputReference
+        if BlockUsageOutputReference is not None:
+            self.BlockUsageOutputReference = BlockUsageOutputReference
 
         self._PowerSystemResource = None
         self.PowerSystemResource = PowerSystemResource
@@ -64,17 +65,17 @@ class Block(PowerSystemResource):
         self._slotReference0 = None
         self.slotReference0 = slotReference0
 
-        self._tieToMeasurement0 = []
-        self.tieToMeasurement0 = [] if tieToMeasurement0 is None else tieToMeasurement0
+        if tieToMeasurement0 is not None:
+            self.tieToMeasurement0 = tieToMeasurement0
 
         self._MetaBlock = None
         self.MetaBlock = MetaBlock
 
-        self._BlockConnection = []
-        self.BlockConnection = [] if BlockConnection is None else BlockConnection
+        if BlockConnection is not None:
+            self.BlockConnection = BlockConnection
 
-        self._BlockParameter = []
-        self.BlockParameter = [] if BlockParameter is None else BlockParameter
+        if BlockParameter is not None:
+            self.BlockParameter = BlockParameter
 
         super(Block, self).__init__(*args, **kw_args)
 
@@ -84,6 +85,7 @@ class Block(PowerSystemResource):
     _enums = {}
     _refs = ["Terminal", "MemberOf_BlockConnectivity", "blockUsageInputReference0", "BlockUsageOutputReference", "PowerSystemResource", "slotReference0", "tieToMeasurement0", "MetaBlock", "BlockConnection", "BlockParameter"]
     _many_refs = ["blockUsageInputReference0", "BlockUsageOutputReference", "tieToMeasurement0", "BlockConnection", "BlockParameter"]
+    _inverses = {"Terminal": "Block", "MemberOf_BlockConnectivity": "Block", "blockUsageInputReference0": "block0", "BlockUsageOutputReference": "block0", "PowerSystemResource": "Block", "slotReference0": "block0", "tieToMeasurement0": "block0", "MetaBlock": "Block", "BlockConnection": "Block", "BlockParameter": "MemberOf_Block"}
 
     def getTerminal(self):
         """The optional terminal to which the block applies.  This is used to link a specific terminal flow to the dynamics block.
@@ -92,13 +94,12 @@ class Block(PowerSystemResource):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.Block if x != self]
-            self._Terminal._Block = filtered
+            self._Terminal._Block.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._Block:
-                self._Terminal._Block.append(self)
+                self._Terminal._reflist("_Block").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -108,13 +109,12 @@ class Block(PowerSystemResource):
 
     def setMemberOf_BlockConnectivity(self, value):
         if self._MemberOf_BlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_BlockConnectivity.Block if x != self]
-            self._MemberOf_BlockConnectivity._Block = filtered
+            self._MemberOf_BlockConnectivity._Block.discard(self)
 
         self._MemberOf_BlockConnectivity = value
         if self._MemberOf_BlockConnectivity is not None:
             if self not in self._MemberOf_BlockConnectivity._Block:
-                self._MemberOf_BlockConnectivity._Block.append(self)
+                self._MemberOf_BlockConnectivity._reflist("_Block").append(self)
 
     MemberOf_BlockConnectivity = property(getMemberOf_BlockConnectivity, setMemberOf_BlockConnectivity)
 
@@ -123,7 +123,8 @@ class Block(PowerSystemResource):
         return self._blockUsageInputReference0
 
     def setblockUsageInputReference0(self, value):
-        for x in self._blockUsageInputReference0:
+        value = RefList(value)
+        for x in list(self._blockUsageInputReference0):
             x.block0 = None
         for y in value:
             y._block0 = self
@@ -144,7 +145,8 @@ class Block(PowerSystemResource):
         return self._BlockUsageOutputReference
 
     def setBlockUsageOutputReference(self, value):
-        for x in self._BlockUsageOutputReference:
+        value = RefList(value)
+        for x in list(self._BlockUsageOutputReference):
             x.block0 = None
         for y in value:
             y._block0 = self
@@ -167,13 +169,12 @@ class Block(PowerSystemResource):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Block if x != self]
-            self._PowerSystemResource._Block = filtered
+            self._PowerSystemResource._Block.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
             if self not in self._PowerSystemResource._Block:
-                self._PowerSystemResource._Block.append(self)
+                self._PowerSystemResource._reflist("_Block").append(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -183,13 +184,12 @@ class Block(PowerSystemResource):
 
     def setslotReference0(self, value):
         if self._slotReference0 is not None:
-            filtered = [x for x in self.slotReference0.block0 if x != self]
-            self._slotReference0._block0 = filtered
+            self._slotReference0._block0.discard(self)
 
         self._slotReference0 = value
         if self._slotReference0 is not None:
             if self not in self._slotReference0._block0:
-                self._slotReference0._block0.append(self)
+                self._slotReference0._reflist("_block0").append(self)
 
     slotReference0 = property(getslotReference0, setslotReference0)
 
@@ -198,7 +198,8 @@ class Block(PowerSystemResource):
         return self._tieToMeasurement0
 
     def settieToMeasurement0(self, value):
-        for x in self._tieToMeasurement0:
+        value = RefList(value)
+        for x in list(self._tieToMeasurement0):
             x.block0 = None
         for y in value:
             y._block0 = self
@@ -220,13 +221,12 @@ class Block(PowerSystemResource):
 
     def setMetaBlock(self, value):
         if self._MetaBlock is not None:
-            filtered = [x for x in self.MetaBlock.Block if x != self]
-            self._MetaBlock._Block = filtered
+            self._MetaBlock._Block.discard(self)
 
         self._MetaBlock = value
         if self._MetaBlock is not None:
             if self not in self._MetaBlock._Block:
-                self._MetaBlock._Block.append(self)
+                self._MetaBlock._reflist("_Block").append(self)
 
     MetaBlock = property(getMetaBlock, setMetaBlock)
 
@@ -235,7 +235,8 @@ class Block(PowerSystemResource):
         return self._BlockConnection
 
     def setBlockConnection(self, value):
-        for x in self._BlockConnection:
+        value = RefList(value)
+        for x in list(self._BlockConnection):
             x.Block = None
         for y in value:
             y._Block = self
@@ -256,7 +257,8 @@ class Block(PowerSystemResource):
         return self._BlockParameter
 
     def setBlockParameter(self, value):
-        for x in self._BlockParameter:
+        value = RefList(value)
+        for x in list(self._BlockParameter):
             x.MemberOf_Block = None
         for y in value:
             y._MemberOf_Block = self
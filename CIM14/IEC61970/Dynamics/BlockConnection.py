@@ -48,6 +48,7 @@ class BlockConnection(IdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockConnection", "MemberOf_BlockConnectivity", "Block"]
     _many_refs = []
+    _inverses = {"MetaBlockConnection": "BlockConnection", "MemberOf_BlockConnectivity": "BlockConnection", "Block": "BlockConnection"}
 
     def getMetaBlockConnection(self):
         
@@ -55,13 +56,12 @@ class BlockConnection(IdentifiedObject):
 
     def setMetaBlockConnection(self, value):
         if self._MetaBlockConnection is not None:
-            filtered = [x for x in self.MetaBlockConnection.BlockConnection if x != self]
-            self._MetaBlockConnection._BlockConnection = filtered
+            self._MetaBlockConnection._BlockConnection.discard(self)
 
         self._MetaBlockConnection = value
         if self._MetaBlockConnection is not None:
             if self not in self._MetaBlockConnection._BlockConnection:
-                self._MetaBlockConnection._BlockConnection.append(self)
+                self._MetaBlockConnection._reflist("_BlockConnection").append(self)
 
     MetaBlockConnection = property(getMetaBlockConnection, setMetaBlockConnection)
 
@@ -71,13 +71,12 @@ class BlockConnection(IdentifiedObject):
 
     def setMemberOf_BlockConnectivity(self, value):
         if self._MemberOf_BlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_BlockConnectivity.BlockConnection if x != self]
-            self._MemberOf_BlockConnectivity._BlockConnection = filtered
+            self._MemberOf_BlockConnectivity._BlockConnection.discard(self)
 
         self._MemberOf_BlockConnectivity = value
         if self._MemberOf_BlockConnectivity is not None:
             if self not in self._MemberOf_BlockConnectivity._BlockConnection:
-                self._MemberOf_BlockConnectivity._BlockConnection.append(self)
+                self._MemberOf_BlockConnectivity._reflist("_BlockConnection").append(self)
 
     MemberOf_BlockConnectivity = property(getMemberOf_BlockConnectivity, setMemberOf_BlockConnectivity)
 
@@ -87,13 +86,12 @@ class BlockConnection(IdentifiedObject):
 
     def setBlock(self, value):
         if self._Block is not None:
-            filtered = [x for x in self.Block.BlockConnection if x != self]
-            self._Block._BlockConnection = filtered
+            self._Block._BlockConnection.discard(self)
 
         self._Block = value
         if self._Block is not None:
             if self not in self._Block._BlockConnection:
-                self._Block._BlockConnection.append(self)
+                self._Block._reflist("_BlockConnection").append(self)
 
     Block = property(getBlock, setBlock)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class BlockConnectivity(IdentifiedObject):
     """A instance definition of connectivity of BlockUsage objects as defined in a a BlockConnection within the dyanmics-meta-model.
@@ -34,11 +35,11 @@ class BlockConnectivity(IdentifiedObject):
         self._MetaBlockConnectivity = None
         self.MetaBlockConnectivity = MetaBlockConnectivity
 
-        self._Block = []
-        self.Block = [] if Block is None else Block
+        if Block is not None:
+            self.Block = Block
 
-        self._BlockConnection = []
-        self.BlockConnection = [] if BlockConnection is None else BlockConnection
+        if BlockConnection is not None:
+            self.BlockConnection = BlockConnection
 
         super(BlockConnectivity, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class BlockConnectivity(IdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockConnectivity", "Block", "BlockConnection"]
     _many_refs = ["Block", "BlockConnection"]
+    _inverses = {"MetaBlockConnectivity": "BlockConnectivity", "Block": "MemberOf_BlockConnectivity", "BlockConnection": "MemberOf_BlockConnectivity"}
 
     def getMetaBlockConnectivity(self):
         
@@ -55,13 +57,12 @@ class BlockConnectivity(IdentifiedObject):
 
     def setMetaBlockConnectivity(self, value):
         if self._MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MetaBlockConnectivity.BlockConnectivity if x != self]
-            self._MetaBlockConnectivity._BlockConnectivity = filtered
+            self._MetaBlockConnectivity._BlockConnectivity.discard(self)
 
         self._MetaBlockConnectivity = value
         if self._MetaBlockConnectivity is not None:
             if self not in self._MetaBlockConnectivity._BlockConnectivity:
-                self._MetaBlockConnectivity._BlockConnectivity.append(self)
+                self._MetaBlockConnectivity._reflist("_BlockConnectivity").append(self)
 
     MetaBlockConnectivity = property(getMetaBlockConnectivity, setMetaBlockConnectivity)
 
@@ -70,7 +71,8 @@ class BlockConnectivity(IdentifiedObject):
         return self._Block
 
     def setBlock(self, value):
-        for x in self._Block:
+        value = RefList(value)
+        for x in list(self._Block):
             x.MemberOf_BlockConnectivity = None
         for y in value:
             y._MemberOf_BlockConnectivity = self
@@ -91,7 +93,8 @@ class BlockConnectivity(IdentifiedObject):
         return self._BlockConnection
 
     def setBlockConnection(self, value):
-        for x in self._BlockConnection:
+        value = RefList(value)
+        for x in list(self._BlockConnection):
             x.MemberOf_BlockConnectivity = None
         for y in value:
             y._MemberOf_BlockConnectivity = self
@@ -44,6 +44,7 @@ class BlockConstant(MetaBlockConnectable):
     _enums = {}
     _refs = ["metaBlock0"]
     _many_refs = []
+    _inverses = {"metaBlock0": "blockConstant0"}
 
     def getmetaBlock0(self):
         
@@ -51,13 +52,12 @@ class BlockConstant(MetaBlockConnectable):
 
     def setmetaBlock0(self, value):
         if self._metaBlock0 is not None:
-            filtered = [x for x in self.metaBlock0.blockConstant0 if x != self]
-            self._metaBlock0._blockConstant0 = filtered
+            self._metaBlock0._blockConstant0.discard(self)
 
         self._metaBlock0 = value
         if self._metaBlock0 is not None:
             if self not in self._metaBlock0._blockConstant0:
-                self._metaBlock0._blockConstant0.append(self)
+                self._metaBlock0._reflist("_blockConstant0").append(self)
 
     metaBlock0 = property(getmetaBlock0, setmetaBlock0)
 
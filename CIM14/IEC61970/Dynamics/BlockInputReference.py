@@ -48,6 +48,7 @@ class BlockInputReference(IdentifiedObject):
     _enums = {}
     _refs = ["metaBlockReference0", "metaBlockInput0", "BlockConnectable"]
     _many_refs = []
+    _inverses = {"metaBlockReference0": "blockInputReference0", "metaBlockInput0": "blockInputReference0", "BlockConnectable": "BlockInputReference"}
 
     def getmetaBlockReference0(self):
         
@@ -55,13 +56,12 @@ class BlockInputReference(IdentifiedObject):
 
     def setmetaBlockReference0(self, value):
         if self._metaBlockReference0 is not None:
-            filtered = [x for x in self.metaBlockReference0.blockInputReference0 if x != self]
-            self._metaBlockReference0._blockInputReference0 = filtered
+            self._metaBlockReference0._blockInputReference0.discard(self)
 
         self._metaBlockReference0 = value
         if self._metaBlockReference0 is not None:
             if self not in self._metaBlockReference0._blockInputReference0:
-                self._metaBlockReference0._blockInputReference0.append(self)
+                self._metaBlockReference0._reflist("_blockInputReference0").append(self)
 
     metaBlockReference0 = property(getmetaBlockReference0, setmetaBlockReference0)
 
@@ -72,13 +72,12 @@ class BlockInputReference(IdentifiedObject):
 
     def setmetaBlockInput0(self, value):
         if self._metaBlockInput0 is not None:
-            filtered = [x for x in self.metaBlockInput0.blockInputReference0 if x != self]
-            self._metaBlockInput0._blockInputReference0 = filtered
+            self._metaBlockInput0._blockInputReference0.discard(self)
 
         self._metaBlockInput0 = value
         if self._metaBlockInput0 is not None:
             if self not in self._metaBlockInput0._blockInputReference0:
-                self._metaBlockInput0._blockInputReference0.append(self)
+                self._metaBlockInput0._reflist("_blockInputReference0").append(self)
 
     metaBlockInput0 = property(getmetaBlockInput0, setmetaBlockInput0)
 
@@ -89,13 +88,12 @@ class BlockInputReference(IdentifiedObject):
 
     def setBlockConnectable(self, value):
         if self._BlockConnectable is not None:
-            filtered = [x for x in self.BlockConnectable.BlockInputReference if x != self]
-            self._BlockConnectable._BlockInputReference = filtered
+            self._BlockConnectable._BlockInputReference.discard(self)
 
         self._BlockConnectable = value
         if self._BlockConnectable is not None:
             if self not in self._BlockConnectable._BlockInputReference:
-                self._BlockConnectable._BlockInputReference.append(self)
+                self._BlockConnectable._reflist("_BlockInputReference").append(self)
 
     BlockConnectable = property(getBlockConnectable, setBlockConnectable)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class BlockInputType(IdentifiedObject):
 
@@ -28,11 +29,11 @@ class BlockInputType(IdentifiedObject):
         @param slotInput0:
         @param metaBlockInput0:
         """
-        self._slotInput0 = []
-        self.slotInput0 = [] if slotInput0 is None else slotInput0
+        if slotInput0 is not None:
+            self.slotInput0 = slotInput0
 
-        self._metaBlockInput0 = []
-        self.metaBlockInput0 = [] if metaBlockInput0 is None else metaBlockInput0
+        if metaBlockInput0 is not None:
+            self.metaBlockInput0 = metaBlockInput0
 
         super(BlockInputType, self).__init__(*args, **kw_args)
 
@@ -42,13 +43,15 @@ class BlockInputType(IdentifiedObject):
     _enums = {}
     _refs = ["slotInput0", "metaBlockInput0"]
     _many_refs = ["slotInput0", "metaBlockInput0"]
+    _inverses = {"slotInput0": "blockInputType0", "metaBlockInput0": "blockInputType0"}
 
     def getslotInput0(self):
         
         return self._slotInput0
 
     def setslotInput0(self, value):
-        for x in self._slotInput0:
+        value = RefList(value)
+        for x in list(self._slotInput0):
             x.blockInputType0 = None
         for y in value:
             y._blockInputType0 = self
@@ -69,7 +72,8 @@ class BlockInputType(IdentifiedObject):
         return self._metaBlockInput0
 
     def setmetaBlockInput0(self, value):
-        for x in self._metaBlockInput0:
+        value = RefList(value)
+        for x in list(self._metaBlockInput0):
             x.blockInputType0 = None
         for y in value:
             y._blockInputType0 = self
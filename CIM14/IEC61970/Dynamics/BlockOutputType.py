@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class BlockOutputType(IdentifiedObject):
 
@@ -28,11 +29,11 @@ class BlockOutputType(IdentifiedObject):
         @param metaBlockOutput0:
         @param slotOutput0:
         """
-        self._metaBlockOutput0 = []
-        self.metaBlockOutput0 = [] if metaBlockOutput0 is None else metaBlockOutput0
+        if metaBlockOutput0 is not None:
+            self.metaBlockOutput0 = metaBlockOutput0
 
-        self._slotOutput0 = []
-        self.slotOutput0 = [] if slotOutput0 is None else slotOutput0
+        if slotOutput0 is not None:
+            self.slotOutput0 = slotOutput0
 
         super(BlockOutputType, self).__init__(*args, **kw_args)
 
@@ -42,13 +43,15 @@ class BlockOutputType(IdentifiedObject):
     _enums = {}
     _refs = ["metaBlockOutput0", "slotOutput0"]
     _many_refs = ["metaBlockOutput0", "slotOutput0"]
+    _inverses = {"metaBlockOutput0": "blockOutputType0", "slotOutput0": "blockOutputType0"}
 
     def getmetaBlockOutput0(self):
         
         return self._metaBlockOutput0
 
     def setmetaBlockOutput0(self, value):
-        for x in self._metaBlockOutput0:
+        value = RefList(value)
+        for x in list(self._metaBlockOutput0):
             x.blockOutputType0 = None
         for y in value:
             y._blockOutputType0 = self
@@ -69,7 +72,8 @@ class BlockOutputType(IdentifiedObject):
         return self._slotOutput0
 
     def setslotOutput0(self, value):
-        for x in self._slotOutput0:
+        value = RefList(value)
+        for x in list(self._slotOutput0):
             x.blockOutputType0 = None
         for y in value:
             y._blockOutputType0 = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class BlockType(IdentifiedObject):
     """This is the kind of a block used to specify what kind of blocks could fit into a particular slot.    For example, only blocks of type 'pss' would fit into a 'pss' type block.  Though a cross compound generator configuration would possibly have multple pss blocks playing specific roles such as pss1 and pss2..
@@ -30,11 +31,11 @@ class BlockType(IdentifiedObject):
         @param slot0:
         @param metaBlock0:
         """
-        self._slot0 = []
-        self.slot0 = [] if slot0 is None else slot0
+        if slot0 is not None:
+            self.slot0 = slot0
 
-        self._metaBlock0 = []
-        self.metaBlock0 = [] if metaBlock0 is None else metaBlock0
+        if metaBlock0 is not None:
+            self.metaBlock0 = metaBlock0
 
         super(BlockType, self).__init__(*args, **kw_args)
 
@@ -44,13 +45,15 @@ class BlockType(IdentifiedObject):
     _enums = {}
     _refs = ["slot0", "metaBlock0"]
     _many_refs = ["slot0", "metaBlock0"]
+    _inverses = {"slot0": "blockType0", "metaBlock0": "blockType0"}
 
     def getslot0(self):
         
         return self._slot0
 
     def setslot0(self, value):
-        for x in self._slot0:
+        value = RefList(value)
+        for x in list(self._slot0):
             x.blockType0 = None
         for y in value:
             y._blockType0 = self
@@ -71,7 +74,8 @@ class BlockType(IdentifiedObject):
         return self._metaBlock0
 
     def setmetaBlock0(self, value):
-        for x in self._metaBlock0:
+        value = RefList(value)
+        for x in list(self._metaBlock0):
             x.blockType0 = None
         for y in value:
             y._blockType0 = self
@@ -48,6 +48,7 @@ class BlockUsageInputReference(IdentifiedObject):
     _enums = {}
     _refs = ["block0", "BlockUsageOutputReference", "metaBlockInput0"]
     _many_refs = []
+    _inverses = {"block0": "blockUsageInputReference0", "BlockUsageOutputReference": "BlockUsageInputReference", "metaBlockInput0": "blockUsageInputReference0"}
 
     def getblock0(self):
         
@@ -55,13 +56,12 @@ class BlockUsageInputReference(IdentifiedObject):
 
     def setblock0(self, value):
         if self._block0 is not None:
-            filtered = [x for x in self.block0.blockUsageInputReference0 if x != self]
-            self._block0._blockUsageInputReference0 = filtered
+            self._block0._blockUsageInputReference0.discard(self)
 
         self._block0 = value
         if self._block0 is not None:
             if self not in self._block0._blockUsageInputReference0:
-                self._block0._blockUsageInputReference0.append(self)
+                self._block0._reflist("_blockUsageInputReference0").append(self)
 
     block0 = property(getblock0, setblock0)
 
@@ -72,13 +72,12 @@ class BlockUsageInputReference(IdentifiedObject):
 
     def setBlockUsageOutputReference(self, value):
         if self._BlockUsageOutputReference is not None:
-            filtered = [x for x in self.BlockUsageOutputReference.BlockUsageInputReference if x != self]
-            self._BlockUsageOutputReference._BlockUsageInputReference = filtered
+            self._BlockUsageOutputReference._BlockUsageInputReference.discard(self)
 
         self._BlockUsageOutputReference = value
         if self._BlockUsageOutputReference is not None:
             if self not in self._BlockUsageOutputReference._BlockUsageInputReference:
-                self._BlockUsageOutputReference._BlockUsageInputReference.append(self)
+                self._BlockUsageOutputReference._reflist("_BlockUsageInputReference").append(self)
 
     BlockUsageOutputReference = property(getBlockUsageOutputReference, setBlockUsageOutputReference)
 
@@ -88,13 +87,12 @@ class BlockUsageInputReference(IdentifiedObject):
 
     def setmetaBlockInput0(self, value):
         if self._metaBlockInput0 is not None:
-            filtered = [x for x in self.metaBlockInput0.blockUsageInputReference0 if x != self]
-            self._metaBlockInput0._blockUsageInputReference0 = filtered
+            self._metaBlockInput0._blockUsageInputReference0.discard(self)
 
         self._metaBlockInput0 = value
         if self._metaBlockInput0 is not None:
             if self not in self._metaBlockInput0._blockUsageInputReference0:
-                self._metaBlockInput0._blockUsageInputReference0.append(self)
+                self._metaBlockInput0._reflist("_blockUsageInputReference0").append(self)
 
     metaBlockInput0 = property(getmetaBlockInput0, setmetaBlockInput0)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class BlockUsageOutputReference(IdentifiedObject):
     """Used at instance level to tie the input of a referenced block to the output of another referenced block. Note that typically an input is only tied to an output of another block at the same PowerSystemResource, but there is no restriction to do so.   If the output is implicity tied to an input, then the an instance of this class is not required.  The sole purpose of this class is to explicitly tio the input of other blocks at the power system instance level.
@@ -34,8 +35,8 @@ class BlockUsageOutputReference(IdentifiedObject):
         self._block0 = None
         self.block0 = block0
 
-        self._BlockUsageInputReference = []
-        self.BlockUsageInputReference = [] if BlockUsageInputReference is None else BlockUsageInputReference
+        if BlockUsageInputReference is not None:
+            self.BlockUsageInputReference = BlockUsageInputReference
 
         self._metaBlockOutput0 = None
         self.metaBlockOutput0 = metaBlockOutput0
@@ -48,6 +49,7 @@ class BlockUsageOutputReference(IdentifiedObject):
     _enums = {}
     _refs = ["block0", "BlockUsageInputReference", "metaBlockOutput0"]
     _many_refs = ["BlockUsageInputReference"]
+    _inverses = {"block0": "BlockUsageOutputReference", "BlockUsageInputReference": "BlockUsageOutputReference", "metaBlockOutput0": "blockUsageOutputReference0"}
 
     def getblock0(self):
         
@@ -55,13 +57,12 @@ class BlockUsageOutputReference(IdentifiedObject):
 
     def setblock0(self, value):
         if self._block0 is not None:
-            filtered = [x for x in self.block0.BlockUsageOutputReference if x != self]
-            self._block0._BlockUsageOutputReference = filtered
+            self._block0._BlockUsageOutputReference.discard(self)
 
         self._block0 = value
         if self._block0 is not None:
             if self not in self._block0._BlockUsageOutputReference:
-                self._block0._BlockUsageOutputReference.append(self)
+                self._block0._reflist("_BlockUsageOutputReference").append(self)
 
     block0 = property(getblock0, setblock0)
 
@@ -71,7 +72,8 @@ class BlockUsageOutputReference(IdentifiedObject):
         return self._BlockUsageInputReference
 
     def setBlockUsageInputReference(self, value):
-        for x in self._BlockUsageInputReference:
+        value = RefList(value)
+        for x in list(self._BlockUsageInputReference):
             x.BlockUsageOutputReference = None
         for y in value:
             y._BlockUsageOutputReference = self
@@ -93,13 +95,12 @@ class BlockUsageOutputReference(IdentifiedObject):
 
     def setmetaBlockOutput0(self, value):
         if self._metaBlockOutput0 is not None:
-            filtered = [x for x in self.metaBlockOutput0.blockUsageOutputReference0 if x != self]
-            self._metaBlockOutput0._blockUsageOutputReference0 = filtered
+            self._metaBlockOutput0._blockUsageOutputReference0.discard(self)
 
         self._metaBlockOutput0 = value
         if self._metaBlockOutput0 is not None:
             if self not in self._metaBlockOutput0._blockUsageOutputReference0:
-                self._metaBlockOutput0._blockUsageOutputReference0.append(self)
+                self._metaBlockOutput0._reflist("_blockUsageOutputReference0").append(self)
 
     metaBlockOutput0 = property(getmetaBlockOutput0, setmetaBlockOutput0)
 
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, RefList
 
 class CompositeModel(Element):
 
@@ -27,8 +27,8 @@ class CompositeModel(Element):
 
         @param slotReference0:
         """
-        self._slotReference0 = []
-        self.slotReference0 = [] if slotReference0 is None else slotReference0
+        if slotReference0 is not None:
+            self.slotReference0 = slotReference0
 
         super(CompositeModel, self).__init__(*args, **kw_args)
 
@@ -38,6 +38,7 @@ class CompositeModel(Element):
     _enums = {}
     _refs = ["slotReference0"]
     _many_refs = ["slotReference0"]
+    _inverses = {"slotReference0": "compositeModel0"}
 
     def getslotReference0(self):
         
@@ -45,20 +46,19 @@ class CompositeModel(Element):
 
     def setslotReference0(self, value):
         for p in self._slotReference0:
-            filtered = [q for q in p.compositeModel0 if q != self]
-            self._slotReference0._compositeModel0 = filtered
+            p._compositeModel0.discard(self)
         for r in value:
             if self not in r._compositeModel0:
-                r._compositeModel0.append(self)
-        self._slotReference0 = value
+                r._reflist("_compositeModel0").append(self)
+        self._slotReference0 = RefList(value)
 
     slotReference0 = property(getslotReference0, setslotReference0)
 
     def addslotReference0(self, *slotReference0):
         for obj in slotReference0:
             if self not in obj._compositeModel0:
-                obj._compositeModel0.append(self)
-            self._slotReference0.append(obj)
+                obj._reflist("_compositeModel0").append(self)
+            self._reflist("_slotReference0").append(obj)
 
     def removeslotReference0(self, *slotReference0):
         for obj in slotReference0:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class ConnectionFrame(IdentifiedObject):
 
@@ -28,11 +29,11 @@ class ConnectionFrame(IdentifiedObject):
         @param slotConnection0:
         @param slot0:
         """
-        self._slotConnection0 = []
-        self.slotConnection0 = [] if slotConnection0 is None else slotConnection0
+        if slotConnection0 is not None:
+            self.slotConnection0 = slotConnection0
 
-        self._slot0 = []
-        self.slot0 = [] if slot0 is None else slot0
+        if slot0 is not None:
+            self.slot0 = slot0
 
         super(ConnectionFrame, self).__init__(*args, **kw_args)
 
@@ -42,13 +43,15 @@ class ConnectionFrame(IdentifiedObject):
     _enums = {}
     _refs = ["slotConnection0", "slot0"]
     _many_refs = ["slotConnection0", "slot0"]
+    _inverses = {"slotConnection0": "connectionFrame0", "slot0": "connectionFrame0"}
 
     def getslotConnection0(self):
         
         return self._slotConnection0
 
     def setslotConnection0(self, value):
-        for x in self._slotConnection0:
+        value = RefList(value)
+        for x in list(self._slotConnection0):
             x.connectionFrame0 = None
         for y in value:
             y._connectionFrame0 = self
@@ -69,7 +72,8 @@ class ConnectionFrame(IdentifiedObject):
         return self._slot0
 
     def setslot0(self, value):
-        for x in self._slot0:
+        value = RefList(value)
+        for x in list(self._slot0):
             x.connectionFrame0 = None
         for y in value:
             y._connectionFrame0 = self
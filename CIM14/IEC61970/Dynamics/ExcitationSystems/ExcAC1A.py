@@ -112,4 +112,5 @@ class ExcAC1A(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
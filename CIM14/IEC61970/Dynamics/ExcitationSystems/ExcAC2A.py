@@ -124,4 +124,5 @@ class ExcAC2A(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -124,4 +124,5 @@ class ExcAC3A(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
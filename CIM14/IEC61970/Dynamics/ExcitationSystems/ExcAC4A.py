@@ -76,4 +76,5 @@ class ExcAC4A(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
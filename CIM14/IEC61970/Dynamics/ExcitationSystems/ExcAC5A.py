@@ -96,4 +96,5 @@ class ExcAC5A(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -128,4 +128,5 @@ class ExcAC6A(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -144,4 +144,5 @@ class ExcAC7B(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -116,4 +116,5 @@ class ExcAC8B(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class ExcBBC(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
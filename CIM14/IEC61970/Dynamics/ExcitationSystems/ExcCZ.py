@@ -36,4 +36,5 @@ class ExcCZ(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
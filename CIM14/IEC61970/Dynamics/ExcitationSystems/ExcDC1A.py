@@ -104,4 +104,5 @@ class ExcDC1A(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -104,4 +104,5 @@ class ExcDC2A(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -84,4 +84,5 @@ class ExcDC3A(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -116,4 +116,5 @@ class ExcDC4B(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
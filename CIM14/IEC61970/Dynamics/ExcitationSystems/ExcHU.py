@@ -36,4 +36,5 @@ class ExcHU(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
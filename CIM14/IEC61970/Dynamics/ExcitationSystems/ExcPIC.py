@@ -36,4 +36,5 @@ class ExcPIC(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
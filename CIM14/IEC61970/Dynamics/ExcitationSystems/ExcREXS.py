@@ -36,4 +36,5 @@ class ExcREXS(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
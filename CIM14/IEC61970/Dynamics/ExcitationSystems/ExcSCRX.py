@@ -68,4 +68,5 @@ class ExcSCRX(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -76,4 +76,5 @@ class ExcSEXS(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
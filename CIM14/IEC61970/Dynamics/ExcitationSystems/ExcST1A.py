@@ -116,4 +116,5 @@ class ExcST1A(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -100,4 +100,5 @@ class ExcST2A(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
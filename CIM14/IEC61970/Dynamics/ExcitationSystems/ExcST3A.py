@@ -120,4 +120,5 @@ class ExcST3A(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -108,4 +108,5 @@ class ExcST4B(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -104,4 +104,5 @@ class ExcST6B(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
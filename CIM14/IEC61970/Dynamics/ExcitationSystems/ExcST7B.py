@@ -104,4 +104,5 @@ class ExcST7B(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class ExcWT3E(ExcitationSystem):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
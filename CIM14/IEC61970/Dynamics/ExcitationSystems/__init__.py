@@ -19,42 +19,47 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcitationSystem import ExcitationSystem
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcDC4B import ExcDC4B
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcAC1A import ExcAC1A
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcSEXS import ExcSEXS
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcAC6A import ExcAC6A
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcDC3A import ExcDC3A
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcBBC import ExcBBC
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcST7B import ExcST7B
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcSCRX import ExcSCRX
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcAC5A import ExcAC5A
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcREXS import ExcREXS
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcELIN1 import ExcELIN1
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcST3A import ExcST3A
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcSK2 import ExcSK2
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcPIC import ExcPIC
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcST5B import ExcST5B
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcCZ import ExcCZ
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcST1A import ExcST1A
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcDC1A import ExcDC1A
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcAC3A import ExcAC3A
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcAC4A import ExcAC4A
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcAC2A import ExcAC2A
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcWT2E import ExcWT2E
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcDC2A import ExcDC2A
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcAC8B import ExcAC8B
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcST2A import ExcST2A
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcHU import ExcHU
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcBAS import ExcBAS
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcSK import ExcSK
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcWT3E import ExcWT3E
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcST6B import ExcST6B
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcELIN2 import ExcELIN2
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcST4B import ExcST4B
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcAC7B import ExcAC7B
-from CIM14.IEC61970.Dynamics.ExcitationSystems.ExcWT4E import ExcWT4E
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#ExcitationSystems"
 nsPrefix = "cimExcitationSystems"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ExcitationSystem",
+    "ExcDC4B",
+    "ExcAC1A",
+    "ExcSEXS",
+    "ExcAC6A",
+    "ExcDC3A",
+    "ExcBBC",
+    "ExcST7B",
+    "ExcSCRX",
+    "ExcAC5A",
+    "ExcREXS",
+    "ExcELIN1",
+    "ExcST3A",
+    "ExcSK2",
+    "ExcPIC",
+    "ExcST5B",
+    "ExcCZ",
+    "ExcST1A",
+    "ExcDC1A",
+    "ExcAC3A",
+    "ExcAC4A",
+    "ExcAC2A",
+    "ExcWT2E",
+    "ExcDC2A",
+    "ExcAC8B",
+    "ExcST2A",
+    "ExcHU",
+    "ExcBAS",
+    "ExcSK",
+    "ExcWT3E",
+    "ExcST6B",
+    "ExcELIN2",
+    "ExcST4B",
+    "ExcAC7B",
+    "ExcWT4E",
+])
@@ -36,4 +36,5 @@ class GenAsync(AsynchronousMachine):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.RotatingMachine import RotatingMachine
+from CIM14.Element import RefList
 
 class GenEquiv(RotatingMachine):
     """An equivalent representation of a synchronous generator as a constant internal voltage behind an impedance Ra plus Xp.
@@ -33,8 +34,8 @@ class GenEquiv(RotatingMachine):
         #: Equivalent reactance, also known as Xp.
         self.xp = xp
 
-        self._synchronousMachine0 = []
-        self.synchronousMachine0 = [] if synchronousMachine0 is None else synchronousMachine0
+        if synchronousMachine0 is not None:
+            self.synchronousMachine0 = synchronousMachine0
 
         super(GenEquiv, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class GenEquiv(RotatingMachine):
     _enums = {}
     _refs = ["synchronousMachine0"]
     _many_refs = ["synchronousMachine0"]
+    _inverses = {"synchronousMachine0": "genEquiv0"}
 
     def getsynchronousMachine0(self):
         
@@ -51,20 +53,19 @@ class GenEquiv(RotatingMachine):
 
     def setsynchronousMachine0(self, value):
         for p in self._synchronousMachine0:
-            filtered = [q for q in p.genEquiv0 if q != self]
-            self._synchronousMachine0._genEquiv0 = filtered
+            p._genEquiv0.discard(self)
         for r in value:
             if self not in r._genEquiv0:
-                r._genEquiv0.append(self)
-        self._synchronousMachine0 = value
+                r._reflist("_genEquiv0").append(self)
+        self._synchronousMachine0 = RefList(value)
 
     synchronousMachine0 = property(getsynchronousMachine0, setsynchronousMachine0)
 
     def addsynchronousMachine0(self, *synchronousMachine0):
         for obj in synchronousMachine0:
             if self not in obj._genEquiv0:
-                obj._genEquiv0.append(self)
-            self._synchronousMachine0.append(obj)
+                obj._reflist("_genEquiv0").append(self)
+            self._reflist("_synchronousMachine0").append(obj)
 
     def removesynchronousMachine0(self, *synchronousMachine0):
         for obj in synchronousMachine0:
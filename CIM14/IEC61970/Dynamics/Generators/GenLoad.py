@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
+from CIM14.Element import RefList
 
 class GenLoad(RegulatingCondEq):
     """Representation of a small generator as a negative load rather than a dynamic generator model. This practice is also referred to as 'netting' the generation with the load, i.e. taking the net value of load minus generation as the new load value.  For dynamic modeling purposes, each generator that does not have a dynamic load model must have a genLoad record.
@@ -29,8 +30,8 @@ class GenLoad(RegulatingCondEq):
 
         @param synchronousMachine0:
         """
-        self._synchronousMachine0 = []
-        self.synchronousMachine0 = [] if synchronousMachine0 is None else synchronousMachine0
+        if synchronousMachine0 is not None:
+            self.synchronousMachine0 = synchronousMachine0
 
         super(GenLoad, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class GenLoad(RegulatingCondEq):
     _enums = {}
     _refs = ["synchronousMachine0"]
     _many_refs = ["synchronousMachine0"]
+    _inverses = {"synchronousMachine0": "genLoad0"}
 
     def getsynchronousMachine0(self):
         
@@ -47,20 +49,19 @@ class GenLoad(RegulatingCondEq):
 
     def setsynchronousMachine0(self, value):
         for p in self._synchronousMachine0:
-            filtered = [q for q in p.genLoad0 if q != self]
-            self._synchronousMachine0._genLoad0 = filtered
+            p._genLoad0.discard(self)
         for r in value:
             if self not in r._genLoad0:
-                r._genLoad0.append(self)
-        self._synchronousMachine0 = value
+                r._reflist("_genLoad0").append(self)
+        self._synchronousMachine0 = RefList(value)
 
     synchronousMachine0 = property(getsynchronousMachine0, setsynchronousMachine0)
 
     def addsynchronousMachine0(self, *synchronousMachine0):
         for obj in synchronousMachine0:
             if self not in obj._genLoad0:
-                obj._genLoad0.append(self)
-            self._synchronousMachine0.append(obj)
+                obj._reflist("_genLoad0").append(self)
+            self._reflist("_synchronousMachine0").append(obj)
 
     def removesynchronousMachine0(self, *synchronousMachine0):
         for obj in synchronousMachine0:
@@ -19,9 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.IEC61970.Dynamics.Generators.GenLoad import GenLoad
-from CIM14.IEC61970.Dynamics.Generators.GenEquiv import GenEquiv
-from CIM14.IEC61970.Dynamics.Generators.GenAsync import GenAsync
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Generators"
 nsPrefix = "cimGenerators"
@@ -42,3 +41,10 @@ class ParametersFormType(str):
     """Values are: timeConstantReactance, equivalentCircuit
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "GenLoad",
+    "GenEquiv",
+    "GenAsync",
+])
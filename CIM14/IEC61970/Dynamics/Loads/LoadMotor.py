@@ -88,4 +88,5 @@ class LoadMotor(AggregateLoad):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
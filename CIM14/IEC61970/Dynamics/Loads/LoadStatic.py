@@ -104,4 +104,5 @@ class LoadStatic(AggregateLoad):
     _enums = {"staticLoadType": "StaticLoadType"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
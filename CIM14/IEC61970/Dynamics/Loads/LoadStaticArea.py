@@ -36,4 +36,5 @@ class LoadStaticArea(LoadStatic):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
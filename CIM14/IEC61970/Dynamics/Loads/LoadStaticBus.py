@@ -36,4 +36,5 @@ class LoadStaticBus(LoadStatic):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
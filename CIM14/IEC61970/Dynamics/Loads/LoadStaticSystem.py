@@ -36,4 +36,5 @@ class LoadStaticSystem(LoadStatic):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
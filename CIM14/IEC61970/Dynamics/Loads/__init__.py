@@ -19,14 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.IEC61970.Dynamics.Loads.AggregateLoad import AggregateLoad
-from CIM14.IEC61970.Dynamics.Loads.LoadStatic import LoadStatic
-from CIM14.IEC61970.Dynamics.Loads.LoadStaticSystem import LoadStaticSystem
-from CIM14.IEC61970.Dynamics.Loads.LoadStaticOwner import LoadStaticOwner
-from CIM14.IEC61970.Dynamics.Loads.LoadStaticZone import LoadStaticZone
-from CIM14.IEC61970.Dynamics.Loads.LoadStaticBus import LoadStaticBus
-from CIM14.IEC61970.Dynamics.Loads.LoadStaticArea import LoadStaticArea
-from CIM14.IEC61970.Dynamics.Loads.LoadMotor import LoadMotor
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Loads"
 nsPrefix = "cimLoads"
@@ -37,3 +31,15 @@ class StaticLoadType(str):
     Values are: ZIP1, exponential, ZIP2
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "AggregateLoad",
+    "LoadStatic",
+    "LoadStaticSystem",
+    "LoadStaticOwner",
+    "LoadStaticZone",
+    "LoadStaticBus",
+    "LoadStaticArea",
+    "LoadMotor",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class MetaBlock(IdentifiedObject):
     """A block is a meta-data representation of a control block.   It has an external interface and an optinal internal interface. Blocks internals can be ommitted if the block is well understood by both exchange parties.    When well understood by both partice the block can be treated as a primitive block.   All dynamic models must be defined to the level of primtive blocks in order for the model to be consumed and used for dynamic simulation. Examples of primitive blocks include a well known IEEE exciter model, a summation block, or an integrator block.
@@ -53,32 +54,32 @@ class MetaBlock(IdentifiedObject):
         #: Iindicates this type is treated as a primitive type and therefore the internal block model can be ignored and is not typically defined in the model. Primitive blocks include such basic things as summation and standard IEEEexciter models. The exchange parties must agree on the meaning of primitive blocks according to their identification.
         self.primitive = primitive
 
-        self._MetaBlockReference = []
-        self.MetaBlockReference = [] if MetaBlockReference is None else MetaBlockReference
+        if MetaBlockReference is not None:
+            self.MetaBlockReference = MetaBlockReference
 
-        self._MetaBlockOutput = []
-        self.MetaBlockOutput = [] if MetaBlockOutput is None else MetaBlockOutput
+        if MetaBlockOutput is not None:
+            self.MetaBlockOutput = MetaBlockOutput
 
-        self._MetaBlockState = []
-        self.MetaBlockState = [] if MetaBlockState is None else MetaBlockState
+        if MetaBlockState is not None:
+            self.MetaBlockState = MetaBlockState
 
-        self._MetaBlockSignal = []
-        self.MetaBlockSignal = [] if MetaBlockSignal is None else MetaBlockSignal
+        if MetaBlockSignal is not None:
+            self.MetaBlockSignal = MetaBlockSignal
 
         self._blockType0 = None
         self.blockType0 = blockType0
 
-        self._MetaBlockInput = []
-        self.MetaBlockInput = [] if MetaBlockInput is None else MetaBlockInput
+        if MetaBlockInput is not None:
+            self.MetaBlockInput = MetaBlockInput
 
-        self._blockConstant0 = []
-        self.blockConstant0 = [] if blockConstant0 is None else blockConstant0
+        if blockConstant0 is not None:
+            self.blockConstant0 = blockConstant0
 
-        self._Block = []
-        self.Block = [] if Block is None else Block
+        if Block is not None:
+            self.Block = Block
 
-        self._MetaBlockParameter = []
-        self.MetaBlockParameter = [] if MetaBlockParameter is None else MetaBlockParameter
+        if MetaBlockParameter is not None:
+            self.MetaBlockParameter = MetaBlockParameter
 
         super(MetaBlock, self).__init__(*args, **kw_args)
 
@@ -88,13 +89,15 @@ class MetaBlock(IdentifiedObject):
     _enums = {"blockKind": "BlockKind"}
     _refs = ["MetaBlockReference", "MetaBlockOutput", "MetaBlockState", "MetaBlockSignal", "blockType0", "MetaBlockInput", "blockConstant0", "Block", "MetaBlockParameter"]
     _many_refs = ["MetaBlockReference", "MetaBlockOutput", "MetaBlockState", "MetaBlockSignal", "MetaBlockInput", "blockConstant0", "Block", "MetaBlockParameter"]
+    _inverses = {"MetaBlockReference": "MemberOf_MetaBlock", "MetaBlockOutput": "MemberOf_MetaBlock", "MetaBlockState": "MemberOf_MetaBlock", "MetaBlockSignal": "MemberOf_MetaBlock", "blockType0": "metaBlock0", "MetaBlockInput": "MemberOf_MetaBlock", "blockConstant0": "metaBlock0", "Block": "MetaBlock", "MetaBlockParameter": "MemberOf_MetaBlock"}
 
     def getMetaBlockReference(self):
         
         return self._MetaBlockReference
 
     def setMetaBlockReference(self, value):
-        for x in self._MetaBlockReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockReference):
             x.MemberOf_MetaBlock = None
         for y in value:
             y._MemberOf_MetaBlock = self
@@ -116,7 +119,8 @@ class MetaBlock(IdentifiedObject):
         return self._MetaBlockOutput
 
     def setMetaBlockOutput(self, value):
-        for x in self._MetaBlockOutput:
+        value = RefList(value)
+        for x in list(self._MetaBlockOutput):
             x.MemberOf_MetaBlock = None
         for y in value:
             y._MemberOf_MetaBlock = self
@@ -137,7 +141,8 @@ class MetaBlock(IdentifiedObject):
         return self._MetaBlockState
 
     def setMetaBlockState(self, value):
-        for x in self._MetaBlockState:
+        value = RefList(value)
+        for x in list(self._MetaBlockState):
             x.MemberOf_MetaBlock = None
         for y in value:
             y._MemberOf_MetaBlock = self
@@ -158,7 +163,8 @@ class MetaBlock(IdentifiedObject):
         return self._MetaBlockSignal
 
     def setMetaBlockSignal(self, value):
-        for x in self._MetaBlockSignal:
+        value = RefList(value)
+        for x in list(self._MetaBlockSignal):
             x.MemberOf_MetaBlock = None
         for y in value:
             y._MemberOf_MetaBlock = self
@@ -180,13 +186,12 @@ class MetaBlock(IdentifiedObject):
 
     def setblockType0(self, value):
         if self._blockType0 is not None:
-            filtered = [x for x in self.blockType0.metaBlock0 if x != self]
-            self._blockType0._metaBlock0 = filtered
+            self._blockType0._metaBlock0.discard(self)
 
         self._blockType0 = value
         if self._blockType0 is not None:
             if self not in self._blockType0._metaBlock0:
-                self._blockType0._metaBlock0.append(self)
+                self._blockType0._reflist("_metaBlock0").append(self)
 
     blockType0 = property(getblockType0, setblockType0)
 
@@ -196,7 +201,8 @@ class MetaBlock(IdentifiedObject):
         return self._MetaBlockInput
 
     def setMetaBlockInput(self, value):
-        for x in self._MetaBlockInput:
+        value = RefList(value)
+        for x in list(self._MetaBlockInput):
             x.MemberOf_MetaBlock = None
         for y in value:
             y._MemberOf_MetaBlock = self
@@ -217,7 +223,8 @@ class MetaBlock(IdentifiedObject):
         return self._blockConstant0
 
     def setblockConstant0(self, value):
-        for x in self._blockConstant0:
+        value = RefList(value)
+        for x in list(self._blockConstant0):
             x.metaBlock0 = None
         for y in value:
             y._metaBlock0 = self
@@ -238,7 +245,8 @@ class MetaBlock(IdentifiedObject):
         return self._Block
 
     def setBlock(self, value):
-        for x in self._Block:
+        value = RefList(value)
+        for x in list(self._Block):
             x.MetaBlock = None
         for y in value:
             y._MetaBlock = self
@@ -260,7 +268,8 @@ class MetaBlock(IdentifiedObject):
         return self._MetaBlockParameter
 
     def setMetaBlockParameter(self, value):
-        for x in self._MetaBlockParameter:
+        value = RefList(value)
+        for x in list(self._MetaBlockParameter):
             x.MemberOf_MetaBlock = None
         for y in value:
             y._MemberOf_MetaBlock = self
@@ -48,6 +48,7 @@ class MetaBlockConInput(IdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockConSignal", "MemberOf_MetaBlockConnection", "Unit"]
     _many_refs = []
+    _inverses = {"MetaBlockConSignal": "MetaBlockConInput", "MemberOf_MetaBlockConnection": "MetaBlockConInput", "Unit": "MetaBlockConInput"}
 
     def getMetaBlockConSignal(self):
         
@@ -70,13 +71,12 @@ class MetaBlockConInput(IdentifiedObject):
 
     def setMemberOf_MetaBlockConnection(self, value):
         if self._MemberOf_MetaBlockConnection is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnection.MetaBlockConInput if x != self]
-            self._MemberOf_MetaBlockConnection._MetaBlockConInput = filtered
+            self._MemberOf_MetaBlockConnection._MetaBlockConInput.discard(self)
 
         self._MemberOf_MetaBlockConnection = value
         if self._MemberOf_MetaBlockConnection is not None:
             if self not in self._MemberOf_MetaBlockConnection._MetaBlockConInput:
-                self._MemberOf_MetaBlockConnection._MetaBlockConInput.append(self)
+                self._MemberOf_MetaBlockConnection._reflist("_MetaBlockConInput").append(self)
 
     MemberOf_MetaBlockConnection = property(getMemberOf_MetaBlockConnection, setMemberOf_MetaBlockConnection)
 
@@ -86,13 +86,12 @@ class MetaBlockConInput(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.MetaBlockConInput if x != self]
-            self._Unit._MetaBlockConInput = filtered
+            self._Unit._MetaBlockConInput.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
             if self not in self._Unit._MetaBlockConInput:
-                self._Unit._MetaBlockConInput.append(self)
+                self._Unit._reflist("_MetaBlockConInput").append(self)
 
     Unit = property(getUnit, setUnit)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class MetaBlockConOutput(IdentifiedObject):
     """If model uses MeasurementType association, it means the output is pushed back to the steady state model (if reasonable).
@@ -31,8 +32,8 @@ class MetaBlockConOutput(IdentifiedObject):
         @param MemberOf_MetaBlockConnection:
         @param Unit:
         """
-        self._MetaBlockConSignal = []
-        self.MetaBlockConSignal = [] if MetaBlockConSignal is None else MetaBlockConSignal
+        if MetaBlockConSignal is not None:
+            self.MetaBlockConSignal = MetaBlockConSignal
 
         self._MemberOf_MetaBlockConnection = None
         self.MemberOf_MetaBlockConnection = MemberOf_MetaBlockConnection
@@ -48,13 +49,15 @@ class MetaBlockConOutput(IdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockConSignal", "MemberOf_MetaBlockConnection", "Unit"]
     _many_refs = ["MetaBlockConSignal"]
+    _inverses = {"MetaBlockConSignal": "MetaBlockConOutput", "MemberOf_MetaBlockConnection": "MetaBlockConOutput", "Unit": "MetaBlockConOutput"}
 
     def getMetaBlockConSignal(self):
         
         return self._MetaBlockConSignal
 
     def setMetaBlockConSignal(self, value):
-        for x in self._MetaBlockConSignal:
+        value = RefList(value)
+        for x in list(self._MetaBlockConSignal):
             x.MetaBlockConOutput = None
         for y in value:
             y._MetaBlockConOutput = self
@@ -76,13 +79,12 @@ class MetaBlockConOutput(IdentifiedObject):
 
     def setMemberOf_MetaBlockConnection(self, value):
         if self._MemberOf_MetaBlockConnection is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnection.MetaBlockConOutput if x != self]
-            self._MemberOf_MetaBlockConnection._MetaBlockConOutput = filtered
+            self._MemberOf_MetaBlockConnection._MetaBlockConOutput.discard(self)
 
         self._MemberOf_MetaBlockConnection = value
         if self._MemberOf_MetaBlockConnection is not None:
             if self not in self._MemberOf_MetaBlockConnection._MetaBlockConOutput:
-                self._MemberOf_MetaBlockConnection._MetaBlockConOutput.append(self)
+                self._MemberOf_MetaBlockConnection._reflist("_MetaBlockConOutput").append(self)
 
     MemberOf_MetaBlockConnection = property(getMemberOf_MetaBlockConnection, setMemberOf_MetaBlockConnection)
 
@@ -92,13 +94,12 @@ class MetaBlockConOutput(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.MetaBlockConOutput if x != self]
-            self._Unit._MetaBlockConOutput = filtered
+            self._Unit._MetaBlockConOutput.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
             if self not in self._Unit._MetaBlockConOutput:
-                self._Unit._MetaBlockConOutput.append(self)
+                self._Unit._reflist("_MetaBlockConOutput").append(self)
 
     Unit = property(getUnit, setUnit)
 
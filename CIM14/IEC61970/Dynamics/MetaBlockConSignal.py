@@ -50,6 +50,7 @@ class MetaBlockConSignal(IdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockConInput", "MemberOf_MetaBlockConnectivity", "MetaBlockConOutput", "metaBlockConnectivity0"]
     _many_refs = []
+    _inverses = {"MetaBlockConInput": "MetaBlockConSignal", "MemberOf_MetaBlockConnectivity": "MetaBlockConSignal", "MetaBlockConOutput": "MetaBlockConSignal", "metaBlockConnectivity0": "metaBlockConSignal0"}
 
     def getMetaBlockConInput(self):
         
@@ -72,13 +73,12 @@ class MetaBlockConSignal(IdentifiedObject):
 
     def setMemberOf_MetaBlockConnectivity(self, value):
         if self._MemberOf_MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnectivity.MetaBlockConSignal if x != self]
-            self._MemberOf_MetaBlockConnectivity._MetaBlockConSignal = filtered
+            self._MemberOf_MetaBlockConnectivity._MetaBlockConSignal.discard(self)
 
         self._MemberOf_MetaBlockConnectivity = value
         if self._MemberOf_MetaBlockConnectivity is not None:
             if self not in self._MemberOf_MetaBlockConnectivity._MetaBlockConSignal:
-                self._MemberOf_MetaBlockConnectivity._MetaBlockConSignal.append(self)
+                self._MemberOf_MetaBlockConnectivity._reflist("_MetaBlockConSignal").append(self)
 
     MemberOf_MetaBlockConnectivity = property(getMemberOf_MetaBlockConnectivity, setMemberOf_MetaBlockConnectivity)
 
@@ -88,13 +88,12 @@ class MetaBlockConSignal(IdentifiedObject):
 
     def setMetaBlockConOutput(self, value):
         if self._MetaBlockConOutput is not None:
-            filtered = [x for x in self.MetaBlockConOutput.MetaBlockConSignal if x != self]
-            self._MetaBlockConOutput._MetaBlockConSignal = filtered
+            self._MetaBlockConOutput._MetaBlockConSignal.discard(self)
 
         self._MetaBlockConOutput = value
         if self._MetaBlockConOutput is not None:
             if self not in self._MetaBlockConOutput._MetaBlockConSignal:
-                self._MetaBlockConOutput._MetaBlockConSignal.append(self)
+                self._MetaBlockConOutput._reflist("_MetaBlockConSignal").append(self)
 
     MetaBlockConOutput = property(getMetaBlockConOutput, setMetaBlockConOutput)
 
@@ -104,13 +103,12 @@ class MetaBlockConSignal(IdentifiedObject):
 
     def setmetaBlockConnectivity0(self, value):
         if self._metaBlockConnectivity0 is not None:
-            filtered = [x for x in self.metaBlockConnectivity0.metaBlockConSignal0 if x != self]
-            self._metaBlockConnectivity0._metaBlockConSignal0 = filtered
+            self._metaBlockConnectivity0._metaBlockConSignal0.discard(self)
 
         self._metaBlockConnectivity0 = value
         if self._metaBlockConnectivity0 is not None:
             if self not in self._metaBlockConnectivity0._metaBlockConSignal0:
-                self._metaBlockConnectivity0._metaBlockConSignal0.append(self)
+                self._metaBlockConnectivity0._reflist("_metaBlockConSignal0").append(self)
 
     metaBlockConnectivity0 = property(getmetaBlockConnectivity0, setmetaBlockConnectivity0)
 
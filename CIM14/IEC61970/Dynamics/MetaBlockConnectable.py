@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class MetaBlockConnectable(IdentifiedObject):
     """This is a source connection for a block input at the dynamics meta-data level.   The subtypes represent different ways to obtain the numbers.  Note that a block output is NOT derived from this class since block outputs can only be computed from references to other blocks via the BlockOutputReference class.
@@ -37,32 +38,32 @@ class MetaBlockConnectable(IdentifiedObject):
         @param StandardControlBlock_MetaBlockOutputReference:
         @param MetaBlockInputReference:
         """
-        self._StandardControlBlock_MetaBlockStateReference = []
-        self.StandardControlBlock_MetaBlockStateReference = [] if StandardControlBlock_MetaBlockStateReference is None else StandardControlBlock_MetaBlockStateReference
+        if StandardControlBlock_MetaBlockStateReference is not None:
+            self.StandardControlBlock_MetaBlockStateReference = StandardControlBlock_MetaBlockStateReference
 
-        self._MetaBlockOutputReference = []
-        self.MetaBlockOutputReference = [] if MetaBlockOutputReference is None else MetaBlockOutputReference
+        if MetaBlockOutputReference is not None:
+            self.MetaBlockOutputReference = MetaBlockOutputReference
 
-        self._MetaBlockStateReference = []
-        self.MetaBlockStateReference = [] if MetaBlockStateReference is None else MetaBlockStateReference
+        if MetaBlockStateReference is not None:
+            self.MetaBlockStateReference = MetaBlockStateReference
 
-        self._BlockInputReference = []
-        self.BlockInputReference = [] if BlockInputReference is None else BlockInputReference
+        if BlockInputReference is not None:
+            self.BlockInputReference = BlockInputReference
 
-        self._StandardControlBlock_MetaBlockInputReference = []
-        self.StandardControlBlock_MetaBlockInputReference = [] if StandardControlBlock_MetaBlockInputReference is None else StandardControlBlock_MetaBlockInputReference
+        if StandardControlBlock_MetaBlockInputReference is not None:
+            self.StandardControlBlock_MetaBlockInputReference = StandardControlBlock_MetaBlockInputReference
 
-        self._StandardControlBlock_MetaBlockParameterReference = []
-        self.StandardControlBlock_MetaBlockParameterReference = [] if StandardControlBlock_MetaBlockParameterReference is None else StandardControlBlock_MetaBlockParameterReference
+        if StandardControlBlock_MetaBlockParameterReference is not None:
+            self.StandardControlBlock_MetaBlockParameterReference = StandardControlBlock_MetaBlockParameterReference
 
-        self._MetaBlockParameterReference = []
-        self.MetaBlockParameterReference = [] if MetaBlockParameterReference is None else MetaBlockParameterReference
+        if MetaBlockParameterReference is not None:
+            self.MetaBlockParameterReference = MetaBlockParameterReference
 
-        self._StandardControlBlock_MetaBlockOutputReference = []
-        self.StandardControlBlock_MetaBlockOutputReference = [] if StandardControlBlock_MetaBlockOutputReference is None else StandardControlBlock_MetaBlockOutputReference
+        if StandardControlBlock_MetaBlockOutputReference is not None:
+            self.StandardControlBlock_MetaBlockOutputReference = StandardControlBlock_MetaBlockOutputReference
 
-        self._MetaBlockInputReference = []
-        self.MetaBlockInputReference = [] if MetaBlockInputReference is None else MetaBlockInputReference
+        if MetaBlockInputReference is not None:
+            self.MetaBlockInputReference = MetaBlockInputReference
 
         super(MetaBlockConnectable, self).__init__(*args, **kw_args)
 
@@ -72,13 +73,15 @@ class MetaBlockConnectable(IdentifiedObject):
     _enums = {}
     _refs = ["StandardControlBlock_MetaBlockStateReference", "MetaBlockOutputReference", "MetaBlockStateReference", "BlockInputReference", "StandardControlBlock_MetaBlockInputReference", "StandardControlBlock_MetaBlockParameterReference", "MetaBlockParameterReference", "StandardControlBlock_MetaBlockOutputReference", "MetaBlockInputReference"]
     _many_refs = ["StandardControlBlock_MetaBlockStateReference", "MetaBlockOutputReference", "MetaBlockStateReference", "BlockInputReference", "StandardControlBlock_MetaBlockInputReference", "StandardControlBlock_MetaBlockParameterReference", "MetaBlockParameterReference", "StandardControlBlock_MetaBlockOutputReference", "MetaBlockInputReference"]
+    _inverses = {"StandardControlBlock_MetaBlockStateReference": "StandardControlBlock_MetaBlockConnectable", "MetaBlockOutputReference": "MetaBlockConnectable", "MetaBlockStateReference": "MetaBlockConnectable", "BlockInputReference": "BlockConnectable", "StandardControlBlock_MetaBlockInputReference": "StandardControlBlock_MetaBlockConnectable", "StandardControlBlock_MetaBlockParameterReference": "StandardControlBlock_MetaBlockConnectable", "MetaBlockParameterReference": "MetaBlockConnectable", "StandardControlBlock_MetaBlockOutputReference": "StandardControlBlock_MetaBlockConnectable", "MetaBlockInputReference": "MetaBlockConnectable"}
 
     def getStandardControlBlock_MetaBlockStateReference(self):
         
         return self._StandardControlBlock_MetaBlockStateReference
 
     def setStandardControlBlock_MetaBlockStateReference(self, value):
-        for x in self._StandardControlBlock_MetaBlockStateReference:
+        value = RefList(value)
+        for x in list(self._StandardControlBlock_MetaBlockStateReference):
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
             y._StandardControlBlock_MetaBlockConnectable = self
@@ -99,7 +102,8 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._MetaBlockOutputReference
 
     def setMetaBlockOutputReference(self, value):
-        for x in self._MetaBlockOutputReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockOutputReference):
             x.MetaBlockConnectable = None
         for y in value:
             y._MetaBlockConnectable = self
@@ -120,7 +124,8 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._MetaBlockStateReference
 
     def setMetaBlockStateReference(self, value):
-        for x in self._MetaBlockStateReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockStateReference):
             x.MetaBlockConnectable = None
         for y in value:
             y._MetaBlockConnectable = self
@@ -142,7 +147,8 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._BlockInputReference
 
     def setBlockInputReference(self, value):
-        for x in self._BlockInputReference:
+        value = RefList(value)
+        for x in list(self._BlockInputReference):
             x.BlockConnectable = None
         for y in value:
             y._BlockConnectable = self
@@ -163,7 +169,8 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._StandardControlBlock_MetaBlockInputReference
 
     def setStandardControlBlock_MetaBlockInputReference(self, value):
-        for x in self._StandardControlBlock_MetaBlockInputReference:
+        value = RefList(value)
+        for x in list(self._StandardControlBlock_MetaBlockInputReference):
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
             y._StandardControlBlock_MetaBlockConnectable = self
@@ -184,7 +191,8 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._StandardControlBlock_MetaBlockParameterReference
 
     def setStandardControlBlock_MetaBlockParameterReference(self, value):
-        for x in self._StandardControlBlock_MetaBlockParameterReference:
+        value = RefList(value)
+        for x in list(self._StandardControlBlock_MetaBlockParameterReference):
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
             y._StandardControlBlock_MetaBlockConnectable = self
@@ -205,7 +213,8 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._MetaBlockParameterReference
 
     def setMetaBlockParameterReference(self, value):
-        for x in self._MetaBlockParameterReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockParameterReference):
             x.MetaBlockConnectable = None
         for y in value:
             y._MetaBlockConnectable = self
@@ -226,7 +235,8 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._StandardControlBlock_MetaBlockOutputReference
 
     def setStandardControlBlock_MetaBlockOutputReference(self, value):
-        for x in self._StandardControlBlock_MetaBlockOutputReference:
+        value = RefList(value)
+        for x in list(self._StandardControlBlock_MetaBlockOutputReference):
             x.StandardControlBlock_MetaBlockConnectable = None
         for y in value:
             y._StandardControlBlock_MetaBlockConnectable = self
@@ -247,7 +257,8 @@ class MetaBlockConnectable(IdentifiedObject):
         return self._MetaBlockInputReference
 
     def setMetaBlockInputReference(self, value):
-        for x in self._MetaBlockInputReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockInputReference):
             x.MetaBlockConnectable = None
         for y in value:
             y._MetaBlockConnectable = self
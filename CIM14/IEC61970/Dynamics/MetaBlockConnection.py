@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class MetaBlockConnection(IdentifiedObject):
 
@@ -35,17 +36,17 @@ class MetaBlockConnection(IdentifiedObject):
         #: Used for standard connection situations where multiple blocks of same class or same MetaBlock::blockkind have to be connected. The slotnames used are defined in the Reference Manual for Exchanging Standard Power System Dynamic Models. Application: Cross-compound or Combined Cycle connections.
         self.slotname = slotname
 
-        self._MetaBlockConOutput = []
-        self.MetaBlockConOutput = [] if MetaBlockConOutput is None else MetaBlockConOutput
+        if MetaBlockConOutput is not None:
+            self.MetaBlockConOutput = MetaBlockConOutput
 
-        self._MetaBlockConInput = []
-        self.MetaBlockConInput = [] if MetaBlockConInput is None else MetaBlockConInput
+        if MetaBlockConInput is not None:
+            self.MetaBlockConInput = MetaBlockConInput
 
         self._metaBlockConnectivity0 = None
         self.metaBlockConnectivity0 = metaBlockConnectivity0
 
-        self._BlockConnection = []
-        self.BlockConnection = [] if BlockConnection is None else BlockConnection
+        if BlockConnection is not None:
+            self.BlockConnection = BlockConnection
 
         self._MemberOf_MetaBlockConnectivity = None
         self.MemberOf_MetaBlockConnectivity = MemberOf_MetaBlockConnectivity
@@ -58,13 +59,15 @@ class MetaBlockConnection(IdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockConOutput", "MetaBlockConInput", "metaBlockConnectivity0", "BlockConnection", "MemberOf_MetaBlockConnectivity"]
     _many_refs = ["MetaBlockConOutput", "MetaBlockConInput", "BlockConnection"]
+    _inverses = {"MetaBlockConOutput": "MemberOf_MetaBlockConnection", "MetaBlockConInput": "MemberOf_MetaBlockConnection", "metaBlockConnectivity0": "metaBlockConnection0", "BlockConnection": "MetaBlockConnection", "MemberOf_MetaBlockConnectivity": "MetaBlockConnection"}
 
     def getMetaBlockConOutput(self):
         
         return self._MetaBlockConOutput
 
     def setMetaBlockConOutput(self, value):
-        for x in self._MetaBlockConOutput:
+        value = RefList(value)
+        for x in list(self._MetaBlockConOutput):
             x.MemberOf_MetaBlockConnection = None
         for y in value:
             y._MemberOf_MetaBlockConnection = self
@@ -85,7 +88,8 @@ class MetaBlockConnection(IdentifiedObject):
         return self._MetaBlockConInput
 
     def setMetaBlockConInput(self, value):
-        for x in self._MetaBlockConInput:
+        value = RefList(value)
+        for x in list(self._MetaBlockConInput):
             x.MemberOf_MetaBlockConnection = None
         for y in value:
             y._MemberOf_MetaBlockConnection = self
@@ -107,13 +111,12 @@ class MetaBlockConnection(IdentifiedObject):
 
     def setmetaBlockConnectivity0(self, value):
         if self._metaBlockConnectivity0 is not None:
-            filtered = [x for x in self.metaBlockConnectivity0.metaBlockConnection0 if x != self]
-            self._metaBlockConnectivity0._metaBlockConnection0 = filtered
+            self._metaBlockConnectivity0._metaBlockConnection0.discard(self)
 
         self._metaBlockConnectivity0 = value
         if self._metaBlockConnectivity0 is not None:
             if self not in self._metaBlockConnectivity0._metaBlockConnection0:
-                self._metaBlockConnectivity0._metaBlockConnection0.append(self)
+                self._metaBlockConnectivity0._reflist("_metaBlockConnection0").append(self)
 
     metaBlockConnectivity0 = property(getmetaBlockConnectivity0, setmetaBlockConnectivity0)
 
@@ -122,7 +125,8 @@ class MetaBlockConnection(IdentifiedObject):
         return self._BlockConnection
 
     def setBlockConnection(self, value):
-        for x in self._BlockConnection:
+        value = RefList(value)
+        for x in list(self._BlockConnection):
             x.MetaBlockConnection = None
         for y in value:
             y._MetaBlockConnection = self
@@ -144,13 +148,12 @@ class MetaBlockConnection(IdentifiedObject):
 
     def setMemberOf_MetaBlockConnectivity(self, value):
         if self._MemberOf_MetaBlockConnectivity is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockConnectivity.MetaBlockConnection if x != self]
-            self._MemberOf_MetaBlockConnectivity._MetaBlockConnection = filtered
+            self._MemberOf_MetaBlockConnectivity._MetaBlockConnection.discard(self)
 
         self._MemberOf_MetaBlockConnectivity = value
         if self._MemberOf_MetaBlockConnectivity is not None:
             if self not in self._MemberOf_MetaBlockConnectivity._MetaBlockConnection:
-                self._MemberOf_MetaBlockConnectivity._MetaBlockConnection.append(self)
+                self._MemberOf_MetaBlockConnectivity._reflist("_MetaBlockConnection").append(self)
 
     MemberOf_MetaBlockConnectivity = property(getMemberOf_MetaBlockConnectivity, setMemberOf_MetaBlockConnectivity)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class MetaBlockConnectivity(IdentifiedObject):
 
@@ -31,20 +32,20 @@ class MetaBlockConnectivity(IdentifiedObject):
         @param metaBlockConSignal0:
         @param MetaBlockConnection:
         """
-        self._BlockConnectivity = []
-        self.BlockConnectivity = [] if BlockConnectivity is None else BlockConnectivity
+        if BlockConnectivity is not None:
+            self.BlockConnectivity = BlockConnectivity
 
-        self._MetaBlockConSignal = []
-        self.MetaBlockConSignal = [] if MetaBlockConSignal is None else MetaBlockConSignal
+        if MetaBlockConSignal is not None:
+            self.MetaBlockConSignal = MetaBlockConSignal
 
-        self._metaBlockConnection0 = []
-        self.metaBlockConnection0 = [] if metaBlockConnection0 is None else metaBlockConnection0
+        if metaBlockConnection0 is not None:
+            self.metaBlockConnection0 = metaBlockConnection0
 
-        self._metaBlockConSignal0 = []
-        self.metaBlockConSignal0 = [] if metaBlockConSignal0 is None else metaBlockConSignal0
+        if metaBlockConSignal0 is not None:
+            self.metaBlockConSignal0 = metaBlockConSignal0
 
-        self._MetaBlockConnection = []
-        self.MetaBlockConnection = [] if MetaBlockConnection is None else MetaBlockConnection
+        if MetaBlockConnection is not None:
+            self.MetaBlockConnection = MetaBlockConnection
 
         super(MetaBlockConnectivity, self).__init__(*args, **kw_args)
 
@@ -54,13 +55,15 @@ class MetaBlockConnectivity(IdentifiedObject):
     _enums = {}
     _refs = ["BlockConnectivity", "MetaBlockConSignal", "metaBlockConnection0", "metaBlockConSignal0", "MetaBlockConnection"]
     _many_refs = ["BlockConnectivity", "MetaBlockConSignal", "metaBlockConnection0", "metaBlockConSignal0", "MetaBlockConnection"]
+    _inverses = {"BlockConnectivity": "MetaBlockConnectivity", "MetaBlockConSignal": "MemberOf_MetaBlockConnectivity", "metaBlockConnection0": "metaBlockConnectivity0", "metaBlockConSignal0": "metaBlockConnectivity0", "MetaBlockConnection": "MemberOf_MetaBlockConnectivity"}
 
     def getBlockConnectivity(self):
         
         return self._BlockConnectivity
 
     def setBlockConnectivity(self, value):
-        for x in self._BlockConnectivity:
+        value = RefList(value)
+        for x in list(self._BlockConnectivity):
             x.MetaBlockConnectivity = None
         for y in value:
             y._MetaBlockConnectivity = self
@@ -81,7 +84,8 @@ class MetaBlockConnectivity(IdentifiedObject):
         return self._MetaBlockConSignal
 
     def setMetaBlockConSignal(self, value):
-        for x in self._MetaBlockConSignal:
+        value = RefList(value)
+        for x in list(self._MetaBlockConSignal):
             x.MemberOf_MetaBlockConnectivity = None
         for y in value:
             y._MemberOf_MetaBlockConnectivity = self
@@ -102,7 +106,8 @@ class MetaBlockConnectivity(IdentifiedObject):
         return self._metaBlockConnection0
 
     def setmetaBlockConnection0(self, value):
-        for x in self._metaBlockConnection0:
+        value = RefList(value)
+        for x in list(self._metaBlockConnection0):
             x.metaBlockConnectivity0 = None
         for y in value:
             y._metaBlockConnectivity0 = self
@@ -123,7 +128,8 @@ class MetaBlockConnectivity(IdentifiedObject):
         return self._metaBlockConSignal0
 
     def setmetaBlockConSignal0(self, value):
-        for x in self._metaBlockConSignal0:
+        value = RefList(value)
+        for x in list(self._metaBlockConSignal0):
             x.metaBlockConnectivity0 = None
         for y in value:
             y._metaBlockConnectivity0 = self
@@ -144,7 +150,8 @@ class MetaBlockConnectivity(IdentifiedObject):
         return self._MetaBlockConnection
 
     def setMetaBlockConnection(self, value):
-        for x in self._MetaBlockConnection:
+        value = RefList(value)
+        for x in list(self._MetaBlockConnection):
             x.MemberOf_MetaBlockConnectivity = None
         for y in value:
             y._MemberOf_MetaBlockConnectivity = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.MetaBlockConnectable import MetaBlockConnectable
+from CIM14.Element import RefList
 
 class MetaBlockInput(MetaBlockConnectable):
     """Linkage at the dynanics meta model level.    The output of a block could link to this. This is a public interface external to the block.
@@ -33,20 +34,20 @@ class MetaBlockInput(MetaBlockConnectable):
         @param blockInputType0:
         @param tieToMeasurement0: The identified block input to which this measurement applies.   Note this applies only to the external interface of blocks.
         """
-        self._blockInputReference0 = []
-        self.blockInputReference0 = [] if blockInputReference0 is None else blockInputReference0
+        if blockInputReference0 is not None:
+            self.blockInputReference0 = blockInputReference0
 
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
 
-        self._blockUsageInputReference0 = []
-        self.blockUsageInputReference0 = [] if blockUsageInputReference0 is None else blockUsageInputReference0
+        if blockUsageInputReference0 is not None:
+            self.blockUsageInputReference0 = blockUsageInputReference0
 
         self._blockInputType0 = None
         self.blockInputType0 = blockInputType0
 
-        self._tieToMeasurement0 = []
-        self.tieToMeasurement0 = [] if tieToMeasurement0 is None else tieToMeasurement0
+        if tieToMeasurement0 is not None:
+            self.tieToMeasurement0 = tieToMeasurement0
 
         super(MetaBlockInput, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class MetaBlockInput(MetaBlockConnectable):
     _enums = {}
     _refs = ["blockInputReference0", "MemberOf_MetaBlock", "blockUsageInputReference0", "blockInputType0", "tieToMeasurement0"]
     _many_refs = ["blockInputReference0", "blockUsageInputReference0", "tieToMeasurement0"]
+    _inverses = {"blockInputReference0": "metaBlockInput0", "MemberOf_MetaBlock": "MetaBlockInput", "blockUsageInputReference0": "metaBlockInput0", "blockInputType0": "metaBlockInput0", "tieToMeasurement0": "metaBlockInput0"}
 
     def getblockInputReference0(self):
         """References the idenfiied input for the block reference.
@@ -63,7 +65,8 @@ class MetaBlockInput(MetaBlockConnectable):
         return self._blockInputReference0
 
     def setblockInputReference0(self, value):
-        for x in self._blockInputReference0:
+        value = RefList(value)
+        for x in list(self._blockInputReference0):
             x.metaBlockInput0 = None
         for y in value:
             y._metaBlockInput0 = self
@@ -86,13 +89,12 @@ class MetaBlockInput(MetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockInput if x != self]
-            self._MemberOf_MetaBlock._MetaBlockInput = filtered
+            self._MemberOf_MetaBlock._MetaBlockInput.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
             if self not in self._MemberOf_MetaBlock._MetaBlockInput:
-                self._MemberOf_MetaBlock._MetaBlockInput.append(self)
+                self._MemberOf_MetaBlock._reflist("_MetaBlockInput").append(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -101,7 +103,8 @@ class MetaBlockInput(MetaBlockConnectable):
         return self._blockUsageInputReference0
 
     def setblockUsageInputReference0(self, value):
-        for x in self._blockUsageInputReference0:
+        value = RefList(value)
+        for x in list(self._blockUsageInputReference0):
             x.metaBlockInput0 = None
         for y in value:
             y._metaBlockInput0 = self
@@ -123,13 +126,12 @@ class MetaBlockInput(MetaBlockConnectable):
 
     def setblockInputType0(self, value):
         if self._blockInputType0 is not None:
-            filtered = [x for x in self.blockInputType0.metaBlockInput0 if x != self]
-            self._blockInputType0._metaBlockInput0 = filtered
+            self._blockInputType0._metaBlockInput0.discard(self)
 
         self._blockInputType0 = value
         if self._blockInputType0 is not None:
             if self not in self._blockInputType0._metaBlockInput0:
-                self._blockInputType0._metaBlockInput0.append(self)
+                self._blockInputType0._reflist("_metaBlockInput0").append(self)
 
     blockInputType0 = property(getblockInputType0, setblockInputType0)
 
@@ -139,7 +141,8 @@ class MetaBlockInput(MetaBlockConnectable):
         return self._tieToMeasurement0
 
     def settieToMeasurement0(self, value):
-        for x in self._tieToMeasurement0:
+        value = RefList(value)
+        for x in list(self._tieToMeasurement0):
             x.metaBlockInput0 = None
         for y in value:
             y._metaBlockInput0 = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.MetaBlockConnectable import MetaBlockConnectable
+from CIM14.Element import RefList
 
 class MetaBlockOutput(MetaBlockConnectable):
     """Output state of a block.   This is a public interface external to the block.    One or more block outputs should be specified in order to link blocks together.    Certain block kinds might require a specific output. For example, an exciter block might require an output called 'Ea'.
@@ -32,14 +33,14 @@ class MetaBlockOutput(MetaBlockConnectable):
         @param blockUsageOutputReference0:
         @param blockOutputType0:
         """
-        self._BlockOutputReference = []
-        self.BlockOutputReference = [] if BlockOutputReference is None else BlockOutputReference
+        if BlockOutputReference is not None:
+            self.BlockOutputReference = BlockOutputReference
 
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
 
-        self._blockUsageOutputReference0 = []
-        self.blockUsageOutputReference0 = [] if blockUsageOutputReference0 is None else blockUsageOutputReference0
+        if blockUsageOutputReference0 is not None:
+            self.blockUsageOutputReference0 = blockUsageOutputReference0
 
         self._blockOutputType0 = None
         self.blockOutputType0 = blockOutputType0
@@ -52,6 +53,7 @@ class MetaBlockOutput(MetaBlockConnectable):
     _enums = {}
     _refs = ["BlockOutputReference", "MemberOf_MetaBlock", "blockUsageOutputReference0", "blockOutputType0"]
     _many_refs = ["BlockOutputReference", "blockUsageOutputReference0"]
+    _inverses = {"BlockOutputReference": "metaBlockOutput0", "MemberOf_MetaBlock": "MetaBlockOutput", "blockUsageOutputReference0": "metaBlockOutput0", "blockOutputType0": "metaBlockOutput0"}
 
     def getBlockOutputReference(self):
         """A block output reference for the block output.  The output of the block is passed to the block output reference which is a block connectable and thus can be connected at the dynamics metadata level to another block.
@@ -59,7 +61,8 @@ class MetaBlockOutput(MetaBlockConnectable):
         return self._BlockOutputReference
 
     def setBlockOutputReference(self, value):
-        for x in self._BlockOutputReference:
+        value = RefList(value)
+        for x in list(self._BlockOutputReference):
             x.metaBlockOutput0 = None
         for y in value:
             y._metaBlockOutput0 = self
@@ -82,13 +85,12 @@ class MetaBlockOutput(MetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockOutput if x != self]
-            self._MemberOf_MetaBlock._MetaBlockOutput = filtered
+            self._MemberOf_MetaBlock._MetaBlockOutput.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
             if self not in self._MemberOf_MetaBlock._MetaBlockOutput:
-                self._MemberOf_MetaBlock._MetaBlockOutput.append(self)
+                self._MemberOf_MetaBlock._reflist("_MetaBlockOutput").append(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -97,7 +99,8 @@ class MetaBlockOutput(MetaBlockConnectable):
         return self._blockUsageOutputReference0
 
     def setblockUsageOutputReference0(self, value):
-        for x in self._blockUsageOutputReference0:
+        value = RefList(value)
+        for x in list(self._blockUsageOutputReference0):
             x.metaBlockOutput0 = None
         for y in value:
             y._metaBlockOutput0 = self
@@ -119,13 +122,12 @@ class MetaBlockOutput(MetaBlockConnectable):
 
     def setblockOutputType0(self, value):
         if self._blockOutputType0 is not None:
-            filtered = [x for x in self.blockOutputType0.metaBlockOutput0 if x != self]
-            self._blockOutputType0._metaBlockOutput0 = filtered
+            self._blockOutputType0._metaBlockOutput0.discard(self)
 
         self._blockOutputType0 = value
         if self._blockOutputType0 is not None:
             if self not in self._blockOutputType0._metaBlockOutput0:
-                self._blockOutputType0._metaBlockOutput0.append(self)
+                self._blockOutputType0._reflist("_metaBlockOutput0").append(self)
 
     blockOutputType0 = property(getblockOutputType0, setblockOutputType0)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class MetaBlockOutputReference(IdentifiedObject):
 
@@ -36,8 +37,8 @@ class MetaBlockOutputReference(IdentifiedObject):
         self._MemberOf_MetaBlockReference = None
         self.MemberOf_MetaBlockReference = MemberOf_MetaBlockReference
 
-        self._MetaBlockSignal = []
-        self.MetaBlockSignal = [] if MetaBlockSignal is None else MetaBlockSignal
+        if MetaBlockSignal is not None:
+            self.MetaBlockSignal = MetaBlockSignal
 
         self._StandardControlBlock_MetaBlockConnectable = None
         self.StandardControlBlock_MetaBlockConnectable = StandardControlBlock_MetaBlockConnectable
@@ -50,6 +51,7 @@ class MetaBlockOutputReference(IdentifiedObject):
     _enums = {}
     _refs = ["MetaBlockConnectable", "MemberOf_MetaBlockReference", "MetaBlockSignal", "StandardControlBlock_MetaBlockConnectable"]
     _many_refs = ["MetaBlockSignal"]
+    _inverses = {"MetaBlockConnectable": "MetaBlockOutputReference", "MemberOf_MetaBlockReference": "MetaBlockOutputReference", "MetaBlockSignal": "To", "StandardControlBlock_MetaBlockConnectable": "StandardControlBlock_MetaBlockOutputReference"}
 
     def getMetaBlockConnectable(self):
         
@@ -57,13 +59,12 @@ class MetaBlockOutputReference(IdentifiedObject):
 
     def setMetaBlockConnectable(self, value):
         if self._MetaBlockConnectable is not None:
-            filtered = [x for x in self.MetaBlockConnectable.MetaBlockOutputReference if x != self]
-            self._MetaBlockConnectable._MetaBlockOutputReference = filtered
+            self._MetaBlockConnectable._MetaBlockOutputReference.discard(self)
 
         self._MetaBlockConnectable = value
         if self._MetaBlockConnectable is not None:
             if self not in self._MetaBlockConnectable._MetaBlockOutputReference:
-                self._MetaBlockConnectable._MetaBlockOutputReference.append(self)
+                self._MetaBlockConnectable._reflist("_MetaBlockOutputReference").append(self)
 
     MetaBlockConnectable = property(getMetaBlockConnectable, setMetaBlockConnectable)
 
@@ -73,13 +74,12 @@ class MetaBlockOutputReference(IdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.MetaBlockOutputReference if x != self]
-            self._MemberOf_MetaBlockReference._MetaBlockOutputReference = filtered
+            self._MemberOf_MetaBlockReference._MetaBlockOutputReference.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
             if self not in self._MemberOf_MetaBlockReference._MetaBlockOutputReference:
-                self._MemberOf_MetaBlockReference._MetaBlockOutputReference.append(self)
+                self._MemberOf_MetaBlockReference._reflist("_MetaBlockOutputReference").append(self)
 
     MemberOf_MetaBlockReference = property(getMemberOf_MetaBlockReference, setMemberOf_MetaBlockReference)
 
@@ -88,7 +88,8 @@ class MetaBlockOutputReference(IdentifiedObject):
         return self._MetaBlockSignal
 
     def setMetaBlockSignal(self, value):
-        for x in self._MetaBlockSignal:
+        value = RefList(value)
+        for x in list(self._MetaBlockSignal):
             x.To = None
         for y in value:
             y._To = self
@@ -110,13 +111,12 @@ class MetaBlockOutputReference(IdentifiedObject):
 
     def setStandardControlBlock_MetaBlockConnectable(self, value):
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            filtered = [x for x in self.StandardControlBlock_MetaBlockConnectable.StandardControlBlock_MetaBlockOutputReference if x != self]
-            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockOutputReference = filtered
+            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockOutputReference.discard(self)
 
         self._StandardControlBlock_MetaBlockConnectable = value
         if self._StandardControlBlock_MetaBlockConnectable is not None:
             if self not in self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockOutputReference:
-                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockOutputReference.append(self)
+                self._StandardControlBlock_MetaBlockConnectable._reflist("_StandardControlBlock_MetaBlockOutputReference").append(self)
 
     StandardControlBlock_MetaBlockConnectable = property(getStandardControlBlock_MetaBlockConnectable, setStandardControlBlock_MetaBlockConnectable)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.MetaBlockConnectable import MetaBlockConnectable
+from CIM14.Element import RefList
 
 class MetaBlockParameter(MetaBlockConnectable):
     """An identified parameter of a block.   This is meta dynamics model and does not contain specific parameter values. When using a block one would need to supply specific parameter values. These are typically time constants, but are not restricted to this.  Sometimes, for standard blocks, the block paramter may come directly from the attributes of an associated PowerSystemResource object, but such parameters may be specified to enable user defined models to alter the behavior of a standard block.
@@ -30,8 +31,8 @@ class MetaBlockParameter(MetaBlockConnectable):
         @param BlockParameter:
         @param MemberOf_MetaBlock: Paramters belong to a block.
         """
-        self._BlockParameter = []
-        self.BlockParameter = [] if BlockParameter is None else BlockParameter
+        if BlockParameter is not None:
+            self.BlockParameter = BlockParameter
 
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
@@ -44,13 +45,15 @@ class MetaBlockParameter(MetaBlockConnectable):
     _enums = {}
     _refs = ["BlockParameter", "MemberOf_MetaBlock"]
     _many_refs = ["BlockParameter"]
+    _inverses = {"BlockParameter": "MetaBlockParameter", "MemberOf_MetaBlock": "MetaBlockParameter"}
 
     def getBlockParameter(self):
         
         return self._BlockParameter
 
     def setBlockParameter(self, value):
-        for x in self._BlockParameter:
+        value = RefList(value)
+        for x in list(self._BlockParameter):
             x.MetaBlockParameter = None
         for y in value:
             y._MetaBlockParameter = self
@@ -73,13 +76,12 @@ class MetaBlockParameter(MetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockParameter if x != self]
-            self._MemberOf_MetaBlock._MetaBlockParameter = filtered
+            self._MemberOf_MetaBlock._MetaBlockParameter.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
             if self not in self._MemberOf_MetaBlock._MetaBlockParameter:
-                self._MemberOf_MetaBlock._MetaBlockParameter.append(self)
+                self._MemberOf_MetaBlock._reflist("_MetaBlockParameter").append(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -48,6 +48,7 @@ class MetaBlockParameterReference(IdentifiedObject):
     _enums = {}
     _refs = ["StandardControlBlock_MetaBlockConnectable", "MetaBlockConnectable", "MemberOf_MetaBlockReference"]
     _many_refs = []
+    _inverses = {"StandardControlBlock_MetaBlockConnectable": "StandardControlBlock_MetaBlockParameterReference", "MetaBlockConnectable": "MetaBlockParameterReference", "MemberOf_MetaBlockReference": "MetaBlockParameterReference"}
 
     def getStandardControlBlock_MetaBlockConnectable(self):
         
@@ -55,13 +56,12 @@ class MetaBlockParameterReference(IdentifiedObject):
 
     def setStandardControlBlock_MetaBlockConnectable(self, value):
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            filtered = [x for x in self.StandardControlBlock_MetaBlockConnectable.StandardControlBlock_MetaBlockParameterReference if x != self]
-            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockParameterReference = filtered
+            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockParameterReference.discard(self)
 
         self._StandardControlBlock_MetaBlockConnectable = value
         if self._StandardControlBlock_MetaBlockConnectable is not None:
             if self not in self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockParameterReference:
-                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockParameterReference.append(self)
+                self._StandardControlBlock_MetaBlockConnectable._reflist("_StandardControlBlock_MetaBlockParameterReference").append(self)
 
     StandardControlBlock_MetaBlockConnectable = property(getStandardControlBlock_MetaBlockConnectable, setStandardControlBlock_MetaBlockConnectable)
 
@@ -71,13 +71,12 @@ class MetaBlockParameterReference(IdentifiedObject):
 
     def setMetaBlockConnectable(self, value):
         if self._MetaBlockConnectable is not None:
-            filtered = [x for x in self.MetaBlockConnectable.MetaBlockParameterReference if x != self]
-            self._MetaBlockConnectable._MetaBlockParameterReference = filtered
+            self._MetaBlockConnectable._MetaBlockParameterReference.discard(self)
 
         self._MetaBlockConnectable = value
         if self._MetaBlockConnectable is not None:
             if self not in self._MetaBlockConnectable._MetaBlockParameterReference:
-                self._MetaBlockConnectable._MetaBlockParameterReference.append(self)
+                self._MetaBlockConnectable._reflist("_MetaBlockParameterReference").append(self)
 
     MetaBlockConnectable = property(getMetaBlockConnectable, setMetaBlockConnectable)
 
@@ -87,13 +86,12 @@ class MetaBlockParameterReference(IdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.MetaBlockParameterReference if x != self]
-            self._MemberOf_MetaBlockReference._MetaBlockParameterReference = filtered
+            self._MemberOf_MetaBlockReference._MetaBlockParameterReference.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
             if self not in self._MemberOf_MetaBlockReference._MetaBlockParameterReference:
-                self._MemberOf_MetaBlockReference._MetaBlockParameterReference.append(self)
+                self._MemberOf_MetaBlockReference._reflist("_MetaBlockParameterReference").append(self)
 
     MemberOf_MetaBlockReference = property(getMemberOf_MetaBlockReference, setMemberOf_MetaBlockReference)
 
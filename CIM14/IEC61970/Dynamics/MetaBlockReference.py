@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class MetaBlockReference(IdentifiedObject):
     """References a control block at the internal meta dynamics model level.    These references are contained in other blocks and reference the single instance of the meta model that defines a particular block definition. One would not expect to see bock references contained within a primitive block.
@@ -41,31 +42,31 @@ class MetaBlockReference(IdentifiedObject):
         #: should be enum, initial conditions vs. simulation equations
         self.equationType = equationType
 
-        self._blockInputReference0 = []
-        self.blockInputReference0 = [] if blockInputReference0 is None else blockInputReference0
+        if blockInputReference0 is not None:
+            self.blockInputReference0 = blockInputReference0
 
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
 
         self.MetaBlock = MetaBlock
 
-        self._blockOutputReference0 = []
-        self.blockOutputReference0 = [] if blockOutputReference0 is None else blockOutputReference0
+        if blockOutputReference0 is not None:
+            self.blockOutputReference0 = blockOutputReference0
 
-        self._MetaBlockStateReference = []
-        self.MetaBlockStateReference = [] if MetaBlockStateReference is None else MetaBlockStateReference
+        if MetaBlockStateReference is not None:
+            self.MetaBlockStateReference = MetaBlockStateReference
 
-        self._MetaBlockInputReference = []
-        self.MetaBlockInputReference = [] if MetaBlockInputReference is None else MetaBlockInputReference
+        if MetaBlockInputReference is not None:
+            self.MetaBlockInputReference = MetaBlockInputReference
 
-        self._MetaBlockOutputReference = []
-        self.MetaBlockOutputReference = [] if MetaBlockOutputReference is None else MetaBlockOutputReference
+        if MetaBlockOutputReference is not None:
+            self.MetaBlockOutputReference = MetaBlockOutputReference
 
-        self._BlockParameter = []
-        self.BlockParameter = [] if BlockParameter is None else BlockParameter
+        if BlockParameter is not None:
+            self.BlockParameter = BlockParameter
 
-        self._MetaBlockParameterReference = []
-        self.MetaBlockParameterReference = [] if MetaBlockParameterReference is None else MetaBlockParameterReference
+        if MetaBlockParameterReference is not None:
+            self.MetaBlockParameterReference = MetaBlockParameterReference
 
         super(MetaBlockReference, self).__init__(*args, **kw_args)
 
@@ -75,13 +76,15 @@ class MetaBlockReference(IdentifiedObject):
     _enums = {}
     _refs = ["blockInputReference0", "MemberOf_MetaBlock", "MetaBlock", "blockOutputReference0", "MetaBlockStateReference", "MetaBlockInputReference", "MetaBlockOutputReference", "BlockParameter", "MetaBlockParameterReference"]
     _many_refs = ["blockInputReference0", "blockOutputReference0", "MetaBlockStateReference", "MetaBlockInputReference", "MetaBlockOutputReference", "BlockParameter", "MetaBlockParameterReference"]
+    _inverses = {"blockInputReference0": "metaBlockReference0", "MemberOf_MetaBlock": "MetaBlockReference", "blockOutputReference0": "metaBlockReference0", "MetaBlockStateReference": "MemberOf_MetaBlockReference", "MetaBlockInputReference": "MemberOf_MetaBlockReference", "MetaBlockOutputReference": "MemberOf_MetaBlockReference", "BlockParameter": "MemberOf_MetaBlockReference", "MetaBlockParameterReference": "MemberOf_MetaBlockReference"}
 
     def getblockInputReference0(self):
         
         return self._blockInputReference0
 
     def setblockInputReference0(self, value):
-        for x in self._blockInputReference0:
+        value = RefList(value)
+        for x in list(self._blockInputReference0):
             x.metaBlockReference0 = None
         for y in value:
             y._metaBlockReference0 = self
@@ -103,13 +106,12 @@ class MetaBlockReference(IdentifiedObject):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockReference if x != self]
-            self._MemberOf_MetaBlock._MetaBlockReference = filtered
+            self._MemberOf_MetaBlock._MetaBlockReference.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
             if self not in self._MemberOf_MetaBlock._MetaBlockReference:
-                self._MemberOf_MetaBlock._MetaBlockReference.append(self)
+                self._MemberOf_MetaBlock._reflist("_MetaBlockReference").append(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -121,20 +123,19 @@ class MetaBlockReference(IdentifiedObject):
 
     def setblockOutputReference0(self, value):
         for p in self._blockOutputReference0:
-            filtered = [q for q in p.metaBlockReference0 if q != self]
-            self._blockOutputReference0._metaBlockReference0 = filtered
+            p._metaBlockReference0.discard(self)
         for r in value:
             if self not in r._metaBlockReference0:
-                r._metaBlockReference0.append(self)
-        self._blockOutputReference0 = value
+                r._reflist("_metaBlockReference0").append(self)
+        self._blockOutputReference0 = RefList(value)
 
     blockOutputReference0 = property(getblockOutputReference0, setblockOutputReference0)
 
     def addblockOutputReference0(self, *blockOutputReference0):
         for obj in blockOutputReference0:
             if self not in obj._metaBlockReference0:
-                obj._metaBlockReference0.append(self)
-            self._blockOutputReference0.append(obj)
+                obj._reflist("_metaBlockReference0").append(self)
+            self._reflist("_blockOutputReference0").append(obj)
 
     def removeblockOutputReference0(self, *blockOutputReference0):
         for obj in blockOutputReference0:
@@ -147,7 +148,8 @@ class MetaBlockReference(IdentifiedObject):
         return self._MetaBlockStateReference
 
     def setMetaBlockStateReference(self, value):
-        for x in self._MetaBlockStateReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockStateReference):
             x.MemberOf_MetaBlockReference = None
         for y in value:
             y._MemberOf_MetaBlockReference = self
@@ -168,7 +170,8 @@ class MetaBlockReference(IdentifiedObject):
         return self._MetaBlockInputReference
 
     def setMetaBlockInputReference(self, value):
-        for x in self._MetaBlockInputReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockInputReference):
             x.MemberOf_MetaBlockReference = None
         for y in value:
             y._MemberOf_MetaBlockReference = self
@@ -189,7 +192,8 @@ class MetaBlockReference(IdentifiedObject):
         return self._MetaBlockOutputReference
 
     def setMetaBlockOutputReference(self, value):
-        for x in self._MetaBlockOutputReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockOutputReference):
             x.MemberOf_MetaBlockReference = None
         for y in value:
             y._MemberOf_MetaBlockReference = self
@@ -210,7 +214,8 @@ class MetaBlockReference(IdentifiedObject):
         return self._BlockParameter
 
     def setBlockParameter(self, value):
-        for x in self._BlockParameter:
+        value = RefList(value)
+        for x in list(self._BlockParameter):
             x.MemberOf_MetaBlockReference = None
         for y in value:
             y._MemberOf_MetaBlockReference = self
@@ -231,7 +236,8 @@ class MetaBlockReference(IdentifiedObject):
         return self._MetaBlockParameterReference
 
     def setMetaBlockParameterReference(self, value):
-        for x in self._MetaBlockParameterReference:
+        value = RefList(value)
+        for x in list(self._MetaBlockParameterReference):
             x.MemberOf_MetaBlockReference = None
         for y in value:
             y._MemberOf_MetaBlockReference = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class MetaBlockSignal(IdentifiedObject):
 
@@ -31,11 +32,11 @@ class MetaBlockSignal(IdentifiedObject):
         @param From:
         @param To:
         """
-        self._metaBlockSignal1 = []
-        self.metaBlockSignal1 = [] if metaBlockSignal1 is None else metaBlockSignal1
+        if metaBlockSignal1 is not None:
+            self.metaBlockSignal1 = metaBlockSignal1
 
-        self._metaBlockSignal = []
-        self.metaBlockSignal = [] if metaBlockSignal is None else metaBlockSignal
+        if metaBlockSignal is not None:
+            self.metaBlockSignal = metaBlockSignal
 
         self._MemberOf_MetaBlock = None
         self.MemberOf_MetaBlock = MemberOf_MetaBlock
@@ -54,6 +55,7 @@ class MetaBlockSignal(IdentifiedObject):
     _enums = {}
     _refs = ["metaBlockSignal1", "metaBlockSignal", "MemberOf_MetaBlock", "From", "To"]
     _many_refs = ["metaBlockSignal1", "metaBlockSignal"]
+    _inverses = {"metaBlockSignal1": "metaBlockSignal", "metaBlockSignal": "metaBlockSignal1", "MemberOf_MetaBlock": "MetaBlockSignal", "From": "MetaBlockSignal", "To": "MetaBlockSignal"}
 
     def getmetaBlockSignal1(self):
         
@@ -61,20 +63,19 @@ class MetaBlockSignal(IdentifiedObject):
 
     def setmetaBlockSignal1(self, value):
         for p in self._metaBlockSignal1:
-            filtered = [q for q in p.metaBlockSignal if q != self]
-            self._metaBlockSignal1._metaBlockSignal = filtered
+            p._metaBlockSignal.discard(self)
         for r in value:
             if self not in r._metaBlockSignal:
-                r._metaBlockSignal.append(self)
-        self._metaBlockSignal1 = value
+                r._reflist("_metaBlockSignal").append(self)
+        self._metaBlockSignal1 = RefList(value)
 
     metaBlockSignal1 = property(getmetaBlockSignal1, setmetaBlockSignal1)
 
     def addmetaBlockSignal1(self, *metaBlockSignal1):
         for obj in metaBlockSignal1:
             if self not in obj._metaBlockSignal:
-                obj._metaBlockSignal.append(self)
-            self._metaBlockSignal1.append(obj)
+                obj._reflist("_metaBlockSignal").append(self)
+            self._reflist("_metaBlockSignal1").append(obj)
 
     def removemetaBlockSignal1(self, *metaBlockSignal1):
         for obj in metaBlockSignal1:
@@ -88,20 +89,19 @@ class MetaBlockSignal(IdentifiedObject):
 
     def setmetaBlockSignal(self, value):
         for p in self._metaBlockSignal:
-            filtered = [q for q in p.metaBlockSignal1 if q != self]
-            self._metaBlockSignal._metaBlockSignal1 = filtered
+            p._metaBlockSignal1.discard(self)
         for r in value:
             if self not in r._metaBlockSignal1:
-                r._metaBlockSignal1.append(self)
-        self._metaBlockSignal = value
+                r._reflist("_metaBlockSignal1").append(self)
+        self._metaBlockSignal = RefList(value)
 
     metaBlockSignal = property(getmetaBlockSignal, setmetaBlockSignal)
 
     def addmetaBlockSignal(self, *metaBlockSignal):
         for obj in metaBlockSignal:
             if self not in obj._metaBlockSignal1:
-                obj._metaBlockSignal1.append(self)
-            self._metaBlockSignal.append(obj)
+                obj._reflist("_metaBlockSignal1").append(self)
+            self._reflist("_metaBlockSignal").append(obj)
 
     def removemetaBlockSignal(self, *metaBlockSignal):
         for obj in metaBlockSignal:
@@ -115,13 +115,12 @@ class MetaBlockSignal(IdentifiedObject):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockSignal if x != self]
-            self._MemberOf_MetaBlock._MetaBlockSignal = filtered
+            self._MemberOf_MetaBlock._MetaBlockSignal.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
             if self not in self._MemberOf_MetaBlock._MetaBlockSignal:
-                self._MemberOf_MetaBlock._MetaBlockSignal.append(self)
+                self._MemberOf_MetaBlock._reflist("_MetaBlockSignal").append(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -146,13 +145,12 @@ class MetaBlockSignal(IdentifiedObject):
 
     def setTo(self, value):
         if self._To is not None:
-            filtered = [x for x in self.To.MetaBlockSignal if x != self]
-            self._To._MetaBlockSignal = filtered
+            self._To._MetaBlockSignal.discard(self)
 
         self._To = value
         if self._To is not None:
             if self not in self._To._MetaBlockSignal:
-                self._To._MetaBlockSignal.append(self)
+                self._To._reflist("_MetaBlockSignal").append(self)
 
     To = property(getTo, setTo)
 
@@ -38,6 +38,7 @@ class MetaBlockState(MetaBlockConnectable):
     _enums = {}
     _refs = ["MemberOf_MetaBlock"]
     _many_refs = []
+    _inverses = {"MemberOf_MetaBlock": "MetaBlockState"}
 
     def getMemberOf_MetaBlock(self):
         
@@ -45,13 +46,12 @@ class MetaBlockState(MetaBlockConnectable):
 
     def setMemberOf_MetaBlock(self, value):
         if self._MemberOf_MetaBlock is not None:
-            filtered = [x for x in self.MemberOf_MetaBlock.MetaBlockState if x != self]
-            self._MemberOf_MetaBlock._MetaBlockState = filtered
+            self._MemberOf_MetaBlock._MetaBlockState.discard(self)
 
         self._MemberOf_MetaBlock = value
         if self._MemberOf_MetaBlock is not None:
             if self not in self._MemberOf_MetaBlock._MetaBlockState:
-                self._MemberOf_MetaBlock._MetaBlockState.append(self)
+                self._MemberOf_MetaBlock._reflist("_MetaBlockState").append(self)
 
     MemberOf_MetaBlock = property(getMemberOf_MetaBlock, setMemberOf_MetaBlock)
 
@@ -50,6 +50,7 @@ class MetaBlockStateReference(IdentifiedObject):
     _enums = {}
     _refs = ["StandardControlBlock_MetaBlockConnectable", "MetaBlockConnectable", "MemberOf_MetaBlockReference"]
     _many_refs = []
+    _inverses = {"StandardControlBlock_MetaBlockConnectable": "StandardControlBlock_MetaBlockStateReference", "MetaBlockConnectable": "MetaBlockStateReference", "MemberOf_MetaBlockReference": "MetaBlockStateReference"}
 
     def getStandardControlBlock_MetaBlockConnectable(self):
         
@@ -57,13 +58,12 @@ class MetaBlockStateReference(IdentifiedObject):
 
     def setStandardControlBlock_MetaBlockConnectable(self, value):
         if self._StandardControlBlock_MetaBlockConnectable is not None:
-            filtered = [x for x in self.StandardControlBlock_MetaBlockConnectable.StandardControlBlock_MetaBlockStateReference if x != self]
-            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference = filtered
+            self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference.discard(self)
 
         self._StandardControlBlock_MetaBlockConnectable = value
         if self._StandardControlBlock_MetaBlockConnectable is not None:
             if self not in self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference:
-                self._StandardControlBlock_MetaBlockConnectable._StandardControlBlock_MetaBlockStateReference.append(self)
+                self._StandardControlBlock_MetaBlockConnectable._reflist("_StandardControlBlock_MetaBlockStateReference").append(self)
 
     StandardControlBlock_MetaBlockConnectable = property(getStandardControlBlock_MetaBlockConnectable, setStandardControlBlock_MetaBlockConnectable)
 
@@ -73,13 +73,12 @@ class MetaBlockStateReference(IdentifiedObject):
 
     def setMetaBlockConnectable(self, value):
         if self._MetaBlockConnectable is not None:
-            filtered = [x for x in self.MetaBlockConnectable.MetaBlockStateReference if x != self]
-            self._MetaBlockConnectable._MetaBlockStateReference = filtered
+            self._MetaBlockConnectable._MetaBlockStateReference.discard(self)
 
         self._MetaBlockConnectable = value
         if self._MetaBlockConnectable is not None:
             if self not in self._MetaBlockConnectable._MetaBlockStateReference:
-                self._MetaBlockConnectable._MetaBlockStateReference.append(self)
+                self._MetaBlockConnectable._reflist("_MetaBlockStateReference").append(self)
 
     MetaBlockConnectable = property(getMetaBlockConnectable, setMetaBlockConnectable)
 
@@ -89,13 +88,12 @@ class MetaBlockStateReference(IdentifiedObject):
 
     def setMemberOf_MetaBlockReference(self, value):
         if self._MemberOf_MetaBlockReference is not None:
-            filtered = [x for x in self.MemberOf_MetaBlockReference.MetaBlockStateReference if x != self]
-            self._MemberOf_MetaBlockReference._MetaBlockStateReference = filtered
+            self._MemberOf_MetaBlockReference._MetaBlockStateReference.discard(self)
 
         self._MemberOf_MetaBlockReference = value
         if self._MemberOf_MetaBlockReference is not None:
             if self not in self._MemberOf_MetaBlockReference._MetaBlockStateReference:
-                self._MemberOf_MetaBlockReference._MetaBlockStateReference.append(self)
+                self._MemberOf_MetaBlockReference._reflist("_MetaBlockStateReference").append(self)
 
     MemberOf_MetaBlockReference = property(getMemberOf_MetaBlockReference, setMemberOf_MetaBlockReference)
 
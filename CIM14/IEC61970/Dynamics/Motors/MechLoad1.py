@@ -52,4 +52,5 @@ class MechLoad1(MechanicalLoad):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import RefList
 
 class MechanicalLoad(PowerSystemResource):
     """A mechanical load represents the variation in a motor's shaft torque or power as a function of shaft speed.
@@ -29,8 +30,8 @@ class MechanicalLoad(PowerSystemResource):
 
         @param rotatingMachine0:
         """
-        self._rotatingMachine0 = []
-        self.rotatingMachine0 = [] if rotatingMachine0 is None else rotatingMachine0
+        if rotatingMachine0 is not None:
+            self.rotatingMachine0 = rotatingMachine0
 
         super(MechanicalLoad, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class MechanicalLoad(PowerSystemResource):
     _enums = {}
     _refs = ["rotatingMachine0"]
     _many_refs = ["rotatingMachine0"]
+    _inverses = {"rotatingMachine0": "mechanicalLoad0"}
 
     def getrotatingMachine0(self):
         
@@ -47,20 +49,19 @@ class MechanicalLoad(PowerSystemResource):
 
     def setrotatingMachine0(self, value):
         for p in self._rotatingMachine0:
-            filtered = [q for q in p.mechanicalLoad0 if q != self]
-            self._rotatingMachine0._mechanicalLoad0 = filtered
+            p._mechanicalLoad0.discard(self)
         for r in value:
             if self not in r._mechanicalLoad0:
-                r._mechanicalLoad0.append(self)
-        self._rotatingMachine0 = value
+                r._reflist("_mechanicalLoad0").append(self)
+        self._rotatingMachine0 = RefList(value)
 
     rotatingMachine0 = property(getrotatingMachine0, setrotatingMachine0)
 
     def addrotatingMachine0(self, *rotatingMachine0):
         for obj in rotatingMachine0:
             if self not in obj._mechanicalLoad0:
-                obj._mechanicalLoad0.append(self)
-            self._rotatingMachine0.append(obj)
+                obj._reflist("_mechanicalLoad0").append(self)
+            self._reflist("_rotatingMachine0").append(obj)
 
     def removerotatingMachine0(self, *rotatingMachine0):
         for obj in rotatingMachine0:
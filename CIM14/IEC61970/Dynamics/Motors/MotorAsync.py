@@ -36,4 +36,5 @@ class MotorAsync(AsynchronousMachine):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
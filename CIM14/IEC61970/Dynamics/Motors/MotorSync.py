@@ -40,4 +40,5 @@ class MotorSync(SynchronousMachine):
     _enums = {"synchronousMotorType": "SynchronousMotorType"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
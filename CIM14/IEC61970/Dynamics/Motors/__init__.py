@@ -19,10 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.IEC61970.Dynamics.Motors.MechanicalLoad import MechanicalLoad
-from CIM14.IEC61970.Dynamics.Motors.MotorSync import MotorSync
-from CIM14.IEC61970.Dynamics.Motors.MechLoad1 import MechLoad1
-from CIM14.IEC61970.Dynamics.Motors.MotorAsync import MotorAsync
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Motors"
 nsPrefix = "cimMotors"
@@ -33,3 +31,11 @@ class SynchronousMotorType(str):
     Values are: salientPole, roundRotor
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "MechanicalLoad",
+    "MotorSync",
+    "MechLoad1",
+    "MotorAsync",
+])
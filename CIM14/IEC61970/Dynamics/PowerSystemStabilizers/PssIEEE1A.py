@@ -36,4 +36,5 @@ class PssIEEE1A(PowerSystemStabilizer):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
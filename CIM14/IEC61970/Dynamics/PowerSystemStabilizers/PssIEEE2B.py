@@ -160,4 +160,5 @@ class PssIEEE2B(PowerSystemStabilizer):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class PssIEEE3B(PowerSystemStabilizer):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
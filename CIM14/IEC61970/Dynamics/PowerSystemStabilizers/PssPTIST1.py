@@ -36,4 +36,5 @@ class PssPTIST1(PowerSystemStabilizer):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class PssPTIST3(PowerSystemStabilizer):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
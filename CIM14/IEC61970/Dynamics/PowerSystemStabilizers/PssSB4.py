@@ -36,4 +36,5 @@ class PssSB4(PowerSystemStabilizer):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
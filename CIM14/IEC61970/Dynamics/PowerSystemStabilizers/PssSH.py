@@ -36,4 +36,5 @@ class PssSH(PowerSystemStabilizer):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
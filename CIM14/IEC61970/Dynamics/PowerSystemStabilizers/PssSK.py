@@ -36,4 +36,5 @@ class PssSK(PowerSystemStabilizer):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class PssWSCC(PowerSystemStabilizer):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
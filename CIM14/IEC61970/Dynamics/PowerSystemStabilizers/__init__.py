@@ -19,18 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.IEC61970.Dynamics.PowerSystemStabilizers.PowerSystemStabilizer import PowerSystemStabilizer
-from CIM14.IEC61970.Dynamics.PowerSystemStabilizers.PssIEEE3B import PssIEEE3B
-from CIM14.IEC61970.Dynamics.PowerSystemStabilizers.PssSK import PssSK
-from CIM14.IEC61970.Dynamics.PowerSystemStabilizers.PssIEEE4B import PssIEEE4B
-from CIM14.IEC61970.Dynamics.PowerSystemStabilizers.PssIEEE1A import PssIEEE1A
-from CIM14.IEC61970.Dynamics.PowerSystemStabilizers.PssPTIST1 import PssPTIST1
-from CIM14.IEC61970.Dynamics.PowerSystemStabilizers.PssIEEE2B import PssIEEE2B
-from CIM14.IEC61970.Dynamics.PowerSystemStabilizers.PssSB import PssSB
-from CIM14.IEC61970.Dynamics.PowerSystemStabilizers.PssSB4 import PssSB4
-from CIM14.IEC61970.Dynamics.PowerSystemStabilizers.PssSH import PssSH
-from CIM14.IEC61970.Dynamics.PowerSystemStabilizers.PssPTIST3 import PssPTIST3
-from CIM14.IEC61970.Dynamics.PowerSystemStabilizers.PssWSCC import PssWSCC
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#PowerSystemStabilizers"
 nsPrefix = "cimPowerSystemStabilizers"
@@ -40,3 +30,19 @@ class InputSignalCodeJ(str):
     """Values are: 2, 4, 3, 5, 1, 6
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "PowerSystemStabilizer",
+    "PssIEEE3B",
+    "PssSK",
+    "PssIEEE4B",
+    "PssIEEE1A",
+    "PssPTIST1",
+    "PssIEEE2B",
+    "PssSB",
+    "PssSB4",
+    "PssSH",
+    "PssPTIST3",
+    "PssWSCC",
+])
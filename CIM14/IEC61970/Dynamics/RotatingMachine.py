@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
+from CIM14.Element import RefList
 
 class RotatingMachine(RegulatingCondEq):
     """A rotating machine which may be used as a generator or motor.
@@ -61,8 +62,8 @@ class RotatingMachine(RegulatingCondEq):
         #: Stator leakage reactance (&gt; 0.)
         self.xls = xls
 
-        self._mechanicalLoad0 = []
-        self.mechanicalLoad0 = [] if mechanicalLoad0 is None else mechanicalLoad0
+        if mechanicalLoad0 is not None:
+            self.mechanicalLoad0 = mechanicalLoad0
 
         super(RotatingMachine, self).__init__(*args, **kw_args)
 
@@ -72,6 +73,7 @@ class RotatingMachine(RegulatingCondEq):
     _enums = {"parametersFormType": "ParametersFormType"}
     _refs = ["mechanicalLoad0"]
     _many_refs = ["mechanicalLoad0"]
+    _inverses = {"mechanicalLoad0": "rotatingMachine0"}
 
     def getmechanicalLoad0(self):
         
@@ -79,20 +81,19 @@ class RotatingMachine(RegulatingCondEq):
 
     def setmechanicalLoad0(self, value):
         for p in self._mechanicalLoad0:
-            filtered = [q for q in p.rotatingMachine0 if q != self]
-            self._mechanicalLoad0._rotatingMachine0 = filtered
+            p._rotatingMachine0.discard(self)
         for r in value:
             if self not in r._rotatingMachine0:
-                r._rotatingMachine0.append(self)
-        self._mechanicalLoad0 = value
+                r._reflist("_rotatingMachine0").append(self)
+        self._mechanicalLoad0 = RefList(value)
 
     mechanicalLoad0 = property(getmechanicalLoad0, setmechanicalLoad0)
 
     def addmechanicalLoad0(self, *mechanicalLoad0):
         for obj in mechanicalLoad0:
             if self not in obj._rotatingMachine0:
-                obj._rotatingMachine0.append(self)
-            self._mechanicalLoad0.append(obj)
+                obj._reflist("_rotatingMachine0").append(self)
+            self._reflist("_mechanicalLoad0").append(obj)
 
     def removemechanicalLoad0(self, *mechanicalLoad0):
         for obj in mechanicalLoad0:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class Slot(IdentifiedObject):
 
@@ -34,17 +35,17 @@ class Slot(IdentifiedObject):
         self._blockType0 = None
         self.blockType0 = blockType0
 
-        self._slotReference0 = []
-        self.slotReference0 = [] if slotReference0 is None else slotReference0
+        if slotReference0 is not None:
+            self.slotReference0 = slotReference0
 
-        self._slotOutput0 = []
-        self.slotOutput0 = [] if slotOutput0 is None else slotOutput0
+        if slotOutput0 is not None:
+            self.slotOutput0 = slotOutput0
 
         self._connectionFrame0 = None
         self.connectionFrame0 = connectionFrame0
 
-        self._slotInput0 = []
-        self.slotInput0 = [] if slotInput0 is None else slotInput0
+        if slotInput0 is not None:
+            self.slotInput0 = slotInput0
 
         super(Slot, self).__init__(*args, **kw_args)
 
@@ -54,6 +55,7 @@ class Slot(IdentifiedObject):
     _enums = {}
     _refs = ["blockType0", "slotReference0", "slotOutput0", "connectionFrame0", "slotInput0"]
     _many_refs = ["slotReference0", "slotOutput0", "slotInput0"]
+    _inverses = {"blockType0": "slot0", "slotReference0": "slot0", "slotOutput0": "slot0", "connectionFrame0": "slot0", "slotInput0": "slot0"}
 
     def getblockType0(self):
         
@@ -61,13 +63,12 @@ class Slot(IdentifiedObject):
 
     def setblockType0(self, value):
         if self._blockType0 is not None:
-            filtered = [x for x in self.blockType0.slot0 if x != self]
-            self._blockType0._slot0 = filtered
+            self._blockType0._slot0.discard(self)
 
         self._blockType0 = value
         if self._blockType0 is not None:
             if self not in self._blockType0._slot0:
-                self._blockType0._slot0.append(self)
+                self._blockType0._reflist("_slot0").append(self)
 
     blockType0 = property(getblockType0, setblockType0)
 
@@ -76,7 +77,8 @@ class Slot(IdentifiedObject):
         return self._slotReference0
 
     def setslotReference0(self, value):
-        for x in self._slotReference0:
+        value = RefList(value)
+        for x in list(self._slotReference0):
             x.slot0 = None
         for y in value:
             y._slot0 = self
@@ -97,7 +99,8 @@ class Slot(IdentifiedObject):
         return self._slotOutput0
 
     def setslotOutput0(self, value):
-        for x in self._slotOutput0:
+        value = RefList(value)
+        for x in list(self._slotOutput0):
             x.slot0 = None
         for y in value:
             y._slot0 = self
@@ -119,13 +122,12 @@ class Slot(IdentifiedObject):
 
     def setconnectionFrame0(self, value):
         if self._connectionFrame0 is not None:
-            filtered = [x for x in self.connectionFrame0.slot0 if x != self]
-            self._connectionFrame0._slot0 = filtered
+            self._connectionFrame0._slot0.discard(self)
 
         self._connectionFrame0 = value
         if self._connectionFrame0 is not None:
             if self not in self._connectionFrame0._slot0:
-                self._connectionFrame0._slot0.append(self)
+                self._connectionFrame0._reflist("_slot0").append(self)
 
     connectionFrame0 = property(getconnectionFrame0, setconnectionFrame0)
 
@@ -134,7 +136,8 @@ class Slot(IdentifiedObject):
         return self._slotInput0
 
     def setslotInput0(self, value):
-        for x in self._slotInput0:
+        value = RefList(value)
+        for x in list(self._slotInput0):
             x.slot0 = None
         for y in value:
             y._slot0 = self
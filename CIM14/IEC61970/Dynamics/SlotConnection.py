@@ -48,6 +48,7 @@ class SlotConnection(IdentifiedObject):
     _enums = {}
     _refs = ["connectionFrame0", "slotInput0", "slotOutput0"]
     _many_refs = []
+    _inverses = {"connectionFrame0": "slotConnection0", "slotInput0": "slotConnection0", "slotOutput0": "slotConnection0"}
 
     def getconnectionFrame0(self):
         
@@ -55,13 +56,12 @@ class SlotConnection(IdentifiedObject):
 
     def setconnectionFrame0(self, value):
         if self._connectionFrame0 is not None:
-            filtered = [x for x in self.connectionFrame0.slotConnection0 if x != self]
-            self._connectionFrame0._slotConnection0 = filtered
+            self._connectionFrame0._slotConnection0.discard(self)
 
         self._connectionFrame0 = value
         if self._connectionFrame0 is not None:
             if self not in self._connectionFrame0._slotConnection0:
-                self._connectionFrame0._slotConnection0.append(self)
+                self._connectionFrame0._reflist("_slotConnection0").append(self)
 
     connectionFrame0 = property(getconnectionFrame0, setconnectionFrame0)
 
@@ -86,13 +86,12 @@ class SlotConnection(IdentifiedObject):
 
     def setslotOutput0(self, value):
         if self._slotOutput0 is not None:
-            filtered = [x for x in self.slotOutput0.slotConnection0 if x != self]
-            self._slotOutput0._slotConnection0 = filtered
+            self._slotOutput0._slotConnection0.discard(self)
 
         self._slotOutput0 = value
         if self._slotOutput0 is not None:
             if self not in self._slotOutput0._slotConnection0:
-                self._slotOutput0._slotConnection0.append(self)
+                self._slotOutput0._reflist("_slotConnection0").append(self)
 
     slotOutput0 = property(getslotOutput0, setslotOutput0)
 
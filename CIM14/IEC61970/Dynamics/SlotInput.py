@@ -46,6 +46,7 @@ class SlotInput(IdentifiedObject):
     _enums = {}
     _refs = ["blockInputType0", "slotConnection0", "slot0"]
     _many_refs = []
+    _inverses = {"blockInputType0": "slotInput0", "slotConnection0": "slotInput0", "slot0": "slotInput0"}
 
     def getblockInputType0(self):
         
@@ -53,13 +54,12 @@ class SlotInput(IdentifiedObject):
 
     def setblockInputType0(self, value):
         if self._blockInputType0 is not None:
-            filtered = [x for x in self.blockInputType0.slotInput0 if x != self]
-            self._blockInputType0._slotInput0 = filtered
+            self._blockInputType0._slotInput0.discard(self)
 
         self._blockInputType0 = value
         if self._blockInputType0 is not None:
             if self not in self._blockInputType0._slotInput0:
-                self._blockInputType0._slotInput0.append(self)
+                self._blockInputType0._reflist("_slotInput0").append(self)
 
     blockInputType0 = property(getblockInputType0, setblockInputType0)
 
@@ -84,13 +84,12 @@ class SlotInput(IdentifiedObject):
 
     def setslot0(self, value):
         if self._slot0 is not None:
-            filtered = [x for x in self.slot0.slotInput0 if x != self]
-            self._slot0._slotInput0 = filtered
+            self._slot0._slotInput0.discard(self)
 
         self._slot0 = value
         if self._slot0 is not None:
             if self not in self._slot0._slotInput0:
-                self._slot0._slotInput0.append(self)
+                self._slot0._reflist("_slotInput0").append(self)
 
     slot0 = property(getslot0, setslot0)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class SlotOutput(IdentifiedObject):
 
@@ -32,8 +33,8 @@ class SlotOutput(IdentifiedObject):
         self._slot0 = None
         self.slot0 = slot0
 
-        self._slotConnection0 = []
-        self.slotConnection0 = [] if slotConnection0 is None else slotConnection0
+        if slotConnection0 is not None:
+            self.slotConnection0 = slotConnection0
 
         self._blockOutputType0 = None
         self.blockOutputType0 = blockOutputType0
@@ -46,6 +47,7 @@ class SlotOutput(IdentifiedObject):
     _enums = {}
     _refs = ["slot0", "slotConnection0", "blockOutputType0"]
     _many_refs = ["slotConnection0"]
+    _inverses = {"slot0": "slotOutput0", "slotConnection0": "slotOutput0", "blockOutputType0": "slotOutput0"}
 
     def getslot0(self):
         
@@ -53,13 +55,12 @@ class SlotOutput(IdentifiedObject):
 
     def setslot0(self, value):
         if self._slot0 is not None:
-            filtered = [x for x in self.slot0.slotOutput0 if x != self]
-            self._slot0._slotOutput0 = filtered
+            self._slot0._slotOutput0.discard(self)
 
         self._slot0 = value
         if self._slot0 is not None:
             if self not in self._slot0._slotOutput0:
-                self._slot0._slotOutput0.append(self)
+                self._slot0._reflist("_slotOutput0").append(self)
 
     slot0 = property(getslot0, setslot0)
 
@@ -68,7 +69,8 @@ class SlotOutput(IdentifiedObject):
         return self._slotConnection0
 
     def setslotConnection0(self, value):
-        for x in self._slotConnection0:
+        value = RefList(value)
+        for x in list(self._slotConnection0):
             x.slotOutput0 = None
         for y in value:
             y._slotOutput0 = self
@@ -90,13 +92,12 @@ class SlotOutput(IdentifiedObject):
 
     def setblockOutputType0(self, value):
         if self._blockOutputType0 is not None:
-            filtered = [x for x in self.blockOutputType0.slotOutput0 if x != self]
-            self._blockOutputType0._slotOutput0 = filtered
+            self._blockOutputType0._slotOutput0.discard(self)
 
         self._blockOutputType0 = value
         if self._blockOutputType0 is not None:
             if self not in self._blockOutputType0._slotOutput0:
-                self._blockOutputType0._slotOutput0.append(self)
+                self._blockOutputType0._reflist("_slotOutput0").append(self)
 
     blockOutputType0 = property(getblockOutputType0, setblockOutputType0)
 
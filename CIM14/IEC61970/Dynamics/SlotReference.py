@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class SlotReference(IdentifiedObject):
     """The specific role the block usage is playing in a connection frame. This allows connections to be established at the meta dynamics level and not at the instance level.
@@ -34,11 +35,11 @@ class SlotReference(IdentifiedObject):
         self._slot0 = None
         self.slot0 = slot0
 
-        self._block0 = []
-        self.block0 = [] if block0 is None else block0
+        if block0 is not None:
+            self.block0 = block0
 
-        self._compositeModel0 = []
-        self.compositeModel0 = [] if compositeModel0 is None else compositeModel0
+        if compositeModel0 is not None:
+            self.compositeModel0 = compositeModel0
 
         super(SlotReference, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class SlotReference(IdentifiedObject):
     _enums = {}
     _refs = ["slot0", "block0", "compositeModel0"]
     _many_refs = ["block0", "compositeModel0"]
+    _inverses = {"slot0": "slotReference0", "block0": "slotReference0", "compositeModel0": "slotReference0"}
 
     def getslot0(self):
         
@@ -55,13 +57,12 @@ class SlotReference(IdentifiedObject):
 
     def setslot0(self, value):
         if self._slot0 is not None:
-            filtered = [x for x in self.slot0.slotReference0 if x != self]
-            self._slot0._slotReference0 = filtered
+            self._slot0._slotReference0.discard(self)
 
         self._slot0 = value
         if self._slot0 is not None:
             if self not in self._slot0._slotReference0:
-                self._slot0._slotReference0.append(self)
+                self._slot0._reflist("_slotReference0").append(self)
 
     slot0 = property(getslot0, setslot0)
 
@@ -70,7 +71,8 @@ class SlotReference(IdentifiedObject):
         return self._block0
 
     def setblock0(self, value):
-        for x in self._block0:
+        value = RefList(value)
+        for x in list(self._block0):
             x.slotReference0 = None
         for y in value:
             y._slotReference0 = self
@@ -92,20 +94,19 @@ class SlotReference(IdentifiedObject):
 
     def setcompositeModel0(self, value):
         for p in self._compositeModel0:
-            filtered = [q for q in p.slotReference0 if q != self]
-            self._compositeModel0._slotReference0 = filtered
+            p._slotReference0.discard(self)
         for r in value:
             if self not in r._slotReference0:
-                r._slotReference0.append(self)
-        self._compositeModel0 = value
+                r._reflist("_slotReference0").append(self)
+        self._compositeModel0 = RefList(value)
 
     compositeModel0 = property(getcompositeModel0, setcompositeModel0)
 
     def addcompositeModel0(self, *compositeModel0):
         for obj in compositeModel0:
             if self not in obj._slotReference0:
-                obj._slotReference0.append(self)
-            self._compositeModel0.append(obj)
+                obj._reflist("_slotReference0").append(self)
+            self._reflist("_compositeModel0").append(obj)
 
     def removecompositeModel0(self, *compositeModel0):
         for obj in compositeModel0:
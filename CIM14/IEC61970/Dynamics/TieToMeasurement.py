@@ -48,6 +48,7 @@ class TieToMeasurement(IdentifiedObject):
     _enums = {}
     _refs = ["measurement0", "block0", "metaBlockInput0"]
     _many_refs = []
+    _inverses = {"measurement0": "tieToMeasurement0", "block0": "tieToMeasurement0", "metaBlockInput0": "tieToMeasurement0"}
 
     def getmeasurement0(self):
         
@@ -55,13 +56,12 @@ class TieToMeasurement(IdentifiedObject):
 
     def setmeasurement0(self, value):
         if self._measurement0 is not None:
-            filtered = [x for x in self.measurement0.tieToMeasurement0 if x != self]
-            self._measurement0._tieToMeasurement0 = filtered
+            self._measurement0._tieToMeasurement0.discard(self)
 
         self._measurement0 = value
         if self._measurement0 is not None:
             if self not in self._measurement0._tieToMeasurement0:
-                self._measurement0._tieToMeasurement0.append(self)
+                self._measurement0._reflist("_tieToMeasurement0").append(self)
 
     measurement0 = property(getmeasurement0, setmeasurement0)
 
@@ -71,13 +71,12 @@ class TieToMeasurement(IdentifiedObject):
 
     def setblock0(self, value):
         if self._block0 is not None:
-            filtered = [x for x in self.block0.tieToMeasurement0 if x != self]
-            self._block0._tieToMeasurement0 = filtered
+            self._block0._tieToMeasurement0.discard(self)
 
         self._block0 = value
         if self._block0 is not None:
             if self not in self._block0._tieToMeasurement0:
-                self._block0._tieToMeasurement0.append(self)
+                self._block0._reflist("_tieToMeasurement0").append(self)
 
     block0 = property(getblock0, setblock0)
 
@@ -88,13 +87,12 @@ class TieToMeasurement(IdentifiedObject):
 
     def setmetaBlockInput0(self, value):
         if self._metaBlockInput0 is not None:
-            filtered = [x for x in self.metaBlockInput0.tieToMeasurement0 if x != self]
-            self._metaBlockInput0._tieToMeasurement0 = filtered
+            self._metaBlockInput0._tieToMeasurement0.discard(self)
 
         self._metaBlockInput0 = value
         if self._metaBlockInput0 is not None:
             if self not in self._metaBlockInput0._tieToMeasurement0:
-                self._metaBlockInput0._tieToMeasurement0.append(self)
+                self._metaBlockInput0._reflist("_tieToMeasurement0").append(self)
 
     metaBlockInput0 = property(getmetaBlockInput0, setmetaBlockInput0)
 
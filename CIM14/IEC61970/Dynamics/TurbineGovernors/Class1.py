@@ -34,4 +34,5 @@ class Class1(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
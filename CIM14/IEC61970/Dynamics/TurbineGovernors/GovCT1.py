@@ -180,4 +180,5 @@ class GovCT1(TurbineGovernor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -34,4 +34,5 @@ class GovGAST(TurbineGovernor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
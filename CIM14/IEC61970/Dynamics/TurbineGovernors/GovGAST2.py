@@ -34,4 +34,5 @@ class GovGAST2(TurbineGovernor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.TurbineGovernors.TurbineGovernor import TurbineGovernor
+from CIM14.Element import RefList
 
 class GovHydro1(TurbineGovernor):
     """Hydro turbine-governor model.
@@ -85,8 +86,8 @@ class GovHydro1(TurbineGovernor):
         self._HydroTurbine = None
         self.HydroTurbine = HydroTurbine
 
-        self._synchronousMachine0 = []
-        self.synchronousMachine0 = [] if synchronousMachine0 is None else synchronousMachine0
+        if synchronousMachine0 is not None:
+            self.synchronousMachine0 = synchronousMachine0
 
         super(GovHydro1, self).__init__(*args, **kw_args)
 
@@ -96,6 +97,7 @@ class GovHydro1(TurbineGovernor):
     _enums = {}
     _refs = ["HydroTurbine", "synchronousMachine0"]
     _many_refs = ["synchronousMachine0"]
+    _inverses = {"HydroTurbine": "HydroTurbineGovernor", "synchronousMachine0": "govHydro10"}
 
     def getHydroTurbine(self):
         
@@ -118,20 +120,19 @@ class GovHydro1(TurbineGovernor):
 
     def setsynchronousMachine0(self, value):
         for p in self._synchronousMachine0:
-            filtered = [q for q in p.govHydro10 if q != self]
-            self._synchronousMachine0._govHydro10 = filtered
+            p._govHydro10.discard(self)
         for r in value:
             if self not in r._govHydro10:
-                r._govHydro10.append(self)
-        self._synchronousMachine0 = value
+                r._reflist("_govHydro10").append(self)
+        self._synchronousMachine0 = RefList(value)
 
     synchronousMachine0 = property(getsynchronousMachine0, setsynchronousMachine0)
 
     def addsynchronousMachine0(self, *synchronousMachine0):
         for obj in synchronousMachine0:
             if self not in obj._govHydro10:
-                obj._govHydro10.append(self)
-            self._synchronousMachine0.append(obj)
+                obj._reflist("_govHydro10").append(self)
+            self._reflist("_synchronousMachine0").append(obj)
 
     def removesynchronousMachine0(self, *synchronousMachine0):
         for obj in synchronousMachine0:
@@ -150,4 +150,5 @@ class GovHydro2(TurbineGovernor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -34,4 +34,5 @@ class GovHydroWEH(TurbineGovernor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -34,4 +34,5 @@ class GovHydroWPID(TurbineGovernor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
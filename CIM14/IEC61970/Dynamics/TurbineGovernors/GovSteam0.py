@@ -68,4 +68,5 @@ class GovSteam0(TurbineGovernor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -180,4 +180,5 @@ class GovSteam1(TurbineGovernor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
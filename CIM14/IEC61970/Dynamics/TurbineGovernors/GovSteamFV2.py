@@ -34,4 +34,5 @@ class GovSteamFV2(TurbineGovernor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
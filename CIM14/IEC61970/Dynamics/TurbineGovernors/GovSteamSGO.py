@@ -34,4 +34,5 @@ class GovSteamSGO(TurbineGovernor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -34,4 +34,5 @@ class GovWT2P(TurbineGovernor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -34,4 +34,5 @@ class GovWT3T(TurbineGovernor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -34,4 +34,5 @@ class GovWT4T(TurbineGovernor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,44 +19,49 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.IEC61970.Dynamics.TurbineGovernors.TurbineGovernor import TurbineGovernor
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovSteamFV2 import GovSteamFV2
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovWT3P import GovWT3P
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovSteamSGO import GovSteamSGO
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovGASM import GovGASM
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovHydroR import GovHydroR
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovWT4T import GovWT4T
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovGAST2 import GovGAST2
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovSteamCC import GovSteamCC
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovRAV import GovRAV
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovSteam1 import GovSteam1
-from CIM14.IEC61970.Dynamics.TurbineGovernors.TLCFB1 import TLCFB1
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovHydro4 import GovHydro4
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovCT2 import GovCT2
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovHydro1 import GovHydro1
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovGAST import GovGAST
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovWT3T import GovWT3T
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovHydroWPID import GovHydroWPID
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovWT1T import GovWT1T
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovWT2T import GovWT2T
-from CIM14.IEC61970.Dynamics.TurbineGovernors.Class1 import Class1
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovWT4P import GovWT4P
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovHydroPID import GovHydroPID
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovHydroWEH import GovHydroWEH
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovHydroDD import GovHydroDD
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovWT1P import GovWT1P
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovWT2P import GovWT2P
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovSteamEU import GovSteamEU
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovHydro3 import GovHydro3
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovSteam0 import GovSteam0
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovHydroPID2 import GovHydroPID2
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovHydro2 import GovHydro2
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovCT1 import GovCT1
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovHydro0 import GovHydro0
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovGASTWD import GovGASTWD
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovSteamFV3 import GovSteamFV3
-from CIM14.IEC61970.Dynamics.TurbineGovernors.GovDUM import GovDUM
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#TurbineGovernors"
 nsPrefix = "cimTurbineGovernors"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "TurbineGovernor",
+    "GovSteamFV2",
+    "GovWT3P",
+    "GovSteamSGO",
+    "GovGASM",
+    "GovHydroR",
+    "GovWT4T",
+    "GovGAST2",
+    "GovSteamCC",
+    "GovRAV",
+    "GovSteam1",
+    "TLCFB1",
+    "GovHydro4",
+    "GovCT2",
+    "GovHydro1",
+    "GovGAST",
+    "GovWT3T",
+    "GovHydroWPID",
+    "GovWT1T",
+    "GovWT2T",
+    "Class1",
+    "GovWT4P",
+    "GovHydroPID",
+    "GovHydroWEH",
+    "GovHydroDD",
+    "GovWT1P",
+    "GovWT2P",
+    "GovSteamEU",
+    "GovHydro3",
+    "GovSteam0",
+    "GovHydroPID2",
+    "GovHydro2",
+    "GovCT1",
+    "GovHydro0",
+    "GovGASTWD",
+    "GovSteamFV3",
+    "GovDUM",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.MetaBlockParameter import MetaBlockParameter
+from CIM14.Element import RefList
 
 class UserBlockParameter(MetaBlockParameter):
     """Concrete class intended to obtain a parameter value from a user of the block  in the parameter list at the instance level.
@@ -29,8 +30,8 @@ class UserBlockParameter(MetaBlockParameter):
 
         @param BlockUsageParameter:
         """
-        self._BlockUsageParameter = []
-        self.BlockUsageParameter = [] if BlockUsageParameter is None else BlockUsageParameter
+        if BlockUsageParameter is not None:
+            self.BlockUsageParameter = BlockUsageParameter
 
         super(UserBlockParameter, self).__init__(*args, **kw_args)
 
@@ -40,13 +41,15 @@ class UserBlockParameter(MetaBlockParameter):
     _enums = {}
     _refs = ["BlockUsageParameter"]
     _many_refs = ["BlockUsageParameter"]
+    _inverses = {"BlockUsageParameter": "UserBlockParameter"}
 
     def getBlockUsageParameter(self):
         
         return self._BlockUsageParameter
 
     def setBlockUsageParameter(self, value):
-        for x in self._BlockUsageParameter:
+        value = RefList(value)
+        for x in list(self._BlockUsageParameter):
             x.UserBlockParameter = None
         for y in value:
             y._UserBlockParameter = self
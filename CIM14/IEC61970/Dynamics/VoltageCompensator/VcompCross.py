@@ -44,4 +44,5 @@ class VcompCross(VoltageCompensator):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -44,4 +44,5 @@ class VcompIEEE(VoltageCompensator):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
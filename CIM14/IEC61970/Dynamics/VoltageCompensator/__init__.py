@@ -19,10 +19,15 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.IEC61970.Dynamics.VoltageCompensator.VoltageCompensator import VoltageCompensator
-from CIM14.IEC61970.Dynamics.VoltageCompensator.VcompCross import VcompCross
-from CIM14.IEC61970.Dynamics.VoltageCompensator.VcompIEEE import VcompIEEE
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#VoltageCompensator"
 nsPrefix = "cimVoltageCompensator"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "VoltageCompensator",
+    "VcompCross",
+    "VcompIEEE",
+])
@@ -56,4 +56,5 @@ class EquivalentInjection(EquivalentEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
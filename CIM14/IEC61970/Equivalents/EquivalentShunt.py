@@ -44,4 +44,5 @@ class EquivalentShunt(EquivalentEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
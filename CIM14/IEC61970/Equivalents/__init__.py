@@ -21,12 +21,17 @@
 """The equivalents package models equivalent networks.
 """
 
-from CIM14.IEC61970.Equivalents.EquivalentEquipment import EquivalentEquipment
-from CIM14.IEC61970.Equivalents.EquivalentShunt import EquivalentShunt
-from CIM14.IEC61970.Equivalents.EquivalentBranch import EquivalentBranch
-from CIM14.IEC61970.Equivalents.EquivalentInjection import EquivalentInjection
-from CIM14.IEC61970.Equivalents.EquivalentNetwork import EquivalentNetwork
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Equivalents"
 nsPrefix = "cimEquivalents"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "EquivalentEquipment",
+    "EquivalentShunt",
+    "EquivalentBranch",
+    "EquivalentInjection",
+    "EquivalentNetwork",
+])
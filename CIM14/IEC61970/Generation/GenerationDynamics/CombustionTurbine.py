@@ -80,6 +80,7 @@ class CombustionTurbine(PrimeMover):
     _enums = {}
     _refs = ["HeatRecoveryBoiler", "CTTempActivePowerCurve", "AirCompressor"]
     _many_refs = []
+    _inverses = {"HeatRecoveryBoiler": "CombustionTurbines", "CTTempActivePowerCurve": "CombustionTurbine", "AirCompressor": "CombustionTurbine"}
 
     def getHeatRecoveryBoiler(self):
         """A combustion turbine may have a heat recovery boiler for making steam
@@ -88,13 +89,12 @@ class CombustionTurbine(PrimeMover):
 
     def setHeatRecoveryBoiler(self, value):
         if self._HeatRecoveryBoiler is not None:
-            filtered = [x for x in self.HeatRecoveryBoiler.CombustionTurbines if x != self]
-            self._HeatRecoveryBoiler._CombustionTurbines = filtered
+            self._HeatRecoveryBoiler._CombustionTurbines.discard(self)
 
         self._HeatRecoveryBoiler = value
         if self._HeatRecoveryBoiler is not None:
             if self not in self._HeatRecoveryBoiler._CombustionTurbines:
-                self._HeatRecoveryBoiler._CombustionTurbines.append(self)
+                self._HeatRecoveryBoiler._reflist("_CombustionTurbines").append(self)
 
     HeatRecoveryBoiler = property(getHeatRecoveryBoiler, setHeatRecoveryBoiler)
 
@@ -84,6 +84,7 @@ class HydroTurbine(PrimeMover):
     _enums = {"turbineType": "TurbineType"}
     _refs = ["HydroTurbineGovernor"]
     _many_refs = []
+    _inverses = {"HydroTurbineGovernor": "HydroTurbine"}
 
     def getHydroTurbineGovernor(self):
         
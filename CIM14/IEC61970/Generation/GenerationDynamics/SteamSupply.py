@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import RefList
 
 class SteamSupply(PowerSystemResource):
     """Steam supply for steam turbine
@@ -33,8 +34,8 @@ class SteamSupply(PowerSystemResource):
         #: Rating of steam supply
         self.steamSupplyRating = steamSupplyRating
 
-        self._SteamTurbines = []
-        self.SteamTurbines = [] if SteamTurbines is None else SteamTurbines
+        if SteamTurbines is not None:
+            self.SteamTurbines = SteamTurbines
 
         super(SteamSupply, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class SteamSupply(PowerSystemResource):
     _enums = {}
     _refs = ["SteamTurbines"]
     _many_refs = ["SteamTurbines"]
+    _inverses = {"SteamTurbines": "SteamSupplys"}
 
     def getSteamTurbines(self):
         """Steam turbines may have steam supplied by a steam supply
@@ -52,20 +54,19 @@ class SteamSupply(PowerSystemResource):
 
     def setSteamTurbines(self, value):
         for p in self._SteamTurbines:
-            filtered = [q for q in p.SteamSupplys if q != self]
-            self._SteamTurbines._SteamSupplys = filtered
+            p._SteamSupplys.discard(self)
         for r in value:
             if self not in r._SteamSupplys:
-                r._SteamSupplys.append(self)
-        self._SteamTurbines = value
+                r._reflist("_SteamSupplys").append(self)
+        self._SteamTurbines = RefList(value)
 
     SteamTurbines = property(getSteamTurbines, setSteamTurbines)
 
     def addSteamTurbines(self, *SteamTurbines):
         for obj in SteamTurbines:
             if self not in obj._SteamSupplys:
-                obj._SteamSupplys.append(self)
-            self._SteamTurbines.append(obj)
+                obj._reflist("_SteamSupplys").append(self)
+            self._reflist("_SteamTurbines").append(obj)
 
     def removeSteamTurbines(self, *SteamTurbines):
         for obj in SteamTurbines:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Generation.GenerationDynamics.PrimeMover import PrimeMover
+from CIM14.Element import RefList
 
 class SteamTurbine(PrimeMover):
     """Steam turbine
@@ -77,8 +78,8 @@ class SteamTurbine(PrimeMover):
         #: Fraction Of Power From Shaft 2 First Low Pressure Turbine output
         self.shaft2PowerLP1 = shaft2PowerLP1
 
-        self._SteamSupplys = []
-        self.SteamSupplys = [] if SteamSupplys is None else SteamSupplys
+        if SteamSupplys is not None:
+            self.SteamSupplys = SteamSupplys
 
         super(SteamTurbine, self).__init__(*args, **kw_args)
 
@@ -88,6 +89,7 @@ class SteamTurbine(PrimeMover):
     _enums = {}
     _refs = ["SteamSupplys"]
     _many_refs = ["SteamSupplys"]
+    _inverses = {"SteamSupplys": "SteamTurbines"}
 
     def getSteamSupplys(self):
         """Steam turbines may have steam supplied by a steam supply
@@ -96,20 +98,19 @@ class SteamTurbine(PrimeMover):
 
     def setSteamSupplys(self, value):
         for p in self._SteamSupplys:
-            filtered = [q for q in p.SteamTurbines if q != self]
-            self._SteamSupplys._SteamTurbines = filtered
+            p._SteamTurbines.discard(self)
         for r in value:
             if self not in r._SteamTurbines:
-                r._SteamTurbines.append(self)
-        self._SteamSupplys = value
+                r._reflist("_SteamTurbines").append(self)
+        self._SteamSupplys = RefList(value)
 
     SteamSupplys = property(getSteamSupplys, setSteamSupplys)
 
     def addSteamSupplys(self, *SteamSupplys):
         for obj in SteamSupplys:
             if self not in obj._SteamTurbines:
-                obj._SteamTurbines.append(self)
-            self._SteamSupplys.append(obj)
+                obj._reflist("_SteamTurbines").append(self)
+            self._reflist("_SteamSupplys").append(obj)
 
     def removeSteamSupplys(self, *SteamSupplys):
         for obj in SteamSupplys:
@@ -36,4 +36,5 @@ class Supercritical(FossilSteamSupply):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -21,19 +21,8 @@
 """The Generation Dynamics package contains prime movers, such as turbines and boilers, which are needed for simulation and educational purposes.
 """
 
-from CIM14.IEC61970.Generation.GenerationDynamics.SteamSupply import SteamSupply
-from CIM14.IEC61970.Generation.GenerationDynamics.FossilSteamSupply import FossilSteamSupply
-from CIM14.IEC61970.Generation.GenerationDynamics.HeatRecoveryBoiler import HeatRecoveryBoiler
-from CIM14.IEC61970.Generation.GenerationDynamics.PWRSteamSupply import PWRSteamSupply
-from CIM14.IEC61970.Generation.GenerationDynamics.PrimeMover import PrimeMover
-from CIM14.IEC61970.Generation.GenerationDynamics.Supercritical import Supercritical
-from CIM14.IEC61970.Generation.GenerationDynamics.CombustionTurbine import CombustionTurbine
-from CIM14.IEC61970.Generation.GenerationDynamics.HydroTurbine import HydroTurbine
-from CIM14.IEC61970.Generation.GenerationDynamics.Subcritical import Subcritical
-from CIM14.IEC61970.Generation.GenerationDynamics.CTTempActivePowerCurve import CTTempActivePowerCurve
-from CIM14.IEC61970.Generation.GenerationDynamics.SteamTurbine import SteamTurbine
-from CIM14.IEC61970.Generation.GenerationDynamics.DrumBoiler import DrumBoiler
-from CIM14.IEC61970.Generation.GenerationDynamics.BWRSteamSupply import BWRSteamSupply
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#GenerationDynamics"
 nsPrefix = "cimGenerationDynamics"
@@ -50,3 +39,20 @@ class TurbineType(str):
     Values are: francis, pelton, kaplan
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "SteamSupply",
+    "FossilSteamSupply",
+    "HeatRecoveryBoiler",
+    "PWRSteamSupply",
+    "PrimeMover",
+    "Supercritical",
+    "CombustionTurbine",
+    "HydroTurbine",
+    "Subcritical",
+    "CTTempActivePowerCurve",
+    "SteamTurbine",
+    "DrumBoiler",
+    "BWRSteamSupply",
+])
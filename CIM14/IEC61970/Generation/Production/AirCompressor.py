@@ -48,6 +48,7 @@ class AirCompressor(PowerSystemResource):
     _enums = {}
     _refs = ["CAESPlant", "CombustionTurbine"]
     _many_refs = []
+    _inverses = {"CAESPlant": "AirCompressor", "CombustionTurbine": "AirCompressor"}
 
     def getCAESPlant(self):
         """An air compressor may be a member of a compressed air energy storage plant
@@ -52,6 +52,7 @@ class CAESPlant(PowerSystemResource):
     _enums = {}
     _refs = ["AirCompressor", "ThermalGeneratingUnit"]
     _many_refs = []
+    _inverses = {"AirCompressor": "CAESPlant", "ThermalGeneratingUnit": "CAESPlant"}
 
     def getAirCompressor(self):
         """An air compressor may be a member of a compressed air energy storage plant
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import RefList
 
 class CogenerationPlant(PowerSystemResource):
     """A set of thermal generating units for the production of electrical energy and process steam (usually from the output of the steam turbines). The steam sendout is typically used for industrial purposes or for municipal heating and cooling.
@@ -50,8 +51,8 @@ class CogenerationPlant(PowerSystemResource):
         #: The high pressure steam rating
         self.cogenHPSteamRating = cogenHPSteamRating
 
-        self._ThermalGeneratingUnits = []
-        self.ThermalGeneratingUnits = [] if ThermalGeneratingUnits is None else ThermalGeneratingUnits
+        if ThermalGeneratingUnits is not None:
+            self.ThermalGeneratingUnits = ThermalGeneratingUnits
 
         self._SteamSendoutSchedule = None
         self.SteamSendoutSchedule = SteamSendoutSchedule
@@ -64,6 +65,7 @@ class CogenerationPlant(PowerSystemResource):
     _enums = {}
     _refs = ["ThermalGeneratingUnits", "SteamSendoutSchedule"]
     _many_refs = ["ThermalGeneratingUnits"]
+    _inverses = {"ThermalGeneratingUnits": "CogenerationPlant", "SteamSendoutSchedule": "CogenerationPlant"}
 
     def getThermalGeneratingUnits(self):
         """A thermal generating unit may be a member of a cogeneration plant
@@ -71,7 +73,8 @@ class CogenerationPlant(PowerSystemResource):
         return self._ThermalGeneratingUnits
 
     def setThermalGeneratingUnits(self, value):
-        for x in self._ThermalGeneratingUnits:
+        value = RefList(value)
+        for x in list(self._ThermalGeneratingUnits):
             x.CogenerationPlant = None
         for y in value:
             y._CogenerationPlant = self
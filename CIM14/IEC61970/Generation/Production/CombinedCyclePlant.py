@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import RefList
 
 class CombinedCyclePlant(PowerSystemResource):
     """A set of combustion turbines and steam turbines where the exhaust heat from the combustion turbines is recovered to make steam for the steam turbines, resulting in greater overall plant efficiency
@@ -33,8 +34,8 @@ class CombinedCyclePlant(PowerSystemResource):
         #: The combined cycle plant's active power output rating
         self.combCyclePlantRating = combCyclePlantRating
 
-        self._ThermalGeneratingUnits = []
-        self.ThermalGeneratingUnits = [] if ThermalGeneratingUnits is None else ThermalGeneratingUnits
+        if ThermalGeneratingUnits is not None:
+            self.ThermalGeneratingUnits = ThermalGeneratingUnits
 
         super(CombinedCyclePlant, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class CombinedCyclePlant(PowerSystemResource):
     _enums = {}
     _refs = ["ThermalGeneratingUnits"]
     _many_refs = ["ThermalGeneratingUnits"]
+    _inverses = {"ThermalGeneratingUnits": "CombinedCyclePlant"}
 
     def getThermalGeneratingUnits(self):
         """A thermal generating unit may be a member of a combined cycle plant
@@ -51,7 +53,8 @@ class CombinedCyclePlant(PowerSystemResource):
         return self._ThermalGeneratingUnits
 
     def setThermalGeneratingUnits(self, value):
-        for x in self._ThermalGeneratingUnits:
+        value = RefList(value)
+        for x in list(self._ThermalGeneratingUnits):
             x.CombinedCyclePlant = None
         for y in value:
             y._CombinedCyclePlant = self
@@ -48,6 +48,7 @@ class EmissionAccount(Curve):
     _enums = {"emissionType": "EmissionType", "emissionValueSource": "EmissionValueSource"}
     _refs = ["ThermalGeneratingUnit"]
     _many_refs = []
+    _inverses = {"ThermalGeneratingUnit": "EmmissionAccounts"}
 
     def getThermalGeneratingUnit(self):
         """A thermal generating unit may have one or more emission allowance accounts
@@ -56,13 +57,12 @@ class EmissionAccount(Curve):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.EmmissionAccounts if x != self]
-            self._ThermalGeneratingUnit._EmmissionAccounts = filtered
+            self._ThermalGeneratingUnit._EmmissionAccounts.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
             if self not in self._ThermalGeneratingUnit._EmmissionAccounts:
-                self._ThermalGeneratingUnit._EmmissionAccounts.append(self)
+                self._ThermalGeneratingUnit._reflist("_EmmissionAccounts").append(self)
 
     ThermalGeneratingUnit = property(getThermalGeneratingUnit, setThermalGeneratingUnit)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class FossilFuel(IdentifiedObject):
     """The fossil fuel consumed by the non-nuclear thermal generating units, e.g., coal, oil, gas
@@ -70,8 +71,8 @@ class FossilFuel(IdentifiedObject):
         #: The active power output level of the unit at which the given type of fuel is switched on. This fuel (e.g., oil) is sometimes used to supplement the base fuel (e.g., coal) at high active power output levels.
         self.highBreakpointP = highBreakpointP
 
-        self._FuelAllocationSchedules = []
-        self.FuelAllocationSchedules = [] if FuelAllocationSchedules is None else FuelAllocationSchedules
+        if FuelAllocationSchedules is not None:
+            self.FuelAllocationSchedules = FuelAllocationSchedules
 
         self._ThermalGeneratingUnit = None
         self.ThermalGeneratingUnit = ThermalGeneratingUnit
@@ -84,6 +85,7 @@ class FossilFuel(IdentifiedObject):
     _enums = {"fossilFuelType": "FuelType"}
     _refs = ["FuelAllocationSchedules", "ThermalGeneratingUnit"]
     _many_refs = ["FuelAllocationSchedules"]
+    _inverses = {"FuelAllocationSchedules": "FossilFuel", "ThermalGeneratingUnit": "FossilFuels"}
 
     def getFuelAllocationSchedules(self):
         """A fuel allocation schedule must have a fossil fuel
@@ -91,7 +93,8 @@ class FossilFuel(IdentifiedObject):
         return self._FuelAllocationSchedules
 
     def setFuelAllocationSchedules(self, value):
-        for x in self._FuelAllocationSchedules:
+        value = RefList(value)
+        for x in list(self._FuelAllocationSchedules):
             x.FossilFuel = None
         for y in value:
             y._FossilFuel = self
@@ -114,13 +117,12 @@ class FossilFuel(IdentifiedObject):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.FossilFuels if x != self]
-            self._ThermalGeneratingUnit._FossilFuels = filtered
+            self._ThermalGeneratingUnit._FossilFuels.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
             if self not in self._ThermalGeneratingUnit._FossilFuels:
-                self._ThermalGeneratingUnit._FossilFuels.append(self)
+                self._ThermalGeneratingUnit._reflist("_FossilFuels").append(self)
 
     ThermalGeneratingUnit = property(getThermalGeneratingUnit, setThermalGeneratingUnit)
 
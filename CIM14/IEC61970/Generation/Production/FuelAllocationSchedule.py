@@ -64,6 +64,7 @@ class FuelAllocationSchedule(Curve):
     _enums = {"fuelType": "FuelType"}
     _refs = ["FossilFuel", "ThermalGeneratingUnit"]
     _many_refs = []
+    _inverses = {"FossilFuel": "FuelAllocationSchedules", "ThermalGeneratingUnit": "FuelAllocationSchedules"}
 
     def getFossilFuel(self):
         """A fuel allocation schedule must have a fossil fuel
@@ -72,13 +73,12 @@ class FuelAllocationSchedule(Curve):
 
     def setFossilFuel(self, value):
         if self._FossilFuel is not None:
-            filtered = [x for x in self.FossilFuel.FuelAllocationSchedules if x != self]
-            self._FossilFuel._FuelAllocationSchedules = filtered
+            self._FossilFuel._FuelAllocationSchedules.discard(self)
 
         self._FossilFuel = value
         if self._FossilFuel is not None:
             if self not in self._FossilFuel._FuelAllocationSchedules:
-                self._FossilFuel._FuelAllocationSchedules.append(self)
+                self._FossilFuel._reflist("_FuelAllocationSchedules").append(self)
 
     FossilFuel = property(getFossilFuel, setFossilFuel)
 
@@ -89,13 +89,12 @@ class FuelAllocationSchedule(Curve):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.FuelAllocationSchedules if x != self]
-            self._ThermalGeneratingUnit._FuelAllocationSchedules = filtered
+            self._ThermalGeneratingUnit._FuelAllocationSchedules.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
             if self not in self._ThermalGeneratingUnit._FuelAllocationSchedules:
-                self._ThermalGeneratingUnit._FuelAllocationSchedules.append(self)
+                self._ThermalGeneratingUnit._reflist("_FuelAllocationSchedules").append(self)
 
     ThermalGeneratingUnit = property(getThermalGeneratingUnit, setThermalGeneratingUnit)
 
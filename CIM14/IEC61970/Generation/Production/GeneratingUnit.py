@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from CIM14.Element import RefList
 
 class GeneratingUnit(Equipment):
     """A single or set of synchronous machines for converting mechanical power into alternating-current power. For example, individual machines within a set may be defined for scheduling purposes while a single control signal is derived for the set. In this case there would be a GeneratingUnit for each member of the set and an additional GeneratingUnit corresponding to the set.
@@ -205,20 +206,20 @@ class GeneratingUnit(Equipment):
         #: Pulse high limit which is the largest control pulse that the unit can respond to
         self.controlPulseHigh = controlPulseHigh
 
-        self._SynchronousMachines = []
-        self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
+        if SynchronousMachines is not None:
+            self.SynchronousMachines = SynchronousMachines
 
-        self._GrossToNetActivePowerCurves = []
-        self.GrossToNetActivePowerCurves = [] if GrossToNetActivePowerCurves is None else GrossToNetActivePowerCurves
+        if GrossToNetActivePowerCurves is not None:
+            self.GrossToNetActivePowerCurves = GrossToNetActivePowerCurves
 
-        self._GenUnitOpCostCurves = []
-        self.GenUnitOpCostCurves = [] if GenUnitOpCostCurves is None else GenUnitOpCostCurves
+        if GenUnitOpCostCurves is not None:
+            self.GenUnitOpCostCurves = GenUnitOpCostCurves
 
         self._GenUnitOpSchedule = None
         self.GenUnitOpSchedule = GenUnitOpSchedule
 
-        self._ControlAreaGeneratingUnit = []
-        self.ControlAreaGeneratingUnit = [] if ControlAreaGeneratingUnit is None else ControlAreaGeneratingUnit
+        if ControlAreaGeneratingUnit is not None:
+            self.ControlAreaGeneratingUnit = ControlAreaGeneratingUnit
 
         super(GeneratingUnit, self).__init__(*args, **kw_args)
 
@@ -228,6 +229,7 @@ class GeneratingUnit(Equipment):
     _enums = {"genControlMode": "GeneratorControlMode", "genOperatingMode": "GeneratorOperatingMode", "genControlSource": "GeneratorControlSource"}
     _refs = ["SynchronousMachines", "GrossToNetActivePowerCurves", "GenUnitOpCostCurves", "GenUnitOpSchedule", "ControlAreaGeneratingUnit"]
     _many_refs = ["SynchronousMachines", "GrossToNetActivePowerCurves", "GenUnitOpCostCurves", "ControlAreaGeneratingUnit"]
+    _inverses = {"SynchronousMachines": "GeneratingUnit", "GrossToNetActivePowerCurves": "GeneratingUnit", "GenUnitOpCostCurves": "GeneratingUnit", "GenUnitOpSchedule": "GeneratingUnit", "ControlAreaGeneratingUnit": "GeneratingUnit"}
 
     def getSynchronousMachines(self):
         """A synchronous machine may operate as a generator and as such becomes a member of a generating unit
@@ -235,7 +237,8 @@ class GeneratingUnit(Equipment):
         return self._SynchronousMachines
 
     def setSynchronousMachines(self, value):
-        for x in self._SynchronousMachines:
+        value = RefList(value)
+        for x in list(self._SynchronousMachines):
             x.GeneratingUnit = None
         for y in value:
             y._GeneratingUnit = self
@@ -257,7 +260,8 @@ class GeneratingUnit(Equipment):
         return self._GrossToNetActivePowerCurves
 
     def setGrossToNetActivePowerCurves(self, value):
-        for x in self._GrossToNetActivePowerCurves:
+        value = RefList(value)
+        for x in list(self._GrossToNetActivePowerCurves):
             x.GeneratingUnit = None
         for y in value:
             y._GeneratingUnit = self
@@ -279,7 +283,8 @@ class GeneratingUnit(Equipment):
         return self._GenUnitOpCostCurves
 
     def setGenUnitOpCostCurves(self, value):
-        for x in self._GenUnitOpCostCurves:
+        value = RefList(value)
+        for x in list(self._GenUnitOpCostCurves):
             x.GeneratingUnit = None
         for y in value:
             y._GeneratingUnit = self
@@ -317,7 +322,8 @@ class GeneratingUnit(Equipment):
         return self._ControlAreaGeneratingUnit
 
     def setControlAreaGeneratingUnit(self, value):
-        for x in self._ControlAreaGeneratingUnit:
+        value = RefList(value)
+        for x in list(self._ControlAreaGeneratingUnit):
             x.GeneratingUnit = None
         for y in value:
             y._GeneratingUnit = self
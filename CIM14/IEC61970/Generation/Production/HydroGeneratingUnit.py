@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Generation.Production.GeneratingUnit import GeneratingUnit
+from CIM14.Element import RefList
 
 class HydroGeneratingUnit(GeneratingUnit):
     """A generating unit whose prime mover is a hydraulic turbine (e.g., Francis, Pelton, Kaplan)
@@ -46,11 +47,11 @@ class HydroGeneratingUnit(GeneratingUnit):
         self._PenstockLossCurve = None
         self.PenstockLossCurve = PenstockLossCurve
 
-        self._HydroGeneratingEfficiencyCurves = []
-        self.HydroGeneratingEfficiencyCurves = [] if HydroGeneratingEfficiencyCurves is None else HydroGeneratingEfficiencyCurves
+        if HydroGeneratingEfficiencyCurves is not None:
+            self.HydroGeneratingEfficiencyCurves = HydroGeneratingEfficiencyCurves
 
-        self._TailbayLossCurve = []
-        self.TailbayLossCurve = [] if TailbayLossCurve is None else TailbayLossCurve
+        if TailbayLossCurve is not None:
+            self.TailbayLossCurve = TailbayLossCurve
 
         super(HydroGeneratingUnit, self).__init__(*args, **kw_args)
 
@@ -60,6 +61,7 @@ class HydroGeneratingUnit(GeneratingUnit):
     _enums = {"energyConversionCapability": "HydroEnergyConversionKind"}
     _refs = ["HydroPowerPlant", "PenstockLossCurve", "HydroGeneratingEfficiencyCurves", "TailbayLossCurve"]
     _many_refs = ["HydroGeneratingEfficiencyCurves", "TailbayLossCurve"]
+    _inverses = {"HydroPowerPlant": "HydroGeneratingUnits", "PenstockLossCurve": "HydroGeneratingUnit", "HydroGeneratingEfficiencyCurves": "HydroGeneratingUnit", "TailbayLossCurve": "HydroGeneratingUnit"}
 
     def getHydroPowerPlant(self):
         """The hydro generating unit belongs to a hydro power plant
@@ -68,13 +70,12 @@ class HydroGeneratingUnit(GeneratingUnit):
 
     def setHydroPowerPlant(self, value):
         if self._HydroPowerPlant is not None:
-            filtered = [x for x in self.HydroPowerPlant.HydroGeneratingUnits if x != self]
-            self._HydroPowerPlant._HydroGeneratingUnits = filtered
+            self._HydroPowerPlant._HydroGeneratingUnits.discard(self)
 
         self._HydroPowerPlant = value
         if self._HydroPowerPlant is not None:
             if self not in self._HydroPowerPlant._HydroGeneratingUnits:
-                self._HydroPowerPlant._HydroGeneratingUnits.append(self)
+                self._HydroPowerPlant._reflist("_HydroGeneratingUnits").append(self)
 
     HydroPowerPlant = property(getHydroPowerPlant, setHydroPowerPlant)
 
@@ -100,7 +101,8 @@ class HydroGeneratingUnit(GeneratingUnit):
         return self._HydroGeneratingEfficiencyCurves
 
     def setHydroGeneratingEfficiencyCurves(self, value):
-        for x in self._HydroGeneratingEfficiencyCurves:
+        value = RefList(value)
+        for x in list(self._HydroGeneratingEfficiencyCurves):
             x.HydroGeneratingUnit = None
         for y in value:
             y._HydroGeneratingUnit = self
@@ -122,7 +124,8 @@ class HydroGeneratingUnit(GeneratingUnit):
         return self._TailbayLossCurve
 
     def setTailbayLossCurve(self, value):
-        for x in self._TailbayLossCurve:
+        value = RefList(value)
+        for x in list(self._TailbayLossCurve):
             x.HydroGeneratingUnit = None
         for y in value:
             y._HydroGeneratingUnit = self
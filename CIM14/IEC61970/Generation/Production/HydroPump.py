@@ -64,6 +64,7 @@ class HydroPump(PowerSystemResource):
     _enums = {}
     _refs = ["SynchronousMachine", "HydroPumpOpSchedule", "HydroPowerPlant"]
     _many_refs = []
+    _inverses = {"SynchronousMachine": "HydroPump", "HydroPumpOpSchedule": "HydroPump", "HydroPowerPlant": "HydroPumps"}
 
     def getSynchronousMachine(self):
         """The synchronous machine drives the turbine which moves the water from a low elevation to a higher elevation. The direction of machine rotation for pumping may or may not be the same as for generating.
@@ -104,13 +105,12 @@ class HydroPump(PowerSystemResource):
 
     def setHydroPowerPlant(self, value):
         if self._HydroPowerPlant is not None:
-            filtered = [x for x in self.HydroPowerPlant.HydroPumps if x != self]
-            self._HydroPowerPlant._HydroPumps = filtered
+            self._HydroPowerPlant._HydroPumps.discard(self)
 
         self._HydroPowerPlant = value
         if self._HydroPowerPlant is not None:
             if self not in self._HydroPowerPlant._HydroPumps:
-                self._HydroPowerPlant._HydroPumps.append(self)
+                self._HydroPowerPlant._reflist("_HydroPumps").append(self)
 
     HydroPowerPlant = property(getHydroPowerPlant, setHydroPowerPlant)
 
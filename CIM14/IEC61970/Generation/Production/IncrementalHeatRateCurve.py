@@ -44,6 +44,7 @@ class IncrementalHeatRateCurve(Curve):
     _enums = {}
     _refs = ["ThermalGeneratingUnit"]
     _many_refs = []
+    _inverses = {"ThermalGeneratingUnit": "IncrementalHeatRateCurve"}
 
     def getThermalGeneratingUnit(self):
         """A thermal generating unit may have an incremental heat rate curve
@@ -40,6 +40,7 @@ class PenstockLossCurve(Curve):
     _enums = {}
     _refs = ["HydroGeneratingUnit"]
     _many_refs = []
+    _inverses = {"HydroGeneratingUnit": "PenstockLossCurve"}
 
     def getHydroGeneratingUnit(self):
         """A hydro generating unit has a penstock loss curve
@@ -48,6 +48,7 @@ class ShutdownCurve(Curve):
     _enums = {}
     _refs = ["ThermalGeneratingUnit"]
     _many_refs = []
+    _inverses = {"ThermalGeneratingUnit": "ShutdownCurve"}
 
     def getThermalGeneratingUnit(self):
         """A thermal generating unit may have a shutdown curve
@@ -44,6 +44,7 @@ class StartIgnFuelCurve(Curve):
     _enums = {"ignitionFuelType": "FuelType"}
     _refs = ["StartupModel"]
     _many_refs = []
+    _inverses = {"StartupModel": "StartIgnFuelCurve"}
 
     def getStartupModel(self):
         """The unit's startup model may have a startup ignition fuel curve
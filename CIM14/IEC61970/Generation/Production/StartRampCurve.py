@@ -44,6 +44,7 @@ class StartRampCurve(Curve):
     _enums = {}
     _refs = ["StartupModel"]
     _many_refs = []
+    _inverses = {"StartupModel": "StartRampCurve"}
 
     def getStartupModel(self):
         """The unit's startup model may have a startup ramp curve
@@ -92,6 +92,7 @@ class StartupModel(IdentifiedObject):
     _enums = {}
     _refs = ["ThermalGeneratingUnit", "StartRampCurve", "StartMainFuelCurve", "StartIgnFuelCurve"]
     _many_refs = []
+    _inverses = {"ThermalGeneratingUnit": "StartupModel", "StartRampCurve": "StartupModel", "StartMainFuelCurve": "StartupModel", "StartIgnFuelCurve": "StartupModel"}
 
     def getThermalGeneratingUnit(self):
         """A thermal generating unit may have a startup model
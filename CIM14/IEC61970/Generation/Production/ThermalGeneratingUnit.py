@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Generation.Production.GeneratingUnit import GeneratingUnit
+from CIM14.Element import RefList
 
 class ThermalGeneratingUnit(GeneratingUnit):
     """A generating unit whose prime mover could be a steam turbine, combustion turbine, or diesel engine.
@@ -47,8 +48,8 @@ class ThermalGeneratingUnit(GeneratingUnit):
         self._StartupModel = None
         self.StartupModel = StartupModel
 
-        self._EmmissionAccounts = []
-        self.EmmissionAccounts = [] if EmmissionAccounts is None else EmmissionAccounts
+        if EmmissionAccounts is not None:
+            self.EmmissionAccounts = EmmissionAccounts
 
         self._CombinedCyclePlant = None
         self.CombinedCyclePlant = CombinedCyclePlant
@@ -56,8 +57,8 @@ class ThermalGeneratingUnit(GeneratingUnit):
         self._CogenerationPlant = None
         self.CogenerationPlant = CogenerationPlant
 
-        self._EmissionCurves = []
-        self.EmissionCurves = [] if EmissionCurves is None else EmissionCurves
+        if EmissionCurves is not None:
+            self.EmissionCurves = EmissionCurves
 
         self._HeatRateCurve = None
         self.HeatRateCurve = HeatRateCurve
@@ -68,11 +69,11 @@ class ThermalGeneratingUnit(GeneratingUnit):
         self._IncrementalHeatRateCurve = None
         self.IncrementalHeatRateCurve = IncrementalHeatRateCurve
 
-        self._FuelAllocationSchedules = []
-        self.FuelAllocationSchedules = [] if FuelAllocationSchedules is None else FuelAllocationSchedules
+        if FuelAllocationSchedules is not None:
+            self.FuelAllocationSchedules = FuelAllocationSchedules
 
-        self._FossilFuels = []
-        self.FossilFuels = [] if FossilFuels is None else FossilFuels
+        if FossilFuels is not None:
+            self.FossilFuels = FossilFuels
 
         self._HeatInputCurve = None
         self.HeatInputCurve = HeatInputCurve
@@ -88,6 +89,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
     _enums = {}
     _refs = ["StartupModel", "EmmissionAccounts", "CombinedCyclePlant", "CogenerationPlant", "EmissionCurves", "HeatRateCurve", "ShutdownCurve", "IncrementalHeatRateCurve", "FuelAllocationSchedules", "FossilFuels", "HeatInputCurve", "CAESPlant"]
     _many_refs = ["EmmissionAccounts", "EmissionCurves", "FuelAllocationSchedules", "FossilFuels"]
+    _inverses = {"StartupModel": "ThermalGeneratingUnit", "EmmissionAccounts": "ThermalGeneratingUnit", "CombinedCyclePlant": "ThermalGeneratingUnits", "CogenerationPlant": "ThermalGeneratingUnits", "EmissionCurves": "ThermalGeneratingUnit", "HeatRateCurve": "ThermalGeneratingUnit", "ShutdownCurve": "ThermalGeneratingUnit", "IncrementalHeatRateCurve": "ThermalGeneratingUnit", "FuelAllocationSchedules": "ThermalGeneratingUnit", "FossilFuels": "ThermalGeneratingUnit", "HeatInputCurve": "ThermalGeneratingUnit", "CAESPlant": "ThermalGeneratingUnit"}
 
     def getStartupModel(self):
         """A thermal generating unit may have a startup model
@@ -111,7 +113,8 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._EmmissionAccounts
 
     def setEmmissionAccounts(self, value):
-        for x in self._EmmissionAccounts:
+        value = RefList(value)
+        for x in list(self._EmmissionAccounts):
             x.ThermalGeneratingUnit = None
         for y in value:
             y._ThermalGeneratingUnit = self
@@ -134,13 +137,12 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setCombinedCyclePlant(self, value):
         if self._CombinedCyclePlant is not None:
-            filtered = [x for x in self.CombinedCyclePlant.ThermalGeneratingUnits if x != self]
-            self._CombinedCyclePlant._ThermalGeneratingUnits = filtered
+            self._CombinedCyclePlant._ThermalGeneratingUnits.discard(self)
 
         self._CombinedCyclePlant = value
         if self._CombinedCyclePlant is not None:
             if self not in self._CombinedCyclePlant._ThermalGeneratingUnits:
-                self._CombinedCyclePlant._ThermalGeneratingUnits.append(self)
+                self._CombinedCyclePlant._reflist("_ThermalGeneratingUnits").append(self)
 
     CombinedCyclePlant = property(getCombinedCyclePlant, setCombinedCyclePlant)
 
@@ -151,13 +153,12 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setCogenerationPlant(self, value):
         if self._CogenerationPlant is not None:
-            filtered = [x for x in self.CogenerationPlant.ThermalGeneratingUnits if x != self]
-            self._CogenerationPlant._ThermalGeneratingUnits = filtered
+            self._CogenerationPlant._ThermalGeneratingUnits.discard(self)
 
         self._CogenerationPlant = value
         if self._CogenerationPlant is not None:
             if self not in self._CogenerationPlant._ThermalGeneratingUnits:
-                self._CogenerationPlant._ThermalGeneratingUnits.append(self)
+                self._CogenerationPlant._reflist("_ThermalGeneratingUnits").append(self)
 
     CogenerationPlant = property(getCogenerationPlant, setCogenerationPlant)
 
@@ -167,7 +168,8 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._EmissionCurves
 
     def setEmissionCurves(self, value):
-        for x in self._EmissionCurves:
+        value = RefList(value)
+        for x in list(self._EmissionCurves):
             x.ThermalGeneratingUnit = None
         for y in value:
             y._ThermalGeneratingUnit = self
@@ -237,7 +239,8 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._FuelAllocationSchedules
 
     def setFuelAllocationSchedules(self, value):
-        for x in self._FuelAllocationSchedules:
+        value = RefList(value)
+        for x in list(self._FuelAllocationSchedules):
             x.ThermalGeneratingUnit = None
         for y in value:
             y._ThermalGeneratingUnit = self
@@ -259,7 +262,8 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._FossilFuels
 
     def setFossilFuels(self, value):
-        for x in self._FossilFuels:
+        value = RefList(value)
+        for x in list(self._FossilFuels):
             x.ThermalGeneratingUnit = None
         for y in value:
             y._ThermalGeneratingUnit = self
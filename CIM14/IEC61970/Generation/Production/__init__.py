@@ -21,41 +21,8 @@
 """The production package is responsible for classes which describe various kinds of generators. These classes also provide production costing information which is used to economically allocate demand among committed units and calculate reserve quantities.
 """
 
-from CIM14.IEC61970.Generation.Production.LevelVsVolumeCurve import LevelVsVolumeCurve
-from CIM14.IEC61970.Generation.Production.FossilFuel import FossilFuel
-from CIM14.IEC61970.Generation.Production.SteamSendoutSchedule import SteamSendoutSchedule
-from CIM14.IEC61970.Generation.Production.EmissionCurve import EmissionCurve
-from CIM14.IEC61970.Generation.Production.CombinedCyclePlant import CombinedCyclePlant
-from CIM14.IEC61970.Generation.Production.StartIgnFuelCurve import StartIgnFuelCurve
-from CIM14.IEC61970.Generation.Production.HydroGeneratingEfficiencyCurve import HydroGeneratingEfficiencyCurve
-from CIM14.IEC61970.Generation.Production.StartRampCurve import StartRampCurve
-from CIM14.IEC61970.Generation.Production.GeneratingUnit import GeneratingUnit
-from CIM14.IEC61970.Generation.Production.NuclearGeneratingUnit import NuclearGeneratingUnit
-from CIM14.IEC61970.Generation.Production.WindGeneratingUnit import WindGeneratingUnit
-from CIM14.IEC61970.Generation.Production.StartMainFuelCurve import StartMainFuelCurve
-from CIM14.IEC61970.Generation.Production.StartupModel import StartupModel
-from CIM14.IEC61970.Generation.Production.AirCompressor import AirCompressor
-from CIM14.IEC61970.Generation.Production.HeatInputCurve import HeatInputCurve
-from CIM14.IEC61970.Generation.Production.CogenerationPlant import CogenerationPlant
-from CIM14.IEC61970.Generation.Production.ShutdownCurve import ShutdownCurve
-from CIM14.IEC61970.Generation.Production.InflowForecast import InflowForecast
-from CIM14.IEC61970.Generation.Production.HydroGeneratingUnit import HydroGeneratingUnit
-from CIM14.IEC61970.Generation.Production.TargetLevelSchedule import TargetLevelSchedule
-from CIM14.IEC61970.Generation.Production.EmissionAccount import EmissionAccount
-from CIM14.IEC61970.Generation.Production.GrossToNetActivePowerCurve import GrossToNetActivePowerCurve
-from CIM14.IEC61970.Generation.Production.HydroPumpOpSchedule import HydroPumpOpSchedule
-from CIM14.IEC61970.Generation.Production.Reservoir import Reservoir
-from CIM14.IEC61970.Generation.Production.CAESPlant import CAESPlant
-from CIM14.IEC61970.Generation.Production.GenUnitOpCostCurve import GenUnitOpCostCurve
-from CIM14.IEC61970.Generation.Production.PenstockLossCurve import PenstockLossCurve
-from CIM14.IEC61970.Generation.Production.HydroPump import HydroPump
-from CIM14.IEC61970.Generation.Production.GenUnitOpSchedule import GenUnitOpSchedule
-from CIM14.IEC61970.Generation.Production.FuelAllocationSchedule import FuelAllocationSchedule
-from CIM14.IEC61970.Generation.Production.HeatRateCurve import HeatRateCurve
-from CIM14.IEC61970.Generation.Production.IncrementalHeatRateCurve import IncrementalHeatRateCurve
-from CIM14.IEC61970.Generation.Production.ThermalGeneratingUnit import ThermalGeneratingUnit
-from CIM14.IEC61970.Generation.Production.TailbayLossCurve import TailbayLossCurve
-from CIM14.IEC61970.Generation.Production.HydroPowerPlant import HydroPowerPlant
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Production"
 nsPrefix = "cimProduction"
@@ -143,3 +110,42 @@ class CostPerHeatUnit(float):
     """Cost, in units of currency, per quantity of heat generated
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "LevelVsVolumeCurve",
+    "FossilFuel",
+    "SteamSendoutSchedule",
+    "EmissionCurve",
+    "CombinedCyclePlant",
+    "StartIgnFuelCurve",
+    "HydroGeneratingEfficiencyCurve",
+    "StartRampCurve",
+    "GeneratingUnit",
+    "NuclearGeneratingUnit",
+    "WindGeneratingUnit",
+    "StartMainFuelCurve",
+    "StartupModel",
+    "AirCompressor",
+    "HeatInputCurve",
+    "CogenerationPlant",
+    "ShutdownCurve",
+    "InflowForecast",
+    "HydroGeneratingUnit",
+    "TargetLevelSchedule",
+    "EmissionAccount",
+    "GrossToNetActivePowerCurve",
+    "HydroPumpOpSchedule",
+    "Reservoir",
+    "CAESPlant",
+    "GenUnitOpCostCurve",
+    "PenstockLossCurve",
+    "HydroPump",
+    "GenUnitOpSchedule",
+    "FuelAllocationSchedule",
+    "HeatRateCurve",
+    "IncrementalHeatRateCurve",
+    "ThermalGeneratingUnit",
+    "TailbayLossCurve",
+    "HydroPowerPlant",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class ModelingAuthority(IdentifiedObject):
     """A Modeling Authority is an entity responsible for supplying and maintaining the data defining a specific set of objects in a network model.
@@ -29,8 +30,8 @@ class ModelingAuthority(IdentifiedObject):
 
         @param ModelingAuthoritySets: A Modeling Authority set supplies and maintains the data for the objects in a Modeling Authority Set.
         """
-        self._ModelingAuthoritySets = []
-        self.ModelingAuthoritySets = [] if ModelingAuthoritySets is None else ModelingAuthoritySets
+        if ModelingAuthoritySets is not None:
+            self.ModelingAuthoritySets = ModelingAuthoritySets
 
         super(ModelingAuthority, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class ModelingAuthority(IdentifiedObject):
     _enums = {}
     _refs = ["ModelingAuthoritySets"]
     _many_refs = ["ModelingAuthoritySets"]
+    _inverses = {"ModelingAuthoritySets": "ModelingAuthority"}
 
     def getModelingAuthoritySets(self):
         """A Modeling Authority set supplies and maintains the data for the objects in a Modeling Authority Set.
@@ -47,7 +49,8 @@ class ModelingAuthority(IdentifiedObject):
         return self._ModelingAuthoritySets
 
     def setModelingAuthoritySets(self, value):
-        for x in self._ModelingAuthoritySets:
+        value = RefList(value)
+        for x in list(self._ModelingAuthoritySets):
             x.ModelingAuthority = None
         for y in value:
             y._ModelingAuthority = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class ModelingAuthoritySet(IdentifiedObject):
     """A Modeling Authority Set is a group of objects in a network model where the data is supplied and maintained by the same Modeling Authority.
@@ -33,8 +34,8 @@ class ModelingAuthoritySet(IdentifiedObject):
         self._ModelingAuthority = None
         self.ModelingAuthority = ModelingAuthority
 
-        self._IdentifiedObjects = []
-        self.IdentifiedObjects = [] if IdentifiedObjects is None else IdentifiedObjects
+        if IdentifiedObjects is not None:
+            self.IdentifiedObjects = IdentifiedObjects
 
         super(ModelingAuthoritySet, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class ModelingAuthoritySet(IdentifiedObject):
     _enums = {}
     _refs = ["ModelingAuthority", "IdentifiedObjects"]
     _many_refs = ["IdentifiedObjects"]
+    _inverses = {"ModelingAuthority": "ModelingAuthoritySets", "IdentifiedObjects": "ModelingAuthoritySet"}
 
     def getModelingAuthority(self):
         """A Modeling Authority set supplies and maintains the data for the objects in a Modeling Authority Set.
@@ -52,13 +54,12 @@ class ModelingAuthoritySet(IdentifiedObject):
 
     def setModelingAuthority(self, value):
         if self._ModelingAuthority is not None:
-            filtered = [x for x in self.ModelingAuthority.ModelingAuthoritySets if x != self]
-            self._ModelingAuthority._ModelingAuthoritySets = filtered
+            self._ModelingAuthority._ModelingAuthoritySets.discard(self)
 
         self._ModelingAuthority = value
         if self._ModelingAuthority is not None:
             if self not in self._ModelingAuthority._ModelingAuthoritySets:
-                self._ModelingAuthority._ModelingAuthoritySets.append(self)
+                self._ModelingAuthority._reflist("_ModelingAuthoritySets").append(self)
 
     ModelingAuthority = property(getModelingAuthority, setModelingAuthority)
 
@@ -68,7 +69,8 @@ class ModelingAuthoritySet(IdentifiedObject):
         return self._IdentifiedObjects
 
     def setIdentifiedObjects(self, value):
-        for x in self._IdentifiedObjects:
+        value = RefList(value)
+        for x in list(self._IdentifiedObjects):
             x.ModelingAuthoritySet = None
         for y in value:
             y._ModelingAuthoritySet = self
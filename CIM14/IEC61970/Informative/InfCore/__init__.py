@@ -19,9 +19,14 @@
 # IN THE SOFTWARE.
 
 
-from CIM14.IEC61970.Informative.InfCore.ModelingAuthority import ModelingAuthority
-from CIM14.IEC61970.Informative.InfCore.ModelingAuthoritySet import ModelingAuthoritySet
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#InfCore"
 nsPrefix = "cimInfCore"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ModelingAuthority",
+    "ModelingAuthoritySet",
+])
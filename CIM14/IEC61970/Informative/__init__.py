@@ -20,6 +20,14 @@
 
 
 
+
+import sys
+from CIM14.Element import LazyModule
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Informative"
 nsPrefix = "cimInformative"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+], [
+    "InfCore",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class DayType(IdentifiedObject):
     """Group of similar days, e.g., Mon/Tue/Wed, Thu/Fri, Sat/Sun, Holiday1, Holiday2
@@ -29,8 +30,8 @@ class DayType(IdentifiedObject):
 
         @param SeasonDayTypeSchedules: Schedules that use this DayType.
         """
-        self._SeasonDayTypeSchedules = []
-        self.SeasonDayTypeSchedules = [] if SeasonDayTypeSchedules is None else SeasonDayTypeSchedules
+        if SeasonDayTypeSchedules is not None:
+            self.SeasonDayTypeSchedules = SeasonDayTypeSchedules
 
         super(DayType, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class DayType(IdentifiedObject):
     _enums = {}
     _refs = ["SeasonDayTypeSchedules"]
     _many_refs = ["SeasonDayTypeSchedules"]
+    _inverses = {"SeasonDayTypeSchedules": "DayType"}
 
     def getSeasonDayTypeSchedules(self):
         """Schedules that use this DayType.
@@ -47,7 +49,8 @@ class DayType(IdentifiedObject):
         return self._SeasonDayTypeSchedules
 
     def setSeasonDayTypeSchedules(self, value):
-        for x in self._SeasonDayTypeSchedules:
+        value = RefList(value)
+        for x in list(self._SeasonDayTypeSchedules):
             x.DayType = None
         for y in value:
             y._DayType = self
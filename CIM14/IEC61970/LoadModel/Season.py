@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM14.Element import Element
+from CIM14.Element import Element, RefList
 
 class Season(Element):
     """A specified time period of the year, e.g., Spring, Summer, Fall, Winter
@@ -41,8 +41,8 @@ class Season(Element):
         #: Date season ends
         self.endDate = endDate
 
-        self._SeasonDayTypeSchedules = []
-        self.SeasonDayTypeSchedules = [] if SeasonDayTypeSchedules is None else SeasonDayTypeSchedules
+        if SeasonDayTypeSchedules is not None:
+            self.SeasonDayTypeSchedules = SeasonDayTypeSchedules
 
         super(Season, self).__init__(*args, **kw_args)
 
@@ -52,6 +52,7 @@ class Season(Element):
     _enums = {"name": "SeasonName"}
     _refs = ["SeasonDayTypeSchedules"]
     _many_refs = ["SeasonDayTypeSchedules"]
+    _inverses = {"SeasonDayTypeSchedules": "Season"}
 
     def getSeasonDayTypeSchedules(self):
         """Schedules that use this Season.
@@ -59,7 +60,8 @@ class Season(Element):
         return self._SeasonDayTypeSchedules
 
     def setSeasonDayTypeSchedules(self, value):
-        for x in self._SeasonDayTypeSchedules:
+        value = RefList(value)
+        for x in list(self._SeasonDayTypeSchedules):
             x.Season = None
         for y in value:
             y._Season = self
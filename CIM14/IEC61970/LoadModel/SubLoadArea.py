@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.LoadModel.EnergyArea import EnergyArea
+from CIM14.Element import RefList
 
 class SubLoadArea(EnergyArea):
     """The class is the second level in a hierarchical structure for grouping of loads for the purpose of load flow load scaling.
@@ -30,8 +31,8 @@ class SubLoadArea(EnergyArea):
         @param LoadGroups: The Loadgroups in the SubLoadArea.
         @param LoadArea: The LoadArea where the SubLoadArea belongs.
         """
-        self._LoadGroups = []
-        self.LoadGroups = [] if LoadGroups is None else LoadGroups
+        if LoadGroups is not None:
+            self.LoadGroups = LoadGroups
 
         self._LoadArea = None
         self.LoadArea = LoadArea
@@ -44,6 +45,7 @@ class SubLoadArea(EnergyArea):
     _enums = {}
     _refs = ["LoadGroups", "LoadArea"]
     _many_refs = ["LoadGroups"]
+    _inverses = {"LoadGroups": "SubLoadArea", "LoadArea": "SubLoadAreas"}
 
     def getLoadGroups(self):
         """The Loadgroups in the SubLoadArea.
@@ -51,7 +53,8 @@ class SubLoadArea(EnergyArea):
         return self._LoadGroups
 
     def setLoadGroups(self, value):
-        for x in self._LoadGroups:
+        value = RefList(value)
+        for x in list(self._LoadGroups):
             x.SubLoadArea = None
         for y in value:
             y._SubLoadArea = self
@@ -74,13 +77,12 @@ class SubLoadArea(EnergyArea):
 
     def setLoadArea(self, value):
         if self._LoadArea is not None:
-            filtered = [x for x in self.LoadArea.SubLoadAreas if x != self]
-            self._LoadArea._SubLoadAreas = filtered
+            self._LoadArea._SubLoadAreas.discard(self)
 
         self._LoadArea = value
         if self._LoadArea is not None:
             if self not in self._LoadArea._SubLoadAreas:
-                self._LoadArea._SubLoadAreas.append(self)
+                self._LoadArea._reflist("_SubLoadAreas").append(self)
 
     LoadArea = property(getLoadArea, setLoadArea)
 
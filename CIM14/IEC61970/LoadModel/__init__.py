@@ -21,22 +21,8 @@
 """This package is responsible for modeling the energy consumers and the system load as curves and associated curve data. Special circumstances that may affect the load, such as seasons and daytypes, are also included here.  This information is used by Load Forecasting and Load Management.
 """
 
-from CIM14.IEC61970.LoadModel.PowerCutZone import PowerCutZone
-from CIM14.IEC61970.LoadModel.LoadResponseCharacteristic import LoadResponseCharacteristic
-from CIM14.IEC61970.LoadModel.EnergyArea import EnergyArea
-from CIM14.IEC61970.LoadModel.LoadArea import LoadArea
-from CIM14.IEC61970.LoadModel.StationSupply import StationSupply
-from CIM14.IEC61970.LoadModel.SubLoadArea import SubLoadArea
-from CIM14.IEC61970.LoadModel.LoadGroup import LoadGroup
-from CIM14.IEC61970.LoadModel.NonConformLoadGroup import NonConformLoadGroup
-from CIM14.IEC61970.LoadModel.SeasonDayTypeSchedule import SeasonDayTypeSchedule
-from CIM14.IEC61970.LoadModel.Season import Season
-from CIM14.IEC61970.LoadModel.ConformLoadSchedule import ConformLoadSchedule
-from CIM14.IEC61970.LoadModel.NonConformLoad import NonConformLoad
-from CIM14.IEC61970.LoadModel.ConformLoad import ConformLoad
-from CIM14.IEC61970.LoadModel.NonConformLoadSchedule import NonConformLoadSchedule
-from CIM14.IEC61970.LoadModel.DayType import DayType
-from CIM14.IEC61970.LoadModel.ConformLoadGroup import ConformLoadGroup
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#LoadModel"
 nsPrefix = "cimLoadModel"
@@ -47,3 +33,23 @@ class SeasonName(str):
     Values are: fall, winter, summer, spring
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "PowerCutZone",
+    "LoadResponseCharacteristic",
+    "EnergyArea",
+    "LoadArea",
+    "StationSupply",
+    "SubLoadArea",
+    "LoadGroup",
+    "NonConformLoadGroup",
+    "SeasonDayTypeSchedule",
+    "Season",
+    "ConformLoadSchedule",
+    "NonConformLoad",
+    "ConformLoad",
+    "NonConformLoadSchedule",
+    "DayType",
+    "ConformLoadGroup",
+])
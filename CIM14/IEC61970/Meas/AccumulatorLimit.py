@@ -44,6 +44,7 @@ class AccumulatorLimit(Limit):
     _enums = {}
     _refs = ["LimitSet"]
     _many_refs = []
+    _inverses = {"LimitSet": "Limits"}
 
     def getLimitSet(self):
         """The set of limits.
@@ -52,13 +53,12 @@ class AccumulatorLimit(Limit):
 
     def setLimitSet(self, value):
         if self._LimitSet is not None:
-            filtered = [x for x in self.LimitSet.Limits if x != self]
-            self._LimitSet._Limits = filtered
+            self._LimitSet._Limits.discard(self)
 
         self._LimitSet = value
         if self._LimitSet is not None:
             if self not in self._LimitSet._Limits:
-                self._LimitSet._Limits.append(self)
+                self._LimitSet._reflist("_Limits").append(self)
 
     LimitSet = property(getLimitSet, setLimitSet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Meas.LimitSet import LimitSet
+from CIM14.Element import RefList
 
 class AccumulatorLimitSet(LimitSet):
     """An AccumulatorLimitSet specifies a set of Limits that are associated with an Accumulator measurement.
@@ -30,11 +31,11 @@ class AccumulatorLimitSet(LimitSet):
         @param Measurements: The Measurements using the LimitSet.
         @param Limits: The limit values used for supervision of Measurements.
         """
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
-        self._Limits = []
-        self.Limits = [] if Limits is None else Limits
+        if Limits is not None:
+            self.Limits = Limits
 
         super(AccumulatorLimitSet, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class AccumulatorLimitSet(LimitSet):
     _enums = {}
     _refs = ["Measurements", "Limits"]
     _many_refs = ["Measurements", "Limits"]
+    _inverses = {"Measurements": "LimitSets", "Limits": "LimitSet"}
 
     def getMeasurements(self):
         """The Measurements using the LimitSet.
@@ -52,20 +54,19 @@ class AccumulatorLimitSet(LimitSet):
 
     def setMeasurements(self, value):
         for p in self._Measurements:
-            filtered = [q for q in p.LimitSets if q != self]
-            self._Measurements._LimitSets = filtered
+            p._LimitSets.discard(self)
         for r in value:
             if self not in r._LimitSets:
-                r._LimitSets.append(self)
-        self._Measurements = value
+                r._reflist("_LimitSets").append(self)
+        self._Measurements = RefList(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
         for obj in Measurements:
             if self not in obj._LimitSets:
-                obj._LimitSets.append(self)
-            self._Measurements.append(obj)
+                obj._reflist("_LimitSets").append(self)
+            self._reflist("_Measurements").append(obj)
 
     def removeMeasurements(self, *Measurements):
         for obj in Measurements:
@@ -79,7 +80,8 @@ class AccumulatorLimitSet(LimitSet):
         return self._Limits
 
     def setLimits(self, value):
-        for x in self._Limits:
+        value = RefList(value)
+        for x in list(self._Limits):
             x.LimitSet = None
         for y in value:
             y._LimitSet = self
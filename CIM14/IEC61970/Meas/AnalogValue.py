@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Meas.MeasurementValue import MeasurementValue
+from CIM14.Element import RefList
 
 class AnalogValue(MeasurementValue):
     """AnalogValue represents an analog MeasurementValue.
@@ -35,14 +36,14 @@ class AnalogValue(MeasurementValue):
         #: The value to supervise.
         self.value = value
 
-        self._AltTieMeas = []
-        self.AltTieMeas = [] if AltTieMeas is None else AltTieMeas
+        if AltTieMeas is not None:
+            self.AltTieMeas = AltTieMeas
 
         self._Analog = None
         self.Analog = Analog
 
-        self._AltGeneratingUnit = []
-        self.AltGeneratingUnit = [] if AltGeneratingUnit is None else AltGeneratingUnit
+        if AltGeneratingUnit is not None:
+            self.AltGeneratingUnit = AltGeneratingUnit
 
         super(AnalogValue, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class AnalogValue(MeasurementValue):
     _enums = {}
     _refs = ["AltTieMeas", "Analog", "AltGeneratingUnit"]
     _many_refs = ["AltTieMeas", "AltGeneratingUnit"]
+    _inverses = {"AltTieMeas": "AnalogValue", "Analog": "AnalogValues", "AltGeneratingUnit": "AnalogValue"}
 
     def getAltTieMeas(self):
         """The usage of the measurement within the control area specification.
@@ -59,7 +61,8 @@ class AnalogValue(MeasurementValue):
         return self._AltTieMeas
 
     def setAltTieMeas(self, value):
-        for x in self._AltTieMeas:
+        value = RefList(value)
+        for x in list(self._AltTieMeas):
             x.AnalogValue = None
         for y in value:
             y._AnalogValue = self
@@ -82,13 +85,12 @@ class AnalogValue(MeasurementValue):
 
     def setAnalog(self, value):
         if self._Analog is not None:
-            filtered = [x for x in self.Analog.AnalogValues if x != self]
-            self._Analog._AnalogValues = filtered
+            self._Analog._AnalogValues.discard(self)
 
         self._Analog = value
         if self._Analog is not None:
             if self not in self._Analog._AnalogValues:
-                self._Analog._AnalogValues.append(self)
+                self._Analog._reflist("_AnalogValues").append(self)
 
     Analog = property(getAnalog, setAnalog)
 
@@ -98,7 +100,8 @@ class AnalogValue(MeasurementValue):
         return self._AltGeneratingUnit
 
     def setAltGeneratingUnit(self, value):
-        for x in self._AltGeneratingUnit:
+        value = RefList(value)
+        for x in list(self._AltGeneratingUnit):
             x.AnalogValue = None
         for y in value:
             y._AnalogValue = self
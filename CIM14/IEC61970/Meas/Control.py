@@ -60,6 +60,7 @@ class Control(IdentifiedObject):
     _enums = {}
     _refs = ["Unit", "RegulatingCondEq", "ControlType", "RemoteControl"]
     _many_refs = []
+    _inverses = {"Unit": "Controls", "RegulatingCondEq": "Controls", "ControlType": "Controls", "RemoteControl": "Control"}
 
     def getUnit(self):
         """The Unit for the Control.
@@ -68,13 +69,12 @@ class Control(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.Controls if x != self]
-            self._Unit._Controls = filtered
+            self._Unit._Controls.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
             if self not in self._Unit._Controls:
-                self._Unit._Controls.append(self)
+                self._Unit._reflist("_Controls").append(self)
 
     Unit = property(getUnit, setUnit)
 
@@ -85,13 +85,12 @@ class Control(IdentifiedObject):
 
     def setRegulatingCondEq(self, value):
         if self._RegulatingCondEq is not None:
-            filtered = [x for x in self.RegulatingCondEq.Controls if x != self]
-            self._RegulatingCondEq._Controls = filtered
+            self._RegulatingCondEq._Controls.discard(self)
 
         self._RegulatingCondEq = value
         if self._RegulatingCondEq is not None:
             if self not in self._RegulatingCondEq._Controls:
-                self._RegulatingCondEq._Controls.append(self)
+                self._RegulatingCondEq._reflist("_Controls").append(self)
 
     RegulatingCondEq = property(getRegulatingCondEq, setRegulatingCondEq)
 
@@ -102,13 +101,12 @@ class Control(IdentifiedObject):
 
     def setControlType(self, value):
         if self._ControlType is not None:
-            filtered = [x for x in self.ControlType.Controls if x != self]
-            self._ControlType._Controls = filtered
+            self._ControlType._Controls.discard(self)
 
         self._ControlType = value
         if self._ControlType is not None:
             if self not in self._ControlType._Controls:
-                self._ControlType._Controls.append(self)
+                self._ControlType._reflist("_Controls").append(self)
 
     ControlType = property(getControlType, setControlType)
 
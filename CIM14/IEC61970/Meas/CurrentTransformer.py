@@ -60,4 +60,5 @@ class CurrentTransformer(Equipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class Limit(IdentifiedObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
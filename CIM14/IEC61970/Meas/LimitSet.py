@@ -40,4 +40,5 @@ class LimitSet(IdentifiedObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class Measurement(IdentifiedObject):
     """A Measurement represents any measured, calculated or non-measured non-calculated quantity. Any piece of equipment may contain Measurements, e.g. a substation may have temperature measurements and door open indications, a transformer may have oil temperature and tank pressure measurements, a bay may contain a number of power flow measurements and a Breaker may contain a switch status measurement.  The PSR - Measurement association is intended to capture this use of Measurement and is included in the naming hierarchy based on EquipmentContainer. The naming hierarchy typically has Measurements as leafs, e.g. Substation-VoltageLevel-Bay-Switch-Measurement. Some Measurements represent quantities related to a particular sensor location in the network, e.g. a voltage transformer (PT) at a busbar or a current transformer (CT) at the bar between a breaker and an isolator. The sensing position is not captured in the PSR - Measurement association. Instead it is captured by the Measurement - Terminal association that is used to define the sensing location in the network topology. The location is defined by the connection of the Terminal to ConductingEquipment.  Two possible paths exist: 1) Measurement-Terminal- ConnectivityNode-Terminal-ConductingEquipment 2) Measurement-Terminal-ConductingEquipment Alternative 2 is the only allowed use.  When the sensor location is needed both Measurement-PSR and Measurement-Terminal are used. The Measurement-Terminal association is never used alone.
@@ -42,8 +43,8 @@ class Measurement(IdentifiedObject):
         self._PowerSystemResource = None
         self.PowerSystemResource = PowerSystemResource
 
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        if Locations is not None:
+            self.Locations = Locations
 
         self._Terminal = None
         self.Terminal = Terminal
@@ -51,14 +52,14 @@ class Measurement(IdentifiedObject):
         self._Unit = None
         self.Unit = Unit
 
-        self._tieToMeasurement0 = []
-        self.tieToMeasurement0 = [] if tieToMeasurement0 is None else tieToMeasurement0
+        if tieToMeasurement0 is not None:
+            self.tieToMeasurement0 = tieToMeasurement0
 
         self._Asset = None
         self.Asset = Asset
 
-        self._Documents = []
-        self.Documents = [] if Documents is None else Documents
+        if Documents is not None:
+            self.Documents = Documents
 
         super(Measurement, self).__init__(*args, **kw_args)
 
@@ -68,6 +69,7 @@ class Measurement(IdentifiedObject):
     _enums = {}
     _refs = ["PowerSystemResource", "Locations", "Terminal", "Unit", "tieToMeasurement0", "Asset", "Documents"]
     _many_refs = ["Locations", "tieToMeasurement0", "Documents"]
+    _inverses = {"PowerSystemResource": "Measurements", "Locations": "Measurements", "Terminal": "Measurements", "Unit": "Measurements", "tieToMeasurement0": "measurement0", "Asset": "Measurements", "Documents": "Measurements"}
 
     def getPowerSystemResource(self):
         """The PowerSystemResource that contains the Measurement in the naming hierarchy
@@ -76,13 +78,12 @@ class Measurement(IdentifiedObject):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.Measurements if x != self]
-            self._PowerSystemResource._Measurements = filtered
+            self._PowerSystemResource._Measurements.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
             if self not in self._PowerSystemResource._Measurements:
-                self._PowerSystemResource._Measurements.append(self)
+                self._PowerSystemResource._reflist("_Measurements").append(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -92,20 +93,19 @@ class Measurement(IdentifiedObject):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.Measurements if q != self]
-            self._Locations._Measurements = filtered
+            p._Measurements.discard(self)
         for r in value:
             if self not in r._Measurements:
-                r._Measurements.append(self)
-        self._Locations = value
+                r._reflist("_Measurements").append(self)
+        self._Locations = RefList(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
         for obj in Locations:
             if self not in obj._Measurements:
-                obj._Measurements.append(self)
-            self._Locations.append(obj)
+                obj._reflist("_Measurements").append(self)
+            self._reflist("_Locations").append(obj)
 
     def removeLocations(self, *Locations):
         for obj in Locations:
@@ -120,13 +120,12 @@ class Measurement(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.Measurements if x != self]
-            self._Terminal._Measurements = filtered
+            self._Terminal._Measurements.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._Measurements:
-                self._Terminal._Measurements.append(self)
+                self._Terminal._reflist("_Measurements").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -137,13 +136,12 @@ class Measurement(IdentifiedObject):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.Measurements if x != self]
-            self._Unit._Measurements = filtered
+            self._Unit._Measurements.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
             if self not in self._Unit._Measurements:
-                self._Unit._Measurements.append(self)
+                self._Unit._reflist("_Measurements").append(self)
 
     Unit = property(getUnit, setUnit)
 
@@ -152,7 +150,8 @@ class Measurement(IdentifiedObject):
         return self._tieToMeasurement0
 
     def settieToMeasurement0(self, value):
-        for x in self._tieToMeasurement0:
+        value = RefList(value)
+        for x in list(self._tieToMeasurement0):
             x.measurement0 = None
         for y in value:
             y._measurement0 = self
@@ -174,13 +173,12 @@ class Measurement(IdentifiedObject):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.Measurements if x != self]
-            self._Asset._Measurements = filtered
+            self._Asset._Measurements.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
             if self not in self._Asset._Measurements:
-                self._Asset._Measurements.append(self)
+                self._Asset._reflist("_Measurements").append(self)
 
     Asset = property(getAsset, setAsset)
 
@@ -191,20 +189,19 @@ class Measurement(IdentifiedObject):
 
     def setDocuments(self, value):
         for p in self._Documents:
-            filtered = [q for q in p.Measurements if q != self]
-            self._Documents._Measurements = filtered
+            p._Measurements.discard(self)
         for r in value:
             if self not in r._Measurements:
-                r._Measurements.append(self)
-        self._Documents = value
+                r._reflist("_Measurements").append(self)
+        self._Documents = RefList(value)
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
         for obj in Documents:
             if self not in obj._Measurements:
-                obj._Measurements.append(self)
-            self._Documents.append(obj)
+                obj._reflist("_Measurements").append(self)
+            self._reflist("_Documents").append(obj)
 
     def removeDocuments(self, *Documents):
         for obj in Documents:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class MeasurementValueSource(IdentifiedObject):
     """MeasurementValueSource describes the alternative sources updating a MeasurementValue. User conventions for how to use the MeasurementValueSource attributes are described in the introduction to IEC 61970-301.
@@ -29,8 +30,8 @@ class MeasurementValueSource(IdentifiedObject):
 
         @param MeasurementValues: The MeasurementValues updated by the source
         """
-        self._MeasurementValues = []
-        self.MeasurementValues = [] if MeasurementValues is None else MeasurementValues
+        if MeasurementValues is not None:
+            self.MeasurementValues = MeasurementValues
 
         super(MeasurementValueSource, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class MeasurementValueSource(IdentifiedObject):
     _enums = {}
     _refs = ["MeasurementValues"]
     _many_refs = ["MeasurementValues"]
+    _inverses = {"MeasurementValues": "MeasurementValueSource"}
 
     def getMeasurementValues(self):
         """The MeasurementValues updated by the source
@@ -47,7 +49,8 @@ class MeasurementValueSource(IdentifiedObject):
         return self._MeasurementValues
 
     def setMeasurementValues(self, value):
-        for x in self._MeasurementValues:
+        value = RefList(value)
+        for x in list(self._MeasurementValues):
             x.MeasurementValueSource = None
         for y in value:
             y._MeasurementValueSource = self
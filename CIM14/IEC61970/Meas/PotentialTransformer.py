@@ -48,4 +48,5 @@ class PotentialTransformer(Equipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
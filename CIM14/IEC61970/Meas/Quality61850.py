@@ -84,4 +84,5 @@ class Quality61850(Element):
     _enums = {"validity": "Validity", "source": "Source"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -56,6 +56,7 @@ class SetPoint(Control):
     _enums = {}
     _refs = ["Analog"]
     _many_refs = []
+    _inverses = {"Analog": "SetPoint"}
 
     def getAnalog(self):
         """The Measurement variable used for control
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Meas.Measurement import Measurement
+from CIM14.Element import RefList
 
 class StringMeasurement(Measurement):
     """StringMeasurement represents a measurement with values of type string.
@@ -29,8 +30,8 @@ class StringMeasurement(Measurement):
 
         @param StringMeasurementValues: The values connected to this measurement.
         """
-        self._StringMeasurementValues = []
-        self.StringMeasurementValues = [] if StringMeasurementValues is None else StringMeasurementValues
+        if StringMeasurementValues is not None:
+            self.StringMeasurementValues = StringMeasurementValues
 
         super(StringMeasurement, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class StringMeasurement(Measurement):
     _enums = {}
     _refs = ["StringMeasurementValues"]
     _many_refs = ["StringMeasurementValues"]
+    _inverses = {"StringMeasurementValues": "StringMeasurement"}
 
     def getStringMeasurementValues(self):
         """The values connected to this measurement.
@@ -47,7 +49,8 @@ class StringMeasurement(Measurement):
         return self._StringMeasurementValues
 
     def setStringMeasurementValues(self, value):
-        for x in self._StringMeasurementValues:
+        value = RefList(value)
+        for x in list(self._StringMeasurementValues):
             x.StringMeasurement = None
         for y in value:
             y._StringMeasurement = self
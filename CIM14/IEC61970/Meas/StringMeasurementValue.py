@@ -44,6 +44,7 @@ class StringMeasurementValue(MeasurementValue):
     _enums = {}
     _refs = ["StringMeasurement"]
     _many_refs = []
+    _inverses = {"StringMeasurement": "StringMeasurementValues"}
 
     def getStringMeasurement(self):
         """Measurement to which this value is connected.
@@ -52,13 +53,12 @@ class StringMeasurementValue(MeasurementValue):
 
     def setStringMeasurement(self, value):
         if self._StringMeasurement is not None:
-            filtered = [x for x in self.StringMeasurement.StringMeasurementValues if x != self]
-            self._StringMeasurement._StringMeasurementValues = filtered
+            self._StringMeasurement._StringMeasurementValues.discard(self)
 
         self._StringMeasurement = value
         if self._StringMeasurement is not None:
             if self not in self._StringMeasurement._StringMeasurementValues:
-                self._StringMeasurement._StringMeasurementValues.append(self)
+                self._StringMeasurement._reflist("_StringMeasurementValues").append(self)
 
     StringMeasurement = property(getStringMeasurement, setStringMeasurement)
 
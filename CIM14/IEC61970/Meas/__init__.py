@@ -21,33 +21,8 @@
 """Contains entities that describe dynamic measurement data exchanged between applications.
 """
 
-from CIM14.IEC61970.Meas.MeasurementValue import MeasurementValue
-from CIM14.IEC61970.Meas.Control import Control
-from CIM14.IEC61970.Meas.Measurement import Measurement
-from CIM14.IEC61970.Meas.StringMeasurement import StringMeasurement
-from CIM14.IEC61970.Meas.Discrete import Discrete
-from CIM14.IEC61970.Meas.CurrentTransformer import CurrentTransformer
-from CIM14.IEC61970.Meas.ValueAliasSet import ValueAliasSet
-from CIM14.IEC61970.Meas.DiscreteValue import DiscreteValue
-from CIM14.IEC61970.Meas.Limit import Limit
-from CIM14.IEC61970.Meas.AnalogLimit import AnalogLimit
-from CIM14.IEC61970.Meas.LimitSet import LimitSet
-from CIM14.IEC61970.Meas.AccumulatorLimitSet import AccumulatorLimitSet
-from CIM14.IEC61970.Meas.SetPoint import SetPoint
-from CIM14.IEC61970.Meas.Command import Command
-from CIM14.IEC61970.Meas.StringMeasurementValue import StringMeasurementValue
-from CIM14.IEC61970.Meas.PotentialTransformer import PotentialTransformer
-from CIM14.IEC61970.Meas.ValueToAlias import ValueToAlias
-from CIM14.IEC61970.Meas.ControlType import ControlType
-from CIM14.IEC61970.Meas.Accumulator import Accumulator
-from CIM14.IEC61970.Meas.AnalogLimitSet import AnalogLimitSet
-from CIM14.IEC61970.Meas.AccumulatorLimit import AccumulatorLimit
-from CIM14.IEC61970.Meas.MeasurementValueSource import MeasurementValueSource
-from CIM14.IEC61970.Meas.AnalogValue import AnalogValue
-from CIM14.IEC61970.Meas.Analog import Analog
-from CIM14.IEC61970.Meas.Quality61850 import Quality61850
-from CIM14.IEC61970.Meas.MeasurementValueQuality import MeasurementValueQuality
-from CIM14.IEC61970.Meas.AccumulatorValue import AccumulatorValue
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Meas"
 nsPrefix = "cimMeas"
@@ -58,3 +33,34 @@ class Validity(str):
     Values are: QUESTIONABLE, INVALID, GOOD
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "MeasurementValue",
+    "Control",
+    "Measurement",
+    "StringMeasurement",
+    "Discrete",
+    "CurrentTransformer",
+    "ValueAliasSet",
+    "DiscreteValue",
+    "Limit",
+    "AnalogLimit",
+    "LimitSet",
+    "AccumulatorLimitSet",
+    "SetPoint",
+    "Command",
+    "StringMeasurementValue",
+    "PotentialTransformer",
+    "ValueToAlias",
+    "ControlType",
+    "Accumulator",
+    "AnalogLimitSet",
+    "AccumulatorLimit",
+    "MeasurementValueSource",
+    "AnalogValue",
+    "Analog",
+    "Quality61850",
+    "MeasurementValueQuality",
+    "AccumulatorValue",
+])
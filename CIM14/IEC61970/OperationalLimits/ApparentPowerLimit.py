@@ -40,4 +40,5 @@ class ApparentPowerLimit(OperationalLimit):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
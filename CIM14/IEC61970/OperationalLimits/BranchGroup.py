@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class BranchGroup(IdentifiedObject):
     """A group of branch terminals whose directed flow summation is to be monitored. Abranch group need not form a cutset of the network.
@@ -53,8 +54,8 @@ class BranchGroup(IdentifiedObject):
         #: Monitor the reactive power flow.
         self.monitorReactivePower = monitorReactivePower
 
-        self._BranchGroupTerminal = []
-        self.BranchGroupTerminal = [] if BranchGroupTerminal is None else BranchGroupTerminal
+        if BranchGroupTerminal is not None:
+            self.BranchGroupTerminal = BranchGroupTerminal
 
         super(BranchGroup, self).__init__(*args, **kw_args)
 
@@ -64,6 +65,7 @@ class BranchGroup(IdentifiedObject):
     _enums = {}
     _refs = ["BranchGroupTerminal"]
     _many_refs = ["BranchGroupTerminal"]
+    _inverses = {"BranchGroupTerminal": "BranchGroup"}
 
     def getBranchGroupTerminal(self):
         """The directed branch group terminals to be summed.
@@ -71,7 +73,8 @@ class BranchGroup(IdentifiedObject):
         return self._BranchGroupTerminal
 
     def setBranchGroupTerminal(self, value):
-        for x in self._BranchGroupTerminal:
+        value = RefList(value)
+        for x in list(self._BranchGroupTerminal):
             x.BranchGroup = None
         for y in value:
             y._BranchGroup = self
@@ -48,6 +48,7 @@ class BranchGroupTerminal(Element):
     _enums = {}
     _refs = ["BranchGroup", "Terminal"]
     _many_refs = []
+    _inverses = {"BranchGroup": "BranchGroupTerminal", "Terminal": "BranchGroupTerminal"}
 
     def getBranchGroup(self):
         """The branch group to which the directed branch group terminals belong.
@@ -56,13 +57,12 @@ class BranchGroupTerminal(Element):
 
     def setBranchGroup(self, value):
         if self._BranchGroup is not None:
-            filtered = [x for x in self.BranchGroup.BranchGroupTerminal if x != self]
-            self._BranchGroup._BranchGroupTerminal = filtered
+            self._BranchGroup._BranchGroupTerminal.discard(self)
 
         self._BranchGroup = value
         if self._BranchGroup is not None:
             if self not in self._BranchGroup._BranchGroupTerminal:
-                self._BranchGroup._BranchGroupTerminal.append(self)
+                self._BranchGroup._reflist("_BranchGroupTerminal").append(self)
 
     BranchGroup = property(getBranchGroup, setBranchGroup)
 
@@ -73,13 +73,12 @@ class BranchGroupTerminal(Element):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.BranchGroupTerminal if x != self]
-            self._Terminal._BranchGroupTerminal = filtered
+            self._Terminal._BranchGroupTerminal.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._BranchGroupTerminal:
-                self._Terminal._BranchGroupTerminal.append(self)
+                self._Terminal._reflist("_BranchGroupTerminal").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
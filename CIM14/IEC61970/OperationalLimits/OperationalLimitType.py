@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class OperationalLimitType(IdentifiedObject):
     """A type of limit.  The meaning of a specific limit is described in this class.
@@ -37,8 +38,8 @@ class OperationalLimitType(IdentifiedObject):
         #: The nominal acceptable duration of the limit.  Limits are commonly expressed in terms of the a time limit for which the limit is normally acceptable.   The actual acceptable duration of a specific limit may depend on other local factors such as temperature or wind speed.
         self.acceptableDuration = acceptableDuration
 
-        self._OperationalLimit = []
-        self.OperationalLimit = [] if OperationalLimit is None else OperationalLimit
+        if OperationalLimit is not None:
+            self.OperationalLimit = OperationalLimit
 
         super(OperationalLimitType, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class OperationalLimitType(IdentifiedObject):
     _enums = {"direction": "OperationalLimitDirectionKind"}
     _refs = ["OperationalLimit"]
     _many_refs = ["OperationalLimit"]
+    _inverses = {"OperationalLimit": "OperationalLimitType"}
 
     def getOperationalLimit(self):
         """The operational limits associated with this type of limit.
@@ -55,7 +57,8 @@ class OperationalLimitType(IdentifiedObject):
         return self._OperationalLimit
 
     def setOperationalLimit(self, value):
-        for x in self._OperationalLimit:
+        value = RefList(value)
+        for x in list(self._OperationalLimit):
             x.OperationalLimitType = None
         for y in value:
             y._OperationalLimitType = self
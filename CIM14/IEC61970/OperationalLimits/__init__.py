@@ -21,15 +21,8 @@
 """The OperationalLimits package models a specification of limits associated with equipment and other operational entities.
 """
 
-from CIM14.IEC61970.OperationalLimits.OperationalLimit import OperationalLimit
-from CIM14.IEC61970.OperationalLimits.CurrentLimit import CurrentLimit
-from CIM14.IEC61970.OperationalLimits.BranchGroup import BranchGroup
-from CIM14.IEC61970.OperationalLimits.BranchGroupTerminal import BranchGroupTerminal
-from CIM14.IEC61970.OperationalLimits.ApparentPowerLimit import ApparentPowerLimit
-from CIM14.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
-from CIM14.IEC61970.OperationalLimits.VoltageLimit import VoltageLimit
-from CIM14.IEC61970.OperationalLimits.ActivePowerLimit import ActivePowerLimit
-from CIM14.IEC61970.OperationalLimits.OperationalLimitType import OperationalLimitType
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#OperationalLimits"
 nsPrefix = "cimOperationalLimits"
@@ -40,3 +33,16 @@ class OperationalLimitDirectionKind(str):
     Values are: low, absoluteValue, high
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "OperationalLimit",
+    "CurrentLimit",
+    "BranchGroup",
+    "BranchGroupTerminal",
+    "ApparentPowerLimit",
+    "OperationalLimitSet",
+    "VoltageLimit",
+    "ActivePowerLimit",
+    "OperationalLimitType",
+])
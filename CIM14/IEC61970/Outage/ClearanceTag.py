@@ -76,6 +76,7 @@ class ClearanceTag(IdentifiedObject):
     _enums = {}
     _refs = ["ClearanceTagType", "ConductingEquipment"]
     _many_refs = []
+    _inverses = {"ClearanceTagType": "ClearanceTags", "ConductingEquipment": "ClearanceTags"}
 
     def getClearanceTagType(self):
         """The type of tag, depending on the purpose of the work to be performed and/or the type of supervisory control allowed.
@@ -84,13 +85,12 @@ class ClearanceTag(IdentifiedObject):
 
     def setClearanceTagType(self, value):
         if self._ClearanceTagType is not None:
-            filtered = [x for x in self.ClearanceTagType.ClearanceTags if x != self]
-            self._ClearanceTagType._ClearanceTags = filtered
+            self._ClearanceTagType._ClearanceTags.discard(self)
 
         self._ClearanceTagType = value
         if self._ClearanceTagType is not None:
             if self not in self._ClearanceTagType._ClearanceTags:
-                self._ClearanceTagType._ClearanceTags.append(self)
+                self._ClearanceTagType._reflist("_ClearanceTags").append(self)
 
     ClearanceTagType = property(getClearanceTagType, setClearanceTagType)
 
@@ -101,13 +101,12 @@ class ClearanceTag(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.ClearanceTags if x != self]
-            self._ConductingEquipment._ClearanceTags = filtered
+            self._ConductingEquipment._ClearanceTags.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
             if self not in self._ConductingEquipment._ClearanceTags:
-                self._ConductingEquipment._ClearanceTags.append(self)
+                self._ConductingEquipment._reflist("_ClearanceTags").append(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IrregularIntervalSchedule import IrregularIntervalSchedule
+from CIM14.Element import RefList
 
 class OutageSchedule(IrregularIntervalSchedule):
     """The period of time that a piece of equipment is out of service, for example, for maintenance or testing; including the equipment's active power rating while under maintenance. The X-axis represents absolute time and the Y-axis represents the equipment's available rating while out of service.
@@ -30,8 +31,8 @@ class OutageSchedule(IrregularIntervalSchedule):
         @param SwitchingOperations: An OutageSchedule may operate many switches.
         @param PowerSystemResource: A power system resource may have an outage schedule
         """
-        self._SwitchingOperations = []
-        self.SwitchingOperations = [] if SwitchingOperations is None else SwitchingOperations
+        if SwitchingOperations is not None:
+            self.SwitchingOperations = SwitchingOperations
 
         self._PowerSystemResource = None
         self.PowerSystemResource = PowerSystemResource
@@ -44,6 +45,7 @@ class OutageSchedule(IrregularIntervalSchedule):
     _enums = {}
     _refs = ["SwitchingOperations", "PowerSystemResource"]
     _many_refs = ["SwitchingOperations"]
+    _inverses = {"SwitchingOperations": "OutageSchedule", "PowerSystemResource": "OutageSchedule"}
 
     def getSwitchingOperations(self):
         """An OutageSchedule may operate many switches.
@@ -51,7 +53,8 @@ class OutageSchedule(IrregularIntervalSchedule):
         return self._SwitchingOperations
 
     def setSwitchingOperations(self, value):
-        for x in self._SwitchingOperations:
+        value = RefList(value)
+        for x in list(self._SwitchingOperations):
             x.OutageSchedule = None
         for y in value:
             y._OutageSchedule = self
@@ -21,10 +21,8 @@
 """An extension to the Core and Wires packages that models information on the current and planned network configuration. These entities are optional within typical network applications.
 """
 
-from CIM14.IEC61970.Outage.ClearanceTag import ClearanceTag
-from CIM14.IEC61970.Outage.ClearanceTagType import ClearanceTagType
-from CIM14.IEC61970.Outage.OutageSchedule import OutageSchedule
-from CIM14.IEC61970.Outage.SwitchingOperation import SwitchingOperation
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Outage"
 nsPrefix = "cimOutage"
@@ -35,3 +33,11 @@ class SwitchState(str):
     Values are: open, close
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ClearanceTag",
+    "ClearanceTagType",
+    "OutageSchedule",
+    "SwitchingOperation",
+])
@@ -64,4 +64,5 @@ class CurrentRelay(ProtectionEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class FaultIndicator(Equipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from CIM14.Element import RefList
 
 class ProtectionEquipment(Equipment):
     """An electrical device designed to respond to input conditions in a prescribed manner and after specified conditions are met to cause contact operation or similar abrupt change in associated electric control circuits, or simply to display the detected condition. Protection equipment are associated with conducting equipment and usually operate circuit breakers.
@@ -52,8 +53,8 @@ class ProtectionEquipment(Equipment):
         self._Unit = None
         self.Unit = Unit
 
-        self._ConductingEquipments = []
-        self.ConductingEquipments = [] if ConductingEquipments is None else ConductingEquipments
+        if ConductingEquipments is not None:
+            self.ConductingEquipments = ConductingEquipments
 
         super(ProtectionEquipment, self).__init__(*args, **kw_args)
 
@@ -63,6 +64,7 @@ class ProtectionEquipment(Equipment):
     _enums = {}
     _refs = ["ProtectedSwitches", "Unit", "ConductingEquipments"]
     _many_refs = ["ProtectedSwitches", "ConductingEquipments"]
+    _inverses = {"Unit": "ProtectionEquipments", "ConductingEquipments": "ProtectionEquipments"}
 
     def add_ProtectedSwitches(self, *ProtectedSwitches):
         for obj in ProtectedSwitches:
@@ -79,13 +81,12 @@ class ProtectionEquipment(Equipment):
 
     def setUnit(self, value):
         if self._Unit is not None:
-            filtered = [x for x in self.Unit.ProtectionEquipments if x != self]
-            self._Unit._ProtectionEquipments = filtered
+            self._Unit._ProtectionEquipments.discard(self)
 
         self._Unit = value
         if self._Unit is not None:
             if self not in self._Unit._ProtectionEquipments:
-                self._Unit._ProtectionEquipments.append(self)
+                self._Unit._reflist("_ProtectionEquipments").append(self)
 
     Unit = property(getUnit, setUnit)
 
@@ -96,20 +97,19 @@ class ProtectionEquipment(Equipment):
 
     def setConductingEquipments(self, value):
         for p in self._ConductingEquipments:
-            filtered = [q for q in p.ProtectionEquipments if q != self]
-            self._ConductingEquipments._ProtectionEquipments = filtered
+            p._ProtectionEquipments.discard(self)
         for r in value:
             if self not in r._ProtectionEquipments:
-                r._ProtectionEquipments.append(self)
-        self._ConductingEquipments = value
+                r._reflist("_ProtectionEquipments").append(self)
+        self._ConductingEquipments = RefList(value)
 
     ConductingEquipments = property(getConductingEquipments, setConductingEquipments)
 
     def addConductingEquipments(self, *ConductingEquipments):
         for obj in ConductingEquipments:
             if self not in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.append(self)
-            self._ConductingEquipments.append(obj)
+                obj._reflist("_ProtectionEquipments").append(self)
+            self._reflist("_ConductingEquipments").append(obj)
 
     def removeConductingEquipments(self, *ConductingEquipments):
         for obj in ConductingEquipments:
@@ -48,6 +48,7 @@ class RecloseSequence(IdentifiedObject):
     _enums = {}
     _refs = ["ProtectedSwitch"]
     _many_refs = []
+    _inverses = {"ProtectedSwitch": "RecloseSequences"}
 
     def getProtectedSwitch(self):
         """A breaker may have zero or more automatic reclosures after a trip occurs.
@@ -56,13 +57,12 @@ class RecloseSequence(IdentifiedObject):
 
     def setProtectedSwitch(self, value):
         if self._ProtectedSwitch is not None:
-            filtered = [x for x in self.ProtectedSwitch.RecloseSequences if x != self]
-            self._ProtectedSwitch._RecloseSequences = filtered
+            self._ProtectedSwitch._RecloseSequences.discard(self)
 
         self._ProtectedSwitch = value
         if self._ProtectedSwitch is not None:
             if self not in self._ProtectedSwitch._RecloseSequences:
-                self._ProtectedSwitch._RecloseSequences.append(self)
+                self._ProtectedSwitch._reflist("_RecloseSequences").append(self)
 
     ProtectedSwitch = property(getProtectedSwitch, setProtectedSwitch)
 
@@ -36,4 +36,5 @@ class SurgeProtector(Equipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
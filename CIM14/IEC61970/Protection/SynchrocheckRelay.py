@@ -48,4 +48,5 @@ class SynchrocheckRelay(ProtectionEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
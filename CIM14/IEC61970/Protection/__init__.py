@@ -21,13 +21,18 @@
 """An extension to the Core and Wires packages that models information for protection equipment such as relays. These entities are used within training simulators and distribution network fault location applications.
 """
 
-from CIM14.IEC61970.Protection.RecloseSequence import RecloseSequence
-from CIM14.IEC61970.Protection.ProtectionEquipment import ProtectionEquipment
-from CIM14.IEC61970.Protection.CurrentRelay import CurrentRelay
-from CIM14.IEC61970.Protection.SurgeProtector import SurgeProtector
-from CIM14.IEC61970.Protection.FaultIndicator import FaultIndicator
-from CIM14.IEC61970.Protection.SynchrocheckRelay import SynchrocheckRelay
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Protection"
 nsPrefix = "cimProtection"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "RecloseSequence",
+    "ProtectionEquipment",
+    "CurrentRelay",
+    "SurgeProtector",
+    "FaultIndicator",
+    "SynchrocheckRelay",
+])
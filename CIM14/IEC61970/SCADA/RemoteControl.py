@@ -52,6 +52,7 @@ class RemoteControl(RemotePoint):
     _enums = {}
     _refs = ["Control"]
     _many_refs = []
+    _inverses = {"Control": "RemoteControl"}
 
     def getControl(self):
         """The Control for the RemoteControl point.
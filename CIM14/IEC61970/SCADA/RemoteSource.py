@@ -56,6 +56,7 @@ class RemoteSource(RemotePoint):
     _enums = {}
     _refs = ["MeasurementValue"]
     _many_refs = []
+    _inverses = {"MeasurementValue": "RemoteSource"}
 
     def getMeasurementValue(self):
         """Link to the physical telemetered point associated with this measurement.
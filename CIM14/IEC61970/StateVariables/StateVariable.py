@@ -36,4 +36,5 @@ class StateVariable(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -44,6 +44,7 @@ class SvStatus(StateVariable):
     _enums = {}
     _refs = ["ConductingEquipment"]
     _many_refs = []
+    _inverses = {"ConductingEquipment": "SvStatus"}
 
     def getConductingEquipment(self):
         """The conducting equipment associated with the status state.
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class TopologicalIsland(IdentifiedObject):
     """An electrically connected subset of the network. Topological islands can change as the current network state changes (i.e. switch or Terminal.connected status changes).
@@ -30,8 +31,8 @@ class TopologicalIsland(IdentifiedObject):
         @param TopologicalNodes: A topological node belongs to a topological island
         @param AngleRef_TopologicalNode: The angle reference for the island.   Normally there is one TopologicalNode that is selected as the angle reference for each island.   Other reference schemes exist, so the association is optional.
         """
-        self._TopologicalNodes = []
-        self.TopologicalNodes = [] if TopologicalNodes is None else TopologicalNodes
+        if TopologicalNodes is not None:
+            self.TopologicalNodes = TopologicalNodes
 
         self._AngleRef_TopologicalNode = None
         self.AngleRef_TopologicalNode = AngleRef_TopologicalNode
@@ -44,6 +45,7 @@ class TopologicalIsland(IdentifiedObject):
     _enums = {}
     _refs = ["TopologicalNodes", "AngleRef_TopologicalNode"]
     _many_refs = ["TopologicalNodes"]
+    _inverses = {"TopologicalNodes": "TopologicalIsland", "AngleRef_TopologicalNode": "AngleRef_TopologicalIsland"}
 
     def getTopologicalNodes(self):
         """A topological node belongs to a topological island
@@ -51,7 +53,8 @@ class TopologicalIsland(IdentifiedObject):
         return self._TopologicalNodes
 
     def setTopologicalNodes(self, value):
-        for x in self._TopologicalNodes:
+        value = RefList(value)
+        for x in list(self._TopologicalNodes):
             x.TopologicalIsland = None
         for y in value:
             y._TopologicalIsland = self
@@ -21,16 +21,21 @@
 """State variables for analysis solutions such as powerflow.
 """
 
-from CIM14.IEC61970.StateVariables.TopologicalIsland import TopologicalIsland
-from CIM14.IEC61970.StateVariables.StateVariable import StateVariable
-from CIM14.IEC61970.StateVariables.SvVoltage import SvVoltage
-from CIM14.IEC61970.StateVariables.SvShortCircuit import SvShortCircuit
-from CIM14.IEC61970.StateVariables.SvShuntCompensatorSections import SvShuntCompensatorSections
-from CIM14.IEC61970.StateVariables.SvPowerFlow import SvPowerFlow
-from CIM14.IEC61970.StateVariables.SvStatus import SvStatus
-from CIM14.IEC61970.StateVariables.SvTapStep import SvTapStep
-from CIM14.IEC61970.StateVariables.SvInjection import SvInjection
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#StateVariables"
 nsPrefix = "cimStateVariables"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "TopologicalIsland",
+    "StateVariable",
+    "SvVoltage",
+    "SvShortCircuit",
+    "SvShuntCompensatorSections",
+    "SvPowerFlow",
+    "SvStatus",
+    "SvTapStep",
+    "SvInjection",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM14.Element import RefList
 
 class BusNameMarker(IdentifiedObject):
     """Used to apply user standard names to topology buses. Typically used for 'bus/branch' case generation. Associated with one or more ConnectivityNodes that are normally a part of the bus name.    The associated ConnectivityNodes are to be connected by non-retained switches. For a ring bus station configuration, all busbar connectivity nodes in the ring are typically associated.   For a breaker and a half scheme, both busbars would be associated.  For a ring bus, all busbars would be associated.  For a 'straight' busbar configuration, only the main connectivity node at the busbar would be associated.
@@ -33,8 +34,8 @@ class BusNameMarker(IdentifiedObject):
         self._ReportingGroup = None
         self.ReportingGroup = ReportingGroup
 
-        self._ConnectivityNode = []
-        self.ConnectivityNode = [] if ConnectivityNode is None else ConnectivityNode
+        if ConnectivityNode is not None:
+            self.ConnectivityNode = ConnectivityNode
 
         super(BusNameMarker, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class BusNameMarker(IdentifiedObject):
     _enums = {}
     _refs = ["ReportingGroup", "ConnectivityNode"]
     _many_refs = ["ConnectivityNode"]
+    _inverses = {"ReportingGroup": "BusNameMarker", "ConnectivityNode": "BusNameMarker"}
 
     def getReportingGroup(self):
         """The reporting group to which this BusNameMarker belongs.
@@ -52,13 +54,12 @@ class BusNameMarker(IdentifiedObject):
 
     def setReportingGroup(self, value):
         if self._ReportingGroup is not None:
-            filtered = [x for x in self.ReportingGroup.BusNameMarker if x != self]
-            self._ReportingGroup._BusNameMarker = filtered
+            self._ReportingGroup._BusNameMarker.discard(self)
 
         self._ReportingGroup = value
         if self._ReportingGroup is not None:
             if self not in self._ReportingGroup._BusNameMarker:
-                self._ReportingGroup._BusNameMarker.append(self)
+                self._ReportingGroup._reflist("_BusNameMarker").append(self)
 
     ReportingGroup = property(getReportingGroup, setReportingGroup)
 
@@ -68,7 +69,8 @@ class BusNameMarker(IdentifiedObject):
         return self._ConnectivityNode
 
     def setConnectivityNode(self, value):
-        for x in self._ConnectivityNode:
+        value = RefList(value)
+        for x in list(self._ConnectivityNode):
             x.BusNameMarker = None
         for y in value:
             y._BusNameMarker = self
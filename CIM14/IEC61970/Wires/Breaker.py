@@ -44,4 +44,5 @@ class Breaker(ProtectedSwitch):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
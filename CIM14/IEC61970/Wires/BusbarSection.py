@@ -40,6 +40,7 @@ class BusbarSection(Connector):
     _enums = {}
     _refs = ["VoltageControlZone"]
     _many_refs = []
+    _inverses = {"VoltageControlZone": "BusbarSection"}
 
     def getVoltageControlZone(self):
         """A VoltageControlZone is controlled by a designated BusbarSection.
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from CIM14.Element import RefList
 
 class CompositeSwitch(Equipment):
     """A model of a set of individual Switches normally enclosed within the same cabinet and possibly with interlocks that restrict the combination of switch positions. These are typically found in medium voltage distribution networks.  A CompositeSwitch could represent a Ring-Main-Unit (RMU), or pad-mounted switchgear, with primitive internal devices such as an internal bus-bar plus 3 or 4 internal switches each of which may individually be open or closed. A CompositeSwitch and a set of contained Switches can also be used to represent a multi-position switch e.g. a switch that can connect a circuit to Ground, Open or Busbar.
@@ -33,8 +34,8 @@ class CompositeSwitch(Equipment):
         #: An alphanumeric code that can be used as a reference to extar information such as the description of the interlocking scheme if any
         self.compositeSwitchType = compositeSwitchType
 
-        self._Switches = []
-        self.Switches = [] if Switches is None else Switches
+        if Switches is not None:
+            self.Switches = Switches
 
         super(CompositeSwitch, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class CompositeSwitch(Equipment):
     _enums = {}
     _refs = ["Switches"]
     _many_refs = ["Switches"]
+    _inverses = {"Switches": "CompositeSwitch"}
 
     def getSwitches(self):
         """Switches contained in this Composite switch.
@@ -51,7 +53,8 @@ class CompositeSwitch(Equipment):
         return self._Switches
 
     def setSwitches(self, value):
-        for x in self._Switches:
+        value = RefList(value)
+        for x in list(self._Switches):
             x.CompositeSwitch = None
         for y in value:
             y._CompositeSwitch = self
@@ -36,4 +36,5 @@ class Connector(ConductingEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -44,4 +44,5 @@ class DCLineSegment(Conductor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
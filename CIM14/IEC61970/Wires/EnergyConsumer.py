@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM14.Element import RefList
 
 class EnergyConsumer(ConductingEquipment):
     """Generic user of energy - a  point of consumption on the power system model
@@ -52,14 +53,14 @@ class EnergyConsumer(ConductingEquipment):
         #: Reactive power of the load that is a fixed quantity.
         self.qfixed = qfixed
 
-        self._aggregateLoad0 = []
-        self.aggregateLoad0 = [] if aggregateLoad0 is None else aggregateLoad0
+        if aggregateLoad0 is not None:
+            self.aggregateLoad0 = aggregateLoad0
 
         self._PowerCutZone = None
         self.PowerCutZone = PowerCutZone
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         self._LoadResponse = None
         self.LoadResponse = LoadResponse
@@ -72,6 +73,7 @@ class EnergyConsumer(ConductingEquipment):
     _enums = {}
     _refs = ["aggregateLoad0", "PowerCutZone", "ServiceDeliveryPoints", "LoadResponse"]
     _many_refs = ["aggregateLoad0", "ServiceDeliveryPoints"]
+    _inverses = {"aggregateLoad0": "energyConsumer0", "PowerCutZone": "EnergyConsumers", "ServiceDeliveryPoints": "EnergyConsumer", "LoadResponse": "EnergyConsumer"}
 
     def getaggregateLoad0(self):
         
@@ -79,20 +81,19 @@ class EnergyConsumer(ConductingEquipment):
 
     def setaggregateLoad0(self, value):
         for p in self._aggregateLoad0:
-            filtered = [q for q in p.energyConsumer0 if q != self]
-            self._aggregateLoad0._energyConsumer0 = filtered
+            p._energyConsumer0.discard(self)
         for r in value:
             if self not in r._energyConsumer0:
-                r._energyConsumer0.append(self)
-        self._aggregateLoad0 = value
+                r._reflist("_energyConsumer0").append(self)
+        self._aggregateLoad0 = RefList(value)
 
     aggregateLoad0 = property(getaggregateLoad0, setaggregateLoad0)
 
     def addaggregateLoad0(self, *aggregateLoad0):
         for obj in aggregateLoad0:
             if self not in obj._energyConsumer0:
-                obj._energyConsumer0.append(self)
-            self._aggregateLoad0.append(obj)
+                obj._reflist("_energyConsumer0").append(self)
+            self._reflist("_aggregateLoad0").append(obj)
 
     def removeaggregateLoad0(self, *aggregateLoad0):
         for obj in aggregateLoad0:
@@ -107,13 +108,12 @@ class EnergyConsumer(ConductingEquipment):
 
     def setPowerCutZone(self, value):
         if self._PowerCutZone is not None:
-            filtered = [x for x in self.PowerCutZone.EnergyConsumers if x != self]
-            self._PowerCutZone._EnergyConsumers = filtered
+            self._PowerCutZone._EnergyConsumers.discard(self)
 
         self._PowerCutZone = value
         if self._PowerCutZone is not None:
             if self not in self._PowerCutZone._EnergyConsumers:
-                self._PowerCutZone._EnergyConsumers.append(self)
+                self._PowerCutZone._reflist("_EnergyConsumers").append(self)
 
     PowerCutZone = property(getPowerCutZone, setPowerCutZone)
 
@@ -122,7 +122,8 @@ class EnergyConsumer(ConductingEquipment):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
-        for x in self._ServiceDeliveryPoints:
+        value = RefList(value)
+        for x in list(self._ServiceDeliveryPoints):
             x.EnergyConsumer = None
         for y in value:
             y._EnergyConsumer = self
@@ -145,13 +146,12 @@ class EnergyConsumer(ConductingEquipment):
 
     def setLoadResponse(self, value):
         if self._LoadResponse is not None:
-            filtered = [x for x in self.LoadResponse.EnergyConsumer if x != self]
-            self._LoadResponse._EnergyConsumer = filtered
+            self._LoadResponse._EnergyConsumer.discard(self)
 
         self._LoadResponse = value
         if self._LoadResponse is not None:
             if self not in self._LoadResponse._EnergyConsumer:
-                self._LoadResponse._EnergyConsumer.append(self)
+                self._LoadResponse._reflist("_EnergyConsumer").append(self)
 
     LoadResponse = property(getLoadResponse, setLoadResponse)
 
@@ -40,6 +40,7 @@ class HeatExchanger(Equipment):
     _enums = {}
     _refs = ["PowerTransformer"]
     _many_refs = []
+    _inverses = {"PowerTransformer": "HeatExchanger"}
 
     def getPowerTransformer(self):
         """A transformer may have a heat exchanger
@@ -40,6 +40,7 @@ class ImpedanceVariationCurve(Curve):
     _enums = {}
     _refs = ["TapChanger"]
     _many_refs = []
+    _inverses = {"TapChanger": "ImpedanceVariationCurve"}
 
     def getTapChanger(self):
         """An ImpedanceVariationCurve is defines impedance changes for a TapChanger.
@@ -40,6 +40,7 @@ class Line(EquipmentContainer):
     _enums = {}
     _refs = ["Region"]
     _many_refs = []
+    _inverses = {"Region": "Lines"}
 
     def getRegion(self):
         """A Line can be contained by a SubGeographical Region.
@@ -48,13 +49,12 @@ class Line(EquipmentContainer):
 
     def setRegion(self, value):
         if self._Region is not None:
-            filtered = [x for x in self.Region.Lines if x != self]
-            self._Region._Lines = filtered
+            self._Region._Lines.discard(self)
 
         self._Region = value
         if self._Region is not None:
             if self not in self._Region._Lines:
-                self._Region._Lines.append(self)
+                self._Region._reflist("_Lines").append(self)
 
     Region = property(getRegion, setRegion)
 
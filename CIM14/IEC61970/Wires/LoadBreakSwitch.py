@@ -40,4 +40,5 @@ class LoadBreakSwitch(ProtectedSwitch):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -76,6 +76,7 @@ class PhaseTapChanger(TapChanger):
     _enums = {"phaseTapChangerType": "PhaseTapChangerKind"}
     _refs = ["PhaseVariationCurve", "Winding", "TransformerWinding"]
     _many_refs = []
+    _inverses = {"PhaseVariationCurve": "PhaseTapChanger", "Winding": "PhaseTapChanger", "TransformerWinding": "PhaseTapChanger"}
 
     def getPhaseVariationCurve(self):
         """A PhaseTapChanger can have an associated PhaseVariationCurve to define phase shift variations with tap step changes.
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Equipment import Equipment
+from CIM14.Element import RefList
 
 class PowerTransformer(Equipment):
     """An electrical device consisting of  two or more coupled windings, with or without a magnetic core, for introducing mutual coupling between electric circuits. Transformers can be used to control voltage and phase shift (active power flow).
@@ -42,8 +43,8 @@ class PowerTransformer(Equipment):
         #: Core shunt magnetizing susceptance in the saturation region.
         self.bmagSat = bmagSat
 
-        self._TransformerWindings = []
-        self.TransformerWindings = [] if TransformerWindings is None else TransformerWindings
+        if TransformerWindings is not None:
+            self.TransformerWindings = TransformerWindings
 
         self._HeatExchanger = None
         self.HeatExchanger = HeatExchanger
@@ -56,6 +57,7 @@ class PowerTransformer(Equipment):
     _enums = {}
     _refs = ["TransformerWindings", "HeatExchanger"]
     _many_refs = ["TransformerWindings"]
+    _inverses = {"TransformerWindings": "PowerTransformer", "HeatExchanger": "PowerTransformer"}
 
     def getTransformerWindings(self):
         """A transformer has windings
@@ -63,7 +65,8 @@ class PowerTransformer(Equipment):
         return self._TransformerWindings
 
     def setTransformerWindings(self, value):
-        for x in self._TransformerWindings:
+        value = RefList(value)
+        for x in list(self._TransformerWindings):
             x.PowerTransformer = None
         for y in value:
             y._PowerTransformer = self
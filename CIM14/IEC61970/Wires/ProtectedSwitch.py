@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Wires.Switch import Switch
+from CIM14.Element import RefList
 
 class ProtectedSwitch(Switch):
     """A ProtectedSwitch is a switching device that can be operated by ProtectionEquipment.
@@ -29,8 +30,8 @@ class ProtectedSwitch(Switch):
 
         @param RecloseSequences: A breaker may have zero or more automatic reclosures after a trip occurs.
         """
-        self._RecloseSequences = []
-        self.RecloseSequences = [] if RecloseSequences is None else RecloseSequences
+        if RecloseSequences is not None:
+            self.RecloseSequences = RecloseSequences
 
         super(ProtectedSwitch, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class ProtectedSwitch(Switch):
     _enums = {}
     _refs = ["RecloseSequences"]
     _many_refs = ["RecloseSequences"]
+    _inverses = {"RecloseSequences": "ProtectedSwitch"}
 
     def getRecloseSequences(self):
         """A breaker may have zero or more automatic reclosures after a trip occurs.
@@ -47,7 +49,8 @@ class ProtectedSwitch(Switch):
         return self._RecloseSequences
 
     def setRecloseSequences(self, value):
-        for x in self._RecloseSequences:
+        value = RefList(value)
+        for x in list(self._RecloseSequences):
             x.ProtectedSwitch = None
         for y in value:
             y._ProtectedSwitch = self
@@ -52,6 +52,7 @@ class RatioTapChanger(TapChanger):
     _enums = {"tculControlMode": "TransformerControlMode"}
     _refs = ["Winding", "TransformerWinding", "RatioVariationCurve"]
     _many_refs = []
+    _inverses = {"Winding": "RatioTapChanger", "TransformerWinding": "RatioTapChanger", "RatioVariationCurve": "RatioTapChanger"}
 
     def getWinding(self):
         """Winding to which this ratio tap changer belongs.
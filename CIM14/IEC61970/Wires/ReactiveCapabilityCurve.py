@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.Curve import Curve
+from CIM14.Element import RefList
 
 class ReactiveCapabilityCurve(Curve):
     """Reactive power rating envelope versus the synchronous machine's active power, in both the generating and motoring modes. For each active power value there is a corresponding high and low reactive power limit  value. Typically there will be a separate curve for each coolant condition, such as hydrogen pressure.  The Y1 axis values represent reactive minimum and the Y2 axis values represent reactive maximum.
@@ -38,11 +39,11 @@ class ReactiveCapabilityCurve(Curve):
         #: The hydrogen coolant pressure
         self.hydrogenPressure = hydrogenPressure
 
-        self._InitiallyUsedBySynchronousMachines = []
-        self.InitiallyUsedBySynchronousMachines = [] if InitiallyUsedBySynchronousMachines is None else InitiallyUsedBySynchronousMachines
+        if InitiallyUsedBySynchronousMachines is not None:
+            self.InitiallyUsedBySynchronousMachines = InitiallyUsedBySynchronousMachines
 
-        self._SynchronousMachines = []
-        self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
+        if SynchronousMachines is not None:
+            self.SynchronousMachines = SynchronousMachines
 
         super(ReactiveCapabilityCurve, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class ReactiveCapabilityCurve(Curve):
     _enums = {}
     _refs = ["InitiallyUsedBySynchronousMachines", "SynchronousMachines"]
     _many_refs = ["InitiallyUsedBySynchronousMachines", "SynchronousMachines"]
+    _inverses = {"InitiallyUsedBySynchronousMachines": "InitialReactiveCapabilityCurve", "SynchronousMachines": "ReactiveCapabilityCurves"}
 
     def getInitiallyUsedBySynchronousMachines(self):
         """Synchronous machines using this curve as default.
@@ -59,7 +61,8 @@ class ReactiveCapabilityCurve(Curve):
         return self._InitiallyUsedBySynchronousMachines
 
     def setInitiallyUsedBySynchronousMachines(self, value):
-        for x in self._InitiallyUsedBySynchronousMachines:
+        value = RefList(value)
+        for x in list(self._InitiallyUsedBySynchronousMachines):
             x.InitialReactiveCapabilityCurve = None
         for y in value:
             y._InitialReactiveCapabilityCurve = self
@@ -82,20 +85,19 @@ class ReactiveCapabilityCurve(Curve):
 
     def setSynchronousMachines(self, value):
         for p in self._SynchronousMachines:
-            filtered = [q for q in p.ReactiveCapabilityCurves if q != self]
-            self._SynchronousMachines._ReactiveCapabilityCurves = filtered
+            p._ReactiveCapabilityCurves.discard(self)
         for r in value:
             if self not in r._ReactiveCapabilityCurves:
-                r._ReactiveCapabilityCurves.append(self)
-        self._SynchronousMachines = value
+                r._reflist("_ReactiveCapabilityCurves").append(self)
+        self._SynchronousMachines = RefList(value)
 
     SynchronousMachines = property(getSynchronousMachines, setSynchronousMachines)
 
     def addSynchronousMachines(self, *SynchronousMachines):
         for obj in SynchronousMachines:
             if self not in obj._ReactiveCapabilityCurves:
-                obj._ReactiveCapabilityCurves.append(self)
-            self._SynchronousMachines.append(obj)
+                obj._reflist("_ReactiveCapabilityCurves").append(self)
+            self._reflist("_SynchronousMachines").append(obj)
 
     def removeSynchronousMachines(self, *SynchronousMachines):
         for obj in SynchronousMachines:
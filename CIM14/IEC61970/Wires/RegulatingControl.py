@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import RefList
 
 class RegulatingControl(PowerSystemResource):
     """Specifies a set of equipment that works together to control a power system quantity such as voltage or flow.
@@ -48,17 +49,17 @@ class RegulatingControl(PowerSystemResource):
         #: The target value specified for case input.   This value can be used for the target value wihout the use of schedules. The value has the units appropriate to the mode attribute.
         self.targetValue = targetValue
 
-        self._RegulationSchedule = []
-        self.RegulationSchedule = [] if RegulationSchedule is None else RegulationSchedule
+        if RegulationSchedule is not None:
+            self.RegulationSchedule = RegulationSchedule
 
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._TapChanger = []
-        self.TapChanger = [] if TapChanger is None else TapChanger
+        if TapChanger is not None:
+            self.TapChanger = TapChanger
 
-        self._RegulatingCondEq = []
-        self.RegulatingCondEq = [] if RegulatingCondEq is None else RegulatingCondEq
+        if RegulatingCondEq is not None:
+            self.RegulatingCondEq = RegulatingCondEq
 
         super(RegulatingControl, self).__init__(*args, **kw_args)
 
@@ -68,6 +69,7 @@ class RegulatingControl(PowerSystemResource):
     _enums = {"mode": "RegulatingControlModeKind"}
     _refs = ["RegulationSchedule", "Terminal", "TapChanger", "RegulatingCondEq"]
     _many_refs = ["RegulationSchedule", "TapChanger", "RegulatingCondEq"]
+    _inverses = {"RegulationSchedule": "RegulatingControl", "Terminal": "RegulatingControl", "TapChanger": "RegulatingControl", "RegulatingCondEq": "RegulatingControl"}
 
     def getRegulationSchedule(self):
         """Schedule for this Regulating regulating control.
@@ -75,7 +77,8 @@ class RegulatingControl(PowerSystemResource):
         return self._RegulationSchedule
 
     def setRegulationSchedule(self, value):
-        for x in self._RegulationSchedule:
+        value = RefList(value)
+        for x in list(self._RegulationSchedule):
             x.RegulatingControl = None
         for y in value:
             y._RegulatingControl = self
@@ -98,13 +101,12 @@ class RegulatingControl(PowerSystemResource):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.RegulatingControl if x != self]
-            self._Terminal._RegulatingControl = filtered
+            self._Terminal._RegulatingControl.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._RegulatingControl:
-                self._Terminal._RegulatingControl.append(self)
+                self._Terminal._reflist("_RegulatingControl").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -114,7 +116,8 @@ class RegulatingControl(PowerSystemResource):
         return self._TapChanger
 
     def setTapChanger(self, value):
-        for x in self._TapChanger:
+        value = RefList(value)
+        for x in list(self._TapChanger):
             x.RegulatingControl = None
         for y in value:
             y._RegulatingControl = self
@@ -136,7 +139,8 @@ class RegulatingControl(PowerSystemResource):
         return self._RegulatingCondEq
 
     def setRegulatingCondEq(self, value):
-        for x in self._RegulatingCondEq:
+        value = RefList(value)
+        for x in list(self._RegulatingCondEq):
             x.RegulatingControl = None
         for y in value:
             y._RegulatingControl = self
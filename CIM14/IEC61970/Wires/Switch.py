@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM14.Element import RefList
 
 class Switch(ConductingEquipment):
     """A generic device designed to close, or open, or both, one or more electric circuits.
@@ -48,17 +49,17 @@ class Switch(ConductingEquipment):
         #: The attribute is used in cases when no Measurement for the status value is present. If the Switch has a status measurment the Discrete.normalValue is expected to match with the Switch.normalOpen.
         self.normalOpen = normalOpen
 
-        self._SwitchingOperations = []
-        self.SwitchingOperations = [] if SwitchingOperations is None else SwitchingOperations
+        if SwitchingOperations is not None:
+            self.SwitchingOperations = SwitchingOperations
 
         self._CompositeSwitch = None
         self.CompositeSwitch = CompositeSwitch
 
-        self._ConnectDisconnectFunctions = []
-        self.ConnectDisconnectFunctions = [] if ConnectDisconnectFunctions is None else ConnectDisconnectFunctions
+        if ConnectDisconnectFunctions is not None:
+            self.ConnectDisconnectFunctions = ConnectDisconnectFunctions
 
-        self._SwitchSchedules = []
-        self.SwitchSchedules = [] if SwitchSchedules is None else SwitchSchedules
+        if SwitchSchedules is not None:
+            self.SwitchSchedules = SwitchSchedules
 
         super(Switch, self).__init__(*args, **kw_args)
 
@@ -68,6 +69,7 @@ class Switch(ConductingEquipment):
     _enums = {}
     _refs = ["SwitchingOperations", "CompositeSwitch", "ConnectDisconnectFunctions", "SwitchSchedules"]
     _many_refs = ["SwitchingOperations", "ConnectDisconnectFunctions", "SwitchSchedules"]
+    _inverses = {"SwitchingOperations": "Switches", "CompositeSwitch": "Switches", "ConnectDisconnectFunctions": "Switches", "SwitchSchedules": "Switch"}
 
     def getSwitchingOperations(self):
         """A switch may be operated by many schedules.
@@ -76,20 +78,19 @@ class Switch(ConductingEquipment):
 
     def setSwitchingOperations(self, value):
         for p in self._SwitchingOperations:
-            filtered = [q for q in p.Switches if q != self]
-            self._SwitchingOperations._Switches = filtered
+            p._Switches.discard(self)
         for r in value:
             if self not in r._Switches:
-                r._Switches.append(self)
-        self._SwitchingOperations = value
+                r._reflist("_Switches").append(self)
+        self._SwitchingOperations = RefList(value)
 
     SwitchingOperations = property(getSwitchingOperations, setSwitchingOperations)
 
     def addSwitchingOperations(self, *SwitchingOperations):
         for obj in SwitchingOperations:
             if self not in obj._Switches:
-                obj._Switches.append(self)
-            self._SwitchingOperations.append(obj)
+                obj._reflist("_Switches").append(self)
+            self._reflist("_SwitchingOperations").append(obj)
 
     def removeSwitchingOperations(self, *SwitchingOperations):
         for obj in SwitchingOperations:
@@ -104,13 +105,12 @@ class Switch(ConductingEquipment):
 
     def setCompositeSwitch(self, value):
         if self._CompositeSwitch is not None:
-            filtered = [x for x in self.CompositeSwitch.Switches if x != self]
-            self._CompositeSwitch._Switches = filtered
+            self._CompositeSwitch._Switches.discard(self)
 
         self._CompositeSwitch = value
         if self._CompositeSwitch is not None:
             if self not in self._CompositeSwitch._Switches:
-                self._CompositeSwitch._Switches.append(self)
+                self._CompositeSwitch._reflist("_Switches").append(self)
 
     CompositeSwitch = property(getCompositeSwitch, setCompositeSwitch)
 
@@ -120,20 +120,19 @@ class Switch(ConductingEquipment):
 
     def setConnectDisconnectFunctions(self, value):
         for p in self._ConnectDisconnectFunctions:
-            filtered = [q for q in p.Switches if q != self]
-            self._ConnectDisconnectFunctions._Switches = filtered
+            p._Switches.discard(self)
         for r in value:
             if self not in r._Switches:
-                r._Switches.append(self)
-        self._ConnectDisconnectFunctions = value
+                r._reflist("_Switches").append(self)
+        self._ConnectDisconnectFunctions = RefList(value)
 
     ConnectDisconnectFunctions = property(getConnectDisconnectFunctions, setConnectDisconnectFunctions)
 
     def addConnectDisconnectFunctions(self, *ConnectDisconnectFunctions):
         for obj in ConnectDisconnectFunctions:
             if self not in obj._Switches:
-                obj._Switches.append(self)
-            self._ConnectDisconnectFunctions.append(obj)
+                obj._reflist("_Switches").append(self)
+            self._reflist("_ConnectDisconnectFunctions").append(obj)
 
     def removeConnectDisconnectFunctions(self, *ConnectDisconnectFunctions):
         for obj in ConnectDisconnectFunctions:
@@ -147,7 +146,8 @@ class Switch(ConductingEquipment):
         return self._SwitchSchedules
 
     def setSwitchSchedules(self, value):
-        for x in self._SwitchSchedules:
+        value = RefList(value)
+        for x in list(self._SwitchSchedules):
             x.Switch = None
         for y in value:
             y._Switch = self
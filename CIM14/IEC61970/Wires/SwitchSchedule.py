@@ -40,6 +40,7 @@ class SwitchSchedule(SeasonDayTypeSchedule):
     _enums = {}
     _refs = ["Switch"]
     _many_refs = []
+    _inverses = {"Switch": "SwitchSchedules"}
 
     def getSwitch(self):
         """A SwitchSchedule is associated with a Switch.
@@ -48,13 +49,12 @@ class SwitchSchedule(SeasonDayTypeSchedule):
 
     def setSwitch(self, value):
         if self._Switch is not None:
-            filtered = [x for x in self.Switch.SwitchSchedules if x != self]
-            self._Switch._SwitchSchedules = filtered
+            self._Switch._SwitchSchedules.discard(self)
 
         self._Switch = value
         if self._Switch is not None:
             if self not in self._Switch._SwitchSchedules:
-                self._Switch._SwitchSchedules.append(self)
+                self._Switch._reflist("_SwitchSchedules").append(self)
 
     Switch = property(getSwitch, setSwitch)
 
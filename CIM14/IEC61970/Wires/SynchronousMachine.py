@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Dynamics.RotatingMachine import RotatingMachine
+from CIM14.Element import RefList
 
 class SynchronousMachine(RotatingMachine):
     """An electromechanical device that operates synchronously with the network. It is a single machine operating either as a generator or synchronous condenser or pump.
@@ -152,8 +153,8 @@ class SynchronousMachine(RotatingMachine):
         #: Direct-axis subtransient reactance, also known as X'd.
         self.xDirectSubtrans = xDirectSubtrans
 
-        self._genLoad0 = []
-        self.genLoad0 = [] if genLoad0 is None else genLoad0
+        if genLoad0 is not None:
+            self.genLoad0 = genLoad0
 
         self._HydroPump = None
         self.HydroPump = HydroPump
@@ -161,20 +162,20 @@ class SynchronousMachine(RotatingMachine):
         self._GeneratingUnit = None
         self.GeneratingUnit = GeneratingUnit
 
-        self._govHydro10 = []
-        self.govHydro10 = [] if govHydro10 is None else govHydro10
+        if govHydro10 is not None:
+            self.govHydro10 = govHydro10
 
-        self._PrimeMovers = []
-        self.PrimeMovers = [] if PrimeMovers is None else PrimeMovers
+        if PrimeMovers is not None:
+            self.PrimeMovers = PrimeMovers
 
         self._InitialReactiveCapabilityCurve = None
         self.InitialReactiveCapabilityCurve = InitialReactiveCapabilityCurve
 
-        self._genEquiv0 = []
-        self.genEquiv0 = [] if genEquiv0 is None else genEquiv0
+        if genEquiv0 is not None:
+            self.genEquiv0 = genEquiv0
 
-        self._ReactiveCapabilityCurves = []
-        self.ReactiveCapabilityCurves = [] if ReactiveCapabilityCurves is None else ReactiveCapabilityCurves
+        if ReactiveCapabilityCurves is not None:
+            self.ReactiveCapabilityCurves = ReactiveCapabilityCurves
 
         super(SynchronousMachine, self).__init__(*args, **kw_args)
 
@@ -184,6 +185,7 @@ class SynchronousMachine(RotatingMachine):
     _enums = {"operatingMode": "SynchronousMachineOperatingMode", "type": "SynchronousMachineType", "coolantType": "CoolantType"}
     _refs = ["genLoad0", "HydroPump", "GeneratingUnit", "govHydro10", "PrimeMovers", "InitialReactiveCapabilityCurve", "genEquiv0", "ReactiveCapabilityCurves"]
     _many_refs = ["genLoad0", "govHydro10", "PrimeMovers", "genEquiv0", "ReactiveCapabilityCurves"]
+    _inverses = {"genLoad0": "synchronousMachine0", "HydroPump": "SynchronousMachine", "GeneratingUnit": "SynchronousMachines", "govHydro10": "synchronousMachine0", "PrimeMovers": "SynchronousMachines", "InitialReactiveCapabilityCurve": "InitiallyUsedBySynchronousMachines", "genEquiv0": "synchronousMachine0", "ReactiveCapabilityCurves": "SynchronousMachines"}
 
     def getgenLoad0(self):
         
@@ -191,20 +193,19 @@ class SynchronousMachine(RotatingMachine):
 
     def setgenLoad0(self, value):
         for p in self._genLoad0:
-            filtered = [q for q in p.synchronousMachine0 if q != self]
-            self._genLoad0._synchronousMachine0 = filtered
+            p._synchronousMachine0.discard(self)
         for r in value:
             if self not in r._synchronousMachine0:
-                r._synchronousMachine0.append(self)
-        self._genLoad0 = value
+                r._reflist("_synchronousMachine0").append(self)
+        self._genLoad0 = RefList(value)
 
     genLoad0 = property(getgenLoad0, setgenLoad0)
 
     def addgenLoad0(self, *genLoad0):
         for obj in genLoad0:
             if self not in obj._synchronousMachine0:
-                obj._synchronousMachine0.append(self)
-            self._genLoad0.append(obj)
+                obj._reflist("_synchronousMachine0").append(self)
+            self._reflist("_genLoad0").append(obj)
 
     def removegenLoad0(self, *genLoad0):
         for obj in genLoad0:
@@ -235,13 +236,12 @@ class SynchronousMachine(RotatingMachine):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.SynchronousMachines if x != self]
-            self._GeneratingUnit._SynchronousMachines = filtered
+            self._GeneratingUnit._SynchronousMachines.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
             if self not in self._GeneratingUnit._SynchronousMachines:
-                self._GeneratingUnit._SynchronousMachines.append(self)
+                self._GeneratingUnit._reflist("_SynchronousMachines").append(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
@@ -251,20 +251,19 @@ class SynchronousMachine(RotatingMachine):
 
     def setgovHydro10(self, value):
         for p in self._govHydro10:
-            filtered = [q for q in p.synchronousMachine0 if q != self]
-            self._govHydro10._synchronousMachine0 = filtered
+            p._synchronousMachine0.discard(self)
         for r in value:
             if self not in r._synchronousMachine0:
-                r._synchronousMachine0.append(self)
-        self._govHydro10 = value
+                r._reflist("_synchronousMachine0").append(self)
+        self._govHydro10 = RefList(value)
 
     govHydro10 = property(getgovHydro10, setgovHydro10)
 
     def addgovHydro10(self, *govHydro10):
         for obj in govHydro10:
             if self not in obj._synchronousMachine0:
-                obj._synchronousMachine0.append(self)
-            self._govHydro10.append(obj)
+                obj._reflist("_synchronousMachine0").append(self)
+            self._reflist("_govHydro10").append(obj)
 
     def removegovHydro10(self, *govHydro10):
         for obj in govHydro10:
@@ -279,20 +278,19 @@ class SynchronousMachine(RotatingMachine):
 
     def setPrimeMovers(self, value):
         for p in self._PrimeMovers:
-            filtered = [q for q in p.SynchronousMachines if q != self]
-            self._PrimeMovers._SynchronousMachines = filtered
+            p._SynchronousMachines.discard(self)
         for r in value:
             if self not in r._SynchronousMachines:
-                r._SynchronousMachines.append(self)
-        self._PrimeMovers = value
+                r._reflist("_SynchronousMachines").append(self)
+        self._PrimeMovers = RefList(value)
 
     PrimeMovers = property(getPrimeMovers, setPrimeMovers)
 
     def addPrimeMovers(self, *PrimeMovers):
         for obj in PrimeMovers:
             if self not in obj._SynchronousMachines:
-                obj._SynchronousMachines.append(self)
-            self._PrimeMovers.append(obj)
+                obj._reflist("_SynchronousMachines").append(self)
+            self._reflist("_PrimeMovers").append(obj)
 
     def removePrimeMovers(self, *PrimeMovers):
         for obj in PrimeMovers:
@@ -307,13 +305,12 @@ class SynchronousMachine(RotatingMachine):
 
     def setInitialReactiveCapabilityCurve(self, value):
         if self._InitialReactiveCapabilityCurve is not None:
-            filtered = [x for x in self.InitialReactiveCapabilityCurve.InitiallyUsedBySynchronousMachines if x != self]
-            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines = filtered
+            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.discard(self)
 
         self._InitialReactiveCapabilityCurve = value
         if self._InitialReactiveCapabilityCurve is not None:
             if self not in self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines:
-                self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.append(self)
+                self._InitialReactiveCapabilityCurve._reflist("_InitiallyUsedBySynchronousMachines").append(self)
 
     InitialReactiveCapabilityCurve = property(getInitialReactiveCapabilityCurve, setInitialReactiveCapabilityCurve)
 
@@ -323,20 +320,19 @@ class SynchronousMachine(RotatingMachine):
 
     def setgenEquiv0(self, value):
         for p in self._genEquiv0:
-            filtered = [q for q in p.synchronousMachine0 if q != self]
-            self._genEquiv0._synchronousMachine0 = filtered
+            p._synchronousMachine0.discard(self)
         for r in value:
             if self not in r._synchronousMachine0:
-                r._synchronousMachine0.append(self)
-        self._genEquiv0 = value
+                r._reflist("_synchronousMachine0").append(self)
+        self._genEquiv0 = RefList(value)
 
     genEquiv0 = property(getgenEquiv0, setgenEquiv0)
 
     def addgenEquiv0(self, *genEquiv0):
         for obj in genEquiv0:
             if self not in obj._synchronousMachine0:
-                obj._synchronousMachine0.append(self)
-            self._genEquiv0.append(obj)
+                obj._reflist("_synchronousMachine0").append(self)
+            self._reflist("_genEquiv0").append(obj)
 
     def removegenEquiv0(self, *genEquiv0):
         for obj in genEquiv0:
@@ -351,20 +347,19 @@ class SynchronousMachine(RotatingMachine):
 
     def setReactiveCapabilityCurves(self, value):
         for p in self._ReactiveCapabilityCurves:
-            filtered = [q for q in p.SynchronousMachines if q != self]
-            self._ReactiveCapabilityCurves._SynchronousMachines = filtered
+            p._SynchronousMachines.discard(self)
         for r in value:
             if self not in r._SynchronousMachines:
-                r._SynchronousMachines.append(self)
-        self._ReactiveCapabilityCurves = value
+                r._reflist("_SynchronousMachines").append(self)
+        self._ReactiveCapabilityCurves = RefList(value)
 
     ReactiveCapabilityCurves = property(getReactiveCapabilityCurves, setReactiveCapabilityCurves)
 
     def addReactiveCapabilityCurves(self, *ReactiveCapabilityCurves):
         for obj in ReactiveCapabilityCurves:
             if self not in obj._SynchronousMachines:
-                obj._SynchronousMachines.append(self)
-            self._ReactiveCapabilityCurves.append(obj)
+                obj._reflist("_SynchronousMachines").append(self)
+            self._reflist("_ReactiveCapabilityCurves").append(obj)
 
     def removeReactiveCapabilityCurves(self, *ReactiveCapabilityCurves):
         for obj in ReactiveCapabilityCurves:
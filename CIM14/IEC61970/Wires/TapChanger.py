@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM14.Element import RefList
 
 class TapChanger(PowerSystemResource):
     """Mechanism for changing transformer winding tap positions.
@@ -78,8 +79,8 @@ class TapChanger(PowerSystemResource):
         self._ImpedanceVariationCurve = None
         self.ImpedanceVariationCurve = ImpedanceVariationCurve
 
-        self._TapSchedules = []
-        self.TapSchedules = [] if TapSchedules is None else TapSchedules
+        if TapSchedules is not None:
+            self.TapSchedules = TapSchedules
 
         self._RegulatingControl = None
         self.RegulatingControl = RegulatingControl
@@ -92,6 +93,7 @@ class TapChanger(PowerSystemResource):
     _enums = {}
     _refs = ["SvTapStep", "ImpedanceVariationCurve", "TapSchedules", "RegulatingControl"]
     _many_refs = ["TapSchedules"]
+    _inverses = {"SvTapStep": "TapChanger", "ImpedanceVariationCurve": "TapChanger", "TapSchedules": "TapChanger", "RegulatingControl": "TapChanger"}
 
     def getSvTapStep(self):
         """The tap step state associated with the tap changer.
@@ -131,7 +133,8 @@ class TapChanger(PowerSystemResource):
         return self._TapSchedules
 
     def setTapSchedules(self, value):
-        for x in self._TapSchedules:
+        value = RefList(value)
+        for x in list(self._TapSchedules):
             x.TapChanger = None
         for y in value:
             y._TapChanger = self
@@ -153,13 +156,12 @@ class TapChanger(PowerSystemResource):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.TapChanger if x != self]
-            self._RegulatingControl._TapChanger = filtered
+            self._RegulatingControl._TapChanger.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
             if self not in self._RegulatingControl._TapChanger:
-                self._RegulatingControl._TapChanger.append(self)
+                self._RegulatingControl._reflist("_TapChanger").append(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
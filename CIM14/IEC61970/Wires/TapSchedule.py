@@ -52,6 +52,7 @@ class TapSchedule(SeasonDayTypeSchedule):
     _enums = {}
     _refs = ["TapChanger"]
     _many_refs = []
+    _inverses = {"TapChanger": "TapSchedules"}
 
     def getTapChanger(self):
         """A TapSchedule is associated with a TapChanger.
@@ -60,13 +61,12 @@ class TapSchedule(SeasonDayTypeSchedule):
 
     def setTapChanger(self, value):
         if self._TapChanger is not None:
-            filtered = [x for x in self.TapChanger.TapSchedules if x != self]
-            self._TapChanger._TapSchedules = filtered
+            self._TapChanger._TapSchedules.discard(self)
 
         self._TapChanger = value
         if self._TapChanger is not None:
             if self not in self._TapChanger._TapSchedules:
-                self._TapChanger._TapSchedules.append(self)
+                self._TapChanger._reflist("_TapSchedules").append(self)
 
     TapChanger = property(getTapChanger, setTapChanger)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM14.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM14.Element import RefList
 
 class TransformerWinding(ConductingEquipment):
     """A winding is associated with each defined terminal of a transformer (or phase shifter).
@@ -105,11 +106,11 @@ class TransformerWinding(ConductingEquipment):
         #: Ground reactance path through connected grounding transformer.
         self.xground = xground
 
-        self._From_WindingTest = []
-        self.From_WindingTest = [] if From_WindingTest is None else From_WindingTest
+        if From_WindingTest is not None:
+            self.From_WindingTest = From_WindingTest
 
-        self._To_WindingTest = []
-        self.To_WindingTest = [] if To_WindingTest is None else To_WindingTest
+        if To_WindingTest is not None:
+            self.To_WindingTest = To_WindingTest
 
         self._RatioTapChanger = None
         self.RatioTapChanger = RatioTapChanger
@@ -128,6 +129,7 @@ class TransformerWinding(ConductingEquipment):
     _enums = {"connectionType": "WindingConnection", "windingType": "WindingType"}
     _refs = ["From_WindingTest", "To_WindingTest", "RatioTapChanger", "PowerTransformer", "PhaseTapChanger"]
     _many_refs = ["From_WindingTest", "To_WindingTest"]
+    _inverses = {"From_WindingTest": "From_TransformerWinding", "To_WindingTest": "To_TransformerWinding", "RatioTapChanger": "TransformerWinding", "PowerTransformer": "TransformerWindings", "PhaseTapChanger": "TransformerWinding"}
 
     def getFrom_WindingTest(self):
         """The transformer winding tests for which the transformer winding (terminal) participates as the 'from' part of the test.
@@ -135,7 +137,8 @@ class TransformerWinding(ConductingEquipment):
         return self._From_WindingTest
 
     def setFrom_WindingTest(self, value):
-        for x in self._From_WindingTest:
+        value = RefList(value)
+        for x in list(self._From_WindingTest):
             x.From_TransformerWinding = None
         for y in value:
             y._From_TransformerWinding = self
@@ -157,7 +160,8 @@ class TransformerWinding(ConductingEquipment):
         return self._To_WindingTest
 
     def setTo_WindingTest(self, value):
-        for x in self._To_WindingTest:
+        value = RefList(value)
+        for x in list(self._To_WindingTest):
             x.To_TransformerWinding = None
         for y in value:
             y._To_TransformerWinding = self
@@ -196,13 +200,12 @@ class TransformerWinding(ConductingEquipment):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.TransformerWindings if x != self]
-            self._PowerTransformer._TransformerWindings = filtered
+            self._PowerTransformer._TransformerWindings.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
             if self not in self._PowerTransformer._TransformerWindings:
-                self._PowerTransformer._TransformerWindings.append(self)
+                self._PowerTransformer._reflist("_TransformerWindings").append(self)
 
     PowerTransformer = property(getPowerTransformer, setPowerTransformer)
 
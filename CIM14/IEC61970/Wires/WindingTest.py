@@ -76,6 +76,7 @@ class WindingTest(IdentifiedObject):
     _enums = {}
     _refs = ["From_TransformerWinding", "To_TransformerWinding"]
     _many_refs = []
+    _inverses = {"From_TransformerWinding": "From_WindingTest", "To_TransformerWinding": "To_WindingTest"}
 
     def getFrom_TransformerWinding(self):
         """The winding from which the test was conducted
@@ -84,13 +85,12 @@ class WindingTest(IdentifiedObject):
 
     def setFrom_TransformerWinding(self, value):
         if self._From_TransformerWinding is not None:
-            filtered = [x for x in self.From_TransformerWinding.From_WindingTest if x != self]
-            self._From_TransformerWinding._From_WindingTest = filtered
+            self._From_TransformerWinding._From_WindingTest.discard(self)
 
         self._From_TransformerWinding = value
         if self._From_TransformerWinding is not None:
             if self not in self._From_TransformerWinding._From_WindingTest:
-                self._From_TransformerWinding._From_WindingTest.append(self)
+                self._From_TransformerWinding._reflist("_From_WindingTest").append(self)
 
     From_TransformerWinding = property(getFrom_TransformerWinding, setFrom_TransformerWinding)
 
@@ -101,13 +101,12 @@ class WindingTest(IdentifiedObject):
 
     def setTo_TransformerWinding(self, value):
         if self._To_TransformerWinding is not None:
-            filtered = [x for x in self.To_TransformerWinding.To_WindingTest if x != self]
-            self._To_TransformerWinding._To_WindingTest = filtered
+            self._To_TransformerWinding._To_WindingTest.discard(self)
 
         self._To_TransformerWinding = value
         if self._To_TransformerWinding is not None:
             if self not in self._To_TransformerWinding._To_WindingTest:
-                self._To_TransformerWinding._To_WindingTest.append(self)
+                self._To_TransformerWinding._reflist("_To_WindingTest").append(self)
 
     To_TransformerWinding = property(getTo_TransformerWinding, setTo_TransformerWinding)
 
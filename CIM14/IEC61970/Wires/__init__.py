@@ -21,51 +21,8 @@
 """An extension to the Core and Topology package that models information on the electrical characteristics of Transmission and Distribution networks. This package is used by network applications such as State Estimation, Load Flow and Optimal Power Flow.
 """
 
-from CIM14.IEC61970.Wires.PowerTransformer import PowerTransformer
-from CIM14.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
-from CIM14.IEC61970.Wires.FrequencyConverter import FrequencyConverter
-from CIM14.IEC61970.Wires.ShuntCompensator import ShuntCompensator
-from CIM14.IEC61970.Wires.HeatExchanger import HeatExchanger
-from CIM14.IEC61970.Wires.RegulatingControl import RegulatingControl
-from CIM14.IEC61970.Wires.ReactiveCapabilityCurve import ReactiveCapabilityCurve
-from CIM14.IEC61970.Wires.Line import Line
-from CIM14.IEC61970.Wires.Connector import Connector
-from CIM14.IEC61970.Wires.Junction import Junction
-from CIM14.IEC61970.Wires.Ground import Ground
-from CIM14.IEC61970.Wires.Conductor import Conductor
-from CIM14.IEC61970.Wires.TransformerWinding import TransformerWinding
-from CIM14.IEC61970.Wires.SynchronousMachine import SynchronousMachine
-from CIM14.IEC61970.Wires.EnergyConsumer import EnergyConsumer
-from CIM14.IEC61970.Wires.TapChanger import TapChanger
-from CIM14.IEC61970.Wires.RatioTapChanger import RatioTapChanger
-from CIM14.IEC61970.Wires.Switch import Switch
-from CIM14.IEC61970.Wires.ProtectedSwitch import ProtectedSwitch
-from CIM14.IEC61970.Wires.LoadBreakSwitch import LoadBreakSwitch
-from CIM14.IEC61970.Wires.ACLineSegment import ACLineSegment
-from CIM14.IEC61970.Wires.Plant import Plant
-from CIM14.IEC61970.Wires.RegulationSchedule import RegulationSchedule
-from CIM14.IEC61970.Wires.WindingTest import WindingTest
-from CIM14.IEC61970.Wires.PhaseVariationCurve import PhaseVariationCurve
-from CIM14.IEC61970.Wires.MutualCoupling import MutualCoupling
-from CIM14.IEC61970.Wires.Disconnector import Disconnector
-from CIM14.IEC61970.Wires.SeriesCompensator import SeriesCompensator
-from CIM14.IEC61970.Wires.GroundDisconnector import GroundDisconnector
-from CIM14.IEC61970.Wires.RatioVariationCurve import RatioVariationCurve
-from CIM14.IEC61970.Wires.Resistor import Resistor
-from CIM14.IEC61970.Wires.CompositeSwitch import CompositeSwitch
-from CIM14.IEC61970.Wires.PhaseTapChanger import PhaseTapChanger
-from CIM14.IEC61970.Wires.RectifierInverter import RectifierInverter
-from CIM14.IEC61970.Wires.StaticVarCompensator import StaticVarCompensator
-from CIM14.IEC61970.Wires.TapSchedule import TapSchedule
-from CIM14.IEC61970.Wires.VoltageControlZone import VoltageControlZone
-from CIM14.IEC61970.Wires.EnergySource import EnergySource
-from CIM14.IEC61970.Wires.Fuse import Fuse
-from CIM14.IEC61970.Wires.Jumper import Jumper
-from CIM14.IEC61970.Wires.ImpedanceVariationCurve import ImpedanceVariationCurve
-from CIM14.IEC61970.Wires.DCLineSegment import DCLineSegment
-from CIM14.IEC61970.Wires.SwitchSchedule import SwitchSchedule
-from CIM14.IEC61970.Wires.Breaker import Breaker
-from CIM14.IEC61970.Wires.BusbarSection import BusbarSection
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#Wires"
 nsPrefix = "cimWires"
@@ -140,3 +97,52 @@ class OperatingMode(str):
     """Textual name for an operating mode
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "PowerTransformer",
+    "RegulatingCondEq",
+    "FrequencyConverter",
+    "ShuntCompensator",
+    "HeatExchanger",
+    "RegulatingControl",
+    "ReactiveCapabilityCurve",
+    "Line",
+    "Connector",
+    "Junction",
+    "Ground",
+    "Conductor",
+    "TransformerWinding",
+    "SynchronousMachine",
+    "EnergyConsumer",
+    "TapChanger",
+    "RatioTapChanger",
+    "Switch",
+    "ProtectedSwitch",
+    "LoadBreakSwitch",
+    "ACLineSegment",
+    "Plant",
+    "RegulationSchedule",
+    "WindingTest",
+    "PhaseVariationCurve",
+    "MutualCoupling",
+    "Disconnector",
+    "SeriesCompensator",
+    "GroundDisconnector",
+    "RatioVariationCurve",
+    "Resistor",
+    "CompositeSwitch",
+    "PhaseTapChanger",
+    "RectifierInverter",
+    "StaticVarCompensator",
+    "TapSchedule",
+    "VoltageControlZone",
+    "EnergySource",
+    "Fuse",
+    "Jumper",
+    "ImpedanceVariationCurve",
+    "DCLineSegment",
+    "SwitchSchedule",
+    "Breaker",
+    "BusbarSection",
+])
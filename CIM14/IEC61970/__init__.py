@@ -21,8 +21,31 @@
 """Contains entities that describe dynamic measurement data exchanged between applications.
 """
 
-from CIM14.IEC61970.IEC61970CIMVersion import IEC61970CIMVersion
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14#IEC61970"
 nsPrefix = "cimIEC61970"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "IEC61970CIMVersion",
+], [
+    "Contingency",
+    "ControlArea",
+    "Core",
+    "Domain",
+    "Dynamics",
+    "Equivalents",
+    "Generation",
+    "Informative",
+    "LoadModel",
+    "Meas",
+    "OperationalLimits",
+    "Outage",
+    "Protection",
+    "SCADA",
+    "StateVariables",
+    "Topology",
+    "Wires",
+])
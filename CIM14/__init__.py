@@ -21,8 +21,8 @@
 """The IEC 61968 subpackages of the CIM are developed, standardized and maintained by IEC TC57 Working Group 14: System Interfaces for Distribution Management (WG14). Currently, normative parts of the model support the needs of information exchange defined in IEC 61968-9: 'Interfaces for Meter Reading and Control' and in IEC 61968-13: 'CIM RDF Model exchange format for distribution.'
 """
 
-from CIM14.CombinedVersion import CombinedVersion
-from CIM14.Element import Element
+import sys
+from CIM14.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2009/CIM-schema-cim14"
 nsPrefix = "cim"
@@ -501,3 +501,14 @@ packageMap = {
     "ConnectDisconnectFunction": "CIM14.IEC61968.LoadControl",
 }
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "CombinedVersion",
+    "Element",
+], [
+    "CDPSM",
+    "CPSM",
+    "ENTSOE",
+    "IEC61968",
+    "IEC61970",
+])
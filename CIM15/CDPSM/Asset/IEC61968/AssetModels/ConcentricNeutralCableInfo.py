@@ -44,4 +44,5 @@ class ConcentricNeutralCableInfo(CableInfo):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
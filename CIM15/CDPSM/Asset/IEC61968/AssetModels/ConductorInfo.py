@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.CDPSM.Asset.Element import RefList
 
 class ConductorInfo(AssetInfo):
     """Conductor data.
@@ -50,11 +51,11 @@ class ConductorInfo(AssetInfo):
         #: Number of phases (including neutral) to be retained. Any wires beyond this number should be reduced into the earth return.
         self.phaseCount = phaseCount
 
-        self._WireArrangements = []
-        self.WireArrangements = [] if WireArrangements is None else WireArrangements
+        if WireArrangements is not None:
+            self.WireArrangements = WireArrangements
 
-        self._LineSegments = []
-        self.LineSegments = [] if LineSegments is None else LineSegments
+        if LineSegments is not None:
+            self.LineSegments = LineSegments
 
         super(ConductorInfo, self).__init__(*args, **kw_args)
 
@@ -64,6 +65,7 @@ class ConductorInfo(AssetInfo):
     _enums = {"usage": "ConductorUsageKind", "insulationMaterial": "ConductorInsulationKind"}
     _refs = ["WireArrangements", "LineSegments"]
     _many_refs = ["WireArrangements", "LineSegments"]
+    _inverses = {"WireArrangements": "ConductorInfo", "LineSegments": "ConductorInfo"}
 
     def getWireArrangements(self):
         """All wire arrangements (single wires) that make this conductor.
@@ -71,7 +73,8 @@ class ConductorInfo(AssetInfo):
         return self._WireArrangements
 
     def setWireArrangements(self, value):
-        for x in self._WireArrangements:
+        value = RefList(value)
+        for x in list(self._WireArrangements):
             x.ConductorInfo = None
         for y in value:
             y._ConductorInfo = self
@@ -93,7 +96,8 @@ class ConductorInfo(AssetInfo):
         return self._LineSegments
 
     def setLineSegments(self, value):
-        for x in self._LineSegments:
+        value = RefList(value)
+        for x in list(self._LineSegments):
             x.ConductorInfo = None
         for y in value:
             y._ConductorInfo = self
@@ -48,4 +48,5 @@ class EndDeviceInfo(AssetInfo):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.CDPSM.Asset.Element import RefList
 
 class PowerTransformerInfo(AssetInfo):
     """Set of power transformer data, from an equipment library.
@@ -29,8 +30,8 @@ class PowerTransformerInfo(AssetInfo):
 
         @param TransformerTankInfo: Data for all the tanks described by this power transformer data.
         """
-        self._TransformerTankInfo = []
-        self.TransformerTankInfo = [] if TransformerTankInfo is None else TransformerTankInfo
+        if TransformerTankInfo is not None:
+            self.TransformerTankInfo = TransformerTankInfo
 
         super(PowerTransformerInfo, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class PowerTransformerInfo(AssetInfo):
     _enums = {}
     _refs = ["TransformerTankInfo"]
     _many_refs = ["TransformerTankInfo"]
+    _inverses = {"TransformerTankInfo": "PowerTransformerInfo"}
 
     def getTransformerTankInfo(self):
         """Data for all the tanks described by this power transformer data.
@@ -47,7 +49,8 @@ class PowerTransformerInfo(AssetInfo):
         return self._TransformerTankInfo
 
     def setTransformerTankInfo(self, value):
-        for x in self._TransformerTankInfo:
+        value = RefList(value)
+        for x in list(self._TransformerTankInfo):
             x.PowerTransformerInfo = None
         for y in value:
             y._PowerTransformerInfo = self
@@ -92,4 +92,5 @@ class TapChangerInfo(AssetInfo):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
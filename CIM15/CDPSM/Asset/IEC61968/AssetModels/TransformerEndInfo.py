@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.CDPSM.Asset.Element import RefList
 
 class TransformerEndInfo(AssetInfo):
     """Transformer end data.
@@ -69,8 +70,8 @@ class TransformerEndInfo(AssetInfo):
         self._TransformerTankInfo = None
         self.TransformerTankInfo = TransformerTankInfo
 
-        self._TransformerEnd = []
-        self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
+        if TransformerEnd is not None:
+            self.TransformerEnd = TransformerEnd
 
         super(TransformerEndInfo, self).__init__(*args, **kw_args)
 
@@ -80,6 +81,7 @@ class TransformerEndInfo(AssetInfo):
     _enums = {"connectionKind": "WindingConnection"}
     _refs = ["TransformerTankInfo", "TransformerEnd"]
     _many_refs = ["TransformerEnd"]
+    _inverses = {"TransformerTankInfo": "TransformerEndInfos", "TransformerEnd": "TransformerEndInfo"}
 
     def getTransformerTankInfo(self):
         """Transformer tank data that this end description is part of.
@@ -88,13 +90,12 @@ class TransformerEndInfo(AssetInfo):
 
     def setTransformerTankInfo(self, value):
         if self._TransformerTankInfo is not None:
-            filtered = [x for x in self.TransformerTankInfo.TransformerEndInfos if x != self]
-            self._TransformerTankInfo._TransformerEndInfos = filtered
+            self._TransformerTankInfo._TransformerEndInfos.discard(self)
 
         self._TransformerTankInfo = value
         if self._TransformerTankInfo is not None:
             if self not in self._TransformerTankInfo._TransformerEndInfos:
-                self._TransformerTankInfo._TransformerEndInfos.append(self)
+                self._TransformerTankInfo._reflist("_TransformerEndInfos").append(self)
 
     TransformerTankInfo = property(getTransformerTankInfo, setTransformerTankInfo)
 
@@ -104,7 +105,8 @@ class TransformerEndInfo(AssetInfo):
         return self._TransformerEnd
 
     def setTransformerEnd(self, value):
-        for x in self._TransformerEnd:
+        value = RefList(value)
+        for x in list(self._TransformerEnd):
             x.TransformerEndInfo = None
         for y in value:
             y._TransformerEndInfo = self
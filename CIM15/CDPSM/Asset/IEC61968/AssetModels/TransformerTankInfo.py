@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.CDPSM.Asset.Element import RefList
 
 class TransformerTankInfo(AssetInfo):
     """Set of transformer tank data, from an equipment library.
@@ -34,11 +35,11 @@ class TransformerTankInfo(AssetInfo):
         self._PowerTransformerInfo = None
         self.PowerTransformerInfo = PowerTransformerInfo
 
-        self._TransformerEndInfos = []
-        self.TransformerEndInfos = [] if TransformerEndInfos is None else TransformerEndInfos
+        if TransformerEndInfos is not None:
+            self.TransformerEndInfos = TransformerEndInfos
 
-        self._TransformerTanks = []
-        self.TransformerTanks = [] if TransformerTanks is None else TransformerTanks
+        if TransformerTanks is not None:
+            self.TransformerTanks = TransformerTanks
 
         super(TransformerTankInfo, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class TransformerTankInfo(AssetInfo):
     _enums = {}
     _refs = ["PowerTransformerInfo", "TransformerEndInfos", "TransformerTanks"]
     _many_refs = ["TransformerEndInfos", "TransformerTanks"]
+    _inverses = {"PowerTransformerInfo": "TransformerTankInfo", "TransformerEndInfos": "TransformerTankInfo", "TransformerTanks": "TransformerTankInfo"}
 
     def getPowerTransformerInfo(self):
         """Power transformer data that this tank description is part of.
@@ -56,13 +58,12 @@ class TransformerTankInfo(AssetInfo):
 
     def setPowerTransformerInfo(self, value):
         if self._PowerTransformerInfo is not None:
-            filtered = [x for x in self.PowerTransformerInfo.TransformerTankInfo if x != self]
-            self._PowerTransformerInfo._TransformerTankInfo = filtered
+            self._PowerTransformerInfo._TransformerTankInfo.discard(self)
 
         self._PowerTransformerInfo = value
         if self._PowerTransformerInfo is not None:
             if self not in self._PowerTransformerInfo._TransformerTankInfo:
-                self._PowerTransformerInfo._TransformerTankInfo.append(self)
+                self._PowerTransformerInfo._reflist("_TransformerTankInfo").append(self)
 
     PowerTransformerInfo = property(getPowerTransformerInfo, setPowerTransformerInfo)
 
@@ -72,7 +73,8 @@ class TransformerTankInfo(AssetInfo):
         return self._TransformerEndInfos
 
     def setTransformerEndInfos(self, value):
-        for x in self._TransformerEndInfos:
+        value = RefList(value)
+        for x in list(self._TransformerEndInfos):
             x.TransformerTankInfo = None
         for y in value:
             y._TransformerTankInfo = self
@@ -94,7 +96,8 @@ class TransformerTankInfo(AssetInfo):
         return self._TransformerTanks
 
     def setTransformerTanks(self, value):
-        for x in self._TransformerTanks:
+        value = RefList(value)
+        for x in list(self._TransformerTanks):
             x.TransformerTankInfo = None
         for y in value:
             y._TransformerTankInfo = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Asset.Element import RefList
 
 class WireType(IdentifiedObject):
     """Wire conductor (per IEEE specs). A specific type of wire or combination of wires, not insulated from each other, suitable for carrying electrical current.
@@ -77,8 +78,8 @@ class WireType(IdentifiedObject):
         #: Describes the wire guage or cross section (e.g., 4/0, #2, 336.5).
         self.sizeDescription = sizeDescription
 
-        self._WireArrangements = []
-        self.WireArrangements = [] if WireArrangements is None else WireArrangements
+        if WireArrangements is not None:
+            self.WireArrangements = WireArrangements
 
         super(WireType, self).__init__(*args, **kw_args)
 
@@ -88,6 +89,7 @@ class WireType(IdentifiedObject):
     _enums = {"material": "ConductorMaterialKind"}
     _refs = ["WireArrangements"]
     _many_refs = ["WireArrangements"]
+    _inverses = {"WireArrangements": "WireType"}
 
     def getWireArrangements(self):
         """All wire arrangements using this wire type.
@@ -95,7 +97,8 @@ class WireType(IdentifiedObject):
         return self._WireArrangements
 
     def setWireArrangements(self, value):
-        for x in self._WireArrangements:
+        value = RefList(value)
+        for x in list(self._WireArrangements):
             x.WireType = None
         for y in value:
             y._WireType = self
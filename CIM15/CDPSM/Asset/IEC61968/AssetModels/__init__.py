@@ -21,18 +21,8 @@
 """This package is an extension of Assets package and contains the core information classes that support asset management and different network and work planning applications with specialized AssetInfo subclasses. They hold attributes that can be referenced by not only Asset-s or AssetModel-s but also by ConductingEquipment-s.
 """
 
-from CIM15.CDPSM.Asset.IEC61968.AssetModels.ConductorInfo import ConductorInfo
-from CIM15.CDPSM.Asset.IEC61968.AssetModels.WireArrangement import WireArrangement
-from CIM15.CDPSM.Asset.IEC61968.AssetModels.WireType import WireType
-from CIM15.CDPSM.Asset.IEC61968.AssetModels.EndDeviceInfo import EndDeviceInfo
-from CIM15.CDPSM.Asset.IEC61968.AssetModels.OverheadConductorInfo import OverheadConductorInfo
-from CIM15.CDPSM.Asset.IEC61968.AssetModels.TapChangerInfo import TapChangerInfo
-from CIM15.CDPSM.Asset.IEC61968.AssetModels.TransformerTankInfo import TransformerTankInfo
-from CIM15.CDPSM.Asset.IEC61968.AssetModels.CableInfo import CableInfo
-from CIM15.CDPSM.Asset.IEC61968.AssetModels.ConcentricNeutralCableInfo import ConcentricNeutralCableInfo
-from CIM15.CDPSM.Asset.IEC61968.AssetModels.TapeShieldCableInfo import TapeShieldCableInfo
-from CIM15.CDPSM.Asset.IEC61968.AssetModels.TransformerEndInfo import TransformerEndInfo
-from CIM15.CDPSM.Asset.IEC61968.AssetModels.PowerTransformerInfo import PowerTransformerInfo
+import sys
+from CIM15.CDPSM.Asset.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-4/CDPSM/Asset#AssetModels"
 nsPrefix = "cimAssetModels"
@@ -67,3 +57,19 @@ class CableShieldMaterialKind(str):
     """Values are: lead, aluminum, other, copper, steel
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ConductorInfo",
+    "WireArrangement",
+    "WireType",
+    "EndDeviceInfo",
+    "OverheadConductorInfo",
+    "TapChangerInfo",
+    "TransformerTankInfo",
+    "CableInfo",
+    "ConcentricNeutralCableInfo",
+    "TapeShieldCableInfo",
+    "TransformerEndInfo",
+    "PowerTransformerInfo",
+])
@@ -36,4 +36,5 @@ class AssetInfo(IdentifiedObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -21,8 +21,13 @@
 """This package contains the core information classes that support asset management applications that deal with the physical and lifecycle aspects of various network resources (as opposed to power system resource models defined in IEC61970::Wires package, which support network applications).
 """
 
-from CIM15.CDPSM.Asset.IEC61968.Assets.AssetInfo import AssetInfo
+import sys
+from CIM15.CDPSM.Asset.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-4/CDPSM/Asset#Assets"
 nsPrefix = "cimAssets"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "AssetInfo",
+])
@@ -21,7 +21,16 @@
 """This package is an extension of the Metering package and contains the information classes that support specialised applications such as prepayment metering. These classes are generally associated with the collection and control of revenue from the customer for a delivered service.
 """
 
+import sys
+from CIM15.CDPSM.Asset.Element import LazyModule
+
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-4/CDPSM/Asset#IEC61968"
 nsPrefix = "cimIEC61968"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+], [
+    "AssetModels",
+    "Assets",
+])
@@ -48,6 +48,7 @@ class Name(Element):
     _enums = {}
     _refs = ["IdentifiedObject", "NameType"]
     _many_refs = []
+    _inverses = {"IdentifiedObject": "Names", "NameType": "Names"}
 
     def getIdentifiedObject(self):
         """Identified object that this name designates.
@@ -56,13 +57,12 @@ class Name(Element):
 
     def setIdentifiedObject(self, value):
         if self._IdentifiedObject is not None:
-            filtered = [x for x in self.IdentifiedObject.Names if x != self]
-            self._IdentifiedObject._Names = filtered
+            self._IdentifiedObject._Names.discard(self)
 
         self._IdentifiedObject = value
         if self._IdentifiedObject is not None:
             if self not in self._IdentifiedObject._Names:
-                self._IdentifiedObject._Names.append(self)
+                self._IdentifiedObject._reflist("_Names").append(self)
 
     IdentifiedObject = property(getIdentifiedObject, setIdentifiedObject)
 
@@ -73,13 +73,12 @@ class Name(Element):
 
     def setNameType(self, value):
         if self._NameType is not None:
-            filtered = [x for x in self.NameType.Names if x != self]
-            self._NameType._Names = filtered
+            self._NameType._Names.discard(self)
 
         self._NameType = value
         if self._NameType is not None:
             if self not in self._NameType._Names:
-                self._NameType._Names.append(self)
+                self._NameType._reflist("_Names").append(self)
 
     NameType = property(getNameType, setNameType)
 
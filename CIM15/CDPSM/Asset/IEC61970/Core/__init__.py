@@ -21,10 +21,15 @@
 """Contains the core PowerSystemResource and ConductingEquipment entities shared by all applications plus common collections of those entities. Not all applications require all the Core entities.  This package does not depend on any other package except the Domain package, but most of the other packages have associations and generalizations that depend on it.
 """
 
-from CIM15.CDPSM.Asset.IEC61970.Core.NameType import NameType
-from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
-from CIM15.CDPSM.Asset.IEC61970.Core.Name import Name
+import sys
+from CIM15.CDPSM.Asset.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-4/CDPSM/Asset#Core"
 nsPrefix = "cimCore"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "NameType",
+    "IdentifiedObject",
+    "Name",
+])
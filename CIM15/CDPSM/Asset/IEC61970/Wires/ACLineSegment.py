@@ -48,6 +48,7 @@ class ACLineSegment(IdentifiedObject):
     _enums = {}
     _refs = ["SequenceImpedance", "ConductorInfo", "PhaseImpedance"]
     _many_refs = []
+    _inverses = {"SequenceImpedance": "LineSegments", "ConductorInfo": "LineSegments", "PhaseImpedance": "LineSegments"}
 
     def getSequenceImpedance(self):
         """Sequence impedance of this line segment; used for balanced model.
@@ -56,13 +57,12 @@ class ACLineSegment(IdentifiedObject):
 
     def setSequenceImpedance(self, value):
         if self._SequenceImpedance is not None:
-            filtered = [x for x in self.SequenceImpedance.LineSegments if x != self]
-            self._SequenceImpedance._LineSegments = filtered
+            self._SequenceImpedance._LineSegments.discard(self)
 
         self._SequenceImpedance = value
         if self._SequenceImpedance is not None:
             if self not in self._SequenceImpedance._LineSegments:
-                self._SequenceImpedance._LineSegments.append(self)
+                self._SequenceImpedance._reflist("_LineSegments").append(self)
 
     SequenceImpedance = property(getSequenceImpedance, setSequenceImpedance)
 
@@ -73,13 +73,12 @@ class ACLineSegment(IdentifiedObject):
 
     def setConductorInfo(self, value):
         if self._ConductorInfo is not None:
-            filtered = [x for x in self.ConductorInfo.LineSegments if x != self]
-            self._ConductorInfo._LineSegments = filtered
+            self._ConductorInfo._LineSegments.discard(self)
 
         self._ConductorInfo = value
         if self._ConductorInfo is not None:
             if self not in self._ConductorInfo._LineSegments:
-                self._ConductorInfo._LineSegments.append(self)
+                self._ConductorInfo._reflist("_LineSegments").append(self)
 
     ConductorInfo = property(getConductorInfo, setConductorInfo)
 
@@ -90,13 +89,12 @@ class ACLineSegment(IdentifiedObject):
 
     def setPhaseImpedance(self, value):
         if self._PhaseImpedance is not None:
-            filtered = [x for x in self.PhaseImpedance.LineSegments if x != self]
-            self._PhaseImpedance._LineSegments = filtered
+            self._PhaseImpedance._LineSegments.discard(self)
 
         self._PhaseImpedance = value
         if self._PhaseImpedance is not None:
             if self not in self._PhaseImpedance._LineSegments:
-                self._PhaseImpedance._LineSegments.append(self)
+                self._PhaseImpedance._reflist("_LineSegments").append(self)
 
     PhaseImpedance = property(getPhaseImpedance, setPhaseImpedance)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Asset.Element import RefList
 
 class PerLengthPhaseImpedance(IdentifiedObject):
     """Impedance and admittance parameters per unit length for n-wire unbalanced lines, in matrix form.
@@ -29,8 +30,8 @@ class PerLengthPhaseImpedance(IdentifiedObject):
 
         @param LineSegments: All line segments described by this phase impedance.
         """
-        self._LineSegments = []
-        self.LineSegments = [] if LineSegments is None else LineSegments
+        if LineSegments is not None:
+            self.LineSegments = LineSegments
 
         super(PerLengthPhaseImpedance, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class PerLengthPhaseImpedance(IdentifiedObject):
     _enums = {}
     _refs = ["LineSegments"]
     _many_refs = ["LineSegments"]
+    _inverses = {"LineSegments": "PhaseImpedance"}
 
     def getLineSegments(self):
         """All line segments described by this phase impedance.
@@ -47,7 +49,8 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         return self._LineSegments
 
     def setLineSegments(self, value):
-        for x in self._LineSegments:
+        value = RefList(value)
+        for x in list(self._LineSegments):
             x.PhaseImpedance = None
         for y in value:
             y._PhaseImpedance = self
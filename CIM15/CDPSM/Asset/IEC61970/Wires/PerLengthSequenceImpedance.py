@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Asset.Element import RefList
 
 class PerLengthSequenceImpedance(IdentifiedObject):
     """Sequence impedance and admittance parameters per unit length, for transposed lines of 1, 2, or 3 phases. For 1-phase lines, define x=x0=xself. For 2-phase lines, define x=xs-xm and x0=xs+xm.
@@ -29,8 +30,8 @@ class PerLengthSequenceImpedance(IdentifiedObject):
 
         @param LineSegments: All line segments described by this sequence impedance.
         """
-        self._LineSegments = []
-        self.LineSegments = [] if LineSegments is None else LineSegments
+        if LineSegments is not None:
+            self.LineSegments = LineSegments
 
         super(PerLengthSequenceImpedance, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class PerLengthSequenceImpedance(IdentifiedObject):
     _enums = {}
     _refs = ["LineSegments"]
     _many_refs = ["LineSegments"]
+    _inverses = {"LineSegments": "SequenceImpedance"}
 
     def getLineSegments(self):
         """All line segments described by this sequence impedance.
@@ -47,7 +49,8 @@ class PerLengthSequenceImpedance(IdentifiedObject):
         return self._LineSegments
 
     def setLineSegments(self, value):
-        for x in self._LineSegments:
+        value = RefList(value)
+        for x in list(self._LineSegments):
             x.SequenceImpedance = None
         for y in value:
             y._SequenceImpedance = self
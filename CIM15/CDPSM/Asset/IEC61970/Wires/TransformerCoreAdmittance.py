@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Asset.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Asset.Element import RefList
 
 class TransformerCoreAdmittance(IdentifiedObject):
 
@@ -27,8 +28,8 @@ class TransformerCoreAdmittance(IdentifiedObject):
 
         @param TransformerEnd: All transformer ends having this core admittance.
         """
-        self._TransformerEnd = []
-        self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
+        if TransformerEnd is not None:
+            self.TransformerEnd = TransformerEnd
 
         super(TransformerCoreAdmittance, self).__init__(*args, **kw_args)
 
@@ -38,6 +39,7 @@ class TransformerCoreAdmittance(IdentifiedObject):
     _enums = {}
     _refs = ["TransformerEnd"]
     _many_refs = ["TransformerEnd"]
+    _inverses = {"TransformerEnd": "CoreAdmittance"}
 
     def getTransformerEnd(self):
         """All transformer ends having this core admittance.
@@ -45,7 +47,8 @@ class TransformerCoreAdmittance(IdentifiedObject):
         return self._TransformerEnd
 
     def setTransformerEnd(self, value):
-        for x in self._TransformerEnd:
+        value = RefList(value)
+        for x in list(self._TransformerEnd):
             x.CoreAdmittance = None
         for y in value:
             y._CoreAdmittance = self
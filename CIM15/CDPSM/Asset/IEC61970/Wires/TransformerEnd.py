@@ -48,6 +48,7 @@ class TransformerEnd(IdentifiedObject):
     _enums = {}
     _refs = ["CoreAdmittance", "TransformerEndInfo", "StarImpedance"]
     _many_refs = []
+    _inverses = {"CoreAdmittance": "TransformerEnd", "TransformerEndInfo": "TransformerEnd", "StarImpedance": "TransformerEnd"}
 
     def getCoreAdmittance(self):
         """Core admittance of this transformer end, representing magnetising current and core losses. The full values of the transformer should be supplied for one transformer end only.
@@ -56,13 +57,12 @@ class TransformerEnd(IdentifiedObject):
 
     def setCoreAdmittance(self, value):
         if self._CoreAdmittance is not None:
-            filtered = [x for x in self.CoreAdmittance.TransformerEnd if x != self]
-            self._CoreAdmittance._TransformerEnd = filtered
+            self._CoreAdmittance._TransformerEnd.discard(self)
 
         self._CoreAdmittance = value
         if self._CoreAdmittance is not None:
             if self not in self._CoreAdmittance._TransformerEnd:
-                self._CoreAdmittance._TransformerEnd.append(self)
+                self._CoreAdmittance._reflist("_TransformerEnd").append(self)
 
     CoreAdmittance = property(getCoreAdmittance, setCoreAdmittance)
 
@@ -73,13 +73,12 @@ class TransformerEnd(IdentifiedObject):
 
     def setTransformerEndInfo(self, value):
         if self._TransformerEndInfo is not None:
-            filtered = [x for x in self.TransformerEndInfo.TransformerEnd if x != self]
-            self._TransformerEndInfo._TransformerEnd = filtered
+            self._TransformerEndInfo._TransformerEnd.discard(self)
 
         self._TransformerEndInfo = value
         if self._TransformerEndInfo is not None:
             if self not in self._TransformerEndInfo._TransformerEnd:
-                self._TransformerEndInfo._TransformerEnd.append(self)
+                self._TransformerEndInfo._reflist("_TransformerEnd").append(self)
 
     TransformerEndInfo = property(getTransformerEndInfo, setTransformerEndInfo)
 
@@ -90,13 +89,12 @@ class TransformerEnd(IdentifiedObject):
 
     def setStarImpedance(self, value):
         if self._StarImpedance is not None:
-            filtered = [x for x in self.StarImpedance.TransformerEnd if x != self]
-            self._StarImpedance._TransformerEnd = filtered
+            self._StarImpedance._TransformerEnd.discard(self)
 
         self._StarImpedance = value
         if self._StarImpedance is not None:
             if self not in self._StarImpedance._TransformerEnd:
-                self._StarImpedance._TransformerEnd.append(self)
+                self._StarImpedance._reflist("_TransformerEnd").append(self)
 
     StarImpedance = property(getStarImpedance, setStarImpedance)
 
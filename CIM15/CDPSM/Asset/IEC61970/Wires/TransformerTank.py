@@ -40,6 +40,7 @@ class TransformerTank(IdentifiedObject):
     _enums = {}
     _refs = ["TransformerTankInfo"]
     _many_refs = []
+    _inverses = {"TransformerTankInfo": "TransformerTanks"}
 
     def getTransformerTankInfo(self):
         """Transformer tank data.
@@ -48,13 +49,12 @@ class TransformerTank(IdentifiedObject):
 
     def setTransformerTankInfo(self, value):
         if self._TransformerTankInfo is not None:
-            filtered = [x for x in self.TransformerTankInfo.TransformerTanks if x != self]
-            self._TransformerTankInfo._TransformerTanks = filtered
+            self._TransformerTankInfo._TransformerTanks.discard(self)
 
         self._TransformerTankInfo = value
         if self._TransformerTankInfo is not None:
             if self not in self._TransformerTankInfo._TransformerTanks:
-                self._TransformerTankInfo._TransformerTanks.append(self)
+                self._TransformerTankInfo._reflist("_TransformerTanks").append(self)
 
     TransformerTankInfo = property(getTransformerTankInfo, setTransformerTankInfo)
 
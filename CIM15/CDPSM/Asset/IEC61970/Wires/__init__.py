@@ -21,14 +21,8 @@
 """An extension to the Core and Topology package that models information on the electrical characteristics of Transmission and Distribution networks. This package is used by network applications such as State Estimation, Load Flow and Optimal Power Flow.
 """
 
-from CIM15.CDPSM.Asset.IEC61970.Wires.PerLengthSequenceImpedance import PerLengthSequenceImpedance
-from CIM15.CDPSM.Asset.IEC61970.Wires.ACLineSegment import ACLineSegment
-from CIM15.CDPSM.Asset.IEC61970.Wires.TransformerCoreAdmittance import TransformerCoreAdmittance
-from CIM15.CDPSM.Asset.IEC61970.Wires.TransformerTank import TransformerTank
-from CIM15.CDPSM.Asset.IEC61970.Wires.TransformerTankEnd import TransformerTankEnd
-from CIM15.CDPSM.Asset.IEC61970.Wires.TransformerStarImpedance import TransformerStarImpedance
-from CIM15.CDPSM.Asset.IEC61970.Wires.PerLengthPhaseImpedance import PerLengthPhaseImpedance
-from CIM15.CDPSM.Asset.IEC61970.Wires.TransformerEnd import TransformerEnd
+import sys
+from CIM15.CDPSM.Asset.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-4/CDPSM/Asset#Wires"
 nsPrefix = "cimWires"
@@ -38,3 +32,15 @@ class WindingConnection(str):
     """Values are: Z, A, Yn, Y, Zn, D, I
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "PerLengthSequenceImpedance",
+    "ACLineSegment",
+    "TransformerCoreAdmittance",
+    "TransformerTank",
+    "TransformerTankEnd",
+    "TransformerStarImpedance",
+    "PerLengthPhaseImpedance",
+    "TransformerEnd",
+])
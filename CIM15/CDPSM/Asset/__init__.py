@@ -21,7 +21,8 @@
 """The IEC 61968 subpackages of the CIM are developed, standardized and maintained by IEC TC57 Working Group 14: interfaces for distribution management (WG14). Currently, normative parts of the model support the needs of information exchange defined in IEC 61968-9 and in IEC 61968-13.
 """
 
-from CIM15.CDPSM.Asset.Element import Element
+import sys
+from CIM15.CDPSM.Asset.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-4/CDPSM/Asset"
 nsPrefix = "asset"
@@ -136,3 +137,11 @@ class CIMGDay(str):
 
 class CIMGYearMonth(str):
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Element",
+], [
+    "IEC61968",
+    "IEC61970",
+])
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.CDPSM.Balanced.Element import Element
+from CIM15.CDPSM.Balanced.Element import Element, RefList
 
 class NameType(Element):
     """Type of name. Possible values for attribute 'name' are implementation dependent but standard profiles may specify types. An enterprise may have multiple IT systems each having its own local name for the same object, e.g. a planning system may have different names from an EMS. An object may also have different names within the same IT system, e.g. localName and aliasName as defined in CIM version 14. Their definitions from CIM14 are The localName is a human readable name of the object. It is only used with objects organized in a naming hierarchy. localName: A free text name local to a node in a naming hierarchy similar to a file directory structure. A power system related naming hierarchy may be: Substation, VoltageLevel, Equipment etc. Children of the same parent in such a hierarchy have names that typically are unique among them. aliasName: A free text alternate name typically used in tabular reports where the column width is limited.
@@ -29,8 +29,8 @@ class NameType(Element):
 
         @param Names: All names of this type.
         """
-        self._Names = []
-        self.Names = [] if Names is None else Names
+        if Names is not None:
+            self.Names = Names
 
         super(NameType, self).__init__(*args, **kw_args)
 
@@ -40,6 +40,7 @@ class NameType(Element):
     _enums = {}
     _refs = ["Names"]
     _many_refs = ["Names"]
+    _inverses = {"Names": "NameType"}
 
     def getNames(self):
         """All names of this type.
@@ -47,7 +48,8 @@ class NameType(Element):
         return self._Names
 
     def setNames(self, value):
-        for x in self._Names:
+        value = RefList(value)
+        for x in list(self._Names):
             x.NameType = None
         for y in value:
             y._NameType = self
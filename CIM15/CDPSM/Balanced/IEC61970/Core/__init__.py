@@ -21,9 +21,8 @@
 """Contains the core PowerSystemResource and ConductingEquipment entities shared by all applications plus common collections of those entities. Not all applications require all the Core entities.  This package does not depend on any other package except the Domain package, but most of the other packages have associations and generalizations that depend on it.
 """
 
-from CIM15.CDPSM.Balanced.IEC61970.Core.NameType import NameType
-from CIM15.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
-from CIM15.CDPSM.Balanced.IEC61970.Core.Name import Name
+import sys
+from CIM15.CDPSM.Balanced.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-13/CDPSM/Balanced#Core"
 nsPrefix = "cimCore"
@@ -33,3 +32,10 @@ class PhaseCode(str):
     """Values are: s12N, BN, BC, ABN, s2N, N, ACN, BCN, ABCN, AC, s1N, AN, B, AB, C, A, CN, ABC
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "NameType",
+    "IdentifiedObject",
+    "Name",
+])
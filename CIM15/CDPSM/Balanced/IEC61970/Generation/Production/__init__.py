@@ -21,7 +21,8 @@
 """The production package is responsible for classes which describe various kinds of generators. These classes also provide production costing information which is used to economically allocate demand among committed units and calculate reserve quantities.
 """
 
-from CIM15.CDPSM.Balanced.IEC61970.Generation.Production.GeneratingUnit import GeneratingUnit
+import sys
+from CIM15.CDPSM.Balanced.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-13/CDPSM/Balanced#Production"
 nsPrefix = "cimProduction"
@@ -31,3 +32,8 @@ class GeneratorControlSource(str):
     """Values are: plantControl, offAGC, unavailable, onAGC
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "GeneratingUnit",
+])
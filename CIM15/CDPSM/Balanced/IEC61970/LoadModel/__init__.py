@@ -21,8 +21,13 @@
 """This package is responsible for modeling the energy consumers and the system load as curves and associated curve data. Special circumstances that may affect the load, such as seasons and daytypes, are also included here.  This information is used by Load Forecasting and Load Management.
 """
 
-from CIM15.CDPSM.Balanced.IEC61970.LoadModel.LoadResponseCharacteristic import LoadResponseCharacteristic
+import sys
+from CIM15.CDPSM.Balanced.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-13/CDPSM/Balanced#LoadModel"
 nsPrefix = "cimLoadModel"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "LoadResponseCharacteristic",
+])
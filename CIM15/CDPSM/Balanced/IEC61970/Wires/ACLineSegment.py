@@ -60,4 +60,5 @@ class ACLineSegment(IdentifiedObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
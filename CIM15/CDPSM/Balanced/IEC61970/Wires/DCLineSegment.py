@@ -36,4 +36,5 @@ class DCLineSegment(IdentifiedObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class PhaseTapChanger(TapChanger):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
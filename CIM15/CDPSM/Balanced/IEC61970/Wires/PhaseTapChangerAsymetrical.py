@@ -40,4 +40,5 @@ class PhaseTapChangerAsymetrical(PhaseTapChangerNonLinear):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
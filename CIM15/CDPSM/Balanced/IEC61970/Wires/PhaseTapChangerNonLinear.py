@@ -40,4 +40,5 @@ class PhaseTapChangerNonLinear(PhaseTapChanger):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
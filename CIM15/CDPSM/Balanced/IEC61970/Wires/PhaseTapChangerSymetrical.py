@@ -36,4 +36,5 @@ class PhaseTapChangerSymetrical(PhaseTapChangerNonLinear):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class PowerTransformer(IdentifiedObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
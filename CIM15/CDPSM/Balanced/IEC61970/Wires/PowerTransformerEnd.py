@@ -80,4 +80,5 @@ class PowerTransformerEnd(TransformerEnd):
     _enums = {"connectionKind": "WindingConnection"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -40,4 +40,5 @@ class ProtectedSwitch(IdentifiedObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
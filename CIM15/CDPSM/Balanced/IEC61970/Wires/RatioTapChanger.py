@@ -44,4 +44,5 @@ class RatioTapChanger(TapChanger):
     _enums = {"tculControlMode": "TransformerControlMode"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
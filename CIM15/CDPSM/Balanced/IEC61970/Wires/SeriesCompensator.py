@@ -44,4 +44,5 @@ class SeriesCompensator(IdentifiedObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
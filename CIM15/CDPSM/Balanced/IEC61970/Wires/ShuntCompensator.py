@@ -84,4 +84,5 @@ class ShuntCompensator(IdentifiedObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
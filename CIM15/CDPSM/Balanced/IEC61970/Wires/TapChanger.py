@@ -56,4 +56,5 @@ class TapChanger(IdentifiedObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
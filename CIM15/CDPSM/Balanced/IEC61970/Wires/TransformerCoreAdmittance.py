@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Balanced.Element import RefList
 
 class TransformerCoreAdmittance(IdentifiedObject):
 
@@ -43,8 +44,8 @@ class TransformerCoreAdmittance(IdentifiedObject):
         #: Zero sequence magnetizing branch susceptance.
         self.b0 = b0
 
-        self._TransformerEnd = []
-        self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
+        if TransformerEnd is not None:
+            self.TransformerEnd = TransformerEnd
 
         super(TransformerCoreAdmittance, self).__init__(*args, **kw_args)
 
@@ -54,6 +55,7 @@ class TransformerCoreAdmittance(IdentifiedObject):
     _enums = {}
     _refs = ["TransformerEnd"]
     _many_refs = ["TransformerEnd"]
+    _inverses = {"TransformerEnd": "CoreAdmittance"}
 
     def getTransformerEnd(self):
         """All transformer ends having this core admittance.
@@ -61,7 +63,8 @@ class TransformerCoreAdmittance(IdentifiedObject):
         return self._TransformerEnd
 
     def setTransformerEnd(self, value):
-        for x in self._TransformerEnd:
+        value = RefList(value)
+        for x in list(self._TransformerEnd):
             x.CoreAdmittance = None
         for y in value:
             y._CoreAdmittance = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Balanced.Element import RefList
 
 class TransformerEnd(IdentifiedObject):
     """TransformerEnd is a conducting connection point of a power transformer. It corresponds to a physical transformer winding terminal.  In earlier CIM versions, the TransformerWinding class served a similar purpose. This successor TransformerEnd class is more flexible and has important differences with TransformerWinding.
@@ -32,11 +33,11 @@ class TransformerEnd(IdentifiedObject):
         @param CoreAdmittance: Core admittance of this transformer end, representing magnetising current and core losses. The full values of the transformer should be supplied for one transformer end only.
         @param StarImpedance: (accurate for 2- or 3-winding transformers only) Pi-model impedances of this transformer end. By convention, for a two winding transformer, the full values of the transformer should be entered on the high voltage end (endNumber=1).
         """
-        self._FromMeshImpedance = []
-        self.FromMeshImpedance = [] if FromMeshImpedance is None else FromMeshImpedance
+        if FromMeshImpedance is not None:
+            self.FromMeshImpedance = FromMeshImpedance
 
-        self._ToMeshImpedance = []
-        self.ToMeshImpedance = [] if ToMeshImpedance is None else ToMeshImpedance
+        if ToMeshImpedance is not None:
+            self.ToMeshImpedance = ToMeshImpedance
 
         self._CoreAdmittance = None
         self.CoreAdmittance = CoreAdmittance
@@ -52,6 +53,7 @@ class TransformerEnd(IdentifiedObject):
     _enums = {}
     _refs = ["FromMeshImpedance", "ToMeshImpedance", "CoreAdmittance", "StarImpedance"]
     _many_refs = ["FromMeshImpedance", "ToMeshImpedance"]
+    _inverses = {"FromMeshImpedance": "FromTransformerEnd", "ToMeshImpedance": "ToTransformerEnd", "CoreAdmittance": "TransformerEnd", "StarImpedance": "TransformerEnd"}
 
     def getFromMeshImpedance(self):
         """All mesh impedances between this 'to' and other 'from' transformer ends.
@@ -59,7 +61,8 @@ class TransformerEnd(IdentifiedObject):
         return self._FromMeshImpedance
 
     def setFromMeshImpedance(self, value):
-        for x in self._FromMeshImpedance:
+        value = RefList(value)
+        for x in list(self._FromMeshImpedance):
             x.FromTransformerEnd = None
         for y in value:
             y._FromTransformerEnd = self
@@ -82,20 +85,19 @@ class TransformerEnd(IdentifiedObject):
 
     def setToMeshImpedance(self, value):
         for p in self._ToMeshImpedance:
-            filtered = [q for q in p.ToTransformerEnd if q != self]
-            self._ToMeshImpedance._ToTransformerEnd = filtered
+            p._ToTransformerEnd.discard(self)
         for r in value:
             if self not in r._ToTransformerEnd:
-                r._ToTransformerEnd.append(self)
-        self._ToMeshImpedance = value
+                r._reflist("_ToTransformerEnd").append(self)
+        self._ToMeshImpedance = RefList(value)
 
     ToMeshImpedance = property(getToMeshImpedance, setToMeshImpedance)
 
     def addToMeshImpedance(self, *ToMeshImpedance):
         for obj in ToMeshImpedance:
             if self not in obj._ToTransformerEnd:
-                obj._ToTransformerEnd.append(self)
-            self._ToMeshImpedance.append(obj)
+                obj._reflist("_ToTransformerEnd").append(self)
+            self._reflist("_ToMeshImpedance").append(obj)
 
     def removeToMeshImpedance(self, *ToMeshImpedance):
         for obj in ToMeshImpedance:
@@ -110,13 +112,12 @@ class TransformerEnd(IdentifiedObject):
 
     def setCoreAdmittance(self, value):
         if self._CoreAdmittance is not None:
-            filtered = [x for x in self.CoreAdmittance.TransformerEnd if x != self]
-            self._CoreAdmittance._TransformerEnd = filtered
+            self._CoreAdmittance._TransformerEnd.discard(self)
 
         self._CoreAdmittance = value
         if self._CoreAdmittance is not None:
             if self not in self._CoreAdmittance._TransformerEnd:
-                self._CoreAdmittance._TransformerEnd.append(self)
+                self._CoreAdmittance._reflist("_TransformerEnd").append(self)
 
     CoreAdmittance = property(getCoreAdmittance, setCoreAdmittance)
 
@@ -127,13 +128,12 @@ class TransformerEnd(IdentifiedObject):
 
     def setStarImpedance(self, value):
         if self._StarImpedance is not None:
-            filtered = [x for x in self.StarImpedance.TransformerEnd if x != self]
-            self._StarImpedance._TransformerEnd = filtered
+            self._StarImpedance._TransformerEnd.discard(self)
 
         self._StarImpedance = value
         if self._StarImpedance is not None:
             if self not in self._StarImpedance._TransformerEnd:
-                self._StarImpedance._TransformerEnd.append(self)
+                self._StarImpedance._reflist("_TransformerEnd").append(self)
 
     StarImpedance = property(getStarImpedance, setStarImpedance)
 
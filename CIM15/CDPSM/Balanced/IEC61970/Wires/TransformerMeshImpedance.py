@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Balanced.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Balanced.Element import RefList
 
 class TransformerMeshImpedance(IdentifiedObject):
     """Transformer mesh impedance (Delta-model) between transformer ends. The typical case is that TransformerMeshImpedance describe the impedance between two TransformerEnds pare wise, i.e. the cardinalities at both TranformerEnd associations are 1. But in cases where two or more TransformerEnds are operated connected together the cardinality at the ToTransfomerEnd role is larger than 1.
@@ -49,8 +50,8 @@ class TransformerMeshImpedance(IdentifiedObject):
         self._FromTransformerEnd = None
         self.FromTransformerEnd = FromTransformerEnd
 
-        self._ToTransformerEnd = []
-        self.ToTransformerEnd = [] if ToTransformerEnd is None else ToTransformerEnd
+        if ToTransformerEnd is not None:
+            self.ToTransformerEnd = ToTransformerEnd
 
         super(TransformerMeshImpedance, self).__init__(*args, **kw_args)
 
@@ -60,6 +61,7 @@ class TransformerMeshImpedance(IdentifiedObject):
     _enums = {}
     _refs = ["FromTransformerEnd", "ToTransformerEnd"]
     _many_refs = ["ToTransformerEnd"]
+    _inverses = {"FromTransformerEnd": "FromMeshImpedance", "ToTransformerEnd": "ToMeshImpedance"}
 
     def getFromTransformerEnd(self):
         """From end this mesh impedance is connected to. It determines the voltage reference.
@@ -68,13 +70,12 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setFromTransformerEnd(self, value):
         if self._FromTransformerEnd is not None:
-            filtered = [x for x in self.FromTransformerEnd.FromMeshImpedance if x != self]
-            self._FromTransformerEnd._FromMeshImpedance = filtered
+            self._FromTransformerEnd._FromMeshImpedance.discard(self)
 
         self._FromTransformerEnd = value
         if self._FromTransformerEnd is not None:
             if self not in self._FromTransformerEnd._FromMeshImpedance:
-                self._FromTransformerEnd._FromMeshImpedance.append(self)
+                self._FromTransformerEnd._reflist("_FromMeshImpedance").append(self)
 
     FromTransformerEnd = property(getFromTransformerEnd, setFromTransformerEnd)
 
@@ -85,20 +86,19 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setToTransformerEnd(self, value):
         for p in self._ToTransformerEnd:
-            filtered = [q for q in p.ToMeshImpedance if q != self]
-            self._ToTransformerEnd._ToMeshImpedance = filtered
+            p._ToMeshImpedance.discard(self)
         for r in value:
             if self not in r._ToMeshImpedance:
-                r._ToMeshImpedance.append(self)
-        self._ToTransformerEnd = value
+                r._reflist("_ToMeshImpedance").append(self)
+        self._ToTransformerEnd = RefList(value)
 
     ToTransformerEnd = property(getToTransformerEnd, setToTransformerEnd)
 
     def addToTransformerEnd(self, *ToTransformerEnd):
         for obj in ToTransformerEnd:
             if self not in obj._ToMeshImpedance:
-                obj._ToMeshImpedance.append(self)
-            self._ToTransformerEnd.append(obj)
+                obj._reflist("_ToMeshImpedance").append(self)
+            self._reflist("_ToTransformerEnd").append(obj)
 
     def removeToTransformerEnd(self, *ToTransformerEnd):
         for obj in ToTransformerEnd:
@@ -36,4 +36,5 @@ class TransformerTankEnd(TransformerEnd):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -21,28 +21,8 @@
 """An extension to the Core and Topology package that models information on the electrical characteristics of Transmission and Distribution networks. This package is used by network applications such as State Estimation, Load Flow and Optimal Power Flow.
 """
 
-from CIM15.CDPSM.Balanced.IEC61970.Wires.PhaseTapChangerLinear import PhaseTapChangerLinear
-from CIM15.CDPSM.Balanced.IEC61970.Wires.EnergyConsumer import EnergyConsumer
-from CIM15.CDPSM.Balanced.IEC61970.Wires.ACLineSegment import ACLineSegment
-from CIM15.CDPSM.Balanced.IEC61970.Wires.TransformerCoreAdmittance import TransformerCoreAdmittance
-from CIM15.CDPSM.Balanced.IEC61970.Wires.SynchronousMachine import SynchronousMachine
-from CIM15.CDPSM.Balanced.IEC61970.Wires.PowerTransformerEnd import PowerTransformerEnd
-from CIM15.CDPSM.Balanced.IEC61970.Wires.PhaseTapChangerAsymetrical import PhaseTapChangerAsymetrical
-from CIM15.CDPSM.Balanced.IEC61970.Wires.TransformerMeshImpedance import TransformerMeshImpedance
-from CIM15.CDPSM.Balanced.IEC61970.Wires.ProtectedSwitch import ProtectedSwitch
-from CIM15.CDPSM.Balanced.IEC61970.Wires.PhaseTapChangerNonLinear import PhaseTapChangerNonLinear
-from CIM15.CDPSM.Balanced.IEC61970.Wires.RatioTapChanger import RatioTapChanger
-from CIM15.CDPSM.Balanced.IEC61970.Wires.SeriesCompensator import SeriesCompensator
-from CIM15.CDPSM.Balanced.IEC61970.Wires.PhaseTapChanger import PhaseTapChanger
-from CIM15.CDPSM.Balanced.IEC61970.Wires.TransformerTankEnd import TransformerTankEnd
-from CIM15.CDPSM.Balanced.IEC61970.Wires.DCLineSegment import DCLineSegment
-from CIM15.CDPSM.Balanced.IEC61970.Wires.TapChanger import TapChanger
-from CIM15.CDPSM.Balanced.IEC61970.Wires.PhaseTapChangerSymetrical import PhaseTapChangerSymetrical
-from CIM15.CDPSM.Balanced.IEC61970.Wires.TransformerStarImpedance import TransformerStarImpedance
-from CIM15.CDPSM.Balanced.IEC61970.Wires.PowerTransformer import PowerTransformer
-from CIM15.CDPSM.Balanced.IEC61970.Wires.TransformerEnd import TransformerEnd
-from CIM15.CDPSM.Balanced.IEC61970.Wires.EnergySource import EnergySource
-from CIM15.CDPSM.Balanced.IEC61970.Wires.ShuntCompensator import ShuntCompensator
+import sys
+from CIM15.CDPSM.Balanced.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-13/CDPSM/Balanced#Wires"
 nsPrefix = "cimWires"
@@ -82,3 +62,29 @@ class TapChangerKind(str):
     """Values are: voltageAndPhaseControl, phaseControl, fixed, voltageControl
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "PhaseTapChangerLinear",
+    "EnergyConsumer",
+    "ACLineSegment",
+    "TransformerCoreAdmittance",
+    "SynchronousMachine",
+    "PowerTransformerEnd",
+    "PhaseTapChangerAsymetrical",
+    "TransformerMeshImpedance",
+    "ProtectedSwitch",
+    "PhaseTapChangerNonLinear",
+    "RatioTapChanger",
+    "SeriesCompensator",
+    "PhaseTapChanger",
+    "TransformerTankEnd",
+    "DCLineSegment",
+    "TapChanger",
+    "PhaseTapChangerSymetrical",
+    "TransformerStarImpedance",
+    "PowerTransformer",
+    "TransformerEnd",
+    "EnergySource",
+    "ShuntCompensator",
+])
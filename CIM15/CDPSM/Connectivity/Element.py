@@ -18,6 +18,13 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+from PyCIM.Element import RefList, EmptyRefList, EMPTY, ClassMeta, \
+    LazyModule, _MetaDescriptor, _getattr, _new, _reflist
+
+# Names imported from this module by the classes and packages of the CIM.
+__all__ = ["Element", "RefList", "EmptyRefList", "EMPTY", "ClassMeta",
+           "LazyModule"]
+
 
 class Element(object):
 
@@ -36,4 +43,11 @@ class Element(object):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
+
+    #: Flattened metadata of the class (see L{ClassMeta}).
+    _meta = _MetaDescriptor()
 
+    __getattr__ = _getattr
+    new = classmethod(_new)
+    _reflist = _reflist
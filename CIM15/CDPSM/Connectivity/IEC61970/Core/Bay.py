@@ -44,6 +44,7 @@ class Bay(EquipmentContainer):
     _enums = {}
     _refs = ["VoltageLevel", "Substation"]
     _many_refs = []
+    _inverses = {"VoltageLevel": "Bays", "Substation": "Bays"}
 
     def getVoltageLevel(self):
         """The association is used in the naming hierarchy.
@@ -52,13 +53,12 @@ class Bay(EquipmentContainer):
 
     def setVoltageLevel(self, value):
         if self._VoltageLevel is not None:
-            filtered = [x for x in self.VoltageLevel.Bays if x != self]
-            self._VoltageLevel._Bays = filtered
+            self._VoltageLevel._Bays.discard(self)
 
         self._VoltageLevel = value
         if self._VoltageLevel is not None:
             if self not in self._VoltageLevel._Bays:
-                self._VoltageLevel._Bays.append(self)
+                self._VoltageLevel._reflist("_Bays").append(self)
 
     VoltageLevel = property(getVoltageLevel, setVoltageLevel)
 
@@ -69,13 +69,12 @@ class Bay(EquipmentContainer):
 
     def setSubstation(self, value):
         if self._Substation is not None:
-            filtered = [x for x in self.Substation.Bays if x != self]
-            self._Substation._Bays = filtered
+            self._Substation._Bays.discard(self)
 
         self._Substation = value
         if self._Substation is not None:
             if self not in self._Substation._Bays:
-                self._Substation._Bays.append(self)
+                self._Substation._reflist("_Bays").append(self)
 
     Substation = property(getSubstation, setSubstation)
 
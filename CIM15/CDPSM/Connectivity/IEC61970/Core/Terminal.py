@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Connectivity.Element import RefList
 
 class Terminal(IdentifiedObject):
     """An electrical connection point to a piece of conducting equipment. Terminals are connected at physical connection points called 'connectivity nodes'.
@@ -38,8 +39,8 @@ class Terminal(IdentifiedObject):
         self._ConnectivityNode = None
         self.ConnectivityNode = ConnectivityNode
 
-        self._TransformerEnd = []
-        self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
+        if TransformerEnd is not None:
+            self.TransformerEnd = TransformerEnd
 
         self._ConductingEquipment = None
         self.ConductingEquipment = ConductingEquipment
@@ -52,6 +53,7 @@ class Terminal(IdentifiedObject):
     _enums = {"phases": "PhaseCode"}
     _refs = ["ConnectivityNode", "TransformerEnd", "ConductingEquipment"]
     _many_refs = ["TransformerEnd"]
+    _inverses = {"ConnectivityNode": "Terminals", "TransformerEnd": "Terminal", "ConductingEquipment": "Terminals"}
 
     def getConnectivityNode(self):
         """Terminals interconnect with zero impedance at a node.  Measurements on a node apply to all of its terminals.
@@ -60,13 +62,12 @@ class Terminal(IdentifiedObject):
 
     def setConnectivityNode(self, value):
         if self._ConnectivityNode is not None:
-            filtered = [x for x in self.ConnectivityNode.Terminals if x != self]
-            self._ConnectivityNode._Terminals = filtered
+            self._ConnectivityNode._Terminals.discard(self)
 
         self._ConnectivityNode = value
         if self._ConnectivityNode is not None:
             if self not in self._ConnectivityNode._Terminals:
-                self._ConnectivityNode._Terminals.append(self)
+                self._ConnectivityNode._reflist("_Terminals").append(self)
 
     ConnectivityNode = property(getConnectivityNode, setConnectivityNode)
 
@@ -76,7 +77,8 @@ class Terminal(IdentifiedObject):
         return self._TransformerEnd
 
     def setTransformerEnd(self, value):
-        for x in self._TransformerEnd:
+        value = RefList(value)
+        for x in list(self._TransformerEnd):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -99,13 +101,12 @@ class Terminal(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.Terminals if x != self]
-            self._ConductingEquipment._Terminals = filtered
+            self._ConductingEquipment._Terminals.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
             if self not in self._ConductingEquipment._Terminals:
-                self._ConductingEquipment._Terminals.append(self)
+                self._ConductingEquipment._reflist("_Terminals").append(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
@@ -21,24 +21,8 @@
 """Contains the core PowerSystemResource and ConductingEquipment entities shared by all applications plus common collections of those entities. Not all applications require all the Core entities.  This package does not depend on any other package except the Domain package, but most of the other packages have associations and generalizations that depend on it.
 """
 
-from CIM15.CDPSM.Connectivity.IEC61970.Core.Terminal import Terminal
-from CIM15.CDPSM.Connectivity.IEC61970.Core.Bay import Bay
-from CIM15.CDPSM.Connectivity.IEC61970.Core.NameTypeAuthority import NameTypeAuthority
-from CIM15.CDPSM.Connectivity.IEC61970.Core.VoltageLevel import VoltageLevel
-from CIM15.CDPSM.Connectivity.IEC61970.Core.SubGeographicalRegion import SubGeographicalRegion
-from CIM15.CDPSM.Connectivity.IEC61970.Core.PSRType import PSRType
-from CIM15.CDPSM.Connectivity.IEC61970.Core.EquipmentContainer import EquipmentContainer
-from CIM15.CDPSM.Connectivity.IEC61970.Core.ConductingEquipment import ConductingEquipment
-from CIM15.CDPSM.Connectivity.IEC61970.Core.GeographicalRegion import GeographicalRegion
-from CIM15.CDPSM.Connectivity.IEC61970.Core.NameType import NameType
-from CIM15.CDPSM.Connectivity.IEC61970.Core.Equipment import Equipment
-from CIM15.CDPSM.Connectivity.IEC61970.Core.IdentifiedObject import IdentifiedObject
-from CIM15.CDPSM.Connectivity.IEC61970.Core.ConnectivityNodeContainer import ConnectivityNodeContainer
-from CIM15.CDPSM.Connectivity.IEC61970.Core.Substation import Substation
-from CIM15.CDPSM.Connectivity.IEC61970.Core.ConnectivityNode import ConnectivityNode
-from CIM15.CDPSM.Connectivity.IEC61970.Core.Name import Name
-from CIM15.CDPSM.Connectivity.IEC61970.Core.BaseVoltage import BaseVoltage
-from CIM15.CDPSM.Connectivity.IEC61970.Core.PowerSystemResource import PowerSystemResource
+import sys
+from CIM15.CDPSM.Connectivity.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-13/CDPSM/Connectivity#Core"
 nsPrefix = "cimCore"
@@ -48,3 +32,25 @@ class PhaseCode(str):
     """Values are: s12N, BN, BC, ABN, s2N, N, ACN, BCN, ABCN, AC, s1N, AN, B, AB, C, A, CN, ABC
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Terminal",
+    "Bay",
+    "NameTypeAuthority",
+    "VoltageLevel",
+    "SubGeographicalRegion",
+    "PSRType",
+    "EquipmentContainer",
+    "ConductingEquipment",
+    "GeographicalRegion",
+    "NameType",
+    "Equipment",
+    "IdentifiedObject",
+    "ConnectivityNodeContainer",
+    "Substation",
+    "ConnectivityNode",
+    "Name",
+    "BaseVoltage",
+    "PowerSystemResource",
+])
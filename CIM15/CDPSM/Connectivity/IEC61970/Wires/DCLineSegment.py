@@ -36,4 +36,5 @@ class DCLineSegment(Conductor):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
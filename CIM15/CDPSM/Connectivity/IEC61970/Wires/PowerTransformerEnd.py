@@ -40,6 +40,7 @@ class PowerTransformerEnd(TransformerEnd):
     _enums = {}
     _refs = ["PowerTransformer"]
     _many_refs = []
+    _inverses = {"PowerTransformer": "PowerTransformerEnd"}
 
     def getPowerTransformer(self):
         
@@ -47,13 +48,12 @@ class PowerTransformerEnd(TransformerEnd):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.PowerTransformerEnd if x != self]
-            self._PowerTransformer._PowerTransformerEnd = filtered
+            self._PowerTransformer._PowerTransformerEnd.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
             if self not in self._PowerTransformer._PowerTransformerEnd:
-                self._PowerTransformer._PowerTransformerEnd.append(self)
+                self._PowerTransformer._reflist("_PowerTransformerEnd").append(self)
 
     PowerTransformer = property(getPowerTransformer, setPowerTransformer)
 
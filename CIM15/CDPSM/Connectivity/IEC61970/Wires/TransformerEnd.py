@@ -40,6 +40,7 @@ class TransformerEnd(IdentifiedObject):
     _enums = {}
     _refs = ["Terminal"]
     _many_refs = []
+    _inverses = {"Terminal": "TransformerEnd"}
 
     def getTerminal(self):
         """External terminal of the power transformer to which this end belongs.
@@ -48,13 +49,12 @@ class TransformerEnd(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.TransformerEnd if x != self]
-            self._Terminal._TransformerEnd = filtered
+            self._Terminal._TransformerEnd.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._TransformerEnd:
-                self._Terminal._TransformerEnd.append(self)
+                self._Terminal._reflist("_TransformerEnd").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
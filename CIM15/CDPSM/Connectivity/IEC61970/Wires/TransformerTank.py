@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Connectivity.IEC61970.Core.Equipment import Equipment
+from CIM15.CDPSM.Connectivity.Element import RefList
 
 class TransformerTank(Equipment):
     """An assembly of two or more coupled windings that transform electrical power between voltage levels. These windings are bound on a common core and place in the same tank. Transformer tank can be used to model both single-phase and 3-phase transformers.
@@ -33,8 +34,8 @@ class TransformerTank(Equipment):
         self._PowerTransformer = None
         self.PowerTransformer = PowerTransformer
 
-        self._TransformerTankEnds = []
-        self.TransformerTankEnds = [] if TransformerTankEnds is None else TransformerTankEnds
+        if TransformerTankEnds is not None:
+            self.TransformerTankEnds = TransformerTankEnds
 
         super(TransformerTank, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class TransformerTank(Equipment):
     _enums = {}
     _refs = ["PowerTransformer", "TransformerTankEnds"]
     _many_refs = ["TransformerTankEnds"]
+    _inverses = {"PowerTransformer": "TransformerTanks", "TransformerTankEnds": "TransformerTank"}
 
     def getPowerTransformer(self):
         """Bank this transformer belongs to.
@@ -52,13 +54,12 @@ class TransformerTank(Equipment):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.TransformerTanks if x != self]
-            self._PowerTransformer._TransformerTanks = filtered
+            self._PowerTransformer._TransformerTanks.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
             if self not in self._PowerTransformer._TransformerTanks:
-                self._PowerTransformer._TransformerTanks.append(self)
+                self._PowerTransformer._reflist("_TransformerTanks").append(self)
 
     PowerTransformer = property(getPowerTransformer, setPowerTransformer)
 
@@ -68,7 +69,8 @@ class TransformerTank(Equipment):
         return self._TransformerTankEnds
 
     def setTransformerTankEnds(self, value):
-        for x in self._TransformerTankEnds:
+        value = RefList(value)
+        for x in list(self._TransformerTankEnds):
             x.TransformerTank = None
         for y in value:
             y._TransformerTank = self
@@ -44,6 +44,7 @@ class TransformerTankEnd(TransformerEnd):
     _enums = {"phases": "PhaseCode"}
     _refs = ["TransformerTank"]
     _many_refs = []
+    _inverses = {"TransformerTank": "TransformerTankEnds"}
 
     def getTransformerTank(self):
         """Transformer this winding belongs to.
@@ -52,13 +53,12 @@ class TransformerTankEnd(TransformerEnd):
 
     def setTransformerTank(self, value):
         if self._TransformerTank is not None:
-            filtered = [x for x in self.TransformerTank.TransformerTankEnds if x != self]
-            self._TransformerTank._TransformerTankEnds = filtered
+            self._TransformerTank._TransformerTankEnds.discard(self)
 
         self._TransformerTank = value
         if self._TransformerTank is not None:
             if self not in self._TransformerTank._TransformerTankEnds:
-                self._TransformerTank._TransformerTankEnds.append(self)
+                self._TransformerTank._reflist("_TransformerTankEnds").append(self)
 
     TransformerTank = property(getTransformerTank, setTransformerTank)
 
@@ -36,4 +36,5 @@ class ShuntCompensatorPhase(PowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,8 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM15.CDPSM.Connectivity.IEC61970.WiresPhaseModel.ShuntCompensatorPhase import ShuntCompensatorPhase
-from CIM15.CDPSM.Connectivity.IEC61970.WiresPhaseModel.SwitchPhase import SwitchPhase
+import sys
+from CIM15.CDPSM.Connectivity.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-13/CDPSM/Connectivity#WiresPhaseModel"
 nsPrefix = "cimWiresPhaseModel"
@@ -30,3 +30,9 @@ class SinglePhaseKind(str):
     """Values are: C, N, s1, B, s2, A
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ShuntCompensatorPhase",
+    "SwitchPhase",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.CDPSM.Geographical.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.CDPSM.Geographical.Element import RefList
 
 class Location(IdentifiedObject):
     """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It can be defined with one or more postition points (coordinates) in a given coordinate system.
@@ -31,11 +32,11 @@ class Location(IdentifiedObject):
         @param PositionPoints: Sequence of position points describing this location, expressed in coordinate system 'Location.CoordinateSystem'.
         @param CoordinateSystem: Coordinate system used to describe position points of this location.
         """
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
-        self._PositionPoints = []
-        self.PositionPoints = [] if PositionPoints is None else PositionPoints
+        if PositionPoints is not None:
+            self.PositionPoints = PositionPoints
 
         self._CoordinateSystem = None
         self.CoordinateSystem = CoordinateSystem
@@ -48,6 +49,7 @@ class Location(IdentifiedObject):
     _enums = {}
     _refs = ["PowerSystemResources", "PositionPoints", "CoordinateSystem"]
     _many_refs = ["PowerSystemResources", "PositionPoints"]
+    _inverses = {"PowerSystemResources": "Location", "PositionPoints": "Location", "CoordinateSystem": "Location"}
 
     def getPowerSystemResources(self):
         """All power system resources at this location.
@@ -55,7 +57,8 @@ class Location(IdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
-        for x in self._PowerSystemResources:
+        value = RefList(value)
+        for x in list(self._PowerSystemResources):
             x.Location = None
         for y in value:
             y._Location = self
@@ -77,7 +80,8 @@ class Location(IdentifiedObject):
         return self._PositionPoints
 
     def setPositionPoints(self, value):
-        for x in self._PositionPoints:
+        value = RefList(value)
+        for x in list(self._PositionPoints):
             x.Location = None
         for y in value:
             y._Location = self
@@ -100,13 +104,12 @@ class Location(IdentifiedObject):
 
     def setCoordinateSystem(self, value):
         if self._CoordinateSystem is not None:
-            filtered = [x for x in self.CoordinateSystem.Location if x != self]
-            self._CoordinateSystem._Location = filtered
+            self._CoordinateSystem._Location.discard(self)
 
         self._CoordinateSystem = value
         if self._CoordinateSystem is not None:
             if self not in self._CoordinateSystem._Location:
-                self._CoordinateSystem._Location.append(self)
+                self._CoordinateSystem._reflist("_Location").append(self)
 
     CoordinateSystem = property(getCoordinateSystem, setCoordinateSystem)
 
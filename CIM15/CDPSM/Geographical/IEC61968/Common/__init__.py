@@ -21,10 +21,15 @@
 """This package contains the information classes that support distribution management in general.
 """
 
-from CIM15.CDPSM.Geographical.IEC61968.Common.Location import Location
-from CIM15.CDPSM.Geographical.IEC61968.Common.CoordinateSystem import CoordinateSystem
-from CIM15.CDPSM.Geographical.IEC61968.Common.PositionPoint import PositionPoint
+import sys
+from CIM15.CDPSM.Geographical.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-13/CDPSM/Geographical#Common"
 nsPrefix = "cimCommon"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Location",
+    "CoordinateSystem",
+    "PositionPoint",
+])
@@ -36,4 +36,5 @@ class ConductingEquipment(Equipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class Equipment(PowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.CDPSM.Geographical.Element import Element
+from CIM15.CDPSM.Geographical.Element import Element, RefList
 
 class IdentifiedObject(Element):
     """This is a root class to provide common identification for all classes needing identification and naming attributes
@@ -37,8 +37,8 @@ class IdentifiedObject(Element):
         #: The name is any free human readable and possibly non unique text naming the object.
         self.name = name
 
-        self._Names = []
-        self.Names = [] if Names is None else Names
+        if Names is not None:
+            self.Names = Names
 
         super(IdentifiedObject, self).__init__(*args, **kw_args)
 
@@ -48,6 +48,7 @@ class IdentifiedObject(Element):
     _enums = {}
     _refs = ["Names"]
     _many_refs = ["Names"]
+    _inverses = {"Names": "IdentifiedObject"}
 
     def getNames(self):
         """All names of this identified object.
@@ -55,7 +56,8 @@ class IdentifiedObject(Element):
         return self._Names
 
     def setNames(self, value):
-        for x in self._Names:
+        value = RefList(value)
+        for x in list(self._Names):
             x.IdentifiedObject = None
         for y in value:
             y._IdentifiedObject = self
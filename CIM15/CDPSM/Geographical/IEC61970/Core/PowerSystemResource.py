@@ -40,6 +40,7 @@ class PowerSystemResource(IdentifiedObject):
     _enums = {}
     _refs = ["Location"]
     _many_refs = []
+    _inverses = {"Location": "PowerSystemResources"}
 
     def getLocation(self):
         """Location of this power system resource.
@@ -48,13 +49,12 @@ class PowerSystemResource(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PowerSystemResources if x != self]
-            self._Location._PowerSystemResources = filtered
+            self._Location._PowerSystemResources.discard(self)
 
         self._Location = value
         if self._Location is not None:
             if self not in self._Location._PowerSystemResources:
-                self._Location._PowerSystemResources.append(self)
+                self._Location._reflist("_PowerSystemResources").append(self)
 
     Location = property(getLocation, setLocation)
 
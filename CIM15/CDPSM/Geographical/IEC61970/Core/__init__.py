@@ -21,13 +21,18 @@
 """Contains the core PowerSystemResource and ConductingEquipment entities shared by all applications plus common collections of those entities. Not all applications require all the Core entities.  This package does not depend on any other package except the Domain package, but most of the other packages have associations and generalizations that depend on it.
 """
 
-from CIM15.CDPSM.Geographical.IEC61970.Core.ConductingEquipment import ConductingEquipment
-from CIM15.CDPSM.Geographical.IEC61970.Core.NameType import NameType
-from CIM15.CDPSM.Geographical.IEC61970.Core.Equipment import Equipment
-from CIM15.CDPSM.Geographical.IEC61970.Core.IdentifiedObject import IdentifiedObject
-from CIM15.CDPSM.Geographical.IEC61970.Core.Name import Name
-from CIM15.CDPSM.Geographical.IEC61970.Core.PowerSystemResource import PowerSystemResource
+import sys
+from CIM15.CDPSM.Geographical.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-13/CDPSM/Geographical#Core"
 nsPrefix = "cimCore"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ConductingEquipment",
+    "NameType",
+    "Equipment",
+    "IdentifiedObject",
+    "Name",
+    "PowerSystemResource",
+])
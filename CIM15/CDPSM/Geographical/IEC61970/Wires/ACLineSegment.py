@@ -36,4 +36,5 @@ class ACLineSegment(ConductingEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class DCLineSegment(ConductingEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
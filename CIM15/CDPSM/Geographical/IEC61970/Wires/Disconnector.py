@@ -36,4 +36,5 @@ class Disconnector(ConductingEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class Line(PowerSystemResource):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
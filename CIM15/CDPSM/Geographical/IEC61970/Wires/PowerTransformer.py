@@ -36,4 +36,5 @@ class PowerTransformer(ConductingEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
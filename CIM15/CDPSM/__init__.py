@@ -20,6 +20,17 @@
 
 
 
+
+import sys
+from CIM15.Element import LazyModule
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15?profile=http://iec.ch/TC57/2011/iec61968-4/CDPSM"
 nsPrefix = "cdosm"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+], [
+    "Asset",
+    "Balanced",
+    "Connectivity",
+    "Geographical",
+])
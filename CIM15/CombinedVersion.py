@@ -44,4 +44,5 @@ class CombinedVersion(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
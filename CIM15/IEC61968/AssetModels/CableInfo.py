@@ -80,6 +80,7 @@ class CableInfo(ConductorInfo):
     _enums = {"outerJacketKind": "CableOuterJacketKind", "constructionKind": "CableConstructionKind", "shieldMaterial": "CableShieldMaterialKind"}
     _refs = ["DuctBankInfo"]
     _many_refs = []
+    _inverses = {"DuctBankInfo": "CableInfos"}
 
     def getDuctBankInfo(self):
         
@@ -87,13 +88,12 @@ class CableInfo(ConductorInfo):
 
     def setDuctBankInfo(self, value):
         if self._DuctBankInfo is not None:
-            filtered = [x for x in self.DuctBankInfo.CableInfos if x != self]
-            self._DuctBankInfo._CableInfos = filtered
+            self._DuctBankInfo._CableInfos.discard(self)
 
         self._DuctBankInfo = value
         if self._DuctBankInfo is not None:
             if self not in self._DuctBankInfo._CableInfos:
-                self._DuctBankInfo._CableInfos.append(self)
+                self._DuctBankInfo._reflist("_CableInfos").append(self)
 
     DuctBankInfo = property(getDuctBankInfo, setDuctBankInfo)
 
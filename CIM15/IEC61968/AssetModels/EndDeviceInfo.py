@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import RefList
 
 class EndDeviceInfo(AssetInfo):
     """End device data.End device data.
@@ -41,8 +42,8 @@ class EndDeviceInfo(AssetInfo):
         #: Rated voltage.
         self.ratedVoltage = ratedVoltage
 
-        self._EndDevices = []
-        self.EndDevices = [] if EndDevices is None else EndDevices
+        if EndDevices is not None:
+            self.EndDevices = EndDevices
 
         super(EndDeviceInfo, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class EndDeviceInfo(AssetInfo):
     _enums = {}
     _refs = ["EndDevices"]
     _many_refs = ["EndDevices"]
+    _inverses = {"EndDevices": "EndDeviceInfo"}
 
     def getEndDevices(self):
         """All end devices described with this data.
@@ -59,7 +61,8 @@ class EndDeviceInfo(AssetInfo):
         return self._EndDevices
 
     def setEndDevices(self, value):
-        for x in self._EndDevices:
+        value = RefList(value)
+        for x in list(self._EndDevices):
             x.EndDeviceInfo = None
         for y in value:
             y._EndDeviceInfo = self
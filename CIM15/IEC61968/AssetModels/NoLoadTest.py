@@ -60,6 +60,7 @@ class NoLoadTest(TransformerTest):
     _enums = {}
     _refs = ["EnergisedEnd"]
     _many_refs = []
+    _inverses = {"EnergisedEnd": "EnergisedEndNoLoadTest"}
 
     def getEnergisedEnd(self):
         """Transformer end that current is applied to in this no-load test.
@@ -68,13 +69,12 @@ class NoLoadTest(TransformerTest):
 
     def setEnergisedEnd(self, value):
         if self._EnergisedEnd is not None:
-            filtered = [x for x in self.EnergisedEnd.EnergisedEndNoLoadTest if x != self]
-            self._EnergisedEnd._EnergisedEndNoLoadTest = filtered
+            self._EnergisedEnd._EnergisedEndNoLoadTest.discard(self)
 
         self._EnergisedEnd = value
         if self._EnergisedEnd is not None:
             if self not in self._EnergisedEnd._EnergisedEndNoLoadTest:
-                self._EnergisedEnd._EnergisedEndNoLoadTest.append(self)
+                self._EnergisedEnd._reflist("_EnergisedEndNoLoadTest").append(self)
 
     EnergisedEnd = property(getEnergisedEnd, setEnergisedEnd)
 
@@ -64,6 +64,7 @@ class OpenCircuitTest(TransformerTest):
     _enums = {}
     _refs = ["OpenEnd", "EnergisedEnd"]
     _many_refs = []
+    _inverses = {"OpenEnd": "OpenEndOpenCircuitTests", "EnergisedEnd": "EnergisedEndOpenCircuitTests"}
 
     def getOpenEnd(self):
         """Transformer end measured for induced voltage and angle in this open-circuit test.
@@ -72,13 +73,12 @@ class OpenCircuitTest(TransformerTest):
 
     def setOpenEnd(self, value):
         if self._OpenEnd is not None:
-            filtered = [x for x in self.OpenEnd.OpenEndOpenCircuitTests if x != self]
-            self._OpenEnd._OpenEndOpenCircuitTests = filtered
+            self._OpenEnd._OpenEndOpenCircuitTests.discard(self)
 
         self._OpenEnd = value
         if self._OpenEnd is not None:
             if self not in self._OpenEnd._OpenEndOpenCircuitTests:
-                self._OpenEnd._OpenEndOpenCircuitTests.append(self)
+                self._OpenEnd._reflist("_OpenEndOpenCircuitTests").append(self)
 
     OpenEnd = property(getOpenEnd, setOpenEnd)
 
@@ -89,13 +89,12 @@ class OpenCircuitTest(TransformerTest):
 
     def setEnergisedEnd(self, value):
         if self._EnergisedEnd is not None:
-            filtered = [x for x in self.EnergisedEnd.EnergisedEndOpenCircuitTests if x != self]
-            self._EnergisedEnd._EnergisedEndOpenCircuitTests = filtered
+            self._EnergisedEnd._EnergisedEndOpenCircuitTests.discard(self)
 
         self._EnergisedEnd = value
         if self._EnergisedEnd is not None:
             if self not in self._EnergisedEnd._EnergisedEndOpenCircuitTests:
-                self._EnergisedEnd._EnergisedEndOpenCircuitTests.append(self)
+                self._EnergisedEnd._reflist("_EnergisedEndOpenCircuitTests").append(self)
 
     EnergisedEnd = property(getEnergisedEnd, setEnergisedEnd)
 
@@ -52,6 +52,7 @@ class OverheadConductorInfo(ConductorInfo):
     _enums = {}
     _refs = ["MountingPoint"]
     _many_refs = []
+    _inverses = {"MountingPoint": "OverheadConductors"}
 
     def getMountingPoint(self):
         
@@ -59,13 +60,12 @@ class OverheadConductorInfo(ConductorInfo):
 
     def setMountingPoint(self, value):
         if self._MountingPoint is not None:
-            filtered = [x for x in self.MountingPoint.OverheadConductors if x != self]
-            self._MountingPoint._OverheadConductors = filtered
+            self._MountingPoint._OverheadConductors.discard(self)
 
         self._MountingPoint = value
         if self._MountingPoint is not None:
             if self not in self._MountingPoint._OverheadConductors:
-                self._MountingPoint._OverheadConductors.append(self)
+                self._MountingPoint._reflist("_OverheadConductors").append(self)
 
     MountingPoint = property(getMountingPoint, setMountingPoint)
 
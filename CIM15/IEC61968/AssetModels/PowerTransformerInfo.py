@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import RefList
 
 class PowerTransformerInfo(AssetInfo):
     """Set of power transformer data, from an equipment library.Set of power transformer data, from an equipment library.
@@ -30,11 +31,11 @@ class PowerTransformerInfo(AssetInfo):
         @param TransformerTankInfo: Data for all the tanks described by this power transformer data.
         @param PowerTransformers: All power transformers that can be described with this power transformer data.
         """
-        self._TransformerTankInfo = []
-        self.TransformerTankInfo = [] if TransformerTankInfo is None else TransformerTankInfo
+        if TransformerTankInfo is not None:
+            self.TransformerTankInfo = TransformerTankInfo
 
-        self._PowerTransformers = []
-        self.PowerTransformers = [] if PowerTransformers is None else PowerTransformers
+        if PowerTransformers is not None:
+            self.PowerTransformers = PowerTransformers
 
         super(PowerTransformerInfo, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class PowerTransformerInfo(AssetInfo):
     _enums = {}
     _refs = ["TransformerTankInfo", "PowerTransformers"]
     _many_refs = ["TransformerTankInfo", "PowerTransformers"]
+    _inverses = {"TransformerTankInfo": "PowerTransformerInfo", "PowerTransformers": "PowerTransformerInfo"}
 
     def getTransformerTankInfo(self):
         """Data for all the tanks described by this power transformer data.
@@ -51,7 +53,8 @@ class PowerTransformerInfo(AssetInfo):
         return self._TransformerTankInfo
 
     def setTransformerTankInfo(self, value):
-        for x in self._TransformerTankInfo:
+        value = RefList(value)
+        for x in list(self._TransformerTankInfo):
             x.PowerTransformerInfo = None
         for y in value:
             y._PowerTransformerInfo = self
@@ -73,7 +76,8 @@ class PowerTransformerInfo(AssetInfo):
         return self._PowerTransformers
 
     def setPowerTransformers(self, value):
-        for x in self._PowerTransformers:
+        value = RefList(value)
+        for x in list(self._PowerTransformers):
             x.PowerTransformerInfo = None
         for y in value:
             y._PowerTransformerInfo = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.AssetModels.TransformerTest import TransformerTest
+from CIM15.Element import RefList
 
 class ShortCircuitTest(TransformerTest):
     """Short-circuit test results determine mesh impedance parameters. They include load losses and leakage impedances.  For three-phase windings, the excitation can be positive sequence (the default) or zero sequence. There must be at least one grounded winding.Short-circuit test results determine mesh impedance parameters. They include load losses and leakage impedances.  For three-phase windings, the excitation can be positive sequence (the default) or zero sequence. There must be at least one grounded winding.
@@ -54,8 +55,8 @@ class ShortCircuitTest(TransformerTest):
         #: Tap step number for the energised end of the test pair.
         self.energisedEndStep = energisedEndStep
 
-        self._GroundedEnds = []
-        self.GroundedEnds = [] if GroundedEnds is None else GroundedEnds
+        if GroundedEnds is not None:
+            self.GroundedEnds = GroundedEnds
 
         self._EnergisedEnd = None
         self.EnergisedEnd = EnergisedEnd
@@ -68,6 +69,7 @@ class ShortCircuitTest(TransformerTest):
     _enums = {}
     _refs = ["GroundedEnds", "EnergisedEnd"]
     _many_refs = ["GroundedEnds"]
+    _inverses = {"GroundedEnds": "GroundedEndShortCircuitTests", "EnergisedEnd": "EnergisedEndShortCircuitTests"}
 
     def getGroundedEnds(self):
         """All ends short-circuited in this short-circuit test.
@@ -76,20 +78,19 @@ class ShortCircuitTest(TransformerTest):
 
     def setGroundedEnds(self, value):
         for p in self._GroundedEnds:
-            filtered = [q for q in p.GroundedEndShortCircuitTests if q != self]
-            self._GroundedEnds._GroundedEndShortCircuitTests = filtered
+            p._GroundedEndShortCircuitTests.discard(self)
         for r in value:
             if self not in r._GroundedEndShortCircuitTests:
-                r._GroundedEndShortCircuitTests.append(self)
-        self._GroundedEnds = value
+                r._reflist("_GroundedEndShortCircuitTests").append(self)
+        self._GroundedEnds = RefList(value)
 
     GroundedEnds = property(getGroundedEnds, setGroundedEnds)
 
     def addGroundedEnds(self, *GroundedEnds):
         for obj in GroundedEnds:
             if self not in obj._GroundedEndShortCircuitTests:
-                obj._GroundedEndShortCircuitTests.append(self)
-            self._GroundedEnds.append(obj)
+                obj._reflist("_GroundedEndShortCircuitTests").append(self)
+            self._reflist("_GroundedEnds").append(obj)
 
     def removeGroundedEnds(self, *GroundedEnds):
         for obj in GroundedEnds:
@@ -104,13 +105,12 @@ class ShortCircuitTest(TransformerTest):
 
     def setEnergisedEnd(self, value):
         if self._EnergisedEnd is not None:
-            filtered = [x for x in self.EnergisedEnd.EnergisedEndShortCircuitTests if x != self]
-            self._EnergisedEnd._EnergisedEndShortCircuitTests = filtered
+            self._EnergisedEnd._EnergisedEndShortCircuitTests.discard(self)
 
         self._EnergisedEnd = value
         if self._EnergisedEnd is not None:
             if self not in self._EnergisedEnd._EnergisedEndShortCircuitTests:
-                self._EnergisedEnd._EnergisedEndShortCircuitTests.append(self)
+                self._EnergisedEnd._reflist("_EnergisedEndShortCircuitTests").append(self)
 
     EnergisedEnd = property(getEnergisedEnd, setEnergisedEnd)
 
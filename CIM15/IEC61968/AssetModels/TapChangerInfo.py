@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import RefList
 
 class TapChangerInfo(AssetInfo):
     """Tap changer data.Tap changer data.
@@ -89,8 +90,8 @@ class TapChangerInfo(AssetInfo):
         #: Basic Insulation Level (BIL) expressed as the impulse crest voltage of a nominal wave, typically 1.2 X 50 microsecond. This is a measure of the ability of the insulation to withstand very high voltage surges.
         self.bil = bil
 
-        self._TapChangers = []
-        self.TapChangers = [] if TapChangers is None else TapChangers
+        if TapChangers is not None:
+            self.TapChangers = TapChangers
 
         super(TapChangerInfo, self).__init__(*args, **kw_args)
 
@@ -100,6 +101,7 @@ class TapChangerInfo(AssetInfo):
     _enums = {}
     _refs = ["TapChangers"]
     _many_refs = ["TapChangers"]
+    _inverses = {"TapChangers": "TapChangerInfo"}
 
     def getTapChangers(self):
         """All tap changers having this data.
@@ -107,7 +109,8 @@ class TapChangerInfo(AssetInfo):
         return self._TapChangers
 
     def setTapChangers(self, value):
-        for x in self._TapChangers:
+        value = RefList(value)
+        for x in list(self._TapChangers):
             x.TapChangerInfo = None
         for y in value:
             y._TapChangerInfo = self
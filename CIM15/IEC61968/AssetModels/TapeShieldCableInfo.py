@@ -44,4 +44,5 @@ class TapeShieldCableInfo(CableInfo):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
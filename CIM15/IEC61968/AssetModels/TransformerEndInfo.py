@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import RefList
 
 class TransformerEndInfo(AssetInfo):
     """Transformer end data.Transformer end data.
@@ -74,32 +75,32 @@ class TransformerEndInfo(AssetInfo):
         #: Winding phase angle where 360 degrees are represented with clock hours, so the valid values are {0, ..., 11}. For example, to express winding code 'Dyn11', set attributes as follows: 'connectionKind' = Yn and 'phaseAngleClock' = 11.
         self.phaseAngleClock = phaseAngleClock
 
-        self._FromMeshImpedance = []
-        self.FromMeshImpedance = [] if FromMeshImpedance is None else FromMeshImpedance
+        if FromMeshImpedance is not None:
+            self.FromMeshImpedance = FromMeshImpedance
 
-        self._EnergisedEndNoLoadTest = []
-        self.EnergisedEndNoLoadTest = [] if EnergisedEndNoLoadTest is None else EnergisedEndNoLoadTest
+        if EnergisedEndNoLoadTest is not None:
+            self.EnergisedEndNoLoadTest = EnergisedEndNoLoadTest
 
-        self._OpenEndOpenCircuitTests = []
-        self.OpenEndOpenCircuitTests = [] if OpenEndOpenCircuitTests is None else OpenEndOpenCircuitTests
+        if OpenEndOpenCircuitTests is not None:
+            self.OpenEndOpenCircuitTests = OpenEndOpenCircuitTests
 
-        self._ToMeshImpedance = []
-        self.ToMeshImpedance = [] if ToMeshImpedance is None else ToMeshImpedance
+        if ToMeshImpedance is not None:
+            self.ToMeshImpedance = ToMeshImpedance
 
-        self._TransformerEnd = []
-        self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
+        if TransformerEnd is not None:
+            self.TransformerEnd = TransformerEnd
 
         self._TransformerTankInfo = None
         self.TransformerTankInfo = TransformerTankInfo
 
-        self._EnergisedEndOpenCircuitTests = []
-        self.EnergisedEndOpenCircuitTests = [] if EnergisedEndOpenCircuitTests is None else EnergisedEndOpenCircuitTests
+        if EnergisedEndOpenCircuitTests is not None:
+            self.EnergisedEndOpenCircuitTests = EnergisedEndOpenCircuitTests
 
-        self._GroundedEndShortCircuitTests = []
-        self.GroundedEndShortCircuitTests = [] if GroundedEndShortCircuitTests is None else GroundedEndShortCircuitTests
+        if GroundedEndShortCircuitTests is not None:
+            self.GroundedEndShortCircuitTests = GroundedEndShortCircuitTests
 
-        self._EnergisedEndShortCircuitTests = []
-        self.EnergisedEndShortCircuitTests = [] if EnergisedEndShortCircuitTests is None else EnergisedEndShortCircuitTests
+        if EnergisedEndShortCircuitTests is not None:
+            self.EnergisedEndShortCircuitTests = EnergisedEndShortCircuitTests
 
         self._CoreAdmittance = None
         self.CoreAdmittance = CoreAdmittance
@@ -112,6 +113,7 @@ class TransformerEndInfo(AssetInfo):
     _enums = {"connectionKind": "WindingConnection"}
     _refs = ["FromMeshImpedance", "EnergisedEndNoLoadTest", "OpenEndOpenCircuitTests", "ToMeshImpedance", "TransformerEnd", "TransformerTankInfo", "EnergisedEndOpenCircuitTests", "GroundedEndShortCircuitTests", "EnergisedEndShortCircuitTests", "CoreAdmittance"]
     _many_refs = ["FromMeshImpedance", "EnergisedEndNoLoadTest", "OpenEndOpenCircuitTests", "ToMeshImpedance", "TransformerEnd", "EnergisedEndOpenCircuitTests", "GroundedEndShortCircuitTests", "EnergisedEndShortCircuitTests"]
+    _inverses = {"FromMeshImpedance": "FromTransformerEndInfo", "EnergisedEndNoLoadTest": "EnergisedEnd", "OpenEndOpenCircuitTests": "OpenEnd", "ToMeshImpedance": "ToTransformerEndInfo", "TransformerEnd": "TransformerEndInfo", "TransformerTankInfo": "TransformerEndInfos", "EnergisedEndOpenCircuitTests": "EnergisedEnd", "GroundedEndShortCircuitTests": "GroundedEnds", "EnergisedEndShortCircuitTests": "EnergisedEnd", "CoreAdmittance": "TransformerEndInfo"}
 
     def getFromMeshImpedance(self):
         """All mesh impedances between this 'to' and other 'from' transformer ends.
@@ -119,7 +121,8 @@ class TransformerEndInfo(AssetInfo):
         return self._FromMeshImpedance
 
     def setFromMeshImpedance(self, value):
-        for x in self._FromMeshImpedance:
+        value = RefList(value)
+        for x in list(self._FromMeshImpedance):
             x.FromTransformerEndInfo = None
         for y in value:
             y._FromTransformerEndInfo = self
@@ -141,7 +144,8 @@ class TransformerEndInfo(AssetInfo):
         return self._EnergisedEndNoLoadTest
 
     def setEnergisedEndNoLoadTest(self, value):
-        for x in self._EnergisedEndNoLoadTest:
+        value = RefList(value)
+        for x in list(self._EnergisedEndNoLoadTest):
             x.EnergisedEnd = None
         for y in value:
             y._EnergisedEnd = self
@@ -163,7 +167,8 @@ class TransformerEndInfo(AssetInfo):
         return self._OpenEndOpenCircuitTests
 
     def setOpenEndOpenCircuitTests(self, value):
-        for x in self._OpenEndOpenCircuitTests:
+        value = RefList(value)
+        for x in list(self._OpenEndOpenCircuitTests):
             x.OpenEnd = None
         for y in value:
             y._OpenEnd = self
@@ -186,20 +191,19 @@ class TransformerEndInfo(AssetInfo):
 
     def setToMeshImpedance(self, value):
         for p in self._ToMeshImpedance:
-            filtered = [q for q in p.ToTransformerEndInfo if q != self]
-            self._ToMeshImpedance._ToTransformerEndInfo = filtered
+            p._ToTransformerEndInfo.discard(self)
         for r in value:
             if self not in r._ToTransformerEndInfo:
-                r._ToTransformerEndInfo.append(self)
-        self._ToMeshImpedance = value
+                r._reflist("_ToTransformerEndInfo").append(self)
+        self._ToMeshImpedance = RefList(value)
 
     ToMeshImpedance = property(getToMeshImpedance, setToMeshImpedance)
 
     def addToMeshImpedance(self, *ToMeshImpedance):
         for obj in ToMeshImpedance:
             if self not in obj._ToTransformerEndInfo:
-                obj._ToTransformerEndInfo.append(self)
-            self._ToMeshImpedance.append(obj)
+                obj._reflist("_ToTransformerEndInfo").append(self)
+            self._reflist("_ToMeshImpedance").append(obj)
 
     def removeToMeshImpedance(self, *ToMeshImpedance):
         for obj in ToMeshImpedance:
@@ -213,7 +217,8 @@ class TransformerEndInfo(AssetInfo):
         return self._TransformerEnd
 
     def setTransformerEnd(self, value):
-        for x in self._TransformerEnd:
+        value = RefList(value)
+        for x in list(self._TransformerEnd):
             x.TransformerEndInfo = None
         for y in value:
             y._TransformerEndInfo = self
@@ -236,13 +241,12 @@ class TransformerEndInfo(AssetInfo):
 
     def setTransformerTankInfo(self, value):
         if self._TransformerTankInfo is not None:
-            filtered = [x for x in self.TransformerTankInfo.TransformerEndInfos if x != self]
-            self._TransformerTankInfo._TransformerEndInfos = filtered
+            self._TransformerTankInfo._TransformerEndInfos.discard(self)
 
         self._TransformerTankInfo = value
         if self._TransformerTankInfo is not None:
             if self not in self._TransformerTankInfo._TransformerEndInfos:
-                self._TransformerTankInfo._TransformerEndInfos.append(self)
+                self._TransformerTankInfo._reflist("_TransformerEndInfos").append(self)
 
     TransformerTankInfo = property(getTransformerTankInfo, setTransformerTankInfo)
 
@@ -252,7 +256,8 @@ class TransformerEndInfo(AssetInfo):
         return self._EnergisedEndOpenCircuitTests
 
     def setEnergisedEndOpenCircuitTests(self, value):
-        for x in self._EnergisedEndOpenCircuitTests:
+        value = RefList(value)
+        for x in list(self._EnergisedEndOpenCircuitTests):
             x.EnergisedEnd = None
         for y in value:
             y._EnergisedEnd = self
@@ -275,20 +280,19 @@ class TransformerEndInfo(AssetInfo):
 
     def setGroundedEndShortCircuitTests(self, value):
         for p in self._GroundedEndShortCircuitTests:
-            filtered = [q for q in p.GroundedEnds if q != self]
-            self._GroundedEndShortCircuitTests._GroundedEnds = filtered
+            p._GroundedEnds.discard(self)
         for r in value:
             if self not in r._GroundedEnds:
-                r._GroundedEnds.append(self)
-        self._GroundedEndShortCircuitTests = value
+                r._reflist("_GroundedEnds").append(self)
+        self._GroundedEndShortCircuitTests = RefList(value)
 
     GroundedEndShortCircuitTests = property(getGroundedEndShortCircuitTests, setGroundedEndShortCircuitTests)
 
     def addGroundedEndShortCircuitTests(self, *GroundedEndShortCircuitTests):
         for obj in GroundedEndShortCircuitTests:
             if self not in obj._GroundedEnds:
-                obj._GroundedEnds.append(self)
-            self._GroundedEndShortCircuitTests.append(obj)
+                obj._reflist("_GroundedEnds").append(self)
+            self._reflist("_GroundedEndShortCircuitTests").append(obj)
 
     def removeGroundedEndShortCircuitTests(self, *GroundedEndShortCircuitTests):
         for obj in GroundedEndShortCircuitTests:
@@ -302,7 +306,8 @@ class TransformerEndInfo(AssetInfo):
         return self._EnergisedEndShortCircuitTests
 
     def setEnergisedEndShortCircuitTests(self, value):
-        for x in self._EnergisedEndShortCircuitTests:
+        value = RefList(value)
+        for x in list(self._EnergisedEndShortCircuitTests):
             x.EnergisedEnd = None
         for y in value:
             y._EnergisedEnd = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import RefList
 
 class TransformerTankInfo(AssetInfo):
     """Set of transformer tank data, from an equipment library.Set of transformer tank data, from an equipment library.
@@ -33,20 +34,20 @@ class TransformerTankInfo(AssetInfo):
         @param TransformerAssetModels:
         @param TransformerTanks: All transformer tanks that can be described with this transformer tank data.
         """
-        self._TransformerAssets = []
-        self.TransformerAssets = [] if TransformerAssets is None else TransformerAssets
+        if TransformerAssets is not None:
+            self.TransformerAssets = TransformerAssets
 
-        self._TransformerEndInfos = []
-        self.TransformerEndInfos = [] if TransformerEndInfos is None else TransformerEndInfos
+        if TransformerEndInfos is not None:
+            self.TransformerEndInfos = TransformerEndInfos
 
         self._PowerTransformerInfo = None
         self.PowerTransformerInfo = PowerTransformerInfo
 
-        self._TransformerAssetModels = []
-        self.TransformerAssetModels = [] if TransformerAssetModels is None else TransformerAssetModels
+        if TransformerAssetModels is not None:
+            self.TransformerAssetModels = TransformerAssetModels
 
-        self._TransformerTanks = []
-        self.TransformerTanks = [] if TransformerTanks is None else TransformerTanks
+        if TransformerTanks is not None:
+            self.TransformerTanks = TransformerTanks
 
         super(TransformerTankInfo, self).__init__(*args, **kw_args)
 
@@ -56,13 +57,15 @@ class TransformerTankInfo(AssetInfo):
     _enums = {}
     _refs = ["TransformerAssets", "TransformerEndInfos", "PowerTransformerInfo", "TransformerAssetModels", "TransformerTanks"]
     _many_refs = ["TransformerAssets", "TransformerEndInfos", "TransformerAssetModels", "TransformerTanks"]
+    _inverses = {"TransformerAssets": "TransformerInfo", "TransformerEndInfos": "TransformerTankInfo", "PowerTransformerInfo": "TransformerTankInfo", "TransformerAssetModels": "TransformerInfo", "TransformerTanks": "TransformerTankInfo"}
 
     def getTransformerAssets(self):
         
         return self._TransformerAssets
 
     def setTransformerAssets(self, value):
-        for x in self._TransformerAssets:
+        value = RefList(value)
+        for x in list(self._TransformerAssets):
             x.TransformerInfo = None
         for y in value:
             y._TransformerInfo = self
@@ -84,7 +87,8 @@ class TransformerTankInfo(AssetInfo):
         return self._TransformerEndInfos
 
     def setTransformerEndInfos(self, value):
-        for x in self._TransformerEndInfos:
+        value = RefList(value)
+        for x in list(self._TransformerEndInfos):
             x.TransformerTankInfo = None
         for y in value:
             y._TransformerTankInfo = self
@@ -107,13 +111,12 @@ class TransformerTankInfo(AssetInfo):
 
     def setPowerTransformerInfo(self, value):
         if self._PowerTransformerInfo is not None:
-            filtered = [x for x in self.PowerTransformerInfo.TransformerTankInfo if x != self]
-            self._PowerTransformerInfo._TransformerTankInfo = filtered
+            self._PowerTransformerInfo._TransformerTankInfo.discard(self)
 
         self._PowerTransformerInfo = value
         if self._PowerTransformerInfo is not None:
             if self not in self._PowerTransformerInfo._TransformerTankInfo:
-                self._PowerTransformerInfo._TransformerTankInfo.append(self)
+                self._PowerTransformerInfo._reflist("_TransformerTankInfo").append(self)
 
     PowerTransformerInfo = property(getPowerTransformerInfo, setPowerTransformerInfo)
 
@@ -122,7 +125,8 @@ class TransformerTankInfo(AssetInfo):
         return self._TransformerAssetModels
 
     def setTransformerAssetModels(self, value):
-        for x in self._TransformerAssetModels:
+        value = RefList(value)
+        for x in list(self._TransformerAssetModels):
             x.TransformerInfo = None
         for y in value:
             y._TransformerInfo = self
@@ -144,7 +148,8 @@ class TransformerTankInfo(AssetInfo):
         return self._TransformerTanks
 
     def setTransformerTanks(self, value):
-        for x in self._TransformerTanks:
+        value = RefList(value)
+        for x in list(self._TransformerTanks):
             x.TransformerTankInfo = None
         for y in value:
             y._TransformerTankInfo = self
@@ -56,6 +56,7 @@ class WireArrangement(IdentifiedObject):
     _enums = {}
     _refs = ["ConductorInfo", "WireType"]
     _many_refs = []
+    _inverses = {"ConductorInfo": "WireArrangements", "WireType": "WireArrangements"}
 
     def getConductorInfo(self):
         """Conductor data this wire arrangement belongs to.
@@ -64,13 +65,12 @@ class WireArrangement(IdentifiedObject):
 
     def setConductorInfo(self, value):
         if self._ConductorInfo is not None:
-            filtered = [x for x in self.ConductorInfo.WireArrangements if x != self]
-            self._ConductorInfo._WireArrangements = filtered
+            self._ConductorInfo._WireArrangements.discard(self)
 
         self._ConductorInfo = value
         if self._ConductorInfo is not None:
             if self not in self._ConductorInfo._WireArrangements:
-                self._ConductorInfo._WireArrangements.append(self)
+                self._ConductorInfo._reflist("_WireArrangements").append(self)
 
     ConductorInfo = property(getConductorInfo, setConductorInfo)
 
@@ -81,13 +81,12 @@ class WireArrangement(IdentifiedObject):
 
     def setWireType(self, value):
         if self._WireType is not None:
-            filtered = [x for x in self.WireType.WireArrangements if x != self]
-            self._WireType._WireArrangements = filtered
+            self._WireType._WireArrangements.discard(self)
 
         self._WireType = value
         if self._WireType is not None:
             if self not in self._WireType._WireArrangements:
-                self._WireType._WireArrangements.append(self)
+                self._WireType._reflist("_WireArrangements").append(self)
 
     WireType = property(getWireType, setWireType)
 
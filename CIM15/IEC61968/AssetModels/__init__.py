@@ -21,22 +21,8 @@
 """This package is an extension of Assets package and contains the core information classes that support asset management and different network and work planning applications with specialized AssetInfo subclasses. They hold attributes that can be referenced by not only Asset-s or AssetModel-s but also by ConductingEquipment-s.
 """
 
-from CIM15.IEC61968.AssetModels.ShortCircuitTest import ShortCircuitTest
-from CIM15.IEC61968.AssetModels.EndDeviceInfo import EndDeviceInfo
-from CIM15.IEC61968.AssetModels.WireType import WireType
-from CIM15.IEC61968.AssetModels.TapeShieldCableInfo import TapeShieldCableInfo
-from CIM15.IEC61968.AssetModels.ConductorInfo import ConductorInfo
-from CIM15.IEC61968.AssetModels.TapChangerInfo import TapChangerInfo
-from CIM15.IEC61968.AssetModels.TransformerTankInfo import TransformerTankInfo
-from CIM15.IEC61968.AssetModels.PowerTransformerInfo import PowerTransformerInfo
-from CIM15.IEC61968.AssetModels.OpenCircuitTest import OpenCircuitTest
-from CIM15.IEC61968.AssetModels.CableInfo import CableInfo
-from CIM15.IEC61968.AssetModels.TransformerEndInfo import TransformerEndInfo
-from CIM15.IEC61968.AssetModels.NoLoadTest import NoLoadTest
-from CIM15.IEC61968.AssetModels.OverheadConductorInfo import OverheadConductorInfo
-from CIM15.IEC61968.AssetModels.ConcentricNeutralCableInfo import ConcentricNeutralCableInfo
-from CIM15.IEC61968.AssetModels.WireArrangement import WireArrangement
-from CIM15.IEC61968.AssetModels.TransformerTest import TransformerTest
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#AssetModels"
 nsPrefix = "cimAssetModels"
@@ -71,3 +57,23 @@ class ConductorInsulationKind(str):
     """Values are: treeRetardantCrosslinkedPolyethylene, butyl, highPressureFluidFilled, other, varnishedCambricCloth, siliconRubber, beltedPilc, crosslinkedPolyethylene, oilPaper, lowCapacitanceRubber, asbestosAndVarnishedCambric, treeResistantHighMolecularWeightPolyethylene, unbeltedPilc, ozoneResistantRubber, ethylenePropyleneRubber, highMolecularWeightPolyethylene, varnishedDacronGlass, rubber
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ShortCircuitTest",
+    "EndDeviceInfo",
+    "WireType",
+    "TapeShieldCableInfo",
+    "ConductorInfo",
+    "TapChangerInfo",
+    "TransformerTankInfo",
+    "PowerTransformerInfo",
+    "OpenCircuitTest",
+    "CableInfo",
+    "TransformerEndInfo",
+    "NoLoadTest",
+    "OverheadConductorInfo",
+    "ConcentricNeutralCableInfo",
+    "WireArrangement",
+    "TransformerTest",
+])
@@ -46,4 +46,5 @@ class AcceptanceTest(object):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Asset(IdentifiedObject):
     """Tangible resource of the utility, including power system equipment, cabinets, buildings, etc. For electrical network equipment, the role of the asset is defined through PowerSystemResource and its subclasses, defined mainly in the Wires model (refer to IEC61970-301 and model package IEC61970::Wires). Asset description places emphasis on the physical characteristics of the equipment fulfilling that role.Tangible resource of the utility, including power system equipment, cabinets, buildings, etc. For electrical network equipment, the role of the asset is defined through PowerSystemResource and its subclasses, defined mainly in the Wires model (refer to IEC61970-301 and model package IEC61970::Wires). Asset description places emphasis on the physical characteristics of the equipment fulfilling that role.
@@ -102,28 +103,28 @@ class Asset(IdentifiedObject):
         #: Lot number for this asset. Even for the same model and version number, many assets are manufactured in lots.
         self.lotNumber = lotNumber
 
-        self._DocumentRoles = []
-        self.DocumentRoles = [] if DocumentRoles is None else DocumentRoles
+        if DocumentRoles is not None:
+            self.DocumentRoles = DocumentRoles
 
-        self._Mediums = []
-        self.Mediums = [] if Mediums is None else Mediums
+        if Mediums is not None:
+            self.Mediums = Mediums
 
-        self._ErpRecDeliveryItems = []
-        self.ErpRecDeliveryItems = [] if ErpRecDeliveryItems is None else ErpRecDeliveryItems
+        if ErpRecDeliveryItems is not None:
+            self.ErpRecDeliveryItems = ErpRecDeliveryItems
 
-        self._Ratings = []
-        self.Ratings = [] if Ratings is None else Ratings
+        if Ratings is not None:
+            self.Ratings = Ratings
 
-        self._ToAssetRoles = []
-        self.ToAssetRoles = [] if ToAssetRoles is None else ToAssetRoles
+        if ToAssetRoles is not None:
+            self.ToAssetRoles = ToAssetRoles
 
         self.electronicAddress = electronicAddress
 
-        self._FromAssetRoles = []
-        self.FromAssetRoles = [] if FromAssetRoles is None else FromAssetRoles
+        if FromAssetRoles is not None:
+            self.FromAssetRoles = FromAssetRoles
 
-        self._AssetFunctions = []
-        self.AssetFunctions = [] if AssetFunctions is None else AssetFunctions
+        if AssetFunctions is not None:
+            self.AssetFunctions = AssetFunctions
 
         self._ErpItemMaster = None
         self.ErpItemMaster = ErpItemMaster
@@ -131,8 +132,8 @@ class Asset(IdentifiedObject):
         self._ErpInventory = None
         self.ErpInventory = ErpInventory
 
-        self._ReliabilityInfos = []
-        self.ReliabilityInfos = [] if ReliabilityInfos is None else ReliabilityInfos
+        if ReliabilityInfos is not None:
+            self.ReliabilityInfos = ReliabilityInfos
 
         self._AssetInfo = None
         self.AssetInfo = AssetInfo
@@ -142,40 +143,40 @@ class Asset(IdentifiedObject):
 
         self.acceptanceTest = acceptanceTest
 
-        self._ErpOrganisationRoles = []
-        self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
+        if ErpOrganisationRoles is not None:
+            self.ErpOrganisationRoles = ErpOrganisationRoles
 
-        self._ScheduledEvents = []
-        self.ScheduledEvents = [] if ScheduledEvents is None else ScheduledEvents
+        if ScheduledEvents is not None:
+            self.ScheduledEvents = ScheduledEvents
 
         self._AssetContainer = None
         self.AssetContainer = AssetContainer
 
-        self._AssetPropertyCurves = []
-        self.AssetPropertyCurves = [] if AssetPropertyCurves is None else AssetPropertyCurves
+        if AssetPropertyCurves is not None:
+            self.AssetPropertyCurves = AssetPropertyCurves
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._ActivityRecords = []
-        self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
+        if ActivityRecords is not None:
+            self.ActivityRecords = ActivityRecords
 
         self._Location = None
         self.Location = Location
 
         self.status = status
 
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         self._FinancialInfo = None
         self.FinancialInfo = FinancialInfo
 
-        self._Properties = []
-        self.Properties = [] if Properties is None else Properties
+        if Properties is not None:
+            self.Properties = Properties
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         super(Asset, self).__init__(*args, **kw_args)
 
@@ -185,13 +186,15 @@ class Asset(IdentifiedObject):
     _enums = {}
     _refs = ["DocumentRoles", "Mediums", "ErpRecDeliveryItems", "Ratings", "ToAssetRoles", "electronicAddress", "FromAssetRoles", "AssetFunctions", "ErpItemMaster", "ErpInventory", "ReliabilityInfos", "AssetInfo", "WorkTask", "acceptanceTest", "ErpOrganisationRoles", "ScheduledEvents", "AssetContainer", "AssetPropertyCurves", "ChangeItems", "ActivityRecords", "Location", "status", "PowerSystemResources", "FinancialInfo", "Properties", "Measurements"]
     _many_refs = ["DocumentRoles", "Mediums", "ErpRecDeliveryItems", "Ratings", "ToAssetRoles", "FromAssetRoles", "AssetFunctions", "ReliabilityInfos", "ErpOrganisationRoles", "ScheduledEvents", "AssetPropertyCurves", "ChangeItems", "ActivityRecords", "PowerSystemResources", "Properties", "Measurements"]
+    _inverses = {"DocumentRoles": "Asset", "Mediums": "Assets", "ErpRecDeliveryItems": "Assets", "Ratings": "RatingAssets", "ToAssetRoles": "FromAsset", "FromAssetRoles": "ToAsset", "AssetFunctions": "Asset", "ErpItemMaster": "Asset", "ErpInventory": "Asset", "ReliabilityInfos": "Assets", "AssetInfo": "Assets", "WorkTask": "Assets", "ErpOrganisationRoles": "Asset", "ScheduledEvents": "Assets", "AssetContainer": "Assets", "AssetPropertyCurves": "Assets", "ChangeItems": "Asset", "ActivityRecords": "Assets", "Location": "Assets", "PowerSystemResources": "Assets", "FinancialInfo": "Asset", "Properties": "PropertyAssets", "Measurements": "Asset"}
 
     def getDocumentRoles(self):
         
         return self._DocumentRoles
 
     def setDocumentRoles(self, value):
-        for x in self._DocumentRoles:
+        value = RefList(value)
+        for x in list(self._DocumentRoles):
             x.Asset = None
         for y in value:
             y._Asset = self
@@ -213,20 +216,19 @@ class Asset(IdentifiedObject):
 
     def setMediums(self, value):
         for p in self._Mediums:
-            filtered = [q for q in p.Assets if q != self]
-            self._Mediums._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
             if self not in r._Assets:
-                r._Assets.append(self)
-        self._Mediums = value
+                r._reflist("_Assets").append(self)
+        self._Mediums = RefList(value)
 
     Mediums = property(getMediums, setMediums)
 
     def addMediums(self, *Mediums):
         for obj in Mediums:
             if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._Mediums.append(obj)
+                obj._reflist("_Assets").append(self)
+            self._reflist("_Mediums").append(obj)
 
     def removeMediums(self, *Mediums):
         for obj in Mediums:
@@ -240,20 +242,19 @@ class Asset(IdentifiedObject):
 
     def setErpRecDeliveryItems(self, value):
         for p in self._ErpRecDeliveryItems:
-            filtered = [q for q in p.Assets if q != self]
-            self._ErpRecDeliveryItems._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
             if self not in r._Assets:
-                r._Assets.append(self)
-        self._ErpRecDeliveryItems = value
+                r._reflist("_Assets").append(self)
+        self._ErpRecDeliveryItems = RefList(value)
 
     ErpRecDeliveryItems = property(getErpRecDeliveryItems, setErpRecDeliveryItems)
 
     def addErpRecDeliveryItems(self, *ErpRecDeliveryItems):
         for obj in ErpRecDeliveryItems:
             if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ErpRecDeliveryItems.append(obj)
+                obj._reflist("_Assets").append(self)
+            self._reflist("_ErpRecDeliveryItems").append(obj)
 
     def removeErpRecDeliveryItems(self, *ErpRecDeliveryItems):
         for obj in ErpRecDeliveryItems:
@@ -268,20 +269,19 @@ class Asset(IdentifiedObject):
 
     def setRatings(self, value):
         for p in self._Ratings:
-            filtered = [q for q in p.RatingAssets if q != self]
-            self._Ratings._RatingAssets = filtered
+            p._RatingAssets.discard(self)
         for r in value:
             if self not in r._RatingAssets:
-                r._RatingAssets.append(self)
-        self._Ratings = value
+                r._reflist("_RatingAssets").append(self)
+        self._Ratings = RefList(value)
 
     Ratings = property(getRatings, setRatings)
 
     def addRatings(self, *Ratings):
         for obj in Ratings:
             if self not in obj._RatingAssets:
-                obj._RatingAssets.append(self)
-            self._Ratings.append(obj)
+                obj._reflist("_RatingAssets").append(self)
+            self._reflist("_Ratings").append(obj)
 
     def removeRatings(self, *Ratings):
         for obj in Ratings:
@@ -294,7 +294,8 @@ class Asset(IdentifiedObject):
         return self._ToAssetRoles
 
     def setToAssetRoles(self, value):
-        for x in self._ToAssetRoles:
+        value = RefList(value)
+        for x in list(self._ToAssetRoles):
             x.FromAsset = None
         for y in value:
             y._FromAsset = self
@@ -318,7 +319,8 @@ class Asset(IdentifiedObject):
         return self._FromAssetRoles
 
     def setFromAssetRoles(self, value):
-        for x in self._FromAssetRoles:
+        value = RefList(value)
+        for x in list(self._FromAssetRoles):
             x.ToAsset = None
         for y in value:
             y._ToAsset = self
@@ -339,7 +341,8 @@ class Asset(IdentifiedObject):
         return self._AssetFunctions
 
     def setAssetFunctions(self, value):
-        for x in self._AssetFunctions:
+        value = RefList(value)
+        for x in list(self._AssetFunctions):
             x.Asset = None
         for y in value:
             y._Asset = self
@@ -391,20 +394,19 @@ class Asset(IdentifiedObject):
 
     def setReliabilityInfos(self, value):
         for p in self._ReliabilityInfos:
-            filtered = [q for q in p.Assets if q != self]
-            self._ReliabilityInfos._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
             if self not in r._Assets:
-                r._Assets.append(self)
-        self._ReliabilityInfos = value
+                r._reflist("_Assets").append(self)
+        self._ReliabilityInfos = RefList(value)
 
     ReliabilityInfos = property(getReliabilityInfos, setReliabilityInfos)
 
     def addReliabilityInfos(self, *ReliabilityInfos):
         for obj in ReliabilityInfos:
             if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ReliabilityInfos.append(obj)
+                obj._reflist("_Assets").append(self)
+            self._reflist("_ReliabilityInfos").append(obj)
 
     def removeReliabilityInfos(self, *ReliabilityInfos):
         for obj in ReliabilityInfos:
@@ -434,13 +436,12 @@ class Asset(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.Assets if x != self]
-            self._WorkTask._Assets = filtered
+            self._WorkTask._Assets.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
             if self not in self._WorkTask._Assets:
-                self._WorkTask._Assets.append(self)
+                self._WorkTask._reflist("_Assets").append(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -452,7 +453,8 @@ class Asset(IdentifiedObject):
         return self._ErpOrganisationRoles
 
     def setErpOrganisationRoles(self, value):
-        for x in self._ErpOrganisationRoles:
+        value = RefList(value)
+        for x in list(self._ErpOrganisationRoles):
             x.Asset = None
         for y in value:
             y._Asset = self
@@ -474,20 +476,19 @@ class Asset(IdentifiedObject):
 
     def setScheduledEvents(self, value):
         for p in self._ScheduledEvents:
-            filtered = [q for q in p.Assets if q != self]
-            self._ScheduledEvents._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
             if self not in r._Assets:
-                r._Assets.append(self)
-        self._ScheduledEvents = value
+                r._reflist("_Assets").append(self)
+        self._ScheduledEvents = RefList(value)
 
     ScheduledEvents = property(getScheduledEvents, setScheduledEvents)
 
     def addScheduledEvents(self, *ScheduledEvents):
         for obj in ScheduledEvents:
             if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ScheduledEvents.append(obj)
+                obj._reflist("_Assets").append(self)
+            self._reflist("_ScheduledEvents").append(obj)
 
     def removeScheduledEvents(self, *ScheduledEvents):
         for obj in ScheduledEvents:
@@ -501,13 +502,12 @@ class Asset(IdentifiedObject):
 
     def setAssetContainer(self, value):
         if self._AssetContainer is not None:
-            filtered = [x for x in self.AssetContainer.Assets if x != self]
-            self._AssetContainer._Assets = filtered
+            self._AssetContainer._Assets.discard(self)
 
         self._AssetContainer = value
         if self._AssetContainer is not None:
             if self not in self._AssetContainer._Assets:
-                self._AssetContainer._Assets.append(self)
+                self._AssetContainer._reflist("_Assets").append(self)
 
     AssetContainer = property(getAssetContainer, setAssetContainer)
 
@@ -517,20 +517,19 @@ class Asset(IdentifiedObject):
 
     def setAssetPropertyCurves(self, value):
         for p in self._AssetPropertyCurves:
-            filtered = [q for q in p.Assets if q != self]
-            self._AssetPropertyCurves._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
             if self not in r._Assets:
-                r._Assets.append(self)
-        self._AssetPropertyCurves = value
+                r._reflist("_Assets").append(self)
+        self._AssetPropertyCurves = RefList(value)
 
     AssetPropertyCurves = property(getAssetPropertyCurves, setAssetPropertyCurves)
 
     def addAssetPropertyCurves(self, *AssetPropertyCurves):
         for obj in AssetPropertyCurves:
             if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._AssetPropertyCurves.append(obj)
+                obj._reflist("_Assets").append(self)
+            self._reflist("_AssetPropertyCurves").append(obj)
 
     def removeAssetPropertyCurves(self, *AssetPropertyCurves):
         for obj in AssetPropertyCurves:
@@ -543,7 +542,8 @@ class Asset(IdentifiedObject):
         return self._ChangeItems
 
     def setChangeItems(self, value):
-        for x in self._ChangeItems:
+        value = RefList(value)
+        for x in list(self._ChangeItems):
             x.Asset = None
         for y in value:
             y._Asset = self
@@ -566,20 +566,19 @@ class Asset(IdentifiedObject):
 
     def setActivityRecords(self, value):
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Assets if q != self]
-            self._ActivityRecords._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
             if self not in r._Assets:
-                r._Assets.append(self)
-        self._ActivityRecords = value
+                r._reflist("_Assets").append(self)
+        self._ActivityRecords = RefList(value)
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
             if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._ActivityRecords.append(obj)
+                obj._reflist("_Assets").append(self)
+            self._reflist("_ActivityRecords").append(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
@@ -594,13 +593,12 @@ class Asset(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.Assets if x != self]
-            self._Location._Assets = filtered
+            self._Location._Assets.discard(self)
 
         self._Location = value
         if self._Location is not None:
             if self not in self._Location._Assets:
-                self._Location._Assets.append(self)
+                self._Location._reflist("_Assets").append(self)
 
     Location = property(getLocation, setLocation)
 
@@ -614,20 +612,19 @@ class Asset(IdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.Assets if q != self]
-            self._PowerSystemResources._Assets = filtered
+            p._Assets.discard(self)
         for r in value:
             if self not in r._Assets:
-                r._Assets.append(self)
-        self._PowerSystemResources = value
+                r._reflist("_Assets").append(self)
+        self._PowerSystemResources = RefList(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
             if self not in obj._Assets:
-                obj._Assets.append(self)
-            self._PowerSystemResources.append(obj)
+                obj._reflist("_Assets").append(self)
+            self._reflist("_PowerSystemResources").append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
@@ -657,20 +654,19 @@ class Asset(IdentifiedObject):
 
     def setProperties(self, value):
         for p in self._Properties:
-            filtered = [q for q in p.PropertyAssets if q != self]
-            self._Properties._PropertyAssets = filtered
+            p._PropertyAssets.discard(self)
         for r in value:
             if self not in r._PropertyAssets:
-                r._PropertyAssets.append(self)
-        self._Properties = value
+                r._reflist("_PropertyAssets").append(self)
+        self._Properties = RefList(value)
 
     Properties = property(getProperties, setProperties)
 
     def addProperties(self, *Properties):
         for obj in Properties:
             if self not in obj._PropertyAssets:
-                obj._PropertyAssets.append(self)
-            self._Properties.append(obj)
+                obj._reflist("_PropertyAssets").append(self)
+            self._reflist("_Properties").append(obj)
 
     def removeProperties(self, *Properties):
         for obj in Properties:
@@ -683,7 +679,8 @@ class Asset(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
-        for x in self._Measurements:
+        value = RefList(value)
+        for x in list(self._Measurements):
             x.Asset = None
         for y in value:
             y._Asset = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import RefList
 
 class AssetContainer(Asset):
     """Asset that is aggregation of other assets such as conductors, transformers, switchgear, land, fences, buildings, equipment, vehicles, etc.Asset that is aggregation of other assets such as conductors, transformers, switchgear, land, fences, buildings, equipment, vehicles, etc.
@@ -31,14 +32,14 @@ class AssetContainer(Asset):
         @param Assets:
         @param LandProperties:
         """
-        self._Seals = []
-        self.Seals = [] if Seals is None else Seals
+        if Seals is not None:
+            self.Seals = Seals
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
-        self._LandProperties = []
-        self.LandProperties = [] if LandProperties is None else LandProperties
+        if LandProperties is not None:
+            self.LandProperties = LandProperties
 
         super(AssetContainer, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class AssetContainer(Asset):
     _enums = {}
     _refs = ["Seals", "Assets", "LandProperties"]
     _many_refs = ["Seals", "Assets", "LandProperties"]
+    _inverses = {"Seals": "AssetContainer", "Assets": "AssetContainer", "LandProperties": "AssetContainers"}
 
     def getSeals(self):
         """All seals applied to this asset container.
@@ -55,7 +57,8 @@ class AssetContainer(Asset):
         return self._Seals
 
     def setSeals(self, value):
-        for x in self._Seals:
+        value = RefList(value)
+        for x in list(self._Seals):
             x.AssetContainer = None
         for y in value:
             y._AssetContainer = self
@@ -76,7 +79,8 @@ class AssetContainer(Asset):
         return self._Assets
 
     def setAssets(self, value):
-        for x in self._Assets:
+        value = RefList(value)
+        for x in list(self._Assets):
             x.AssetContainer = None
         for y in value:
             y._AssetContainer = self
@@ -98,20 +102,19 @@ class AssetContainer(Asset):
 
     def setLandProperties(self, value):
         for p in self._LandProperties:
-            filtered = [q for q in p.AssetContainers if q != self]
-            self._LandProperties._AssetContainers = filtered
+            p._AssetContainers.discard(self)
         for r in value:
             if self not in r._AssetContainers:
-                r._AssetContainers.append(self)
-        self._LandProperties = value
+                r._reflist("_AssetContainers").append(self)
+        self._LandProperties = RefList(value)
 
     LandProperties = property(getLandProperties, setLandProperties)
 
     def addLandProperties(self, *LandProperties):
         for obj in LandProperties:
             if self not in obj._AssetContainers:
-                obj._AssetContainers.append(self)
-            self._LandProperties.append(obj)
+                obj._reflist("_AssetContainers").append(self)
+            self._reflist("_LandProperties").append(obj)
 
     def removeLandProperties(self, *LandProperties):
         for obj in LandProperties:
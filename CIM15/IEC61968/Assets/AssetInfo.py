@@ -48,6 +48,7 @@ class AssetInfo(IdentifiedObject):
     _enums = {}
     _refs = ["Assets", "DimensionsInfo", "AssetModel"]
     _many_refs = []
+    _inverses = {"Assets": "AssetInfo", "DimensionsInfo": "AssetInfos", "AssetModel": "AssetInfo"}
 
     def getAssets(self):
         """All assets described by this data.
@@ -71,13 +72,12 @@ class AssetInfo(IdentifiedObject):
 
     def setDimensionsInfo(self, value):
         if self._DimensionsInfo is not None:
-            filtered = [x for x in self.DimensionsInfo.AssetInfos if x != self]
-            self._DimensionsInfo._AssetInfos = filtered
+            self._DimensionsInfo._AssetInfos.discard(self)
 
         self._DimensionsInfo = value
         if self._DimensionsInfo is not None:
             if self not in self._DimensionsInfo._AssetInfos:
-                self._DimensionsInfo._AssetInfos.append(self)
+                self._DimensionsInfo._reflist("_AssetInfos").append(self)
 
     DimensionsInfo = property(getDimensionsInfo, setDimensionsInfo)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class AssetModel(IdentifiedObject):
     """Model of an asset, either a product of a specific manufacturer or a generic asset model or material item. Data-sheet characteristics are available through the associated AssetInfo subclass and can be shared with asset or power system resource instances.Model of an asset, either a product of a specific manufacturer or a generic asset model or material item. Data-sheet characteristics are available through the associated AssetInfo subclass and can be shared with asset or power system resource instances.
@@ -33,8 +34,8 @@ class AssetModel(IdentifiedObject):
         self._AssetInfo = None
         self.AssetInfo = AssetInfo
 
-        self._ErpInventoryCounts = []
-        self.ErpInventoryCounts = [] if ErpInventoryCounts is None else ErpInventoryCounts
+        if ErpInventoryCounts is not None:
+            self.ErpInventoryCounts = ErpInventoryCounts
 
         super(AssetModel, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class AssetModel(IdentifiedObject):
     _enums = {}
     _refs = ["AssetInfo", "ErpInventoryCounts"]
     _many_refs = ["ErpInventoryCounts"]
+    _inverses = {"AssetInfo": "AssetModel", "ErpInventoryCounts": "AssetModel"}
 
     def getAssetInfo(self):
         """Data applicable to this asset model.
@@ -66,7 +68,8 @@ class AssetModel(IdentifiedObject):
         return self._ErpInventoryCounts
 
     def setErpInventoryCounts(self, value):
-        for x in self._ErpInventoryCounts:
+        value = RefList(value)
+        for x in list(self._ErpInventoryCounts):
             x.AssetModel = None
         for y in value:
             y._AssetModel = self
@@ -36,4 +36,5 @@ class ComMedia(Asset):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
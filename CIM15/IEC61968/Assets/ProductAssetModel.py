@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetModel import AssetModel
+from CIM15.Element import RefList
 
 class ProductAssetModel(AssetModel):
     """Asset model by a specific manufacturer.Asset model by a specific manufacturer.
@@ -53,8 +54,8 @@ class ProductAssetModel(AssetModel):
         self._GenericAssetModelOrMaterial = None
         self.GenericAssetModelOrMaterial = GenericAssetModelOrMaterial
 
-        self._AssetModelCatalogueItems = []
-        self.AssetModelCatalogueItems = [] if AssetModelCatalogueItems is None else AssetModelCatalogueItems
+        if AssetModelCatalogueItems is not None:
+            self.AssetModelCatalogueItems = AssetModelCatalogueItems
 
         super(ProductAssetModel, self).__init__(*args, **kw_args)
 
@@ -64,6 +65,7 @@ class ProductAssetModel(AssetModel):
     _enums = {"usageKind": "AssetModelUsageKind", "corporateStandardKind": "CorporateStandardKind"}
     _refs = ["GenericAssetModelOrMaterial", "AssetModelCatalogueItems"]
     _many_refs = ["AssetModelCatalogueItems"]
+    _inverses = {"GenericAssetModelOrMaterial": "ProductAssetModels", "AssetModelCatalogueItems": "AssetModel"}
 
     def getGenericAssetModelOrMaterial(self):
         """Generic asset model or material satisified by this product asset model.
@@ -72,13 +74,12 @@ class ProductAssetModel(AssetModel):
 
     def setGenericAssetModelOrMaterial(self, value):
         if self._GenericAssetModelOrMaterial is not None:
-            filtered = [x for x in self.GenericAssetModelOrMaterial.ProductAssetModels if x != self]
-            self._GenericAssetModelOrMaterial._ProductAssetModels = filtered
+            self._GenericAssetModelOrMaterial._ProductAssetModels.discard(self)
 
         self._GenericAssetModelOrMaterial = value
         if self._GenericAssetModelOrMaterial is not None:
             if self not in self._GenericAssetModelOrMaterial._ProductAssetModels:
-                self._GenericAssetModelOrMaterial._ProductAssetModels.append(self)
+                self._GenericAssetModelOrMaterial._reflist("_ProductAssetModels").append(self)
 
     GenericAssetModelOrMaterial = property(getGenericAssetModelOrMaterial, setGenericAssetModelOrMaterial)
 
@@ -87,7 +88,8 @@ class ProductAssetModel(AssetModel):
         return self._AssetModelCatalogueItems
 
     def setAssetModelCatalogueItems(self, value):
-        for x in self._AssetModelCatalogueItems:
+        value = RefList(value)
+        for x in list(self._AssetModelCatalogueItems):
             x.AssetModel = None
         for y in value:
             y._AssetModel = self
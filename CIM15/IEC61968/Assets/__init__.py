@@ -21,15 +21,8 @@
 """This package contains the core information classes that support asset management applications that deal with the physical and lifecycle aspects of various network resources (as opposed to power system resource models defined in IEC61970::Wires package, which support network applications).
 """
 
-from CIM15.IEC61968.Assets.ProductAssetModel import ProductAssetModel
-from CIM15.IEC61968.Assets.AssetModel import AssetModel
-from CIM15.IEC61968.Assets.Asset import Asset
-from CIM15.IEC61968.Assets.ComMedia import ComMedia
-from CIM15.IEC61968.Assets.AssetContainer import AssetContainer
-from CIM15.IEC61968.Assets.AssetFunction import AssetFunction
-from CIM15.IEC61968.Assets.Seal import Seal
-from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
-from CIM15.IEC61968.Assets.AcceptanceTest import AcceptanceTest
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Assets"
 nsPrefix = "cimAssets"
@@ -54,3 +47,16 @@ class AssetModelUsageKind(str):
     """Values are: customerSubstation, transmission, other, substation, unknown, distributionOverhead, distributionUnderground, streetlight
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ProductAssetModel",
+    "AssetModel",
+    "Asset",
+    "ComMedia",
+    "AssetContainer",
+    "AssetFunction",
+    "Seal",
+    "AssetInfo",
+    "AcceptanceTest",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ActivityRecord(IdentifiedObject):
     """Records activity for an entity at a point in time; activity may be for an event that has already occurred or for a planned activity.Records activity for an entity at a point in time; activity may be for an event that has already occurred or for a planned activity.
@@ -50,17 +51,17 @@ class ActivityRecord(IdentifiedObject):
         #: Category of event resulting in this activity record.
         self.category = category
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
-        self._Organisations = []
-        self.Organisations = [] if Organisations is None else Organisations
+        if Organisations is not None:
+            self.Organisations = Organisations
 
-        self._Documents = []
-        self.Documents = [] if Documents is None else Documents
+        if Documents is not None:
+            self.Documents = Documents
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
         self.status = status
 
@@ -75,6 +76,7 @@ class ActivityRecord(IdentifiedObject):
     _enums = {}
     _refs = ["ErpPersons", "Organisations", "Documents", "Assets", "status", "ScheduledEvent"]
     _many_refs = ["ErpPersons", "Organisations", "Documents", "Assets"]
+    _inverses = {"ErpPersons": "ActivityRecords", "Organisations": "ActivityRecords", "Documents": "ActivityRecords", "Assets": "ActivityRecords", "ScheduledEvent": "ActivityRecord"}
 
     def getErpPersons(self):
         
@@ -82,20 +84,19 @@ class ActivityRecord(IdentifiedObject):
 
     def setErpPersons(self, value):
         for p in self._ErpPersons:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._ErpPersons._ActivityRecords = filtered
+            p._ActivityRecords.discard(self)
         for r in value:
             if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
-        self._ErpPersons = value
+                r._reflist("_ActivityRecords").append(self)
+        self._ErpPersons = RefList(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
             if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._ErpPersons.append(obj)
+                obj._reflist("_ActivityRecords").append(self)
+            self._reflist("_ErpPersons").append(obj)
 
     def removeErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
@@ -109,20 +110,19 @@ class ActivityRecord(IdentifiedObject):
 
     def setOrganisations(self, value):
         for p in self._Organisations:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Organisations._ActivityRecords = filtered
+            p._ActivityRecords.discard(self)
         for r in value:
             if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
-        self._Organisations = value
+                r._reflist("_ActivityRecords").append(self)
+        self._Organisations = RefList(value)
 
     Organisations = property(getOrganisations, setOrganisations)
 
     def addOrganisations(self, *Organisations):
         for obj in Organisations:
             if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Organisations.append(obj)
+                obj._reflist("_ActivityRecords").append(self)
+            self._reflist("_Organisations").append(obj)
 
     def removeOrganisations(self, *Organisations):
         for obj in Organisations:
@@ -137,20 +137,19 @@ class ActivityRecord(IdentifiedObject):
 
     def setDocuments(self, value):
         for p in self._Documents:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Documents._ActivityRecords = filtered
+            p._ActivityRecords.discard(self)
         for r in value:
             if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
-        self._Documents = value
+                r._reflist("_ActivityRecords").append(self)
+        self._Documents = RefList(value)
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
         for obj in Documents:
             if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Documents.append(obj)
+                obj._reflist("_ActivityRecords").append(self)
+            self._reflist("_Documents").append(obj)
 
     def removeDocuments(self, *Documents):
         for obj in Documents:
@@ -165,20 +164,19 @@ class ActivityRecord(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.ActivityRecords if q != self]
-            self._Assets._ActivityRecords = filtered
+            p._ActivityRecords.discard(self)
         for r in value:
             if self not in r._ActivityRecords:
-                r._ActivityRecords.append(self)
-        self._Assets = value
+                r._reflist("_ActivityRecords").append(self)
+        self._Assets = RefList(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
             if self not in obj._ActivityRecords:
-                obj._ActivityRecords.append(self)
-            self._Assets.append(obj)
+                obj._reflist("_ActivityRecords").append(self)
+            self._reflist("_Assets").append(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
@@ -43,6 +43,7 @@ class Agreement(Document):
     _enums = {}
     _refs = ["validityInterval"]
     _many_refs = []
+    _inverses = {}
 
     # Date and time interval this agreement is valid (from going into effect to termination).
     validityInterval = None
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class CoordinateSystem(IdentifiedObject):
     """Coordinate reference system.Coordinate reference system.
@@ -35,14 +36,14 @@ class CoordinateSystem(IdentifiedObject):
         #: A Uniform Resource Name (URN) for the coordinate reference system (crs) used to define 'Location.PositionPoints'. An example would be the European Petroleum Survey Group (EPSG) code for a coordinate reference system, defined in URN under the Open Geospatial Consortium (OGC) namespace as: urn:ogc :def:uom:EPSG::XXXX, where XXXX is an EPSG code (a full list of codes can be found at the EPSG Registry website http://www.epsg-registry.org/). To define the coordinate system as being WGS84 (latitude, longitude) using an EPSG OGC, this attribute would be urn:ogc:def:uom:EPSG::4236. A profile should limit this code to a set of allowed URNs agreed to by all sending and receiving parties.
         self.crsUrn = crsUrn
 
-        self._Diagrams = []
-        self.Diagrams = [] if Diagrams is None else Diagrams
+        if Diagrams is not None:
+            self.Diagrams = Diagrams
 
-        self._Location = []
-        self.Location = [] if Location is None else Location
+        if Location is not None:
+            self.Location = Location
 
-        self._GmlDiagramObjects = []
-        self.GmlDiagramObjects = [] if GmlDiagramObjects is None else GmlDiagramObjects
+        if GmlDiagramObjects is not None:
+            self.GmlDiagramObjects = GmlDiagramObjects
 
         super(CoordinateSystem, self).__init__(*args, **kw_args)
 
@@ -52,13 +53,15 @@ class CoordinateSystem(IdentifiedObject):
     _enums = {}
     _refs = ["Diagrams", "Location", "GmlDiagramObjects"]
     _many_refs = ["Diagrams", "Location", "GmlDiagramObjects"]
+    _inverses = {"Diagrams": "CoordinateSystem", "Location": "CoordinateSystem", "GmlDiagramObjects": "CoordinateSystems"}
 
     def getDiagrams(self):
         
         return self._Diagrams
 
     def setDiagrams(self, value):
-        for x in self._Diagrams:
+        value = RefList(value)
+        for x in list(self._Diagrams):
             x.CoordinateSystem = None
         for y in value:
             y._CoordinateSystem = self
@@ -80,7 +83,8 @@ class CoordinateSystem(IdentifiedObject):
         return self._Location
 
     def setLocation(self, value):
-        for x in self._Location:
+        value = RefList(value)
+        for x in list(self._Location):
             x.CoordinateSystem = None
         for y in value:
             y._CoordinateSystem = self
@@ -102,20 +106,19 @@ class CoordinateSystem(IdentifiedObject):
 
     def setGmlDiagramObjects(self, value):
         for p in self._GmlDiagramObjects:
-            filtered = [q for q in p.CoordinateSystems if q != self]
-            self._GmlDiagramObjects._CoordinateSystems = filtered
+            p._CoordinateSystems.discard(self)
         for r in value:
             if self not in r._CoordinateSystems:
-                r._CoordinateSystems.append(self)
-        self._GmlDiagramObjects = value
+                r._reflist("_CoordinateSystems").append(self)
+        self._GmlDiagramObjects = RefList(value)
 
     GmlDiagramObjects = property(getGmlDiagramObjects, setGmlDiagramObjects)
 
     def addGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
             if self not in obj._CoordinateSystems:
-                obj._CoordinateSystems.append(self)
-            self._GmlDiagramObjects.append(obj)
+                obj._reflist("_CoordinateSystems").append(self)
+            self._reflist("_GmlDiagramObjects").append(obj)
 
     def removeGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
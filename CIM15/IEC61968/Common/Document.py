@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Document(IdentifiedObject):
     """Parent class for different groupings of information collected and managed as a part of a business process. It will frequently contain references to other objects, such as assets, people and power system resources.Parent class for different groupings of information collected and managed as a part of a business process. It will frequently contain references to other objects, such as assets, people and power system resources.
@@ -68,50 +69,50 @@ class Document(IdentifiedObject):
         #: Utility-specific categorisation of this document, according to their corporate standards, practices, and existing IT systems (e.g., for management of assets, maintenance, work, outage, customers, etc.).
         self.category = category
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._ToDocumentRoles = []
-        self.ToDocumentRoles = [] if ToDocumentRoles is None else ToDocumentRoles
+        if ToDocumentRoles is not None:
+            self.ToDocumentRoles = ToDocumentRoles
 
         self.electronicAddress = electronicAddress
 
-        self._NetworkDataSets = []
-        self.NetworkDataSets = [] if NetworkDataSets is None else NetworkDataSets
+        if NetworkDataSets is not None:
+            self.NetworkDataSets = NetworkDataSets
 
-        self._FromDocumentRoles = []
-        self.FromDocumentRoles = [] if FromDocumentRoles is None else FromDocumentRoles
+        if FromDocumentRoles is not None:
+            self.FromDocumentRoles = FromDocumentRoles
 
-        self._ScheduleParameterInfos = []
-        self.ScheduleParameterInfos = [] if ScheduleParameterInfos is None else ScheduleParameterInfos
+        if ScheduleParameterInfos is not None:
+            self.ScheduleParameterInfos = ScheduleParameterInfos
 
-        self._ErpOrganisationRoles = []
-        self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
+        if ErpOrganisationRoles is not None:
+            self.ErpOrganisationRoles = ErpOrganisationRoles
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
-        self._ActivityRecords = []
-        self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
+        if ActivityRecords is not None:
+            self.ActivityRecords = ActivityRecords
 
-        self._ChangeSets = []
-        self.ChangeSets = [] if ChangeSets is None else ChangeSets
+        if ChangeSets is not None:
+            self.ChangeSets = ChangeSets
 
-        self._ErpPersonRoles = []
-        self.ErpPersonRoles = [] if ErpPersonRoles is None else ErpPersonRoles
+        if ErpPersonRoles is not None:
+            self.ErpPersonRoles = ErpPersonRoles
 
-        self._ScheduledEvents = []
-        self.ScheduledEvents = [] if ScheduledEvents is None else ScheduledEvents
+        if ScheduledEvents is not None:
+            self.ScheduledEvents = ScheduledEvents
 
         self.docStatus = docStatus
 
-        self._AssetRoles = []
-        self.AssetRoles = [] if AssetRoles is None else AssetRoles
+        if AssetRoles is not None:
+            self.AssetRoles = AssetRoles
 
         self.status = status
 
-        self._PowerSystemResourceRoles = []
-        self.PowerSystemResourceRoles = [] if PowerSystemResourceRoles is None else PowerSystemResourceRoles
+        if PowerSystemResourceRoles is not None:
+            self.PowerSystemResourceRoles = PowerSystemResourceRoles
 
         super(Document, self).__init__(*args, **kw_args)
 
@@ -121,13 +122,15 @@ class Document(IdentifiedObject):
     _enums = {}
     _refs = ["ChangeItems", "ToDocumentRoles", "electronicAddress", "NetworkDataSets", "FromDocumentRoles", "ScheduleParameterInfos", "ErpOrganisationRoles", "Measurements", "ActivityRecords", "ChangeSets", "ErpPersonRoles", "ScheduledEvents", "docStatus", "AssetRoles", "status", "PowerSystemResourceRoles"]
     _many_refs = ["ChangeItems", "ToDocumentRoles", "NetworkDataSets", "FromDocumentRoles", "ScheduleParameterInfos", "ErpOrganisationRoles", "Measurements", "ActivityRecords", "ChangeSets", "ErpPersonRoles", "ScheduledEvents", "AssetRoles", "PowerSystemResourceRoles"]
+    _inverses = {"ChangeItems": "Document", "ToDocumentRoles": "FromDocument", "NetworkDataSets": "Documents", "FromDocumentRoles": "ToDocument", "ScheduleParameterInfos": "Documents", "ErpOrganisationRoles": "Document", "Measurements": "Documents", "ActivityRecords": "Documents", "ChangeSets": "Documents", "ErpPersonRoles": "Document", "ScheduledEvents": "Document", "AssetRoles": "Document", "PowerSystemResourceRoles": "Document"}
 
     def getChangeItems(self):
         
         return self._ChangeItems
 
     def setChangeItems(self, value):
-        for x in self._ChangeItems:
+        value = RefList(value)
+        for x in list(self._ChangeItems):
             x.Document = None
         for y in value:
             y._Document = self
@@ -148,7 +151,8 @@ class Document(IdentifiedObject):
         return self._ToDocumentRoles
 
     def setToDocumentRoles(self, value):
-        for x in self._ToDocumentRoles:
+        value = RefList(value)
+        for x in list(self._ToDocumentRoles):
             x.FromDocument = None
         for y in value:
             y._FromDocument = self
@@ -173,20 +177,19 @@ class Document(IdentifiedObject):
 
     def setNetworkDataSets(self, value):
         for p in self._NetworkDataSets:
-            filtered = [q for q in p.Documents if q != self]
-            self._NetworkDataSets._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
             if self not in r._Documents:
-                r._Documents.append(self)
-        self._NetworkDataSets = value
+                r._reflist("_Documents").append(self)
+        self._NetworkDataSets = RefList(value)
 
     NetworkDataSets = property(getNetworkDataSets, setNetworkDataSets)
 
     def addNetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
             if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._NetworkDataSets.append(obj)
+                obj._reflist("_Documents").append(self)
+            self._reflist("_NetworkDataSets").append(obj)
 
     def removeNetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
@@ -199,7 +202,8 @@ class Document(IdentifiedObject):
         return self._FromDocumentRoles
 
     def setFromDocumentRoles(self, value):
-        for x in self._FromDocumentRoles:
+        value = RefList(value)
+        for x in list(self._FromDocumentRoles):
             x.ToDocument = None
         for y in value:
             y._ToDocument = self
@@ -221,20 +225,19 @@ class Document(IdentifiedObject):
 
     def setScheduleParameterInfos(self, value):
         for p in self._ScheduleParameterInfos:
-            filtered = [q for q in p.Documents if q != self]
-            self._ScheduleParameterInfos._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
             if self not in r._Documents:
-                r._Documents.append(self)
-        self._ScheduleParameterInfos = value
+                r._reflist("_Documents").append(self)
+        self._ScheduleParameterInfos = RefList(value)
 
     ScheduleParameterInfos = property(getScheduleParameterInfos, setScheduleParameterInfos)
 
     def addScheduleParameterInfos(self, *ScheduleParameterInfos):
         for obj in ScheduleParameterInfos:
             if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._ScheduleParameterInfos.append(obj)
+                obj._reflist("_Documents").append(self)
+            self._reflist("_ScheduleParameterInfos").append(obj)
 
     def removeScheduleParameterInfos(self, *ScheduleParameterInfos):
         for obj in ScheduleParameterInfos:
@@ -247,7 +250,8 @@ class Document(IdentifiedObject):
         return self._ErpOrganisationRoles
 
     def setErpOrganisationRoles(self, value):
-        for x in self._ErpOrganisationRoles:
+        value = RefList(value)
+        for x in list(self._ErpOrganisationRoles):
             x.Document = None
         for y in value:
             y._Document = self
@@ -270,20 +274,19 @@ class Document(IdentifiedObject):
 
     def setMeasurements(self, value):
         for p in self._Measurements:
-            filtered = [q for q in p.Documents if q != self]
-            self._Measurements._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
             if self not in r._Documents:
-                r._Documents.append(self)
-        self._Measurements = value
+                r._reflist("_Documents").append(self)
+        self._Measurements = RefList(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
         for obj in Measurements:
             if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._Measurements.append(obj)
+                obj._reflist("_Documents").append(self)
+            self._reflist("_Measurements").append(obj)
 
     def removeMeasurements(self, *Measurements):
         for obj in Measurements:
@@ -298,20 +301,19 @@ class Document(IdentifiedObject):
 
     def setActivityRecords(self, value):
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Documents if q != self]
-            self._ActivityRecords._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
             if self not in r._Documents:
-                r._Documents.append(self)
-        self._ActivityRecords = value
+                r._reflist("_Documents").append(self)
+        self._ActivityRecords = RefList(value)
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
             if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._ActivityRecords.append(obj)
+                obj._reflist("_Documents").append(self)
+            self._reflist("_ActivityRecords").append(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
@@ -325,20 +327,19 @@ class Document(IdentifiedObject):
 
     def setChangeSets(self, value):
         for p in self._ChangeSets:
-            filtered = [q for q in p.Documents if q != self]
-            self._ChangeSets._Documents = filtered
+            p._Documents.discard(self)
         for r in value:
             if self not in r._Documents:
-                r._Documents.append(self)
-        self._ChangeSets = value
+                r._reflist("_Documents").append(self)
+        self._ChangeSets = RefList(value)
 
     ChangeSets = property(getChangeSets, setChangeSets)
 
     def addChangeSets(self, *ChangeSets):
         for obj in ChangeSets:
             if self not in obj._Documents:
-                obj._Documents.append(self)
-            self._ChangeSets.append(obj)
+                obj._reflist("_Documents").append(self)
+            self._reflist("_ChangeSets").append(obj)
 
     def removeChangeSets(self, *ChangeSets):
         for obj in ChangeSets:
@@ -351,7 +352,8 @@ class Document(IdentifiedObject):
         return self._ErpPersonRoles
 
     def setErpPersonRoles(self, value):
-        for x in self._ErpPersonRoles:
+        value = RefList(value)
+        for x in list(self._ErpPersonRoles):
             x.Document = None
         for y in value:
             y._Document = self
@@ -372,7 +374,8 @@ class Document(IdentifiedObject):
         return self._ScheduledEvents
 
     def setScheduledEvents(self, value):
-        for x in self._ScheduledEvents:
+        value = RefList(value)
+        for x in list(self._ScheduledEvents):
             x.Document = None
         for y in value:
             y._Document = self
@@ -396,7 +399,8 @@ class Document(IdentifiedObject):
         return self._AssetRoles
 
     def setAssetRoles(self, value):
-        for x in self._AssetRoles:
+        value = RefList(value)
+        for x in list(self._AssetRoles):
             x.Document = None
         for y in value:
             y._Document = self
@@ -420,7 +424,8 @@ class Document(IdentifiedObject):
         return self._PowerSystemResourceRoles
 
     def setPowerSystemResourceRoles(self, value):
-        for x in self._PowerSystemResourceRoles:
+        value = RefList(value)
+        for x in list(self._PowerSystemResourceRoles):
             x.Document = None
         for y in value:
             y._Document = self
@@ -61,6 +61,7 @@ class ElectronicAddress(object):
     _enums = {}
     _refs = ["status"]
     _many_refs = []
+    _inverses = {}
 
     # Status of this electronic address.
     status = None
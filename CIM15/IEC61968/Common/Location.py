@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Location(IdentifiedObject):
     """The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It can be defined with one or more postition points (coordinates) in a given coordinate system.The place, scene, or point of something where someone or something has been, is, and/or will be at a given moment in time. It can be defined with one or more postition points (coordinates) in a given coordinate system.
@@ -70,53 +71,53 @@ class Location(IdentifiedObject):
 
         self.phone2 = phone2
 
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         self.secondaryAddress = secondaryAddress
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._RedLines = []
-        self.RedLines = [] if RedLines is None else RedLines
+        if RedLines is not None:
+            self.RedLines = RedLines
 
         self._DimensionsInfo = None
         self.DimensionsInfo = DimensionsInfo
 
-        self._LandProperties = []
-        self.LandProperties = [] if LandProperties is None else LandProperties
+        if LandProperties is not None:
+            self.LandProperties = LandProperties
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
-        self._Hazards = []
-        self.Hazards = [] if Hazards is None else Hazards
+        if Hazards is not None:
+            self.Hazards = Hazards
 
         self.status = status
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        if Crews is not None:
+            self.Crews = Crews
 
-        self._PositionPoints = []
-        self.PositionPoints = [] if PositionPoints is None else PositionPoints
+        if PositionPoints is not None:
+            self.PositionPoints = PositionPoints
 
         self.electronicAddress = electronicAddress
 
-        self._Directions = []
-        self.Directions = [] if Directions is None else Directions
+        if Directions is not None:
+            self.Directions = Directions
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
-        self._Routes = []
-        self.Routes = [] if Routes is None else Routes
+        if Routes is not None:
+            self.Routes = Routes
 
         self._CoordinateSystem = None
         self.CoordinateSystem = CoordinateSystem
 
-        self._ErpOrganisations = []
-        self.ErpOrganisations = [] if ErpOrganisations is None else ErpOrganisations
+        if ErpOrganisations is not None:
+            self.ErpOrganisations = ErpOrganisations
 
         super(Location, self).__init__(*args, **kw_args)
 
@@ -126,6 +127,7 @@ class Location(IdentifiedObject):
     _enums = {}
     _refs = ["mainAddress", "phone1", "phone2", "PowerSystemResources", "secondaryAddress", "ChangeItems", "RedLines", "DimensionsInfo", "LandProperties", "Assets", "Hazards", "status", "Crews", "PositionPoints", "electronicAddress", "Directions", "Measurements", "Routes", "CoordinateSystem", "ErpOrganisations"]
     _many_refs = ["PowerSystemResources", "ChangeItems", "RedLines", "LandProperties", "Assets", "Hazards", "Crews", "PositionPoints", "Directions", "Measurements", "Routes", "ErpOrganisations"]
+    _inverses = {"PowerSystemResources": "Location", "ChangeItems": "Location", "RedLines": "Locations", "DimensionsInfo": "Locations", "LandProperties": "Locations", "Assets": "Location", "Hazards": "Locations", "Crews": "Locations", "PositionPoints": "Location", "Directions": "Location", "Measurements": "Locations", "Routes": "Locations", "CoordinateSystem": "Location", "ErpOrganisations": "Locations"}
 
     # Main address of the location.
     mainAddress = None
@@ -142,7 +144,8 @@ class Location(IdentifiedObject):
         return self._PowerSystemResources
 
     def setPowerSystemResources(self, value):
-        for x in self._PowerSystemResources:
+        value = RefList(value)
+        for x in list(self._PowerSystemResources):
             x.Location = None
         for y in value:
             y._Location = self
@@ -166,7 +169,8 @@ class Location(IdentifiedObject):
         return self._ChangeItems
 
     def setChangeItems(self, value):
-        for x in self._ChangeItems:
+        value = RefList(value)
+        for x in list(self._ChangeItems):
             x.Location = None
         for y in value:
             y._Location = self
@@ -188,20 +192,19 @@ class Location(IdentifiedObject):
 
     def setRedLines(self, value):
         for p in self._RedLines:
-            filtered = [q for q in p.Locations if q != self]
-            self._RedLines._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
             if self not in r._Locations:
-                r._Locations.append(self)
-        self._RedLines = value
+                r._reflist("_Locations").append(self)
+        self._RedLines = RefList(value)
 
     RedLines = property(getRedLines, setRedLines)
 
     def addRedLines(self, *RedLines):
         for obj in RedLines:
             if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._RedLines.append(obj)
+                obj._reflist("_Locations").append(self)
+            self._reflist("_RedLines").append(obj)
 
     def removeRedLines(self, *RedLines):
         for obj in RedLines:
@@ -215,13 +218,12 @@ class Location(IdentifiedObject):
 
     def setDimensionsInfo(self, value):
         if self._DimensionsInfo is not None:
-            filtered = [x for x in self.DimensionsInfo.Locations if x != self]
-            self._DimensionsInfo._Locations = filtered
+            self._DimensionsInfo._Locations.discard(self)
 
         self._DimensionsInfo = value
         if self._DimensionsInfo is not None:
             if self not in self._DimensionsInfo._Locations:
-                self._DimensionsInfo._Locations.append(self)
+                self._DimensionsInfo._reflist("_Locations").append(self)
 
     DimensionsInfo = property(getDimensionsInfo, setDimensionsInfo)
 
@@ -231,20 +233,19 @@ class Location(IdentifiedObject):
 
     def setLandProperties(self, value):
         for p in self._LandProperties:
-            filtered = [q for q in p.Locations if q != self]
-            self._LandProperties._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
             if self not in r._Locations:
-                r._Locations.append(self)
-        self._LandProperties = value
+                r._reflist("_Locations").append(self)
+        self._LandProperties = RefList(value)
 
     LandProperties = property(getLandProperties, setLandProperties)
 
     def addLandProperties(self, *LandProperties):
         for obj in LandProperties:
             if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._LandProperties.append(obj)
+                obj._reflist("_Locations").append(self)
+            self._reflist("_LandProperties").append(obj)
 
     def removeLandProperties(self, *LandProperties):
         for obj in LandProperties:
@@ -258,7 +259,8 @@ class Location(IdentifiedObject):
         return self._Assets
 
     def setAssets(self, value):
-        for x in self._Assets:
+        value = RefList(value)
+        for x in list(self._Assets):
             x.Location = None
         for y in value:
             y._Location = self
@@ -280,20 +282,19 @@ class Location(IdentifiedObject):
 
     def setHazards(self, value):
         for p in self._Hazards:
-            filtered = [q for q in p.Locations if q != self]
-            self._Hazards._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
             if self not in r._Locations:
-                r._Locations.append(self)
-        self._Hazards = value
+                r._reflist("_Locations").append(self)
+        self._Hazards = RefList(value)
 
     Hazards = property(getHazards, setHazards)
 
     def addHazards(self, *Hazards):
         for obj in Hazards:
             if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Hazards.append(obj)
+                obj._reflist("_Locations").append(self)
+            self._reflist("_Hazards").append(obj)
 
     def removeHazards(self, *Hazards):
         for obj in Hazards:
@@ -310,20 +311,19 @@ class Location(IdentifiedObject):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.Locations if q != self]
-            self._Crews._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
             if self not in r._Locations:
-                r._Locations.append(self)
-        self._Crews = value
+                r._reflist("_Locations").append(self)
+        self._Crews = RefList(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
             if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Crews.append(obj)
+                obj._reflist("_Locations").append(self)
+            self._reflist("_Crews").append(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
@@ -337,7 +337,8 @@ class Location(IdentifiedObject):
         return self._PositionPoints
 
     def setPositionPoints(self, value):
-        for x in self._PositionPoints:
+        value = RefList(value)
+        for x in list(self._PositionPoints):
             x.Location = None
         for y in value:
             y._Location = self
@@ -361,7 +362,8 @@ class Location(IdentifiedObject):
         return self._Directions
 
     def setDirections(self, value):
-        for x in self._Directions:
+        value = RefList(value)
+        for x in list(self._Directions):
             x.Location = None
         for y in value:
             y._Location = self
@@ -383,20 +385,19 @@ class Location(IdentifiedObject):
 
     def setMeasurements(self, value):
         for p in self._Measurements:
-            filtered = [q for q in p.Locations if q != self]
-            self._Measurements._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
             if self not in r._Locations:
-                r._Locations.append(self)
-        self._Measurements = value
+                r._reflist("_Locations").append(self)
+        self._Measurements = RefList(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
         for obj in Measurements:
             if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Measurements.append(obj)
+                obj._reflist("_Locations").append(self)
+            self._reflist("_Measurements").append(obj)
 
     def removeMeasurements(self, *Measurements):
         for obj in Measurements:
@@ -410,20 +411,19 @@ class Location(IdentifiedObject):
 
     def setRoutes(self, value):
         for p in self._Routes:
-            filtered = [q for q in p.Locations if q != self]
-            self._Routes._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
             if self not in r._Locations:
-                r._Locations.append(self)
-        self._Routes = value
+                r._reflist("_Locations").append(self)
+        self._Routes = RefList(value)
 
     Routes = property(getRoutes, setRoutes)
 
     def addRoutes(self, *Routes):
         for obj in Routes:
             if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._Routes.append(obj)
+                obj._reflist("_Locations").append(self)
+            self._reflist("_Routes").append(obj)
 
     def removeRoutes(self, *Routes):
         for obj in Routes:
@@ -438,13 +438,12 @@ class Location(IdentifiedObject):
 
     def setCoordinateSystem(self, value):
         if self._CoordinateSystem is not None:
-            filtered = [x for x in self.CoordinateSystem.Location if x != self]
-            self._CoordinateSystem._Location = filtered
+            self._CoordinateSystem._Location.discard(self)
 
         self._CoordinateSystem = value
         if self._CoordinateSystem is not None:
             if self not in self._CoordinateSystem._Location:
-                self._CoordinateSystem._Location.append(self)
+                self._CoordinateSystem._reflist("_Location").append(self)
 
     CoordinateSystem = property(getCoordinateSystem, setCoordinateSystem)
 
@@ -454,20 +453,19 @@ class Location(IdentifiedObject):
 
     def setErpOrganisations(self, value):
         for p in self._ErpOrganisations:
-            filtered = [q for q in p.Locations if q != self]
-            self._ErpOrganisations._Locations = filtered
+            p._Locations.discard(self)
         for r in value:
             if self not in r._Locations:
-                r._Locations.append(self)
-        self._ErpOrganisations = value
+                r._reflist("_Locations").append(self)
+        self._ErpOrganisations = RefList(value)
 
     ErpOrganisations = property(getErpOrganisations, setErpOrganisations)
 
     def addErpOrganisations(self, *ErpOrganisations):
         for obj in ErpOrganisations:
             if self not in obj._Locations:
-                obj._Locations.append(self)
-            self._ErpOrganisations.append(obj)
+                obj._reflist("_Locations").append(self)
+            self._reflist("_ErpOrganisations").append(obj)
 
     def removeErpOrganisations(self, *ErpOrganisations):
         for obj in ErpOrganisations:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Organisation(IdentifiedObject):
     """Organisation that might have roles as utility, contractor, supplier, manufacturer, customer, etc.Organisation that might have roles as utility, contractor, supplier, manufacturer, customer, etc.
@@ -44,8 +45,8 @@ class Organisation(IdentifiedObject):
 
         self.electronicAddress = electronicAddress
 
-        self._BusinessRoles = []
-        self.BusinessRoles = [] if BusinessRoles is None else BusinessRoles
+        if BusinessRoles is not None:
+            self.BusinessRoles = BusinessRoles
 
         super(Organisation, self).__init__(*args, **kw_args)
 
@@ -55,6 +56,7 @@ class Organisation(IdentifiedObject):
     _enums = {}
     _refs = ["phone2", "phone1", "streetAddress", "postalAddress", "electronicAddress", "BusinessRoles"]
     _many_refs = ["BusinessRoles"]
+    _inverses = {"BusinessRoles": "Organisations"}
 
     # Additional phone number.
     phone2 = None
@@ -77,20 +79,19 @@ class Organisation(IdentifiedObject):
 
     def setBusinessRoles(self, value):
         for p in self._BusinessRoles:
-            filtered = [q for q in p.Organisations if q != self]
-            self._BusinessRoles._Organisations = filtered
+            p._Organisations.discard(self)
         for r in value:
             if self not in r._Organisations:
-                r._Organisations.append(self)
-        self._BusinessRoles = value
+                r._reflist("_Organisations").append(self)
+        self._BusinessRoles = RefList(value)
 
     BusinessRoles = property(getBusinessRoles, setBusinessRoles)
 
     def addBusinessRoles(self, *BusinessRoles):
         for obj in BusinessRoles:
             if self not in obj._Organisations:
-                obj._Organisations.append(self)
-            self._BusinessRoles.append(obj)
+                obj._reflist("_Organisations").append(self)
+            self._reflist("_BusinessRoles").append(obj)
 
     def removeBusinessRoles(self, *BusinessRoles):
         for obj in BusinessRoles:
@@ -48,6 +48,7 @@ class PostalAddress(object):
     _enums = {}
     _refs = ["streetDetail", "townDetail"]
     _many_refs = []
+    _inverses = {}
 
     # Street detail.
     streetDetail = None
@@ -50,4 +50,5 @@ class Status(object):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
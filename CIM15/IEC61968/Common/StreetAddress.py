@@ -43,6 +43,7 @@ class StreetAddress(object):
     _enums = {}
     _refs = ["status", "streetDetail", "townDetail"]
     _many_refs = []
+    _inverses = {}
 
     # Status of this address.
     status = None
@@ -74,4 +74,5 @@ class StreetDetail(object):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -54,4 +54,5 @@ class TelephoneNumber(object):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
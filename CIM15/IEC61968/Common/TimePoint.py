@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class TimePoint(IdentifiedObject):
     """A point in time within a sequence of points in time relative to a TimeSchedule.A point in time within a sequence of points in time relative to a TimeSchedule.
@@ -51,8 +52,8 @@ class TimePoint(IdentifiedObject):
         self._TimeSchedule = None
         self.TimeSchedule = TimeSchedule
 
-        self._ScheduledEvents = []
-        self.ScheduledEvents = [] if ScheduledEvents is None else ScheduledEvents
+        if ScheduledEvents is not None:
+            self.ScheduledEvents = ScheduledEvents
 
         super(TimePoint, self).__init__(*args, **kw_args)
 
@@ -62,6 +63,7 @@ class TimePoint(IdentifiedObject):
     _enums = {}
     _refs = ["status", "window", "TimeSchedule", "ScheduledEvents"]
     _many_refs = ["ScheduledEvents"]
+    _inverses = {"TimeSchedule": "TimePoints", "ScheduledEvents": "TimePoint"}
 
     # Status of this time point.
     status = None
@@ -76,13 +78,12 @@ class TimePoint(IdentifiedObject):
 
     def setTimeSchedule(self, value):
         if self._TimeSchedule is not None:
-            filtered = [x for x in self.TimeSchedule.TimePoints if x != self]
-            self._TimeSchedule._TimePoints = filtered
+            self._TimeSchedule._TimePoints.discard(self)
 
         self._TimeSchedule = value
         if self._TimeSchedule is not None:
             if self not in self._TimeSchedule._TimePoints:
-                self._TimeSchedule._TimePoints.append(self)
+                self._TimeSchedule._reflist("_TimePoints").append(self)
 
     TimeSchedule = property(getTimeSchedule, setTimeSchedule)
 
@@ -91,7 +92,8 @@ class TimePoint(IdentifiedObject):
         return self._ScheduledEvents
 
     def setScheduledEvents(self, value):
-        for x in self._ScheduledEvents:
+        value = RefList(value)
+        for x in list(self._ScheduledEvents):
             x.TimePoint = None
         for y in value:
             y._TimePoint = self
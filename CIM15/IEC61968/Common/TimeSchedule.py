@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class TimeSchedule(Document):
     """Description of anything that changes through time. Time schedule is used to perform a single-valued function of time. Use inherited 'category' attribute to give additional information on this schedule, such as: periodic (hourly, daily, weekly, monthly, etc.), day of the month, by date, calendar (specific times and dates).Description of anything that changes through time. Time schedule is used to perform a single-valued function of time. Use inherited 'category' attribute to give additional information on this schedule, such as: periodic (hourly, daily, weekly, monthly, etc.), day of the month, by date, calendar (specific times and dates).
@@ -46,8 +47,8 @@ class TimeSchedule(Document):
         #: Interval at which the scheduled action repeats (e.g., first Monday of every month, last day of the month, etc.).
         self.recurrencePattern = recurrencePattern
 
-        self._TimePoints = []
-        self.TimePoints = [] if TimePoints is None else TimePoints
+        if TimePoints is not None:
+            self.TimePoints = TimePoints
 
         self.scheduleInterval = scheduleInterval
 
@@ -59,6 +60,7 @@ class TimeSchedule(Document):
     _enums = {}
     _refs = ["TimePoints", "scheduleInterval"]
     _many_refs = ["TimePoints"]
+    _inverses = {"TimePoints": "TimeSchedule"}
 
     def getTimePoints(self):
         """Sequence of time points belonging to this time schedule.
@@ -66,7 +68,8 @@ class TimeSchedule(Document):
         return self._TimePoints
 
     def setTimePoints(self, value):
-        for x in self._TimePoints:
+        value = RefList(value)
+        for x in list(self._TimePoints):
             x.TimeSchedule = None
         for y in value:
             y._TimeSchedule = self
@@ -54,4 +54,5 @@ class TownDetail(object):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
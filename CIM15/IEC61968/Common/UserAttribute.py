@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, RefList
 
 class UserAttribute(Element):
     """Generic name-value pair class, with optional sequence number and units for value; can be used to model parts of information exchange when concrete types are not known in advance.Generic name-value pair class, with optional sequence number and units for value; can be used to model parts of information exchange when concrete types are not known in advance.
@@ -49,11 +49,11 @@ class UserAttribute(Element):
         #: Sequence number for this attribute in a list of attributes.
         self.sequenceNumber = sequenceNumber
 
-        self._ErpLedgerEntries = []
-        self.ErpLedgerEntries = [] if ErpLedgerEntries is None else ErpLedgerEntries
+        if ErpLedgerEntries is not None:
+            self.ErpLedgerEntries = ErpLedgerEntries
 
-        self._ProcedureDataSets = []
-        self.ProcedureDataSets = [] if ProcedureDataSets is None else ProcedureDataSets
+        if ProcedureDataSets is not None:
+            self.ProcedureDataSets = ProcedureDataSets
 
         self._Transaction = None
         self.Transaction = Transaction
@@ -64,17 +64,17 @@ class UserAttribute(Element):
         self._Procedure = None
         self.Procedure = Procedure
 
-        self._PropertyAssets = []
-        self.PropertyAssets = [] if PropertyAssets is None else PropertyAssets
+        if PropertyAssets is not None:
+            self.PropertyAssets = PropertyAssets
 
         self._RatingSpecification = None
         self.RatingSpecification = RatingSpecification
 
-        self._ErpInvoiceLineItems = []
-        self.ErpInvoiceLineItems = [] if ErpInvoiceLineItems is None else ErpInvoiceLineItems
+        if ErpInvoiceLineItems is not None:
+            self.ErpInvoiceLineItems = ErpInvoiceLineItems
 
-        self._RatingAssets = []
-        self.RatingAssets = [] if RatingAssets is None else RatingAssets
+        if RatingAssets is not None:
+            self.RatingAssets = RatingAssets
 
         super(UserAttribute, self).__init__(*args, **kw_args)
 
@@ -84,6 +84,7 @@ class UserAttribute(Element):
     _enums = {}
     _refs = ["ErpLedgerEntries", "ProcedureDataSets", "Transaction", "PropertySpecification", "Procedure", "PropertyAssets", "RatingSpecification", "ErpInvoiceLineItems", "RatingAssets"]
     _many_refs = ["ErpLedgerEntries", "ProcedureDataSets", "PropertyAssets", "ErpInvoiceLineItems", "RatingAssets"]
+    _inverses = {"ErpLedgerEntries": "UserAttributes", "ProcedureDataSets": "Properties", "Transaction": "UserAttributes", "PropertySpecification": "AssetProperites", "Procedure": "ProcedureValues", "PropertyAssets": "Properties", "RatingSpecification": "Ratings", "ErpInvoiceLineItems": "UserAttributes", "RatingAssets": "Ratings"}
 
     def getErpLedgerEntries(self):
         
@@ -91,20 +92,19 @@ class UserAttribute(Element):
 
     def setErpLedgerEntries(self, value):
         for p in self._ErpLedgerEntries:
-            filtered = [q for q in p.UserAttributes if q != self]
-            self._ErpLedgerEntries._UserAttributes = filtered
+            p._UserAttributes.discard(self)
         for r in value:
             if self not in r._UserAttributes:
-                r._UserAttributes.append(self)
-        self._ErpLedgerEntries = value
+                r._reflist("_UserAttributes").append(self)
+        self._ErpLedgerEntries = RefList(value)
 
     ErpLedgerEntries = property(getErpLedgerEntries, setErpLedgerEntries)
 
     def addErpLedgerEntries(self, *ErpLedgerEntries):
         for obj in ErpLedgerEntries:
             if self not in obj._UserAttributes:
-                obj._UserAttributes.append(self)
-            self._ErpLedgerEntries.append(obj)
+                obj._reflist("_UserAttributes").append(self)
+            self._reflist("_ErpLedgerEntries").append(obj)
 
     def removeErpLedgerEntries(self, *ErpLedgerEntries):
         for obj in ErpLedgerEntries:
@@ -118,20 +118,19 @@ class UserAttribute(Element):
 
     def setProcedureDataSets(self, value):
         for p in self._ProcedureDataSets:
-            filtered = [q for q in p.Properties if q != self]
-            self._ProcedureDataSets._Properties = filtered
+            p._Properties.discard(self)
         for r in value:
             if self not in r._Properties:
-                r._Properties.append(self)
-        self._ProcedureDataSets = value
+                r._reflist("_Properties").append(self)
+        self._ProcedureDataSets = RefList(value)
 
     ProcedureDataSets = property(getProcedureDataSets, setProcedureDataSets)
 
     def addProcedureDataSets(self, *ProcedureDataSets):
         for obj in ProcedureDataSets:
             if self not in obj._Properties:
-                obj._Properties.append(self)
-            self._ProcedureDataSets.append(obj)
+                obj._reflist("_Properties").append(self)
+            self._reflist("_ProcedureDataSets").append(obj)
 
     def removeProcedureDataSets(self, *ProcedureDataSets):
         for obj in ProcedureDataSets:
@@ -146,13 +145,12 @@ class UserAttribute(Element):
 
     def setTransaction(self, value):
         if self._Transaction is not None:
-            filtered = [x for x in self.Transaction.UserAttributes if x != self]
-            self._Transaction._UserAttributes = filtered
+            self._Transaction._UserAttributes.discard(self)
 
         self._Transaction = value
         if self._Transaction is not None:
             if self not in self._Transaction._UserAttributes:
-                self._Transaction._UserAttributes.append(self)
+                self._Transaction._reflist("_UserAttributes").append(self)
 
     Transaction = property(getTransaction, setTransaction)
 
@@ -162,13 +160,12 @@ class UserAttribute(Element):
 
     def setPropertySpecification(self, value):
         if self._PropertySpecification is not None:
-            filtered = [x for x in self.PropertySpecification.AssetProperites if x != self]
-            self._PropertySpecification._AssetProperites = filtered
+            self._PropertySpecification._AssetProperites.discard(self)
 
         self._PropertySpecification = value
         if self._PropertySpecification is not None:
             if self not in self._PropertySpecification._AssetProperites:
-                self._PropertySpecification._AssetProperites.append(self)
+                self._PropertySpecification._reflist("_AssetProperites").append(self)
 
     PropertySpecification = property(getPropertySpecification, setPropertySpecification)
 
@@ -178,13 +175,12 @@ class UserAttribute(Element):
 
     def setProcedure(self, value):
         if self._Procedure is not None:
-            filtered = [x for x in self.Procedure.ProcedureValues if x != self]
-            self._Procedure._ProcedureValues = filtered
+            self._Procedure._ProcedureValues.discard(self)
 
         self._Procedure = value
         if self._Procedure is not None:
             if self not in self._Procedure._ProcedureValues:
-                self._Procedure._ProcedureValues.append(self)
+                self._Procedure._reflist("_ProcedureValues").append(self)
 
     Procedure = property(getProcedure, setProcedure)
 
@@ -194,20 +190,19 @@ class UserAttribute(Element):
 
     def setPropertyAssets(self, value):
         for p in self._PropertyAssets:
-            filtered = [q for q in p.Properties if q != self]
-            self._PropertyAssets._Properties = filtered
+            p._Properties.discard(self)
         for r in value:
             if self not in r._Properties:
-                r._Properties.append(self)
-        self._PropertyAssets = value
+                r._reflist("_Properties").append(self)
+        self._PropertyAssets = RefList(value)
 
     PropertyAssets = property(getPropertyAssets, setPropertyAssets)
 
     def addPropertyAssets(self, *PropertyAssets):
         for obj in PropertyAssets:
             if self not in obj._Properties:
-                obj._Properties.append(self)
-            self._PropertyAssets.append(obj)
+                obj._reflist("_Properties").append(self)
+            self._reflist("_PropertyAssets").append(obj)
 
     def removePropertyAssets(self, *PropertyAssets):
         for obj in PropertyAssets:
@@ -221,13 +216,12 @@ class UserAttribute(Element):
 
     def setRatingSpecification(self, value):
         if self._RatingSpecification is not None:
-            filtered = [x for x in self.RatingSpecification.Ratings if x != self]
-            self._RatingSpecification._Ratings = filtered
+            self._RatingSpecification._Ratings.discard(self)
 
         self._RatingSpecification = value
         if self._RatingSpecification is not None:
             if self not in self._RatingSpecification._Ratings:
-                self._RatingSpecification._Ratings.append(self)
+                self._RatingSpecification._reflist("_Ratings").append(self)
 
     RatingSpecification = property(getRatingSpecification, setRatingSpecification)
 
@@ -237,20 +231,19 @@ class UserAttribute(Element):
 
     def setErpInvoiceLineItems(self, value):
         for p in self._ErpInvoiceLineItems:
-            filtered = [q for q in p.UserAttributes if q != self]
-            self._ErpInvoiceLineItems._UserAttributes = filtered
+            p._UserAttributes.discard(self)
         for r in value:
             if self not in r._UserAttributes:
-                r._UserAttributes.append(self)
-        self._ErpInvoiceLineItems = value
+                r._reflist("_UserAttributes").append(self)
+        self._ErpInvoiceLineItems = RefList(value)
 
     ErpInvoiceLineItems = property(getErpInvoiceLineItems, setErpInvoiceLineItems)
 
     def addErpInvoiceLineItems(self, *ErpInvoiceLineItems):
         for obj in ErpInvoiceLineItems:
             if self not in obj._UserAttributes:
-                obj._UserAttributes.append(self)
-            self._ErpInvoiceLineItems.append(obj)
+                obj._reflist("_UserAttributes").append(self)
+            self._reflist("_ErpInvoiceLineItems").append(obj)
 
     def removeErpInvoiceLineItems(self, *ErpInvoiceLineItems):
         for obj in ErpInvoiceLineItems:
@@ -264,20 +257,19 @@ class UserAttribute(Element):
 
     def setRatingAssets(self, value):
         for p in self._RatingAssets:
-            filtered = [q for q in p.Ratings if q != self]
-            self._RatingAssets._Ratings = filtered
+            p._Ratings.discard(self)
         for r in value:
             if self not in r._Ratings:
-                r._Ratings.append(self)
-        self._RatingAssets = value
+                r._reflist("_Ratings").append(self)
+        self._RatingAssets = RefList(value)
 
     RatingAssets = property(getRatingAssets, setRatingAssets)
 
     def addRatingAssets(self, *RatingAssets):
         for obj in RatingAssets:
             if self not in obj._Ratings:
-                obj._Ratings.append(self)
-            self._RatingAssets.append(obj)
+                obj._reflist("_Ratings").append(self)
+            self._reflist("_RatingAssets").append(obj)
 
     def removeRatingAssets(self, *RatingAssets):
         for obj in RatingAssets:
@@ -21,24 +21,29 @@
 """This package contains the information classes that support distribution management in general.
 """
 
-from CIM15.IEC61968.Common.PostalAddress import PostalAddress
-from CIM15.IEC61968.Common.Status import Status
-from CIM15.IEC61968.Common.ElectronicAddress import ElectronicAddress
-from CIM15.IEC61968.Common.Location import Location
-from CIM15.IEC61968.Common.TownDetail import TownDetail
-from CIM15.IEC61968.Common.CoordinateSystem import CoordinateSystem
-from CIM15.IEC61968.Common.Document import Document
-from CIM15.IEC61968.Common.PositionPoint import PositionPoint
-from CIM15.IEC61968.Common.UserAttribute import UserAttribute
-from CIM15.IEC61968.Common.StreetAddress import StreetAddress
-from CIM15.IEC61968.Common.StreetDetail import StreetDetail
-from CIM15.IEC61968.Common.TimeSchedule import TimeSchedule
-from CIM15.IEC61968.Common.ActivityRecord import ActivityRecord
-from CIM15.IEC61968.Common.TimePoint import TimePoint
-from CIM15.IEC61968.Common.Organisation import Organisation
-from CIM15.IEC61968.Common.TelephoneNumber import TelephoneNumber
-from CIM15.IEC61968.Common.Agreement import Agreement
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Common"
 nsPrefix = "cimCommon"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "PostalAddress",
+    "Status",
+    "ElectronicAddress",
+    "Location",
+    "TownDetail",
+    "CoordinateSystem",
+    "Document",
+    "PositionPoint",
+    "UserAttribute",
+    "StreetAddress",
+    "StreetDetail",
+    "TimeSchedule",
+    "ActivityRecord",
+    "TimePoint",
+    "Organisation",
+    "TelephoneNumber",
+    "Agreement",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from CIM15.Element import RefList
 
 class Customer(Organisation):
     """Organisation receiving services from ServiceSupplier.Organisation receiving services from ServiceSupplier.
@@ -52,28 +53,28 @@ class Customer(Organisation):
         #: Kind of customer. Values are: "windMachine", "residentialAndCommercial", "internalUse", "energyServiceScheduler", "residentialAndStreetlight", "residential", "pumpingLoad", "other", "commercialIndustrial", "energyServiceSupplier", "residentialStreetlightOthers", "residentialFarmService"
         self.kind = kind
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
-        self._EndDevices = []
-        self.EndDevices = [] if EndDevices is None else EndDevices
+        if EndDevices is not None:
+            self.EndDevices = EndDevices
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        if Works is not None:
+            self.Works = Works
 
         self.status = status
 
         self._PlannedOutage = None
         self.PlannedOutage = PlannedOutage
 
-        self._OutageNotifications = []
-        self.OutageNotifications = [] if OutageNotifications is None else OutageNotifications
+        if OutageNotifications is not None:
+            self.OutageNotifications = OutageNotifications
 
-        self._TroubleTickets = []
-        self.TroubleTickets = [] if TroubleTickets is None else TroubleTickets
+        if TroubleTickets is not None:
+            self.TroubleTickets = TroubleTickets
 
         super(Customer, self).__init__(*args, **kw_args)
 
@@ -83,6 +84,7 @@ class Customer(Organisation):
     _enums = {"kind": "CustomerKind"}
     _refs = ["CustomerAgreements", "ErpPersons", "EndDevices", "Works", "status", "PlannedOutage", "OutageNotifications", "TroubleTickets"]
     _many_refs = ["CustomerAgreements", "ErpPersons", "EndDevices", "Works", "OutageNotifications", "TroubleTickets"]
+    _inverses = {"CustomerAgreements": "Customer", "ErpPersons": "CustomerData", "EndDevices": "Customer", "Works": "Customers", "PlannedOutage": "CustomerDatas", "OutageNotifications": "CustomerDatas", "TroubleTickets": "CustomerData"}
 
     def getCustomerAgreements(self):
         """All agreements of this customer.
@@ -90,7 +92,8 @@ class Customer(Organisation):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
-        for x in self._CustomerAgreements:
+        value = RefList(value)
+        for x in list(self._CustomerAgreements):
             x.Customer = None
         for y in value:
             y._Customer = self
@@ -111,7 +114,8 @@ class Customer(Organisation):
         return self._ErpPersons
 
     def setErpPersons(self, value):
-        for x in self._ErpPersons:
+        value = RefList(value)
+        for x in list(self._ErpPersons):
             x.CustomerData = None
         for y in value:
             y._CustomerData = self
@@ -133,7 +137,8 @@ class Customer(Organisation):
         return self._EndDevices
 
     def setEndDevices(self, value):
-        for x in self._EndDevices:
+        value = RefList(value)
+        for x in list(self._EndDevices):
             x.Customer = None
         for y in value:
             y._Customer = self
@@ -156,20 +161,19 @@ class Customer(Organisation):
 
     def setWorks(self, value):
         for p in self._Works:
-            filtered = [q for q in p.Customers if q != self]
-            self._Works._Customers = filtered
+            p._Customers.discard(self)
         for r in value:
             if self not in r._Customers:
-                r._Customers.append(self)
-        self._Works = value
+                r._reflist("_Customers").append(self)
+        self._Works = RefList(value)
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
         for obj in Works:
             if self not in obj._Customers:
-                obj._Customers.append(self)
-            self._Works.append(obj)
+                obj._reflist("_Customers").append(self)
+            self._reflist("_Works").append(obj)
 
     def removeWorks(self, *Works):
         for obj in Works:
@@ -186,13 +190,12 @@ class Customer(Organisation):
 
     def setPlannedOutage(self, value):
         if self._PlannedOutage is not None:
-            filtered = [x for x in self.PlannedOutage.CustomerDatas if x != self]
-            self._PlannedOutage._CustomerDatas = filtered
+            self._PlannedOutage._CustomerDatas.discard(self)
 
         self._PlannedOutage = value
         if self._PlannedOutage is not None:
             if self not in self._PlannedOutage._CustomerDatas:
-                self._PlannedOutage._CustomerDatas.append(self)
+                self._PlannedOutage._reflist("_CustomerDatas").append(self)
 
     PlannedOutage = property(getPlannedOutage, setPlannedOutage)
 
@@ -202,20 +205,19 @@ class Customer(Organisation):
 
     def setOutageNotifications(self, value):
         for p in self._OutageNotifications:
-            filtered = [q for q in p.CustomerDatas if q != self]
-            self._OutageNotifications._CustomerDatas = filtered
+            p._CustomerDatas.discard(self)
         for r in value:
             if self not in r._CustomerDatas:
-                r._CustomerDatas.append(self)
-        self._OutageNotifications = value
+                r._reflist("_CustomerDatas").append(self)
+        self._OutageNotifications = RefList(value)
 
     OutageNotifications = property(getOutageNotifications, setOutageNotifications)
 
     def addOutageNotifications(self, *OutageNotifications):
         for obj in OutageNotifications:
             if self not in obj._CustomerDatas:
-                obj._CustomerDatas.append(self)
-            self._OutageNotifications.append(obj)
+                obj._reflist("_CustomerDatas").append(self)
+            self._reflist("_OutageNotifications").append(obj)
 
     def removeOutageNotifications(self, *OutageNotifications):
         for obj in OutageNotifications:
@@ -228,7 +230,8 @@ class Customer(Organisation):
         return self._TroubleTickets
 
     def setTroubleTickets(self, value):
-        for x in self._TroubleTickets:
+        value = RefList(value)
+        for x in list(self._TroubleTickets):
             x.CustomerData = None
         for y in value:
             y._CustomerData = self
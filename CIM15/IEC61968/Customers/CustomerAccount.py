@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class CustomerAccount(Document):
     """Assignment of a group of products and services purchased by the customer through a customer agreement, used as a mechanism for customer billing and payment. It contains common information from the various types of customer agreements to create billings (invoices) for a customer and receive payment.Assignment of a group of products and services purchased by the customer through a customer agreement, used as a mechanism for customer billing and payment. It contains common information from the various types of customer agreements to create billings (invoices) for a customer and receive payment.
@@ -33,20 +34,20 @@ class CustomerAccount(Document):
         @param PaymentTransactions: All payment transactions for this customer account.
         @param CustomerBillingInfos:
         """
-        self._WorkBillingInfos = []
-        self.WorkBillingInfos = [] if WorkBillingInfos is None else WorkBillingInfos
+        if WorkBillingInfos is not None:
+            self.WorkBillingInfos = WorkBillingInfos
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._ErpInvoicees = []
-        self.ErpInvoicees = [] if ErpInvoicees is None else ErpInvoicees
+        if ErpInvoicees is not None:
+            self.ErpInvoicees = ErpInvoicees
 
-        self._PaymentTransactions = []
-        self.PaymentTransactions = [] if PaymentTransactions is None else PaymentTransactions
+        if PaymentTransactions is not None:
+            self.PaymentTransactions = PaymentTransactions
 
-        self._CustomerBillingInfos = []
-        self.CustomerBillingInfos = [] if CustomerBillingInfos is None else CustomerBillingInfos
+        if CustomerBillingInfos is not None:
+            self.CustomerBillingInfos = CustomerBillingInfos
 
         super(CustomerAccount, self).__init__(*args, **kw_args)
 
@@ -56,13 +57,15 @@ class CustomerAccount(Document):
     _enums = {}
     _refs = ["WorkBillingInfos", "CustomerAgreements", "ErpInvoicees", "PaymentTransactions", "CustomerBillingInfos"]
     _many_refs = ["WorkBillingInfos", "CustomerAgreements", "ErpInvoicees", "PaymentTransactions", "CustomerBillingInfos"]
+    _inverses = {"WorkBillingInfos": "CustomerAccount", "CustomerAgreements": "CustomerAccount", "ErpInvoicees": "CustomerAccount", "PaymentTransactions": "CustomerAccount", "CustomerBillingInfos": "CustomerAccount"}
 
     def getWorkBillingInfos(self):
         
         return self._WorkBillingInfos
 
     def setWorkBillingInfos(self, value):
-        for x in self._WorkBillingInfos:
+        value = RefList(value)
+        for x in list(self._WorkBillingInfos):
             x.CustomerAccount = None
         for y in value:
             y._CustomerAccount = self
@@ -84,7 +87,8 @@ class CustomerAccount(Document):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
-        for x in self._CustomerAgreements:
+        value = RefList(value)
+        for x in list(self._CustomerAgreements):
             x.CustomerAccount = None
         for y in value:
             y._CustomerAccount = self
@@ -105,7 +109,8 @@ class CustomerAccount(Document):
         return self._ErpInvoicees
 
     def setErpInvoicees(self, value):
-        for x in self._ErpInvoicees:
+        value = RefList(value)
+        for x in list(self._ErpInvoicees):
             x.CustomerAccount = None
         for y in value:
             y._CustomerAccount = self
@@ -127,7 +132,8 @@ class CustomerAccount(Document):
         return self._PaymentTransactions
 
     def setPaymentTransactions(self, value):
-        for x in self._PaymentTransactions:
+        value = RefList(value)
+        for x in list(self._PaymentTransactions):
             x.CustomerAccount = None
         for y in value:
             y._CustomerAccount = self
@@ -148,7 +154,8 @@ class CustomerAccount(Document):
         return self._CustomerBillingInfos
 
     def setCustomerBillingInfos(self, value):
-        for x in self._CustomerBillingInfos:
+        value = RefList(value)
+        for x in list(self._CustomerBillingInfos):
             x.CustomerAccount = None
         for y in value:
             y._CustomerAccount = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Agreement import Agreement
+from CIM15.Element import RefList
 
 class CustomerAgreement(Agreement):
     """Agreement between the customer and the service supplier to pay for service at a specific service location. It records certain billing information about the type of service provided at the service location and is used during charge creation to determine the type of service.Agreement between the customer and the service supplier to pay for service at a specific service location. It records certain billing information about the type of service provided at the service location and is used during charge creation to determine the type of service.
@@ -52,8 +53,8 @@ class CustomerAgreement(Agreement):
         #: Budget bill code.
         self.budgetBill = budgetBill
 
-        self._PricingStructures = []
-        self.PricingStructures = [] if PricingStructures is None else PricingStructures
+        if PricingStructures is not None:
+            self.PricingStructures = PricingStructures
 
         self._CustomerAccount = None
         self.CustomerAccount = CustomerAccount
@@ -61,32 +62,32 @@ class CustomerAgreement(Agreement):
         self._StandardIndustryCode = None
         self.StandardIndustryCode = StandardIndustryCode
 
-        self._AuxiliaryAgreements = []
-        self.AuxiliaryAgreements = [] if AuxiliaryAgreements is None else AuxiliaryAgreements
+        if AuxiliaryAgreements is not None:
+            self.AuxiliaryAgreements = AuxiliaryAgreements
 
-        self._MeterReadings = []
-        self.MeterReadings = [] if MeterReadings is None else MeterReadings
+        if MeterReadings is not None:
+            self.MeterReadings = MeterReadings
 
-        self._Equipments = []
-        self.Equipments = [] if Equipments is None else Equipments
+        if Equipments is not None:
+            self.Equipments = Equipments
 
         self._ServiceSupplier = None
         self.ServiceSupplier = ServiceSupplier
 
-        self._ServiceLocations = []
-        self.ServiceLocations = [] if ServiceLocations is None else ServiceLocations
+        if ServiceLocations is not None:
+            self.ServiceLocations = ServiceLocations
 
         self._DemandResponseProgram = None
         self.DemandResponseProgram = DemandResponseProgram
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         self._Customer = None
         self.Customer = Customer
 
-        self._EndDeviceControls = []
-        self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
+        if EndDeviceControls is not None:
+            self.EndDeviceControls = EndDeviceControls
 
         super(CustomerAgreement, self).__init__(*args, **kw_args)
 
@@ -96,6 +97,7 @@ class CustomerAgreement(Agreement):
     _enums = {}
     _refs = ["PricingStructures", "CustomerAccount", "StandardIndustryCode", "AuxiliaryAgreements", "MeterReadings", "Equipments", "ServiceSupplier", "ServiceLocations", "DemandResponseProgram", "ServiceDeliveryPoints", "Customer", "EndDeviceControls"]
     _many_refs = ["PricingStructures", "AuxiliaryAgreements", "MeterReadings", "Equipments", "ServiceLocations", "ServiceDeliveryPoints", "EndDeviceControls"]
+    _inverses = {"PricingStructures": "CustomerAgreements", "CustomerAccount": "CustomerAgreements", "StandardIndustryCode": "CustomerAgreements", "AuxiliaryAgreements": "CustomerAgreement", "MeterReadings": "CustomerAgreement", "Equipments": "CustomerAgreements", "ServiceSupplier": "CustomerAgreements", "ServiceLocations": "CustomerAgreements", "DemandResponseProgram": "CustomerAgreements", "ServiceDeliveryPoints": "CustomerAgreement", "Customer": "CustomerAgreements", "EndDeviceControls": "CustomerAgreement"}
 
     def getPricingStructures(self):
         """All pricing structures applicable to this customer agreement.
@@ -104,20 +106,19 @@ class CustomerAgreement(Agreement):
 
     def setPricingStructures(self, value):
         for p in self._PricingStructures:
-            filtered = [q for q in p.CustomerAgreements if q != self]
-            self._PricingStructures._CustomerAgreements = filtered
+            p._CustomerAgreements.discard(self)
         for r in value:
             if self not in r._CustomerAgreements:
-                r._CustomerAgreements.append(self)
-        self._PricingStructures = value
+                r._reflist("_CustomerAgreements").append(self)
+        self._PricingStructures = RefList(value)
 
     PricingStructures = property(getPricingStructures, setPricingStructures)
 
     def addPricingStructures(self, *PricingStructures):
         for obj in PricingStructures:
             if self not in obj._CustomerAgreements:
-                obj._CustomerAgreements.append(self)
-            self._PricingStructures.append(obj)
+                obj._reflist("_CustomerAgreements").append(self)
+            self._reflist("_PricingStructures").append(obj)
 
     def removePricingStructures(self, *PricingStructures):
         for obj in PricingStructures:
@@ -132,13 +133,12 @@ class CustomerAgreement(Agreement):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.CustomerAgreements if x != self]
-            self._CustomerAccount._CustomerAgreements = filtered
+            self._CustomerAccount._CustomerAgreements.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
             if self not in self._CustomerAccount._CustomerAgreements:
-                self._CustomerAccount._CustomerAgreements.append(self)
+                self._CustomerAccount._reflist("_CustomerAgreements").append(self)
 
     CustomerAccount = property(getCustomerAccount, setCustomerAccount)
 
@@ -148,13 +148,12 @@ class CustomerAgreement(Agreement):
 
     def setStandardIndustryCode(self, value):
         if self._StandardIndustryCode is not None:
-            filtered = [x for x in self.StandardIndustryCode.CustomerAgreements if x != self]
-            self._StandardIndustryCode._CustomerAgreements = filtered
+            self._StandardIndustryCode._CustomerAgreements.discard(self)
 
         self._StandardIndustryCode = value
         if self._StandardIndustryCode is not None:
             if self not in self._StandardIndustryCode._CustomerAgreements:
-                self._StandardIndustryCode._CustomerAgreements.append(self)
+                self._StandardIndustryCode._reflist("_CustomerAgreements").append(self)
 
     StandardIndustryCode = property(getStandardIndustryCode, setStandardIndustryCode)
 
@@ -164,7 +163,8 @@ class CustomerAgreement(Agreement):
         return self._AuxiliaryAgreements
 
     def setAuxiliaryAgreements(self, value):
-        for x in self._AuxiliaryAgreements:
+        value = RefList(value)
+        for x in list(self._AuxiliaryAgreements):
             x.CustomerAgreement = None
         for y in value:
             y._CustomerAgreement = self
@@ -186,7 +186,8 @@ class CustomerAgreement(Agreement):
         return self._MeterReadings
 
     def setMeterReadings(self, value):
-        for x in self._MeterReadings:
+        value = RefList(value)
+        for x in list(self._MeterReadings):
             x.CustomerAgreement = None
         for y in value:
             y._CustomerAgreement = self
@@ -208,20 +209,19 @@ class CustomerAgreement(Agreement):
 
     def setEquipments(self, value):
         for p in self._Equipments:
-            filtered = [q for q in p.CustomerAgreements if q != self]
-            self._Equipments._CustomerAgreements = filtered
+            p._CustomerAgreements.discard(self)
         for r in value:
             if self not in r._CustomerAgreements:
-                r._CustomerAgreements.append(self)
-        self._Equipments = value
+                r._reflist("_CustomerAgreements").append(self)
+        self._Equipments = RefList(value)
 
     Equipments = property(getEquipments, setEquipments)
 
     def addEquipments(self, *Equipments):
         for obj in Equipments:
             if self not in obj._CustomerAgreements:
-                obj._CustomerAgreements.append(self)
-            self._Equipments.append(obj)
+                obj._reflist("_CustomerAgreements").append(self)
+            self._reflist("_Equipments").append(obj)
 
     def removeEquipments(self, *Equipments):
         for obj in Equipments:
@@ -236,13 +236,12 @@ class CustomerAgreement(Agreement):
 
     def setServiceSupplier(self, value):
         if self._ServiceSupplier is not None:
-            filtered = [x for x in self.ServiceSupplier.CustomerAgreements if x != self]
-            self._ServiceSupplier._CustomerAgreements = filtered
+            self._ServiceSupplier._CustomerAgreements.discard(self)
 
         self._ServiceSupplier = value
         if self._ServiceSupplier is not None:
             if self not in self._ServiceSupplier._CustomerAgreements:
-                self._ServiceSupplier._CustomerAgreements.append(self)
+                self._ServiceSupplier._reflist("_CustomerAgreements").append(self)
 
     ServiceSupplier = property(getServiceSupplier, setServiceSupplier)
 
@@ -253,20 +252,19 @@ class CustomerAgreement(Agreement):
 
     def setServiceLocations(self, value):
         for p in self._ServiceLocations:
-            filtered = [q for q in p.CustomerAgreements if q != self]
-            self._ServiceLocations._CustomerAgreements = filtered
+            p._CustomerAgreements.discard(self)
         for r in value:
             if self not in r._CustomerAgreements:
-                r._CustomerAgreements.append(self)
-        self._ServiceLocations = value
+                r._reflist("_CustomerAgreements").append(self)
+        self._ServiceLocations = RefList(value)
 
     ServiceLocations = property(getServiceLocations, setServiceLocations)
 
     def addServiceLocations(self, *ServiceLocations):
         for obj in ServiceLocations:
             if self not in obj._CustomerAgreements:
-                obj._CustomerAgreements.append(self)
-            self._ServiceLocations.append(obj)
+                obj._reflist("_CustomerAgreements").append(self)
+            self._reflist("_ServiceLocations").append(obj)
 
     def removeServiceLocations(self, *ServiceLocations):
         for obj in ServiceLocations:
@@ -281,13 +279,12 @@ class CustomerAgreement(Agreement):
 
     def setDemandResponseProgram(self, value):
         if self._DemandResponseProgram is not None:
-            filtered = [x for x in self.DemandResponseProgram.CustomerAgreements if x != self]
-            self._DemandResponseProgram._CustomerAgreements = filtered
+            self._DemandResponseProgram._CustomerAgreements.discard(self)
 
         self._DemandResponseProgram = value
         if self._DemandResponseProgram is not None:
             if self not in self._DemandResponseProgram._CustomerAgreements:
-                self._DemandResponseProgram._CustomerAgreements.append(self)
+                self._DemandResponseProgram._reflist("_CustomerAgreements").append(self)
 
     DemandResponseProgram = property(getDemandResponseProgram, setDemandResponseProgram)
 
@@ -297,7 +294,8 @@ class CustomerAgreement(Agreement):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
-        for x in self._ServiceDeliveryPoints:
+        value = RefList(value)
+        for x in list(self._ServiceDeliveryPoints):
             x.CustomerAgreement = None
         for y in value:
             y._CustomerAgreement = self
@@ -320,13 +318,12 @@ class CustomerAgreement(Agreement):
 
     def setCustomer(self, value):
         if self._Customer is not None:
-            filtered = [x for x in self.Customer.CustomerAgreements if x != self]
-            self._Customer._CustomerAgreements = filtered
+            self._Customer._CustomerAgreements.discard(self)
 
         self._Customer = value
         if self._Customer is not None:
             if self not in self._Customer._CustomerAgreements:
-                self._Customer._CustomerAgreements.append(self)
+                self._Customer._reflist("_CustomerAgreements").append(self)
 
     Customer = property(getCustomer, setCustomer)
 
@@ -336,7 +333,8 @@ class CustomerAgreement(Agreement):
         return self._EndDeviceControls
 
     def setEndDeviceControls(self, value):
-        for x in self._EndDeviceControls:
+        value = RefList(value)
+        for x in list(self._EndDeviceControls):
             x.CustomerAgreement = None
         for y in value:
             y._CustomerAgreement = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ServiceCategory(IdentifiedObject):
     """Category of service provided to the customer.Category of service provided to the customer.
@@ -34,11 +35,11 @@ class ServiceCategory(IdentifiedObject):
         #: Kind of service. Values are: "other", "refuse", "sewerage", "electricity", "heat", "internet", "rates", "time", "water", "gas", "tvLicence"
         self.kind = kind
 
-        self._PricingStructures = []
-        self.PricingStructures = [] if PricingStructures is None else PricingStructures
+        if PricingStructures is not None:
+            self.PricingStructures = PricingStructures
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         super(ServiceCategory, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class ServiceCategory(IdentifiedObject):
     _enums = {"kind": "ServiceKind"}
     _refs = ["PricingStructures", "ServiceDeliveryPoints"]
     _many_refs = ["PricingStructures", "ServiceDeliveryPoints"]
+    _inverses = {"PricingStructures": "ServiceCategory", "ServiceDeliveryPoints": "ServiceCategory"}
 
     def getPricingStructures(self):
         """All pricing structures applicable to this service category.
@@ -55,7 +57,8 @@ class ServiceCategory(IdentifiedObject):
         return self._PricingStructures
 
     def setPricingStructures(self, value):
-        for x in self._PricingStructures:
+        value = RefList(value)
+        for x in list(self._PricingStructures):
             x.ServiceCategory = None
         for y in value:
             y._ServiceCategory = self
@@ -77,7 +80,8 @@ class ServiceCategory(IdentifiedObject):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
-        for x in self._ServiceDeliveryPoints:
+        value = RefList(value)
+        for x in list(self._ServiceDeliveryPoints):
             x.ServiceCategory = None
         for y in value:
             y._ServiceCategory = self
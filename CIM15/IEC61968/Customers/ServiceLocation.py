@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Location import Location
+from CIM15.Element import RefList
 
 class ServiceLocation(Location):
     """A customer service location has one or more service delivery points, which in turn relate to Meters. The location may be a point or a polygon, depending on the specific circumstances. For distribution, the service location is typically the location of the utility customer's premise. Because a customer's premise may have one or more meters, the service delivery point is used to define the actual conducting equipment that the end device attaches to at the utility customer's service location. For transmission, it is the point(s) of interconnection on the transmission provider's transmission system where capacity and/or energy transmitted by the transmission provider is made available to the receiving party.A customer service location has one or more service delivery points, which in turn relate to Meters. The location may be a point or a polygon, depending on the specific circumstances. For distribution, the service location is typically the location of the utility customer's premise. Because a customer's premise may have one or more meters, the service delivery point is used to define the actual conducting equipment that the end device attaches to at the utility customer's service location. For transmission, it is the point(s) of interconnection on the transmission provider's transmission system where capacity and/or energy transmitted by the transmission provider is made available to the receiving party.
@@ -44,17 +45,17 @@ class ServiceLocation(Location):
         #: True if inspection is needed of facilities at this service location. This could be requested by a customer, due to suspected tampering, environmental concerns (e.g., a fire in the vicinity), or to correct incompatible data.
         self.needsInspection = needsInspection
 
-        self._EndDevices = []
-        self.EndDevices = [] if EndDevices is None else EndDevices
+        if EndDevices is not None:
+            self.EndDevices = EndDevices
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
         super(ServiceLocation, self).__init__(*args, **kw_args)
 
@@ -64,6 +65,7 @@ class ServiceLocation(Location):
     _enums = {}
     _refs = ["EndDevices", "ErpPersons", "ServiceDeliveryPoints", "CustomerAgreements"]
     _many_refs = ["EndDevices", "ErpPersons", "ServiceDeliveryPoints", "CustomerAgreements"]
+    _inverses = {"EndDevices": "ServiceLocation", "ErpPersons": "ServiceLocation", "ServiceDeliveryPoints": "ServiceLocation", "CustomerAgreements": "ServiceLocations"}
 
     def getEndDevices(self):
         """All end devices that measure the service delivered to this service location.
@@ -71,7 +73,8 @@ class ServiceLocation(Location):
         return self._EndDevices
 
     def setEndDevices(self, value):
-        for x in self._EndDevices:
+        value = RefList(value)
+        for x in list(self._EndDevices):
             x.ServiceLocation = None
         for y in value:
             y._ServiceLocation = self
@@ -92,7 +95,8 @@ class ServiceLocation(Location):
         return self._ErpPersons
 
     def setErpPersons(self, value):
-        for x in self._ErpPersons:
+        value = RefList(value)
+        for x in list(self._ErpPersons):
             x.ServiceLocation = None
         for y in value:
             y._ServiceLocation = self
@@ -114,7 +118,8 @@ class ServiceLocation(Location):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
-        for x in self._ServiceDeliveryPoints:
+        value = RefList(value)
+        for x in list(self._ServiceDeliveryPoints):
             x.ServiceLocation = None
         for y in value:
             y._ServiceLocation = self
@@ -137,20 +142,19 @@ class ServiceLocation(Location):
 
     def setCustomerAgreements(self, value):
         for p in self._CustomerAgreements:
-            filtered = [q for q in p.ServiceLocations if q != self]
-            self._CustomerAgreements._ServiceLocations = filtered
+            p._ServiceLocations.discard(self)
         for r in value:
             if self not in r._ServiceLocations:
-                r._ServiceLocations.append(self)
-        self._CustomerAgreements = value
+                r._reflist("_ServiceLocations").append(self)
+        self._CustomerAgreements = RefList(value)
 
     CustomerAgreements = property(getCustomerAgreements, setCustomerAgreements)
 
     def addCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
             if self not in obj._ServiceLocations:
-                obj._ServiceLocations.append(self)
-            self._CustomerAgreements.append(obj)
+                obj._reflist("_ServiceLocations").append(self)
+            self._reflist("_CustomerAgreements").append(obj)
 
     def removeCustomerAgreements(self, *CustomerAgreements):
         for obj in CustomerAgreements:
@@ -21,13 +21,8 @@
 """This package contains the core information classes that support customer billing applications.
 """
 
-from CIM15.IEC61968.Customers.Tariff import Tariff
-from CIM15.IEC61968.Customers.CustomerAccount import CustomerAccount
-from CIM15.IEC61968.Customers.ServiceLocation import ServiceLocation
-from CIM15.IEC61968.Customers.CustomerAgreement import CustomerAgreement
-from CIM15.IEC61968.Customers.ServiceCategory import ServiceCategory
-from CIM15.IEC61968.Customers.PricingStructure import PricingStructure
-from CIM15.IEC61968.Customers.Customer import Customer
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Customers"
 nsPrefix = "cimCustomers"
@@ -47,3 +42,14 @@ class ServiceKind(str):
     """Values are: other, refuse, sewerage, electricity, heat, internet, rates, time, water, gas, tvLicence
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Tariff",
+    "CustomerAccount",
+    "ServiceLocation",
+    "CustomerAgreement",
+    "ServiceCategory",
+    "PricingStructure",
+    "Customer",
+])
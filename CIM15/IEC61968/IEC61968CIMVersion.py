@@ -44,4 +44,5 @@ class IEC61968CIMVersion(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
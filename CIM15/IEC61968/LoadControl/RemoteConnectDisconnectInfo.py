@@ -82,4 +82,5 @@ class RemoteConnectDisconnectInfo(object):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
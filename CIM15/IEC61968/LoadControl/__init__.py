@@ -21,9 +21,14 @@
 """This package is an extension of the Metering package and contains the information classes that support specialised applications such as demand-side management using load control equipment. These classes are generally associated with the point where a service is delivered to the customer.
 """
 
-from CIM15.IEC61968.LoadControl.ConnectDisconnectFunction import ConnectDisconnectFunction
-from CIM15.IEC61968.LoadControl.RemoteConnectDisconnectInfo import RemoteConnectDisconnectInfo
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#LoadControl"
 nsPrefix = "cimLoadControl"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ConnectDisconnectFunction",
+    "RemoteConnectDisconnectInfo",
+])
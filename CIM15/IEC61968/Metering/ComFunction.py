@@ -48,4 +48,5 @@ class ComFunction(EndDeviceFunction):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
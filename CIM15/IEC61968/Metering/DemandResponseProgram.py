@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class DemandResponseProgram(IdentifiedObject):
     """Demand response program.Demand response program.
@@ -36,16 +37,16 @@ class DemandResponseProgram(IdentifiedObject):
         #: Type of demand response program; examples are CPP (critical-peak pricing), RTP (real-time pricing), DLC (direct load control), DBP (demand bidding program), BIP (base interruptible program). Note that possible types change a lot and it would be impossible to enumerate them all.
         self.type = type
 
-        self._EndDeviceControls = []
-        self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
+        if EndDeviceControls is not None:
+            self.EndDeviceControls = EndDeviceControls
 
         self.validityInterval = validityInterval
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
-        self._EndDeviceGroups = []
-        self.EndDeviceGroups = [] if EndDeviceGroups is None else EndDeviceGroups
+        if EndDeviceGroups is not None:
+            self.EndDeviceGroups = EndDeviceGroups
 
         super(DemandResponseProgram, self).__init__(*args, **kw_args)
 
@@ -55,6 +56,7 @@ class DemandResponseProgram(IdentifiedObject):
     _enums = {}
     _refs = ["EndDeviceControls", "validityInterval", "CustomerAgreements", "EndDeviceGroups"]
     _many_refs = ["EndDeviceControls", "CustomerAgreements", "EndDeviceGroups"]
+    _inverses = {"EndDeviceControls": "DemandResponseProgram", "CustomerAgreements": "DemandResponseProgram", "EndDeviceGroups": "DemandResponseProgram"}
 
     def getEndDeviceControls(self):
         """All end device controls with this demand response program.
@@ -62,7 +64,8 @@ class DemandResponseProgram(IdentifiedObject):
         return self._EndDeviceControls
 
     def setEndDeviceControls(self, value):
-        for x in self._EndDeviceControls:
+        value = RefList(value)
+        for x in list(self._EndDeviceControls):
             x.DemandResponseProgram = None
         for y in value:
             y._DemandResponseProgram = self
@@ -87,7 +90,8 @@ class DemandResponseProgram(IdentifiedObject):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
-        for x in self._CustomerAgreements:
+        value = RefList(value)
+        for x in list(self._CustomerAgreements):
             x.DemandResponseProgram = None
         for y in value:
             y._DemandResponseProgram = self
@@ -109,7 +113,8 @@ class DemandResponseProgram(IdentifiedObject):
         return self._EndDeviceGroups
 
     def setEndDeviceGroups(self, value):
-        for x in self._EndDeviceGroups:
+        value = RefList(value)
+        for x in list(self._EndDeviceGroups):
             x.DemandResponseProgram = None
         for y in value:
             y._DemandResponseProgram = self
@@ -46,4 +46,5 @@ class DynamicDemand(object):
     _enums = {"kind": "DemandKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
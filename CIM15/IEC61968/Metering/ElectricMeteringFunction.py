@@ -56,6 +56,7 @@ class ElectricMeteringFunction(EndDeviceFunction):
     _enums = {}
     _refs = ["ctRatioMultiplier", "billingMultiplier", "vtRatioMultiplier", "demandMultiplier"]
     _many_refs = []
+    _inverses = {}
 
     # Current transformer ratio used to convert associated quantities to real measurements.
     ctRatioMultiplier = None
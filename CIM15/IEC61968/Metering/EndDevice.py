@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetContainer import AssetContainer
+from CIM15.Element import RefList
 
 class EndDevice(AssetContainer):
     """Asset container that performs one or more end device functions. One type of end device is a meter which can perform metering, load management, connect/disconnect, accounting functions, etc. Some end devices, such as ones monitoring and controlling air conditioner, refrigerator, pool pumps may be connected to a meter. All end devices may have communication capability defined by the associated communication function(s). An end device may be owned by a consumer, a service provider, utility or otherwise. There may be a related end device function that identifies a sensor or control point within a metering application or communications systems (e.g., water, gas, electricity). Some devices may use an optical port that conforms to the ANSI C12.18 standard for communications.Asset container that performs one or more end device functions. One type of end device is a meter which can perform metering, load management, connect/disconnect, accounting functions, etc. Some end devices, such as ones monitoring and controlling air conditioner, refrigerator, pool pumps may be connected to a meter. All end devices may have communication capability defined by the associated communication function(s). An end device may be owned by a consumer, a service provider, utility or otherwise. There may be a related end device function that identifies a sensor or control point within a metering application or communications systems (e.g., water, gas, electricity). Some devices may use an optical port that conforms to the ANSI C12.18 standard for communications.
@@ -52,17 +53,17 @@ class EndDevice(AssetContainer):
         self._ServiceLocation = None
         self.ServiceLocation = ServiceLocation
 
-        self._EndDeviceFunctions = []
-        self.EndDeviceFunctions = [] if EndDeviceFunctions is None else EndDeviceFunctions
+        if EndDeviceFunctions is not None:
+            self.EndDeviceFunctions = EndDeviceFunctions
 
-        self._EndDeviceControls = []
-        self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
+        if EndDeviceControls is not None:
+            self.EndDeviceControls = EndDeviceControls
 
         self._Customer = None
         self.Customer = Customer
 
-        self._EndDeviceGroups = []
-        self.EndDeviceGroups = [] if EndDeviceGroups is None else EndDeviceGroups
+        if EndDeviceGroups is not None:
+            self.EndDeviceGroups = EndDeviceGroups
 
         super(EndDevice, self).__init__(*args, **kw_args)
 
@@ -72,6 +73,7 @@ class EndDevice(AssetContainer):
     _enums = {}
     _refs = ["EndDeviceInfo", "ServiceDeliveryPoint", "ServiceLocation", "EndDeviceFunctions", "EndDeviceControls", "Customer", "EndDeviceGroups"]
     _many_refs = ["EndDeviceFunctions", "EndDeviceControls", "EndDeviceGroups"]
+    _inverses = {"EndDeviceInfo": "EndDevices", "ServiceDeliveryPoint": "EndDevices", "ServiceLocation": "EndDevices", "EndDeviceFunctions": "EndDevice", "EndDeviceControls": "EndDevice", "Customer": "EndDevices", "EndDeviceGroups": "EndDevices"}
 
     def getEndDeviceInfo(self):
         """End device data.
@@ -80,13 +82,12 @@ class EndDevice(AssetContainer):
 
     def setEndDeviceInfo(self, value):
         if self._EndDeviceInfo is not None:
-            filtered = [x for x in self.EndDeviceInfo.EndDevices if x != self]
-            self._EndDeviceInfo._EndDevices = filtered
+            self._EndDeviceInfo._EndDevices.discard(self)
 
         self._EndDeviceInfo = value
         if self._EndDeviceInfo is not None:
             if self not in self._EndDeviceInfo._EndDevices:
-                self._EndDeviceInfo._EndDevices.append(self)
+                self._EndDeviceInfo._reflist("_EndDevices").append(self)
 
     EndDeviceInfo = property(getEndDeviceInfo, setEndDeviceInfo)
 
@@ -97,13 +98,12 @@ class EndDevice(AssetContainer):
 
     def setServiceDeliveryPoint(self, value):
         if self._ServiceDeliveryPoint is not None:
-            filtered = [x for x in self.ServiceDeliveryPoint.EndDevices if x != self]
-            self._ServiceDeliveryPoint._EndDevices = filtered
+            self._ServiceDeliveryPoint._EndDevices.discard(self)
 
         self._ServiceDeliveryPoint = value
         if self._ServiceDeliveryPoint is not None:
             if self not in self._ServiceDeliveryPoint._EndDevices:
-                self._ServiceDeliveryPoint._EndDevices.append(self)
+                self._ServiceDeliveryPoint._reflist("_EndDevices").append(self)
 
     ServiceDeliveryPoint = property(getServiceDeliveryPoint, setServiceDeliveryPoint)
 
@@ -114,13 +114,12 @@ class EndDevice(AssetContainer):
 
     def setServiceLocation(self, value):
         if self._ServiceLocation is not None:
-            filtered = [x for x in self.ServiceLocation.EndDevices if x != self]
-            self._ServiceLocation._EndDevices = filtered
+            self._ServiceLocation._EndDevices.discard(self)
 
         self._ServiceLocation = value
         if self._ServiceLocation is not None:
             if self not in self._ServiceLocation._EndDevices:
-                self._ServiceLocation._EndDevices.append(self)
+                self._ServiceLocation._reflist("_EndDevices").append(self)
 
     ServiceLocation = property(getServiceLocation, setServiceLocation)
 
@@ -130,7 +129,8 @@ class EndDevice(AssetContainer):
         return self._EndDeviceFunctions
 
     def setEndDeviceFunctions(self, value):
-        for x in self._EndDeviceFunctions:
+        value = RefList(value)
+        for x in list(self._EndDeviceFunctions):
             x.EndDevice = None
         for y in value:
             y._EndDevice = self
@@ -152,7 +152,8 @@ class EndDevice(AssetContainer):
         return self._EndDeviceControls
 
     def setEndDeviceControls(self, value):
-        for x in self._EndDeviceControls:
+        value = RefList(value)
+        for x in list(self._EndDeviceControls):
             x.EndDevice = None
         for y in value:
             y._EndDevice = self
@@ -175,13 +176,12 @@ class EndDevice(AssetContainer):
 
     def setCustomer(self, value):
         if self._Customer is not None:
-            filtered = [x for x in self.Customer.EndDevices if x != self]
-            self._Customer._EndDevices = filtered
+            self._Customer._EndDevices.discard(self)
 
         self._Customer = value
         if self._Customer is not None:
             if self not in self._Customer._EndDevices:
-                self._Customer._EndDevices.append(self)
+                self._Customer._reflist("_EndDevices").append(self)
 
     Customer = property(getCustomer, setCustomer)
 
@@ -192,20 +192,19 @@ class EndDevice(AssetContainer):
 
     def setEndDeviceGroups(self, value):
         for p in self._EndDeviceGroups:
-            filtered = [q for q in p.EndDevices if q != self]
-            self._EndDeviceGroups._EndDevices = filtered
+            p._EndDevices.discard(self)
         for r in value:
             if self not in r._EndDevices:
-                r._EndDevices.append(self)
-        self._EndDeviceGroups = value
+                r._reflist("_EndDevices").append(self)
+        self._EndDeviceGroups = RefList(value)
 
     EndDeviceGroups = property(getEndDeviceGroups, setEndDeviceGroups)
 
     def addEndDeviceGroups(self, *EndDeviceGroups):
         for obj in EndDeviceGroups:
             if self not in obj._EndDevices:
-                obj._EndDevices.append(self)
-            self._EndDeviceGroups.append(obj)
+                obj._reflist("_EndDevices").append(self)
+            self._reflist("_EndDeviceGroups").append(obj)
 
     def removeEndDeviceGroups(self, *EndDeviceGroups):
         for obj in EndDeviceGroups:
@@ -71,6 +71,7 @@ class EndDeviceControl(IdentifiedObject):
     _enums = {}
     _refs = ["DemandResponseProgram", "CustomerAgreement", "scheduledInterval", "EndDeviceGroup", "EndDevice"]
     _many_refs = []
+    _inverses = {"DemandResponseProgram": "EndDeviceControls", "CustomerAgreement": "EndDeviceControls", "EndDeviceGroup": "EndDeviceControls", "EndDevice": "EndDeviceControls"}
 
     def getDemandResponseProgram(self):
         """Demand response program for this end device control.
@@ -79,13 +80,12 @@ class EndDeviceControl(IdentifiedObject):
 
     def setDemandResponseProgram(self, value):
         if self._DemandResponseProgram is not None:
-            filtered = [x for x in self.DemandResponseProgram.EndDeviceControls if x != self]
-            self._DemandResponseProgram._EndDeviceControls = filtered
+            self._DemandResponseProgram._EndDeviceControls.discard(self)
 
         self._DemandResponseProgram = value
         if self._DemandResponseProgram is not None:
             if self not in self._DemandResponseProgram._EndDeviceControls:
-                self._DemandResponseProgram._EndDeviceControls.append(self)
+                self._DemandResponseProgram._reflist("_EndDeviceControls").append(self)
 
     DemandResponseProgram = property(getDemandResponseProgram, setDemandResponseProgram)
 
@@ -96,13 +96,12 @@ class EndDeviceControl(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.EndDeviceControls if x != self]
-            self._CustomerAgreement._EndDeviceControls = filtered
+            self._CustomerAgreement._EndDeviceControls.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
             if self not in self._CustomerAgreement._EndDeviceControls:
-                self._CustomerAgreement._EndDeviceControls.append(self)
+                self._CustomerAgreement._reflist("_EndDeviceControls").append(self)
 
     CustomerAgreement = property(getCustomerAgreement, setCustomerAgreement)
 
@@ -116,13 +115,12 @@ class EndDeviceControl(IdentifiedObject):
 
     def setEndDeviceGroup(self, value):
         if self._EndDeviceGroup is not None:
-            filtered = [x for x in self.EndDeviceGroup.EndDeviceControls if x != self]
-            self._EndDeviceGroup._EndDeviceControls = filtered
+            self._EndDeviceGroup._EndDeviceControls.discard(self)
 
         self._EndDeviceGroup = value
         if self._EndDeviceGroup is not None:
             if self not in self._EndDeviceGroup._EndDeviceControls:
-                self._EndDeviceGroup._EndDeviceControls.append(self)
+                self._EndDeviceGroup._reflist("_EndDeviceControls").append(self)
 
     EndDeviceGroup = property(getEndDeviceGroup, setEndDeviceGroup)
 
@@ -133,13 +131,12 @@ class EndDeviceControl(IdentifiedObject):
 
     def setEndDevice(self, value):
         if self._EndDevice is not None:
-            filtered = [x for x in self.EndDevice.EndDeviceControls if x != self]
-            self._EndDevice._EndDeviceControls = filtered
+            self._EndDevice._EndDeviceControls.discard(self)
 
         self._EndDevice = value
         if self._EndDevice is not None:
             if self not in self._EndDevice._EndDeviceControls:
-                self._EndDevice._EndDeviceControls.append(self)
+                self._EndDevice._reflist("_EndDeviceControls").append(self)
 
     EndDevice = property(getEndDevice, setEndDevice)
 
@@ -48,6 +48,7 @@ class EndDeviceEvent(ActivityRecord):
     _enums = {}
     _refs = ["EndDeviceFunction", "MeterReading"]
     _many_refs = []
+    _inverses = {"EndDeviceFunction": "EndDeviceEvents", "MeterReading": "EndDeviceEvents"}
 
     def getEndDeviceFunction(self):
         """End device function that reported this end device event.
@@ -56,13 +57,12 @@ class EndDeviceEvent(ActivityRecord):
 
     def setEndDeviceFunction(self, value):
         if self._EndDeviceFunction is not None:
-            filtered = [x for x in self.EndDeviceFunction.EndDeviceEvents if x != self]
-            self._EndDeviceFunction._EndDeviceEvents = filtered
+            self._EndDeviceFunction._EndDeviceEvents.discard(self)
 
         self._EndDeviceFunction = value
         if self._EndDeviceFunction is not None:
             if self not in self._EndDeviceFunction._EndDeviceEvents:
-                self._EndDeviceFunction._EndDeviceEvents.append(self)
+                self._EndDeviceFunction._reflist("_EndDeviceEvents").append(self)
 
     EndDeviceFunction = property(getEndDeviceFunction, setEndDeviceFunction)
 
@@ -73,13 +73,12 @@ class EndDeviceEvent(ActivityRecord):
 
     def setMeterReading(self, value):
         if self._MeterReading is not None:
-            filtered = [x for x in self.MeterReading.EndDeviceEvents if x != self]
-            self._MeterReading._EndDeviceEvents = filtered
+            self._MeterReading._EndDeviceEvents.discard(self)
 
         self._MeterReading = value
         if self._MeterReading is not None:
             if self not in self._MeterReading._EndDeviceEvents:
-                self._MeterReading._EndDeviceEvents.append(self)
+                self._MeterReading._reflist("_EndDeviceEvents").append(self)
 
     MeterReading = property(getMeterReading, setMeterReading)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetFunction import AssetFunction
+from CIM15.Element import RefList
 
 class EndDeviceFunction(AssetFunction):
     """Function performed by an end device such as a meter, communication equipment, controllers, etc.Function performed by an end device such as a meter, communication equipment, controllers, etc.
@@ -40,14 +41,14 @@ class EndDeviceFunction(AssetFunction):
         #: True if the function is supported (inherent property of the device).
         self.supported = supported
 
-        self._Registers = []
-        self.Registers = [] if Registers is None else Registers
+        if Registers is not None:
+            self.Registers = Registers
 
         self._ComEquipment = None
         self.ComEquipment = ComEquipment
 
-        self._EndDeviceEvents = []
-        self.EndDeviceEvents = [] if EndDeviceEvents is None else EndDeviceEvents
+        if EndDeviceEvents is not None:
+            self.EndDeviceEvents = EndDeviceEvents
 
         self._EndDevice = None
         self.EndDevice = EndDevice
@@ -60,6 +61,7 @@ class EndDeviceFunction(AssetFunction):
     _enums = {}
     _refs = ["Registers", "ComEquipment", "EndDeviceEvents", "EndDevice"]
     _many_refs = ["Registers", "EndDeviceEvents"]
+    _inverses = {"Registers": "EndDeviceFunction", "ComEquipment": "EndDeviceFunctions", "EndDeviceEvents": "EndDeviceFunction", "EndDevice": "EndDeviceFunctions"}
 
     def getRegisters(self):
         """All registers for quantities metered by this end device function.
@@ -67,7 +69,8 @@ class EndDeviceFunction(AssetFunction):
         return self._Registers
 
     def setRegisters(self, value):
-        for x in self._Registers:
+        value = RefList(value)
+        for x in list(self._Registers):
             x.EndDeviceFunction = None
         for y in value:
             y._EndDeviceFunction = self
@@ -90,13 +93,12 @@ class EndDeviceFunction(AssetFunction):
 
     def setComEquipment(self, value):
         if self._ComEquipment is not None:
-            filtered = [x for x in self.ComEquipment.EndDeviceFunctions if x != self]
-            self._ComEquipment._EndDeviceFunctions = filtered
+            self._ComEquipment._EndDeviceFunctions.discard(self)
 
         self._ComEquipment = value
         if self._ComEquipment is not None:
             if self not in self._ComEquipment._EndDeviceFunctions:
-                self._ComEquipment._EndDeviceFunctions.append(self)
+                self._ComEquipment._reflist("_EndDeviceFunctions").append(self)
 
     ComEquipment = property(getComEquipment, setComEquipment)
 
@@ -106,7 +108,8 @@ class EndDeviceFunction(AssetFunction):
         return self._EndDeviceEvents
 
     def setEndDeviceEvents(self, value):
-        for x in self._EndDeviceEvents:
+        value = RefList(value)
+        for x in list(self._EndDeviceEvents):
             x.EndDeviceFunction = None
         for y in value:
             y._EndDeviceFunction = self
@@ -129,13 +132,12 @@ class EndDeviceFunction(AssetFunction):
 
     def setEndDevice(self, value):
         if self._EndDevice is not None:
-            filtered = [x for x in self.EndDevice.EndDeviceFunctions if x != self]
-            self._EndDevice._EndDeviceFunctions = filtered
+            self._EndDevice._EndDeviceFunctions.discard(self)
 
         self._EndDevice = value
         if self._EndDevice is not None:
             if self not in self._EndDevice._EndDeviceFunctions:
-                self._EndDevice._EndDeviceFunctions.append(self)
+                self._EndDevice._reflist("_EndDeviceFunctions").append(self)
 
     EndDevice = property(getEndDevice, setEndDevice)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class EndDeviceGroup(IdentifiedObject):
     """Abstraction for management of group communications within a two-way AMR system or the data for a group of related meters. Commands can be issued to all of the meters that belong to a meter group using a defined group address and the underlying AMR communication infrastructure.Abstraction for management of group communications within a two-way AMR system or the data for a group of related meters. Commands can be issued to all of the meters that belong to a meter group using a defined group address and the underlying AMR communication infrastructure.
@@ -35,11 +36,11 @@ class EndDeviceGroup(IdentifiedObject):
         #: Address of this end device group.
         self.groupAddress = groupAddress
 
-        self._EndDeviceControls = []
-        self.EndDeviceControls = [] if EndDeviceControls is None else EndDeviceControls
+        if EndDeviceControls is not None:
+            self.EndDeviceControls = EndDeviceControls
 
-        self._EndDevices = []
-        self.EndDevices = [] if EndDevices is None else EndDevices
+        if EndDevices is not None:
+            self.EndDevices = EndDevices
 
         self._DemandResponseProgram = None
         self.DemandResponseProgram = DemandResponseProgram
@@ -52,6 +53,7 @@ class EndDeviceGroup(IdentifiedObject):
     _enums = {}
     _refs = ["EndDeviceControls", "EndDevices", "DemandResponseProgram"]
     _many_refs = ["EndDeviceControls", "EndDevices"]
+    _inverses = {"EndDeviceControls": "EndDeviceGroup", "EndDevices": "EndDeviceGroups", "DemandResponseProgram": "EndDeviceGroups"}
 
     def getEndDeviceControls(self):
         """All end device controls sending commands to this end device group.
@@ -59,7 +61,8 @@ class EndDeviceGroup(IdentifiedObject):
         return self._EndDeviceControls
 
     def setEndDeviceControls(self, value):
-        for x in self._EndDeviceControls:
+        value = RefList(value)
+        for x in list(self._EndDeviceControls):
             x.EndDeviceGroup = None
         for y in value:
             y._EndDeviceGroup = self
@@ -82,20 +85,19 @@ class EndDeviceGroup(IdentifiedObject):
 
     def setEndDevices(self, value):
         for p in self._EndDevices:
-            filtered = [q for q in p.EndDeviceGroups if q != self]
-            self._EndDevices._EndDeviceGroups = filtered
+            p._EndDeviceGroups.discard(self)
         for r in value:
             if self not in r._EndDeviceGroups:
-                r._EndDeviceGroups.append(self)
-        self._EndDevices = value
+                r._reflist("_EndDeviceGroups").append(self)
+        self._EndDevices = RefList(value)
 
     EndDevices = property(getEndDevices, setEndDevices)
 
     def addEndDevices(self, *EndDevices):
         for obj in EndDevices:
             if self not in obj._EndDeviceGroups:
-                obj._EndDeviceGroups.append(self)
-            self._EndDevices.append(obj)
+                obj._reflist("_EndDeviceGroups").append(self)
+            self._reflist("_EndDevices").append(obj)
 
     def removeEndDevices(self, *EndDevices):
         for obj in EndDevices:
@@ -110,13 +112,12 @@ class EndDeviceGroup(IdentifiedObject):
 
     def setDemandResponseProgram(self, value):
         if self._DemandResponseProgram is not None:
-            filtered = [x for x in self.DemandResponseProgram.EndDeviceGroups if x != self]
-            self._DemandResponseProgram._EndDeviceGroups = filtered
+            self._DemandResponseProgram._EndDeviceGroups.discard(self)
 
         self._DemandResponseProgram = value
         if self._DemandResponseProgram is not None:
             if self not in self._DemandResponseProgram._EndDeviceGroups:
-                self._DemandResponseProgram._EndDeviceGroups.append(self)
+                self._DemandResponseProgram._reflist("_EndDeviceGroups").append(self)
 
     DemandResponseProgram = property(getDemandResponseProgram, setDemandResponseProgram)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.MeasurementValue import MeasurementValue
+from CIM15.Element import RefList
 
 class IntervalReading(MeasurementValue):
     """Data captured at regular intervals of time. Interval data could be captured as incremental data, absolute data, or relative data. The source for the data is usually a tariff quantity or an engineering quantity. Data is typically captured in time-tagged, uniform, fixed-length intervals of 5 min, 10 min, 15 min, 30 min, or 60 min. Note: Interval Data is sometimes also called 'Interval Data Readings' (IDR).Data captured at regular intervals of time. Interval data could be captured as incremental data, absolute data, or relative data. The source for the data is usually a tariff quantity or an engineering quantity. Data is typically captured in time-tagged, uniform, fixed-length intervals of 5 min, 10 min, 15 min, 30 min, or 60 min. Note: Interval Data is sometimes also called 'Interval Data Readings' (IDR).
@@ -34,11 +35,11 @@ class IntervalReading(MeasurementValue):
         #: Value of this interval reading.
         self.value = value
 
-        self._IntervalBlocks = []
-        self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
+        if IntervalBlocks is not None:
+            self.IntervalBlocks = IntervalBlocks
 
-        self._ReadingQualities = []
-        self.ReadingQualities = [] if ReadingQualities is None else ReadingQualities
+        if ReadingQualities is not None:
+            self.ReadingQualities = ReadingQualities
 
         super(IntervalReading, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class IntervalReading(MeasurementValue):
     _enums = {}
     _refs = ["IntervalBlocks", "ReadingQualities"]
     _many_refs = ["IntervalBlocks", "ReadingQualities"]
+    _inverses = {"IntervalBlocks": "IntervalReadings", "ReadingQualities": "IntervalReading"}
 
     def getIntervalBlocks(self):
         """All blocks containing this interval reading.
@@ -56,20 +58,19 @@ class IntervalReading(MeasurementValue):
 
     def setIntervalBlocks(self, value):
         for p in self._IntervalBlocks:
-            filtered = [q for q in p.IntervalReadings if q != self]
-            self._IntervalBlocks._IntervalReadings = filtered
+            p._IntervalReadings.discard(self)
         for r in value:
             if self not in r._IntervalReadings:
-                r._IntervalReadings.append(self)
-        self._IntervalBlocks = value
+                r._reflist("_IntervalReadings").append(self)
+        self._IntervalBlocks = RefList(value)
 
     IntervalBlocks = property(getIntervalBlocks, setIntervalBlocks)
 
     def addIntervalBlocks(self, *IntervalBlocks):
         for obj in IntervalBlocks:
             if self not in obj._IntervalReadings:
-                obj._IntervalReadings.append(self)
-            self._IntervalBlocks.append(obj)
+                obj._reflist("_IntervalReadings").append(self)
+            self._reflist("_IntervalBlocks").append(obj)
 
     def removeIntervalBlocks(self, *IntervalBlocks):
         for obj in IntervalBlocks:
@@ -83,7 +84,8 @@ class IntervalReading(MeasurementValue):
         return self._ReadingQualities
 
     def setReadingQualities(self, value):
-        for x in self._ReadingQualities:
+        value = RefList(value)
+        for x in list(self._ReadingQualities):
             x.IntervalReading = None
         for y in value:
             y._IntervalReading = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Metering.EndDevice import EndDevice
+from CIM15.Element import RefList
 
 class Meter(EndDevice):
     """Physical asset that performs the metering role of the ServiceDeliveryPoint. Used for measuring consumption and detection of events.Physical asset that performs the metering role of the ServiceDeliveryPoint. Used for measuring consumption and detection of events.
@@ -44,17 +45,17 @@ class Meter(EndDevice):
         #: Meter form designation per ANSI C12.10 or other applicable standard. An alphanumeric designation denoting the circuit arrangement for which the meter is applicable and its specific terminal arrangement.
         self.formNumber = formNumber
 
-        self._MeterReplacementWorks = []
-        self.MeterReplacementWorks = [] if MeterReplacementWorks is None else MeterReplacementWorks
+        if MeterReplacementWorks is not None:
+            self.MeterReplacementWorks = MeterReplacementWorks
 
-        self._MeterReadings = []
-        self.MeterReadings = [] if MeterReadings is None else MeterReadings
+        if MeterReadings is not None:
+            self.MeterReadings = MeterReadings
 
-        self._MeterServiceWorks = []
-        self.MeterServiceWorks = [] if MeterServiceWorks is None else MeterServiceWorks
+        if MeterServiceWorks is not None:
+            self.MeterServiceWorks = MeterServiceWorks
 
-        self._VendingTransactions = []
-        self.VendingTransactions = [] if VendingTransactions is None else VendingTransactions
+        if VendingTransactions is not None:
+            self.VendingTransactions = VendingTransactions
 
         super(Meter, self).__init__(*args, **kw_args)
 
@@ -64,6 +65,7 @@ class Meter(EndDevice):
     _enums = {}
     _refs = ["MeterReplacementWorks", "MeterReadings", "MeterServiceWorks", "VendingTransactions"]
     _many_refs = ["MeterReplacementWorks", "MeterReadings", "MeterServiceWorks", "VendingTransactions"]
+    _inverses = {"MeterReplacementWorks": "OldMeter", "MeterReadings": "Meter", "MeterServiceWorks": "Meter", "VendingTransactions": "Meter"}
 
     def getMeterReplacementWorks(self):
         """All works on replacement of this old meter.
@@ -71,7 +73,8 @@ class Meter(EndDevice):
         return self._MeterReplacementWorks
 
     def setMeterReplacementWorks(self, value):
-        for x in self._MeterReplacementWorks:
+        value = RefList(value)
+        for x in list(self._MeterReplacementWorks):
             x.OldMeter = None
         for y in value:
             y._OldMeter = self
@@ -93,7 +96,8 @@ class Meter(EndDevice):
         return self._MeterReadings
 
     def setMeterReadings(self, value):
-        for x in self._MeterReadings:
+        value = RefList(value)
+        for x in list(self._MeterReadings):
             x.Meter = None
         for y in value:
             y._Meter = self
@@ -115,7 +119,8 @@ class Meter(EndDevice):
         return self._MeterServiceWorks
 
     def setMeterServiceWorks(self, value):
-        for x in self._MeterServiceWorks:
+        value = RefList(value)
+        for x in list(self._MeterServiceWorks):
             x.Meter = None
         for y in value:
             y._Meter = self
@@ -137,7 +142,8 @@ class Meter(EndDevice):
         return self._VendingTransactions
 
     def setVendingTransactions(self, value):
-        for x in self._VendingTransactions:
+        value = RefList(value)
+        for x in list(self._VendingTransactions):
             x.Meter = None
         for y in value:
             y._Meter = self
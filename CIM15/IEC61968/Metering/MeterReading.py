@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class MeterReading(IdentifiedObject):
     """Set of values obtained from the meter.Set of values obtained from the meter.
@@ -40,11 +41,11 @@ class MeterReading(IdentifiedObject):
 
         self.valuesInterval = valuesInterval
 
-        self._EndDeviceEvents = []
-        self.EndDeviceEvents = [] if EndDeviceEvents is None else EndDeviceEvents
+        if EndDeviceEvents is not None:
+            self.EndDeviceEvents = EndDeviceEvents
 
-        self._Readings = []
-        self.Readings = [] if Readings is None else Readings
+        if Readings is not None:
+            self.Readings = Readings
 
         self._CustomerAgreement = None
         self.CustomerAgreement = CustomerAgreement
@@ -52,8 +53,8 @@ class MeterReading(IdentifiedObject):
         self._Meter = None
         self.Meter = Meter
 
-        self._IntervalBlocks = []
-        self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
+        if IntervalBlocks is not None:
+            self.IntervalBlocks = IntervalBlocks
 
         super(MeterReading, self).__init__(*args, **kw_args)
 
@@ -63,6 +64,7 @@ class MeterReading(IdentifiedObject):
     _enums = {}
     _refs = ["ServiceDeliveryPoint", "valuesInterval", "EndDeviceEvents", "Readings", "CustomerAgreement", "Meter", "IntervalBlocks"]
     _many_refs = ["EndDeviceEvents", "Readings", "IntervalBlocks"]
+    _inverses = {"ServiceDeliveryPoint": "MeterReadings", "EndDeviceEvents": "MeterReading", "Readings": "MeterReadings", "CustomerAgreement": "MeterReadings", "Meter": "MeterReadings", "IntervalBlocks": "MeterReading"}
 
     def getServiceDeliveryPoint(self):
         """Service delivery point from which this meter reading (set of values) has been obtained.
@@ -71,13 +73,12 @@ class MeterReading(IdentifiedObject):
 
     def setServiceDeliveryPoint(self, value):
         if self._ServiceDeliveryPoint is not None:
-            filtered = [x for x in self.ServiceDeliveryPoint.MeterReadings if x != self]
-            self._ServiceDeliveryPoint._MeterReadings = filtered
+            self._ServiceDeliveryPoint._MeterReadings.discard(self)
 
         self._ServiceDeliveryPoint = value
         if self._ServiceDeliveryPoint is not None:
             if self not in self._ServiceDeliveryPoint._MeterReadings:
-                self._ServiceDeliveryPoint._MeterReadings.append(self)
+                self._ServiceDeliveryPoint._reflist("_MeterReadings").append(self)
 
     ServiceDeliveryPoint = property(getServiceDeliveryPoint, setServiceDeliveryPoint)
 
@@ -90,7 +91,8 @@ class MeterReading(IdentifiedObject):
         return self._EndDeviceEvents
 
     def setEndDeviceEvents(self, value):
-        for x in self._EndDeviceEvents:
+        value = RefList(value)
+        for x in list(self._EndDeviceEvents):
             x.MeterReading = None
         for y in value:
             y._MeterReading = self
@@ -113,20 +115,19 @@ class MeterReading(IdentifiedObject):
 
     def setReadings(self, value):
         for p in self._Readings:
-            filtered = [q for q in p.MeterReadings if q != self]
-            self._Readings._MeterReadings = filtered
+            p._MeterReadings.discard(self)
         for r in value:
             if self not in r._MeterReadings:
-                r._MeterReadings.append(self)
-        self._Readings = value
+                r._reflist("_MeterReadings").append(self)
+        self._Readings = RefList(value)
 
     Readings = property(getReadings, setReadings)
 
     def addReadings(self, *Readings):
         for obj in Readings:
             if self not in obj._MeterReadings:
-                obj._MeterReadings.append(self)
-            self._Readings.append(obj)
+                obj._reflist("_MeterReadings").append(self)
+            self._reflist("_Readings").append(obj)
 
     def removeReadings(self, *Readings):
         for obj in Readings:
@@ -141,13 +142,12 @@ class MeterReading(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.MeterReadings if x != self]
-            self._CustomerAgreement._MeterReadings = filtered
+            self._CustomerAgreement._MeterReadings.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
             if self not in self._CustomerAgreement._MeterReadings:
-                self._CustomerAgreement._MeterReadings.append(self)
+                self._CustomerAgreement._reflist("_MeterReadings").append(self)
 
     CustomerAgreement = property(getCustomerAgreement, setCustomerAgreement)
 
@@ -158,13 +158,12 @@ class MeterReading(IdentifiedObject):
 
     def setMeter(self, value):
         if self._Meter is not None:
-            filtered = [x for x in self.Meter.MeterReadings if x != self]
-            self._Meter._MeterReadings = filtered
+            self._Meter._MeterReadings.discard(self)
 
         self._Meter = value
         if self._Meter is not None:
             if self not in self._Meter._MeterReadings:
-                self._Meter._MeterReadings.append(self)
+                self._Meter._reflist("_MeterReadings").append(self)
 
     Meter = property(getMeter, setMeter)
 
@@ -174,7 +173,8 @@ class MeterReading(IdentifiedObject):
         return self._IntervalBlocks
 
     def setIntervalBlocks(self, value):
-        for x in self._IntervalBlocks:
+        value = RefList(value)
+        for x in list(self._IntervalBlocks):
             x.MeterReading = None
         for y in value:
             y._MeterReading = self
@@ -44,6 +44,7 @@ class MeterServiceWork(Work):
     _enums = {}
     _refs = ["OldMeter", "Meter"]
     _many_refs = []
+    _inverses = {"OldMeter": "MeterReplacementWorks", "Meter": "MeterServiceWorks"}
 
     def getOldMeter(self):
         """Old meter replaced by this work.
@@ -52,13 +53,12 @@ class MeterServiceWork(Work):
 
     def setOldMeter(self, value):
         if self._OldMeter is not None:
-            filtered = [x for x in self.OldMeter.MeterReplacementWorks if x != self]
-            self._OldMeter._MeterReplacementWorks = filtered
+            self._OldMeter._MeterReplacementWorks.discard(self)
 
         self._OldMeter = value
         if self._OldMeter is not None:
             if self not in self._OldMeter._MeterReplacementWorks:
-                self._OldMeter._MeterReplacementWorks.append(self)
+                self._OldMeter._reflist("_MeterReplacementWorks").append(self)
 
     OldMeter = property(getOldMeter, setOldMeter)
 
@@ -69,13 +69,12 @@ class MeterServiceWork(Work):
 
     def setMeter(self, value):
         if self._Meter is not None:
-            filtered = [x for x in self.Meter.MeterServiceWorks if x != self]
-            self._Meter._MeterServiceWorks = filtered
+            self._Meter._MeterServiceWorks.discard(self)
 
         self._Meter = value
         if self._Meter is not None:
             if self not in self._Meter._MeterServiceWorks:
-                self._Meter._MeterServiceWorks.append(self)
+                self._Meter._reflist("_MeterServiceWorks").append(self)
 
     Meter = property(getMeter, setMeter)
 
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, RefList
 
 class PendingCalculation(Element):
     """When present, a scalar conversion that needs to be applied to every IntervalReading.value contained in IntervalBlock. This conversion results in a new associated ReadingType, reflecting the true dimensions of IntervalReading values after the conversion.When present, a scalar conversion that needs to be applied to every IntervalReading.value contained in IntervalBlock. This conversion results in a new associated ReadingType, reflecting the true dimensions of IntervalReading values after the conversion.
@@ -50,8 +50,8 @@ class PendingCalculation(Element):
         #: (if applicable) Offset to be added as well as multiplication using scalars.
         self.offset = offset
 
-        self._IntervalBlocks = []
-        self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
+        if IntervalBlocks is not None:
+            self.IntervalBlocks = IntervalBlocks
 
         self._ReadingType = None
         self.ReadingType = ReadingType
@@ -64,6 +64,7 @@ class PendingCalculation(Element):
     _enums = {}
     _refs = ["IntervalBlocks", "ReadingType"]
     _many_refs = ["IntervalBlocks"]
+    _inverses = {"IntervalBlocks": "PendingCalculation", "ReadingType": "PendingCalculation"}
 
     def getIntervalBlocks(self):
         """All blocks of interval reading values to which this pending conversion applies.
@@ -71,7 +72,8 @@ class PendingCalculation(Element):
         return self._IntervalBlocks
 
     def setIntervalBlocks(self, value):
-        for x in self._IntervalBlocks:
+        value = RefList(value)
+        for x in list(self._IntervalBlocks):
             x.PendingCalculation = None
         for y in value:
             y._PendingCalculation = self
@@ -42,4 +42,5 @@ class ReadingMultiplier(object):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
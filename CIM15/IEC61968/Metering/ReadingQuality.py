@@ -48,6 +48,7 @@ class ReadingQuality(Element):
     _enums = {}
     _refs = ["Reading", "IntervalReading"]
     _many_refs = []
+    _inverses = {"Reading": "ReadingQualities", "IntervalReading": "ReadingQualities"}
 
     def getReading(self):
         """Reading value to which this quality applies.
@@ -56,13 +57,12 @@ class ReadingQuality(Element):
 
     def setReading(self, value):
         if self._Reading is not None:
-            filtered = [x for x in self.Reading.ReadingQualities if x != self]
-            self._Reading._ReadingQualities = filtered
+            self._Reading._ReadingQualities.discard(self)
 
         self._Reading = value
         if self._Reading is not None:
             if self not in self._Reading._ReadingQualities:
-                self._Reading._ReadingQualities.append(self)
+                self._Reading._reflist("_ReadingQualities").append(self)
 
     Reading = property(getReading, setReading)
 
@@ -73,13 +73,12 @@ class ReadingQuality(Element):
 
     def setIntervalReading(self, value):
         if self._IntervalReading is not None:
-            filtered = [x for x in self.IntervalReading.ReadingQualities if x != self]
-            self._IntervalReading._ReadingQualities = filtered
+            self._IntervalReading._ReadingQualities.discard(self)
 
         self._IntervalReading = value
         if self._IntervalReading is not None:
             if self not in self._IntervalReading._ReadingQualities:
-                self._IntervalReading._ReadingQualities.append(self)
+                self._IntervalReading._reflist("_ReadingQualities").append(self)
 
     IntervalReading = property(getIntervalReading, setIntervalReading)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ReadingType(IdentifiedObject):
     """Type of data conveyed by a specific Reading.Type of data conveyed by a specific Reading.
@@ -65,13 +66,13 @@ class ReadingType(IdentifiedObject):
         #: Numeric type to be expected for the associated IntervalBlock.value (e.g. unsignedInteger).
         self.defaultValueDataType = defaultValueDataType
 
-        self._IntervalBlocks = []
-        self.IntervalBlocks = [] if IntervalBlocks is None else IntervalBlocks
+        if IntervalBlocks is not None:
+            self.IntervalBlocks = IntervalBlocks
 
         self.dynamicConfiguration = dynamicConfiguration
 
-        self._Readings = []
-        self.Readings = [] if Readings is None else Readings
+        if Readings is not None:
+            self.Readings = Readings
 
         self._Register = None
         self.Register = Register
@@ -87,6 +88,7 @@ class ReadingType(IdentifiedObject):
     _enums = {"multiplier": "UnitMultiplier", "unit": "UnitSymbol", "kind": "ReadingKind"}
     _refs = ["IntervalBlocks", "dynamicConfiguration", "Readings", "Register", "PendingCalculation"]
     _many_refs = ["IntervalBlocks", "Readings"]
+    _inverses = {"IntervalBlocks": "ReadingType", "Readings": "ReadingType", "Register": "ReadingType", "PendingCalculation": "ReadingType"}
 
     def getIntervalBlocks(self):
         """All blocks containing interval reading values with this type information.
@@ -94,7 +96,8 @@ class ReadingType(IdentifiedObject):
         return self._IntervalBlocks
 
     def setIntervalBlocks(self, value):
-        for x in self._IntervalBlocks:
+        value = RefList(value)
+        for x in list(self._IntervalBlocks):
             x.ReadingType = None
         for y in value:
             y._ReadingType = self
@@ -119,7 +122,8 @@ class ReadingType(IdentifiedObject):
         return self._Readings
 
     def setReadings(self, value):
-        for x in self._Readings:
+        value = RefList(value)
+        for x in list(self._Readings):
             x.ReadingType = None
         for y in value:
             y._ReadingType = self
@@ -52,6 +52,7 @@ class Register(IdentifiedObject):
     _enums = {}
     _refs = ["ReadingType", "EndDeviceFunction"]
     _many_refs = []
+    _inverses = {"ReadingType": "Register", "EndDeviceFunction": "Registers"}
 
     def getReadingType(self):
         """Reading type for values displayed by this register.
@@ -76,13 +77,12 @@ class Register(IdentifiedObject):
 
     def setEndDeviceFunction(self, value):
         if self._EndDeviceFunction is not None:
-            filtered = [x for x in self.EndDeviceFunction.Registers if x != self]
-            self._EndDeviceFunction._Registers = filtered
+            self._EndDeviceFunction._Registers.discard(self)
 
         self._EndDeviceFunction = value
         if self._EndDeviceFunction is not None:
             if self not in self._EndDeviceFunction._Registers:
-                self._EndDeviceFunction._Registers.append(self)
+                self._EndDeviceFunction._reflist("_Registers").append(self)
 
     EndDeviceFunction = property(getEndDeviceFunction, setEndDeviceFunction)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ServiceDeliveryPoint(IdentifiedObject):
     """Logical point on the network where the ownership of the service changes hands. It is one of potentially many service points within a service location, delivering service in accordance with a customer agreement. Used at the place where a meter may be installed.Logical point on the network where the ownership of the service changes hands. It is one of potentially many service points within a service location, delivering service in accordance with a customer agreement. Used at the place where a meter may be installed.
@@ -78,23 +79,23 @@ class ServiceDeliveryPoint(IdentifiedObject):
         #: Nominal service voltage.
         self.ratedVoltage = ratedVoltage
 
-        self._SDPLocations = []
-        self.SDPLocations = [] if SDPLocations is None else SDPLocations
+        if SDPLocations is not None:
+            self.SDPLocations = SDPLocations
 
         self._ServiceLocation = None
         self.ServiceLocation = ServiceLocation
 
-        self._EndDevices = []
-        self.EndDevices = [] if EndDevices is None else EndDevices
+        if EndDevices is not None:
+            self.EndDevices = EndDevices
 
-        self._MeterReadings = []
-        self.MeterReadings = [] if MeterReadings is None else MeterReadings
+        if MeterReadings is not None:
+            self.MeterReadings = MeterReadings
 
         self._ServiceCategory = None
         self.ServiceCategory = ServiceCategory
 
-        self._PricingStructures = []
-        self.PricingStructures = [] if PricingStructures is None else PricingStructures
+        if PricingStructures is not None:
+            self.PricingStructures = PricingStructures
 
         self._EnergyConsumer = None
         self.EnergyConsumer = EnergyConsumer
@@ -116,6 +117,7 @@ class ServiceDeliveryPoint(IdentifiedObject):
     _enums = {"phaseCode": "PhaseCode"}
     _refs = ["SDPLocations", "ServiceLocation", "EndDevices", "MeterReadings", "ServiceCategory", "PricingStructures", "EnergyConsumer", "ServiceSupplier", "CustomerAgreement", "TransformerTanks"]
     _many_refs = ["SDPLocations", "EndDevices", "MeterReadings", "PricingStructures"]
+    _inverses = {"SDPLocations": "ServiceDeliveryPoints", "ServiceLocation": "ServiceDeliveryPoints", "EndDevices": "ServiceDeliveryPoint", "MeterReadings": "ServiceDeliveryPoint", "ServiceCategory": "ServiceDeliveryPoints", "PricingStructures": "ServiceDeliveryPoints", "EnergyConsumer": "ServiceDeliveryPoints", "ServiceSupplier": "ServiceDeliveryPoints", "CustomerAgreement": "ServiceDeliveryPoints", "TransformerTanks": "ServiceDeliveryPoints"}
 
     def getSDPLocations(self):
         """All locations of this service delivery point.
@@ -124,20 +126,19 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setSDPLocations(self, value):
         for p in self._SDPLocations:
-            filtered = [q for q in p.ServiceDeliveryPoints if q != self]
-            self._SDPLocations._ServiceDeliveryPoints = filtered
+            p._ServiceDeliveryPoints.discard(self)
         for r in value:
             if self not in r._ServiceDeliveryPoints:
-                r._ServiceDeliveryPoints.append(self)
-        self._SDPLocations = value
+                r._reflist("_ServiceDeliveryPoints").append(self)
+        self._SDPLocations = RefList(value)
 
     SDPLocations = property(getSDPLocations, setSDPLocations)
 
     def addSDPLocations(self, *SDPLocations):
         for obj in SDPLocations:
             if self not in obj._ServiceDeliveryPoints:
-                obj._ServiceDeliveryPoints.append(self)
-            self._SDPLocations.append(obj)
+                obj._reflist("_ServiceDeliveryPoints").append(self)
+            self._reflist("_SDPLocations").append(obj)
 
     def removeSDPLocations(self, *SDPLocations):
         for obj in SDPLocations:
@@ -152,13 +153,12 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setServiceLocation(self, value):
         if self._ServiceLocation is not None:
-            filtered = [x for x in self.ServiceLocation.ServiceDeliveryPoints if x != self]
-            self._ServiceLocation._ServiceDeliveryPoints = filtered
+            self._ServiceLocation._ServiceDeliveryPoints.discard(self)
 
         self._ServiceLocation = value
         if self._ServiceLocation is not None:
             if self not in self._ServiceLocation._ServiceDeliveryPoints:
-                self._ServiceLocation._ServiceDeliveryPoints.append(self)
+                self._ServiceLocation._reflist("_ServiceDeliveryPoints").append(self)
 
     ServiceLocation = property(getServiceLocation, setServiceLocation)
 
@@ -168,7 +168,8 @@ class ServiceDeliveryPoint(IdentifiedObject):
         return self._EndDevices
 
     def setEndDevices(self, value):
-        for x in self._EndDevices:
+        value = RefList(value)
+        for x in list(self._EndDevices):
             x.ServiceDeliveryPoint = None
         for y in value:
             y._ServiceDeliveryPoint = self
@@ -190,7 +191,8 @@ class ServiceDeliveryPoint(IdentifiedObject):
         return self._MeterReadings
 
     def setMeterReadings(self, value):
-        for x in self._MeterReadings:
+        value = RefList(value)
+        for x in list(self._MeterReadings):
             x.ServiceDeliveryPoint = None
         for y in value:
             y._ServiceDeliveryPoint = self
@@ -213,13 +215,12 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setServiceCategory(self, value):
         if self._ServiceCategory is not None:
-            filtered = [x for x in self.ServiceCategory.ServiceDeliveryPoints if x != self]
-            self._ServiceCategory._ServiceDeliveryPoints = filtered
+            self._ServiceCategory._ServiceDeliveryPoints.discard(self)
 
         self._ServiceCategory = value
         if self._ServiceCategory is not None:
             if self not in self._ServiceCategory._ServiceDeliveryPoints:
-                self._ServiceCategory._ServiceDeliveryPoints.append(self)
+                self._ServiceCategory._reflist("_ServiceDeliveryPoints").append(self)
 
     ServiceCategory = property(getServiceCategory, setServiceCategory)
 
@@ -230,20 +231,19 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setPricingStructures(self, value):
         for p in self._PricingStructures:
-            filtered = [q for q in p.ServiceDeliveryPoints if q != self]
-            self._PricingStructures._ServiceDeliveryPoints = filtered
+            p._ServiceDeliveryPoints.discard(self)
         for r in value:
             if self not in r._ServiceDeliveryPoints:
-                r._ServiceDeliveryPoints.append(self)
-        self._PricingStructures = value
+                r._reflist("_ServiceDeliveryPoints").append(self)
+        self._PricingStructures = RefList(value)
 
     PricingStructures = property(getPricingStructures, setPricingStructures)
 
     def addPricingStructures(self, *PricingStructures):
         for obj in PricingStructures:
             if self not in obj._ServiceDeliveryPoints:
-                obj._ServiceDeliveryPoints.append(self)
-            self._PricingStructures.append(obj)
+                obj._reflist("_ServiceDeliveryPoints").append(self)
+            self._reflist("_PricingStructures").append(obj)
 
     def removePricingStructures(self, *PricingStructures):
         for obj in PricingStructures:
@@ -257,13 +257,12 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setEnergyConsumer(self, value):
         if self._EnergyConsumer is not None:
-            filtered = [x for x in self.EnergyConsumer.ServiceDeliveryPoints if x != self]
-            self._EnergyConsumer._ServiceDeliveryPoints = filtered
+            self._EnergyConsumer._ServiceDeliveryPoints.discard(self)
 
         self._EnergyConsumer = value
         if self._EnergyConsumer is not None:
             if self not in self._EnergyConsumer._ServiceDeliveryPoints:
-                self._EnergyConsumer._ServiceDeliveryPoints.append(self)
+                self._EnergyConsumer._reflist("_ServiceDeliveryPoints").append(self)
 
     EnergyConsumer = property(getEnergyConsumer, setEnergyConsumer)
 
@@ -274,13 +273,12 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setServiceSupplier(self, value):
         if self._ServiceSupplier is not None:
-            filtered = [x for x in self.ServiceSupplier.ServiceDeliveryPoints if x != self]
-            self._ServiceSupplier._ServiceDeliveryPoints = filtered
+            self._ServiceSupplier._ServiceDeliveryPoints.discard(self)
 
         self._ServiceSupplier = value
         if self._ServiceSupplier is not None:
             if self not in self._ServiceSupplier._ServiceDeliveryPoints:
-                self._ServiceSupplier._ServiceDeliveryPoints.append(self)
+                self._ServiceSupplier._reflist("_ServiceDeliveryPoints").append(self)
 
     ServiceSupplier = property(getServiceSupplier, setServiceSupplier)
 
@@ -291,13 +289,12 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.ServiceDeliveryPoints if x != self]
-            self._CustomerAgreement._ServiceDeliveryPoints = filtered
+            self._CustomerAgreement._ServiceDeliveryPoints.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
             if self not in self._CustomerAgreement._ServiceDeliveryPoints:
-                self._CustomerAgreement._ServiceDeliveryPoints.append(self)
+                self._CustomerAgreement._reflist("_ServiceDeliveryPoints").append(self)
 
     CustomerAgreement = property(getCustomerAgreement, setCustomerAgreement)
 
@@ -308,13 +305,12 @@ class ServiceDeliveryPoint(IdentifiedObject):
 
     def setTransformerTanks(self, value):
         if self._TransformerTanks is not None:
-            filtered = [x for x in self.TransformerTanks.ServiceDeliveryPoints if x != self]
-            self._TransformerTanks._ServiceDeliveryPoints = filtered
+            self._TransformerTanks._ServiceDeliveryPoints.discard(self)
 
         self._TransformerTanks = value
         if self._TransformerTanks is not None:
             if self not in self._TransformerTanks._ServiceDeliveryPoints:
-                self._TransformerTanks._ServiceDeliveryPoints.append(self)
+                self._TransformerTanks._reflist("_ServiceDeliveryPoints").append(self)
 
     TransformerTanks = property(getTransformerTanks, setTransformerTanks)
 
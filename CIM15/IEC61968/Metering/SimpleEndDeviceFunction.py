@@ -40,4 +40,5 @@ class SimpleEndDeviceFunction(EndDeviceFunction):
     _enums = {"kind": "EndDeviceFunctionKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
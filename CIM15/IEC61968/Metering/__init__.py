@@ -21,29 +21,8 @@
 """This package contains only diagrams, drawn by hand from Metering-related XSDs that are in Part 9 document. Entry points into the schema are filled with green. Non-used associations are light grey.
 """
 
-from CIM15.IEC61968.Metering.SDPLocation import SDPLocation
-from CIM15.IEC61968.Metering.Reading import Reading
-from CIM15.IEC61968.Metering.ServiceDeliveryPoint import ServiceDeliveryPoint
-from CIM15.IEC61968.Metering.ElectricMeteringFunction import ElectricMeteringFunction
-from CIM15.IEC61968.Metering.DemandResponseProgram import DemandResponseProgram
-from CIM15.IEC61968.Metering.ReadingMultiplier import ReadingMultiplier
-from CIM15.IEC61968.Metering.MeterReading import MeterReading
-from CIM15.IEC61968.Metering.ReadingQuality import ReadingQuality
-from CIM15.IEC61968.Metering.EndDeviceEvent import EndDeviceEvent
-from CIM15.IEC61968.Metering.IntervalReading import IntervalReading
-from CIM15.IEC61968.Metering.Meter import Meter
-from CIM15.IEC61968.Metering.MeterServiceWork import MeterServiceWork
-from CIM15.IEC61968.Metering.PendingCalculation import PendingCalculation
-from CIM15.IEC61968.Metering.IntervalBlock import IntervalBlock
-from CIM15.IEC61968.Metering.EndDeviceFunction import EndDeviceFunction
-from CIM15.IEC61968.Metering.ComFunction import ComFunction
-from CIM15.IEC61968.Metering.EndDevice import EndDevice
-from CIM15.IEC61968.Metering.SimpleEndDeviceFunction import SimpleEndDeviceFunction
-from CIM15.IEC61968.Metering.EndDeviceGroup import EndDeviceGroup
-from CIM15.IEC61968.Metering.Register import Register
-from CIM15.IEC61968.Metering.EndDeviceControl import EndDeviceControl
-from CIM15.IEC61968.Metering.DynamicDemand import DynamicDemand
-from CIM15.IEC61968.Metering.ReadingType import ReadingType
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Metering"
 nsPrefix = "cimMetering"
@@ -63,3 +42,30 @@ class DemandKind(str):
     """Values are: fixedBlock, rollingBlock, logarithmic
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "SDPLocation",
+    "Reading",
+    "ServiceDeliveryPoint",
+    "ElectricMeteringFunction",
+    "DemandResponseProgram",
+    "ReadingMultiplier",
+    "MeterReading",
+    "ReadingQuality",
+    "EndDeviceEvent",
+    "IntervalReading",
+    "Meter",
+    "MeterServiceWork",
+    "PendingCalculation",
+    "IntervalBlock",
+    "EndDeviceFunction",
+    "ComFunction",
+    "EndDevice",
+    "SimpleEndDeviceFunction",
+    "EndDeviceGroup",
+    "Register",
+    "EndDeviceControl",
+    "DynamicDemand",
+    "ReadingType",
+])
@@ -46,4 +46,5 @@ class AccountMovement(object):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
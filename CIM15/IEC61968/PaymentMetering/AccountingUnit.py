@@ -50,4 +50,5 @@ class AccountingUnit(object):
     _enums = {"multiplier": "UnitMultiplier", "monetaryUnit": "Currency"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class AuxiliaryAccount(Document):
     """Variable and dynamic part of auxiliary agreement, generally representing the current state of the account related to the outstanding balance defined in auxiliary agreement.Variable and dynamic part of auxiliary agreement, generally representing the current state of the account related to the outstanding balance defined in auxiliary agreement.
@@ -44,11 +45,11 @@ class AuxiliaryAccount(Document):
 
         self.lastDebit = lastDebit
 
-        self._PaymentTransactions = []
-        self.PaymentTransactions = [] if PaymentTransactions is None else PaymentTransactions
+        if PaymentTransactions is not None:
+            self.PaymentTransactions = PaymentTransactions
 
-        self._Charges = []
-        self.Charges = [] if Charges is None else Charges
+        if Charges is not None:
+            self.Charges = Charges
 
         self.lastCredit = lastCredit
 
@@ -65,6 +66,7 @@ class AuxiliaryAccount(Document):
     _enums = {}
     _refs = ["lastDebit", "PaymentTransactions", "Charges", "lastCredit", "AuxiliaryAgreement", "due"]
     _many_refs = ["PaymentTransactions", "Charges"]
+    _inverses = {"PaymentTransactions": "AuxiliaryAccount", "Charges": "AuxiliaryAccounts", "AuxiliaryAgreement": "AuxiliaryAccounts"}
 
     # Details of the last debit transaction performed on this account.
     lastDebit = None
@@ -75,7 +77,8 @@ class AuxiliaryAccount(Document):
         return self._PaymentTransactions
 
     def setPaymentTransactions(self, value):
-        for x in self._PaymentTransactions:
+        value = RefList(value)
+        for x in list(self._PaymentTransactions):
             x.AuxiliaryAccount = None
         for y in value:
             y._AuxiliaryAccount = self
@@ -98,20 +101,19 @@ class AuxiliaryAccount(Document):
 
     def setCharges(self, value):
         for p in self._Charges:
-            filtered = [q for q in p.AuxiliaryAccounts if q != self]
-            self._Charges._AuxiliaryAccounts = filtered
+            p._AuxiliaryAccounts.discard(self)
         for r in value:
             if self not in r._AuxiliaryAccounts:
-                r._AuxiliaryAccounts.append(self)
-        self._Charges = value
+                r._reflist("_AuxiliaryAccounts").append(self)
+        self._Charges = RefList(value)
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
         for obj in Charges:
             if self not in obj._AuxiliaryAccounts:
-                obj._AuxiliaryAccounts.append(self)
-            self._Charges.append(obj)
+                obj._reflist("_AuxiliaryAccounts").append(self)
+            self._reflist("_Charges").append(obj)
 
     def removeCharges(self, *Charges):
         for obj in Charges:
@@ -129,13 +131,12 @@ class AuxiliaryAccount(Document):
 
     def setAuxiliaryAgreement(self, value):
         if self._AuxiliaryAgreement is not None:
-            filtered = [x for x in self.AuxiliaryAgreement.AuxiliaryAccounts if x != self]
-            self._AuxiliaryAgreement._AuxiliaryAccounts = filtered
+            self._AuxiliaryAgreement._AuxiliaryAccounts.discard(self)
 
         self._AuxiliaryAgreement = value
         if self._AuxiliaryAgreement is not None:
             if self not in self._AuxiliaryAgreement._AuxiliaryAccounts:
-                self._AuxiliaryAgreement._AuxiliaryAccounts.append(self)
+                self._AuxiliaryAgreement._reflist("_AuxiliaryAccounts").append(self)
 
     AuxiliaryAgreement = property(getAuxiliaryAgreement, setAuxiliaryAgreement)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Agreement import Agreement
+from CIM15.Element import RefList
 
 class AuxiliaryAgreement(Agreement):
     """An ad-hoc auxiliary account agreement associated with a customer agreement, not part of the customer's account, but typically subject to formal agreement between customer and supplier (utility). Typically this is used to collect revenue owing by the customer for other services or arrears accrued with the utility for other services. It is typically linked to a prepaid token purchase transaction, thus forcing the customer to make a payment towards settlement of the auxiliary account balance whenever he needs to purchase a prepaid token for electricity. The present status of auxiliary agreement can be defined in the context of the utility's business rules, for example: enabled, disabled, pending, over recovered, under recovered, written off, etc.An ad-hoc auxiliary account agreement associated with a customer agreement, not part of the customer's account, but typically subject to formal agreement between customer and supplier (utility). Typically this is used to collect revenue owing by the customer for other services or arrears accrued with the utility for other services. It is typically linked to a prepaid token purchase transaction, thus forcing the customer to make a payment towards settlement of the auxiliary account balance whenever he needs to purchase a prepaid token for electricity. The present status of auxiliary agreement can be defined in the context of the utility's business rules, for example: enabled, disabled, pending, over recovered, under recovered, written off, etc.
@@ -73,8 +74,8 @@ class AuxiliaryAgreement(Agreement):
         self._CustomerAgreement = None
         self.CustomerAgreement = CustomerAgreement
 
-        self._AuxiliaryAccounts = []
-        self.AuxiliaryAccounts = [] if AuxiliaryAccounts is None else AuxiliaryAccounts
+        if AuxiliaryAccounts is not None:
+            self.AuxiliaryAccounts = AuxiliaryAccounts
 
         super(AuxiliaryAgreement, self).__init__(*args, **kw_args)
 
@@ -84,6 +85,7 @@ class AuxiliaryAgreement(Agreement):
     _enums = {}
     _refs = ["CustomerAgreement", "AuxiliaryAccounts"]
     _many_refs = ["AuxiliaryAccounts"]
+    _inverses = {"CustomerAgreement": "AuxiliaryAgreements", "AuxiliaryAccounts": "AuxiliaryAgreement"}
 
     def getCustomerAgreement(self):
         """Customer agreement this (non-service related) auxiliary agreement refers to.
@@ -92,13 +94,12 @@ class AuxiliaryAgreement(Agreement):
 
     def setCustomerAgreement(self, value):
         if self._CustomerAgreement is not None:
-            filtered = [x for x in self.CustomerAgreement.AuxiliaryAgreements if x != self]
-            self._CustomerAgreement._AuxiliaryAgreements = filtered
+            self._CustomerAgreement._AuxiliaryAgreements.discard(self)
 
         self._CustomerAgreement = value
         if self._CustomerAgreement is not None:
             if self not in self._CustomerAgreement._AuxiliaryAgreements:
-                self._CustomerAgreement._AuxiliaryAgreements.append(self)
+                self._CustomerAgreement._reflist("_AuxiliaryAgreements").append(self)
 
     CustomerAgreement = property(getCustomerAgreement, setCustomerAgreement)
 
@@ -108,7 +109,8 @@ class AuxiliaryAgreement(Agreement):
         return self._AuxiliaryAccounts
 
     def setAuxiliaryAccounts(self, value):
-        for x in self._AuxiliaryAccounts:
+        value = RefList(value)
+        for x in list(self._AuxiliaryAccounts):
             x.AuxiliaryAgreement = None
         for y in value:
             y._AuxiliaryAgreement = self
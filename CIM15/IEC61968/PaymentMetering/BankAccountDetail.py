@@ -54,4 +54,5 @@ class BankAccountDetail(object):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -56,6 +56,7 @@ class Card(Element):
     _enums = {}
     _refs = ["Tender"]
     _many_refs = []
+    _inverses = {"Tender": "Card"}
 
     def getTender(self):
         """Payment tender this card is being used for.
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Cashier(IdentifiedObject):
     """The operator of the point of sale for the duration of CashierShift. Cashier is under the exclusive management control of Vendor.The operator of the point of sale for the duration of CashierShift. Cashier is under the exclusive management control of Vendor.
@@ -32,8 +33,8 @@ class Cashier(IdentifiedObject):
         """
         self.electronicAddress = electronicAddress
 
-        self._CashierShifts = []
-        self.CashierShifts = [] if CashierShifts is None else CashierShifts
+        if CashierShifts is not None:
+            self.CashierShifts = CashierShifts
 
         super(Cashier, self).__init__(*args, **kw_args)
 
@@ -43,6 +44,7 @@ class Cashier(IdentifiedObject):
     _enums = {}
     _refs = ["electronicAddress", "CashierShifts"]
     _many_refs = ["CashierShifts"]
+    _inverses = {"CashierShifts": "Cashier"}
 
     # Electronic address.
     electronicAddress = None
@@ -53,7 +55,8 @@ class Cashier(IdentifiedObject):
         return self._CashierShifts
 
     def setCashierShifts(self, value):
-        for x in self._CashierShifts:
+        value = RefList(value)
+        for x in list(self._CashierShifts):
             x.Cashier = None
         for y in value:
             y._Cashier = self
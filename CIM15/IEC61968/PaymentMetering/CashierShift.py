@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.PaymentMetering.Shift import Shift
+from CIM15.Element import RefList
 
 class CashierShift(Shift):
     """The operating shift for a cashier, during which he may transact against the cashier shift, subject to vendor shift being open.The operating shift for a cashier, during which he may transact against the cashier shift, subject to vendor shift being open.
@@ -36,14 +37,14 @@ class CashierShift(Shift):
         #: The amount of cash that the cashier brings with him to start his shift and that he will take away at the end of his shift; i.e. the cash float does not get banked.
         self.cashFloat = cashFloat
 
-        self._Transactions = []
-        self.Transactions = [] if Transactions is None else Transactions
+        if Transactions is not None:
+            self.Transactions = Transactions
 
         self._PointOfSale = None
         self.PointOfSale = PointOfSale
 
-        self._Receipts = []
-        self.Receipts = [] if Receipts is None else Receipts
+        if Receipts is not None:
+            self.Receipts = Receipts
 
         self._Cashier = None
         self.Cashier = Cashier
@@ -56,13 +57,15 @@ class CashierShift(Shift):
     _enums = {}
     _refs = ["Transactions", "PointOfSale", "Receipts", "Cashier"]
     _many_refs = ["Transactions", "Receipts"]
+    _inverses = {"Transactions": "CashierShift", "PointOfSale": "CashierShifts", "Receipts": "CashierShift", "Cashier": "CashierShifts"}
 
     def getTransactions(self):
         
         return self._Transactions
 
     def setTransactions(self, value):
-        for x in self._Transactions:
+        value = RefList(value)
+        for x in list(self._Transactions):
             x.CashierShift = None
         for y in value:
             y._CashierShift = self
@@ -85,13 +88,12 @@ class CashierShift(Shift):
 
     def setPointOfSale(self, value):
         if self._PointOfSale is not None:
-            filtered = [x for x in self.PointOfSale.CashierShifts if x != self]
-            self._PointOfSale._CashierShifts = filtered
+            self._PointOfSale._CashierShifts.discard(self)
 
         self._PointOfSale = value
         if self._PointOfSale is not None:
             if self not in self._PointOfSale._CashierShifts:
-                self._PointOfSale._CashierShifts.append(self)
+                self._PointOfSale._reflist("_CashierShifts").append(self)
 
     PointOfSale = property(getPointOfSale, setPointOfSale)
 
@@ -101,7 +103,8 @@ class CashierShift(Shift):
         return self._Receipts
 
     def setReceipts(self, value):
-        for x in self._Receipts:
+        value = RefList(value)
+        for x in list(self._Receipts):
             x.CashierShift = None
         for y in value:
             y._CashierShift = self
@@ -124,13 +127,12 @@ class CashierShift(Shift):
 
     def setCashier(self, value):
         if self._Cashier is not None:
-            filtered = [x for x in self.Cashier.CashierShifts if x != self]
-            self._Cashier._CashierShifts = filtered
+            self._Cashier._CashierShifts.discard(self)
 
         self._Cashier = value
         if self._Cashier is not None:
             if self not in self._Cashier._CashierShifts:
-                self._Cashier._CashierShifts.append(self)
+                self._Cashier._reflist("_CashierShifts").append(self)
 
     Cashier = property(getCashier, setCashier)
 
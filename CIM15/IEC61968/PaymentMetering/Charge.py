@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Charge(IdentifiedObject):
     """A charge element associated with other entities such as tariff structures, auxiliary agreements or other charge elements. The total charge amount applicable to this instance of charge is the sum of fixed and variable portion.A charge element associated with other entities such as tariff structures, auxiliary agreements or other charge elements. The total charge amount applicable to this instance of charge is the sum of fixed and variable portion.
@@ -42,17 +43,17 @@ class Charge(IdentifiedObject):
         #: The kind of charge to be applied. Values are: "other", "demandCharge", "consumptionCharge", "auxiliaryCharge", "taxCharge"
         self.kind = kind
 
-        self._ConsumptionTariffIntervals = []
-        self.ConsumptionTariffIntervals = [] if ConsumptionTariffIntervals is None else ConsumptionTariffIntervals
+        if ConsumptionTariffIntervals is not None:
+            self.ConsumptionTariffIntervals = ConsumptionTariffIntervals
 
-        self._TimeTariffIntervals = []
-        self.TimeTariffIntervals = [] if TimeTariffIntervals is None else TimeTariffIntervals
+        if TimeTariffIntervals is not None:
+            self.TimeTariffIntervals = TimeTariffIntervals
 
-        self._AuxiliaryAccounts = []
-        self.AuxiliaryAccounts = [] if AuxiliaryAccounts is None else AuxiliaryAccounts
+        if AuxiliaryAccounts is not None:
+            self.AuxiliaryAccounts = AuxiliaryAccounts
 
-        self._ChildCharges = []
-        self.ChildCharges = [] if ChildCharges is None else ChildCharges
+        if ChildCharges is not None:
+            self.ChildCharges = ChildCharges
 
         self.fixedPortion = fixedPortion
 
@@ -67,6 +68,7 @@ class Charge(IdentifiedObject):
     _enums = {"kind": "ChargeKind"}
     _refs = ["ConsumptionTariffIntervals", "TimeTariffIntervals", "AuxiliaryAccounts", "ChildCharges", "fixedPortion", "ParentCharge"]
     _many_refs = ["ConsumptionTariffIntervals", "TimeTariffIntervals", "AuxiliaryAccounts", "ChildCharges"]
+    _inverses = {"ConsumptionTariffIntervals": "Charges", "TimeTariffIntervals": "Charges", "AuxiliaryAccounts": "Charges", "ChildCharges": "ParentCharge", "ParentCharge": "ChildCharges"}
 
     def getConsumptionTariffIntervals(self):
         """Tariff intervals to which this consumption-based charge must be levied.
@@ -75,20 +77,19 @@ class Charge(IdentifiedObject):
 
     def setConsumptionTariffIntervals(self, value):
         for p in self._ConsumptionTariffIntervals:
-            filtered = [q for q in p.Charges if q != self]
-            self._ConsumptionTariffIntervals._Charges = filtered
+            p._Charges.discard(self)
         for r in value:
             if self not in r._Charges:
-                r._Charges.append(self)
-        self._ConsumptionTariffIntervals = value
+                r._reflist("_Charges").append(self)
+        self._ConsumptionTariffIntervals = RefList(value)
 
     ConsumptionTariffIntervals = property(getConsumptionTariffIntervals, setConsumptionTariffIntervals)
 
     def addConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
         for obj in ConsumptionTariffIntervals:
             if self not in obj._Charges:
-                obj._Charges.append(self)
-            self._ConsumptionTariffIntervals.append(obj)
+                obj._reflist("_Charges").append(self)
+            self._reflist("_ConsumptionTariffIntervals").append(obj)
 
     def removeConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
         for obj in ConsumptionTariffIntervals:
@@ -103,20 +104,19 @@ class Charge(IdentifiedObject):
 
     def setTimeTariffIntervals(self, value):
         for p in self._TimeTariffIntervals:
-            filtered = [q for q in p.Charges if q != self]
-            self._TimeTariffIntervals._Charges = filtered
+            p._Charges.discard(self)
         for r in value:
             if self not in r._Charges:
-                r._Charges.append(self)
-        self._TimeTariffIntervals = value
+                r._reflist("_Charges").append(self)
+        self._TimeTariffIntervals = RefList(value)
 
     TimeTariffIntervals = property(getTimeTariffIntervals, setTimeTariffIntervals)
 
     def addTimeTariffIntervals(self, *TimeTariffIntervals):
         for obj in TimeTariffIntervals:
             if self not in obj._Charges:
-                obj._Charges.append(self)
-            self._TimeTariffIntervals.append(obj)
+                obj._reflist("_Charges").append(self)
+            self._reflist("_TimeTariffIntervals").append(obj)
 
     def removeTimeTariffIntervals(self, *TimeTariffIntervals):
         for obj in TimeTariffIntervals:
@@ -131,20 +131,19 @@ class Charge(IdentifiedObject):
 
     def setAuxiliaryAccounts(self, value):
         for p in self._AuxiliaryAccounts:
-            filtered = [q for q in p.Charges if q != self]
-            self._AuxiliaryAccounts._Charges = filtered
+            p._Charges.discard(self)
         for r in value:
             if self not in r._Charges:
-                r._Charges.append(self)
-        self._AuxiliaryAccounts = value
+                r._reflist("_Charges").append(self)
+        self._AuxiliaryAccounts = RefList(value)
 
     AuxiliaryAccounts = property(getAuxiliaryAccounts, setAuxiliaryAccounts)
 
     def addAuxiliaryAccounts(self, *AuxiliaryAccounts):
         for obj in AuxiliaryAccounts:
             if self not in obj._Charges:
-                obj._Charges.append(self)
-            self._AuxiliaryAccounts.append(obj)
+                obj._reflist("_Charges").append(self)
+            self._reflist("_AuxiliaryAccounts").append(obj)
 
     def removeAuxiliaryAccounts(self, *AuxiliaryAccounts):
         for obj in AuxiliaryAccounts:
@@ -158,7 +157,8 @@ class Charge(IdentifiedObject):
         return self._ChildCharges
 
     def setChildCharges(self, value):
-        for x in self._ChildCharges:
+        value = RefList(value)
+        for x in list(self._ChildCharges):
             x.ParentCharge = None
         for y in value:
             y._ParentCharge = self
@@ -184,13 +184,12 @@ class Charge(IdentifiedObject):
 
     def setParentCharge(self, value):
         if self._ParentCharge is not None:
-            filtered = [x for x in self.ParentCharge.ChildCharges if x != self]
-            self._ParentCharge._ChildCharges = filtered
+            self._ParentCharge._ChildCharges.discard(self)
 
         self._ParentCharge = value
         if self._ParentCharge is not None:
             if self not in self._ParentCharge._ChildCharges:
-                self._ParentCharge._ChildCharges.append(self)
+                self._ParentCharge._reflist("_ChildCharges").append(self)
 
     ParentCharge = property(getParentCharge, setParentCharge)
 
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, RefList
 
 class ConsumptionTariffInterval(Element):
     """One of a sequence of intervals defined in terms of consumption quantity of a service such as electricity, water, gas, etc. It is typically used in association with TariffProfile to define the steps or blocks in a step tariff structure, where startValue simultaneously defines the entry value of this step and the closing value of the previous step. Where consumption is &gt;= startValue it falls within this interval and where consumption is &lt; startValue it falls within the previous interval.One of a sequence of intervals defined in terms of consumption quantity of a service such as electricity, water, gas, etc. It is typically used in association with TariffProfile to define the steps or blocks in a step tariff structure, where startValue simultaneously defines the entry value of this step and the closing value of the previous step. Where consumption is &gt;= startValue it falls within this interval and where consumption is &lt; startValue it falls within the previous interval.
@@ -39,14 +39,14 @@ class ConsumptionTariffInterval(Element):
         #: A sequential reference that defines the identity of this interval and its relative position with respect to other intervals in a sequence of intervals.
         self.sequenceNumber = sequenceNumber
 
-        self._Charges = []
-        self.Charges = [] if Charges is None else Charges
+        if Charges is not None:
+            self.Charges = Charges
 
-        self._TariffProfiles = []
-        self.TariffProfiles = [] if TariffProfiles is None else TariffProfiles
+        if TariffProfiles is not None:
+            self.TariffProfiles = TariffProfiles
 
-        self._TouTariffIntervals = []
-        self.TouTariffIntervals = [] if TouTariffIntervals is None else TouTariffIntervals
+        if TouTariffIntervals is not None:
+            self.TouTariffIntervals = TouTariffIntervals
 
         super(ConsumptionTariffInterval, self).__init__(*args, **kw_args)
 
@@ -56,6 +56,7 @@ class ConsumptionTariffInterval(Element):
     _enums = {}
     _refs = ["Charges", "TariffProfiles", "TouTariffIntervals"]
     _many_refs = ["Charges", "TariffProfiles", "TouTariffIntervals"]
+    _inverses = {"Charges": "ConsumptionTariffIntervals", "TariffProfiles": "ConsumptionTariffIntervals", "TouTariffIntervals": "ConsumptionTariffIntervals"}
 
     def getCharges(self):
         """All charges used to define this consumption tariff interval.
@@ -64,20 +65,19 @@ class ConsumptionTariffInterval(Element):
 
     def setCharges(self, value):
         for p in self._Charges:
-            filtered = [q for q in p.ConsumptionTariffIntervals if q != self]
-            self._Charges._ConsumptionTariffIntervals = filtered
+            p._ConsumptionTariffIntervals.discard(self)
         for r in value:
             if self not in r._ConsumptionTariffIntervals:
-                r._ConsumptionTariffIntervals.append(self)
-        self._Charges = value
+                r._reflist("_ConsumptionTariffIntervals").append(self)
+        self._Charges = RefList(value)
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
         for obj in Charges:
             if self not in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.append(self)
-            self._Charges.append(obj)
+                obj._reflist("_ConsumptionTariffIntervals").append(self)
+            self._reflist("_Charges").append(obj)
 
     def removeCharges(self, *Charges):
         for obj in Charges:
@@ -92,20 +92,19 @@ class ConsumptionTariffInterval(Element):
 
     def setTariffProfiles(self, value):
         for p in self._TariffProfiles:
-            filtered = [q for q in p.ConsumptionTariffIntervals if q != self]
-            self._TariffProfiles._ConsumptionTariffIntervals = filtered
+            p._ConsumptionTariffIntervals.discard(self)
         for r in value:
             if self not in r._ConsumptionTariffIntervals:
-                r._ConsumptionTariffIntervals.append(self)
-        self._TariffProfiles = value
+                r._reflist("_ConsumptionTariffIntervals").append(self)
+        self._TariffProfiles = RefList(value)
 
     TariffProfiles = property(getTariffProfiles, setTariffProfiles)
 
     def addTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
             if self not in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.append(self)
-            self._TariffProfiles.append(obj)
+                obj._reflist("_ConsumptionTariffIntervals").append(self)
+            self._reflist("_TariffProfiles").append(obj)
 
     def removeTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
@@ -120,20 +119,19 @@ class ConsumptionTariffInterval(Element):
 
     def setTouTariffIntervals(self, value):
         for p in self._TouTariffIntervals:
-            filtered = [q for q in p.ConsumptionTariffIntervals if q != self]
-            self._TouTariffIntervals._ConsumptionTariffIntervals = filtered
+            p._ConsumptionTariffIntervals.discard(self)
         for r in value:
             if self not in r._ConsumptionTariffIntervals:
-                r._ConsumptionTariffIntervals.append(self)
-        self._TouTariffIntervals = value
+                r._reflist("_ConsumptionTariffIntervals").append(self)
+        self._TouTariffIntervals = RefList(value)
 
     TouTariffIntervals = property(getTouTariffIntervals, setTouTariffIntervals)
 
     def addTouTariffIntervals(self, *TouTariffIntervals):
         for obj in TouTariffIntervals:
             if self not in obj._ConsumptionTariffIntervals:
-                obj._ConsumptionTariffIntervals.append(self)
-            self._TouTariffIntervals.append(obj)
+                obj._reflist("_ConsumptionTariffIntervals").append(self)
+            self._reflist("_TouTariffIntervals").append(obj)
 
     def removeTouTariffIntervals(self, *TouTariffIntervals):
         for obj in TouTariffIntervals:
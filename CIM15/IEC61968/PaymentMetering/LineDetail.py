@@ -50,4 +50,5 @@ class LineDetail(object):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
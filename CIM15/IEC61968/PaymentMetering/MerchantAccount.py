@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class MerchantAccount(Document):
     """The operating account controlled by merchant agreement, against which vendor may vend tokens or receipt payments. Transactions via vendor shift debit the account and bank deposits via bank statement credit the account.The operating account controlled by merchant agreement, against which vendor may vend tokens or receipt payments. Transactions via vendor shift debit the account and bank deposits via bank statement credit the account.
@@ -42,11 +43,11 @@ class MerchantAccount(Document):
         self._MerchantAgreement = None
         self.MerchantAgreement = MerchantAgreement
 
-        self._Transactors = []
-        self.Transactors = [] if Transactors is None else Transactors
+        if Transactors is not None:
+            self.Transactors = Transactors
 
-        self._VendorShifts = []
-        self.VendorShifts = [] if VendorShifts is None else VendorShifts
+        if VendorShifts is not None:
+            self.VendorShifts = VendorShifts
 
         super(MerchantAccount, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class MerchantAccount(Document):
     _enums = {}
     _refs = ["MerchantAgreement", "Transactors", "VendorShifts"]
     _many_refs = ["Transactors", "VendorShifts"]
+    _inverses = {"MerchantAgreement": "MerchantAccounts", "Transactors": "MerchantAccounts", "VendorShifts": "MerchantAccount"}
 
     def getMerchantAgreement(self):
         """Merchant agreement that instantiated this merchant account.
@@ -64,13 +66,12 @@ class MerchantAccount(Document):
 
     def setMerchantAgreement(self, value):
         if self._MerchantAgreement is not None:
-            filtered = [x for x in self.MerchantAgreement.MerchantAccounts if x != self]
-            self._MerchantAgreement._MerchantAccounts = filtered
+            self._MerchantAgreement._MerchantAccounts.discard(self)
 
         self._MerchantAgreement = value
         if self._MerchantAgreement is not None:
             if self not in self._MerchantAgreement._MerchantAccounts:
-                self._MerchantAgreement._MerchantAccounts.append(self)
+                self._MerchantAgreement._reflist("_MerchantAccounts").append(self)
 
     MerchantAgreement = property(getMerchantAgreement, setMerchantAgreement)
 
@@ -81,20 +82,19 @@ class MerchantAccount(Document):
 
     def setTransactors(self, value):
         for p in self._Transactors:
-            filtered = [q for q in p.MerchantAccounts if q != self]
-            self._Transactors._MerchantAccounts = filtered
+            p._MerchantAccounts.discard(self)
         for r in value:
             if self not in r._MerchantAccounts:
-                r._MerchantAccounts.append(self)
-        self._Transactors = value
+                r._reflist("_MerchantAccounts").append(self)
+        self._Transactors = RefList(value)
 
     Transactors = property(getTransactors, setTransactors)
 
     def addTransactors(self, *Transactors):
         for obj in Transactors:
             if self not in obj._MerchantAccounts:
-                obj._MerchantAccounts.append(self)
-            self._Transactors.append(obj)
+                obj._reflist("_MerchantAccounts").append(self)
+            self._reflist("_Transactors").append(obj)
 
     def removeTransactors(self, *Transactors):
         for obj in Transactors:
@@ -108,7 +108,8 @@ class MerchantAccount(Document):
         return self._VendorShifts
 
     def setVendorShifts(self, value):
-        for x in self._VendorShifts:
+        value = RefList(value)
+        for x in list(self._VendorShifts):
             x.MerchantAccount = None
         for y in value:
             y._MerchantAccount = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Agreement import Agreement
+from CIM15.Element import RefList
 
 class MerchantAgreement(Agreement):
     """A formal controlling contractual agreement between supplier and merchant, in terms of which merchant is authorised to vend tokens and receipt payments on behalf of supplier. Merchant is accountable to supplier for revenue collected at point of sale.A formal controlling contractual agreement between supplier and merchant, in terms of which merchant is authorised to vend tokens and receipt payments on behalf of supplier. Merchant is accountable to supplier for revenue collected at point of sale.
@@ -29,8 +30,8 @@ class MerchantAgreement(Agreement):
 
         @param MerchantAccounts: All merchant accounts instantiated as a result of this merchant agreement.
         """
-        self._MerchantAccounts = []
-        self.MerchantAccounts = [] if MerchantAccounts is None else MerchantAccounts
+        if MerchantAccounts is not None:
+            self.MerchantAccounts = MerchantAccounts
 
         super(MerchantAgreement, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class MerchantAgreement(Agreement):
     _enums = {}
     _refs = ["MerchantAccounts"]
     _many_refs = ["MerchantAccounts"]
+    _inverses = {"MerchantAccounts": "MerchantAgreement"}
 
     def getMerchantAccounts(self):
         """All merchant accounts instantiated as a result of this merchant agreement.
@@ -47,7 +49,8 @@ class MerchantAgreement(Agreement):
         return self._MerchantAccounts
 
     def setMerchantAccounts(self, value):
-        for x in self._MerchantAccounts:
+        value = RefList(value)
+        for x in list(self._MerchantAccounts):
             x.MerchantAgreement = None
         for y in value:
             y._MerchantAgreement = self
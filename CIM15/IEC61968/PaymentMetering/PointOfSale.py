@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class PointOfSale(IdentifiedObject):
     """Logical point where transactions take place with operational interaction between cashier and the payment system; in certain cases point of sale interacts directly with the end customer, in which case cashier might not be a real person: for example a self-service kiosk or over the internet.Logical point where transactions take place with operational interaction between cashier and the payment system; in certain cases point of sale interacts directly with the end customer, in which case cashier might not be a real person: for example a self-service kiosk or over the internet.
@@ -33,8 +34,8 @@ class PointOfSale(IdentifiedObject):
         #: Local description for where this point of sale is physically located.
         self.location = location
 
-        self._CashierShifts = []
-        self.CashierShifts = [] if CashierShifts is None else CashierShifts
+        if CashierShifts is not None:
+            self.CashierShifts = CashierShifts
 
         super(PointOfSale, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class PointOfSale(IdentifiedObject):
     _enums = {}
     _refs = ["CashierShifts"]
     _many_refs = ["CashierShifts"]
+    _inverses = {"CashierShifts": "PointOfSale"}
 
     def getCashierShifts(self):
         """All shifts this point of sale operated in.
@@ -51,7 +53,8 @@ class PointOfSale(IdentifiedObject):
         return self._CashierShifts
 
     def setCashierShifts(self, value):
-        for x in self._CashierShifts:
+        value = RefList(value)
+        for x in list(self._CashierShifts):
             x.PointOfSale = None
         for y in value:
             y._PointOfSale = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from CIM15.Element import RefList
 
 class ServiceSupplier(Organisation):
     """Organisation that provides services to customers.Organisation that provides services to customers.
@@ -39,14 +40,14 @@ class ServiceSupplier(Organisation):
         #: Kind of supplier. Values are: "other", "retailer", "utility"
         self.kind = kind
 
-        self._BankAccounts = []
-        self.BankAccounts = [] if BankAccounts is None else BankAccounts
+        if BankAccounts is not None:
+            self.BankAccounts = BankAccounts
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
         super(ServiceSupplier, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class ServiceSupplier(Organisation):
     _enums = {"kind": "SupplierKind"}
     _refs = ["BankAccounts", "ServiceDeliveryPoints", "CustomerAgreements"]
     _many_refs = ["BankAccounts", "ServiceDeliveryPoints", "CustomerAgreements"]
+    _inverses = {"BankAccounts": "ServiceSupplier", "ServiceDeliveryPoints": "ServiceSupplier", "CustomerAgreements": "ServiceSupplier"}
 
     def getBankAccounts(self):
         """All BackAccounts this ServiceSupplier owns.
@@ -63,7 +65,8 @@ class ServiceSupplier(Organisation):
         return self._BankAccounts
 
     def setBankAccounts(self, value):
-        for x in self._BankAccounts:
+        value = RefList(value)
+        for x in list(self._BankAccounts):
             x.ServiceSupplier = None
         for y in value:
             y._ServiceSupplier = self
@@ -85,7 +88,8 @@ class ServiceSupplier(Organisation):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
-        for x in self._ServiceDeliveryPoints:
+        value = RefList(value)
+        for x in list(self._ServiceDeliveryPoints):
             x.ServiceSupplier = None
         for y in value:
             y._ServiceSupplier = self
@@ -107,7 +111,8 @@ class ServiceSupplier(Organisation):
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
-        for x in self._CustomerAgreements:
+        value = RefList(value)
+        for x in list(self._CustomerAgreements):
             x.ServiceSupplier = None
         for y in value:
             y._ServiceSupplier = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class TariffProfile(Document):
     """A schedule of charges; structure associated with Tariff that allows the definition of complex tarif structures such as step and time of use when used in conjunction with TimeTariffInterval and Charge. Inherited 'status.value' is defined in the context of the utility's business rules, for example: active, inactive, etc.A schedule of charges; structure associated with Tariff that allows the definition of complex tarif structures such as step and time of use when used in conjunction with TimeTariffInterval and Charge. Inherited 'status.value' is defined in the context of the utility's business rules, for example: active, inactive, etc.
@@ -35,14 +36,14 @@ class TariffProfile(Document):
         #: The frequency at which the tariff charge schedule is repeated Examples are: once off on a specified date and time; hourly; daily; weekly; monthly; 3-monthly; 6-monthly; 12-monthly; etc. At the end of each cycle, the business rules are reset to start from the beginning again.
         self.tariffCycle = tariffCycle
 
-        self._Tariffs = []
-        self.Tariffs = [] if Tariffs is None else Tariffs
+        if Tariffs is not None:
+            self.Tariffs = Tariffs
 
-        self._ConsumptionTariffIntervals = []
-        self.ConsumptionTariffIntervals = [] if ConsumptionTariffIntervals is None else ConsumptionTariffIntervals
+        if ConsumptionTariffIntervals is not None:
+            self.ConsumptionTariffIntervals = ConsumptionTariffIntervals
 
-        self._TimeTariffIntervals = []
-        self.TimeTariffIntervals = [] if TimeTariffIntervals is None else TimeTariffIntervals
+        if TimeTariffIntervals is not None:
+            self.TimeTariffIntervals = TimeTariffIntervals
 
         super(TariffProfile, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class TariffProfile(Document):
     _enums = {}
     _refs = ["Tariffs", "ConsumptionTariffIntervals", "TimeTariffIntervals"]
     _many_refs = ["Tariffs", "ConsumptionTariffIntervals", "TimeTariffIntervals"]
+    _inverses = {"Tariffs": "TariffProfiles", "ConsumptionTariffIntervals": "TariffProfiles", "TimeTariffIntervals": "TariffProfiles"}
 
     def getTariffs(self):
         """All tariffs defined by this tariff profile.
@@ -60,20 +62,19 @@ class TariffProfile(Document):
 
     def setTariffs(self, value):
         for p in self._Tariffs:
-            filtered = [q for q in p.TariffProfiles if q != self]
-            self._Tariffs._TariffProfiles = filtered
+            p._TariffProfiles.discard(self)
         for r in value:
             if self not in r._TariffProfiles:
-                r._TariffProfiles.append(self)
-        self._Tariffs = value
+                r._reflist("_TariffProfiles").append(self)
+        self._Tariffs = RefList(value)
 
     Tariffs = property(getTariffs, setTariffs)
 
     def addTariffs(self, *Tariffs):
         for obj in Tariffs:
             if self not in obj._TariffProfiles:
-                obj._TariffProfiles.append(self)
-            self._Tariffs.append(obj)
+                obj._reflist("_TariffProfiles").append(self)
+            self._reflist("_Tariffs").append(obj)
 
     def removeTariffs(self, *Tariffs):
         for obj in Tariffs:
@@ -88,20 +89,19 @@ class TariffProfile(Document):
 
     def setConsumptionTariffIntervals(self, value):
         for p in self._ConsumptionTariffIntervals:
-            filtered = [q for q in p.TariffProfiles if q != self]
-            self._ConsumptionTariffIntervals._TariffProfiles = filtered
+            p._TariffProfiles.discard(self)
         for r in value:
             if self not in r._TariffProfiles:
-                r._TariffProfiles.append(self)
-        self._ConsumptionTariffIntervals = value
+                r._reflist("_TariffProfiles").append(self)
+        self._ConsumptionTariffIntervals = RefList(value)
 
     ConsumptionTariffIntervals = property(getConsumptionTariffIntervals, setConsumptionTariffIntervals)
 
     def addConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
         for obj in ConsumptionTariffIntervals:
             if self not in obj._TariffProfiles:
-                obj._TariffProfiles.append(self)
-            self._ConsumptionTariffIntervals.append(obj)
+                obj._reflist("_TariffProfiles").append(self)
+            self._reflist("_ConsumptionTariffIntervals").append(obj)
 
     def removeConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
         for obj in ConsumptionTariffIntervals:
@@ -116,20 +116,19 @@ class TariffProfile(Document):
 
     def setTimeTariffIntervals(self, value):
         for p in self._TimeTariffIntervals:
-            filtered = [q for q in p.TariffProfiles if q != self]
-            self._TimeTariffIntervals._TariffProfiles = filtered
+            p._TariffProfiles.discard(self)
         for r in value:
             if self not in r._TariffProfiles:
-                r._TariffProfiles.append(self)
-        self._TimeTariffIntervals = value
+                r._reflist("_TariffProfiles").append(self)
+        self._TimeTariffIntervals = RefList(value)
 
     TimeTariffIntervals = property(getTimeTariffIntervals, setTimeTariffIntervals)
 
     def addTimeTariffIntervals(self, *TimeTariffIntervals):
         for obj in TimeTariffIntervals:
             if self not in obj._TariffProfiles:
-                obj._TariffProfiles.append(self)
-            self._TimeTariffIntervals.append(obj)
+                obj._reflist("_TariffProfiles").append(self)
+            self._reflist("_TimeTariffIntervals").append(obj)
 
     def removeTimeTariffIntervals(self, *TimeTariffIntervals):
         for obj in TimeTariffIntervals:
@@ -60,6 +60,7 @@ class Tender(IdentifiedObject):
     _enums = {"kind": "TenderKind"}
     _refs = ["Card", "Receipt", "Cheque"]
     _many_refs = []
+    _inverses = {"Card": "Tender", "Receipt": "Tenders", "Cheque": "Tender"}
 
     def getCard(self):
         """Card used to tender payment.
@@ -84,13 +85,12 @@ class Tender(IdentifiedObject):
 
     def setReceipt(self, value):
         if self._Receipt is not None:
-            filtered = [x for x in self.Receipt.Tenders if x != self]
-            self._Receipt._Tenders = filtered
+            self._Receipt._Tenders.discard(self)
 
         self._Receipt = value
         if self._Receipt is not None:
             if self not in self._Receipt._Tenders:
-                self._Receipt._Tenders.append(self)
+                self._Receipt._reflist("_Tenders").append(self)
 
     Receipt = property(getReceipt, setReceipt)
 
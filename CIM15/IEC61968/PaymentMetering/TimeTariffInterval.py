@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, RefList
 
 class TimeTariffInterval(Element):
     """One of a sequence of time intervals defined in terms of real time. It is typically used in association with TariffProfile to define the intervals in a time of use tariff structure, where startDateTime simultaneously determines the starting point of this interval and the ending point of the previous interval.One of a sequence of time intervals defined in terms of real time. It is typically used in association with TariffProfile to define the intervals in a time of use tariff structure, where startDateTime simultaneously determines the starting point of this interval and the ending point of the previous interval.
@@ -39,14 +39,14 @@ class TimeTariffInterval(Element):
         #: A sequential reference that defines the identity of this interval and its relative position with respect to other intervals in a sequence of intervals.
         self.sequenceNumber = sequenceNumber
 
-        self._ConsumptionTariffIntervals = []
-        self.ConsumptionTariffIntervals = [] if ConsumptionTariffIntervals is None else ConsumptionTariffIntervals
+        if ConsumptionTariffIntervals is not None:
+            self.ConsumptionTariffIntervals = ConsumptionTariffIntervals
 
-        self._TariffProfiles = []
-        self.TariffProfiles = [] if TariffProfiles is None else TariffProfiles
+        if TariffProfiles is not None:
+            self.TariffProfiles = TariffProfiles
 
-        self._Charges = []
-        self.Charges = [] if Charges is None else Charges
+        if Charges is not None:
+            self.Charges = Charges
 
         super(TimeTariffInterval, self).__init__(*args, **kw_args)
 
@@ -56,6 +56,7 @@ class TimeTariffInterval(Element):
     _enums = {}
     _refs = ["ConsumptionTariffIntervals", "TariffProfiles", "Charges"]
     _many_refs = ["ConsumptionTariffIntervals", "TariffProfiles", "Charges"]
+    _inverses = {"ConsumptionTariffIntervals": "TouTariffIntervals", "TariffProfiles": "TimeTariffIntervals", "Charges": "TimeTariffIntervals"}
 
     def getConsumptionTariffIntervals(self):
         """All consumption tariff intervals that introduce variation in this time of use tariff interval; allows to express e.g., peak hour prices that are different with different consumption blocks.
@@ -64,20 +65,19 @@ class TimeTariffInterval(Element):
 
     def setConsumptionTariffIntervals(self, value):
         for p in self._ConsumptionTariffIntervals:
-            filtered = [q for q in p.TouTariffIntervals if q != self]
-            self._ConsumptionTariffIntervals._TouTariffIntervals = filtered
+            p._TouTariffIntervals.discard(self)
         for r in value:
             if self not in r._TouTariffIntervals:
-                r._TouTariffIntervals.append(self)
-        self._ConsumptionTariffIntervals = value
+                r._reflist("_TouTariffIntervals").append(self)
+        self._ConsumptionTariffIntervals = RefList(value)
 
     ConsumptionTariffIntervals = property(getConsumptionTariffIntervals, setConsumptionTariffIntervals)
 
     def addConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
         for obj in ConsumptionTariffIntervals:
             if self not in obj._TouTariffIntervals:
-                obj._TouTariffIntervals.append(self)
-            self._ConsumptionTariffIntervals.append(obj)
+                obj._reflist("_TouTariffIntervals").append(self)
+            self._reflist("_ConsumptionTariffIntervals").append(obj)
 
     def removeConsumptionTariffIntervals(self, *ConsumptionTariffIntervals):
         for obj in ConsumptionTariffIntervals:
@@ -92,20 +92,19 @@ class TimeTariffInterval(Element):
 
     def setTariffProfiles(self, value):
         for p in self._TariffProfiles:
-            filtered = [q for q in p.TimeTariffIntervals if q != self]
-            self._TariffProfiles._TimeTariffIntervals = filtered
+            p._TimeTariffIntervals.discard(self)
         for r in value:
             if self not in r._TimeTariffIntervals:
-                r._TimeTariffIntervals.append(self)
-        self._TariffProfiles = value
+                r._reflist("_TimeTariffIntervals").append(self)
+        self._TariffProfiles = RefList(value)
 
     TariffProfiles = property(getTariffProfiles, setTariffProfiles)
 
     def addTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
             if self not in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.append(self)
-            self._TariffProfiles.append(obj)
+                obj._reflist("_TimeTariffIntervals").append(self)
+            self._reflist("_TariffProfiles").append(obj)
 
     def removeTariffProfiles(self, *TariffProfiles):
         for obj in TariffProfiles:
@@ -120,20 +119,19 @@ class TimeTariffInterval(Element):
 
     def setCharges(self, value):
         for p in self._Charges:
-            filtered = [q for q in p.TimeTariffIntervals if q != self]
-            self._Charges._TimeTariffIntervals = filtered
+            p._TimeTariffIntervals.discard(self)
         for r in value:
             if self not in r._TimeTariffIntervals:
-                r._TimeTariffIntervals.append(self)
-        self._Charges = value
+                r._reflist("_TimeTariffIntervals").append(self)
+        self._Charges = RefList(value)
 
     Charges = property(getCharges, setCharges)
 
     def addCharges(self, *Charges):
         for obj in Charges:
             if self not in obj._TimeTariffIntervals:
-                obj._TimeTariffIntervals.append(self)
-            self._Charges.append(obj)
+                obj._reflist("_TimeTariffIntervals").append(self)
+            self._reflist("_Charges").append(obj)
 
     def removeCharges(self, *Charges):
         for obj in Charges:
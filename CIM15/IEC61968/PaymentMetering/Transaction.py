@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Transaction(IdentifiedObject):
     """The record of details of payment for service or token sale.The record of details of payment for service or token sale.
@@ -70,8 +71,8 @@ class Transaction(IdentifiedObject):
 
         self.line = line
 
-        self._UserAttributes = []
-        self.UserAttributes = [] if UserAttributes is None else UserAttributes
+        if UserAttributes is not None:
+            self.UserAttributes = UserAttributes
 
         self._AuxiliaryAccount = None
         self.AuxiliaryAccount = AuxiliaryAccount
@@ -99,6 +100,7 @@ class Transaction(IdentifiedObject):
     _enums = {"kind": "TransactionKind"}
     _refs = ["PricingStructure", "line", "UserAttributes", "AuxiliaryAccount", "VendorShift", "Receipt", "Meter", "CustomerAccount", "CashierShift"]
     _many_refs = ["UserAttributes"]
+    _inverses = {"PricingStructure": "Transactions", "UserAttributes": "Transaction", "AuxiliaryAccount": "PaymentTransactions", "VendorShift": "Transactions", "Receipt": "Transactions", "Meter": "VendingTransactions", "CustomerAccount": "PaymentTransactions", "CashierShift": "Transactions"}
 
     def getPricingStructure(self):
         """Pricing structure applicable for this transaction.
@@ -107,13 +109,12 @@ class Transaction(IdentifiedObject):
 
     def setPricingStructure(self, value):
         if self._PricingStructure is not None:
-            filtered = [x for x in self.PricingStructure.Transactions if x != self]
-            self._PricingStructure._Transactions = filtered
+            self._PricingStructure._Transactions.discard(self)
 
         self._PricingStructure = value
         if self._PricingStructure is not None:
             if self not in self._PricingStructure._Transactions:
-                self._PricingStructure._Transactions.append(self)
+                self._PricingStructure._reflist("_Transactions").append(self)
 
     PricingStructure = property(getPricingStructure, setPricingStructure)
 
@@ -126,7 +127,8 @@ class Transaction(IdentifiedObject):
         return self._UserAttributes
 
     def setUserAttributes(self, value):
-        for x in self._UserAttributes:
+        value = RefList(value)
+        for x in list(self._UserAttributes):
             x.Transaction = None
         for y in value:
             y._Transaction = self
@@ -149,13 +151,12 @@ class Transaction(IdentifiedObject):
 
     def setAuxiliaryAccount(self, value):
         if self._AuxiliaryAccount is not None:
-            filtered = [x for x in self.AuxiliaryAccount.PaymentTransactions if x != self]
-            self._AuxiliaryAccount._PaymentTransactions = filtered
+            self._AuxiliaryAccount._PaymentTransactions.discard(self)
 
         self._AuxiliaryAccount = value
         if self._AuxiliaryAccount is not None:
             if self not in self._AuxiliaryAccount._PaymentTransactions:
-                self._AuxiliaryAccount._PaymentTransactions.append(self)
+                self._AuxiliaryAccount._reflist("_PaymentTransactions").append(self)
 
     AuxiliaryAccount = property(getAuxiliaryAccount, setAuxiliaryAccount)
 
@@ -166,13 +167,12 @@ class Transaction(IdentifiedObject):
 
     def setVendorShift(self, value):
         if self._VendorShift is not None:
-            filtered = [x for x in self.VendorShift.Transactions if x != self]
-            self._VendorShift._Transactions = filtered
+            self._VendorShift._Transactions.discard(self)
 
         self._VendorShift = value
         if self._VendorShift is not None:
             if self not in self._VendorShift._Transactions:
-                self._VendorShift._Transactions.append(self)
+                self._VendorShift._reflist("_Transactions").append(self)
 
     VendorShift = property(getVendorShift, setVendorShift)
 
@@ -183,13 +183,12 @@ class Transaction(IdentifiedObject):
 
     def setReceipt(self, value):
         if self._Receipt is not None:
-            filtered = [x for x in self.Receipt.Transactions if x != self]
-            self._Receipt._Transactions = filtered
+            self._Receipt._Transactions.discard(self)
 
         self._Receipt = value
         if self._Receipt is not None:
             if self not in self._Receipt._Transactions:
-                self._Receipt._Transactions.append(self)
+                self._Receipt._reflist("_Transactions").append(self)
 
     Receipt = property(getReceipt, setReceipt)
 
@@ -200,13 +199,12 @@ class Transaction(IdentifiedObject):
 
     def setMeter(self, value):
         if self._Meter is not None:
-            filtered = [x for x in self.Meter.VendingTransactions if x != self]
-            self._Meter._VendingTransactions = filtered
+            self._Meter._VendingTransactions.discard(self)
 
         self._Meter = value
         if self._Meter is not None:
             if self not in self._Meter._VendingTransactions:
-                self._Meter._VendingTransactions.append(self)
+                self._Meter._reflist("_VendingTransactions").append(self)
 
     Meter = property(getMeter, setMeter)
 
@@ -217,13 +215,12 @@ class Transaction(IdentifiedObject):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.PaymentTransactions if x != self]
-            self._CustomerAccount._PaymentTransactions = filtered
+            self._CustomerAccount._PaymentTransactions.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
             if self not in self._CustomerAccount._PaymentTransactions:
-                self._CustomerAccount._PaymentTransactions.append(self)
+                self._CustomerAccount._reflist("_PaymentTransactions").append(self)
 
     CustomerAccount = property(getCustomerAccount, setCustomerAccount)
 
@@ -234,13 +231,12 @@ class Transaction(IdentifiedObject):
 
     def setCashierShift(self, value):
         if self._CashierShift is not None:
-            filtered = [x for x in self.CashierShift.Transactions if x != self]
-            self._CashierShift._Transactions = filtered
+            self._CashierShift._Transactions.discard(self)
 
         self._CashierShift = value
         if self._CashierShift is not None:
             if self not in self._CashierShift._Transactions:
-                self._CashierShift._Transactions.append(self)
+                self._CashierShift._reflist("_Transactions").append(self)
 
     CashierShift = property(getCashierShift, setCashierShift)
 
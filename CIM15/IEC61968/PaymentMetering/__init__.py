@@ -21,32 +21,8 @@
 """This package is an extension of the Metering package and contains the information classes that support specialised applications such as prepayment metering. These classes are generally associated with the collection and control of revenue from the customer for a delivered service.
 """
 
-from CIM15.IEC61968.PaymentMetering.VendorShift import VendorShift
-from CIM15.IEC61968.PaymentMetering.Transactor import Transactor
-from CIM15.IEC61968.PaymentMetering.CashierShift import CashierShift
-from CIM15.IEC61968.PaymentMetering.TariffProfile import TariffProfile
-from CIM15.IEC61968.PaymentMetering.AccountingUnit import AccountingUnit
-from CIM15.IEC61968.PaymentMetering.Transaction import Transaction
-from CIM15.IEC61968.PaymentMetering.TimeTariffInterval import TimeTariffInterval
-from CIM15.IEC61968.PaymentMetering.Charge import Charge
-from CIM15.IEC61968.PaymentMetering.AuxiliaryAgreement import AuxiliaryAgreement
-from CIM15.IEC61968.PaymentMetering.Tender import Tender
-from CIM15.IEC61968.PaymentMetering.ServiceSupplier import ServiceSupplier
-from CIM15.IEC61968.PaymentMetering.MerchantAgreement import MerchantAgreement
-from CIM15.IEC61968.PaymentMetering.LineDetail import LineDetail
-from CIM15.IEC61968.PaymentMetering.ConsumptionTariffInterval import ConsumptionTariffInterval
-from CIM15.IEC61968.PaymentMetering.Vendor import Vendor
-from CIM15.IEC61968.PaymentMetering.Cheque import Cheque
-from CIM15.IEC61968.PaymentMetering.AccountMovement import AccountMovement
-from CIM15.IEC61968.PaymentMetering.Shift import Shift
-from CIM15.IEC61968.PaymentMetering.Receipt import Receipt
-from CIM15.IEC61968.PaymentMetering.Due import Due
-from CIM15.IEC61968.PaymentMetering.BankAccountDetail import BankAccountDetail
-from CIM15.IEC61968.PaymentMetering.AuxiliaryAccount import AuxiliaryAccount
-from CIM15.IEC61968.PaymentMetering.Cashier import Cashier
-from CIM15.IEC61968.PaymentMetering.Card import Card
-from CIM15.IEC61968.PaymentMetering.MerchantAccount import MerchantAccount
-from CIM15.IEC61968.PaymentMetering.PointOfSale import PointOfSale
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#PaymentMetering"
 nsPrefix = "cimPaymentMetering"
@@ -76,3 +52,33 @@ class SupplierKind(str):
     """Values are: other, retailer, utility
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "VendorShift",
+    "Transactor",
+    "CashierShift",
+    "TariffProfile",
+    "AccountingUnit",
+    "Transaction",
+    "TimeTariffInterval",
+    "Charge",
+    "AuxiliaryAgreement",
+    "Tender",
+    "ServiceSupplier",
+    "MerchantAgreement",
+    "LineDetail",
+    "ConsumptionTariffInterval",
+    "Vendor",
+    "Cheque",
+    "AccountMovement",
+    "Shift",
+    "Receipt",
+    "Due",
+    "BankAccountDetail",
+    "AuxiliaryAccount",
+    "Cashier",
+    "Card",
+    "MerchantAccount",
+    "PointOfSale",
+])
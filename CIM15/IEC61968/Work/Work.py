@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class Work(Document):
     """Document used to request, initiate, track and record work. This is synonymous with work breakdown structure (WBS), which is traversed through the (currently informative) recursive association of Work. Note that the work name is equal to the WBS name, which is given in the inherited 'name' attribute.Document used to request, initiate, track and record work. This is synonymous with work breakdown structure (WBS), which is traversed through the (currently informative) recursive association of Work. Note that the work name is equal to the WBS name, which is given in the inherited 'name' attribute.
@@ -50,11 +51,11 @@ class Work(Document):
         #: Date and time work was requested.
         self.requestDateTime = requestDateTime
 
-        self._Designs = []
-        self.Designs = [] if Designs is None else Designs
+        if Designs is not None:
+            self.Designs = Designs
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
         self._ErpProjectAccounting = None
         self.ErpProjectAccounting = ErpProjectAccounting
@@ -62,11 +63,11 @@ class Work(Document):
         self._Project = None
         self.Project = Project
 
-        self._WorkFlowSteps = []
-        self.WorkFlowSteps = [] if WorkFlowSteps is None else WorkFlowSteps
+        if WorkFlowSteps is not None:
+            self.WorkFlowSteps = WorkFlowSteps
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
         self._BusinessCase = None
         self.BusinessCase = BusinessCase
@@ -77,8 +78,8 @@ class Work(Document):
         self._Request = None
         self.Request = Request
 
-        self._Customers = []
-        self.Customers = [] if Customers is None else Customers
+        if Customers is not None:
+            self.Customers = Customers
 
         super(Work, self).__init__(*args, **kw_args)
 
@@ -88,13 +89,15 @@ class Work(Document):
     _enums = {"kind": "WorkKind"}
     _refs = ["Designs", "WorkCostDetails", "ErpProjectAccounting", "Project", "WorkFlowSteps", "WorkTasks", "BusinessCase", "WorkBillingInfo", "Request", "Customers"]
     _many_refs = ["Designs", "WorkCostDetails", "WorkFlowSteps", "WorkTasks", "Customers"]
+    _inverses = {"Designs": "Work", "WorkCostDetails": "Works", "ErpProjectAccounting": "Works", "Project": "Works", "WorkFlowSteps": "Work", "WorkTasks": "Work", "BusinessCase": "Works", "WorkBillingInfo": "Works", "Request": "Works", "Customers": "Works"}
 
     def getDesigns(self):
         
         return self._Designs
 
     def setDesigns(self, value):
-        for x in self._Designs:
+        value = RefList(value)
+        for x in list(self._Designs):
             x.Work = None
         for y in value:
             y._Work = self
@@ -116,20 +119,19 @@ class Work(Document):
 
     def setWorkCostDetails(self, value):
         for p in self._WorkCostDetails:
-            filtered = [q for q in p.Works if q != self]
-            self._WorkCostDetails._Works = filtered
+            p._Works.discard(self)
         for r in value:
             if self not in r._Works:
-                r._Works.append(self)
-        self._WorkCostDetails = value
+                r._reflist("_Works").append(self)
+        self._WorkCostDetails = RefList(value)
 
     WorkCostDetails = property(getWorkCostDetails, setWorkCostDetails)
 
     def addWorkCostDetails(self, *WorkCostDetails):
         for obj in WorkCostDetails:
             if self not in obj._Works:
-                obj._Works.append(self)
-            self._WorkCostDetails.append(obj)
+                obj._reflist("_Works").append(self)
+            self._reflist("_WorkCostDetails").append(obj)
 
     def removeWorkCostDetails(self, *WorkCostDetails):
         for obj in WorkCostDetails:
@@ -143,13 +145,12 @@ class Work(Document):
 
     def setErpProjectAccounting(self, value):
         if self._ErpProjectAccounting is not None:
-            filtered = [x for x in self.ErpProjectAccounting.Works if x != self]
-            self._ErpProjectAccounting._Works = filtered
+            self._ErpProjectAccounting._Works.discard(self)
 
         self._ErpProjectAccounting = value
         if self._ErpProjectAccounting is not None:
             if self not in self._ErpProjectAccounting._Works:
-                self._ErpProjectAccounting._Works.append(self)
+                self._ErpProjectAccounting._reflist("_Works").append(self)
 
     ErpProjectAccounting = property(getErpProjectAccounting, setErpProjectAccounting)
 
@@ -159,13 +160,12 @@ class Work(Document):
 
     def setProject(self, value):
         if self._Project is not None:
-            filtered = [x for x in self.Project.Works if x != self]
-            self._Project._Works = filtered
+            self._Project._Works.discard(self)
 
         self._Project = value
         if self._Project is not None:
             if self not in self._Project._Works:
-                self._Project._Works.append(self)
+                self._Project._reflist("_Works").append(self)
 
     Project = property(getProject, setProject)
 
@@ -174,7 +174,8 @@ class Work(Document):
         return self._WorkFlowSteps
 
     def setWorkFlowSteps(self, value):
-        for x in self._WorkFlowSteps:
+        value = RefList(value)
+        for x in list(self._WorkFlowSteps):
             x.Work = None
         for y in value:
             y._Work = self
@@ -195,7 +196,8 @@ class Work(Document):
         return self._WorkTasks
 
     def setWorkTasks(self, value):
-        for x in self._WorkTasks:
+        value = RefList(value)
+        for x in list(self._WorkTasks):
             x.Work = None
         for y in value:
             y._Work = self
@@ -217,13 +219,12 @@ class Work(Document):
 
     def setBusinessCase(self, value):
         if self._BusinessCase is not None:
-            filtered = [x for x in self.BusinessCase.Works if x != self]
-            self._BusinessCase._Works = filtered
+            self._BusinessCase._Works.discard(self)
 
         self._BusinessCase = value
         if self._BusinessCase is not None:
             if self not in self._BusinessCase._Works:
-                self._BusinessCase._Works.append(self)
+                self._BusinessCase._reflist("_Works").append(self)
 
     BusinessCase = property(getBusinessCase, setBusinessCase)
 
@@ -233,13 +234,12 @@ class Work(Document):
 
     def setWorkBillingInfo(self, value):
         if self._WorkBillingInfo is not None:
-            filtered = [x for x in self.WorkBillingInfo.Works if x != self]
-            self._WorkBillingInfo._Works = filtered
+            self._WorkBillingInfo._Works.discard(self)
 
         self._WorkBillingInfo = value
         if self._WorkBillingInfo is not None:
             if self not in self._WorkBillingInfo._Works:
-                self._WorkBillingInfo._Works.append(self)
+                self._WorkBillingInfo._reflist("_Works").append(self)
 
     WorkBillingInfo = property(getWorkBillingInfo, setWorkBillingInfo)
 
@@ -249,13 +249,12 @@ class Work(Document):
 
     def setRequest(self, value):
         if self._Request is not None:
-            filtered = [x for x in self.Request.Works if x != self]
-            self._Request._Works = filtered
+            self._Request._Works.discard(self)
 
         self._Request = value
         if self._Request is not None:
             if self not in self._Request._Works:
-                self._Request._Works.append(self)
+                self._Request._reflist("_Works").append(self)
 
     Request = property(getRequest, setRequest)
 
@@ -266,20 +265,19 @@ class Work(Document):
 
     def setCustomers(self, value):
         for p in self._Customers:
-            filtered = [q for q in p.Works if q != self]
-            self._Customers._Works = filtered
+            p._Works.discard(self)
         for r in value:
             if self not in r._Works:
-                r._Works.append(self)
-        self._Customers = value
+                r._reflist("_Works").append(self)
+        self._Customers = RefList(value)
 
     Customers = property(getCustomers, setCustomers)
 
     def addCustomers(self, *Customers):
         for obj in Customers:
             if self not in obj._Works:
-                obj._Works.append(self)
-            self._Customers.append(obj)
+                obj._reflist("_Works").append(self)
+            self._reflist("_Customers").append(obj)
 
     def removeCustomers(self, *Customers):
         for obj in Customers:
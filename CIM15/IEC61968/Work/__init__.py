@@ -21,7 +21,8 @@
 """This package contains the core information classes that support work management and network extension planning applications.
 """
 
-from CIM15.IEC61968.Work.Work import Work
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Work"
 nsPrefix = "cimWork"
@@ -31,3 +32,8 @@ class WorkKind(str):
     """Values are: disconnect, other, reconnect, construction, service, meter, inspection, maintenance
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Work",
+])
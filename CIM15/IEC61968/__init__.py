@@ -21,8 +21,22 @@
 """This package is an extension of the Metering package and contains the information classes that support specialised applications such as prepayment metering. These classes are generally associated with the collection and control of revenue from the customer for a delivered service.
 """
 
-from CIM15.IEC61968.IEC61968CIMVersion import IEC61968CIMVersion
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#IEC61968"
 nsPrefix = "cimIEC61968"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "IEC61968CIMVersion",
+], [
+    "AssetModels",
+    "Assets",
+    "Common",
+    "Customers",
+    "LoadControl",
+    "Metering",
+    "PaymentMetering",
+    "Work",
+])
@@ -40,6 +40,7 @@ class AuxiliaryEquipment(Equipment):
     _enums = {}
     _refs = ["Terminal"]
     _many_refs = []
+    _inverses = {"Terminal": "AuxiliaryEquipment"}
 
     def getTerminal(self):
         """The Terminal at the equipment where the AuxiliaryEquipment is attached.
@@ -48,13 +49,12 @@ class AuxiliaryEquipment(Equipment):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.AuxiliaryEquipment if x != self]
-            self._Terminal._AuxiliaryEquipment = filtered
+            self._Terminal._AuxiliaryEquipment.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._AuxiliaryEquipment:
-                self._Terminal._AuxiliaryEquipment.append(self)
+                self._Terminal._reflist("_AuxiliaryEquipment").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
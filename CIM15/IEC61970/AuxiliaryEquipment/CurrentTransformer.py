@@ -64,6 +64,7 @@ class CurrentTransformer(Sensor):
     _enums = {}
     _refs = ["CTInfo"]
     _many_refs = []
+    _inverses = {"CTInfo": "CTs"}
 
     def getCTInfo(self):
         """Current transformer data.
@@ -72,13 +73,12 @@ class CurrentTransformer(Sensor):
 
     def setCTInfo(self, value):
         if self._CTInfo is not None:
-            filtered = [x for x in self.CTInfo.CTs if x != self]
-            self._CTInfo._CTs = filtered
+            self._CTInfo._CTs.discard(self)
 
         self._CTInfo = value
         if self._CTInfo is not None:
             if self not in self._CTInfo._CTs:
-                self._CTInfo._CTs.append(self)
+                self._CTInfo._reflist("_CTs").append(self)
 
     CTInfo = property(getCTInfo, setCTInfo)
 
@@ -40,6 +40,7 @@ class FaultIndicator(AuxiliaryEquipment):
     _enums = {}
     _refs = ["FaultIndicatorInfo"]
     _many_refs = []
+    _inverses = {"FaultIndicatorInfo": "FaultIndicators"}
 
     def getFaultIndicatorInfo(self):
         """Fault indicator data.
@@ -48,13 +49,12 @@ class FaultIndicator(AuxiliaryEquipment):
 
     def setFaultIndicatorInfo(self, value):
         if self._FaultIndicatorInfo is not None:
-            filtered = [x for x in self.FaultIndicatorInfo.FaultIndicators if x != self]
-            self._FaultIndicatorInfo._FaultIndicators = filtered
+            self._FaultIndicatorInfo._FaultIndicators.discard(self)
 
         self._FaultIndicatorInfo = value
         if self._FaultIndicatorInfo is not None:
             if self not in self._FaultIndicatorInfo._FaultIndicators:
-                self._FaultIndicatorInfo._FaultIndicators.append(self)
+                self._FaultIndicatorInfo._reflist("_FaultIndicators").append(self)
 
     FaultIndicatorInfo = property(getFaultIndicatorInfo, setFaultIndicatorInfo)
 
@@ -52,6 +52,7 @@ class PotentialTransformer(Sensor):
     _enums = {}
     _refs = ["PTInfo"]
     _many_refs = []
+    _inverses = {"PTInfo": "PTs"}
 
     def getPTInfo(self):
         """Potential (voltage) transformer data.
@@ -60,13 +61,12 @@ class PotentialTransformer(Sensor):
 
     def setPTInfo(self, value):
         if self._PTInfo is not None:
-            filtered = [x for x in self.PTInfo.PTs if x != self]
-            self._PTInfo._PTs = filtered
+            self._PTInfo._PTs.discard(self)
 
         self._PTInfo = value
         if self._PTInfo is not None:
             if self not in self._PTInfo._PTs:
-                self._PTInfo._PTs.append(self)
+                self._PTInfo._reflist("_PTs").append(self)
 
     PTInfo = property(getPTInfo, setPTInfo)
 
@@ -36,4 +36,5 @@ class Sensor(AuxiliaryEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
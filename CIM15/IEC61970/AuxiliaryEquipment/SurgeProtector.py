@@ -40,6 +40,7 @@ class SurgeProtector(AuxiliaryEquipment):
     _enums = {}
     _refs = ["SurgeProtectorInfo"]
     _many_refs = []
+    _inverses = {"SurgeProtectorInfo": "SurgeProtectors"}
 
     def getSurgeProtectorInfo(self):
         """Surge protector data.
@@ -48,13 +49,12 @@ class SurgeProtector(AuxiliaryEquipment):
 
     def setSurgeProtectorInfo(self, value):
         if self._SurgeProtectorInfo is not None:
-            filtered = [x for x in self.SurgeProtectorInfo.SurgeProtectors if x != self]
-            self._SurgeProtectorInfo._SurgeProtectors = filtered
+            self._SurgeProtectorInfo._SurgeProtectors.discard(self)
 
         self._SurgeProtectorInfo = value
         if self._SurgeProtectorInfo is not None:
             if self not in self._SurgeProtectorInfo._SurgeProtectors:
-                self._SurgeProtectorInfo._SurgeProtectors.append(self)
+                self._SurgeProtectorInfo._reflist("_SurgeProtectors").append(self)
 
     SurgeProtectorInfo = property(getSurgeProtectorInfo, setSurgeProtectorInfo)
 
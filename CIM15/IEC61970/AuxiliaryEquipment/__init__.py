@@ -19,13 +19,18 @@
 # IN THE SOFTWARE.
 
 
-from CIM15.IEC61970.AuxiliaryEquipment.PotentialTransformer import PotentialTransformer
-from CIM15.IEC61970.AuxiliaryEquipment.Sensor import Sensor
-from CIM15.IEC61970.AuxiliaryEquipment.AuxiliaryEquipment import AuxiliaryEquipment
-from CIM15.IEC61970.AuxiliaryEquipment.CurrentTransformer import CurrentTransformer
-from CIM15.IEC61970.AuxiliaryEquipment.SurgeProtector import SurgeProtector
-from CIM15.IEC61970.AuxiliaryEquipment.FaultIndicator import FaultIndicator
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#AuxiliaryEquipment"
 nsPrefix = "cimAuxiliaryEquipment"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "PotentialTransformer",
+    "Sensor",
+    "AuxiliaryEquipment",
+    "CurrentTransformer",
+    "SurgeProtector",
+    "FaultIndicator",
+])
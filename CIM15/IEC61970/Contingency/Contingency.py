@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Contingency(IdentifiedObject):
     """An event threatening system reliability, consisting of one or more contingency elements.An event threatening system reliability, consisting of one or more contingency elements.
@@ -33,8 +34,8 @@ class Contingency(IdentifiedObject):
         #: Set true if must study this contingency.
         self.mustStudy = mustStudy
 
-        self._ContingencyElement = []
-        self.ContingencyElement = [] if ContingencyElement is None else ContingencyElement
+        if ContingencyElement is not None:
+            self.ContingencyElement = ContingencyElement
 
         super(Contingency, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class Contingency(IdentifiedObject):
     _enums = {}
     _refs = ["ContingencyElement"]
     _many_refs = ["ContingencyElement"]
+    _inverses = {"ContingencyElement": "Contingency"}
 
     def getContingencyElement(self):
         """A contingency can have any number of contingency elements.
@@ -51,7 +53,8 @@ class Contingency(IdentifiedObject):
         return self._ContingencyElement
 
     def setContingencyElement(self, value):
-        for x in self._ContingencyElement:
+        value = RefList(value)
+        for x in list(self._ContingencyElement):
             x.Contingency = None
         for y in value:
             y._Contingency = self
@@ -44,6 +44,7 @@ class ContingencyEquipment(ContingencyElement):
     _enums = {"contingentStatus": "ContingencyEquipmentStatusKind"}
     _refs = ["Equipment"]
     _many_refs = []
+    _inverses = {"Equipment": "ContingencyEquipment"}
 
     def getEquipment(self):
         """The single piece of equipment to which to apply the contingency.
@@ -52,13 +53,12 @@ class ContingencyEquipment(ContingencyElement):
 
     def setEquipment(self, value):
         if self._Equipment is not None:
-            filtered = [x for x in self.Equipment.ContingencyEquipment if x != self]
-            self._Equipment._ContingencyEquipment = filtered
+            self._Equipment._ContingencyEquipment.discard(self)
 
         self._Equipment = value
         if self._Equipment is not None:
             if self not in self._Equipment._ContingencyEquipment:
-                self._Equipment._ContingencyEquipment.append(self)
+                self._Equipment._reflist("_ContingencyEquipment").append(self)
 
     Equipment = property(getEquipment, setEquipment)
 
@@ -21,9 +21,8 @@
 """Contingencies to be studied.
 """
 
-from CIM15.IEC61970.Contingency.ContingencyEquipment import ContingencyEquipment
-from CIM15.IEC61970.Contingency.Contingency import Contingency
-from CIM15.IEC61970.Contingency.ContingencyElement import ContingencyElement
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Contingency"
 nsPrefix = "cimContingency"
@@ -33,3 +32,10 @@ class ContingencyEquipmentStatusKind(str):
     """Values are: outOfService, inService
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ContingencyEquipment",
+    "Contingency",
+    "ContingencyElement",
+])
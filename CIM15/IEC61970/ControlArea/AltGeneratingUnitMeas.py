@@ -48,6 +48,7 @@ class AltGeneratingUnitMeas(Element):
     _enums = {}
     _refs = ["AnalogValue", "ControlAreaGeneratingUnit"]
     _many_refs = []
+    _inverses = {"AnalogValue": "AltGeneratingUnit", "ControlAreaGeneratingUnit": "AltGeneratingUnitMeas"}
 
     def getAnalogValue(self):
         """The specific analog value used as a source.
@@ -56,13 +57,12 @@ class AltGeneratingUnitMeas(Element):
 
     def setAnalogValue(self, value):
         if self._AnalogValue is not None:
-            filtered = [x for x in self.AnalogValue.AltGeneratingUnit if x != self]
-            self._AnalogValue._AltGeneratingUnit = filtered
+            self._AnalogValue._AltGeneratingUnit.discard(self)
 
         self._AnalogValue = value
         if self._AnalogValue is not None:
             if self not in self._AnalogValue._AltGeneratingUnit:
-                self._AnalogValue._AltGeneratingUnit.append(self)
+                self._AnalogValue._reflist("_AltGeneratingUnit").append(self)
 
     AnalogValue = property(getAnalogValue, setAnalogValue)
 
@@ -73,13 +73,12 @@ class AltGeneratingUnitMeas(Element):
 
     def setControlAreaGeneratingUnit(self, value):
         if self._ControlAreaGeneratingUnit is not None:
-            filtered = [x for x in self.ControlAreaGeneratingUnit.AltGeneratingUnitMeas if x != self]
-            self._ControlAreaGeneratingUnit._AltGeneratingUnitMeas = filtered
+            self._ControlAreaGeneratingUnit._AltGeneratingUnitMeas.discard(self)
 
         self._ControlAreaGeneratingUnit = value
         if self._ControlAreaGeneratingUnit is not None:
             if self not in self._ControlAreaGeneratingUnit._AltGeneratingUnitMeas:
-                self._ControlAreaGeneratingUnit._AltGeneratingUnitMeas.append(self)
+                self._ControlAreaGeneratingUnit._reflist("_AltGeneratingUnitMeas").append(self)
 
     ControlAreaGeneratingUnit = property(getControlAreaGeneratingUnit, setControlAreaGeneratingUnit)
 
@@ -48,6 +48,7 @@ class AltTieMeas(Element):
     _enums = {}
     _refs = ["AnalogValue", "TieFlow"]
     _many_refs = []
+    _inverses = {"AnalogValue": "AltTieMeas", "TieFlow": "AltTieMeas"}
 
     def getAnalogValue(self):
         """The specific analog value used as a source.
@@ -56,13 +57,12 @@ class AltTieMeas(Element):
 
     def setAnalogValue(self, value):
         if self._AnalogValue is not None:
-            filtered = [x for x in self.AnalogValue.AltTieMeas if x != self]
-            self._AnalogValue._AltTieMeas = filtered
+            self._AnalogValue._AltTieMeas.discard(self)
 
         self._AnalogValue = value
         if self._AnalogValue is not None:
             if self not in self._AnalogValue._AltTieMeas:
-                self._AnalogValue._AltTieMeas.append(self)
+                self._AnalogValue._reflist("_AltTieMeas").append(self)
 
     AnalogValue = property(getAnalogValue, setAnalogValue)
 
@@ -73,13 +73,12 @@ class AltTieMeas(Element):
 
     def setTieFlow(self, value):
         if self._TieFlow is not None:
-            filtered = [x for x in self.TieFlow.AltTieMeas if x != self]
-            self._TieFlow._AltTieMeas = filtered
+            self._TieFlow._AltTieMeas.discard(self)
 
         self._TieFlow = value
         if self._TieFlow is not None:
             if self not in self._TieFlow._AltTieMeas:
-                self._TieFlow._AltTieMeas.append(self)
+                self._TieFlow._reflist("_AltTieMeas").append(self)
 
     TieFlow = property(getTieFlow, setTieFlow)
 
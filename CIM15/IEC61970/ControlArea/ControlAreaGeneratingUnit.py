@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, RefList
 
 class ControlAreaGeneratingUnit(Element):
     """A control area generating unit. This class is needed so that alternate control area definitions may include the same generating unit.   Note only one instance within a control area should reference a specific generating unit.A control area generating unit. This class is needed so that alternate control area definitions may include the same generating unit.   Note only one instance within a control area should reference a specific generating unit.
@@ -31,8 +31,8 @@ class ControlAreaGeneratingUnit(Element):
         @param GeneratingUnit: The generating unit specified for this control area.  Note that a control area should include a GeneratingUnit only once.
         @param ControlArea: The parent control area for the generating unit specifications.
         """
-        self._AltGeneratingUnitMeas = []
-        self.AltGeneratingUnitMeas = [] if AltGeneratingUnitMeas is None else AltGeneratingUnitMeas
+        if AltGeneratingUnitMeas is not None:
+            self.AltGeneratingUnitMeas = AltGeneratingUnitMeas
 
         self._GeneratingUnit = None
         self.GeneratingUnit = GeneratingUnit
@@ -48,6 +48,7 @@ class ControlAreaGeneratingUnit(Element):
     _enums = {}
     _refs = ["AltGeneratingUnitMeas", "GeneratingUnit", "ControlArea"]
     _many_refs = ["AltGeneratingUnitMeas"]
+    _inverses = {"AltGeneratingUnitMeas": "ControlAreaGeneratingUnit", "GeneratingUnit": "ControlAreaGeneratingUnit", "ControlArea": "ControlAreaGeneratingUnit"}
 
     def getAltGeneratingUnitMeas(self):
         """The link to prioritized measurements for this GeneratingUnit.
@@ -55,7 +56,8 @@ class ControlAreaGeneratingUnit(Element):
         return self._AltGeneratingUnitMeas
 
     def setAltGeneratingUnitMeas(self, value):
-        for x in self._AltGeneratingUnitMeas:
+        value = RefList(value)
+        for x in list(self._AltGeneratingUnitMeas):
             x.ControlAreaGeneratingUnit = None
         for y in value:
             y._ControlAreaGeneratingUnit = self
@@ -78,13 +80,12 @@ class ControlAreaGeneratingUnit(Element):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.ControlAreaGeneratingUnit if x != self]
-            self._GeneratingUnit._ControlAreaGeneratingUnit = filtered
+            self._GeneratingUnit._ControlAreaGeneratingUnit.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
             if self not in self._GeneratingUnit._ControlAreaGeneratingUnit:
-                self._GeneratingUnit._ControlAreaGeneratingUnit.append(self)
+                self._GeneratingUnit._reflist("_ControlAreaGeneratingUnit").append(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
@@ -95,13 +96,12 @@ class ControlAreaGeneratingUnit(Element):
 
     def setControlArea(self, value):
         if self._ControlArea is not None:
-            filtered = [x for x in self.ControlArea.ControlAreaGeneratingUnit if x != self]
-            self._ControlArea._ControlAreaGeneratingUnit = filtered
+            self._ControlArea._ControlAreaGeneratingUnit.discard(self)
 
         self._ControlArea = value
         if self._ControlArea is not None:
             if self not in self._ControlArea._ControlAreaGeneratingUnit:
-                self._ControlArea._ControlAreaGeneratingUnit.append(self)
+                self._ControlArea._reflist("_ControlAreaGeneratingUnit").append(self)
 
     ControlArea = property(getControlArea, setControlArea)
 
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, RefList
 
 class TieFlow(Element):
     """A flow specification in terms of location and direction for a control area.A flow specification in terms of location and direction for a control area.
@@ -35,8 +35,8 @@ class TieFlow(Element):
         #: The flow is positive into the terminal.  A flow is positive if it is an import into the control area.
         self.positiveFlowIn = positiveFlowIn
 
-        self._AltTieMeas = []
-        self.AltTieMeas = [] if AltTieMeas is None else AltTieMeas
+        if AltTieMeas is not None:
+            self.AltTieMeas = AltTieMeas
 
         self._Terminal = None
         self.Terminal = Terminal
@@ -52,6 +52,7 @@ class TieFlow(Element):
     _enums = {}
     _refs = ["AltTieMeas", "Terminal", "ControlArea"]
     _many_refs = ["AltTieMeas"]
+    _inverses = {"AltTieMeas": "TieFlow", "Terminal": "TieFlow", "ControlArea": "TieFlow"}
 
     def getAltTieMeas(self):
         """The primary and alternate tie flow measurements associated with the tie flow.
@@ -59,7 +60,8 @@ class TieFlow(Element):
         return self._AltTieMeas
 
     def setAltTieMeas(self, value):
-        for x in self._AltTieMeas:
+        value = RefList(value)
+        for x in list(self._AltTieMeas):
             x.TieFlow = None
         for y in value:
             y._TieFlow = self
@@ -82,13 +84,12 @@ class TieFlow(Element):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.TieFlow if x != self]
-            self._Terminal._TieFlow = filtered
+            self._Terminal._TieFlow.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._TieFlow:
-                self._Terminal._TieFlow.append(self)
+                self._Terminal._reflist("_TieFlow").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -99,13 +100,12 @@ class TieFlow(Element):
 
     def setControlArea(self, value):
         if self._ControlArea is not None:
-            filtered = [x for x in self.ControlArea.TieFlow if x != self]
-            self._ControlArea._TieFlow = filtered
+            self._ControlArea._TieFlow.discard(self)
 
         self._ControlArea = value
         if self._ControlArea is not None:
             if self not in self._ControlArea._TieFlow:
-                self._ControlArea._TieFlow.append(self)
+                self._ControlArea._reflist("_TieFlow").append(self)
 
     ControlArea = property(getControlArea, setControlArea)
 
@@ -21,11 +21,8 @@
 """The ControlArea package models area specifications which can be used for a variety of purposes.  The package as a whole models potentially overlapping control area specifications for the purpose of actual generation control, load forecast area load capture, or powerflow based analysis.
 """
 
-from CIM15.IEC61970.ControlArea.AltTieMeas import AltTieMeas
-from CIM15.IEC61970.ControlArea.AltGeneratingUnitMeas import AltGeneratingUnitMeas
-from CIM15.IEC61970.ControlArea.TieFlow import TieFlow
-from CIM15.IEC61970.ControlArea.ControlArea import ControlArea
-from CIM15.IEC61970.ControlArea.ControlAreaGeneratingUnit import ControlAreaGeneratingUnit
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#ControlArea"
 nsPrefix = "cimControlArea"
@@ -35,3 +32,12 @@ class ControlAreaTypeKind(str):
     """Values are: Forecast, AGC, Interchange
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "AltTieMeas",
+    "AltGeneratingUnitMeas",
+    "TieFlow",
+    "ControlArea",
+    "ControlAreaGeneratingUnit",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class BaseVoltage(IdentifiedObject):
     """Defines a nominal base voltage which is referenced in the system.Defines a nominal base voltage which is referenced in the system.
@@ -39,14 +40,14 @@ class BaseVoltage(IdentifiedObject):
         #: If true, this is a direct current base voltage and items assigned to this base voltage are also associated with a direct current capabilities.   False indicates alternating current.
         self.isDC = isDC
 
-        self._TopologicalNode = []
-        self.TopologicalNode = [] if TopologicalNode is None else TopologicalNode
+        if TopologicalNode is not None:
+            self.TopologicalNode = TopologicalNode
 
-        self._VoltageLevel = []
-        self.VoltageLevel = [] if VoltageLevel is None else VoltageLevel
+        if VoltageLevel is not None:
+            self.VoltageLevel = VoltageLevel
 
-        self._ConductingEquipment = []
-        self.ConductingEquipment = [] if ConductingEquipment is None else ConductingEquipment
+        if ConductingEquipment is not None:
+            self.ConductingEquipment = ConductingEquipment
 
         super(BaseVoltage, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class BaseVoltage(IdentifiedObject):
     _enums = {}
     _refs = ["TopologicalNode", "VoltageLevel", "ConductingEquipment"]
     _many_refs = ["TopologicalNode", "VoltageLevel", "ConductingEquipment"]
+    _inverses = {"TopologicalNode": "BaseVoltage", "VoltageLevel": "BaseVoltage", "ConductingEquipment": "BaseVoltage"}
 
     def getTopologicalNode(self):
         """The topological nodes at the base voltage.
@@ -63,7 +65,8 @@ class BaseVoltage(IdentifiedObject):
         return self._TopologicalNode
 
     def setTopologicalNode(self, value):
-        for x in self._TopologicalNode:
+        value = RefList(value)
+        for x in list(self._TopologicalNode):
             x.BaseVoltage = None
         for y in value:
             y._BaseVoltage = self
@@ -85,7 +88,8 @@ class BaseVoltage(IdentifiedObject):
         return self._VoltageLevel
 
     def setVoltageLevel(self, value):
-        for x in self._VoltageLevel:
+        value = RefList(value)
+        for x in list(self._VoltageLevel):
             x.BaseVoltage = None
         for y in value:
             y._BaseVoltage = self
@@ -107,7 +111,8 @@ class BaseVoltage(IdentifiedObject):
         return self._ConductingEquipment
 
     def setConductingEquipment(self, value):
-        for x in self._ConductingEquipment:
+        value = RefList(value)
+        for x in list(self._ConductingEquipment):
             x.BaseVoltage = None
         for y in value:
             y._BaseVoltage = self
@@ -56,4 +56,5 @@ class BasicIntervalSchedule(IdentifiedObject):
     _enums = {"value1Multiplier": "UnitMultiplier", "value2Unit": "UnitSymbol", "value1Unit": "UnitSymbol", "value2Multiplier": "UnitMultiplier"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
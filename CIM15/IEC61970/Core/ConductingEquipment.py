@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Equipment import Equipment
+from CIM15.Element import RefList
 
 class ConductingEquipment(Equipment):
     """The parts of the power system that are designed to carry current or that are conductively connected therewith. ConductingEquipment is contained within an EquipmentContainer that may be a Substation, or a VoltageLevel or a Bay within a Substation.The parts of the power system that are designed to carry current or that are conductively connected therewith. ConductingEquipment is contained within an EquipmentContainer that may be a Substation, or a VoltageLevel or a Bay within a Substation.
@@ -37,17 +38,17 @@ class ConductingEquipment(Equipment):
         self._BaseVoltage = None
         self.BaseVoltage = BaseVoltage
 
-        self._ClearanceTags = []
-        self.ClearanceTags = [] if ClearanceTags is None else ClearanceTags
+        if ClearanceTags is not None:
+            self.ClearanceTags = ClearanceTags
 
-        self._ProtectionEquipments = []
-        self.ProtectionEquipments = [] if ProtectionEquipments is None else ProtectionEquipments
+        if ProtectionEquipments is not None:
+            self.ProtectionEquipments = ProtectionEquipments
 
-        self._Terminals = []
-        self.Terminals = [] if Terminals is None else Terminals
+        if Terminals is not None:
+            self.Terminals = Terminals
 
-        self._OutageStepRoles = []
-        self.OutageStepRoles = [] if OutageStepRoles is None else OutageStepRoles
+        if OutageStepRoles is not None:
+            self.OutageStepRoles = OutageStepRoles
 
         self._SvStatus = None
         self.SvStatus = SvStatus
@@ -60,6 +61,7 @@ class ConductingEquipment(Equipment):
     _enums = {}
     _refs = ["BaseVoltage", "ClearanceTags", "ProtectionEquipments", "Terminals", "OutageStepRoles", "SvStatus"]
     _many_refs = ["ClearanceTags", "ProtectionEquipments", "Terminals", "OutageStepRoles"]
+    _inverses = {"BaseVoltage": "ConductingEquipment", "ClearanceTags": "ConductingEquipment", "ProtectionEquipments": "ConductingEquipments", "Terminals": "ConductingEquipment", "OutageStepRoles": "ConductingEquipment", "SvStatus": "ConductingEquipment"}
 
     def getBaseVoltage(self):
         """Use association to ConductingEquipment only when there is no VoltageLevel container used.
@@ -68,13 +70,12 @@ class ConductingEquipment(Equipment):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.ConductingEquipment if x != self]
-            self._BaseVoltage._ConductingEquipment = filtered
+            self._BaseVoltage._ConductingEquipment.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
             if self not in self._BaseVoltage._ConductingEquipment:
-                self._BaseVoltage._ConductingEquipment.append(self)
+                self._BaseVoltage._reflist("_ConductingEquipment").append(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
@@ -84,7 +85,8 @@ class ConductingEquipment(Equipment):
         return self._ClearanceTags
 
     def setClearanceTags(self, value):
-        for x in self._ClearanceTags:
+        value = RefList(value)
+        for x in list(self._ClearanceTags):
             x.ConductingEquipment = None
         for y in value:
             y._ConductingEquipment = self
@@ -107,20 +109,19 @@ class ConductingEquipment(Equipment):
 
     def setProtectionEquipments(self, value):
         for p in self._ProtectionEquipments:
-            filtered = [q for q in p.ConductingEquipments if q != self]
-            self._ProtectionEquipments._ConductingEquipments = filtered
+            p._ConductingEquipments.discard(self)
         for r in value:
             if self not in r._ConductingEquipments:
-                r._ConductingEquipments.append(self)
-        self._ProtectionEquipments = value
+                r._reflist("_ConductingEquipments").append(self)
+        self._ProtectionEquipments = RefList(value)
 
     ProtectionEquipments = property(getProtectionEquipments, setProtectionEquipments)
 
     def addProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
             if self not in obj._ConductingEquipments:
-                obj._ConductingEquipments.append(self)
-            self._ProtectionEquipments.append(obj)
+                obj._reflist("_ConductingEquipments").append(self)
+            self._reflist("_ProtectionEquipments").append(obj)
 
     def removeProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
@@ -134,7 +135,8 @@ class ConductingEquipment(Equipment):
         return self._Terminals
 
     def setTerminals(self, value):
-        for x in self._Terminals:
+        value = RefList(value)
+        for x in list(self._Terminals):
             x.ConductingEquipment = None
         for y in value:
             y._ConductingEquipment = self
@@ -155,7 +157,8 @@ class ConductingEquipment(Equipment):
         return self._OutageStepRoles
 
     def setOutageStepRoles(self, value):
-        for x in self._OutageStepRoles:
+        value = RefList(value)
+        for x in list(self._OutageStepRoles):
             x.ConductingEquipment = None
         for y in value:
             y._ConductingEquipment = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import RefList
 
 class ConnectivityNodeContainer(PowerSystemResource):
     """A base class for all objects that may contain ConnectivityNodes or TopologicalNodes.A base class for all objects that may contain ConnectivityNodes or TopologicalNodes.
@@ -30,11 +31,11 @@ class ConnectivityNodeContainer(PowerSystemResource):
         @param TopologicalNode: The topological nodes which belong to this connectivity node container.
         @param ConnectivityNodes: Connectivity nodes contained by this container.
         """
-        self._TopologicalNode = []
-        self.TopologicalNode = [] if TopologicalNode is None else TopologicalNode
+        if TopologicalNode is not None:
+            self.TopologicalNode = TopologicalNode
 
-        self._ConnectivityNodes = []
-        self.ConnectivityNodes = [] if ConnectivityNodes is None else ConnectivityNodes
+        if ConnectivityNodes is not None:
+            self.ConnectivityNodes = ConnectivityNodes
 
         super(ConnectivityNodeContainer, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class ConnectivityNodeContainer(PowerSystemResource):
     _enums = {}
     _refs = ["TopologicalNode", "ConnectivityNodes"]
     _many_refs = ["TopologicalNode", "ConnectivityNodes"]
+    _inverses = {"TopologicalNode": "ConnectivityNodeContainer", "ConnectivityNodes": "ConnectivityNodeContainer"}
 
     def getTopologicalNode(self):
         """The topological nodes which belong to this connectivity node container.
@@ -51,7 +53,8 @@ class ConnectivityNodeContainer(PowerSystemResource):
         return self._TopologicalNode
 
     def setTopologicalNode(self, value):
-        for x in self._TopologicalNode:
+        value = RefList(value)
+        for x in list(self._TopologicalNode):
             x.ConnectivityNodeContainer = None
         for y in value:
             y._ConnectivityNodeContainer = self
@@ -73,7 +76,8 @@ class ConnectivityNodeContainer(PowerSystemResource):
         return self._ConnectivityNodes
 
     def setConnectivityNodes(self, value):
-        for x in self._ConnectivityNodes:
+        value = RefList(value)
+        for x in list(self._ConnectivityNodes):
             x.ConnectivityNodeContainer = None
         for y in value:
             y._ConnectivityNodeContainer = self
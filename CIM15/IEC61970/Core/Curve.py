@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Curve(IdentifiedObject):
     """A multi-purpose curve or functional relationship between an independent variable (X-axis) and dependent (Y-axis) variables.A multi-purpose curve or functional relationship between an independent variable (X-axis) and dependent (Y-axis) variables.
@@ -65,8 +66,8 @@ class Curve(IdentifiedObject):
         #: The style or shape of the curve. Values are: "formula", "constantYValue", "straightLineYValues", "rampYValue"
         self.curveStyle = curveStyle
 
-        self._CurveDatas = []
-        self.CurveDatas = [] if CurveDatas is None else CurveDatas
+        if CurveDatas is not None:
+            self.CurveDatas = CurveDatas
 
         super(Curve, self).__init__(*args, **kw_args)
 
@@ -76,6 +77,7 @@ class Curve(IdentifiedObject):
     _enums = {"xUnit": "UnitSymbol", "y1Multiplier": "UnitMultiplier", "y2Unit": "UnitSymbol", "y3Multiplier": "UnitMultiplier", "y1Unit": "UnitSymbol", "xMultiplier": "UnitMultiplier", "y3Unit": "UnitSymbol", "y2Multiplier": "UnitMultiplier", "curveStyle": "CurveStyle"}
     _refs = ["CurveDatas"]
     _many_refs = ["CurveDatas"]
+    _inverses = {"CurveDatas": "Curve"}
 
     def getCurveDatas(self):
         """The point data values that define a curve
@@ -83,7 +85,8 @@ class Curve(IdentifiedObject):
         return self._CurveDatas
 
     def setCurveDatas(self, value):
-        for x in self._CurveDatas:
+        value = RefList(value)
+        for x in list(self._CurveDatas):
             x.Curve = None
         for y in value:
             y._Curve = self
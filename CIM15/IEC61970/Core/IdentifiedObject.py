@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, RefList
 
 class IdentifiedObject(Element):
     """This is a root class to provide common identification for all classes needing identification and naming attributesThis is a root class to provide common identification for all classes needing identification and naming attributes
@@ -43,11 +43,11 @@ class IdentifiedObject(Element):
         #: The name is any free human readable and possibly non unique text naming the object.
         self.name = name
 
-        self._Names = []
-        self.Names = [] if Names is None else Names
+        if Names is not None:
+            self.Names = Names
 
-        self._DiagramObjects = []
-        self.DiagramObjects = [] if DiagramObjects is None else DiagramObjects
+        if DiagramObjects is not None:
+            self.DiagramObjects = DiagramObjects
 
         self._ModelingAuthoritySet = None
         self.ModelingAuthoritySet = ModelingAuthoritySet
@@ -60,6 +60,7 @@ class IdentifiedObject(Element):
     _enums = {}
     _refs = ["Names", "DiagramObjects", "ModelingAuthoritySet"]
     _many_refs = ["Names", "DiagramObjects"]
+    _inverses = {"Names": "IdentifiedObject", "DiagramObjects": "IdentifiedObject", "ModelingAuthoritySet": "IdentifiedObjects"}
 
     def getNames(self):
         """All names of this identified object.
@@ -67,7 +68,8 @@ class IdentifiedObject(Element):
         return self._Names
 
     def setNames(self, value):
-        for x in self._Names:
+        value = RefList(value)
+        for x in list(self._Names):
             x.IdentifiedObject = None
         for y in value:
             y._IdentifiedObject = self
@@ -89,7 +91,8 @@ class IdentifiedObject(Element):
         return self._DiagramObjects
 
     def setDiagramObjects(self, value):
-        for x in self._DiagramObjects:
+        value = RefList(value)
+        for x in list(self._DiagramObjects):
             x.IdentifiedObject = None
         for y in value:
             y._IdentifiedObject = self
@@ -112,13 +115,12 @@ class IdentifiedObject(Element):
 
     def setModelingAuthoritySet(self, value):
         if self._ModelingAuthoritySet is not None:
-            filtered = [x for x in self.ModelingAuthoritySet.IdentifiedObjects if x != self]
-            self._ModelingAuthoritySet._IdentifiedObjects = filtered
+            self._ModelingAuthoritySet._IdentifiedObjects.discard(self)
 
         self._ModelingAuthoritySet = value
         if self._ModelingAuthoritySet is not None:
             if self not in self._ModelingAuthoritySet._IdentifiedObjects:
-                self._ModelingAuthoritySet._IdentifiedObjects.append(self)
+                self._ModelingAuthoritySet._reflist("_IdentifiedObjects").append(self)
 
     ModelingAuthoritySet = property(getModelingAuthoritySet, setModelingAuthoritySet)
 
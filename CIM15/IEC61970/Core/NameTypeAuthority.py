@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, RefList
 
 class NameTypeAuthority(Element):
     """Authority responsible for creation and management of names of a given type; typically an organization or an enterprise system.Authority responsible for creation and management of names of a given type; typically an organization or an enterprise system.
@@ -37,8 +37,8 @@ class NameTypeAuthority(Element):
         #: Description of the name type authority.
         self.description = description
 
-        self._NameTypes = []
-        self.NameTypes = [] if NameTypes is None else NameTypes
+        if NameTypes is not None:
+            self.NameTypes = NameTypes
 
         super(NameTypeAuthority, self).__init__(*args, **kw_args)
 
@@ -48,6 +48,7 @@ class NameTypeAuthority(Element):
     _enums = {}
     _refs = ["NameTypes"]
     _many_refs = ["NameTypes"]
+    _inverses = {"NameTypes": "NameTypeAuthority"}
 
     def getNameTypes(self):
         """All name types managed by this authority.
@@ -55,7 +56,8 @@ class NameTypeAuthority(Element):
         return self._NameTypes
 
     def setNameTypes(self, value):
-        for x in self._NameTypes:
+        value = RefList(value)
+        for x in list(self._NameTypes):
             x.NameTypeAuthority = None
         for y in value:
             y._NameTypeAuthority = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class PowerSystemResource(IdentifiedObject):
     """A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a  Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.A power system resource can be an item of equipment such as a Switch, an EquipmentContainer containing many individual items of equipment such as a  Substation, or an organisational entity such as Company or SubControlArea.  This provides for the nesting of collections of PowerSystemResources within other PowerSystemResources. For example, a Switch could be a member of a Substation and a Substation could be a member of a division of a Company.
@@ -43,47 +44,47 @@ class PowerSystemResource(IdentifiedObject):
         @param NetworkDataSets:
         @param OutageSchedule: A power system resource may have an outage schedule
         """
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._ScheduleSteps = []
-        self.ScheduleSteps = [] if ScheduleSteps is None else ScheduleSteps
+        if ScheduleSteps is not None:
+            self.ScheduleSteps = ScheduleSteps
 
-        self._SafetyDocuments = []
-        self.SafetyDocuments = [] if SafetyDocuments is None else SafetyDocuments
+        if SafetyDocuments is not None:
+            self.SafetyDocuments = SafetyDocuments
 
-        self._OperatingShare = []
-        self.OperatingShare = [] if OperatingShare is None else OperatingShare
+        if OperatingShare is not None:
+            self.OperatingShare = OperatingShare
 
-        self._DocumentRoles = []
-        self.DocumentRoles = [] if DocumentRoles is None else DocumentRoles
+        if DocumentRoles is not None:
+            self.DocumentRoles = DocumentRoles
 
-        self._PsrLists = []
-        self.PsrLists = [] if PsrLists is None else PsrLists
+        if PsrLists is not None:
+            self.PsrLists = PsrLists
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
-        self._ReportingGroup = []
-        self.ReportingGroup = [] if ReportingGroup is None else ReportingGroup
+        if ReportingGroup is not None:
+            self.ReportingGroup = ReportingGroup
 
         self._PSRType = None
         self.PSRType = PSRType
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
-        self._ErpOrganisationRoles = []
-        self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
+        if ErpOrganisationRoles is not None:
+            self.ErpOrganisationRoles = ErpOrganisationRoles
 
         self._Location = None
         self.Location = Location
 
-        self._PSREvent = []
-        self.PSREvent = [] if PSREvent is None else PSREvent
+        if PSREvent is not None:
+            self.PSREvent = PSREvent
 
-        self._NetworkDataSets = []
-        self.NetworkDataSets = [] if NetworkDataSets is None else NetworkDataSets
+        if NetworkDataSets is not None:
+            self.NetworkDataSets = NetworkDataSets
 
         self._OutageSchedule = None
         self.OutageSchedule = OutageSchedule
@@ -96,13 +97,15 @@ class PowerSystemResource(IdentifiedObject):
     _enums = {}
     _refs = ["ChangeItems", "ScheduleSteps", "SafetyDocuments", "OperatingShare", "DocumentRoles", "PsrLists", "Measurements", "ReportingGroup", "PSRType", "Assets", "ErpOrganisationRoles", "Location", "PSREvent", "NetworkDataSets", "OutageSchedule"]
     _many_refs = ["ChangeItems", "ScheduleSteps", "SafetyDocuments", "OperatingShare", "DocumentRoles", "PsrLists", "Measurements", "ReportingGroup", "Assets", "ErpOrganisationRoles", "PSREvent", "NetworkDataSets"]
+    _inverses = {"ChangeItems": "PowerSystemResource", "ScheduleSteps": "PowerSystemResources", "SafetyDocuments": "PowerSystemResource", "OperatingShare": "PowerSystemResource", "DocumentRoles": "PowerSystemResource", "PsrLists": "PowerSystemResources", "Measurements": "PowerSystemResource", "ReportingGroup": "PowerSystemResource", "PSRType": "PowerSystemResources", "Assets": "PowerSystemResources", "ErpOrganisationRoles": "PowerSystemResource", "Location": "PowerSystemResources", "PSREvent": "PowerSystemResource", "NetworkDataSets": "PowerSystemResources", "OutageSchedule": "PowerSystemResource"}
 
     def getChangeItems(self):
         
         return self._ChangeItems
 
     def setChangeItems(self, value):
-        for x in self._ChangeItems:
+        value = RefList(value)
+        for x in list(self._ChangeItems):
             x.PowerSystemResource = None
         for y in value:
             y._PowerSystemResource = self
@@ -124,20 +127,19 @@ class PowerSystemResource(IdentifiedObject):
 
     def setScheduleSteps(self, value):
         for p in self._ScheduleSteps:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._ScheduleSteps._PowerSystemResources = filtered
+            p._PowerSystemResources.discard(self)
         for r in value:
             if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
-        self._ScheduleSteps = value
+                r._reflist("_PowerSystemResources").append(self)
+        self._ScheduleSteps = RefList(value)
 
     ScheduleSteps = property(getScheduleSteps, setScheduleSteps)
 
     def addScheduleSteps(self, *ScheduleSteps):
         for obj in ScheduleSteps:
             if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._ScheduleSteps.append(obj)
+                obj._reflist("_PowerSystemResources").append(self)
+            self._reflist("_ScheduleSteps").append(obj)
 
     def removeScheduleSteps(self, *ScheduleSteps):
         for obj in ScheduleSteps:
@@ -150,7 +152,8 @@ class PowerSystemResource(IdentifiedObject):
         return self._SafetyDocuments
 
     def setSafetyDocuments(self, value):
-        for x in self._SafetyDocuments:
+        value = RefList(value)
+        for x in list(self._SafetyDocuments):
             x.PowerSystemResource = None
         for y in value:
             y._PowerSystemResource = self
@@ -172,7 +175,8 @@ class PowerSystemResource(IdentifiedObject):
         return self._OperatingShare
 
     def setOperatingShare(self, value):
-        for x in self._OperatingShare:
+        value = RefList(value)
+        for x in list(self._OperatingShare):
             x.PowerSystemResource = None
         for y in value:
             y._PowerSystemResource = self
@@ -193,7 +197,8 @@ class PowerSystemResource(IdentifiedObject):
         return self._DocumentRoles
 
     def setDocumentRoles(self, value):
-        for x in self._DocumentRoles:
+        value = RefList(value)
+        for x in list(self._DocumentRoles):
             x.PowerSystemResource = None
         for y in value:
             y._PowerSystemResource = self
@@ -215,20 +220,19 @@ class PowerSystemResource(IdentifiedObject):
 
     def setPsrLists(self, value):
         for p in self._PsrLists:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._PsrLists._PowerSystemResources = filtered
+            p._PowerSystemResources.discard(self)
         for r in value:
             if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
-        self._PsrLists = value
+                r._reflist("_PowerSystemResources").append(self)
+        self._PsrLists = RefList(value)
 
     PsrLists = property(getPsrLists, setPsrLists)
 
     def addPsrLists(self, *PsrLists):
         for obj in PsrLists:
             if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._PsrLists.append(obj)
+                obj._reflist("_PowerSystemResources").append(self)
+            self._reflist("_PsrLists").append(obj)
 
     def removePsrLists(self, *PsrLists):
         for obj in PsrLists:
@@ -242,7 +246,8 @@ class PowerSystemResource(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
-        for x in self._Measurements:
+        value = RefList(value)
+        for x in list(self._Measurements):
             x.PowerSystemResource = None
         for y in value:
             y._PowerSystemResource = self
@@ -265,20 +270,19 @@ class PowerSystemResource(IdentifiedObject):
 
     def setReportingGroup(self, value):
         for p in self._ReportingGroup:
-            filtered = [q for q in p.PowerSystemResource if q != self]
-            self._ReportingGroup._PowerSystemResource = filtered
+            p._PowerSystemResource.discard(self)
         for r in value:
             if self not in r._PowerSystemResource:
-                r._PowerSystemResource.append(self)
-        self._ReportingGroup = value
+                r._reflist("_PowerSystemResource").append(self)
+        self._ReportingGroup = RefList(value)
 
     ReportingGroup = property(getReportingGroup, setReportingGroup)
 
     def addReportingGroup(self, *ReportingGroup):
         for obj in ReportingGroup:
             if self not in obj._PowerSystemResource:
-                obj._PowerSystemResource.append(self)
-            self._ReportingGroup.append(obj)
+                obj._reflist("_PowerSystemResource").append(self)
+            self._reflist("_ReportingGroup").append(obj)
 
     def removeReportingGroup(self, *ReportingGroup):
         for obj in ReportingGroup:
@@ -293,13 +297,12 @@ class PowerSystemResource(IdentifiedObject):
 
     def setPSRType(self, value):
         if self._PSRType is not None:
-            filtered = [x for x in self.PSRType.PowerSystemResources if x != self]
-            self._PSRType._PowerSystemResources = filtered
+            self._PSRType._PowerSystemResources.discard(self)
 
         self._PSRType = value
         if self._PSRType is not None:
             if self not in self._PSRType._PowerSystemResources:
-                self._PSRType._PowerSystemResources.append(self)
+                self._PSRType._reflist("_PowerSystemResources").append(self)
 
     PSRType = property(getPSRType, setPSRType)
 
@@ -310,20 +313,19 @@ class PowerSystemResource(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._Assets._PowerSystemResources = filtered
+            p._PowerSystemResources.discard(self)
         for r in value:
             if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
-        self._Assets = value
+                r._reflist("_PowerSystemResources").append(self)
+        self._Assets = RefList(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
             if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._Assets.append(obj)
+                obj._reflist("_PowerSystemResources").append(self)
+            self._reflist("_Assets").append(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
@@ -336,7 +338,8 @@ class PowerSystemResource(IdentifiedObject):
         return self._ErpOrganisationRoles
 
     def setErpOrganisationRoles(self, value):
-        for x in self._ErpOrganisationRoles:
+        value = RefList(value)
+        for x in list(self._ErpOrganisationRoles):
             x.PowerSystemResource = None
         for y in value:
             y._PowerSystemResource = self
@@ -359,13 +362,12 @@ class PowerSystemResource(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.PowerSystemResources if x != self]
-            self._Location._PowerSystemResources = filtered
+            self._Location._PowerSystemResources.discard(self)
 
         self._Location = value
         if self._Location is not None:
             if self not in self._Location._PowerSystemResources:
-                self._Location._PowerSystemResources.append(self)
+                self._Location._reflist("_PowerSystemResources").append(self)
 
     Location = property(getLocation, setLocation)
 
@@ -375,7 +377,8 @@ class PowerSystemResource(IdentifiedObject):
         return self._PSREvent
 
     def setPSREvent(self, value):
-        for x in self._PSREvent:
+        value = RefList(value)
+        for x in list(self._PSREvent):
             x.PowerSystemResource = None
         for y in value:
             y._PowerSystemResource = self
@@ -397,20 +400,19 @@ class PowerSystemResource(IdentifiedObject):
 
     def setNetworkDataSets(self, value):
         for p in self._NetworkDataSets:
-            filtered = [q for q in p.PowerSystemResources if q != self]
-            self._NetworkDataSets._PowerSystemResources = filtered
+            p._PowerSystemResources.discard(self)
         for r in value:
             if self not in r._PowerSystemResources:
-                r._PowerSystemResources.append(self)
-        self._NetworkDataSets = value
+                r._reflist("_PowerSystemResources").append(self)
+        self._NetworkDataSets = RefList(value)
 
     NetworkDataSets = property(getNetworkDataSets, setNetworkDataSets)
 
     def addNetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
             if self not in obj._PowerSystemResources:
-                obj._PowerSystemResources.append(self)
-            self._NetworkDataSets.append(obj)
+                obj._reflist("_PowerSystemResources").append(self)
+            self._reflist("_NetworkDataSets").append(obj)
 
     def removeNetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
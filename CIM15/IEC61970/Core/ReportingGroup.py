@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ReportingGroup(IdentifiedObject):
     """A reporting group is used for various ad-hoc groupings used for reporting.A reporting group is used for various ad-hoc groupings used for reporting.
@@ -32,17 +33,17 @@ class ReportingGroup(IdentifiedObject):
         @param TopologicalNode: The topological nodes that belong to the reporting group.
         @param PowerSystemResource: PSR's which belong to this reporting group.
         """
-        self._BusNameMarker = []
-        self.BusNameMarker = [] if BusNameMarker is None else BusNameMarker
+        if BusNameMarker is not None:
+            self.BusNameMarker = BusNameMarker
 
         self._ReportingSuperGroup = None
         self.ReportingSuperGroup = ReportingSuperGroup
 
-        self._TopologicalNode = []
-        self.TopologicalNode = [] if TopologicalNode is None else TopologicalNode
+        if TopologicalNode is not None:
+            self.TopologicalNode = TopologicalNode
 
-        self._PowerSystemResource = []
-        self.PowerSystemResource = [] if PowerSystemResource is None else PowerSystemResource
+        if PowerSystemResource is not None:
+            self.PowerSystemResource = PowerSystemResource
 
         super(ReportingGroup, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class ReportingGroup(IdentifiedObject):
     _enums = {}
     _refs = ["BusNameMarker", "ReportingSuperGroup", "TopologicalNode", "PowerSystemResource"]
     _many_refs = ["BusNameMarker", "TopologicalNode", "PowerSystemResource"]
+    _inverses = {"BusNameMarker": "ReportingGroup", "ReportingSuperGroup": "ReportingGroup", "TopologicalNode": "ReportingGroup", "PowerSystemResource": "ReportingGroup"}
 
     def getBusNameMarker(self):
         """The BusNameMarkers that belong to this reporting group.
@@ -59,7 +61,8 @@ class ReportingGroup(IdentifiedObject):
         return self._BusNameMarker
 
     def setBusNameMarker(self, value):
-        for x in self._BusNameMarker:
+        value = RefList(value)
+        for x in list(self._BusNameMarker):
             x.ReportingGroup = None
         for y in value:
             y._ReportingGroup = self
@@ -82,13 +85,12 @@ class ReportingGroup(IdentifiedObject):
 
     def setReportingSuperGroup(self, value):
         if self._ReportingSuperGroup is not None:
-            filtered = [x for x in self.ReportingSuperGroup.ReportingGroup if x != self]
-            self._ReportingSuperGroup._ReportingGroup = filtered
+            self._ReportingSuperGroup._ReportingGroup.discard(self)
 
         self._ReportingSuperGroup = value
         if self._ReportingSuperGroup is not None:
             if self not in self._ReportingSuperGroup._ReportingGroup:
-                self._ReportingSuperGroup._ReportingGroup.append(self)
+                self._ReportingSuperGroup._reflist("_ReportingGroup").append(self)
 
     ReportingSuperGroup = property(getReportingSuperGroup, setReportingSuperGroup)
 
@@ -98,7 +100,8 @@ class ReportingGroup(IdentifiedObject):
         return self._TopologicalNode
 
     def setTopologicalNode(self, value):
-        for x in self._TopologicalNode:
+        value = RefList(value)
+        for x in list(self._TopologicalNode):
             x.ReportingGroup = None
         for y in value:
             y._ReportingGroup = self
@@ -121,20 +124,19 @@ class ReportingGroup(IdentifiedObject):
 
     def setPowerSystemResource(self, value):
         for p in self._PowerSystemResource:
-            filtered = [q for q in p.ReportingGroup if q != self]
-            self._PowerSystemResource._ReportingGroup = filtered
+            p._ReportingGroup.discard(self)
         for r in value:
             if self not in r._ReportingGroup:
-                r._ReportingGroup.append(self)
-        self._PowerSystemResource = value
+                r._reflist("_ReportingGroup").append(self)
+        self._PowerSystemResource = RefList(value)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
     def addPowerSystemResource(self, *PowerSystemResource):
         for obj in PowerSystemResource:
             if self not in obj._ReportingGroup:
-                obj._ReportingGroup.append(self)
-            self._PowerSystemResource.append(obj)
+                obj._reflist("_ReportingGroup").append(self)
+            self._reflist("_PowerSystemResource").append(obj)
 
     def removePowerSystemResource(self, *PowerSystemResource):
         for obj in PowerSystemResource:
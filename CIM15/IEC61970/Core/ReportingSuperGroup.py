@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ReportingSuperGroup(IdentifiedObject):
     """A reporting super group, groups reporting groups for a higher level report.A reporting super group, groups reporting groups for a higher level report.
@@ -29,8 +30,8 @@ class ReportingSuperGroup(IdentifiedObject):
 
         @param ReportingGroup: Reporting groups that are grouped under this group group.
         """
-        self._ReportingGroup = []
-        self.ReportingGroup = [] if ReportingGroup is None else ReportingGroup
+        if ReportingGroup is not None:
+            self.ReportingGroup = ReportingGroup
 
         super(ReportingSuperGroup, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class ReportingSuperGroup(IdentifiedObject):
     _enums = {}
     _refs = ["ReportingGroup"]
     _many_refs = ["ReportingGroup"]
+    _inverses = {"ReportingGroup": "ReportingSuperGroup"}
 
     def getReportingGroup(self):
         """Reporting groups that are grouped under this group group.
@@ -47,7 +49,8 @@ class ReportingSuperGroup(IdentifiedObject):
         return self._ReportingGroup
 
     def setReportingGroup(self, value):
-        for x in self._ReportingGroup:
+        value = RefList(value)
+        for x in list(self._ReportingGroup):
             x.ReportingSuperGroup = None
         for y in value:
             y._ReportingSuperGroup = self
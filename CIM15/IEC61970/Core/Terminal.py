@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Terminal(IdentifiedObject):
     """An electrical connection point to a piece of conducting equipment. Terminals are connected at physical connection points called 'connectivity nodes'.An electrical connection point to a piece of conducting equipment. Terminals are connected at physical connection points called 'connectivity nodes'.
@@ -58,38 +59,38 @@ class Terminal(IdentifiedObject):
         self._BushingInfo = None
         self.BushingInfo = BushingInfo
 
-        self._TieFlow = []
-        self.TieFlow = [] if TieFlow is None else TieFlow
+        if TieFlow is not None:
+            self.TieFlow = TieFlow
 
-        self._HasSecond_MutualCoupling = []
-        self.HasSecond_MutualCoupling = [] if HasSecond_MutualCoupling is None else HasSecond_MutualCoupling
+        if HasSecond_MutualCoupling is not None:
+            self.HasSecond_MutualCoupling = HasSecond_MutualCoupling
 
-        self._OperationalLimitSet = []
-        self.OperationalLimitSet = [] if OperationalLimitSet is None else OperationalLimitSet
+        if OperationalLimitSet is not None:
+            self.OperationalLimitSet = OperationalLimitSet
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         self._ConductingEquipment = None
         self.ConductingEquipment = ConductingEquipment
 
-        self._RegulatingControl = []
-        self.RegulatingControl = [] if RegulatingControl is None else RegulatingControl
+        if RegulatingControl is not None:
+            self.RegulatingControl = RegulatingControl
 
-        self._HasFirst_MutualCoupling = []
-        self.HasFirst_MutualCoupling = [] if HasFirst_MutualCoupling is None else HasFirst_MutualCoupling
+        if HasFirst_MutualCoupling is not None:
+            self.HasFirst_MutualCoupling = HasFirst_MutualCoupling
 
-        self._AuxiliaryEquipment = []
-        self.AuxiliaryEquipment = [] if AuxiliaryEquipment is None else AuxiliaryEquipment
+        if AuxiliaryEquipment is not None:
+            self.AuxiliaryEquipment = AuxiliaryEquipment
 
-        self._TransformerEnd = []
-        self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
+        if TransformerEnd is not None:
+            self.TransformerEnd = TransformerEnd
 
         self._ConnectivityNode = None
         self.ConnectivityNode = ConnectivityNode
 
-        self._BranchGroupTerminal = []
-        self.BranchGroupTerminal = [] if BranchGroupTerminal is None else BranchGroupTerminal
+        if BranchGroupTerminal is not None:
+            self.BranchGroupTerminal = BranchGroupTerminal
 
         self._BusNameMarker = None
         self.BusNameMarker = BusNameMarker
@@ -108,6 +109,7 @@ class Terminal(IdentifiedObject):
     _enums = {"phases": "PhaseCode"}
     _refs = ["BushingInfo", "TieFlow", "HasSecond_MutualCoupling", "OperationalLimitSet", "Measurements", "ConductingEquipment", "RegulatingControl", "HasFirst_MutualCoupling", "AuxiliaryEquipment", "TransformerEnd", "ConnectivityNode", "BranchGroupTerminal", "BusNameMarker", "SvPowerFlow", "TopologicalNode"]
     _many_refs = ["TieFlow", "HasSecond_MutualCoupling", "OperationalLimitSet", "Measurements", "RegulatingControl", "HasFirst_MutualCoupling", "AuxiliaryEquipment", "TransformerEnd", "BranchGroupTerminal"]
+    _inverses = {"BushingInfo": "Terminal", "TieFlow": "Terminal", "HasSecond_MutualCoupling": "Second_Terminal", "OperationalLimitSet": "Terminal", "Measurements": "Terminal", "ConductingEquipment": "Terminals", "RegulatingControl": "Terminal", "HasFirst_MutualCoupling": "First_Terminal", "AuxiliaryEquipment": "Terminal", "TransformerEnd": "Terminal", "ConnectivityNode": "Terminals", "BranchGroupTerminal": "Terminal", "BusNameMarker": "Terminal", "SvPowerFlow": "Terminal", "TopologicalNode": "Terminal"}
 
     def getBushingInfo(self):
         
@@ -130,7 +132,8 @@ class Terminal(IdentifiedObject):
         return self._TieFlow
 
     def setTieFlow(self, value):
-        for x in self._TieFlow:
+        value = RefList(value)
+        for x in list(self._TieFlow):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -152,7 +155,8 @@ class Terminal(IdentifiedObject):
         return self._HasSecond_MutualCoupling
 
     def setHasSecond_MutualCoupling(self, value):
-        for x in self._HasSecond_MutualCoupling:
+        value = RefList(value)
+        for x in list(self._HasSecond_MutualCoupling):
             x.Second_Terminal = None
         for y in value:
             y._Second_Terminal = self
@@ -174,7 +178,8 @@ class Terminal(IdentifiedObject):
         return self._OperationalLimitSet
 
     def setOperationalLimitSet(self, value):
-        for x in self._OperationalLimitSet:
+        value = RefList(value)
+        for x in list(self._OperationalLimitSet):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -196,7 +201,8 @@ class Terminal(IdentifiedObject):
         return self._Measurements
 
     def setMeasurements(self, value):
-        for x in self._Measurements:
+        value = RefList(value)
+        for x in list(self._Measurements):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -219,13 +225,12 @@ class Terminal(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.Terminals if x != self]
-            self._ConductingEquipment._Terminals = filtered
+            self._ConductingEquipment._Terminals.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
             if self not in self._ConductingEquipment._Terminals:
-                self._ConductingEquipment._Terminals.append(self)
+                self._ConductingEquipment._reflist("_Terminals").append(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
@@ -235,7 +240,8 @@ class Terminal(IdentifiedObject):
         return self._RegulatingControl
 
     def setRegulatingControl(self, value):
-        for x in self._RegulatingControl:
+        value = RefList(value)
+        for x in list(self._RegulatingControl):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -257,7 +263,8 @@ class Terminal(IdentifiedObject):
         return self._HasFirst_MutualCoupling
 
     def setHasFirst_MutualCoupling(self, value):
-        for x in self._HasFirst_MutualCoupling:
+        value = RefList(value)
+        for x in list(self._HasFirst_MutualCoupling):
             x.First_Terminal = None
         for y in value:
             y._First_Terminal = self
@@ -278,7 +285,8 @@ class Terminal(IdentifiedObject):
         return self._AuxiliaryEquipment
 
     def setAuxiliaryEquipment(self, value):
-        for x in self._AuxiliaryEquipment:
+        value = RefList(value)
+        for x in list(self._AuxiliaryEquipment):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -300,7 +308,8 @@ class Terminal(IdentifiedObject):
         return self._TransformerEnd
 
     def setTransformerEnd(self, value):
-        for x in self._TransformerEnd:
+        value = RefList(value)
+        for x in list(self._TransformerEnd):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -323,13 +332,12 @@ class Terminal(IdentifiedObject):
 
     def setConnectivityNode(self, value):
         if self._ConnectivityNode is not None:
-            filtered = [x for x in self.ConnectivityNode.Terminals if x != self]
-            self._ConnectivityNode._Terminals = filtered
+            self._ConnectivityNode._Terminals.discard(self)
 
         self._ConnectivityNode = value
         if self._ConnectivityNode is not None:
             if self not in self._ConnectivityNode._Terminals:
-                self._ConnectivityNode._Terminals.append(self)
+                self._ConnectivityNode._reflist("_Terminals").append(self)
 
     ConnectivityNode = property(getConnectivityNode, setConnectivityNode)
 
@@ -339,7 +347,8 @@ class Terminal(IdentifiedObject):
         return self._BranchGroupTerminal
 
     def setBranchGroupTerminal(self, value):
-        for x in self._BranchGroupTerminal:
+        value = RefList(value)
+        for x in list(self._BranchGroupTerminal):
             x.Terminal = None
         for y in value:
             y._Terminal = self
@@ -362,13 +371,12 @@ class Terminal(IdentifiedObject):
 
     def setBusNameMarker(self, value):
         if self._BusNameMarker is not None:
-            filtered = [x for x in self.BusNameMarker.Terminal if x != self]
-            self._BusNameMarker._Terminal = filtered
+            self._BusNameMarker._Terminal.discard(self)
 
         self._BusNameMarker = value
         if self._BusNameMarker is not None:
             if self not in self._BusNameMarker._Terminal:
-                self._BusNameMarker._Terminal.append(self)
+                self._BusNameMarker._reflist("_Terminal").append(self)
 
     BusNameMarker = property(getBusNameMarker, setBusNameMarker)
 
@@ -395,13 +403,12 @@ class Terminal(IdentifiedObject):
 
     def setTopologicalNode(self, value):
         if self._TopologicalNode is not None:
-            filtered = [x for x in self.TopologicalNode.Terminal if x != self]
-            self._TopologicalNode._Terminal = filtered
+            self._TopologicalNode._Terminal.discard(self)
 
         self._TopologicalNode = value
         if self._TopologicalNode is not None:
             if self not in self._TopologicalNode._Terminal:
-                self._TopologicalNode._Terminal.append(self)
+                self._TopologicalNode._reflist("_Terminal").append(self)
 
     TopologicalNode = property(getTopologicalNode, setTopologicalNode)
 
@@ -21,37 +21,8 @@
 """Contains the core PowerSystemResource and ConductingEquipment entities shared by all applications plus common collections of those entities. Not all applications require all the Core entities.  This package does not depend on any other package except the Domain package, but most of the other packages have associations and generalizations that depend on it.
 """
 
-from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
-from CIM15.IEC61970.Core.NameTypeAuthority import NameTypeAuthority
-from CIM15.IEC61970.Core.Equipment import Equipment
-from CIM15.IEC61970.Core.ConductingEquipment import ConductingEquipment
-from CIM15.IEC61970.Core.RegularTimePoint import RegularTimePoint
-from CIM15.IEC61970.Core.ConnectivityNode import ConnectivityNode
-from CIM15.IEC61970.Core.PSRType import PSRType
-from CIM15.IEC61970.Core.ConnectivityNodeContainer import ConnectivityNodeContainer
-from CIM15.IEC61970.Core.Bay import Bay
-from CIM15.IEC61970.Core.EquipmentContainer import EquipmentContainer
-from CIM15.IEC61970.Core.ReportingGroup import ReportingGroup
-from CIM15.IEC61970.Core.BasePower import BasePower
-from CIM15.IEC61970.Core.PsrList import PsrList
-from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
-from CIM15.IEC61970.Core.BasicIntervalSchedule import BasicIntervalSchedule
-from CIM15.IEC61970.Core.Curve import Curve
-from CIM15.IEC61970.Core.GeographicalRegion import GeographicalRegion
-from CIM15.IEC61970.Core.CurveData import CurveData
-from CIM15.IEC61970.Core.SubGeographicalRegion import SubGeographicalRegion
-from CIM15.IEC61970.Core.NameType import NameType
-from CIM15.IEC61970.Core.Substation import Substation
-from CIM15.IEC61970.Core.Name import Name
-from CIM15.IEC61970.Core.BaseVoltage import BaseVoltage
-from CIM15.IEC61970.Core.Terminal import Terminal
-from CIM15.IEC61970.Core.IrregularIntervalSchedule import IrregularIntervalSchedule
-from CIM15.IEC61970.Core.RegularIntervalSchedule import RegularIntervalSchedule
-from CIM15.IEC61970.Core.OperatingParticipant import OperatingParticipant
-from CIM15.IEC61970.Core.OperatingShare import OperatingShare
-from CIM15.IEC61970.Core.VoltageLevel import VoltageLevel
-from CIM15.IEC61970.Core.ReportingSuperGroup import ReportingSuperGroup
-from CIM15.IEC61970.Core.IrregularTimePoint import IrregularTimePoint
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Core"
 nsPrefix = "cimCore"
@@ -81,3 +52,38 @@ class BusbarConfiguration(str):
     """Values are: doubleBus, ringBus, singleBus, mainWithTransfer
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "PowerSystemResource",
+    "NameTypeAuthority",
+    "Equipment",
+    "ConductingEquipment",
+    "RegularTimePoint",
+    "ConnectivityNode",
+    "PSRType",
+    "ConnectivityNodeContainer",
+    "Bay",
+    "EquipmentContainer",
+    "ReportingGroup",
+    "BasePower",
+    "PsrList",
+    "IdentifiedObject",
+    "BasicIntervalSchedule",
+    "Curve",
+    "GeographicalRegion",
+    "CurveData",
+    "SubGeographicalRegion",
+    "NameType",
+    "Substation",
+    "Name",
+    "BaseVoltage",
+    "Terminal",
+    "IrregularIntervalSchedule",
+    "RegularIntervalSchedule",
+    "OperatingParticipant",
+    "OperatingShare",
+    "VoltageLevel",
+    "ReportingSuperGroup",
+    "IrregularTimePoint",
+])
@@ -44,6 +44,7 @@ class Clamp(ConductingEquipment):
     _enums = {}
     _refs = ["ACLineSegment"]
     _many_refs = []
+    _inverses = {"ACLineSegment": "Clamp"}
 
     def getACLineSegment(self):
         
@@ -51,13 +52,12 @@ class Clamp(ConductingEquipment):
 
     def setACLineSegment(self, value):
         if self._ACLineSegment is not None:
-            filtered = [x for x in self.ACLineSegment.Clamp if x != self]
-            self._ACLineSegment._Clamp = filtered
+            self._ACLineSegment._Clamp.discard(self)
 
         self._ACLineSegment = value
         if self._ACLineSegment is not None:
             if self not in self._ACLineSegment._Clamp:
-                self._ACLineSegment._Clamp.append(self)
+                self._ACLineSegment._reflist("_Clamp").append(self)
 
     ACLineSegment = property(getACLineSegment, setACLineSegment)
 
@@ -44,6 +44,7 @@ class Cut(Switch):
     _enums = {}
     _refs = ["ACLineSegment"]
     _many_refs = []
+    _inverses = {"ACLineSegment": "Cut"}
 
     def getACLineSegment(self):
         
@@ -51,13 +52,12 @@ class Cut(Switch):
 
     def setACLineSegment(self, value):
         if self._ACLineSegment is not None:
-            filtered = [x for x in self.ACLineSegment.Cut if x != self]
-            self._ACLineSegment._Cut = filtered
+            self._ACLineSegment._Cut.discard(self)
 
         self._ACLineSegment = value
         if self._ACLineSegment is not None:
             if self not in self._ACLineSegment._Cut:
-                self._ACLineSegment._Cut.append(self)
+                self._ACLineSegment._reflist("_Cut").append(self)
 
     ACLineSegment = property(getACLineSegment, setACLineSegment)
 
@@ -19,9 +19,14 @@
 # IN THE SOFTWARE.
 
 
-from CIM15.IEC61970.CutsJumpers.Cut import Cut
-from CIM15.IEC61970.CutsJumpers.Clamp import Clamp
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#CutsJumpers"
 nsPrefix = "cimCutsJumpers"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Cut",
+    "Clamp",
+])
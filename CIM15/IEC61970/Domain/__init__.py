@@ -21,7 +21,8 @@
 """The domain package define primitive datatypes that are used by classes in other packages. Stereotypes are used to describe the datatypes. The following sterotypes are defined  &lt;&lt;enumeration&gt;&gt; A list of permissable constant values.  &lt;&lt;Primitive&gt;&gt; The most basic data types that all other data types derive from.  &lt;&lt;CIMDataType&gt;&gt; A datatype that contains a value attribute, an optional unit of measure and a unit multiplier. The unit and multiplier are specified as a static variable initialized to the allowed value.  &lt;&lt;Compound&gt;&gt; A composite of two or more attributes.
 """
 
-from CIM15.IEC61970.Domain.DateTimeInterval import DateTimeInterval
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Domain"
 nsPrefix = "cimDomain"
@@ -265,3 +266,8 @@ class IntegerQuantity(str):
 
 class CostPerVolume(float):
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "DateTimeInterval",
+])
@@ -44,4 +44,5 @@ class EquivalentBranch(EquivalentEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -40,6 +40,7 @@ class EquivalentEquipment(ConductingEquipment):
     _enums = {}
     _refs = ["EquivalentNetwork"]
     _many_refs = []
+    _inverses = {"EquivalentNetwork": "EquivalentEquipments"}
 
     def getEquivalentNetwork(self):
         """The equivalent where the reduced model belongs.
@@ -48,13 +49,12 @@ class EquivalentEquipment(ConductingEquipment):
 
     def setEquivalentNetwork(self, value):
         if self._EquivalentNetwork is not None:
-            filtered = [x for x in self.EquivalentNetwork.EquivalentEquipments if x != self]
-            self._EquivalentNetwork._EquivalentEquipments = filtered
+            self._EquivalentNetwork._EquivalentEquipments.discard(self)
 
         self._EquivalentNetwork = value
         if self._EquivalentNetwork is not None:
             if self not in self._EquivalentNetwork._EquivalentEquipments:
-                self._EquivalentNetwork._EquivalentEquipments.append(self)
+                self._EquivalentNetwork._reflist("_EquivalentEquipments").append(self)
 
     EquivalentNetwork = property(getEquivalentNetwork, setEquivalentNetwork)
 
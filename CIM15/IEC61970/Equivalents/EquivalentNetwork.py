@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.ConnectivityNodeContainer import ConnectivityNodeContainer
+from CIM15.Element import RefList
 
 class EquivalentNetwork(ConnectivityNodeContainer):
     """A class that represents an external meshed network that has been reduced to an electrically equivalent model. The ConnectivityNodes contained in the equivalent are intended to reflect internal nodes of the equivalent. The boundary Connectivity nodes where the equivalent connects outside itself are NOT contained by the equivalent.A class that represents an external meshed network that has been reduced to an electrically equivalent model. The ConnectivityNodes contained in the equivalent are intended to reflect internal nodes of the equivalent. The boundary Connectivity nodes where the equivalent connects outside itself are NOT contained by the equivalent.
@@ -29,8 +30,8 @@ class EquivalentNetwork(ConnectivityNodeContainer):
 
         @param EquivalentEquipments: The associated reduced equivalents.
         """
-        self._EquivalentEquipments = []
-        self.EquivalentEquipments = [] if EquivalentEquipments is None else EquivalentEquipments
+        if EquivalentEquipments is not None:
+            self.EquivalentEquipments = EquivalentEquipments
 
         super(EquivalentNetwork, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class EquivalentNetwork(ConnectivityNodeContainer):
     _enums = {}
     _refs = ["EquivalentEquipments"]
     _many_refs = ["EquivalentEquipments"]
+    _inverses = {"EquivalentEquipments": "EquivalentNetwork"}
 
     def getEquivalentEquipments(self):
         """The associated reduced equivalents.
@@ -47,7 +49,8 @@ class EquivalentNetwork(ConnectivityNodeContainer):
         return self._EquivalentEquipments
 
     def setEquivalentEquipments(self, value):
-        for x in self._EquivalentEquipments:
+        value = RefList(value)
+        for x in list(self._EquivalentEquipments):
             x.EquivalentNetwork = None
         for y in value:
             y._EquivalentNetwork = self
@@ -21,12 +21,17 @@
 """The equivalents package models equivalent networks.
 """
 
-from CIM15.IEC61970.Equivalents.EquivalentShunt import EquivalentShunt
-from CIM15.IEC61970.Equivalents.EquivalentEquipment import EquivalentEquipment
-from CIM15.IEC61970.Equivalents.EquivalentNetwork import EquivalentNetwork
-from CIM15.IEC61970.Equivalents.EquivalentInjection import EquivalentInjection
-from CIM15.IEC61970.Equivalents.EquivalentBranch import EquivalentBranch
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Equivalents"
 nsPrefix = "cimEquivalents"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "EquivalentShunt",
+    "EquivalentEquipment",
+    "EquivalentNetwork",
+    "EquivalentInjection",
+    "EquivalentBranch",
+])
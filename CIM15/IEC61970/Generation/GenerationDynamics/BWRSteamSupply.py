@@ -120,4 +120,5 @@ class BWRSteamSupply(SteamSupply):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
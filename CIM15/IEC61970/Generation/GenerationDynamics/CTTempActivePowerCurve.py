@@ -40,6 +40,7 @@ class CTTempActivePowerCurve(Curve):
     _enums = {}
     _refs = ["CombustionTurbine"]
     _many_refs = []
+    _inverses = {"CombustionTurbine": "CTTempActivePowerCurve"}
 
     def getCombustionTurbine(self):
         """A combustion turbine may have an active power versus ambient temperature relationship
@@ -40,4 +40,5 @@ class DrumBoiler(FossilSteamSupply):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
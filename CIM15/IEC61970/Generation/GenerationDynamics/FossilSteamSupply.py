@@ -140,4 +140,5 @@ class FossilSteamSupply(SteamSupply):
     _enums = {"boilerControlMode": "BoilerControlMode"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
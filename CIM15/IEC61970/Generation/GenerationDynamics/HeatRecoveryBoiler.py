@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Generation.GenerationDynamics.FossilSteamSupply import FossilSteamSupply
+from CIM15.Element import RefList
 
 class HeatRecoveryBoiler(FossilSteamSupply):
     """The heat recovery system associated with combustion turbines in order to produce steam for combined cycle plantsThe heat recovery system associated with combustion turbines in order to produce steam for combined cycle plants
@@ -33,8 +34,8 @@ class HeatRecoveryBoiler(FossilSteamSupply):
         #: The steam supply rating in kilopounds per hour, if dual pressure boiler
         self.steamSupplyRating2 = steamSupplyRating2
 
-        self._CombustionTurbines = []
-        self.CombustionTurbines = [] if CombustionTurbines is None else CombustionTurbines
+        if CombustionTurbines is not None:
+            self.CombustionTurbines = CombustionTurbines
 
         super(HeatRecoveryBoiler, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class HeatRecoveryBoiler(FossilSteamSupply):
     _enums = {}
     _refs = ["CombustionTurbines"]
     _many_refs = ["CombustionTurbines"]
+    _inverses = {"CombustionTurbines": "HeatRecoveryBoiler"}
 
     def getCombustionTurbines(self):
         """A combustion turbine may have a heat recovery boiler for making steam
@@ -51,7 +53,8 @@ class HeatRecoveryBoiler(FossilSteamSupply):
         return self._CombustionTurbines
 
     def setCombustionTurbines(self, value):
-        for x in self._CombustionTurbines:
+        value = RefList(value)
+        for x in list(self._CombustionTurbines):
             x.HeatRecoveryBoiler = None
         for y in value:
             y._HeatRecoveryBoiler = self
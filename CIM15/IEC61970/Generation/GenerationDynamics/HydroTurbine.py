@@ -80,4 +80,5 @@ class HydroTurbine(PrimeMover):
     _enums = {"turbineType": "TurbineType"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -116,4 +116,5 @@ class PWRSteamSupply(SteamSupply):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import RefList
 
 class PrimeMover(PowerSystemResource):
     """The machine used to develop mechanical energy used to drive a generator.The machine used to develop mechanical energy used to drive a generator.
@@ -33,8 +34,8 @@ class PrimeMover(PowerSystemResource):
         #: Rating of prime mover
         self.primeMoverRating = primeMoverRating
 
-        self._SynchronousMachines = []
-        self.SynchronousMachines = [] if SynchronousMachines is None else SynchronousMachines
+        if SynchronousMachines is not None:
+            self.SynchronousMachines = SynchronousMachines
 
         super(PrimeMover, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class PrimeMover(PowerSystemResource):
     _enums = {}
     _refs = ["SynchronousMachines"]
     _many_refs = ["SynchronousMachines"]
+    _inverses = {"SynchronousMachines": "PrimeMovers"}
 
     def getSynchronousMachines(self):
         """Synchronous machines this Prime mover drives.
@@ -52,20 +54,19 @@ class PrimeMover(PowerSystemResource):
 
     def setSynchronousMachines(self, value):
         for p in self._SynchronousMachines:
-            filtered = [q for q in p.PrimeMovers if q != self]
-            self._SynchronousMachines._PrimeMovers = filtered
+            p._PrimeMovers.discard(self)
         for r in value:
             if self not in r._PrimeMovers:
-                r._PrimeMovers.append(self)
-        self._SynchronousMachines = value
+                r._reflist("_PrimeMovers").append(self)
+        self._SynchronousMachines = RefList(value)
 
     SynchronousMachines = property(getSynchronousMachines, setSynchronousMachines)
 
     def addSynchronousMachines(self, *SynchronousMachines):
         for obj in SynchronousMachines:
             if self not in obj._PrimeMovers:
-                obj._PrimeMovers.append(self)
-            self._SynchronousMachines.append(obj)
+                obj._reflist("_PrimeMovers").append(self)
+            self._reflist("_SynchronousMachines").append(obj)
 
     def removeSynchronousMachines(self, *SynchronousMachines):
         for obj in SynchronousMachines:
@@ -36,4 +36,5 @@ class Subcritical(FossilSteamSupply):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -21,19 +21,8 @@
 """The Generation Dynamics package contains prime movers, such as turbines and boilers, which are needed for simulation and educational purposes.
 """
 
-from CIM15.IEC61970.Generation.GenerationDynamics.BWRSteamSupply import BWRSteamSupply
-from CIM15.IEC61970.Generation.GenerationDynamics.HydroTurbine import HydroTurbine
-from CIM15.IEC61970.Generation.GenerationDynamics.SteamTurbine import SteamTurbine
-from CIM15.IEC61970.Generation.GenerationDynamics.SteamSupply import SteamSupply
-from CIM15.IEC61970.Generation.GenerationDynamics.FossilSteamSupply import FossilSteamSupply
-from CIM15.IEC61970.Generation.GenerationDynamics.Subcritical import Subcritical
-from CIM15.IEC61970.Generation.GenerationDynamics.PWRSteamSupply import PWRSteamSupply
-from CIM15.IEC61970.Generation.GenerationDynamics.PrimeMover import PrimeMover
-from CIM15.IEC61970.Generation.GenerationDynamics.CombustionTurbine import CombustionTurbine
-from CIM15.IEC61970.Generation.GenerationDynamics.HeatRecoveryBoiler import HeatRecoveryBoiler
-from CIM15.IEC61970.Generation.GenerationDynamics.Supercritical import Supercritical
-from CIM15.IEC61970.Generation.GenerationDynamics.DrumBoiler import DrumBoiler
-from CIM15.IEC61970.Generation.GenerationDynamics.CTTempActivePowerCurve import CTTempActivePowerCurve
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#GenerationDynamics"
 nsPrefix = "cimGenerationDynamics"
@@ -48,3 +37,20 @@ class BoilerControlMode(str):
     """Values are: following, coordinated
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "BWRSteamSupply",
+    "HydroTurbine",
+    "SteamTurbine",
+    "SteamSupply",
+    "FossilSteamSupply",
+    "Subcritical",
+    "PWRSteamSupply",
+    "PrimeMover",
+    "CombustionTurbine",
+    "HeatRecoveryBoiler",
+    "Supercritical",
+    "DrumBoiler",
+    "CTTempActivePowerCurve",
+])
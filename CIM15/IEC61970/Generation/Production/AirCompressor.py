@@ -48,6 +48,7 @@ class AirCompressor(PowerSystemResource):
     _enums = {}
     _refs = ["CombustionTurbine", "CAESPlant"]
     _many_refs = []
+    _inverses = {"CombustionTurbine": "AirCompressor", "CAESPlant": "AirCompressor"}
 
     def getCombustionTurbine(self):
         """A CAES air compressor is driven by combustion turbine
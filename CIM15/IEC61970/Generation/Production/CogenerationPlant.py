@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import RefList
 
 class CogenerationPlant(PowerSystemResource):
     """A set of thermal generating units for the production of electrical energy and process steam (usually from the output of the steam turbines). The steam sendout is typically used for industrial purposes or for municipal heating and cooling.A set of thermal generating units for the production of electrical energy and process steam (usually from the output of the steam turbines). The steam sendout is typically used for industrial purposes or for municipal heating and cooling.
@@ -53,8 +54,8 @@ class CogenerationPlant(PowerSystemResource):
         self._SteamSendoutSchedule = None
         self.SteamSendoutSchedule = SteamSendoutSchedule
 
-        self._ThermalGeneratingUnits = []
-        self.ThermalGeneratingUnits = [] if ThermalGeneratingUnits is None else ThermalGeneratingUnits
+        if ThermalGeneratingUnits is not None:
+            self.ThermalGeneratingUnits = ThermalGeneratingUnits
 
         super(CogenerationPlant, self).__init__(*args, **kw_args)
 
@@ -64,6 +65,7 @@ class CogenerationPlant(PowerSystemResource):
     _enums = {}
     _refs = ["SteamSendoutSchedule", "ThermalGeneratingUnits"]
     _many_refs = ["ThermalGeneratingUnits"]
+    _inverses = {"SteamSendoutSchedule": "CogenerationPlant", "ThermalGeneratingUnits": "CogenerationPlant"}
 
     def getSteamSendoutSchedule(self):
         """A cogeneration plant has a steam sendout schedule
@@ -87,7 +89,8 @@ class CogenerationPlant(PowerSystemResource):
         return self._ThermalGeneratingUnits
 
     def setThermalGeneratingUnits(self, value):
-        for x in self._ThermalGeneratingUnits:
+        value = RefList(value)
+        for x in list(self._ThermalGeneratingUnits):
             x.CogenerationPlant = None
         for y in value:
             y._CogenerationPlant = self
@@ -52,6 +52,7 @@ class EmissionCurve(Curve):
     _enums = {"emissionType": "EmissionType"}
     _refs = ["ThermalGeneratingUnit"]
     _many_refs = []
+    _inverses = {"ThermalGeneratingUnit": "EmissionCurves"}
 
     def getThermalGeneratingUnit(self):
         """A thermal generating unit may have  one or more emission curves
@@ -60,13 +61,12 @@ class EmissionCurve(Curve):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.EmissionCurves if x != self]
-            self._ThermalGeneratingUnit._EmissionCurves = filtered
+            self._ThermalGeneratingUnit._EmissionCurves.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
             if self not in self._ThermalGeneratingUnit._EmissionCurves:
-                self._ThermalGeneratingUnit._EmissionCurves.append(self)
+                self._ThermalGeneratingUnit._reflist("_EmissionCurves").append(self)
 
     ThermalGeneratingUnit = property(getThermalGeneratingUnit, setThermalGeneratingUnit)
 
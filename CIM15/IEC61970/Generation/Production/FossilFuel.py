@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class FossilFuel(IdentifiedObject):
     """The fossil fuel consumed by the non-nuclear thermal generating units, e.g., coal, oil, gasThe fossil fuel consumed by the non-nuclear thermal generating units, e.g., coal, oil, gas
@@ -73,8 +74,8 @@ class FossilFuel(IdentifiedObject):
         self._ThermalGeneratingUnit = None
         self.ThermalGeneratingUnit = ThermalGeneratingUnit
 
-        self._FuelAllocationSchedules = []
-        self.FuelAllocationSchedules = [] if FuelAllocationSchedules is None else FuelAllocationSchedules
+        if FuelAllocationSchedules is not None:
+            self.FuelAllocationSchedules = FuelAllocationSchedules
 
         super(FossilFuel, self).__init__(*args, **kw_args)
 
@@ -84,6 +85,7 @@ class FossilFuel(IdentifiedObject):
     _enums = {"fossilFuelType": "FuelType"}
     _refs = ["ThermalGeneratingUnit", "FuelAllocationSchedules"]
     _many_refs = ["FuelAllocationSchedules"]
+    _inverses = {"ThermalGeneratingUnit": "FossilFuels", "FuelAllocationSchedules": "FossilFuel"}
 
     def getThermalGeneratingUnit(self):
         """A thermal generating unit may have one or more fossil fuels
@@ -92,13 +94,12 @@ class FossilFuel(IdentifiedObject):
 
     def setThermalGeneratingUnit(self, value):
         if self._ThermalGeneratingUnit is not None:
-            filtered = [x for x in self.ThermalGeneratingUnit.FossilFuels if x != self]
-            self._ThermalGeneratingUnit._FossilFuels = filtered
+            self._ThermalGeneratingUnit._FossilFuels.discard(self)
 
         self._ThermalGeneratingUnit = value
         if self._ThermalGeneratingUnit is not None:
             if self not in self._ThermalGeneratingUnit._FossilFuels:
-                self._ThermalGeneratingUnit._FossilFuels.append(self)
+                self._ThermalGeneratingUnit._reflist("_FossilFuels").append(self)
 
     ThermalGeneratingUnit = property(getThermalGeneratingUnit, setThermalGeneratingUnit)
 
@@ -108,7 +109,8 @@ class FossilFuel(IdentifiedObject):
         return self._FuelAllocationSchedules
 
     def setFuelAllocationSchedules(self, value):
-        for x in self._FuelAllocationSchedules:
+        value = RefList(value)
+        for x in list(self._FuelAllocationSchedules):
             x.FossilFuel = None
         for y in value:
             y._FossilFuel = self
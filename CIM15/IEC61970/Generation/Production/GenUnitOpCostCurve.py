@@ -44,6 +44,7 @@ class GenUnitOpCostCurve(Curve):
     _enums = {}
     _refs = ["GeneratingUnit"]
     _many_refs = []
+    _inverses = {"GeneratingUnit": "GenUnitOpCostCurves"}
 
     def getGeneratingUnit(self):
         """A generating unit may have one or more cost curves, depending upon fuel mixture and fuel cost.
@@ -52,13 +53,12 @@ class GenUnitOpCostCurve(Curve):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.GenUnitOpCostCurves if x != self]
-            self._GeneratingUnit._GenUnitOpCostCurves = filtered
+            self._GeneratingUnit._GenUnitOpCostCurves.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
             if self not in self._GeneratingUnit._GenUnitOpCostCurves:
-                self._GeneratingUnit._GenUnitOpCostCurves.append(self)
+                self._GeneratingUnit._reflist("_GenUnitOpCostCurves").append(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
@@ -40,6 +40,7 @@ class GenUnitOpSchedule(RegularIntervalSchedule):
     _enums = {}
     _refs = ["GeneratingUnit"]
     _many_refs = []
+    _inverses = {"GeneratingUnit": "GenUnitOpSchedule"}
 
     def getGeneratingUnit(self):
         """A generating unit may have an operating schedule, indicating the planned operation of the unit
@@ -40,6 +40,7 @@ class GrossToNetActivePowerCurve(Curve):
     _enums = {}
     _refs = ["GeneratingUnit"]
     _many_refs = []
+    _inverses = {"GeneratingUnit": "GrossToNetActivePowerCurves"}
 
     def getGeneratingUnit(self):
         """A generating unit may have a gross active power to net active power curve, describing the losses and auxiliary power requirements of the unit
@@ -48,13 +49,12 @@ class GrossToNetActivePowerCurve(Curve):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.GrossToNetActivePowerCurves if x != self]
-            self._GeneratingUnit._GrossToNetActivePowerCurves = filtered
+            self._GeneratingUnit._GrossToNetActivePowerCurves.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
             if self not in self._GeneratingUnit._GrossToNetActivePowerCurves:
-                self._GeneratingUnit._GrossToNetActivePowerCurves.append(self)
+                self._GeneratingUnit._reflist("_GrossToNetActivePowerCurves").append(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
@@ -60,6 +60,7 @@ class HeatInputCurve(Curve):
     _enums = {}
     _refs = ["ThermalGeneratingUnit"]
     _many_refs = []
+    _inverses = {"ThermalGeneratingUnit": "HeatInputCurve"}
 
     def getThermalGeneratingUnit(self):
         """A thermal generating unit may have a heat input curve
@@ -44,6 +44,7 @@ class HeatRateCurve(Curve):
     _enums = {}
     _refs = ["ThermalGeneratingUnit"]
     _many_refs = []
+    _inverses = {"ThermalGeneratingUnit": "HeatRateCurve"}
 
     def getThermalGeneratingUnit(self):
         """A thermal generating unit may have a heat rate curve
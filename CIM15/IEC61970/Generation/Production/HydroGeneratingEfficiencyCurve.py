@@ -40,6 +40,7 @@ class HydroGeneratingEfficiencyCurve(Curve):
     _enums = {}
     _refs = ["HydroGeneratingUnit"]
     _many_refs = []
+    _inverses = {"HydroGeneratingUnit": "HydroGeneratingEfficiencyCurves"}
 
     def getHydroGeneratingUnit(self):
         """A hydro generating unit has an efficiency curve
@@ -48,13 +49,12 @@ class HydroGeneratingEfficiencyCurve(Curve):
 
     def setHydroGeneratingUnit(self, value):
         if self._HydroGeneratingUnit is not None:
-            filtered = [x for x in self.HydroGeneratingUnit.HydroGeneratingEfficiencyCurves if x != self]
-            self._HydroGeneratingUnit._HydroGeneratingEfficiencyCurves = filtered
+            self._HydroGeneratingUnit._HydroGeneratingEfficiencyCurves.discard(self)
 
         self._HydroGeneratingUnit = value
         if self._HydroGeneratingUnit is not None:
             if self not in self._HydroGeneratingUnit._HydroGeneratingEfficiencyCurves:
-                self._HydroGeneratingUnit._HydroGeneratingEfficiencyCurves.append(self)
+                self._HydroGeneratingUnit._reflist("_HydroGeneratingEfficiencyCurves").append(self)
 
     HydroGeneratingUnit = property(getHydroGeneratingUnit, setHydroGeneratingUnit)
 
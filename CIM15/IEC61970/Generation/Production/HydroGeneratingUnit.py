@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Generation.Production.GeneratingUnit import GeneratingUnit
+from CIM15.Element import RefList
 
 class HydroGeneratingUnit(GeneratingUnit):
     """A generating unit whose prime mover is a hydraulic turbine (e.g., Francis, Pelton, Kaplan)A generating unit whose prime mover is a hydraulic turbine (e.g., Francis, Pelton, Kaplan)
@@ -46,11 +47,11 @@ class HydroGeneratingUnit(GeneratingUnit):
         self._HydroPowerPlant = None
         self.HydroPowerPlant = HydroPowerPlant
 
-        self._TailbayLossCurve = []
-        self.TailbayLossCurve = [] if TailbayLossCurve is None else TailbayLossCurve
+        if TailbayLossCurve is not None:
+            self.TailbayLossCurve = TailbayLossCurve
 
-        self._HydroGeneratingEfficiencyCurves = []
-        self.HydroGeneratingEfficiencyCurves = [] if HydroGeneratingEfficiencyCurves is None else HydroGeneratingEfficiencyCurves
+        if HydroGeneratingEfficiencyCurves is not None:
+            self.HydroGeneratingEfficiencyCurves = HydroGeneratingEfficiencyCurves
 
         super(HydroGeneratingUnit, self).__init__(*args, **kw_args)
 
@@ -60,6 +61,7 @@ class HydroGeneratingUnit(GeneratingUnit):
     _enums = {"energyConversionCapability": "HydroEnergyConversionKind"}
     _refs = ["PenstockLossCurve", "HydroPowerPlant", "TailbayLossCurve", "HydroGeneratingEfficiencyCurves"]
     _many_refs = ["TailbayLossCurve", "HydroGeneratingEfficiencyCurves"]
+    _inverses = {"PenstockLossCurve": "HydroGeneratingUnit", "HydroPowerPlant": "HydroGeneratingUnits", "TailbayLossCurve": "HydroGeneratingUnit", "HydroGeneratingEfficiencyCurves": "HydroGeneratingUnit"}
 
     def getPenstockLossCurve(self):
         """A hydro generating unit has a penstock loss curve
@@ -84,13 +86,12 @@ class HydroGeneratingUnit(GeneratingUnit):
 
     def setHydroPowerPlant(self, value):
         if self._HydroPowerPlant is not None:
-            filtered = [x for x in self.HydroPowerPlant.HydroGeneratingUnits if x != self]
-            self._HydroPowerPlant._HydroGeneratingUnits = filtered
+            self._HydroPowerPlant._HydroGeneratingUnits.discard(self)
 
         self._HydroPowerPlant = value
         if self._HydroPowerPlant is not None:
             if self not in self._HydroPowerPlant._HydroGeneratingUnits:
-                self._HydroPowerPlant._HydroGeneratingUnits.append(self)
+                self._HydroPowerPlant._reflist("_HydroGeneratingUnits").append(self)
 
     HydroPowerPlant = property(getHydroPowerPlant, setHydroPowerPlant)
 
@@ -100,7 +101,8 @@ class HydroGeneratingUnit(GeneratingUnit):
         return self._TailbayLossCurve
 
     def setTailbayLossCurve(self, value):
-        for x in self._TailbayLossCurve:
+        value = RefList(value)
+        for x in list(self._TailbayLossCurve):
             x.HydroGeneratingUnit = None
         for y in value:
             y._HydroGeneratingUnit = self
@@ -122,7 +124,8 @@ class HydroGeneratingUnit(GeneratingUnit):
         return self._HydroGeneratingEfficiencyCurves
 
     def setHydroGeneratingEfficiencyCurves(self, value):
-        for x in self._HydroGeneratingEfficiencyCurves:
+        value = RefList(value)
+        for x in list(self._HydroGeneratingEfficiencyCurves):
             x.HydroGeneratingUnit = None
         for y in value:
             y._HydroGeneratingUnit = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import RefList
 
 class HydroPowerPlant(PowerSystemResource):
     """A hydro power station which can generate or pump. When generating, the generator turbines receive there water from an upper reservoir. When pumping, the pumps receive their water from a lower reservoir.A hydro power station which can generate or pump. When generating, the generator turbines receive there water from an upper reservoir. When pumping, the pumps receive their water from a lower reservoir.
@@ -68,8 +69,8 @@ class HydroPowerPlant(PowerSystemResource):
         #: A code describing the type (or absence) of surge tank that is associated with the hydro power plant
         self.surgeTankCode = surgeTankCode
 
-        self._HydroGeneratingUnits = []
-        self.HydroGeneratingUnits = [] if HydroGeneratingUnits is None else HydroGeneratingUnits
+        if HydroGeneratingUnits is not None:
+            self.HydroGeneratingUnits = HydroGeneratingUnits
 
         self._GenSourcePumpDischargeReservoir = None
         self.GenSourcePumpDischargeReservoir = GenSourcePumpDischargeReservoir
@@ -77,8 +78,8 @@ class HydroPowerPlant(PowerSystemResource):
         self._Reservoir = None
         self.Reservoir = Reservoir
 
-        self._HydroPumps = []
-        self.HydroPumps = [] if HydroPumps is None else HydroPumps
+        if HydroPumps is not None:
+            self.HydroPumps = HydroPumps
 
         super(HydroPowerPlant, self).__init__(*args, **kw_args)
 
@@ -88,6 +89,7 @@ class HydroPowerPlant(PowerSystemResource):
     _enums = {"penstockType": "PenstockType", "hydroPlantType": "HydroPlantType", "surgeTankCode": "SurgeTankCode"}
     _refs = ["HydroGeneratingUnits", "GenSourcePumpDischargeReservoir", "Reservoir", "HydroPumps"]
     _many_refs = ["HydroGeneratingUnits", "HydroPumps"]
+    _inverses = {"HydroGeneratingUnits": "HydroPowerPlant", "GenSourcePumpDischargeReservoir": "UpstreamFromHydroPowerPlants", "Reservoir": "HydroPowerPlants", "HydroPumps": "HydroPowerPlant"}
 
     def getHydroGeneratingUnits(self):
         """The hydro generating unit belongs to a hydro power plant
@@ -95,7 +97,8 @@ class HydroPowerPlant(PowerSystemResource):
         return self._HydroGeneratingUnits
 
     def setHydroGeneratingUnits(self, value):
-        for x in self._HydroGeneratingUnits:
+        value = RefList(value)
+        for x in list(self._HydroGeneratingUnits):
             x.HydroPowerPlant = None
         for y in value:
             y._HydroPowerPlant = self
@@ -118,13 +121,12 @@ class HydroPowerPlant(PowerSystemResource):
 
     def setGenSourcePumpDischargeReservoir(self, value):
         if self._GenSourcePumpDischargeReservoir is not None:
-            filtered = [x for x in self.GenSourcePumpDischargeReservoir.UpstreamFromHydroPowerPlants if x != self]
-            self._GenSourcePumpDischargeReservoir._UpstreamFromHydroPowerPlants = filtered
+            self._GenSourcePumpDischargeReservoir._UpstreamFromHydroPowerPlants.discard(self)
 
         self._GenSourcePumpDischargeReservoir = value
         if self._GenSourcePumpDischargeReservoir is not None:
             if self not in self._GenSourcePumpDischargeReservoir._UpstreamFromHydroPowerPlants:
-                self._GenSourcePumpDischargeReservoir._UpstreamFromHydroPowerPlants.append(self)
+                self._GenSourcePumpDischargeReservoir._reflist("_UpstreamFromHydroPowerPlants").append(self)
 
     GenSourcePumpDischargeReservoir = property(getGenSourcePumpDischargeReservoir, setGenSourcePumpDischargeReservoir)
 
@@ -135,13 +137,12 @@ class HydroPowerPlant(PowerSystemResource):
 
     def setReservoir(self, value):
         if self._Reservoir is not None:
-            filtered = [x for x in self.Reservoir.HydroPowerPlants if x != self]
-            self._Reservoir._HydroPowerPlants = filtered
+            self._Reservoir._HydroPowerPlants.discard(self)
 
         self._Reservoir = value
         if self._Reservoir is not None:
             if self not in self._Reservoir._HydroPowerPlants:
-                self._Reservoir._HydroPowerPlants.append(self)
+                self._Reservoir._reflist("_HydroPowerPlants").append(self)
 
     Reservoir = property(getReservoir, setReservoir)
 
@@ -151,7 +152,8 @@ class HydroPowerPlant(PowerSystemResource):
         return self._HydroPumps
 
     def setHydroPumps(self, value):
-        for x in self._HydroPumps:
+        value = RefList(value)
+        for x in list(self._HydroPumps):
             x.HydroPowerPlant = None
         for y in value:
             y._HydroPowerPlant = self
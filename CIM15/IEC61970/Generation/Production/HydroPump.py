@@ -64,6 +64,7 @@ class HydroPump(PowerSystemResource):
     _enums = {}
     _refs = ["HydroPowerPlant", "HydroPumpOpSchedule", "SynchronousMachine"]
     _many_refs = []
+    _inverses = {"HydroPowerPlant": "HydroPumps", "HydroPumpOpSchedule": "HydroPump", "SynchronousMachine": "HydroPump"}
 
     def getHydroPowerPlant(self):
         """The hydro pump may be a member of a pumped storage plant or a pump for distributing water
@@ -72,13 +73,12 @@ class HydroPump(PowerSystemResource):
 
     def setHydroPowerPlant(self, value):
         if self._HydroPowerPlant is not None:
-            filtered = [x for x in self.HydroPowerPlant.HydroPumps if x != self]
-            self._HydroPowerPlant._HydroPumps = filtered
+            self._HydroPowerPlant._HydroPumps.discard(self)
 
         self._HydroPowerPlant = value
         if self._HydroPowerPlant is not None:
             if self not in self._HydroPowerPlant._HydroPumps:
-                self._HydroPowerPlant._HydroPumps.append(self)
+                self._HydroPowerPlant._reflist("_HydroPumps").append(self)
 
     HydroPowerPlant = property(getHydroPowerPlant, setHydroPowerPlant)
 
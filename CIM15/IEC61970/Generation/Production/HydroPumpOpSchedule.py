@@ -40,6 +40,7 @@ class HydroPumpOpSchedule(RegularIntervalSchedule):
     _enums = {}
     _refs = ["HydroPump"]
     _many_refs = []
+    _inverses = {"HydroPump": "HydroPumpOpSchedule"}
 
     def getHydroPump(self):
         """The hydro pump has a pumping schedule over time, indicating when pumping is to occur.
@@ -40,6 +40,7 @@ class InflowForecast(RegularIntervalSchedule):
     _enums = {}
     _refs = ["Reservoir"]
     _many_refs = []
+    _inverses = {"Reservoir": "InflowForecasts"}
 
     def getReservoir(self):
         """A reservoir may have a 'natural' inflow forecast.
@@ -48,13 +49,12 @@ class InflowForecast(RegularIntervalSchedule):
 
     def setReservoir(self, value):
         if self._Reservoir is not None:
-            filtered = [x for x in self.Reservoir.InflowForecasts if x != self]
-            self._Reservoir._InflowForecasts = filtered
+            self._Reservoir._InflowForecasts.discard(self)
 
         self._Reservoir = value
         if self._Reservoir is not None:
             if self not in self._Reservoir._InflowForecasts:
-                self._Reservoir._InflowForecasts.append(self)
+                self._Reservoir._reflist("_InflowForecasts").append(self)
 
     Reservoir = property(getReservoir, setReservoir)
 
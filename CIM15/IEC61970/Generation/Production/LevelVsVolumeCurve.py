@@ -40,6 +40,7 @@ class LevelVsVolumeCurve(Curve):
     _enums = {}
     _refs = ["Reservoir"]
     _many_refs = []
+    _inverses = {"Reservoir": "LevelVsVolumeCurves"}
 
     def getReservoir(self):
         """A reservoir may have a level versus volume relationship.
@@ -48,13 +49,12 @@ class LevelVsVolumeCurve(Curve):
 
     def setReservoir(self, value):
         if self._Reservoir is not None:
-            filtered = [x for x in self.Reservoir.LevelVsVolumeCurves if x != self]
-            self._Reservoir._LevelVsVolumeCurves = filtered
+            self._Reservoir._LevelVsVolumeCurves.discard(self)
 
         self._Reservoir = value
         if self._Reservoir is not None:
             if self not in self._Reservoir._LevelVsVolumeCurves:
-                self._Reservoir._LevelVsVolumeCurves.append(self)
+                self._Reservoir._reflist("_LevelVsVolumeCurves").append(self)
 
     Reservoir = property(getReservoir, setReservoir)
 
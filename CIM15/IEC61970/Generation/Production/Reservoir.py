@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import RefList
 
 class Reservoir(PowerSystemResource):
     """A water storage facility within a hydro system, including: ponds, lakes, lagoons, and rivers. The storage is usually behind some type of dam.A water storage facility within a hydro system, including: ponds, lakes, lagoons, and rivers. The storage is usually behind some type of dam.
@@ -79,26 +80,26 @@ class Reservoir(PowerSystemResource):
         #: Full supply level, above which water will spill. This can be the spillway crest level or the top of closed gates.
         self.fullSupplyLevel = fullSupplyLevel
 
-        self._LevelVsVolumeCurves = []
-        self.LevelVsVolumeCurves = [] if LevelVsVolumeCurves is None else LevelVsVolumeCurves
+        if LevelVsVolumeCurves is not None:
+            self.LevelVsVolumeCurves = LevelVsVolumeCurves
 
         self._TargetLevelSchedule = None
         self.TargetLevelSchedule = TargetLevelSchedule
 
-        self._HydroPowerPlants = []
-        self.HydroPowerPlants = [] if HydroPowerPlants is None else HydroPowerPlants
+        if HydroPowerPlants is not None:
+            self.HydroPowerPlants = HydroPowerPlants
 
-        self._UpstreamFromHydroPowerPlants = []
-        self.UpstreamFromHydroPowerPlants = [] if UpstreamFromHydroPowerPlants is None else UpstreamFromHydroPowerPlants
+        if UpstreamFromHydroPowerPlants is not None:
+            self.UpstreamFromHydroPowerPlants = UpstreamFromHydroPowerPlants
 
-        self._InflowForecasts = []
-        self.InflowForecasts = [] if InflowForecasts is None else InflowForecasts
+        if InflowForecasts is not None:
+            self.InflowForecasts = InflowForecasts
 
         self._SpillsFromReservoir = None
         self.SpillsFromReservoir = SpillsFromReservoir
 
-        self._SpillsIntoReservoirs = []
-        self.SpillsIntoReservoirs = [] if SpillsIntoReservoirs is None else SpillsIntoReservoirs
+        if SpillsIntoReservoirs is not None:
+            self.SpillsIntoReservoirs = SpillsIntoReservoirs
 
         super(Reservoir, self).__init__(*args, **kw_args)
 
@@ -108,6 +109,7 @@ class Reservoir(PowerSystemResource):
     _enums = {"spillWayGateType": "SpillwayGateType"}
     _refs = ["LevelVsVolumeCurves", "TargetLevelSchedule", "HydroPowerPlants", "UpstreamFromHydroPowerPlants", "InflowForecasts", "SpillsFromReservoir", "SpillsIntoReservoirs"]
     _many_refs = ["LevelVsVolumeCurves", "HydroPowerPlants", "UpstreamFromHydroPowerPlants", "InflowForecasts", "SpillsIntoReservoirs"]
+    _inverses = {"LevelVsVolumeCurves": "Reservoir", "TargetLevelSchedule": "Reservoir", "HydroPowerPlants": "Reservoir", "UpstreamFromHydroPowerPlants": "GenSourcePumpDischargeReservoir", "InflowForecasts": "Reservoir", "SpillsFromReservoir": "SpillsIntoReservoirs", "SpillsIntoReservoirs": "SpillsFromReservoir"}
 
     def getLevelVsVolumeCurves(self):
         """A reservoir may have a level versus volume relationship.
@@ -115,7 +117,8 @@ class Reservoir(PowerSystemResource):
         return self._LevelVsVolumeCurves
 
     def setLevelVsVolumeCurves(self, value):
-        for x in self._LevelVsVolumeCurves:
+        value = RefList(value)
+        for x in list(self._LevelVsVolumeCurves):
             x.Reservoir = None
         for y in value:
             y._Reservoir = self
@@ -153,7 +156,8 @@ class Reservoir(PowerSystemResource):
         return self._HydroPowerPlants
 
     def setHydroPowerPlants(self, value):
-        for x in self._HydroPowerPlants:
+        value = RefList(value)
+        for x in list(self._HydroPowerPlants):
             x.Reservoir = None
         for y in value:
             y._Reservoir = self
@@ -175,7 +179,8 @@ class Reservoir(PowerSystemResource):
         return self._UpstreamFromHydroPowerPlants
 
     def setUpstreamFromHydroPowerPlants(self, value):
-        for x in self._UpstreamFromHydroPowerPlants:
+        value = RefList(value)
+        for x in list(self._UpstreamFromHydroPowerPlants):
             x.GenSourcePumpDischargeReservoir = None
         for y in value:
             y._GenSourcePumpDischargeReservoir = self
@@ -197,7 +202,8 @@ class Reservoir(PowerSystemResource):
         return self._InflowForecasts
 
     def setInflowForecasts(self, value):
-        for x in self._InflowForecasts:
+        value = RefList(value)
+        for x in list(self._InflowForecasts):
             x.Reservoir = None
         for y in value:
             y._Reservoir = self
@@ -220,13 +226,12 @@ class Reservoir(PowerSystemResource):
 
     def setSpillsFromReservoir(self, value):
         if self._SpillsFromReservoir is not None:
-            filtered = [x for x in self.SpillsFromReservoir.SpillsIntoReservoirs if x != self]
-            self._SpillsFromReservoir._SpillsIntoReservoirs = filtered
+            self._SpillsFromReservoir._SpillsIntoReservoirs.discard(self)
 
         self._SpillsFromReservoir = value
         if self._SpillsFromReservoir is not None:
             if self not in self._SpillsFromReservoir._SpillsIntoReservoirs:
-                self._SpillsFromReservoir._SpillsIntoReservoirs.append(self)
+                self._SpillsFromReservoir._reflist("_SpillsIntoReservoirs").append(self)
 
     SpillsFromReservoir = property(getSpillsFromReservoir, setSpillsFromReservoir)
 
@@ -236,7 +241,8 @@ class Reservoir(PowerSystemResource):
         return self._SpillsIntoReservoirs
 
     def setSpillsIntoReservoirs(self, value):
-        for x in self._SpillsIntoReservoirs:
+        value = RefList(value)
+        for x in list(self._SpillsIntoReservoirs):
             x.SpillsFromReservoir = None
         for y in value:
             y._SpillsFromReservoir = self
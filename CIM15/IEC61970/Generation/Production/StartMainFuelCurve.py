@@ -44,6 +44,7 @@ class StartMainFuelCurve(Curve):
     _enums = {"mainFuelType": "FuelType"}
     _refs = ["StartupModel"]
     _many_refs = []
+    _inverses = {"StartupModel": "StartMainFuelCurve"}
 
     def getStartupModel(self):
         """The unit's startup model may have a startup main fuel curve
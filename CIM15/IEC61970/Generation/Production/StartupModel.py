@@ -92,6 +92,7 @@ class StartupModel(IdentifiedObject):
     _enums = {}
     _refs = ["StartRampCurve", "StartMainFuelCurve", "StartIgnFuelCurve", "ThermalGeneratingUnit"]
     _many_refs = []
+    _inverses = {"StartRampCurve": "StartupModel", "StartMainFuelCurve": "StartupModel", "StartIgnFuelCurve": "StartupModel", "ThermalGeneratingUnit": "StartupModel"}
 
     def getStartRampCurve(self):
         """The unit's startup model may have a startup ramp curve
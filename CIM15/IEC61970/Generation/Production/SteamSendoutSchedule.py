@@ -40,6 +40,7 @@ class SteamSendoutSchedule(RegularIntervalSchedule):
     _enums = {}
     _refs = ["CogenerationPlant"]
     _many_refs = []
+    _inverses = {"CogenerationPlant": "SteamSendoutSchedule"}
 
     def getCogenerationPlant(self):
         """A cogeneration plant has a steam sendout schedule
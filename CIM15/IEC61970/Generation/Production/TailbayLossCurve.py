@@ -40,6 +40,7 @@ class TailbayLossCurve(Curve):
     _enums = {}
     _refs = ["HydroGeneratingUnit"]
     _many_refs = []
+    _inverses = {"HydroGeneratingUnit": "TailbayLossCurve"}
 
     def getHydroGeneratingUnit(self):
         """A hydro generating unit has a tailbay loss curve
@@ -48,13 +49,12 @@ class TailbayLossCurve(Curve):
 
     def setHydroGeneratingUnit(self, value):
         if self._HydroGeneratingUnit is not None:
-            filtered = [x for x in self.HydroGeneratingUnit.TailbayLossCurve if x != self]
-            self._HydroGeneratingUnit._TailbayLossCurve = filtered
+            self._HydroGeneratingUnit._TailbayLossCurve.discard(self)
 
         self._HydroGeneratingUnit = value
         if self._HydroGeneratingUnit is not None:
             if self not in self._HydroGeneratingUnit._TailbayLossCurve:
-                self._HydroGeneratingUnit._TailbayLossCurve.append(self)
+                self._HydroGeneratingUnit._reflist("_TailbayLossCurve").append(self)
 
     HydroGeneratingUnit = property(getHydroGeneratingUnit, setHydroGeneratingUnit)
 
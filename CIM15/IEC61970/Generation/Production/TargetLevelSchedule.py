@@ -48,6 +48,7 @@ class TargetLevelSchedule(Curve):
     _enums = {}
     _refs = ["Reservoir"]
     _many_refs = []
+    _inverses = {"Reservoir": "TargetLevelSchedule"}
 
     def getReservoir(self):
         """A reservoir may have a water level target schedule.
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Generation.Production.GeneratingUnit import GeneratingUnit
+from CIM15.Element import RefList
 
 class ThermalGeneratingUnit(GeneratingUnit):
     """A generating unit whose prime mover could be a steam turbine, combustion turbine, or diesel engine.A generating unit whose prime mover could be a steam turbine, combustion turbine, or diesel engine.
@@ -53,17 +54,17 @@ class ThermalGeneratingUnit(GeneratingUnit):
         self._ShutdownCurve = None
         self.ShutdownCurve = ShutdownCurve
 
-        self._FossilFuels = []
-        self.FossilFuels = [] if FossilFuels is None else FossilFuels
+        if FossilFuels is not None:
+            self.FossilFuels = FossilFuels
 
         self._HeatRateCurve = None
         self.HeatRateCurve = HeatRateCurve
 
-        self._FuelAllocationSchedules = []
-        self.FuelAllocationSchedules = [] if FuelAllocationSchedules is None else FuelAllocationSchedules
+        if FuelAllocationSchedules is not None:
+            self.FuelAllocationSchedules = FuelAllocationSchedules
 
-        self._EmissionCurves = []
-        self.EmissionCurves = [] if EmissionCurves is None else EmissionCurves
+        if EmissionCurves is not None:
+            self.EmissionCurves = EmissionCurves
 
         self._HeatInputCurve = None
         self.HeatInputCurve = HeatInputCurve
@@ -77,8 +78,8 @@ class ThermalGeneratingUnit(GeneratingUnit):
         self._StartupModel = None
         self.StartupModel = StartupModel
 
-        self._EmmissionAccounts = []
-        self.EmmissionAccounts = [] if EmmissionAccounts is None else EmmissionAccounts
+        if EmmissionAccounts is not None:
+            self.EmmissionAccounts = EmmissionAccounts
 
         super(ThermalGeneratingUnit, self).__init__(*args, **kw_args)
 
@@ -88,6 +89,7 @@ class ThermalGeneratingUnit(GeneratingUnit):
     _enums = {}
     _refs = ["CAESPlant", "CogenerationPlant", "ShutdownCurve", "FossilFuels", "HeatRateCurve", "FuelAllocationSchedules", "EmissionCurves", "HeatInputCurve", "CombinedCyclePlant", "IncrementalHeatRateCurve", "StartupModel", "EmmissionAccounts"]
     _many_refs = ["FossilFuels", "FuelAllocationSchedules", "EmissionCurves", "EmmissionAccounts"]
+    _inverses = {"CAESPlant": "ThermalGeneratingUnit", "CogenerationPlant": "ThermalGeneratingUnits", "ShutdownCurve": "ThermalGeneratingUnit", "FossilFuels": "ThermalGeneratingUnit", "HeatRateCurve": "ThermalGeneratingUnit", "FuelAllocationSchedules": "ThermalGeneratingUnit", "EmissionCurves": "ThermalGeneratingUnit", "HeatInputCurve": "ThermalGeneratingUnit", "CombinedCyclePlant": "ThermalGeneratingUnits", "IncrementalHeatRateCurve": "ThermalGeneratingUnit", "StartupModel": "ThermalGeneratingUnit", "EmmissionAccounts": "ThermalGeneratingUnit"}
 
     def getCAESPlant(self):
         """A thermal generating unit may be a member of a compressed air energy storage plant
@@ -112,13 +114,12 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setCogenerationPlant(self, value):
         if self._CogenerationPlant is not None:
-            filtered = [x for x in self.CogenerationPlant.ThermalGeneratingUnits if x != self]
-            self._CogenerationPlant._ThermalGeneratingUnits = filtered
+            self._CogenerationPlant._ThermalGeneratingUnits.discard(self)
 
         self._CogenerationPlant = value
         if self._CogenerationPlant is not None:
             if self not in self._CogenerationPlant._ThermalGeneratingUnits:
-                self._CogenerationPlant._ThermalGeneratingUnits.append(self)
+                self._CogenerationPlant._reflist("_ThermalGeneratingUnits").append(self)
 
     CogenerationPlant = property(getCogenerationPlant, setCogenerationPlant)
 
@@ -144,7 +145,8 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._FossilFuels
 
     def setFossilFuels(self, value):
-        for x in self._FossilFuels:
+        value = RefList(value)
+        for x in list(self._FossilFuels):
             x.ThermalGeneratingUnit = None
         for y in value:
             y._ThermalGeneratingUnit = self
@@ -182,7 +184,8 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._FuelAllocationSchedules
 
     def setFuelAllocationSchedules(self, value):
-        for x in self._FuelAllocationSchedules:
+        value = RefList(value)
+        for x in list(self._FuelAllocationSchedules):
             x.ThermalGeneratingUnit = None
         for y in value:
             y._ThermalGeneratingUnit = self
@@ -204,7 +207,8 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._EmissionCurves
 
     def setEmissionCurves(self, value):
-        for x in self._EmissionCurves:
+        value = RefList(value)
+        for x in list(self._EmissionCurves):
             x.ThermalGeneratingUnit = None
         for y in value:
             y._ThermalGeneratingUnit = self
@@ -243,13 +247,12 @@ class ThermalGeneratingUnit(GeneratingUnit):
 
     def setCombinedCyclePlant(self, value):
         if self._CombinedCyclePlant is not None:
-            filtered = [x for x in self.CombinedCyclePlant.ThermalGeneratingUnits if x != self]
-            self._CombinedCyclePlant._ThermalGeneratingUnits = filtered
+            self._CombinedCyclePlant._ThermalGeneratingUnits.discard(self)
 
         self._CombinedCyclePlant = value
         if self._CombinedCyclePlant is not None:
             if self not in self._CombinedCyclePlant._ThermalGeneratingUnits:
-                self._CombinedCyclePlant._ThermalGeneratingUnits.append(self)
+                self._CombinedCyclePlant._reflist("_ThermalGeneratingUnits").append(self)
 
     CombinedCyclePlant = property(getCombinedCyclePlant, setCombinedCyclePlant)
 
@@ -291,7 +294,8 @@ class ThermalGeneratingUnit(GeneratingUnit):
         return self._EmmissionAccounts
 
     def setEmmissionAccounts(self, value):
-        for x in self._EmmissionAccounts:
+        value = RefList(value)
+        for x in list(self._EmmissionAccounts):
             x.ThermalGeneratingUnit = None
         for y in value:
             y._ThermalGeneratingUnit = self
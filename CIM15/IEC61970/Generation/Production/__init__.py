@@ -21,41 +21,8 @@
 """The production package is responsible for classes which describe various kinds of generators. These classes also provide production costing information which is used to economically allocate demand among committed units and calculate reserve quantities.
 """
 
-from CIM15.IEC61970.Generation.Production.Reservoir import Reservoir
-from CIM15.IEC61970.Generation.Production.CogenerationPlant import CogenerationPlant
-from CIM15.IEC61970.Generation.Production.GenUnitOpSchedule import GenUnitOpSchedule
-from CIM15.IEC61970.Generation.Production.FuelAllocationSchedule import FuelAllocationSchedule
-from CIM15.IEC61970.Generation.Production.GrossToNetActivePowerCurve import GrossToNetActivePowerCurve
-from CIM15.IEC61970.Generation.Production.LevelVsVolumeCurve import LevelVsVolumeCurve
-from CIM15.IEC61970.Generation.Production.StartRampCurve import StartRampCurve
-from CIM15.IEC61970.Generation.Production.NuclearGeneratingUnit import NuclearGeneratingUnit
-from CIM15.IEC61970.Generation.Production.EmissionCurve import EmissionCurve
-from CIM15.IEC61970.Generation.Production.HydroPumpOpSchedule import HydroPumpOpSchedule
-from CIM15.IEC61970.Generation.Production.SteamSendoutSchedule import SteamSendoutSchedule
-from CIM15.IEC61970.Generation.Production.TargetLevelSchedule import TargetLevelSchedule
-from CIM15.IEC61970.Generation.Production.CombinedCyclePlant import CombinedCyclePlant
-from CIM15.IEC61970.Generation.Production.HeatRateCurve import HeatRateCurve
-from CIM15.IEC61970.Generation.Production.ThermalGeneratingUnit import ThermalGeneratingUnit
-from CIM15.IEC61970.Generation.Production.EmissionAccount import EmissionAccount
-from CIM15.IEC61970.Generation.Production.PenstockLossCurve import PenstockLossCurve
-from CIM15.IEC61970.Generation.Production.StartupModel import StartupModel
-from CIM15.IEC61970.Generation.Production.HydroGeneratingUnit import HydroGeneratingUnit
-from CIM15.IEC61970.Generation.Production.GenUnitOpCostCurve import GenUnitOpCostCurve
-from CIM15.IEC61970.Generation.Production.IncrementalHeatRateCurve import IncrementalHeatRateCurve
-from CIM15.IEC61970.Generation.Production.FossilFuel import FossilFuel
-from CIM15.IEC61970.Generation.Production.GeneratingUnit import GeneratingUnit
-from CIM15.IEC61970.Generation.Production.StartIgnFuelCurve import StartIgnFuelCurve
-from CIM15.IEC61970.Generation.Production.StartMainFuelCurve import StartMainFuelCurve
-from CIM15.IEC61970.Generation.Production.TailbayLossCurve import TailbayLossCurve
-from CIM15.IEC61970.Generation.Production.HydroPump import HydroPump
-from CIM15.IEC61970.Generation.Production.InflowForecast import InflowForecast
-from CIM15.IEC61970.Generation.Production.HydroGeneratingEfficiencyCurve import HydroGeneratingEfficiencyCurve
-from CIM15.IEC61970.Generation.Production.ShutdownCurve import ShutdownCurve
-from CIM15.IEC61970.Generation.Production.HydroPowerPlant import HydroPowerPlant
-from CIM15.IEC61970.Generation.Production.CAESPlant import CAESPlant
-from CIM15.IEC61970.Generation.Production.AirCompressor import AirCompressor
-from CIM15.IEC61970.Generation.Production.HeatInputCurve import HeatInputCurve
-from CIM15.IEC61970.Generation.Production.WindGeneratingUnit import WindGeneratingUnit
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Production"
 nsPrefix = "cimProduction"
@@ -129,3 +96,42 @@ class Emission(float):
     """Quantity of emission per fuel heat content
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "Reservoir",
+    "CogenerationPlant",
+    "GenUnitOpSchedule",
+    "FuelAllocationSchedule",
+    "GrossToNetActivePowerCurve",
+    "LevelVsVolumeCurve",
+    "StartRampCurve",
+    "NuclearGeneratingUnit",
+    "EmissionCurve",
+    "HydroPumpOpSchedule",
+    "SteamSendoutSchedule",
+    "TargetLevelSchedule",
+    "CombinedCyclePlant",
+    "HeatRateCurve",
+    "ThermalGeneratingUnit",
+    "EmissionAccount",
+    "PenstockLossCurve",
+    "StartupModel",
+    "HydroGeneratingUnit",
+    "GenUnitOpCostCurve",
+    "IncrementalHeatRateCurve",
+    "FossilFuel",
+    "GeneratingUnit",
+    "StartIgnFuelCurve",
+    "StartMainFuelCurve",
+    "TailbayLossCurve",
+    "HydroPump",
+    "InflowForecast",
+    "HydroGeneratingEfficiencyCurve",
+    "ShutdownCurve",
+    "HydroPowerPlant",
+    "CAESPlant",
+    "AirCompressor",
+    "HeatInputCurve",
+    "WindGeneratingUnit",
+])
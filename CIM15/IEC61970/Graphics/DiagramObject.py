@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class DiagramObject(IdentifiedObject):
     """This class defines an object that defines one or more points in a given space. This object can be associated with anything that subclasses Identified Object in IEC 61970-301This class defines an object that defines one or more points in a given space. This object can be associated with anything that subclasses Identified Object in IEC 61970-301
@@ -53,8 +54,8 @@ class DiagramObject(IdentifiedObject):
         #: The drawing order of this element. The higher the number, the later the element is drawn in sequence. This is used to ensure that elements that overlap are rendered in the correct order.
         self.drawingOrder = drawingOrder
 
-        self._VisibilityLayers = []
-        self.VisibilityLayers = [] if VisibilityLayers is None else VisibilityLayers
+        if VisibilityLayers is not None:
+            self.VisibilityLayers = VisibilityLayers
 
         self._IdentifiedObject = None
         self.IdentifiedObject = IdentifiedObject
@@ -62,8 +63,8 @@ class DiagramObject(IdentifiedObject):
         self._DiagramObjectStyle = None
         self.DiagramObjectStyle = DiagramObjectStyle
 
-        self._DiagramObjectPoints = []
-        self.DiagramObjectPoints = [] if DiagramObjectPoints is None else DiagramObjectPoints
+        if DiagramObjectPoints is not None:
+            self.DiagramObjectPoints = DiagramObjectPoints
 
         self._Diagram = None
         self.Diagram = Diagram
@@ -76,6 +77,7 @@ class DiagramObject(IdentifiedObject):
     _enums = {}
     _refs = ["VisibilityLayers", "IdentifiedObject", "DiagramObjectStyle", "DiagramObjectPoints", "Diagram"]
     _many_refs = ["VisibilityLayers", "DiagramObjectPoints"]
+    _inverses = {"VisibilityLayers": "DiagramObjects", "IdentifiedObject": "DiagramObjects", "DiagramObjectStyle": "DiagramObjects", "DiagramObjectPoints": "DiagramObject", "Diagram": "DiagramObjects"}
 
     def getVisibilityLayers(self):
         """A diagram object can be part of multiple visibility layers
@@ -84,20 +86,19 @@ class DiagramObject(IdentifiedObject):
 
     def setVisibilityLayers(self, value):
         for p in self._VisibilityLayers:
-            filtered = [q for q in p.DiagramObjects if q != self]
-            self._VisibilityLayers._DiagramObjects = filtered
+            p._DiagramObjects.discard(self)
         for r in value:
             if self not in r._DiagramObjects:
-                r._DiagramObjects.append(self)
-        self._VisibilityLayers = value
+                r._reflist("_DiagramObjects").append(self)
+        self._VisibilityLayers = RefList(value)
 
     VisibilityLayers = property(getVisibilityLayers, setVisibilityLayers)
 
     def addVisibilityLayers(self, *VisibilityLayers):
         for obj in VisibilityLayers:
             if self not in obj._DiagramObjects:
-                obj._DiagramObjects.append(self)
-            self._VisibilityLayers.append(obj)
+                obj._reflist("_DiagramObjects").append(self)
+            self._reflist("_VisibilityLayers").append(obj)
 
     def removeVisibilityLayers(self, *VisibilityLayers):
         for obj in VisibilityLayers:
@@ -112,13 +113,12 @@ class DiagramObject(IdentifiedObject):
 
     def setIdentifiedObject(self, value):
         if self._IdentifiedObject is not None:
-            filtered = [x for x in self.IdentifiedObject.DiagramObjects if x != self]
-            self._IdentifiedObject._DiagramObjects = filtered
+            self._IdentifiedObject._DiagramObjects.discard(self)
 
         self._IdentifiedObject = value
         if self._IdentifiedObject is not None:
             if self not in self._IdentifiedObject._DiagramObjects:
-                self._IdentifiedObject._DiagramObjects.append(self)
+                self._IdentifiedObject._reflist("_DiagramObjects").append(self)
 
     IdentifiedObject = property(getIdentifiedObject, setIdentifiedObject)
 
@@ -129,13 +129,12 @@ class DiagramObject(IdentifiedObject):
 
     def setDiagramObjectStyle(self, value):
         if self._DiagramObjectStyle is not None:
-            filtered = [x for x in self.DiagramObjectStyle.DiagramObjects if x != self]
-            self._DiagramObjectStyle._DiagramObjects = filtered
+            self._DiagramObjectStyle._DiagramObjects.discard(self)
 
         self._DiagramObjectStyle = value
         if self._DiagramObjectStyle is not None:
             if self not in self._DiagramObjectStyle._DiagramObjects:
-                self._DiagramObjectStyle._DiagramObjects.append(self)
+                self._DiagramObjectStyle._reflist("_DiagramObjects").append(self)
 
     DiagramObjectStyle = property(getDiagramObjectStyle, setDiagramObjectStyle)
 
@@ -145,7 +144,8 @@ class DiagramObject(IdentifiedObject):
         return self._DiagramObjectPoints
 
     def setDiagramObjectPoints(self, value):
-        for x in self._DiagramObjectPoints:
+        value = RefList(value)
+        for x in list(self._DiagramObjectPoints):
             x.DiagramObject = None
         for y in value:
             y._DiagramObject = self
@@ -168,13 +168,12 @@ class DiagramObject(IdentifiedObject):
 
     def setDiagram(self, value):
         if self._Diagram is not None:
-            filtered = [x for x in self.Diagram.DiagramObjects if x != self]
-            self._Diagram._DiagramObjects = filtered
+            self._Diagram._DiagramObjects.discard(self)
 
         self._Diagram = value
         if self._Diagram is not None:
             if self not in self._Diagram._DiagramObjects:
-                self._Diagram._DiagramObjects.append(self)
+                self._Diagram._reflist("_DiagramObjects").append(self)
 
     Diagram = property(getDiagram, setDiagram)
 
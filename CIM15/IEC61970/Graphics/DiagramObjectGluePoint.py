@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, RefList
 
 class DiagramObjectGluePoint(Element):
     """This is used for grouping DiagramObjectPoints from different DiagramObjects that are considered to be &lsquo;glued&rsquo; together in a diagram even if they are not at the exact same coordinates.This is used for grouping DiagramObjectPoints from different DiagramObjects that are considered to be &lsquo;glued&rsquo; together in a diagram even if they are not at the exact same coordinates.
@@ -29,8 +29,8 @@ class DiagramObjectGluePoint(Element):
 
         @param DiagramObjectPoints: A diagram object glue point is associated with 2 or more object points that are considered to be 'glued' together.
         """
-        self._DiagramObjectPoints = []
-        self.DiagramObjectPoints = [] if DiagramObjectPoints is None else DiagramObjectPoints
+        if DiagramObjectPoints is not None:
+            self.DiagramObjectPoints = DiagramObjectPoints
 
         super(DiagramObjectGluePoint, self).__init__(*args, **kw_args)
 
@@ -40,6 +40,7 @@ class DiagramObjectGluePoint(Element):
     _enums = {}
     _refs = ["DiagramObjectPoints"]
     _many_refs = ["DiagramObjectPoints"]
+    _inverses = {"DiagramObjectPoints": "DiagramObjectGluePoint"}
 
     def getDiagramObjectPoints(self):
         """A diagram object glue point is associated with 2 or more object points that are considered to be 'glued' together.
@@ -47,7 +48,8 @@ class DiagramObjectGluePoint(Element):
         return self._DiagramObjectPoints
 
     def setDiagramObjectPoints(self, value):
-        for x in self._DiagramObjectPoints:
+        value = RefList(value)
+        for x in list(self._DiagramObjectPoints):
             x.DiagramObjectGluePoint = None
         for y in value:
             y._DiagramObjectGluePoint = self
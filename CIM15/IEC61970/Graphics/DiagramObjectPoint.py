@@ -60,6 +60,7 @@ class DiagramObjectPoint(Element):
     _enums = {}
     _refs = ["DiagramObjectGluePoint", "DiagramObject"]
     _many_refs = []
+    _inverses = {"DiagramObjectGluePoint": "DiagramObjectPoints", "DiagramObject": "DiagramObjectPoints"}
 
     def getDiagramObjectGluePoint(self):
         """The 'glue' point that this point is associated with
@@ -68,13 +69,12 @@ class DiagramObjectPoint(Element):
 
     def setDiagramObjectGluePoint(self, value):
         if self._DiagramObjectGluePoint is not None:
-            filtered = [x for x in self.DiagramObjectGluePoint.DiagramObjectPoints if x != self]
-            self._DiagramObjectGluePoint._DiagramObjectPoints = filtered
+            self._DiagramObjectGluePoint._DiagramObjectPoints.discard(self)
 
         self._DiagramObjectGluePoint = value
         if self._DiagramObjectGluePoint is not None:
             if self not in self._DiagramObjectGluePoint._DiagramObjectPoints:
-                self._DiagramObjectGluePoint._DiagramObjectPoints.append(self)
+                self._DiagramObjectGluePoint._reflist("_DiagramObjectPoints").append(self)
 
     DiagramObjectGluePoint = property(getDiagramObjectGluePoint, setDiagramObjectGluePoint)
 
@@ -85,13 +85,12 @@ class DiagramObjectPoint(Element):
 
     def setDiagramObject(self, value):
         if self._DiagramObject is not None:
-            filtered = [x for x in self.DiagramObject.DiagramObjectPoints if x != self]
-            self._DiagramObject._DiagramObjectPoints = filtered
+            self._DiagramObject._DiagramObjectPoints.discard(self)
 
         self._DiagramObject = value
         if self._DiagramObject is not None:
             if self not in self._DiagramObject._DiagramObjectPoints:
-                self._DiagramObject._DiagramObjectPoints.append(self)
+                self._DiagramObject._reflist("_DiagramObjectPoints").append(self)
 
     DiagramObject = property(getDiagramObject, setDiagramObject)
 
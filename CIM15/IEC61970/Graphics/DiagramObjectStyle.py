@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class DiagramObjectStyle(IdentifiedObject):
     """A reference to a style used by the originating system for a DiagramObject.  A DiagramObjectStyle describes information such as  &bull; line thickness &bull; shape, e.g circle, rectangle ... &bull; colorA reference to a style used by the originating system for a DiagramObject.  A DiagramObjectStyle describes information such as  &bull; line thickness &bull; shape, e.g circle, rectangle ... &bull; color
@@ -29,8 +30,8 @@ class DiagramObjectStyle(IdentifiedObject):
 
         @param DiagramObjects: A style can be assigned to multiple DiagramObjects
         """
-        self._DiagramObjects = []
-        self.DiagramObjects = [] if DiagramObjects is None else DiagramObjects
+        if DiagramObjects is not None:
+            self.DiagramObjects = DiagramObjects
 
         super(DiagramObjectStyle, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class DiagramObjectStyle(IdentifiedObject):
     _enums = {}
     _refs = ["DiagramObjects"]
     _many_refs = ["DiagramObjects"]
+    _inverses = {"DiagramObjects": "DiagramObjectStyle"}
 
     def getDiagramObjects(self):
         """A style can be assigned to multiple DiagramObjects
@@ -47,7 +49,8 @@ class DiagramObjectStyle(IdentifiedObject):
         return self._DiagramObjects
 
     def setDiagramObjects(self, value):
-        for x in self._DiagramObjects:
+        value = RefList(value)
+        for x in list(self._DiagramObjects):
             x.DiagramObjectStyle = None
         for y in value:
             y._DiagramObjectStyle = self
@@ -40,4 +40,5 @@ class TextDiagramObject(DiagramObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
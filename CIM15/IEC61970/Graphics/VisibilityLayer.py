@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class VisibilityLayer(IdentifiedObject):
     """Layers are typically used for grouping diagram objects according to themes and scales. Themes are used to display or hide certain information (e.g., lakes, borders), while scales are used for hiding or displaying information depending on the current zoom level (hide text when it is too small to be read, or when it exceeds the screen size). This is also called de-cluttering.  CIM based graphics exchange will support an m:n relationship between diagram objects and layers. It will be the task of the importing system to convert an m:n case into an appropriate 1:n representation if the importing system does not support m:n.Layers are typically used for grouping diagram objects according to themes and scales. Themes are used to display or hide certain information (e.g., lakes, borders), while scales are used for hiding or displaying information depending on the current zoom level (hide text when it is too small to be read, or when it exceeds the screen size). This is also called de-cluttering.  CIM based graphics exchange will support an m:n relationship between diagram objects and layers. It will be the task of the importing system to convert an m:n case into an appropriate 1:n representation if the importing system does not support m:n.
@@ -33,8 +34,8 @@ class VisibilityLayer(IdentifiedObject):
         #: The drawing order for this layer.  As with the drawingOrder for diagram objects, the higher the number, the later the layer and the objects within it are rendered.
         self.drawingOrder = drawingOrder
 
-        self._DiagramObjects = []
-        self.DiagramObjects = [] if DiagramObjects is None else DiagramObjects
+        if DiagramObjects is not None:
+            self.DiagramObjects = DiagramObjects
 
         super(VisibilityLayer, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class VisibilityLayer(IdentifiedObject):
     _enums = {}
     _refs = ["DiagramObjects"]
     _many_refs = ["DiagramObjects"]
+    _inverses = {"DiagramObjects": "VisibilityLayers"}
 
     def getDiagramObjects(self):
         """A visibility layer can contain one or more diagram objects
@@ -52,20 +54,19 @@ class VisibilityLayer(IdentifiedObject):
 
     def setDiagramObjects(self, value):
         for p in self._DiagramObjects:
-            filtered = [q for q in p.VisibilityLayers if q != self]
-            self._DiagramObjects._VisibilityLayers = filtered
+            p._VisibilityLayers.discard(self)
         for r in value:
             if self not in r._VisibilityLayers:
-                r._VisibilityLayers.append(self)
-        self._DiagramObjects = value
+                r._reflist("_VisibilityLayers").append(self)
+        self._DiagramObjects = RefList(value)
 
     DiagramObjects = property(getDiagramObjects, setDiagramObjects)
 
     def addDiagramObjects(self, *DiagramObjects):
         for obj in DiagramObjects:
             if self not in obj._VisibilityLayers:
-                obj._VisibilityLayers.append(self)
-            self._DiagramObjects.append(obj)
+                obj._reflist("_VisibilityLayers").append(self)
+            self._reflist("_DiagramObjects").append(obj)
 
     def removeDiagramObjects(self, *DiagramObjects):
         for obj in DiagramObjects:
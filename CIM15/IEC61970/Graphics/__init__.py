@@ -19,12 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM15.IEC61970.Graphics.TextDiagramObject import TextDiagramObject
-from CIM15.IEC61970.Graphics.DiagramObjectGluePoint import DiagramObjectGluePoint
-from CIM15.IEC61970.Graphics.DiagramObject import DiagramObject
-from CIM15.IEC61970.Graphics.DiagramObjectStyle import DiagramObjectStyle
-from CIM15.IEC61970.Graphics.DiagramObjectPoint import DiagramObjectPoint
-from CIM15.IEC61970.Graphics.VisibilityLayer import VisibilityLayer
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Graphics"
 nsPrefix = "cimGraphics"
@@ -34,3 +30,13 @@ class OrientationKind(str):
     """Values are: negative, positive
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "TextDiagramObject",
+    "DiagramObjectGluePoint",
+    "DiagramObject",
+    "DiagramObjectStyle",
+    "DiagramObjectPoint",
+    "VisibilityLayer",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class AssetModelCatalogue(IdentifiedObject):
     """Catalogue of available types of products and materials that are used to build or install, maintain or operate an Asset. Each catalogue item is for a specific product (AssetModel) available from a specific supplier.Catalogue of available types of products and materials that are used to build or install, maintain or operate an Asset. Each catalogue item is for a specific product (AssetModel) available from a specific supplier.
@@ -30,8 +31,8 @@ class AssetModelCatalogue(IdentifiedObject):
         @param AssetModelCatalogueItems:
         @param status:
         """
-        self._AssetModelCatalogueItems = []
-        self.AssetModelCatalogueItems = [] if AssetModelCatalogueItems is None else AssetModelCatalogueItems
+        if AssetModelCatalogueItems is not None:
+            self.AssetModelCatalogueItems = AssetModelCatalogueItems
 
         self.status = status
 
@@ -43,13 +44,15 @@ class AssetModelCatalogue(IdentifiedObject):
     _enums = {}
     _refs = ["AssetModelCatalogueItems", "status"]
     _many_refs = ["AssetModelCatalogueItems"]
+    _inverses = {"AssetModelCatalogueItems": "AssetModelCatalogue"}
 
     def getAssetModelCatalogueItems(self):
         
         return self._AssetModelCatalogueItems
 
     def setAssetModelCatalogueItems(self, value):
-        for x in self._AssetModelCatalogueItems:
+        value = RefList(value)
+        for x in list(self._AssetModelCatalogueItems):
             x.AssetModelCatalogue = None
         for y in value:
             y._AssetModelCatalogue = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.ProductAssetModel import ProductAssetModel
+from CIM15.Element import RefList
 
 class TransformerAssetModel(ProductAssetModel):
     """Documentation for a type of a transformer of a particular product model made by a manufacturer.Documentation for a type of a transformer of a particular product model made by a manufacturer.
@@ -86,8 +87,8 @@ class TransformerAssetModel(ProductAssetModel):
         #: Weight of solid insultation in transformer.
         self.solidInsulationWeight = solidInsulationWeight
 
-        self._TransformerAssets = []
-        self.TransformerAssets = [] if TransformerAssets is None else TransformerAssets
+        if TransformerAssets is not None:
+            self.TransformerAssets = TransformerAssets
 
         self._TransformerInfo = None
         self.TransformerInfo = TransformerInfo
@@ -100,13 +101,15 @@ class TransformerAssetModel(ProductAssetModel):
     _enums = {"constructionKind": "TransformerConstructionKind", "windingInsulationKind": "WindingInsulationKind", "function": "TransformerFunctionKind", "oilPreservationKind": "OilPreservationKind", "coreKind": "TransformerCoreKind"}
     _refs = ["TransformerAssets", "TransformerInfo"]
     _many_refs = ["TransformerAssets"]
+    _inverses = {"TransformerAssets": "TransformerAssetModel", "TransformerInfo": "TransformerAssetModels"}
 
     def getTransformerAssets(self):
         
         return self._TransformerAssets
 
     def setTransformerAssets(self, value):
-        for x in self._TransformerAssets:
+        value = RefList(value)
+        for x in list(self._TransformerAssets):
             x.TransformerAssetModel = None
         for y in value:
             y._TransformerAssetModel = self
@@ -128,13 +131,12 @@ class TransformerAssetModel(ProductAssetModel):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.TransformerAssetModels if x != self]
-            self._TransformerInfo._TransformerAssetModels = filtered
+            self._TransformerInfo._TransformerAssetModels.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
             if self not in self._TransformerInfo._TransformerAssetModels:
-                self._TransformerInfo._TransformerAssetModels.append(self)
+                self._TransformerInfo._reflist("_TransformerAssetModels").append(self)
 
     TransformerInfo = property(getTransformerInfo, setTransformerInfo)
 
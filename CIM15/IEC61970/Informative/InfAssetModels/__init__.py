@@ -19,9 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM15.IEC61970.Informative.InfAssetModels.AssetModelCatalogue import AssetModelCatalogue
-from CIM15.IEC61970.Informative.InfAssetModels.TransformerAssetModel import TransformerAssetModel
-from CIM15.IEC61970.Informative.InfAssetModels.AssetModelCatalogueItem import AssetModelCatalogueItem
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#InfAssetModels"
 nsPrefix = "cimInfAssetModels"
@@ -51,3 +50,10 @@ class TransformerFunctionKind(str):
     """Values are: autotransformer, secondaryTransformer, other, powerTransformer, voltageRegulator
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "AssetModelCatalogue",
+    "TransformerAssetModel",
+    "AssetModelCatalogueItem",
+])
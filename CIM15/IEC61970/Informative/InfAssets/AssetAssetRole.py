@@ -44,6 +44,7 @@ class AssetAssetRole(Role):
     _enums = {}
     _refs = ["ToAsset", "FromAsset"]
     _many_refs = []
+    _inverses = {"ToAsset": "FromAssetRoles", "FromAsset": "ToAssetRoles"}
 
     def getToAsset(self):
         
@@ -51,13 +52,12 @@ class AssetAssetRole(Role):
 
     def setToAsset(self, value):
         if self._ToAsset is not None:
-            filtered = [x for x in self.ToAsset.FromAssetRoles if x != self]
-            self._ToAsset._FromAssetRoles = filtered
+            self._ToAsset._FromAssetRoles.discard(self)
 
         self._ToAsset = value
         if self._ToAsset is not None:
             if self not in self._ToAsset._FromAssetRoles:
-                self._ToAsset._FromAssetRoles.append(self)
+                self._ToAsset._reflist("_FromAssetRoles").append(self)
 
     ToAsset = property(getToAsset, setToAsset)
 
@@ -67,13 +67,12 @@ class AssetAssetRole(Role):
 
     def setFromAsset(self, value):
         if self._FromAsset is not None:
-            filtered = [x for x in self.FromAsset.ToAssetRoles if x != self]
-            self._FromAsset._ToAssetRoles = filtered
+            self._FromAsset._ToAssetRoles.discard(self)
 
         self._FromAsset = value
         if self._FromAsset is not None:
             if self not in self._FromAsset._ToAssetRoles:
-                self._FromAsset._ToAssetRoles.append(self)
+                self._FromAsset._reflist("_ToAssetRoles").append(self)
 
     FromAsset = property(getFromAsset, setFromAsset)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Curve import Curve
+from CIM15.Element import RefList
 
 class AssetPropertyCurve(Curve):
     """An Asset Property that is described through curves rather than as a data point. The relationship is to be defined between an independent variable (X-axis) and one or two dependent variables (Y1-axis and Y2-axis).An Asset Property that is described through curves rather than as a data point. The relationship is to be defined between an independent variable (X-axis) and one or two dependent variables (Y1-axis and Y2-axis).
@@ -33,8 +34,8 @@ class AssetPropertyCurve(Curve):
         self._Specification = None
         self.Specification = Specification
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
         super(AssetPropertyCurve, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class AssetPropertyCurve(Curve):
     _enums = {}
     _refs = ["Specification", "Assets"]
     _many_refs = ["Assets"]
+    _inverses = {"Specification": "AssetPropertyCurves", "Assets": "AssetPropertyCurves"}
 
     def getSpecification(self):
         
@@ -51,13 +53,12 @@ class AssetPropertyCurve(Curve):
 
     def setSpecification(self, value):
         if self._Specification is not None:
-            filtered = [x for x in self.Specification.AssetPropertyCurves if x != self]
-            self._Specification._AssetPropertyCurves = filtered
+            self._Specification._AssetPropertyCurves.discard(self)
 
         self._Specification = value
         if self._Specification is not None:
             if self not in self._Specification._AssetPropertyCurves:
-                self._Specification._AssetPropertyCurves.append(self)
+                self._Specification._reflist("_AssetPropertyCurves").append(self)
 
     Specification = property(getSpecification, setSpecification)
 
@@ -67,20 +68,19 @@ class AssetPropertyCurve(Curve):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.AssetPropertyCurves if q != self]
-            self._Assets._AssetPropertyCurves = filtered
+            p._AssetPropertyCurves.discard(self)
         for r in value:
             if self not in r._AssetPropertyCurves:
-                r._AssetPropertyCurves.append(self)
-        self._Assets = value
+                r._reflist("_AssetPropertyCurves").append(self)
+        self._Assets = RefList(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
             if self not in obj._AssetPropertyCurves:
-                obj._AssetPropertyCurves.append(self)
-            self._Assets.append(obj)
+                obj._reflist("_AssetPropertyCurves").append(self)
+            self._reflist("_Assets").append(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
@@ -40,4 +40,5 @@ class BreakerInfo(SwitchInfo):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
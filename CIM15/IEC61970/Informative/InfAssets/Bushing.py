@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import RefList
 
 class Bushing(Asset):
     """Bushing asset.Bushing asset.
@@ -53,8 +54,8 @@ class Bushing(Asset):
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._BushingInsulationPFs = []
-        self.BushingInsulationPFs = [] if BushingInsulationPFs is None else BushingInsulationPFs
+        if BushingInsulationPFs is not None:
+            self.BushingInsulationPFs = BushingInsulationPFs
 
         super(Bushing, self).__init__(*args, **kw_args)
 
@@ -64,6 +65,7 @@ class Bushing(Asset):
     _enums = {"insulationKind": "BushingInsulationKind"}
     _refs = ["Terminal", "BushingInsulationPFs"]
     _many_refs = ["BushingInsulationPFs"]
+    _inverses = {"Terminal": "BushingInfo", "BushingInsulationPFs": "BushingInfo"}
 
     def getTerminal(self):
         
@@ -85,7 +87,8 @@ class Bushing(Asset):
         return self._BushingInsulationPFs
 
     def setBushingInsulationPFs(self, value):
-        for x in self._BushingInsulationPFs:
+        value = RefList(value)
+        for x in list(self._BushingInsulationPFs):
             x.BushingInfo = None
         for y in value:
             y._BushingInfo = self
@@ -51,6 +51,7 @@ class BushingInsulationPF(IdentifiedObject):
     _enums = {"testKind": "BushingInsulationPfTestKind"}
     _refs = ["status", "TransformerObservation", "BushingInfo"]
     _many_refs = []
+    _inverses = {"TransformerObservation": "BushingInsultationPFs", "BushingInfo": "BushingInsulationPFs"}
 
     status = None
 
@@ -60,13 +61,12 @@ class BushingInsulationPF(IdentifiedObject):
 
     def setTransformerObservation(self, value):
         if self._TransformerObservation is not None:
-            filtered = [x for x in self.TransformerObservation.BushingInsultationPFs if x != self]
-            self._TransformerObservation._BushingInsultationPFs = filtered
+            self._TransformerObservation._BushingInsultationPFs.discard(self)
 
         self._TransformerObservation = value
         if self._TransformerObservation is not None:
             if self not in self._TransformerObservation._BushingInsultationPFs:
-                self._TransformerObservation._BushingInsultationPFs.append(self)
+                self._TransformerObservation._reflist("_BushingInsultationPFs").append(self)
 
     TransformerObservation = property(getTransformerObservation, setTransformerObservation)
 
@@ -76,13 +76,12 @@ class BushingInsulationPF(IdentifiedObject):
 
     def setBushingInfo(self, value):
         if self._BushingInfo is not None:
-            filtered = [x for x in self.BushingInfo.BushingInsulationPFs if x != self]
-            self._BushingInfo._BushingInsulationPFs = filtered
+            self._BushingInfo._BushingInsulationPFs.discard(self)
 
         self._BushingInfo = value
         if self._BushingInfo is not None:
             if self not in self._BushingInfo._BushingInsulationPFs:
-                self._BushingInfo._BushingInsulationPFs.append(self)
+                self._BushingInfo._reflist("_BushingInsulationPFs").append(self)
 
     BushingInfo = property(getBushingInfo, setBushingInfo)
 
@@ -36,4 +36,5 @@ class Cabinet(AssetContainer):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
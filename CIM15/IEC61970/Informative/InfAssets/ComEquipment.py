@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import RefList
 
 class ComEquipment(Asset):
     """Communicaiton equipment assets other than media (such as gateways, routers, controllers, etc.).Communicaiton equipment assets other than media (such as gateways, routers, controllers, etc.).
@@ -29,8 +30,8 @@ class ComEquipment(Asset):
 
         @param EndDeviceFunctions: All device functions of this communication equipment.
         """
-        self._EndDeviceFunctions = []
-        self.EndDeviceFunctions = [] if EndDeviceFunctions is None else EndDeviceFunctions
+        if EndDeviceFunctions is not None:
+            self.EndDeviceFunctions = EndDeviceFunctions
 
         super(ComEquipment, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class ComEquipment(Asset):
     _enums = {}
     _refs = ["EndDeviceFunctions"]
     _many_refs = ["EndDeviceFunctions"]
+    _inverses = {"EndDeviceFunctions": "ComEquipment"}
 
     def getEndDeviceFunctions(self):
         """All device functions of this communication equipment.
@@ -47,7 +49,8 @@ class ComEquipment(Asset):
         return self._EndDeviceFunctions
 
     def setEndDeviceFunctions(self, value):
-        for x in self._EndDeviceFunctions:
+        value = RefList(value)
+        for x in list(self._EndDeviceFunctions):
             x.ComEquipment = None
         for y in value:
             y._ComEquipment = self
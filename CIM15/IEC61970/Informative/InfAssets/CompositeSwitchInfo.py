@@ -72,4 +72,5 @@ class CompositeSwitchInfo(AssetInfo):
     _enums = {"kind": "CompositeSwitchKind", "phaseCode": "PhaseCode"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -56,6 +56,7 @@ class ConductorAsset(Asset):
     _enums = {}
     _refs = ["CircuitSection", "ConductorSegment"]
     _many_refs = []
+    _inverses = {"CircuitSection": "ConductorAssets", "ConductorSegment": "ConductorAssets"}
 
     def getCircuitSection(self):
         
@@ -63,13 +64,12 @@ class ConductorAsset(Asset):
 
     def setCircuitSection(self, value):
         if self._CircuitSection is not None:
-            filtered = [x for x in self.CircuitSection.ConductorAssets if x != self]
-            self._CircuitSection._ConductorAssets = filtered
+            self._CircuitSection._ConductorAssets.discard(self)
 
         self._CircuitSection = value
         if self._CircuitSection is not None:
             if self not in self._CircuitSection._ConductorAssets:
-                self._CircuitSection._ConductorAssets.append(self)
+                self._CircuitSection._reflist("_ConductorAssets").append(self)
 
     CircuitSection = property(getCircuitSection, setCircuitSection)
 
@@ -79,13 +79,12 @@ class ConductorAsset(Asset):
 
     def setConductorSegment(self, value):
         if self._ConductorSegment is not None:
-            filtered = [x for x in self.ConductorSegment.ConductorAssets if x != self]
-            self._ConductorSegment._ConductorAssets = filtered
+            self._ConductorSegment._ConductorAssets.discard(self)
 
         self._ConductorSegment = value
         if self._ConductorSegment is not None:
             if self not in self._ConductorSegment._ConductorAssets:
-                self._ConductorSegment._ConductorAssets.append(self)
+                self._ConductorSegment._reflist("_ConductorAssets").append(self)
 
     ConductorSegment = property(getConductorSegment, setConductorSegment)
 
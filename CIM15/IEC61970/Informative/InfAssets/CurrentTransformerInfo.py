@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import RefList
 
 class CurrentTransformerInfo(AssetInfo):
     """Properties of current transformer asset.Properties of current transformer asset.
@@ -82,8 +83,8 @@ class CurrentTransformerInfo(AssetInfo):
 
         self.secondaryRatio = secondaryRatio
 
-        self._CTs = []
-        self.CTs = [] if CTs is None else CTs
+        if CTs is not None:
+            self.CTs = CTs
 
         self.tertiaryRatio = tertiaryRatio
 
@@ -99,6 +100,7 @@ class CurrentTransformerInfo(AssetInfo):
     _enums = {}
     _refs = ["nominalRatio", "secondaryRatio", "CTs", "tertiaryRatio", "maxRatio", "primaryRatio"]
     _many_refs = ["CTs"]
+    _inverses = {"CTs": "CTInfo"}
 
     # Nominal ratio between the primary and secondary current; i.e. 100:5
     nominalRatio = None
@@ -112,7 +114,8 @@ class CurrentTransformerInfo(AssetInfo):
         return self._CTs
 
     def setCTs(self, value):
-        for x in self._CTs:
+        value = RefList(value)
+        for x in list(self._CTs):
             x.CTInfo = None
         for y in value:
             y._CTInfo = self
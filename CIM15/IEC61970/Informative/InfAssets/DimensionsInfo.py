@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class DimensionsInfo(IdentifiedObject):
     """As applicable, the basic linear, area, or volume dimensions of an asset, asset type (AssetModel) or other type of object (such as land area). Units and multipliers are specified per dimension.As applicable, the basic linear, area, or volume dimensions of an asset, asset type (AssetModel) or other type of object (such as land area). Units and multipliers are specified per dimension.
@@ -51,14 +52,14 @@ class DimensionsInfo(IdentifiedObject):
         #: Depth measurement.
         self.sizeDepth = sizeDepth
 
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        if Locations is not None:
+            self.Locations = Locations
 
-        self._AssetInfos = []
-        self.AssetInfos = [] if AssetInfos is None else AssetInfos
+        if AssetInfos is not None:
+            self.AssetInfos = AssetInfos
 
-        self._Specifications = []
-        self.Specifications = [] if Specifications is None else Specifications
+        if Specifications is not None:
+            self.Specifications = Specifications
 
         super(DimensionsInfo, self).__init__(*args, **kw_args)
 
@@ -68,13 +69,15 @@ class DimensionsInfo(IdentifiedObject):
     _enums = {}
     _refs = ["Locations", "AssetInfos", "Specifications"]
     _many_refs = ["Locations", "AssetInfos", "Specifications"]
+    _inverses = {"Locations": "DimensionsInfo", "AssetInfos": "DimensionsInfo", "Specifications": "DimensionsInfos"}
 
     def getLocations(self):
         
         return self._Locations
 
     def setLocations(self, value):
-        for x in self._Locations:
+        value = RefList(value)
+        for x in list(self._Locations):
             x.DimensionsInfo = None
         for y in value:
             y._DimensionsInfo = self
@@ -95,7 +98,8 @@ class DimensionsInfo(IdentifiedObject):
         return self._AssetInfos
 
     def setAssetInfos(self, value):
-        for x in self._AssetInfos:
+        value = RefList(value)
+        for x in list(self._AssetInfos):
             x.DimensionsInfo = None
         for y in value:
             y._DimensionsInfo = self
@@ -117,20 +121,19 @@ class DimensionsInfo(IdentifiedObject):
 
     def setSpecifications(self, value):
         for p in self._Specifications:
-            filtered = [q for q in p.DimensionsInfos if q != self]
-            self._Specifications._DimensionsInfos = filtered
+            p._DimensionsInfos.discard(self)
         for r in value:
             if self not in r._DimensionsInfos:
-                r._DimensionsInfos.append(self)
-        self._Specifications = value
+                r._reflist("_DimensionsInfos").append(self)
+        self._Specifications = RefList(value)
 
     Specifications = property(getSpecifications, setSpecifications)
 
     def addSpecifications(self, *Specifications):
         for obj in Specifications:
             if self not in obj._DimensionsInfos:
-                obj._DimensionsInfos.append(self)
-            self._Specifications.append(obj)
+                obj._reflist("_DimensionsInfos").append(self)
+            self._reflist("_Specifications").append(obj)
 
     def removeSpecifications(self, *Specifications):
         for obj in Specifications:
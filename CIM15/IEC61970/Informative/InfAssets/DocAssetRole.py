@@ -44,6 +44,7 @@ class DocAssetRole(Role):
     _enums = {}
     _refs = ["Document", "Asset"]
     _many_refs = []
+    _inverses = {"Document": "AssetRoles", "Asset": "DocumentRoles"}
 
     def getDocument(self):
         
@@ -51,13 +52,12 @@ class DocAssetRole(Role):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.AssetRoles if x != self]
-            self._Document._AssetRoles = filtered
+            self._Document._AssetRoles.discard(self)
 
         self._Document = value
         if self._Document is not None:
             if self not in self._Document._AssetRoles:
-                self._Document._AssetRoles.append(self)
+                self._Document._reflist("_AssetRoles").append(self)
 
     Document = property(getDocument, setDocument)
 
@@ -67,13 +67,12 @@ class DocAssetRole(Role):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.DocumentRoles if x != self]
-            self._Asset._DocumentRoles = filtered
+            self._Asset._DocumentRoles.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
             if self not in self._Asset._DocumentRoles:
-                self._Asset._DocumentRoles.append(self)
+                self._Asset._reflist("_DocumentRoles").append(self)
 
     Asset = property(getAsset, setAsset)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetContainer import AssetContainer
+from CIM15.Element import RefList
 
 class DuctBank(AssetContainer):
     """A duct bank may contain many ducts. Each duct contains individual lines that are expressed as conductor assets (thereby describing each line's physical asset characteristics), which are each associated with ACLineSegments and other classes describing their electrical characteristics.A duct bank may contain many ducts. Each duct contains individual lines that are expressed as conductor assets (thereby describing each line's physical asset characteristics), which are each associated with ACLineSegments and other classes describing their electrical characteristics.
@@ -33,8 +34,8 @@ class DuctBank(AssetContainer):
         #: Number of circuits in duct bank. Refer to associations between a duct (ConductorAsset) and an ACLineSegment to understand which circuits are in which ducts.
         self.circuitCount = circuitCount
 
-        self._DuctInfos = []
-        self.DuctInfos = [] if DuctInfos is None else DuctInfos
+        if DuctInfos is not None:
+            self.DuctInfos = DuctInfos
 
         super(DuctBank, self).__init__(*args, **kw_args)
 
@@ -44,13 +45,15 @@ class DuctBank(AssetContainer):
     _enums = {}
     _refs = ["DuctInfos"]
     _many_refs = ["DuctInfos"]
+    _inverses = {"DuctInfos": "DuctBankInfo"}
 
     def getDuctInfos(self):
         
         return self._DuctInfos
 
     def setDuctInfos(self, value):
-        for x in self._DuctInfos:
+        value = RefList(value)
+        for x in list(self._DuctInfos):
             x.DuctBankInfo = None
         for y in value:
             y._DuctBankInfo = self
@@ -104,4 +104,5 @@ class ElectricalInfo(AssetInfo):
     _enums = {"phaseCode": "PhaseCode"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -40,4 +40,5 @@ class FACTSDevice(Asset):
     _enums = {"kind": "FACTSDeviceKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
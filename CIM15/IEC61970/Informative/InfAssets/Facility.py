@@ -40,4 +40,5 @@ class Facility(AssetContainer):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
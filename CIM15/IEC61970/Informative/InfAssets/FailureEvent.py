@@ -52,4 +52,5 @@ class FailureEvent(ActivityRecord):
     _enums = {"failureIsolationMethod": "FailureIsolationMethodKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import RefList
 
 class FaultIndicatorInfo(AssetInfo):
     """Parameters of fault indicator asset.Parameters of fault indicator asset.
@@ -33,8 +34,8 @@ class FaultIndicatorInfo(AssetInfo):
         #: Kind of reset mechanisim of this fault indicator. Values are: "automatic", "other", "remote", "manual"
         self.resetKind = resetKind
 
-        self._FaultIndicators = []
-        self.FaultIndicators = [] if FaultIndicators is None else FaultIndicators
+        if FaultIndicators is not None:
+            self.FaultIndicators = FaultIndicators
 
         super(FaultIndicatorInfo, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class FaultIndicatorInfo(AssetInfo):
     _enums = {"resetKind": "FaultIndicatorResetKind"}
     _refs = ["FaultIndicators"]
     _many_refs = ["FaultIndicators"]
+    _inverses = {"FaultIndicators": "FaultIndicatorInfo"}
 
     def getFaultIndicators(self):
         """All fault indicators described by this data.
@@ -51,7 +53,8 @@ class FaultIndicatorInfo(AssetInfo):
         return self._FaultIndicators
 
     def setFaultIndicators(self, value):
-        for x in self._FaultIndicators:
+        value = RefList(value)
+        for x in list(self._FaultIndicators):
             x.FaultIndicatorInfo = None
         for y in value:
             y._FaultIndicatorInfo = self
@@ -84,6 +84,7 @@ class FinancialInfo(IdentifiedObject):
     _enums = {}
     _refs = ["Asset"]
     _many_refs = []
+    _inverses = {"Asset": "FinancialInfo"}
 
     def getAsset(self):
         
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetModel import AssetModel
+from CIM15.Element import RefList
 
 class GenericAssetModelOrMaterial(AssetModel):
     """Generic asset or material item that may be used for planning, work or design purposes.Generic asset or material item that may be used for planning, work or design purposes.
@@ -47,14 +48,14 @@ class GenericAssetModelOrMaterial(AssetModel):
         #: The value, unit of measure, and multiplier for the quantity.
         self.quantity = quantity
 
-        self._ErpReqLineItems = []
-        self.ErpReqLineItems = [] if ErpReqLineItems is None else ErpReqLineItems
+        if ErpReqLineItems is not None:
+            self.ErpReqLineItems = ErpReqLineItems
 
-        self._ProductAssetModels = []
-        self.ProductAssetModels = [] if ProductAssetModels is None else ProductAssetModels
+        if ProductAssetModels is not None:
+            self.ProductAssetModels = ProductAssetModels
 
-        self._ErpInventoryIssues = []
-        self.ErpInventoryIssues = [] if ErpInventoryIssues is None else ErpInventoryIssues
+        if ErpInventoryIssues is not None:
+            self.ErpInventoryIssues = ErpInventoryIssues
 
         self._CUWorkEquipmentAsset = None
         self.CUWorkEquipmentAsset = CUWorkEquipmentAsset
@@ -65,8 +66,8 @@ class GenericAssetModelOrMaterial(AssetModel):
         self._CUAsset = None
         self.CUAsset = CUAsset
 
-        self._ErpBomItemDatas = []
-        self.ErpBomItemDatas = [] if ErpBomItemDatas is None else ErpBomItemDatas
+        if ErpBomItemDatas is not None:
+            self.ErpBomItemDatas = ErpBomItemDatas
 
         super(GenericAssetModelOrMaterial, self).__init__(*args, **kw_args)
 
@@ -76,13 +77,15 @@ class GenericAssetModelOrMaterial(AssetModel):
     _enums = {}
     _refs = ["ErpReqLineItems", "ProductAssetModels", "ErpInventoryIssues", "CUWorkEquipmentAsset", "TypeAssetCatalogue", "CUAsset", "ErpBomItemDatas"]
     _many_refs = ["ErpReqLineItems", "ProductAssetModels", "ErpInventoryIssues", "ErpBomItemDatas"]
+    _inverses = {"ErpReqLineItems": "TypeAsset", "ProductAssetModels": "GenericAssetModelOrMaterial", "ErpInventoryIssues": "TypeAsset", "CUWorkEquipmentAsset": "TypeAsset", "TypeAssetCatalogue": "TypeAssets", "CUAsset": "TypeAsset", "ErpBomItemDatas": "TypeAsset"}
 
     def getErpReqLineItems(self):
         
         return self._ErpReqLineItems
 
     def setErpReqLineItems(self, value):
-        for x in self._ErpReqLineItems:
+        value = RefList(value)
+        for x in list(self._ErpReqLineItems):
             x.TypeAsset = None
         for y in value:
             y._TypeAsset = self
@@ -104,7 +107,8 @@ class GenericAssetModelOrMaterial(AssetModel):
         return self._ProductAssetModels
 
     def setProductAssetModels(self, value):
-        for x in self._ProductAssetModels:
+        value = RefList(value)
+        for x in list(self._ProductAssetModels):
             x.GenericAssetModelOrMaterial = None
         for y in value:
             y._GenericAssetModelOrMaterial = self
@@ -125,7 +129,8 @@ class GenericAssetModelOrMaterial(AssetModel):
         return self._ErpInventoryIssues
 
     def setErpInventoryIssues(self, value):
-        for x in self._ErpInventoryIssues:
+        value = RefList(value)
+        for x in list(self._ErpInventoryIssues):
             x.TypeAsset = None
         for y in value:
             y._TypeAsset = self
@@ -162,13 +167,12 @@ class GenericAssetModelOrMaterial(AssetModel):
 
     def setTypeAssetCatalogue(self, value):
         if self._TypeAssetCatalogue is not None:
-            filtered = [x for x in self.TypeAssetCatalogue.TypeAssets if x != self]
-            self._TypeAssetCatalogue._TypeAssets = filtered
+            self._TypeAssetCatalogue._TypeAssets.discard(self)
 
         self._TypeAssetCatalogue = value
         if self._TypeAssetCatalogue is not None:
             if self not in self._TypeAssetCatalogue._TypeAssets:
-                self._TypeAssetCatalogue._TypeAssets.append(self)
+                self._TypeAssetCatalogue._reflist("_TypeAssets").append(self)
 
     TypeAssetCatalogue = property(getTypeAssetCatalogue, setTypeAssetCatalogue)
 
@@ -192,7 +196,8 @@ class GenericAssetModelOrMaterial(AssetModel):
         return self._ErpBomItemDatas
 
     def setErpBomItemDatas(self, value):
-        for x in self._ErpBomItemDatas:
+        value = RefList(value)
+        for x in list(self._ErpBomItemDatas):
             x.TypeAsset = None
         for y in value:
             y._TypeAsset = self
@@ -48,4 +48,5 @@ class Joint(Asset):
     _enums = {"fillKind": "JointFillKind", "configurationKind": "JointConfigurationKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
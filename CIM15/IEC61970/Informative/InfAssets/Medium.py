@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Medium(IdentifiedObject):
     """A substance that either (1) provides the means of transmission of a force or effect, such as hydraulic fluid, or (2) is used for a surrounding or enveloping substance, such as oil in a transformer or circuit breaker.A substance that either (1) provides the means of transmission of a force or effect, such as hydraulic fluid, or (2) is used for a surrounding or enveloping substance, such as oil in a transformer or circuit breaker.
@@ -41,8 +42,8 @@ class Medium(IdentifiedObject):
         self._Specification = None
         self.Specification = Specification
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
         super(Medium, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class Medium(IdentifiedObject):
     _enums = {"kind": "MediumKind"}
     _refs = ["Specification", "Assets"]
     _many_refs = ["Assets"]
+    _inverses = {"Specification": "Mediums", "Assets": "Mediums"}
 
     def getSpecification(self):
         
@@ -59,13 +61,12 @@ class Medium(IdentifiedObject):
 
     def setSpecification(self, value):
         if self._Specification is not None:
-            filtered = [x for x in self.Specification.Mediums if x != self]
-            self._Specification._Mediums = filtered
+            self._Specification._Mediums.discard(self)
 
         self._Specification = value
         if self._Specification is not None:
             if self not in self._Specification._Mediums:
-                self._Specification._Mediums.append(self)
+                self._Specification._reflist("_Mediums").append(self)
 
     Specification = property(getSpecification, setSpecification)
 
@@ -75,20 +76,19 @@ class Medium(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.Mediums if q != self]
-            self._Assets._Mediums = filtered
+            p._Mediums.discard(self)
         for r in value:
             if self not in r._Mediums:
-                r._Mediums.append(self)
-        self._Assets = value
+                r._reflist("_Mediums").append(self)
+        self._Assets = RefList(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
             if self not in obj._Mediums:
-                obj._Mediums.append(self)
-            self._Assets.append(obj)
+                obj._reflist("_Mediums").append(self)
+            self._reflist("_Assets").append(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
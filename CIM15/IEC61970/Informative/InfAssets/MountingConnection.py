@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class MountingConnection(IdentifiedObject):
     """A structure can have multiple connection points for electrical connections (e.g. line) each with multiple mounting points, one for each phase. e.g. a Tower may have three Connections, two with three mounting points, one for each phase and a third with a single mounting point for the neutral line. A pole, on the other hand, may have a single Connection with one, two or three mounting points depending on whether it is carrying 1,2 or 3 phases.A structure can have multiple connection points for electrical connections (e.g. line) each with multiple mounting points, one for each phase. e.g. a Tower may have three Connections, two with three mounting points, one for each phase and a third with a single mounting point for the neutral line. A pole, on the other hand, may have a single Connection with one, two or three mounting points depending on whether it is carrying 1,2 or 3 phases.
@@ -30,11 +31,11 @@ class MountingConnection(IdentifiedObject):
         @param StructureInfos:
         @param MountingPoints:
         """
-        self._StructureInfos = []
-        self.StructureInfos = [] if StructureInfos is None else StructureInfos
+        if StructureInfos is not None:
+            self.StructureInfos = StructureInfos
 
-        self._MountingPoints = []
-        self.MountingPoints = [] if MountingPoints is None else MountingPoints
+        if MountingPoints is not None:
+            self.MountingPoints = MountingPoints
 
         super(MountingConnection, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class MountingConnection(IdentifiedObject):
     _enums = {}
     _refs = ["StructureInfos", "MountingPoints"]
     _many_refs = ["StructureInfos", "MountingPoints"]
+    _inverses = {"StructureInfos": "MountingConnections", "MountingPoints": "Connections"}
 
     def getStructureInfos(self):
         
@@ -51,20 +53,19 @@ class MountingConnection(IdentifiedObject):
 
     def setStructureInfos(self, value):
         for p in self._StructureInfos:
-            filtered = [q for q in p.MountingConnections if q != self]
-            self._StructureInfos._MountingConnections = filtered
+            p._MountingConnections.discard(self)
         for r in value:
             if self not in r._MountingConnections:
-                r._MountingConnections.append(self)
-        self._StructureInfos = value
+                r._reflist("_MountingConnections").append(self)
+        self._StructureInfos = RefList(value)
 
     StructureInfos = property(getStructureInfos, setStructureInfos)
 
     def addStructureInfos(self, *StructureInfos):
         for obj in StructureInfos:
             if self not in obj._MountingConnections:
-                obj._MountingConnections.append(self)
-            self._StructureInfos.append(obj)
+                obj._reflist("_MountingConnections").append(self)
+            self._reflist("_StructureInfos").append(obj)
 
     def removeStructureInfos(self, *StructureInfos):
         for obj in StructureInfos:
@@ -78,20 +79,19 @@ class MountingConnection(IdentifiedObject):
 
     def setMountingPoints(self, value):
         for p in self._MountingPoints:
-            filtered = [q for q in p.Connections if q != self]
-            self._MountingPoints._Connections = filtered
+            p._Connections.discard(self)
         for r in value:
             if self not in r._Connections:
-                r._Connections.append(self)
-        self._MountingPoints = value
+                r._reflist("_Connections").append(self)
+        self._MountingPoints = RefList(value)
 
     MountingPoints = property(getMountingPoints, setMountingPoints)
 
     def addMountingPoints(self, *MountingPoints):
         for obj in MountingPoints:
             if self not in obj._Connections:
-                obj._Connections.append(self)
-            self._MountingPoints.append(obj)
+                obj._reflist("_Connections").append(self)
+            self._reflist("_MountingPoints").append(obj)
 
     def removeMountingPoints(self, *MountingPoints):
         for obj in MountingPoints:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class MountingPoint(IdentifiedObject):
     """Point on a structure that a connection may have a conductor connected to. Defined with an x and y coordinate plus a phase. A connection may have multiple mounting points, one for each phase.Point on a structure that a connection may have a conductor connected to. Defined with an x and y coordinate plus a phase. A connection may have multiple mounting points, one for each phase.
@@ -42,11 +43,11 @@ class MountingPoint(IdentifiedObject):
 
         self.yCoord = yCoord
 
-        self._Connections = []
-        self.Connections = [] if Connections is None else Connections
+        if Connections is not None:
+            self.Connections = Connections
 
-        self._OverheadConductors = []
-        self.OverheadConductors = [] if OverheadConductors is None else OverheadConductors
+        if OverheadConductors is not None:
+            self.OverheadConductors = OverheadConductors
 
         super(MountingPoint, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class MountingPoint(IdentifiedObject):
     _enums = {"phaseCode": "PhaseCode"}
     _refs = ["Connections", "OverheadConductors"]
     _many_refs = ["Connections", "OverheadConductors"]
+    _inverses = {"Connections": "MountingPoints", "OverheadConductors": "MountingPoint"}
 
     def getConnections(self):
         
@@ -63,20 +65,19 @@ class MountingPoint(IdentifiedObject):
 
     def setConnections(self, value):
         for p in self._Connections:
-            filtered = [q for q in p.MountingPoints if q != self]
-            self._Connections._MountingPoints = filtered
+            p._MountingPoints.discard(self)
         for r in value:
             if self not in r._MountingPoints:
-                r._MountingPoints.append(self)
-        self._Connections = value
+                r._reflist("_MountingPoints").append(self)
+        self._Connections = RefList(value)
 
     Connections = property(getConnections, setConnections)
 
     def addConnections(self, *Connections):
         for obj in Connections:
             if self not in obj._MountingPoints:
-                obj._MountingPoints.append(self)
-            self._Connections.append(obj)
+                obj._reflist("_MountingPoints").append(self)
+            self._reflist("_Connections").append(obj)
 
     def removeConnections(self, *Connections):
         for obj in Connections:
@@ -89,7 +90,8 @@ class MountingPoint(IdentifiedObject):
         return self._OverheadConductors
 
     def setOverheadConductors(self, value):
-        for x in self._OverheadConductors:
+        value = RefList(value)
+        for x in list(self._OverheadConductors):
             x.MountingPoint = None
         for y in value:
             y._MountingPoint = self
@@ -48,6 +48,7 @@ class OrgAssetRole(Role):
     _enums = {}
     _refs = ["ErpOrganisation", "Asset"]
     _many_refs = []
+    _inverses = {"ErpOrganisation": "AssetRoles", "Asset": "ErpOrganisationRoles"}
 
     def getErpOrganisation(self):
         
@@ -55,13 +56,12 @@ class OrgAssetRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.AssetRoles if x != self]
-            self._ErpOrganisation._AssetRoles = filtered
+            self._ErpOrganisation._AssetRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
             if self not in self._ErpOrganisation._AssetRoles:
-                self._ErpOrganisation._AssetRoles.append(self)
+                self._ErpOrganisation._reflist("_AssetRoles").append(self)
 
     ErpOrganisation = property(getErpOrganisation, setErpOrganisation)
 
@@ -71,13 +71,12 @@ class OrgAssetRole(Role):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.ErpOrganisationRoles if x != self]
-            self._Asset._ErpOrganisationRoles = filtered
+            self._Asset._ErpOrganisationRoles.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
             if self not in self._Asset._ErpOrganisationRoles:
-                self._Asset._ErpOrganisationRoles.append(self)
+                self._Asset._reflist("_ErpOrganisationRoles").append(self)
 
     Asset = property(getAsset, setAsset)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfAssets.Structure import Structure
+from CIM15.Element import RefList
 
 class Pole(Structure):
     """Pole asset.Pole asset.
@@ -73,8 +74,8 @@ class Pole(Structure):
         #: Date and time pole was last treated with preservative.
         self.treatedDateTime = treatedDateTime
 
-        self._Streetlights = []
-        self.Streetlights = [] if Streetlights is None else Streetlights
+        if Streetlights is not None:
+            self.Streetlights = Streetlights
 
         super(Pole, self).__init__(*args, **kw_args)
 
@@ -84,6 +85,7 @@ class Pole(Structure):
     _enums = {"baseKind": "PoleBaseKind", "treatmentKind": "PoleTreatmentKind", "preservativeKind": "PolePreservativeKind"}
     _refs = ["Streetlights"]
     _many_refs = ["Streetlights"]
+    _inverses = {"Streetlights": "Pole"}
 
     def getStreetlights(self):
         """Streetlight(s) may be attached to a pole.
@@ -91,7 +93,8 @@ class Pole(Structure):
         return self._Streetlights
 
     def setStreetlights(self, value):
-        for x in self._Streetlights:
+        value = RefList(value)
+        for x in list(self._Streetlights):
             x.Pole = None
         for y in value:
             y._Pole = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import RefList
 
 class PotentialTransformerInfo(AssetInfo):
     """Properties of potential transformer asset.Properties of potential transformer asset.
@@ -47,8 +48,8 @@ class PotentialTransformerInfo(AssetInfo):
 
         self.tertiaryRatio = tertiaryRatio
 
-        self._PTs = []
-        self.PTs = [] if PTs is None else PTs
+        if PTs is not None:
+            self.PTs = PTs
 
         self.secondaryRatio = secondaryRatio
 
@@ -60,6 +61,7 @@ class PotentialTransformerInfo(AssetInfo):
     _enums = {}
     _refs = ["nominalRatio", "primaryRatio", "tertiaryRatio", "PTs", "secondaryRatio"]
     _many_refs = ["PTs"]
+    _inverses = {"PTs": "PTInfo"}
 
     nominalRatio = None
 
@@ -75,7 +77,8 @@ class PotentialTransformerInfo(AssetInfo):
         return self._PTs
 
     def setPTs(self, value):
-        for x in self._PTs:
+        value = RefList(value)
+        for x in list(self._PTs):
             x.PTInfo = None
         for y in value:
             y._PTInfo = self
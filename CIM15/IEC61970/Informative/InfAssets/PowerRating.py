@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class PowerRating(IdentifiedObject):
     """There are often stages of power which are associated with stages of cooling. For instance, a transformer may be rated 121kV on the primary, 15kV on the secondary and 4kV on the tertiary winding. These are voltage ratings and the power ratings are generally the same for all three windings and independent of the voltage ratings, there are instances where the tertiary may have a lower power rating. For example, for three stages, the power rating may be 15/20/25 MVA and the cooling is OA/FA/FOA. The 15 MVA rating goes with the OA cooling (Oil and Air cooling). This is called the self cooled rating as there are no external cooling enhancements. The 20 MVA rating goes with the FA cooling (Forced Air cooling), this means that when the fans are running and thus enhancing the cooling characteristics, the transformer can operate at a power level of 20 MVA. The 25 MVA rating goes with the FOA cooling (Forced Oil and Air cooling), this means that when the fans and pumps are running and thus enhancing the cooling characteristics even more than before, the transformer can operate at a power level of 25 MVA. This 15/20/25 MVA does not state how the power is split between the various windings. It may be 25 MVA input on the primary, 25 MVA output on the secondary and 0 MVA output on the tertiary. It may also operate at 25 MVA input on the primary, 17 MVA output on the secondary and 8 MVA output on the tertiary.There are often stages of power which are associated with stages of cooling. For instance, a transformer may be rated 121kV on the primary, 15kV on the secondary and 4kV on the tertiary winding. These are voltage ratings and the power ratings are generally the same for all three windings and independent of the voltage ratings, there are instances where the tertiary may have a lower power rating. For example, for three stages, the power rating may be 15/20/25 MVA and the cooling is OA/FA/FOA. The 15 MVA rating goes with the OA cooling (Oil and Air cooling). This is called the self cooled rating as there are no external cooling enhancements. The 20 MVA rating goes with the FA cooling (Forced Air cooling), this means that when the fans are running and thus enhancing the cooling characteristics, the transformer can operate at a power level of 20 MVA. The 25 MVA rating goes with the FOA cooling (Forced Oil and Air cooling), this means that when the fans and pumps are running and thus enhancing the cooling characteristics even more than before, the transformer can operate at a power level of 25 MVA. This 15/20/25 MVA does not state how the power is split between the various windings. It may be 25 MVA input on the primary, 25 MVA output on the secondary and 0 MVA output on the tertiary. It may also operate at 25 MVA input on the primary, 17 MVA output on the secondary and 8 MVA output on the tertiary.
@@ -41,8 +42,8 @@ class PowerRating(IdentifiedObject):
         #: Kind of cooling system. Values are: "forcedAir", "selfCooling", "forcedOilAndAir", "other"
         self.coolingKind = coolingKind
 
-        self._TransformerAssets = []
-        self.TransformerAssets = [] if TransformerAssets is None else TransformerAssets
+        if TransformerAssets is not None:
+            self.TransformerAssets = TransformerAssets
 
         super(PowerRating, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class PowerRating(IdentifiedObject):
     _enums = {"coolingKind": "CoolingKind"}
     _refs = ["TransformerAssets"]
     _many_refs = ["TransformerAssets"]
+    _inverses = {"TransformerAssets": "PowerRatings"}
 
     def getTransformerAssets(self):
         
@@ -59,20 +61,19 @@ class PowerRating(IdentifiedObject):
 
     def setTransformerAssets(self, value):
         for p in self._TransformerAssets:
-            filtered = [q for q in p.PowerRatings if q != self]
-            self._TransformerAssets._PowerRatings = filtered
+            p._PowerRatings.discard(self)
         for r in value:
             if self not in r._PowerRatings:
-                r._PowerRatings.append(self)
-        self._TransformerAssets = value
+                r._reflist("_PowerRatings").append(self)
+        self._TransformerAssets = RefList(value)
 
     TransformerAssets = property(getTransformerAssets, setTransformerAssets)
 
     def addTransformerAssets(self, *TransformerAssets):
         for obj in TransformerAssets:
             if self not in obj._PowerRatings:
-                obj._PowerRatings.append(self)
-            self._TransformerAssets.append(obj)
+                obj._reflist("_PowerRatings").append(self)
+            self._reflist("_TransformerAssets").append(obj)
 
     def removeTransformerAssets(self, *TransformerAssets):
         for obj in TransformerAssets:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class Procedure(Document):
     """A documented procedure for various types of Work or Work Tasks. One or more procedures guide a compatible unit, a standard way of performing a unit of work. The type of procedure is defined in Procedure.type. For example, when type=Inspection, this procedure coupled with Schedule and other information provides the key items of an inspection plan. Another type of Procedure is a Diagnosis. Note that each specific values and settings to be used in a procedure is intended to be described in an instance of ProcedureValue. A maintenance ticket, a type of Work, is generated whenever maintenance is determined to be needed as a result of an inspection or diagnosis.A documented procedure for various types of Work or Work Tasks. One or more procedures guide a compatible unit, a standard way of performing a unit of work. The type of procedure is defined in Procedure.type. For example, when type=Inspection, this procedure coupled with Schedule and other information provides the key items of an inspection plan. Another type of Procedure is a Diagnosis. Note that each specific values and settings to be used in a procedure is intended to be described in an instance of ProcedureValue. A maintenance ticket, a type of Work, is generated whenever maintenance is determined to be needed as a result of an inspection or diagnosis.
@@ -48,17 +49,17 @@ class Procedure(Document):
         #: The textual description of the procedure, which references instances of ProcedureValue as appropriate.
         self.instruction = instruction
 
-        self._ProcedureValues = []
-        self.ProcedureValues = [] if ProcedureValues is None else ProcedureValues
+        if ProcedureValues is not None:
+            self.ProcedureValues = ProcedureValues
 
-        self._ProcedureDataSets = []
-        self.ProcedureDataSets = [] if ProcedureDataSets is None else ProcedureDataSets
+        if ProcedureDataSets is not None:
+            self.ProcedureDataSets = ProcedureDataSets
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
-        self._Limits = []
-        self.Limits = [] if Limits is None else Limits
+        if Limits is not None:
+            self.Limits = Limits
 
         super(Procedure, self).__init__(*args, **kw_args)
 
@@ -68,6 +69,7 @@ class Procedure(Document):
     _enums = {"kind": "ProcedureKind"}
     _refs = ["ProcedureValues", "ProcedureDataSets", "CompatibleUnits", "Limits"]
     _many_refs = ["ProcedureValues", "ProcedureDataSets", "CompatibleUnits", "Limits"]
+    _inverses = {"ProcedureValues": "Procedure", "ProcedureDataSets": "Procedure", "CompatibleUnits": "Procedures", "Limits": "Procedures"}
 
     def getProcedureValues(self):
         """UserAttributes used to specify procedure values. An example is to have an instance for each of the following settings when conducting a test: voltage, current, frequency, temperature specified in 'name' attribute, and the corresponding value and units in 'value' attribute.
@@ -75,7 +77,8 @@ class Procedure(Document):
         return self._ProcedureValues
 
     def setProcedureValues(self, value):
-        for x in self._ProcedureValues:
+        value = RefList(value)
+        for x in list(self._ProcedureValues):
             x.Procedure = None
         for y in value:
             y._Procedure = self
@@ -96,7 +99,8 @@ class Procedure(Document):
         return self._ProcedureDataSets
 
     def setProcedureDataSets(self, value):
-        for x in self._ProcedureDataSets:
+        value = RefList(value)
+        for x in list(self._ProcedureDataSets):
             x.Procedure = None
         for y in value:
             y._Procedure = self
@@ -118,20 +122,19 @@ class Procedure(Document):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.Procedures if q != self]
-            self._CompatibleUnits._Procedures = filtered
+            p._Procedures.discard(self)
         for r in value:
             if self not in r._Procedures:
-                r._Procedures.append(self)
-        self._CompatibleUnits = value
+                r._reflist("_Procedures").append(self)
+        self._CompatibleUnits = RefList(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
             if self not in obj._Procedures:
-                obj._Procedures.append(self)
-            self._CompatibleUnits.append(obj)
+                obj._reflist("_Procedures").append(self)
+            self._reflist("_CompatibleUnits").append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
@@ -145,20 +148,19 @@ class Procedure(Document):
 
     def setLimits(self, value):
         for p in self._Limits:
-            filtered = [q for q in p.Procedures if q != self]
-            self._Limits._Procedures = filtered
+            p._Procedures.discard(self)
         for r in value:
             if self not in r._Procedures:
-                r._Procedures.append(self)
-        self._Limits = value
+                r._reflist("_Procedures").append(self)
+        self._Limits = RefList(value)
 
     Limits = property(getLimits, setLimits)
 
     def addLimits(self, *Limits):
         for obj in Limits:
             if self not in obj._Procedures:
-                obj._Procedures.append(self)
-            self._Limits.append(obj)
+                obj._reflist("_Procedures").append(self)
+            self._reflist("_Limits").append(obj)
 
     def removeLimits(self, *Limits):
         for obj in Limits:
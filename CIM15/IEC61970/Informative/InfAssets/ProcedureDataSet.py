@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ProcedureDataSet(Document):
     """A data set recorded each time a procedure is executed. Observed results are captured in associated measurement values and/or values for properties relevant to the type of procedure performed.A data set recorded each time a procedure is executed. Observed results are captured in associated measurement values and/or values for properties relevant to the type of procedure performed.
@@ -36,17 +37,17 @@ class ProcedureDataSet(Document):
         #: Date and time procedure was completed.
         self.completedDateTime = completedDateTime
 
-        self._Properties = []
-        self.Properties = [] if Properties is None else Properties
+        if Properties is not None:
+            self.Properties = Properties
 
-        self._TransformerObservations = []
-        self.TransformerObservations = [] if TransformerObservations is None else TransformerObservations
+        if TransformerObservations is not None:
+            self.TransformerObservations = TransformerObservations
 
         self._Procedure = None
         self.Procedure = Procedure
 
-        self._MeasurementValues = []
-        self.MeasurementValues = [] if MeasurementValues is None else MeasurementValues
+        if MeasurementValues is not None:
+            self.MeasurementValues = MeasurementValues
 
         super(ProcedureDataSet, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class ProcedureDataSet(Document):
     _enums = {}
     _refs = ["Properties", "TransformerObservations", "Procedure", "MeasurementValues"]
     _many_refs = ["Properties", "TransformerObservations", "MeasurementValues"]
+    _inverses = {"Properties": "ProcedureDataSets", "TransformerObservations": "ProcedureDataSets", "Procedure": "ProcedureDataSets", "MeasurementValues": "ProcedureDataSets"}
 
     def getProperties(self):
         """UserAttributes used to specify further properties of this procedure data set. Use 'name' to specify what kind of property it is, and 'value.value' attribute for the actual value.
@@ -64,20 +66,19 @@ class ProcedureDataSet(Document):
 
     def setProperties(self, value):
         for p in self._Properties:
-            filtered = [q for q in p.ProcedureDataSets if q != self]
-            self._Properties._ProcedureDataSets = filtered
+            p._ProcedureDataSets.discard(self)
         for r in value:
             if self not in r._ProcedureDataSets:
-                r._ProcedureDataSets.append(self)
-        self._Properties = value
+                r._reflist("_ProcedureDataSets").append(self)
+        self._Properties = RefList(value)
 
     Properties = property(getProperties, setProperties)
 
     def addProperties(self, *Properties):
         for obj in Properties:
             if self not in obj._ProcedureDataSets:
-                obj._ProcedureDataSets.append(self)
-            self._Properties.append(obj)
+                obj._reflist("_ProcedureDataSets").append(self)
+            self._reflist("_Properties").append(obj)
 
     def removeProperties(self, *Properties):
         for obj in Properties:
@@ -91,20 +92,19 @@ class ProcedureDataSet(Document):
 
     def setTransformerObservations(self, value):
         for p in self._TransformerObservations:
-            filtered = [q for q in p.ProcedureDataSets if q != self]
-            self._TransformerObservations._ProcedureDataSets = filtered
+            p._ProcedureDataSets.discard(self)
         for r in value:
             if self not in r._ProcedureDataSets:
-                r._ProcedureDataSets.append(self)
-        self._TransformerObservations = value
+                r._reflist("_ProcedureDataSets").append(self)
+        self._TransformerObservations = RefList(value)
 
     TransformerObservations = property(getTransformerObservations, setTransformerObservations)
 
     def addTransformerObservations(self, *TransformerObservations):
         for obj in TransformerObservations:
             if self not in obj._ProcedureDataSets:
-                obj._ProcedureDataSets.append(self)
-            self._TransformerObservations.append(obj)
+                obj._reflist("_ProcedureDataSets").append(self)
+            self._reflist("_TransformerObservations").append(obj)
 
     def removeTransformerObservations(self, *TransformerObservations):
         for obj in TransformerObservations:
@@ -118,13 +118,12 @@ class ProcedureDataSet(Document):
 
     def setProcedure(self, value):
         if self._Procedure is not None:
-            filtered = [x for x in self.Procedure.ProcedureDataSets if x != self]
-            self._Procedure._ProcedureDataSets = filtered
+            self._Procedure._ProcedureDataSets.discard(self)
 
         self._Procedure = value
         if self._Procedure is not None:
             if self not in self._Procedure._ProcedureDataSets:
-                self._Procedure._ProcedureDataSets.append(self)
+                self._Procedure._reflist("_ProcedureDataSets").append(self)
 
     Procedure = property(getProcedure, setProcedure)
 
@@ -134,20 +133,19 @@ class ProcedureDataSet(Document):
 
     def setMeasurementValues(self, value):
         for p in self._MeasurementValues:
-            filtered = [q for q in p.ProcedureDataSets if q != self]
-            self._MeasurementValues._ProcedureDataSets = filtered
+            p._ProcedureDataSets.discard(self)
         for r in value:
             if self not in r._ProcedureDataSets:
-                r._ProcedureDataSets.append(self)
-        self._MeasurementValues = value
+                r._reflist("_ProcedureDataSets").append(self)
+        self._MeasurementValues = RefList(value)
 
     MeasurementValues = property(getMeasurementValues, setMeasurementValues)
 
     def addMeasurementValues(self, *MeasurementValues):
         for obj in MeasurementValues:
             if self not in obj._ProcedureDataSets:
-                obj._ProcedureDataSets.append(self)
-            self._MeasurementValues.append(obj)
+                obj._reflist("_ProcedureDataSets").append(self)
+            self._reflist("_MeasurementValues").append(obj)
 
     def removeMeasurementValues(self, *MeasurementValues):
         for obj in MeasurementValues:
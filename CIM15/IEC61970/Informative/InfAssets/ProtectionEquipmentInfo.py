@@ -44,4 +44,5 @@ class ProtectionEquipmentInfo(AssetInfo):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
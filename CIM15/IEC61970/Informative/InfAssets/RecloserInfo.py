@@ -56,4 +56,5 @@ class RecloserInfo(SwitchInfo):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ReliabilityInfo(IdentifiedObject):
     """Information regarding the experienced and expected reliability of a specific asset, type of asset, or asset model.Information regarding the experienced and expected reliability of a specific asset, type of asset, or asset model.
@@ -41,8 +42,8 @@ class ReliabilityInfo(IdentifiedObject):
         self._Specification = None
         self.Specification = Specification
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
         super(ReliabilityInfo, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class ReliabilityInfo(IdentifiedObject):
     _enums = {}
     _refs = ["Specification", "Assets"]
     _many_refs = ["Assets"]
+    _inverses = {"Specification": "ReliabilityInfos", "Assets": "ReliabilityInfos"}
 
     def getSpecification(self):
         
@@ -59,13 +61,12 @@ class ReliabilityInfo(IdentifiedObject):
 
     def setSpecification(self, value):
         if self._Specification is not None:
-            filtered = [x for x in self.Specification.ReliabilityInfos if x != self]
-            self._Specification._ReliabilityInfos = filtered
+            self._Specification._ReliabilityInfos.discard(self)
 
         self._Specification = value
         if self._Specification is not None:
             if self not in self._Specification._ReliabilityInfos:
-                self._Specification._ReliabilityInfos.append(self)
+                self._Specification._reflist("_ReliabilityInfos").append(self)
 
     Specification = property(getSpecification, setSpecification)
 
@@ -75,20 +76,19 @@ class ReliabilityInfo(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.ReliabilityInfos if q != self]
-            self._Assets._ReliabilityInfos = filtered
+            p._ReliabilityInfos.discard(self)
         for r in value:
             if self not in r._ReliabilityInfos:
-                r._ReliabilityInfos.append(self)
-        self._Assets = value
+                r._reflist("_ReliabilityInfos").append(self)
+        self._Assets = RefList(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
             if self not in obj._ReliabilityInfos:
-                obj._ReliabilityInfos.append(self)
-            self._Assets.append(obj)
+                obj._reflist("_ReliabilityInfos").append(self)
+            self._reflist("_Assets").append(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
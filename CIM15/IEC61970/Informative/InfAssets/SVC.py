@@ -44,4 +44,5 @@ class SVC(FACTSDevice):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -44,6 +44,7 @@ class ShuntCompensatorInfo(AssetInfo):
     _enums = {}
     _refs = ["ShuntImpedanceInfo"]
     _many_refs = []
+    _inverses = {"ShuntImpedanceInfo": "ShuntCompensatorInfos"}
 
     def getShuntImpedanceInfo(self):
         
@@ -51,13 +52,12 @@ class ShuntCompensatorInfo(AssetInfo):
 
     def setShuntImpedanceInfo(self, value):
         if self._ShuntImpedanceInfo is not None:
-            filtered = [x for x in self.ShuntImpedanceInfo.ShuntCompensatorInfos if x != self]
-            self._ShuntImpedanceInfo._ShuntCompensatorInfos = filtered
+            self._ShuntImpedanceInfo._ShuntCompensatorInfos.discard(self)
 
         self._ShuntImpedanceInfo = value
         if self._ShuntImpedanceInfo is not None:
             if self not in self._ShuntImpedanceInfo._ShuntCompensatorInfos:
-                self._ShuntImpedanceInfo._ShuntCompensatorInfos.append(self)
+                self._ShuntImpedanceInfo._reflist("_ShuntCompensatorInfos").append(self)
 
     ShuntImpedanceInfo = property(getShuntImpedanceInfo, setShuntImpedanceInfo)
 
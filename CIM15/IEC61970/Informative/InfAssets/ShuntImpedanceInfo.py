@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import RefList
 
 class ShuntImpedanceInfo(AssetInfo):
     """Properties of a shunt impedance.Properties of a shunt impedance.
@@ -97,8 +98,8 @@ class ShuntImpedanceInfo(AssetInfo):
         #: True if the locally controlled capacitor has voltage override capability.
         self.localOverride = localOverride
 
-        self._ShuntCompensatorInfos = []
-        self.ShuntCompensatorInfos = [] if ShuntCompensatorInfos is None else ShuntCompensatorInfos
+        if ShuntCompensatorInfos is not None:
+            self.ShuntCompensatorInfos = ShuntCompensatorInfos
 
         super(ShuntImpedanceInfo, self).__init__(*args, **kw_args)
 
@@ -108,13 +109,15 @@ class ShuntImpedanceInfo(AssetInfo):
     _enums = {"localControlKind": "ShuntImpedanceLocalControlKind", "regBranchKind": "RegulationBranchKind", "controlKind": "ShuntImpedanceControlKind", "sensingPhaseCode": "PhaseCode"}
     _refs = ["ShuntCompensatorInfos"]
     _many_refs = ["ShuntCompensatorInfos"]
+    _inverses = {"ShuntCompensatorInfos": "ShuntImpedanceInfo"}
 
     def getShuntCompensatorInfos(self):
         
         return self._ShuntCompensatorInfos
 
     def setShuntCompensatorInfos(self, value):
-        for x in self._ShuntCompensatorInfos:
+        value = RefList(value)
+        for x in list(self._ShuntCompensatorInfos):
             x.ShuntImpedanceInfo = None
         for y in value:
             y._ShuntImpedanceInfo = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class Specification(Document):
     """Specification can be used for various purposes relative to an asset, a logical device (PowerSystemResource), location, etc. Examples include documents supplied by manufacturers such as asset installation instructions, asset maintenance instructions, etc.Specification can be used for various purposes relative to an asset, a logical device (PowerSystemResource), location, etc. Examples include documents supplied by manufacturers such as asset installation instructions, asset maintenance instructions, etc.
@@ -35,26 +36,26 @@ class Specification(Document):
         @param Ratings: UserAttributes used to specify ratings of the asset covered by this specification. Ratings also can be used to set the initial value of operational measurement limits. Use 'name' to specify what kind of rating it is (e.g., voltage, current), and 'value' attribute for the actual value and unit information of the rating.
         @param QualificationRequirements:
         """
-        self._AssetPropertyCurves = []
-        self.AssetPropertyCurves = [] if AssetPropertyCurves is None else AssetPropertyCurves
+        if AssetPropertyCurves is not None:
+            self.AssetPropertyCurves = AssetPropertyCurves
 
-        self._Mediums = []
-        self.Mediums = [] if Mediums is None else Mediums
+        if Mediums is not None:
+            self.Mediums = Mediums
 
-        self._AssetProperites = []
-        self.AssetProperites = [] if AssetProperites is None else AssetProperites
+        if AssetProperites is not None:
+            self.AssetProperites = AssetProperites
 
-        self._ReliabilityInfos = []
-        self.ReliabilityInfos = [] if ReliabilityInfos is None else ReliabilityInfos
+        if ReliabilityInfos is not None:
+            self.ReliabilityInfos = ReliabilityInfos
 
-        self._DimensionsInfos = []
-        self.DimensionsInfos = [] if DimensionsInfos is None else DimensionsInfos
+        if DimensionsInfos is not None:
+            self.DimensionsInfos = DimensionsInfos
 
-        self._Ratings = []
-        self.Ratings = [] if Ratings is None else Ratings
+        if Ratings is not None:
+            self.Ratings = Ratings
 
-        self._QualificationRequirements = []
-        self.QualificationRequirements = [] if QualificationRequirements is None else QualificationRequirements
+        if QualificationRequirements is not None:
+            self.QualificationRequirements = QualificationRequirements
 
         super(Specification, self).__init__(*args, **kw_args)
 
@@ -64,13 +65,15 @@ class Specification(Document):
     _enums = {}
     _refs = ["AssetPropertyCurves", "Mediums", "AssetProperites", "ReliabilityInfos", "DimensionsInfos", "Ratings", "QualificationRequirements"]
     _many_refs = ["AssetPropertyCurves", "Mediums", "AssetProperites", "ReliabilityInfos", "DimensionsInfos", "Ratings", "QualificationRequirements"]
+    _inverses = {"AssetPropertyCurves": "Specification", "Mediums": "Specification", "AssetProperites": "PropertySpecification", "ReliabilityInfos": "Specification", "DimensionsInfos": "Specifications", "Ratings": "RatingSpecification", "QualificationRequirements": "Specifications"}
 
     def getAssetPropertyCurves(self):
         
         return self._AssetPropertyCurves
 
     def setAssetPropertyCurves(self, value):
-        for x in self._AssetPropertyCurves:
+        value = RefList(value)
+        for x in list(self._AssetPropertyCurves):
             x.Specification = None
         for y in value:
             y._Specification = self
@@ -91,7 +94,8 @@ class Specification(Document):
         return self._Mediums
 
     def setMediums(self, value):
-        for x in self._Mediums:
+        value = RefList(value)
+        for x in list(self._Mediums):
             x.Specification = None
         for y in value:
             y._Specification = self
@@ -113,7 +117,8 @@ class Specification(Document):
         return self._AssetProperites
 
     def setAssetProperites(self, value):
-        for x in self._AssetProperites:
+        value = RefList(value)
+        for x in list(self._AssetProperites):
             x.PropertySpecification = None
         for y in value:
             y._PropertySpecification = self
@@ -134,7 +139,8 @@ class Specification(Document):
         return self._ReliabilityInfos
 
     def setReliabilityInfos(self, value):
-        for x in self._ReliabilityInfos:
+        value = RefList(value)
+        for x in list(self._ReliabilityInfos):
             x.Specification = None
         for y in value:
             y._Specification = self
@@ -156,20 +162,19 @@ class Specification(Document):
 
     def setDimensionsInfos(self, value):
         for p in self._DimensionsInfos:
-            filtered = [q for q in p.Specifications if q != self]
-            self._DimensionsInfos._Specifications = filtered
+            p._Specifications.discard(self)
         for r in value:
             if self not in r._Specifications:
-                r._Specifications.append(self)
-        self._DimensionsInfos = value
+                r._reflist("_Specifications").append(self)
+        self._DimensionsInfos = RefList(value)
 
     DimensionsInfos = property(getDimensionsInfos, setDimensionsInfos)
 
     def addDimensionsInfos(self, *DimensionsInfos):
         for obj in DimensionsInfos:
             if self not in obj._Specifications:
-                obj._Specifications.append(self)
-            self._DimensionsInfos.append(obj)
+                obj._reflist("_Specifications").append(self)
+            self._reflist("_DimensionsInfos").append(obj)
 
     def removeDimensionsInfos(self, *DimensionsInfos):
         for obj in DimensionsInfos:
@@ -183,7 +188,8 @@ class Specification(Document):
         return self._Ratings
 
     def setRatings(self, value):
-        for x in self._Ratings:
+        value = RefList(value)
+        for x in list(self._Ratings):
             x.RatingSpecification = None
         for y in value:
             y._RatingSpecification = self
@@ -205,20 +211,19 @@ class Specification(Document):
 
     def setQualificationRequirements(self, value):
         for p in self._QualificationRequirements:
-            filtered = [q for q in p.Specifications if q != self]
-            self._QualificationRequirements._Specifications = filtered
+            p._Specifications.discard(self)
         for r in value:
             if self not in r._Specifications:
-                r._Specifications.append(self)
-        self._QualificationRequirements = value
+                r._reflist("_Specifications").append(self)
+        self._QualificationRequirements = RefList(value)
 
     QualificationRequirements = property(getQualificationRequirements, setQualificationRequirements)
 
     def addQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
             if self not in obj._Specifications:
-                obj._Specifications.append(self)
-            self._QualificationRequirements.append(obj)
+                obj._reflist("_Specifications").append(self)
+            self._reflist("_QualificationRequirements").append(obj)
 
     def removeQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
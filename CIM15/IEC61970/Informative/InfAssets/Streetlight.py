@@ -52,6 +52,7 @@ class Streetlight(Asset):
     _enums = {"lampKind": "StreetlightLampKind"}
     _refs = ["Pole"]
     _many_refs = []
+    _inverses = {"Pole": "Streetlights"}
 
     def getPole(self):
         """Streetlight(s) may be attached to a pole.
@@ -60,13 +61,12 @@ class Streetlight(Asset):
 
     def setPole(self, value):
         if self._Pole is not None:
-            filtered = [x for x in self.Pole.Streetlights if x != self]
-            self._Pole._Streetlights = filtered
+            self._Pole._Streetlights.discard(self)
 
         self._Pole = value
         if self._Pole is not None:
             if self not in self._Pole._Streetlights:
-                self._Pole._Streetlights.append(self)
+                self._Pole._reflist("_Streetlights").append(self)
 
     Pole = property(getPole, setPole)
 
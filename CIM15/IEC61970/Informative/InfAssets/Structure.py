@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetContainer import AssetContainer
+from CIM15.Element import RefList
 
 class Structure(AssetContainer):
     """Construction holding assets such as conductors, transformers, switchgear, etc.Construction holding assets such as conductors, transformers, switchgear, etc.
@@ -58,11 +59,11 @@ class Structure(AssetContainer):
         #: Material this structure is made of. Values are: "wood", "concrete", "steel", "other"
         self.materialKind = materialKind
 
-        self._StructureSupportInfos = []
-        self.StructureSupportInfos = [] if StructureSupportInfos is None else StructureSupportInfos
+        if StructureSupportInfos is not None:
+            self.StructureSupportInfos = StructureSupportInfos
 
-        self._MountingConnections = []
-        self.MountingConnections = [] if MountingConnections is None else MountingConnections
+        if MountingConnections is not None:
+            self.MountingConnections = MountingConnections
 
         super(Structure, self).__init__(*args, **kw_args)
 
@@ -72,13 +73,15 @@ class Structure(AssetContainer):
     _enums = {"materialKind": "StructureMaterialKind"}
     _refs = ["StructureSupportInfos", "MountingConnections"]
     _many_refs = ["StructureSupportInfos", "MountingConnections"]
+    _inverses = {"StructureSupportInfos": "SecuredStructure", "MountingConnections": "StructureInfos"}
 
     def getStructureSupportInfos(self):
         
         return self._StructureSupportInfos
 
     def setStructureSupportInfos(self, value):
-        for x in self._StructureSupportInfos:
+        value = RefList(value)
+        for x in list(self._StructureSupportInfos):
             x.SecuredStructure = None
         for y in value:
             y._SecuredStructure = self
@@ -100,20 +103,19 @@ class Structure(AssetContainer):
 
     def setMountingConnections(self, value):
         for p in self._MountingConnections:
-            filtered = [q for q in p.StructureInfos if q != self]
-            self._MountingConnections._StructureInfos = filtered
+            p._StructureInfos.discard(self)
         for r in value:
             if self not in r._StructureInfos:
-                r._StructureInfos.append(self)
-        self._MountingConnections = value
+                r._reflist("_StructureInfos").append(self)
+        self._MountingConnections = RefList(value)
 
     MountingConnections = property(getMountingConnections, setMountingConnections)
 
     def addMountingConnections(self, *MountingConnections):
         for obj in MountingConnections:
             if self not in obj._StructureInfos:
-                obj._StructureInfos.append(self)
-            self._MountingConnections.append(obj)
+                obj._reflist("_StructureInfos").append(self)
+            self._reflist("_MountingConnections").append(obj)
 
     def removeMountingConnections(self, *MountingConnections):
         for obj in MountingConnections:
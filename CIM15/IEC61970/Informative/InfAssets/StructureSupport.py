@@ -68,6 +68,7 @@ class StructureSupport(Asset):
     _enums = {"anchorKind": "AnchorKind", "kind": "StructureSupportKind"}
     _refs = ["SecuredStructure"]
     _many_refs = []
+    _inverses = {"SecuredStructure": "StructureSupportInfos"}
 
     def getSecuredStructure(self):
         
@@ -75,13 +76,12 @@ class StructureSupport(Asset):
 
     def setSecuredStructure(self, value):
         if self._SecuredStructure is not None:
-            filtered = [x for x in self.SecuredStructure.StructureSupportInfos if x != self]
-            self._SecuredStructure._StructureSupportInfos = filtered
+            self._SecuredStructure._StructureSupportInfos.discard(self)
 
         self._SecuredStructure = value
         if self._SecuredStructure is not None:
             if self not in self._SecuredStructure._StructureSupportInfos:
-                self._SecuredStructure._StructureSupportInfos.append(self)
+                self._SecuredStructure._reflist("_StructureSupportInfos").append(self)
 
     SecuredStructure = property(getSecuredStructure, setSecuredStructure)
 
@@ -40,4 +40,5 @@ class SubstationAsset(Asset):
     _enums = {"function": "SubstationFunctionKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
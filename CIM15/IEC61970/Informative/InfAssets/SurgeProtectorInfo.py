@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.AssetInfo import AssetInfo
+from CIM15.Element import RefList
 
 class SurgeProtectorInfo(AssetInfo):
     """Properties of surge protector asset.Properties of surge protector asset.
@@ -45,8 +46,8 @@ class SurgeProtectorInfo(AssetInfo):
 
         self.maxEnergyAbsorption = maxEnergyAbsorption
 
-        self._SurgeProtectors = []
-        self.SurgeProtectors = [] if SurgeProtectors is None else SurgeProtectors
+        if SurgeProtectors is not None:
+            self.SurgeProtectors = SurgeProtectors
 
         super(SurgeProtectorInfo, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class SurgeProtectorInfo(AssetInfo):
     _enums = {}
     _refs = ["SurgeProtectors"]
     _many_refs = ["SurgeProtectors"]
+    _inverses = {"SurgeProtectors": "SurgeProtectorInfo"}
 
     def getSurgeProtectors(self):
         """All surge protectors described by this data.
@@ -63,7 +65,8 @@ class SurgeProtectorInfo(AssetInfo):
         return self._SurgeProtectors
 
     def setSurgeProtectors(self, value):
-        for x in self._SurgeProtectors:
+        value = RefList(value)
+        for x in list(self._SurgeProtectors):
             x.SurgeProtectorInfo = None
         for y in value:
             y._SurgeProtectorInfo = self
@@ -72,4 +72,5 @@ class SwitchInfo(AssetInfo):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
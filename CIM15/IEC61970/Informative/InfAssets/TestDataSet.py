@@ -48,4 +48,5 @@ class TestDataSet(ProcedureDataSet):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
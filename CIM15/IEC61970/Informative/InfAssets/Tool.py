@@ -44,6 +44,7 @@ class Tool(Asset):
     _enums = {}
     _refs = ["Crew"]
     _many_refs = []
+    _inverses = {"Crew": "Tools"}
 
     def getCrew(self):
         
@@ -51,13 +52,12 @@ class Tool(Asset):
 
     def setCrew(self, value):
         if self._Crew is not None:
-            filtered = [x for x in self.Crew.Tools if x != self]
-            self._Crew._Tools = filtered
+            self._Crew._Tools.discard(self)
 
         self._Crew = value
         if self._Crew is not None:
             if self not in self._Crew._Tools:
-                self._Crew._Tools.append(self)
+                self._Crew._reflist("_Tools").append(self)
 
     Crew = property(getCrew, setCrew)
 
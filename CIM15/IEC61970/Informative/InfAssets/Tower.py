@@ -40,4 +40,5 @@ class Tower(Structure):
     _enums = {"constructionKind": "TowerConstructionKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
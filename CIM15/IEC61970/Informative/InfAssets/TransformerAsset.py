@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import RefList
 
 class TransformerAsset(Asset):
     """A specific physical (vs. logical) transformer.A specific physical (vs. logical) transformer.
@@ -36,11 +37,11 @@ class TransformerAsset(Asset):
         #: Date and time this asset was last reconditioned or had a major overhaul.
         self.reconditionedDateTime = reconditionedDateTime
 
-        self._PowerRatings = []
-        self.PowerRatings = [] if PowerRatings is None else PowerRatings
+        if PowerRatings is not None:
+            self.PowerRatings = PowerRatings
 
-        self._TransformerObservations = []
-        self.TransformerObservations = [] if TransformerObservations is None else TransformerObservations
+        if TransformerObservations is not None:
+            self.TransformerObservations = TransformerObservations
 
         self._TransformerInfo = None
         self.TransformerInfo = TransformerInfo
@@ -56,6 +57,7 @@ class TransformerAsset(Asset):
     _enums = {}
     _refs = ["PowerRatings", "TransformerObservations", "TransformerInfo", "TransformerAssetModel"]
     _many_refs = ["PowerRatings", "TransformerObservations"]
+    _inverses = {"PowerRatings": "TransformerAssets", "TransformerObservations": "TransformerAsset", "TransformerInfo": "TransformerAssets", "TransformerAssetModel": "TransformerAssets"}
 
     def getPowerRatings(self):
         
@@ -63,20 +65,19 @@ class TransformerAsset(Asset):
 
     def setPowerRatings(self, value):
         for p in self._PowerRatings:
-            filtered = [q for q in p.TransformerAssets if q != self]
-            self._PowerRatings._TransformerAssets = filtered
+            p._TransformerAssets.discard(self)
         for r in value:
             if self not in r._TransformerAssets:
-                r._TransformerAssets.append(self)
-        self._PowerRatings = value
+                r._reflist("_TransformerAssets").append(self)
+        self._PowerRatings = RefList(value)
 
     PowerRatings = property(getPowerRatings, setPowerRatings)
 
     def addPowerRatings(self, *PowerRatings):
         for obj in PowerRatings:
             if self not in obj._TransformerAssets:
-                obj._TransformerAssets.append(self)
-            self._PowerRatings.append(obj)
+                obj._reflist("_TransformerAssets").append(self)
+            self._reflist("_PowerRatings").append(obj)
 
     def removePowerRatings(self, *PowerRatings):
         for obj in PowerRatings:
@@ -89,7 +90,8 @@ class TransformerAsset(Asset):
         return self._TransformerObservations
 
     def setTransformerObservations(self, value):
-        for x in self._TransformerObservations:
+        value = RefList(value)
+        for x in list(self._TransformerObservations):
             x.TransformerAsset = None
         for y in value:
             y._TransformerAsset = self
@@ -111,13 +113,12 @@ class TransformerAsset(Asset):
 
     def setTransformerInfo(self, value):
         if self._TransformerInfo is not None:
-            filtered = [x for x in self.TransformerInfo.TransformerAssets if x != self]
-            self._TransformerInfo._TransformerAssets = filtered
+            self._TransformerInfo._TransformerAssets.discard(self)
 
         self._TransformerInfo = value
         if self._TransformerInfo is not None:
             if self not in self._TransformerInfo._TransformerAssets:
-                self._TransformerInfo._TransformerAssets.append(self)
+                self._TransformerInfo._reflist("_TransformerAssets").append(self)
 
     TransformerInfo = property(getTransformerInfo, setTransformerInfo)
 
@@ -127,13 +128,12 @@ class TransformerAsset(Asset):
 
     def setTransformerAssetModel(self, value):
         if self._TransformerAssetModel is not None:
-            filtered = [x for x in self.TransformerAssetModel.TransformerAssets if x != self]
-            self._TransformerAssetModel._TransformerAssets = filtered
+            self._TransformerAssetModel._TransformerAssets.discard(self)
 
         self._TransformerAssetModel = value
         if self._TransformerAssetModel is not None:
             if self not in self._TransformerAssetModel._TransformerAssets:
-                self._TransformerAssetModel._TransformerAssets.append(self)
+                self._TransformerAssetModel._reflist("_TransformerAssets").append(self)
 
     TransformerAssetModel = property(getTransformerAssetModel, setTransformerAssetModel)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class TransformerObservation(IdentifiedObject):
     """Common information captured during transformer inspections and/or diagnostics. Note that some properties may be measured through other means and therefore have measurement values in addition to the observed values recorded here.Common information captured during transformer inspections and/or diagnostics. Note that some properties may be measured through other means and therefore have measurement values in addition to the observed values recorded here.
@@ -86,19 +87,19 @@ class TransformerObservation(IdentifiedObject):
         #: Pump vibration, with typical values being: nominal, high.
         self.pumpVibration = pumpVibration
 
-        self._BushingInsultationPFs = []
-        self.BushingInsultationPFs = [] if BushingInsultationPFs is None else BushingInsultationPFs
+        if BushingInsultationPFs is not None:
+            self.BushingInsultationPFs = BushingInsultationPFs
 
-        self._ProcedureDataSets = []
-        self.ProcedureDataSets = [] if ProcedureDataSets is None else ProcedureDataSets
+        if ProcedureDataSets is not None:
+            self.ProcedureDataSets = ProcedureDataSets
 
         self._Transformer = None
         self.Transformer = Transformer
 
         self.status = status
 
-        self._WindingInsulationPFs = []
-        self.WindingInsulationPFs = [] if WindingInsulationPFs is None else WindingInsulationPFs
+        if WindingInsulationPFs is not None:
+            self.WindingInsulationPFs = WindingInsulationPFs
 
         self._TransformerAsset = None
         self.TransformerAsset = TransformerAsset
@@ -111,13 +112,15 @@ class TransformerObservation(IdentifiedObject):
     _enums = {}
     _refs = ["BushingInsultationPFs", "ProcedureDataSets", "Transformer", "status", "WindingInsulationPFs", "TransformerAsset"]
     _many_refs = ["BushingInsultationPFs", "ProcedureDataSets", "WindingInsulationPFs"]
+    _inverses = {"BushingInsultationPFs": "TransformerObservation", "ProcedureDataSets": "TransformerObservations", "Transformer": "TransformerObservations", "WindingInsulationPFs": "TransformerObservation", "TransformerAsset": "TransformerObservations"}
 
     def getBushingInsultationPFs(self):
         
         return self._BushingInsultationPFs
 
     def setBushingInsultationPFs(self, value):
-        for x in self._BushingInsultationPFs:
+        value = RefList(value)
+        for x in list(self._BushingInsultationPFs):
             x.TransformerObservation = None
         for y in value:
             y._TransformerObservation = self
@@ -139,20 +142,19 @@ class TransformerObservation(IdentifiedObject):
 
     def setProcedureDataSets(self, value):
         for p in self._ProcedureDataSets:
-            filtered = [q for q in p.TransformerObservations if q != self]
-            self._ProcedureDataSets._TransformerObservations = filtered
+            p._TransformerObservations.discard(self)
         for r in value:
             if self not in r._TransformerObservations:
-                r._TransformerObservations.append(self)
-        self._ProcedureDataSets = value
+                r._reflist("_TransformerObservations").append(self)
+        self._ProcedureDataSets = RefList(value)
 
     ProcedureDataSets = property(getProcedureDataSets, setProcedureDataSets)
 
     def addProcedureDataSets(self, *ProcedureDataSets):
         for obj in ProcedureDataSets:
             if self not in obj._TransformerObservations:
-                obj._TransformerObservations.append(self)
-            self._ProcedureDataSets.append(obj)
+                obj._reflist("_TransformerObservations").append(self)
+            self._reflist("_ProcedureDataSets").append(obj)
 
     def removeProcedureDataSets(self, *ProcedureDataSets):
         for obj in ProcedureDataSets:
@@ -166,13 +168,12 @@ class TransformerObservation(IdentifiedObject):
 
     def setTransformer(self, value):
         if self._Transformer is not None:
-            filtered = [x for x in self.Transformer.TransformerObservations if x != self]
-            self._Transformer._TransformerObservations = filtered
+            self._Transformer._TransformerObservations.discard(self)
 
         self._Transformer = value
         if self._Transformer is not None:
             if self not in self._Transformer._TransformerObservations:
-                self._Transformer._TransformerObservations.append(self)
+                self._Transformer._reflist("_TransformerObservations").append(self)
 
     Transformer = property(getTransformer, setTransformer)
 
@@ -183,7 +184,8 @@ class TransformerObservation(IdentifiedObject):
         return self._WindingInsulationPFs
 
     def setWindingInsulationPFs(self, value):
-        for x in self._WindingInsulationPFs:
+        value = RefList(value)
+        for x in list(self._WindingInsulationPFs):
             x.TransformerObservation = None
         for y in value:
             y._TransformerObservation = self
@@ -205,13 +207,12 @@ class TransformerObservation(IdentifiedObject):
 
     def setTransformerAsset(self, value):
         if self._TransformerAsset is not None:
-            filtered = [x for x in self.TransformerAsset.TransformerObservations if x != self]
-            self._TransformerAsset._TransformerObservations = filtered
+            self._TransformerAsset._TransformerObservations.discard(self)
 
         self._TransformerAsset = value
         if self._TransformerAsset is not None:
             if self not in self._TransformerAsset._TransformerObservations:
-                self._TransformerAsset._TransformerObservations.append(self)
+                self._TransformerAsset._reflist("_TransformerObservations").append(self)
 
     TransformerAsset = property(getTransformerAsset, setTransformerAsset)
 
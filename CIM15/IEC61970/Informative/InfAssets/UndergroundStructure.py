@@ -52,4 +52,5 @@ class UndergroundStructure(Structure):
     _enums = {"kind": "UndergroundStructureKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
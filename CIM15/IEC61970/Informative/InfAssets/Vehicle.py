@@ -52,6 +52,7 @@ class Vehicle(Asset):
     _enums = {"usageKind": "VehicleUsageKind"}
     _refs = ["Crew"]
     _many_refs = []
+    _inverses = {"Crew": "Vehicles"}
 
     def getCrew(self):
         
@@ -59,13 +60,12 @@ class Vehicle(Asset):
 
     def setCrew(self, value):
         if self._Crew is not None:
-            filtered = [x for x in self.Crew.Vehicles if x != self]
-            self._Crew._Vehicles = filtered
+            self._Crew._Vehicles.discard(self)
 
         self._Crew = value
         if self._Crew is not None:
             if self not in self._Crew._Vehicles:
-                self._Crew._Vehicles.append(self)
+                self._Crew._reflist("_Vehicles").append(self)
 
     Crew = property(getCrew, setCrew)
 
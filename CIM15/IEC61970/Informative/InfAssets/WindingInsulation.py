@@ -67,6 +67,7 @@ class WindingInsulation(IdentifiedObject):
     _enums = {}
     _refs = ["Ground", "TransformerObservation", "ToWinding", "FromWinding", "status"]
     _many_refs = []
+    _inverses = {"Ground": "WindingInsulations", "TransformerObservation": "WindingInsulationPFs", "ToWinding": "ToWindingInsulations", "FromWinding": "FromWindingInsulations"}
 
     def getGround(self):
         
@@ -74,13 +75,12 @@ class WindingInsulation(IdentifiedObject):
 
     def setGround(self, value):
         if self._Ground is not None:
-            filtered = [x for x in self.Ground.WindingInsulations if x != self]
-            self._Ground._WindingInsulations = filtered
+            self._Ground._WindingInsulations.discard(self)
 
         self._Ground = value
         if self._Ground is not None:
             if self not in self._Ground._WindingInsulations:
-                self._Ground._WindingInsulations.append(self)
+                self._Ground._reflist("_WindingInsulations").append(self)
 
     Ground = property(getGround, setGround)
 
@@ -90,13 +90,12 @@ class WindingInsulation(IdentifiedObject):
 
     def setTransformerObservation(self, value):
         if self._TransformerObservation is not None:
-            filtered = [x for x in self.TransformerObservation.WindingInsulationPFs if x != self]
-            self._TransformerObservation._WindingInsulationPFs = filtered
+            self._TransformerObservation._WindingInsulationPFs.discard(self)
 
         self._TransformerObservation = value
         if self._TransformerObservation is not None:
             if self not in self._TransformerObservation._WindingInsulationPFs:
-                self._TransformerObservation._WindingInsulationPFs.append(self)
+                self._TransformerObservation._reflist("_WindingInsulationPFs").append(self)
 
     TransformerObservation = property(getTransformerObservation, setTransformerObservation)
 
@@ -106,13 +105,12 @@ class WindingInsulation(IdentifiedObject):
 
     def setToWinding(self, value):
         if self._ToWinding is not None:
-            filtered = [x for x in self.ToWinding.ToWindingInsulations if x != self]
-            self._ToWinding._ToWindingInsulations = filtered
+            self._ToWinding._ToWindingInsulations.discard(self)
 
         self._ToWinding = value
         if self._ToWinding is not None:
             if self not in self._ToWinding._ToWindingInsulations:
-                self._ToWinding._ToWindingInsulations.append(self)
+                self._ToWinding._reflist("_ToWindingInsulations").append(self)
 
     ToWinding = property(getToWinding, setToWinding)
 
@@ -122,13 +120,12 @@ class WindingInsulation(IdentifiedObject):
 
     def setFromWinding(self, value):
         if self._FromWinding is not None:
-            filtered = [x for x in self.FromWinding.FromWindingInsulations if x != self]
-            self._FromWinding._FromWindingInsulations = filtered
+            self._FromWinding._FromWindingInsulations.discard(self)
 
         self._FromWinding = value
         if self._FromWinding is not None:
             if self not in self._FromWinding._FromWindingInsulations:
-                self._FromWinding._FromWindingInsulations.append(self)
+                self._FromWinding._reflist("_FromWindingInsulations").append(self)
 
     FromWinding = property(getFromWinding, setFromWinding)
 
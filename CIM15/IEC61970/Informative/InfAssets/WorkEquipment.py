@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Assets.Asset import Asset
+from CIM15.Element import RefList
 
 class WorkEquipment(Asset):
     """Equipment used to perform units of work by crews, office staff, etc.Equipment used to perform units of work by crews, office staff, etc.
@@ -33,8 +34,8 @@ class WorkEquipment(Asset):
         self._Crew = None
         self.Crew = Crew
 
-        self._Usages = []
-        self.Usages = [] if Usages is None else Usages
+        if Usages is not None:
+            self.Usages = Usages
 
         super(WorkEquipment, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class WorkEquipment(Asset):
     _enums = {}
     _refs = ["Crew", "Usages"]
     _many_refs = ["Usages"]
+    _inverses = {"Crew": "WorkEquipmentAssets", "Usages": "WorkEquipmentAsset"}
 
     def getCrew(self):
         
@@ -51,13 +53,12 @@ class WorkEquipment(Asset):
 
     def setCrew(self, value):
         if self._Crew is not None:
-            filtered = [x for x in self.Crew.WorkEquipmentAssets if x != self]
-            self._Crew._WorkEquipmentAssets = filtered
+            self._Crew._WorkEquipmentAssets.discard(self)
 
         self._Crew = value
         if self._Crew is not None:
             if self not in self._Crew._WorkEquipmentAssets:
-                self._Crew._WorkEquipmentAssets.append(self)
+                self._Crew._reflist("_WorkEquipmentAssets").append(self)
 
     Crew = property(getCrew, setCrew)
 
@@ -66,7 +67,8 @@ class WorkEquipment(Asset):
         return self._Usages
 
     def setUsages(self, value):
-        for x in self._Usages:
+        value = RefList(value)
+        for x in list(self._Usages):
             x.WorkEquipmentAsset = None
         for y in value:
             y._WorkEquipmentAsset = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from CIM15.Element import RefList
 
 class Bank(Organisation):
     """Organisation that is a commercial bank, agency, or other institution that offers a similar service.Organisation that is a commercial bank, agency, or other institution that offers a similar service.
@@ -41,8 +42,8 @@ class Bank(Organisation):
         #: Codified reference to the particular branch of the bank where BankAccount is held.
         self.branchCode = branchCode
 
-        self._BankAccounts = []
-        self.BankAccounts = [] if BankAccounts is None else BankAccounts
+        if BankAccounts is not None:
+            self.BankAccounts = BankAccounts
 
         super(Bank, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class Bank(Organisation):
     _enums = {}
     _refs = ["BankAccounts"]
     _many_refs = ["BankAccounts"]
+    _inverses = {"BankAccounts": "Bank"}
 
     def getBankAccounts(self):
         """All BankAccounts this Bank provides.
@@ -59,7 +61,8 @@ class Bank(Organisation):
         return self._BankAccounts
 
     def setBankAccounts(self, value):
-        for x in self._BankAccounts:
+        value = RefList(value)
+        for x in list(self._BankAccounts):
             x.Bank = None
         for y in value:
             y._Bank = self
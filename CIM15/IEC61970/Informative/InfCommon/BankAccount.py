@@ -48,6 +48,7 @@ class BankAccount(Document):
     _enums = {}
     _refs = ["ServiceSupplier", "Bank"]
     _many_refs = []
+    _inverses = {"ServiceSupplier": "BankAccounts", "Bank": "BankAccounts"}
 
     def getServiceSupplier(self):
         """ServiceSupplier that is owner of this BankAccount.
@@ -56,13 +57,12 @@ class BankAccount(Document):
 
     def setServiceSupplier(self, value):
         if self._ServiceSupplier is not None:
-            filtered = [x for x in self.ServiceSupplier.BankAccounts if x != self]
-            self._ServiceSupplier._BankAccounts = filtered
+            self._ServiceSupplier._BankAccounts.discard(self)
 
         self._ServiceSupplier = value
         if self._ServiceSupplier is not None:
             if self not in self._ServiceSupplier._BankAccounts:
-                self._ServiceSupplier._BankAccounts.append(self)
+                self._ServiceSupplier._reflist("_BankAccounts").append(self)
 
     ServiceSupplier = property(getServiceSupplier, setServiceSupplier)
 
@@ -73,13 +73,12 @@ class BankAccount(Document):
 
     def setBank(self, value):
         if self._Bank is not None:
-            filtered = [x for x in self.Bank.BankAccounts if x != self]
-            self._Bank._BankAccounts = filtered
+            self._Bank._BankAccounts.discard(self)
 
         self._Bank = value
         if self._Bank is not None:
             if self not in self._Bank._BankAccounts:
-                self._Bank._BankAccounts.append(self)
+                self._Bank._reflist("_BankAccounts").append(self)
 
     Bank = property(getBank, setBank)
 
@@ -36,4 +36,5 @@ class BusinessPlan(Document):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class BusinessRole(IdentifiedObject):
     """A business role that this organisation plays. A single organisation typically performs many functions, each one described as a role.A business role that this organisation plays. A single organisation typically performs many functions, each one described as a role.
@@ -34,8 +35,8 @@ class BusinessRole(IdentifiedObject):
         #: Category by utility's corporate standards and practices.
         self.category = category
 
-        self._Organisations = []
-        self.Organisations = [] if Organisations is None else Organisations
+        if Organisations is not None:
+            self.Organisations = Organisations
 
         self.status = status
 
@@ -47,6 +48,7 @@ class BusinessRole(IdentifiedObject):
     _enums = {}
     _refs = ["Organisations", "status"]
     _many_refs = ["Organisations"]
+    _inverses = {"Organisations": "BusinessRoles"}
 
     def getOrganisations(self):
         
@@ -54,20 +56,19 @@ class BusinessRole(IdentifiedObject):
 
     def setOrganisations(self, value):
         for p in self._Organisations:
-            filtered = [q for q in p.BusinessRoles if q != self]
-            self._Organisations._BusinessRoles = filtered
+            p._BusinessRoles.discard(self)
         for r in value:
             if self not in r._BusinessRoles:
-                r._BusinessRoles.append(self)
-        self._Organisations = value
+                r._reflist("_BusinessRoles").append(self)
+        self._Organisations = RefList(value)
 
     Organisations = property(getOrganisations, setOrganisations)
 
     def addOrganisations(self, *Organisations):
         for obj in Organisations:
             if self not in obj._BusinessRoles:
-                obj._BusinessRoles.append(self)
-            self._Organisations.append(obj)
+                obj._reflist("_BusinessRoles").append(self)
+            self._reflist("_Organisations").append(obj)
 
     def removeOrganisations(self, *Organisations):
         for obj in Organisations:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Craft(IdentifiedObject):
     """Craft of a person or a crew. Examples include overhead electric, underground electric, high pressure gas, etc. This ensures necessary knowledge and skills before being allowed to perform certain types of work.Craft of a person or a crew. Examples include overhead electric, underground electric, high pressure gas, etc. This ensures necessary knowledge and skills before being allowed to perform certain types of work.
@@ -36,16 +37,16 @@ class Craft(IdentifiedObject):
         #: Category by utility's work mangement standards and practices.
         self.category = category
 
-        self._Skills = []
-        self.Skills = [] if Skills is None else Skills
+        if Skills is not None:
+            self.Skills = Skills
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
         self.status = status
 
-        self._Capabilities = []
-        self.Capabilities = [] if Capabilities is None else Capabilities
+        if Capabilities is not None:
+            self.Capabilities = Capabilities
 
         super(Craft, self).__init__(*args, **kw_args)
 
@@ -55,6 +56,7 @@ class Craft(IdentifiedObject):
     _enums = {}
     _refs = ["Skills", "ErpPersons", "status", "Capabilities"]
     _many_refs = ["Skills", "ErpPersons", "Capabilities"]
+    _inverses = {"Skills": "Crafts", "ErpPersons": "Crafts", "Capabilities": "Crafts"}
 
     def getSkills(self):
         
@@ -62,20 +64,19 @@ class Craft(IdentifiedObject):
 
     def setSkills(self, value):
         for p in self._Skills:
-            filtered = [q for q in p.Crafts if q != self]
-            self._Skills._Crafts = filtered
+            p._Crafts.discard(self)
         for r in value:
             if self not in r._Crafts:
-                r._Crafts.append(self)
-        self._Skills = value
+                r._reflist("_Crafts").append(self)
+        self._Skills = RefList(value)
 
     Skills = property(getSkills, setSkills)
 
     def addSkills(self, *Skills):
         for obj in Skills:
             if self not in obj._Crafts:
-                obj._Crafts.append(self)
-            self._Skills.append(obj)
+                obj._reflist("_Crafts").append(self)
+            self._reflist("_Skills").append(obj)
 
     def removeSkills(self, *Skills):
         for obj in Skills:
@@ -89,20 +90,19 @@ class Craft(IdentifiedObject):
 
     def setErpPersons(self, value):
         for p in self._ErpPersons:
-            filtered = [q for q in p.Crafts if q != self]
-            self._ErpPersons._Crafts = filtered
+            p._Crafts.discard(self)
         for r in value:
             if self not in r._Crafts:
-                r._Crafts.append(self)
-        self._ErpPersons = value
+                r._reflist("_Crafts").append(self)
+        self._ErpPersons = RefList(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
             if self not in obj._Crafts:
-                obj._Crafts.append(self)
-            self._ErpPersons.append(obj)
+                obj._reflist("_Crafts").append(self)
+            self._reflist("_ErpPersons").append(obj)
 
     def removeErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
@@ -118,20 +118,19 @@ class Craft(IdentifiedObject):
 
     def setCapabilities(self, value):
         for p in self._Capabilities:
-            filtered = [q for q in p.Crafts if q != self]
-            self._Capabilities._Crafts = filtered
+            p._Crafts.discard(self)
         for r in value:
             if self not in r._Crafts:
-                r._Crafts.append(self)
-        self._Capabilities = value
+                r._reflist("_Crafts").append(self)
+        self._Capabilities = RefList(value)
 
     Capabilities = property(getCapabilities, setCapabilities)
 
     def addCapabilities(self, *Capabilities):
         for obj in Capabilities:
             if self not in obj._Crafts:
-                obj._Crafts.append(self)
-            self._Capabilities.append(obj)
+                obj._reflist("_Crafts").append(self)
+            self._reflist("_Capabilities").append(obj)
 
     def removeCapabilities(self, *Capabilities):
         for obj in Capabilities:
@@ -44,6 +44,7 @@ class DocDocRole(Role):
     _enums = {}
     _refs = ["ToDocument", "FromDocument"]
     _many_refs = []
+    _inverses = {"ToDocument": "FromDocumentRoles", "FromDocument": "ToDocumentRoles"}
 
     def getToDocument(self):
         
@@ -51,13 +52,12 @@ class DocDocRole(Role):
 
     def setToDocument(self, value):
         if self._ToDocument is not None:
-            filtered = [x for x in self.ToDocument.FromDocumentRoles if x != self]
-            self._ToDocument._FromDocumentRoles = filtered
+            self._ToDocument._FromDocumentRoles.discard(self)
 
         self._ToDocument = value
         if self._ToDocument is not None:
             if self not in self._ToDocument._FromDocumentRoles:
-                self._ToDocument._FromDocumentRoles.append(self)
+                self._ToDocument._reflist("_FromDocumentRoles").append(self)
 
     ToDocument = property(getToDocument, setToDocument)
 
@@ -67,13 +67,12 @@ class DocDocRole(Role):
 
     def setFromDocument(self, value):
         if self._FromDocument is not None:
-            filtered = [x for x in self.FromDocument.ToDocumentRoles if x != self]
-            self._FromDocument._ToDocumentRoles = filtered
+            self._FromDocument._ToDocumentRoles.discard(self)
 
         self._FromDocument = value
         if self._FromDocument is not None:
             if self not in self._FromDocument._ToDocumentRoles:
-                self._FromDocument._ToDocumentRoles.append(self)
+                self._FromDocument._reflist("_ToDocumentRoles").append(self)
 
     FromDocument = property(getFromDocument, setFromDocument)
 
@@ -44,6 +44,7 @@ class DocPsrRole(Role):
     _enums = {}
     _refs = ["Document", "PowerSystemResource"]
     _many_refs = []
+    _inverses = {"Document": "PowerSystemResourceRoles", "PowerSystemResource": "DocumentRoles"}
 
     def getDocument(self):
         
@@ -51,13 +52,12 @@ class DocPsrRole(Role):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.PowerSystemResourceRoles if x != self]
-            self._Document._PowerSystemResourceRoles = filtered
+            self._Document._PowerSystemResourceRoles.discard(self)
 
         self._Document = value
         if self._Document is not None:
             if self not in self._Document._PowerSystemResourceRoles:
-                self._Document._PowerSystemResourceRoles.append(self)
+                self._Document._reflist("_PowerSystemResourceRoles").append(self)
 
     Document = property(getDocument, setDocument)
 
@@ -67,13 +67,12 @@ class DocPsrRole(Role):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.DocumentRoles if x != self]
-            self._PowerSystemResource._DocumentRoles = filtered
+            self._PowerSystemResource._DocumentRoles.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
             if self not in self._PowerSystemResource._DocumentRoles:
-                self._PowerSystemResource._DocumentRoles.append(self)
+                self._PowerSystemResource._reflist("_DocumentRoles").append(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -42,4 +42,5 @@ class Ratio(object):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -43,6 +43,7 @@ class Role(IdentifiedObject):
     _enums = {}
     _refs = ["status"]
     _many_refs = []
+    _inverses = {}
 
     status = None
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ScheduleParameterInfo(IdentifiedObject):
     """Schedule parameters for an activity that is to occur, is occurring, or has completed.Schedule parameters for an activity that is to occur, is occurring, or has completed.
@@ -39,13 +40,13 @@ class ScheduleParameterInfo(IdentifiedObject):
 
         self.requestedWindow = requestedWindow
 
-        self._Documents = []
-        self.Documents = [] if Documents is None else Documents
+        if Documents is not None:
+            self.Documents = Documents
 
         self.estimatedWindow = estimatedWindow
 
-        self._ScheduledEvents = []
-        self.ScheduledEvents = [] if ScheduledEvents is None else ScheduledEvents
+        if ScheduledEvents is not None:
+            self.ScheduledEvents = ScheduledEvents
 
         self.status = status
 
@@ -57,6 +58,7 @@ class ScheduleParameterInfo(IdentifiedObject):
     _enums = {}
     _refs = ["ForInspectionDataSet", "requestedWindow", "Documents", "estimatedWindow", "ScheduledEvents", "status"]
     _many_refs = ["Documents", "ScheduledEvents"]
+    _inverses = {"ForInspectionDataSet": "AccordingToSchedules", "Documents": "ScheduleParameterInfos", "ScheduledEvents": "ScheduleParameterInfo"}
 
     def getForInspectionDataSet(self):
         
@@ -64,13 +66,12 @@ class ScheduleParameterInfo(IdentifiedObject):
 
     def setForInspectionDataSet(self, value):
         if self._ForInspectionDataSet is not None:
-            filtered = [x for x in self.ForInspectionDataSet.AccordingToSchedules if x != self]
-            self._ForInspectionDataSet._AccordingToSchedules = filtered
+            self._ForInspectionDataSet._AccordingToSchedules.discard(self)
 
         self._ForInspectionDataSet = value
         if self._ForInspectionDataSet is not None:
             if self not in self._ForInspectionDataSet._AccordingToSchedules:
-                self._ForInspectionDataSet._AccordingToSchedules.append(self)
+                self._ForInspectionDataSet._reflist("_AccordingToSchedules").append(self)
 
     ForInspectionDataSet = property(getForInspectionDataSet, setForInspectionDataSet)
 
@@ -83,20 +84,19 @@ class ScheduleParameterInfo(IdentifiedObject):
 
     def setDocuments(self, value):
         for p in self._Documents:
-            filtered = [q for q in p.ScheduleParameterInfos if q != self]
-            self._Documents._ScheduleParameterInfos = filtered
+            p._ScheduleParameterInfos.discard(self)
         for r in value:
             if self not in r._ScheduleParameterInfos:
-                r._ScheduleParameterInfos.append(self)
-        self._Documents = value
+                r._reflist("_ScheduleParameterInfos").append(self)
+        self._Documents = RefList(value)
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
         for obj in Documents:
             if self not in obj._ScheduleParameterInfos:
-                obj._ScheduleParameterInfos.append(self)
-            self._Documents.append(obj)
+                obj._reflist("_ScheduleParameterInfos").append(self)
+            self._reflist("_Documents").append(obj)
 
     def removeDocuments(self, *Documents):
         for obj in Documents:
@@ -112,7 +112,8 @@ class ScheduleParameterInfo(IdentifiedObject):
         return self._ScheduledEvents
 
     def setScheduledEvents(self, value):
-        for x in self._ScheduledEvents:
+        value = RefList(value)
+        for x in list(self._ScheduledEvents):
             x.ScheduleParameterInfo = None
         for y in value:
             y._ScheduleParameterInfo = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ScheduledEvent(IdentifiedObject):
     """Signifies an event to trigger one or more activities, such as reading a meter, recalculating a bill, requesting work, when generating units must be scheduled for maintenance, when a transformer is scheduled to be refurbished, etc.Signifies an event to trigger one or more activities, such as reading a meter, recalculating a bill, requesting work, when generating units must be scheduled for maintenance, when a transformer is scheduled to be refurbished, etc.
@@ -56,8 +57,8 @@ class ScheduledEvent(IdentifiedObject):
         self._ScheduleParameterInfo = None
         self.ScheduleParameterInfo = ScheduleParameterInfo
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
         super(ScheduledEvent, self).__init__(*args, **kw_args)
 
@@ -67,6 +68,7 @@ class ScheduledEvent(IdentifiedObject):
     _enums = {}
     _refs = ["Document", "ActivityRecord", "status", "TimePoint", "ScheduleParameterInfo", "Assets"]
     _many_refs = ["Assets"]
+    _inverses = {"Document": "ScheduledEvents", "ActivityRecord": "ScheduledEvent", "TimePoint": "ScheduledEvents", "ScheduleParameterInfo": "ScheduledEvents", "Assets": "ScheduledEvents"}
 
     def getDocument(self):
         
@@ -74,13 +76,12 @@ class ScheduledEvent(IdentifiedObject):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.ScheduledEvents if x != self]
-            self._Document._ScheduledEvents = filtered
+            self._Document._ScheduledEvents.discard(self)
 
         self._Document = value
         if self._Document is not None:
             if self not in self._Document._ScheduledEvents:
-                self._Document._ScheduledEvents.append(self)
+                self._Document._reflist("_ScheduledEvents").append(self)
 
     Document = property(getDocument, setDocument)
 
@@ -107,13 +108,12 @@ class ScheduledEvent(IdentifiedObject):
 
     def setTimePoint(self, value):
         if self._TimePoint is not None:
-            filtered = [x for x in self.TimePoint.ScheduledEvents if x != self]
-            self._TimePoint._ScheduledEvents = filtered
+            self._TimePoint._ScheduledEvents.discard(self)
 
         self._TimePoint = value
         if self._TimePoint is not None:
             if self not in self._TimePoint._ScheduledEvents:
-                self._TimePoint._ScheduledEvents.append(self)
+                self._TimePoint._reflist("_ScheduledEvents").append(self)
 
     TimePoint = property(getTimePoint, setTimePoint)
 
@@ -123,13 +123,12 @@ class ScheduledEvent(IdentifiedObject):
 
     def setScheduleParameterInfo(self, value):
         if self._ScheduleParameterInfo is not None:
-            filtered = [x for x in self.ScheduleParameterInfo.ScheduledEvents if x != self]
-            self._ScheduleParameterInfo._ScheduledEvents = filtered
+            self._ScheduleParameterInfo._ScheduledEvents.discard(self)
 
         self._ScheduleParameterInfo = value
         if self._ScheduleParameterInfo is not None:
             if self not in self._ScheduleParameterInfo._ScheduledEvents:
-                self._ScheduleParameterInfo._ScheduledEvents.append(self)
+                self._ScheduleParameterInfo._reflist("_ScheduledEvents").append(self)
 
     ScheduleParameterInfo = property(getScheduleParameterInfo, setScheduleParameterInfo)
 
@@ -139,20 +138,19 @@ class ScheduledEvent(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.ScheduledEvents if q != self]
-            self._Assets._ScheduledEvents = filtered
+            p._ScheduledEvents.discard(self)
         for r in value:
             if self not in r._ScheduledEvents:
-                r._ScheduledEvents.append(self)
-        self._Assets = value
+                r._reflist("_ScheduledEvents").append(self)
+        self._Assets = RefList(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
             if self not in obj._ScheduledEvents:
-                obj._ScheduledEvents.append(self)
-            self._Assets.append(obj)
+                obj._reflist("_ScheduledEvents").append(self)
+            self._reflist("_Assets").append(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
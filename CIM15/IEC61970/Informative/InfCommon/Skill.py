@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class Skill(Document):
     """Proficiency level of a craft, which is required to operate or maintain a particular type of asset and/or perform certain types of work.Proficiency level of a craft, which is required to operate or maintain a particular type of asset and/or perform certain types of work.
@@ -40,14 +41,14 @@ class Skill(Document):
         #: Level of skill for a Craft. Values are: "apprentice", "other", "master", "standard"
         self.level = level
 
-        self._Crafts = []
-        self.Crafts = [] if Crafts is None else Crafts
+        if Crafts is not None:
+            self.Crafts = Crafts
 
         self._ErpPerson = None
         self.ErpPerson = ErpPerson
 
-        self._QualificationRequirements = []
-        self.QualificationRequirements = [] if QualificationRequirements is None else QualificationRequirements
+        if QualificationRequirements is not None:
+            self.QualificationRequirements = QualificationRequirements
 
         self.certificationPeriod = certificationPeriod
 
@@ -59,6 +60,7 @@ class Skill(Document):
     _enums = {"level": "SkillLevelKind"}
     _refs = ["Crafts", "ErpPerson", "QualificationRequirements", "certificationPeriod"]
     _many_refs = ["Crafts", "QualificationRequirements"]
+    _inverses = {"Crafts": "Skills", "ErpPerson": "Skills", "QualificationRequirements": "Skills"}
 
     def getCrafts(self):
         
@@ -66,20 +68,19 @@ class Skill(Document):
 
     def setCrafts(self, value):
         for p in self._Crafts:
-            filtered = [q for q in p.Skills if q != self]
-            self._Crafts._Skills = filtered
+            p._Skills.discard(self)
         for r in value:
             if self not in r._Skills:
-                r._Skills.append(self)
-        self._Crafts = value
+                r._reflist("_Skills").append(self)
+        self._Crafts = RefList(value)
 
     Crafts = property(getCrafts, setCrafts)
 
     def addCrafts(self, *Crafts):
         for obj in Crafts:
             if self not in obj._Skills:
-                obj._Skills.append(self)
-            self._Crafts.append(obj)
+                obj._reflist("_Skills").append(self)
+            self._reflist("_Crafts").append(obj)
 
     def removeCrafts(self, *Crafts):
         for obj in Crafts:
@@ -93,13 +94,12 @@ class Skill(Document):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.Skills if x != self]
-            self._ErpPerson._Skills = filtered
+            self._ErpPerson._Skills.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
             if self not in self._ErpPerson._Skills:
-                self._ErpPerson._Skills.append(self)
+                self._ErpPerson._reflist("_Skills").append(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
@@ -109,20 +109,19 @@ class Skill(Document):
 
     def setQualificationRequirements(self, value):
         for p in self._QualificationRequirements:
-            filtered = [q for q in p.Skills if q != self]
-            self._QualificationRequirements._Skills = filtered
+            p._Skills.discard(self)
         for r in value:
             if self not in r._Skills:
-                r._Skills.append(self)
-        self._QualificationRequirements = value
+                r._reflist("_Skills").append(self)
+        self._QualificationRequirements = RefList(value)
 
     QualificationRequirements = property(getQualificationRequirements, setQualificationRequirements)
 
     def addQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
             if self not in obj._Skills:
-                obj._Skills.append(self)
-            self._QualificationRequirements.append(obj)
+                obj._reflist("_Skills").append(self)
+            self._reflist("_QualificationRequirements").append(obj)
 
     def removeQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
@@ -19,9 +19,14 @@
 # IN THE SOFTWARE.
 
 
-from CIM15.IEC61970.Informative.InfCore.ModelingAuthority import ModelingAuthority
-from CIM15.IEC61970.Informative.InfCore.ModelingAuthoritySet import ModelingAuthoritySet
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#InfCore"
 nsPrefix = "cimInfCore"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ModelingAuthority",
+    "ModelingAuthoritySet",
+])
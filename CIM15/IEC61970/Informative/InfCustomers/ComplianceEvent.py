@@ -40,4 +40,5 @@ class ComplianceEvent(ActivityRecord):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class ExternalCustomerAgreement(Agreement):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
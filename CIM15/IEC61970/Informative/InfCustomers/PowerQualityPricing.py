@@ -72,4 +72,5 @@ class PowerQualityPricing(Document):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
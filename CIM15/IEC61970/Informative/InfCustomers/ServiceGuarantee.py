@@ -51,6 +51,7 @@ class ServiceGuarantee(Document):
     _enums = {}
     _refs = ["applicationPeriod"]
     _many_refs = []
+    _inverses = {}
 
     # Period in which this service guantee applies.
     applicationPeriod = None
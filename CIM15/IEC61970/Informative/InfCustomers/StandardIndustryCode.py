@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class StandardIndustryCode(Document):
     """The Standard Industrial Classification (SIC) are the codes that identify the type of products/service an industry is involved in, and used for statutory reporting purposes. For example, in the USA these codes are located by the federal government, and then published in a book entitled 'The Standard Industrial Classification Manual'. The codes are arranged in a hierarchical structure. Note that Residential Service Agreements are not classified according to the SIC codes.The Standard Industrial Classification (SIC) are the codes that identify the type of products/service an industry is involved in, and used for statutory reporting purposes. For example, in the USA these codes are located by the federal government, and then published in a book entitled 'The Standard Industrial Classification Manual'. The codes are arranged in a hierarchical structure. Note that Residential Service Agreements are not classified according to the SIC codes.
@@ -33,8 +34,8 @@ class StandardIndustryCode(Document):
         #: Standard alphanumeric code assigned to a particular product/service within an industry.
         self.code = code
 
-        self._CustomerAgreements = []
-        self.CustomerAgreements = [] if CustomerAgreements is None else CustomerAgreements
+        if CustomerAgreements is not None:
+            self.CustomerAgreements = CustomerAgreements
 
         super(StandardIndustryCode, self).__init__(*args, **kw_args)
 
@@ -44,13 +45,15 @@ class StandardIndustryCode(Document):
     _enums = {}
     _refs = ["CustomerAgreements"]
     _many_refs = ["CustomerAgreements"]
+    _inverses = {"CustomerAgreements": "StandardIndustryCode"}
 
     def getCustomerAgreements(self):
         
         return self._CustomerAgreements
 
     def setCustomerAgreements(self, value):
-        for x in self._CustomerAgreements:
+        value = RefList(value)
+        for x in list(self._CustomerAgreements):
             x.StandardIndustryCode = None
         for y in value:
             y._StandardIndustryCode = self
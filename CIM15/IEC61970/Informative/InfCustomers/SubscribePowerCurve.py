@@ -36,4 +36,5 @@ class SubscribePowerCurve(Curve):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class WorkBillingInfo(Document):
     """Billing information for work performed for the customer. The history of Work Billing Info, Invoices, and Payments is to be maintained in associated ActivityRecords.Billing information for work performed for the customer. The history of Work Billing Info, Invoices, and Payments is to be maintained in associated ActivityRecords.
@@ -59,14 +60,14 @@ class WorkBillingInfo(Document):
         #: Amount of bill.
         self.workPrice = workPrice
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        if Works is not None:
+            self.Works = Works
 
         self._CustomerAccount = None
         self.CustomerAccount = CustomerAccount
 
-        self._ErpLineItems = []
-        self.ErpLineItems = [] if ErpLineItems is None else ErpLineItems
+        if ErpLineItems is not None:
+            self.ErpLineItems = ErpLineItems
 
         super(WorkBillingInfo, self).__init__(*args, **kw_args)
 
@@ -76,13 +77,15 @@ class WorkBillingInfo(Document):
     _enums = {}
     _refs = ["Works", "CustomerAccount", "ErpLineItems"]
     _many_refs = ["Works", "ErpLineItems"]
+    _inverses = {"Works": "WorkBillingInfo", "CustomerAccount": "WorkBillingInfos", "ErpLineItems": "WorkBillingInfos"}
 
     def getWorks(self):
         
         return self._Works
 
     def setWorks(self, value):
-        for x in self._Works:
+        value = RefList(value)
+        for x in list(self._Works):
             x.WorkBillingInfo = None
         for y in value:
             y._WorkBillingInfo = self
@@ -104,13 +107,12 @@ class WorkBillingInfo(Document):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.WorkBillingInfos if x != self]
-            self._CustomerAccount._WorkBillingInfos = filtered
+            self._CustomerAccount._WorkBillingInfos.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
             if self not in self._CustomerAccount._WorkBillingInfos:
-                self._CustomerAccount._WorkBillingInfos.append(self)
+                self._CustomerAccount._reflist("_WorkBillingInfos").append(self)
 
     CustomerAccount = property(getCustomerAccount, setCustomerAccount)
 
@@ -120,20 +122,19 @@ class WorkBillingInfo(Document):
 
     def setErpLineItems(self, value):
         for p in self._ErpLineItems:
-            filtered = [q for q in p.WorkBillingInfos if q != self]
-            self._ErpLineItems._WorkBillingInfos = filtered
+            p._WorkBillingInfos.discard(self)
         for r in value:
             if self not in r._WorkBillingInfos:
-                r._WorkBillingInfos.append(self)
-        self._ErpLineItems = value
+                r._reflist("_WorkBillingInfos").append(self)
+        self._ErpLineItems = RefList(value)
 
     ErpLineItems = property(getErpLineItems, setErpLineItems)
 
     def addErpLineItems(self, *ErpLineItems):
         for obj in ErpLineItems:
             if self not in obj._WorkBillingInfos:
-                obj._WorkBillingInfos.append(self)
-            self._ErpLineItems.append(obj)
+                obj._reflist("_WorkBillingInfos").append(self)
+            self._reflist("_ErpLineItems").append(obj)
 
     def removeErpLineItems(self, *ErpLineItems):
         for obj in ErpLineItems:
@@ -21,15 +21,8 @@
 """The package is used to define detailed customer models.
 """
 
-from CIM15.IEC61970.Informative.InfCustomers.StandardIndustryCode import StandardIndustryCode
-from CIM15.IEC61970.Informative.InfCustomers.OutageHistory import OutageHistory
-from CIM15.IEC61970.Informative.InfCustomers.ComplianceEvent import ComplianceEvent
-from CIM15.IEC61970.Informative.InfCustomers.CustomerBillingInfo import CustomerBillingInfo
-from CIM15.IEC61970.Informative.InfCustomers.ServiceGuarantee import ServiceGuarantee
-from CIM15.IEC61970.Informative.InfCustomers.SubscribePowerCurve import SubscribePowerCurve
-from CIM15.IEC61970.Informative.InfCustomers.ExternalCustomerAgreement import ExternalCustomerAgreement
-from CIM15.IEC61970.Informative.InfCustomers.PowerQualityPricing import PowerQualityPricing
-from CIM15.IEC61970.Informative.InfCustomers.WorkBillingInfo import WorkBillingInfo
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#InfCustomers"
 nsPrefix = "cimInfCustomers"
@@ -39,3 +32,16 @@ class CustomerBillingKind(str):
     """Values are: consolidatedUdc, other, separateEssUdc, consolidatedEss
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "StandardIndustryCode",
+    "OutageHistory",
+    "ComplianceEvent",
+    "CustomerBillingInfo",
+    "ServiceGuarantee",
+    "SubscribePowerCurve",
+    "ExternalCustomerAgreement",
+    "PowerQualityPricing",
+    "WorkBillingInfo",
+])
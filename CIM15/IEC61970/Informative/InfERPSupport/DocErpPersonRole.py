@@ -44,6 +44,7 @@ class DocErpPersonRole(Role):
     _enums = {}
     _refs = ["Document", "ErpPerson"]
     _many_refs = []
+    _inverses = {"Document": "ErpPersonRoles", "ErpPerson": "DocumentRoles"}
 
     def getDocument(self):
         
@@ -51,13 +52,12 @@ class DocErpPersonRole(Role):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.ErpPersonRoles if x != self]
-            self._Document._ErpPersonRoles = filtered
+            self._Document._ErpPersonRoles.discard(self)
 
         self._Document = value
         if self._Document is not None:
             if self not in self._Document._ErpPersonRoles:
-                self._Document._ErpPersonRoles.append(self)
+                self._Document._reflist("_ErpPersonRoles").append(self)
 
     Document = property(getDocument, setDocument)
 
@@ -67,13 +67,12 @@ class DocErpPersonRole(Role):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.DocumentRoles if x != self]
-            self._ErpPerson._DocumentRoles = filtered
+            self._ErpPerson._DocumentRoles.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
             if self not in self._ErpPerson._DocumentRoles:
-                self._ErpPerson._DocumentRoles.append(self)
+                self._ErpPerson._reflist("_DocumentRoles").append(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
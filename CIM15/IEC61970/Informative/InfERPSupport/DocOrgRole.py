@@ -44,6 +44,7 @@ class DocOrgRole(Role):
     _enums = {}
     _refs = ["Document", "ErpOrganisation"]
     _many_refs = []
+    _inverses = {"Document": "ErpOrganisationRoles", "ErpOrganisation": "DocumentRoles"}
 
     def getDocument(self):
         
@@ -51,13 +52,12 @@ class DocOrgRole(Role):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.ErpOrganisationRoles if x != self]
-            self._Document._ErpOrganisationRoles = filtered
+            self._Document._ErpOrganisationRoles.discard(self)
 
         self._Document = value
         if self._Document is not None:
             if self not in self._Document._ErpOrganisationRoles:
-                self._Document._ErpOrganisationRoles.append(self)
+                self._Document._reflist("_ErpOrganisationRoles").append(self)
 
     Document = property(getDocument, setDocument)
 
@@ -67,13 +67,12 @@ class DocOrgRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.DocumentRoles if x != self]
-            self._ErpOrganisation._DocumentRoles = filtered
+            self._ErpOrganisation._DocumentRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
             if self not in self._ErpOrganisation._DocumentRoles:
-                self._ErpOrganisation._DocumentRoles.append(self)
+                self._ErpOrganisation._reflist("_DocumentRoles").append(self)
 
     ErpOrganisation = property(getErpOrganisation, setErpOrganisation)
 
@@ -40,4 +40,5 @@ class ErpBankAccount(BankAccount):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
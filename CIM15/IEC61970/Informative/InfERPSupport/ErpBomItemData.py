@@ -48,6 +48,7 @@ class ErpBomItemData(IdentifiedObject):
     _enums = {}
     _refs = ["TypeAsset", "ErpBOM", "DesignLocation"]
     _many_refs = []
+    _inverses = {"TypeAsset": "ErpBomItemDatas", "ErpBOM": "ErpBomItemDatas", "DesignLocation": "ErpBomItemDatas"}
 
     def getTypeAsset(self):
         
@@ -55,13 +56,12 @@ class ErpBomItemData(IdentifiedObject):
 
     def setTypeAsset(self, value):
         if self._TypeAsset is not None:
-            filtered = [x for x in self.TypeAsset.ErpBomItemDatas if x != self]
-            self._TypeAsset._ErpBomItemDatas = filtered
+            self._TypeAsset._ErpBomItemDatas.discard(self)
 
         self._TypeAsset = value
         if self._TypeAsset is not None:
             if self not in self._TypeAsset._ErpBomItemDatas:
-                self._TypeAsset._ErpBomItemDatas.append(self)
+                self._TypeAsset._reflist("_ErpBomItemDatas").append(self)
 
     TypeAsset = property(getTypeAsset, setTypeAsset)
 
@@ -71,13 +71,12 @@ class ErpBomItemData(IdentifiedObject):
 
     def setErpBOM(self, value):
         if self._ErpBOM is not None:
-            filtered = [x for x in self.ErpBOM.ErpBomItemDatas if x != self]
-            self._ErpBOM._ErpBomItemDatas = filtered
+            self._ErpBOM._ErpBomItemDatas.discard(self)
 
         self._ErpBOM = value
         if self._ErpBOM is not None:
             if self not in self._ErpBOM._ErpBomItemDatas:
-                self._ErpBOM._ErpBomItemDatas.append(self)
+                self._ErpBOM._reflist("_ErpBomItemDatas").append(self)
 
     ErpBOM = property(getErpBOM, setErpBOM)
 
@@ -87,13 +86,12 @@ class ErpBomItemData(IdentifiedObject):
 
     def setDesignLocation(self, value):
         if self._DesignLocation is not None:
-            filtered = [x for x in self.DesignLocation.ErpBomItemDatas if x != self]
-            self._DesignLocation._ErpBomItemDatas = filtered
+            self._DesignLocation._ErpBomItemDatas.discard(self)
 
         self._DesignLocation = value
         if self._DesignLocation is not None:
             if self not in self._DesignLocation._ErpBomItemDatas:
-                self._DesignLocation._ErpBomItemDatas.append(self)
+                self._DesignLocation._reflist("_ErpBomItemDatas").append(self)
 
     DesignLocation = property(getDesignLocation, setDesignLocation)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ErpCompetency(IdentifiedObject):
     """Information that describes aptitudes of a utility employee. Unlike Skills that an ErpPerson must be certified to perform before undertaking certain type of assignments (to be able to perfrom a Craft), ErpCompetency has more to do with typical Human Resource (HR) matters such as schooling, training, etc.Information that describes aptitudes of a utility employee. Unlike Skills that an ErpPerson must be certified to perform before undertaking certain type of assignments (to be able to perfrom a Craft), ErpCompetency has more to do with typical Human Resource (HR) matters such as schooling, training, etc.
@@ -29,8 +30,8 @@ class ErpCompetency(IdentifiedObject):
 
         @param ErpPersons:
         """
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
         super(ErpCompetency, self).__init__(*args, **kw_args)
 
@@ -40,13 +41,15 @@ class ErpCompetency(IdentifiedObject):
     _enums = {}
     _refs = ["ErpPersons"]
     _many_refs = ["ErpPersons"]
+    _inverses = {"ErpPersons": "ErpCompetency"}
 
     def getErpPersons(self):
         
         return self._ErpPersons
 
     def setErpPersons(self, value):
-        for x in self._ErpPersons:
+        value = RefList(value)
+        for x in list(self._ErpPersons):
             x.ErpCompetency = None
         for y in value:
             y._ErpCompetency = self
@@ -36,4 +36,5 @@ class ErpEngChangeOrder(Document):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
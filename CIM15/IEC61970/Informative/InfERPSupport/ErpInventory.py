@@ -43,6 +43,7 @@ class ErpInventory(IdentifiedObject):
     _enums = {}
     _refs = ["Asset", "status"]
     _many_refs = []
+    _inverses = {"Asset": "ErpInventory"}
 
     def getAsset(self):
         
@@ -47,6 +47,7 @@ class ErpInventoryCount(IdentifiedObject):
     _enums = {}
     _refs = ["status", "MaterialItem", "AssetModel"]
     _many_refs = []
+    _inverses = {"MaterialItem": "ErpInventoryCounts", "AssetModel": "ErpInventoryCounts"}
 
     status = None
 
@@ -56,13 +57,12 @@ class ErpInventoryCount(IdentifiedObject):
 
     def setMaterialItem(self, value):
         if self._MaterialItem is not None:
-            filtered = [x for x in self.MaterialItem.ErpInventoryCounts if x != self]
-            self._MaterialItem._ErpInventoryCounts = filtered
+            self._MaterialItem._ErpInventoryCounts.discard(self)
 
         self._MaterialItem = value
         if self._MaterialItem is not None:
             if self not in self._MaterialItem._ErpInventoryCounts:
-                self._MaterialItem._ErpInventoryCounts.append(self)
+                self._MaterialItem._reflist("_ErpInventoryCounts").append(self)
 
     MaterialItem = property(getMaterialItem, setMaterialItem)
 
@@ -72,13 +72,12 @@ class ErpInventoryCount(IdentifiedObject):
 
     def setAssetModel(self, value):
         if self._AssetModel is not None:
-            filtered = [x for x in self.AssetModel.ErpInventoryCounts if x != self]
-            self._AssetModel._ErpInventoryCounts = filtered
+            self._AssetModel._ErpInventoryCounts.discard(self)
 
         self._AssetModel = value
         if self._AssetModel is not None:
             if self not in self._AssetModel._ErpInventoryCounts:
-                self._AssetModel._ErpInventoryCounts.append(self)
+                self._AssetModel._reflist("_ErpInventoryCounts").append(self)
 
     AssetModel = property(getAssetModel, setAssetModel)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpInvoice(Document):
     """A roll up of invoice line items. The whole invoice has a due date and amount to be paid, with information such as customer, banks etc. being obtained through associations. The invoice roll up is based on individual line items that each contain amounts and descriptions for specific services or products.A roll up of invoice line items. The whole invoice has a due date and amount to be paid, with information such as customer, banks etc. being obtained through associations. The invoice roll up is based on individual line items that each contain amounts and descriptions for specific services or products.
@@ -66,8 +67,8 @@ class ErpInvoice(Document):
         #: True if payment is to be paid by a Customer to accept a particular ErpQuote (with associated Design) and have work initiated, at which time an associated ErpInvoice should automatically be generated. EprPayment.subjectStatus satisfies terms specificed in the ErpQuote.
         self.proForma = proForma
 
-        self._ErpInvoiceLineItems = []
-        self.ErpInvoiceLineItems = [] if ErpInvoiceLineItems is None else ErpInvoiceLineItems
+        if ErpInvoiceLineItems is not None:
+            self.ErpInvoiceLineItems = ErpInvoiceLineItems
 
         self._CustomerAccount = None
         self.CustomerAccount = CustomerAccount
@@ -80,13 +81,15 @@ class ErpInvoice(Document):
     _enums = {"billMediaKind": "BillMediaKind", "kind": "ErpInvoiceKind"}
     _refs = ["ErpInvoiceLineItems", "CustomerAccount"]
     _many_refs = ["ErpInvoiceLineItems"]
+    _inverses = {"ErpInvoiceLineItems": "ErpInvoice", "CustomerAccount": "ErpInvoicees"}
 
     def getErpInvoiceLineItems(self):
         
         return self._ErpInvoiceLineItems
 
     def setErpInvoiceLineItems(self, value):
-        for x in self._ErpInvoiceLineItems:
+        value = RefList(value)
+        for x in list(self._ErpInvoiceLineItems):
             x.ErpInvoice = None
         for y in value:
             y._ErpInvoice = self
@@ -108,13 +111,12 @@ class ErpInvoice(Document):
 
     def setCustomerAccount(self, value):
         if self._CustomerAccount is not None:
-            filtered = [x for x in self.CustomerAccount.ErpInvoicees if x != self]
-            self._CustomerAccount._ErpInvoicees = filtered
+            self._CustomerAccount._ErpInvoicees.discard(self)
 
         self._CustomerAccount = value
         if self._CustomerAccount is not None:
             if self not in self._CustomerAccount._ErpInvoicees:
-                self._CustomerAccount._ErpInvoicees.append(self)
+                self._CustomerAccount._reflist("_ErpInvoicees").append(self)
 
     CustomerAccount = property(getCustomerAccount, setCustomerAccount)
 
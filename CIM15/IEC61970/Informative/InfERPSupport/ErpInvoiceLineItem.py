@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpInvoiceLineItem(Document):
     """An individual line item on an invoice.An individual line item on an invoice.
@@ -73,20 +74,20 @@ class ErpInvoiceLineItem(Document):
         #: Previous line item charge amount.
         self.previousAmount = previousAmount
 
-        self._ErpPayments = []
-        self.ErpPayments = [] if ErpPayments is None else ErpPayments
+        if ErpPayments is not None:
+            self.ErpPayments = ErpPayments
 
         self._ContainerErpInvoiceLineItem = None
         self.ContainerErpInvoiceLineItem = ContainerErpInvoiceLineItem
 
-        self._WorkBillingInfos = []
-        self.WorkBillingInfos = [] if WorkBillingInfos is None else WorkBillingInfos
+        if WorkBillingInfos is not None:
+            self.WorkBillingInfos = WorkBillingInfos
 
         self._ErpQuoteLineItem = None
         self.ErpQuoteLineItem = ErpQuoteLineItem
 
-        self._UserAttributes = []
-        self.UserAttributes = [] if UserAttributes is None else UserAttributes
+        if UserAttributes is not None:
+            self.UserAttributes = UserAttributes
 
         self._ErpRecDelvLineItem = None
         self.ErpRecDelvLineItem = ErpRecDelvLineItem
@@ -94,22 +95,22 @@ class ErpInvoiceLineItem(Document):
         self._ErpPayableLineItem = None
         self.ErpPayableLineItem = ErpPayableLineItem
 
-        self._ComponentErpInvoiceLineItems = []
-        self.ComponentErpInvoiceLineItems = [] if ComponentErpInvoiceLineItems is None else ComponentErpInvoiceLineItems
+        if ComponentErpInvoiceLineItems is not None:
+            self.ComponentErpInvoiceLineItems = ComponentErpInvoiceLineItems
 
         self.billPeriod = billPeriod
 
         self._ErpInvoice = None
         self.ErpInvoice = ErpInvoice
 
-        self._CustomerBillingInfos = []
-        self.CustomerBillingInfos = [] if CustomerBillingInfos is None else CustomerBillingInfos
+        if CustomerBillingInfos is not None:
+            self.CustomerBillingInfos = CustomerBillingInfos
 
         self._ErpRecLineItem = None
         self.ErpRecLineItem = ErpRecLineItem
 
-        self._ErpJournalEntries = []
-        self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
+        if ErpJournalEntries is not None:
+            self.ErpJournalEntries = ErpJournalEntries
 
         super(ErpInvoiceLineItem, self).__init__(*args, **kw_args)
 
@@ -119,6 +120,7 @@ class ErpInvoiceLineItem(Document):
     _enums = {"kind": "ErpInvoiceLineItemKind"}
     _refs = ["ErpPayments", "ContainerErpInvoiceLineItem", "WorkBillingInfos", "ErpQuoteLineItem", "UserAttributes", "ErpRecDelvLineItem", "ErpPayableLineItem", "ComponentErpInvoiceLineItems", "billPeriod", "ErpInvoice", "CustomerBillingInfos", "ErpRecLineItem", "ErpJournalEntries"]
     _many_refs = ["ErpPayments", "WorkBillingInfos", "UserAttributes", "ComponentErpInvoiceLineItems", "CustomerBillingInfos", "ErpJournalEntries"]
+    _inverses = {"ErpPayments": "ErpInvoiceLineItems", "ContainerErpInvoiceLineItem": "ComponentErpInvoiceLineItems", "WorkBillingInfos": "ErpLineItems", "ErpQuoteLineItem": "ErpInvoiceLineItem", "UserAttributes": "ErpInvoiceLineItems", "ErpRecDelvLineItem": "ErpInvoiceLineItem", "ErpPayableLineItem": "ErpInvoiceLineItem", "ComponentErpInvoiceLineItems": "ContainerErpInvoiceLineItem", "ErpInvoice": "ErpInvoiceLineItems", "CustomerBillingInfos": "ErpInvoiceLineItems", "ErpRecLineItem": "ErpInvoiceLineItem", "ErpJournalEntries": "ErpInvoiceLineItem"}
 
     def getErpPayments(self):
         
@@ -126,20 +128,19 @@ class ErpInvoiceLineItem(Document):
 
     def setErpPayments(self, value):
         for p in self._ErpPayments:
-            filtered = [q for q in p.ErpInvoiceLineItems if q != self]
-            self._ErpPayments._ErpInvoiceLineItems = filtered
+            p._ErpInvoiceLineItems.discard(self)
         for r in value:
             if self not in r._ErpInvoiceLineItems:
-                r._ErpInvoiceLineItems.append(self)
-        self._ErpPayments = value
+                r._reflist("_ErpInvoiceLineItems").append(self)
+        self._ErpPayments = RefList(value)
 
     ErpPayments = property(getErpPayments, setErpPayments)
 
     def addErpPayments(self, *ErpPayments):
         for obj in ErpPayments:
             if self not in obj._ErpInvoiceLineItems:
-                obj._ErpInvoiceLineItems.append(self)
-            self._ErpPayments.append(obj)
+                obj._reflist("_ErpInvoiceLineItems").append(self)
+            self._reflist("_ErpPayments").append(obj)
 
     def removeErpPayments(self, *ErpPayments):
         for obj in ErpPayments:
@@ -153,13 +154,12 @@ class ErpInvoiceLineItem(Document):
 
     def setContainerErpInvoiceLineItem(self, value):
         if self._ContainerErpInvoiceLineItem is not None:
-            filtered = [x for x in self.ContainerErpInvoiceLineItem.ComponentErpInvoiceLineItems if x != self]
-            self._ContainerErpInvoiceLineItem._ComponentErpInvoiceLineItems = filtered
+            self._ContainerErpInvoiceLineItem._ComponentErpInvoiceLineItems.discard(self)
 
         self._ContainerErpInvoiceLineItem = value
         if self._ContainerErpInvoiceLineItem is not None:
             if self not in self._ContainerErpInvoiceLineItem._ComponentErpInvoiceLineItems:
-                self._ContainerErpInvoiceLineItem._ComponentErpInvoiceLineItems.append(self)
+                self._ContainerErpInvoiceLineItem._reflist("_ComponentErpInvoiceLineItems").append(self)
 
     ContainerErpInvoiceLineItem = property(getContainerErpInvoiceLineItem, setContainerErpInvoiceLineItem)
 
@@ -169,20 +169,19 @@ class ErpInvoiceLineItem(Document):
 
     def setWorkBillingInfos(self, value):
         for p in self._WorkBillingInfos:
-            filtered = [q for q in p.ErpLineItems if q != self]
-            self._WorkBillingInfos._ErpLineItems = filtered
+            p._ErpLineItems.discard(self)
         for r in value:
             if self not in r._ErpLineItems:
-                r._ErpLineItems.append(self)
-        self._WorkBillingInfos = value
+                r._reflist("_ErpLineItems").append(self)
+        self._WorkBillingInfos = RefList(value)
 
     WorkBillingInfos = property(getWorkBillingInfos, setWorkBillingInfos)
 
     def addWorkBillingInfos(self, *WorkBillingInfos):
         for obj in WorkBillingInfos:
             if self not in obj._ErpLineItems:
-                obj._ErpLineItems.append(self)
-            self._WorkBillingInfos.append(obj)
+                obj._reflist("_ErpLineItems").append(self)
+            self._reflist("_WorkBillingInfos").append(obj)
 
     def removeWorkBillingInfos(self, *WorkBillingInfos):
         for obj in WorkBillingInfos:
@@ -211,20 +210,19 @@ class ErpInvoiceLineItem(Document):
 
     def setUserAttributes(self, value):
         for p in self._UserAttributes:
-            filtered = [q for q in p.ErpInvoiceLineItems if q != self]
-            self._UserAttributes._ErpInvoiceLineItems = filtered
+            p._ErpInvoiceLineItems.discard(self)
         for r in value:
             if self not in r._ErpInvoiceLineItems:
-                r._ErpInvoiceLineItems.append(self)
-        self._UserAttributes = value
+                r._reflist("_ErpInvoiceLineItems").append(self)
+        self._UserAttributes = RefList(value)
 
     UserAttributes = property(getUserAttributes, setUserAttributes)
 
     def addUserAttributes(self, *UserAttributes):
         for obj in UserAttributes:
             if self not in obj._ErpInvoiceLineItems:
-                obj._ErpInvoiceLineItems.append(self)
-            self._UserAttributes.append(obj)
+                obj._reflist("_ErpInvoiceLineItems").append(self)
+            self._reflist("_UserAttributes").append(obj)
 
     def removeUserAttributes(self, *UserAttributes):
         for obj in UserAttributes:
@@ -267,7 +265,8 @@ class ErpInvoiceLineItem(Document):
         return self._ComponentErpInvoiceLineItems
 
     def setComponentErpInvoiceLineItems(self, value):
-        for x in self._ComponentErpInvoiceLineItems:
+        value = RefList(value)
+        for x in list(self._ComponentErpInvoiceLineItems):
             x.ContainerErpInvoiceLineItem = None
         for y in value:
             y._ContainerErpInvoiceLineItem = self
@@ -292,13 +291,12 @@ class ErpInvoiceLineItem(Document):
 
     def setErpInvoice(self, value):
         if self._ErpInvoice is not None:
-            filtered = [x for x in self.ErpInvoice.ErpInvoiceLineItems if x != self]
-            self._ErpInvoice._ErpInvoiceLineItems = filtered
+            self._ErpInvoice._ErpInvoiceLineItems.discard(self)
 
         self._ErpInvoice = value
         if self._ErpInvoice is not None:
             if self not in self._ErpInvoice._ErpInvoiceLineItems:
-                self._ErpInvoice._ErpInvoiceLineItems.append(self)
+                self._ErpInvoice._reflist("_ErpInvoiceLineItems").append(self)
 
     ErpInvoice = property(getErpInvoice, setErpInvoice)
 
@@ -309,20 +307,19 @@ class ErpInvoiceLineItem(Document):
 
     def setCustomerBillingInfos(self, value):
         for p in self._CustomerBillingInfos:
-            filtered = [q for q in p.ErpInvoiceLineItems if q != self]
-            self._CustomerBillingInfos._ErpInvoiceLineItems = filtered
+            p._ErpInvoiceLineItems.discard(self)
         for r in value:
             if self not in r._ErpInvoiceLineItems:
-                r._ErpInvoiceLineItems.append(self)
-        self._CustomerBillingInfos = value
+                r._reflist("_ErpInvoiceLineItems").append(self)
+        self._CustomerBillingInfos = RefList(value)
 
     CustomerBillingInfos = property(getCustomerBillingInfos, setCustomerBillingInfos)
 
     def addCustomerBillingInfos(self, *CustomerBillingInfos):
         for obj in CustomerBillingInfos:
             if self not in obj._ErpInvoiceLineItems:
-                obj._ErpInvoiceLineItems.append(self)
-            self._CustomerBillingInfos.append(obj)
+                obj._reflist("_ErpInvoiceLineItems").append(self)
+            self._reflist("_CustomerBillingInfos").append(obj)
 
     def removeCustomerBillingInfos(self, *CustomerBillingInfos):
         for obj in CustomerBillingInfos:
@@ -350,7 +347,8 @@ class ErpInvoiceLineItem(Document):
         return self._ErpJournalEntries
 
     def setErpJournalEntries(self, value):
-        for x in self._ErpJournalEntries:
+        value = RefList(value)
+        for x in list(self._ErpJournalEntries):
             x.ErpInvoiceLineItem = None
         for y in value:
             y._ErpInvoiceLineItem = self
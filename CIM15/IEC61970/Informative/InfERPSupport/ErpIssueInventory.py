@@ -47,6 +47,7 @@ class ErpIssueInventory(IdentifiedObject):
     _enums = {}
     _refs = ["TypeAsset", "status", "TypeMaterial"]
     _many_refs = []
+    _inverses = {"TypeAsset": "ErpInventoryIssues", "TypeMaterial": "ErpIssueInventories"}
 
     def getTypeAsset(self):
         
@@ -54,13 +55,12 @@ class ErpIssueInventory(IdentifiedObject):
 
     def setTypeAsset(self, value):
         if self._TypeAsset is not None:
-            filtered = [x for x in self.TypeAsset.ErpInventoryIssues if x != self]
-            self._TypeAsset._ErpInventoryIssues = filtered
+            self._TypeAsset._ErpInventoryIssues.discard(self)
 
         self._TypeAsset = value
         if self._TypeAsset is not None:
             if self not in self._TypeAsset._ErpInventoryIssues:
-                self._TypeAsset._ErpInventoryIssues.append(self)
+                self._TypeAsset._reflist("_ErpInventoryIssues").append(self)
 
     TypeAsset = property(getTypeAsset, setTypeAsset)
 
@@ -72,13 +72,12 @@ class ErpIssueInventory(IdentifiedObject):
 
     def setTypeMaterial(self, value):
         if self._TypeMaterial is not None:
-            filtered = [x for x in self.TypeMaterial.ErpIssueInventories if x != self]
-            self._TypeMaterial._ErpIssueInventories = filtered
+            self._TypeMaterial._ErpIssueInventories.discard(self)
 
         self._TypeMaterial = value
         if self._TypeMaterial is not None:
             if self not in self._TypeMaterial._ErpIssueInventories:
-                self._TypeMaterial._ErpIssueInventories.append(self)
+                self._TypeMaterial._reflist("_ErpIssueInventories").append(self)
 
     TypeMaterial = property(getTypeMaterial, setTypeMaterial)
 
@@ -43,6 +43,7 @@ class ErpItemMaster(IdentifiedObject):
     _enums = {}
     _refs = ["Asset", "status"]
     _many_refs = []
+    _inverses = {"Asset": "ErpItemMaster"}
 
     def getAsset(self):
         
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpJournal(Document):
     """Book for recording accounting transactions as they occur. Transactions and adjustments are first recorded in a journal, which is like a diary of instructions, advising which account to be charged and by how much. A journal represents a change in the balances of a business's financial accounts. Many tasks or transactions throughout an enterprise will result in the creation of a journal. Some examples are creating a customer invoice, paying a vendor, transferring inventory, or paying employees.Book for recording accounting transactions as they occur. Transactions and adjustments are first recorded in a journal, which is like a diary of instructions, advising which account to be charged and by how much. A journal represents a change in the balances of a business's financial accounts. Many tasks or transactions throughout an enterprise will result in the creation of a journal. Some examples are creating a customer invoice, paying a vendor, transferring inventory, or paying employees.
@@ -29,8 +30,8 @@ class ErpJournal(Document):
 
         @param ErpJournalEntries:
         """
-        self._ErpJournalEntries = []
-        self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
+        if ErpJournalEntries is not None:
+            self.ErpJournalEntries = ErpJournalEntries
 
         super(ErpJournal, self).__init__(*args, **kw_args)
 
@@ -40,13 +41,15 @@ class ErpJournal(Document):
     _enums = {}
     _refs = ["ErpJournalEntries"]
     _many_refs = ["ErpJournalEntries"]
+    _inverses = {"ErpJournalEntries": "ErpJournal"}
 
     def getErpJournalEntries(self):
         
         return self._ErpJournalEntries
 
     def setErpJournalEntries(self, value):
-        for x in self._ErpJournalEntries:
+        value = RefList(value)
+        for x in list(self._ErpJournalEntries):
             x.ErpJournal = None
         for y in value:
             y._ErpJournal = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ErpJournalEntry(IdentifiedObject):
     """Details of an individual entry in a journal, which is to be posted to a ledger on the posting date.Details of an individual entry in a journal, which is to be posted to a ledger on the posting date.
@@ -57,20 +58,20 @@ class ErpJournalEntry(IdentifiedObject):
 
         self.status = status
 
-        self._ErpPayableLineItems = []
-        self.ErpPayableLineItems = [] if ErpPayableLineItems is None else ErpPayableLineItems
+        if ErpPayableLineItems is not None:
+            self.ErpPayableLineItems = ErpPayableLineItems
 
         self._ErpInvoiceLineItem = None
         self.ErpInvoiceLineItem = ErpInvoiceLineItem
 
-        self._ErpRecLineItems = []
-        self.ErpRecLineItems = [] if ErpRecLineItems is None else ErpRecLineItems
+        if ErpRecLineItems is not None:
+            self.ErpRecLineItems = ErpRecLineItems
 
         self._ErpLedgerEntry = None
         self.ErpLedgerEntry = ErpLedgerEntry
 
-        self._CostTypes = []
-        self.CostTypes = [] if CostTypes is None else CostTypes
+        if CostTypes is not None:
+            self.CostTypes = CostTypes
 
         self._ErpJournal = None
         self.ErpJournal = ErpJournal
@@ -83,6 +84,7 @@ class ErpJournalEntry(IdentifiedObject):
     _enums = {}
     _refs = ["status", "ErpPayableLineItems", "ErpInvoiceLineItem", "ErpRecLineItems", "ErpLedgerEntry", "CostTypes", "ErpJournal"]
     _many_refs = ["ErpPayableLineItems", "ErpRecLineItems", "CostTypes"]
+    _inverses = {"ErpPayableLineItems": "ErpJournalEntries", "ErpInvoiceLineItem": "ErpJournalEntries", "ErpRecLineItems": "ErpJournalEntries", "ErpLedgerEntry": "ErpJounalEntry", "CostTypes": "ErpJournalEntries", "ErpJournal": "ErpJournalEntries"}
 
     status = None
 
@@ -92,20 +94,19 @@ class ErpJournalEntry(IdentifiedObject):
 
     def setErpPayableLineItems(self, value):
         for p in self._ErpPayableLineItems:
-            filtered = [q for q in p.ErpJournalEntries if q != self]
-            self._ErpPayableLineItems._ErpJournalEntries = filtered
+            p._ErpJournalEntries.discard(self)
         for r in value:
             if self not in r._ErpJournalEntries:
-                r._ErpJournalEntries.append(self)
-        self._ErpPayableLineItems = value
+                r._reflist("_ErpJournalEntries").append(self)
+        self._ErpPayableLineItems = RefList(value)
 
     ErpPayableLineItems = property(getErpPayableLineItems, setErpPayableLineItems)
 
     def addErpPayableLineItems(self, *ErpPayableLineItems):
         for obj in ErpPayableLineItems:
             if self not in obj._ErpJournalEntries:
-                obj._ErpJournalEntries.append(self)
-            self._ErpPayableLineItems.append(obj)
+                obj._reflist("_ErpJournalEntries").append(self)
+            self._reflist("_ErpPayableLineItems").append(obj)
 
     def removeErpPayableLineItems(self, *ErpPayableLineItems):
         for obj in ErpPayableLineItems:
@@ -119,13 +120,12 @@ class ErpJournalEntry(IdentifiedObject):
 
     def setErpInvoiceLineItem(self, value):
         if self._ErpInvoiceLineItem is not None:
-            filtered = [x for x in self.ErpInvoiceLineItem.ErpJournalEntries if x != self]
-            self._ErpInvoiceLineItem._ErpJournalEntries = filtered
+            self._ErpInvoiceLineItem._ErpJournalEntries.discard(self)
 
         self._ErpInvoiceLineItem = value
         if self._ErpInvoiceLineItem is not None:
             if self not in self._ErpInvoiceLineItem._ErpJournalEntries:
-                self._ErpInvoiceLineItem._ErpJournalEntries.append(self)
+                self._ErpInvoiceLineItem._reflist("_ErpJournalEntries").append(self)
 
     ErpInvoiceLineItem = property(getErpInvoiceLineItem, setErpInvoiceLineItem)
 
@@ -135,20 +135,19 @@ class ErpJournalEntry(IdentifiedObject):
 
     def setErpRecLineItems(self, value):
         for p in self._ErpRecLineItems:
-            filtered = [q for q in p.ErpJournalEntries if q != self]
-            self._ErpRecLineItems._ErpJournalEntries = filtered
+            p._ErpJournalEntries.discard(self)
         for r in value:
             if self not in r._ErpJournalEntries:
-                r._ErpJournalEntries.append(self)
-        self._ErpRecLineItems = value
+                r._reflist("_ErpJournalEntries").append(self)
+        self._ErpRecLineItems = RefList(value)
 
     ErpRecLineItems = property(getErpRecLineItems, setErpRecLineItems)
 
     def addErpRecLineItems(self, *ErpRecLineItems):
         for obj in ErpRecLineItems:
             if self not in obj._ErpJournalEntries:
-                obj._ErpJournalEntries.append(self)
-            self._ErpRecLineItems.append(obj)
+                obj._reflist("_ErpJournalEntries").append(self)
+            self._reflist("_ErpRecLineItems").append(obj)
 
     def removeErpRecLineItems(self, *ErpRecLineItems):
         for obj in ErpRecLineItems:
@@ -177,20 +176,19 @@ class ErpJournalEntry(IdentifiedObject):
 
     def setCostTypes(self, value):
         for p in self._CostTypes:
-            filtered = [q for q in p.ErpJournalEntries if q != self]
-            self._CostTypes._ErpJournalEntries = filtered
+            p._ErpJournalEntries.discard(self)
         for r in value:
             if self not in r._ErpJournalEntries:
-                r._ErpJournalEntries.append(self)
-        self._CostTypes = value
+                r._reflist("_ErpJournalEntries").append(self)
+        self._CostTypes = RefList(value)
 
     CostTypes = property(getCostTypes, setCostTypes)
 
     def addCostTypes(self, *CostTypes):
         for obj in CostTypes:
             if self not in obj._ErpJournalEntries:
-                obj._ErpJournalEntries.append(self)
-            self._CostTypes.append(obj)
+                obj._reflist("_ErpJournalEntries").append(self)
+            self._reflist("_CostTypes").append(obj)
 
     def removeCostTypes(self, *CostTypes):
         for obj in CostTypes:
@@ -204,13 +202,12 @@ class ErpJournalEntry(IdentifiedObject):
 
     def setErpJournal(self, value):
         if self._ErpJournal is not None:
-            filtered = [x for x in self.ErpJournal.ErpJournalEntries if x != self]
-            self._ErpJournal._ErpJournalEntries = filtered
+            self._ErpJournal._ErpJournalEntries.discard(self)
 
         self._ErpJournal = value
         if self._ErpJournal is not None:
             if self not in self._ErpJournal._ErpJournalEntries:
-                self._ErpJournal._ErpJournalEntries.append(self)
+                self._ErpJournal._reflist("_ErpJournalEntries").append(self)
 
     ErpJournal = property(getErpJournal, setErpJournal)
 
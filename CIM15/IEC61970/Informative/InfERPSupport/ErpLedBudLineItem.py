@@ -47,6 +47,7 @@ class ErpLedBudLineItem(IdentifiedObject):
     _enums = {}
     _refs = ["ErpLedBudLineItem", "ErpLedgerBudget", "status"]
     _many_refs = []
+    _inverses = {"ErpLedBudLineItem": "ErpLedgerEntry", "ErpLedgerBudget": "ErpLedBudLineItems"}
 
     def getErpLedBudLineItem(self):
         
@@ -69,13 +70,12 @@ class ErpLedBudLineItem(IdentifiedObject):
 
     def setErpLedgerBudget(self, value):
         if self._ErpLedgerBudget is not None:
-            filtered = [x for x in self.ErpLedgerBudget.ErpLedBudLineItems if x != self]
-            self._ErpLedgerBudget._ErpLedBudLineItems = filtered
+            self._ErpLedgerBudget._ErpLedBudLineItems.discard(self)
 
         self._ErpLedgerBudget = value
         if self._ErpLedgerBudget is not None:
             if self not in self._ErpLedgerBudget._ErpLedBudLineItems:
-                self._ErpLedgerBudget._ErpLedBudLineItems.append(self)
+                self._ErpLedgerBudget._reflist("_ErpLedBudLineItems").append(self)
 
     ErpLedgerBudget = property(getErpLedgerBudget, setErpLedgerBudget)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpLedger(Document):
     """In accounting transactions, a ledger is a book containing accounts to which debits and credits are posted from journals, where transactions are initially recorded. Journal entries are periodically posted to the ledger. Ledger Actual represents actual amounts by account within ledger within company or business area. Actual amounts may be generated in a source application and then loaded to a specific ledger within the enterprise general ledger or budget application.In accounting transactions, a ledger is a book containing accounts to which debits and credits are posted from journals, where transactions are initially recorded. Journal entries are periodically posted to the ledger. Ledger Actual represents actual amounts by account within ledger within company or business area. Actual amounts may be generated in a source application and then loaded to a specific ledger within the enterprise general ledger or budget application.
@@ -29,8 +30,8 @@ class ErpLedger(Document):
 
         @param ErpLedgerEntries:
         """
-        self._ErpLedgerEntries = []
-        self.ErpLedgerEntries = [] if ErpLedgerEntries is None else ErpLedgerEntries
+        if ErpLedgerEntries is not None:
+            self.ErpLedgerEntries = ErpLedgerEntries
 
         super(ErpLedger, self).__init__(*args, **kw_args)
 
@@ -40,13 +41,15 @@ class ErpLedger(Document):
     _enums = {}
     _refs = ["ErpLedgerEntries"]
     _many_refs = ["ErpLedgerEntries"]
+    _inverses = {"ErpLedgerEntries": "ErpLedger"}
 
     def getErpLedgerEntries(self):
         
         return self._ErpLedgerEntries
 
     def setErpLedgerEntries(self, value):
-        for x in self._ErpLedgerEntries:
+        value = RefList(value)
+        for x in list(self._ErpLedgerEntries):
             x.ErpLedger = None
         for y in value:
             y._ErpLedger = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpLedgerBudget(Document):
     """Information for utility Ledger Budgets. They support the transfer budget amounts between all possible source applications throughout an enterprise and a general ledger or budget application.Information for utility Ledger Budgets. They support the transfer budget amounts between all possible source applications throughout an enterprise and a general ledger or budget application.
@@ -29,8 +30,8 @@ class ErpLedgerBudget(Document):
 
         @param ErpLedBudLineItems:
         """
-        self._ErpLedBudLineItems = []
-        self.ErpLedBudLineItems = [] if ErpLedBudLineItems is None else ErpLedBudLineItems
+        if ErpLedBudLineItems is not None:
+            self.ErpLedBudLineItems = ErpLedBudLineItems
 
         super(ErpLedgerBudget, self).__init__(*args, **kw_args)
 
@@ -40,13 +41,15 @@ class ErpLedgerBudget(Document):
     _enums = {}
     _refs = ["ErpLedBudLineItems"]
     _many_refs = ["ErpLedBudLineItems"]
+    _inverses = {"ErpLedBudLineItems": "ErpLedgerBudget"}
 
     def getErpLedBudLineItems(self):
         
         return self._ErpLedBudLineItems
 
     def setErpLedBudLineItems(self, value):
-        for x in self._ErpLedBudLineItems:
+        value = RefList(value)
+        for x in list(self._ErpLedBudLineItems):
             x.ErpLedgerBudget = None
         for y in value:
             y._ErpLedgerBudget = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ErpLedgerEntry(IdentifiedObject):
     """Details of an individual entry in a ledger, which was posted from a journal on the posted date.Details of an individual entry in a ledger, which was posted from a journal on the posted date.
@@ -61,8 +62,8 @@ class ErpLedgerEntry(IdentifiedObject):
         self._ErpLedgerEntry = None
         self.ErpLedgerEntry = ErpLedgerEntry
 
-        self._UserAttributes = []
-        self.UserAttributes = [] if UserAttributes is None else UserAttributes
+        if UserAttributes is not None:
+            self.UserAttributes = UserAttributes
 
         self._ErpJounalEntry = None
         self.ErpJounalEntry = ErpJounalEntry
@@ -75,6 +76,7 @@ class ErpLedgerEntry(IdentifiedObject):
     _enums = {"accountKind": "ErpAccountKind"}
     _refs = ["ErpLedger", "status", "ErpLedgerEntry", "UserAttributes", "ErpJounalEntry"]
     _many_refs = ["UserAttributes"]
+    _inverses = {"ErpLedger": "ErpLedgerEntries", "ErpLedgerEntry": "ErpLedBudLineItem", "UserAttributes": "ErpLedgerEntries", "ErpJounalEntry": "ErpLedgerEntry"}
 
     def getErpLedger(self):
         
@@ -82,13 +84,12 @@ class ErpLedgerEntry(IdentifiedObject):
 
     def setErpLedger(self, value):
         if self._ErpLedger is not None:
-            filtered = [x for x in self.ErpLedger.ErpLedgerEntries if x != self]
-            self._ErpLedger._ErpLedgerEntries = filtered
+            self._ErpLedger._ErpLedgerEntries.discard(self)
 
         self._ErpLedger = value
         if self._ErpLedger is not None:
             if self not in self._ErpLedger._ErpLedgerEntries:
-                self._ErpLedger._ErpLedgerEntries.append(self)
+                self._ErpLedger._reflist("_ErpLedgerEntries").append(self)
 
     ErpLedger = property(getErpLedger, setErpLedger)
 
@@ -115,20 +116,19 @@ class ErpLedgerEntry(IdentifiedObject):
 
     def setUserAttributes(self, value):
         for p in self._UserAttributes:
-            filtered = [q for q in p.ErpLedgerEntries if q != self]
-            self._UserAttributes._ErpLedgerEntries = filtered
+            p._ErpLedgerEntries.discard(self)
         for r in value:
             if self not in r._ErpLedgerEntries:
-                r._ErpLedgerEntries.append(self)
-        self._UserAttributes = value
+                r._reflist("_ErpLedgerEntries").append(self)
+        self._UserAttributes = RefList(value)
 
     UserAttributes = property(getUserAttributes, setUserAttributes)
 
     def addUserAttributes(self, *UserAttributes):
         for obj in UserAttributes:
             if self not in obj._ErpLedgerEntries:
-                obj._ErpLedgerEntries.append(self)
-            self._UserAttributes.append(obj)
+                obj._reflist("_ErpLedgerEntries").append(self)
+            self._reflist("_UserAttributes").append(obj)
 
     def removeUserAttributes(self, *UserAttributes):
         for obj in UserAttributes:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from CIM15.Element import RefList
 
 class ErpOrganisation(Organisation):
     """Identifies organisations that might have roles as utilities, contractors, suppliers, manufacturers, customers, etc. Organisations may also have parent-child relationships to identify departments within an organisation, or parent company relationships. The organization may be internal (e.g., departments) or external to the utility. There may be multiple organizations of a given 'category', each with a unique 'code'.Identifies organisations that might have roles as utilities, contractors, suppliers, manufacturers, customers, etc. Organisations may also have parent-child relationships to identify departments within an organisation, or parent company relationships. The organization may be internal (e.g., departments) or external to the utility. There may be multiple organizations of a given 'category', each with a unique 'code'.
@@ -72,41 +73,41 @@ class ErpOrganisation(Organisation):
         #: Operational mode of the organisation, often required for outage reporting purposes. Some utilities use text to describe various modes (like nominal, emergency, storm, other), while others use severity ratings (for example, 0 is a nominal condition and 5 is the most severe condition).
         self.mode = mode
 
-        self._AssetRoles = []
-        self.AssetRoles = [] if AssetRoles is None else AssetRoles
+        if AssetRoles is not None:
+            self.AssetRoles = AssetRoles
 
-        self._Requests = []
-        self.Requests = [] if Requests is None else Requests
+        if Requests is not None:
+            self.Requests = Requests
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        if Crews is not None:
+            self.Crews = Crews
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._ErpPersonRoles = []
-        self.ErpPersonRoles = [] if ErpPersonRoles is None else ErpPersonRoles
+        if ErpPersonRoles is not None:
+            self.ErpPersonRoles = ErpPersonRoles
 
-        self._ActivityRecords = []
-        self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
+        if ActivityRecords is not None:
+            self.ActivityRecords = ActivityRecords
 
-        self._ParentOrganisationRoles = []
-        self.ParentOrganisationRoles = [] if ParentOrganisationRoles is None else ParentOrganisationRoles
+        if ParentOrganisationRoles is not None:
+            self.ParentOrganisationRoles = ParentOrganisationRoles
 
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        if Locations is not None:
+            self.Locations = Locations
 
-        self._ChildOrganisationRoles = []
-        self.ChildOrganisationRoles = [] if ChildOrganisationRoles is None else ChildOrganisationRoles
+        if ChildOrganisationRoles is not None:
+            self.ChildOrganisationRoles = ChildOrganisationRoles
 
-        self._PowerSystemResourceRoles = []
-        self.PowerSystemResourceRoles = [] if PowerSystemResourceRoles is None else PowerSystemResourceRoles
+        if PowerSystemResourceRoles is not None:
+            self.PowerSystemResourceRoles = PowerSystemResourceRoles
 
-        self._LandPropertyRoles = []
-        self.LandPropertyRoles = [] if LandPropertyRoles is None else LandPropertyRoles
+        if LandPropertyRoles is not None:
+            self.LandPropertyRoles = LandPropertyRoles
 
-        self._DocumentRoles = []
-        self.DocumentRoles = [] if DocumentRoles is None else DocumentRoles
+        if DocumentRoles is not None:
+            self.DocumentRoles = DocumentRoles
 
         super(ErpOrganisation, self).__init__(*args, **kw_args)
 
@@ -116,13 +117,15 @@ class ErpOrganisation(Organisation):
     _enums = {}
     _refs = ["AssetRoles", "Requests", "Crews", "ChangeItems", "ErpPersonRoles", "ActivityRecords", "ParentOrganisationRoles", "Locations", "ChildOrganisationRoles", "PowerSystemResourceRoles", "LandPropertyRoles", "DocumentRoles"]
     _many_refs = ["AssetRoles", "Requests", "Crews", "ChangeItems", "ErpPersonRoles", "ActivityRecords", "ParentOrganisationRoles", "Locations", "ChildOrganisationRoles", "PowerSystemResourceRoles", "LandPropertyRoles", "DocumentRoles"]
+    _inverses = {"AssetRoles": "ErpOrganisation", "Requests": "Organisation", "Crews": "Organisations", "ChangeItems": "Organisation", "ErpPersonRoles": "ErpOrganisation", "ActivityRecords": "Organisations", "ParentOrganisationRoles": "ChildOrganisation", "Locations": "ErpOrganisations", "ChildOrganisationRoles": "ParentOrganisation", "PowerSystemResourceRoles": "ErpOrganisation", "LandPropertyRoles": "ErpOrganisation", "DocumentRoles": "ErpOrganisation"}
 
     def getAssetRoles(self):
         
         return self._AssetRoles
 
     def setAssetRoles(self, value):
-        for x in self._AssetRoles:
+        value = RefList(value)
+        for x in list(self._AssetRoles):
             x.ErpOrganisation = None
         for y in value:
             y._ErpOrganisation = self
@@ -143,7 +146,8 @@ class ErpOrganisation(Organisation):
         return self._Requests
 
     def setRequests(self, value):
-        for x in self._Requests:
+        value = RefList(value)
+        for x in list(self._Requests):
             x.Organisation = None
         for y in value:
             y._Organisation = self
@@ -165,20 +169,19 @@ class ErpOrganisation(Organisation):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.Organisations if q != self]
-            self._Crews._Organisations = filtered
+            p._Organisations.discard(self)
         for r in value:
             if self not in r._Organisations:
-                r._Organisations.append(self)
-        self._Crews = value
+                r._reflist("_Organisations").append(self)
+        self._Crews = RefList(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
             if self not in obj._Organisations:
-                obj._Organisations.append(self)
-            self._Crews.append(obj)
+                obj._reflist("_Organisations").append(self)
+            self._reflist("_Crews").append(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
@@ -191,7 +194,8 @@ class ErpOrganisation(Organisation):
         return self._ChangeItems
 
     def setChangeItems(self, value):
-        for x in self._ChangeItems:
+        value = RefList(value)
+        for x in list(self._ChangeItems):
             x.Organisation = None
         for y in value:
             y._Organisation = self
@@ -212,7 +216,8 @@ class ErpOrganisation(Organisation):
         return self._ErpPersonRoles
 
     def setErpPersonRoles(self, value):
-        for x in self._ErpPersonRoles:
+        value = RefList(value)
+        for x in list(self._ErpPersonRoles):
             x.ErpOrganisation = None
         for y in value:
             y._ErpOrganisation = self
@@ -234,20 +239,19 @@ class ErpOrganisation(Organisation):
 
     def setActivityRecords(self, value):
         for p in self._ActivityRecords:
-            filtered = [q for q in p.Organisations if q != self]
-            self._ActivityRecords._Organisations = filtered
+            p._Organisations.discard(self)
         for r in value:
             if self not in r._Organisations:
-                r._Organisations.append(self)
-        self._ActivityRecords = value
+                r._reflist("_Organisations").append(self)
+        self._ActivityRecords = RefList(value)
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
             if self not in obj._Organisations:
-                obj._Organisations.append(self)
-            self._ActivityRecords.append(obj)
+                obj._reflist("_Organisations").append(self)
+            self._reflist("_ActivityRecords").append(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
@@ -260,7 +264,8 @@ class ErpOrganisation(Organisation):
         return self._ParentOrganisationRoles
 
     def setParentOrganisationRoles(self, value):
-        for x in self._ParentOrganisationRoles:
+        value = RefList(value)
+        for x in list(self._ParentOrganisationRoles):
             x.ChildOrganisation = None
         for y in value:
             y._ChildOrganisation = self
@@ -282,20 +287,19 @@ class ErpOrganisation(Organisation):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.ErpOrganisations if q != self]
-            self._Locations._ErpOrganisations = filtered
+            p._ErpOrganisations.discard(self)
         for r in value:
             if self not in r._ErpOrganisations:
-                r._ErpOrganisations.append(self)
-        self._Locations = value
+                r._reflist("_ErpOrganisations").append(self)
+        self._Locations = RefList(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
         for obj in Locations:
             if self not in obj._ErpOrganisations:
-                obj._ErpOrganisations.append(self)
-            self._Locations.append(obj)
+                obj._reflist("_ErpOrganisations").append(self)
+            self._reflist("_Locations").append(obj)
 
     def removeLocations(self, *Locations):
         for obj in Locations:
@@ -308,7 +312,8 @@ class ErpOrganisation(Organisation):
         return self._ChildOrganisationRoles
 
     def setChildOrganisationRoles(self, value):
-        for x in self._ChildOrganisationRoles:
+        value = RefList(value)
+        for x in list(self._ChildOrganisationRoles):
             x.ParentOrganisation = None
         for y in value:
             y._ParentOrganisation = self
@@ -329,7 +334,8 @@ class ErpOrganisation(Organisation):
         return self._PowerSystemResourceRoles
 
     def setPowerSystemResourceRoles(self, value):
-        for x in self._PowerSystemResourceRoles:
+        value = RefList(value)
+        for x in list(self._PowerSystemResourceRoles):
             x.ErpOrganisation = None
         for y in value:
             y._ErpOrganisation = self
@@ -350,7 +356,8 @@ class ErpOrganisation(Organisation):
         return self._LandPropertyRoles
 
     def setLandPropertyRoles(self, value):
-        for x in self._LandPropertyRoles:
+        value = RefList(value)
+        for x in list(self._LandPropertyRoles):
             x.ErpOrganisation = None
         for y in value:
             y._ErpOrganisation = self
@@ -371,7 +378,8 @@ class ErpOrganisation(Organisation):
         return self._DocumentRoles
 
     def setDocumentRoles(self, value):
-        for x in self._DocumentRoles:
+        value = RefList(value)
+        for x in list(self._DocumentRoles):
             x.ErpOrganisation = None
         for y in value:
             y._ErpOrganisation = self
@@ -56,6 +56,7 @@ class ErpPOLineItem(Document):
     _enums = {}
     _refs = ["ErpPurchaseOrder", "ErpRecDelLineItem", "AssetModelCatalogueItem", "MaterialItem", "ErpReqLineItem"]
     _many_refs = []
+    _inverses = {"ErpPurchaseOrder": "ErpPOLineItems", "ErpRecDelLineItem": "ErpPOLineItem", "AssetModelCatalogueItem": "ErpPOLineItems", "MaterialItem": "ErpPOLineItems", "ErpReqLineItem": "ErpPOLineItem"}
 
     def getErpPurchaseOrder(self):
         
@@ -63,13 +64,12 @@ class ErpPOLineItem(Document):
 
     def setErpPurchaseOrder(self, value):
         if self._ErpPurchaseOrder is not None:
-            filtered = [x for x in self.ErpPurchaseOrder.ErpPOLineItems if x != self]
-            self._ErpPurchaseOrder._ErpPOLineItems = filtered
+            self._ErpPurchaseOrder._ErpPOLineItems.discard(self)
 
         self._ErpPurchaseOrder = value
         if self._ErpPurchaseOrder is not None:
             if self not in self._ErpPurchaseOrder._ErpPOLineItems:
-                self._ErpPurchaseOrder._ErpPOLineItems.append(self)
+                self._ErpPurchaseOrder._reflist("_ErpPOLineItems").append(self)
 
     ErpPurchaseOrder = property(getErpPurchaseOrder, setErpPurchaseOrder)
 
@@ -94,13 +94,12 @@ class ErpPOLineItem(Document):
 
     def setAssetModelCatalogueItem(self, value):
         if self._AssetModelCatalogueItem is not None:
-            filtered = [x for x in self.AssetModelCatalogueItem.ErpPOLineItems if x != self]
-            self._AssetModelCatalogueItem._ErpPOLineItems = filtered
+            self._AssetModelCatalogueItem._ErpPOLineItems.discard(self)
 
         self._AssetModelCatalogueItem = value
         if self._AssetModelCatalogueItem is not None:
             if self not in self._AssetModelCatalogueItem._ErpPOLineItems:
-                self._AssetModelCatalogueItem._ErpPOLineItems.append(self)
+                self._AssetModelCatalogueItem._reflist("_ErpPOLineItems").append(self)
 
     AssetModelCatalogueItem = property(getAssetModelCatalogueItem, setAssetModelCatalogueItem)
 
@@ -110,13 +109,12 @@ class ErpPOLineItem(Document):
 
     def setMaterialItem(self, value):
         if self._MaterialItem is not None:
-            filtered = [x for x in self.MaterialItem.ErpPOLineItems if x != self]
-            self._MaterialItem._ErpPOLineItems = filtered
+            self._MaterialItem._ErpPOLineItems.discard(self)
 
         self._MaterialItem = value
         if self._MaterialItem is not None:
             if self not in self._MaterialItem._ErpPOLineItems:
-                self._MaterialItem._ErpPOLineItems.append(self)
+                self._MaterialItem._reflist("_ErpPOLineItems").append(self)
 
     MaterialItem = property(getMaterialItem, setMaterialItem)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpPayable(Document):
     """A transaction that represents an invoice from a supplier. A payable (or voucher) is an open item, approved and ready for payment, in the Accounts Payable ledger.A transaction that represents an invoice from a supplier. A payable (or voucher) is an open item, approved and ready for payment, in the Accounts Payable ledger.
@@ -30,11 +31,11 @@ class ErpPayable(Document):
         @param ContractorItems:
         @param ErpPayableLineItems:
         """
-        self._ContractorItems = []
-        self.ContractorItems = [] if ContractorItems is None else ContractorItems
+        if ContractorItems is not None:
+            self.ContractorItems = ContractorItems
 
-        self._ErpPayableLineItems = []
-        self.ErpPayableLineItems = [] if ErpPayableLineItems is None else ErpPayableLineItems
+        if ErpPayableLineItems is not None:
+            self.ErpPayableLineItems = ErpPayableLineItems
 
         super(ErpPayable, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class ErpPayable(Document):
     _enums = {}
     _refs = ["ContractorItems", "ErpPayableLineItems"]
     _many_refs = ["ContractorItems", "ErpPayableLineItems"]
+    _inverses = {"ContractorItems": "ErpPayables", "ErpPayableLineItems": "ErpPayable"}
 
     def getContractorItems(self):
         
@@ -51,20 +53,19 @@ class ErpPayable(Document):
 
     def setContractorItems(self, value):
         for p in self._ContractorItems:
-            filtered = [q for q in p.ErpPayables if q != self]
-            self._ContractorItems._ErpPayables = filtered
+            p._ErpPayables.discard(self)
         for r in value:
             if self not in r._ErpPayables:
-                r._ErpPayables.append(self)
-        self._ContractorItems = value
+                r._reflist("_ErpPayables").append(self)
+        self._ContractorItems = RefList(value)
 
     ContractorItems = property(getContractorItems, setContractorItems)
 
     def addContractorItems(self, *ContractorItems):
         for obj in ContractorItems:
             if self not in obj._ErpPayables:
-                obj._ErpPayables.append(self)
-            self._ContractorItems.append(obj)
+                obj._reflist("_ErpPayables").append(self)
+            self._reflist("_ContractorItems").append(obj)
 
     def removeContractorItems(self, *ContractorItems):
         for obj in ContractorItems:
@@ -77,7 +78,8 @@ class ErpPayable(Document):
         return self._ErpPayableLineItems
 
     def setErpPayableLineItems(self, value):
-        for x in self._ErpPayableLineItems:
+        value = RefList(value)
+        for x in list(self._ErpPayableLineItems):
             x.ErpPayable = None
         for y in value:
             y._ErpPayable = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ErpPayableLineItem(IdentifiedObject):
     """Of an ErpPayable, a line item references an ErpInvoiceLineitem or other source such as credit memos.Of an ErpPayable, a line item references an ErpInvoiceLineitem or other source such as credit memos.
@@ -33,11 +34,11 @@ class ErpPayableLineItem(IdentifiedObject):
         @param ErpPayable:
         @param status:
         """
-        self._ErpPayments = []
-        self.ErpPayments = [] if ErpPayments is None else ErpPayments
+        if ErpPayments is not None:
+            self.ErpPayments = ErpPayments
 
-        self._ErpJournalEntries = []
-        self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
+        if ErpJournalEntries is not None:
+            self.ErpJournalEntries = ErpJournalEntries
 
         self._ErpInvoiceLineItem = None
         self.ErpInvoiceLineItem = ErpInvoiceLineItem
@@ -55,6 +56,7 @@ class ErpPayableLineItem(IdentifiedObject):
     _enums = {}
     _refs = ["ErpPayments", "ErpJournalEntries", "ErpInvoiceLineItem", "ErpPayable", "status"]
     _many_refs = ["ErpPayments", "ErpJournalEntries"]
+    _inverses = {"ErpPayments": "ErpPayableLineItems", "ErpJournalEntries": "ErpPayableLineItems", "ErpInvoiceLineItem": "ErpPayableLineItem", "ErpPayable": "ErpPayableLineItems"}
 
     def getErpPayments(self):
         
@@ -62,20 +64,19 @@ class ErpPayableLineItem(IdentifiedObject):
 
     def setErpPayments(self, value):
         for p in self._ErpPayments:
-            filtered = [q for q in p.ErpPayableLineItems if q != self]
-            self._ErpPayments._ErpPayableLineItems = filtered
+            p._ErpPayableLineItems.discard(self)
         for r in value:
             if self not in r._ErpPayableLineItems:
-                r._ErpPayableLineItems.append(self)
-        self._ErpPayments = value
+                r._reflist("_ErpPayableLineItems").append(self)
+        self._ErpPayments = RefList(value)
 
     ErpPayments = property(getErpPayments, setErpPayments)
 
     def addErpPayments(self, *ErpPayments):
         for obj in ErpPayments:
             if self not in obj._ErpPayableLineItems:
-                obj._ErpPayableLineItems.append(self)
-            self._ErpPayments.append(obj)
+                obj._reflist("_ErpPayableLineItems").append(self)
+            self._reflist("_ErpPayments").append(obj)
 
     def removeErpPayments(self, *ErpPayments):
         for obj in ErpPayments:
@@ -89,20 +90,19 @@ class ErpPayableLineItem(IdentifiedObject):
 
     def setErpJournalEntries(self, value):
         for p in self._ErpJournalEntries:
-            filtered = [q for q in p.ErpPayableLineItems if q != self]
-            self._ErpJournalEntries._ErpPayableLineItems = filtered
+            p._ErpPayableLineItems.discard(self)
         for r in value:
             if self not in r._ErpPayableLineItems:
-                r._ErpPayableLineItems.append(self)
-        self._ErpJournalEntries = value
+                r._reflist("_ErpPayableLineItems").append(self)
+        self._ErpJournalEntries = RefList(value)
 
     ErpJournalEntries = property(getErpJournalEntries, setErpJournalEntries)
 
     def addErpJournalEntries(self, *ErpJournalEntries):
         for obj in ErpJournalEntries:
             if self not in obj._ErpPayableLineItems:
-                obj._ErpPayableLineItems.append(self)
-            self._ErpJournalEntries.append(obj)
+                obj._reflist("_ErpPayableLineItems").append(self)
+            self._reflist("_ErpJournalEntries").append(obj)
 
     def removeErpJournalEntries(self, *ErpJournalEntries):
         for obj in ErpJournalEntries:
@@ -131,13 +131,12 @@ class ErpPayableLineItem(IdentifiedObject):
 
     def setErpPayable(self, value):
         if self._ErpPayable is not None:
-            filtered = [x for x in self.ErpPayable.ErpPayableLineItems if x != self]
-            self._ErpPayable._ErpPayableLineItems = filtered
+            self._ErpPayable._ErpPayableLineItems.discard(self)
 
         self._ErpPayable = value
         if self._ErpPayable is not None:
             if self not in self._ErpPayable._ErpPayableLineItems:
-                self._ErpPayable._ErpPayableLineItems.append(self)
+                self._ErpPayable._reflist("_ErpPayableLineItems").append(self)
 
     ErpPayable = property(getErpPayable, setErpPayable)
 
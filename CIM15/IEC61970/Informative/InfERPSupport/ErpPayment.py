@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpPayment(Document):
     """Payment infromation and status for any individual line item of an ErpInvoice (e.g., when payment is from a customer). ErpPayable is also updated when payment is to a supplier and ErpReceivable is updated when payment is from a customer. Multiple payments can be made against a single line item and an individual payment can apply to more that one line item.Payment infromation and status for any individual line item of an ErpInvoice (e.g., when payment is from a customer). ErpPayable is also updated when payment is to a supplier and ErpReceivable is updated when payment is from a customer. Multiple payments can be made against a single line item and an individual payment can apply to more that one line item.
@@ -35,14 +36,14 @@ class ErpPayment(Document):
         #: Payment terms (e.g., net 30).
         self.termsPayment = termsPayment
 
-        self._ErpRecLineItems = []
-        self.ErpRecLineItems = [] if ErpRecLineItems is None else ErpRecLineItems
+        if ErpRecLineItems is not None:
+            self.ErpRecLineItems = ErpRecLineItems
 
-        self._ErpPayableLineItems = []
-        self.ErpPayableLineItems = [] if ErpPayableLineItems is None else ErpPayableLineItems
+        if ErpPayableLineItems is not None:
+            self.ErpPayableLineItems = ErpPayableLineItems
 
-        self._ErpInvoiceLineItems = []
-        self.ErpInvoiceLineItems = [] if ErpInvoiceLineItems is None else ErpInvoiceLineItems
+        if ErpInvoiceLineItems is not None:
+            self.ErpInvoiceLineItems = ErpInvoiceLineItems
 
         super(ErpPayment, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class ErpPayment(Document):
     _enums = {}
     _refs = ["ErpRecLineItems", "ErpPayableLineItems", "ErpInvoiceLineItems"]
     _many_refs = ["ErpRecLineItems", "ErpPayableLineItems", "ErpInvoiceLineItems"]
+    _inverses = {"ErpRecLineItems": "ErpPayments", "ErpPayableLineItems": "ErpPayments", "ErpInvoiceLineItems": "ErpPayments"}
 
     def getErpRecLineItems(self):
         
@@ -59,20 +61,19 @@ class ErpPayment(Document):
 
     def setErpRecLineItems(self, value):
         for p in self._ErpRecLineItems:
-            filtered = [q for q in p.ErpPayments if q != self]
-            self._ErpRecLineItems._ErpPayments = filtered
+            p._ErpPayments.discard(self)
         for r in value:
             if self not in r._ErpPayments:
-                r._ErpPayments.append(self)
-        self._ErpRecLineItems = value
+                r._reflist("_ErpPayments").append(self)
+        self._ErpRecLineItems = RefList(value)
 
     ErpRecLineItems = property(getErpRecLineItems, setErpRecLineItems)
 
     def addErpRecLineItems(self, *ErpRecLineItems):
         for obj in ErpRecLineItems:
             if self not in obj._ErpPayments:
-                obj._ErpPayments.append(self)
-            self._ErpRecLineItems.append(obj)
+                obj._reflist("_ErpPayments").append(self)
+            self._reflist("_ErpRecLineItems").append(obj)
 
     def removeErpRecLineItems(self, *ErpRecLineItems):
         for obj in ErpRecLineItems:
@@ -86,20 +87,19 @@ class ErpPayment(Document):
 
     def setErpPayableLineItems(self, value):
         for p in self._ErpPayableLineItems:
-            filtered = [q for q in p.ErpPayments if q != self]
-            self._ErpPayableLineItems._ErpPayments = filtered
+            p._ErpPayments.discard(self)
         for r in value:
             if self not in r._ErpPayments:
-                r._ErpPayments.append(self)
-        self._ErpPayableLineItems = value
+                r._reflist("_ErpPayments").append(self)
+        self._ErpPayableLineItems = RefList(value)
 
     ErpPayableLineItems = property(getErpPayableLineItems, setErpPayableLineItems)
 
     def addErpPayableLineItems(self, *ErpPayableLineItems):
         for obj in ErpPayableLineItems:
             if self not in obj._ErpPayments:
-                obj._ErpPayments.append(self)
-            self._ErpPayableLineItems.append(obj)
+                obj._reflist("_ErpPayments").append(self)
+            self._reflist("_ErpPayableLineItems").append(obj)
 
     def removeErpPayableLineItems(self, *ErpPayableLineItems):
         for obj in ErpPayableLineItems:
@@ -113,20 +113,19 @@ class ErpPayment(Document):
 
     def setErpInvoiceLineItems(self, value):
         for p in self._ErpInvoiceLineItems:
-            filtered = [q for q in p.ErpPayments if q != self]
-            self._ErpInvoiceLineItems._ErpPayments = filtered
+            p._ErpPayments.discard(self)
         for r in value:
             if self not in r._ErpPayments:
-                r._ErpPayments.append(self)
-        self._ErpInvoiceLineItems = value
+                r._reflist("_ErpPayments").append(self)
+        self._ErpInvoiceLineItems = RefList(value)
 
     ErpInvoiceLineItems = property(getErpInvoiceLineItems, setErpInvoiceLineItems)
 
     def addErpInvoiceLineItems(self, *ErpInvoiceLineItems):
         for obj in ErpInvoiceLineItems:
             if self not in obj._ErpPayments:
-                obj._ErpPayments.append(self)
-            self._ErpInvoiceLineItems.append(obj)
+                obj._reflist("_ErpPayments").append(self)
+            self._reflist("_ErpInvoiceLineItems").append(obj)
 
     def removeErpInvoiceLineItems(self, *ErpInvoiceLineItems):
         for obj in ErpInvoiceLineItems:
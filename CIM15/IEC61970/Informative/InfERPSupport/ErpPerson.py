@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ErpPerson(IdentifiedObject):
     """General purpose information for name and other information to contact people.General purpose information for name and other information to contact people.
@@ -84,56 +85,56 @@ class ErpPerson(IdentifiedObject):
         self._ServiceLocation = None
         self.ServiceLocation = ServiceLocation
 
-        self._ErpOrganisationRoles = []
-        self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
+        if ErpOrganisationRoles is not None:
+            self.ErpOrganisationRoles = ErpOrganisationRoles
 
-        self._Appointments = []
-        self.Appointments = [] if Appointments is None else Appointments
+        if Appointments is not None:
+            self.Appointments = Appointments
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        if Crews is not None:
+            self.Crews = Crews
 
-        self._LaborItems = []
-        self.LaborItems = [] if LaborItems is None else LaborItems
+        if LaborItems is not None:
+            self.LaborItems = LaborItems
 
-        self._LandPropertyRoles = []
-        self.LandPropertyRoles = [] if LandPropertyRoles is None else LandPropertyRoles
+        if LandPropertyRoles is not None:
+            self.LandPropertyRoles = LandPropertyRoles
 
-        self._ActivityRecords = []
-        self.ActivityRecords = [] if ActivityRecords is None else ActivityRecords
+        if ActivityRecords is not None:
+            self.ActivityRecords = ActivityRecords
 
-        self._MeasurementValues = []
-        self.MeasurementValues = [] if MeasurementValues is None else MeasurementValues
+        if MeasurementValues is not None:
+            self.MeasurementValues = MeasurementValues
 
-        self._Skills = []
-        self.Skills = [] if Skills is None else Skills
+        if Skills is not None:
+            self.Skills = Skills
 
         self.landlinePhone = landlinePhone
 
         self.mobilePhone = mobilePhone
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
         self.status = status
 
-        self._DocumentRoles = []
-        self.DocumentRoles = [] if DocumentRoles is None else DocumentRoles
+        if DocumentRoles is not None:
+            self.DocumentRoles = DocumentRoles
 
         self._ErpPersonnel = None
         self.ErpPersonnel = ErpPersonnel
 
-        self._Crafts = []
-        self.Crafts = [] if Crafts is None else Crafts
+        if Crafts is not None:
+            self.Crafts = Crafts
 
         self._CustomerData = None
         self.CustomerData = CustomerData
 
-        self._CallBacks = []
-        self.CallBacks = [] if CallBacks is None else CallBacks
+        if CallBacks is not None:
+            self.CallBacks = CallBacks
 
-        self._SwitchingStepRoles = []
-        self.SwitchingStepRoles = [] if SwitchingStepRoles is None else SwitchingStepRoles
+        if SwitchingStepRoles is not None:
+            self.SwitchingStepRoles = SwitchingStepRoles
 
         self.electronicAddress = electronicAddress
 
@@ -148,6 +149,7 @@ class ErpPerson(IdentifiedObject):
     _enums = {}
     _refs = ["ServiceLocation", "ErpOrganisationRoles", "Appointments", "Crews", "LaborItems", "LandPropertyRoles", "ActivityRecords", "MeasurementValues", "Skills", "landlinePhone", "mobilePhone", "ChangeItems", "status", "DocumentRoles", "ErpPersonnel", "Crafts", "CustomerData", "CallBacks", "SwitchingStepRoles", "electronicAddress", "ErpCompetency"]
     _many_refs = ["ErpOrganisationRoles", "Appointments", "Crews", "LaborItems", "LandPropertyRoles", "ActivityRecords", "MeasurementValues", "Skills", "ChangeItems", "DocumentRoles", "Crafts", "CallBacks", "SwitchingStepRoles"]
+    _inverses = {"ServiceLocation": "ErpPersons", "ErpOrganisationRoles": "ErpPerson", "Appointments": "ErpPersons", "Crews": "CrewMembers", "LaborItems": "ErpPersons", "LandPropertyRoles": "ErpPerson", "ActivityRecords": "ErpPersons", "MeasurementValues": "ErpPerson", "Skills": "ErpPerson", "ChangeItems": "ErpPerson", "DocumentRoles": "ErpPerson", "ErpPersonnel": "ErpPersons", "Crafts": "ErpPersons", "CustomerData": "ErpPersons", "CallBacks": "ErpPersons", "SwitchingStepRoles": "ErpPerson", "ErpCompetency": "ErpPersons"}
 
     def getServiceLocation(self):
         
@@ -155,13 +157,12 @@ class ErpPerson(IdentifiedObject):
 
     def setServiceLocation(self, value):
         if self._ServiceLocation is not None:
-            filtered = [x for x in self.ServiceLocation.ErpPersons if x != self]
-            self._ServiceLocation._ErpPersons = filtered
+            self._ServiceLocation._ErpPersons.discard(self)
 
         self._ServiceLocation = value
         if self._ServiceLocation is not None:
             if self not in self._ServiceLocation._ErpPersons:
-                self._ServiceLocation._ErpPersons.append(self)
+                self._ServiceLocation._reflist("_ErpPersons").append(self)
 
     ServiceLocation = property(getServiceLocation, setServiceLocation)
 
@@ -170,7 +171,8 @@ class ErpPerson(IdentifiedObject):
         return self._ErpOrganisationRoles
 
     def setErpOrganisationRoles(self, value):
-        for x in self._ErpOrganisationRoles:
+        value = RefList(value)
+        for x in list(self._ErpOrganisationRoles):
             x.ErpPerson = None
         for y in value:
             y._ErpPerson = self
@@ -192,20 +194,19 @@ class ErpPerson(IdentifiedObject):
 
     def setAppointments(self, value):
         for p in self._Appointments:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._Appointments._ErpPersons = filtered
+            p._ErpPersons.discard(self)
         for r in value:
             if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
-        self._Appointments = value
+                r._reflist("_ErpPersons").append(self)
+        self._Appointments = RefList(value)
 
     Appointments = property(getAppointments, setAppointments)
 
     def addAppointments(self, *Appointments):
         for obj in Appointments:
             if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._Appointments.append(obj)
+                obj._reflist("_ErpPersons").append(self)
+            self._reflist("_Appointments").append(obj)
 
     def removeAppointments(self, *Appointments):
         for obj in Appointments:
@@ -220,20 +221,19 @@ class ErpPerson(IdentifiedObject):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.CrewMembers if q != self]
-            self._Crews._CrewMembers = filtered
+            p._CrewMembers.discard(self)
         for r in value:
             if self not in r._CrewMembers:
-                r._CrewMembers.append(self)
-        self._Crews = value
+                r._reflist("_CrewMembers").append(self)
+        self._Crews = RefList(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
             if self not in obj._CrewMembers:
-                obj._CrewMembers.append(self)
-            self._Crews.append(obj)
+                obj._reflist("_CrewMembers").append(self)
+            self._reflist("_Crews").append(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
@@ -247,20 +247,19 @@ class ErpPerson(IdentifiedObject):
 
     def setLaborItems(self, value):
         for p in self._LaborItems:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._LaborItems._ErpPersons = filtered
+            p._ErpPersons.discard(self)
         for r in value:
             if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
-        self._LaborItems = value
+                r._reflist("_ErpPersons").append(self)
+        self._LaborItems = RefList(value)
 
     LaborItems = property(getLaborItems, setLaborItems)
 
     def addLaborItems(self, *LaborItems):
         for obj in LaborItems:
             if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._LaborItems.append(obj)
+                obj._reflist("_ErpPersons").append(self)
+            self._reflist("_LaborItems").append(obj)
 
     def removeLaborItems(self, *LaborItems):
         for obj in LaborItems:
@@ -273,7 +272,8 @@ class ErpPerson(IdentifiedObject):
         return self._LandPropertyRoles
 
     def setLandPropertyRoles(self, value):
-        for x in self._LandPropertyRoles:
+        value = RefList(value)
+        for x in list(self._LandPropertyRoles):
             x.ErpPerson = None
         for y in value:
             y._ErpPerson = self
@@ -295,20 +295,19 @@ class ErpPerson(IdentifiedObject):
 
     def setActivityRecords(self, value):
         for p in self._ActivityRecords:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._ActivityRecords._ErpPersons = filtered
+            p._ErpPersons.discard(self)
         for r in value:
             if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
-        self._ActivityRecords = value
+                r._reflist("_ErpPersons").append(self)
+        self._ActivityRecords = RefList(value)
 
     ActivityRecords = property(getActivityRecords, setActivityRecords)
 
     def addActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
             if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._ActivityRecords.append(obj)
+                obj._reflist("_ErpPersons").append(self)
+            self._reflist("_ActivityRecords").append(obj)
 
     def removeActivityRecords(self, *ActivityRecords):
         for obj in ActivityRecords:
@@ -321,7 +320,8 @@ class ErpPerson(IdentifiedObject):
         return self._MeasurementValues
 
     def setMeasurementValues(self, value):
-        for x in self._MeasurementValues:
+        value = RefList(value)
+        for x in list(self._MeasurementValues):
             x.ErpPerson = None
         for y in value:
             y._ErpPerson = self
@@ -342,7 +342,8 @@ class ErpPerson(IdentifiedObject):
         return self._Skills
 
     def setSkills(self, value):
-        for x in self._Skills:
+        value = RefList(value)
+        for x in list(self._Skills):
             x.ErpPerson = None
         for y in value:
             y._ErpPerson = self
@@ -369,7 +370,8 @@ class ErpPerson(IdentifiedObject):
         return self._ChangeItems
 
     def setChangeItems(self, value):
-        for x in self._ChangeItems:
+        value = RefList(value)
+        for x in list(self._ChangeItems):
             x.ErpPerson = None
         for y in value:
             y._ErpPerson = self
@@ -392,7 +394,8 @@ class ErpPerson(IdentifiedObject):
         return self._DocumentRoles
 
     def setDocumentRoles(self, value):
-        for x in self._DocumentRoles:
+        value = RefList(value)
+        for x in list(self._DocumentRoles):
             x.ErpPerson = None
         for y in value:
             y._ErpPerson = self
@@ -414,13 +417,12 @@ class ErpPerson(IdentifiedObject):
 
     def setErpPersonnel(self, value):
         if self._ErpPersonnel is not None:
-            filtered = [x for x in self.ErpPersonnel.ErpPersons if x != self]
-            self._ErpPersonnel._ErpPersons = filtered
+            self._ErpPersonnel._ErpPersons.discard(self)
 
         self._ErpPersonnel = value
         if self._ErpPersonnel is not None:
             if self not in self._ErpPersonnel._ErpPersons:
-                self._ErpPersonnel._ErpPersons.append(self)
+                self._ErpPersonnel._reflist("_ErpPersons").append(self)
 
     ErpPersonnel = property(getErpPersonnel, setErpPersonnel)
 
@@ -430,20 +432,19 @@ class ErpPerson(IdentifiedObject):
 
     def setCrafts(self, value):
         for p in self._Crafts:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._Crafts._ErpPersons = filtered
+            p._ErpPersons.discard(self)
         for r in value:
             if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
-        self._Crafts = value
+                r._reflist("_ErpPersons").append(self)
+        self._Crafts = RefList(value)
 
     Crafts = property(getCrafts, setCrafts)
 
     def addCrafts(self, *Crafts):
         for obj in Crafts:
             if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._Crafts.append(obj)
+                obj._reflist("_ErpPersons").append(self)
+            self._reflist("_Crafts").append(obj)
 
     def removeCrafts(self, *Crafts):
         for obj in Crafts:
@@ -457,13 +458,12 @@ class ErpPerson(IdentifiedObject):
 
     def setCustomerData(self, value):
         if self._CustomerData is not None:
-            filtered = [x for x in self.CustomerData.ErpPersons if x != self]
-            self._CustomerData._ErpPersons = filtered
+            self._CustomerData._ErpPersons.discard(self)
 
         self._CustomerData = value
         if self._CustomerData is not None:
             if self not in self._CustomerData._ErpPersons:
-                self._CustomerData._ErpPersons.append(self)
+                self._CustomerData._reflist("_ErpPersons").append(self)
 
     CustomerData = property(getCustomerData, setCustomerData)
 
@@ -473,20 +473,19 @@ class ErpPerson(IdentifiedObject):
 
     def setCallBacks(self, value):
         for p in self._CallBacks:
-            filtered = [q for q in p.ErpPersons if q != self]
-            self._CallBacks._ErpPersons = filtered
+            p._ErpPersons.discard(self)
         for r in value:
             if self not in r._ErpPersons:
-                r._ErpPersons.append(self)
-        self._CallBacks = value
+                r._reflist("_ErpPersons").append(self)
+        self._CallBacks = RefList(value)
 
     CallBacks = property(getCallBacks, setCallBacks)
 
     def addCallBacks(self, *CallBacks):
         for obj in CallBacks:
             if self not in obj._ErpPersons:
-                obj._ErpPersons.append(self)
-            self._CallBacks.append(obj)
+                obj._reflist("_ErpPersons").append(self)
+            self._reflist("_CallBacks").append(obj)
 
     def removeCallBacks(self, *CallBacks):
         for obj in CallBacks:
@@ -499,7 +498,8 @@ class ErpPerson(IdentifiedObject):
         return self._SwitchingStepRoles
 
     def setSwitchingStepRoles(self, value):
-        for x in self._SwitchingStepRoles:
+        value = RefList(value)
+        for x in list(self._SwitchingStepRoles):
             x.ErpPerson = None
         for y in value:
             y._ErpPerson = self
@@ -524,13 +524,12 @@ class ErpPerson(IdentifiedObject):
 
     def setErpCompetency(self, value):
         if self._ErpCompetency is not None:
-            filtered = [x for x in self.ErpCompetency.ErpPersons if x != self]
-            self._ErpCompetency._ErpPersons = filtered
+            self._ErpCompetency._ErpPersons.discard(self)
 
         self._ErpCompetency = value
         if self._ErpCompetency is not None:
             if self not in self._ErpCompetency._ErpPersons:
-                self._ErpCompetency._ErpPersons.append(self)
+                self._ErpCompetency._reflist("_ErpPersons").append(self)
 
     ErpCompetency = property(getErpCompetency, setErpCompetency)
 
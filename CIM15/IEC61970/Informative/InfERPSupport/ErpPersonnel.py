@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ErpPersonnel(IdentifiedObject):
     """Information that applies to the basic data about a utility person, used by ERP applications to transfer Personnel data for a worker.Information that applies to the basic data about a utility person, used by ERP applications to transfer Personnel data for a worker.
@@ -32,8 +33,8 @@ class ErpPersonnel(IdentifiedObject):
         """
         self.status = status
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
         super(ErpPersonnel, self).__init__(*args, **kw_args)
 
@@ -43,6 +44,7 @@ class ErpPersonnel(IdentifiedObject):
     _enums = {}
     _refs = ["status", "ErpPersons"]
     _many_refs = ["ErpPersons"]
+    _inverses = {"ErpPersons": "ErpPersonnel"}
 
     status = None
 
@@ -51,7 +53,8 @@ class ErpPersonnel(IdentifiedObject):
         return self._ErpPersons
 
     def setErpPersons(self, value):
-        for x in self._ErpPersons:
+        value = RefList(value)
+        for x in list(self._ErpPersons):
             x.ErpPersonnel = None
         for y in value:
             y._ErpPersonnel = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpProjectAccounting(Document):
     """Utility Project Accounting information, used by ERP applications to enable all relevant sub-systems that submit single sided transactions to transfer information with a Project Accounting Application. This would include, but not necessarily be limited to: Accounts Payable, Accounts Receivable, Budget, Order Management, Purchasing, Time and Labor, Travel and Expense.Utility Project Accounting information, used by ERP applications to enable all relevant sub-systems that submit single sided transactions to transfer information with a Project Accounting Application. This would include, but not necessarily be limited to: Accounts Payable, Accounts Receivable, Budget, Order Management, Purchasing, Time and Labor, Travel and Expense.
@@ -32,17 +33,17 @@ class ErpProjectAccounting(Document):
         @param ErpTimeEntries:
         @param WorkCostDetails:
         """
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        if Works is not None:
+            self.Works = Works
 
-        self._Projects = []
-        self.Projects = [] if Projects is None else Projects
+        if Projects is not None:
+            self.Projects = Projects
 
-        self._ErpTimeEntries = []
-        self.ErpTimeEntries = [] if ErpTimeEntries is None else ErpTimeEntries
+        if ErpTimeEntries is not None:
+            self.ErpTimeEntries = ErpTimeEntries
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
         super(ErpProjectAccounting, self).__init__(*args, **kw_args)
 
@@ -52,13 +53,15 @@ class ErpProjectAccounting(Document):
     _enums = {}
     _refs = ["Works", "Projects", "ErpTimeEntries", "WorkCostDetails"]
     _many_refs = ["Works", "Projects", "ErpTimeEntries", "WorkCostDetails"]
+    _inverses = {"Works": "ErpProjectAccounting", "Projects": "ErpProjectAccounting", "ErpTimeEntries": "ErpProjectAccounting", "WorkCostDetails": "ErpProjectAccounting"}
 
     def getWorks(self):
         
         return self._Works
 
     def setWorks(self, value):
-        for x in self._Works:
+        value = RefList(value)
+        for x in list(self._Works):
             x.ErpProjectAccounting = None
         for y in value:
             y._ErpProjectAccounting = self
@@ -79,7 +82,8 @@ class ErpProjectAccounting(Document):
         return self._Projects
 
     def setProjects(self, value):
-        for x in self._Projects:
+        value = RefList(value)
+        for x in list(self._Projects):
             x.ErpProjectAccounting = None
         for y in value:
             y._ErpProjectAccounting = self
@@ -100,7 +104,8 @@ class ErpProjectAccounting(Document):
         return self._ErpTimeEntries
 
     def setErpTimeEntries(self, value):
-        for x in self._ErpTimeEntries:
+        value = RefList(value)
+        for x in list(self._ErpTimeEntries):
             x.ErpProjectAccounting = None
         for y in value:
             y._ErpProjectAccounting = self
@@ -121,7 +126,8 @@ class ErpProjectAccounting(Document):
         return self._WorkCostDetails
 
     def setWorkCostDetails(self, value):
-        for x in self._WorkCostDetails:
+        value = RefList(value)
+        for x in list(self._WorkCostDetails):
             x.ErpProjectAccounting = None
         for y in value:
             y._ErpProjectAccounting = self
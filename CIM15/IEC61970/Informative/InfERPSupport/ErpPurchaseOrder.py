@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpPurchaseOrder(Document):
     """A document that communicates an order to purchase goods from a buyer to a supplier. The PurchaseOrder carries information to and from the buyer and supplier. It is a legally binding document once both Parties agree to the contents and the specified terms and conditions of the order.A document that communicates an order to purchase goods from a buyer to a supplier. The PurchaseOrder carries information to and from the buyer and supplier. It is a legally binding document once both Parties agree to the contents and the specified terms and conditions of the order.
@@ -29,8 +30,8 @@ class ErpPurchaseOrder(Document):
 
         @param ErpPOLineItems:
         """
-        self._ErpPOLineItems = []
-        self.ErpPOLineItems = [] if ErpPOLineItems is None else ErpPOLineItems
+        if ErpPOLineItems is not None:
+            self.ErpPOLineItems = ErpPOLineItems
 
         super(ErpPurchaseOrder, self).__init__(*args, **kw_args)
 
@@ -40,13 +41,15 @@ class ErpPurchaseOrder(Document):
     _enums = {}
     _refs = ["ErpPOLineItems"]
     _many_refs = ["ErpPOLineItems"]
+    _inverses = {"ErpPOLineItems": "ErpPurchaseOrder"}
 
     def getErpPOLineItems(self):
         
         return self._ErpPOLineItems
 
     def setErpPOLineItems(self, value):
-        for x in self._ErpPOLineItems:
+        value = RefList(value)
+        for x in list(self._ErpPOLineItems):
             x.ErpPurchaseOrder = None
         for y in value:
             y._ErpPurchaseOrder = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpQuote(Document):
     """Document describing the prices of goods or services provided by a supplier. It includes the terms of the purchase, delivery proposals, identification of goods or services ordered, as well as their quantities.Document describing the prices of goods or services provided by a supplier. It includes the terms of the purchase, delivery proposals, identification of goods or services ordered, as well as their quantities.
@@ -29,8 +30,8 @@ class ErpQuote(Document):
 
         @param ErpQuoteLineItems:
         """
-        self._ErpQuoteLineItems = []
-        self.ErpQuoteLineItems = [] if ErpQuoteLineItems is None else ErpQuoteLineItems
+        if ErpQuoteLineItems is not None:
+            self.ErpQuoteLineItems = ErpQuoteLineItems
 
         super(ErpQuote, self).__init__(*args, **kw_args)
 
@@ -40,13 +41,15 @@ class ErpQuote(Document):
     _enums = {}
     _refs = ["ErpQuoteLineItems"]
     _many_refs = ["ErpQuoteLineItems"]
+    _inverses = {"ErpQuoteLineItems": "ErpQuote"}
 
     def getErpQuoteLineItems(self):
         
         return self._ErpQuoteLineItems
 
     def setErpQuoteLineItems(self, value):
-        for x in self._ErpQuoteLineItems:
+        value = RefList(value)
+        for x in list(self._ErpQuoteLineItems):
             x.ErpQuote = None
         for y in value:
             y._ErpQuote = self
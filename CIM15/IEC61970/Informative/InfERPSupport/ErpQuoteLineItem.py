@@ -63,6 +63,7 @@ class ErpQuoteLineItem(IdentifiedObject):
     _enums = {}
     _refs = ["ErpQuote", "AssetModelCatalogueItem", "status", "Design", "ErpInvoiceLineItem", "ErpReqLineItem", "Request"]
     _many_refs = []
+    _inverses = {"ErpQuote": "ErpQuoteLineItems", "AssetModelCatalogueItem": "ErpQuoteLineItems", "Design": "ErpQuoteLineItem", "ErpInvoiceLineItem": "ErpQuoteLineItem", "ErpReqLineItem": "ErpQuoteLineItem", "Request": "ErpQuoteLineItem"}
 
     def getErpQuote(self):
         
@@ -70,13 +71,12 @@ class ErpQuoteLineItem(IdentifiedObject):
 
     def setErpQuote(self, value):
         if self._ErpQuote is not None:
-            filtered = [x for x in self.ErpQuote.ErpQuoteLineItems if x != self]
-            self._ErpQuote._ErpQuoteLineItems = filtered
+            self._ErpQuote._ErpQuoteLineItems.discard(self)
 
         self._ErpQuote = value
         if self._ErpQuote is not None:
             if self not in self._ErpQuote._ErpQuoteLineItems:
-                self._ErpQuote._ErpQuoteLineItems.append(self)
+                self._ErpQuote._reflist("_ErpQuoteLineItems").append(self)
 
     ErpQuote = property(getErpQuote, setErpQuote)
 
@@ -86,13 +86,12 @@ class ErpQuoteLineItem(IdentifiedObject):
 
     def setAssetModelCatalogueItem(self, value):
         if self._AssetModelCatalogueItem is not None:
-            filtered = [x for x in self.AssetModelCatalogueItem.ErpQuoteLineItems if x != self]
-            self._AssetModelCatalogueItem._ErpQuoteLineItems = filtered
+            self._AssetModelCatalogueItem._ErpQuoteLineItems.discard(self)
 
         self._AssetModelCatalogueItem = value
         if self._AssetModelCatalogueItem is not None:
             if self not in self._AssetModelCatalogueItem._ErpQuoteLineItems:
-                self._AssetModelCatalogueItem._ErpQuoteLineItems.append(self)
+                self._AssetModelCatalogueItem._reflist("_ErpQuoteLineItems").append(self)
 
     AssetModelCatalogueItem = property(getAssetModelCatalogueItem, setAssetModelCatalogueItem)
 
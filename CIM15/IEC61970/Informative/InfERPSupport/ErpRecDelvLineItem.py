@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ErpRecDelvLineItem(IdentifiedObject):
     """Of an ErpReceiveDelivery, this is an individually received good or service by the Organisation receiving goods or services. It may be used to indicate receipt of goods in conjunction with a purchase order line item.Of an ErpReceiveDelivery, this is an individually received good or service by the Organisation receiving goods or services. It may be used to indicate receipt of goods in conjunction with a purchase order line item.
@@ -34,8 +35,8 @@ class ErpRecDelvLineItem(IdentifiedObject):
         @param MaterialItems:
         @param ErpPOLineItem:
         """
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
         self._ErpInvoiceLineItem = None
         self.ErpInvoiceLineItem = ErpInvoiceLineItem
@@ -45,8 +46,8 @@ class ErpRecDelvLineItem(IdentifiedObject):
         self._ErpReceiveDelivery = None
         self.ErpReceiveDelivery = ErpReceiveDelivery
 
-        self._MaterialItems = []
-        self.MaterialItems = [] if MaterialItems is None else MaterialItems
+        if MaterialItems is not None:
+            self.MaterialItems = MaterialItems
 
         self._ErpPOLineItem = None
         self.ErpPOLineItem = ErpPOLineItem
@@ -59,6 +60,7 @@ class ErpRecDelvLineItem(IdentifiedObject):
     _enums = {}
     _refs = ["Assets", "ErpInvoiceLineItem", "status", "ErpReceiveDelivery", "MaterialItems", "ErpPOLineItem"]
     _many_refs = ["Assets", "MaterialItems"]
+    _inverses = {"Assets": "ErpRecDeliveryItems", "ErpInvoiceLineItem": "ErpRecDelvLineItem", "ErpReceiveDelivery": "ErpRecDelvLineItems", "MaterialItems": "ErpRecDelvLineItems", "ErpPOLineItem": "ErpRecDelLineItem"}
 
     def getAssets(self):
         
@@ -66,20 +68,19 @@ class ErpRecDelvLineItem(IdentifiedObject):
 
     def setAssets(self, value):
         for p in self._Assets:
-            filtered = [q for q in p.ErpRecDeliveryItems if q != self]
-            self._Assets._ErpRecDeliveryItems = filtered
+            p._ErpRecDeliveryItems.discard(self)
         for r in value:
             if self not in r._ErpRecDeliveryItems:
-                r._ErpRecDeliveryItems.append(self)
-        self._Assets = value
+                r._reflist("_ErpRecDeliveryItems").append(self)
+        self._Assets = RefList(value)
 
     Assets = property(getAssets, setAssets)
 
     def addAssets(self, *Assets):
         for obj in Assets:
             if self not in obj._ErpRecDeliveryItems:
-                obj._ErpRecDeliveryItems.append(self)
-            self._Assets.append(obj)
+                obj._reflist("_ErpRecDeliveryItems").append(self)
+            self._reflist("_Assets").append(obj)
 
     def removeAssets(self, *Assets):
         for obj in Assets:
@@ -110,13 +111,12 @@ class ErpRecDelvLineItem(IdentifiedObject):
 
     def setErpReceiveDelivery(self, value):
         if self._ErpReceiveDelivery is not None:
-            filtered = [x for x in self.ErpReceiveDelivery.ErpRecDelvLineItems if x != self]
-            self._ErpReceiveDelivery._ErpRecDelvLineItems = filtered
+            self._ErpReceiveDelivery._ErpRecDelvLineItems.discard(self)
 
         self._ErpReceiveDelivery = value
         if self._ErpReceiveDelivery is not None:
             if self not in self._ErpReceiveDelivery._ErpRecDelvLineItems:
-                self._ErpReceiveDelivery._ErpRecDelvLineItems.append(self)
+                self._ErpReceiveDelivery._reflist("_ErpRecDelvLineItems").append(self)
 
     ErpReceiveDelivery = property(getErpReceiveDelivery, setErpReceiveDelivery)
 
@@ -126,20 +126,19 @@ class ErpRecDelvLineItem(IdentifiedObject):
 
     def setMaterialItems(self, value):
         for p in self._MaterialItems:
-            filtered = [q for q in p.ErpRecDelvLineItems if q != self]
-            self._MaterialItems._ErpRecDelvLineItems = filtered
+            p._ErpRecDelvLineItems.discard(self)
         for r in value:
             if self not in r._ErpRecDelvLineItems:
-                r._ErpRecDelvLineItems.append(self)
-        self._MaterialItems = value
+                r._reflist("_ErpRecDelvLineItems").append(self)
+        self._MaterialItems = RefList(value)
 
     MaterialItems = property(getMaterialItems, setMaterialItems)
 
     def addMaterialItems(self, *MaterialItems):
         for obj in MaterialItems:
             if self not in obj._ErpRecDelvLineItems:
-                obj._ErpRecDelvLineItems.append(self)
-            self._MaterialItems.append(obj)
+                obj._reflist("_ErpRecDelvLineItems").append(self)
+            self._reflist("_MaterialItems").append(obj)
 
     def removeMaterialItems(self, *MaterialItems):
         for obj in MaterialItems:
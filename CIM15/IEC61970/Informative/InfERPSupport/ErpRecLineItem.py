@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ErpRecLineItem(IdentifiedObject):
     """Individual entry of an ErpReceivable, it is a particular transaction representing an invoice, credit memo or debit memo to a customer.Individual entry of an ErpReceivable, it is a particular transaction representing an invoice, credit memo or debit memo to a customer.
@@ -41,11 +42,11 @@ class ErpRecLineItem(IdentifiedObject):
         self._ErpInvoiceLineItem = None
         self.ErpInvoiceLineItem = ErpInvoiceLineItem
 
-        self._ErpPayments = []
-        self.ErpPayments = [] if ErpPayments is None else ErpPayments
+        if ErpPayments is not None:
+            self.ErpPayments = ErpPayments
 
-        self._ErpJournalEntries = []
-        self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
+        if ErpJournalEntries is not None:
+            self.ErpJournalEntries = ErpJournalEntries
 
         super(ErpRecLineItem, self).__init__(*args, **kw_args)
 
@@ -55,6 +56,7 @@ class ErpRecLineItem(IdentifiedObject):
     _enums = {}
     _refs = ["ErpReceivable", "status", "ErpInvoiceLineItem", "ErpPayments", "ErpJournalEntries"]
     _many_refs = ["ErpPayments", "ErpJournalEntries"]
+    _inverses = {"ErpReceivable": "ErpRecLineItems", "ErpInvoiceLineItem": "ErpRecLineItem", "ErpPayments": "ErpRecLineItems", "ErpJournalEntries": "ErpRecLineItems"}
 
     def getErpReceivable(self):
         
@@ -62,13 +64,12 @@ class ErpRecLineItem(IdentifiedObject):
 
     def setErpReceivable(self, value):
         if self._ErpReceivable is not None:
-            filtered = [x for x in self.ErpReceivable.ErpRecLineItems if x != self]
-            self._ErpReceivable._ErpRecLineItems = filtered
+            self._ErpReceivable._ErpRecLineItems.discard(self)
 
         self._ErpReceivable = value
         if self._ErpReceivable is not None:
             if self not in self._ErpReceivable._ErpRecLineItems:
-                self._ErpReceivable._ErpRecLineItems.append(self)
+                self._ErpReceivable._reflist("_ErpRecLineItems").append(self)
 
     ErpReceivable = property(getErpReceivable, setErpReceivable)
 
@@ -95,20 +96,19 @@ class ErpRecLineItem(IdentifiedObject):
 
     def setErpPayments(self, value):
         for p in self._ErpPayments:
-            filtered = [q for q in p.ErpRecLineItems if q != self]
-            self._ErpPayments._ErpRecLineItems = filtered
+            p._ErpRecLineItems.discard(self)
         for r in value:
             if self not in r._ErpRecLineItems:
-                r._ErpRecLineItems.append(self)
-        self._ErpPayments = value
+                r._reflist("_ErpRecLineItems").append(self)
+        self._ErpPayments = RefList(value)
 
     ErpPayments = property(getErpPayments, setErpPayments)
 
     def addErpPayments(self, *ErpPayments):
         for obj in ErpPayments:
             if self not in obj._ErpRecLineItems:
-                obj._ErpRecLineItems.append(self)
-            self._ErpPayments.append(obj)
+                obj._reflist("_ErpRecLineItems").append(self)
+            self._reflist("_ErpPayments").append(obj)
 
     def removeErpPayments(self, *ErpPayments):
         for obj in ErpPayments:
@@ -122,20 +122,19 @@ class ErpRecLineItem(IdentifiedObject):
 
     def setErpJournalEntries(self, value):
         for p in self._ErpJournalEntries:
-            filtered = [q for q in p.ErpRecLineItems if q != self]
-            self._ErpJournalEntries._ErpRecLineItems = filtered
+            p._ErpRecLineItems.discard(self)
         for r in value:
             if self not in r._ErpRecLineItems:
-                r._ErpRecLineItems.append(self)
-        self._ErpJournalEntries = value
+                r._reflist("_ErpRecLineItems").append(self)
+        self._ErpJournalEntries = RefList(value)
 
     ErpJournalEntries = property(getErpJournalEntries, setErpJournalEntries)
 
     def addErpJournalEntries(self, *ErpJournalEntries):
         for obj in ErpJournalEntries:
             if self not in obj._ErpRecLineItems:
-                obj._ErpRecLineItems.append(self)
-            self._ErpJournalEntries.append(obj)
+                obj._reflist("_ErpRecLineItems").append(self)
+            self._reflist("_ErpJournalEntries").append(obj)
 
     def removeErpJournalEntries(self, *ErpJournalEntries):
         for obj in ErpJournalEntries:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpReceivable(Document):
     """Transaction representing an invoice, credit memo or debit memo to a customer. It is an open (unpaid) item in the Accounts Receivable ledger.Transaction representing an invoice, credit memo or debit memo to a customer. It is an open (unpaid) item in the Accounts Receivable ledger.
@@ -29,8 +30,8 @@ class ErpReceivable(Document):
 
         @param ErpRecLineItems:
         """
-        self._ErpRecLineItems = []
-        self.ErpRecLineItems = [] if ErpRecLineItems is None else ErpRecLineItems
+        if ErpRecLineItems is not None:
+            self.ErpRecLineItems = ErpRecLineItems
 
         super(ErpReceivable, self).__init__(*args, **kw_args)
 
@@ -40,13 +41,15 @@ class ErpReceivable(Document):
     _enums = {}
     _refs = ["ErpRecLineItems"]
     _many_refs = ["ErpRecLineItems"]
+    _inverses = {"ErpRecLineItems": "ErpReceivable"}
 
     def getErpRecLineItems(self):
         
         return self._ErpRecLineItems
 
     def setErpRecLineItems(self, value):
-        for x in self._ErpRecLineItems:
+        value = RefList(value)
+        for x in list(self._ErpRecLineItems):
             x.ErpReceivable = None
         for y in value:
             y._ErpReceivable = self
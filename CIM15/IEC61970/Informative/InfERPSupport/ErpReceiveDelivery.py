@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpReceiveDelivery(Document):
     """Transaction for an Organisation receiving goods or services that may be used to indicate receipt of goods in conjunction with a purchase order. A receivable is an open (unpaid) item in the Accounts Receivable ledger.Transaction for an Organisation receiving goods or services that may be used to indicate receipt of goods in conjunction with a purchase order. A receivable is an open (unpaid) item in the Accounts Receivable ledger.
@@ -29,8 +30,8 @@ class ErpReceiveDelivery(Document):
 
         @param ErpRecDelvLineItems:
         """
-        self._ErpRecDelvLineItems = []
-        self.ErpRecDelvLineItems = [] if ErpRecDelvLineItems is None else ErpRecDelvLineItems
+        if ErpRecDelvLineItems is not None:
+            self.ErpRecDelvLineItems = ErpRecDelvLineItems
 
         super(ErpReceiveDelivery, self).__init__(*args, **kw_args)
 
@@ -40,13 +41,15 @@ class ErpReceiveDelivery(Document):
     _enums = {}
     _refs = ["ErpRecDelvLineItems"]
     _many_refs = ["ErpRecDelvLineItems"]
+    _inverses = {"ErpRecDelvLineItems": "ErpReceiveDelivery"}
 
     def getErpRecDelvLineItems(self):
         
         return self._ErpRecDelvLineItems
 
     def setErpRecDelvLineItems(self, value):
-        for x in self._ErpRecDelvLineItems:
+        value = RefList(value)
+        for x in list(self._ErpRecDelvLineItems):
             x.ErpReceiveDelivery = None
         for y in value:
             y._ErpReceiveDelivery = self
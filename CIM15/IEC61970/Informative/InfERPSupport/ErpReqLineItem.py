@@ -75,6 +75,7 @@ class ErpReqLineItem(IdentifiedObject):
     _enums = {}
     _refs = ["ErpQuoteLineItem", "status", "ErpRequisition", "TypeMaterial", "ErpPOLineItem", "TypeAsset"]
     _many_refs = []
+    _inverses = {"ErpQuoteLineItem": "ErpReqLineItem", "ErpRequisition": "ErpReqLineItems", "TypeMaterial": "ErpReqLineItems", "ErpPOLineItem": "ErpReqLineItem", "TypeAsset": "ErpReqLineItems"}
 
     def getErpQuoteLineItem(self):
         
@@ -99,13 +100,12 @@ class ErpReqLineItem(IdentifiedObject):
 
     def setErpRequisition(self, value):
         if self._ErpRequisition is not None:
-            filtered = [x for x in self.ErpRequisition.ErpReqLineItems if x != self]
-            self._ErpRequisition._ErpReqLineItems = filtered
+            self._ErpRequisition._ErpReqLineItems.discard(self)
 
         self._ErpRequisition = value
         if self._ErpRequisition is not None:
             if self not in self._ErpRequisition._ErpReqLineItems:
-                self._ErpRequisition._ErpReqLineItems.append(self)
+                self._ErpRequisition._reflist("_ErpReqLineItems").append(self)
 
     ErpRequisition = property(getErpRequisition, setErpRequisition)
 
@@ -115,13 +115,12 @@ class ErpReqLineItem(IdentifiedObject):
 
     def setTypeMaterial(self, value):
         if self._TypeMaterial is not None:
-            filtered = [x for x in self.TypeMaterial.ErpReqLineItems if x != self]
-            self._TypeMaterial._ErpReqLineItems = filtered
+            self._TypeMaterial._ErpReqLineItems.discard(self)
 
         self._TypeMaterial = value
         if self._TypeMaterial is not None:
             if self not in self._TypeMaterial._ErpReqLineItems:
-                self._TypeMaterial._ErpReqLineItems.append(self)
+                self._TypeMaterial._reflist("_ErpReqLineItems").append(self)
 
     TypeMaterial = property(getTypeMaterial, setTypeMaterial)
 
@@ -146,13 +145,12 @@ class ErpReqLineItem(IdentifiedObject):
 
     def setTypeAsset(self, value):
         if self._TypeAsset is not None:
-            filtered = [x for x in self.TypeAsset.ErpReqLineItems if x != self]
-            self._TypeAsset._ErpReqLineItems = filtered
+            self._TypeAsset._ErpReqLineItems.discard(self)
 
         self._TypeAsset = value
         if self._TypeAsset is not None:
             if self not in self._TypeAsset._ErpReqLineItems:
-                self._TypeAsset._ErpReqLineItems.append(self)
+                self._TypeAsset._reflist("_ErpReqLineItems").append(self)
 
     TypeAsset = property(getTypeAsset, setTypeAsset)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpRequisition(Document):
     """General information that applies to a utility requisition that is a request for the purchase of goods or services. Typically, a requisition leads to the creation of a purchase order to a specific supplier.General information that applies to a utility requisition that is a request for the purchase of goods or services. Typically, a requisition leads to the creation of a purchase order to a specific supplier.
@@ -29,8 +30,8 @@ class ErpRequisition(Document):
 
         @param ErpReqLineItems:
         """
-        self._ErpReqLineItems = []
-        self.ErpReqLineItems = [] if ErpReqLineItems is None else ErpReqLineItems
+        if ErpReqLineItems is not None:
+            self.ErpReqLineItems = ErpReqLineItems
 
         super(ErpRequisition, self).__init__(*args, **kw_args)
 
@@ -40,13 +41,15 @@ class ErpRequisition(Document):
     _enums = {}
     _refs = ["ErpReqLineItems"]
     _many_refs = ["ErpReqLineItems"]
+    _inverses = {"ErpReqLineItems": "ErpRequisition"}
 
     def getErpReqLineItems(self):
         
         return self._ErpReqLineItems
 
     def setErpReqLineItems(self, value):
-        for x in self._ErpReqLineItems:
+        value = RefList(value)
+        for x in list(self._ErpReqLineItems):
             x.ErpRequisition = None
         for y in value:
             y._ErpRequisition = self
@@ -36,4 +36,5 @@ class ErpSalesOrder(Document):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -43,6 +43,7 @@ class ErpSiteLevelData(IdentifiedObject):
     _enums = {}
     _refs = ["status", "LandProperty"]
     _many_refs = []
+    _inverses = {"LandProperty": "ErpSiteLevelDatas"}
 
     status = None
 
@@ -52,13 +53,12 @@ class ErpSiteLevelData(IdentifiedObject):
 
     def setLandProperty(self, value):
         if self._LandProperty is not None:
-            filtered = [x for x in self.LandProperty.ErpSiteLevelDatas if x != self]
-            self._LandProperty._ErpSiteLevelDatas = filtered
+            self._LandProperty._ErpSiteLevelDatas.discard(self)
 
         self._LandProperty = value
         if self._LandProperty is not None:
             if self not in self._LandProperty._ErpSiteLevelDatas:
-                self._LandProperty._ErpSiteLevelDatas.append(self)
+                self._LandProperty._reflist("_ErpSiteLevelDatas").append(self)
 
     LandProperty = property(getLandProperty, setLandProperty)
 
@@ -47,6 +47,7 @@ class ErpTimeEntry(IdentifiedObject):
     _enums = {}
     _refs = ["ErpProjectAccounting", "status", "ErpTimeSheet"]
     _many_refs = []
+    _inverses = {"ErpProjectAccounting": "ErpTimeEntries", "ErpTimeSheet": "ErpTimeEntries"}
 
     def getErpProjectAccounting(self):
         
@@ -54,13 +55,12 @@ class ErpTimeEntry(IdentifiedObject):
 
     def setErpProjectAccounting(self, value):
         if self._ErpProjectAccounting is not None:
-            filtered = [x for x in self.ErpProjectAccounting.ErpTimeEntries if x != self]
-            self._ErpProjectAccounting._ErpTimeEntries = filtered
+            self._ErpProjectAccounting._ErpTimeEntries.discard(self)
 
         self._ErpProjectAccounting = value
         if self._ErpProjectAccounting is not None:
             if self not in self._ErpProjectAccounting._ErpTimeEntries:
-                self._ErpProjectAccounting._ErpTimeEntries.append(self)
+                self._ErpProjectAccounting._reflist("_ErpTimeEntries").append(self)
 
     ErpProjectAccounting = property(getErpProjectAccounting, setErpProjectAccounting)
 
@@ -72,13 +72,12 @@ class ErpTimeEntry(IdentifiedObject):
 
     def setErpTimeSheet(self, value):
         if self._ErpTimeSheet is not None:
-            filtered = [x for x in self.ErpTimeSheet.ErpTimeEntries if x != self]
-            self._ErpTimeSheet._ErpTimeEntries = filtered
+            self._ErpTimeSheet._ErpTimeEntries.discard(self)
 
         self._ErpTimeSheet = value
         if self._ErpTimeSheet is not None:
             if self not in self._ErpTimeSheet._ErpTimeEntries:
-                self._ErpTimeSheet._ErpTimeEntries.append(self)
+                self._ErpTimeSheet._reflist("_ErpTimeEntries").append(self)
 
     ErpTimeSheet = property(getErpTimeSheet, setErpTimeSheet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class ErpTimeSheet(Document):
     """Time sheet for employees and contractors. Note that ErpTimeSheet inherits the relationship to ErpPerson from Document.Time sheet for employees and contractors. Note that ErpTimeSheet inherits the relationship to ErpPerson from Document.
@@ -29,8 +30,8 @@ class ErpTimeSheet(Document):
 
         @param ErpTimeEntries:
         """
-        self._ErpTimeEntries = []
-        self.ErpTimeEntries = [] if ErpTimeEntries is None else ErpTimeEntries
+        if ErpTimeEntries is not None:
+            self.ErpTimeEntries = ErpTimeEntries
 
         super(ErpTimeSheet, self).__init__(*args, **kw_args)
 
@@ -40,13 +41,15 @@ class ErpTimeSheet(Document):
     _enums = {}
     _refs = ["ErpTimeEntries"]
     _many_refs = ["ErpTimeEntries"]
+    _inverses = {"ErpTimeEntries": "ErpTimeSheet"}
 
     def getErpTimeEntries(self):
         
         return self._ErpTimeEntries
 
     def setErpTimeEntries(self, value):
-        for x in self._ErpTimeEntries:
+        value = RefList(value)
+        for x in list(self._ErpTimeEntries):
             x.ErpTimeSheet = None
         for y in value:
             y._ErpTimeSheet = self
@@ -48,6 +48,7 @@ class OrgErpPersonRole(Role):
     _enums = {}
     _refs = ["ErpPerson", "ErpOrganisation"]
     _many_refs = []
+    _inverses = {"ErpPerson": "ErpOrganisationRoles", "ErpOrganisation": "ErpPersonRoles"}
 
     def getErpPerson(self):
         
@@ -55,13 +56,12 @@ class OrgErpPersonRole(Role):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.ErpOrganisationRoles if x != self]
-            self._ErpPerson._ErpOrganisationRoles = filtered
+            self._ErpPerson._ErpOrganisationRoles.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
             if self not in self._ErpPerson._ErpOrganisationRoles:
-                self._ErpPerson._ErpOrganisationRoles.append(self)
+                self._ErpPerson._reflist("_ErpOrganisationRoles").append(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
@@ -71,13 +71,12 @@ class OrgErpPersonRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.ErpPersonRoles if x != self]
-            self._ErpOrganisation._ErpPersonRoles = filtered
+            self._ErpOrganisation._ErpPersonRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
             if self not in self._ErpOrganisation._ErpPersonRoles:
-                self._ErpOrganisation._ErpPersonRoles.append(self)
+                self._ErpOrganisation._reflist("_ErpPersonRoles").append(self)
 
     ErpOrganisation = property(getErpOrganisation, setErpOrganisation)
 
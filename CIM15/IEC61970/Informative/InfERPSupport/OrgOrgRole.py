@@ -48,6 +48,7 @@ class OrgOrgRole(Role):
     _enums = {}
     _refs = ["ParentOrganisation", "ChildOrganisation"]
     _many_refs = []
+    _inverses = {"ParentOrganisation": "ChildOrganisationRoles", "ChildOrganisation": "ParentOrganisationRoles"}
 
     def getParentOrganisation(self):
         
@@ -55,13 +56,12 @@ class OrgOrgRole(Role):
 
     def setParentOrganisation(self, value):
         if self._ParentOrganisation is not None:
-            filtered = [x for x in self.ParentOrganisation.ChildOrganisationRoles if x != self]
-            self._ParentOrganisation._ChildOrganisationRoles = filtered
+            self._ParentOrganisation._ChildOrganisationRoles.discard(self)
 
         self._ParentOrganisation = value
         if self._ParentOrganisation is not None:
             if self not in self._ParentOrganisation._ChildOrganisationRoles:
-                self._ParentOrganisation._ChildOrganisationRoles.append(self)
+                self._ParentOrganisation._reflist("_ChildOrganisationRoles").append(self)
 
     ParentOrganisation = property(getParentOrganisation, setParentOrganisation)
 
@@ -71,13 +71,12 @@ class OrgOrgRole(Role):
 
     def setChildOrganisation(self, value):
         if self._ChildOrganisation is not None:
-            filtered = [x for x in self.ChildOrganisation.ParentOrganisationRoles if x != self]
-            self._ChildOrganisation._ParentOrganisationRoles = filtered
+            self._ChildOrganisation._ParentOrganisationRoles.discard(self)
 
         self._ChildOrganisation = value
         if self._ChildOrganisation is not None:
             if self not in self._ChildOrganisation._ParentOrganisationRoles:
-                self._ChildOrganisation._ParentOrganisationRoles.append(self)
+                self._ChildOrganisation._reflist("_ParentOrganisationRoles").append(self)
 
     ChildOrganisation = property(getChildOrganisation, setChildOrganisation)
 
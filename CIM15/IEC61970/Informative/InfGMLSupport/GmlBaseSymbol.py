@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlBaseSymbol(IdentifiedObject):
     """Allows referencing and extension of external symbols, which may be stored in a symbol repository. The graphical properties from a referenced external symbol override the ones read in from the base symbol.Allows referencing and extension of external symbols, which may be stored in a symbol repository. The graphical properties from a referenced external symbol override the ones read in from the base symbol.
@@ -29,8 +30,8 @@ class GmlBaseSymbol(IdentifiedObject):
 
         @param GmlSymbols:
         """
-        self._GmlSymbols = []
-        self.GmlSymbols = [] if GmlSymbols is None else GmlSymbols
+        if GmlSymbols is not None:
+            self.GmlSymbols = GmlSymbols
 
         super(GmlBaseSymbol, self).__init__(*args, **kw_args)
 
@@ -40,13 +41,15 @@ class GmlBaseSymbol(IdentifiedObject):
     _enums = {}
     _refs = ["GmlSymbols"]
     _many_refs = ["GmlSymbols"]
+    _inverses = {"GmlSymbols": "GmlBaseSymbol"}
 
     def getGmlSymbols(self):
         
         return self._GmlSymbols
 
     def setGmlSymbols(self, value):
-        for x in self._GmlSymbols:
+        value = RefList(value)
+        for x in list(self._GmlSymbols):
             x.GmlBaseSymbol = None
         for y in value:
             y._GmlBaseSymbol = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlColour(IdentifiedObject):
     """The solid color that will be used. The color value is RGB-encoded using two hexadecimal digits per primary-color component, in the order Red, Green, Blue, prefixed with a hash (#) sign. The hexadecimal digits between A and F may be in either uppercase or lowercase. For example, full red is encoded as '#ff0000' (with no quotation marks). If the Stroke cssParameter element is absent, the default color is defined to be black ('#000000').The solid color that will be used. The color value is RGB-encoded using two hexadecimal digits per primary-color component, in the order Red, Green, Blue, prefixed with a hash (#) sign. The hexadecimal digits between A and F may be in either uppercase or lowercase. For example, full red is encoded as '#ff0000' (with no quotation marks). If the Stroke cssParameter element is absent, the default color is defined to be black ('#000000').
@@ -43,14 +44,14 @@ class GmlColour(IdentifiedObject):
         #: The color value for BLUE (RGB-encoded using two hexadecimal digits per primary-color component, in the order Red, Green, Blue, prefixed with a hash (#) sign.).
         self.blue = blue
 
-        self._GmlFills = []
-        self.GmlFills = [] if GmlFills is None else GmlFills
+        if GmlFills is not None:
+            self.GmlFills = GmlFills
 
-        self._GmlFonts = []
-        self.GmlFonts = [] if GmlFonts is None else GmlFonts
+        if GmlFonts is not None:
+            self.GmlFonts = GmlFonts
 
-        self._GmlStrokes = []
-        self.GmlStrokes = [] if GmlStrokes is None else GmlStrokes
+        if GmlStrokes is not None:
+            self.GmlStrokes = GmlStrokes
 
         super(GmlColour, self).__init__(*args, **kw_args)
 
@@ -60,13 +61,15 @@ class GmlColour(IdentifiedObject):
     _enums = {}
     _refs = ["GmlFills", "GmlFonts", "GmlStrokes"]
     _many_refs = ["GmlFills", "GmlFonts", "GmlStrokes"]
+    _inverses = {"GmlFills": "GmlColour", "GmlFonts": "GmlColour", "GmlStrokes": "GmlColour"}
 
     def getGmlFills(self):
         
         return self._GmlFills
 
     def setGmlFills(self, value):
-        for x in self._GmlFills:
+        value = RefList(value)
+        for x in list(self._GmlFills):
             x.GmlColour = None
         for y in value:
             y._GmlColour = self
@@ -87,7 +90,8 @@ class GmlColour(IdentifiedObject):
         return self._GmlFonts
 
     def setGmlFonts(self, value):
-        for x in self._GmlFonts:
+        value = RefList(value)
+        for x in list(self._GmlFonts):
             x.GmlColour = None
         for y in value:
             y._GmlColour = self
@@ -108,7 +112,8 @@ class GmlColour(IdentifiedObject):
         return self._GmlStrokes
 
     def setGmlStrokes(self, value):
-        for x in self._GmlStrokes:
+        value = RefList(value)
+        for x in list(self._GmlStrokes):
             x.GmlColour = None
         for y in value:
             y._GmlColour = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlDiagramObject(IdentifiedObject):
     """Any of the magnitudes that serve to define the position of a point by reference to a fixed figure, system of lines, etc.Any of the magnitudes that serve to define the position of a point by reference to a fixed figure, system of lines, etc.
@@ -37,32 +38,32 @@ class GmlDiagramObject(IdentifiedObject):
         @param GmlTextSymbols:
         @param GmlPolygonSymbols:
         """
-        self._GmlSelectors = []
-        self.GmlSelectors = [] if GmlSelectors is None else GmlSelectors
+        if GmlSelectors is not None:
+            self.GmlSelectors = GmlSelectors
 
-        self._Diagrams = []
-        self.Diagrams = [] if Diagrams is None else Diagrams
+        if Diagrams is not None:
+            self.Diagrams = Diagrams
 
-        self._CoordinateSystems = []
-        self.CoordinateSystems = [] if CoordinateSystems is None else CoordinateSystems
+        if CoordinateSystems is not None:
+            self.CoordinateSystems = CoordinateSystems
 
-        self._GmlPointSymbols = []
-        self.GmlPointSymbols = [] if GmlPointSymbols is None else GmlPointSymbols
+        if GmlPointSymbols is not None:
+            self.GmlPointSymbols = GmlPointSymbols
 
-        self._GmlLineSymbols = []
-        self.GmlLineSymbols = [] if GmlLineSymbols is None else GmlLineSymbols
+        if GmlLineSymbols is not None:
+            self.GmlLineSymbols = GmlLineSymbols
 
-        self._GmlRasterSymbols = []
-        self.GmlRasterSymbols = [] if GmlRasterSymbols is None else GmlRasterSymbols
+        if GmlRasterSymbols is not None:
+            self.GmlRasterSymbols = GmlRasterSymbols
 
-        self._GmlObservatins = []
-        self.GmlObservatins = [] if GmlObservatins is None else GmlObservatins
+        if GmlObservatins is not None:
+            self.GmlObservatins = GmlObservatins
 
-        self._GmlTextSymbols = []
-        self.GmlTextSymbols = [] if GmlTextSymbols is None else GmlTextSymbols
+        if GmlTextSymbols is not None:
+            self.GmlTextSymbols = GmlTextSymbols
 
-        self._GmlPolygonSymbols = []
-        self.GmlPolygonSymbols = [] if GmlPolygonSymbols is None else GmlPolygonSymbols
+        if GmlPolygonSymbols is not None:
+            self.GmlPolygonSymbols = GmlPolygonSymbols
 
         super(GmlDiagramObject, self).__init__(*args, **kw_args)
 
@@ -72,6 +73,7 @@ class GmlDiagramObject(IdentifiedObject):
     _enums = {}
     _refs = ["GmlSelectors", "Diagrams", "CoordinateSystems", "GmlPointSymbols", "GmlLineSymbols", "GmlRasterSymbols", "GmlObservatins", "GmlTextSymbols", "GmlPolygonSymbols"]
     _many_refs = ["GmlSelectors", "Diagrams", "CoordinateSystems", "GmlPointSymbols", "GmlLineSymbols", "GmlRasterSymbols", "GmlObservatins", "GmlTextSymbols", "GmlPolygonSymbols"]
+    _inverses = {"GmlSelectors": "GmlDiagramObjects", "Diagrams": "GmlDiagramObjects", "CoordinateSystems": "GmlDiagramObjects", "GmlPointSymbols": "GmlDiagramObject", "GmlLineSymbols": "GmlDiagramObject", "GmlRasterSymbols": "GmlDiagramObject", "GmlObservatins": "GmlDiagramObjects", "GmlTextSymbols": "GmlDiagramObject", "GmlPolygonSymbols": "GmlDiagramObject"}
 
     def getGmlSelectors(self):
         
@@ -79,20 +81,19 @@ class GmlDiagramObject(IdentifiedObject):
 
     def setGmlSelectors(self, value):
         for p in self._GmlSelectors:
-            filtered = [q for q in p.GmlDiagramObjects if q != self]
-            self._GmlSelectors._GmlDiagramObjects = filtered
+            p._GmlDiagramObjects.discard(self)
         for r in value:
             if self not in r._GmlDiagramObjects:
-                r._GmlDiagramObjects.append(self)
-        self._GmlSelectors = value
+                r._reflist("_GmlDiagramObjects").append(self)
+        self._GmlSelectors = RefList(value)
 
     GmlSelectors = property(getGmlSelectors, setGmlSelectors)
 
     def addGmlSelectors(self, *GmlSelectors):
         for obj in GmlSelectors:
             if self not in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.append(self)
-            self._GmlSelectors.append(obj)
+                obj._reflist("_GmlDiagramObjects").append(self)
+            self._reflist("_GmlSelectors").append(obj)
 
     def removeGmlSelectors(self, *GmlSelectors):
         for obj in GmlSelectors:
@@ -106,20 +107,19 @@ class GmlDiagramObject(IdentifiedObject):
 
     def setDiagrams(self, value):
         for p in self._Diagrams:
-            filtered = [q for q in p.GmlDiagramObjects if q != self]
-            self._Diagrams._GmlDiagramObjects = filtered
+            p._GmlDiagramObjects.discard(self)
         for r in value:
             if self not in r._GmlDiagramObjects:
-                r._GmlDiagramObjects.append(self)
-        self._Diagrams = value
+                r._reflist("_GmlDiagramObjects").append(self)
+        self._Diagrams = RefList(value)
 
     Diagrams = property(getDiagrams, setDiagrams)
 
     def addDiagrams(self, *Diagrams):
         for obj in Diagrams:
             if self not in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.append(self)
-            self._Diagrams.append(obj)
+                obj._reflist("_GmlDiagramObjects").append(self)
+            self._reflist("_Diagrams").append(obj)
 
     def removeDiagrams(self, *Diagrams):
         for obj in Diagrams:
@@ -133,20 +133,19 @@ class GmlDiagramObject(IdentifiedObject):
 
     def setCoordinateSystems(self, value):
         for p in self._CoordinateSystems:
-            filtered = [q for q in p.GmlDiagramObjects if q != self]
-            self._CoordinateSystems._GmlDiagramObjects = filtered
+            p._GmlDiagramObjects.discard(self)
         for r in value:
             if self not in r._GmlDiagramObjects:
-                r._GmlDiagramObjects.append(self)
-        self._CoordinateSystems = value
+                r._reflist("_GmlDiagramObjects").append(self)
+        self._CoordinateSystems = RefList(value)
 
     CoordinateSystems = property(getCoordinateSystems, setCoordinateSystems)
 
     def addCoordinateSystems(self, *CoordinateSystems):
         for obj in CoordinateSystems:
             if self not in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.append(self)
-            self._CoordinateSystems.append(obj)
+                obj._reflist("_GmlDiagramObjects").append(self)
+            self._reflist("_CoordinateSystems").append(obj)
 
     def removeCoordinateSystems(self, *CoordinateSystems):
         for obj in CoordinateSystems:
@@ -159,7 +158,8 @@ class GmlDiagramObject(IdentifiedObject):
         return self._GmlPointSymbols
 
     def setGmlPointSymbols(self, value):
-        for x in self._GmlPointSymbols:
+        value = RefList(value)
+        for x in list(self._GmlPointSymbols):
             x.GmlDiagramObject = None
         for y in value:
             y._GmlDiagramObject = self
@@ -180,7 +180,8 @@ class GmlDiagramObject(IdentifiedObject):
         return self._GmlLineSymbols
 
     def setGmlLineSymbols(self, value):
-        for x in self._GmlLineSymbols:
+        value = RefList(value)
+        for x in list(self._GmlLineSymbols):
             x.GmlDiagramObject = None
         for y in value:
             y._GmlDiagramObject = self
@@ -201,7 +202,8 @@ class GmlDiagramObject(IdentifiedObject):
         return self._GmlRasterSymbols
 
     def setGmlRasterSymbols(self, value):
-        for x in self._GmlRasterSymbols:
+        value = RefList(value)
+        for x in list(self._GmlRasterSymbols):
             x.GmlDiagramObject = None
         for y in value:
             y._GmlDiagramObject = self
@@ -223,20 +225,19 @@ class GmlDiagramObject(IdentifiedObject):
 
     def setGmlObservatins(self, value):
         for p in self._GmlObservatins:
-            filtered = [q for q in p.GmlDiagramObjects if q != self]
-            self._GmlObservatins._GmlDiagramObjects = filtered
+            p._GmlDiagramObjects.discard(self)
         for r in value:
             if self not in r._GmlDiagramObjects:
-                r._GmlDiagramObjects.append(self)
-        self._GmlObservatins = value
+                r._reflist("_GmlDiagramObjects").append(self)
+        self._GmlObservatins = RefList(value)
 
     GmlObservatins = property(getGmlObservatins, setGmlObservatins)
 
     def addGmlObservatins(self, *GmlObservatins):
         for obj in GmlObservatins:
             if self not in obj._GmlDiagramObjects:
-                obj._GmlDiagramObjects.append(self)
-            self._GmlObservatins.append(obj)
+                obj._reflist("_GmlDiagramObjects").append(self)
+            self._reflist("_GmlObservatins").append(obj)
 
     def removeGmlObservatins(self, *GmlObservatins):
         for obj in GmlObservatins:
@@ -249,7 +250,8 @@ class GmlDiagramObject(IdentifiedObject):
         return self._GmlTextSymbols
 
     def setGmlTextSymbols(self, value):
-        for x in self._GmlTextSymbols:
+        value = RefList(value)
+        for x in list(self._GmlTextSymbols):
             x.GmlDiagramObject = None
         for y in value:
             y._GmlDiagramObject = self
@@ -270,7 +272,8 @@ class GmlDiagramObject(IdentifiedObject):
         return self._GmlPolygonSymbols
 
     def setGmlPolygonSymbols(self, value):
-        for x in self._GmlPolygonSymbols:
+        value = RefList(value)
+        for x in list(self._GmlPolygonSymbols):
             x.GmlDiagramObject = None
         for y in value:
             y._GmlDiagramObject = self
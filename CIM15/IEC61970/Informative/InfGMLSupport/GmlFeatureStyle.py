@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlFeatureStyle(IdentifiedObject):
     """Used for styling a particular aspect or aspects of a feature, such as geometry, topology or arbitrary text string.Used for styling a particular aspect or aspects of a feature, such as geometry, topology or arbitrary text string.
@@ -61,20 +62,20 @@ class GmlFeatureStyle(IdentifiedObject):
         #: Grammar used in the content of the gml:featureConstraint element. Values are: "other", "xpath", "xquery"
         self.queryGrammar = queryGrammar
 
-        self._GmlGeometryStyles = []
-        self.GmlGeometryStyles = [] if GmlGeometryStyles is None else GmlGeometryStyles
+        if GmlGeometryStyles is not None:
+            self.GmlGeometryStyles = GmlGeometryStyles
 
-        self._GmlSymbols = []
-        self.GmlSymbols = [] if GmlSymbols is None else GmlSymbols
+        if GmlSymbols is not None:
+            self.GmlSymbols = GmlSymbols
 
-        self._GmlTobologyStyles = []
-        self.GmlTobologyStyles = [] if GmlTobologyStyles is None else GmlTobologyStyles
+        if GmlTobologyStyles is not None:
+            self.GmlTobologyStyles = GmlTobologyStyles
 
-        self._GmlLabelStyles = []
-        self.GmlLabelStyles = [] if GmlLabelStyles is None else GmlLabelStyles
+        if GmlLabelStyles is not None:
+            self.GmlLabelStyles = GmlLabelStyles
 
-        self._GmlFeatureTypes = []
-        self.GmlFeatureTypes = [] if GmlFeatureTypes is None else GmlFeatureTypes
+        if GmlFeatureTypes is not None:
+            self.GmlFeatureTypes = GmlFeatureTypes
 
         super(GmlFeatureStyle, self).__init__(*args, **kw_args)
 
@@ -84,13 +85,15 @@ class GmlFeatureStyle(IdentifiedObject):
     _enums = {"queryGrammar": "QueryGrammarKind"}
     _refs = ["GmlGeometryStyles", "GmlSymbols", "GmlTobologyStyles", "GmlLabelStyles", "GmlFeatureTypes"]
     _many_refs = ["GmlGeometryStyles", "GmlSymbols", "GmlTobologyStyles", "GmlLabelStyles", "GmlFeatureTypes"]
+    _inverses = {"GmlGeometryStyles": "GmlFeatureStyle", "GmlSymbols": "GmlFeatureStyles", "GmlTobologyStyles": "GmlFeatureStyle", "GmlLabelStyles": "GmlFeatureStyle", "GmlFeatureTypes": "GmlFeatureStyles"}
 
     def getGmlGeometryStyles(self):
         
         return self._GmlGeometryStyles
 
     def setGmlGeometryStyles(self, value):
-        for x in self._GmlGeometryStyles:
+        value = RefList(value)
+        for x in list(self._GmlGeometryStyles):
             x.GmlFeatureStyle = None
         for y in value:
             y._GmlFeatureStyle = self
@@ -112,20 +115,19 @@ class GmlFeatureStyle(IdentifiedObject):
 
     def setGmlSymbols(self, value):
         for p in self._GmlSymbols:
-            filtered = [q for q in p.GmlFeatureStyles if q != self]
-            self._GmlSymbols._GmlFeatureStyles = filtered
+            p._GmlFeatureStyles.discard(self)
         for r in value:
             if self not in r._GmlFeatureStyles:
-                r._GmlFeatureStyles.append(self)
-        self._GmlSymbols = value
+                r._reflist("_GmlFeatureStyles").append(self)
+        self._GmlSymbols = RefList(value)
 
     GmlSymbols = property(getGmlSymbols, setGmlSymbols)
 
     def addGmlSymbols(self, *GmlSymbols):
         for obj in GmlSymbols:
             if self not in obj._GmlFeatureStyles:
-                obj._GmlFeatureStyles.append(self)
-            self._GmlSymbols.append(obj)
+                obj._reflist("_GmlFeatureStyles").append(self)
+            self._reflist("_GmlSymbols").append(obj)
 
     def removeGmlSymbols(self, *GmlSymbols):
         for obj in GmlSymbols:
@@ -138,7 +140,8 @@ class GmlFeatureStyle(IdentifiedObject):
         return self._GmlTobologyStyles
 
     def setGmlTobologyStyles(self, value):
-        for x in self._GmlTobologyStyles:
+        value = RefList(value)
+        for x in list(self._GmlTobologyStyles):
             x.GmlFeatureStyle = None
         for y in value:
             y._GmlFeatureStyle = self
@@ -159,7 +162,8 @@ class GmlFeatureStyle(IdentifiedObject):
         return self._GmlLabelStyles
 
     def setGmlLabelStyles(self, value):
-        for x in self._GmlLabelStyles:
+        value = RefList(value)
+        for x in list(self._GmlLabelStyles):
             x.GmlFeatureStyle = None
         for y in value:
             y._GmlFeatureStyle = self
@@ -181,20 +185,19 @@ class GmlFeatureStyle(IdentifiedObject):
 
     def setGmlFeatureTypes(self, value):
         for p in self._GmlFeatureTypes:
-            filtered = [q for q in p.GmlFeatureStyles if q != self]
-            self._GmlFeatureTypes._GmlFeatureStyles = filtered
+            p._GmlFeatureStyles.discard(self)
         for r in value:
             if self not in r._GmlFeatureStyles:
-                r._GmlFeatureStyles.append(self)
-        self._GmlFeatureTypes = value
+                r._reflist("_GmlFeatureStyles").append(self)
+        self._GmlFeatureTypes = RefList(value)
 
     GmlFeatureTypes = property(getGmlFeatureTypes, setGmlFeatureTypes)
 
     def addGmlFeatureTypes(self, *GmlFeatureTypes):
         for obj in GmlFeatureTypes:
             if self not in obj._GmlFeatureStyles:
-                obj._GmlFeatureStyles.append(self)
-            self._GmlFeatureTypes.append(obj)
+                obj._reflist("_GmlFeatureStyles").append(self)
+            self._reflist("_GmlFeatureTypes").append(obj)
 
     def removeGmlFeatureTypes(self, *GmlFeatureTypes):
         for obj in GmlFeatureTypes:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlFeatureType(IdentifiedObject):
     """Type classification of feature.Type classification of feature.
@@ -29,8 +30,8 @@ class GmlFeatureType(IdentifiedObject):
 
         @param GmlFeatureStyles:
         """
-        self._GmlFeatureStyles = []
-        self.GmlFeatureStyles = [] if GmlFeatureStyles is None else GmlFeatureStyles
+        if GmlFeatureStyles is not None:
+            self.GmlFeatureStyles = GmlFeatureStyles
 
         super(GmlFeatureType, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class GmlFeatureType(IdentifiedObject):
     _enums = {}
     _refs = ["GmlFeatureStyles"]
     _many_refs = ["GmlFeatureStyles"]
+    _inverses = {"GmlFeatureStyles": "GmlFeatureTypes"}
 
     def getGmlFeatureStyles(self):
         
@@ -47,20 +49,19 @@ class GmlFeatureType(IdentifiedObject):
 
     def setGmlFeatureStyles(self, value):
         for p in self._GmlFeatureStyles:
-            filtered = [q for q in p.GmlFeatureTypes if q != self]
-            self._GmlFeatureStyles._GmlFeatureTypes = filtered
+            p._GmlFeatureTypes.discard(self)
         for r in value:
             if self not in r._GmlFeatureTypes:
-                r._GmlFeatureTypes.append(self)
-        self._GmlFeatureStyles = value
+                r._reflist("_GmlFeatureTypes").append(self)
+        self._GmlFeatureStyles = RefList(value)
 
     GmlFeatureStyles = property(getGmlFeatureStyles, setGmlFeatureStyles)
 
     def addGmlFeatureStyles(self, *GmlFeatureStyles):
         for obj in GmlFeatureStyles:
             if self not in obj._GmlFeatureTypes:
-                obj._GmlFeatureTypes.append(self)
-            self._GmlFeatureStyles.append(obj)
+                obj._reflist("_GmlFeatureTypes").append(self)
+            self._reflist("_GmlFeatureStyles").append(obj)
 
     def removeGmlFeatureStyles(self, *GmlFeatureStyles):
         for obj in GmlFeatureStyles:
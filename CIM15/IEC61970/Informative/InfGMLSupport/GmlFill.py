@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlFill(IdentifiedObject):
     """Specifies how the area of the geometry will be filled.Specifies how the area of the geometry will be filled.
@@ -40,17 +41,17 @@ class GmlFill(IdentifiedObject):
         self._GmlColour = None
         self.GmlColour = GmlColour
 
-        self._GmlMarks = []
-        self.GmlMarks = [] if GmlMarks is None else GmlMarks
+        if GmlMarks is not None:
+            self.GmlMarks = GmlMarks
 
-        self._GmlTextSymbols = []
-        self.GmlTextSymbols = [] if GmlTextSymbols is None else GmlTextSymbols
+        if GmlTextSymbols is not None:
+            self.GmlTextSymbols = GmlTextSymbols
 
-        self._GmlSvgParameters = []
-        self.GmlSvgParameters = [] if GmlSvgParameters is None else GmlSvgParameters
+        if GmlSvgParameters is not None:
+            self.GmlSvgParameters = GmlSvgParameters
 
-        self._GmlPolygonSymbols = []
-        self.GmlPolygonSymbols = [] if GmlPolygonSymbols is None else GmlPolygonSymbols
+        if GmlPolygonSymbols is not None:
+            self.GmlPolygonSymbols = GmlPolygonSymbols
 
         super(GmlFill, self).__init__(*args, **kw_args)
 
@@ -60,6 +61,7 @@ class GmlFill(IdentifiedObject):
     _enums = {}
     _refs = ["GmlColour", "GmlMarks", "GmlTextSymbols", "GmlSvgParameters", "GmlPolygonSymbols"]
     _many_refs = ["GmlMarks", "GmlTextSymbols", "GmlSvgParameters", "GmlPolygonSymbols"]
+    _inverses = {"GmlColour": "GmlFills", "GmlMarks": "GmlFIlls", "GmlTextSymbols": "GmlFill", "GmlSvgParameters": "GmlFills", "GmlPolygonSymbols": "GmlFill"}
 
     def getGmlColour(self):
         
@@ -67,13 +69,12 @@ class GmlFill(IdentifiedObject):
 
     def setGmlColour(self, value):
         if self._GmlColour is not None:
-            filtered = [x for x in self.GmlColour.GmlFills if x != self]
-            self._GmlColour._GmlFills = filtered
+            self._GmlColour._GmlFills.discard(self)
 
         self._GmlColour = value
         if self._GmlColour is not None:
             if self not in self._GmlColour._GmlFills:
-                self._GmlColour._GmlFills.append(self)
+                self._GmlColour._reflist("_GmlFills").append(self)
 
     GmlColour = property(getGmlColour, setGmlColour)
 
@@ -83,20 +84,19 @@ class GmlFill(IdentifiedObject):
 
     def setGmlMarks(self, value):
         for p in self._GmlMarks:
-            filtered = [q for q in p.GmlFIlls if q != self]
-            self._GmlMarks._GmlFIlls = filtered
+            p._GmlFIlls.discard(self)
         for r in value:
             if self not in r._GmlFIlls:
-                r._GmlFIlls.append(self)
-        self._GmlMarks = value
+                r._reflist("_GmlFIlls").append(self)
+        self._GmlMarks = RefList(value)
 
     GmlMarks = property(getGmlMarks, setGmlMarks)
 
     def addGmlMarks(self, *GmlMarks):
         for obj in GmlMarks:
             if self not in obj._GmlFIlls:
-                obj._GmlFIlls.append(self)
-            self._GmlMarks.append(obj)
+                obj._reflist("_GmlFIlls").append(self)
+            self._reflist("_GmlMarks").append(obj)
 
     def removeGmlMarks(self, *GmlMarks):
         for obj in GmlMarks:
@@ -109,7 +109,8 @@ class GmlFill(IdentifiedObject):
         return self._GmlTextSymbols
 
     def setGmlTextSymbols(self, value):
-        for x in self._GmlTextSymbols:
+        value = RefList(value)
+        for x in list(self._GmlTextSymbols):
             x.GmlFill = None
         for y in value:
             y._GmlFill = self
@@ -131,20 +132,19 @@ class GmlFill(IdentifiedObject):
 
     def setGmlSvgParameters(self, value):
         for p in self._GmlSvgParameters:
-            filtered = [q for q in p.GmlFills if q != self]
-            self._GmlSvgParameters._GmlFills = filtered
+            p._GmlFills.discard(self)
         for r in value:
             if self not in r._GmlFills:
-                r._GmlFills.append(self)
-        self._GmlSvgParameters = value
+                r._reflist("_GmlFills").append(self)
+        self._GmlSvgParameters = RefList(value)
 
     GmlSvgParameters = property(getGmlSvgParameters, setGmlSvgParameters)
 
     def addGmlSvgParameters(self, *GmlSvgParameters):
         for obj in GmlSvgParameters:
             if self not in obj._GmlFills:
-                obj._GmlFills.append(self)
-            self._GmlSvgParameters.append(obj)
+                obj._reflist("_GmlFills").append(self)
+            self._reflist("_GmlSvgParameters").append(obj)
 
     def removeGmlSvgParameters(self, *GmlSvgParameters):
         for obj in GmlSvgParameters:
@@ -157,7 +157,8 @@ class GmlFill(IdentifiedObject):
         return self._GmlPolygonSymbols
 
     def setGmlPolygonSymbols(self, value):
-        for x in self._GmlPolygonSymbols:
+        value = RefList(value)
+        for x in list(self._GmlPolygonSymbols):
             x.GmlFill = None
         for y in value:
             y._GmlFill = self
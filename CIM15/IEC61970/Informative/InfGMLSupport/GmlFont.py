@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlFont(IdentifiedObject):
     """Identifies a font of a certain family, style, and size.Identifies a font of a certain family, style, and size.
@@ -51,11 +52,11 @@ class GmlFont(IdentifiedObject):
         #: The amount of weight or boldness to use for a font. Allowed values are 'normal' and 'bold'.
         self.weight = weight
 
-        self._GmlTextSymbols = []
-        self.GmlTextSymbols = [] if GmlTextSymbols is None else GmlTextSymbols
+        if GmlTextSymbols is not None:
+            self.GmlTextSymbols = GmlTextSymbols
 
-        self._GmlSvgParameters = []
-        self.GmlSvgParameters = [] if GmlSvgParameters is None else GmlSvgParameters
+        if GmlSvgParameters is not None:
+            self.GmlSvgParameters = GmlSvgParameters
 
         self._GmlColour = None
         self.GmlColour = GmlColour
@@ -68,13 +69,15 @@ class GmlFont(IdentifiedObject):
     _enums = {}
     _refs = ["GmlTextSymbols", "GmlSvgParameters", "GmlColour"]
     _many_refs = ["GmlTextSymbols", "GmlSvgParameters"]
+    _inverses = {"GmlTextSymbols": "GmlFont", "GmlSvgParameters": "GmlFonts", "GmlColour": "GmlFonts"}
 
     def getGmlTextSymbols(self):
         
         return self._GmlTextSymbols
 
     def setGmlTextSymbols(self, value):
-        for x in self._GmlTextSymbols:
+        value = RefList(value)
+        for x in list(self._GmlTextSymbols):
             x.GmlFont = None
         for y in value:
             y._GmlFont = self
@@ -96,20 +99,19 @@ class GmlFont(IdentifiedObject):
 
     def setGmlSvgParameters(self, value):
         for p in self._GmlSvgParameters:
-            filtered = [q for q in p.GmlFonts if q != self]
-            self._GmlSvgParameters._GmlFonts = filtered
+            p._GmlFonts.discard(self)
         for r in value:
             if self not in r._GmlFonts:
-                r._GmlFonts.append(self)
-        self._GmlSvgParameters = value
+                r._reflist("_GmlFonts").append(self)
+        self._GmlSvgParameters = RefList(value)
 
     GmlSvgParameters = property(getGmlSvgParameters, setGmlSvgParameters)
 
     def addGmlSvgParameters(self, *GmlSvgParameters):
         for obj in GmlSvgParameters:
             if self not in obj._GmlFonts:
-                obj._GmlFonts.append(self)
-            self._GmlSvgParameters.append(obj)
+                obj._reflist("_GmlFonts").append(self)
+            self._reflist("_GmlSvgParameters").append(obj)
 
     def removeGmlSvgParameters(self, *GmlSvgParameters):
         for obj in GmlSvgParameters:
@@ -123,13 +125,12 @@ class GmlFont(IdentifiedObject):
 
     def setGmlColour(self, value):
         if self._GmlColour is not None:
-            filtered = [x for x in self.GmlColour.GmlFonts if x != self]
-            self._GmlColour._GmlFonts = filtered
+            self._GmlColour._GmlFonts.discard(self)
 
         self._GmlColour = value
         if self._GmlColour is not None:
             if self not in self._GmlColour._GmlFonts:
-                self._GmlColour._GmlFonts.append(self)
+                self._GmlColour._reflist("_GmlFonts").append(self)
 
     GmlColour = property(getGmlColour, setGmlColour)
 
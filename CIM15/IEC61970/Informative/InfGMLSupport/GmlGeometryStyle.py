@@ -56,6 +56,7 @@ class GmlGeometryStyle(IdentifiedObject):
     _enums = {}
     _refs = ["GmlFeatureStyle", "GmlLabelStyle"]
     _many_refs = []
+    _inverses = {"GmlFeatureStyle": "GmlGeometryStyles", "GmlLabelStyle": "GmlGeometryStyles"}
 
     def getGmlFeatureStyle(self):
         
@@ -63,13 +64,12 @@ class GmlGeometryStyle(IdentifiedObject):
 
     def setGmlFeatureStyle(self, value):
         if self._GmlFeatureStyle is not None:
-            filtered = [x for x in self.GmlFeatureStyle.GmlGeometryStyles if x != self]
-            self._GmlFeatureStyle._GmlGeometryStyles = filtered
+            self._GmlFeatureStyle._GmlGeometryStyles.discard(self)
 
         self._GmlFeatureStyle = value
         if self._GmlFeatureStyle is not None:
             if self not in self._GmlFeatureStyle._GmlGeometryStyles:
-                self._GmlFeatureStyle._GmlGeometryStyles.append(self)
+                self._GmlFeatureStyle._reflist("_GmlGeometryStyles").append(self)
 
     GmlFeatureStyle = property(getGmlFeatureStyle, setGmlFeatureStyle)
 
@@ -79,13 +79,12 @@ class GmlGeometryStyle(IdentifiedObject):
 
     def setGmlLabelStyle(self, value):
         if self._GmlLabelStyle is not None:
-            filtered = [x for x in self.GmlLabelStyle.GmlGeometryStyles if x != self]
-            self._GmlLabelStyle._GmlGeometryStyles = filtered
+            self._GmlLabelStyle._GmlGeometryStyles.discard(self)
 
         self._GmlLabelStyle = value
         if self._GmlLabelStyle is not None:
             if self not in self._GmlLabelStyle._GmlGeometryStyles:
-                self._GmlLabelStyle._GmlGeometryStyles.append(self)
+                self._GmlLabelStyle._reflist("_GmlGeometryStyles").append(self)
 
     GmlLabelStyle = property(getGmlLabelStyle, setGmlLabelStyle)
 
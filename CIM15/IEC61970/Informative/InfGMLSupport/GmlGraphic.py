@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlGraphic(IdentifiedObject):
     """A 'graphic symbol' with an inherent shape, color(s), and possibly size. A 'graphic' can be very informally defined as 'a little picture' and can be of either a raster or vector-graphic source type.A 'graphic symbol' with an inherent shape, color(s), and possibly size. A 'graphic' can be very informally defined as 'a little picture' and can be of either a raster or vector-graphic source type.
@@ -58,11 +59,11 @@ class GmlGraphic(IdentifiedObject):
         #: Vertical scaling factor of normal symbol - particularly applicable to busbars if not described through a sequence of gmlPositions (e.g., Busbars).
         self.yScale = yScale
 
-        self._GmlMarks = []
-        self.GmlMarks = [] if GmlMarks is None else GmlMarks
+        if GmlMarks is not None:
+            self.GmlMarks = GmlMarks
 
-        self._GmlPointSymbols = []
-        self.GmlPointSymbols = [] if GmlPointSymbols is None else GmlPointSymbols
+        if GmlPointSymbols is not None:
+            self.GmlPointSymbols = GmlPointSymbols
 
         super(GmlGraphic, self).__init__(*args, **kw_args)
 
@@ -72,6 +73,7 @@ class GmlGraphic(IdentifiedObject):
     _enums = {}
     _refs = ["GmlMarks", "GmlPointSymbols"]
     _many_refs = ["GmlMarks", "GmlPointSymbols"]
+    _inverses = {"GmlMarks": "GmlGraphics", "GmlPointSymbols": "GmlGraphic"}
 
     def getGmlMarks(self):
         
@@ -79,20 +81,19 @@ class GmlGraphic(IdentifiedObject):
 
     def setGmlMarks(self, value):
         for p in self._GmlMarks:
-            filtered = [q for q in p.GmlGraphics if q != self]
-            self._GmlMarks._GmlGraphics = filtered
+            p._GmlGraphics.discard(self)
         for r in value:
             if self not in r._GmlGraphics:
-                r._GmlGraphics.append(self)
-        self._GmlMarks = value
+                r._reflist("_GmlGraphics").append(self)
+        self._GmlMarks = RefList(value)
 
     GmlMarks = property(getGmlMarks, setGmlMarks)
 
     def addGmlMarks(self, *GmlMarks):
         for obj in GmlMarks:
             if self not in obj._GmlGraphics:
-                obj._GmlGraphics.append(self)
-            self._GmlMarks.append(obj)
+                obj._reflist("_GmlGraphics").append(self)
+            self._reflist("_GmlMarks").append(obj)
 
     def removeGmlMarks(self, *GmlMarks):
         for obj in GmlMarks:
@@ -105,7 +106,8 @@ class GmlGraphic(IdentifiedObject):
         return self._GmlPointSymbols
 
     def setGmlPointSymbols(self, value):
-        for x in self._GmlPointSymbols:
+        value = RefList(value)
+        for x in list(self._GmlPointSymbols):
             x.GmlGraphic = None
         for y in value:
             y._GmlGraphic = self
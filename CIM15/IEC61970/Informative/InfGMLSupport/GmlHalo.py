@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlHalo(IdentifiedObject):
     """A type of Fill that is applied to the backgrounds of font glyphs. The use of halos greatly improves the readability of text labels.A type of Fill that is applied to the backgrounds of font glyphs. The use of halos greatly improves the readability of text labels.
@@ -37,8 +38,8 @@ class GmlHalo(IdentifiedObject):
         #: Specifies the level of translucency to use when rendering the Fill. The value is encoded as a floating-point value between 0.0 and 1.0 with 0.0 representing completely transparent and 1.0 representing completely opaque, with a linear scale of translucency for intermediate values. The default value is 1.0
         self.opacity = opacity
 
-        self._GmlTextSymbols = []
-        self.GmlTextSymbols = [] if GmlTextSymbols is None else GmlTextSymbols
+        if GmlTextSymbols is not None:
+            self.GmlTextSymbols = GmlTextSymbols
 
         super(GmlHalo, self).__init__(*args, **kw_args)
 
@@ -48,13 +49,15 @@ class GmlHalo(IdentifiedObject):
     _enums = {}
     _refs = ["GmlTextSymbols"]
     _many_refs = ["GmlTextSymbols"]
+    _inverses = {"GmlTextSymbols": "GmlHalo"}
 
     def getGmlTextSymbols(self):
         
         return self._GmlTextSymbols
 
     def setGmlTextSymbols(self, value):
-        for x in self._GmlTextSymbols:
+        value = RefList(value)
+        for x in list(self._GmlTextSymbols):
             x.GmlHalo = None
         for y in value:
             y._GmlHalo = self
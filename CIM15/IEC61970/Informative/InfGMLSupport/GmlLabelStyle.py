@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlLabelStyle(IdentifiedObject):
     """The style for the text that is to be displayed along with the graphical representation of a feature. The content of the label is not necessarily defined in the GML data set. More precisely, the content can be static text specified in the style itself and the text from the GML data set. Label style has two elements: gml:style that specifies the style and gml:label that is used to compose the label content.The style for the text that is to be displayed along with the graphical representation of a feature. The content of the label is not necessarily defined in the GML data set. More precisely, the content can be static text specified in the style itself and the text from the GML data set. Label style has two elements: gml:style that specifies the style and gml:label that is used to compose the label content.
@@ -43,11 +44,11 @@ class GmlLabelStyle(IdentifiedObject):
         #: Used to specify the style of the rendered text. The CSS2 styling expressions grammar should be used to express graphic properties.
         self.style = style
 
-        self._GmlTopologyStyles = []
-        self.GmlTopologyStyles = [] if GmlTopologyStyles is None else GmlTopologyStyles
+        if GmlTopologyStyles is not None:
+            self.GmlTopologyStyles = GmlTopologyStyles
 
-        self._GmlGeometryStyles = []
-        self.GmlGeometryStyles = [] if GmlGeometryStyles is None else GmlGeometryStyles
+        if GmlGeometryStyles is not None:
+            self.GmlGeometryStyles = GmlGeometryStyles
 
         self._GmlFeatureStyle = None
         self.GmlFeatureStyle = GmlFeatureStyle
@@ -60,13 +61,15 @@ class GmlLabelStyle(IdentifiedObject):
     _enums = {}
     _refs = ["GmlTopologyStyles", "GmlGeometryStyles", "GmlFeatureStyle"]
     _many_refs = ["GmlTopologyStyles", "GmlGeometryStyles"]
+    _inverses = {"GmlTopologyStyles": "GmlLableStyle", "GmlGeometryStyles": "GmlLabelStyle", "GmlFeatureStyle": "GmlLabelStyles"}
 
     def getGmlTopologyStyles(self):
         
         return self._GmlTopologyStyles
 
     def setGmlTopologyStyles(self, value):
-        for x in self._GmlTopologyStyles:
+        value = RefList(value)
+        for x in list(self._GmlTopologyStyles):
             x.GmlLableStyle = None
         for y in value:
             y._GmlLableStyle = self
@@ -87,7 +90,8 @@ class GmlLabelStyle(IdentifiedObject):
         return self._GmlGeometryStyles
 
     def setGmlGeometryStyles(self, value):
-        for x in self._GmlGeometryStyles:
+        value = RefList(value)
+        for x in list(self._GmlGeometryStyles):
             x.GmlLabelStyle = None
         for y in value:
             y._GmlLabelStyle = self
@@ -109,13 +113,12 @@ class GmlLabelStyle(IdentifiedObject):
 
     def setGmlFeatureStyle(self, value):
         if self._GmlFeatureStyle is not None:
-            filtered = [x for x in self.GmlFeatureStyle.GmlLabelStyles if x != self]
-            self._GmlFeatureStyle._GmlLabelStyles = filtered
+            self._GmlFeatureStyle._GmlLabelStyles.discard(self)
 
         self._GmlFeatureStyle = value
         if self._GmlFeatureStyle is not None:
             if self not in self._GmlFeatureStyle._GmlLabelStyles:
-                self._GmlFeatureStyle._GmlLabelStyles.append(self)
+                self._GmlFeatureStyle._reflist("_GmlLabelStyles").append(self)
 
     GmlFeatureStyle = property(getGmlFeatureStyle, setGmlFeatureStyle)
 
@@ -40,4 +40,5 @@ class GmlLineGeometry(GmlDiagramObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -48,6 +48,7 @@ class GmlLineSymbol(GmlSymbol):
     _enums = {}
     _refs = ["GmlStroke", "GmlDiagramObject"]
     _many_refs = []
+    _inverses = {"GmlStroke": "GmlLineSymbols", "GmlDiagramObject": "GmlLineSymbols"}
 
     def getGmlStroke(self):
         
@@ -55,13 +56,12 @@ class GmlLineSymbol(GmlSymbol):
 
     def setGmlStroke(self, value):
         if self._GmlStroke is not None:
-            filtered = [x for x in self.GmlStroke.GmlLineSymbols if x != self]
-            self._GmlStroke._GmlLineSymbols = filtered
+            self._GmlStroke._GmlLineSymbols.discard(self)
 
         self._GmlStroke = value
         if self._GmlStroke is not None:
             if self not in self._GmlStroke._GmlLineSymbols:
-                self._GmlStroke._GmlLineSymbols.append(self)
+                self._GmlStroke._reflist("_GmlLineSymbols").append(self)
 
     GmlStroke = property(getGmlStroke, setGmlStroke)
 
@@ -71,13 +71,12 @@ class GmlLineSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlLineSymbols if x != self]
-            self._GmlDiagramObject._GmlLineSymbols = filtered
+            self._GmlDiagramObject._GmlLineSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
             if self not in self._GmlDiagramObject._GmlLineSymbols:
-                self._GmlDiagramObject._GmlLineSymbols.append(self)
+                self._GmlDiagramObject._reflist("_GmlLineSymbols").append(self)
 
     GmlDiagramObject = property(getGmlDiagramObject, setGmlDiagramObject)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlMark(IdentifiedObject):
     """Defines a 'shape' which has coloring applied to it (i.e. square, circle, triangle, star, ...).Defines a 'shape' which has coloring applied to it (i.e. square, circle, triangle, star, ...).
@@ -35,14 +36,14 @@ class GmlMark(IdentifiedObject):
         #: Gives the well-known name of the shape of the mark. Allowed values include at least square, circle, triangle, star, cross, and x.
         self.wellKnownName = wellKnownName
 
-        self._GmlGraphics = []
-        self.GmlGraphics = [] if GmlGraphics is None else GmlGraphics
+        if GmlGraphics is not None:
+            self.GmlGraphics = GmlGraphics
 
-        self._GmlStrokes = []
-        self.GmlStrokes = [] if GmlStrokes is None else GmlStrokes
+        if GmlStrokes is not None:
+            self.GmlStrokes = GmlStrokes
 
-        self._GmlFIlls = []
-        self.GmlFIlls = [] if GmlFIlls is None else GmlFIlls
+        if GmlFIlls is not None:
+            self.GmlFIlls = GmlFIlls
 
         super(GmlMark, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class GmlMark(IdentifiedObject):
     _enums = {}
     _refs = ["GmlGraphics", "GmlStrokes", "GmlFIlls"]
     _many_refs = ["GmlGraphics", "GmlStrokes", "GmlFIlls"]
+    _inverses = {"GmlGraphics": "GmlMarks", "GmlStrokes": "GmlMarks", "GmlFIlls": "GmlMarks"}
 
     def getGmlGraphics(self):
         
@@ -59,20 +61,19 @@ class GmlMark(IdentifiedObject):
 
     def setGmlGraphics(self, value):
         for p in self._GmlGraphics:
-            filtered = [q for q in p.GmlMarks if q != self]
-            self._GmlGraphics._GmlMarks = filtered
+            p._GmlMarks.discard(self)
         for r in value:
             if self not in r._GmlMarks:
-                r._GmlMarks.append(self)
-        self._GmlGraphics = value
+                r._reflist("_GmlMarks").append(self)
+        self._GmlGraphics = RefList(value)
 
     GmlGraphics = property(getGmlGraphics, setGmlGraphics)
 
     def addGmlGraphics(self, *GmlGraphics):
         for obj in GmlGraphics:
             if self not in obj._GmlMarks:
-                obj._GmlMarks.append(self)
-            self._GmlGraphics.append(obj)
+                obj._reflist("_GmlMarks").append(self)
+            self._reflist("_GmlGraphics").append(obj)
 
     def removeGmlGraphics(self, *GmlGraphics):
         for obj in GmlGraphics:
@@ -86,20 +87,19 @@ class GmlMark(IdentifiedObject):
 
     def setGmlStrokes(self, value):
         for p in self._GmlStrokes:
-            filtered = [q for q in p.GmlMarks if q != self]
-            self._GmlStrokes._GmlMarks = filtered
+            p._GmlMarks.discard(self)
         for r in value:
             if self not in r._GmlMarks:
-                r._GmlMarks.append(self)
-        self._GmlStrokes = value
+                r._reflist("_GmlMarks").append(self)
+        self._GmlStrokes = RefList(value)
 
     GmlStrokes = property(getGmlStrokes, setGmlStrokes)
 
     def addGmlStrokes(self, *GmlStrokes):
         for obj in GmlStrokes:
             if self not in obj._GmlMarks:
-                obj._GmlMarks.append(self)
-            self._GmlStrokes.append(obj)
+                obj._reflist("_GmlMarks").append(self)
+            self._reflist("_GmlStrokes").append(obj)
 
     def removeGmlStrokes(self, *GmlStrokes):
         for obj in GmlStrokes:
@@ -113,20 +113,19 @@ class GmlMark(IdentifiedObject):
 
     def setGmlFIlls(self, value):
         for p in self._GmlFIlls:
-            filtered = [q for q in p.GmlMarks if q != self]
-            self._GmlFIlls._GmlMarks = filtered
+            p._GmlMarks.discard(self)
         for r in value:
             if self not in r._GmlMarks:
-                r._GmlMarks.append(self)
-        self._GmlFIlls = value
+                r._reflist("_GmlMarks").append(self)
+        self._GmlFIlls = RefList(value)
 
     GmlFIlls = property(getGmlFIlls, setGmlFIlls)
 
     def addGmlFIlls(self, *GmlFIlls):
         for obj in GmlFIlls:
             if self not in obj._GmlMarks:
-                obj._GmlMarks.append(self)
-            self._GmlFIlls.append(obj)
+                obj._reflist("_GmlMarks").append(self)
+            self._reflist("_GmlFIlls").append(obj)
 
     def removeGmlFIlls(self, *GmlFIlls):
         for obj in GmlFIlls:
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, RefList
 
 class GmlObservation(Element):
     """A GML observation models the act of observing, often with a camera, a person or some form of instrument. An observation feature describes the 'metadata' associated with an information capture event, together with a value for the result of the observation. The basic structures introduced in this class are intended to serve as the foundation for more comprehensive schemas for scientific, technical and engineering measurement schemas.A GML observation models the act of observing, often with a camera, a person or some form of instrument. An observation feature describes the 'metadata' associated with an information capture event, together with a value for the result of the observation. The basic structures introduced in this class are intended to serve as the foundation for more comprehensive schemas for scientific, technical and engineering measurement schemas.
@@ -47,14 +47,14 @@ class GmlObservation(Element):
 
         self.dateTime = dateTime
 
-        self._GmlDiagramObjects = []
-        self.GmlDiagramObjects = [] if GmlDiagramObjects is None else GmlDiagramObjects
+        if GmlDiagramObjects is not None:
+            self.GmlDiagramObjects = GmlDiagramObjects
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._GmlValues = []
-        self.GmlValues = [] if GmlValues is None else GmlValues
+        if GmlValues is not None:
+            self.GmlValues = GmlValues
 
         super(GmlObservation, self).__init__(*args, **kw_args)
 
@@ -64,6 +64,7 @@ class GmlObservation(Element):
     _enums = {}
     _refs = ["GmlDiagramObjects", "ChangeItems", "GmlValues"]
     _many_refs = ["GmlDiagramObjects", "ChangeItems", "GmlValues"]
+    _inverses = {"GmlDiagramObjects": "GmlObservatins", "ChangeItems": "GmlObservation", "GmlValues": "GmlObservation"}
 
     def getGmlDiagramObjects(self):
         
@@ -71,20 +72,19 @@ class GmlObservation(Element):
 
     def setGmlDiagramObjects(self, value):
         for p in self._GmlDiagramObjects:
-            filtered = [q for q in p.GmlObservatins if q != self]
-            self._GmlDiagramObjects._GmlObservatins = filtered
+            p._GmlObservatins.discard(self)
         for r in value:
             if self not in r._GmlObservatins:
-                r._GmlObservatins.append(self)
-        self._GmlDiagramObjects = value
+                r._reflist("_GmlObservatins").append(self)
+        self._GmlDiagramObjects = RefList(value)
 
     GmlDiagramObjects = property(getGmlDiagramObjects, setGmlDiagramObjects)
 
     def addGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
             if self not in obj._GmlObservatins:
-                obj._GmlObservatins.append(self)
-            self._GmlDiagramObjects.append(obj)
+                obj._reflist("_GmlObservatins").append(self)
+            self._reflist("_GmlDiagramObjects").append(obj)
 
     def removeGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
@@ -97,7 +97,8 @@ class GmlObservation(Element):
         return self._ChangeItems
 
     def setChangeItems(self, value):
-        for x in self._ChangeItems:
+        value = RefList(value)
+        for x in list(self._ChangeItems):
             x.GmlObservation = None
         for y in value:
             y._GmlObservation = self
@@ -118,7 +119,8 @@ class GmlObservation(Element):
         return self._GmlValues
 
     def setGmlValues(self, value):
-        for x in self._GmlValues:
+        value = RefList(value)
+        for x in list(self._GmlValues):
             x.GmlObservation = None
         for y in value:
             y._GmlObservation = self
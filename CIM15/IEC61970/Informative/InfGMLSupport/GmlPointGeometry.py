@@ -36,4 +36,5 @@ class GmlPointGeometry(GmlDiagramObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -44,6 +44,7 @@ class GmlPointSymbol(GmlSymbol):
     _enums = {}
     _refs = ["GmlGraphic", "GmlDiagramObject"]
     _many_refs = []
+    _inverses = {"GmlGraphic": "GmlPointSymbols", "GmlDiagramObject": "GmlPointSymbols"}
 
     def getGmlGraphic(self):
         
@@ -51,13 +52,12 @@ class GmlPointSymbol(GmlSymbol):
 
     def setGmlGraphic(self, value):
         if self._GmlGraphic is not None:
-            filtered = [x for x in self.GmlGraphic.GmlPointSymbols if x != self]
-            self._GmlGraphic._GmlPointSymbols = filtered
+            self._GmlGraphic._GmlPointSymbols.discard(self)
 
         self._GmlGraphic = value
         if self._GmlGraphic is not None:
             if self not in self._GmlGraphic._GmlPointSymbols:
-                self._GmlGraphic._GmlPointSymbols.append(self)
+                self._GmlGraphic._reflist("_GmlPointSymbols").append(self)
 
     GmlGraphic = property(getGmlGraphic, setGmlGraphic)
 
@@ -67,13 +67,12 @@ class GmlPointSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlPointSymbols if x != self]
-            self._GmlDiagramObject._GmlPointSymbols = filtered
+            self._GmlDiagramObject._GmlPointSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
             if self not in self._GmlDiagramObject._GmlPointSymbols:
-                self._GmlDiagramObject._GmlPointSymbols.append(self)
+                self._GmlDiagramObject._reflist("_GmlPointSymbols").append(self)
 
     GmlDiagramObject = property(getGmlDiagramObject, setGmlDiagramObject)
 
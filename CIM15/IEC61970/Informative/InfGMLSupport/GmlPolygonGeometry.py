@@ -36,4 +36,5 @@ class GmlPolygonGeometry(GmlDiagramObject):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
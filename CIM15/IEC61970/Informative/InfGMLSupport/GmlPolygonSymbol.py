@@ -48,6 +48,7 @@ class GmlPolygonSymbol(GmlSymbol):
     _enums = {}
     _refs = ["GmlDiagramObject", "GmlFill", "GmlStroke"]
     _many_refs = []
+    _inverses = {"GmlDiagramObject": "GmlPolygonSymbols", "GmlFill": "GmlPolygonSymbols", "GmlStroke": "GmlPolygonSymbols"}
 
     def getGmlDiagramObject(self):
         
@@ -55,13 +56,12 @@ class GmlPolygonSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlPolygonSymbols if x != self]
-            self._GmlDiagramObject._GmlPolygonSymbols = filtered
+            self._GmlDiagramObject._GmlPolygonSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
             if self not in self._GmlDiagramObject._GmlPolygonSymbols:
-                self._GmlDiagramObject._GmlPolygonSymbols.append(self)
+                self._GmlDiagramObject._reflist("_GmlPolygonSymbols").append(self)
 
     GmlDiagramObject = property(getGmlDiagramObject, setGmlDiagramObject)
 
@@ -71,13 +71,12 @@ class GmlPolygonSymbol(GmlSymbol):
 
     def setGmlFill(self, value):
         if self._GmlFill is not None:
-            filtered = [x for x in self.GmlFill.GmlPolygonSymbols if x != self]
-            self._GmlFill._GmlPolygonSymbols = filtered
+            self._GmlFill._GmlPolygonSymbols.discard(self)
 
         self._GmlFill = value
         if self._GmlFill is not None:
             if self not in self._GmlFill._GmlPolygonSymbols:
-                self._GmlFill._GmlPolygonSymbols.append(self)
+                self._GmlFill._reflist("_GmlPolygonSymbols").append(self)
 
     GmlFill = property(getGmlFill, setGmlFill)
 
@@ -87,13 +86,12 @@ class GmlPolygonSymbol(GmlSymbol):
 
     def setGmlStroke(self, value):
         if self._GmlStroke is not None:
-            filtered = [x for x in self.GmlStroke.GmlPolygonSymbols if x != self]
-            self._GmlStroke._GmlPolygonSymbols = filtered
+            self._GmlStroke._GmlPolygonSymbols.discard(self)
 
         self._GmlStroke = value
         if self._GmlStroke is not None:
             if self not in self._GmlStroke._GmlPolygonSymbols:
-                self._GmlStroke._GmlPolygonSymbols.append(self)
+                self._GmlStroke._reflist("_GmlPolygonSymbols").append(self)
 
     GmlStroke = property(getGmlStroke, setGmlStroke)
 
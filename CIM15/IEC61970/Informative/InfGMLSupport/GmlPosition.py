@@ -36,4 +36,5 @@ class GmlPosition(PositionPoint):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
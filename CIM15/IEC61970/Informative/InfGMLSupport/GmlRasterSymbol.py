@@ -72,6 +72,7 @@ class GmlRasterSymbol(GmlSymbol):
     _enums = {}
     _refs = ["GmlDiagramObject"]
     _many_refs = []
+    _inverses = {"GmlDiagramObject": "GmlRasterSymbols"}
 
     def getGmlDiagramObject(self):
         
@@ -79,13 +80,12 @@ class GmlRasterSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlRasterSymbols if x != self]
-            self._GmlDiagramObject._GmlRasterSymbols = filtered
+            self._GmlDiagramObject._GmlRasterSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
             if self not in self._GmlDiagramObject._GmlRasterSymbols:
-                self._GmlDiagramObject._GmlRasterSymbols.append(self)
+                self._GmlDiagramObject._reflist("_GmlRasterSymbols").append(self)
 
     GmlDiagramObject = property(getGmlDiagramObject, setGmlDiagramObject)
 
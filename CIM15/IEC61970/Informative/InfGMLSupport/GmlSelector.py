@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlSelector(IdentifiedObject):
     """A diagram element that allows selection by a user, i.e. as 'hyperNode' for navigating between diagrams, or as composite object representing multiple grouped objects.A diagram element that allows selection by a user, i.e. as 'hyperNode' for navigating between diagrams, or as composite object representing multiple grouped objects.
@@ -30,11 +31,11 @@ class GmlSelector(IdentifiedObject):
         @param ChangeItems:
         @param GmlDiagramObjects:
         """
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._GmlDiagramObjects = []
-        self.GmlDiagramObjects = [] if GmlDiagramObjects is None else GmlDiagramObjects
+        if GmlDiagramObjects is not None:
+            self.GmlDiagramObjects = GmlDiagramObjects
 
         super(GmlSelector, self).__init__(*args, **kw_args)
 
@@ -44,13 +45,15 @@ class GmlSelector(IdentifiedObject):
     _enums = {}
     _refs = ["ChangeItems", "GmlDiagramObjects"]
     _many_refs = ["ChangeItems", "GmlDiagramObjects"]
+    _inverses = {"ChangeItems": "GmlSelector", "GmlDiagramObjects": "GmlSelectors"}
 
     def getChangeItems(self):
         
         return self._ChangeItems
 
     def setChangeItems(self, value):
-        for x in self._ChangeItems:
+        value = RefList(value)
+        for x in list(self._ChangeItems):
             x.GmlSelector = None
         for y in value:
             y._GmlSelector = self
@@ -72,20 +75,19 @@ class GmlSelector(IdentifiedObject):
 
     def setGmlDiagramObjects(self, value):
         for p in self._GmlDiagramObjects:
-            filtered = [q for q in p.GmlSelectors if q != self]
-            self._GmlDiagramObjects._GmlSelectors = filtered
+            p._GmlSelectors.discard(self)
         for r in value:
             if self not in r._GmlSelectors:
-                r._GmlSelectors.append(self)
-        self._GmlDiagramObjects = value
+                r._reflist("_GmlSelectors").append(self)
+        self._GmlDiagramObjects = RefList(value)
 
     GmlDiagramObjects = property(getGmlDiagramObjects, setGmlDiagramObjects)
 
     def addGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
             if self not in obj._GmlSelectors:
-                obj._GmlSelectors.append(self)
-            self._GmlDiagramObjects.append(obj)
+                obj._reflist("_GmlSelectors").append(self)
+            self._reflist("_GmlDiagramObjects").append(obj)
 
     def removeGmlDiagramObjects(self, *GmlDiagramObjects):
         for obj in GmlDiagramObjects:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlStroke(IdentifiedObject):
     """The element encapsulating the graphical symbolization parameters for linear geometries.The element encapsulating the graphical symbolization parameters for linear geometries.
@@ -64,17 +65,17 @@ class GmlStroke(IdentifiedObject):
         self._GmlColour = None
         self.GmlColour = GmlColour
 
-        self._GmlPolygonSymbols = []
-        self.GmlPolygonSymbols = [] if GmlPolygonSymbols is None else GmlPolygonSymbols
+        if GmlPolygonSymbols is not None:
+            self.GmlPolygonSymbols = GmlPolygonSymbols
 
-        self._GmlMarks = []
-        self.GmlMarks = [] if GmlMarks is None else GmlMarks
+        if GmlMarks is not None:
+            self.GmlMarks = GmlMarks
 
-        self._GmlSvgParameters = []
-        self.GmlSvgParameters = [] if GmlSvgParameters is None else GmlSvgParameters
+        if GmlSvgParameters is not None:
+            self.GmlSvgParameters = GmlSvgParameters
 
-        self._GmlLineSymbols = []
-        self.GmlLineSymbols = [] if GmlLineSymbols is None else GmlLineSymbols
+        if GmlLineSymbols is not None:
+            self.GmlLineSymbols = GmlLineSymbols
 
         super(GmlStroke, self).__init__(*args, **kw_args)
 
@@ -84,6 +85,7 @@ class GmlStroke(IdentifiedObject):
     _enums = {}
     _refs = ["GmlColour", "GmlPolygonSymbols", "GmlMarks", "GmlSvgParameters", "GmlLineSymbols"]
     _many_refs = ["GmlPolygonSymbols", "GmlMarks", "GmlSvgParameters", "GmlLineSymbols"]
+    _inverses = {"GmlColour": "GmlStrokes", "GmlPolygonSymbols": "GmlStroke", "GmlMarks": "GmlStrokes", "GmlSvgParameters": "GmlStokes", "GmlLineSymbols": "GmlStroke"}
 
     def getGmlColour(self):
         
@@ -91,13 +93,12 @@ class GmlStroke(IdentifiedObject):
 
     def setGmlColour(self, value):
         if self._GmlColour is not None:
-            filtered = [x for x in self.GmlColour.GmlStrokes if x != self]
-            self._GmlColour._GmlStrokes = filtered
+            self._GmlColour._GmlStrokes.discard(self)
 
         self._GmlColour = value
         if self._GmlColour is not None:
             if self not in self._GmlColour._GmlStrokes:
-                self._GmlColour._GmlStrokes.append(self)
+                self._GmlColour._reflist("_GmlStrokes").append(self)
 
     GmlColour = property(getGmlColour, setGmlColour)
 
@@ -106,7 +107,8 @@ class GmlStroke(IdentifiedObject):
         return self._GmlPolygonSymbols
 
     def setGmlPolygonSymbols(self, value):
-        for x in self._GmlPolygonSymbols:
+        value = RefList(value)
+        for x in list(self._GmlPolygonSymbols):
             x.GmlStroke = None
         for y in value:
             y._GmlStroke = self
@@ -128,20 +130,19 @@ class GmlStroke(IdentifiedObject):
 
     def setGmlMarks(self, value):
         for p in self._GmlMarks:
-            filtered = [q for q in p.GmlStrokes if q != self]
-            self._GmlMarks._GmlStrokes = filtered
+            p._GmlStrokes.discard(self)
         for r in value:
             if self not in r._GmlStrokes:
-                r._GmlStrokes.append(self)
-        self._GmlMarks = value
+                r._reflist("_GmlStrokes").append(self)
+        self._GmlMarks = RefList(value)
 
     GmlMarks = property(getGmlMarks, setGmlMarks)
 
     def addGmlMarks(self, *GmlMarks):
         for obj in GmlMarks:
             if self not in obj._GmlStrokes:
-                obj._GmlStrokes.append(self)
-            self._GmlMarks.append(obj)
+                obj._reflist("_GmlStrokes").append(self)
+            self._reflist("_GmlMarks").append(obj)
 
     def removeGmlMarks(self, *GmlMarks):
         for obj in GmlMarks:
@@ -155,20 +156,19 @@ class GmlStroke(IdentifiedObject):
 
     def setGmlSvgParameters(self, value):
         for p in self._GmlSvgParameters:
-            filtered = [q for q in p.GmlStokes if q != self]
-            self._GmlSvgParameters._GmlStokes = filtered
+            p._GmlStokes.discard(self)
         for r in value:
             if self not in r._GmlStokes:
-                r._GmlStokes.append(self)
-        self._GmlSvgParameters = value
+                r._reflist("_GmlStokes").append(self)
+        self._GmlSvgParameters = RefList(value)
 
     GmlSvgParameters = property(getGmlSvgParameters, setGmlSvgParameters)
 
     def addGmlSvgParameters(self, *GmlSvgParameters):
         for obj in GmlSvgParameters:
             if self not in obj._GmlStokes:
-                obj._GmlStokes.append(self)
-            self._GmlSvgParameters.append(obj)
+                obj._reflist("_GmlStokes").append(self)
+            self._reflist("_GmlSvgParameters").append(obj)
 
     def removeGmlSvgParameters(self, *GmlSvgParameters):
         for obj in GmlSvgParameters:
@@ -181,7 +181,8 @@ class GmlStroke(IdentifiedObject):
         return self._GmlLineSymbols
 
     def setGmlLineSymbols(self, value):
-        for x in self._GmlLineSymbols:
+        value = RefList(value)
+        for x in list(self._GmlLineSymbols):
             x.GmlStroke = None
         for y in value:
             y._GmlStroke = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlSvgParameter(IdentifiedObject):
     """Refers to an SVG/CSS graphical-formatting parameter. The parameter is identified using the 'name' attribute and the content of the element gives the SVG/CSS-coded value.Refers to an SVG/CSS graphical-formatting parameter. The parameter is identified using the 'name' attribute and the content of the element gives the SVG/CSS-coded value.
@@ -39,14 +40,14 @@ class GmlSvgParameter(IdentifiedObject):
         #: The SVG/CSS-coded value of the associated SvgAttribute.
         self.value = value
 
-        self._GmlStokes = []
-        self.GmlStokes = [] if GmlStokes is None else GmlStokes
+        if GmlStokes is not None:
+            self.GmlStokes = GmlStokes
 
-        self._GmlFonts = []
-        self.GmlFonts = [] if GmlFonts is None else GmlFonts
+        if GmlFonts is not None:
+            self.GmlFonts = GmlFonts
 
-        self._GmlFills = []
-        self.GmlFills = [] if GmlFills is None else GmlFills
+        if GmlFills is not None:
+            self.GmlFills = GmlFills
 
         super(GmlSvgParameter, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class GmlSvgParameter(IdentifiedObject):
     _enums = {}
     _refs = ["GmlStokes", "GmlFonts", "GmlFills"]
     _many_refs = ["GmlStokes", "GmlFonts", "GmlFills"]
+    _inverses = {"GmlStokes": "GmlSvgParameters", "GmlFonts": "GmlSvgParameters", "GmlFills": "GmlSvgParameters"}
 
     def getGmlStokes(self):
         
@@ -63,20 +65,19 @@ class GmlSvgParameter(IdentifiedObject):
 
     def setGmlStokes(self, value):
         for p in self._GmlStokes:
-            filtered = [q for q in p.GmlSvgParameters if q != self]
-            self._GmlStokes._GmlSvgParameters = filtered
+            p._GmlSvgParameters.discard(self)
         for r in value:
             if self not in r._GmlSvgParameters:
-                r._GmlSvgParameters.append(self)
-        self._GmlStokes = value
+                r._reflist("_GmlSvgParameters").append(self)
+        self._GmlStokes = RefList(value)
 
     GmlStokes = property(getGmlStokes, setGmlStokes)
 
     def addGmlStokes(self, *GmlStokes):
         for obj in GmlStokes:
             if self not in obj._GmlSvgParameters:
-                obj._GmlSvgParameters.append(self)
-            self._GmlStokes.append(obj)
+                obj._reflist("_GmlSvgParameters").append(self)
+            self._reflist("_GmlStokes").append(obj)
 
     def removeGmlStokes(self, *GmlStokes):
         for obj in GmlStokes:
@@ -90,20 +91,19 @@ class GmlSvgParameter(IdentifiedObject):
 
     def setGmlFonts(self, value):
         for p in self._GmlFonts:
-            filtered = [q for q in p.GmlSvgParameters if q != self]
-            self._GmlFonts._GmlSvgParameters = filtered
+            p._GmlSvgParameters.discard(self)
         for r in value:
             if self not in r._GmlSvgParameters:
-                r._GmlSvgParameters.append(self)
-        self._GmlFonts = value
+                r._reflist("_GmlSvgParameters").append(self)
+        self._GmlFonts = RefList(value)
 
     GmlFonts = property(getGmlFonts, setGmlFonts)
 
     def addGmlFonts(self, *GmlFonts):
         for obj in GmlFonts:
             if self not in obj._GmlSvgParameters:
-                obj._GmlSvgParameters.append(self)
-            self._GmlFonts.append(obj)
+                obj._reflist("_GmlSvgParameters").append(self)
+            self._reflist("_GmlFonts").append(obj)
 
     def removeGmlFonts(self, *GmlFonts):
         for obj in GmlFonts:
@@ -117,20 +117,19 @@ class GmlSvgParameter(IdentifiedObject):
 
     def setGmlFills(self, value):
         for p in self._GmlFills:
-            filtered = [q for q in p.GmlSvgParameters if q != self]
-            self._GmlFills._GmlSvgParameters = filtered
+            p._GmlSvgParameters.discard(self)
         for r in value:
             if self not in r._GmlSvgParameters:
-                r._GmlSvgParameters.append(self)
-        self._GmlFills = value
+                r._reflist("_GmlSvgParameters").append(self)
+        self._GmlFills = RefList(value)
 
     GmlFills = property(getGmlFills, setGmlFills)
 
     def addGmlFills(self, *GmlFills):
         for obj in GmlFills:
             if self not in obj._GmlSvgParameters:
-                obj._GmlSvgParameters.append(self)
-            self._GmlFills.append(obj)
+                obj._reflist("_GmlSvgParameters").append(self)
+            self._reflist("_GmlFills").append(obj)
 
     def removeGmlFills(self, *GmlFills):
         for obj in GmlFills:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class GmlSymbol(IdentifiedObject):
     """Describes how a feature is to appear on a map or display. The symbol describes not just the shape that should appear but also such graphical properties as color and opacity.Describes how a feature is to appear on a map or display. The symbol describes not just the shape that should appear but also such graphical properties as color and opacity.
@@ -42,8 +43,8 @@ class GmlSymbol(IdentifiedObject):
         #: The Symbol type.
         self.type = type
 
-        self._GmlFeatureStyles = []
-        self.GmlFeatureStyles = [] if GmlFeatureStyles is None else GmlFeatureStyles
+        if GmlFeatureStyles is not None:
+            self.GmlFeatureStyles = GmlFeatureStyles
 
         self._GmlBaseSymbol = None
         self.GmlBaseSymbol = GmlBaseSymbol
@@ -56,6 +57,7 @@ class GmlSymbol(IdentifiedObject):
     _enums = {}
     _refs = ["GmlFeatureStyles", "GmlBaseSymbol"]
     _many_refs = ["GmlFeatureStyles"]
+    _inverses = {"GmlFeatureStyles": "GmlSymbols", "GmlBaseSymbol": "GmlSymbols"}
 
     def getGmlFeatureStyles(self):
         
@@ -63,20 +65,19 @@ class GmlSymbol(IdentifiedObject):
 
     def setGmlFeatureStyles(self, value):
         for p in self._GmlFeatureStyles:
-            filtered = [q for q in p.GmlSymbols if q != self]
-            self._GmlFeatureStyles._GmlSymbols = filtered
+            p._GmlSymbols.discard(self)
         for r in value:
             if self not in r._GmlSymbols:
-                r._GmlSymbols.append(self)
-        self._GmlFeatureStyles = value
+                r._reflist("_GmlSymbols").append(self)
+        self._GmlFeatureStyles = RefList(value)
 
     GmlFeatureStyles = property(getGmlFeatureStyles, setGmlFeatureStyles)
 
     def addGmlFeatureStyles(self, *GmlFeatureStyles):
         for obj in GmlFeatureStyles:
             if self not in obj._GmlSymbols:
-                obj._GmlSymbols.append(self)
-            self._GmlFeatureStyles.append(obj)
+                obj._reflist("_GmlSymbols").append(self)
+            self._reflist("_GmlFeatureStyles").append(obj)
 
     def removeGmlFeatureStyles(self, *GmlFeatureStyles):
         for obj in GmlFeatureStyles:
@@ -90,13 +91,12 @@ class GmlSymbol(IdentifiedObject):
 
     def setGmlBaseSymbol(self, value):
         if self._GmlBaseSymbol is not None:
-            filtered = [x for x in self.GmlBaseSymbol.GmlSymbols if x != self]
-            self._GmlBaseSymbol._GmlSymbols = filtered
+            self._GmlBaseSymbol._GmlSymbols.discard(self)
 
         self._GmlBaseSymbol = value
         if self._GmlBaseSymbol is not None:
             if self not in self._GmlBaseSymbol._GmlSymbols:
-                self._GmlBaseSymbol._GmlSymbols.append(self)
+                self._GmlBaseSymbol._reflist("_GmlSymbols").append(self)
 
     GmlBaseSymbol = property(getGmlBaseSymbol, setGmlBaseSymbol)
 
@@ -76,6 +76,7 @@ class GmlTextSymbol(GmlSymbol):
     _enums = {}
     _refs = ["GmlFill", "GmlLabelPlacement", "GmlHalo", "GmlFont", "GmlDiagramObject"]
     _many_refs = []
+    _inverses = {"GmlFill": "GmlTextSymbols", "GmlLabelPlacement": "GmlTextSymbols", "GmlHalo": "GmlTextSymbols", "GmlFont": "GmlTextSymbols", "GmlDiagramObject": "GmlTextSymbols"}
 
     def getGmlFill(self):
         
@@ -83,13 +84,12 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlFill(self, value):
         if self._GmlFill is not None:
-            filtered = [x for x in self.GmlFill.GmlTextSymbols if x != self]
-            self._GmlFill._GmlTextSymbols = filtered
+            self._GmlFill._GmlTextSymbols.discard(self)
 
         self._GmlFill = value
         if self._GmlFill is not None:
             if self not in self._GmlFill._GmlTextSymbols:
-                self._GmlFill._GmlTextSymbols.append(self)
+                self._GmlFill._reflist("_GmlTextSymbols").append(self)
 
     GmlFill = property(getGmlFill, setGmlFill)
 
@@ -99,13 +99,12 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlLabelPlacement(self, value):
         if self._GmlLabelPlacement is not None:
-            filtered = [x for x in self.GmlLabelPlacement.GmlTextSymbols if x != self]
-            self._GmlLabelPlacement._GmlTextSymbols = filtered
+            self._GmlLabelPlacement._GmlTextSymbols.discard(self)
 
         self._GmlLabelPlacement = value
         if self._GmlLabelPlacement is not None:
             if self not in self._GmlLabelPlacement._GmlTextSymbols:
-                self._GmlLabelPlacement._GmlTextSymbols.append(self)
+                self._GmlLabelPlacement._reflist("_GmlTextSymbols").append(self)
 
     GmlLabelPlacement = property(getGmlLabelPlacement, setGmlLabelPlacement)
 
@@ -115,13 +114,12 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlHalo(self, value):
         if self._GmlHalo is not None:
-            filtered = [x for x in self.GmlHalo.GmlTextSymbols if x != self]
-            self._GmlHalo._GmlTextSymbols = filtered
+            self._GmlHalo._GmlTextSymbols.discard(self)
 
         self._GmlHalo = value
         if self._GmlHalo is not None:
             if self not in self._GmlHalo._GmlTextSymbols:
-                self._GmlHalo._GmlTextSymbols.append(self)
+                self._GmlHalo._reflist("_GmlTextSymbols").append(self)
 
     GmlHalo = property(getGmlHalo, setGmlHalo)
 
@@ -131,13 +129,12 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlFont(self, value):
         if self._GmlFont is not None:
-            filtered = [x for x in self.GmlFont.GmlTextSymbols if x != self]
-            self._GmlFont._GmlTextSymbols = filtered
+            self._GmlFont._GmlTextSymbols.discard(self)
 
         self._GmlFont = value
         if self._GmlFont is not None:
             if self not in self._GmlFont._GmlTextSymbols:
-                self._GmlFont._GmlTextSymbols.append(self)
+                self._GmlFont._reflist("_GmlTextSymbols").append(self)
 
     GmlFont = property(getGmlFont, setGmlFont)
 
@@ -147,13 +144,12 @@ class GmlTextSymbol(GmlSymbol):
 
     def setGmlDiagramObject(self, value):
         if self._GmlDiagramObject is not None:
-            filtered = [x for x in self.GmlDiagramObject.GmlTextSymbols if x != self]
-            self._GmlDiagramObject._GmlTextSymbols = filtered
+            self._GmlDiagramObject._GmlTextSymbols.discard(self)
 
         self._GmlDiagramObject = value
         if self._GmlDiagramObject is not None:
             if self not in self._GmlDiagramObject._GmlTextSymbols:
-                self._GmlDiagramObject._GmlTextSymbols.append(self)
+                self._GmlDiagramObject._reflist("_GmlTextSymbols").append(self)
 
     GmlDiagramObject = property(getGmlDiagramObject, setGmlDiagramObject)
 
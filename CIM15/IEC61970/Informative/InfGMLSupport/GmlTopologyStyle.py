@@ -44,6 +44,7 @@ class GmlTopologyStyle(IdentifiedObject):
     _enums = {}
     _refs = ["GmlLableStyle", "GmlFeatureStyle"]
     _many_refs = []
+    _inverses = {"GmlLableStyle": "GmlTopologyStyles", "GmlFeatureStyle": "GmlTobologyStyles"}
 
     def getGmlLableStyle(self):
         
@@ -51,13 +52,12 @@ class GmlTopologyStyle(IdentifiedObject):
 
     def setGmlLableStyle(self, value):
         if self._GmlLableStyle is not None:
-            filtered = [x for x in self.GmlLableStyle.GmlTopologyStyles if x != self]
-            self._GmlLableStyle._GmlTopologyStyles = filtered
+            self._GmlLableStyle._GmlTopologyStyles.discard(self)
 
         self._GmlLableStyle = value
         if self._GmlLableStyle is not None:
             if self not in self._GmlLableStyle._GmlTopologyStyles:
-                self._GmlLableStyle._GmlTopologyStyles.append(self)
+                self._GmlLableStyle._reflist("_GmlTopologyStyles").append(self)
 
     GmlLableStyle = property(getGmlLableStyle, setGmlLableStyle)
 
@@ -67,13 +67,12 @@ class GmlTopologyStyle(IdentifiedObject):
 
     def setGmlFeatureStyle(self, value):
         if self._GmlFeatureStyle is not None:
-            filtered = [x for x in self.GmlFeatureStyle.GmlTobologyStyles if x != self]
-            self._GmlFeatureStyle._GmlTobologyStyles = filtered
+            self._GmlFeatureStyle._GmlTobologyStyles.discard(self)
 
         self._GmlFeatureStyle = value
         if self._GmlFeatureStyle is not None:
             if self not in self._GmlFeatureStyle._GmlTobologyStyles:
-                self._GmlFeatureStyle._GmlTobologyStyles.append(self)
+                self._GmlFeatureStyle._reflist("_GmlTobologyStyles").append(self)
 
     GmlFeatureStyle = property(getGmlFeatureStyle, setGmlFeatureStyle)
 
@@ -56,6 +56,7 @@ class GmlValue(IdentifiedObject):
     _enums = {}
     _refs = ["GmlObservation", "MeasurementValue"]
     _many_refs = []
+    _inverses = {"GmlObservation": "GmlValues", "MeasurementValue": "GmlValues"}
 
     def getGmlObservation(self):
         
@@ -63,13 +64,12 @@ class GmlValue(IdentifiedObject):
 
     def setGmlObservation(self, value):
         if self._GmlObservation is not None:
-            filtered = [x for x in self.GmlObservation.GmlValues if x != self]
-            self._GmlObservation._GmlValues = filtered
+            self._GmlObservation._GmlValues.discard(self)
 
         self._GmlObservation = value
         if self._GmlObservation is not None:
             if self not in self._GmlObservation._GmlValues:
-                self._GmlObservation._GmlValues.append(self)
+                self._GmlObservation._reflist("_GmlValues").append(self)
 
     GmlObservation = property(getGmlObservation, setGmlObservation)
 
@@ -79,13 +79,12 @@ class GmlValue(IdentifiedObject):
 
     def setMeasurementValue(self, value):
         if self._MeasurementValue is not None:
-            filtered = [x for x in self.MeasurementValue.GmlValues if x != self]
-            self._MeasurementValue._GmlValues = filtered
+            self._MeasurementValue._GmlValues.discard(self)
 
         self._MeasurementValue = value
         if self._MeasurementValue is not None:
             if self not in self._MeasurementValue._GmlValues:
-                self._MeasurementValue._GmlValues.append(self)
+                self._MeasurementValue._reflist("_GmlValues").append(self)
 
     MeasurementValue = property(getMeasurementValue, setMeasurementValue)
 
@@ -44,4 +44,5 @@ class Map(Diagram):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -52,4 +52,5 @@ class LoadLimitFunction(LoadMgmtFunction):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
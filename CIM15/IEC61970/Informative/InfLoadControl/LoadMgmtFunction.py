@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Metering.EndDeviceFunction import EndDeviceFunction
+from CIM15.Element import RefList
 
 class LoadMgmtFunction(EndDeviceFunction):
     """A collective function at an end device that manages the customer load.A collective function at an end device that manages the customer load.
@@ -54,11 +55,11 @@ class LoadMgmtFunction(EndDeviceFunction):
         #: After a command had been received to activate the mannualOverRide state or remoteOverRideState, the normal (halted) schedule will resume after this specified time duration had elapsed.
         self.overRideTimeOut = overRideTimeOut
 
-        self._Switches = []
-        self.Switches = [] if Switches is None else Switches
+        if Switches is not None:
+            self.Switches = Switches
 
-        self._LoadMgmtRecords = []
-        self.LoadMgmtRecords = [] if LoadMgmtRecords is None else LoadMgmtRecords
+        if LoadMgmtRecords is not None:
+            self.LoadMgmtRecords = LoadMgmtRecords
 
         super(LoadMgmtFunction, self).__init__(*args, **kw_args)
 
@@ -68,6 +69,7 @@ class LoadMgmtFunction(EndDeviceFunction):
     _enums = {"schedulingBasis": "LoadMgmtKind", "loadStatus": "LoadStateKind"}
     _refs = ["Switches", "LoadMgmtRecords"]
     _many_refs = ["Switches", "LoadMgmtRecords"]
+    _inverses = {"Switches": "LoadMgmtFunctions", "LoadMgmtRecords": "LoadMgmtFunction"}
 
     def getSwitches(self):
         
@@ -75,20 +77,19 @@ class LoadMgmtFunction(EndDeviceFunction):
 
     def setSwitches(self, value):
         for p in self._Switches:
-            filtered = [q for q in p.LoadMgmtFunctions if q != self]
-            self._Switches._LoadMgmtFunctions = filtered
+            p._LoadMgmtFunctions.discard(self)
         for r in value:
             if self not in r._LoadMgmtFunctions:
-                r._LoadMgmtFunctions.append(self)
-        self._Switches = value
+                r._reflist("_LoadMgmtFunctions").append(self)
+        self._Switches = RefList(value)
 
     Switches = property(getSwitches, setSwitches)
 
     def addSwitches(self, *Switches):
         for obj in Switches:
             if self not in obj._LoadMgmtFunctions:
-                obj._LoadMgmtFunctions.append(self)
-            self._Switches.append(obj)
+                obj._reflist("_LoadMgmtFunctions").append(self)
+            self._reflist("_Switches").append(obj)
 
     def removeSwitches(self, *Switches):
         for obj in Switches:
@@ -101,7 +102,8 @@ class LoadMgmtFunction(EndDeviceFunction):
         return self._LoadMgmtRecords
 
     def setLoadMgmtRecords(self, value):
-        for x in self._LoadMgmtRecords:
+        value = RefList(value)
+        for x in list(self._LoadMgmtRecords):
             x.LoadMgmtFunction = None
         for y in value:
             y._LoadMgmtFunction = self
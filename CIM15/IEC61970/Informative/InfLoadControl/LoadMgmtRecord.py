@@ -44,6 +44,7 @@ class LoadMgmtRecord(ActivityRecord):
     _enums = {}
     _refs = ["LoadMgmtFunction"]
     _many_refs = []
+    _inverses = {"LoadMgmtFunction": "LoadMgmtRecords"}
 
     def getLoadMgmtFunction(self):
         
@@ -51,13 +52,12 @@ class LoadMgmtRecord(ActivityRecord):
 
     def setLoadMgmtFunction(self, value):
         if self._LoadMgmtFunction is not None:
-            filtered = [x for x in self.LoadMgmtFunction.LoadMgmtRecords if x != self]
-            self._LoadMgmtFunction._LoadMgmtRecords = filtered
+            self._LoadMgmtFunction._LoadMgmtRecords.discard(self)
 
         self._LoadMgmtFunction = value
         if self._LoadMgmtFunction is not None:
             if self not in self._LoadMgmtFunction._LoadMgmtRecords:
-                self._LoadMgmtFunction._LoadMgmtRecords.append(self)
+                self._LoadMgmtFunction._reflist("_LoadMgmtRecords").append(self)
 
     LoadMgmtFunction = property(getLoadMgmtFunction, setLoadMgmtFunction)
 
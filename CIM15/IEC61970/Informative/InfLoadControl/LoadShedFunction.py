@@ -40,4 +40,5 @@ class LoadShedFunction(LoadMgmtFunction):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
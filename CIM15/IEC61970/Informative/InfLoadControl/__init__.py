@@ -19,10 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM15.IEC61970.Informative.InfLoadControl.LoadMgmtRecord import LoadMgmtRecord
-from CIM15.IEC61970.Informative.InfLoadControl.LoadShedFunction import LoadShedFunction
-from CIM15.IEC61970.Informative.InfLoadControl.LoadMgmtFunction import LoadMgmtFunction
-from CIM15.IEC61970.Informative.InfLoadControl.LoadLimitFunction import LoadLimitFunction
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#InfLoadControl"
 nsPrefix = "cimInfLoadControl"
@@ -37,3 +35,11 @@ class LoadStateKind(str):
     """Values are: limitedLoad, noLoad, fullLoad
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "LoadMgmtRecord",
+    "LoadShedFunction",
+    "LoadMgmtFunction",
+    "LoadLimitFunction",
+])
@@ -44,6 +44,7 @@ class Direction(Element):
     _enums = {}
     _refs = ["Location"]
     _many_refs = []
+    _inverses = {"Location": "Directions"}
 
     def getLocation(self):
         
@@ -51,13 +52,12 @@ class Direction(Element):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.Directions if x != self]
-            self._Location._Directions = filtered
+            self._Location._Directions.discard(self)
 
         self._Location = value
         if self._Location is not None:
             if self not in self._Location._Directions:
-                self._Location._Directions.append(self)
+                self._Location._reflist("_Directions").append(self)
 
     Location = property(getLocation, setLocation)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Hazard(IdentifiedObject):
     """A hazard is any object or condition that is a danger for causing loss or perils to an asset and/or people. Examples of hazards are trees growing under overhead power lines, a park being located by a substation (i.e., children climb fence to recover a ball), a lake near an overhead distribution line (fishing pole/line contacting power lines), etc.A hazard is any object or condition that is a danger for causing loss or perils to an asset and/or people. Examples of hazards are trees growing under overhead power lines, a park being located by a substation (i.e., children climb fence to recover a ball), a lake near an overhead distribution line (fishing pole/line contacting power lines), etc.
@@ -34,8 +35,8 @@ class Hazard(IdentifiedObject):
         #: Category by utility's corporate standards and practices.
         self.category = category
 
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        if Locations is not None:
+            self.Locations = Locations
 
         self.status = status
 
@@ -47,6 +48,7 @@ class Hazard(IdentifiedObject):
     _enums = {}
     _refs = ["Locations", "status"]
     _many_refs = ["Locations"]
+    _inverses = {"Locations": "Hazards"}
 
     def getLocations(self):
         """The point or polygon location of a given hazard.
@@ -55,20 +57,19 @@ class Hazard(IdentifiedObject):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.Hazards if q != self]
-            self._Locations._Hazards = filtered
+            p._Hazards.discard(self)
         for r in value:
             if self not in r._Hazards:
-                r._Hazards.append(self)
-        self._Locations = value
+                r._reflist("_Hazards").append(self)
+        self._Locations = RefList(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
         for obj in Locations:
             if self not in obj._Hazards:
-                obj._Hazards.append(self)
-            self._Locations.append(obj)
+                obj._reflist("_Hazards").append(self)
+            self._reflist("_Locations").append(obj)
 
     def removeLocations(self, *Locations):
         for obj in Locations:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class LandProperty(IdentifiedObject):
     """Information about a particular piece of (land) property such as its use. Ownership of the property may be determined through associations to Organisations and/or ErpPersons.Information about a particular piece of (land) property such as its use. Ownership of the property may be determined through associations to Organisations and/or ErpPersons.
@@ -50,26 +51,26 @@ class LandProperty(IdentifiedObject):
 
         self.status = status
 
-        self._LocationGrants = []
-        self.LocationGrants = [] if LocationGrants is None else LocationGrants
+        if LocationGrants is not None:
+            self.LocationGrants = LocationGrants
 
-        self._ErpSiteLevelDatas = []
-        self.ErpSiteLevelDatas = [] if ErpSiteLevelDatas is None else ErpSiteLevelDatas
+        if ErpSiteLevelDatas is not None:
+            self.ErpSiteLevelDatas = ErpSiteLevelDatas
 
-        self._ErpPersonRoles = []
-        self.ErpPersonRoles = [] if ErpPersonRoles is None else ErpPersonRoles
+        if ErpPersonRoles is not None:
+            self.ErpPersonRoles = ErpPersonRoles
 
-        self._ErpOrganisationRoles = []
-        self.ErpOrganisationRoles = [] if ErpOrganisationRoles is None else ErpOrganisationRoles
+        if ErpOrganisationRoles is not None:
+            self.ErpOrganisationRoles = ErpOrganisationRoles
 
-        self._AssetContainers = []
-        self.AssetContainers = [] if AssetContainers is None else AssetContainers
+        if AssetContainers is not None:
+            self.AssetContainers = AssetContainers
 
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        if Locations is not None:
+            self.Locations = Locations
 
-        self._RightOfWays = []
-        self.RightOfWays = [] if RightOfWays is None else RightOfWays
+        if RightOfWays is not None:
+            self.RightOfWays = RightOfWays
 
         super(LandProperty, self).__init__(*args, **kw_args)
 
@@ -79,6 +80,7 @@ class LandProperty(IdentifiedObject):
     _enums = {"kind": "LandPropertyKind", "demographicKind": "DemographicKind"}
     _refs = ["status", "LocationGrants", "ErpSiteLevelDatas", "ErpPersonRoles", "ErpOrganisationRoles", "AssetContainers", "Locations", "RightOfWays"]
     _many_refs = ["LocationGrants", "ErpSiteLevelDatas", "ErpPersonRoles", "ErpOrganisationRoles", "AssetContainers", "Locations", "RightOfWays"]
+    _inverses = {"LocationGrants": "LandProperty", "ErpSiteLevelDatas": "LandProperty", "ErpPersonRoles": "LandProperty", "ErpOrganisationRoles": "LandProperty", "AssetContainers": "LandProperties", "Locations": "LandProperties", "RightOfWays": "LandProperties"}
 
     status = None
 
@@ -88,7 +90,8 @@ class LandProperty(IdentifiedObject):
         return self._LocationGrants
 
     def setLocationGrants(self, value):
-        for x in self._LocationGrants:
+        value = RefList(value)
+        for x in list(self._LocationGrants):
             x.LandProperty = None
         for y in value:
             y._LandProperty = self
@@ -109,7 +112,8 @@ class LandProperty(IdentifiedObject):
         return self._ErpSiteLevelDatas
 
     def setErpSiteLevelDatas(self, value):
-        for x in self._ErpSiteLevelDatas:
+        value = RefList(value)
+        for x in list(self._ErpSiteLevelDatas):
             x.LandProperty = None
         for y in value:
             y._LandProperty = self
@@ -130,7 +134,8 @@ class LandProperty(IdentifiedObject):
         return self._ErpPersonRoles
 
     def setErpPersonRoles(self, value):
-        for x in self._ErpPersonRoles:
+        value = RefList(value)
+        for x in list(self._ErpPersonRoles):
             x.LandProperty = None
         for y in value:
             y._LandProperty = self
@@ -152,20 +157,19 @@ class LandProperty(IdentifiedObject):
 
     def setErpOrganisationRoles(self, value):
         for p in self._ErpOrganisationRoles:
-            filtered = [q for q in p.LandProperty if q != self]
-            self._ErpOrganisationRoles._LandProperty = filtered
+            p._LandProperty.discard(self)
         for r in value:
             if self not in r._LandProperty:
-                r._LandProperty.append(self)
-        self._ErpOrganisationRoles = value
+                r._reflist("_LandProperty").append(self)
+        self._ErpOrganisationRoles = RefList(value)
 
     ErpOrganisationRoles = property(getErpOrganisationRoles, setErpOrganisationRoles)
 
     def addErpOrganisationRoles(self, *ErpOrganisationRoles):
         for obj in ErpOrganisationRoles:
             if self not in obj._LandProperty:
-                obj._LandProperty.append(self)
-            self._ErpOrganisationRoles.append(obj)
+                obj._reflist("_LandProperty").append(self)
+            self._reflist("_ErpOrganisationRoles").append(obj)
 
     def removeErpOrganisationRoles(self, *ErpOrganisationRoles):
         for obj in ErpOrganisationRoles:
@@ -179,20 +183,19 @@ class LandProperty(IdentifiedObject):
 
     def setAssetContainers(self, value):
         for p in self._AssetContainers:
-            filtered = [q for q in p.LandProperties if q != self]
-            self._AssetContainers._LandProperties = filtered
+            p._LandProperties.discard(self)
         for r in value:
             if self not in r._LandProperties:
-                r._LandProperties.append(self)
-        self._AssetContainers = value
+                r._reflist("_LandProperties").append(self)
+        self._AssetContainers = RefList(value)
 
     AssetContainers = property(getAssetContainers, setAssetContainers)
 
     def addAssetContainers(self, *AssetContainers):
         for obj in AssetContainers:
             if self not in obj._LandProperties:
-                obj._LandProperties.append(self)
-            self._AssetContainers.append(obj)
+                obj._reflist("_LandProperties").append(self)
+            self._reflist("_AssetContainers").append(obj)
 
     def removeAssetContainers(self, *AssetContainers):
         for obj in AssetContainers:
@@ -207,20 +210,19 @@ class LandProperty(IdentifiedObject):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.LandProperties if q != self]
-            self._Locations._LandProperties = filtered
+            p._LandProperties.discard(self)
         for r in value:
             if self not in r._LandProperties:
-                r._LandProperties.append(self)
-        self._Locations = value
+                r._reflist("_LandProperties").append(self)
+        self._Locations = RefList(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
         for obj in Locations:
             if self not in obj._LandProperties:
-                obj._LandProperties.append(self)
-            self._Locations.append(obj)
+                obj._reflist("_LandProperties").append(self)
+            self._reflist("_Locations").append(obj)
 
     def removeLocations(self, *Locations):
         for obj in Locations:
@@ -235,20 +237,19 @@ class LandProperty(IdentifiedObject):
 
     def setRightOfWays(self, value):
         for p in self._RightOfWays:
-            filtered = [q for q in p.LandProperties if q != self]
-            self._RightOfWays._LandProperties = filtered
+            p._LandProperties.discard(self)
         for r in value:
             if self not in r._LandProperties:
-                r._LandProperties.append(self)
-        self._RightOfWays = value
+                r._reflist("_LandProperties").append(self)
+        self._RightOfWays = RefList(value)
 
     RightOfWays = property(getRightOfWays, setRightOfWays)
 
     def addRightOfWays(self, *RightOfWays):
         for obj in RightOfWays:
             if self not in obj._LandProperties:
-                obj._LandProperties.append(self)
-            self._RightOfWays.append(obj)
+                obj._reflist("_LandProperties").append(self)
+            self._reflist("_RightOfWays").append(obj)
 
     def removeRightOfWays(self, *RightOfWays):
         for obj in RightOfWays:
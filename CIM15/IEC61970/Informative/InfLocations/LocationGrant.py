@@ -44,6 +44,7 @@ class LocationGrant(Agreement):
     _enums = {}
     _refs = ["LandProperty"]
     _many_refs = []
+    _inverses = {"LandProperty": "LocationGrants"}
 
     def getLandProperty(self):
         """Land property this location grant applies to.
@@ -52,13 +53,12 @@ class LocationGrant(Agreement):
 
     def setLandProperty(self, value):
         if self._LandProperty is not None:
-            filtered = [x for x in self.LandProperty.LocationGrants if x != self]
-            self._LandProperty._LocationGrants = filtered
+            self._LandProperty._LocationGrants.discard(self)
 
         self._LandProperty = value
         if self._LandProperty is not None:
             if self not in self._LandProperty._LocationGrants:
-                self._LandProperty._LocationGrants.append(self)
+                self._LandProperty._reflist("_LocationGrants").append(self)
 
     LandProperty = property(getLandProperty, setLandProperty)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.Role import Role
+from CIM15.Element import RefList
 
 class OrgPropertyRole(Role):
     """Roles played between Organisations and a given piece of property. For example, the Organisation may be the owner, renter, occupier, taxiing authority, etc.Roles played between Organisations and a given piece of property. For example, the Organisation may be the owner, renter, occupier, taxiing authority, etc.
@@ -30,8 +31,8 @@ class OrgPropertyRole(Role):
         @param LandProperty:
         @param ErpOrganisation:
         """
-        self._LandProperty = []
-        self.LandProperty = [] if LandProperty is None else LandProperty
+        if LandProperty is not None:
+            self.LandProperty = LandProperty
 
         self._ErpOrganisation = None
         self.ErpOrganisation = ErpOrganisation
@@ -44,6 +45,7 @@ class OrgPropertyRole(Role):
     _enums = {}
     _refs = ["LandProperty", "ErpOrganisation"]
     _many_refs = ["LandProperty"]
+    _inverses = {"LandProperty": "ErpOrganisationRoles", "ErpOrganisation": "LandPropertyRoles"}
 
     def getLandProperty(self):
         
@@ -51,20 +53,19 @@ class OrgPropertyRole(Role):
 
     def setLandProperty(self, value):
         for p in self._LandProperty:
-            filtered = [q for q in p.ErpOrganisationRoles if q != self]
-            self._LandProperty._ErpOrganisationRoles = filtered
+            p._ErpOrganisationRoles.discard(self)
         for r in value:
             if self not in r._ErpOrganisationRoles:
-                r._ErpOrganisationRoles.append(self)
-        self._LandProperty = value
+                r._reflist("_ErpOrganisationRoles").append(self)
+        self._LandProperty = RefList(value)
 
     LandProperty = property(getLandProperty, setLandProperty)
 
     def addLandProperty(self, *LandProperty):
         for obj in LandProperty:
             if self not in obj._ErpOrganisationRoles:
-                obj._ErpOrganisationRoles.append(self)
-            self._LandProperty.append(obj)
+                obj._reflist("_ErpOrganisationRoles").append(self)
+            self._reflist("_LandProperty").append(obj)
 
     def removeLandProperty(self, *LandProperty):
         for obj in LandProperty:
@@ -78,13 +79,12 @@ class OrgPropertyRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.LandPropertyRoles if x != self]
-            self._ErpOrganisation._LandPropertyRoles = filtered
+            self._ErpOrganisation._LandPropertyRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
             if self not in self._ErpOrganisation._LandPropertyRoles:
-                self._ErpOrganisation._LandPropertyRoles.append(self)
+                self._ErpOrganisation._reflist("_LandPropertyRoles").append(self)
 
     ErpOrganisation = property(getErpOrganisation, setErpOrganisation)
 
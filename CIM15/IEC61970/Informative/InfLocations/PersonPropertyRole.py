@@ -44,6 +44,7 @@ class PersonPropertyRole(Role):
     _enums = {}
     _refs = ["ErpPerson", "LandProperty"]
     _many_refs = []
+    _inverses = {"ErpPerson": "LandPropertyRoles", "LandProperty": "ErpPersonRoles"}
 
     def getErpPerson(self):
         
@@ -51,13 +52,12 @@ class PersonPropertyRole(Role):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.LandPropertyRoles if x != self]
-            self._ErpPerson._LandPropertyRoles = filtered
+            self._ErpPerson._LandPropertyRoles.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
             if self not in self._ErpPerson._LandPropertyRoles:
-                self._ErpPerson._LandPropertyRoles.append(self)
+                self._ErpPerson._reflist("_LandPropertyRoles").append(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
@@ -67,13 +67,12 @@ class PersonPropertyRole(Role):
 
     def setLandProperty(self, value):
         if self._LandProperty is not None:
-            filtered = [x for x in self.LandProperty.ErpPersonRoles if x != self]
-            self._LandProperty._ErpPersonRoles = filtered
+            self._LandProperty._ErpPersonRoles.discard(self)
 
         self._LandProperty = value
         if self._LandProperty is not None:
             if self not in self._LandProperty._ErpPersonRoles:
-                self._LandProperty._ErpPersonRoles.append(self)
+                self._LandProperty._reflist("_ErpPersonRoles").append(self)
 
     LandProperty = property(getLandProperty, setLandProperty)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class RedLine(IdentifiedObject):
     """This class is used for handling the accompanying annotations, time stamp, author, etc. of designs, drawings and maps. A red line can be associated with any Location object.This class is used for handling the accompanying annotations, time stamp, author, etc. of designs, drawings and maps. A red line can be associated with any Location object.
@@ -30,8 +31,8 @@ class RedLine(IdentifiedObject):
         @param Locations:
         @param status:
         """
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        if Locations is not None:
+            self.Locations = Locations
 
         self.status = status
 
@@ -43,6 +44,7 @@ class RedLine(IdentifiedObject):
     _enums = {}
     _refs = ["Locations", "status"]
     _many_refs = ["Locations"]
+    _inverses = {"Locations": "RedLines"}
 
     def getLocations(self):
         
@@ -50,20 +52,19 @@ class RedLine(IdentifiedObject):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.RedLines if q != self]
-            self._Locations._RedLines = filtered
+            p._RedLines.discard(self)
         for r in value:
             if self not in r._RedLines:
-                r._RedLines.append(self)
-        self._Locations = value
+                r._reflist("_RedLines").append(self)
+        self._Locations = RefList(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
         for obj in Locations:
             if self not in obj._RedLines:
-                obj._RedLines.append(self)
-            self._Locations.append(obj)
+                obj._reflist("_RedLines").append(self)
+            self._reflist("_Locations").append(obj)
 
     def removeLocations(self, *Locations):
         for obj in Locations:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Agreement import Agreement
+from CIM15.Element import RefList
 
 class RightOfWay(Agreement):
     """A right-of-way (ROW) is for land where it is lawful to use for a public road, an electric power line, etc. Note that the association to Location, Asset, Organisation, etc. for the Grant is inherited from Agreement, a type of Document.A right-of-way (ROW) is for land where it is lawful to use for a public road, an electric power line, etc. Note that the association to Location, Asset, Organisation, etc. for the Grant is inherited from Agreement, a type of Document.
@@ -33,8 +34,8 @@ class RightOfWay(Agreement):
         #: Property related information that describes the ROW's land parcel. For example, it may be a deed book number, deed book page number, and parcel number.
         self.propertyData = propertyData
 
-        self._LandProperties = []
-        self.LandProperties = [] if LandProperties is None else LandProperties
+        if LandProperties is not None:
+            self.LandProperties = LandProperties
 
         super(RightOfWay, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class RightOfWay(Agreement):
     _enums = {}
     _refs = ["LandProperties"]
     _many_refs = ["LandProperties"]
+    _inverses = {"LandProperties": "RightOfWays"}
 
     def getLandProperties(self):
         """All land properties this right of way applies to.
@@ -52,20 +54,19 @@ class RightOfWay(Agreement):
 
     def setLandProperties(self, value):
         for p in self._LandProperties:
-            filtered = [q for q in p.RightOfWays if q != self]
-            self._LandProperties._RightOfWays = filtered
+            p._RightOfWays.discard(self)
         for r in value:
             if self not in r._RightOfWays:
-                r._RightOfWays.append(self)
-        self._LandProperties = value
+                r._reflist("_RightOfWays").append(self)
+        self._LandProperties = RefList(value)
 
     LandProperties = property(getLandProperties, setLandProperties)
 
     def addLandProperties(self, *LandProperties):
         for obj in LandProperties:
             if self not in obj._RightOfWays:
-                obj._RightOfWays.append(self)
-            self._LandProperties.append(obj)
+                obj._reflist("_RightOfWays").append(self)
+            self._reflist("_LandProperties").append(obj)
 
     def removeLandProperties(self, *LandProperties):
         for obj in LandProperties:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Route(IdentifiedObject):
     """Route that is followed, for example by service crews.Route that is followed, for example by service crews.
@@ -35,13 +36,13 @@ class Route(IdentifiedObject):
         #: Category by utility's work management standards and practices.
         self.category = category
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        if Crews is not None:
+            self.Crews = Crews
 
         self.status = status
 
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        if Locations is not None:
+            self.Locations = Locations
 
         super(Route, self).__init__(*args, **kw_args)
 
@@ -51,13 +52,15 @@ class Route(IdentifiedObject):
     _enums = {}
     _refs = ["Crews", "status", "Locations"]
     _many_refs = ["Crews", "Locations"]
+    _inverses = {"Crews": "Route", "Locations": "Routes"}
 
     def getCrews(self):
         
         return self._Crews
 
     def setCrews(self, value):
-        for x in self._Crews:
+        value = RefList(value)
+        for x in list(self._Crews):
             x.Route = None
         for y in value:
             y._Route = self
@@ -81,20 +84,19 @@ class Route(IdentifiedObject):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.Routes if q != self]
-            self._Locations._Routes = filtered
+            p._Routes.discard(self)
         for r in value:
             if self not in r._Routes:
-                r._Routes.append(self)
-        self._Locations = value
+                r._reflist("_Routes").append(self)
+        self._Locations = RefList(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
         for obj in Locations:
             if self not in obj._Routes:
-                obj._Routes.append(self)
-            self._Locations.append(obj)
+                obj._reflist("_Routes").append(self)
+            self._reflist("_Locations").append(obj)
 
     def removeLocations(self, *Locations):
         for obj in Locations:
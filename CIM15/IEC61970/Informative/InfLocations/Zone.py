@@ -40,4 +40,5 @@ class Zone(Location):
     _enums = {"kind": "ZoneKind"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,16 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM15.IEC61970.Informative.InfLocations.LocationGrant import LocationGrant
-from CIM15.IEC61970.Informative.InfLocations.RightOfWay import RightOfWay
-from CIM15.IEC61970.Informative.InfLocations.PersonPropertyRole import PersonPropertyRole
-from CIM15.IEC61970.Informative.InfLocations.Zone import Zone
-from CIM15.IEC61970.Informative.InfLocations.RedLine import RedLine
-from CIM15.IEC61970.Informative.InfLocations.Route import Route
-from CIM15.IEC61970.Informative.InfLocations.OrgPropertyRole import OrgPropertyRole
-from CIM15.IEC61970.Informative.InfLocations.Direction import Direction
-from CIM15.IEC61970.Informative.InfLocations.LandProperty import LandProperty
-from CIM15.IEC61970.Informative.InfLocations.Hazard import Hazard
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#InfLocations"
 nsPrefix = "cimInfLocations"
@@ -48,3 +40,17 @@ class ZoneKind(str):
     """Values are: weatherZone, other, specialRestrictionLand, electricalNetwork
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "LocationGrant",
+    "RightOfWay",
+    "PersonPropertyRole",
+    "Zone",
+    "RedLine",
+    "Route",
+    "OrgPropertyRole",
+    "Direction",
+    "LandProperty",
+    "Hazard",
+])
@@ -36,4 +36,5 @@ class GasMeteringFunction(EndDeviceFunction):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,9 +19,14 @@
 # IN THE SOFTWARE.
 
 
-from CIM15.IEC61970.Informative.InfMetering.GasMeteringFunction import GasMeteringFunction
-from CIM15.IEC61970.Informative.InfMetering.WaterMeteringFunction import WaterMeteringFunction
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#InfMetering"
 nsPrefix = "cimInfMetering"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "GasMeteringFunction",
+    "WaterMeteringFunction",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class CallBack(IdentifiedObject):
     """Information about a planned CallBack or a CallBack that has occurred, from the utility to a customer regarding the status and plans about resolving trouble, performing work, etc.Information about a planned CallBack or a CallBack that has occurred, from the utility to a customer regarding the status and plans about resolving trouble, performing work, etc.
@@ -52,14 +53,14 @@ class CallBack(IdentifiedObject):
         #: Descriptiion of the problem reported during this call back.
         self.problemInfo = problemInfo
 
-        self._Appointments = []
-        self.Appointments = [] if Appointments is None else Appointments
+        if Appointments is not None:
+            self.Appointments = Appointments
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
-        self._TroubleTickets = []
-        self.TroubleTickets = [] if TroubleTickets is None else TroubleTickets
+        if TroubleTickets is not None:
+            self.TroubleTickets = TroubleTickets
 
         self.status = status
 
@@ -71,13 +72,15 @@ class CallBack(IdentifiedObject):
     _enums = {}
     _refs = ["Appointments", "ErpPersons", "TroubleTickets", "status"]
     _many_refs = ["Appointments", "ErpPersons", "TroubleTickets"]
+    _inverses = {"Appointments": "CallBack", "ErpPersons": "CallBacks", "TroubleTickets": "CallBacks"}
 
     def getAppointments(self):
         
         return self._Appointments
 
     def setAppointments(self, value):
-        for x in self._Appointments:
+        value = RefList(value)
+        for x in list(self._Appointments):
             x.CallBack = None
         for y in value:
             y._CallBack = self
@@ -99,20 +102,19 @@ class CallBack(IdentifiedObject):
 
     def setErpPersons(self, value):
         for p in self._ErpPersons:
-            filtered = [q for q in p.CallBacks if q != self]
-            self._ErpPersons._CallBacks = filtered
+            p._CallBacks.discard(self)
         for r in value:
             if self not in r._CallBacks:
-                r._CallBacks.append(self)
-        self._ErpPersons = value
+                r._reflist("_CallBacks").append(self)
+        self._ErpPersons = RefList(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
             if self not in obj._CallBacks:
-                obj._CallBacks.append(self)
-            self._ErpPersons.append(obj)
+                obj._reflist("_CallBacks").append(self)
+            self._reflist("_ErpPersons").append(obj)
 
     def removeErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
@@ -126,20 +128,19 @@ class CallBack(IdentifiedObject):
 
     def setTroubleTickets(self, value):
         for p in self._TroubleTickets:
-            filtered = [q for q in p.CallBacks if q != self]
-            self._TroubleTickets._CallBacks = filtered
+            p._CallBacks.discard(self)
         for r in value:
             if self not in r._CallBacks:
-                r._CallBacks.append(self)
-        self._TroubleTickets = value
+                r._reflist("_CallBacks").append(self)
+        self._TroubleTickets = RefList(value)
 
     TroubleTickets = property(getTroubleTickets, setTroubleTickets)
 
     def addTroubleTickets(self, *TroubleTickets):
         for obj in TroubleTickets:
             if self not in obj._CallBacks:
-                obj._CallBacks.append(self)
-            self._TroubleTickets.append(obj)
+                obj._reflist("_CallBacks").append(self)
+            self._reflist("_TroubleTickets").append(obj)
 
     def removeTroubleTickets(self, *TroubleTickets):
         for obj in TroubleTickets:
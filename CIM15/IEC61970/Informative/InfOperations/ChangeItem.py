@@ -87,6 +87,7 @@ class ChangeItem(IdentifiedObject):
     _enums = {"kind": "ChangeItemKind"}
     _refs = ["GmlSelector", "Organisation", "Document", "Asset", "status", "GmlObservation", "ErpPerson", "PowerSystemResource", "ChangeSet", "Location", "NetworkDataSet"]
     _many_refs = []
+    _inverses = {"GmlSelector": "ChangeItems", "Organisation": "ChangeItems", "Document": "ChangeItems", "Asset": "ChangeItems", "GmlObservation": "ChangeItems", "ErpPerson": "ChangeItems", "PowerSystemResource": "ChangeItems", "ChangeSet": "ChangeItems", "Location": "ChangeItems", "NetworkDataSet": "ChangeItems"}
 
     def getGmlSelector(self):
         
@@ -94,13 +95,12 @@ class ChangeItem(IdentifiedObject):
 
     def setGmlSelector(self, value):
         if self._GmlSelector is not None:
-            filtered = [x for x in self.GmlSelector.ChangeItems if x != self]
-            self._GmlSelector._ChangeItems = filtered
+            self._GmlSelector._ChangeItems.discard(self)
 
         self._GmlSelector = value
         if self._GmlSelector is not None:
             if self not in self._GmlSelector._ChangeItems:
-                self._GmlSelector._ChangeItems.append(self)
+                self._GmlSelector._reflist("_ChangeItems").append(self)
 
     GmlSelector = property(getGmlSelector, setGmlSelector)
 
@@ -110,13 +110,12 @@ class ChangeItem(IdentifiedObject):
 
     def setOrganisation(self, value):
         if self._Organisation is not None:
-            filtered = [x for x in self.Organisation.ChangeItems if x != self]
-            self._Organisation._ChangeItems = filtered
+            self._Organisation._ChangeItems.discard(self)
 
         self._Organisation = value
         if self._Organisation is not None:
             if self not in self._Organisation._ChangeItems:
-                self._Organisation._ChangeItems.append(self)
+                self._Organisation._reflist("_ChangeItems").append(self)
 
     Organisation = property(getOrganisation, setOrganisation)
 
@@ -126,13 +125,12 @@ class ChangeItem(IdentifiedObject):
 
     def setDocument(self, value):
         if self._Document is not None:
-            filtered = [x for x in self.Document.ChangeItems if x != self]
-            self._Document._ChangeItems = filtered
+            self._Document._ChangeItems.discard(self)
 
         self._Document = value
         if self._Document is not None:
             if self not in self._Document._ChangeItems:
-                self._Document._ChangeItems.append(self)
+                self._Document._reflist("_ChangeItems").append(self)
 
     Document = property(getDocument, setDocument)
 
@@ -142,13 +140,12 @@ class ChangeItem(IdentifiedObject):
 
     def setAsset(self, value):
         if self._Asset is not None:
-            filtered = [x for x in self.Asset.ChangeItems if x != self]
-            self._Asset._ChangeItems = filtered
+            self._Asset._ChangeItems.discard(self)
 
         self._Asset = value
         if self._Asset is not None:
             if self not in self._Asset._ChangeItems:
-                self._Asset._ChangeItems.append(self)
+                self._Asset._reflist("_ChangeItems").append(self)
 
     Asset = property(getAsset, setAsset)
 
@@ -160,13 +157,12 @@ class ChangeItem(IdentifiedObject):
 
     def setGmlObservation(self, value):
         if self._GmlObservation is not None:
-            filtered = [x for x in self.GmlObservation.ChangeItems if x != self]
-            self._GmlObservation._ChangeItems = filtered
+            self._GmlObservation._ChangeItems.discard(self)
 
         self._GmlObservation = value
         if self._GmlObservation is not None:
             if self not in self._GmlObservation._ChangeItems:
-                self._GmlObservation._ChangeItems.append(self)
+                self._GmlObservation._reflist("_ChangeItems").append(self)
 
     GmlObservation = property(getGmlObservation, setGmlObservation)
 
@@ -176,13 +172,12 @@ class ChangeItem(IdentifiedObject):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.ChangeItems if x != self]
-            self._ErpPerson._ChangeItems = filtered
+            self._ErpPerson._ChangeItems.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
             if self not in self._ErpPerson._ChangeItems:
-                self._ErpPerson._ChangeItems.append(self)
+                self._ErpPerson._reflist("_ChangeItems").append(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
@@ -192,13 +187,12 @@ class ChangeItem(IdentifiedObject):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.ChangeItems if x != self]
-            self._PowerSystemResource._ChangeItems = filtered
+            self._PowerSystemResource._ChangeItems.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
             if self not in self._PowerSystemResource._ChangeItems:
-                self._PowerSystemResource._ChangeItems.append(self)
+                self._PowerSystemResource._reflist("_ChangeItems").append(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -208,13 +202,12 @@ class ChangeItem(IdentifiedObject):
 
     def setChangeSet(self, value):
         if self._ChangeSet is not None:
-            filtered = [x for x in self.ChangeSet.ChangeItems if x != self]
-            self._ChangeSet._ChangeItems = filtered
+            self._ChangeSet._ChangeItems.discard(self)
 
         self._ChangeSet = value
         if self._ChangeSet is not None:
             if self not in self._ChangeSet._ChangeItems:
-                self._ChangeSet._ChangeItems.append(self)
+                self._ChangeSet._reflist("_ChangeItems").append(self)
 
     ChangeSet = property(getChangeSet, setChangeSet)
 
@@ -224,13 +217,12 @@ class ChangeItem(IdentifiedObject):
 
     def setLocation(self, value):
         if self._Location is not None:
-            filtered = [x for x in self.Location.ChangeItems if x != self]
-            self._Location._ChangeItems = filtered
+            self._Location._ChangeItems.discard(self)
 
         self._Location = value
         if self._Location is not None:
             if self not in self._Location._ChangeItems:
-                self._Location._ChangeItems.append(self)
+                self._Location._reflist("_ChangeItems").append(self)
 
     Location = property(getLocation, setLocation)
 
@@ -240,13 +232,12 @@ class ChangeItem(IdentifiedObject):
 
     def setNetworkDataSet(self, value):
         if self._NetworkDataSet is not None:
-            filtered = [x for x in self.NetworkDataSet.ChangeItems if x != self]
-            self._NetworkDataSet._ChangeItems = filtered
+            self._NetworkDataSet._ChangeItems.discard(self)
 
         self._NetworkDataSet = value
         if self._NetworkDataSet is not None:
             if self not in self._NetworkDataSet._ChangeItems:
-                self._NetworkDataSet._ChangeItems.append(self)
+                self._NetworkDataSet._reflist("_ChangeItems").append(self)
 
     NetworkDataSet = property(getNetworkDataSet, setNetworkDataSet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ChangeSet(IdentifiedObject):
     """The updates required in a transaction for an existing data set are grouped into a single ChangeSet. In data sets (e.g., NetworkDataSet), each major step in the ChangeSet is described through a separate ChangeItem associated with the data set. Within each data set, each inidividual object change is described with a seperate ChangeItem associated with the object.The updates required in a transaction for an existing data set are grouped into a single ChangeSet. In data sets (e.g., NetworkDataSet), each major step in the ChangeSet is described through a separate ChangeItem associated with the data set. Within each data set, each inidividual object change is described with a seperate ChangeItem associated with the object.
@@ -32,16 +33,16 @@ class ChangeSet(IdentifiedObject):
         @param status:
         @param Documents:
         """
-        self._NetworkDataSets = []
-        self.NetworkDataSets = [] if NetworkDataSets is None else NetworkDataSets
+        if NetworkDataSets is not None:
+            self.NetworkDataSets = NetworkDataSets
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
         self.status = status
 
-        self._Documents = []
-        self.Documents = [] if Documents is None else Documents
+        if Documents is not None:
+            self.Documents = Documents
 
         super(ChangeSet, self).__init__(*args, **kw_args)
 
@@ -51,6 +52,7 @@ class ChangeSet(IdentifiedObject):
     _enums = {}
     _refs = ["NetworkDataSets", "ChangeItems", "status", "Documents"]
     _many_refs = ["NetworkDataSets", "ChangeItems", "Documents"]
+    _inverses = {"NetworkDataSets": "ChangeSets", "ChangeItems": "ChangeSet", "Documents": "ChangeSets"}
 
     def getNetworkDataSets(self):
         
@@ -58,20 +60,19 @@ class ChangeSet(IdentifiedObject):
 
     def setNetworkDataSets(self, value):
         for p in self._NetworkDataSets:
-            filtered = [q for q in p.ChangeSets if q != self]
-            self._NetworkDataSets._ChangeSets = filtered
+            p._ChangeSets.discard(self)
         for r in value:
             if self not in r._ChangeSets:
-                r._ChangeSets.append(self)
-        self._NetworkDataSets = value
+                r._reflist("_ChangeSets").append(self)
+        self._NetworkDataSets = RefList(value)
 
     NetworkDataSets = property(getNetworkDataSets, setNetworkDataSets)
 
     def addNetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
             if self not in obj._ChangeSets:
-                obj._ChangeSets.append(self)
-            self._NetworkDataSets.append(obj)
+                obj._reflist("_ChangeSets").append(self)
+            self._reflist("_NetworkDataSets").append(obj)
 
     def removeNetworkDataSets(self, *NetworkDataSets):
         for obj in NetworkDataSets:
@@ -84,7 +85,8 @@ class ChangeSet(IdentifiedObject):
         return self._ChangeItems
 
     def setChangeItems(self, value):
-        for x in self._ChangeItems:
+        value = RefList(value)
+        for x in list(self._ChangeItems):
             x.ChangeSet = None
         for y in value:
             y._ChangeSet = self
@@ -108,20 +110,19 @@ class ChangeSet(IdentifiedObject):
 
     def setDocuments(self, value):
         for p in self._Documents:
-            filtered = [q for q in p.ChangeSets if q != self]
-            self._Documents._ChangeSets = filtered
+            p._ChangeSets.discard(self)
         for r in value:
             if self not in r._ChangeSets:
-                r._ChangeSets.append(self)
-        self._Documents = value
+                r._reflist("_ChangeSets").append(self)
+        self._Documents = RefList(value)
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
         for obj in Documents:
             if self not in obj._ChangeSets:
-                obj._ChangeSets.append(self)
-            self._Documents.append(obj)
+                obj._reflist("_ChangeSets").append(self)
+            self._reflist("_Documents").append(obj)
 
     def removeDocuments(self, *Documents):
         for obj in Documents:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.EquipmentContainer import EquipmentContainer
+from CIM15.Element import RefList
 
 class Circuit(EquipmentContainer):
     """EquipmentContainer that will typically include conductors, energy consumers, transformers and transformer windings, switches, shunt compensators, etc., likely at different voltages. Circuit extends from a substation to a set of open points (radial circuit), or to a second substation (looped circuit). It generally starts with a switching device, located in a substation. Membership in a Circuit is based on the nominal or design system configuration, but the electrical connectivity will change during switching operations.EquipmentContainer that will typically include conductors, energy consumers, transformers and transformer windings, switches, shunt compensators, etc., likely at different voltages. Circuit extends from a substation to a set of open points (radial circuit), or to a second substation (looped circuit). It generally starts with a switching device, located in a substation. Membership in a Circuit is based on the nominal or design system configuration, but the electrical connectivity will change during switching operations.
@@ -29,8 +30,8 @@ class Circuit(EquipmentContainer):
 
         @param CircuitSections:
         """
-        self._CircuitSections = []
-        self.CircuitSections = [] if CircuitSections is None else CircuitSections
+        if CircuitSections is not None:
+            self.CircuitSections = CircuitSections
 
         super(Circuit, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class Circuit(EquipmentContainer):
     _enums = {}
     _refs = ["CircuitSections"]
     _many_refs = ["CircuitSections"]
+    _inverses = {"CircuitSections": "Circuits"}
 
     def getCircuitSections(self):
         
@@ -47,20 +49,19 @@ class Circuit(EquipmentContainer):
 
     def setCircuitSections(self, value):
         for p in self._CircuitSections:
-            filtered = [q for q in p.Circuits if q != self]
-            self._CircuitSections._Circuits = filtered
+            p._Circuits.discard(self)
         for r in value:
             if self not in r._Circuits:
-                r._Circuits.append(self)
-        self._CircuitSections = value
+                r._reflist("_Circuits").append(self)
+        self._CircuitSections = RefList(value)
 
     CircuitSections = property(getCircuitSections, setCircuitSections)
 
     def addCircuitSections(self, *CircuitSections):
         for obj in CircuitSections:
             if self not in obj._Circuits:
-                obj._Circuits.append(self)
-            self._CircuitSections.append(obj)
+                obj._reflist("_Circuits").append(self)
+            self._reflist("_CircuitSections").append(obj)
 
     def removeCircuitSections(self, *CircuitSections):
         for obj in CircuitSections:
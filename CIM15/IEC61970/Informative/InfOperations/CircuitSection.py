@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class CircuitSection(IdentifiedObject):
     """Section of circuit located between two sectionalizing devices. It may contain other circuit sections, for example, a lateral tapped off a primary.Section of circuit located between two sectionalizing devices. It may contain other circuit sections, for example, a lateral tapped off a primary.
@@ -34,11 +35,11 @@ class CircuitSection(IdentifiedObject):
         #: Kind of this circuit section. Values are: "electricallyConnected", "nominallyConnected", "asBuilt", "other"
         self.connectionKind = connectionKind
 
-        self._ConductorAssets = []
-        self.ConductorAssets = [] if ConductorAssets is None else ConductorAssets
+        if ConductorAssets is not None:
+            self.ConductorAssets = ConductorAssets
 
-        self._Circuits = []
-        self.Circuits = [] if Circuits is None else Circuits
+        if Circuits is not None:
+            self.Circuits = Circuits
 
         super(CircuitSection, self).__init__(*args, **kw_args)
 
@@ -48,13 +49,15 @@ class CircuitSection(IdentifiedObject):
     _enums = {"connectionKind": "CircuitConnectionKind"}
     _refs = ["ConductorAssets", "Circuits"]
     _many_refs = ["ConductorAssets", "Circuits"]
+    _inverses = {"ConductorAssets": "CircuitSection", "Circuits": "CircuitSections"}
 
     def getConductorAssets(self):
         
         return self._ConductorAssets
 
     def setConductorAssets(self, value):
-        for x in self._ConductorAssets:
+        value = RefList(value)
+        for x in list(self._ConductorAssets):
             x.CircuitSection = None
         for y in value:
             y._CircuitSection = self
@@ -76,20 +79,19 @@ class CircuitSection(IdentifiedObject):
 
     def setCircuits(self, value):
         for p in self._Circuits:
-            filtered = [q for q in p.CircuitSections if q != self]
-            self._Circuits._CircuitSections = filtered
+            p._CircuitSections.discard(self)
         for r in value:
             if self not in r._CircuitSections:
-                r._CircuitSections.append(self)
-        self._Circuits = value
+                r._reflist("_CircuitSections").append(self)
+        self._Circuits = RefList(value)
 
     Circuits = property(getCircuits, setCircuits)
 
     def addCircuits(self, *Circuits):
         for obj in Circuits:
             if self not in obj._CircuitSections:
-                obj._CircuitSections.append(self)
-            self._Circuits.append(obj)
+                obj._reflist("_CircuitSections").append(self)
+            self._reflist("_Circuits").append(obj)
 
     def removeCircuits(self, *Circuits):
         for obj in Circuits:
@@ -44,6 +44,7 @@ class ErpPersonScheduleStepRole(Role):
     _enums = {}
     _refs = ["ErpPerson", "SwitchingStep"]
     _many_refs = []
+    _inverses = {"ErpPerson": "SwitchingStepRoles", "SwitchingStep": "ErpPersonRole"}
 
     def getErpPerson(self):
         
@@ -51,13 +52,12 @@ class ErpPersonScheduleStepRole(Role):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.SwitchingStepRoles if x != self]
-            self._ErpPerson._SwitchingStepRoles = filtered
+            self._ErpPerson._SwitchingStepRoles.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
             if self not in self._ErpPerson._SwitchingStepRoles:
-                self._ErpPerson._SwitchingStepRoles.append(self)
+                self._ErpPerson._reflist("_SwitchingStepRoles").append(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class IncidentCode(IdentifiedObject):
     """Classification of incident types. Multiple incident codes may apply to a given incident. The primary overall incident cause is recorded in 'IncidentRecord.category', and the main code in association end 'Names'.Classification of incident types. Multiple incident codes may apply to a given incident. The primary overall incident cause is recorded in 'IncidentRecord.category', and the main code in association end 'Names'.
@@ -33,8 +34,8 @@ class IncidentCode(IdentifiedObject):
         #: Additional level of classification detail (as extension to the main code found in association to Name).
         self.subCode = subCode
 
-        self._IncidentRecords = []
-        self.IncidentRecords = [] if IncidentRecords is None else IncidentRecords
+        if IncidentRecords is not None:
+            self.IncidentRecords = IncidentRecords
 
         super(IncidentCode, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class IncidentCode(IdentifiedObject):
     _enums = {}
     _refs = ["IncidentRecords"]
     _many_refs = ["IncidentRecords"]
+    _inverses = {"IncidentRecords": "IncidentCodes"}
 
     def getIncidentRecords(self):
         
@@ -51,20 +53,19 @@ class IncidentCode(IdentifiedObject):
 
     def setIncidentRecords(self, value):
         for p in self._IncidentRecords:
-            filtered = [q for q in p.IncidentCodes if q != self]
-            self._IncidentRecords._IncidentCodes = filtered
+            p._IncidentCodes.discard(self)
         for r in value:
             if self not in r._IncidentCodes:
-                r._IncidentCodes.append(self)
-        self._IncidentRecords = value
+                r._reflist("_IncidentCodes").append(self)
+        self._IncidentRecords = RefList(value)
 
     IncidentRecords = property(getIncidentRecords, setIncidentRecords)
 
     def addIncidentRecords(self, *IncidentRecords):
         for obj in IncidentRecords:
             if self not in obj._IncidentCodes:
-                obj._IncidentCodes.append(self)
-            self._IncidentRecords.append(obj)
+                obj._reflist("_IncidentCodes").append(self)
+            self._reflist("_IncidentRecords").append(obj)
 
     def removeIncidentRecords(self, *IncidentRecords):
         for obj in IncidentRecords:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class IncidentRecord(Document):
     """Document describing the incident reported in a TroubleTicket. If the incident has to do with an outage, this will be associated with an OutageRecord. Primary cause of the incident is captured in 'category'.Document describing the incident reported in a TroubleTicket. If the incident has to do with an outage, this will be associated with an OutageRecord. Primary cause of the incident is captured in 'category'.
@@ -31,13 +32,13 @@ class IncidentRecord(Document):
         @param period: Period between the first customer impacted by the incident and the incident resolution for all customers impacted.
         @param IncidentCodes:
         """
-        self._TroubleTickets = []
-        self.TroubleTickets = [] if TroubleTickets is None else TroubleTickets
+        if TroubleTickets is not None:
+            self.TroubleTickets = TroubleTickets
 
         self.period = period
 
-        self._IncidentCodes = []
-        self.IncidentCodes = [] if IncidentCodes is None else IncidentCodes
+        if IncidentCodes is not None:
+            self.IncidentCodes = IncidentCodes
 
         super(IncidentRecord, self).__init__(*args, **kw_args)
 
@@ -47,13 +48,15 @@ class IncidentRecord(Document):
     _enums = {}
     _refs = ["TroubleTickets", "period", "IncidentCodes"]
     _many_refs = ["TroubleTickets", "IncidentCodes"]
+    _inverses = {"TroubleTickets": "IncidentRecord", "IncidentCodes": "IncidentRecords"}
 
     def getTroubleTickets(self):
         
         return self._TroubleTickets
 
     def setTroubleTickets(self, value):
-        for x in self._TroubleTickets:
+        value = RefList(value)
+        for x in list(self._TroubleTickets):
             x.IncidentRecord = None
         for y in value:
             y._IncidentRecord = self
@@ -78,20 +81,19 @@ class IncidentRecord(Document):
 
     def setIncidentCodes(self, value):
         for p in self._IncidentCodes:
-            filtered = [q for q in p.IncidentRecords if q != self]
-            self._IncidentCodes._IncidentRecords = filtered
+            p._IncidentRecords.discard(self)
         for r in value:
             if self not in r._IncidentRecords:
-                r._IncidentRecords.append(self)
-        self._IncidentCodes = value
+                r._reflist("_IncidentRecords").append(self)
+        self._IncidentCodes = RefList(value)
 
     IncidentCodes = property(getIncidentCodes, setIncidentCodes)
 
     def addIncidentCodes(self, *IncidentCodes):
         for obj in IncidentCodes:
             if self not in obj._IncidentRecords:
-                obj._IncidentRecords.append(self)
-            self._IncidentCodes.append(obj)
+                obj._reflist("_IncidentRecords").append(self)
+            self._reflist("_IncidentCodes").append(obj)
 
     def removeIncidentCodes(self, *IncidentCodes):
         for obj in IncidentCodes:
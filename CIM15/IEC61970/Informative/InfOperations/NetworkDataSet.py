@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class NetworkDataSet(IdentifiedObject):
     """Categorized as a type of document, model of a portion of the electrical network that includes a list of the equipment, along with relevant connectivity, electrical characteristics, geographical location, and various parameters associated with the equipment.Categorized as a type of document, model of a portion of the electrical network that includes a list of the equipment, along with relevant connectivity, electrical characteristics, geographical location, and various parameters associated with the equipment.
@@ -39,17 +40,17 @@ class NetworkDataSet(IdentifiedObject):
 
         self.status = status
 
-        self._Documents = []
-        self.Documents = [] if Documents is None else Documents
+        if Documents is not None:
+            self.Documents = Documents
 
-        self._ChangeItems = []
-        self.ChangeItems = [] if ChangeItems is None else ChangeItems
+        if ChangeItems is not None:
+            self.ChangeItems = ChangeItems
 
-        self._ChangeSets = []
-        self.ChangeSets = [] if ChangeSets is None else ChangeSets
+        if ChangeSets is not None:
+            self.ChangeSets = ChangeSets
 
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         super(NetworkDataSet, self).__init__(*args, **kw_args)
 
@@ -59,6 +60,7 @@ class NetworkDataSet(IdentifiedObject):
     _enums = {}
     _refs = ["status", "Documents", "ChangeItems", "ChangeSets", "PowerSystemResources"]
     _many_refs = ["Documents", "ChangeItems", "ChangeSets", "PowerSystemResources"]
+    _inverses = {"Documents": "NetworkDataSets", "ChangeItems": "NetworkDataSet", "ChangeSets": "NetworkDataSets", "PowerSystemResources": "NetworkDataSets"}
 
     status = None
 
@@ -68,20 +70,19 @@ class NetworkDataSet(IdentifiedObject):
 
     def setDocuments(self, value):
         for p in self._Documents:
-            filtered = [q for q in p.NetworkDataSets if q != self]
-            self._Documents._NetworkDataSets = filtered
+            p._NetworkDataSets.discard(self)
         for r in value:
             if self not in r._NetworkDataSets:
-                r._NetworkDataSets.append(self)
-        self._Documents = value
+                r._reflist("_NetworkDataSets").append(self)
+        self._Documents = RefList(value)
 
     Documents = property(getDocuments, setDocuments)
 
     def addDocuments(self, *Documents):
         for obj in Documents:
             if self not in obj._NetworkDataSets:
-                obj._NetworkDataSets.append(self)
-            self._Documents.append(obj)
+                obj._reflist("_NetworkDataSets").append(self)
+            self._reflist("_Documents").append(obj)
 
     def removeDocuments(self, *Documents):
         for obj in Documents:
@@ -94,7 +95,8 @@ class NetworkDataSet(IdentifiedObject):
         return self._ChangeItems
 
     def setChangeItems(self, value):
-        for x in self._ChangeItems:
+        value = RefList(value)
+        for x in list(self._ChangeItems):
             x.NetworkDataSet = None
         for y in value:
             y._NetworkDataSet = self
@@ -116,20 +118,19 @@ class NetworkDataSet(IdentifiedObject):
 
     def setChangeSets(self, value):
         for p in self._ChangeSets:
-            filtered = [q for q in p.NetworkDataSets if q != self]
-            self._ChangeSets._NetworkDataSets = filtered
+            p._NetworkDataSets.discard(self)
         for r in value:
             if self not in r._NetworkDataSets:
-                r._NetworkDataSets.append(self)
-        self._ChangeSets = value
+                r._reflist("_NetworkDataSets").append(self)
+        self._ChangeSets = RefList(value)
 
     ChangeSets = property(getChangeSets, setChangeSets)
 
     def addChangeSets(self, *ChangeSets):
         for obj in ChangeSets:
             if self not in obj._NetworkDataSets:
-                obj._NetworkDataSets.append(self)
-            self._ChangeSets.append(obj)
+                obj._reflist("_NetworkDataSets").append(self)
+            self._reflist("_ChangeSets").append(obj)
 
     def removeChangeSets(self, *ChangeSets):
         for obj in ChangeSets:
@@ -143,20 +144,19 @@ class NetworkDataSet(IdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.NetworkDataSets if q != self]
-            self._PowerSystemResources._NetworkDataSets = filtered
+            p._NetworkDataSets.discard(self)
         for r in value:
             if self not in r._NetworkDataSets:
-                r._NetworkDataSets.append(self)
-        self._PowerSystemResources = value
+                r._reflist("_NetworkDataSets").append(self)
+        self._PowerSystemResources = RefList(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
             if self not in obj._NetworkDataSets:
-                obj._NetworkDataSets.append(self)
-            self._PowerSystemResources.append(obj)
+                obj._reflist("_NetworkDataSets").append(self)
+            self._reflist("_PowerSystemResources").append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
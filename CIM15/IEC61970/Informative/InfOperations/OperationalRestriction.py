@@ -39,6 +39,7 @@ class OperationalRestriction(Document):
     _enums = {}
     _refs = ["activePeriod"]
     _many_refs = []
+    _inverses = {}
 
     # Interval during which the restriction is applied.
     activePeriod = None
@@ -44,6 +44,7 @@ class OrgPsrRole(Role):
     _enums = {}
     _refs = ["ErpOrganisation", "PowerSystemResource"]
     _many_refs = []
+    _inverses = {"ErpOrganisation": "PowerSystemResourceRoles", "PowerSystemResource": "ErpOrganisationRoles"}
 
     def getErpOrganisation(self):
         
@@ -51,13 +52,12 @@ class OrgPsrRole(Role):
 
     def setErpOrganisation(self, value):
         if self._ErpOrganisation is not None:
-            filtered = [x for x in self.ErpOrganisation.PowerSystemResourceRoles if x != self]
-            self._ErpOrganisation._PowerSystemResourceRoles = filtered
+            self._ErpOrganisation._PowerSystemResourceRoles.discard(self)
 
         self._ErpOrganisation = value
         if self._ErpOrganisation is not None:
             if self not in self._ErpOrganisation._PowerSystemResourceRoles:
-                self._ErpOrganisation._PowerSystemResourceRoles.append(self)
+                self._ErpOrganisation._reflist("_PowerSystemResourceRoles").append(self)
 
     ErpOrganisation = property(getErpOrganisation, setErpOrganisation)
 
@@ -67,13 +67,12 @@ class OrgPsrRole(Role):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.ErpOrganisationRoles if x != self]
-            self._PowerSystemResource._ErpOrganisationRoles = filtered
+            self._PowerSystemResource._ErpOrganisationRoles.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
             if self not in self._PowerSystemResource._ErpOrganisationRoles:
-                self._PowerSystemResource._ErpOrganisationRoles.append(self)
+                self._PowerSystemResource._reflist("_ErpOrganisationRoles").append(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class OutageCode(IdentifiedObject):
     """Classification of outage types. Multiple outage codes may apply to a given outage or outage step.The primary overall outage type is recorded in 'OutageRecord.outageType'. There may be more than one classification per outage step and/or per outage record. Example codes/subcodes include: weather/ice, weather/lightning, wildlife/squirrel, wildlife/bird, burned/overload, burned/weather, wire down/accident, wire down/tree, wire down/vandalism, etc. The typical outage code is in the inherited association to Name. The code is described in the inherited 'description' attribute.Classification of outage types. Multiple outage codes may apply to a given outage or outage step.The primary overall outage type is recorded in 'OutageRecord.outageType'. There may be more than one classification per outage step and/or per outage record. Example codes/subcodes include: weather/ice, weather/lightning, wildlife/squirrel, wildlife/bird, burned/overload, burned/weather, wire down/accident, wire down/tree, wire down/vandalism, etc. The typical outage code is in the inherited association to Name. The code is described in the inherited 'description' attribute.
@@ -34,11 +35,11 @@ class OutageCode(IdentifiedObject):
         #: The main code is stored in the inherited association to Name. This sub-code provides an additional level of classification detail.
         self.subCode = subCode
 
-        self._OutageRecords = []
-        self.OutageRecords = [] if OutageRecords is None else OutageRecords
+        if OutageRecords is not None:
+            self.OutageRecords = OutageRecords
 
-        self._OutageSteps = []
-        self.OutageSteps = [] if OutageSteps is None else OutageSteps
+        if OutageSteps is not None:
+            self.OutageSteps = OutageSteps
 
         super(OutageCode, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class OutageCode(IdentifiedObject):
     _enums = {}
     _refs = ["OutageRecords", "OutageSteps"]
     _many_refs = ["OutageRecords", "OutageSteps"]
+    _inverses = {"OutageRecords": "OutageCodes", "OutageSteps": "OutageCodes"}
 
     def getOutageRecords(self):
         
@@ -55,20 +57,19 @@ class OutageCode(IdentifiedObject):
 
     def setOutageRecords(self, value):
         for p in self._OutageRecords:
-            filtered = [q for q in p.OutageCodes if q != self]
-            self._OutageRecords._OutageCodes = filtered
+            p._OutageCodes.discard(self)
         for r in value:
             if self not in r._OutageCodes:
-                r._OutageCodes.append(self)
-        self._OutageRecords = value
+                r._reflist("_OutageCodes").append(self)
+        self._OutageRecords = RefList(value)
 
     OutageRecords = property(getOutageRecords, setOutageRecords)
 
     def addOutageRecords(self, *OutageRecords):
         for obj in OutageRecords:
             if self not in obj._OutageCodes:
-                obj._OutageCodes.append(self)
-            self._OutageRecords.append(obj)
+                obj._reflist("_OutageCodes").append(self)
+            self._reflist("_OutageRecords").append(obj)
 
     def removeOutageRecords(self, *OutageRecords):
         for obj in OutageRecords:
@@ -82,20 +83,19 @@ class OutageCode(IdentifiedObject):
 
     def setOutageSteps(self, value):
         for p in self._OutageSteps:
-            filtered = [q for q in p.OutageCodes if q != self]
-            self._OutageSteps._OutageCodes = filtered
+            p._OutageCodes.discard(self)
         for r in value:
             if self not in r._OutageCodes:
-                r._OutageCodes.append(self)
-        self._OutageSteps = value
+                r._reflist("_OutageCodes").append(self)
+        self._OutageSteps = RefList(value)
 
     OutageSteps = property(getOutageSteps, setOutageSteps)
 
     def addOutageSteps(self, *OutageSteps):
         for obj in OutageSteps:
             if self not in obj._OutageCodes:
-                obj._OutageCodes.append(self)
-            self._OutageSteps.append(obj)
+                obj._reflist("_OutageCodes").append(self)
+            self._reflist("_OutageSteps").append(obj)
 
     def removeOutageSteps(self, *OutageSteps):
         for obj in OutageSteps:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class OutageNotification(Document):
     """A document containing information to be sent to customers notifying that an outage will take place. This is used to generate mailing lists for customers.A document containing information to be sent to customers notifying that an outage will take place. This is used to generate mailing lists for customers.
@@ -41,8 +42,8 @@ class OutageNotification(Document):
         #: Details of the outage 'reason'.
         self.reason = reason
 
-        self._CustomerDatas = []
-        self.CustomerDatas = [] if CustomerDatas is None else CustomerDatas
+        if CustomerDatas is not None:
+            self.CustomerDatas = CustomerDatas
 
         super(OutageNotification, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class OutageNotification(Document):
     _enums = {}
     _refs = ["CustomerDatas"]
     _many_refs = ["CustomerDatas"]
+    _inverses = {"CustomerDatas": "OutageNotifications"}
 
     def getCustomerDatas(self):
         
@@ -59,20 +61,19 @@ class OutageNotification(Document):
 
     def setCustomerDatas(self, value):
         for p in self._CustomerDatas:
-            filtered = [q for q in p.OutageNotifications if q != self]
-            self._CustomerDatas._OutageNotifications = filtered
+            p._OutageNotifications.discard(self)
         for r in value:
             if self not in r._OutageNotifications:
-                r._OutageNotifications.append(self)
-        self._CustomerDatas = value
+                r._reflist("_OutageNotifications").append(self)
+        self._CustomerDatas = RefList(value)
 
     CustomerDatas = property(getCustomerDatas, setCustomerDatas)
 
     def addCustomerDatas(self, *CustomerDatas):
         for obj in CustomerDatas:
             if self not in obj._OutageNotifications:
-                obj._OutageNotifications.append(self)
-            self._CustomerDatas.append(obj)
+                obj._reflist("_OutageNotifications").append(self)
+            self._reflist("_CustomerDatas").append(obj)
 
     def removeCustomerDatas(self, *CustomerDatas):
         for obj in CustomerDatas:
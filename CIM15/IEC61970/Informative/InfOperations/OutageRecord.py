@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class OutageRecord(Document):
     """A document describing details of an outage in part of the electrical network, typically produced by a SCADA system following a breaker trip, or within a trouble call system by grouping customer calls. This has an associated outage step for each supply point. Primary cause of the outage is captured in 'category'. In some countries all outage restoration is performed using a switching schedule which complements the outage record and records the crew and any planned work. In other systems, it may be acceptable to manage outages including new work tasks without switching schedules. Note: The relationship between OutageRecord and ErpPerson and Crew is inherited as each is a type of Document.A document describing details of an outage in part of the electrical network, typically produced by a SCADA system following a breaker trip, or within a trouble call system by grouping customer calls. This has an associated outage step for each supply point. Primary cause of the outage is captured in 'category'. In some countries all outage restoration is performed using a switching schedule which complements the outage record and records the crew and any planned work. In other systems, it may be acceptable to manage outages including new work tasks without switching schedules. Note: The relationship between OutageRecord and ErpPerson and Crew is inherited as each is a type of Document.
@@ -51,14 +52,14 @@ class OutageRecord(Document):
         #: Value of ErpOrganisation.mode at the time of OutageRecord.startDateTime.
         self.mode = mode
 
-        self._OutageCodes = []
-        self.OutageCodes = [] if OutageCodes is None else OutageCodes
+        if OutageCodes is not None:
+            self.OutageCodes = OutageCodes
 
         self._OutageReport = None
         self.OutageReport = OutageReport
 
-        self._OutageSteps = []
-        self.OutageSteps = [] if OutageSteps is None else OutageSteps
+        if OutageSteps is not None:
+            self.OutageSteps = OutageSteps
 
         super(OutageRecord, self).__init__(*args, **kw_args)
 
@@ -68,6 +69,7 @@ class OutageRecord(Document):
     _enums = {}
     _refs = ["OutageCodes", "OutageReport", "OutageSteps"]
     _many_refs = ["OutageCodes", "OutageSteps"]
+    _inverses = {"OutageCodes": "OutageRecords", "OutageReport": "OutageRecord", "OutageSteps": "OutageRecord"}
 
     def getOutageCodes(self):
         """Multiple outage codes may apply to an outage record.
@@ -76,20 +78,19 @@ class OutageRecord(Document):
 
     def setOutageCodes(self, value):
         for p in self._OutageCodes:
-            filtered = [q for q in p.OutageRecords if q != self]
-            self._OutageCodes._OutageRecords = filtered
+            p._OutageRecords.discard(self)
         for r in value:
             if self not in r._OutageRecords:
-                r._OutageRecords.append(self)
-        self._OutageCodes = value
+                r._reflist("_OutageRecords").append(self)
+        self._OutageCodes = RefList(value)
 
     OutageCodes = property(getOutageCodes, setOutageCodes)
 
     def addOutageCodes(self, *OutageCodes):
         for obj in OutageCodes:
             if self not in obj._OutageRecords:
-                obj._OutageRecords.append(self)
-            self._OutageCodes.append(obj)
+                obj._reflist("_OutageRecords").append(self)
+            self._reflist("_OutageCodes").append(obj)
 
     def removeOutageCodes(self, *OutageCodes):
         for obj in OutageCodes:
@@ -117,7 +118,8 @@ class OutageRecord(Document):
         return self._OutageSteps
 
     def setOutageSteps(self, value):
-        for x in self._OutageSteps:
+        value = RefList(value)
+        for x in list(self._OutageSteps):
             x.OutageRecord = None
         for y in value:
             y._OutageRecord = self
@@ -60,6 +60,7 @@ class OutageReport(Document):
     _enums = {}
     _refs = ["OutageRecord", "OutageHistory"]
     _many_refs = []
+    _inverses = {"OutageRecord": "OutageReport", "OutageHistory": "OutageReports"}
 
     def getOutageRecord(self):
         """reference to related document
@@ -84,13 +85,12 @@ class OutageReport(Document):
 
     def setOutageHistory(self, value):
         if self._OutageHistory is not None:
-            filtered = [x for x in self.OutageHistory.OutageReports if x != self]
-            self._OutageHistory._OutageReports = filtered
+            self._OutageHistory._OutageReports.discard(self)
 
         self._OutageHistory = value
         if self._OutageHistory is not None:
             if self not in self._OutageHistory._OutageReports:
-                self._OutageHistory._OutageReports.append(self)
+                self._OutageHistory._reflist("_OutageReports").append(self)
 
     OutageHistory = property(getOutageHistory, setOutageHistory)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class OutageStep(IdentifiedObject):
     """Holds an outage start and end time for each supply point of an outage record. The supply point for a given step is the associated PowerSystemResource instance.Holds an outage start and end time for each supply point of an outage record. The supply point for a given step is the associated PowerSystemResource instance.
@@ -82,21 +83,21 @@ class OutageStep(IdentifiedObject):
         #: Total Customer Minutes Lost (CML) for this supply point for this outage.
         self.totalCml = totalCml
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        if Crews is not None:
+            self.Crews = Crews
 
         self.noPowerInterval = noPowerInterval
 
-        self._ConductingEquipmentRoles = []
-        self.ConductingEquipmentRoles = [] if ConductingEquipmentRoles is None else ConductingEquipmentRoles
+        if ConductingEquipmentRoles is not None:
+            self.ConductingEquipmentRoles = ConductingEquipmentRoles
 
         self.status = status
 
         self._OutageRecord = None
         self.OutageRecord = OutageRecord
 
-        self._OutageCodes = []
-        self.OutageCodes = [] if OutageCodes is None else OutageCodes
+        if OutageCodes is not None:
+            self.OutageCodes = OutageCodes
 
         super(OutageStep, self).__init__(*args, **kw_args)
 
@@ -106,6 +107,7 @@ class OutageStep(IdentifiedObject):
     _enums = {}
     _refs = ["Crews", "noPowerInterval", "ConductingEquipmentRoles", "status", "OutageRecord", "OutageCodes"]
     _many_refs = ["Crews", "ConductingEquipmentRoles", "OutageCodes"]
+    _inverses = {"Crews": "OutageSteps", "ConductingEquipmentRoles": "OutageStep", "OutageRecord": "OutageSteps", "OutageCodes": "OutageSteps"}
 
     def getCrews(self):
         
@@ -113,20 +115,19 @@ class OutageStep(IdentifiedObject):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.OutageSteps if q != self]
-            self._Crews._OutageSteps = filtered
+            p._OutageSteps.discard(self)
         for r in value:
             if self not in r._OutageSteps:
-                r._OutageSteps.append(self)
-        self._Crews = value
+                r._reflist("_OutageSteps").append(self)
+        self._Crews = RefList(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
             if self not in obj._OutageSteps:
-                obj._OutageSteps.append(self)
-            self._Crews.append(obj)
+                obj._reflist("_OutageSteps").append(self)
+            self._reflist("_Crews").append(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
@@ -142,7 +143,8 @@ class OutageStep(IdentifiedObject):
         return self._ConductingEquipmentRoles
 
     def setConductingEquipmentRoles(self, value):
-        for x in self._ConductingEquipmentRoles:
+        value = RefList(value)
+        for x in list(self._ConductingEquipmentRoles):
             x.OutageStep = None
         for y in value:
             y._OutageStep = self
@@ -166,13 +168,12 @@ class OutageStep(IdentifiedObject):
 
     def setOutageRecord(self, value):
         if self._OutageRecord is not None:
-            filtered = [x for x in self.OutageRecord.OutageSteps if x != self]
-            self._OutageRecord._OutageSteps = filtered
+            self._OutageRecord._OutageSteps.discard(self)
 
         self._OutageRecord = value
         if self._OutageRecord is not None:
             if self not in self._OutageRecord._OutageSteps:
-                self._OutageRecord._OutageSteps.append(self)
+                self._OutageRecord._reflist("_OutageSteps").append(self)
 
     OutageRecord = property(getOutageRecord, setOutageRecord)
 
@@ -183,20 +184,19 @@ class OutageStep(IdentifiedObject):
 
     def setOutageCodes(self, value):
         for p in self._OutageCodes:
-            filtered = [q for q in p.OutageSteps if q != self]
-            self._OutageCodes._OutageSteps = filtered
+            p._OutageSteps.discard(self)
         for r in value:
             if self not in r._OutageSteps:
-                r._OutageSteps.append(self)
-        self._OutageCodes = value
+                r._reflist("_OutageSteps").append(self)
+        self._OutageCodes = RefList(value)
 
     OutageCodes = property(getOutageCodes, setOutageCodes)
 
     def addOutageCodes(self, *OutageCodes):
         for obj in OutageCodes:
             if self not in obj._OutageSteps:
-                obj._OutageSteps.append(self)
-            self._OutageCodes.append(obj)
+                obj._reflist("_OutageSteps").append(self)
+            self._reflist("_OutageCodes").append(obj)
 
     def removeOutageCodes(self, *OutageCodes):
         for obj in OutageCodes:
@@ -44,6 +44,7 @@ class OutageStepPsrRole(Role):
     _enums = {}
     _refs = ["OutageStep", "ConductingEquipment"]
     _many_refs = []
+    _inverses = {"OutageStep": "ConductingEquipmentRoles", "ConductingEquipment": "OutageStepRoles"}
 
     def getOutageStep(self):
         
@@ -51,13 +52,12 @@ class OutageStepPsrRole(Role):
 
     def setOutageStep(self, value):
         if self._OutageStep is not None:
-            filtered = [x for x in self.OutageStep.ConductingEquipmentRoles if x != self]
-            self._OutageStep._ConductingEquipmentRoles = filtered
+            self._OutageStep._ConductingEquipmentRoles.discard(self)
 
         self._OutageStep = value
         if self._OutageStep is not None:
             if self not in self._OutageStep._ConductingEquipmentRoles:
-                self._OutageStep._ConductingEquipmentRoles.append(self)
+                self._OutageStep._reflist("_ConductingEquipmentRoles").append(self)
 
     OutageStep = property(getOutageStep, setOutageStep)
 
@@ -67,13 +67,12 @@ class OutageStepPsrRole(Role):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.OutageStepRoles if x != self]
-            self._ConductingEquipment._OutageStepRoles = filtered
+            self._ConductingEquipment._OutageStepRoles.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
             if self not in self._ConductingEquipment._OutageStepRoles:
-                self._ConductingEquipment._OutageStepRoles.append(self)
+                self._ConductingEquipment._reflist("_OutageStepRoles").append(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
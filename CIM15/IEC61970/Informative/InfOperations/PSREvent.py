@@ -44,6 +44,7 @@ class PSREvent(ActivityRecord):
     _enums = {"kind": "PSREventKind"}
     _refs = ["PowerSystemResource"]
     _many_refs = []
+    _inverses = {"PowerSystemResource": "PSREvent"}
 
     def getPowerSystemResource(self):
         """Power system resource that generated this event.
@@ -52,13 +53,12 @@ class PSREvent(ActivityRecord):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.PSREvent if x != self]
-            self._PowerSystemResource._PSREvent = filtered
+            self._PowerSystemResource._PSREvent.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
             if self not in self._PowerSystemResource._PSREvent:
-                self._PowerSystemResource._PSREvent.append(self)
+                self._PowerSystemResource._reflist("_PSREvent").append(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
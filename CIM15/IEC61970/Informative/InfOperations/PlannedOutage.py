@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class PlannedOutage(Document):
     """Planned outage involves network operations which will affect the supply of power to customers. Note that the list of Power System Resources for the PlannedOutage may be the same or a superset of the ones per OutageStep.Planned outage involves network operations which will affect the supply of power to customers. Note that the list of Power System Resources for the PlannedOutage may be the same or a superset of the ones per OutageStep.
@@ -34,11 +35,11 @@ class PlannedOutage(Document):
         #: Kind of outage. Values are: "fixed", "flexible", "forced"
         self.kind = kind
 
-        self._CustomerDatas = []
-        self.CustomerDatas = [] if CustomerDatas is None else CustomerDatas
+        if CustomerDatas is not None:
+            self.CustomerDatas = CustomerDatas
 
-        self._OutageSchedules = []
-        self.OutageSchedules = [] if OutageSchedules is None else OutageSchedules
+        if OutageSchedules is not None:
+            self.OutageSchedules = OutageSchedules
 
         super(PlannedOutage, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class PlannedOutage(Document):
     _enums = {"kind": "OutageKind"}
     _refs = ["CustomerDatas", "OutageSchedules"]
     _many_refs = ["CustomerDatas", "OutageSchedules"]
+    _inverses = {"CustomerDatas": "PlannedOutage", "OutageSchedules": "PlannedOutage"}
 
     def getCustomerDatas(self):
         """All customers affected by this work. Derived from WorkOrder.connectedCustomers
@@ -55,7 +57,8 @@ class PlannedOutage(Document):
         return self._CustomerDatas
 
     def setCustomerDatas(self, value):
-        for x in self._CustomerDatas:
+        value = RefList(value)
+        for x in list(self._CustomerDatas):
             x.PlannedOutage = None
         for y in value:
             y._PlannedOutage = self
@@ -76,7 +79,8 @@ class PlannedOutage(Document):
         return self._OutageSchedules
 
     def setOutageSchedules(self, value):
-        for x in self._OutageSchedules:
+        value = RefList(value)
+        for x in list(self._OutageSchedules):
             x.PlannedOutage = None
         for y in value:
             y._PlannedOutage = self
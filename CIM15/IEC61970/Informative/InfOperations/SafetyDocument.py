@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class SafetyDocument(Document):
     """A document restricting or authorising works on electrical equipment (for example a permit to work, sanction for test, limitation of access, or certificate of isolation), defined based upon organisational practices. Note: SafetyDocument may refer to ClearanceTag-s associated with ConductingEquipment for which the SafetyDocument is issued.A document restricting or authorising works on electrical equipment (for example a permit to work, sanction for test, limitation of access, or certificate of isolation), defined based upon organisational practices. Note: SafetyDocument may refer to ClearanceTag-s associated with ConductingEquipment for which the SafetyDocument is issued.
@@ -31,11 +32,11 @@ class SafetyDocument(Document):
         @param ScheduleSteps:
         @param PowerSystemResource:
         """
-        self._ClearanceTags = []
-        self.ClearanceTags = [] if ClearanceTags is None else ClearanceTags
+        if ClearanceTags is not None:
+            self.ClearanceTags = ClearanceTags
 
-        self._ScheduleSteps = []
-        self.ScheduleSteps = [] if ScheduleSteps is None else ScheduleSteps
+        if ScheduleSteps is not None:
+            self.ScheduleSteps = ScheduleSteps
 
         self._PowerSystemResource = None
         self.PowerSystemResource = PowerSystemResource
@@ -48,13 +49,15 @@ class SafetyDocument(Document):
     _enums = {}
     _refs = ["ClearanceTags", "ScheduleSteps", "PowerSystemResource"]
     _many_refs = ["ClearanceTags", "ScheduleSteps"]
+    _inverses = {"ClearanceTags": "SafetyDocument", "ScheduleSteps": "SafetyDocument", "PowerSystemResource": "SafetyDocuments"}
 
     def getClearanceTags(self):
         
         return self._ClearanceTags
 
     def setClearanceTags(self, value):
-        for x in self._ClearanceTags:
+        value = RefList(value)
+        for x in list(self._ClearanceTags):
             x.SafetyDocument = None
         for y in value:
             y._SafetyDocument = self
@@ -75,7 +78,8 @@ class SafetyDocument(Document):
         return self._ScheduleSteps
 
     def setScheduleSteps(self, value):
-        for x in self._ScheduleSteps:
+        value = RefList(value)
+        for x in list(self._ScheduleSteps):
             x.SafetyDocument = None
         for y in value:
             y._SafetyDocument = self
@@ -97,13 +101,12 @@ class SafetyDocument(Document):
 
     def setPowerSystemResource(self, value):
         if self._PowerSystemResource is not None:
-            filtered = [x for x in self.PowerSystemResource.SafetyDocuments if x != self]
-            self._PowerSystemResource._SafetyDocuments = filtered
+            self._PowerSystemResource._SafetyDocuments.discard(self)
 
         self._PowerSystemResource = value
         if self._PowerSystemResource is not None:
             if self not in self._PowerSystemResource._SafetyDocuments:
-                self._PowerSystemResource._SafetyDocuments.append(self)
+                self._PowerSystemResource._reflist("_SafetyDocuments").append(self)
 
     PowerSystemResource = property(getPowerSystemResource, setPowerSystemResource)
 
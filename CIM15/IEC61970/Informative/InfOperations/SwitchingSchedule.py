@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class SwitchingSchedule(Document):
     """Document describing a sequence of steps to perform an item of work, for example to isolate some plant with regard to safety, equipment ratings, and standards of customer service. Note 1: SwitchingSchedule is intended to describe the full operational details for switching for real time operation which includes other operations such as grounding, applying safety documents etc.  Note 2: The association to ErpPerson suits the UK practice of quoting specific names (e.g the crew foreman). The association to Crew is for US practice.Document describing a sequence of steps to perform an item of work, for example to isolate some plant with regard to safety, equipment ratings, and standards of customer service. Note 1: SwitchingSchedule is intended to describe the full operational details for switching for real time operation which includes other operations such as grounding, applying safety documents etc.  Note 2: The association to ErpPerson suits the UK practice of quoting specific names (e.g the crew foreman). The association to Crew is for US practice.
@@ -36,14 +37,14 @@ class SwitchingSchedule(Document):
         #: Reason for switching.
         self.reason = reason
 
-        self._ScheduleSteps = []
-        self.ScheduleSteps = [] if ScheduleSteps is None else ScheduleSteps
+        if ScheduleSteps is not None:
+            self.ScheduleSteps = ScheduleSteps
 
         self._WorkTask = None
         self.WorkTask = WorkTask
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        if Crews is not None:
+            self.Crews = Crews
 
         self.interval = interval
 
@@ -55,13 +56,15 @@ class SwitchingSchedule(Document):
     _enums = {}
     _refs = ["ScheduleSteps", "WorkTask", "Crews", "interval"]
     _many_refs = ["ScheduleSteps", "Crews"]
+    _inverses = {"ScheduleSteps": "SwitchingSchedule", "WorkTask": "SwitchingSchedules", "Crews": "SwitchingSchedules"}
 
     def getScheduleSteps(self):
         
         return self._ScheduleSteps
 
     def setScheduleSteps(self, value):
-        for x in self._ScheduleSteps:
+        value = RefList(value)
+        for x in list(self._ScheduleSteps):
             x.SwitchingSchedule = None
         for y in value:
             y._SwitchingSchedule = self
@@ -83,13 +86,12 @@ class SwitchingSchedule(Document):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.SwitchingSchedules if x != self]
-            self._WorkTask._SwitchingSchedules = filtered
+            self._WorkTask._SwitchingSchedules.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
             if self not in self._WorkTask._SwitchingSchedules:
-                self._WorkTask._SwitchingSchedules.append(self)
+                self._WorkTask._reflist("_SwitchingSchedules").append(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -100,20 +102,19 @@ class SwitchingSchedule(Document):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.SwitchingSchedules if q != self]
-            self._Crews._SwitchingSchedules = filtered
+            p._SwitchingSchedules.discard(self)
         for r in value:
             if self not in r._SwitchingSchedules:
-                r._SwitchingSchedules.append(self)
-        self._Crews = value
+                r._reflist("_SwitchingSchedules").append(self)
+        self._Crews = RefList(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
             if self not in obj._SwitchingSchedules:
-                obj._SwitchingSchedules.append(self)
-            self._Crews.append(obj)
+                obj._reflist("_SwitchingSchedules").append(self)
+            self._reflist("_Crews").append(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class SwitchingStep(IdentifiedObject):
     """A single step within a SwitchingSchedule. Could be a switching operation (applying a network alteration), or issuing a safety document. Note: Inherited attribute IdentifiedObject.name is used to hold the sequence number.A single step within a SwitchingSchedule. Could be a switching operation (applying a network alteration), or issuing a safety document. Note: Inherited attribute IdentifiedObject.name is used to hold the sequence number.
@@ -57,8 +58,8 @@ class SwitchingStep(IdentifiedObject):
         self._SwitchingSchedule = None
         self.SwitchingSchedule = SwitchingSchedule
 
-        self._PowerSystemResources = []
-        self.PowerSystemResources = [] if PowerSystemResources is None else PowerSystemResources
+        if PowerSystemResources is not None:
+            self.PowerSystemResources = PowerSystemResources
 
         self._ErpPersonRole = None
         self.ErpPersonRole = ErpPersonRole
@@ -71,6 +72,7 @@ class SwitchingStep(IdentifiedObject):
     _enums = {"statusKind": "SwitchingStepStatusKind"}
     _refs = ["SafetyDocument", "requiredControlActionInterval", "SwitchingSchedule", "PowerSystemResources", "ErpPersonRole"]
     _many_refs = ["PowerSystemResources"]
+    _inverses = {"SafetyDocument": "ScheduleSteps", "SwitchingSchedule": "ScheduleSteps", "PowerSystemResources": "ScheduleSteps", "ErpPersonRole": "SwitchingStep"}
 
     def getSafetyDocument(self):
         
@@ -78,13 +80,12 @@ class SwitchingStep(IdentifiedObject):
 
     def setSafetyDocument(self, value):
         if self._SafetyDocument is not None:
-            filtered = [x for x in self.SafetyDocument.ScheduleSteps if x != self]
-            self._SafetyDocument._ScheduleSteps = filtered
+            self._SafetyDocument._ScheduleSteps.discard(self)
 
         self._SafetyDocument = value
         if self._SafetyDocument is not None:
             if self not in self._SafetyDocument._ScheduleSteps:
-                self._SafetyDocument._ScheduleSteps.append(self)
+                self._SafetyDocument._reflist("_ScheduleSteps").append(self)
 
     SafetyDocument = property(getSafetyDocument, setSafetyDocument)
 
@@ -97,13 +98,12 @@ class SwitchingStep(IdentifiedObject):
 
     def setSwitchingSchedule(self, value):
         if self._SwitchingSchedule is not None:
-            filtered = [x for x in self.SwitchingSchedule.ScheduleSteps if x != self]
-            self._SwitchingSchedule._ScheduleSteps = filtered
+            self._SwitchingSchedule._ScheduleSteps.discard(self)
 
         self._SwitchingSchedule = value
         if self._SwitchingSchedule is not None:
             if self not in self._SwitchingSchedule._ScheduleSteps:
-                self._SwitchingSchedule._ScheduleSteps.append(self)
+                self._SwitchingSchedule._reflist("_ScheduleSteps").append(self)
 
     SwitchingSchedule = property(getSwitchingSchedule, setSwitchingSchedule)
 
@@ -113,20 +113,19 @@ class SwitchingStep(IdentifiedObject):
 
     def setPowerSystemResources(self, value):
         for p in self._PowerSystemResources:
-            filtered = [q for q in p.ScheduleSteps if q != self]
-            self._PowerSystemResources._ScheduleSteps = filtered
+            p._ScheduleSteps.discard(self)
         for r in value:
             if self not in r._ScheduleSteps:
-                r._ScheduleSteps.append(self)
-        self._PowerSystemResources = value
+                r._reflist("_ScheduleSteps").append(self)
+        self._PowerSystemResources = RefList(value)
 
     PowerSystemResources = property(getPowerSystemResources, setPowerSystemResources)
 
     def addPowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
             if self not in obj._ScheduleSteps:
-                obj._ScheduleSteps.append(self)
-            self._PowerSystemResources.append(obj)
+                obj._reflist("_ScheduleSteps").append(self)
+            self._reflist("_PowerSystemResources").append(obj)
 
     def removePowerSystemResources(self, *PowerSystemResources):
         for obj in PowerSystemResources:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class TroubleTicket(Document):
     """A document used to report electrical trouble. The trouble may either be an outage or non-outage problem, such as power quality. It must always be associated with an incident record. Note that a separate activity record is created for each call associated with an instance of trouble ticket. The time of a call is stored in 'ActivityRecord.createdOn' and comments are recorded in 'ActivityRecord.remarks'.A document used to report electrical trouble. The trouble may either be an outage or non-outage problem, such as power quality. It must always be associated with an incident record. Note that a separate activity record is created for each call associated with an instance of trouble ticket. The time of a call is stored in 'ActivityRecord.createdOn' and comments are recorded in 'ActivityRecord.remarks'.
@@ -68,8 +69,8 @@ class TroubleTicket(Document):
         #: True if requested to customer when someone is about to arrive at their premises.
         self.callBack = callBack
 
-        self._CallBacks = []
-        self.CallBacks = [] if CallBacks is None else CallBacks
+        if CallBacks is not None:
+            self.CallBacks = CallBacks
 
         self.troublePeriod = troublePeriod
 
@@ -87,6 +88,7 @@ class TroubleTicket(Document):
     _enums = {"reportingKind": "TroubleReportingKind"}
     _refs = ["CallBacks", "troublePeriod", "CustomerData", "IncidentRecord"]
     _many_refs = ["CallBacks"]
+    _inverses = {"CallBacks": "TroubleTickets", "CustomerData": "TroubleTickets", "IncidentRecord": "TroubleTickets"}
 
     def getCallBacks(self):
         
@@ -94,20 +96,19 @@ class TroubleTicket(Document):
 
     def setCallBacks(self, value):
         for p in self._CallBacks:
-            filtered = [q for q in p.TroubleTickets if q != self]
-            self._CallBacks._TroubleTickets = filtered
+            p._TroubleTickets.discard(self)
         for r in value:
             if self not in r._TroubleTickets:
-                r._TroubleTickets.append(self)
-        self._CallBacks = value
+                r._reflist("_TroubleTickets").append(self)
+        self._CallBacks = RefList(value)
 
     CallBacks = property(getCallBacks, setCallBacks)
 
     def addCallBacks(self, *CallBacks):
         for obj in CallBacks:
             if self not in obj._TroubleTickets:
-                obj._TroubleTickets.append(self)
-            self._CallBacks.append(obj)
+                obj._reflist("_TroubleTickets").append(self)
+            self._reflist("_CallBacks").append(obj)
 
     def removeCallBacks(self, *CallBacks):
         for obj in CallBacks:
@@ -124,13 +125,12 @@ class TroubleTicket(Document):
 
     def setCustomerData(self, value):
         if self._CustomerData is not None:
-            filtered = [x for x in self.CustomerData.TroubleTickets if x != self]
-            self._CustomerData._TroubleTickets = filtered
+            self._CustomerData._TroubleTickets.discard(self)
 
         self._CustomerData = value
         if self._CustomerData is not None:
             if self not in self._CustomerData._TroubleTickets:
-                self._CustomerData._TroubleTickets.append(self)
+                self._CustomerData._reflist("_TroubleTickets").append(self)
 
     CustomerData = property(getCustomerData, setCustomerData)
 
@@ -140,13 +140,12 @@ class TroubleTicket(Document):
 
     def setIncidentRecord(self, value):
         if self._IncidentRecord is not None:
-            filtered = [x for x in self.IncidentRecord.TroubleTickets if x != self]
-            self._IncidentRecord._TroubleTickets = filtered
+            self._IncidentRecord._TroubleTickets.discard(self)
 
         self._IncidentRecord = value
         if self._IncidentRecord is not None:
             if self not in self._IncidentRecord._TroubleTickets:
-                self._IncidentRecord._TroubleTickets.append(self)
+                self._IncidentRecord._reflist("_TroubleTickets").append(self)
 
     IncidentRecord = property(getIncidentRecord, setIncidentRecord)
 
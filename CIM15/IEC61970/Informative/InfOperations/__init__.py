@@ -21,30 +21,8 @@
 """TODO: The following has been copied from a very old version of draft Part 11, so the references are wrong, but we store the knowledge here to reuse later: 'The Documentation package is used for the modeling of business documents. Some of these may be electronic realizations of legacy paper document, and some may be electronic information exchanges or collections. Documents will typically reference or describe one or more CIM objects. The DataSets package is used to describe documents tyically used for exchange of collections of object descriptions (e.g., NetworkDataSet). The operational package is used to define documents related to distribution operations business processes (e.g., OperationalRestriction, SwitchingSchedule). TroubleTickets are used by Customers to report problems related to the elctrical distribution network. TroubleTickets may be grouped and be related to a PlannedOutage, OutageNotification and/or PowerSystemResource. The Outage package defines classes related to outage management (OutageStep, OutageRecord, OutageReport).'
 """
 
-from CIM15.IEC61970.Informative.InfOperations.OutageRecord import OutageRecord
-from CIM15.IEC61970.Informative.InfOperations.OutageReport import OutageReport
-from CIM15.IEC61970.Informative.InfOperations.ChangeItem import ChangeItem
-from CIM15.IEC61970.Informative.InfOperations.PSREvent import PSREvent
-from CIM15.IEC61970.Informative.InfOperations.PlannedOutage import PlannedOutage
-from CIM15.IEC61970.Informative.InfOperations.CircuitSection import CircuitSection
-from CIM15.IEC61970.Informative.InfOperations.SafetyDocument import SafetyDocument
-from CIM15.IEC61970.Informative.InfOperations.OperationalRestriction import OperationalRestriction
-from CIM15.IEC61970.Informative.InfOperations.ChangeSet import ChangeSet
-from CIM15.IEC61970.Informative.InfOperations.SwitchingSchedule import SwitchingSchedule
-from CIM15.IEC61970.Informative.InfOperations.Circuit import Circuit
-from CIM15.IEC61970.Informative.InfOperations.NetworkDataSet import NetworkDataSet
-from CIM15.IEC61970.Informative.InfOperations.OutageStep import OutageStep
-from CIM15.IEC61970.Informative.InfOperations.OrgPsrRole import OrgPsrRole
-from CIM15.IEC61970.Informative.InfOperations.OutageCode import OutageCode
-from CIM15.IEC61970.Informative.InfOperations.IncidentCode import IncidentCode
-from CIM15.IEC61970.Informative.InfOperations.LandBase import LandBase
-from CIM15.IEC61970.Informative.InfOperations.ErpPersonScheduleStepRole import ErpPersonScheduleStepRole
-from CIM15.IEC61970.Informative.InfOperations.SwitchingStep import SwitchingStep
-from CIM15.IEC61970.Informative.InfOperations.CallBack import CallBack
-from CIM15.IEC61970.Informative.InfOperations.TroubleTicket import TroubleTicket
-from CIM15.IEC61970.Informative.InfOperations.IncidentRecord import IncidentRecord
-from CIM15.IEC61970.Informative.InfOperations.OutageNotification import OutageNotification
-from CIM15.IEC61970.Informative.InfOperations.OutageStepPsrRole import OutageStepPsrRole
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#InfOperations"
 nsPrefix = "cimInfOperations"
@@ -79,3 +57,31 @@ class OutageKind(str):
     """Values are: fixed, flexible, forced
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "OutageRecord",
+    "OutageReport",
+    "ChangeItem",
+    "PSREvent",
+    "PlannedOutage",
+    "CircuitSection",
+    "SafetyDocument",
+    "OperationalRestriction",
+    "ChangeSet",
+    "SwitchingSchedule",
+    "Circuit",
+    "NetworkDataSet",
+    "OutageStep",
+    "OrgPsrRole",
+    "OutageCode",
+    "IncidentCode",
+    "LandBase",
+    "ErpPersonScheduleStepRole",
+    "SwitchingStep",
+    "CallBack",
+    "TroubleTicket",
+    "IncidentRecord",
+    "OutageNotification",
+    "OutageStepPsrRole",
+])
@@ -100,4 +100,5 @@ class GeneratorTypeAsset(GenericAssetModelOrMaterial):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class TypeAssetCatalogue(IdentifiedObject):
     """Catalogue of generic types of assets (TypeAsset) that may be used for design purposes. It is not associated with a particular manufacturer.Catalogue of generic types of assets (TypeAsset) that may be used for design purposes. It is not associated with a particular manufacturer.
@@ -30,8 +31,8 @@ class TypeAssetCatalogue(IdentifiedObject):
         @param TypeAssets:
         @param status:
         """
-        self._TypeAssets = []
-        self.TypeAssets = [] if TypeAssets is None else TypeAssets
+        if TypeAssets is not None:
+            self.TypeAssets = TypeAssets
 
         self.status = status
 
@@ -43,13 +44,15 @@ class TypeAssetCatalogue(IdentifiedObject):
     _enums = {}
     _refs = ["TypeAssets", "status"]
     _many_refs = ["TypeAssets"]
+    _inverses = {"TypeAssets": "TypeAssetCatalogue"}
 
     def getTypeAssets(self):
         
         return self._TypeAssets
 
     def setTypeAssets(self, value):
-        for x in self._TypeAssets:
+        value = RefList(value)
+        for x in list(self._TypeAssets):
             x.TypeAssetCatalogue = None
         for y in value:
             y._TypeAssetCatalogue = self
@@ -19,9 +19,14 @@
 # IN THE SOFTWARE.
 
 
-from CIM15.IEC61970.Informative.InfTypeAsset.TypeAssetCatalogue import TypeAssetCatalogue
-from CIM15.IEC61970.Informative.InfTypeAsset.GeneratorTypeAsset import GeneratorTypeAsset
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#InfTypeAsset"
 nsPrefix = "cimInfTypeAsset"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "TypeAssetCatalogue",
+    "GeneratorTypeAsset",
+])
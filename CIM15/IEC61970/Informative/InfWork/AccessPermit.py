@@ -56,4 +56,5 @@ class AccessPermit(Document):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfCommon.ScheduledEvent import ScheduledEvent
+from CIM15.Element import RefList
 
 class Appointment(ScheduledEvent):
     """Meeting time and location.Meeting time and location.
@@ -42,8 +43,8 @@ class Appointment(ScheduledEvent):
 
         self.address = address
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
         self.meetingInterval = meetingInterval
 
@@ -58,6 +59,7 @@ class Appointment(ScheduledEvent):
     _enums = {}
     _refs = ["address", "ErpPersons", "meetingInterval", "CallBack"]
     _many_refs = ["ErpPersons"]
+    _inverses = {"ErpPersons": "Appointments", "CallBack": "Appointments"}
 
     # Address for appointment.
     address = None
@@ -68,20 +70,19 @@ class Appointment(ScheduledEvent):
 
     def setErpPersons(self, value):
         for p in self._ErpPersons:
-            filtered = [q for q in p.Appointments if q != self]
-            self._ErpPersons._Appointments = filtered
+            p._Appointments.discard(self)
         for r in value:
             if self not in r._Appointments:
-                r._Appointments.append(self)
-        self._ErpPersons = value
+                r._reflist("_Appointments").append(self)
+        self._ErpPersons = RefList(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
             if self not in obj._Appointments:
-                obj._Appointments.append(self)
-            self._ErpPersons.append(obj)
+                obj._reflist("_Appointments").append(self)
+            self._reflist("_ErpPersons").append(obj)
 
     def removeErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
@@ -98,13 +99,12 @@ class Appointment(ScheduledEvent):
 
     def setCallBack(self, value):
         if self._CallBack is not None:
-            filtered = [x for x in self.CallBack.Appointments if x != self]
-            self._CallBack._Appointments = filtered
+            self._CallBack._Appointments.discard(self)
 
         self._CallBack = value
         if self._CallBack is not None:
             if self not in self._CallBack._Appointments:
-                self._CallBack._Appointments.append(self)
+                self._CallBack._reflist("_Appointments").append(self)
 
     CallBack = property(getCallBack, setCallBack)
 
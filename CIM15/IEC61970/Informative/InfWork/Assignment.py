@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class Assignment(Document):
     """An assignment is given to an ErpPerson, Crew, Organisation, Equipment Item, Tool, etc. and may be used to perform Work, WorkTasks, Procedures, etc. TimeSchedules may be set up directly for Assignments or indirectly via the associated WorkTask. Note that these associations are all inherited through the recursive relationship on Document.An assignment is given to an ErpPerson, Crew, Organisation, Equipment Item, Tool, etc. and may be used to perform Work, WorkTasks, Procedures, etc. TimeSchedules may be set up directly for Assignments or indirectly via the associated WorkTask. Note that these associations are all inherited through the recursive relationship on Document.
@@ -30,8 +31,8 @@ class Assignment(Document):
         @param Crews: All Crews having this Assignment.
         @param effectivePeriod: Period between the assignment becoming effective and its expiration.
         """
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        if Crews is not None:
+            self.Crews = Crews
 
         self.effectivePeriod = effectivePeriod
 
@@ -43,6 +44,7 @@ class Assignment(Document):
     _enums = {}
     _refs = ["Crews", "effectivePeriod"]
     _many_refs = ["Crews"]
+    _inverses = {"Crews": "Assignments"}
 
     def getCrews(self):
         """All Crews having this Assignment.
@@ -51,20 +53,19 @@ class Assignment(Document):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.Assignments if q != self]
-            self._Crews._Assignments = filtered
+            p._Assignments.discard(self)
         for r in value:
             if self not in r._Assignments:
-                r._Assignments.append(self)
-        self._Crews = value
+                r._reflist("_Assignments").append(self)
+        self._Crews = RefList(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
             if self not in obj._Assignments:
-                obj._Assignments.append(self)
-            self._Crews.append(obj)
+                obj._reflist("_Assignments").append(self)
+            self._reflist("_Crews").append(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class BusinessCase(Document):
     """Business justification for capital expenditures, usually addressing operations and maintenance costs as well.Business justification for capital expenditures, usually addressing operations and maintenance costs as well.
@@ -34,11 +35,11 @@ class BusinessCase(Document):
         #: A codified representation of the business case (i.e., codes for highway relocation, replace substation transformers, etc.).
         self.corporateCode = corporateCode
 
-        self._Projects = []
-        self.Projects = [] if Projects is None else Projects
+        if Projects is not None:
+            self.Projects = Projects
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        if Works is not None:
+            self.Works = Works
 
         super(BusinessCase, self).__init__(*args, **kw_args)
 
@@ -48,13 +49,15 @@ class BusinessCase(Document):
     _enums = {}
     _refs = ["Projects", "Works"]
     _many_refs = ["Projects", "Works"]
+    _inverses = {"Projects": "BusinessCase", "Works": "BusinessCase"}
 
     def getProjects(self):
         
         return self._Projects
 
     def setProjects(self, value):
-        for x in self._Projects:
+        value = RefList(value)
+        for x in list(self._Projects):
             x.BusinessCase = None
         for y in value:
             y._BusinessCase = self
@@ -75,7 +78,8 @@ class BusinessCase(Document):
         return self._Works
 
     def setWorks(self, value):
-        for x in self._Works:
+        value = RefList(value)
+        for x in list(self._Works):
             x.BusinessCase = None
         for y in value:
             y._BusinessCase = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class CUAllowableAction(IdentifiedObject):
     """Allowed actions: Install, Remove, Transfer, Abandon, etc.Allowed actions: Install, Remove, Transfer, Abandon, etc.
@@ -30,8 +31,8 @@ class CUAllowableAction(IdentifiedObject):
         @param CompatibleUnits:
         @param status:
         """
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         self.status = status
 
@@ -43,13 +44,15 @@ class CUAllowableAction(IdentifiedObject):
     _enums = {}
     _refs = ["CompatibleUnits", "status"]
     _many_refs = ["CompatibleUnits"]
+    _inverses = {"CompatibleUnits": "CUAllowableAction"}
 
     def getCompatibleUnits(self):
         
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
-        for x in self._CompatibleUnits:
+        value = RefList(value)
+        for x in list(self._CompatibleUnits):
             x.CUAllowableAction = None
         for y in value:
             y._CUAllowableAction = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class CUAsset(IdentifiedObject):
     """Compatible unit for various types of assets such as transformers switches, substation fences, poles, etc..Compatible unit for various types of assets such as transformers switches, substation fences, poles, etc..
@@ -39,8 +40,8 @@ class CUAsset(IdentifiedObject):
         #: The code for this type of asset.
         self.typeAssetCode = typeAssetCode
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         self._TypeAsset = None
         self.TypeAsset = TypeAsset
@@ -55,6 +56,7 @@ class CUAsset(IdentifiedObject):
     _enums = {}
     _refs = ["CompatibleUnits", "TypeAsset", "status"]
     _many_refs = ["CompatibleUnits"]
+    _inverses = {"CompatibleUnits": "CUAssets", "TypeAsset": "CUAsset"}
 
     def getCompatibleUnits(self):
         
@@ -62,20 +64,19 @@ class CUAsset(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CUAssets if q != self]
-            self._CompatibleUnits._CUAssets = filtered
+            p._CUAssets.discard(self)
         for r in value:
             if self not in r._CUAssets:
-                r._CUAssets.append(self)
-        self._CompatibleUnits = value
+                r._reflist("_CUAssets").append(self)
+        self._CompatibleUnits = RefList(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
             if self not in obj._CUAssets:
-                obj._CUAssets.append(self)
-            self._CompatibleUnits.append(obj)
+                obj._reflist("_CUAssets").append(self)
+            self._reflist("_CompatibleUnits").append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class CUContractorItem(IdentifiedObject):
     """Compatible unit contractor item.Compatible unit contractor item.
@@ -38,8 +39,8 @@ class CUContractorItem(IdentifiedObject):
         #: Activity code identifies a specific and distinguishable unit of work.
         self.activityCode = activityCode
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         self.status = status
 
@@ -51,6 +52,7 @@ class CUContractorItem(IdentifiedObject):
     _enums = {}
     _refs = ["CompatibleUnits", "status"]
     _many_refs = ["CompatibleUnits"]
+    _inverses = {"CompatibleUnits": "CUContractorItems"}
 
     def getCompatibleUnits(self):
         
@@ -58,20 +60,19 @@ class CUContractorItem(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CUContractorItems if q != self]
-            self._CompatibleUnits._CUContractorItems = filtered
+            p._CUContractorItems.discard(self)
         for r in value:
             if self not in r._CUContractorItems:
-                r._CUContractorItems.append(self)
-        self._CompatibleUnits = value
+                r._reflist("_CUContractorItems").append(self)
+        self._CompatibleUnits = RefList(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
             if self not in obj._CUContractorItems:
-                obj._CUContractorItems.append(self)
-            self._CompatibleUnits.append(obj)
+                obj._reflist("_CUContractorItems").append(self)
+            self._reflist("_CompatibleUnits").append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class CUGroup(IdentifiedObject):
     """A Compatible Unit Group identifies a set of compatible units which may be jointly utilized for estimating and designating jobs.A Compatible Unit Group identifies a set of compatible units which may be jointly utilized for estimating and designating jobs.
@@ -33,19 +34,19 @@ class CUGroup(IdentifiedObject):
         @param status:
         @param DesignLocationCUs:
         """
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
-        self._ParentCUGroups = []
-        self.ParentCUGroups = [] if ParentCUGroups is None else ParentCUGroups
+        if ParentCUGroups is not None:
+            self.ParentCUGroups = ParentCUGroups
 
-        self._ChildCUGroups = []
-        self.ChildCUGroups = [] if ChildCUGroups is None else ChildCUGroups
+        if ChildCUGroups is not None:
+            self.ChildCUGroups = ChildCUGroups
 
         self.status = status
 
-        self._DesignLocationCUs = []
-        self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
+        if DesignLocationCUs is not None:
+            self.DesignLocationCUs = DesignLocationCUs
 
         super(CUGroup, self).__init__(*args, **kw_args)
 
@@ -55,13 +56,15 @@ class CUGroup(IdentifiedObject):
     _enums = {}
     _refs = ["CompatibleUnits", "ParentCUGroups", "ChildCUGroups", "status", "DesignLocationCUs"]
     _many_refs = ["CompatibleUnits", "ParentCUGroups", "ChildCUGroups", "DesignLocationCUs"]
+    _inverses = {"CompatibleUnits": "CUGroup", "ParentCUGroups": "ChildCUGroups", "ChildCUGroups": "ParentCUGroups", "DesignLocationCUs": "CUGroups"}
 
     def getCompatibleUnits(self):
         
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
-        for x in self._CompatibleUnits:
+        value = RefList(value)
+        for x in list(self._CompatibleUnits):
             x.CUGroup = None
         for y in value:
             y._CUGroup = self
@@ -83,20 +86,19 @@ class CUGroup(IdentifiedObject):
 
     def setParentCUGroups(self, value):
         for p in self._ParentCUGroups:
-            filtered = [q for q in p.ChildCUGroups if q != self]
-            self._ParentCUGroups._ChildCUGroups = filtered
+            p._ChildCUGroups.discard(self)
         for r in value:
             if self not in r._ChildCUGroups:
-                r._ChildCUGroups.append(self)
-        self._ParentCUGroups = value
+                r._reflist("_ChildCUGroups").append(self)
+        self._ParentCUGroups = RefList(value)
 
     ParentCUGroups = property(getParentCUGroups, setParentCUGroups)
 
     def addParentCUGroups(self, *ParentCUGroups):
         for obj in ParentCUGroups:
             if self not in obj._ChildCUGroups:
-                obj._ChildCUGroups.append(self)
-            self._ParentCUGroups.append(obj)
+                obj._reflist("_ChildCUGroups").append(self)
+            self._reflist("_ParentCUGroups").append(obj)
 
     def removeParentCUGroups(self, *ParentCUGroups):
         for obj in ParentCUGroups:
@@ -110,20 +112,19 @@ class CUGroup(IdentifiedObject):
 
     def setChildCUGroups(self, value):
         for p in self._ChildCUGroups:
-            filtered = [q for q in p.ParentCUGroups if q != self]
-            self._ChildCUGroups._ParentCUGroups = filtered
+            p._ParentCUGroups.discard(self)
         for r in value:
             if self not in r._ParentCUGroups:
-                r._ParentCUGroups.append(self)
-        self._ChildCUGroups = value
+                r._reflist("_ParentCUGroups").append(self)
+        self._ChildCUGroups = RefList(value)
 
     ChildCUGroups = property(getChildCUGroups, setChildCUGroups)
 
     def addChildCUGroups(self, *ChildCUGroups):
         for obj in ChildCUGroups:
             if self not in obj._ParentCUGroups:
-                obj._ParentCUGroups.append(self)
-            self._ChildCUGroups.append(obj)
+                obj._reflist("_ParentCUGroups").append(self)
+            self._reflist("_ChildCUGroups").append(obj)
 
     def removeChildCUGroups(self, *ChildCUGroups):
         for obj in ChildCUGroups:
@@ -139,20 +140,19 @@ class CUGroup(IdentifiedObject):
 
     def setDesignLocationCUs(self, value):
         for p in self._DesignLocationCUs:
-            filtered = [q for q in p.CUGroups if q != self]
-            self._DesignLocationCUs._CUGroups = filtered
+            p._CUGroups.discard(self)
         for r in value:
             if self not in r._CUGroups:
-                r._CUGroups.append(self)
-        self._DesignLocationCUs = value
+                r._reflist("_CUGroups").append(self)
+        self._DesignLocationCUs = RefList(value)
 
     DesignLocationCUs = property(getDesignLocationCUs, setDesignLocationCUs)
 
     def addDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
             if self not in obj._CUGroups:
-                obj._CUGroups.append(self)
-            self._DesignLocationCUs.append(obj)
+                obj._reflist("_CUGroups").append(self)
+            self._reflist("_DesignLocationCUs").append(obj)
 
     def removeDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class CULaborCode(IdentifiedObject):
     """Labor code associated with various compatible unit labor items.Labor code associated with various compatible unit labor items.
@@ -34,8 +35,8 @@ class CULaborCode(IdentifiedObject):
         #: Labor code.
         self.code = code
 
-        self._CULaborItems = []
-        self.CULaborItems = [] if CULaborItems is None else CULaborItems
+        if CULaborItems is not None:
+            self.CULaborItems = CULaborItems
 
         self.status = status
 
@@ -47,13 +48,15 @@ class CULaborCode(IdentifiedObject):
     _enums = {}
     _refs = ["CULaborItems", "status"]
     _many_refs = ["CULaborItems"]
+    _inverses = {"CULaborItems": "CULaborCode"}
 
     def getCULaborItems(self):
         
         return self._CULaborItems
 
     def setCULaborItems(self, value):
-        for x in self._CULaborItems:
+        value = RefList(value)
+        for x in list(self._CULaborItems):
             x.CULaborCode = None
         for y in value:
             y._CULaborCode = self
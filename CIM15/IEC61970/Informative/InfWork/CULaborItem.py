@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class CULaborItem(IdentifiedObject):
     """Compatible unit labor item.Compatible unit labor item.
@@ -44,16 +45,16 @@ class CULaborItem(IdentifiedObject):
         #: Activity code identifies a specific and distinguishable unit of work.
         self.activityCode = activityCode
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         self._CULaborCode = None
         self.CULaborCode = CULaborCode
 
         self.status = status
 
-        self._QualificationRequirements = []
-        self.QualificationRequirements = [] if QualificationRequirements is None else QualificationRequirements
+        if QualificationRequirements is not None:
+            self.QualificationRequirements = QualificationRequirements
 
         super(CULaborItem, self).__init__(*args, **kw_args)
 
@@ -63,6 +64,7 @@ class CULaborItem(IdentifiedObject):
     _enums = {}
     _refs = ["CompatibleUnits", "CULaborCode", "status", "QualificationRequirements"]
     _many_refs = ["CompatibleUnits", "QualificationRequirements"]
+    _inverses = {"CompatibleUnits": "CULaborItems", "CULaborCode": "CULaborItems", "QualificationRequirements": "CULaborItems"}
 
     def getCompatibleUnits(self):
         
@@ -70,20 +72,19 @@ class CULaborItem(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CULaborItems if q != self]
-            self._CompatibleUnits._CULaborItems = filtered
+            p._CULaborItems.discard(self)
         for r in value:
             if self not in r._CULaborItems:
-                r._CULaborItems.append(self)
-        self._CompatibleUnits = value
+                r._reflist("_CULaborItems").append(self)
+        self._CompatibleUnits = RefList(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
             if self not in obj._CULaborItems:
-                obj._CULaborItems.append(self)
-            self._CompatibleUnits.append(obj)
+                obj._reflist("_CULaborItems").append(self)
+            self._reflist("_CompatibleUnits").append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
@@ -97,13 +98,12 @@ class CULaborItem(IdentifiedObject):
 
     def setCULaborCode(self, value):
         if self._CULaborCode is not None:
-            filtered = [x for x in self.CULaborCode.CULaborItems if x != self]
-            self._CULaborCode._CULaborItems = filtered
+            self._CULaborCode._CULaborItems.discard(self)
 
         self._CULaborCode = value
         if self._CULaborCode is not None:
             if self not in self._CULaborCode._CULaborItems:
-                self._CULaborCode._CULaborItems.append(self)
+                self._CULaborCode._reflist("_CULaborItems").append(self)
 
     CULaborCode = property(getCULaborCode, setCULaborCode)
 
@@ -115,20 +115,19 @@ class CULaborItem(IdentifiedObject):
 
     def setQualificationRequirements(self, value):
         for p in self._QualificationRequirements:
-            filtered = [q for q in p.CULaborItems if q != self]
-            self._QualificationRequirements._CULaborItems = filtered
+            p._CULaborItems.discard(self)
         for r in value:
             if self not in r._CULaborItems:
-                r._CULaborItems.append(self)
-        self._QualificationRequirements = value
+                r._reflist("_CULaborItems").append(self)
+        self._QualificationRequirements = RefList(value)
 
     QualificationRequirements = property(getQualificationRequirements, setQualificationRequirements)
 
     def addQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
             if self not in obj._CULaborItems:
-                obj._CULaborItems.append(self)
-            self._QualificationRequirements.append(obj)
+                obj._reflist("_CULaborItems").append(self)
+            self._reflist("_QualificationRequirements").append(obj)
 
     def removeQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class CUMaterialItem(IdentifiedObject):
     """Compatible unit of a consumable supply item. For example, nuts, bolts, brackets, glue, etc.Compatible unit of a consumable supply item. For example, nuts, bolts, brackets, glue, etc.
@@ -42,11 +43,11 @@ class CUMaterialItem(IdentifiedObject):
 
         self.status = status
 
-        self._PropertyUnits = []
-        self.PropertyUnits = [] if PropertyUnits is None else PropertyUnits
+        if PropertyUnits is not None:
+            self.PropertyUnits = PropertyUnits
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         self._TypeMaterial = None
         self.TypeMaterial = TypeMaterial
@@ -59,6 +60,7 @@ class CUMaterialItem(IdentifiedObject):
     _enums = {}
     _refs = ["status", "PropertyUnits", "CompatibleUnits", "TypeMaterial"]
     _many_refs = ["PropertyUnits", "CompatibleUnits"]
+    _inverses = {"PropertyUnits": "CUMaterialItems", "CompatibleUnits": "CUMaterialItems", "TypeMaterial": "CUMaterialItems"}
 
     status = None
 
@@ -68,20 +70,19 @@ class CUMaterialItem(IdentifiedObject):
 
     def setPropertyUnits(self, value):
         for p in self._PropertyUnits:
-            filtered = [q for q in p.CUMaterialItems if q != self]
-            self._PropertyUnits._CUMaterialItems = filtered
+            p._CUMaterialItems.discard(self)
         for r in value:
             if self not in r._CUMaterialItems:
-                r._CUMaterialItems.append(self)
-        self._PropertyUnits = value
+                r._reflist("_CUMaterialItems").append(self)
+        self._PropertyUnits = RefList(value)
 
     PropertyUnits = property(getPropertyUnits, setPropertyUnits)
 
     def addPropertyUnits(self, *PropertyUnits):
         for obj in PropertyUnits:
             if self not in obj._CUMaterialItems:
-                obj._CUMaterialItems.append(self)
-            self._PropertyUnits.append(obj)
+                obj._reflist("_CUMaterialItems").append(self)
+            self._reflist("_PropertyUnits").append(obj)
 
     def removePropertyUnits(self, *PropertyUnits):
         for obj in PropertyUnits:
@@ -95,20 +96,19 @@ class CUMaterialItem(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CUMaterialItems if q != self]
-            self._CompatibleUnits._CUMaterialItems = filtered
+            p._CUMaterialItems.discard(self)
         for r in value:
             if self not in r._CUMaterialItems:
-                r._CUMaterialItems.append(self)
-        self._CompatibleUnits = value
+                r._reflist("_CUMaterialItems").append(self)
+        self._CompatibleUnits = RefList(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
             if self not in obj._CUMaterialItems:
-                obj._CUMaterialItems.append(self)
-            self._CompatibleUnits.append(obj)
+                obj._reflist("_CUMaterialItems").append(self)
+            self._reflist("_CompatibleUnits").append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
@@ -122,13 +122,12 @@ class CUMaterialItem(IdentifiedObject):
 
     def setTypeMaterial(self, value):
         if self._TypeMaterial is not None:
-            filtered = [x for x in self.TypeMaterial.CUMaterialItems if x != self]
-            self._TypeMaterial._CUMaterialItems = filtered
+            self._TypeMaterial._CUMaterialItems.discard(self)
 
         self._TypeMaterial = value
         if self._TypeMaterial is not None:
             if self not in self._TypeMaterial._CUMaterialItems:
-                self._TypeMaterial._CUMaterialItems.append(self)
+                self._TypeMaterial._reflist("_CUMaterialItems").append(self)
 
     TypeMaterial = property(getTypeMaterial, setTypeMaterial)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class CUWorkEquipmentItem(IdentifiedObject):
     """Compatible unit for various types of WorkEquipmentAssets, including vehicles.Compatible unit for various types of WorkEquipmentAssets, including vehicles.
@@ -44,8 +45,8 @@ class CUWorkEquipmentItem(IdentifiedObject):
 
         self.status = status
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         super(CUWorkEquipmentItem, self).__init__(*args, **kw_args)
 
@@ -55,6 +56,7 @@ class CUWorkEquipmentItem(IdentifiedObject):
     _enums = {}
     _refs = ["TypeAsset", "status", "CompatibleUnits"]
     _many_refs = ["CompatibleUnits"]
+    _inverses = {"TypeAsset": "CUWorkEquipmentAsset", "CompatibleUnits": "CUWorkEquipmentItems"}
 
     def getTypeAsset(self):
         
@@ -79,20 +81,19 @@ class CUWorkEquipmentItem(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.CUWorkEquipmentItems if q != self]
-            self._CompatibleUnits._CUWorkEquipmentItems = filtered
+            p._CUWorkEquipmentItems.discard(self)
         for r in value:
             if self not in r._CUWorkEquipmentItems:
-                r._CUWorkEquipmentItems.append(self)
-        self._CompatibleUnits = value
+                r._reflist("_CUWorkEquipmentItems").append(self)
+        self._CompatibleUnits = RefList(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
             if self not in obj._CUWorkEquipmentItems:
-                obj._CUWorkEquipmentItems.append(self)
-            self._CompatibleUnits.append(obj)
+                obj._reflist("_CUWorkEquipmentItems").append(self)
+            self._reflist("_CompatibleUnits").append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
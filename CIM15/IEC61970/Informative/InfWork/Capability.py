@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Capability(IdentifiedObject):
     """Capabilities of a crew.Capabilities of a crew.
@@ -44,13 +45,13 @@ class Capability(IdentifiedObject):
         self._Crew = None
         self.Crew = Crew
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
         self.status = status
 
-        self._Crafts = []
-        self.Crafts = [] if Crafts is None else Crafts
+        if Crafts is not None:
+            self.Crafts = Crafts
 
         self.validityInterval = validityInterval
 
@@ -62,6 +63,7 @@ class Capability(IdentifiedObject):
     _enums = {}
     _refs = ["Crew", "WorkTasks", "status", "Crafts", "validityInterval"]
     _many_refs = ["WorkTasks", "Crafts"]
+    _inverses = {"Crew": "Capabilities", "WorkTasks": "Capabilities", "Crafts": "Capabilities"}
 
     def getCrew(self):
         
@@ -69,13 +71,12 @@ class Capability(IdentifiedObject):
 
     def setCrew(self, value):
         if self._Crew is not None:
-            filtered = [x for x in self.Crew.Capabilities if x != self]
-            self._Crew._Capabilities = filtered
+            self._Crew._Capabilities.discard(self)
 
         self._Crew = value
         if self._Crew is not None:
             if self not in self._Crew._Capabilities:
-                self._Crew._Capabilities.append(self)
+                self._Crew._reflist("_Capabilities").append(self)
 
     Crew = property(getCrew, setCrew)
 
@@ -85,20 +86,19 @@ class Capability(IdentifiedObject):
 
     def setWorkTasks(self, value):
         for p in self._WorkTasks:
-            filtered = [q for q in p.Capabilities if q != self]
-            self._WorkTasks._Capabilities = filtered
+            p._Capabilities.discard(self)
         for r in value:
             if self not in r._Capabilities:
-                r._Capabilities.append(self)
-        self._WorkTasks = value
+                r._reflist("_Capabilities").append(self)
+        self._WorkTasks = RefList(value)
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
             if self not in obj._Capabilities:
-                obj._Capabilities.append(self)
-            self._WorkTasks.append(obj)
+                obj._reflist("_Capabilities").append(self)
+            self._reflist("_WorkTasks").append(obj)
 
     def removeWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
@@ -114,20 +114,19 @@ class Capability(IdentifiedObject):
 
     def setCrafts(self, value):
         for p in self._Crafts:
-            filtered = [q for q in p.Capabilities if q != self]
-            self._Crafts._Capabilities = filtered
+            p._Capabilities.discard(self)
         for r in value:
             if self not in r._Capabilities:
-                r._Capabilities.append(self)
-        self._Crafts = value
+                r._reflist("_Capabilities").append(self)
+        self._Crafts = RefList(value)
 
     Crafts = property(getCrafts, setCrafts)
 
     def addCrafts(self, *Crafts):
         for obj in Crafts:
             if self not in obj._Capabilities:
-                obj._Capabilities.append(self)
-            self._Crafts.append(obj)
+                obj._reflist("_Capabilities").append(self)
+            self._reflist("_Crafts").append(obj)
 
     def removeCrafts(self, *Crafts):
         for obj in Crafts:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class CompatibleUnit(Document):
     """A pre-planned job model containing labor, material, and accounting requirements for standardized job planning.A pre-planned job model containing labor, material, and accounting requirements for standardized job planning.
@@ -47,17 +48,17 @@ class CompatibleUnit(Document):
         #: Estimated total cost for perfoming CU.
         self.estCost = estCost
 
-        self._CUWorkEquipmentItems = []
-        self.CUWorkEquipmentItems = [] if CUWorkEquipmentItems is None else CUWorkEquipmentItems
+        if CUWorkEquipmentItems is not None:
+            self.CUWorkEquipmentItems = CUWorkEquipmentItems
 
-        self._DesignLocationCUs = []
-        self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
+        if DesignLocationCUs is not None:
+            self.DesignLocationCUs = DesignLocationCUs
 
         self._CUGroup = None
         self.CUGroup = CUGroup
 
-        self._CUAssets = []
-        self.CUAssets = [] if CUAssets is None else CUAssets
+        if CUAssets is not None:
+            self.CUAssets = CUAssets
 
         self._PropertyUnit = None
         self.PropertyUnit = PropertyUnit
@@ -68,17 +69,17 @@ class CompatibleUnit(Document):
         self._CUAllowableAction = None
         self.CUAllowableAction = CUAllowableAction
 
-        self._Procedures = []
-        self.Procedures = [] if Procedures is None else Procedures
+        if Procedures is not None:
+            self.Procedures = Procedures
 
-        self._CUContractorItems = []
-        self.CUContractorItems = [] if CUContractorItems is None else CUContractorItems
+        if CUContractorItems is not None:
+            self.CUContractorItems = CUContractorItems
 
-        self._CUMaterialItems = []
-        self.CUMaterialItems = [] if CUMaterialItems is None else CUMaterialItems
+        if CUMaterialItems is not None:
+            self.CUMaterialItems = CUMaterialItems
 
-        self._CULaborItems = []
-        self.CULaborItems = [] if CULaborItems is None else CULaborItems
+        if CULaborItems is not None:
+            self.CULaborItems = CULaborItems
 
         super(CompatibleUnit, self).__init__(*args, **kw_args)
 
@@ -88,6 +89,7 @@ class CompatibleUnit(Document):
     _enums = {}
     _refs = ["CUWorkEquipmentItems", "DesignLocationCUs", "CUGroup", "CUAssets", "PropertyUnit", "CostType", "CUAllowableAction", "Procedures", "CUContractorItems", "CUMaterialItems", "CULaborItems"]
     _many_refs = ["CUWorkEquipmentItems", "DesignLocationCUs", "CUAssets", "Procedures", "CUContractorItems", "CUMaterialItems", "CULaborItems"]
+    _inverses = {"CUWorkEquipmentItems": "CompatibleUnits", "DesignLocationCUs": "CompatibleUnits", "CUGroup": "CompatibleUnits", "CUAssets": "CompatibleUnits", "PropertyUnit": "CompatibleUnits", "CostType": "CompatibleUnits", "CUAllowableAction": "CompatibleUnits", "Procedures": "CompatibleUnits", "CUContractorItems": "CompatibleUnits", "CUMaterialItems": "CompatibleUnits", "CULaborItems": "CompatibleUnits"}
 
     def getCUWorkEquipmentItems(self):
         
@@ -95,20 +97,19 @@ class CompatibleUnit(Document):
 
     def setCUWorkEquipmentItems(self, value):
         for p in self._CUWorkEquipmentItems:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CUWorkEquipmentItems._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
             if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._CUWorkEquipmentItems = value
+                r._reflist("_CompatibleUnits").append(self)
+        self._CUWorkEquipmentItems = RefList(value)
 
     CUWorkEquipmentItems = property(getCUWorkEquipmentItems, setCUWorkEquipmentItems)
 
     def addCUWorkEquipmentItems(self, *CUWorkEquipmentItems):
         for obj in CUWorkEquipmentItems:
             if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CUWorkEquipmentItems.append(obj)
+                obj._reflist("_CompatibleUnits").append(self)
+            self._reflist("_CUWorkEquipmentItems").append(obj)
 
     def removeCUWorkEquipmentItems(self, *CUWorkEquipmentItems):
         for obj in CUWorkEquipmentItems:
@@ -122,20 +123,19 @@ class CompatibleUnit(Document):
 
     def setDesignLocationCUs(self, value):
         for p in self._DesignLocationCUs:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._DesignLocationCUs._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
             if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._DesignLocationCUs = value
+                r._reflist("_CompatibleUnits").append(self)
+        self._DesignLocationCUs = RefList(value)
 
     DesignLocationCUs = property(getDesignLocationCUs, setDesignLocationCUs)
 
     def addDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
             if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._DesignLocationCUs.append(obj)
+                obj._reflist("_CompatibleUnits").append(self)
+            self._reflist("_DesignLocationCUs").append(obj)
 
     def removeDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
@@ -149,13 +149,12 @@ class CompatibleUnit(Document):
 
     def setCUGroup(self, value):
         if self._CUGroup is not None:
-            filtered = [x for x in self.CUGroup.CompatibleUnits if x != self]
-            self._CUGroup._CompatibleUnits = filtered
+            self._CUGroup._CompatibleUnits.discard(self)
 
         self._CUGroup = value
         if self._CUGroup is not None:
             if self not in self._CUGroup._CompatibleUnits:
-                self._CUGroup._CompatibleUnits.append(self)
+                self._CUGroup._reflist("_CompatibleUnits").append(self)
 
     CUGroup = property(getCUGroup, setCUGroup)
 
@@ -165,20 +164,19 @@ class CompatibleUnit(Document):
 
     def setCUAssets(self, value):
         for p in self._CUAssets:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CUAssets._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
             if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._CUAssets = value
+                r._reflist("_CompatibleUnits").append(self)
+        self._CUAssets = RefList(value)
 
     CUAssets = property(getCUAssets, setCUAssets)
 
     def addCUAssets(self, *CUAssets):
         for obj in CUAssets:
             if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CUAssets.append(obj)
+                obj._reflist("_CompatibleUnits").append(self)
+            self._reflist("_CUAssets").append(obj)
 
     def removeCUAssets(self, *CUAssets):
         for obj in CUAssets:
@@ -192,13 +190,12 @@ class CompatibleUnit(Document):
 
     def setPropertyUnit(self, value):
         if self._PropertyUnit is not None:
-            filtered = [x for x in self.PropertyUnit.CompatibleUnits if x != self]
-            self._PropertyUnit._CompatibleUnits = filtered
+            self._PropertyUnit._CompatibleUnits.discard(self)
 
         self._PropertyUnit = value
         if self._PropertyUnit is not None:
             if self not in self._PropertyUnit._CompatibleUnits:
-                self._PropertyUnit._CompatibleUnits.append(self)
+                self._PropertyUnit._reflist("_CompatibleUnits").append(self)
 
     PropertyUnit = property(getPropertyUnit, setPropertyUnit)
 
@@ -208,13 +205,12 @@ class CompatibleUnit(Document):
 
     def setCostType(self, value):
         if self._CostType is not None:
-            filtered = [x for x in self.CostType.CompatibleUnits if x != self]
-            self._CostType._CompatibleUnits = filtered
+            self._CostType._CompatibleUnits.discard(self)
 
         self._CostType = value
         if self._CostType is not None:
             if self not in self._CostType._CompatibleUnits:
-                self._CostType._CompatibleUnits.append(self)
+                self._CostType._reflist("_CompatibleUnits").append(self)
 
     CostType = property(getCostType, setCostType)
 
@@ -224,13 +220,12 @@ class CompatibleUnit(Document):
 
     def setCUAllowableAction(self, value):
         if self._CUAllowableAction is not None:
-            filtered = [x for x in self.CUAllowableAction.CompatibleUnits if x != self]
-            self._CUAllowableAction._CompatibleUnits = filtered
+            self._CUAllowableAction._CompatibleUnits.discard(self)
 
         self._CUAllowableAction = value
         if self._CUAllowableAction is not None:
             if self not in self._CUAllowableAction._CompatibleUnits:
-                self._CUAllowableAction._CompatibleUnits.append(self)
+                self._CUAllowableAction._reflist("_CompatibleUnits").append(self)
 
     CUAllowableAction = property(getCUAllowableAction, setCUAllowableAction)
 
@@ -240,20 +235,19 @@ class CompatibleUnit(Document):
 
     def setProcedures(self, value):
         for p in self._Procedures:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._Procedures._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
             if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._Procedures = value
+                r._reflist("_CompatibleUnits").append(self)
+        self._Procedures = RefList(value)
 
     Procedures = property(getProcedures, setProcedures)
 
     def addProcedures(self, *Procedures):
         for obj in Procedures:
             if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._Procedures.append(obj)
+                obj._reflist("_CompatibleUnits").append(self)
+            self._reflist("_Procedures").append(obj)
 
     def removeProcedures(self, *Procedures):
         for obj in Procedures:
@@ -267,20 +261,19 @@ class CompatibleUnit(Document):
 
     def setCUContractorItems(self, value):
         for p in self._CUContractorItems:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CUContractorItems._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
             if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._CUContractorItems = value
+                r._reflist("_CompatibleUnits").append(self)
+        self._CUContractorItems = RefList(value)
 
     CUContractorItems = property(getCUContractorItems, setCUContractorItems)
 
     def addCUContractorItems(self, *CUContractorItems):
         for obj in CUContractorItems:
             if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CUContractorItems.append(obj)
+                obj._reflist("_CompatibleUnits").append(self)
+            self._reflist("_CUContractorItems").append(obj)
 
     def removeCUContractorItems(self, *CUContractorItems):
         for obj in CUContractorItems:
@@ -294,20 +287,19 @@ class CompatibleUnit(Document):
 
     def setCUMaterialItems(self, value):
         for p in self._CUMaterialItems:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CUMaterialItems._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
             if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._CUMaterialItems = value
+                r._reflist("_CompatibleUnits").append(self)
+        self._CUMaterialItems = RefList(value)
 
     CUMaterialItems = property(getCUMaterialItems, setCUMaterialItems)
 
     def addCUMaterialItems(self, *CUMaterialItems):
         for obj in CUMaterialItems:
             if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CUMaterialItems.append(obj)
+                obj._reflist("_CompatibleUnits").append(self)
+            self._reflist("_CUMaterialItems").append(obj)
 
     def removeCUMaterialItems(self, *CUMaterialItems):
         for obj in CUMaterialItems:
@@ -321,20 +313,19 @@ class CompatibleUnit(Document):
 
     def setCULaborItems(self, value):
         for p in self._CULaborItems:
-            filtered = [q for q in p.CompatibleUnits if q != self]
-            self._CULaborItems._CompatibleUnits = filtered
+            p._CompatibleUnits.discard(self)
         for r in value:
             if self not in r._CompatibleUnits:
-                r._CompatibleUnits.append(self)
-        self._CULaborItems = value
+                r._reflist("_CompatibleUnits").append(self)
+        self._CULaborItems = RefList(value)
 
     CULaborItems = property(getCULaborItems, setCULaborItems)
 
     def addCULaborItems(self, *CULaborItems):
         for obj in CULaborItems:
             if self not in obj._CompatibleUnits:
-                obj._CompatibleUnits.append(self)
-            self._CULaborItems.append(obj)
+                obj._reflist("_CompatibleUnits").append(self)
+            self._reflist("_CULaborItems").append(obj)
 
     def removeCULaborItems(self, *CULaborItems):
         for obj in CULaborItems:
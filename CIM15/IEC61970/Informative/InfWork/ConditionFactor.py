@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ConditionFactor(IdentifiedObject):
     """This is to specify the various condition factors for a design that may alter the cost estimate or the allocation.This is to specify the various condition factors for a design that may alter the cost estimate or the allocation.
@@ -40,16 +41,16 @@ class ConditionFactor(IdentifiedObject):
         #: The actual value of the condition factor, such as labor flat fee or percentage.
         self.cfValue = cfValue
 
-        self._Designs = []
-        self.Designs = [] if Designs is None else Designs
+        if Designs is not None:
+            self.Designs = Designs
 
-        self._DesignLocations = []
-        self.DesignLocations = [] if DesignLocations is None else DesignLocations
+        if DesignLocations is not None:
+            self.DesignLocations = DesignLocations
 
         self.status = status
 
-        self._DesignLocationCUs = []
-        self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
+        if DesignLocationCUs is not None:
+            self.DesignLocationCUs = DesignLocationCUs
 
         super(ConditionFactor, self).__init__(*args, **kw_args)
 
@@ -59,6 +60,7 @@ class ConditionFactor(IdentifiedObject):
     _enums = {"kind": "ConditionFactorKind"}
     _refs = ["Designs", "DesignLocations", "status", "DesignLocationCUs"]
     _many_refs = ["Designs", "DesignLocations", "DesignLocationCUs"]
+    _inverses = {"Designs": "ConditionFactors", "DesignLocations": "ConditionFactors", "DesignLocationCUs": "ConditionFactors"}
 
     def getDesigns(self):
         
@@ -66,20 +68,19 @@ class ConditionFactor(IdentifiedObject):
 
     def setDesigns(self, value):
         for p in self._Designs:
-            filtered = [q for q in p.ConditionFactors if q != self]
-            self._Designs._ConditionFactors = filtered
+            p._ConditionFactors.discard(self)
         for r in value:
             if self not in r._ConditionFactors:
-                r._ConditionFactors.append(self)
-        self._Designs = value
+                r._reflist("_ConditionFactors").append(self)
+        self._Designs = RefList(value)
 
     Designs = property(getDesigns, setDesigns)
 
     def addDesigns(self, *Designs):
         for obj in Designs:
             if self not in obj._ConditionFactors:
-                obj._ConditionFactors.append(self)
-            self._Designs.append(obj)
+                obj._reflist("_ConditionFactors").append(self)
+            self._reflist("_Designs").append(obj)
 
     def removeDesigns(self, *Designs):
         for obj in Designs:
@@ -93,20 +94,19 @@ class ConditionFactor(IdentifiedObject):
 
     def setDesignLocations(self, value):
         for p in self._DesignLocations:
-            filtered = [q for q in p.ConditionFactors if q != self]
-            self._DesignLocations._ConditionFactors = filtered
+            p._ConditionFactors.discard(self)
         for r in value:
             if self not in r._ConditionFactors:
-                r._ConditionFactors.append(self)
-        self._DesignLocations = value
+                r._reflist("_ConditionFactors").append(self)
+        self._DesignLocations = RefList(value)
 
     DesignLocations = property(getDesignLocations, setDesignLocations)
 
     def addDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
             if self not in obj._ConditionFactors:
-                obj._ConditionFactors.append(self)
-            self._DesignLocations.append(obj)
+                obj._reflist("_ConditionFactors").append(self)
+            self._reflist("_DesignLocations").append(obj)
 
     def removeDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
@@ -122,20 +122,19 @@ class ConditionFactor(IdentifiedObject):
 
     def setDesignLocationCUs(self, value):
         for p in self._DesignLocationCUs:
-            filtered = [q for q in p.ConditionFactors if q != self]
-            self._DesignLocationCUs._ConditionFactors = filtered
+            p._ConditionFactors.discard(self)
         for r in value:
             if self not in r._ConditionFactors:
-                r._ConditionFactors.append(self)
-        self._DesignLocationCUs = value
+                r._reflist("_ConditionFactors").append(self)
+        self._DesignLocationCUs = RefList(value)
 
     DesignLocationCUs = property(getDesignLocationCUs, setDesignLocationCUs)
 
     def addDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
             if self not in obj._ConditionFactors:
-                obj._ConditionFactors.append(self)
-            self._DesignLocationCUs.append(obj)
+                obj._reflist("_ConditionFactors").append(self)
+            self._reflist("_DesignLocationCUs").append(obj)
 
     def removeDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
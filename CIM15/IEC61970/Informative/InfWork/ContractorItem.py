@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ContractorItem(IdentifiedObject):
     """Contractor information for work task.Contractor information for work task.
@@ -47,8 +48,8 @@ class ContractorItem(IdentifiedObject):
         self._WorkTask = None
         self.WorkTask = WorkTask
 
-        self._ErpPayables = []
-        self.ErpPayables = [] if ErpPayables is None else ErpPayables
+        if ErpPayables is not None:
+            self.ErpPayables = ErpPayables
 
         self.status = status
 
@@ -63,6 +64,7 @@ class ContractorItem(IdentifiedObject):
     _enums = {}
     _refs = ["WorkTask", "ErpPayables", "status", "WorkCostDetail"]
     _many_refs = ["ErpPayables"]
+    _inverses = {"WorkTask": "ContractorItems", "ErpPayables": "ContractorItems", "WorkCostDetail": "ContractorItems"}
 
     def getWorkTask(self):
         
@@ -70,13 +72,12 @@ class ContractorItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.ContractorItems if x != self]
-            self._WorkTask._ContractorItems = filtered
+            self._WorkTask._ContractorItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
             if self not in self._WorkTask._ContractorItems:
-                self._WorkTask._ContractorItems.append(self)
+                self._WorkTask._reflist("_ContractorItems").append(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -86,20 +87,19 @@ class ContractorItem(IdentifiedObject):
 
     def setErpPayables(self, value):
         for p in self._ErpPayables:
-            filtered = [q for q in p.ContractorItems if q != self]
-            self._ErpPayables._ContractorItems = filtered
+            p._ContractorItems.discard(self)
         for r in value:
             if self not in r._ContractorItems:
-                r._ContractorItems.append(self)
-        self._ErpPayables = value
+                r._reflist("_ContractorItems").append(self)
+        self._ErpPayables = RefList(value)
 
     ErpPayables = property(getErpPayables, setErpPayables)
 
     def addErpPayables(self, *ErpPayables):
         for obj in ErpPayables:
             if self not in obj._ContractorItems:
-                obj._ContractorItems.append(self)
-            self._ErpPayables.append(obj)
+                obj._reflist("_ContractorItems").append(self)
+            self._reflist("_ErpPayables").append(obj)
 
     def removeErpPayables(self, *ErpPayables):
         for obj in ErpPayables:
@@ -115,13 +115,12 @@ class ContractorItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.ContractorItems if x != self]
-            self._WorkCostDetail._ContractorItems = filtered
+            self._WorkCostDetail._ContractorItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
             if self not in self._WorkCostDetail._ContractorItems:
-                self._WorkCostDetail._ContractorItems.append(self)
+                self._WorkCostDetail._reflist("_ContractorItems").append(self)
 
     WorkCostDetail = property(getWorkCostDetail, setWorkCostDetail)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class CostType(IdentifiedObject):
     """A categorization for resources, often costs, in accounting transactions. Examples include: material components, building in service, coal sales, overhead, etc.A categorization for resources, often costs, in accounting transactions. Examples include: material components, building in service, coal sales, overhead, etc.
@@ -50,20 +51,20 @@ class CostType(IdentifiedObject):
         #: True if an amount can be assigned to the resource element (e.g., building in service, transmission plant, software development capital); false otherwise (e.g., internal labor, material components).
         self.amountAssignable = amountAssignable
 
-        self._ErpJournalEntries = []
-        self.ErpJournalEntries = [] if ErpJournalEntries is None else ErpJournalEntries
+        if ErpJournalEntries is not None:
+            self.ErpJournalEntries = ErpJournalEntries
 
         self._ParentCostType = None
         self.ParentCostType = ParentCostType
 
-        self._ChildCostTypes = []
-        self.ChildCostTypes = [] if ChildCostTypes is None else ChildCostTypes
+        if ChildCostTypes is not None:
+            self.ChildCostTypes = ChildCostTypes
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
         self.status = status
 
@@ -75,6 +76,7 @@ class CostType(IdentifiedObject):
     _enums = {}
     _refs = ["ErpJournalEntries", "ParentCostType", "ChildCostTypes", "WorkCostDetails", "CompatibleUnits", "status"]
     _many_refs = ["ErpJournalEntries", "ChildCostTypes", "WorkCostDetails", "CompatibleUnits"]
+    _inverses = {"ErpJournalEntries": "CostTypes", "ParentCostType": "ChildCostTypes", "ChildCostTypes": "ParentCostType", "WorkCostDetails": "CostType", "CompatibleUnits": "CostType"}
 
     def getErpJournalEntries(self):
         
@@ -82,20 +84,19 @@ class CostType(IdentifiedObject):
 
     def setErpJournalEntries(self, value):
         for p in self._ErpJournalEntries:
-            filtered = [q for q in p.CostTypes if q != self]
-            self._ErpJournalEntries._CostTypes = filtered
+            p._CostTypes.discard(self)
         for r in value:
             if self not in r._CostTypes:
-                r._CostTypes.append(self)
-        self._ErpJournalEntries = value
+                r._reflist("_CostTypes").append(self)
+        self._ErpJournalEntries = RefList(value)
 
     ErpJournalEntries = property(getErpJournalEntries, setErpJournalEntries)
 
     def addErpJournalEntries(self, *ErpJournalEntries):
         for obj in ErpJournalEntries:
             if self not in obj._CostTypes:
-                obj._CostTypes.append(self)
-            self._ErpJournalEntries.append(obj)
+                obj._reflist("_CostTypes").append(self)
+            self._reflist("_ErpJournalEntries").append(obj)
 
     def removeErpJournalEntries(self, *ErpJournalEntries):
         for obj in ErpJournalEntries:
@@ -109,13 +110,12 @@ class CostType(IdentifiedObject):
 
     def setParentCostType(self, value):
         if self._ParentCostType is not None:
-            filtered = [x for x in self.ParentCostType.ChildCostTypes if x != self]
-            self._ParentCostType._ChildCostTypes = filtered
+            self._ParentCostType._ChildCostTypes.discard(self)
 
         self._ParentCostType = value
         if self._ParentCostType is not None:
             if self not in self._ParentCostType._ChildCostTypes:
-                self._ParentCostType._ChildCostTypes.append(self)
+                self._ParentCostType._reflist("_ChildCostTypes").append(self)
 
     ParentCostType = property(getParentCostType, setParentCostType)
 
@@ -124,7 +124,8 @@ class CostType(IdentifiedObject):
         return self._ChildCostTypes
 
     def setChildCostTypes(self, value):
-        for x in self._ChildCostTypes:
+        value = RefList(value)
+        for x in list(self._ChildCostTypes):
             x.ParentCostType = None
         for y in value:
             y._ParentCostType = self
@@ -145,7 +146,8 @@ class CostType(IdentifiedObject):
         return self._WorkCostDetails
 
     def setWorkCostDetails(self, value):
-        for x in self._WorkCostDetails:
+        value = RefList(value)
+        for x in list(self._WorkCostDetails):
             x.CostType = None
         for y in value:
             y._CostType = self
@@ -166,7 +168,8 @@ class CostType(IdentifiedObject):
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
-        for x in self._CompatibleUnits:
+        value = RefList(value)
+        for x in list(self._CompatibleUnits):
             x.CostType = None
         for y in value:
             y._CostType = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Crew(IdentifiedObject):
     """A crew is a group of people with specific skills, tools, and vehicles.A crew is a group of people with specific skills, tools, and vehicles.
@@ -45,44 +46,44 @@ class Crew(IdentifiedObject):
         #: Category by utility's work management standards and practices.
         self.category = category
 
-        self._Tools = []
-        self.Tools = [] if Tools is None else Tools
+        if Tools is not None:
+            self.Tools = Tools
 
-        self._SwitchingSchedules = []
-        self.SwitchingSchedules = [] if SwitchingSchedules is None else SwitchingSchedules
+        if SwitchingSchedules is not None:
+            self.SwitchingSchedules = SwitchingSchedules
 
         self._Route = None
         self.Route = Route
 
-        self._Capabilities = []
-        self.Capabilities = [] if Capabilities is None else Capabilities
+        if Capabilities is not None:
+            self.Capabilities = Capabilities
 
-        self._CrewMembers = []
-        self.CrewMembers = [] if CrewMembers is None else CrewMembers
+        if CrewMembers is not None:
+            self.CrewMembers = CrewMembers
 
-        self._OutageSteps = []
-        self.OutageSteps = [] if OutageSteps is None else OutageSteps
+        if OutageSteps is not None:
+            self.OutageSteps = OutageSteps
 
-        self._WorkEquipmentAssets = []
-        self.WorkEquipmentAssets = [] if WorkEquipmentAssets is None else WorkEquipmentAssets
+        if WorkEquipmentAssets is not None:
+            self.WorkEquipmentAssets = WorkEquipmentAssets
 
-        self._Assignments = []
-        self.Assignments = [] if Assignments is None else Assignments
+        if Assignments is not None:
+            self.Assignments = Assignments
 
-        self._Locations = []
-        self.Locations = [] if Locations is None else Locations
+        if Locations is not None:
+            self.Locations = Locations
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
-        self._Organisations = []
-        self.Organisations = [] if Organisations is None else Organisations
+        if Organisations is not None:
+            self.Organisations = Organisations
 
-        self._ShiftPatterns = []
-        self.ShiftPatterns = [] if ShiftPatterns is None else ShiftPatterns
+        if ShiftPatterns is not None:
+            self.ShiftPatterns = ShiftPatterns
 
-        self._Vehicles = []
-        self.Vehicles = [] if Vehicles is None else Vehicles
+        if Vehicles is not None:
+            self.Vehicles = Vehicles
 
         super(Crew, self).__init__(*args, **kw_args)
 
@@ -92,13 +93,15 @@ class Crew(IdentifiedObject):
     _enums = {}
     _refs = ["Tools", "SwitchingSchedules", "Route", "Capabilities", "CrewMembers", "OutageSteps", "WorkEquipmentAssets", "Assignments", "Locations", "WorkTasks", "Organisations", "ShiftPatterns", "Vehicles"]
     _many_refs = ["Tools", "SwitchingSchedules", "Capabilities", "CrewMembers", "OutageSteps", "WorkEquipmentAssets", "Assignments", "Locations", "WorkTasks", "Organisations", "ShiftPatterns", "Vehicles"]
+    _inverses = {"Tools": "Crew", "SwitchingSchedules": "Crews", "Route": "Crews", "Capabilities": "Crew", "CrewMembers": "Crews", "OutageSteps": "Crews", "WorkEquipmentAssets": "Crew", "Assignments": "Crews", "Locations": "Crews", "WorkTasks": "Crews", "Organisations": "Crews", "ShiftPatterns": "Crews", "Vehicles": "Crew"}
 
     def getTools(self):
         
         return self._Tools
 
     def setTools(self, value):
-        for x in self._Tools:
+        value = RefList(value)
+        for x in list(self._Tools):
             x.Crew = None
         for y in value:
             y._Crew = self
@@ -121,20 +124,19 @@ class Crew(IdentifiedObject):
 
     def setSwitchingSchedules(self, value):
         for p in self._SwitchingSchedules:
-            filtered = [q for q in p.Crews if q != self]
-            self._SwitchingSchedules._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
             if self not in r._Crews:
-                r._Crews.append(self)
-        self._SwitchingSchedules = value
+                r._reflist("_Crews").append(self)
+        self._SwitchingSchedules = RefList(value)
 
     SwitchingSchedules = property(getSwitchingSchedules, setSwitchingSchedules)
 
     def addSwitchingSchedules(self, *SwitchingSchedules):
         for obj in SwitchingSchedules:
             if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._SwitchingSchedules.append(obj)
+                obj._reflist("_Crews").append(self)
+            self._reflist("_SwitchingSchedules").append(obj)
 
     def removeSwitchingSchedules(self, *SwitchingSchedules):
         for obj in SwitchingSchedules:
@@ -148,13 +150,12 @@ class Crew(IdentifiedObject):
 
     def setRoute(self, value):
         if self._Route is not None:
-            filtered = [x for x in self.Route.Crews if x != self]
-            self._Route._Crews = filtered
+            self._Route._Crews.discard(self)
 
         self._Route = value
         if self._Route is not None:
             if self not in self._Route._Crews:
-                self._Route._Crews.append(self)
+                self._Route._reflist("_Crews").append(self)
 
     Route = property(getRoute, setRoute)
 
@@ -163,7 +164,8 @@ class Crew(IdentifiedObject):
         return self._Capabilities
 
     def setCapabilities(self, value):
-        for x in self._Capabilities:
+        value = RefList(value)
+        for x in list(self._Capabilities):
             x.Crew = None
         for y in value:
             y._Crew = self
@@ -186,20 +188,19 @@ class Crew(IdentifiedObject):
 
     def setCrewMembers(self, value):
         for p in self._CrewMembers:
-            filtered = [q for q in p.Crews if q != self]
-            self._CrewMembers._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
             if self not in r._Crews:
-                r._Crews.append(self)
-        self._CrewMembers = value
+                r._reflist("_Crews").append(self)
+        self._CrewMembers = RefList(value)
 
     CrewMembers = property(getCrewMembers, setCrewMembers)
 
     def addCrewMembers(self, *CrewMembers):
         for obj in CrewMembers:
             if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._CrewMembers.append(obj)
+                obj._reflist("_Crews").append(self)
+            self._reflist("_CrewMembers").append(obj)
 
     def removeCrewMembers(self, *CrewMembers):
         for obj in CrewMembers:
@@ -213,20 +214,19 @@ class Crew(IdentifiedObject):
 
     def setOutageSteps(self, value):
         for p in self._OutageSteps:
-            filtered = [q for q in p.Crews if q != self]
-            self._OutageSteps._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
             if self not in r._Crews:
-                r._Crews.append(self)
-        self._OutageSteps = value
+                r._reflist("_Crews").append(self)
+        self._OutageSteps = RefList(value)
 
     OutageSteps = property(getOutageSteps, setOutageSteps)
 
     def addOutageSteps(self, *OutageSteps):
         for obj in OutageSteps:
             if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._OutageSteps.append(obj)
+                obj._reflist("_Crews").append(self)
+            self._reflist("_OutageSteps").append(obj)
 
     def removeOutageSteps(self, *OutageSteps):
         for obj in OutageSteps:
@@ -239,7 +239,8 @@ class Crew(IdentifiedObject):
         return self._WorkEquipmentAssets
 
     def setWorkEquipmentAssets(self, value):
-        for x in self._WorkEquipmentAssets:
+        value = RefList(value)
+        for x in list(self._WorkEquipmentAssets):
             x.Crew = None
         for y in value:
             y._Crew = self
@@ -262,20 +263,19 @@ class Crew(IdentifiedObject):
 
     def setAssignments(self, value):
         for p in self._Assignments:
-            filtered = [q for q in p.Crews if q != self]
-            self._Assignments._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
             if self not in r._Crews:
-                r._Crews.append(self)
-        self._Assignments = value
+                r._reflist("_Crews").append(self)
+        self._Assignments = RefList(value)
 
     Assignments = property(getAssignments, setAssignments)
 
     def addAssignments(self, *Assignments):
         for obj in Assignments:
             if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._Assignments.append(obj)
+                obj._reflist("_Crews").append(self)
+            self._reflist("_Assignments").append(obj)
 
     def removeAssignments(self, *Assignments):
         for obj in Assignments:
@@ -289,20 +289,19 @@ class Crew(IdentifiedObject):
 
     def setLocations(self, value):
         for p in self._Locations:
-            filtered = [q for q in p.Crews if q != self]
-            self._Locations._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
             if self not in r._Crews:
-                r._Crews.append(self)
-        self._Locations = value
+                r._reflist("_Crews").append(self)
+        self._Locations = RefList(value)
 
     Locations = property(getLocations, setLocations)
 
     def addLocations(self, *Locations):
         for obj in Locations:
             if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._Locations.append(obj)
+                obj._reflist("_Crews").append(self)
+            self._reflist("_Locations").append(obj)
 
     def removeLocations(self, *Locations):
         for obj in Locations:
@@ -317,20 +316,19 @@ class Crew(IdentifiedObject):
 
     def setWorkTasks(self, value):
         for p in self._WorkTasks:
-            filtered = [q for q in p.Crews if q != self]
-            self._WorkTasks._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
             if self not in r._Crews:
-                r._Crews.append(self)
-        self._WorkTasks = value
+                r._reflist("_Crews").append(self)
+        self._WorkTasks = RefList(value)
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
             if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._WorkTasks.append(obj)
+                obj._reflist("_Crews").append(self)
+            self._reflist("_WorkTasks").append(obj)
 
     def removeWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
@@ -344,20 +342,19 @@ class Crew(IdentifiedObject):
 
     def setOrganisations(self, value):
         for p in self._Organisations:
-            filtered = [q for q in p.Crews if q != self]
-            self._Organisations._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
             if self not in r._Crews:
-                r._Crews.append(self)
-        self._Organisations = value
+                r._reflist("_Crews").append(self)
+        self._Organisations = RefList(value)
 
     Organisations = property(getOrganisations, setOrganisations)
 
     def addOrganisations(self, *Organisations):
         for obj in Organisations:
             if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._Organisations.append(obj)
+                obj._reflist("_Crews").append(self)
+            self._reflist("_Organisations").append(obj)
 
     def removeOrganisations(self, *Organisations):
         for obj in Organisations:
@@ -371,20 +368,19 @@ class Crew(IdentifiedObject):
 
     def setShiftPatterns(self, value):
         for p in self._ShiftPatterns:
-            filtered = [q for q in p.Crews if q != self]
-            self._ShiftPatterns._Crews = filtered
+            p._Crews.discard(self)
         for r in value:
             if self not in r._Crews:
-                r._Crews.append(self)
-        self._ShiftPatterns = value
+                r._reflist("_Crews").append(self)
+        self._ShiftPatterns = RefList(value)
 
     ShiftPatterns = property(getShiftPatterns, setShiftPatterns)
 
     def addShiftPatterns(self, *ShiftPatterns):
         for obj in ShiftPatterns:
             if self not in obj._Crews:
-                obj._Crews.append(self)
-            self._ShiftPatterns.append(obj)
+                obj._reflist("_Crews").append(self)
+            self._reflist("_ShiftPatterns").append(obj)
 
     def removeShiftPatterns(self, *ShiftPatterns):
         for obj in ShiftPatterns:
@@ -397,7 +393,8 @@ class Crew(IdentifiedObject):
         return self._Vehicles
 
     def setVehicles(self, value):
-        for x in self._Vehicles:
+        value = RefList(value)
+        for x in list(self._Vehicles):
             x.Crew = None
         for y in value:
             y._Crew = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class Design(Document):
     """A design for consideration by customers, potential customers, or internal work. Note that the Version of design is the revision attribute that is inherited from Document.A design for consideration by customers, potential customers, or internal work. Note that the Version of design is the revision attribute that is inherited from Document.
@@ -48,26 +49,26 @@ class Design(Document):
         #: Price to customer for implementing design.
         self.price = price
 
-        self._DesignLocations = []
-        self.DesignLocations = [] if DesignLocations is None else DesignLocations
+        if DesignLocations is not None:
+            self.DesignLocations = DesignLocations
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
-        self._ConditionFactors = []
-        self.ConditionFactors = [] if ConditionFactors is None else ConditionFactors
+        if ConditionFactors is not None:
+            self.ConditionFactors = ConditionFactors
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
-        self._ErpBOMs = []
-        self.ErpBOMs = [] if ErpBOMs is None else ErpBOMs
+        if ErpBOMs is not None:
+            self.ErpBOMs = ErpBOMs
 
         self._Work = None
         self.Work = Work
 
-        self._DesignLocationsCUs = []
-        self.DesignLocationsCUs = [] if DesignLocationsCUs is None else DesignLocationsCUs
+        if DesignLocationsCUs is not None:
+            self.DesignLocationsCUs = DesignLocationsCUs
 
         self._ErpQuoteLineItem = None
         self.ErpQuoteLineItem = ErpQuoteLineItem
@@ -80,6 +81,7 @@ class Design(Document):
     _enums = {"kind": "DesignKind"}
     _refs = ["DesignLocations", "WorkCostDetails", "ConditionFactors", "WorkTasks", "ErpBOMs", "Work", "DesignLocationsCUs", "ErpQuoteLineItem"]
     _many_refs = ["DesignLocations", "WorkCostDetails", "ConditionFactors", "WorkTasks", "ErpBOMs", "DesignLocationsCUs"]
+    _inverses = {"DesignLocations": "Designs", "WorkCostDetails": "Design", "ConditionFactors": "Designs", "WorkTasks": "Design", "ErpBOMs": "Design", "Work": "Designs", "DesignLocationsCUs": "Designs", "ErpQuoteLineItem": "Design"}
 
     def getDesignLocations(self):
         
@@ -87,20 +89,19 @@ class Design(Document):
 
     def setDesignLocations(self, value):
         for p in self._DesignLocations:
-            filtered = [q for q in p.Designs if q != self]
-            self._DesignLocations._Designs = filtered
+            p._Designs.discard(self)
         for r in value:
             if self not in r._Designs:
-                r._Designs.append(self)
-        self._DesignLocations = value
+                r._reflist("_Designs").append(self)
+        self._DesignLocations = RefList(value)
 
     DesignLocations = property(getDesignLocations, setDesignLocations)
 
     def addDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
             if self not in obj._Designs:
-                obj._Designs.append(self)
-            self._DesignLocations.append(obj)
+                obj._reflist("_Designs").append(self)
+            self._reflist("_DesignLocations").append(obj)
 
     def removeDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
@@ -113,7 +114,8 @@ class Design(Document):
         return self._WorkCostDetails
 
     def setWorkCostDetails(self, value):
-        for x in self._WorkCostDetails:
+        value = RefList(value)
+        for x in list(self._WorkCostDetails):
             x.Design = None
         for y in value:
             y._Design = self
@@ -135,20 +137,19 @@ class Design(Document):
 
     def setConditionFactors(self, value):
         for p in self._ConditionFactors:
-            filtered = [q for q in p.Designs if q != self]
-            self._ConditionFactors._Designs = filtered
+            p._Designs.discard(self)
         for r in value:
             if self not in r._Designs:
-                r._Designs.append(self)
-        self._ConditionFactors = value
+                r._reflist("_Designs").append(self)
+        self._ConditionFactors = RefList(value)
 
     ConditionFactors = property(getConditionFactors, setConditionFactors)
 
     def addConditionFactors(self, *ConditionFactors):
         for obj in ConditionFactors:
             if self not in obj._Designs:
-                obj._Designs.append(self)
-            self._ConditionFactors.append(obj)
+                obj._reflist("_Designs").append(self)
+            self._reflist("_ConditionFactors").append(obj)
 
     def removeConditionFactors(self, *ConditionFactors):
         for obj in ConditionFactors:
@@ -161,7 +162,8 @@ class Design(Document):
         return self._WorkTasks
 
     def setWorkTasks(self, value):
-        for x in self._WorkTasks:
+        value = RefList(value)
+        for x in list(self._WorkTasks):
             x.Design = None
         for y in value:
             y._Design = self
@@ -182,7 +184,8 @@ class Design(Document):
         return self._ErpBOMs
 
     def setErpBOMs(self, value):
-        for x in self._ErpBOMs:
+        value = RefList(value)
+        for x in list(self._ErpBOMs):
             x.Design = None
         for y in value:
             y._Design = self
@@ -204,13 +207,12 @@ class Design(Document):
 
     def setWork(self, value):
         if self._Work is not None:
-            filtered = [x for x in self.Work.Designs if x != self]
-            self._Work._Designs = filtered
+            self._Work._Designs.discard(self)
 
         self._Work = value
         if self._Work is not None:
             if self not in self._Work._Designs:
-                self._Work._Designs.append(self)
+                self._Work._reflist("_Designs").append(self)
 
     Work = property(getWork, setWork)
 
@@ -220,20 +222,19 @@ class Design(Document):
 
     def setDesignLocationsCUs(self, value):
         for p in self._DesignLocationsCUs:
-            filtered = [q for q in p.Designs if q != self]
-            self._DesignLocationsCUs._Designs = filtered
+            p._Designs.discard(self)
         for r in value:
             if self not in r._Designs:
-                r._Designs.append(self)
-        self._DesignLocationsCUs = value
+                r._reflist("_Designs").append(self)
+        self._DesignLocationsCUs = RefList(value)
 
     DesignLocationsCUs = property(getDesignLocationsCUs, setDesignLocationsCUs)
 
     def addDesignLocationsCUs(self, *DesignLocationsCUs):
         for obj in DesignLocationsCUs:
             if self not in obj._Designs:
-                obj._Designs.append(self)
-            self._DesignLocationsCUs.append(obj)
+                obj._reflist("_Designs").append(self)
+            self._reflist("_DesignLocationsCUs").append(obj)
 
     def removeDesignLocationsCUs(self, *DesignLocationsCUs):
         for obj in DesignLocationsCUs:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class DesignLocation(IdentifiedObject):
     """A logical part of the design (e.g., pole and all equipment on a pole). This includes points and spans.A logical part of the design (e.g., pole and all equipment on a pole). This includes points and spans.
@@ -43,29 +44,29 @@ class DesignLocation(IdentifiedObject):
 
         self.status = status
 
-        self._MaterialItems = []
-        self.MaterialItems = [] if MaterialItems is None else MaterialItems
+        if MaterialItems is not None:
+            self.MaterialItems = MaterialItems
 
-        self._Designs = []
-        self.Designs = [] if Designs is None else Designs
+        if Designs is not None:
+            self.Designs = Designs
 
-        self._DesignLocationCUs = []
-        self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
+        if DesignLocationCUs is not None:
+            self.DesignLocationCUs = DesignLocationCUs
 
-        self._WorkLocations = []
-        self.WorkLocations = [] if WorkLocations is None else WorkLocations
+        if WorkLocations is not None:
+            self.WorkLocations = WorkLocations
 
-        self._Diagrams = []
-        self.Diagrams = [] if Diagrams is None else Diagrams
+        if Diagrams is not None:
+            self.Diagrams = Diagrams
 
-        self._MiscCostItems = []
-        self.MiscCostItems = [] if MiscCostItems is None else MiscCostItems
+        if MiscCostItems is not None:
+            self.MiscCostItems = MiscCostItems
 
-        self._ErpBomItemDatas = []
-        self.ErpBomItemDatas = [] if ErpBomItemDatas is None else ErpBomItemDatas
+        if ErpBomItemDatas is not None:
+            self.ErpBomItemDatas = ErpBomItemDatas
 
-        self._ConditionFactors = []
-        self.ConditionFactors = [] if ConditionFactors is None else ConditionFactors
+        if ConditionFactors is not None:
+            self.ConditionFactors = ConditionFactors
 
         super(DesignLocation, self).__init__(*args, **kw_args)
 
@@ -75,6 +76,7 @@ class DesignLocation(IdentifiedObject):
     _enums = {}
     _refs = ["status", "MaterialItems", "Designs", "DesignLocationCUs", "WorkLocations", "Diagrams", "MiscCostItems", "ErpBomItemDatas", "ConditionFactors"]
     _many_refs = ["MaterialItems", "Designs", "DesignLocationCUs", "WorkLocations", "Diagrams", "MiscCostItems", "ErpBomItemDatas", "ConditionFactors"]
+    _inverses = {"MaterialItems": "DesignLocation", "Designs": "DesignLocations", "DesignLocationCUs": "DesignLocation", "WorkLocations": "DesignLocations", "Diagrams": "DesignLocations", "MiscCostItems": "DesignLocation", "ErpBomItemDatas": "DesignLocation", "ConditionFactors": "DesignLocations"}
 
     status = None
 
@@ -83,7 +85,8 @@ class DesignLocation(IdentifiedObject):
         return self._MaterialItems
 
     def setMaterialItems(self, value):
-        for x in self._MaterialItems:
+        value = RefList(value)
+        for x in list(self._MaterialItems):
             x.DesignLocation = None
         for y in value:
             y._DesignLocation = self
@@ -105,20 +108,19 @@ class DesignLocation(IdentifiedObject):
 
     def setDesigns(self, value):
         for p in self._Designs:
-            filtered = [q for q in p.DesignLocations if q != self]
-            self._Designs._DesignLocations = filtered
+            p._DesignLocations.discard(self)
         for r in value:
             if self not in r._DesignLocations:
-                r._DesignLocations.append(self)
-        self._Designs = value
+                r._reflist("_DesignLocations").append(self)
+        self._Designs = RefList(value)
 
     Designs = property(getDesigns, setDesigns)
 
     def addDesigns(self, *Designs):
         for obj in Designs:
             if self not in obj._DesignLocations:
-                obj._DesignLocations.append(self)
-            self._Designs.append(obj)
+                obj._reflist("_DesignLocations").append(self)
+            self._reflist("_Designs").append(obj)
 
     def removeDesigns(self, *Designs):
         for obj in Designs:
@@ -131,7 +133,8 @@ class DesignLocation(IdentifiedObject):
         return self._DesignLocationCUs
 
     def setDesignLocationCUs(self, value):
-        for x in self._DesignLocationCUs:
+        value = RefList(value)
+        for x in list(self._DesignLocationCUs):
             x.DesignLocation = None
         for y in value:
             y._DesignLocation = self
@@ -153,20 +156,19 @@ class DesignLocation(IdentifiedObject):
 
     def setWorkLocations(self, value):
         for p in self._WorkLocations:
-            filtered = [q for q in p.DesignLocations if q != self]
-            self._WorkLocations._DesignLocations = filtered
+            p._DesignLocations.discard(self)
         for r in value:
             if self not in r._DesignLocations:
-                r._DesignLocations.append(self)
-        self._WorkLocations = value
+                r._reflist("_DesignLocations").append(self)
+        self._WorkLocations = RefList(value)
 
     WorkLocations = property(getWorkLocations, setWorkLocations)
 
     def addWorkLocations(self, *WorkLocations):
         for obj in WorkLocations:
             if self not in obj._DesignLocations:
-                obj._DesignLocations.append(self)
-            self._WorkLocations.append(obj)
+                obj._reflist("_DesignLocations").append(self)
+            self._reflist("_WorkLocations").append(obj)
 
     def removeWorkLocations(self, *WorkLocations):
         for obj in WorkLocations:
@@ -180,20 +182,19 @@ class DesignLocation(IdentifiedObject):
 
     def setDiagrams(self, value):
         for p in self._Diagrams:
-            filtered = [q for q in p.DesignLocations if q != self]
-            self._Diagrams._DesignLocations = filtered
+            p._DesignLocations.discard(self)
         for r in value:
             if self not in r._DesignLocations:
-                r._DesignLocations.append(self)
-        self._Diagrams = value
+                r._reflist("_DesignLocations").append(self)
+        self._Diagrams = RefList(value)
 
     Diagrams = property(getDiagrams, setDiagrams)
 
     def addDiagrams(self, *Diagrams):
         for obj in Diagrams:
             if self not in obj._DesignLocations:
-                obj._DesignLocations.append(self)
-            self._Diagrams.append(obj)
+                obj._reflist("_DesignLocations").append(self)
+            self._reflist("_Diagrams").append(obj)
 
     def removeDiagrams(self, *Diagrams):
         for obj in Diagrams:
@@ -206,7 +207,8 @@ class DesignLocation(IdentifiedObject):
         return self._MiscCostItems
 
     def setMiscCostItems(self, value):
-        for x in self._MiscCostItems:
+        value = RefList(value)
+        for x in list(self._MiscCostItems):
             x.DesignLocation = None
         for y in value:
             y._DesignLocation = self
@@ -227,7 +229,8 @@ class DesignLocation(IdentifiedObject):
         return self._ErpBomItemDatas
 
     def setErpBomItemDatas(self, value):
-        for x in self._ErpBomItemDatas:
+        value = RefList(value)
+        for x in list(self._ErpBomItemDatas):
             x.DesignLocation = None
         for y in value:
             y._DesignLocation = self
@@ -249,20 +252,19 @@ class DesignLocation(IdentifiedObject):
 
     def setConditionFactors(self, value):
         for p in self._ConditionFactors:
-            filtered = [q for q in p.DesignLocations if q != self]
-            self._ConditionFactors._DesignLocations = filtered
+            p._DesignLocations.discard(self)
         for r in value:
             if self not in r._DesignLocations:
-                r._DesignLocations.append(self)
-        self._ConditionFactors = value
+                r._reflist("_DesignLocations").append(self)
+        self._ConditionFactors = RefList(value)
 
     ConditionFactors = property(getConditionFactors, setConditionFactors)
 
     def addConditionFactors(self, *ConditionFactors):
         for obj in ConditionFactors:
             if self not in obj._DesignLocations:
-                obj._DesignLocations.append(self)
-            self._ConditionFactors.append(obj)
+                obj._reflist("_DesignLocations").append(self)
+            self._reflist("_ConditionFactors").append(obj)
 
     def removeConditionFactors(self, *ConditionFactors):
         for obj in ConditionFactors:
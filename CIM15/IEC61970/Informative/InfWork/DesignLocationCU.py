@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class DesignLocationCU(IdentifiedObject):
     """Compatible unit at a given design location.Compatible unit at a given design location.
@@ -59,20 +60,20 @@ class DesignLocationCU(IdentifiedObject):
         #: The quantity of the CU being assigned to this location.
         self.cuQuantity = cuQuantity
 
-        self._ConditionFactors = []
-        self.ConditionFactors = [] if ConditionFactors is None else ConditionFactors
+        if ConditionFactors is not None:
+            self.ConditionFactors = ConditionFactors
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
-        self._Designs = []
-        self.Designs = [] if Designs is None else Designs
+        if Designs is not None:
+            self.Designs = Designs
 
-        self._CUGroups = []
-        self.CUGroups = [] if CUGroups is None else CUGroups
+        if CUGroups is not None:
+            self.CUGroups = CUGroups
 
         self._DesignLocation = None
         self.DesignLocation = DesignLocation
@@ -87,6 +88,7 @@ class DesignLocationCU(IdentifiedObject):
     _enums = {"cuAction": "WorkActionKind"}
     _refs = ["ConditionFactors", "CompatibleUnits", "WorkTasks", "Designs", "CUGroups", "DesignLocation", "status"]
     _many_refs = ["ConditionFactors", "CompatibleUnits", "WorkTasks", "Designs", "CUGroups"]
+    _inverses = {"ConditionFactors": "DesignLocationCUs", "CompatibleUnits": "DesignLocationCUs", "WorkTasks": "DesignLocationCUs", "Designs": "DesignLocationsCUs", "CUGroups": "DesignLocationCUs", "DesignLocation": "DesignLocationCUs"}
 
     def getConditionFactors(self):
         
@@ -94,20 +96,19 @@ class DesignLocationCU(IdentifiedObject):
 
     def setConditionFactors(self, value):
         for p in self._ConditionFactors:
-            filtered = [q for q in p.DesignLocationCUs if q != self]
-            self._ConditionFactors._DesignLocationCUs = filtered
+            p._DesignLocationCUs.discard(self)
         for r in value:
             if self not in r._DesignLocationCUs:
-                r._DesignLocationCUs.append(self)
-        self._ConditionFactors = value
+                r._reflist("_DesignLocationCUs").append(self)
+        self._ConditionFactors = RefList(value)
 
     ConditionFactors = property(getConditionFactors, setConditionFactors)
 
     def addConditionFactors(self, *ConditionFactors):
         for obj in ConditionFactors:
             if self not in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.append(self)
-            self._ConditionFactors.append(obj)
+                obj._reflist("_DesignLocationCUs").append(self)
+            self._reflist("_ConditionFactors").append(obj)
 
     def removeConditionFactors(self, *ConditionFactors):
         for obj in ConditionFactors:
@@ -121,20 +122,19 @@ class DesignLocationCU(IdentifiedObject):
 
     def setCompatibleUnits(self, value):
         for p in self._CompatibleUnits:
-            filtered = [q for q in p.DesignLocationCUs if q != self]
-            self._CompatibleUnits._DesignLocationCUs = filtered
+            p._DesignLocationCUs.discard(self)
         for r in value:
             if self not in r._DesignLocationCUs:
-                r._DesignLocationCUs.append(self)
-        self._CompatibleUnits = value
+                r._reflist("_DesignLocationCUs").append(self)
+        self._CompatibleUnits = RefList(value)
 
     CompatibleUnits = property(getCompatibleUnits, setCompatibleUnits)
 
     def addCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
             if self not in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.append(self)
-            self._CompatibleUnits.append(obj)
+                obj._reflist("_DesignLocationCUs").append(self)
+            self._reflist("_CompatibleUnits").append(obj)
 
     def removeCompatibleUnits(self, *CompatibleUnits):
         for obj in CompatibleUnits:
@@ -148,20 +148,19 @@ class DesignLocationCU(IdentifiedObject):
 
     def setWorkTasks(self, value):
         for p in self._WorkTasks:
-            filtered = [q for q in p.DesignLocationCUs if q != self]
-            self._WorkTasks._DesignLocationCUs = filtered
+            p._DesignLocationCUs.discard(self)
         for r in value:
             if self not in r._DesignLocationCUs:
-                r._DesignLocationCUs.append(self)
-        self._WorkTasks = value
+                r._reflist("_DesignLocationCUs").append(self)
+        self._WorkTasks = RefList(value)
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
             if self not in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.append(self)
-            self._WorkTasks.append(obj)
+                obj._reflist("_DesignLocationCUs").append(self)
+            self._reflist("_WorkTasks").append(obj)
 
     def removeWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
@@ -175,20 +174,19 @@ class DesignLocationCU(IdentifiedObject):
 
     def setDesigns(self, value):
         for p in self._Designs:
-            filtered = [q for q in p.DesignLocationsCUs if q != self]
-            self._Designs._DesignLocationsCUs = filtered
+            p._DesignLocationsCUs.discard(self)
         for r in value:
             if self not in r._DesignLocationsCUs:
-                r._DesignLocationsCUs.append(self)
-        self._Designs = value
+                r._reflist("_DesignLocationsCUs").append(self)
+        self._Designs = RefList(value)
 
     Designs = property(getDesigns, setDesigns)
 
     def addDesigns(self, *Designs):
         for obj in Designs:
             if self not in obj._DesignLocationsCUs:
-                obj._DesignLocationsCUs.append(self)
-            self._Designs.append(obj)
+                obj._reflist("_DesignLocationsCUs").append(self)
+            self._reflist("_Designs").append(obj)
 
     def removeDesigns(self, *Designs):
         for obj in Designs:
@@ -202,20 +200,19 @@ class DesignLocationCU(IdentifiedObject):
 
     def setCUGroups(self, value):
         for p in self._CUGroups:
-            filtered = [q for q in p.DesignLocationCUs if q != self]
-            self._CUGroups._DesignLocationCUs = filtered
+            p._DesignLocationCUs.discard(self)
         for r in value:
             if self not in r._DesignLocationCUs:
-                r._DesignLocationCUs.append(self)
-        self._CUGroups = value
+                r._reflist("_DesignLocationCUs").append(self)
+        self._CUGroups = RefList(value)
 
     CUGroups = property(getCUGroups, setCUGroups)
 
     def addCUGroups(self, *CUGroups):
         for obj in CUGroups:
             if self not in obj._DesignLocationCUs:
-                obj._DesignLocationCUs.append(self)
-            self._CUGroups.append(obj)
+                obj._reflist("_DesignLocationCUs").append(self)
+            self._reflist("_CUGroups").append(obj)
 
     def removeCUGroups(self, *CUGroups):
         for obj in CUGroups:
@@ -229,13 +226,12 @@ class DesignLocationCU(IdentifiedObject):
 
     def setDesignLocation(self, value):
         if self._DesignLocation is not None:
-            filtered = [x for x in self.DesignLocation.DesignLocationCUs if x != self]
-            self._DesignLocation._DesignLocationCUs = filtered
+            self._DesignLocation._DesignLocationCUs.discard(self)
 
         self._DesignLocation = value
         if self._DesignLocation is not None:
             if self not in self._DesignLocation._DesignLocationCUs:
-                self._DesignLocation._DesignLocationCUs.append(self)
+                self._DesignLocation._reflist("_DesignLocationCUs").append(self)
 
     DesignLocation = property(getDesignLocation, setDesignLocation)
 
@@ -88,4 +88,5 @@ class DiagnosisDataSet(ProcedureDataSet):
     _enums = {"phaseCode": "PhaseCode"}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -55,6 +55,7 @@ class EquipmentItem(IdentifiedObject):
     _enums = {}
     _refs = ["WorkTask", "WorkCostDetail", "status"]
     _many_refs = []
+    _inverses = {"WorkTask": "EquipmentItems", "WorkCostDetail": "EquipmentItems"}
 
     def getWorkTask(self):
         
@@ -62,13 +63,12 @@ class EquipmentItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.EquipmentItems if x != self]
-            self._WorkTask._EquipmentItems = filtered
+            self._WorkTask._EquipmentItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
             if self not in self._WorkTask._EquipmentItems:
-                self._WorkTask._EquipmentItems.append(self)
+                self._WorkTask._reflist("_EquipmentItems").append(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -78,13 +78,12 @@ class EquipmentItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.EquipmentItems if x != self]
-            self._WorkCostDetail._EquipmentItems = filtered
+            self._WorkCostDetail._EquipmentItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
             if self not in self._WorkCostDetail._EquipmentItems:
-                self._WorkCostDetail._EquipmentItems.append(self)
+                self._WorkCostDetail._reflist("_EquipmentItems").append(self)
 
     WorkCostDetail = property(getWorkCostDetail, setWorkCostDetail)
 
@@ -64,4 +64,5 @@ class InfoQuestion(Document):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Informative.InfAssets.ProcedureDataSet import ProcedureDataSet
+from CIM15.Element import RefList
 
 class InspectionDataSet(ProcedureDataSet):
     """Documents the result of one inspection, a type of Procedure, for a given attribute of an asset.Documents the result of one inspection, a type of Procedure, for a given attribute of an asset.
@@ -33,8 +34,8 @@ class InspectionDataSet(ProcedureDataSet):
         #: Description of the conditions of the location where the asset resides.
         self.locationCondition = locationCondition
 
-        self._AccordingToSchedules = []
-        self.AccordingToSchedules = [] if AccordingToSchedules is None else AccordingToSchedules
+        if AccordingToSchedules is not None:
+            self.AccordingToSchedules = AccordingToSchedules
 
         super(InspectionDataSet, self).__init__(*args, **kw_args)
 
@@ -44,13 +45,15 @@ class InspectionDataSet(ProcedureDataSet):
     _enums = {}
     _refs = ["AccordingToSchedules"]
     _many_refs = ["AccordingToSchedules"]
+    _inverses = {"AccordingToSchedules": "ForInspectionDataSet"}
 
     def getAccordingToSchedules(self):
         
         return self._AccordingToSchedules
 
     def setAccordingToSchedules(self, value):
-        for x in self._AccordingToSchedules:
+        value = RefList(value)
+        for x in list(self._AccordingToSchedules):
             x.ForInspectionDataSet = None
         for y in value:
             y._ForInspectionDataSet = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class LaborItem(IdentifiedObject):
     """Labor used for work order.Labor used for work order.
@@ -48,8 +49,8 @@ class LaborItem(IdentifiedObject):
         #: Activity code identifies a specific and distinguishable unit of work.
         self.activityCode = activityCode
 
-        self._ErpPersons = []
-        self.ErpPersons = [] if ErpPersons is None else ErpPersons
+        if ErpPersons is not None:
+            self.ErpPersons = ErpPersons
 
         self._WorkTask = None
         self.WorkTask = WorkTask
@@ -67,6 +68,7 @@ class LaborItem(IdentifiedObject):
     _enums = {}
     _refs = ["ErpPersons", "WorkTask", "status", "WorkCostDetail"]
     _many_refs = ["ErpPersons"]
+    _inverses = {"ErpPersons": "LaborItems", "WorkTask": "LaborItems", "WorkCostDetail": "LaborItems"}
 
     def getErpPersons(self):
         
@@ -74,20 +76,19 @@ class LaborItem(IdentifiedObject):
 
     def setErpPersons(self, value):
         for p in self._ErpPersons:
-            filtered = [q for q in p.LaborItems if q != self]
-            self._ErpPersons._LaborItems = filtered
+            p._LaborItems.discard(self)
         for r in value:
             if self not in r._LaborItems:
-                r._LaborItems.append(self)
-        self._ErpPersons = value
+                r._reflist("_LaborItems").append(self)
+        self._ErpPersons = RefList(value)
 
     ErpPersons = property(getErpPersons, setErpPersons)
 
     def addErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
             if self not in obj._LaborItems:
-                obj._LaborItems.append(self)
-            self._ErpPersons.append(obj)
+                obj._reflist("_LaborItems").append(self)
+            self._reflist("_ErpPersons").append(obj)
 
     def removeErpPersons(self, *ErpPersons):
         for obj in ErpPersons:
@@ -101,13 +102,12 @@ class LaborItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.LaborItems if x != self]
-            self._WorkTask._LaborItems = filtered
+            self._WorkTask._LaborItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
             if self not in self._WorkTask._LaborItems:
-                self._WorkTask._LaborItems.append(self)
+                self._WorkTask._reflist("_LaborItems").append(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -119,13 +119,12 @@ class LaborItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.LaborItems if x != self]
-            self._WorkCostDetail._LaborItems = filtered
+            self._WorkCostDetail._LaborItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
             if self not in self._WorkCostDetail._LaborItems:
-                self._WorkCostDetail._LaborItems.append(self)
+                self._WorkCostDetail._reflist("_LaborItems").append(self)
 
     WorkCostDetail = property(getWorkCostDetail, setWorkCostDetail)
 
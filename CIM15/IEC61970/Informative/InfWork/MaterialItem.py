@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class MaterialItem(IdentifiedObject):
     """The physical consumable supply used for work and other purposes. It includes items such as nuts, bolts, brackets, glue, etc.The physical consumable supply used for work and other purposes. It includes items such as nuts, bolts, brackets, glue, etc.
@@ -65,17 +66,17 @@ class MaterialItem(IdentifiedObject):
         #: The actual cost of this particular material in this particular quantity.
         self.actualCost = actualCost
 
-        self._ErpInventoryCounts = []
-        self.ErpInventoryCounts = [] if ErpInventoryCounts is None else ErpInventoryCounts
+        if ErpInventoryCounts is not None:
+            self.ErpInventoryCounts = ErpInventoryCounts
 
-        self._Usages = []
-        self.Usages = [] if Usages is None else Usages
+        if Usages is not None:
+            self.Usages = Usages
 
-        self._ErpPOLineItems = []
-        self.ErpPOLineItems = [] if ErpPOLineItems is None else ErpPOLineItems
+        if ErpPOLineItems is not None:
+            self.ErpPOLineItems = ErpPOLineItems
 
-        self._ErpRecDelvLineItems = []
-        self.ErpRecDelvLineItems = [] if ErpRecDelvLineItems is None else ErpRecDelvLineItems
+        if ErpRecDelvLineItems is not None:
+            self.ErpRecDelvLineItems = ErpRecDelvLineItems
 
         self._DesignLocation = None
         self.DesignLocation = DesignLocation
@@ -99,13 +100,15 @@ class MaterialItem(IdentifiedObject):
     _enums = {}
     _refs = ["ErpInventoryCounts", "Usages", "ErpPOLineItems", "ErpRecDelvLineItems", "DesignLocation", "status", "TypeMaterial", "WorkCostDetail", "WorkTask"]
     _many_refs = ["ErpInventoryCounts", "Usages", "ErpPOLineItems", "ErpRecDelvLineItems"]
+    _inverses = {"ErpInventoryCounts": "MaterialItem", "Usages": "MaterialItem", "ErpPOLineItems": "MaterialItem", "ErpRecDelvLineItems": "MaterialItems", "DesignLocation": "MaterialItems", "TypeMaterial": "MaterialItems", "WorkCostDetail": "MaterialItems", "WorkTask": "MaterialItems"}
 
     def getErpInventoryCounts(self):
         
         return self._ErpInventoryCounts
 
     def setErpInventoryCounts(self, value):
-        for x in self._ErpInventoryCounts:
+        value = RefList(value)
+        for x in list(self._ErpInventoryCounts):
             x.MaterialItem = None
         for y in value:
             y._MaterialItem = self
@@ -126,7 +129,8 @@ class MaterialItem(IdentifiedObject):
         return self._Usages
 
     def setUsages(self, value):
-        for x in self._Usages:
+        value = RefList(value)
+        for x in list(self._Usages):
             x.MaterialItem = None
         for y in value:
             y._MaterialItem = self
@@ -147,7 +151,8 @@ class MaterialItem(IdentifiedObject):
         return self._ErpPOLineItems
 
     def setErpPOLineItems(self, value):
-        for x in self._ErpPOLineItems:
+        value = RefList(value)
+        for x in list(self._ErpPOLineItems):
             x.MaterialItem = None
         for y in value:
             y._MaterialItem = self
@@ -169,20 +174,19 @@ class MaterialItem(IdentifiedObject):
 
     def setErpRecDelvLineItems(self, value):
         for p in self._ErpRecDelvLineItems:
-            filtered = [q for q in p.MaterialItems if q != self]
-            self._ErpRecDelvLineItems._MaterialItems = filtered
+            p._MaterialItems.discard(self)
         for r in value:
             if self not in r._MaterialItems:
-                r._MaterialItems.append(self)
-        self._ErpRecDelvLineItems = value
+                r._reflist("_MaterialItems").append(self)
+        self._ErpRecDelvLineItems = RefList(value)
 
     ErpRecDelvLineItems = property(getErpRecDelvLineItems, setErpRecDelvLineItems)
 
     def addErpRecDelvLineItems(self, *ErpRecDelvLineItems):
         for obj in ErpRecDelvLineItems:
             if self not in obj._MaterialItems:
-                obj._MaterialItems.append(self)
-            self._ErpRecDelvLineItems.append(obj)
+                obj._reflist("_MaterialItems").append(self)
+            self._reflist("_ErpRecDelvLineItems").append(obj)
 
     def removeErpRecDelvLineItems(self, *ErpRecDelvLineItems):
         for obj in ErpRecDelvLineItems:
@@ -196,13 +200,12 @@ class MaterialItem(IdentifiedObject):
 
     def setDesignLocation(self, value):
         if self._DesignLocation is not None:
-            filtered = [x for x in self.DesignLocation.MaterialItems if x != self]
-            self._DesignLocation._MaterialItems = filtered
+            self._DesignLocation._MaterialItems.discard(self)
 
         self._DesignLocation = value
         if self._DesignLocation is not None:
             if self not in self._DesignLocation._MaterialItems:
-                self._DesignLocation._MaterialItems.append(self)
+                self._DesignLocation._reflist("_MaterialItems").append(self)
 
     DesignLocation = property(getDesignLocation, setDesignLocation)
 
@@ -214,13 +217,12 @@ class MaterialItem(IdentifiedObject):
 
     def setTypeMaterial(self, value):
         if self._TypeMaterial is not None:
-            filtered = [x for x in self.TypeMaterial.MaterialItems if x != self]
-            self._TypeMaterial._MaterialItems = filtered
+            self._TypeMaterial._MaterialItems.discard(self)
 
         self._TypeMaterial = value
         if self._TypeMaterial is not None:
             if self not in self._TypeMaterial._MaterialItems:
-                self._TypeMaterial._MaterialItems.append(self)
+                self._TypeMaterial._reflist("_MaterialItems").append(self)
 
     TypeMaterial = property(getTypeMaterial, setTypeMaterial)
 
@@ -230,13 +232,12 @@ class MaterialItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.MaterialItems if x != self]
-            self._WorkCostDetail._MaterialItems = filtered
+            self._WorkCostDetail._MaterialItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
             if self not in self._WorkCostDetail._MaterialItems:
-                self._WorkCostDetail._MaterialItems.append(self)
+                self._WorkCostDetail._reflist("_MaterialItems").append(self)
 
     WorkCostDetail = property(getWorkCostDetail, setWorkCostDetail)
 
@@ -246,13 +247,12 @@ class MaterialItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.MaterialItems if x != self]
-            self._WorkTask._MaterialItems = filtered
+            self._WorkTask._MaterialItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
             if self not in self._WorkTask._MaterialItems:
-                self._WorkTask._MaterialItems.append(self)
+                self._WorkTask._reflist("_MaterialItems").append(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -71,6 +71,7 @@ class MiscCostItem(IdentifiedObject):
     _enums = {}
     _refs = ["DesignLocation", "status", "WorkTask", "WorkCostDetail"]
     _many_refs = []
+    _inverses = {"DesignLocation": "MiscCostItems", "WorkTask": "MiscCostItems", "WorkCostDetail": "MiscCostItems"}
 
     def getDesignLocation(self):
         
@@ -78,13 +79,12 @@ class MiscCostItem(IdentifiedObject):
 
     def setDesignLocation(self, value):
         if self._DesignLocation is not None:
-            filtered = [x for x in self.DesignLocation.MiscCostItems if x != self]
-            self._DesignLocation._MiscCostItems = filtered
+            self._DesignLocation._MiscCostItems.discard(self)
 
         self._DesignLocation = value
         if self._DesignLocation is not None:
             if self not in self._DesignLocation._MiscCostItems:
-                self._DesignLocation._MiscCostItems.append(self)
+                self._DesignLocation._reflist("_MiscCostItems").append(self)
 
     DesignLocation = property(getDesignLocation, setDesignLocation)
 
@@ -96,13 +96,12 @@ class MiscCostItem(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.MiscCostItems if x != self]
-            self._WorkTask._MiscCostItems = filtered
+            self._WorkTask._MiscCostItems.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
             if self not in self._WorkTask._MiscCostItems:
-                self._WorkTask._MiscCostItems.append(self)
+                self._WorkTask._reflist("_MiscCostItems").append(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -112,13 +111,12 @@ class MiscCostItem(IdentifiedObject):
 
     def setWorkCostDetail(self, value):
         if self._WorkCostDetail is not None:
-            filtered = [x for x in self.WorkCostDetail.MiscCostItems if x != self]
-            self._WorkCostDetail._MiscCostItems = filtered
+            self._WorkCostDetail._MiscCostItems.discard(self)
 
         self._WorkCostDetail = value
         if self._WorkCostDetail is not None:
             if self not in self._WorkCostDetail._MiscCostItems:
-                self._WorkCostDetail._MiscCostItems.append(self)
+                self._WorkCostDetail._reflist("_MiscCostItems").append(self)
 
     WorkCostDetail = property(getWorkCostDetail, setWorkCostDetail)
 
@@ -44,4 +44,5 @@ class NonStandardItem(Document):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
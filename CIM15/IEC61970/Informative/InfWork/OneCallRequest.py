@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class OneCallRequest(Document):
     """A request for other utilities to mark their underground facilities prior to commencement of construction and/or maintenance.A request for other utilities to mark their underground facilities prior to commencement of construction and/or maintenance.
@@ -41,8 +42,8 @@ class OneCallRequest(Document):
         #: Instructions for marking a dig area, if applicable.
         self.markingInstruction = markingInstruction
 
-        self._WorkLocations = []
-        self.WorkLocations = [] if WorkLocations is None else WorkLocations
+        if WorkLocations is not None:
+            self.WorkLocations = WorkLocations
 
         super(OneCallRequest, self).__init__(*args, **kw_args)
 
@@ -52,13 +53,15 @@ class OneCallRequest(Document):
     _enums = {}
     _refs = ["WorkLocations"]
     _many_refs = ["WorkLocations"]
+    _inverses = {"WorkLocations": "OneCallRequest"}
 
     def getWorkLocations(self):
         
         return self._WorkLocations
 
     def setWorkLocations(self, value):
-        for x in self._WorkLocations:
+        value = RefList(value)
+        for x in list(self._WorkLocations):
             x.OneCallRequest = None
         for y in value:
             y._OneCallRequest = self
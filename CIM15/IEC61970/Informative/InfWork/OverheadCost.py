@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class OverheadCost(IdentifiedObject):
     """Overhead cost applied to work order.Overhead cost applied to work order.
@@ -41,11 +42,11 @@ class OverheadCost(IdentifiedObject):
 
         self.status = status
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
         super(OverheadCost, self).__init__(*args, **kw_args)
 
@@ -55,6 +56,7 @@ class OverheadCost(IdentifiedObject):
     _enums = {}
     _refs = ["status", "WorkCostDetails", "WorkTasks"]
     _many_refs = ["WorkCostDetails", "WorkTasks"]
+    _inverses = {"WorkCostDetails": "OverheadCost", "WorkTasks": "OverheadCost"}
 
     status = None
 
@@ -63,7 +65,8 @@ class OverheadCost(IdentifiedObject):
         return self._WorkCostDetails
 
     def setWorkCostDetails(self, value):
-        for x in self._WorkCostDetails:
+        value = RefList(value)
+        for x in list(self._WorkCostDetails):
             x.OverheadCost = None
         for y in value:
             y._OverheadCost = self
@@ -84,7 +87,8 @@ class OverheadCost(IdentifiedObject):
         return self._WorkTasks
 
     def setWorkTasks(self, value):
-        for x in self._WorkTasks:
+        value = RefList(value)
+        for x in list(self._WorkTasks):
             x.OverheadCost = None
         for y in value:
             y._OverheadCost = self
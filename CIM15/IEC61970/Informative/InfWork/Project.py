@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class Project(Document):
     """A collection of related work. For construction projects and maintenance projects, multiple phases may be performed.A collection of related work. For construction projects and maintenance projects, multiple phases may be performed.
@@ -41,17 +42,17 @@ class Project(Document):
         self._BusinessCase = None
         self.BusinessCase = BusinessCase
 
-        self._SubProjects = []
-        self.SubProjects = [] if SubProjects is None else SubProjects
+        if SubProjects is not None:
+            self.SubProjects = SubProjects
 
         self._ErpProjectAccounting = None
         self.ErpProjectAccounting = ErpProjectAccounting
 
-        self._Requests = []
-        self.Requests = [] if Requests is None else Requests
+        if Requests is not None:
+            self.Requests = Requests
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        if Works is not None:
+            self.Works = Works
 
         self._ParentProject = None
         self.ParentProject = ParentProject
@@ -64,6 +65,7 @@ class Project(Document):
     _enums = {}
     _refs = ["BusinessCase", "SubProjects", "ErpProjectAccounting", "Requests", "Works", "ParentProject"]
     _many_refs = ["SubProjects", "Requests", "Works"]
+    _inverses = {"BusinessCase": "Projects", "SubProjects": "ParentProject", "ErpProjectAccounting": "Projects", "Requests": "Projects", "Works": "Project", "ParentProject": "SubProjects"}
 
     def getBusinessCase(self):
         
@@ -71,13 +73,12 @@ class Project(Document):
 
     def setBusinessCase(self, value):
         if self._BusinessCase is not None:
-            filtered = [x for x in self.BusinessCase.Projects if x != self]
-            self._BusinessCase._Projects = filtered
+            self._BusinessCase._Projects.discard(self)
 
         self._BusinessCase = value
         if self._BusinessCase is not None:
             if self not in self._BusinessCase._Projects:
-                self._BusinessCase._Projects.append(self)
+                self._BusinessCase._reflist("_Projects").append(self)
 
     BusinessCase = property(getBusinessCase, setBusinessCase)
 
@@ -86,7 +87,8 @@ class Project(Document):
         return self._SubProjects
 
     def setSubProjects(self, value):
-        for x in self._SubProjects:
+        value = RefList(value)
+        for x in list(self._SubProjects):
             x.ParentProject = None
         for y in value:
             y._ParentProject = self
@@ -108,13 +110,12 @@ class Project(Document):
 
     def setErpProjectAccounting(self, value):
         if self._ErpProjectAccounting is not None:
-            filtered = [x for x in self.ErpProjectAccounting.Projects if x != self]
-            self._ErpProjectAccounting._Projects = filtered
+            self._ErpProjectAccounting._Projects.discard(self)
 
         self._ErpProjectAccounting = value
         if self._ErpProjectAccounting is not None:
             if self not in self._ErpProjectAccounting._Projects:
-                self._ErpProjectAccounting._Projects.append(self)
+                self._ErpProjectAccounting._reflist("_Projects").append(self)
 
     ErpProjectAccounting = property(getErpProjectAccounting, setErpProjectAccounting)
 
@@ -124,20 +125,19 @@ class Project(Document):
 
     def setRequests(self, value):
         for p in self._Requests:
-            filtered = [q for q in p.Projects if q != self]
-            self._Requests._Projects = filtered
+            p._Projects.discard(self)
         for r in value:
             if self not in r._Projects:
-                r._Projects.append(self)
-        self._Requests = value
+                r._reflist("_Projects").append(self)
+        self._Requests = RefList(value)
 
     Requests = property(getRequests, setRequests)
 
     def addRequests(self, *Requests):
         for obj in Requests:
             if self not in obj._Projects:
-                obj._Projects.append(self)
-            self._Requests.append(obj)
+                obj._reflist("_Projects").append(self)
+            self._reflist("_Requests").append(obj)
 
     def removeRequests(self, *Requests):
         for obj in Requests:
@@ -150,7 +150,8 @@ class Project(Document):
         return self._Works
 
     def setWorks(self, value):
-        for x in self._Works:
+        value = RefList(value)
+        for x in list(self._Works):
             x.Project = None
         for y in value:
             y._Project = self
@@ -172,13 +173,12 @@ class Project(Document):
 
     def setParentProject(self, value):
         if self._ParentProject is not None:
-            filtered = [x for x in self.ParentProject.SubProjects if x != self]
-            self._ParentProject._SubProjects = filtered
+            self._ParentProject._SubProjects.discard(self)
 
         self._ParentProject = value
         if self._ParentProject is not None:
             if self not in self._ParentProject._SubProjects:
-                self._ParentProject._SubProjects.append(self)
+                self._ParentProject._reflist("_SubProjects").append(self)
 
     ParentProject = property(getParentProject, setParentProject)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class PropertyUnit(IdentifiedObject):
     """Unit of property for reporting purposes.Unit of property for reporting purposes.
@@ -46,14 +47,14 @@ class PropertyUnit(IdentifiedObject):
 
         self.status = status
 
-        self._CompatibleUnits = []
-        self.CompatibleUnits = [] if CompatibleUnits is None else CompatibleUnits
+        if CompatibleUnits is not None:
+            self.CompatibleUnits = CompatibleUnits
 
-        self._CUMaterialItems = []
-        self.CUMaterialItems = [] if CUMaterialItems is None else CUMaterialItems
+        if CUMaterialItems is not None:
+            self.CUMaterialItems = CUMaterialItems
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
         super(PropertyUnit, self).__init__(*args, **kw_args)
 
@@ -63,6 +64,7 @@ class PropertyUnit(IdentifiedObject):
     _enums = {"activityCode": "WorkActionKind"}
     _refs = ["status", "CompatibleUnits", "CUMaterialItems", "WorkCostDetails"]
     _many_refs = ["CompatibleUnits", "CUMaterialItems", "WorkCostDetails"]
+    _inverses = {"CompatibleUnits": "PropertyUnit", "CUMaterialItems": "PropertyUnits", "WorkCostDetails": "PropertyUnits"}
 
     status = None
 
@@ -71,7 +73,8 @@ class PropertyUnit(IdentifiedObject):
         return self._CompatibleUnits
 
     def setCompatibleUnits(self, value):
-        for x in self._CompatibleUnits:
+        value = RefList(value)
+        for x in list(self._CompatibleUnits):
             x.PropertyUnit = None
         for y in value:
             y._PropertyUnit = self
@@ -93,20 +96,19 @@ class PropertyUnit(IdentifiedObject):
 
     def setCUMaterialItems(self, value):
         for p in self._CUMaterialItems:
-            filtered = [q for q in p.PropertyUnits if q != self]
-            self._CUMaterialItems._PropertyUnits = filtered
+            p._PropertyUnits.discard(self)
         for r in value:
             if self not in r._PropertyUnits:
-                r._PropertyUnits.append(self)
-        self._CUMaterialItems = value
+                r._reflist("_PropertyUnits").append(self)
+        self._CUMaterialItems = RefList(value)
 
     CUMaterialItems = property(getCUMaterialItems, setCUMaterialItems)
 
     def addCUMaterialItems(self, *CUMaterialItems):
         for obj in CUMaterialItems:
             if self not in obj._PropertyUnits:
-                obj._PropertyUnits.append(self)
-            self._CUMaterialItems.append(obj)
+                obj._reflist("_PropertyUnits").append(self)
+            self._reflist("_CUMaterialItems").append(obj)
 
     def removeCUMaterialItems(self, *CUMaterialItems):
         for obj in CUMaterialItems:
@@ -120,20 +122,19 @@ class PropertyUnit(IdentifiedObject):
 
     def setWorkCostDetails(self, value):
         for p in self._WorkCostDetails:
-            filtered = [q for q in p.PropertyUnits if q != self]
-            self._WorkCostDetails._PropertyUnits = filtered
+            p._PropertyUnits.discard(self)
         for r in value:
             if self not in r._PropertyUnits:
-                r._PropertyUnits.append(self)
-        self._WorkCostDetails = value
+                r._reflist("_PropertyUnits").append(self)
+        self._WorkCostDetails = RefList(value)
 
     WorkCostDetails = property(getWorkCostDetails, setWorkCostDetails)
 
     def addWorkCostDetails(self, *WorkCostDetails):
         for obj in WorkCostDetails:
             if self not in obj._PropertyUnits:
-                obj._PropertyUnits.append(self)
-            self._WorkCostDetails.append(obj)
+                obj._reflist("_PropertyUnits").append(self)
+            self._reflist("_WorkCostDetails").append(obj)
 
     def removeWorkCostDetails(self, *WorkCostDetails):
         for obj in WorkCostDetails:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class QualificationRequirement(IdentifiedObject):
     """Certain skills are required and must be certified in order for a person (typically a member of a crew) to be qualified to work on types of equipment.Certain skills are required and must be certified in order for a person (typically a member of a crew) to be qualified to work on types of equipment.
@@ -36,17 +37,17 @@ class QualificationRequirement(IdentifiedObject):
         #: Qualification identifier.
         self.qualificationID = qualificationID
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
-        self._Skills = []
-        self.Skills = [] if Skills is None else Skills
+        if Skills is not None:
+            self.Skills = Skills
 
-        self._CULaborItems = []
-        self.CULaborItems = [] if CULaborItems is None else CULaborItems
+        if CULaborItems is not None:
+            self.CULaborItems = CULaborItems
 
-        self._Specifications = []
-        self.Specifications = [] if Specifications is None else Specifications
+        if Specifications is not None:
+            self.Specifications = Specifications
 
         super(QualificationRequirement, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class QualificationRequirement(IdentifiedObject):
     _enums = {}
     _refs = ["WorkTasks", "Skills", "CULaborItems", "Specifications"]
     _many_refs = ["WorkTasks", "Skills", "CULaborItems", "Specifications"]
+    _inverses = {"WorkTasks": "QualificationRequirements", "Skills": "QualificationRequirements", "CULaborItems": "QualificationRequirements", "Specifications": "QualificationRequirements"}
 
     def getWorkTasks(self):
         
@@ -63,20 +65,19 @@ class QualificationRequirement(IdentifiedObject):
 
     def setWorkTasks(self, value):
         for p in self._WorkTasks:
-            filtered = [q for q in p.QualificationRequirements if q != self]
-            self._WorkTasks._QualificationRequirements = filtered
+            p._QualificationRequirements.discard(self)
         for r in value:
             if self not in r._QualificationRequirements:
-                r._QualificationRequirements.append(self)
-        self._WorkTasks = value
+                r._reflist("_QualificationRequirements").append(self)
+        self._WorkTasks = RefList(value)
 
     WorkTasks = property(getWorkTasks, setWorkTasks)
 
     def addWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
             if self not in obj._QualificationRequirements:
-                obj._QualificationRequirements.append(self)
-            self._WorkTasks.append(obj)
+                obj._reflist("_QualificationRequirements").append(self)
+            self._reflist("_WorkTasks").append(obj)
 
     def removeWorkTasks(self, *WorkTasks):
         for obj in WorkTasks:
@@ -90,20 +91,19 @@ class QualificationRequirement(IdentifiedObject):
 
     def setSkills(self, value):
         for p in self._Skills:
-            filtered = [q for q in p.QualificationRequirements if q != self]
-            self._Skills._QualificationRequirements = filtered
+            p._QualificationRequirements.discard(self)
         for r in value:
             if self not in r._QualificationRequirements:
-                r._QualificationRequirements.append(self)
-        self._Skills = value
+                r._reflist("_QualificationRequirements").append(self)
+        self._Skills = RefList(value)
 
     Skills = property(getSkills, setSkills)
 
     def addSkills(self, *Skills):
         for obj in Skills:
             if self not in obj._QualificationRequirements:
-                obj._QualificationRequirements.append(self)
-            self._Skills.append(obj)
+                obj._reflist("_QualificationRequirements").append(self)
+            self._reflist("_Skills").append(obj)
 
     def removeSkills(self, *Skills):
         for obj in Skills:
@@ -117,20 +117,19 @@ class QualificationRequirement(IdentifiedObject):
 
     def setCULaborItems(self, value):
         for p in self._CULaborItems:
-            filtered = [q for q in p.QualificationRequirements if q != self]
-            self._CULaborItems._QualificationRequirements = filtered
+            p._QualificationRequirements.discard(self)
         for r in value:
             if self not in r._QualificationRequirements:
-                r._QualificationRequirements.append(self)
-        self._CULaborItems = value
+                r._reflist("_QualificationRequirements").append(self)
+        self._CULaborItems = RefList(value)
 
     CULaborItems = property(getCULaborItems, setCULaborItems)
 
     def addCULaborItems(self, *CULaborItems):
         for obj in CULaborItems:
             if self not in obj._QualificationRequirements:
-                obj._QualificationRequirements.append(self)
-            self._CULaborItems.append(obj)
+                obj._reflist("_QualificationRequirements").append(self)
+            self._reflist("_CULaborItems").append(obj)
 
     def removeCULaborItems(self, *CULaborItems):
         for obj in CULaborItems:
@@ -144,20 +143,19 @@ class QualificationRequirement(IdentifiedObject):
 
     def setSpecifications(self, value):
         for p in self._Specifications:
-            filtered = [q for q in p.QualificationRequirements if q != self]
-            self._Specifications._QualificationRequirements = filtered
+            p._QualificationRequirements.discard(self)
         for r in value:
             if self not in r._QualificationRequirements:
-                r._QualificationRequirements.append(self)
-        self._Specifications = value
+                r._reflist("_QualificationRequirements").append(self)
+        self._Specifications = RefList(value)
 
     Specifications = property(getSpecifications, setSpecifications)
 
     def addSpecifications(self, *Specifications):
         for obj in Specifications:
             if self not in obj._QualificationRequirements:
-                obj._QualificationRequirements.append(self)
-            self._Specifications.append(obj)
+                obj._reflist("_QualificationRequirements").append(self)
+            self._reflist("_Specifications").append(obj)
 
     def removeSpecifications(self, *Specifications):
         for obj in Specifications:
@@ -40,4 +40,5 @@ class Regulation(Document):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
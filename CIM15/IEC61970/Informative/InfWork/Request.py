@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class Request(Document):
     """A request for work, service or project.A request for work, service or project.
@@ -47,14 +48,14 @@ class Request(Document):
         self._ErpQuoteLineItem = None
         self.ErpQuoteLineItem = ErpQuoteLineItem
 
-        self._Projects = []
-        self.Projects = [] if Projects is None else Projects
+        if Projects is not None:
+            self.Projects = Projects
 
         self._Organisation = None
         self.Organisation = Organisation
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        if Works is not None:
+            self.Works = Works
 
         super(Request, self).__init__(*args, **kw_args)
 
@@ -64,6 +65,7 @@ class Request(Document):
     _enums = {}
     _refs = ["ErpQuoteLineItem", "Projects", "Organisation", "Works"]
     _many_refs = ["Projects", "Works"]
+    _inverses = {"ErpQuoteLineItem": "Request", "Projects": "Requests", "Organisation": "Requests", "Works": "Request"}
 
     def getErpQuoteLineItem(self):
         
@@ -86,20 +88,19 @@ class Request(Document):
 
     def setProjects(self, value):
         for p in self._Projects:
-            filtered = [q for q in p.Requests if q != self]
-            self._Projects._Requests = filtered
+            p._Requests.discard(self)
         for r in value:
             if self not in r._Requests:
-                r._Requests.append(self)
-        self._Projects = value
+                r._reflist("_Requests").append(self)
+        self._Projects = RefList(value)
 
     Projects = property(getProjects, setProjects)
 
     def addProjects(self, *Projects):
         for obj in Projects:
             if self not in obj._Requests:
-                obj._Requests.append(self)
-            self._Projects.append(obj)
+                obj._reflist("_Requests").append(self)
+            self._reflist("_Projects").append(obj)
 
     def removeProjects(self, *Projects):
         for obj in Projects:
@@ -113,13 +114,12 @@ class Request(Document):
 
     def setOrganisation(self, value):
         if self._Organisation is not None:
-            filtered = [x for x in self.Organisation.Requests if x != self]
-            self._Organisation._Requests = filtered
+            self._Organisation._Requests.discard(self)
 
         self._Organisation = value
         if self._Organisation is not None:
             if self not in self._Organisation._Requests:
-                self._Organisation._Requests.append(self)
+                self._Organisation._reflist("_Requests").append(self)
 
     Organisation = property(getOrganisation, setOrganisation)
 
@@ -128,7 +128,8 @@ class Request(Document):
         return self._Works
 
     def setWorks(self, value):
-        for x in self._Works:
+        value = RefList(value)
+        for x in list(self._Works):
             x.Request = None
         for y in value:
             y._Request = self
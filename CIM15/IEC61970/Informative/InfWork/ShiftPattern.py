@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ShiftPattern(IdentifiedObject):
     """The patterns of shifts worked by people or crews.The patterns of shifts worked by people or crews.
@@ -39,8 +40,8 @@ class ShiftPattern(IdentifiedObject):
         #: Type of assignement intended to be worked on this shift, for example, temporary, standard, etc.
         self.assignmentType = assignmentType
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        if Crews is not None:
+            self.Crews = Crews
 
         self.status = status
 
@@ -54,6 +55,7 @@ class ShiftPattern(IdentifiedObject):
     _enums = {}
     _refs = ["Crews", "status", "validityInterval"]
     _many_refs = ["Crews"]
+    _inverses = {"Crews": "ShiftPatterns"}
 
     def getCrews(self):
         
@@ -61,20 +63,19 @@ class ShiftPattern(IdentifiedObject):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.ShiftPatterns if q != self]
-            self._Crews._ShiftPatterns = filtered
+            p._ShiftPatterns.discard(self)
         for r in value:
             if self not in r._ShiftPatterns:
-                r._ShiftPatterns.append(self)
-        self._Crews = value
+                r._reflist("_ShiftPatterns").append(self)
+        self._Crews = RefList(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
             if self not in obj._ShiftPatterns:
-                obj._ShiftPatterns.append(self)
-            self._Crews.append(obj)
+                obj._reflist("_ShiftPatterns").append(self)
+            self._reflist("_Crews").append(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
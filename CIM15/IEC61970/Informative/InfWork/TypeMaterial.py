@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class TypeMaterial(Document):
     """Documentation for a generic material item that may be used for design, work and other purposes. Any number of MaterialItems manufactured by various vendors may be used to perform this TypeMaterial. Note that class analagous to 'AssetModel' is not used for material items. This is because in some cases, for example, a utility sets up a Master material record for a 3 inch long half inch diameter steel bolt and they do not necessarily care what specific supplier is providing the material item. As different vendors are used to supply the part, the Stock Code of the material item can stay the same. In other cases, each time the vendor changes, a new stock code is set up so they can track material used by vendor. Therefore a Material Item 'Model' is not typically needed.Documentation for a generic material item that may be used for design, work and other purposes. Any number of MaterialItems manufactured by various vendors may be used to perform this TypeMaterial. Note that class analagous to 'AssetModel' is not used for material items. This is because in some cases, for example, a utility sets up a Master material record for a 3 inch long half inch diameter steel bolt and they do not necessarily care what specific supplier is providing the material item. As different vendors are used to supply the part, the Stock Code of the material item can stay the same. In other cases, each time the vendor changes, a new stock code is set up so they can track material used by vendor. Therefore a Material Item 'Model' is not typically needed.
@@ -48,17 +49,17 @@ class TypeMaterial(Document):
         #: The estimated unit cost of this type of material, either for a unit cost or cost per unit length. Cost is for material or asset only and does not include labor to install/construct or configure it.
         self.estUnitCost = estUnitCost
 
-        self._ErpIssueInventories = []
-        self.ErpIssueInventories = [] if ErpIssueInventories is None else ErpIssueInventories
+        if ErpIssueInventories is not None:
+            self.ErpIssueInventories = ErpIssueInventories
 
-        self._MaterialItems = []
-        self.MaterialItems = [] if MaterialItems is None else MaterialItems
+        if MaterialItems is not None:
+            self.MaterialItems = MaterialItems
 
-        self._CUMaterialItems = []
-        self.CUMaterialItems = [] if CUMaterialItems is None else CUMaterialItems
+        if CUMaterialItems is not None:
+            self.CUMaterialItems = CUMaterialItems
 
-        self._ErpReqLineItems = []
-        self.ErpReqLineItems = [] if ErpReqLineItems is None else ErpReqLineItems
+        if ErpReqLineItems is not None:
+            self.ErpReqLineItems = ErpReqLineItems
 
         super(TypeMaterial, self).__init__(*args, **kw_args)
 
@@ -68,13 +69,15 @@ class TypeMaterial(Document):
     _enums = {}
     _refs = ["ErpIssueInventories", "MaterialItems", "CUMaterialItems", "ErpReqLineItems"]
     _many_refs = ["ErpIssueInventories", "MaterialItems", "CUMaterialItems", "ErpReqLineItems"]
+    _inverses = {"ErpIssueInventories": "TypeMaterial", "MaterialItems": "TypeMaterial", "CUMaterialItems": "TypeMaterial", "ErpReqLineItems": "TypeMaterial"}
 
     def getErpIssueInventories(self):
         
         return self._ErpIssueInventories
 
     def setErpIssueInventories(self, value):
-        for x in self._ErpIssueInventories:
+        value = RefList(value)
+        for x in list(self._ErpIssueInventories):
             x.TypeMaterial = None
         for y in value:
             y._TypeMaterial = self
@@ -95,7 +98,8 @@ class TypeMaterial(Document):
         return self._MaterialItems
 
     def setMaterialItems(self, value):
-        for x in self._MaterialItems:
+        value = RefList(value)
+        for x in list(self._MaterialItems):
             x.TypeMaterial = None
         for y in value:
             y._TypeMaterial = self
@@ -116,7 +120,8 @@ class TypeMaterial(Document):
         return self._CUMaterialItems
 
     def setCUMaterialItems(self, value):
-        for x in self._CUMaterialItems:
+        value = RefList(value)
+        for x in list(self._CUMaterialItems):
             x.TypeMaterial = None
         for y in value:
             y._TypeMaterial = self
@@ -137,7 +142,8 @@ class TypeMaterial(Document):
         return self._ErpReqLineItems
 
     def setErpReqLineItems(self, value):
-        for x in self._ErpReqLineItems:
+        value = RefList(value)
+        for x in list(self._ErpReqLineItems):
             x.TypeMaterial = None
         for y in value:
             y._TypeMaterial = self
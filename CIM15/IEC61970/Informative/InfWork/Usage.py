@@ -51,6 +51,7 @@ class Usage(IdentifiedObject):
     _enums = {}
     _refs = ["WorkTask", "WorkEquipmentAsset", "status", "MaterialItem"]
     _many_refs = []
+    _inverses = {"WorkTask": "Usages", "WorkEquipmentAsset": "Usages", "MaterialItem": "Usages"}
 
     def getWorkTask(self):
         
@@ -58,13 +59,12 @@ class Usage(IdentifiedObject):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.Usages if x != self]
-            self._WorkTask._Usages = filtered
+            self._WorkTask._Usages.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
             if self not in self._WorkTask._Usages:
-                self._WorkTask._Usages.append(self)
+                self._WorkTask._reflist("_Usages").append(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -74,13 +74,12 @@ class Usage(IdentifiedObject):
 
     def setWorkEquipmentAsset(self, value):
         if self._WorkEquipmentAsset is not None:
-            filtered = [x for x in self.WorkEquipmentAsset.Usages if x != self]
-            self._WorkEquipmentAsset._Usages = filtered
+            self._WorkEquipmentAsset._Usages.discard(self)
 
         self._WorkEquipmentAsset = value
         if self._WorkEquipmentAsset is not None:
             if self not in self._WorkEquipmentAsset._Usages:
-                self._WorkEquipmentAsset._Usages.append(self)
+                self._WorkEquipmentAsset._reflist("_Usages").append(self)
 
     WorkEquipmentAsset = property(getWorkEquipmentAsset, setWorkEquipmentAsset)
 
@@ -92,13 +91,12 @@ class Usage(IdentifiedObject):
 
     def setMaterialItem(self, value):
         if self._MaterialItem is not None:
-            filtered = [x for x in self.MaterialItem.Usages if x != self]
-            self._MaterialItem._Usages = filtered
+            self._MaterialItem._Usages.discard(self)
 
         self._MaterialItem = value
         if self._MaterialItem is not None:
             if self not in self._MaterialItem._Usages:
-                self._MaterialItem._Usages.append(self)
+                self._MaterialItem._reflist("_Usages").append(self)
 
     MaterialItem = property(getMaterialItem, setMaterialItem)
 
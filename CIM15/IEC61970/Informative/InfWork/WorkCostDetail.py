@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class WorkCostDetail(Document):
     """A collection of all of the individual cost items collected from multiple sources.A collection of all of the individual cost items collected from multiple sources.
@@ -60,35 +61,35 @@ class WorkCostDetail(Document):
         self._WorkTask = None
         self.WorkTask = WorkTask
 
-        self._Works = []
-        self.Works = [] if Works is None else Works
+        if Works is not None:
+            self.Works = Works
 
         self._Design = None
         self.Design = Design
 
-        self._MiscCostItems = []
-        self.MiscCostItems = [] if MiscCostItems is None else MiscCostItems
+        if MiscCostItems is not None:
+            self.MiscCostItems = MiscCostItems
 
         self._WorkCostSummary = None
         self.WorkCostSummary = WorkCostSummary
 
-        self._PropertyUnits = []
-        self.PropertyUnits = [] if PropertyUnits is None else PropertyUnits
+        if PropertyUnits is not None:
+            self.PropertyUnits = PropertyUnits
 
         self._ErpProjectAccounting = None
         self.ErpProjectAccounting = ErpProjectAccounting
 
-        self._LaborItems = []
-        self.LaborItems = [] if LaborItems is None else LaborItems
+        if LaborItems is not None:
+            self.LaborItems = LaborItems
 
-        self._MaterialItems = []
-        self.MaterialItems = [] if MaterialItems is None else MaterialItems
+        if MaterialItems is not None:
+            self.MaterialItems = MaterialItems
 
-        self._EquipmentItems = []
-        self.EquipmentItems = [] if EquipmentItems is None else EquipmentItems
+        if EquipmentItems is not None:
+            self.EquipmentItems = EquipmentItems
 
-        self._ContractorItems = []
-        self.ContractorItems = [] if ContractorItems is None else ContractorItems
+        if ContractorItems is not None:
+            self.ContractorItems = ContractorItems
 
         self._OverheadCost = None
         self.OverheadCost = OverheadCost
@@ -104,6 +105,7 @@ class WorkCostDetail(Document):
     _enums = {}
     _refs = ["WorkTask", "Works", "Design", "MiscCostItems", "WorkCostSummary", "PropertyUnits", "ErpProjectAccounting", "LaborItems", "MaterialItems", "EquipmentItems", "ContractorItems", "OverheadCost", "CostType"]
     _many_refs = ["Works", "MiscCostItems", "PropertyUnits", "LaborItems", "MaterialItems", "EquipmentItems", "ContractorItems"]
+    _inverses = {"WorkTask": "WorkCostDetails", "Works": "WorkCostDetails", "Design": "WorkCostDetails", "MiscCostItems": "WorkCostDetail", "WorkCostSummary": "WorkCostDetail", "PropertyUnits": "WorkCostDetails", "ErpProjectAccounting": "WorkCostDetails", "LaborItems": "WorkCostDetail", "MaterialItems": "WorkCostDetail", "EquipmentItems": "WorkCostDetail", "ContractorItems": "WorkCostDetail", "OverheadCost": "WorkCostDetails", "CostType": "WorkCostDetails"}
 
     def getWorkTask(self):
         
@@ -111,13 +113,12 @@ class WorkCostDetail(Document):
 
     def setWorkTask(self, value):
         if self._WorkTask is not None:
-            filtered = [x for x in self.WorkTask.WorkCostDetails if x != self]
-            self._WorkTask._WorkCostDetails = filtered
+            self._WorkTask._WorkCostDetails.discard(self)
 
         self._WorkTask = value
         if self._WorkTask is not None:
             if self not in self._WorkTask._WorkCostDetails:
-                self._WorkTask._WorkCostDetails.append(self)
+                self._WorkTask._reflist("_WorkCostDetails").append(self)
 
     WorkTask = property(getWorkTask, setWorkTask)
 
@@ -127,20 +128,19 @@ class WorkCostDetail(Document):
 
     def setWorks(self, value):
         for p in self._Works:
-            filtered = [q for q in p.WorkCostDetails if q != self]
-            self._Works._WorkCostDetails = filtered
+            p._WorkCostDetails.discard(self)
         for r in value:
             if self not in r._WorkCostDetails:
-                r._WorkCostDetails.append(self)
-        self._Works = value
+                r._reflist("_WorkCostDetails").append(self)
+        self._Works = RefList(value)
 
     Works = property(getWorks, setWorks)
 
     def addWorks(self, *Works):
         for obj in Works:
             if self not in obj._WorkCostDetails:
-                obj._WorkCostDetails.append(self)
-            self._Works.append(obj)
+                obj._reflist("_WorkCostDetails").append(self)
+            self._reflist("_Works").append(obj)
 
     def removeWorks(self, *Works):
         for obj in Works:
@@ -154,13 +154,12 @@ class WorkCostDetail(Document):
 
     def setDesign(self, value):
         if self._Design is not None:
-            filtered = [x for x in self.Design.WorkCostDetails if x != self]
-            self._Design._WorkCostDetails = filtered
+            self._Design._WorkCostDetails.discard(self)
 
         self._Design = value
         if self._Design is not None:
             if self not in self._Design._WorkCostDetails:
-                self._Design._WorkCostDetails.append(self)
+                self._Design._reflist("_WorkCostDetails").append(self)
 
     Design = property(getDesign, setDesign)
 
@@ -169,7 +168,8 @@ class WorkCostDetail(Document):
         return self._MiscCostItems
 
     def setMiscCostItems(self, value):
-        for x in self._MiscCostItems:
+        value = RefList(value)
+        for x in list(self._MiscCostItems):
             x.WorkCostDetail = None
         for y in value:
             y._WorkCostDetail = self
@@ -206,20 +206,19 @@ class WorkCostDetail(Document):
 
     def setPropertyUnits(self, value):
         for p in self._PropertyUnits:
-            filtered = [q for q in p.WorkCostDetails if q != self]
-            self._PropertyUnits._WorkCostDetails = filtered
+            p._WorkCostDetails.discard(self)
         for r in value:
             if self not in r._WorkCostDetails:
-                r._WorkCostDetails.append(self)
-        self._PropertyUnits = value
+                r._reflist("_WorkCostDetails").append(self)
+        self._PropertyUnits = RefList(value)
 
     PropertyUnits = property(getPropertyUnits, setPropertyUnits)
 
     def addPropertyUnits(self, *PropertyUnits):
         for obj in PropertyUnits:
             if self not in obj._WorkCostDetails:
-                obj._WorkCostDetails.append(self)
-            self._PropertyUnits.append(obj)
+                obj._reflist("_WorkCostDetails").append(self)
+            self._reflist("_PropertyUnits").append(obj)
 
     def removePropertyUnits(self, *PropertyUnits):
         for obj in PropertyUnits:
@@ -233,13 +232,12 @@ class WorkCostDetail(Document):
 
     def setErpProjectAccounting(self, value):
         if self._ErpProjectAccounting is not None:
-            filtered = [x for x in self.ErpProjectAccounting.WorkCostDetails if x != self]
-            self._ErpProjectAccounting._WorkCostDetails = filtered
+            self._ErpProjectAccounting._WorkCostDetails.discard(self)
 
         self._ErpProjectAccounting = value
         if self._ErpProjectAccounting is not None:
             if self not in self._ErpProjectAccounting._WorkCostDetails:
-                self._ErpProjectAccounting._WorkCostDetails.append(self)
+                self._ErpProjectAccounting._reflist("_WorkCostDetails").append(self)
 
     ErpProjectAccounting = property(getErpProjectAccounting, setErpProjectAccounting)
 
@@ -248,7 +246,8 @@ class WorkCostDetail(Document):
         return self._LaborItems
 
     def setLaborItems(self, value):
-        for x in self._LaborItems:
+        value = RefList(value)
+        for x in list(self._LaborItems):
             x.WorkCostDetail = None
         for y in value:
             y._WorkCostDetail = self
@@ -269,7 +268,8 @@ class WorkCostDetail(Document):
         return self._MaterialItems
 
     def setMaterialItems(self, value):
-        for x in self._MaterialItems:
+        value = RefList(value)
+        for x in list(self._MaterialItems):
             x.WorkCostDetail = None
         for y in value:
             y._WorkCostDetail = self
@@ -290,7 +290,8 @@ class WorkCostDetail(Document):
         return self._EquipmentItems
 
     def setEquipmentItems(self, value):
-        for x in self._EquipmentItems:
+        value = RefList(value)
+        for x in list(self._EquipmentItems):
             x.WorkCostDetail = None
         for y in value:
             y._WorkCostDetail = self
@@ -311,7 +312,8 @@ class WorkCostDetail(Document):
         return self._ContractorItems
 
     def setContractorItems(self, value):
-        for x in self._ContractorItems:
+        value = RefList(value)
+        for x in list(self._ContractorItems):
             x.WorkCostDetail = None
         for y in value:
             y._WorkCostDetail = self
@@ -333,13 +335,12 @@ class WorkCostDetail(Document):
 
     def setOverheadCost(self, value):
         if self._OverheadCost is not None:
-            filtered = [x for x in self.OverheadCost.WorkCostDetails if x != self]
-            self._OverheadCost._WorkCostDetails = filtered
+            self._OverheadCost._WorkCostDetails.discard(self)
 
         self._OverheadCost = value
         if self._OverheadCost is not None:
             if self not in self._OverheadCost._WorkCostDetails:
-                self._OverheadCost._WorkCostDetails.append(self)
+                self._OverheadCost._reflist("_WorkCostDetails").append(self)
 
     OverheadCost = property(getOverheadCost, setOverheadCost)
 
@@ -349,13 +350,12 @@ class WorkCostDetail(Document):
 
     def setCostType(self, value):
         if self._CostType is not None:
-            filtered = [x for x in self.CostType.WorkCostDetails if x != self]
-            self._CostType._WorkCostDetails = filtered
+            self._CostType._WorkCostDetails.discard(self)
 
         self._CostType = value
         if self._CostType is not None:
             if self not in self._CostType._WorkCostDetails:
-                self._CostType._WorkCostDetails.append(self)
+                self._CostType._reflist("_WorkCostDetails").append(self)
 
     CostType = property(getCostType, setCostType)
 
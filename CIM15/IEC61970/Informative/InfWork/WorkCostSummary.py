@@ -40,6 +40,7 @@ class WorkCostSummary(Document):
     _enums = {}
     _refs = ["WorkCostDetail"]
     _many_refs = []
+    _inverses = {"WorkCostDetail": "WorkCostSummary"}
 
     def getWorkCostDetail(self):
         
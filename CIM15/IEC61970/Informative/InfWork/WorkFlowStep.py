@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class WorkFlowStep(IdentifiedObject):
     """A pre-defined set of work steps for a given type of work.A pre-defined set of work steps for a given type of work.
@@ -35,8 +36,8 @@ class WorkFlowStep(IdentifiedObject):
         #: Used to define dependencies of each work flow step, which is for the instance of WorkTask associated with a given instance of WorkFlow.
         self.sequenceNumber = sequenceNumber
 
-        self._WorkTasks = []
-        self.WorkTasks = [] if WorkTasks is None else WorkTasks
+        if WorkTasks is not None:
+            self.WorkTasks = WorkTasks
 
         self.status = status
 
@@ -51,13 +52,15 @@ class WorkFlowStep(IdentifiedObject):
     _enums = {}
     _refs = ["WorkTasks", "status", "Work"]
     _many_refs = ["WorkTasks"]
+    _inverses = {"WorkTasks": "WorkFlowStep", "Work": "WorkFlowSteps"}
 
     def getWorkTasks(self):
         
         return self._WorkTasks
 
     def setWorkTasks(self, value):
-        for x in self._WorkTasks:
+        value = RefList(value)
+        for x in list(self._WorkTasks):
             x.WorkFlowStep = None
         for y in value:
             y._WorkFlowStep = self
@@ -81,13 +84,12 @@ class WorkFlowStep(IdentifiedObject):
 
     def setWork(self, value):
         if self._Work is not None:
-            filtered = [x for x in self.Work.WorkFlowSteps if x != self]
-            self._Work._WorkFlowSteps = filtered
+            self._Work._WorkFlowSteps.discard(self)
 
         self._Work = value
         if self._Work is not None:
             if self not in self._Work._WorkFlowSteps:
-                self._Work._WorkFlowSteps.append(self)
+                self._Work._reflist("_WorkFlowSteps").append(self)
 
     Work = property(getWork, setWork)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Location import Location
+from CIM15.Element import RefList
 
 class WorkLocation(Location):
     """Information about a particular location for various forms of work such as a one call request.Information about a particular location for various forms of work such as a one call request.
@@ -49,8 +50,8 @@ class WorkLocation(Location):
         self._OneCallRequest = None
         self.OneCallRequest = OneCallRequest
 
-        self._DesignLocations = []
-        self.DesignLocations = [] if DesignLocations is None else DesignLocations
+        if DesignLocations is not None:
+            self.DesignLocations = DesignLocations
 
         super(WorkLocation, self).__init__(*args, **kw_args)
 
@@ -60,6 +61,7 @@ class WorkLocation(Location):
     _enums = {}
     _refs = ["OneCallRequest", "DesignLocations"]
     _many_refs = ["DesignLocations"]
+    _inverses = {"OneCallRequest": "WorkLocations", "DesignLocations": "WorkLocations"}
 
     def getOneCallRequest(self):
         
@@ -67,13 +69,12 @@ class WorkLocation(Location):
 
     def setOneCallRequest(self, value):
         if self._OneCallRequest is not None:
-            filtered = [x for x in self.OneCallRequest.WorkLocations if x != self]
-            self._OneCallRequest._WorkLocations = filtered
+            self._OneCallRequest._WorkLocations.discard(self)
 
         self._OneCallRequest = value
         if self._OneCallRequest is not None:
             if self not in self._OneCallRequest._WorkLocations:
-                self._OneCallRequest._WorkLocations.append(self)
+                self._OneCallRequest._reflist("_WorkLocations").append(self)
 
     OneCallRequest = property(getOneCallRequest, setOneCallRequest)
 
@@ -83,20 +84,19 @@ class WorkLocation(Location):
 
     def setDesignLocations(self, value):
         for p in self._DesignLocations:
-            filtered = [q for q in p.WorkLocations if q != self]
-            self._DesignLocations._WorkLocations = filtered
+            p._WorkLocations.discard(self)
         for r in value:
             if self not in r._WorkLocations:
-                r._WorkLocations.append(self)
-        self._DesignLocations = value
+                r._reflist("_WorkLocations").append(self)
+        self._DesignLocations = RefList(value)
 
     DesignLocations = property(getDesignLocations, setDesignLocations)
 
     def addDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
             if self not in obj._WorkLocations:
-                obj._WorkLocations.append(self)
-            self._DesignLocations.append(obj)
+                obj._reflist("_WorkLocations").append(self)
+            self._reflist("_DesignLocations").append(obj)
 
     def removeDesignLocations(self, *DesignLocations):
         for obj in DesignLocations:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Document import Document
+from CIM15.Element import RefList
 
 class WorkTask(Document):
     """A set of tasks is required to implement a design.A set of tasks is required to implement a design.
@@ -53,17 +54,17 @@ class WorkTask(Document):
         #: If specified, override schedule and perform this task in accordance with instructions specified here.
         self.schedOverride = schedOverride
 
-        self._EquipmentItems = []
-        self.EquipmentItems = [] if EquipmentItems is None else EquipmentItems
+        if EquipmentItems is not None:
+            self.EquipmentItems = EquipmentItems
 
-        self._Usages = []
-        self.Usages = [] if Usages is None else Usages
+        if Usages is not None:
+            self.Usages = Usages
 
-        self._MiscCostItems = []
-        self.MiscCostItems = [] if MiscCostItems is None else MiscCostItems
+        if MiscCostItems is not None:
+            self.MiscCostItems = MiscCostItems
 
-        self._Crews = []
-        self.Crews = [] if Crews is None else Crews
+        if Crews is not None:
+            self.Crews = Crews
 
         self._Work = None
         self.Work = Work
@@ -71,14 +72,14 @@ class WorkTask(Document):
         self._OverheadCost = None
         self.OverheadCost = OverheadCost
 
-        self._DesignLocationCUs = []
-        self.DesignLocationCUs = [] if DesignLocationCUs is None else DesignLocationCUs
+        if DesignLocationCUs is not None:
+            self.DesignLocationCUs = DesignLocationCUs
 
-        self._ContractorItems = []
-        self.ContractorItems = [] if ContractorItems is None else ContractorItems
+        if ContractorItems is not None:
+            self.ContractorItems = ContractorItems
 
-        self._SwitchingSchedules = []
-        self.SwitchingSchedules = [] if SwitchingSchedules is None else SwitchingSchedules
+        if SwitchingSchedules is not None:
+            self.SwitchingSchedules = SwitchingSchedules
 
         self._WorkFlowStep = None
         self.WorkFlowStep = WorkFlowStep
@@ -86,23 +87,23 @@ class WorkTask(Document):
         self._Design = None
         self.Design = Design
 
-        self._QualificationRequirements = []
-        self.QualificationRequirements = [] if QualificationRequirements is None else QualificationRequirements
+        if QualificationRequirements is not None:
+            self.QualificationRequirements = QualificationRequirements
 
-        self._Capabilities = []
-        self.Capabilities = [] if Capabilities is None else Capabilities
+        if Capabilities is not None:
+            self.Capabilities = Capabilities
 
-        self._WorkCostDetails = []
-        self.WorkCostDetails = [] if WorkCostDetails is None else WorkCostDetails
+        if WorkCostDetails is not None:
+            self.WorkCostDetails = WorkCostDetails
 
-        self._Assets = []
-        self.Assets = [] if Assets is None else Assets
+        if Assets is not None:
+            self.Assets = Assets
 
-        self._LaborItems = []
-        self.LaborItems = [] if LaborItems is None else LaborItems
+        if LaborItems is not None:
+            self.LaborItems = LaborItems
 
-        self._MaterialItems = []
-        self.MaterialItems = [] if MaterialItems is None else MaterialItems
+        if MaterialItems is not None:
+            self.MaterialItems = MaterialItems
 
         super(WorkTask, self).__init__(*args, **kw_args)
 
@@ -112,13 +113,15 @@ class WorkTask(Document):
     _enums = {}
     _refs = ["EquipmentItems", "Usages", "MiscCostItems", "Crews", "Work", "OverheadCost", "DesignLocationCUs", "ContractorItems", "SwitchingSchedules", "WorkFlowStep", "Design", "QualificationRequirements", "Capabilities", "WorkCostDetails", "Assets", "LaborItems", "MaterialItems"]
     _many_refs = ["EquipmentItems", "Usages", "MiscCostItems", "Crews", "DesignLocationCUs", "ContractorItems", "SwitchingSchedules", "QualificationRequirements", "Capabilities", "WorkCostDetails", "Assets", "LaborItems", "MaterialItems"]
+    _inverses = {"EquipmentItems": "WorkTask", "Usages": "WorkTask", "MiscCostItems": "WorkTask", "Crews": "WorkTasks", "Work": "WorkTasks", "OverheadCost": "WorkTasks", "DesignLocationCUs": "WorkTasks", "ContractorItems": "WorkTask", "SwitchingSchedules": "WorkTask", "WorkFlowStep": "WorkTasks", "Design": "WorkTasks", "QualificationRequirements": "WorkTasks", "Capabilities": "WorkTasks", "WorkCostDetails": "WorkTask", "Assets": "WorkTask", "LaborItems": "WorkTask", "MaterialItems": "WorkTask"}
 
     def getEquipmentItems(self):
         
         return self._EquipmentItems
 
     def setEquipmentItems(self, value):
-        for x in self._EquipmentItems:
+        value = RefList(value)
+        for x in list(self._EquipmentItems):
             x.WorkTask = None
         for y in value:
             y._WorkTask = self
@@ -139,7 +142,8 @@ class WorkTask(Document):
         return self._Usages
 
     def setUsages(self, value):
-        for x in self._Usages:
+        value = RefList(value)
+        for x in list(self._Usages):
             x.WorkTask = None
         for y in value:
             y._WorkTask = self
@@ -160,7 +164,8 @@ class WorkTask(Document):
         return self._MiscCostItems
 
     def setMiscCostItems(self, value):
-        for x in self._MiscCostItems:
+        value = RefList(value)
+        for x in list(self._MiscCostItems):
             x.WorkTask = None
         for y in value:
             y._WorkTask = self
@@ -183,20 +188,19 @@ class WorkTask(Document):
 
     def setCrews(self, value):
         for p in self._Crews:
-            filtered = [q for q in p.WorkTasks if q != self]
-            self._Crews._WorkTasks = filtered
+            p._WorkTasks.discard(self)
         for r in value:
             if self not in r._WorkTasks:
-                r._WorkTasks.append(self)
-        self._Crews = value
+                r._reflist("_WorkTasks").append(self)
+        self._Crews = RefList(value)
 
     Crews = property(getCrews, setCrews)
 
     def addCrews(self, *Crews):
         for obj in Crews:
             if self not in obj._WorkTasks:
-                obj._WorkTasks.append(self)
-            self._Crews.append(obj)
+                obj._reflist("_WorkTasks").append(self)
+            self._reflist("_Crews").append(obj)
 
     def removeCrews(self, *Crews):
         for obj in Crews:
@@ -210,13 +214,12 @@ class WorkTask(Document):
 
     def setWork(self, value):
         if self._Work is not None:
-            filtered = [x for x in self.Work.WorkTasks if x != self]
-            self._Work._WorkTasks = filtered
+            self._Work._WorkTasks.discard(self)
 
         self._Work = value
         if self._Work is not None:
             if self not in self._Work._WorkTasks:
-                self._Work._WorkTasks.append(self)
+                self._Work._reflist("_WorkTasks").append(self)
 
     Work = property(getWork, setWork)
 
@@ -226,13 +229,12 @@ class WorkTask(Document):
 
     def setOverheadCost(self, value):
         if self._OverheadCost is not None:
-            filtered = [x for x in self.OverheadCost.WorkTasks if x != self]
-            self._OverheadCost._WorkTasks = filtered
+            self._OverheadCost._WorkTasks.discard(self)
 
         self._OverheadCost = value
         if self._OverheadCost is not None:
             if self not in self._OverheadCost._WorkTasks:
-                self._OverheadCost._WorkTasks.append(self)
+                self._OverheadCost._reflist("_WorkTasks").append(self)
 
     OverheadCost = property(getOverheadCost, setOverheadCost)
 
@@ -242,20 +244,19 @@ class WorkTask(Document):
 
     def setDesignLocationCUs(self, value):
         for p in self._DesignLocationCUs:
-            filtered = [q for q in p.WorkTasks if q != self]
-            self._DesignLocationCUs._WorkTasks = filtered
+            p._WorkTasks.discard(self)
         for r in value:
             if self not in r._WorkTasks:
-                r._WorkTasks.append(self)
-        self._DesignLocationCUs = value
+                r._reflist("_WorkTasks").append(self)
+        self._DesignLocationCUs = RefList(value)
 
     DesignLocationCUs = property(getDesignLocationCUs, setDesignLocationCUs)
 
     def addDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
             if self not in obj._WorkTasks:
-                obj._WorkTasks.append(self)
-            self._DesignLocationCUs.append(obj)
+                obj._reflist("_WorkTasks").append(self)
+            self._reflist("_DesignLocationCUs").append(obj)
 
     def removeDesignLocationCUs(self, *DesignLocationCUs):
         for obj in DesignLocationCUs:
@@ -268,7 +269,8 @@ class WorkTask(Document):
         return self._ContractorItems
 
     def setContractorItems(self, value):
-        for x in self._ContractorItems:
+        value = RefList(value)
+        for x in list(self._ContractorItems):
             x.WorkTask = None
         for y in value:
             y._WorkTask = self
@@ -289,7 +291,8 @@ class WorkTask(Document):
         return self._SwitchingSchedules
 
     def setSwitchingSchedules(self, value):
-        for x in self._SwitchingSchedules:
+        value = RefList(value)
+        for x in list(self._SwitchingSchedules):
             x.WorkTask = None
         for y in value:
             y._WorkTask = self
@@ -311,13 +314,12 @@ class WorkTask(Document):
 
     def setWorkFlowStep(self, value):
         if self._WorkFlowStep is not None:
-            filtered = [x for x in self.WorkFlowStep.WorkTasks if x != self]
-            self._WorkFlowStep._WorkTasks = filtered
+            self._WorkFlowStep._WorkTasks.discard(self)
 
         self._WorkFlowStep = value
         if self._WorkFlowStep is not None:
             if self not in self._WorkFlowStep._WorkTasks:
-                self._WorkFlowStep._WorkTasks.append(self)
+                self._WorkFlowStep._reflist("_WorkTasks").append(self)
 
     WorkFlowStep = property(getWorkFlowStep, setWorkFlowStep)
 
@@ -327,13 +329,12 @@ class WorkTask(Document):
 
     def setDesign(self, value):
         if self._Design is not None:
-            filtered = [x for x in self.Design.WorkTasks if x != self]
-            self._Design._WorkTasks = filtered
+            self._Design._WorkTasks.discard(self)
 
         self._Design = value
         if self._Design is not None:
             if self not in self._Design._WorkTasks:
-                self._Design._WorkTasks.append(self)
+                self._Design._reflist("_WorkTasks").append(self)
 
     Design = property(getDesign, setDesign)
 
@@ -343,20 +344,19 @@ class WorkTask(Document):
 
     def setQualificationRequirements(self, value):
         for p in self._QualificationRequirements:
-            filtered = [q for q in p.WorkTasks if q != self]
-            self._QualificationRequirements._WorkTasks = filtered
+            p._WorkTasks.discard(self)
         for r in value:
             if self not in r._WorkTasks:
-                r._WorkTasks.append(self)
-        self._QualificationRequirements = value
+                r._reflist("_WorkTasks").append(self)
+        self._QualificationRequirements = RefList(value)
 
     QualificationRequirements = property(getQualificationRequirements, setQualificationRequirements)
 
     def addQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
             if self not in obj._WorkTasks:
-                obj._WorkTasks.append(self)
-            self._QualificationRequirements.append(obj)
+                obj._reflist("_WorkTasks").append(self)
+            self._reflist("_QualificationRequirements").append(obj)
 
     def removeQualificationRequirements(self, *QualificationRequirements):
         for obj in QualificationRequirements:
@@ -370,20 +370,19 @@ class WorkTask(Document):
 
     def setCapabilities(self, value):
         for p in self._Capabilities:
-            filtered = [q for q in p.WorkTasks if q != self]
-            self._Capabilities._WorkTasks = filtered
+            p._WorkTasks.discard(self)
         for r in value:
             if self not in r._WorkTasks:
-                r._WorkTasks.append(self)
-        self._Capabilities = value
+                r._reflist("_WorkTasks").append(self)
+        self._Capabilities = RefList(value)
 
     Capabilities = property(getCapabilities, setCapabilities)
 
     def addCapabilities(self, *Capabilities):
         for obj in Capabilities:
             if self not in obj._WorkTasks:
-                obj._WorkTasks.append(self)
-            self._Capabilities.append(obj)
+                obj._reflist("_WorkTasks").append(self)
+            self._reflist("_Capabilities").append(obj)
 
     def removeCapabilities(self, *Capabilities):
         for obj in Capabilities:
@@ -396,7 +395,8 @@ class WorkTask(Document):
         return self._WorkCostDetails
 
     def setWorkCostDetails(self, value):
-        for x in self._WorkCostDetails:
+        value = RefList(value)
+        for x in list(self._WorkCostDetails):
             x.WorkTask = None
         for y in value:
             y._WorkTask = self
@@ -417,7 +417,8 @@ class WorkTask(Document):
         return self._Assets
 
     def setAssets(self, value):
-        for x in self._Assets:
+        value = RefList(value)
+        for x in list(self._Assets):
             x.WorkTask = None
         for y in value:
             y._WorkTask = self
@@ -438,7 +439,8 @@ class WorkTask(Document):
         return self._LaborItems
 
     def setLaborItems(self, value):
-        for x in self._LaborItems:
+        value = RefList(value)
+        for x in list(self._LaborItems):
             x.WorkTask = None
         for y in value:
             y._WorkTask = self
@@ -459,7 +461,8 @@ class WorkTask(Document):
         return self._MaterialItems
 
     def setMaterialItems(self, value):
-        for x in self._MaterialItems:
+        value = RefList(value)
+        for x in list(self._MaterialItems):
             x.WorkTask = None
         for y in value:
             y._WorkTask = self
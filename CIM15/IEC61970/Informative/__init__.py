@@ -21,7 +21,27 @@
 """This package contains functions common for distribution management.  TODO: The following has been copied from a very old version of draft Part 11, so the references are wrong, but we store the knowledge here to reuse later: 'Locations are logical entities which are related to a geographical position. Locations can be defined as points, lines or polygons. Location serves as a parent class for e.g. Zone, WorkLocation or ServiceLocation. Both Assets and PowerSystemResources are typically associated to a location. Aside from coordinates, useful properties of Locations can include Directions (i.e. driving instructions) and relationships to Organizations. ActivityRecord is a generalized class used to track the history of an object (e.g. Asset, PowerSystemResource, Customer, Location, Organisation or ErpContact). An ActivityRecord is a type of Document. Key properties of an ActivityRecord include statusDate, status, statusReason and remarks. TODO: Update attribute names. The graphical and geographical aspects of Assets, Locations and PowerSystemResources are managed using Graphical Markup Language (GML), which was defined by the Open GIS Consortium.  Using GML, a diagram is a collection of presentation objects. This package defines the classes Diagram and Presentation. TODO: These are now under Common package.'
 """
 
+import sys
+from CIM15.Element import LazyModule
+
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Informative"
 nsPrefix = "cimInformative"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+], [
+    "InfAssetModels",
+    "InfAssets",
+    "InfCommon",
+    "InfCore",
+    "InfCustomers",
+    "InfERPSupport",
+    "InfGMLSupport",
+    "InfLoadControl",
+    "InfLocations",
+    "InfMetering",
+    "InfOperations",
+    "InfTypeAsset",
+    "InfWork",
+])
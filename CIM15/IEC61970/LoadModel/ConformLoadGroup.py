@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.LoadModel.LoadGroup import LoadGroup
+from CIM15.Element import RefList
 
 class ConformLoadGroup(LoadGroup):
     """A group of loads conforming to an allocation pattern.A group of loads conforming to an allocation pattern.
@@ -30,11 +31,11 @@ class ConformLoadGroup(LoadGroup):
         @param ConformLoadSchedules: The ConformLoadSchedules in the ConformLoadGroup.
         @param EnergyConsumers: Conform loads assigned to this ConformLoadGroup.
         """
-        self._ConformLoadSchedules = []
-        self.ConformLoadSchedules = [] if ConformLoadSchedules is None else ConformLoadSchedules
+        if ConformLoadSchedules is not None:
+            self.ConformLoadSchedules = ConformLoadSchedules
 
-        self._EnergyConsumers = []
-        self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
+        if EnergyConsumers is not None:
+            self.EnergyConsumers = EnergyConsumers
 
         super(ConformLoadGroup, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class ConformLoadGroup(LoadGroup):
     _enums = {}
     _refs = ["ConformLoadSchedules", "EnergyConsumers"]
     _many_refs = ["ConformLoadSchedules", "EnergyConsumers"]
+    _inverses = {"ConformLoadSchedules": "ConformLoadGroup", "EnergyConsumers": "LoadGroup"}
 
     def getConformLoadSchedules(self):
         """The ConformLoadSchedules in the ConformLoadGroup.
@@ -51,7 +53,8 @@ class ConformLoadGroup(LoadGroup):
         return self._ConformLoadSchedules
 
     def setConformLoadSchedules(self, value):
-        for x in self._ConformLoadSchedules:
+        value = RefList(value)
+        for x in list(self._ConformLoadSchedules):
             x.ConformLoadGroup = None
         for y in value:
             y._ConformLoadGroup = self
@@ -73,7 +76,8 @@ class ConformLoadGroup(LoadGroup):
         return self._EnergyConsumers
 
     def setEnergyConsumers(self, value):
-        for x in self._EnergyConsumers:
+        value = RefList(value)
+        for x in list(self._EnergyConsumers):
             x.LoadGroup = None
         for y in value:
             y._LoadGroup = self
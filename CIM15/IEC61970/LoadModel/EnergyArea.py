@@ -40,6 +40,7 @@ class EnergyArea(IdentifiedObject):
     _enums = {}
     _refs = ["ControlArea"]
     _many_refs = []
+    _inverses = {"ControlArea": "EnergyArea"}
 
     def getControlArea(self):
         """The control area specification that is used for the load forecast.
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.LoadModel.EnergyArea import EnergyArea
+from CIM15.Element import RefList
 
 class LoadArea(EnergyArea):
     """The class is the root or first level in a hierarchical structure for grouping of loads for the purpose of load flow load scaling.The class is the root or first level in a hierarchical structure for grouping of loads for the purpose of load flow load scaling.
@@ -29,8 +30,8 @@ class LoadArea(EnergyArea):
 
         @param SubLoadAreas: The SubLoadAreas in the LoadArea.
         """
-        self._SubLoadAreas = []
-        self.SubLoadAreas = [] if SubLoadAreas is None else SubLoadAreas
+        if SubLoadAreas is not None:
+            self.SubLoadAreas = SubLoadAreas
 
         super(LoadArea, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class LoadArea(EnergyArea):
     _enums = {}
     _refs = ["SubLoadAreas"]
     _many_refs = ["SubLoadAreas"]
+    _inverses = {"SubLoadAreas": "LoadArea"}
 
     def getSubLoadAreas(self):
         """The SubLoadAreas in the LoadArea.
@@ -47,7 +49,8 @@ class LoadArea(EnergyArea):
         return self._SubLoadAreas
 
     def setSubLoadAreas(self, value):
-        for x in self._SubLoadAreas:
+        value = RefList(value)
+        for x in list(self._SubLoadAreas):
             x.LoadArea = None
         for y in value:
             y._LoadArea = self
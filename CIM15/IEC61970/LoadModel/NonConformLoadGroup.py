@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.LoadModel.LoadGroup import LoadGroup
+from CIM15.Element import RefList
 
 class NonConformLoadGroup(LoadGroup):
     """Loads that do not follow a daily and seasonal load variation pattern.Loads that do not follow a daily and seasonal load variation pattern.
@@ -30,11 +31,11 @@ class NonConformLoadGroup(LoadGroup):
         @param NonConformLoadSchedules: The NonConformLoadSchedules in the NonConformLoadGroup.
         @param EnergyConsumers: Conform loads assigned to this ConformLoadGroup.
         """
-        self._NonConformLoadSchedules = []
-        self.NonConformLoadSchedules = [] if NonConformLoadSchedules is None else NonConformLoadSchedules
+        if NonConformLoadSchedules is not None:
+            self.NonConformLoadSchedules = NonConformLoadSchedules
 
-        self._EnergyConsumers = []
-        self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
+        if EnergyConsumers is not None:
+            self.EnergyConsumers = EnergyConsumers
 
         super(NonConformLoadGroup, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class NonConformLoadGroup(LoadGroup):
     _enums = {}
     _refs = ["NonConformLoadSchedules", "EnergyConsumers"]
     _many_refs = ["NonConformLoadSchedules", "EnergyConsumers"]
+    _inverses = {"NonConformLoadSchedules": "NonConformLoadGroup", "EnergyConsumers": "LoadGroup"}
 
     def getNonConformLoadSchedules(self):
         """The NonConformLoadSchedules in the NonConformLoadGroup.
@@ -51,7 +53,8 @@ class NonConformLoadGroup(LoadGroup):
         return self._NonConformLoadSchedules
 
     def setNonConformLoadSchedules(self, value):
-        for x in self._NonConformLoadSchedules:
+        value = RefList(value)
+        for x in list(self._NonConformLoadSchedules):
             x.NonConformLoadGroup = None
         for y in value:
             y._NonConformLoadGroup = self
@@ -73,7 +76,8 @@ class NonConformLoadGroup(LoadGroup):
         return self._EnergyConsumers
 
     def setEnergyConsumers(self, value):
-        for x in self._EnergyConsumers:
+        value = RefList(value)
+        for x in list(self._EnergyConsumers):
             x.LoadGroup = None
         for y in value:
             y._LoadGroup = self
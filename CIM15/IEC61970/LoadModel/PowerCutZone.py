@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import RefList
 
 class PowerCutZone(PowerSystemResource):
     """An area or zone of the power system which is used for load shedding purposes.An area or zone of the power system which is used for load shedding purposes.
@@ -37,8 +38,8 @@ class PowerCutZone(PowerSystemResource):
         #: First level (amount) of load to cut as a percentage of total zone load
         self.cutLevel1 = cutLevel1
 
-        self._EnergyConsumers = []
-        self.EnergyConsumers = [] if EnergyConsumers is None else EnergyConsumers
+        if EnergyConsumers is not None:
+            self.EnergyConsumers = EnergyConsumers
 
         super(PowerCutZone, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class PowerCutZone(PowerSystemResource):
     _enums = {}
     _refs = ["EnergyConsumers"]
     _many_refs = ["EnergyConsumers"]
+    _inverses = {"EnergyConsumers": "PowerCutZone"}
 
     def getEnergyConsumers(self):
         """An energy consumer is assigned to a power cut zone
@@ -55,7 +57,8 @@ class PowerCutZone(PowerSystemResource):
         return self._EnergyConsumers
 
     def setEnergyConsumers(self, value):
-        for x in self._EnergyConsumers:
+        value = RefList(value)
+        for x in list(self._EnergyConsumers):
             x.PowerCutZone = None
         for y in value:
             y._PowerCutZone = self
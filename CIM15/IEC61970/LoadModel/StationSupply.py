@@ -36,4 +36,5 @@ class StationSupply(EnergyConsumer):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
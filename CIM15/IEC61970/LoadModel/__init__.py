@@ -21,22 +21,8 @@
 """This package is responsible for modeling the energy consumers and the system load as curves and associated curve data. Special circumstances that may affect the load, such as seasons and daytypes, are also included here.  This information is used by Load Forecasting and Load Management.
 """
 
-from CIM15.IEC61970.LoadModel.ConformLoad import ConformLoad
-from CIM15.IEC61970.LoadModel.ConformLoadGroup import ConformLoadGroup
-from CIM15.IEC61970.LoadModel.SeasonDayTypeSchedule import SeasonDayTypeSchedule
-from CIM15.IEC61970.LoadModel.LoadGroup import LoadGroup
-from CIM15.IEC61970.LoadModel.ConformLoadSchedule import ConformLoadSchedule
-from CIM15.IEC61970.LoadModel.LoadArea import LoadArea
-from CIM15.IEC61970.LoadModel.PowerCutZone import PowerCutZone
-from CIM15.IEC61970.LoadModel.LoadResponseCharacteristic import LoadResponseCharacteristic
-from CIM15.IEC61970.LoadModel.NonConformLoad import NonConformLoad
-from CIM15.IEC61970.LoadModel.StationSupply import StationSupply
-from CIM15.IEC61970.LoadModel.EnergyArea import EnergyArea
-from CIM15.IEC61970.LoadModel.NonConformLoadSchedule import NonConformLoadSchedule
-from CIM15.IEC61970.LoadModel.NonConformLoadGroup import NonConformLoadGroup
-from CIM15.IEC61970.LoadModel.DayType import DayType
-from CIM15.IEC61970.LoadModel.SubLoadArea import SubLoadArea
-from CIM15.IEC61970.LoadModel.Season import Season
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#LoadModel"
 nsPrefix = "cimLoadModel"
@@ -46,3 +32,23 @@ class SeasonName(str):
     """Values are: winter, summer, fall, spring
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ConformLoad",
+    "ConformLoadGroup",
+    "SeasonDayTypeSchedule",
+    "LoadGroup",
+    "ConformLoadSchedule",
+    "LoadArea",
+    "PowerCutZone",
+    "LoadResponseCharacteristic",
+    "NonConformLoad",
+    "StationSupply",
+    "EnergyArea",
+    "NonConformLoadSchedule",
+    "NonConformLoadGroup",
+    "DayType",
+    "SubLoadArea",
+    "Season",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.Measurement import Measurement
+from CIM15.Element import RefList
 
 class Accumulator(Measurement):
     """Accumulator represents a accumulated (counted) Measurement, e.g. an energy value.Accumulator represents a accumulated (counted) Measurement, e.g. an energy value.
@@ -34,11 +35,11 @@ class Accumulator(Measurement):
         #: Normal value range maximum for any of the MeasurementValue.values. Used for scaling, e.g. in bar graphs or of telemetered raw values.
         self.maxValue = maxValue
 
-        self._LimitSets = []
-        self.LimitSets = [] if LimitSets is None else LimitSets
+        if LimitSets is not None:
+            self.LimitSets = LimitSets
 
-        self._AccumulatorValues = []
-        self.AccumulatorValues = [] if AccumulatorValues is None else AccumulatorValues
+        if AccumulatorValues is not None:
+            self.AccumulatorValues = AccumulatorValues
 
         super(Accumulator, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class Accumulator(Measurement):
     _enums = {}
     _refs = ["LimitSets", "AccumulatorValues"]
     _many_refs = ["LimitSets", "AccumulatorValues"]
+    _inverses = {"LimitSets": "Measurements", "AccumulatorValues": "Accumulator"}
 
     def getLimitSets(self):
         """A measurement may have zero or more limit ranges defined for it.
@@ -56,20 +58,19 @@ class Accumulator(Measurement):
 
     def setLimitSets(self, value):
         for p in self._LimitSets:
-            filtered = [q for q in p.Measurements if q != self]
-            self._LimitSets._Measurements = filtered
+            p._Measurements.discard(self)
         for r in value:
             if self not in r._Measurements:
-                r._Measurements.append(self)
-        self._LimitSets = value
+                r._reflist("_Measurements").append(self)
+        self._LimitSets = RefList(value)
 
     LimitSets = property(getLimitSets, setLimitSets)
 
     def addLimitSets(self, *LimitSets):
         for obj in LimitSets:
             if self not in obj._Measurements:
-                obj._Measurements.append(self)
-            self._LimitSets.append(obj)
+                obj._reflist("_Measurements").append(self)
+            self._reflist("_LimitSets").append(obj)
 
     def removeLimitSets(self, *LimitSets):
         for obj in LimitSets:
@@ -83,7 +84,8 @@ class Accumulator(Measurement):
         return self._AccumulatorValues
 
     def setAccumulatorValues(self, value):
-        for x in self._AccumulatorValues:
+        value = RefList(value)
+        for x in list(self._AccumulatorValues):
             x.Accumulator = None
         for y in value:
             y._Accumulator = self
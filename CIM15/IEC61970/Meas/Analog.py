@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.Measurement import Measurement
+from CIM15.Element import RefList
 
 class Analog(Measurement):
     """Analog represents an analog Measurement.Analog represents an analog Measurement.
@@ -47,11 +48,11 @@ class Analog(Measurement):
         #: Normal value range minimum for any of the MeasurementValue.values. Used for scaling, e.g. in bar graphs or of telemetered raw values
         self.minValue = minValue
 
-        self._LimitSets = []
-        self.LimitSets = [] if LimitSets is None else LimitSets
+        if LimitSets is not None:
+            self.LimitSets = LimitSets
 
-        self._AnalogValues = []
-        self.AnalogValues = [] if AnalogValues is None else AnalogValues
+        if AnalogValues is not None:
+            self.AnalogValues = AnalogValues
 
         self._SetPoint = None
         self.SetPoint = SetPoint
@@ -64,6 +65,7 @@ class Analog(Measurement):
     _enums = {}
     _refs = ["LimitSets", "AnalogValues", "SetPoint"]
     _many_refs = ["LimitSets", "AnalogValues"]
+    _inverses = {"LimitSets": "Measurements", "AnalogValues": "Analog", "SetPoint": "Analog"}
 
     def getLimitSets(self):
         """A measurement may have zero or more limit ranges defined for it.
@@ -72,20 +74,19 @@ class Analog(Measurement):
 
     def setLimitSets(self, value):
         for p in self._LimitSets:
-            filtered = [q for q in p.Measurements if q != self]
-            self._LimitSets._Measurements = filtered
+            p._Measurements.discard(self)
         for r in value:
             if self not in r._Measurements:
-                r._Measurements.append(self)
-        self._LimitSets = value
+                r._reflist("_Measurements").append(self)
+        self._LimitSets = RefList(value)
 
     LimitSets = property(getLimitSets, setLimitSets)
 
     def addLimitSets(self, *LimitSets):
         for obj in LimitSets:
             if self not in obj._Measurements:
-                obj._Measurements.append(self)
-            self._LimitSets.append(obj)
+                obj._reflist("_Measurements").append(self)
+            self._reflist("_LimitSets").append(obj)
 
     def removeLimitSets(self, *LimitSets):
         for obj in LimitSets:
@@ -99,7 +100,8 @@ class Analog(Measurement):
         return self._AnalogValues
 
     def setAnalogValues(self, value):
-        for x in self._AnalogValues:
+        value = RefList(value)
+        for x in list(self._AnalogValues):
             x.Analog = None
         for y in value:
             y._Analog = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.LimitSet import LimitSet
+from CIM15.Element import RefList
 
 class AnalogLimitSet(LimitSet):
     """An AnalogLimitSet specifies a set of Limits that are associated with an Analog measurement.An AnalogLimitSet specifies a set of Limits that are associated with an Analog measurement.
@@ -30,11 +31,11 @@ class AnalogLimitSet(LimitSet):
         @param Limits: The limit values used for supervision of Measurements.
         @param Measurements: The Measurements using the LimitSet.
         """
-        self._Limits = []
-        self.Limits = [] if Limits is None else Limits
+        if Limits is not None:
+            self.Limits = Limits
 
-        self._Measurements = []
-        self.Measurements = [] if Measurements is None else Measurements
+        if Measurements is not None:
+            self.Measurements = Measurements
 
         super(AnalogLimitSet, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class AnalogLimitSet(LimitSet):
     _enums = {}
     _refs = ["Limits", "Measurements"]
     _many_refs = ["Limits", "Measurements"]
+    _inverses = {"Limits": "LimitSet", "Measurements": "LimitSets"}
 
     def getLimits(self):
         """The limit values used for supervision of Measurements.
@@ -51,7 +53,8 @@ class AnalogLimitSet(LimitSet):
         return self._Limits
 
     def setLimits(self, value):
-        for x in self._Limits:
+        value = RefList(value)
+        for x in list(self._Limits):
             x.LimitSet = None
         for y in value:
             y._LimitSet = self
@@ -74,20 +77,19 @@ class AnalogLimitSet(LimitSet):
 
     def setMeasurements(self, value):
         for p in self._Measurements:
-            filtered = [q for q in p.LimitSets if q != self]
-            self._Measurements._LimitSets = filtered
+            p._LimitSets.discard(self)
         for r in value:
             if self not in r._LimitSets:
-                r._LimitSets.append(self)
-        self._Measurements = value
+                r._reflist("_LimitSets").append(self)
+        self._Measurements = RefList(value)
 
     Measurements = property(getMeasurements, setMeasurements)
 
     def addMeasurements(self, *Measurements):
         for obj in Measurements:
             if self not in obj._LimitSets:
-                obj._LimitSets.append(self)
-            self._Measurements.append(obj)
+                obj._reflist("_LimitSets").append(self)
+            self._reflist("_Measurements").append(obj)
 
     def removeMeasurements(self, *Measurements):
         for obj in Measurements:
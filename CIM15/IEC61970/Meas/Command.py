@@ -52,6 +52,7 @@ class Command(Control):
     _enums = {}
     _refs = ["Discrete", "ValueAliasSet"]
     _many_refs = []
+    _inverses = {"Discrete": "Command", "ValueAliasSet": "Commands"}
 
     def getDiscrete(self):
         """The Measurement variable used for control.
@@ -76,13 +77,12 @@ class Command(Control):
 
     def setValueAliasSet(self, value):
         if self._ValueAliasSet is not None:
-            filtered = [x for x in self.ValueAliasSet.Commands if x != self]
-            self._ValueAliasSet._Commands = filtered
+            self._ValueAliasSet._Commands.discard(self)
 
         self._ValueAliasSet = value
         if self._ValueAliasSet is not None:
             if self not in self._ValueAliasSet._Commands:
-                self._ValueAliasSet._Commands.append(self)
+                self._ValueAliasSet._reflist("_Commands").append(self)
 
     ValueAliasSet = property(getValueAliasSet, setValueAliasSet)
 
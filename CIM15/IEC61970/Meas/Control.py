@@ -64,6 +64,7 @@ class Control(IdentifiedObject):
     _enums = {"unitSymbol": "UnitSymbol", "unitMultiplier": "UnitMultiplier"}
     _refs = ["RemoteControl", "RegulatingCondEq", "ControlType"]
     _many_refs = []
+    _inverses = {"RemoteControl": "Control", "RegulatingCondEq": "Controls", "ControlType": "Controls"}
 
     def getRemoteControl(self):
         """The remote point controlling the physical actuator.
@@ -88,13 +89,12 @@ class Control(IdentifiedObject):
 
     def setRegulatingCondEq(self, value):
         if self._RegulatingCondEq is not None:
-            filtered = [x for x in self.RegulatingCondEq.Controls if x != self]
-            self._RegulatingCondEq._Controls = filtered
+            self._RegulatingCondEq._Controls.discard(self)
 
         self._RegulatingCondEq = value
         if self._RegulatingCondEq is not None:
             if self not in self._RegulatingCondEq._Controls:
-                self._RegulatingCondEq._Controls.append(self)
+                self._RegulatingCondEq._reflist("_Controls").append(self)
 
     RegulatingCondEq = property(getRegulatingCondEq, setRegulatingCondEq)
 
@@ -105,13 +105,12 @@ class Control(IdentifiedObject):
 
     def setControlType(self, value):
         if self._ControlType is not None:
-            filtered = [x for x in self.ControlType.Controls if x != self]
-            self._ControlType._Controls = filtered
+            self._ControlType._Controls.discard(self)
 
         self._ControlType = value
         if self._ControlType is not None:
             if self not in self._ControlType._Controls:
-                self._ControlType._Controls.append(self)
+                self._ControlType._reflist("_Controls").append(self)
 
     ControlType = property(getControlType, setControlType)
 
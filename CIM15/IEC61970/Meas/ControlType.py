@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ControlType(IdentifiedObject):
     """Specifies the type of Control, e.g. BreakerOn/Off, GeneratorVoltageSetPoint, TieLineFlow etc. The ControlType.name shall be unique among all specified types and describe the type. The ControlType.aliasName is meant to be used for localization.Specifies the type of Control, e.g. BreakerOn/Off, GeneratorVoltageSetPoint, TieLineFlow etc. The ControlType.name shall be unique among all specified types and describe the type. The ControlType.aliasName is meant to be used for localization.
@@ -29,8 +30,8 @@ class ControlType(IdentifiedObject):
 
         @param Controls: The Controls having the ControlType
         """
-        self._Controls = []
-        self.Controls = [] if Controls is None else Controls
+        if Controls is not None:
+            self.Controls = Controls
 
         super(ControlType, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class ControlType(IdentifiedObject):
     _enums = {}
     _refs = ["Controls"]
     _many_refs = ["Controls"]
+    _inverses = {"Controls": "ControlType"}
 
     def getControls(self):
         """The Controls having the ControlType
@@ -47,7 +49,8 @@ class ControlType(IdentifiedObject):
         return self._Controls
 
     def setControls(self, value):
-        for x in self._Controls:
+        value = RefList(value)
+        for x in list(self._Controls):
             x.ControlType = None
         for y in value:
             y._ControlType = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Meas.Measurement import Measurement
+from CIM15.Element import RefList
 
 class Discrete(Measurement):
     """Discrete represents a discrete Measurement, i.e. a Measurement reprsenting discrete values, e.g. a Breaker position.Discrete represents a discrete Measurement, i.e. a Measurement reprsenting discrete values, e.g. a Breaker position.
@@ -46,8 +47,8 @@ class Discrete(Measurement):
         self._Command = None
         self.Command = Command
 
-        self._DiscreteValues = []
-        self.DiscreteValues = [] if DiscreteValues is None else DiscreteValues
+        if DiscreteValues is not None:
+            self.DiscreteValues = DiscreteValues
 
         self._ValueAliasSet = None
         self.ValueAliasSet = ValueAliasSet
@@ -60,6 +61,7 @@ class Discrete(Measurement):
     _enums = {}
     _refs = ["Command", "DiscreteValues", "ValueAliasSet"]
     _many_refs = ["DiscreteValues"]
+    _inverses = {"Command": "Discrete", "DiscreteValues": "Discrete", "ValueAliasSet": "Discretes"}
 
     def getCommand(self):
         """The Control variable associated with the Measurement.
@@ -83,7 +85,8 @@ class Discrete(Measurement):
         return self._DiscreteValues
 
     def setDiscreteValues(self, value):
-        for x in self._DiscreteValues:
+        value = RefList(value)
+        for x in list(self._DiscreteValues):
             x.Discrete = None
         for y in value:
             y._Discrete = self
@@ -106,13 +109,12 @@ class Discrete(Measurement):
 
     def setValueAliasSet(self, value):
         if self._ValueAliasSet is not None:
-            filtered = [x for x in self.ValueAliasSet.Discretes if x != self]
-            self._ValueAliasSet._Discretes = filtered
+            self._ValueAliasSet._Discretes.discard(self)
 
         self._ValueAliasSet = value
         if self._ValueAliasSet is not None:
             if self not in self._ValueAliasSet._Discretes:
-                self._ValueAliasSet._Discretes.append(self)
+                self._ValueAliasSet._reflist("_Discretes").append(self)
 
     ValueAliasSet = property(getValueAliasSet, setValueAliasSet)
 
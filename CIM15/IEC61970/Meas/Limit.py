@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class Limit(IdentifiedObject):
     """Specifies one limit value for a Measurement. A Measurement typically has several limits that are kept together by the LimitSet class. The actual meaning and use of a Limit instance (i.e., if it is an alarm or warning limit or if it is a high or low limit) is not captured in the Limit class. However the name of a Limit instance may indicate both meaning and use.Specifies one limit value for a Measurement. A Measurement typically has several limits that are kept together by the LimitSet class. The actual meaning and use of a Limit instance (i.e., if it is an alarm or warning limit or if it is a high or low limit) is not captured in the Limit class. However the name of a Limit instance may indicate both meaning and use.
@@ -29,8 +30,8 @@ class Limit(IdentifiedObject):
 
         @param Procedures:
         """
-        self._Procedures = []
-        self.Procedures = [] if Procedures is None else Procedures
+        if Procedures is not None:
+            self.Procedures = Procedures
 
         super(Limit, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class Limit(IdentifiedObject):
     _enums = {}
     _refs = ["Procedures"]
     _many_refs = ["Procedures"]
+    _inverses = {"Procedures": "Limits"}
 
     def getProcedures(self):
         
@@ -47,20 +49,19 @@ class Limit(IdentifiedObject):
 
     def setProcedures(self, value):
         for p in self._Procedures:
-            filtered = [q for q in p.Limits if q != self]
-            self._Procedures._Limits = filtered
+            p._Limits.discard(self)
         for r in value:
             if self not in r._Limits:
-                r._Limits.append(self)
-        self._Procedures = value
+                r._reflist("_Limits").append(self)
+        self._Procedures = RefList(value)
 
     Procedures = property(getProcedures, setProcedures)
 
     def addProcedures(self, *Procedures):
         for obj in Procedures:
             if self not in obj._Limits:
-                obj._Limits.append(self)
-            self._Procedures.append(obj)
+                obj._reflist("_Limits").append(self)
+            self._reflist("_Procedures").append(obj)
 
     def removeProcedures(self, *Procedures):
         for obj in Procedures:
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class MeasurementValue(IdentifiedObject):
     """The current state for a measurement. A state value is an instance of a measurement from a specific source. Measurements can be associated with many state values, each representing a different source for the measurement.The current state for a measurement. A state value is an instance of a measurement from a specific source. Measurements can be associated with many state values, each representing a different source for the measurement.
@@ -42,14 +43,14 @@ class MeasurementValue(IdentifiedObject):
         #: The time when the value was last updated
         self.timeStamp = timeStamp
 
-        self._GmlValues = []
-        self.GmlValues = [] if GmlValues is None else GmlValues
+        if GmlValues is not None:
+            self.GmlValues = GmlValues
 
         self._MeasurementValueQuality = None
         self.MeasurementValueQuality = MeasurementValueQuality
 
-        self._ProcedureDataSets = []
-        self.ProcedureDataSets = [] if ProcedureDataSets is None else ProcedureDataSets
+        if ProcedureDataSets is not None:
+            self.ProcedureDataSets = ProcedureDataSets
 
         self._MeasurementValueSource = None
         self.MeasurementValueSource = MeasurementValueSource
@@ -68,13 +69,15 @@ class MeasurementValue(IdentifiedObject):
     _enums = {}
     _refs = ["GmlValues", "MeasurementValueQuality", "ProcedureDataSets", "MeasurementValueSource", "ErpPerson", "RemoteSource"]
     _many_refs = ["GmlValues", "ProcedureDataSets"]
+    _inverses = {"GmlValues": "MeasurementValue", "MeasurementValueQuality": "MeasurementValue", "ProcedureDataSets": "MeasurementValues", "MeasurementValueSource": "MeasurementValues", "ErpPerson": "MeasurementValues", "RemoteSource": "MeasurementValue"}
 
     def getGmlValues(self):
         
         return self._GmlValues
 
     def setGmlValues(self, value):
-        for x in self._GmlValues:
+        value = RefList(value)
+        for x in list(self._GmlValues):
             x.MeasurementValue = None
         for y in value:
             y._MeasurementValue = self
@@ -112,20 +115,19 @@ class MeasurementValue(IdentifiedObject):
 
     def setProcedureDataSets(self, value):
         for p in self._ProcedureDataSets:
-            filtered = [q for q in p.MeasurementValues if q != self]
-            self._ProcedureDataSets._MeasurementValues = filtered
+            p._MeasurementValues.discard(self)
         for r in value:
             if self not in r._MeasurementValues:
-                r._MeasurementValues.append(self)
-        self._ProcedureDataSets = value
+                r._reflist("_MeasurementValues").append(self)
+        self._ProcedureDataSets = RefList(value)
 
     ProcedureDataSets = property(getProcedureDataSets, setProcedureDataSets)
 
     def addProcedureDataSets(self, *ProcedureDataSets):
         for obj in ProcedureDataSets:
             if self not in obj._MeasurementValues:
-                obj._MeasurementValues.append(self)
-            self._ProcedureDataSets.append(obj)
+                obj._reflist("_MeasurementValues").append(self)
+            self._reflist("_ProcedureDataSets").append(obj)
 
     def removeProcedureDataSets(self, *ProcedureDataSets):
         for obj in ProcedureDataSets:
@@ -140,13 +142,12 @@ class MeasurementValue(IdentifiedObject):
 
     def setMeasurementValueSource(self, value):
         if self._MeasurementValueSource is not None:
-            filtered = [x for x in self.MeasurementValueSource.MeasurementValues if x != self]
-            self._MeasurementValueSource._MeasurementValues = filtered
+            self._MeasurementValueSource._MeasurementValues.discard(self)
 
         self._MeasurementValueSource = value
         if self._MeasurementValueSource is not None:
             if self not in self._MeasurementValueSource._MeasurementValues:
-                self._MeasurementValueSource._MeasurementValues.append(self)
+                self._MeasurementValueSource._reflist("_MeasurementValues").append(self)
 
     MeasurementValueSource = property(getMeasurementValueSource, setMeasurementValueSource)
 
@@ -156,13 +157,12 @@ class MeasurementValue(IdentifiedObject):
 
     def setErpPerson(self, value):
         if self._ErpPerson is not None:
-            filtered = [x for x in self.ErpPerson.MeasurementValues if x != self]
-            self._ErpPerson._MeasurementValues = filtered
+            self._ErpPerson._MeasurementValues.discard(self)
 
         self._ErpPerson = value
         if self._ErpPerson is not None:
             if self not in self._ErpPerson._MeasurementValues:
-                self._ErpPerson._MeasurementValues.append(self)
+                self._ErpPerson._reflist("_MeasurementValues").append(self)
 
     ErpPerson = property(getErpPerson, setErpPerson)
 
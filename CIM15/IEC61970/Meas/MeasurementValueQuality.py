@@ -40,6 +40,7 @@ class MeasurementValueQuality(Quality61850):
     _enums = {}
     _refs = ["MeasurementValue"]
     _many_refs = []
+    _inverses = {"MeasurementValue": "MeasurementValueQuality"}
 
     def getMeasurementValue(self):
         """A MeasurementValue has a MeasurementValueQuality associated with it.
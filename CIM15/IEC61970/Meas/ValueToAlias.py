@@ -44,6 +44,7 @@ class ValueToAlias(IdentifiedObject):
     _enums = {}
     _refs = ["ValueAliasSet"]
     _many_refs = []
+    _inverses = {"ValueAliasSet": "Values"}
 
     def getValueAliasSet(self):
         """The ValueAliasSet having the ValueToAlias mappings
@@ -52,13 +53,12 @@ class ValueToAlias(IdentifiedObject):
 
     def setValueAliasSet(self, value):
         if self._ValueAliasSet is not None:
-            filtered = [x for x in self.ValueAliasSet.Values if x != self]
-            self._ValueAliasSet._Values = filtered
+            self._ValueAliasSet._Values.discard(self)
 
         self._ValueAliasSet = value
         if self._ValueAliasSet is not None:
             if self not in self._ValueAliasSet._Values:
-                self._ValueAliasSet._Values.append(self)
+                self._ValueAliasSet._reflist("_Values").append(self)
 
     ValueAliasSet = property(getValueAliasSet, setValueAliasSet)
 
@@ -21,31 +21,8 @@
 """Contains entities that describe dynamic measurement data exchanged between applications.
 """
 
-from CIM15.IEC61970.Meas.AccumulatorLimit import AccumulatorLimit
-from CIM15.IEC61970.Meas.ValueToAlias import ValueToAlias
-from CIM15.IEC61970.Meas.MeasurementValueSource import MeasurementValueSource
-from CIM15.IEC61970.Meas.Analog import Analog
-from CIM15.IEC61970.Meas.AnalogValue import AnalogValue
-from CIM15.IEC61970.Meas.Measurement import Measurement
-from CIM15.IEC61970.Meas.ControlType import ControlType
-from CIM15.IEC61970.Meas.StringMeasurementValue import StringMeasurementValue
-from CIM15.IEC61970.Meas.StringMeasurement import StringMeasurement
-from CIM15.IEC61970.Meas.AnalogLimit import AnalogLimit
-from CIM15.IEC61970.Meas.SetPoint import SetPoint
-from CIM15.IEC61970.Meas.Limit import Limit
-from CIM15.IEC61970.Meas.Discrete import Discrete
-from CIM15.IEC61970.Meas.ValueAliasSet import ValueAliasSet
-from CIM15.IEC61970.Meas.Quality61850 import Quality61850
-from CIM15.IEC61970.Meas.AccumulatorValue import AccumulatorValue
-from CIM15.IEC61970.Meas.Command import Command
-from CIM15.IEC61970.Meas.Accumulator import Accumulator
-from CIM15.IEC61970.Meas.MeasurementValueQuality import MeasurementValueQuality
-from CIM15.IEC61970.Meas.MeasurementValue import MeasurementValue
-from CIM15.IEC61970.Meas.DiscreteValue import DiscreteValue
-from CIM15.IEC61970.Meas.AnalogLimitSet import AnalogLimitSet
-from CIM15.IEC61970.Meas.LimitSet import LimitSet
-from CIM15.IEC61970.Meas.AccumulatorLimitSet import AccumulatorLimitSet
-from CIM15.IEC61970.Meas.Control import Control
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Meas"
 nsPrefix = "cimMeas"
@@ -55,3 +32,32 @@ class Validity(str):
     """Values are: QUESTIONABLE, INVALID, GOOD
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "AccumulatorLimit",
+    "ValueToAlias",
+    "MeasurementValueSource",
+    "Analog",
+    "AnalogValue",
+    "Measurement",
+    "ControlType",
+    "StringMeasurementValue",
+    "StringMeasurement",
+    "AnalogLimit",
+    "SetPoint",
+    "Limit",
+    "Discrete",
+    "ValueAliasSet",
+    "Quality61850",
+    "AccumulatorValue",
+    "Command",
+    "Accumulator",
+    "MeasurementValueQuality",
+    "MeasurementValue",
+    "DiscreteValue",
+    "AnalogLimitSet",
+    "LimitSet",
+    "AccumulatorLimitSet",
+    "Control",
+])
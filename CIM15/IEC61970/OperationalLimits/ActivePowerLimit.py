@@ -44,6 +44,7 @@ class ActivePowerLimit(OperationalLimit):
     _enums = {}
     _refs = ["ActivePowerLimitSet"]
     _many_refs = []
+    _inverses = {"ActivePowerLimitSet": "ActivePowerLimits"}
 
     def getActivePowerLimitSet(self):
         
@@ -51,13 +52,12 @@ class ActivePowerLimit(OperationalLimit):
 
     def setActivePowerLimitSet(self, value):
         if self._ActivePowerLimitSet is not None:
-            filtered = [x for x in self.ActivePowerLimitSet.ActivePowerLimits if x != self]
-            self._ActivePowerLimitSet._ActivePowerLimits = filtered
+            self._ActivePowerLimitSet._ActivePowerLimits.discard(self)
 
         self._ActivePowerLimitSet = value
         if self._ActivePowerLimitSet is not None:
             if self not in self._ActivePowerLimitSet._ActivePowerLimits:
-                self._ActivePowerLimitSet._ActivePowerLimits.append(self)
+                self._ActivePowerLimitSet._reflist("_ActivePowerLimits").append(self)
 
     ActivePowerLimitSet = property(getActivePowerLimitSet, setActivePowerLimitSet)
 
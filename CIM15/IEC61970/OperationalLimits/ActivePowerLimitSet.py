@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
+from CIM15.Element import RefList
 
 class ActivePowerLimitSet(OperationalLimitSet):
 
@@ -27,8 +28,8 @@ class ActivePowerLimitSet(OperationalLimitSet):
 
         @param ActivePowerLimits:
         """
-        self._ActivePowerLimits = []
-        self.ActivePowerLimits = [] if ActivePowerLimits is None else ActivePowerLimits
+        if ActivePowerLimits is not None:
+            self.ActivePowerLimits = ActivePowerLimits
 
         super(ActivePowerLimitSet, self).__init__(*args, **kw_args)
 
@@ -38,13 +39,15 @@ class ActivePowerLimitSet(OperationalLimitSet):
     _enums = {}
     _refs = ["ActivePowerLimits"]
     _many_refs = ["ActivePowerLimits"]
+    _inverses = {"ActivePowerLimits": "ActivePowerLimitSet"}
 
     def getActivePowerLimits(self):
         
         return self._ActivePowerLimits
 
     def setActivePowerLimits(self, value):
-        for x in self._ActivePowerLimits:
+        value = RefList(value)
+        for x in list(self._ActivePowerLimits):
             x.ActivePowerLimitSet = None
         for y in value:
             y._ActivePowerLimitSet = self
@@ -44,6 +44,7 @@ class ApparentPowerLimit(OperationalLimit):
     _enums = {}
     _refs = ["ApparentPowerLimitSet"]
     _many_refs = []
+    _inverses = {"ApparentPowerLimitSet": "ApparentPowerLimits"}
 
     def getApparentPowerLimitSet(self):
         
@@ -51,13 +52,12 @@ class ApparentPowerLimit(OperationalLimit):
 
     def setApparentPowerLimitSet(self, value):
         if self._ApparentPowerLimitSet is not None:
-            filtered = [x for x in self.ApparentPowerLimitSet.ApparentPowerLimits if x != self]
-            self._ApparentPowerLimitSet._ApparentPowerLimits = filtered
+            self._ApparentPowerLimitSet._ApparentPowerLimits.discard(self)
 
         self._ApparentPowerLimitSet = value
         if self._ApparentPowerLimitSet is not None:
             if self not in self._ApparentPowerLimitSet._ApparentPowerLimits:
-                self._ApparentPowerLimitSet._ApparentPowerLimits.append(self)
+                self._ApparentPowerLimitSet._reflist("_ApparentPowerLimits").append(self)
 
     ApparentPowerLimitSet = property(getApparentPowerLimitSet, setApparentPowerLimitSet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
+from CIM15.Element import RefList
 
 class ApparentPowerLimitSet(OperationalLimitSet):
 
@@ -27,8 +28,8 @@ class ApparentPowerLimitSet(OperationalLimitSet):
 
         @param ApparentPowerLimits:
         """
-        self._ApparentPowerLimits = []
-        self.ApparentPowerLimits = [] if ApparentPowerLimits is None else ApparentPowerLimits
+        if ApparentPowerLimits is not None:
+            self.ApparentPowerLimits = ApparentPowerLimits
 
         super(ApparentPowerLimitSet, self).__init__(*args, **kw_args)
 
@@ -38,13 +39,15 @@ class ApparentPowerLimitSet(OperationalLimitSet):
     _enums = {}
     _refs = ["ApparentPowerLimits"]
     _many_refs = ["ApparentPowerLimits"]
+    _inverses = {"ApparentPowerLimits": "ApparentPowerLimitSet"}
 
     def getApparentPowerLimits(self):
         
         return self._ApparentPowerLimits
 
     def setApparentPowerLimits(self, value):
-        for x in self._ApparentPowerLimits:
+        value = RefList(value)
+        for x in list(self._ApparentPowerLimits):
             x.ApparentPowerLimitSet = None
         for y in value:
             y._ApparentPowerLimitSet = self
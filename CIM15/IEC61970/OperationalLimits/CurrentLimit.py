@@ -44,6 +44,7 @@ class CurrentLimit(OperationalLimit):
     _enums = {}
     _refs = ["CurrentLimitSet"]
     _many_refs = []
+    _inverses = {"CurrentLimitSet": "CurrentLimits"}
 
     def getCurrentLimitSet(self):
         
@@ -51,13 +52,12 @@ class CurrentLimit(OperationalLimit):
 
     def setCurrentLimitSet(self, value):
         if self._CurrentLimitSet is not None:
-            filtered = [x for x in self.CurrentLimitSet.CurrentLimits if x != self]
-            self._CurrentLimitSet._CurrentLimits = filtered
+            self._CurrentLimitSet._CurrentLimits.discard(self)
 
         self._CurrentLimitSet = value
         if self._CurrentLimitSet is not None:
             if self not in self._CurrentLimitSet._CurrentLimits:
-                self._CurrentLimitSet._CurrentLimits.append(self)
+                self._CurrentLimitSet._reflist("_CurrentLimits").append(self)
 
     CurrentLimitSet = property(getCurrentLimitSet, setCurrentLimitSet)
 
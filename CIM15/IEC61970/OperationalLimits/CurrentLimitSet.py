@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
+from CIM15.Element import RefList
 
 class CurrentLimitSet(OperationalLimitSet):
 
@@ -27,8 +28,8 @@ class CurrentLimitSet(OperationalLimitSet):
 
         @param CurrentLimits:
         """
-        self._CurrentLimits = []
-        self.CurrentLimits = [] if CurrentLimits is None else CurrentLimits
+        if CurrentLimits is not None:
+            self.CurrentLimits = CurrentLimits
 
         super(CurrentLimitSet, self).__init__(*args, **kw_args)
 
@@ -38,13 +39,15 @@ class CurrentLimitSet(OperationalLimitSet):
     _enums = {}
     _refs = ["CurrentLimits"]
     _many_refs = ["CurrentLimits"]
+    _inverses = {"CurrentLimits": "CurrentLimitSet"}
 
     def getCurrentLimits(self):
         
         return self._CurrentLimits
 
     def setCurrentLimits(self, value):
-        for x in self._CurrentLimits:
+        value = RefList(value)
+        for x in list(self._CurrentLimits):
             x.CurrentLimitSet = None
         for y in value:
             y._CurrentLimitSet = self
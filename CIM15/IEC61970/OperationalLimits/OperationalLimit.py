@@ -44,6 +44,7 @@ class OperationalLimit(IdentifiedObject):
     _enums = {}
     _refs = ["OperationalLimitType", "OperationalLimitSet"]
     _many_refs = []
+    _inverses = {"OperationalLimitType": "OperationalLimit", "OperationalLimitSet": "OperationalLimitValue"}
 
     def getOperationalLimitType(self):
         """The limit type associated with this limit.
@@ -52,13 +53,12 @@ class OperationalLimit(IdentifiedObject):
 
     def setOperationalLimitType(self, value):
         if self._OperationalLimitType is not None:
-            filtered = [x for x in self.OperationalLimitType.OperationalLimit if x != self]
-            self._OperationalLimitType._OperationalLimit = filtered
+            self._OperationalLimitType._OperationalLimit.discard(self)
 
         self._OperationalLimitType = value
         if self._OperationalLimitType is not None:
             if self not in self._OperationalLimitType._OperationalLimit:
-                self._OperationalLimitType._OperationalLimit.append(self)
+                self._OperationalLimitType._reflist("_OperationalLimit").append(self)
 
     OperationalLimitType = property(getOperationalLimitType, setOperationalLimitType)
 
@@ -69,13 +69,12 @@ class OperationalLimit(IdentifiedObject):
 
     def setOperationalLimitSet(self, value):
         if self._OperationalLimitSet is not None:
-            filtered = [x for x in self.OperationalLimitSet.OperationalLimitValue if x != self]
-            self._OperationalLimitSet._OperationalLimitValue = filtered
+            self._OperationalLimitSet._OperationalLimitValue.discard(self)
 
         self._OperationalLimitSet = value
         if self._OperationalLimitSet is not None:
             if self not in self._OperationalLimitSet._OperationalLimitValue:
-                self._OperationalLimitSet._OperationalLimitValue.append(self)
+                self._OperationalLimitSet._reflist("_OperationalLimitValue").append(self)
 
     OperationalLimitSet = property(getOperationalLimitSet, setOperationalLimitSet)
 
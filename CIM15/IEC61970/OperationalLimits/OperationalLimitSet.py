@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class OperationalLimitSet(IdentifiedObject):
     """A set of limits associated with equipmnet.  Sets of limits might apply to a specific temperature, or season for example. A set of limits may contain may different severities of limit levels that would apply to the same equipment.   The set may contain limits of different types such as apparent power and current limits or high and low voltage limits  that are logically applied together as a set.A set of limits associated with equipmnet.  Sets of limits might apply to a specific temperature, or season for example. A set of limits may contain may different severities of limit levels that would apply to the same equipment.   The set may contain limits of different types such as apparent power and current limits or high and low voltage limits  that are logically applied together as a set.
@@ -33,8 +34,8 @@ class OperationalLimitSet(IdentifiedObject):
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._OperationalLimitValue = []
-        self.OperationalLimitValue = [] if OperationalLimitValue is None else OperationalLimitValue
+        if OperationalLimitValue is not None:
+            self.OperationalLimitValue = OperationalLimitValue
 
         super(OperationalLimitSet, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class OperationalLimitSet(IdentifiedObject):
     _enums = {}
     _refs = ["Terminal", "OperationalLimitValue"]
     _many_refs = ["OperationalLimitValue"]
+    _inverses = {"Terminal": "OperationalLimitSet", "OperationalLimitValue": "OperationalLimitSet"}
 
     def getTerminal(self):
         """The terminal specifically associated to this operational limit set.  If no terminal is associated, all terminals of the equipment are implied.
@@ -52,13 +54,12 @@ class OperationalLimitSet(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.OperationalLimitSet if x != self]
-            self._Terminal._OperationalLimitSet = filtered
+            self._Terminal._OperationalLimitSet.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._OperationalLimitSet:
-                self._Terminal._OperationalLimitSet.append(self)
+                self._Terminal._reflist("_OperationalLimitSet").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -68,7 +69,8 @@ class OperationalLimitSet(IdentifiedObject):
         return self._OperationalLimitValue
 
     def setOperationalLimitValue(self, value):
-        for x in self._OperationalLimitValue:
+        value = RefList(value)
+        for x in list(self._OperationalLimitValue):
             x.OperationalLimitSet = None
         for y in value:
             y._OperationalLimitSet = self
@@ -44,6 +44,7 @@ class VoltageLimit(OperationalLimit):
     _enums = {}
     _refs = ["VoltageLimitSet"]
     _many_refs = []
+    _inverses = {"VoltageLimitSet": "VoltageLimits"}
 
     def getVoltageLimitSet(self):
         
@@ -51,13 +52,12 @@ class VoltageLimit(OperationalLimit):
 
     def setVoltageLimitSet(self, value):
         if self._VoltageLimitSet is not None:
-            filtered = [x for x in self.VoltageLimitSet.VoltageLimits if x != self]
-            self._VoltageLimitSet._VoltageLimits = filtered
+            self._VoltageLimitSet._VoltageLimits.discard(self)
 
         self._VoltageLimitSet = value
         if self._VoltageLimitSet is not None:
             if self not in self._VoltageLimitSet._VoltageLimits:
-                self._VoltageLimitSet._VoltageLimits.append(self)
+                self._VoltageLimitSet._reflist("_VoltageLimits").append(self)
 
     VoltageLimitSet = property(getVoltageLimitSet, setVoltageLimitSet)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
+from CIM15.Element import RefList
 
 class VoltageLimitSet(OperationalLimitSet):
 
@@ -27,8 +28,8 @@ class VoltageLimitSet(OperationalLimitSet):
 
         @param VoltageLimits:
         """
-        self._VoltageLimits = []
-        self.VoltageLimits = [] if VoltageLimits is None else VoltageLimits
+        if VoltageLimits is not None:
+            self.VoltageLimits = VoltageLimits
 
         super(VoltageLimitSet, self).__init__(*args, **kw_args)
 
@@ -38,13 +39,15 @@ class VoltageLimitSet(OperationalLimitSet):
     _enums = {}
     _refs = ["VoltageLimits"]
     _many_refs = ["VoltageLimits"]
+    _inverses = {"VoltageLimits": "VoltageLimitSet"}
 
     def getVoltageLimits(self):
         
         return self._VoltageLimits
 
     def setVoltageLimits(self, value):
-        for x in self._VoltageLimits:
+        value = RefList(value)
+        for x in list(self._VoltageLimits):
             x.VoltageLimitSet = None
         for y in value:
             y._VoltageLimitSet = self
@@ -21,19 +21,8 @@
 """The OperationalLimits package models a specification of limits associated with equipment and other operational entities.
 """
 
-from CIM15.IEC61970.OperationalLimits.ApparentPowerLimit import ApparentPowerLimit
-from CIM15.IEC61970.OperationalLimits.ActivePowerLimit import ActivePowerLimit
-from CIM15.IEC61970.OperationalLimits.OperationalLimitType import OperationalLimitType
-from CIM15.IEC61970.OperationalLimits.BranchGroup import BranchGroup
-from CIM15.IEC61970.OperationalLimits.OperationalLimitSet import OperationalLimitSet
-from CIM15.IEC61970.OperationalLimits.ActivePowerLimitSet import ActivePowerLimitSet
-from CIM15.IEC61970.OperationalLimits.CurrentLimit import CurrentLimit
-from CIM15.IEC61970.OperationalLimits.CurrentLimitSet import CurrentLimitSet
-from CIM15.IEC61970.OperationalLimits.ApparentPowerLimitSet import ApparentPowerLimitSet
-from CIM15.IEC61970.OperationalLimits.BranchGroupTerminal import BranchGroupTerminal
-from CIM15.IEC61970.OperationalLimits.VoltageLimitSet import VoltageLimitSet
-from CIM15.IEC61970.OperationalLimits.VoltageLimit import VoltageLimit
-from CIM15.IEC61970.OperationalLimits.OperationalLimit import OperationalLimit
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#OperationalLimits"
 nsPrefix = "cimOperationalLimits"
@@ -43,3 +32,20 @@ class OperationalLimitDirectionKind(str):
     """Values are: low, high, absoluteValue
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "ApparentPowerLimit",
+    "ActivePowerLimit",
+    "OperationalLimitType",
+    "BranchGroup",
+    "OperationalLimitSet",
+    "ActivePowerLimitSet",
+    "CurrentLimit",
+    "CurrentLimitSet",
+    "ApparentPowerLimitSet",
+    "BranchGroupTerminal",
+    "VoltageLimitSet",
+    "VoltageLimit",
+    "OperationalLimit",
+])
@@ -80,6 +80,7 @@ class ClearanceTag(IdentifiedObject):
     _enums = {}
     _refs = ["ConductingEquipment", "SafetyDocument", "ClearanceTagType"]
     _many_refs = []
+    _inverses = {"ConductingEquipment": "ClearanceTags", "SafetyDocument": "ClearanceTags", "ClearanceTagType": "ClearanceTags"}
 
     def getConductingEquipment(self):
         """Conducting equipment may have multiple clearance tags for authorized field work
@@ -88,13 +89,12 @@ class ClearanceTag(IdentifiedObject):
 
     def setConductingEquipment(self, value):
         if self._ConductingEquipment is not None:
-            filtered = [x for x in self.ConductingEquipment.ClearanceTags if x != self]
-            self._ConductingEquipment._ClearanceTags = filtered
+            self._ConductingEquipment._ClearanceTags.discard(self)
 
         self._ConductingEquipment = value
         if self._ConductingEquipment is not None:
             if self not in self._ConductingEquipment._ClearanceTags:
-                self._ConductingEquipment._ClearanceTags.append(self)
+                self._ConductingEquipment._reflist("_ClearanceTags").append(self)
 
     ConductingEquipment = property(getConductingEquipment, setConductingEquipment)
 
@@ -104,13 +104,12 @@ class ClearanceTag(IdentifiedObject):
 
     def setSafetyDocument(self, value):
         if self._SafetyDocument is not None:
-            filtered = [x for x in self.SafetyDocument.ClearanceTags if x != self]
-            self._SafetyDocument._ClearanceTags = filtered
+            self._SafetyDocument._ClearanceTags.discard(self)
 
         self._SafetyDocument = value
         if self._SafetyDocument is not None:
             if self not in self._SafetyDocument._ClearanceTags:
-                self._SafetyDocument._ClearanceTags.append(self)
+                self._SafetyDocument._reflist("_ClearanceTags").append(self)
 
     SafetyDocument = property(getSafetyDocument, setSafetyDocument)
 
@@ -121,13 +120,12 @@ class ClearanceTag(IdentifiedObject):
 
     def setClearanceTagType(self, value):
         if self._ClearanceTagType is not None:
-            filtered = [x for x in self.ClearanceTagType.ClearanceTags if x != self]
-            self._ClearanceTagType._ClearanceTags = filtered
+            self._ClearanceTagType._ClearanceTags.discard(self)
 
         self._ClearanceTagType = value
         if self._ClearanceTagType is not None:
             if self not in self._ClearanceTagType._ClearanceTags:
-                self._ClearanceTagType._ClearanceTags.append(self)
+                self._ClearanceTagType._reflist("_ClearanceTags").append(self)
 
     ClearanceTagType = property(getClearanceTagType, setClearanceTagType)
 
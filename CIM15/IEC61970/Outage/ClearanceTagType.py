@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class ClearanceTagType(IdentifiedObject):
     """Type of ClearanceTag. Could indicate the type of work to be performed and/or the type of supervisory control.Type of ClearanceTag. Could indicate the type of work to be performed and/or the type of supervisory control.
@@ -29,8 +30,8 @@ class ClearanceTagType(IdentifiedObject):
 
         @param ClearanceTags: The ClearanceTags currently being defined for this type.
         """
-        self._ClearanceTags = []
-        self.ClearanceTags = [] if ClearanceTags is None else ClearanceTags
+        if ClearanceTags is not None:
+            self.ClearanceTags = ClearanceTags
 
         super(ClearanceTagType, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class ClearanceTagType(IdentifiedObject):
     _enums = {}
     _refs = ["ClearanceTags"]
     _many_refs = ["ClearanceTags"]
+    _inverses = {"ClearanceTags": "ClearanceTagType"}
 
     def getClearanceTags(self):
         """The ClearanceTags currently being defined for this type.
@@ -47,7 +49,8 @@ class ClearanceTagType(IdentifiedObject):
         return self._ClearanceTags
 
     def setClearanceTags(self, value):
-        for x in self._ClearanceTags:
+        value = RefList(value)
+        for x in list(self._ClearanceTags):
             x.ClearanceTagType = None
         for y in value:
             y._ClearanceTagType = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IrregularIntervalSchedule import IrregularIntervalSchedule
+from CIM15.Element import RefList
 
 class OutageSchedule(IrregularIntervalSchedule):
     """The period of time that a piece of equipment is out of service, for example, for maintenance or testing; including the equipment's active power rating while under maintenance. The X-axis represents absolute time and the Y-axis represents the equipment's available rating while out of service.The period of time that a piece of equipment is out of service, for example, for maintenance or testing; including the equipment's active power rating while under maintenance. The X-axis represents absolute time and the Y-axis represents the equipment's available rating while out of service.
@@ -34,8 +35,8 @@ class OutageSchedule(IrregularIntervalSchedule):
         self._PlannedOutage = None
         self.PlannedOutage = PlannedOutage
 
-        self._SwitchingOperations = []
-        self.SwitchingOperations = [] if SwitchingOperations is None else SwitchingOperations
+        if SwitchingOperations is not None:
+            self.SwitchingOperations = SwitchingOperations
 
         self._PowerSystemResource = None
         self.PowerSystemResource = PowerSystemResource
@@ -48,6 +49,7 @@ class OutageSchedule(IrregularIntervalSchedule):
     _enums = {}
     _refs = ["PlannedOutage", "SwitchingOperations", "PowerSystemResource"]
     _many_refs = ["SwitchingOperations"]
+    _inverses = {"PlannedOutage": "OutageSchedules", "SwitchingOperations": "OutageSchedule", "PowerSystemResource": "OutageSchedule"}
 
     def getPlannedOutage(self):
         
@@ -55,13 +57,12 @@ class OutageSchedule(IrregularIntervalSchedule):
 
     def setPlannedOutage(self, value):
         if self._PlannedOutage is not None:
-            filtered = [x for x in self.PlannedOutage.OutageSchedules if x != self]
-            self._PlannedOutage._OutageSchedules = filtered
+            self._PlannedOutage._OutageSchedules.discard(self)
 
         self._PlannedOutage = value
         if self._PlannedOutage is not None:
             if self not in self._PlannedOutage._OutageSchedules:
-                self._PlannedOutage._OutageSchedules.append(self)
+                self._PlannedOutage._reflist("_OutageSchedules").append(self)
 
     PlannedOutage = property(getPlannedOutage, setPlannedOutage)
 
@@ -71,7 +72,8 @@ class OutageSchedule(IrregularIntervalSchedule):
         return self._SwitchingOperations
 
     def setSwitchingOperations(self, value):
-        for x in self._SwitchingOperations:
+        value = RefList(value)
+        for x in list(self._SwitchingOperations):
             x.OutageSchedule = None
         for y in value:
             y._OutageSchedule = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class SwitchingOperation(IdentifiedObject):
     """A SwitchingOperation is used to define individual switch operations for an OutageSchedule. This OutageSchedule may be associated with another item of Substation such as a Transformer, Line, or Generator; or with the Switch itself as a PowerSystemResource. A Switch may be referenced by many OutageSchedules.A SwitchingOperation is used to define individual switch operations for an OutageSchedule. This OutageSchedule may be associated with another item of Substation such as a Transformer, Line, or Generator; or with the Switch itself as a PowerSystemResource. A Switch may be referenced by many OutageSchedules.
@@ -41,8 +42,8 @@ class SwitchingOperation(IdentifiedObject):
         self._OutageSchedule = None
         self.OutageSchedule = OutageSchedule
 
-        self._Switches = []
-        self.Switches = [] if Switches is None else Switches
+        if Switches is not None:
+            self.Switches = Switches
 
         super(SwitchingOperation, self).__init__(*args, **kw_args)
 
@@ -52,6 +53,7 @@ class SwitchingOperation(IdentifiedObject):
     _enums = {"newState": "SwitchState"}
     _refs = ["OutageSchedule", "Switches"]
     _many_refs = ["Switches"]
+    _inverses = {"OutageSchedule": "SwitchingOperations", "Switches": "SwitchingOperations"}
 
     def getOutageSchedule(self):
         """An OutageSchedule may operate many switches.
@@ -60,13 +62,12 @@ class SwitchingOperation(IdentifiedObject):
 
     def setOutageSchedule(self, value):
         if self._OutageSchedule is not None:
-            filtered = [x for x in self.OutageSchedule.SwitchingOperations if x != self]
-            self._OutageSchedule._SwitchingOperations = filtered
+            self._OutageSchedule._SwitchingOperations.discard(self)
 
         self._OutageSchedule = value
         if self._OutageSchedule is not None:
             if self not in self._OutageSchedule._SwitchingOperations:
-                self._OutageSchedule._SwitchingOperations.append(self)
+                self._OutageSchedule._reflist("_SwitchingOperations").append(self)
 
     OutageSchedule = property(getOutageSchedule, setOutageSchedule)
 
@@ -77,20 +78,19 @@ class SwitchingOperation(IdentifiedObject):
 
     def setSwitches(self, value):
         for p in self._Switches:
-            filtered = [q for q in p.SwitchingOperations if q != self]
-            self._Switches._SwitchingOperations = filtered
+            p._SwitchingOperations.discard(self)
         for r in value:
             if self not in r._SwitchingOperations:
-                r._SwitchingOperations.append(self)
-        self._Switches = value
+                r._reflist("_SwitchingOperations").append(self)
+        self._Switches = RefList(value)
 
     Switches = property(getSwitches, setSwitches)
 
     def addSwitches(self, *Switches):
         for obj in Switches:
             if self not in obj._SwitchingOperations:
-                obj._SwitchingOperations.append(self)
-            self._Switches.append(obj)
+                obj._reflist("_SwitchingOperations").append(self)
+            self._reflist("_Switches").append(obj)
 
     def removeSwitches(self, *Switches):
         for obj in Switches:
@@ -21,10 +21,8 @@
 """An extension to the Core and Wires packages that models information on the current and planned network configuration. These entities are optional within typical network applications.
 """
 
-from CIM15.IEC61970.Outage.SwitchingOperation import SwitchingOperation
-from CIM15.IEC61970.Outage.OutageSchedule import OutageSchedule
-from CIM15.IEC61970.Outage.ClearanceTagType import ClearanceTagType
-from CIM15.IEC61970.Outage.ClearanceTag import ClearanceTag
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Outage"
 nsPrefix = "cimOutage"
@@ -34,3 +32,11 @@ class SwitchState(str):
     """Values are: open, close
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "SwitchingOperation",
+    "OutageSchedule",
+    "ClearanceTagType",
+    "ClearanceTag",
+])
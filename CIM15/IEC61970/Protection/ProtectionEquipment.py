@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Equipment import Equipment
+from CIM15.Element import RefList
 
 class ProtectionEquipment(Equipment):
     """An electrical device designed to respond to input conditions in a prescribed manner and after specified conditions are met to cause contact operation or similar abrupt change in associated electric control circuits, or simply to display the detected condition. Protection equipment are associated with conducting equipment and usually operate circuit breakers.An electrical device designed to respond to input conditions in a prescribed manner and after specified conditions are met to cause contact operation or similar abrupt change in associated electric control circuits, or simply to display the detected condition. Protection equipment are associated with conducting equipment and usually operate circuit breakers.
@@ -54,11 +55,11 @@ class ProtectionEquipment(Equipment):
         #: The unit multiplier of the value. Values are: "M", "G", "d", "micro", "c", "p", "n", "T", "k", "m", "none"
         self.unitMultiplier = unitMultiplier
 
-        self._ConductingEquipments = []
-        self.ConductingEquipments = [] if ConductingEquipments is None else ConductingEquipments
+        if ConductingEquipments is not None:
+            self.ConductingEquipments = ConductingEquipments
 
-        self._ProtectedSwitches = []
-        self.ProtectedSwitches = [] if ProtectedSwitches is None else ProtectedSwitches
+        if ProtectedSwitches is not None:
+            self.ProtectedSwitches = ProtectedSwitches
 
         super(ProtectionEquipment, self).__init__(*args, **kw_args)
 
@@ -68,6 +69,7 @@ class ProtectionEquipment(Equipment):
     _enums = {"unitSymbol": "UnitSymbol", "unitMultiplier": "UnitMultiplier"}
     _refs = ["ConductingEquipments", "ProtectedSwitches"]
     _many_refs = ["ConductingEquipments", "ProtectedSwitches"]
+    _inverses = {"ConductingEquipments": "ProtectionEquipments", "ProtectedSwitches": "ProtectionEquipments"}
 
     def getConductingEquipments(self):
         """Protection equipment may be used to protect specific Conducting Equipment. Multiple equipment may be protected or monitored by multiple protection equipment.
@@ -76,20 +78,19 @@ class ProtectionEquipment(Equipment):
 
     def setConductingEquipments(self, value):
         for p in self._ConductingEquipments:
-            filtered = [q for q in p.ProtectionEquipments if q != self]
-            self._ConductingEquipments._ProtectionEquipments = filtered
+            p._ProtectionEquipments.discard(self)
         for r in value:
             if self not in r._ProtectionEquipments:
-                r._ProtectionEquipments.append(self)
-        self._ConductingEquipments = value
+                r._reflist("_ProtectionEquipments").append(self)
+        self._ConductingEquipments = RefList(value)
 
     ConductingEquipments = property(getConductingEquipments, setConductingEquipments)
 
     def addConductingEquipments(self, *ConductingEquipments):
         for obj in ConductingEquipments:
             if self not in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.append(self)
-            self._ConductingEquipments.append(obj)
+                obj._reflist("_ProtectionEquipments").append(self)
+            self._reflist("_ConductingEquipments").append(obj)
 
     def removeConductingEquipments(self, *ConductingEquipments):
         for obj in ConductingEquipments:
@@ -104,20 +105,19 @@ class ProtectionEquipment(Equipment):
 
     def setProtectedSwitches(self, value):
         for p in self._ProtectedSwitches:
-            filtered = [q for q in p.ProtectionEquipments if q != self]
-            self._ProtectedSwitches._ProtectionEquipments = filtered
+            p._ProtectionEquipments.discard(self)
         for r in value:
             if self not in r._ProtectionEquipments:
-                r._ProtectionEquipments.append(self)
-        self._ProtectedSwitches = value
+                r._reflist("_ProtectionEquipments").append(self)
+        self._ProtectedSwitches = RefList(value)
 
     ProtectedSwitches = property(getProtectedSwitches, setProtectedSwitches)
 
     def addProtectedSwitches(self, *ProtectedSwitches):
         for obj in ProtectedSwitches:
             if self not in obj._ProtectionEquipments:
-                obj._ProtectionEquipments.append(self)
-            self._ProtectedSwitches.append(obj)
+                obj._reflist("_ProtectionEquipments").append(self)
+            self._reflist("_ProtectedSwitches").append(obj)
 
     def removeProtectedSwitches(self, *ProtectedSwitches):
         for obj in ProtectedSwitches:
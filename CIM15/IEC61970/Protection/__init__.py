@@ -21,11 +21,16 @@
 """An extension to the Core and Wires packages that models information for protection equipment such as relays. These entities are used within training simulators and distribution network fault location applications.
 """
 
-from CIM15.IEC61970.Protection.RecloseSequence import RecloseSequence
-from CIM15.IEC61970.Protection.SynchrocheckRelay import SynchrocheckRelay
-from CIM15.IEC61970.Protection.CurrentRelay import CurrentRelay
-from CIM15.IEC61970.Protection.ProtectionEquipment import ProtectionEquipment
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Protection"
 nsPrefix = "cimProtection"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "RecloseSequence",
+    "SynchrocheckRelay",
+    "CurrentRelay",
+    "ProtectionEquipment",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import RefList
 
 class CommunicationLink(PowerSystemResource):
     """The connection to remote units is through one or more communication links. Reduntant links may exist. The CommunicationLink class inherit PowerSystemResource. The intention is to allow CommunicationLinks to have Measurements. These Measurements can be used to model link status as operational, out of service, unit failure etc.The connection to remote units is through one or more communication links. Reduntant links may exist. The CommunicationLink class inherit PowerSystemResource. The intention is to allow CommunicationLinks to have Measurements. These Measurements can be used to model link status as operational, out of service, unit failure etc.
@@ -29,8 +30,8 @@ class CommunicationLink(PowerSystemResource):
 
         @param RemoteUnits: RTUs may be attached to communication links.
         """
-        self._RemoteUnits = []
-        self.RemoteUnits = [] if RemoteUnits is None else RemoteUnits
+        if RemoteUnits is not None:
+            self.RemoteUnits = RemoteUnits
 
         super(CommunicationLink, self).__init__(*args, **kw_args)
 
@@ -40,6 +41,7 @@ class CommunicationLink(PowerSystemResource):
     _enums = {}
     _refs = ["RemoteUnits"]
     _many_refs = ["RemoteUnits"]
+    _inverses = {"RemoteUnits": "CommunicationLinks"}
 
     def getRemoteUnits(self):
         """RTUs may be attached to communication links.
@@ -48,20 +50,19 @@ class CommunicationLink(PowerSystemResource):
 
     def setRemoteUnits(self, value):
         for p in self._RemoteUnits:
-            filtered = [q for q in p.CommunicationLinks if q != self]
-            self._RemoteUnits._CommunicationLinks = filtered
+            p._CommunicationLinks.discard(self)
         for r in value:
             if self not in r._CommunicationLinks:
-                r._CommunicationLinks.append(self)
-        self._RemoteUnits = value
+                r._reflist("_CommunicationLinks").append(self)
+        self._RemoteUnits = RefList(value)
 
     RemoteUnits = property(getRemoteUnits, setRemoteUnits)
 
     def addRemoteUnits(self, *RemoteUnits):
         for obj in RemoteUnits:
             if self not in obj._CommunicationLinks:
-                obj._CommunicationLinks.append(self)
-            self._RemoteUnits.append(obj)
+                obj._reflist("_CommunicationLinks").append(self)
+            self._reflist("_RemoteUnits").append(obj)
 
     def removeRemoteUnits(self, *RemoteUnits):
         for obj in RemoteUnits:
@@ -40,6 +40,7 @@ class RemotePoint(IdentifiedObject):
     _enums = {}
     _refs = ["RemoteUnit"]
     _many_refs = []
+    _inverses = {"RemoteUnit": "RemotePoints"}
 
     def getRemoteUnit(self):
         """Remote unit this point belongs to.
@@ -48,13 +49,12 @@ class RemotePoint(IdentifiedObject):
 
     def setRemoteUnit(self, value):
         if self._RemoteUnit is not None:
-            filtered = [x for x in self.RemoteUnit.RemotePoints if x != self]
-            self._RemoteUnit._RemotePoints = filtered
+            self._RemoteUnit._RemotePoints.discard(self)
 
         self._RemoteUnit = value
         if self._RemoteUnit is not None:
             if self not in self._RemoteUnit._RemotePoints:
-                self._RemoteUnit._RemotePoints.append(self)
+                self._RemoteUnit._reflist("_RemotePoints").append(self)
 
     RemoteUnit = property(getRemoteUnit, setRemoteUnit)
 
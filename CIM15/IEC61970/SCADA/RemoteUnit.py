@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import RefList
 
 class RemoteUnit(PowerSystemResource):
     """A remote unit can be a RTU, IED, substation control system, control center etc. The communication with the remote unit can be through various standard protocols (e.g. IEC 61870, IEC 61850) or non standard protocols (e.g. DNP, RP570 etc.). A remote unit contain remote data points that might be telemetered, collected or calculated. The RemoteUnit class inherit PowerSystemResource. The intention is to allow RemotUnits to have Measurements. These Measurements can be used to model unit status as operational, out of service, unit failure etc.A remote unit can be a RTU, IED, substation control system, control center etc. The communication with the remote unit can be through various standard protocols (e.g. IEC 61870, IEC 61850) or non standard protocols (e.g. DNP, RP570 etc.). A remote unit contain remote data points that might be telemetered, collected or calculated. The RemoteUnit class inherit PowerSystemResource. The intention is to allow RemotUnits to have Measurements. These Measurements can be used to model unit status as operational, out of service, unit failure etc.
@@ -34,11 +35,11 @@ class RemoteUnit(PowerSystemResource):
         #: Type of remote unit. Values are: "SubstationControlSystem", "IED", "ControlCenter", "RTU"
         self.remoteUnitType = remoteUnitType
 
-        self._RemotePoints = []
-        self.RemotePoints = [] if RemotePoints is None else RemotePoints
+        if RemotePoints is not None:
+            self.RemotePoints = RemotePoints
 
-        self._CommunicationLinks = []
-        self.CommunicationLinks = [] if CommunicationLinks is None else CommunicationLinks
+        if CommunicationLinks is not None:
+            self.CommunicationLinks = CommunicationLinks
 
         super(RemoteUnit, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class RemoteUnit(PowerSystemResource):
     _enums = {"remoteUnitType": "RemoteUnitType"}
     _refs = ["RemotePoints", "CommunicationLinks"]
     _many_refs = ["RemotePoints", "CommunicationLinks"]
+    _inverses = {"RemotePoints": "RemoteUnit", "CommunicationLinks": "RemoteUnits"}
 
     def getRemotePoints(self):
         """Remote points this Remote unit contains.
@@ -55,7 +57,8 @@ class RemoteUnit(PowerSystemResource):
         return self._RemotePoints
 
     def setRemotePoints(self, value):
-        for x in self._RemotePoints:
+        value = RefList(value)
+        for x in list(self._RemotePoints):
             x.RemoteUnit = None
         for y in value:
             y._RemoteUnit = self
@@ -78,20 +81,19 @@ class RemoteUnit(PowerSystemResource):
 
     def setCommunicationLinks(self, value):
         for p in self._CommunicationLinks:
-            filtered = [q for q in p.RemoteUnits if q != self]
-            self._CommunicationLinks._RemoteUnits = filtered
+            p._RemoteUnits.discard(self)
         for r in value:
             if self not in r._RemoteUnits:
-                r._RemoteUnits.append(self)
-        self._CommunicationLinks = value
+                r._reflist("_RemoteUnits").append(self)
+        self._CommunicationLinks = RefList(value)
 
     CommunicationLinks = property(getCommunicationLinks, setCommunicationLinks)
 
     def addCommunicationLinks(self, *CommunicationLinks):
         for obj in CommunicationLinks:
             if self not in obj._RemoteUnits:
-                obj._RemoteUnits.append(self)
-            self._CommunicationLinks.append(obj)
+                obj._reflist("_RemoteUnits").append(self)
+            self._reflist("_CommunicationLinks").append(obj)
 
     def removeCommunicationLinks(self, *CommunicationLinks):
         for obj in CommunicationLinks:
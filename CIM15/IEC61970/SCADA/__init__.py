@@ -21,11 +21,8 @@
 """Contains entities to model information used by Supervisory Control and Data Acquisition (SCADA) applications. Supervisory control supports operator control of equipment, such as opening or closing a breaker. Data acquisition gathers telemetered data from various sources.  The subtypes of the Telemetry entity deliberately match the UCA and IEC 61850 definitions.  This package also supports alarm presentation but it is not expected to be used by other applications.
 """
 
-from CIM15.IEC61970.SCADA.RemoteSource import RemoteSource
-from CIM15.IEC61970.SCADA.RemotePoint import RemotePoint
-from CIM15.IEC61970.SCADA.RemoteUnit import RemoteUnit
-from CIM15.IEC61970.SCADA.RemoteControl import RemoteControl
-from CIM15.IEC61970.SCADA.CommunicationLink import CommunicationLink
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#SCADA"
 nsPrefix = "cimSCADA"
@@ -40,3 +37,12 @@ class Source(str):
     """Values are: SUBSTITUTED, DEFAULTED, PROCESS
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "RemoteSource",
+    "RemotePoint",
+    "RemoteUnit",
+    "RemoteControl",
+    "CommunicationLink",
+])
@@ -48,6 +48,7 @@ class SvInjection(StateVariable):
     _enums = {}
     _refs = ["TopologicalNode"]
     _many_refs = []
+    _inverses = {"TopologicalNode": "SvInjection"}
 
     def getTopologicalNode(self):
         """The topological node associated with the state injection.
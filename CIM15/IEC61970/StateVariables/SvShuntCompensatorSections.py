@@ -44,6 +44,7 @@ class SvShuntCompensatorSections(StateVariable):
     _enums = {}
     _refs = ["ShuntCompensator"]
     _many_refs = []
+    _inverses = {"ShuntCompensator": "SvShuntCompensatorSections"}
 
     def getShuntCompensator(self):
         """The shunt compensator for which the state applies.
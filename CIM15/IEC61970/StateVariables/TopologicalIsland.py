@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class TopologicalIsland(IdentifiedObject):
     """An electrically connected subset of the network. Topological islands can change as the current network state changes: e.g. due to  - disconnect switches or breakers change state in a SCADA/EMS - manual creation, change or deletion of TopologicalNodes in a planning tool.An electrically connected subset of the network. Topological islands can change as the current network state changes: e.g. due to  - disconnect switches or breakers change state in a SCADA/EMS - manual creation, change or deletion of TopologicalNodes in a planning tool.
@@ -33,8 +34,8 @@ class TopologicalIsland(IdentifiedObject):
         self._AngleRef_TopologicalNode = None
         self.AngleRef_TopologicalNode = AngleRef_TopologicalNode
 
-        self._TopologicalNodes = []
-        self.TopologicalNodes = [] if TopologicalNodes is None else TopologicalNodes
+        if TopologicalNodes is not None:
+            self.TopologicalNodes = TopologicalNodes
 
         super(TopologicalIsland, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class TopologicalIsland(IdentifiedObject):
     _enums = {}
     _refs = ["AngleRef_TopologicalNode", "TopologicalNodes"]
     _many_refs = ["TopologicalNodes"]
+    _inverses = {"AngleRef_TopologicalNode": "AngleRef_TopologicalIsland", "TopologicalNodes": "TopologicalIsland"}
 
     def getAngleRef_TopologicalNode(self):
         """The angle reference for the island.   Normally there is one TopologicalNode that is selected as the angle reference for each island.   Other reference schemes exist, so the association is optional.
@@ -67,7 +69,8 @@ class TopologicalIsland(IdentifiedObject):
         return self._TopologicalNodes
 
     def setTopologicalNodes(self, value):
-        for x in self._TopologicalNodes:
+        value = RefList(value)
+        for x in list(self._TopologicalNodes):
             x.TopologicalIsland = None
         for y in value:
             y._TopologicalIsland = self
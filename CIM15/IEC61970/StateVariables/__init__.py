@@ -21,16 +21,21 @@
 """State variables for analysis solutions such as powerflow.
 """
 
-from CIM15.IEC61970.StateVariables.SvVoltage import SvVoltage
-from CIM15.IEC61970.StateVariables.SvShortCircuit import SvShortCircuit
-from CIM15.IEC61970.StateVariables.SvShuntCompensatorSections import SvShuntCompensatorSections
-from CIM15.IEC61970.StateVariables.StateVariable import StateVariable
-from CIM15.IEC61970.StateVariables.SvTapStep import SvTapStep
-from CIM15.IEC61970.StateVariables.SvStatus import SvStatus
-from CIM15.IEC61970.StateVariables.SvInjection import SvInjection
-from CIM15.IEC61970.StateVariables.SvPowerFlow import SvPowerFlow
-from CIM15.IEC61970.StateVariables.TopologicalIsland import TopologicalIsland
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#StateVariables"
 nsPrefix = "cimStateVariables"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "SvVoltage",
+    "SvShortCircuit",
+    "SvShuntCompensatorSections",
+    "StateVariable",
+    "SvTapStep",
+    "SvStatus",
+    "SvInjection",
+    "SvPowerFlow",
+    "TopologicalIsland",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class BusNameMarker(IdentifiedObject):
     """Used to apply user standard names to topology buses. Typically used for 'bus/branch' case generation. Associated with one or more ConnectivityNodes that are normally a part of the bus name.    The associated ConnectivityNodes are to be connected by non-retained switches. For a ring bus station configuration, all busbar connectivity nodes in the ring are typically associated.   For a breaker and a half scheme, both busbars would be associated.  For a ring bus, all busbars would be associated.  For a 'straight' busbar configuration, only the main connectivity node at the busbar would be associated.Used to apply user standard names to topology buses. Typically used for 'bus/branch' case generation. Associated with one or more ConnectivityNodes that are normally a part of the bus name.    The associated ConnectivityNodes are to be connected by non-retained switches. For a ring bus station configuration, all busbar connectivity nodes in the ring are typically associated.   For a breaker and a half scheme, both busbars would be associated.  For a ring bus, all busbars would be associated.  For a 'straight' busbar configuration, only the main connectivity node at the busbar would be associated.
@@ -30,8 +31,8 @@ class BusNameMarker(IdentifiedObject):
         @param Terminal: A list of Terminals from the set of Terminals which are connected at the same bus (TopologicalNode) in the normal topology. At least one Terminal from the set of normally connected Terminals shall be in the list.
         @param ReportingGroup: The reporting group to which this BusNameMarker belongs.
         """
-        self._Terminal = []
-        self.Terminal = [] if Terminal is None else Terminal
+        if Terminal is not None:
+            self.Terminal = Terminal
 
         self._ReportingGroup = None
         self.ReportingGroup = ReportingGroup
@@ -44,6 +45,7 @@ class BusNameMarker(IdentifiedObject):
     _enums = {}
     _refs = ["Terminal", "ReportingGroup"]
     _many_refs = ["Terminal"]
+    _inverses = {"Terminal": "BusNameMarker", "ReportingGroup": "BusNameMarker"}
 
     def getTerminal(self):
         """A list of Terminals from the set of Terminals which are connected at the same bus (TopologicalNode) in the normal topology. At least one Terminal from the set of normally connected Terminals shall be in the list.
@@ -51,7 +53,8 @@ class BusNameMarker(IdentifiedObject):
         return self._Terminal
 
     def setTerminal(self, value):
-        for x in self._Terminal:
+        value = RefList(value)
+        for x in list(self._Terminal):
             x.BusNameMarker = None
         for y in value:
             y._BusNameMarker = self
@@ -74,13 +77,12 @@ class BusNameMarker(IdentifiedObject):
 
     def setReportingGroup(self, value):
         if self._ReportingGroup is not None:
-            filtered = [x for x in self.ReportingGroup.BusNameMarker if x != self]
-            self._ReportingGroup._BusNameMarker = filtered
+            self._ReportingGroup._BusNameMarker.discard(self)
 
         self._ReportingGroup = value
         if self._ReportingGroup is not None:
             if self not in self._ReportingGroup._BusNameMarker:
-                self._ReportingGroup._BusNameMarker.append(self)
+                self._ReportingGroup._reflist("_BusNameMarker").append(self)
 
     ReportingGroup = property(getReportingGroup, setReportingGroup)
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class TopologicalNode(IdentifiedObject):
     """For a detailed substation model a TopologicalNode is a set of connectivity nodes that, in the current network state, are connected together through any type of closed switches, including  jumpers. Topological nodes changes as the current network state changes (i.e., switches, breakers, etc. change state). For a planning model switch statuses are not used to form TopologicalNodes. Instead they are manually created or deleted in a model builder tool. TopologialNodes maintained this way are also called 'busses'.For a detailed substation model a TopologicalNode is a set of connectivity nodes that, in the current network state, are connected together through any type of closed switches, including  jumpers. Topological nodes changes as the current network state changes (i.e., switches, breakers, etc. change state). For a planning model switch statuses are not used to form TopologicalNodes. Instead they are manually created or deleted in a model builder tool. TopologialNodes maintained this way are also called 'busses'.
@@ -47,8 +48,8 @@ class TopologicalNode(IdentifiedObject):
         self._SvInjection = None
         self.SvInjection = SvInjection
 
-        self._ConnectivityNodes = []
-        self.ConnectivityNodes = [] if ConnectivityNodes is None else ConnectivityNodes
+        if ConnectivityNodes is not None:
+            self.ConnectivityNodes = ConnectivityNodes
 
         self._SvVoltage = None
         self.SvVoltage = SvVoltage
@@ -62,8 +63,8 @@ class TopologicalNode(IdentifiedObject):
         self._ReportingGroup = None
         self.ReportingGroup = ReportingGroup
 
-        self._Terminal = []
-        self.Terminal = [] if Terminal is None else Terminal
+        if Terminal is not None:
+            self.Terminal = Terminal
 
         self._AngleRef_TopologicalIsland = None
         self.AngleRef_TopologicalIsland = AngleRef_TopologicalIsland
@@ -76,6 +77,7 @@ class TopologicalNode(IdentifiedObject):
     _enums = {}
     _refs = ["SvShortCircuit", "ConnectivityNodeContainer", "SvInjection", "ConnectivityNodes", "SvVoltage", "BaseVoltage", "TopologicalIsland", "ReportingGroup", "Terminal", "AngleRef_TopologicalIsland"]
     _many_refs = ["ConnectivityNodes", "Terminal"]
+    _inverses = {"SvShortCircuit": "TopologicalNode", "ConnectivityNodeContainer": "TopologicalNode", "SvInjection": "TopologicalNode", "ConnectivityNodes": "TopologicalNode", "SvVoltage": "TopologicalNode", "BaseVoltage": "TopologicalNode", "TopologicalIsland": "TopologicalNodes", "ReportingGroup": "TopologicalNode", "Terminal": "TopologicalNode", "AngleRef_TopologicalIsland": "AngleRef_TopologicalNode"}
 
     def getSvShortCircuit(self):
         """The short circuit state associated with the topological node.
@@ -100,13 +102,12 @@ class TopologicalNode(IdentifiedObject):
 
     def setConnectivityNodeContainer(self, value):
         if self._ConnectivityNodeContainer is not None:
-            filtered = [x for x in self.ConnectivityNodeContainer.TopologicalNode if x != self]
-            self._ConnectivityNodeContainer._TopologicalNode = filtered
+            self._ConnectivityNodeContainer._TopologicalNode.discard(self)
 
         self._ConnectivityNodeContainer = value
         if self._ConnectivityNodeContainer is not None:
             if self not in self._ConnectivityNodeContainer._TopologicalNode:
-                self._ConnectivityNodeContainer._TopologicalNode.append(self)
+                self._ConnectivityNodeContainer._reflist("_TopologicalNode").append(self)
 
     ConnectivityNodeContainer = property(getConnectivityNodeContainer, setConnectivityNodeContainer)
 
@@ -132,7 +133,8 @@ class TopologicalNode(IdentifiedObject):
         return self._ConnectivityNodes
 
     def setConnectivityNodes(self, value):
-        for x in self._ConnectivityNodes:
+        value = RefList(value)
+        for x in list(self._ConnectivityNodes):
             x.TopologicalNode = None
         for y in value:
             y._TopologicalNode = self
@@ -171,13 +173,12 @@ class TopologicalNode(IdentifiedObject):
 
     def setBaseVoltage(self, value):
         if self._BaseVoltage is not None:
-            filtered = [x for x in self.BaseVoltage.TopologicalNode if x != self]
-            self._BaseVoltage._TopologicalNode = filtered
+            self._BaseVoltage._TopologicalNode.discard(self)
 
         self._BaseVoltage = value
         if self._BaseVoltage is not None:
             if self not in self._BaseVoltage._TopologicalNode:
-                self._BaseVoltage._TopologicalNode.append(self)
+                self._BaseVoltage._reflist("_TopologicalNode").append(self)
 
     BaseVoltage = property(getBaseVoltage, setBaseVoltage)
 
@@ -188,13 +189,12 @@ class TopologicalNode(IdentifiedObject):
 
     def setTopologicalIsland(self, value):
         if self._TopologicalIsland is not None:
-            filtered = [x for x in self.TopologicalIsland.TopologicalNodes if x != self]
-            self._TopologicalIsland._TopologicalNodes = filtered
+            self._TopologicalIsland._TopologicalNodes.discard(self)
 
         self._TopologicalIsland = value
         if self._TopologicalIsland is not None:
             if self not in self._TopologicalIsland._TopologicalNodes:
-                self._TopologicalIsland._TopologicalNodes.append(self)
+                self._TopologicalIsland._reflist("_TopologicalNodes").append(self)
 
     TopologicalIsland = property(getTopologicalIsland, setTopologicalIsland)
 
@@ -205,13 +205,12 @@ class TopologicalNode(IdentifiedObject):
 
     def setReportingGroup(self, value):
         if self._ReportingGroup is not None:
-            filtered = [x for x in self.ReportingGroup.TopologicalNode if x != self]
-            self._ReportingGroup._TopologicalNode = filtered
+            self._ReportingGroup._TopologicalNode.discard(self)
 
         self._ReportingGroup = value
         if self._ReportingGroup is not None:
             if self not in self._ReportingGroup._TopologicalNode:
-                self._ReportingGroup._TopologicalNode.append(self)
+                self._ReportingGroup._reflist("_TopologicalNode").append(self)
 
     ReportingGroup = property(getReportingGroup, setReportingGroup)
 
@@ -221,7 +220,8 @@ class TopologicalNode(IdentifiedObject):
         return self._Terminal
 
     def setTerminal(self, value):
-        for x in self._Terminal:
+        value = RefList(value)
+        for x in list(self._Terminal):
             x.TopologicalNode = None
         for y in value:
             y._TopologicalNode = self
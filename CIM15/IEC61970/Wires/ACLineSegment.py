@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.Conductor import Conductor
+from CIM15.Element import RefList
 
 class ACLineSegment(Conductor):
     """A wire or combination of wires, with consistent electrical characteristics, building a single electrical system, used to carry alternating current between points in the power system. For symmetrical, transposed 3ph lines, it is sufficient to use ACLineSegment attributes, which describe sequence impedances and admittances for the entire length of the segment. If per lenght impedance data is available from a library of standard types, impedances and admittances can be calculated in one of the following ways: - calculate electrical parameters from asset data, using associated ConductorInfo, with values then multiplied by Conductor.length to produce a matrix model. - calculate unbalanced electrical parameters from associated PerLengthPhaseImpedance, then multiplied by Conductor.length to produce a matrix model. - calculate transposed electrical parameters from associated PerLengthSequenceImpedance, then multiplied by Conductor.length to produce a sequence model.A wire or combination of wires, with consistent electrical characteristics, building a single electrical system, used to carry alternating current between points in the power system. For symmetrical, transposed 3ph lines, it is sufficient to use ACLineSegment attributes, which describe sequence impedances and admittances for the entire length of the segment. If per lenght impedance data is available from a library of standard types, impedances and admittances can be calculated in one of the following ways: - calculate electrical parameters from asset data, using associated ConductorInfo, with values then multiplied by Conductor.length to produce a matrix model. - calculate unbalanced electrical parameters from associated PerLengthPhaseImpedance, then multiplied by Conductor.length to produce a matrix model. - calculate transposed electrical parameters from associated PerLengthSequenceImpedance, then multiplied by Conductor.length to produce a sequence model.
@@ -69,20 +70,20 @@ class ACLineSegment(Conductor):
         self._SequenceImpedance = None
         self.SequenceImpedance = SequenceImpedance
 
-        self._ConductorAssets = []
-        self.ConductorAssets = [] if ConductorAssets is None else ConductorAssets
+        if ConductorAssets is not None:
+            self.ConductorAssets = ConductorAssets
 
         self._ConductorInfo = None
         self.ConductorInfo = ConductorInfo
 
-        self._Cut = []
-        self.Cut = [] if Cut is None else Cut
+        if Cut is not None:
+            self.Cut = Cut
 
         self._PhaseImpedance = None
         self.PhaseImpedance = PhaseImpedance
 
-        self._Clamp = []
-        self.Clamp = [] if Clamp is None else Clamp
+        if Clamp is not None:
+            self.Clamp = Clamp
 
         super(ACLineSegment, self).__init__(*args, **kw_args)
 
@@ -92,6 +93,7 @@ class ACLineSegment(Conductor):
     _enums = {}
     _refs = ["SequenceImpedance", "ConductorAssets", "ConductorInfo", "Cut", "PhaseImpedance", "Clamp"]
     _many_refs = ["ConductorAssets", "Cut", "Clamp"]
+    _inverses = {"SequenceImpedance": "LineSegments", "ConductorAssets": "ConductorSegment", "ConductorInfo": "LineSegments", "Cut": "ACLineSegment", "PhaseImpedance": "LineSegments", "Clamp": "ACLineSegment"}
 
     def getSequenceImpedance(self):
         """Sequence impedance of this line segment; used for balanced model.
@@ -100,13 +102,12 @@ class ACLineSegment(Conductor):
 
     def setSequenceImpedance(self, value):
         if self._SequenceImpedance is not None:
-            filtered = [x for x in self.SequenceImpedance.LineSegments if x != self]
-            self._SequenceImpedance._LineSegments = filtered
+            self._SequenceImpedance._LineSegments.discard(self)
 
         self._SequenceImpedance = value
         if self._SequenceImpedance is not None:
             if self not in self._SequenceImpedance._LineSegments:
-                self._SequenceImpedance._LineSegments.append(self)
+                self._SequenceImpedance._reflist("_LineSegments").append(self)
 
     SequenceImpedance = property(getSequenceImpedance, setSequenceImpedance)
 
@@ -115,7 +116,8 @@ class ACLineSegment(Conductor):
         return self._ConductorAssets
 
     def setConductorAssets(self, value):
-        for x in self._ConductorAssets:
+        value = RefList(value)
+        for x in list(self._ConductorAssets):
             x.ConductorSegment = None
         for y in value:
             y._ConductorSegment = self
@@ -138,13 +140,12 @@ class ACLineSegment(Conductor):
 
     def setConductorInfo(self, value):
         if self._ConductorInfo is not None:
-            filtered = [x for x in self.ConductorInfo.LineSegments if x != self]
-            self._ConductorInfo._LineSegments = filtered
+            self._ConductorInfo._LineSegments.discard(self)
 
         self._ConductorInfo = value
         if self._ConductorInfo is not None:
             if self not in self._ConductorInfo._LineSegments:
-                self._ConductorInfo._LineSegments.append(self)
+                self._ConductorInfo._reflist("_LineSegments").append(self)
 
     ConductorInfo = property(getConductorInfo, setConductorInfo)
 
@@ -153,7 +154,8 @@ class ACLineSegment(Conductor):
         return self._Cut
 
     def setCut(self, value):
-        for x in self._Cut:
+        value = RefList(value)
+        for x in list(self._Cut):
             x.ACLineSegment = None
         for y in value:
             y._ACLineSegment = self
@@ -176,13 +178,12 @@ class ACLineSegment(Conductor):
 
     def setPhaseImpedance(self, value):
         if self._PhaseImpedance is not None:
-            filtered = [x for x in self.PhaseImpedance.LineSegments if x != self]
-            self._PhaseImpedance._LineSegments = filtered
+            self._PhaseImpedance._LineSegments.discard(self)
 
         self._PhaseImpedance = value
         if self._PhaseImpedance is not None:
             if self not in self._PhaseImpedance._LineSegments:
-                self._PhaseImpedance._LineSegments.append(self)
+                self._PhaseImpedance._reflist("_LineSegments").append(self)
 
     PhaseImpedance = property(getPhaseImpedance, setPhaseImpedance)
 
@@ -191,7 +192,8 @@ class ACLineSegment(Conductor):
         return self._Clamp
 
     def setClamp(self, value):
-        for x in self._Clamp:
+        value = RefList(value)
+        for x in list(self._Clamp):
             x.ACLineSegment = None
         for y in value:
             y._ACLineSegment = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM15.Element import RefList
 
 class EnergyConsumer(ConductingEquipment):
     """Generic user of energy - a  point of consumption on the power system modelGeneric user of energy - a  point of consumption on the power system model
@@ -52,8 +53,8 @@ class EnergyConsumer(ConductingEquipment):
         #: Reactive power of the load that is a fixed quantity. Load sign convention is used, i.e. positive sign means flow out from a node.
         self.qfixed = qfixed
 
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
         self._LoadResponse = None
         self.LoadResponse = LoadResponse
@@ -61,8 +62,8 @@ class EnergyConsumer(ConductingEquipment):
         self._PowerCutZone = None
         self.PowerCutZone = PowerCutZone
 
-        self._EnergyConsumerPhases = []
-        self.EnergyConsumerPhases = [] if EnergyConsumerPhases is None else EnergyConsumerPhases
+        if EnergyConsumerPhases is not None:
+            self.EnergyConsumerPhases = EnergyConsumerPhases
 
         super(EnergyConsumer, self).__init__(*args, **kw_args)
 
@@ -72,13 +73,15 @@ class EnergyConsumer(ConductingEquipment):
     _enums = {}
     _refs = ["ServiceDeliveryPoints", "LoadResponse", "PowerCutZone", "EnergyConsumerPhases"]
     _many_refs = ["ServiceDeliveryPoints", "EnergyConsumerPhases"]
+    _inverses = {"ServiceDeliveryPoints": "EnergyConsumer", "LoadResponse": "EnergyConsumer", "PowerCutZone": "EnergyConsumers", "EnergyConsumerPhases": "EnergyConsumer"}
 
     def getServiceDeliveryPoints(self):
         
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
-        for x in self._ServiceDeliveryPoints:
+        value = RefList(value)
+        for x in list(self._ServiceDeliveryPoints):
             x.EnergyConsumer = None
         for y in value:
             y._EnergyConsumer = self
@@ -101,13 +104,12 @@ class EnergyConsumer(ConductingEquipment):
 
     def setLoadResponse(self, value):
         if self._LoadResponse is not None:
-            filtered = [x for x in self.LoadResponse.EnergyConsumer if x != self]
-            self._LoadResponse._EnergyConsumer = filtered
+            self._LoadResponse._EnergyConsumer.discard(self)
 
         self._LoadResponse = value
         if self._LoadResponse is not None:
             if self not in self._LoadResponse._EnergyConsumer:
-                self._LoadResponse._EnergyConsumer.append(self)
+                self._LoadResponse._reflist("_EnergyConsumer").append(self)
 
     LoadResponse = property(getLoadResponse, setLoadResponse)
 
@@ -118,13 +120,12 @@ class EnergyConsumer(ConductingEquipment):
 
     def setPowerCutZone(self, value):
         if self._PowerCutZone is not None:
-            filtered = [x for x in self.PowerCutZone.EnergyConsumers if x != self]
-            self._PowerCutZone._EnergyConsumers = filtered
+            self._PowerCutZone._EnergyConsumers.discard(self)
 
         self._PowerCutZone = value
         if self._PowerCutZone is not None:
             if self not in self._PowerCutZone._EnergyConsumers:
-                self._PowerCutZone._EnergyConsumers.append(self)
+                self._PowerCutZone._reflist("_EnergyConsumers").append(self)
 
     PowerCutZone = property(getPowerCutZone, setPowerCutZone)
 
@@ -133,7 +134,8 @@ class EnergyConsumer(ConductingEquipment):
         return self._EnergyConsumerPhases
 
     def setEnergyConsumerPhases(self, value):
-        for x in self._EnergyConsumerPhases:
+        value = RefList(value)
+        for x in list(self._EnergyConsumerPhases):
             x.EnergyConsumer = None
         for y in value:
             y._EnergyConsumer = self
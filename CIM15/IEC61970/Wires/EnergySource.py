@@ -76,4 +76,5 @@ class EnergySource(ConductingEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
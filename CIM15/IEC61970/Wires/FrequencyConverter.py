@@ -60,4 +60,5 @@ class FrequencyConverter(RegulatingCondEq):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class Fuse(Switch):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM15.Element import RefList
 
 class Ground(ConductingEquipment):
     """A common point for connecting grounded conducting equipment such as shunt capacitors. The power system model can have more than one ground.A common point for connecting grounded conducting equipment such as shunt capacitors. The power system model can have more than one ground.
@@ -29,8 +30,8 @@ class Ground(ConductingEquipment):
 
         @param WindingInsulations:
         """
-        self._WindingInsulations = []
-        self.WindingInsulations = [] if WindingInsulations is None else WindingInsulations
+        if WindingInsulations is not None:
+            self.WindingInsulations = WindingInsulations
 
         super(Ground, self).__init__(*args, **kw_args)
 
@@ -40,13 +41,15 @@ class Ground(ConductingEquipment):
     _enums = {}
     _refs = ["WindingInsulations"]
     _many_refs = ["WindingInsulations"]
+    _inverses = {"WindingInsulations": "Ground"}
 
     def getWindingInsulations(self):
         
         return self._WindingInsulations
 
     def setWindingInsulations(self, value):
-        for x in self._WindingInsulations:
+        value = RefList(value)
+        for x in list(self._WindingInsulations):
             x.Ground = None
         for y in value:
             y._Ground = self
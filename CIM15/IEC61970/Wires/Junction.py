@@ -36,4 +36,5 @@ class Junction(Connector):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -36,4 +36,5 @@ class LoadBreakSwitch(ProtectedSwitch):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -76,6 +76,7 @@ class MutualCoupling(IdentifiedObject):
     _enums = {}
     _refs = ["First_Terminal", "Second_Terminal"]
     _many_refs = []
+    _inverses = {"First_Terminal": "HasFirst_MutualCoupling", "Second_Terminal": "HasSecond_MutualCoupling"}
 
     def getFirst_Terminal(self):
         """The starting terminal for the calculation of distances along the first branch of the mutual coupling.  Normally MutualCoupling would only be used for terminals of AC line segments.  The first and second terminals of a mutual coupling should point to different AC line segments.
@@ -84,13 +85,12 @@ class MutualCoupling(IdentifiedObject):
 
     def setFirst_Terminal(self, value):
         if self._First_Terminal is not None:
-            filtered = [x for x in self.First_Terminal.HasFirst_MutualCoupling if x != self]
-            self._First_Terminal._HasFirst_MutualCoupling = filtered
+            self._First_Terminal._HasFirst_MutualCoupling.discard(self)
 
         self._First_Terminal = value
         if self._First_Terminal is not None:
             if self not in self._First_Terminal._HasFirst_MutualCoupling:
-                self._First_Terminal._HasFirst_MutualCoupling.append(self)
+                self._First_Terminal._reflist("_HasFirst_MutualCoupling").append(self)
 
     First_Terminal = property(getFirst_Terminal, setFirst_Terminal)
 
@@ -101,13 +101,12 @@ class MutualCoupling(IdentifiedObject):
 
     def setSecond_Terminal(self, value):
         if self._Second_Terminal is not None:
-            filtered = [x for x in self.Second_Terminal.HasSecond_MutualCoupling if x != self]
-            self._Second_Terminal._HasSecond_MutualCoupling = filtered
+            self._Second_Terminal._HasSecond_MutualCoupling.discard(self)
 
         self._Second_Terminal = value
         if self._Second_Terminal is not None:
             if self not in self._Second_Terminal._HasSecond_MutualCoupling:
-                self._Second_Terminal._HasSecond_MutualCoupling.append(self)
+                self._Second_Terminal._reflist("_HasSecond_MutualCoupling").append(self)
 
     Second_Terminal = property(getSecond_Terminal, setSecond_Terminal)
 
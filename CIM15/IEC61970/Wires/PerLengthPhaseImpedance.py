@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class PerLengthPhaseImpedance(IdentifiedObject):
     """Impedance and admittance parameters per unit length for n-wire unbalanced lines, in matrix form.Impedance and admittance parameters per unit length for n-wire unbalanced lines, in matrix form.
@@ -34,11 +35,11 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         #: Number of phase, neutral, and other wires retained. Constrains the number of matrix elements and the phase codes that can be used with this matrix.
         self.conductorCount = conductorCount
 
-        self._LineSegments = []
-        self.LineSegments = [] if LineSegments is None else LineSegments
+        if LineSegments is not None:
+            self.LineSegments = LineSegments
 
-        self._PhaseImpedanceData = []
-        self.PhaseImpedanceData = [] if PhaseImpedanceData is None else PhaseImpedanceData
+        if PhaseImpedanceData is not None:
+            self.PhaseImpedanceData = PhaseImpedanceData
 
         super(PerLengthPhaseImpedance, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class PerLengthPhaseImpedance(IdentifiedObject):
     _enums = {}
     _refs = ["LineSegments", "PhaseImpedanceData"]
     _many_refs = ["LineSegments", "PhaseImpedanceData"]
+    _inverses = {"LineSegments": "PhaseImpedance", "PhaseImpedanceData": "PhaseImpedance"}
 
     def getLineSegments(self):
         """All line segments described by this phase impedance.
@@ -55,7 +57,8 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         return self._LineSegments
 
     def setLineSegments(self, value):
-        for x in self._LineSegments:
+        value = RefList(value)
+        for x in list(self._LineSegments):
             x.PhaseImpedance = None
         for y in value:
             y._PhaseImpedance = self
@@ -77,7 +80,8 @@ class PerLengthPhaseImpedance(IdentifiedObject):
         return self._PhaseImpedanceData
 
     def setPhaseImpedanceData(self, value):
-        for x in self._PhaseImpedanceData:
+        value = RefList(value)
+        for x in list(self._PhaseImpedanceData):
             x.PhaseImpedance = None
         for y in value:
             y._PhaseImpedance = self
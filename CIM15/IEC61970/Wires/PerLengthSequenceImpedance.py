@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class PerLengthSequenceImpedance(IdentifiedObject):
     """Sequence impedance and admittance parameters per unit length, for transposed lines of 1, 2, or 3 phases. For 1-phase lines, define x=x0=xself. For 2-phase lines, define x=xs-xm and x0=xs+xm.Sequence impedance and admittance parameters per unit length, for transposed lines of 1, 2, or 3 phases. For 1-phase lines, define x=x0=xself. For 2-phase lines, define x=xs-xm and x0=xs+xm.
@@ -61,8 +62,8 @@ class PerLengthSequenceImpedance(IdentifiedObject):
         #: Zero sequence series reactance, per unit of length.
         self.x0 = x0
 
-        self._LineSegments = []
-        self.LineSegments = [] if LineSegments is None else LineSegments
+        if LineSegments is not None:
+            self.LineSegments = LineSegments
 
         super(PerLengthSequenceImpedance, self).__init__(*args, **kw_args)
 
@@ -72,6 +73,7 @@ class PerLengthSequenceImpedance(IdentifiedObject):
     _enums = {}
     _refs = ["LineSegments"]
     _many_refs = ["LineSegments"]
+    _inverses = {"LineSegments": "SequenceImpedance"}
 
     def getLineSegments(self):
         """All line segments described by this sequence impedance.
@@ -79,7 +81,8 @@ class PerLengthSequenceImpedance(IdentifiedObject):
         return self._LineSegments
 
     def setLineSegments(self, value):
-        for x in self._LineSegments:
+        value = RefList(value)
+        for x in list(self._LineSegments):
             x.SequenceImpedance = None
         for y in value:
             y._SequenceImpedance = self
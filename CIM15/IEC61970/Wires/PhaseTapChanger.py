@@ -44,6 +44,7 @@ class PhaseTapChanger(TapChanger):
     _enums = {}
     _refs = ["PhaseTapChangerTabular", "TransformerEnd"]
     _many_refs = []
+    _inverses = {"PhaseTapChangerTabular": "PhaseTapChanger", "TransformerEnd": "PhaseTapChanger"}
 
     def getPhaseTapChangerTabular(self):
         
@@ -51,13 +52,12 @@ class PhaseTapChanger(TapChanger):
 
     def setPhaseTapChangerTabular(self, value):
         if self._PhaseTapChangerTabular is not None:
-            filtered = [x for x in self.PhaseTapChangerTabular.PhaseTapChanger if x != self]
-            self._PhaseTapChangerTabular._PhaseTapChanger = filtered
+            self._PhaseTapChangerTabular._PhaseTapChanger.discard(self)
 
         self._PhaseTapChangerTabular = value
         if self._PhaseTapChangerTabular is not None:
             if self not in self._PhaseTapChangerTabular._PhaseTapChanger:
-                self._PhaseTapChangerTabular._PhaseTapChanger.append(self)
+                self._PhaseTapChangerTabular._reflist("_PhaseTapChanger").append(self)
 
     PhaseTapChangerTabular = property(getPhaseTapChangerTabular, setPhaseTapChangerTabular)
 
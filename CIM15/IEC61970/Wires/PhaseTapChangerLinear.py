@@ -40,4 +40,5 @@ class PhaseTapChangerLinear(PhaseTapChanger):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
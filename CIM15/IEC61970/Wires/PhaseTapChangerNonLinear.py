@@ -48,4 +48,5 @@ class PhaseTapChangerNonLinear(PhaseTapChanger):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, RefList
 
 class PhaseTapChangerTabular(Element):
     """With PhaseTapChangerTabular it is possible to describe curve how the the phase angle difference and reactance varies with the tap step.With PhaseTapChangerTabular it is possible to describe curve how the the phase angle difference and reactance varies with the tap step.
@@ -30,11 +30,11 @@ class PhaseTapChangerTabular(Element):
         @param PhaseTapChangerTabularPoint:
         @param PhaseTapChanger:
         """
-        self._PhaseTapChangerTabularPoint = []
-        self.PhaseTapChangerTabularPoint = [] if PhaseTapChangerTabularPoint is None else PhaseTapChangerTabularPoint
+        if PhaseTapChangerTabularPoint is not None:
+            self.PhaseTapChangerTabularPoint = PhaseTapChangerTabularPoint
 
-        self._PhaseTapChanger = []
-        self.PhaseTapChanger = [] if PhaseTapChanger is None else PhaseTapChanger
+        if PhaseTapChanger is not None:
+            self.PhaseTapChanger = PhaseTapChanger
 
         super(PhaseTapChangerTabular, self).__init__(*args, **kw_args)
 
@@ -44,13 +44,15 @@ class PhaseTapChangerTabular(Element):
     _enums = {}
     _refs = ["PhaseTapChangerTabularPoint", "PhaseTapChanger"]
     _many_refs = ["PhaseTapChangerTabularPoint", "PhaseTapChanger"]
+    _inverses = {"PhaseTapChangerTabularPoint": "PhaseTapChangerTabular", "PhaseTapChanger": "PhaseTapChangerTabular"}
 
     def getPhaseTapChangerTabularPoint(self):
         
         return self._PhaseTapChangerTabularPoint
 
     def setPhaseTapChangerTabularPoint(self, value):
-        for x in self._PhaseTapChangerTabularPoint:
+        value = RefList(value)
+        for x in list(self._PhaseTapChangerTabularPoint):
             x.PhaseTapChangerTabular = None
         for y in value:
             y._PhaseTapChangerTabular = self
@@ -71,7 +73,8 @@ class PhaseTapChangerTabular(Element):
         return self._PhaseTapChanger
 
     def setPhaseTapChanger(self, value):
-        for x in self._PhaseTapChanger:
+        value = RefList(value)
+        for x in list(self._PhaseTapChanger):
             x.PhaseTapChangerTabular = None
         for y in value:
             y._PhaseTapChangerTabular = self
@@ -52,6 +52,7 @@ class PhaseTapChangerTabularPoint(Element):
     _enums = {}
     _refs = ["PhaseTapChangerTabular"]
     _many_refs = []
+    _inverses = {"PhaseTapChangerTabular": "PhaseTapChangerTabularPoint"}
 
     def getPhaseTapChangerTabular(self):
         
@@ -59,13 +60,12 @@ class PhaseTapChangerTabularPoint(Element):
 
     def setPhaseTapChangerTabular(self, value):
         if self._PhaseTapChangerTabular is not None:
-            filtered = [x for x in self.PhaseTapChangerTabular.PhaseTapChangerTabularPoint if x != self]
-            self._PhaseTapChangerTabular._PhaseTapChangerTabularPoint = filtered
+            self._PhaseTapChangerTabular._PhaseTapChangerTabularPoint.discard(self)
 
         self._PhaseTapChangerTabular = value
         if self._PhaseTapChangerTabular is not None:
             if self not in self._PhaseTapChangerTabular._PhaseTapChangerTabularPoint:
-                self._PhaseTapChangerTabular._PhaseTapChangerTabularPoint.append(self)
+                self._PhaseTapChangerTabular._reflist("_PhaseTapChangerTabularPoint").append(self)
 
     PhaseTapChangerTabular = property(getPhaseTapChangerTabular, setPhaseTapChangerTabular)
 
@@ -36,4 +36,5 @@ class Plant(EquipmentContainer):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.Switch import Switch
+from CIM15.Element import RefList
 
 class ProtectedSwitch(Switch):
     """A ProtectedSwitch is a switching device that can be operated by ProtectionEquipment.A ProtectedSwitch is a switching device that can be operated by ProtectionEquipment.
@@ -34,11 +35,11 @@ class ProtectedSwitch(Switch):
         #: The maximum fault current a breaking device can break safely under prescribed conditions of use.
         self.breakingCapacity = breakingCapacity
 
-        self._ProtectionEquipments = []
-        self.ProtectionEquipments = [] if ProtectionEquipments is None else ProtectionEquipments
+        if ProtectionEquipments is not None:
+            self.ProtectionEquipments = ProtectionEquipments
 
-        self._RecloseSequences = []
-        self.RecloseSequences = [] if RecloseSequences is None else RecloseSequences
+        if RecloseSequences is not None:
+            self.RecloseSequences = RecloseSequences
 
         super(ProtectedSwitch, self).__init__(*args, **kw_args)
 
@@ -48,6 +49,7 @@ class ProtectedSwitch(Switch):
     _enums = {}
     _refs = ["ProtectionEquipments", "RecloseSequences"]
     _many_refs = ["ProtectionEquipments", "RecloseSequences"]
+    _inverses = {"ProtectionEquipments": "ProtectedSwitches", "RecloseSequences": "ProtectedSwitch"}
 
     def getProtectionEquipments(self):
         """Protection equipments that operate this ProtectedSwitch.
@@ -56,20 +58,19 @@ class ProtectedSwitch(Switch):
 
     def setProtectionEquipments(self, value):
         for p in self._ProtectionEquipments:
-            filtered = [q for q in p.ProtectedSwitches if q != self]
-            self._ProtectionEquipments._ProtectedSwitches = filtered
+            p._ProtectedSwitches.discard(self)
         for r in value:
             if self not in r._ProtectedSwitches:
-                r._ProtectedSwitches.append(self)
-        self._ProtectionEquipments = value
+                r._reflist("_ProtectedSwitches").append(self)
+        self._ProtectionEquipments = RefList(value)
 
     ProtectionEquipments = property(getProtectionEquipments, setProtectionEquipments)
 
     def addProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
             if self not in obj._ProtectedSwitches:
-                obj._ProtectedSwitches.append(self)
-            self._ProtectionEquipments.append(obj)
+                obj._reflist("_ProtectedSwitches").append(self)
+            self._reflist("_ProtectionEquipments").append(obj)
 
     def removeProtectionEquipments(self, *ProtectionEquipments):
         for obj in ProtectionEquipments:
@@ -83,7 +84,8 @@ class ProtectedSwitch(Switch):
         return self._RecloseSequences
 
     def setRecloseSequences(self, value):
-        for x in self._RecloseSequences:
+        value = RefList(value)
+        for x in list(self._RecloseSequences):
             x.ProtectedSwitch = None
         for y in value:
             y._ProtectedSwitch = self
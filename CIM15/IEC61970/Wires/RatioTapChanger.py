@@ -52,6 +52,7 @@ class RatioTapChanger(TapChanger):
     _enums = {"tculControlMode": "TransformerControlMode"}
     _refs = ["RatioTapChangerTabular", "TransformerEnd"]
     _many_refs = []
+    _inverses = {"RatioTapChangerTabular": "RatioTapChanger", "TransformerEnd": "RatioTapChanger"}
 
     def getRatioTapChangerTabular(self):
         
@@ -59,13 +60,12 @@ class RatioTapChanger(TapChanger):
 
     def setRatioTapChangerTabular(self, value):
         if self._RatioTapChangerTabular is not None:
-            filtered = [x for x in self.RatioTapChangerTabular.RatioTapChanger if x != self]
-            self._RatioTapChangerTabular._RatioTapChanger = filtered
+            self._RatioTapChangerTabular._RatioTapChanger.discard(self)
 
         self._RatioTapChangerTabular = value
         if self._RatioTapChangerTabular is not None:
             if self not in self._RatioTapChangerTabular._RatioTapChanger:
-                self._RatioTapChangerTabular._RatioTapChanger.append(self)
+                self._RatioTapChangerTabular._reflist("_RatioTapChanger").append(self)
 
     RatioTapChangerTabular = property(getRatioTapChangerTabular, setRatioTapChangerTabular)
 
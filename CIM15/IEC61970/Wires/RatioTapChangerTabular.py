@@ -18,7 +18,7 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from CIM15.Element import Element
+from CIM15.Element import Element, RefList
 
 class RatioTapChangerTabular(Element):
     """With RatioTapChangerTabular it is possible to describe curve how the voltage magnitude and reactance varies with the tap step.With RatioTapChangerTabular it is possible to describe curve how the voltage magnitude and reactance varies with the tap step.
@@ -30,11 +30,11 @@ class RatioTapChangerTabular(Element):
         @param RatioTapChangerTabularPoint:
         @param RatioTapChanger:
         """
-        self._RatioTapChangerTabularPoint = []
-        self.RatioTapChangerTabularPoint = [] if RatioTapChangerTabularPoint is None else RatioTapChangerTabularPoint
+        if RatioTapChangerTabularPoint is not None:
+            self.RatioTapChangerTabularPoint = RatioTapChangerTabularPoint
 
-        self._RatioTapChanger = []
-        self.RatioTapChanger = [] if RatioTapChanger is None else RatioTapChanger
+        if RatioTapChanger is not None:
+            self.RatioTapChanger = RatioTapChanger
 
         super(RatioTapChangerTabular, self).__init__(*args, **kw_args)
 
@@ -44,13 +44,15 @@ class RatioTapChangerTabular(Element):
     _enums = {}
     _refs = ["RatioTapChangerTabularPoint", "RatioTapChanger"]
     _many_refs = ["RatioTapChangerTabularPoint", "RatioTapChanger"]
+    _inverses = {"RatioTapChangerTabularPoint": "RatioTapChangerTabular", "RatioTapChanger": "RatioTapChangerTabular"}
 
     def getRatioTapChangerTabularPoint(self):
         
         return self._RatioTapChangerTabularPoint
 
     def setRatioTapChangerTabularPoint(self, value):
-        for x in self._RatioTapChangerTabularPoint:
+        value = RefList(value)
+        for x in list(self._RatioTapChangerTabularPoint):
             x.RatioTapChangerTabular = None
         for y in value:
             y._RatioTapChangerTabular = self
@@ -71,7 +73,8 @@ class RatioTapChangerTabular(Element):
         return self._RatioTapChanger
 
     def setRatioTapChanger(self, value):
-        for x in self._RatioTapChanger:
+        value = RefList(value)
+        for x in list(self._RatioTapChanger):
             x.RatioTapChangerTabular = None
         for y in value:
             y._RatioTapChangerTabular = self
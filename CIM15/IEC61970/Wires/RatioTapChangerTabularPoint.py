@@ -52,6 +52,7 @@ class RatioTapChangerTabularPoint(Element):
     _enums = {}
     _refs = ["RatioTapChangerTabular"]
     _many_refs = []
+    _inverses = {"RatioTapChangerTabular": "RatioTapChangerTabularPoint"}
 
     def getRatioTapChangerTabular(self):
         
@@ -59,13 +60,12 @@ class RatioTapChangerTabularPoint(Element):
 
     def setRatioTapChangerTabular(self, value):
         if self._RatioTapChangerTabular is not None:
-            filtered = [x for x in self.RatioTapChangerTabular.RatioTapChangerTabularPoint if x != self]
-            self._RatioTapChangerTabular._RatioTapChangerTabularPoint = filtered
+            self._RatioTapChangerTabular._RatioTapChangerTabularPoint.discard(self)
 
         self._RatioTapChangerTabular = value
         if self._RatioTapChangerTabular is not None:
             if self not in self._RatioTapChangerTabular._RatioTapChangerTabularPoint:
-                self._RatioTapChangerTabular._RatioTapChangerTabularPoint.append(self)
+                self._RatioTapChangerTabular._reflist("_RatioTapChangerTabularPoint").append(self)
 
     RatioTapChangerTabular = property(getRatioTapChangerTabular, setRatioTapChangerTabular)
 
@@ -36,4 +36,5 @@ class Recloser(ProtectedSwitch):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
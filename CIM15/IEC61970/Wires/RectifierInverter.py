@@ -84,4 +84,5 @@ class RectifierInverter(ConductingEquipment):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import RefList
 
 class RegulatingControl(PowerSystemResource):
     """Specifies a set of equipment that works together to control a power system quantity such as voltage or flow.Specifies a set of equipment that works together to control a power system quantity such as voltage or flow.
@@ -51,14 +52,14 @@ class RegulatingControl(PowerSystemResource):
         #: Phase voltage controlling this regulator, measured at regulator location. Values are: "s12N", "BN", "BC", "ABN", "s2N", "N", "ACN", "BCN", "ABCN", "AC", "s1N", "AN", "B", "AB", "C", "A", "CN", "ABC"
         self.monitoredPhase = monitoredPhase
 
-        self._RegulatingCondEq = []
-        self.RegulatingCondEq = [] if RegulatingCondEq is None else RegulatingCondEq
+        if RegulatingCondEq is not None:
+            self.RegulatingCondEq = RegulatingCondEq
 
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._RegulationSchedule = []
-        self.RegulationSchedule = [] if RegulationSchedule is None else RegulationSchedule
+        if RegulationSchedule is not None:
+            self.RegulationSchedule = RegulationSchedule
 
         super(RegulatingControl, self).__init__(*args, **kw_args)
 
@@ -68,6 +69,7 @@ class RegulatingControl(PowerSystemResource):
     _enums = {"mode": "RegulatingControlModeKind", "monitoredPhase": "PhaseCode"}
     _refs = ["RegulatingCondEq", "Terminal", "RegulationSchedule"]
     _many_refs = ["RegulatingCondEq", "RegulationSchedule"]
+    _inverses = {"RegulatingCondEq": "RegulatingControl", "Terminal": "RegulatingControl", "RegulationSchedule": "RegulatingControl"}
 
     def getRegulatingCondEq(self):
         """The equipment that participates in this regulating control scheme.
@@ -75,7 +77,8 @@ class RegulatingControl(PowerSystemResource):
         return self._RegulatingCondEq
 
     def setRegulatingCondEq(self, value):
-        for x in self._RegulatingCondEq:
+        value = RefList(value)
+        for x in list(self._RegulatingCondEq):
             x.RegulatingControl = None
         for y in value:
             y._RegulatingControl = self
@@ -98,13 +101,12 @@ class RegulatingControl(PowerSystemResource):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.RegulatingControl if x != self]
-            self._Terminal._RegulatingControl = filtered
+            self._Terminal._RegulatingControl.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._RegulatingControl:
-                self._Terminal._RegulatingControl.append(self)
+                self._Terminal._reflist("_RegulatingControl").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -114,7 +116,8 @@ class RegulatingControl(PowerSystemResource):
         return self._RegulationSchedule
 
     def setRegulationSchedule(self, value):
-        for x in self._RegulationSchedule:
+        value = RefList(value)
+        for x in list(self._RegulationSchedule):
             x.RegulatingControl = None
         for y in value:
             y._RegulatingControl = self
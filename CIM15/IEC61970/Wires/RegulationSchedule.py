@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.LoadModel.SeasonDayTypeSchedule import SeasonDayTypeSchedule
+from CIM15.Element import RefList
 
 class RegulationSchedule(SeasonDayTypeSchedule):
     """A pre-established pattern over time for a controlled variable, e.g., busbar voltage.A pre-established pattern over time for a controlled variable, e.g., busbar voltage.
@@ -33,8 +34,8 @@ class RegulationSchedule(SeasonDayTypeSchedule):
         self._RegulatingControl = None
         self.RegulatingControl = RegulatingControl
 
-        self._VoltageControlZones = []
-        self.VoltageControlZones = [] if VoltageControlZones is None else VoltageControlZones
+        if VoltageControlZones is not None:
+            self.VoltageControlZones = VoltageControlZones
 
         super(RegulationSchedule, self).__init__(*args, **kw_args)
 
@@ -44,6 +45,7 @@ class RegulationSchedule(SeasonDayTypeSchedule):
     _enums = {}
     _refs = ["RegulatingControl", "VoltageControlZones"]
     _many_refs = ["VoltageControlZones"]
+    _inverses = {"RegulatingControl": "RegulationSchedule", "VoltageControlZones": "RegulationSchedule"}
 
     def getRegulatingControl(self):
         """Regulating controls that have this Schedule.
@@ -52,13 +54,12 @@ class RegulationSchedule(SeasonDayTypeSchedule):
 
     def setRegulatingControl(self, value):
         if self._RegulatingControl is not None:
-            filtered = [x for x in self.RegulatingControl.RegulationSchedule if x != self]
-            self._RegulatingControl._RegulationSchedule = filtered
+            self._RegulatingControl._RegulationSchedule.discard(self)
 
         self._RegulatingControl = value
         if self._RegulatingControl is not None:
             if self not in self._RegulatingControl._RegulationSchedule:
-                self._RegulatingControl._RegulationSchedule.append(self)
+                self._RegulatingControl._reflist("_RegulationSchedule").append(self)
 
     RegulatingControl = property(getRegulatingControl, setRegulatingControl)
 
@@ -68,7 +69,8 @@ class RegulationSchedule(SeasonDayTypeSchedule):
         return self._VoltageControlZones
 
     def setVoltageControlZones(self, value):
-        for x in self._VoltageControlZones:
+        value = RefList(value)
+        for x in list(self._VoltageControlZones):
             x.RegulationSchedule = None
         for y in value:
             y._RegulationSchedule = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
+from CIM15.Element import RefList
 
 class ShuntCompensator(RegulatingCondEq):
     """A shunt capacitor or reactor or switchable bank of shunt capacitors or reactors. A section of a shunt compensator is an individual capacitor or reactor.  A negative value for reactivePerSection indicates that the compensator is a reactor. ShuntCompensator is a single terminal device.  Ground is implied.A shunt capacitor or reactor or switchable bank of shunt capacitors or reactors. A section of a shunt compensator is an individual capacitor or reactor.  A negative value for reactivePerSection indicates that the compensator is a reactor. ShuntCompensator is a single terminal device.  Ground is implied.
@@ -93,8 +94,8 @@ class ShuntCompensator(RegulatingCondEq):
         self._SvShuntCompensatorSections = None
         self.SvShuntCompensatorSections = SvShuntCompensatorSections
 
-        self._ShuntCompensatorPhases = []
-        self.ShuntCompensatorPhases = [] if ShuntCompensatorPhases is None else ShuntCompensatorPhases
+        if ShuntCompensatorPhases is not None:
+            self.ShuntCompensatorPhases = ShuntCompensatorPhases
 
         super(ShuntCompensator, self).__init__(*args, **kw_args)
 
@@ -104,6 +105,7 @@ class ShuntCompensator(RegulatingCondEq):
     _enums = {}
     _refs = ["SvShuntCompensatorSections", "ShuntCompensatorPhases"]
     _many_refs = ["ShuntCompensatorPhases"]
+    _inverses = {"SvShuntCompensatorSections": "ShuntCompensator", "ShuntCompensatorPhases": "ShuntCompensator"}
 
     def getSvShuntCompensatorSections(self):
         """The state for the number of shunt compensator sections in service.
@@ -126,7 +128,8 @@ class ShuntCompensator(RegulatingCondEq):
         return self._ShuntCompensatorPhases
 
     def setShuntCompensatorPhases(self, value):
-        for x in self._ShuntCompensatorPhases:
+        value = RefList(value)
+        for x in list(self._ShuntCompensatorPhases):
             x.ShuntCompensator = None
         for y in value:
             y._ShuntCompensator = self
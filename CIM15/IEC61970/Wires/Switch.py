@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.ConductingEquipment import ConductingEquipment
+from CIM15.Element import RefList
 
 class Switch(ConductingEquipment):
     """A generic device designed to close, or open, or both, one or more electric circuits.A generic device designed to close, or open, or both, one or more electric circuits.
@@ -54,20 +55,20 @@ class Switch(ConductingEquipment):
         #: The switch on count since the switch was last reset or initialized.
         self.switchOnCount = switchOnCount
 
-        self._SwitchingOperations = []
-        self.SwitchingOperations = [] if SwitchingOperations is None else SwitchingOperations
+        if SwitchingOperations is not None:
+            self.SwitchingOperations = SwitchingOperations
 
-        self._LoadMgmtFunctions = []
-        self.LoadMgmtFunctions = [] if LoadMgmtFunctions is None else LoadMgmtFunctions
+        if LoadMgmtFunctions is not None:
+            self.LoadMgmtFunctions = LoadMgmtFunctions
 
-        self._ConnectDisconnectFunctions = []
-        self.ConnectDisconnectFunctions = [] if ConnectDisconnectFunctions is None else ConnectDisconnectFunctions
+        if ConnectDisconnectFunctions is not None:
+            self.ConnectDisconnectFunctions = ConnectDisconnectFunctions
 
-        self._SwitchSchedules = []
-        self.SwitchSchedules = [] if SwitchSchedules is None else SwitchSchedules
+        if SwitchSchedules is not None:
+            self.SwitchSchedules = SwitchSchedules
 
-        self._SwitchPhases = []
-        self.SwitchPhases = [] if SwitchPhases is None else SwitchPhases
+        if SwitchPhases is not None:
+            self.SwitchPhases = SwitchPhases
 
         self._CompositeSwitch = None
         self.CompositeSwitch = CompositeSwitch
@@ -80,6 +81,7 @@ class Switch(ConductingEquipment):
     _enums = {}
     _refs = ["SwitchingOperations", "LoadMgmtFunctions", "ConnectDisconnectFunctions", "SwitchSchedules", "SwitchPhases", "CompositeSwitch"]
     _many_refs = ["SwitchingOperations", "LoadMgmtFunctions", "ConnectDisconnectFunctions", "SwitchSchedules", "SwitchPhases"]
+    _inverses = {"SwitchingOperations": "Switches", "LoadMgmtFunctions": "Switches", "ConnectDisconnectFunctions": "Switches", "SwitchSchedules": "Switch", "SwitchPhases": "Switch", "CompositeSwitch": "Switches"}
 
     def getSwitchingOperations(self):
         """A switch may be operated by many schedules.
@@ -88,20 +90,19 @@ class Switch(ConductingEquipment):
 
     def setSwitchingOperations(self, value):
         for p in self._SwitchingOperations:
-            filtered = [q for q in p.Switches if q != self]
-            self._SwitchingOperations._Switches = filtered
+            p._Switches.discard(self)
         for r in value:
             if self not in r._Switches:
-                r._Switches.append(self)
-        self._SwitchingOperations = value
+                r._reflist("_Switches").append(self)
+        self._SwitchingOperations = RefList(value)
 
     SwitchingOperations = property(getSwitchingOperations, setSwitchingOperations)
 
     def addSwitchingOperations(self, *SwitchingOperations):
         for obj in SwitchingOperations:
             if self not in obj._Switches:
-                obj._Switches.append(self)
-            self._SwitchingOperations.append(obj)
+                obj._reflist("_Switches").append(self)
+            self._reflist("_SwitchingOperations").append(obj)
 
     def removeSwitchingOperations(self, *SwitchingOperations):
         for obj in SwitchingOperations:
@@ -115,20 +116,19 @@ class Switch(ConductingEquipment):
 
     def setLoadMgmtFunctions(self, value):
         for p in self._LoadMgmtFunctions:
-            filtered = [q for q in p.Switches if q != self]
-            self._LoadMgmtFunctions._Switches = filtered
+            p._Switches.discard(self)
         for r in value:
             if self not in r._Switches:
-                r._Switches.append(self)
-        self._LoadMgmtFunctions = value
+                r._reflist("_Switches").append(self)
+        self._LoadMgmtFunctions = RefList(value)
 
     LoadMgmtFunctions = property(getLoadMgmtFunctions, setLoadMgmtFunctions)
 
     def addLoadMgmtFunctions(self, *LoadMgmtFunctions):
         for obj in LoadMgmtFunctions:
             if self not in obj._Switches:
-                obj._Switches.append(self)
-            self._LoadMgmtFunctions.append(obj)
+                obj._reflist("_Switches").append(self)
+            self._reflist("_LoadMgmtFunctions").append(obj)
 
     def removeLoadMgmtFunctions(self, *LoadMgmtFunctions):
         for obj in LoadMgmtFunctions:
@@ -142,20 +142,19 @@ class Switch(ConductingEquipment):
 
     def setConnectDisconnectFunctions(self, value):
         for p in self._ConnectDisconnectFunctions:
-            filtered = [q for q in p.Switches if q != self]
-            self._ConnectDisconnectFunctions._Switches = filtered
+            p._Switches.discard(self)
         for r in value:
             if self not in r._Switches:
-                r._Switches.append(self)
-        self._ConnectDisconnectFunctions = value
+                r._reflist("_Switches").append(self)
+        self._ConnectDisconnectFunctions = RefList(value)
 
     ConnectDisconnectFunctions = property(getConnectDisconnectFunctions, setConnectDisconnectFunctions)
 
     def addConnectDisconnectFunctions(self, *ConnectDisconnectFunctions):
         for obj in ConnectDisconnectFunctions:
             if self not in obj._Switches:
-                obj._Switches.append(self)
-            self._ConnectDisconnectFunctions.append(obj)
+                obj._reflist("_Switches").append(self)
+            self._reflist("_ConnectDisconnectFunctions").append(obj)
 
     def removeConnectDisconnectFunctions(self, *ConnectDisconnectFunctions):
         for obj in ConnectDisconnectFunctions:
@@ -169,7 +168,8 @@ class Switch(ConductingEquipment):
         return self._SwitchSchedules
 
     def setSwitchSchedules(self, value):
-        for x in self._SwitchSchedules:
+        value = RefList(value)
+        for x in list(self._SwitchSchedules):
             x.Switch = None
         for y in value:
             y._Switch = self
@@ -190,7 +190,8 @@ class Switch(ConductingEquipment):
         return self._SwitchPhases
 
     def setSwitchPhases(self, value):
-        for x in self._SwitchPhases:
+        value = RefList(value)
+        for x in list(self._SwitchPhases):
             x.Switch = None
         for y in value:
             y._Switch = self
@@ -213,13 +214,12 @@ class Switch(ConductingEquipment):
 
     def setCompositeSwitch(self, value):
         if self._CompositeSwitch is not None:
-            filtered = [x for x in self.CompositeSwitch.Switches if x != self]
-            self._CompositeSwitch._Switches = filtered
+            self._CompositeSwitch._Switches.discard(self)
 
         self._CompositeSwitch = value
         if self._CompositeSwitch is not None:
             if self not in self._CompositeSwitch._Switches:
-                self._CompositeSwitch._Switches.append(self)
+                self._CompositeSwitch._reflist("_Switches").append(self)
 
     CompositeSwitch = property(getCompositeSwitch, setCompositeSwitch)
 
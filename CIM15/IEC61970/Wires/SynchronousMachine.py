@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
+from CIM15.Element import RefList
 
 class SynchronousMachine(RegulatingCondEq):
     """An electromechanical device that operates synchronously with the network. It is a single machine operating either as a generator or synchronous condenser or pump.An electromechanical device that operates synchronously with the network. It is a single machine operating either as a generator or synchronous condenser or pump.
@@ -153,14 +154,14 @@ class SynchronousMachine(RegulatingCondEq):
         #: Positive sequence reactance of the synchronous machine.
         self.x = x
 
-        self._PrimeMovers = []
-        self.PrimeMovers = [] if PrimeMovers is None else PrimeMovers
+        if PrimeMovers is not None:
+            self.PrimeMovers = PrimeMovers
 
         self._GeneratingUnit = None
         self.GeneratingUnit = GeneratingUnit
 
-        self._ReactiveCapabilityCurves = []
-        self.ReactiveCapabilityCurves = [] if ReactiveCapabilityCurves is None else ReactiveCapabilityCurves
+        if ReactiveCapabilityCurves is not None:
+            self.ReactiveCapabilityCurves = ReactiveCapabilityCurves
 
         self._HydroPump = None
         self.HydroPump = HydroPump
@@ -176,6 +177,7 @@ class SynchronousMachine(RegulatingCondEq):
     _enums = {"operatingMode": "SynchronousMachineOperatingMode", "coolantType": "CoolantType", "type": "SynchronousMachineType"}
     _refs = ["PrimeMovers", "GeneratingUnit", "ReactiveCapabilityCurves", "HydroPump", "InitialReactiveCapabilityCurve"]
     _many_refs = ["PrimeMovers", "ReactiveCapabilityCurves"]
+    _inverses = {"PrimeMovers": "SynchronousMachines", "GeneratingUnit": "SynchronousMachines", "ReactiveCapabilityCurves": "SynchronousMachines", "HydroPump": "SynchronousMachine", "InitialReactiveCapabilityCurve": "InitiallyUsedBySynchronousMachines"}
 
     def getPrimeMovers(self):
         """Prime movers that drive this SynchronousMachine.
@@ -184,20 +186,19 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setPrimeMovers(self, value):
         for p in self._PrimeMovers:
-            filtered = [q for q in p.SynchronousMachines if q != self]
-            self._PrimeMovers._SynchronousMachines = filtered
+            p._SynchronousMachines.discard(self)
         for r in value:
             if self not in r._SynchronousMachines:
-                r._SynchronousMachines.append(self)
-        self._PrimeMovers = value
+                r._reflist("_SynchronousMachines").append(self)
+        self._PrimeMovers = RefList(value)
 
     PrimeMovers = property(getPrimeMovers, setPrimeMovers)
 
     def addPrimeMovers(self, *PrimeMovers):
         for obj in PrimeMovers:
             if self not in obj._SynchronousMachines:
-                obj._SynchronousMachines.append(self)
-            self._PrimeMovers.append(obj)
+                obj._reflist("_SynchronousMachines").append(self)
+            self._reflist("_PrimeMovers").append(obj)
 
     def removePrimeMovers(self, *PrimeMovers):
         for obj in PrimeMovers:
@@ -212,13 +213,12 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setGeneratingUnit(self, value):
         if self._GeneratingUnit is not None:
-            filtered = [x for x in self.GeneratingUnit.SynchronousMachines if x != self]
-            self._GeneratingUnit._SynchronousMachines = filtered
+            self._GeneratingUnit._SynchronousMachines.discard(self)
 
         self._GeneratingUnit = value
         if self._GeneratingUnit is not None:
             if self not in self._GeneratingUnit._SynchronousMachines:
-                self._GeneratingUnit._SynchronousMachines.append(self)
+                self._GeneratingUnit._reflist("_SynchronousMachines").append(self)
 
     GeneratingUnit = property(getGeneratingUnit, setGeneratingUnit)
 
@@ -229,20 +229,19 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setReactiveCapabilityCurves(self, value):
         for p in self._ReactiveCapabilityCurves:
-            filtered = [q for q in p.SynchronousMachines if q != self]
-            self._ReactiveCapabilityCurves._SynchronousMachines = filtered
+            p._SynchronousMachines.discard(self)
         for r in value:
             if self not in r._SynchronousMachines:
-                r._SynchronousMachines.append(self)
-        self._ReactiveCapabilityCurves = value
+                r._reflist("_SynchronousMachines").append(self)
+        self._ReactiveCapabilityCurves = RefList(value)
 
     ReactiveCapabilityCurves = property(getReactiveCapabilityCurves, setReactiveCapabilityCurves)
 
     def addReactiveCapabilityCurves(self, *ReactiveCapabilityCurves):
         for obj in ReactiveCapabilityCurves:
             if self not in obj._SynchronousMachines:
-                obj._SynchronousMachines.append(self)
-            self._ReactiveCapabilityCurves.append(obj)
+                obj._reflist("_SynchronousMachines").append(self)
+            self._reflist("_ReactiveCapabilityCurves").append(obj)
 
     def removeReactiveCapabilityCurves(self, *ReactiveCapabilityCurves):
         for obj in ReactiveCapabilityCurves:
@@ -273,13 +272,12 @@ class SynchronousMachine(RegulatingCondEq):
 
     def setInitialReactiveCapabilityCurve(self, value):
         if self._InitialReactiveCapabilityCurve is not None:
-            filtered = [x for x in self.InitialReactiveCapabilityCurve.InitiallyUsedBySynchronousMachines if x != self]
-            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines = filtered
+            self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.discard(self)
 
         self._InitialReactiveCapabilityCurve = value
         if self._InitialReactiveCapabilityCurve is not None:
             if self not in self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines:
-                self._InitialReactiveCapabilityCurve._InitiallyUsedBySynchronousMachines.append(self)
+                self._InitialReactiveCapabilityCurve._reflist("_InitiallyUsedBySynchronousMachines").append(self)
 
     InitialReactiveCapabilityCurve = property(getInitialReactiveCapabilityCurve, setInitialReactiveCapabilityCurve)
 
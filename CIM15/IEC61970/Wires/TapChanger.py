@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.PowerSystemResource import PowerSystemResource
+from CIM15.Element import RefList
 
 class TapChanger(PowerSystemResource):
     """Mechanism for changing transformer winding tap positions.Mechanism for changing transformer winding tap positions.
@@ -71,8 +72,8 @@ class TapChanger(PowerSystemResource):
         self._TapChangerInfo = None
         self.TapChangerInfo = TapChangerInfo
 
-        self._TapSchedules = []
-        self.TapSchedules = [] if TapSchedules is None else TapSchedules
+        if TapSchedules is not None:
+            self.TapSchedules = TapSchedules
 
         self._TapChangerControl = None
         self.TapChangerControl = TapChangerControl
@@ -88,6 +89,7 @@ class TapChanger(PowerSystemResource):
     _enums = {}
     _refs = ["TapChangerInfo", "TapSchedules", "TapChangerControl", "SvTapStep"]
     _many_refs = ["TapSchedules"]
+    _inverses = {"TapChangerInfo": "TapChangers", "TapSchedules": "TapChanger", "TapChangerControl": "TapChanger", "SvTapStep": "TapChanger"}
 
     def getTapChangerInfo(self):
         """Data for this tap changer.
@@ -96,13 +98,12 @@ class TapChanger(PowerSystemResource):
 
     def setTapChangerInfo(self, value):
         if self._TapChangerInfo is not None:
-            filtered = [x for x in self.TapChangerInfo.TapChangers if x != self]
-            self._TapChangerInfo._TapChangers = filtered
+            self._TapChangerInfo._TapChangers.discard(self)
 
         self._TapChangerInfo = value
         if self._TapChangerInfo is not None:
             if self not in self._TapChangerInfo._TapChangers:
-                self._TapChangerInfo._TapChangers.append(self)
+                self._TapChangerInfo._reflist("_TapChangers").append(self)
 
     TapChangerInfo = property(getTapChangerInfo, setTapChangerInfo)
 
@@ -112,7 +113,8 @@ class TapChanger(PowerSystemResource):
         return self._TapSchedules
 
     def setTapSchedules(self, value):
-        for x in self._TapSchedules:
+        value = RefList(value)
+        for x in list(self._TapSchedules):
             x.TapChanger = None
         for y in value:
             y._TapChanger = self
@@ -134,13 +136,12 @@ class TapChanger(PowerSystemResource):
 
     def setTapChangerControl(self, value):
         if self._TapChangerControl is not None:
-            filtered = [x for x in self.TapChangerControl.TapChanger if x != self]
-            self._TapChangerControl._TapChanger = filtered
+            self._TapChangerControl._TapChanger.discard(self)
 
         self._TapChangerControl = value
         if self._TapChangerControl is not None:
             if self not in self._TapChangerControl._TapChanger:
-                self._TapChangerControl._TapChanger.append(self)
+                self._TapChangerControl._reflist("_TapChanger").append(self)
 
     TapChangerControl = property(getTapChangerControl, setTapChangerControl)
 
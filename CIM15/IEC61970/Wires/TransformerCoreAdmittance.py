@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class TransformerCoreAdmittance(IdentifiedObject):
 
@@ -47,8 +48,8 @@ class TransformerCoreAdmittance(IdentifiedObject):
         self._TransformerEndInfo = None
         self.TransformerEndInfo = TransformerEndInfo
 
-        self._TransformerEnd = []
-        self.TransformerEnd = [] if TransformerEnd is None else TransformerEnd
+        if TransformerEnd is not None:
+            self.TransformerEnd = TransformerEnd
 
         super(TransformerCoreAdmittance, self).__init__(*args, **kw_args)
 
@@ -58,6 +59,7 @@ class TransformerCoreAdmittance(IdentifiedObject):
     _enums = {}
     _refs = ["TransformerEndInfo", "TransformerEnd"]
     _many_refs = ["TransformerEnd"]
+    _inverses = {"TransformerEndInfo": "CoreAdmittance", "TransformerEnd": "CoreAdmittance"}
 
     def getTransformerEndInfo(self):
         """Transformer end info having this core admittance.
@@ -81,7 +83,8 @@ class TransformerCoreAdmittance(IdentifiedObject):
         return self._TransformerEnd
 
     def setTransformerEnd(self, value):
-        for x in self._TransformerEnd:
+        value = RefList(value)
+        for x in list(self._TransformerEnd):
             x.CoreAdmittance = None
         for y in value:
             y._CoreAdmittance = self
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class TransformerEnd(IdentifiedObject):
     """TransformerEnd is a conducting connection point of a power transformer. It corresponds to a physical transformer winding terminal.  In earlier CIM versions, the TransformerWinding class served a similar purpose. This successor TransformerEnd class is more flexible and has important differences with TransformerWinding.TransformerEnd is a conducting connection point of a power transformer. It corresponds to a physical transformer winding terminal.  In earlier CIM versions, the TransformerWinding class served a similar purpose. This successor TransformerEnd class is more flexible and has important differences with TransformerWinding.
@@ -69,8 +70,8 @@ class TransformerEnd(IdentifiedObject):
         self._Terminal = None
         self.Terminal = Terminal
 
-        self._FromWindingInsulations = []
-        self.FromWindingInsulations = [] if FromWindingInsulations is None else FromWindingInsulations
+        if FromWindingInsulations is not None:
+            self.FromWindingInsulations = FromWindingInsulations
 
         self._CoreAdmittance = None
         self.CoreAdmittance = CoreAdmittance
@@ -84,14 +85,14 @@ class TransformerEnd(IdentifiedObject):
         self._RatioTapChanger = None
         self.RatioTapChanger = RatioTapChanger
 
-        self._FromMeshImpedance = []
-        self.FromMeshImpedance = [] if FromMeshImpedance is None else FromMeshImpedance
+        if FromMeshImpedance is not None:
+            self.FromMeshImpedance = FromMeshImpedance
 
-        self._ToWindingInsulations = []
-        self.ToWindingInsulations = [] if ToWindingInsulations is None else ToWindingInsulations
+        if ToWindingInsulations is not None:
+            self.ToWindingInsulations = ToWindingInsulations
 
-        self._ToMeshImpedance = []
-        self.ToMeshImpedance = [] if ToMeshImpedance is None else ToMeshImpedance
+        if ToMeshImpedance is not None:
+            self.ToMeshImpedance = ToMeshImpedance
 
         self._StarImpedance = None
         self.StarImpedance = StarImpedance
@@ -104,6 +105,7 @@ class TransformerEnd(IdentifiedObject):
     _enums = {}
     _refs = ["Terminal", "FromWindingInsulations", "CoreAdmittance", "TransformerEndInfo", "PhaseTapChanger", "RatioTapChanger", "FromMeshImpedance", "ToWindingInsulations", "ToMeshImpedance", "StarImpedance"]
     _many_refs = ["FromWindingInsulations", "FromMeshImpedance", "ToWindingInsulations", "ToMeshImpedance"]
+    _inverses = {"Terminal": "TransformerEnd", "FromWindingInsulations": "FromWinding", "CoreAdmittance": "TransformerEnd", "TransformerEndInfo": "TransformerEnd", "PhaseTapChanger": "TransformerEnd", "RatioTapChanger": "TransformerEnd", "FromMeshImpedance": "FromTransformerEnd", "ToWindingInsulations": "ToWinding", "ToMeshImpedance": "ToTransformerEnd", "StarImpedance": "TransformerEnd"}
 
     def getTerminal(self):
         """External terminal of the power transformer to which this end belongs.
@@ -112,13 +114,12 @@ class TransformerEnd(IdentifiedObject):
 
     def setTerminal(self, value):
         if self._Terminal is not None:
-            filtered = [x for x in self.Terminal.TransformerEnd if x != self]
-            self._Terminal._TransformerEnd = filtered
+            self._Terminal._TransformerEnd.discard(self)
 
         self._Terminal = value
         if self._Terminal is not None:
             if self not in self._Terminal._TransformerEnd:
-                self._Terminal._TransformerEnd.append(self)
+                self._Terminal._reflist("_TransformerEnd").append(self)
 
     Terminal = property(getTerminal, setTerminal)
 
@@ -127,7 +128,8 @@ class TransformerEnd(IdentifiedObject):
         return self._FromWindingInsulations
 
     def setFromWindingInsulations(self, value):
-        for x in self._FromWindingInsulations:
+        value = RefList(value)
+        for x in list(self._FromWindingInsulations):
             x.FromWinding = None
         for y in value:
             y._FromWinding = self
@@ -150,13 +152,12 @@ class TransformerEnd(IdentifiedObject):
 
     def setCoreAdmittance(self, value):
         if self._CoreAdmittance is not None:
-            filtered = [x for x in self.CoreAdmittance.TransformerEnd if x != self]
-            self._CoreAdmittance._TransformerEnd = filtered
+            self._CoreAdmittance._TransformerEnd.discard(self)
 
         self._CoreAdmittance = value
         if self._CoreAdmittance is not None:
             if self not in self._CoreAdmittance._TransformerEnd:
-                self._CoreAdmittance._TransformerEnd.append(self)
+                self._CoreAdmittance._reflist("_TransformerEnd").append(self)
 
     CoreAdmittance = property(getCoreAdmittance, setCoreAdmittance)
 
@@ -167,13 +168,12 @@ class TransformerEnd(IdentifiedObject):
 
     def setTransformerEndInfo(self, value):
         if self._TransformerEndInfo is not None:
-            filtered = [x for x in self.TransformerEndInfo.TransformerEnd if x != self]
-            self._TransformerEndInfo._TransformerEnd = filtered
+            self._TransformerEndInfo._TransformerEnd.discard(self)
 
         self._TransformerEndInfo = value
         if self._TransformerEndInfo is not None:
             if self not in self._TransformerEndInfo._TransformerEnd:
-                self._TransformerEndInfo._TransformerEnd.append(self)
+                self._TransformerEndInfo._reflist("_TransformerEnd").append(self)
 
     TransformerEndInfo = property(getTransformerEndInfo, setTransformerEndInfo)
 
@@ -215,7 +215,8 @@ class TransformerEnd(IdentifiedObject):
         return self._FromMeshImpedance
 
     def setFromMeshImpedance(self, value):
-        for x in self._FromMeshImpedance:
+        value = RefList(value)
+        for x in list(self._FromMeshImpedance):
             x.FromTransformerEnd = None
         for y in value:
             y._FromTransformerEnd = self
@@ -236,7 +237,8 @@ class TransformerEnd(IdentifiedObject):
         return self._ToWindingInsulations
 
     def setToWindingInsulations(self, value):
-        for x in self._ToWindingInsulations:
+        value = RefList(value)
+        for x in list(self._ToWindingInsulations):
             x.ToWinding = None
         for y in value:
             y._ToWinding = self
@@ -259,20 +261,19 @@ class TransformerEnd(IdentifiedObject):
 
     def setToMeshImpedance(self, value):
         for p in self._ToMeshImpedance:
-            filtered = [q for q in p.ToTransformerEnd if q != self]
-            self._ToMeshImpedance._ToTransformerEnd = filtered
+            p._ToTransformerEnd.discard(self)
         for r in value:
             if self not in r._ToTransformerEnd:
-                r._ToTransformerEnd.append(self)
-        self._ToMeshImpedance = value
+                r._reflist("_ToTransformerEnd").append(self)
+        self._ToMeshImpedance = RefList(value)
 
     ToMeshImpedance = property(getToMeshImpedance, setToMeshImpedance)
 
     def addToMeshImpedance(self, *ToMeshImpedance):
         for obj in ToMeshImpedance:
             if self not in obj._ToTransformerEnd:
-                obj._ToTransformerEnd.append(self)
-            self._ToMeshImpedance.append(obj)
+                obj._reflist("_ToTransformerEnd").append(self)
+            self._reflist("_ToMeshImpedance").append(obj)
 
     def removeToMeshImpedance(self, *ToMeshImpedance):
         for obj in ToMeshImpedance:
@@ -287,13 +288,12 @@ class TransformerEnd(IdentifiedObject):
 
     def setStarImpedance(self, value):
         if self._StarImpedance is not None:
-            filtered = [x for x in self.StarImpedance.TransformerEnd if x != self]
-            self._StarImpedance._TransformerEnd = filtered
+            self._StarImpedance._TransformerEnd.discard(self)
 
         self._StarImpedance = value
         if self._StarImpedance is not None:
             if self not in self._StarImpedance._TransformerEnd:
-                self._StarImpedance._TransformerEnd.append(self)
+                self._StarImpedance._reflist("_TransformerEnd").append(self)
 
     StarImpedance = property(getStarImpedance, setStarImpedance)
 
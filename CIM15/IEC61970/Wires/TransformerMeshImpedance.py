@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class TransformerMeshImpedance(IdentifiedObject):
     """Transformer mesh impedance (Delta-model) between transformer ends. The typical case is that TransformerMeshImpedance describe the impedance between two TransformerEnds pare wise, i.e. the cardinalities at both TranformerEnd associations are 1. But in cases where two or more TransformerEnds are operated connected together the cardinality at the ToTransfomerEnd role is larger than 1.Transformer mesh impedance (Delta-model) between transformer ends. The typical case is that TransformerMeshImpedance describe the impedance between two TransformerEnds pare wise, i.e. the cardinalities at both TranformerEnd associations are 1. But in cases where two or more TransformerEnds are operated connected together the cardinality at the ToTransfomerEnd role is larger than 1.
@@ -51,11 +52,11 @@ class TransformerMeshImpedance(IdentifiedObject):
         self._FromTransformerEndInfo = None
         self.FromTransformerEndInfo = FromTransformerEndInfo
 
-        self._ToTransformerEnd = []
-        self.ToTransformerEnd = [] if ToTransformerEnd is None else ToTransformerEnd
+        if ToTransformerEnd is not None:
+            self.ToTransformerEnd = ToTransformerEnd
 
-        self._ToTransformerEndInfo = []
-        self.ToTransformerEndInfo = [] if ToTransformerEndInfo is None else ToTransformerEndInfo
+        if ToTransformerEndInfo is not None:
+            self.ToTransformerEndInfo = ToTransformerEndInfo
 
         self._FromTransformerEnd = None
         self.FromTransformerEnd = FromTransformerEnd
@@ -68,6 +69,7 @@ class TransformerMeshImpedance(IdentifiedObject):
     _enums = {}
     _refs = ["FromTransformerEndInfo", "ToTransformerEnd", "ToTransformerEndInfo", "FromTransformerEnd"]
     _many_refs = ["ToTransformerEnd", "ToTransformerEndInfo"]
+    _inverses = {"FromTransformerEndInfo": "FromMeshImpedance", "ToTransformerEnd": "ToMeshImpedance", "ToTransformerEndInfo": "ToMeshImpedance", "FromTransformerEnd": "FromMeshImpedance"}
 
     def getFromTransformerEndInfo(self):
         """From end info this mesh impedance is connected to. It determines the voltage reference.
@@ -76,13 +78,12 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setFromTransformerEndInfo(self, value):
         if self._FromTransformerEndInfo is not None:
-            filtered = [x for x in self.FromTransformerEndInfo.FromMeshImpedance if x != self]
-            self._FromTransformerEndInfo._FromMeshImpedance = filtered
+            self._FromTransformerEndInfo._FromMeshImpedance.discard(self)
 
         self._FromTransformerEndInfo = value
         if self._FromTransformerEndInfo is not None:
             if self not in self._FromTransformerEndInfo._FromMeshImpedance:
-                self._FromTransformerEndInfo._FromMeshImpedance.append(self)
+                self._FromTransformerEndInfo._reflist("_FromMeshImpedance").append(self)
 
     FromTransformerEndInfo = property(getFromTransformerEndInfo, setFromTransformerEndInfo)
 
@@ -93,20 +94,19 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setToTransformerEnd(self, value):
         for p in self._ToTransformerEnd:
-            filtered = [q for q in p.ToMeshImpedance if q != self]
-            self._ToTransformerEnd._ToMeshImpedance = filtered
+            p._ToMeshImpedance.discard(self)
         for r in value:
             if self not in r._ToMeshImpedance:
-                r._ToMeshImpedance.append(self)
-        self._ToTransformerEnd = value
+                r._reflist("_ToMeshImpedance").append(self)
+        self._ToTransformerEnd = RefList(value)
 
     ToTransformerEnd = property(getToTransformerEnd, setToTransformerEnd)
 
     def addToTransformerEnd(self, *ToTransformerEnd):
         for obj in ToTransformerEnd:
             if self not in obj._ToMeshImpedance:
-                obj._ToMeshImpedance.append(self)
-            self._ToTransformerEnd.append(obj)
+                obj._reflist("_ToMeshImpedance").append(self)
+            self._reflist("_ToTransformerEnd").append(obj)
 
     def removeToTransformerEnd(self, *ToTransformerEnd):
         for obj in ToTransformerEnd:
@@ -121,20 +121,19 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setToTransformerEndInfo(self, value):
         for p in self._ToTransformerEndInfo:
-            filtered = [q for q in p.ToMeshImpedance if q != self]
-            self._ToTransformerEndInfo._ToMeshImpedance = filtered
+            p._ToMeshImpedance.discard(self)
         for r in value:
             if self not in r._ToMeshImpedance:
-                r._ToMeshImpedance.append(self)
-        self._ToTransformerEndInfo = value
+                r._reflist("_ToMeshImpedance").append(self)
+        self._ToTransformerEndInfo = RefList(value)
 
     ToTransformerEndInfo = property(getToTransformerEndInfo, setToTransformerEndInfo)
 
     def addToTransformerEndInfo(self, *ToTransformerEndInfo):
         for obj in ToTransformerEndInfo:
             if self not in obj._ToMeshImpedance:
-                obj._ToMeshImpedance.append(self)
-            self._ToTransformerEndInfo.append(obj)
+                obj._reflist("_ToMeshImpedance").append(self)
+            self._reflist("_ToTransformerEndInfo").append(obj)
 
     def removeToTransformerEndInfo(self, *ToTransformerEndInfo):
         for obj in ToTransformerEndInfo:
@@ -149,13 +148,12 @@ class TransformerMeshImpedance(IdentifiedObject):
 
     def setFromTransformerEnd(self, value):
         if self._FromTransformerEnd is not None:
-            filtered = [x for x in self.FromTransformerEnd.FromMeshImpedance if x != self]
-            self._FromTransformerEnd._FromMeshImpedance = filtered
+            self._FromTransformerEnd._FromMeshImpedance.discard(self)
 
         self._FromTransformerEnd = value
         if self._FromTransformerEnd is not None:
             if self not in self._FromTransformerEnd._FromMeshImpedance:
-                self._FromTransformerEnd._FromMeshImpedance.append(self)
+                self._FromTransformerEnd._reflist("_FromMeshImpedance").append(self)
 
     FromTransformerEnd = property(getFromTransformerEnd, setFromTransformerEnd)
 
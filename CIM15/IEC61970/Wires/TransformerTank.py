@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.Equipment import Equipment
+from CIM15.Element import RefList
 
 class TransformerTank(Equipment):
     """An assembly of two or more coupled windings that transform electrical power between voltage levels. These windings are bound on a common core and place in the same tank. Transformer tank can be used to model both single-phase and 3-phase transformers.An assembly of two or more coupled windings that transform electrical power between voltage levels. These windings are bound on a common core and place in the same tank. Transformer tank can be used to model both single-phase and 3-phase transformers.
@@ -33,11 +34,11 @@ class TransformerTank(Equipment):
         @param TransformerTankInfo: Transformer tank data.
         @param TransformerObservations:
         """
-        self._ServiceDeliveryPoints = []
-        self.ServiceDeliveryPoints = [] if ServiceDeliveryPoints is None else ServiceDeliveryPoints
+        if ServiceDeliveryPoints is not None:
+            self.ServiceDeliveryPoints = ServiceDeliveryPoints
 
-        self._TransformerTankEnds = []
-        self.TransformerTankEnds = [] if TransformerTankEnds is None else TransformerTankEnds
+        if TransformerTankEnds is not None:
+            self.TransformerTankEnds = TransformerTankEnds
 
         self._PowerTransformer = None
         self.PowerTransformer = PowerTransformer
@@ -45,8 +46,8 @@ class TransformerTank(Equipment):
         self._TransformerTankInfo = None
         self.TransformerTankInfo = TransformerTankInfo
 
-        self._TransformerObservations = []
-        self.TransformerObservations = [] if TransformerObservations is None else TransformerObservations
+        if TransformerObservations is not None:
+            self.TransformerObservations = TransformerObservations
 
         super(TransformerTank, self).__init__(*args, **kw_args)
 
@@ -56,6 +57,7 @@ class TransformerTank(Equipment):
     _enums = {}
     _refs = ["ServiceDeliveryPoints", "TransformerTankEnds", "PowerTransformer", "TransformerTankInfo", "TransformerObservations"]
     _many_refs = ["ServiceDeliveryPoints", "TransformerTankEnds", "TransformerObservations"]
+    _inverses = {"ServiceDeliveryPoints": "TransformerTanks", "TransformerTankEnds": "TransformerTank", "PowerTransformer": "TransformerTanks", "TransformerTankInfo": "TransformerTanks", "TransformerObservations": "Transformer"}
 
     def getServiceDeliveryPoints(self):
         """All service delivery points supplied by this transformer.
@@ -63,7 +65,8 @@ class TransformerTank(Equipment):
         return self._ServiceDeliveryPoints
 
     def setServiceDeliveryPoints(self, value):
-        for x in self._ServiceDeliveryPoints:
+        value = RefList(value)
+        for x in list(self._ServiceDeliveryPoints):
             x.TransformerTanks = None
         for y in value:
             y._TransformerTanks = self
@@ -85,7 +88,8 @@ class TransformerTank(Equipment):
         return self._TransformerTankEnds
 
     def setTransformerTankEnds(self, value):
-        for x in self._TransformerTankEnds:
+        value = RefList(value)
+        for x in list(self._TransformerTankEnds):
             x.TransformerTank = None
         for y in value:
             y._TransformerTank = self
@@ -108,13 +112,12 @@ class TransformerTank(Equipment):
 
     def setPowerTransformer(self, value):
         if self._PowerTransformer is not None:
-            filtered = [x for x in self.PowerTransformer.TransformerTanks if x != self]
-            self._PowerTransformer._TransformerTanks = filtered
+            self._PowerTransformer._TransformerTanks.discard(self)
 
         self._PowerTransformer = value
         if self._PowerTransformer is not None:
             if self not in self._PowerTransformer._TransformerTanks:
-                self._PowerTransformer._TransformerTanks.append(self)
+                self._PowerTransformer._reflist("_TransformerTanks").append(self)
 
     PowerTransformer = property(getPowerTransformer, setPowerTransformer)
 
@@ -125,13 +128,12 @@ class TransformerTank(Equipment):
 
     def setTransformerTankInfo(self, value):
         if self._TransformerTankInfo is not None:
-            filtered = [x for x in self.TransformerTankInfo.TransformerTanks if x != self]
-            self._TransformerTankInfo._TransformerTanks = filtered
+            self._TransformerTankInfo._TransformerTanks.discard(self)
 
         self._TransformerTankInfo = value
         if self._TransformerTankInfo is not None:
             if self not in self._TransformerTankInfo._TransformerTanks:
-                self._TransformerTankInfo._TransformerTanks.append(self)
+                self._TransformerTankInfo._reflist("_TransformerTanks").append(self)
 
     TransformerTankInfo = property(getTransformerTankInfo, setTransformerTankInfo)
 
@@ -140,7 +142,8 @@ class TransformerTank(Equipment):
         return self._TransformerObservations
 
     def setTransformerObservations(self, value):
-        for x in self._TransformerObservations:
+        value = RefList(value)
+        for x in list(self._TransformerObservations):
             x.Transformer = None
         for y in value:
             y._Transformer = self
@@ -44,6 +44,7 @@ class VoltageControlZone(PowerSystemResource):
     _enums = {}
     _refs = ["RegulationSchedule", "BusbarSection"]
     _many_refs = []
+    _inverses = {"RegulationSchedule": "VoltageControlZones", "BusbarSection": "VoltageControlZone"}
 
     def getRegulationSchedule(self):
         """A VoltageControlZone may have a  voltage regulation schedule.
@@ -52,13 +53,12 @@ class VoltageControlZone(PowerSystemResource):
 
     def setRegulationSchedule(self, value):
         if self._RegulationSchedule is not None:
-            filtered = [x for x in self.RegulationSchedule.VoltageControlZones if x != self]
-            self._RegulationSchedule._VoltageControlZones = filtered
+            self._RegulationSchedule._VoltageControlZones.discard(self)
 
         self._RegulationSchedule = value
         if self._RegulationSchedule is not None:
             if self not in self._RegulationSchedule._VoltageControlZones:
-                self._RegulationSchedule._VoltageControlZones.append(self)
+                self._RegulationSchedule._reflist("_VoltageControlZones").append(self)
 
     RegulationSchedule = property(getRegulationSchedule, setRegulationSchedule)
 
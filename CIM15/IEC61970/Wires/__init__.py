@@ -21,66 +21,8 @@
 """An extension to the Core and Topology package that models information on the electrical characteristics of Transmission and Distribution networks. This package is used by network applications such as State Estimation, Load Flow and Optimal Power Flow.
 """
 
-from CIM15.IEC61970.Wires.PhaseImpedanceData import PhaseImpedanceData
-from CIM15.IEC61970.Wires.TapSchedule import TapSchedule
-from CIM15.IEC61970.Wires.TransformerStarImpedance import TransformerStarImpedance
-from CIM15.IEC61970.Wires.Recloser import Recloser
-from CIM15.IEC61970.Wires.RatioTapChangerTabularPoint import RatioTapChangerTabularPoint
-from CIM15.IEC61970.Wires.PhaseTapChangerTabular import PhaseTapChangerTabular
-from CIM15.IEC61970.Wires.RatioTapChanger import RatioTapChanger
-from CIM15.IEC61970.Wires.PhaseTapChangerLinear import PhaseTapChangerLinear
-from CIM15.IEC61970.Wires.ACLineSegment import ACLineSegment
-from CIM15.IEC61970.Wires.PowerTransformerEnd import PowerTransformerEnd
-from CIM15.IEC61970.Wires.Junction import Junction
-from CIM15.IEC61970.Wires.RegulatingCondEq import RegulatingCondEq
-from CIM15.IEC61970.Wires.Sectionaliser import Sectionaliser
-from CIM15.IEC61970.Wires.RatioTapChangerTabular import RatioTapChangerTabular
-from CIM15.IEC61970.Wires.PowerTransformer import PowerTransformer
-from CIM15.IEC61970.Wires.Fuse import Fuse
-from CIM15.IEC61970.Wires.EnergyConsumer import EnergyConsumer
-from CIM15.IEC61970.Wires.Disconnector import Disconnector
-from CIM15.IEC61970.Wires.Connector import Connector
-from CIM15.IEC61970.Wires.ReactiveCapabilityCurve import ReactiveCapabilityCurve
-from CIM15.IEC61970.Wires.Plant import Plant
-from CIM15.IEC61970.Wires.GroundDisconnector import GroundDisconnector
-from CIM15.IEC61970.Wires.Resistor import Resistor
-from CIM15.IEC61970.Wires.SynchronousMachine import SynchronousMachine
-from CIM15.IEC61970.Wires.PhaseTapChangerAsymetrical import PhaseTapChangerAsymetrical
-from CIM15.IEC61970.Wires.RectifierInverter import RectifierInverter
-from CIM15.IEC61970.Wires.SeriesCompensator import SeriesCompensator
-from CIM15.IEC61970.Wires.TapChangerControl import TapChangerControl
-from CIM15.IEC61970.Wires.RegulatingControl import RegulatingControl
-from CIM15.IEC61970.Wires.ProtectedSwitch import ProtectedSwitch
-from CIM15.IEC61970.Wires.PhaseTapChanger import PhaseTapChanger
-from CIM15.IEC61970.Wires.Ground import Ground
-from CIM15.IEC61970.Wires.CompositeSwitch import CompositeSwitch
-from CIM15.IEC61970.Wires.RegulationSchedule import RegulationSchedule
-from CIM15.IEC61970.Wires.TransformerTankEnd import TransformerTankEnd
-from CIM15.IEC61970.Wires.Breaker import Breaker
-from CIM15.IEC61970.Wires.MutualCoupling import MutualCoupling
-from CIM15.IEC61970.Wires.Line import Line
-from CIM15.IEC61970.Wires.PerLengthPhaseImpedance import PerLengthPhaseImpedance
-from CIM15.IEC61970.Wires.FrequencyConverter import FrequencyConverter
-from CIM15.IEC61970.Wires.ShuntCompensator import ShuntCompensator
-from CIM15.IEC61970.Wires.VoltageControlZone import VoltageControlZone
-from CIM15.IEC61970.Wires.LoadBreakSwitch import LoadBreakSwitch
-from CIM15.IEC61970.Wires.BusbarSection import BusbarSection
-from CIM15.IEC61970.Wires.TransformerEnd import TransformerEnd
-from CIM15.IEC61970.Wires.TransformerCoreAdmittance import TransformerCoreAdmittance
-from CIM15.IEC61970.Wires.StaticVarCompensator import StaticVarCompensator
-from CIM15.IEC61970.Wires.Switch import Switch
-from CIM15.IEC61970.Wires.PerLengthSequenceImpedance import PerLengthSequenceImpedance
-from CIM15.IEC61970.Wires.TransformerMeshImpedance import TransformerMeshImpedance
-from CIM15.IEC61970.Wires.SwitchSchedule import SwitchSchedule
-from CIM15.IEC61970.Wires.EnergySource import EnergySource
-from CIM15.IEC61970.Wires.TransformerTank import TransformerTank
-from CIM15.IEC61970.Wires.PhaseTapChangerTabularPoint import PhaseTapChangerTabularPoint
-from CIM15.IEC61970.Wires.DCLineSegment import DCLineSegment
-from CIM15.IEC61970.Wires.TapChanger import TapChanger
-from CIM15.IEC61970.Wires.Conductor import Conductor
-from CIM15.IEC61970.Wires.PhaseTapChangerNonLinear import PhaseTapChangerNonLinear
-from CIM15.IEC61970.Wires.PhaseTapChangerSymetrical import PhaseTapChangerSymetrical
-from CIM15.IEC61970.Wires.Jumper import Jumper
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#Wires"
 nsPrefix = "cimWires"
@@ -145,3 +87,67 @@ class OperatingMode(str):
     """Textual name for an operating mode
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "PhaseImpedanceData",
+    "TapSchedule",
+    "TransformerStarImpedance",
+    "Recloser",
+    "RatioTapChangerTabularPoint",
+    "PhaseTapChangerTabular",
+    "RatioTapChanger",
+    "PhaseTapChangerLinear",
+    "ACLineSegment",
+    "PowerTransformerEnd",
+    "Junction",
+    "RegulatingCondEq",
+    "Sectionaliser",
+    "RatioTapChangerTabular",
+    "PowerTransformer",
+    "Fuse",
+    "EnergyConsumer",
+    "Disconnector",
+    "Connector",
+    "ReactiveCapabilityCurve",
+    "Plant",
+    "GroundDisconnector",
+    "Resistor",
+    "SynchronousMachine",
+    "PhaseTapChangerAsymetrical",
+    "RectifierInverter",
+    "SeriesCompensator",
+    "TapChangerControl",
+    "RegulatingControl",
+    "ProtectedSwitch",
+    "PhaseTapChanger",
+    "Ground",
+    "CompositeSwitch",
+    "RegulationSchedule",
+    "TransformerTankEnd",
+    "Breaker",
+    "MutualCoupling",
+    "Line",
+    "PerLengthPhaseImpedance",
+    "FrequencyConverter",
+    "ShuntCompensator",
+    "VoltageControlZone",
+    "LoadBreakSwitch",
+    "BusbarSection",
+    "TransformerEnd",
+    "TransformerCoreAdmittance",
+    "StaticVarCompensator",
+    "Switch",
+    "PerLengthSequenceImpedance",
+    "TransformerMeshImpedance",
+    "SwitchSchedule",
+    "EnergySource",
+    "TransformerTank",
+    "PhaseTapChangerTabularPoint",
+    "DCLineSegment",
+    "TapChanger",
+    "Conductor",
+    "PhaseTapChangerNonLinear",
+    "PhaseTapChangerSymetrical",
+    "Jumper",
+])
@@ -38,6 +38,7 @@ class EnergyConsumerPhase(PowerSystemResource):
     _enums = {}
     _refs = ["EnergyConsumer"]
     _many_refs = []
+    _inverses = {"EnergyConsumer": "EnergyConsumerPhases"}
 
     def getEnergyConsumer(self):
         
@@ -45,13 +46,12 @@ class EnergyConsumerPhase(PowerSystemResource):
 
     def setEnergyConsumer(self, value):
         if self._EnergyConsumer is not None:
-            filtered = [x for x in self.EnergyConsumer.EnergyConsumerPhases if x != self]
-            self._EnergyConsumer._EnergyConsumerPhases = filtered
+            self._EnergyConsumer._EnergyConsumerPhases.discard(self)
 
         self._EnergyConsumer = value
         if self._EnergyConsumer is not None:
             if self not in self._EnergyConsumer._EnergyConsumerPhases:
-                self._EnergyConsumer._EnergyConsumerPhases.append(self)
+                self._EnergyConsumer._reflist("_EnergyConsumerPhases").append(self)
 
     EnergyConsumer = property(getEnergyConsumer, setEnergyConsumer)
 
@@ -40,6 +40,7 @@ class ShuntCompensatorPhase(PowerSystemResource):
     _enums = {}
     _refs = ["ShuntCompensator"]
     _many_refs = []
+    _inverses = {"ShuntCompensator": "ShuntCompensatorPhases"}
 
     def getShuntCompensator(self):
         
@@ -47,13 +48,12 @@ class ShuntCompensatorPhase(PowerSystemResource):
 
     def setShuntCompensator(self, value):
         if self._ShuntCompensator is not None:
-            filtered = [x for x in self.ShuntCompensator.ShuntCompensatorPhases if x != self]
-            self._ShuntCompensator._ShuntCompensatorPhases = filtered
+            self._ShuntCompensator._ShuntCompensatorPhases.discard(self)
 
         self._ShuntCompensator = value
         if self._ShuntCompensator is not None:
             if self not in self._ShuntCompensator._ShuntCompensatorPhases:
-                self._ShuntCompensator._ShuntCompensatorPhases.append(self)
+                self._ShuntCompensator._reflist("_ShuntCompensatorPhases").append(self)
 
     ShuntCompensator = property(getShuntCompensator, setShuntCompensator)
 
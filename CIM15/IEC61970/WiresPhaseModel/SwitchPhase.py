@@ -52,6 +52,7 @@ class SwitchPhase(PowerSystemResource):
     _enums = {"phaseSide1": "SinglePhaseKind", "phaseSide2": "SinglePhaseKind"}
     _refs = ["Switch"]
     _many_refs = []
+    _inverses = {"Switch": "SwitchPhases"}
 
     def getSwitch(self):
         
@@ -59,13 +60,12 @@ class SwitchPhase(PowerSystemResource):
 
     def setSwitch(self, value):
         if self._Switch is not None:
-            filtered = [x for x in self.Switch.SwitchPhases if x != self]
-            self._Switch._SwitchPhases = filtered
+            self._Switch._SwitchPhases.discard(self)
 
         self._Switch = value
         if self._Switch is not None:
             if self not in self._Switch._SwitchPhases:
-                self._Switch._SwitchPhases.append(self)
+                self._Switch._reflist("_SwitchPhases").append(self)
 
     Switch = property(getSwitch, setSwitch)
 
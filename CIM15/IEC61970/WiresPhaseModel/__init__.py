@@ -19,9 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM15.IEC61970.WiresPhaseModel.SwitchPhase import SwitchPhase
-from CIM15.IEC61970.WiresPhaseModel.ShuntCompensatorPhase import ShuntCompensatorPhase
-from CIM15.IEC61970.WiresPhaseModel.EnergyConsumerPhase import EnergyConsumerPhase
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#WiresPhaseModel"
 nsPrefix = "cimWiresPhaseModel"
@@ -31,3 +30,10 @@ class SinglePhaseKind(str):
     """Values are: C, N, s1, B, s2, A
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "SwitchPhase",
+    "ShuntCompensatorPhase",
+    "EnergyConsumerPhase",
+])
@@ -21,8 +21,34 @@
 """The ControlArea package models area specifications which can be used for a variety of purposes.  The package as a whole models potentially overlapping control area specifications for the purpose of actual generation control, load forecast area load capture, or powerflow based analysis.
 """
 
-from CIM15.IEC61970.IEC61970CIMVersion import IEC61970CIMVersion
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#IEC61970"
 nsPrefix = "cimIEC61970"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "IEC61970CIMVersion",
+], [
+    "AuxiliaryEquipment",
+    "Contingency",
+    "ControlArea",
+    "Core",
+    "CutsJumpers",
+    "Domain",
+    "Equivalents",
+    "Generation",
+    "Graphics",
+    "Informative",
+    "LoadModel",
+    "Meas",
+    "OperationalLimits",
+    "Outage",
+    "Protection",
+    "SCADA",
+    "StateVariables",
+    "Topology",
+    "Wires",
+    "WiresPhaseModel",
+])
@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61968.Common.Organisation import Organisation
+from CIM15.Element import RefList
 
 class MarketParticipant(Organisation):
 
@@ -27,8 +28,8 @@ class MarketParticipant(Organisation):
 
         @param MarketRoles: All roles of this market participant.
         """
-        self._MarketRoles = []
-        self.MarketRoles = [] if MarketRoles is None else MarketRoles
+        if MarketRoles is not None:
+            self.MarketRoles = MarketRoles
 
         super(MarketParticipant, self).__init__(*args, **kw_args)
 
@@ -38,6 +39,7 @@ class MarketParticipant(Organisation):
     _enums = {}
     _refs = ["MarketRoles"]
     _many_refs = ["MarketRoles"]
+    _inverses = {"MarketRoles": "MarketParticipants"}
 
     def getMarketRoles(self):
         """All roles of this market participant.
@@ -46,20 +48,19 @@ class MarketParticipant(Organisation):
 
     def setMarketRoles(self, value):
         for p in self._MarketRoles:
-            filtered = [q for q in p.MarketParticipants if q != self]
-            self._MarketRoles._MarketParticipants = filtered
+            p._MarketParticipants.discard(self)
         for r in value:
             if self not in r._MarketParticipants:
-                r._MarketParticipants.append(self)
-        self._MarketRoles = value
+                r._reflist("_MarketParticipants").append(self)
+        self._MarketRoles = RefList(value)
 
     MarketRoles = property(getMarketRoles, setMarketRoles)
 
     def addMarketRoles(self, *MarketRoles):
         for obj in MarketRoles:
             if self not in obj._MarketParticipants:
-                obj._MarketParticipants.append(self)
-            self._MarketRoles.append(obj)
+                obj._reflist("_MarketParticipants").append(self)
+            self._reflist("_MarketRoles").append(obj)
 
     def removeMarketRoles(self, *MarketRoles):
         for obj in MarketRoles:
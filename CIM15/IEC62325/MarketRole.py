@@ -19,6 +19,7 @@
 # IN THE SOFTWARE.
 
 from CIM15.IEC61970.Core.IdentifiedObject import IdentifiedObject
+from CIM15.Element import RefList
 
 class MarketRole(IdentifiedObject):
     """Role of a market player.Role of a market player.
@@ -36,8 +37,8 @@ class MarketRole(IdentifiedObject):
 
         self.status = status
 
-        self._MarketParticipants = []
-        self.MarketParticipants = [] if MarketParticipants is None else MarketParticipants
+        if MarketParticipants is not None:
+            self.MarketParticipants = MarketParticipants
 
         super(MarketRole, self).__init__(*args, **kw_args)
 
@@ -47,6 +48,7 @@ class MarketRole(IdentifiedObject):
     _enums = {"kind": "MarketRoleKind"}
     _refs = ["status", "MarketParticipants"]
     _many_refs = ["MarketParticipants"]
+    _inverses = {"MarketParticipants": "MarketRoles"}
 
     status = None
 
@@ -57,20 +59,19 @@ class MarketRole(IdentifiedObject):
 
     def setMarketParticipants(self, value):
         for p in self._MarketParticipants:
-            filtered = [q for q in p.MarketRoles if q != self]
-            self._MarketParticipants._MarketRoles = filtered
+            p._MarketRoles.discard(self)
         for r in value:
             if self not in r._MarketRoles:
-                r._MarketRoles.append(self)
-        self._MarketParticipants = value
+                r._reflist("_MarketRoles").append(self)
+        self._MarketParticipants = RefList(value)
 
     MarketParticipants = property(getMarketParticipants, setMarketParticipants)
 
     def addMarketParticipants(self, *MarketParticipants):
         for obj in MarketParticipants:
             if self not in obj._MarketRoles:
-                obj._MarketRoles.append(self)
-            self._MarketParticipants.append(obj)
+                obj._reflist("_MarketRoles").append(self)
+            self._reflist("_MarketParticipants").append(obj)
 
     def removeMarketParticipants(self, *MarketParticipants):
         for obj in MarketParticipants:
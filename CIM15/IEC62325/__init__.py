@@ -19,9 +19,8 @@
 # IN THE SOFTWARE.
 
 
-from CIM15.IEC62325.MarketParticipant import MarketParticipant
-from CIM15.IEC62325.IEC62325CIMVersion import IEC62325CIMVersion
-from CIM15.IEC62325.MarketRole import MarketRole
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#IEC62325"
 nsPrefix = "cimIEC62325"
@@ -31,3 +30,10 @@ class MarketRoleKind(str):
     """Values are: transmissionOperator, complianceMonitor, standardsDeveloper, interchangeAuthority, energyServiceConsumer, planningAuthority, other, purchasingSellingEntity, competitiveRetailer, transmissionOwner, transmissionServiceProvider, generatorOperator, balancingAuthority, loadServingEntity, transmissionPlanner, distributionProvider, reliabilityAuthority, resourcePlanner, generatorOwner
     """
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "MarketParticipant",
+    "IEC62325CIMVersion",
+    "MarketRole",
+])
@@ -34,4 +34,5 @@ class Package(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
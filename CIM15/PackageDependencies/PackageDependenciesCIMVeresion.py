@@ -44,4 +44,5 @@ class PackageDependenciesCIMVeresion(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
@@ -21,8 +21,13 @@
 """This package shows all the root level subpackage dependencies of the combined CIM model.
 """
 
-from CIM15.PackageDependencies.PackageDependenciesCIMVeresion import PackageDependenciesCIMVeresion
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15#PackageDependencies"
 nsPrefix = "cimPackageDependencies"
 
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "PackageDependenciesCIMVeresion",
+])
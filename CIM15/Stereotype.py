@@ -34,4 +34,5 @@ class Stereotype(Element):
     _enums = {}
     _refs = []
     _many_refs = []
+    _inverses = {}
 
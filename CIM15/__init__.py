@@ -21,10 +21,8 @@
 """This package shows all the root level subpackage dependencies of the combined CIM model.
 """
 
-from CIM15.CombinedVersion import CombinedVersion
-from CIM15.Element import Element
-from CIM15.Stereotype import Stereotype
-from CIM15.Package import Package
+import sys
+from CIM15.Element import LazyModule
 
 nsURI = "http://iec.ch/TC57/2010/CIM-schema-cim15"
 nsPrefix = "cim"
@@ -659,3 +657,17 @@ class CIMGDay(str):
 
 class CIMGYearMonth(str):
     pass
+
+
+sys.modules[__name__] = LazyModule(sys.modules[__name__], [
+    "CombinedVersion",
+    "Element",
+    "Stereotype",
+    "Package",
+], [
+    "CDPSM",
+    "IEC61968",
+    "IEC61970",
+    "IEC62325",
+    "PackageDependencies",
+])
@@ -0,0 +1,164 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class BulkLinker(object):
+    """ Binds the references between many CIM objects.
+
+    The generated property setters keep both ends of an association
+    consistent by scanning the list at the many end of the association
+    each time a reference is set, so binding n objects to a common object
+    (e.g. terminals to a connectivity node or equipment to a base voltage)
+    takes O(n^2) time. The linker appends to both ends of the association
+    directly and removes duplicate and stale entries from the lists that
+    have been appended to once, when L{finish} is called. Until then the
+    lists may hold duplicates.
+
+    The inverse of a property is that recorded in the metadata of its class
+    (see C{_inverses}). Properties without an inverse are set through the
+    property.
+
+    The linker may be used as a context manager::
+
+        with BulkLinker() as linker:
+            for terminal in terminals:
+                linker.link(terminal, "ConnectivityNode", node)
+    """
+
+    def __init__(self):
+        # Map of (class, property name) to association descriptor or None.
+        self._associations = {}
+
+        # Map of (list owner id, private name) to (owner, private name,
+        # private name of the inverse if single valued).
+        self._touched = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.finish()
+        return False
+
+    def link(self, obj, attr, value):
+        """ Sets a reference, or adds a reference to a many valued
+        property, and the inverse reference.
+
+        @param obj: CIM object.
+        @type attr: string
+        @param attr: Name of the reference property (e.g. "Terminals").
+        @param value: Referenced CIM object.
+        """
+        key = (obj.__class__, attr)
+        try:
+            assoc = self._associations[key]
+        except KeyError:
+            assoc = self._associations[key] = _describe(obj.__class__, attr,
+                                                         value.__class__)
+
+        if assoc is None:
+            # Rely on properties to set any bi-directional references.
+            if attr in obj._meta.many_refs:
+                getattr(obj, "add%s" % attr)(value)
+            else:
+                setattr(obj, attr, value)
+            return
+
+        name, many, inverse, inverse_many = assoc
+        touched = self._touched
+
+        if many:
+            obj._reflist(name).append(value)
+            touched[(id(obj), name)] = \
+                (obj, name, None if inverse_many else inverse)
+
+            if inverse_many:
+                value._reflist(inverse).append(obj)
+                touched[(id(value), inverse)] = (value, inverse, None)
+            else:
+                old = getattr(value, inverse)
+                if old is not None and old is not obj:
+                    touched[(id(old), name)] = (old, name, inverse)
+                setattr(value, inverse, obj)
+        else:
+            old = getattr(obj, name)
+            if old is value:
+                return
+            if old is not None:
+                if inverse_many:
+                    touched[(id(old), inverse)] = (old, inverse, name)
+                elif getattr(old, inverse) is obj:
+                    setattr(old, inverse, None)
+            setattr(obj, name, value)
+
+            if inverse_many:
+                value._reflist(inverse).append(obj)
+                touched[(id(value), inverse)] = (value, inverse, name)
+            else:
+                other = getattr(value, inverse)
+                if other is not None and other is not obj:
+                    setattr(other, name, None)
+                setattr(value, inverse, obj)
+
+    def finish(self):
+        """ Removes the duplicate entries from the lists that have been
+        appended to and the entries of objects that no longer reference
+        the owner of the list.
+        """
+        n = 0
+        for owner, name, inverse in self._touched.itervalues():
+            items = getattr(owner, name)
+            seen = set()
+            keep = []
+            for x in items:
+                if x in seen:
+                    continue
+                if inverse is not None and getattr(x, inverse) is not owner:
+                    continue
+                seen.add(x)
+                keep.append(x)
+            if len(keep) != len(items):
+                n += len(items) - len(keep)
+                items[:] = keep
+        self._touched.clear()
+
+        if n:
+            logger.debug("Removed %d duplicate or stale references.", n)
+
+
+def _describe(klass, attr, target):
+    """ Returns the association descriptor for a property: the private
+    name under which the property is stored, whether it is many valued,
+    the private name of the inverse property and whether it is many
+    valued. Returns None if the property has no inverse.
+    """
+    inverse = klass._meta.inverses.get(attr)
+    if inverse is None or \
+            not isinstance(getattr(klass, attr, None), property) or \
+            not isinstance(getattr(target, inverse, None), property):
+        return None
+
+    return ("_" + attr, attr in klass._meta.many_refs,
+            "_" + inverse, inverse in target._meta.many_refs)
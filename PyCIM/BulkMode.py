@@ -0,0 +1,67 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import gc
+import logging
+
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def bulkmode(enabled=True, freeze=False):
+    """ Suspends the cyclic garbage collector while many objects are
+    created, or serialised, in the block::
+
+        with bulkmode(freeze=True):
+            d = cimread("model.xml")
+
+    CIM object graphs are full of reference cycles (e.g. between a terminal
+    and its connectivity node) and none of them become garbage while a
+    model is being read, but the collector repeatedly scans the growing
+    graph. The collector is re-enabled, if it was enabled, on leaving the
+    block.
+
+    @type enabled: bool
+    @param enabled: Whether to suspend the collector. If False the block is
+    run unchanged.
+    @type freeze: bool
+    @param freeze: Move all objects to the permanent generation on leaving
+    the block, so that later collections, and the copy-on-write pages of
+    forked worker processes, are not touched by scans of the model.
+    Requires C{gc.freeze} (Python 3.7 and later) and is ignored otherwise.
+    """
+    if not enabled:
+        yield
+        return
+
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if freeze:
+            if hasattr(gc, "freeze"):
+                gc.freeze()
+            else:
+                logger.debug("gc.freeze is not available.")
+        if was_enabled:
+            gc.enable()
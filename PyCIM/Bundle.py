@@ -0,0 +1,153 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import ast
+import imp
+import logging
+import marshal
+import os
+import struct
+import time
+
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED
+
+logger = logging.getLogger(__name__)
+
+# Source of the PyCIM package of a bundle, which holds the module shared by
+# the Element classes. Other modules of PyCIM are imported from any PyCIM
+# package further along the module search path.
+_PACKAGE = "__path__ = __import__('pkgutil').extend_path(__path__, __name__)\n"
+
+
+def cimbundle(package, path, docstrings=True):
+    """ Writes the compiled modules of a CIM package (e.g. C{"CIM15"} or
+    C{"CIM14.CDPSM.Balanced"}), and the modules of the packages that
+    contain it, to a single zip archive. The package is imported from
+    the archive, in place of the source tree, by placing the archive ahead
+    of it on the module search path::
+
+        cimbundle("CIM14.CDPSM.Balanced", "balanced.zip", docstrings=False)
+
+        sys.path.insert(0, "balanced.zip")
+        from CIM14.CDPSM.Balanced import packageMap
+
+    Modules are imported from the archive without a stat call or file open
+    per module. Other subpackages of the containing packages are not
+    included. The module of PyCIM from which the Element classes import
+    their support (L{PyCIM.Element}) is included in a C{PyCIM} package.
+
+    @type package: string
+    @param package: Name of the CIM package.
+    @type path: string
+    @param path: Path of the archive to be written.
+    @type docstrings: bool
+    @param docstrings: Whether to keep the docstrings of the modules,
+    classes and methods.
+    @rtype: int
+    @return: Number of modules written.
+    """
+    t0 = time.time()
+
+    # Locate the package without importing it.
+    names = package.split(".")
+    dirs = []
+    search = None
+    for name in names:
+        f, pathname, _ = imp.find_module(name, search)
+        if f is not None:
+            f.close()
+            raise ValueError("%s is not a package" % package)
+        dirs.append(pathname)
+        search = [pathname]
+    root = os.path.dirname(dirs[0])
+
+    files = []
+    for d in dirs[:-1]:
+        files.extend([os.path.join(d, name) for name in sorted(os.listdir(d))
+                      if name.endswith(".py")])
+    for dirpath, dirnames, filenames in os.walk(dirs[-1]):
+        if "__init__.py" not in filenames:
+            dirnames[:] = []
+            continue
+        dirnames.sort()
+        files.extend([os.path.join(dirpath, name)
+                      for name in sorted(filenames) if name.endswith(".py")])
+
+    modules = [(os.path.relpath(filename, root).replace(os.sep, "/"),
+                filename) for filename in files]
+    modules.append(("PyCIM/__init__.py", None))
+    modules.append(("PyCIM/Element.py",
+                    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 "Element.py")))
+
+    magic = imp.get_magic()
+    with ZipFile(path, "w", ZIP_DEFLATED) as archive:
+        for arcname, filename in modules:
+            if filename is None:
+                mtime = int(time.time())
+                source = _PACKAGE
+            else:
+                mtime = int(os.stat(filename).st_mtime)
+                with open(filename, "rU") as f:
+                    source = f.read()
+            if docstrings:
+                code = compile(source, arcname, "exec")
+            else:
+                tree = ast.parse(source, arcname)
+                _strip(tree)
+                code = compile(tree, arcname, "exec")
+
+            info = ZipInfo(arcname + "c", time.localtime(mtime)[:6])
+            info.compress_type = ZIP_DEFLATED
+            archive.writestr(info, magic + struct.pack("<I", mtime) +
+                             marshal.dumps(code))
+
+    logger.info("Bundled %d modules of %s in %.2fs." %
+                (len(modules), package, time.time() - t0))
+
+    return len(modules)
+
+
+def _strip(tree):
+    """ Removes the docstrings of the modules, classes and functions in the
+    given syntax tree.
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef)) and \
+                node.body and isinstance(node.body[0], ast.Expr) and \
+                isinstance(node.body[0].value, ast.Str):
+            node.body = node.body[1:] or [ast.Pass(lineno=node.body[0].lineno,
+                                                   col_offset=0)]
+
+
+if __name__ == "__main__":
+    from optparse import OptionParser
+
+    parser = OptionParser(usage="python -m PyCIM.Bundle [options] PACKAGE "
+                                "ARCHIVE")
+    parser.add_option("-s", "--strip-docstrings", action="store_true",
+                      default=False, help="remove docstrings")
+    options, args = parser.parse_args()
+    if len(args) != 2:
+        parser.error("a package and an archive path are required")
+
+    logging.basicConfig(level=logging.INFO)
+
+    cimbundle(args[0], args[1], not options.strip_docstrings)
@@ -0,0 +1,519 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Columnar storage, in NumPy arrays, of CIM objects of classes that have
+many instances per owning object, such as the position points of a location
+or the data points of a curve.
+"""
+
+import logging
+
+from time import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from PyCIM.BulkLinker import _describe
+
+logger = logging.getLogger(__name__)
+
+#: Map of the names of the classes stored in columns by default to the name
+#: of the reference to the object that owns their instances.
+POINTS = {
+    "PositionPoint": "Location",
+    "CurveData": "Curve",
+    "IrregularTimePoint": "IntervalSchedule",
+    "DiagramObjectPoint": "DiagramObject",
+    "IntervalReading": "IntervalBlocks",
+}
+
+# Map of attribute type to the type of its column, if all of the values are
+# of the attribute type.
+_dtypes = {float: "f8", int: "i8", bool: "?"}
+
+# Types of column tried, in turn, for string attributes, with the functions
+# that parse and format their values. A column is used only if all of the
+# values are formatted as they were given.
+_numbers = [("i8", int, str), ("f8", float, repr)]
+
+# Map of class to the class of its views.
+_views = {}
+
+READ_ONLY = "the references of objects in columnar storage may not be changed"
+
+
+def columnar(d, points=None):
+    """ Moves the objects of the given classes from a dictionary of CIM
+    objects into columns, a table of NumPy arrays per class::
+
+        store = columnar(d)
+        points = location.PositionPoints
+        x = points.column("xPosition")
+
+    The association of each owner (e.g. C{Location.PositionPoints}) holds a
+    L{ColumnBlock}, the slice of the table of its objects, which creates
+    views of the objects on demand. Views have the attributes and
+    references of the objects they replace, and their attributes may be
+    set, but their references are read only. Objects with references to
+    more than their owner, and owners whose objects are of more than one
+    class, are left as they are.
+
+    String attributes whose values are all integers or floating point
+    numbers, such as the positions of C{PositionPoint}, are held in numeric
+    columns, so C{column} returns numbers, while views return the strings.
+
+    @type d: dict
+    @param d: Map of UUID to CIM object, from which the stored objects are
+    removed.
+    @type points: dict
+    @param points: Map of class name to the name of the reference to the
+    owning object. Defaults to L{POINTS}. Subclasses of the named classes
+    are also stored.
+    @rtype: L{ColumnStore}
+    @return: The tables of columns.
+    """
+    if numpy is None:
+        raise ImportError("columnar storage requires NumPy")
+
+    t0 = time()
+
+    if points is None:
+        points = POINTS
+
+    # Map of class to the name of the reference to the owner of its objects.
+    refs = {}
+    # Map of (class, owner class) to association descriptor.
+    assocs = {}
+    # Map of (owner id, private name of its association) to the owner, the
+    # name of the reference to it and the objects that may be stored.
+    owners = {}
+    keys = []
+    for obj in d.itervalues():
+        klass = obj.__class__
+        try:
+            ref = refs[klass]
+        except KeyError:
+            ref = refs[klass] = _owner_ref(klass, points)
+        if ref is None:
+            continue
+
+        owner = _owner(obj, ref)
+        if owner is None:
+            continue
+        key = (klass, owner.__class__)
+        try:
+            assoc = assocs[key]
+        except KeyError:
+            assoc = assocs[key] = _describe(klass, ref, owner.__class__)
+        if assoc is None:
+            continue
+
+        inverse = assoc[2]
+        key = (id(owner), inverse)
+        if key not in owners:
+            owners[key] = (owner, ref, inverse, set())
+            keys.append(key)
+        owners[key][3].add(obj)
+
+    # Map of (class, private name of the association of the owners) to the
+    # owners and their objects.
+    groups = {}
+    order = []
+    for key in keys:
+        owner, ref, inverse, candidates = owners[key]
+        objs = list(getattr(owner, inverse))
+        klass = objs[0].__class__
+        if len(objs) != len(candidates) or \
+                [obj for obj in objs if obj.__class__ is not klass
+                 or obj not in candidates or not _sole(obj, ref)]:
+            continue
+
+        key = (klass, inverse)
+        if key not in groups:
+            groups[key] = (ref, [], [])
+            order.append(key)
+        groups[key][1].append(owner)
+        groups[key][2].append(objs)
+
+    store = ColumnStore()
+    for klass, inverse in order:
+        ref, group, objs = groups[(klass, inverse)]
+        table = ColumnTable(klass, ref, inverse, group, objs)
+        for position, owner in enumerate(group):
+            setattr(owner, inverse, ColumnBlock(table, position))
+        for block in objs:
+            for obj in block:
+                del d[obj.UUID]
+        store.tables.append(table)
+
+    logger.info("Stored %d CIM objects in %d tables of columns in %.2fs.",
+                len(store), len(store.tables), time() - t0)
+
+    return store
+
+
+class ColumnStore(object):
+    """ The tables of columns created by L{columnar}.
+    """
+
+    def __init__(self):
+        #: Tables of columns.
+        self.tables = []
+
+    def __len__(self):
+        return sum([len(table) for table in self.tables])
+
+    def __iter__(self):
+        for table in self.tables:
+            for block in table.blocks():
+                for view in block:
+                    yield view
+
+    def views(self):
+        """ Returns a map of UUID to view of each stored object, which may
+        be merged with the dictionary of other objects to be written::
+
+            objects = dict(d)
+            objects.update(store.views())
+            cimwrite(objects, "model.xml")
+        """
+        return dict([(view.UUID, view) for view in self])
+
+    def restore(self, d):
+        """ Recreates the stored objects, adding them to the given
+        dictionary and to the associations of their owners, and empties
+        the store.
+
+        @type d: dict
+        @param d: Map of UUID to CIM object.
+        """
+        for table in self.tables:
+            names = [name for name in table.klass._meta.attrs
+                     if name != "UUID"]
+            for block in table.blocks():
+                owner = block.owner
+                views = list(block)
+                delattr(owner, table.inverse)
+                for view in views:
+                    obj = table.klass.new(view.UUID)
+                    for name in names:
+                        setattr(obj, name, getattr(view, name))
+                    if table.many:
+                        getattr(obj, "add%s" % table.ref)(owner)
+                    else:
+                        setattr(obj, table.ref, owner)
+                    d[obj.UUID] = obj
+        del self.tables[:]
+
+
+class ColumnTable(object):
+    """ The objects of one class, held in an array per attribute, with the
+    objects of each owner in consecutive rows.
+    """
+
+    def __init__(self, klass, ref, inverse, owners, objs):
+        #: Class of the stored objects.
+        self.klass = klass
+        #: Name of the reference of the stored objects to their owner.
+        self.ref = ref
+        #: Whether the reference to the owner is many valued.
+        self.many = ref in klass._meta.many_refs
+        #: Private name of the association of the owners.
+        self.inverse = inverse
+        #: Objects that own the stored objects.
+        self.owners = owners
+        #: Row of the first object of each owner, followed by the number
+        #: of rows.
+        self.offsets = numpy.cumsum([0] + [len(o) for o in objs])
+
+        rows = [obj for block in objs for obj in block]
+        types = klass._meta.types
+        #: Map of attribute name to the array of its values.
+        self.columns = {}
+        # Map of the names of the string attributes held in numeric columns
+        # to the functions that parse and format their values.
+        self._numbers = {}
+        for name in klass._meta.attrs:
+            values = [getattr(obj, name) for obj in rows]
+            t = types.get(name)
+            numbers = _numeric(values) if t in (str, unicode) else None
+            if t in _dtypes and \
+                    not [v for v in values if v.__class__ is not t]:
+                self.columns[name] = numpy.array(values, _dtypes[t])
+            elif numbers is not None:
+                self.columns[name] = numbers[0]
+                self._numbers[name] = numbers[1:]
+            else:
+                self.columns[name] = _objects(values)
+
+        self._view = _view_class(klass)
+
+    def column(self, name):
+        """ Returns the array of the values of an attribute.
+        """
+        return self.columns[name]
+
+    def blocks(self):
+        """ Returns the block of each owner.
+        """
+        return [getattr(owner, self.inverse) for owner in self.owners]
+
+    def get(self, name, row):
+        """ Returns the value of an attribute of a stored object.
+        """
+        value = self.columns[name][row]
+        if name in self._numbers:
+            return self._numbers[name][1](value.item())
+        elif isinstance(value, numpy.generic):
+            return value.item()
+        return value
+
+    def set(self, name, row, value):
+        """ Sets the value of an attribute of a stored object. A numeric
+        column of a string attribute is replaced by strings if the value is
+        not a number formatted as the others.
+        """
+        if name in self._numbers:
+            parse, format = self._numbers[name]
+            try:
+                number = parse(value)
+            except (TypeError, ValueError):
+                number = None
+            if number is not None and format(number) == value:
+                self.columns[name][row] = number
+                return
+            self.columns[name] = _objects([format(v) for v in
+                                           self.columns[name].tolist()])
+            del self._numbers[name]
+        self.columns[name][row] = value
+
+    def __len__(self):
+        return int(self.offsets[-1])
+
+    def __repr__(self):
+        return "ColumnTable(%s, %d)" % (self.klass.__name__, len(self))
+
+
+class ColumnBlock(object):
+    """ The objects of one class owned by an object: a slice of the rows of
+    a L{ColumnTable}. Behaves as a read only sequence of views of the
+    objects.
+    """
+
+    __slots__ = ("table", "position")
+
+    def __init__(self, table, position):
+        #: Table of the stored objects.
+        self.table = table
+        #: Position of the owner in the owners of the table.
+        self.position = position
+
+    @property
+    def owner(self):
+        """ Object that owns the stored objects.
+        """
+        return self.table.owners[self.position]
+
+    @property
+    def start(self):
+        """ Row of the first object in the table.
+        """
+        return int(self.table.offsets[self.position])
+
+    @property
+    def stop(self):
+        """ Row after the last object in the table.
+        """
+        return int(self.table.offsets[self.position + 1])
+
+    def column(self, name):
+        """ Returns the array of the values of an attribute, a view of the
+        column of the table.
+        """
+        return self.table.columns[name][self.start:self.stop]
+
+    def __len__(self):
+        return self.stop - self.start
+
+    def __iter__(self):
+        view = self.table._view
+        for row in xrange(self.start, self.stop):
+            yield view(self, row)
+
+    def __getitem__(self, index):
+        start, n = self.start, len(self)
+        if isinstance(index, slice):
+            return [self.table._view(self, start + row)
+                    for row in xrange(*index.indices(n))]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("block index out of range")
+        return self.table._view(self, start + index)
+
+    def __contains__(self, obj):
+        return isinstance(obj, _View) and obj._block.table is self.table \
+            and self.start <= obj._row < self.stop
+
+    def index(self, obj):
+        if obj in self:
+            return obj._row - self.start
+        raise ValueError("object not in block")
+
+    def __nonzero__(self):
+        return len(self) > 0
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return "ColumnBlock(%s, %d)" % (self.table.klass.__name__, len(self))
+
+    def _read_only(self, *args):
+        raise TypeError(READ_ONLY)
+
+    append = add = extend = discard = remove = _read_only
+
+
+class _View(object):
+    """ View of a row of a L{ColumnTable} with the attributes and
+    references of the object it replaces.
+    """
+
+    __slots__ = ("_block", "_row")
+
+    def __init__(self, block, row):
+        object.__setattr__(self, "_block", block)
+        object.__setattr__(self, "_row", row)
+
+    def __getattr__(self, name):
+        table = self._block.table
+        if name in table.columns:
+            return table.get(name, self._row)
+        elif name == table.ref:
+            owner = self._block.owner
+            return [owner] if table.many else owner
+        meta = self._meta
+        if name in meta.refs:
+            return None
+        elif name in meta.many_refs:
+            return []
+        raise AttributeError("'%s' object has no attribute '%s'" %
+                             (self.__class__.__name__, name))
+
+    def __setattr__(self, name, value):
+        table = self._block.table
+        if name in table.columns:
+            table.set(name, self._row, value)
+        elif name in self._meta.owners:
+            raise TypeError(READ_ONLY)
+        else:
+            raise AttributeError("'%s' object has no attribute '%s'" %
+                                 (self.__class__.__name__, name))
+
+    def __eq__(self, other):
+        return isinstance(other, _View) and \
+            other._block.table is self._block.table and \
+            other._row == self._row
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash((id(self._block.table), self._row))
+
+
+def _view_class(klass):
+    """ Returns the class of the views of objects of the given class, which
+    has the same name and metadata.
+    """
+    try:
+        return _views[klass]
+    except KeyError:
+        view = _views[klass] = type(klass.__name__, (_View,),
+                                    {"__slots__": (), "_meta": klass._meta})
+        return view
+
+
+def _numeric(values):
+    """ Returns a numeric column of the given strings, with the functions
+    that parse and format its values, or None if they are not all numbers
+    formatted as they would be written.
+    """
+    for dtype, parse, format in _numbers:
+        try:
+            numbers = [parse(v) for v in values]
+            if [v for v, x in zip(values, numbers) if format(x) != v]:
+                continue
+            return numpy.array(numbers, dtype), parse, format
+        except (TypeError, ValueError, OverflowError):
+            continue
+    return None
+
+
+def _objects(values):
+    """ Returns a column of the given Python objects.
+    """
+    column = numpy.empty(len(values), object)
+    column[:] = values
+    return column
+
+def _owner_ref(klass, points):
+    """ Returns the name of the reference of a class to the owner of its
+    objects, or None if it is not stored in columns.
+    """
+    for k in klass.mro()[:-1]:
+        if k.__name__ in points:
+            ref = points[k.__name__]
+            meta = klass._meta
+            if ref in meta.refs or ref in meta.many_refs:
+                return ref
+            return None
+    return None
+
+
+def _owner(obj, ref):
+    """ Returns the owner of an object, or None if it has none or more than
+    one.
+    """
+    value = getattr(obj, ref)
+    if ref in obj._meta.many_refs:
+        return value[0] if len(value) == 1 else None
+    return value
+
+
+def _sole(obj, ref):
+    """ Returns whether an object references only its owner.
+    """
+    meta = obj._meta
+    for name in meta.refs:
+        if name != ref and getattr(obj, name) is not None:
+            return False
+    for name in meta.many_refs:
+        if name != ref and len(getattr(obj, name)):
+            return False
+    return True
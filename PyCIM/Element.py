@@ -0,0 +1,469 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+"""Support shared by the Element classes, from which the classes of each
+version and profile of the CIM derive: the storage of references, the
+flattened metadata of the classes, the construction of instances and the
+lazy import of packages.
+"""
+
+from importlib import import_module
+from itertools import count, izip
+from types import ModuleType
+
+
+class RefList(object):
+    """Insertion ordered collection of references to CIM objects, used for
+    many-valued associations. Behaves like a list for iteration, indexing
+    and len(), but holds each object once. Membership tests, appends and
+    removals take constant time.
+    """
+
+    __slots__ = ("_items", "_index", "_holes")
+
+    # Length from which membership is looked up by the index.
+    threshold = 8
+
+    def __init__(self, iterable=()):
+        # Referenced objects, with None in place of removed objects.
+        self._items = []
+
+        # Map of referenced object to position, or None for short lists.
+        self._index = None
+
+        # Number of removed objects in the list of items.
+        self._holes = 0
+
+        if iterable:
+            self.extend(iterable)
+
+    def _compact(self):
+        items = self._items
+        if self._holes:
+            items = self._items = [x for x in items if x is not None]
+            self._holes = 0
+        if len(items) > self.threshold:
+            self._index = dict(izip(items, count()))
+        else:
+            self._index = None
+        return items
+
+    def append(self, obj):
+        """Adds the given object, unless it is already referenced.
+        """
+        index = self._index
+        if index is None:
+            items = self._items
+            if obj not in items:
+                items.append(obj)
+                if len(items) > self.threshold:
+                    self._index = dict(izip(items, count()))
+        elif obj not in index:
+            index[obj] = len(self._items)
+            self._items.append(obj)
+
+    add = append
+
+    def extend(self, iterable):
+        for obj in iterable:
+            self.append(obj)
+
+    def discard(self, obj):
+        """Removes the given object if it is referenced.
+        """
+        index = self._index
+        if index is None:
+            try:
+                self._items.remove(obj)
+            except ValueError:
+                pass
+            return
+
+        try:
+            i = index.pop(obj)
+        except KeyError:
+            return
+
+        items = self._items
+        if i == len(items) - 1:
+            items.pop()
+            while items and items[-1] is None:
+                items.pop()
+                self._holes -= 1
+        else:
+            items[i] = None
+            self._holes += 1
+            if self._holes > len(index):
+                self._compact()
+
+    def remove(self, obj):
+        if obj not in self:
+            raise ValueError("RefList.remove(x): x not in list")
+        self.discard(obj)
+
+    def pop(self, i=-1):
+        obj = self[i]
+        self.discard(obj)
+        return obj
+
+    def index(self, obj):
+        if obj not in self:
+            raise ValueError("%r is not in list" % (obj,))
+        if self._holes:
+            self._compact()
+        if self._index is not None:
+            return self._index[obj]
+        return self._items.index(obj)
+
+    def count(self, obj):
+        return 1 if obj in self else 0
+
+    def insert(self, i, obj):
+        items = list(self)
+        items.insert(i, obj)
+        self._reset(items)
+
+    def sort(self, *args, **kw_args):
+        items = list(self)
+        items.sort(*args, **kw_args)
+        self._reset(items)
+
+    def reverse(self):
+        self._reset(list(self)[::-1])
+
+    def _reset(self, items):
+        self._items = []
+        self._index = None
+        self._holes = 0
+        self.extend(items)
+
+    def __contains__(self, obj):
+        index = self._index
+        if index is None:
+            return obj in self._items
+        return obj in index
+
+    def __len__(self):
+        if self._index is None:
+            return len(self._items)
+        return len(self._index)
+
+    def __nonzero__(self):
+        return len(self) > 0
+
+    def __iter__(self):
+        if self._holes:
+            self._compact()
+        return iter(self._items)
+
+    def __reversed__(self):
+        if self._holes:
+            self._compact()
+        return reversed(self._items)
+
+    def __getitem__(self, i):
+        if self._holes:
+            self._compact()
+        return self._items[i]
+
+    def __getslice__(self, i, j):
+        return self[max(0, i):max(0, j):]
+
+    def __setitem__(self, i, value):
+        items = list(self)
+        items[i] = value
+        self._reset(items)
+
+    def __setslice__(self, i, j, value):
+        self[max(0, i):max(0, j):] = value
+
+    def __delitem__(self, i):
+        items = list(self)
+        del items[i]
+        self._reset(items)
+
+    def __delslice__(self, i, j):
+        del self[max(0, i):max(0, j):]
+
+    def __eq__(self, other):
+        if isinstance(other, (RefList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        if isinstance(other, (RefList, list)):
+            return list(self) != list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __reduce__(self):
+        return (RefList, (list(self),))
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class EmptyRefList(RefList):
+    """Immutable empty collection of references, shared by all many-valued
+    associations to which no reference has been added.
+    """
+
+    __slots__ = ()
+
+    def append(self, obj):
+        raise TypeError("references must be added to a many-valued "
+                        "association using its add or set method")
+
+    add = append
+
+    def extend(self, iterable):
+        self.append(None)
+
+    def _reset(self, items):
+        self.append(None)
+
+
+#: Storage of the many-valued associations of all objects until a reference
+#: is added.
+EMPTY = EmptyRefList()
+
+
+class ClassMeta(object):
+    """Metadata of a CIM class flattened over the class and its bases. The
+    metadata of each class is computed once and accessed as C{klass._meta}
+    or C{obj._meta}.
+    """
+
+    def __init__(self, klass):
+        #: Names of the attributes, including enumerations, in the order in
+        #: which they are defined, starting with those of the root class.
+        self.attrs = []
+
+        #: Names of the single valued references, in definition order.
+        self.refs = []
+
+        #: Names of the many valued references, in definition order.
+        self.many_refs = []
+
+        #: Map of attribute name to Python type.
+        self.types = {}
+
+        #: Map of enumeration attribute name to enumeration type name.
+        self.enums = {}
+
+        #: Map of attribute name to default value.
+        self.defaults = {}
+
+        #: Map of attribute and reference name to the name of the class that
+        #: defines it.
+        self.owners = {}
+
+        #: Map of reference name to the name of the inverse reference, in
+        #: the referenced class, of the same association.
+        self.inverses = {}
+
+        for k in reversed(klass.mro()[:-1]):
+            d = k.__dict__
+            for name in d.get("_attrs", ()):
+                if name not in self.owners:
+                    self.attrs.append(name)
+                self.owners[name] = k.__name__
+            self.types.update(d.get("_attr_types", ()))
+            self.enums.update(d.get("_enums", ()))
+            self.defaults.update(d.get("_defaults", ()))
+            self.inverses.update(d.get("_inverses", ()))
+
+            many = d.get("_many_refs", ())
+            for name in d.get("_refs", ()):
+                if name not in self.owners:
+                    if name in many:
+                        self.many_refs.append(name)
+                    else:
+                        self.refs.append(name)
+                self.owners[name] = k.__name__
+
+
+# Map of class to its flattened metadata.
+_metas = {}
+
+class _MetaDescriptor(object):
+
+    def __get__(self, obj, klass):
+        try:
+            return _metas[klass]
+        except KeyError:
+            meta = _metas[klass] = ClassMeta(klass)
+            return meta
+
+
+# Map of class to the names of the storage of its many-valued associations.
+_storage = {}
+
+def _storage_names(klass):
+    try:
+        return _storage[klass]
+    except KeyError:
+        names = _storage[klass] = set(
+            ["_" + ref for ref in klass._meta.many_refs
+             if isinstance(getattr(klass, ref, None), property)])
+        return names
+
+# Map of class to the state of an instance constructed with default
+# arguments, the names of the attributes holding lists, a map of the names
+# of the constructor arguments to whether they are attributes (rather than
+# references) and whether instances have a __dict__.
+_prototypes = {}
+
+def _prototype(klass):
+    try:
+        return _prototypes[klass]
+    except KeyError:
+        obj = klass()
+        try:
+            state = dict(obj.__dict__)
+            hasdict = True
+        except AttributeError:
+            state = {}
+            hasdict = False
+            for k in klass.mro():
+                for name in k.__dict__.get("__slots__", ()):
+                    try:
+                        state[name] = k.__dict__[name].__get__(obj, klass)
+                    except AttributeError:
+                        pass
+        lists = [name for name, value in state.iteritems()
+                 if isinstance(value, list)]
+        meta = klass._meta
+        params = dict.fromkeys(meta.refs + meta.many_refs, False)
+        params.update(dict.fromkeys(meta.attrs, True))
+        p = _prototypes[klass] = (state, lists, params, hasdict)
+        return p
+
+
+def _getattr(self, name):
+    # The storage of a many-valued association is created when the
+    # first reference is added.
+    if name in _storage_names(self.__class__):
+        return EMPTY
+    raise AttributeError("'%s' object has no attribute '%s'" %
+                         (self.__class__.__name__, name))
+
+
+def _new(cls, UUID='', **kw_args):
+    """Returns a new instance with the given UUID. Unlike the constructor,
+    which calls the property setter of each reference, attributes and
+    references take their default values directly and only the property
+    setters of the given keyword arguments are called.
+
+    @param UUID: Identifier of the new instance.
+    @param kw_args: Attributes and references of the new instance.
+    """
+    state, lists, params, hasdict = _prototype(cls)
+    obj = cls.__new__(cls)
+    if hasdict:
+        obj.__dict__.update(state)
+    else:
+        for name, value in state.iteritems():
+            setattr(obj, name, value)
+    for name in lists:
+        setattr(obj, name, [])
+    obj.UUID = UUID
+    for name, value in kw_args.iteritems():
+        try:
+            attribute = params[name]
+        except KeyError:
+            raise TypeError("%s.new() got an unexpected keyword argument "
+                            "'%s'" % (cls.__name__, name))
+        if value is not None or attribute:
+            setattr(obj, name, value)
+    return obj
+
+
+def _reflist(self, name):
+    """Returns the storage of the many-valued association with the
+    given private name, creating it if no reference has been added.
+    """
+    refs = getattr(self, name)
+    if refs is EMPTY:
+        refs = RefList()
+        setattr(self, name, refs)
+    return refs
+
+
+class LazyModule(ModuleType):
+    """Package module whose classes and subpackages are imported when they
+    are first accessed. A package replaces its module with a lazy module
+    at the end of its initialisation::
+
+        sys.modules[__name__] = LazyModule(sys.modules[__name__],
+                                           ["Terminal", ...], ["Wires", ...])
+    """
+
+    def __init__(self, module, classes=(), packages=()):
+        ModuleType.__init__(self, module.__name__)
+        names = set(classes)
+        for name, value in module.__dict__.iteritems():
+            # Class modules bound while the package was initialised.
+            if name in names and isinstance(value, ModuleType):
+                continue
+            self.__dict__[name] = value
+
+        if "__all__" not in self.__dict__:
+            self.__dict__["__all__"] = sorted(names) + sorted(
+                [name for name, value in self.__dict__.iteritems()
+                 if not name.startswith("_")
+                 and not isinstance(value, ModuleType)
+                 and value is not LazyModule])
+
+        # The functions of the package refer to the globals of its module.
+        self.__dict__["_module"] = module
+        self.__dict__["_classes"] = names
+        self.__dict__["_packages"] = set(packages)
+
+    def __getattr__(self, name):
+        if name in self._classes:
+            value = getattr(import_module("%s.%s" % (self.__name__, name)),
+                            name)
+        elif name in self._packages:
+            value = import_module("%s.%s" % (self.__name__, name))
+        else:
+            raise AttributeError("'module' object has no attribute '%s'" %
+                                 name)
+        self.__dict__[name] = value
+        return value
+
+    def __getattribute__(self, name):
+        value = ModuleType.__getattribute__(self, name)
+        # Importing a class module binds the module to the package.
+        if isinstance(value, ModuleType) and \
+                name in ModuleType.__getattribute__(self, "_classes"):
+            value = getattr(value, name)
+            ModuleType.__getattribute__(self, "__dict__")[name] = value
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | self._classes | self._packages)
@@ -20,16 +20,341 @@
 # IN THE SOFTWARE.
 
 from xml.etree.cElementTree import iterparse
+from collections import namedtuple
+from cStringIO import StringIO
+from multiprocessing import Pool, cpu_count
+from multiprocessing.pool import ThreadPool
+from sys import getsizeof
 from time import time
+from zipfile import ZipFile
+import bz2
 import logging
+import mmap
+import os
+import re
+import zlib
+
+from BulkLinker import BulkLinker
+from BulkMode import bulkmode
 
 
 logger = logging.getLogger(__name__)
 
+RDF_NS = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+
+# Kinds of property descriptor.
+ATTRIBUTE = 0
+REFERENCE = 1
+MANY = 2
+
+# Map of (packageMap id, nsURI) to class registry.
+_registries = {}
+
+# Leading bytes of compressed and archived documents.
+GZIP_MAGIC = "\x1f\x8b"
+BZIP2_MAGIC = "BZh"
+ZIP_MAGIC = "PK\x03\x04"
+
+# Local names of the elements of a difference model that contain the
+# descriptions of CIM objects.
+FORWARD = "forwardDifferences"
+REVERSE = "reverseDifferences"
+_differences = set(["DifferenceModel", FORWARD, REVERSE])
+
+# Extensions of the documents read from zip archives.
+_extensions = (".xml", ".rdf")
+
+#: Lightweight description of a CIM object in a RDF/XML document: the class
+#: name, the uuid, a map of attribute name to value, a list of (reference
+#: name, uuid) tuples and whether the object is described by C{rdf:about}.
+CIMRecord = namedtuple("CIMRecord",
+                       "name uuid attributes references described")
+
+
+_booleans = {"true": True, "false": False, "1": True, "0": False}
+
+def to_bool(text):
+    """ Converts an xsd:boolean literal (e.g. "true", "false") to a bool.
+    """
+    try:
+        return _booleans[text.strip().lower()]
+    except KeyError:
+        raise ValueError("invalid literal for boolean: %r" % text)
+
+def to_int(text):
+    """ Converts an integer literal to an int, accepting decimal notation
+    for whole numbers (e.g. "1.0").
+    """
+    try:
+        return int(text)
+    except ValueError:
+        val = float(text)
+        if val != int(val):
+            raise
+        return int(val)
+
+def to_str(text):
+    """ Returns string attribute values unchanged. Empty elements yield an
+    empty string.
+    """
+    if text is None:
+        return ""
+    return text
+
+def to_enum(text):
+    """ Interns enumeration literals, of which there are few distinct
+    values, so that all objects share the same string.
+    """
+    try:
+        return intern(text)
+    except TypeError: # unicode
+        return text
+
+#: Map of attribute type to value converter.
+converters = {float: float, int: to_int, bool: to_bool, str: to_str}
+
+
+class ClassRegistry(object):
+    """ Resolves element tags to CIM classes for a particular package map.
+
+    Each tag is resolved once: the module is imported and the class
+    retrieved on first use, after which lookups are a single dict access.
+    Attribute/reference tags (e.g. {...}Terminal.ConnectivityNode) are
+    resolved, per class, to a (name, kind, converter) property descriptor
+    where the kind is one of ATTRIBUTE, REFERENCE or MANY. The converter
+    is selected using the C{_attr_types} and C{_enums} of the class that
+    defines the attribute and is None for references.
+    """
+
+    def __init__(self, packageMap, nsURI):
+        #: Map of class name to PyCIM package name.
+        self.packageMap = packageMap
+
+        #: CIM namespace URI.
+        self.nsURI = nsURI
+
+        #: CIM element tag base (e.g. {http://iec.ch/TC57/2010/CIM-schema-cim15#}).
+        self.base = "{%s#}" % nsURI
+
+        #: Map of element tag to class. Tags that can not be resolved map
+        #: to None.
+        self.classes = {}
+
+        #: Map of class to a map of element tag (and property name) to
+        #: property descriptor.
+        self.properties = {}
+
+    def resolve_class(self, tag):
+        """ Returns the class for the given element tag or None if the tag
+        is not in the CIM namespace or is not in the package map.
+        """
+        klass = None
+        m = len(self.base)
+        if tag[:m] == self.base:
+            name = tag[m:]
+            try:
+                mname = self.packageMap[name]
+            except KeyError:
+                pass
+            else:
+                # Import the module for the CIM object.
+                module = __import__(mname, globals(), locals(), [name], 0)
+                # Get the CIM class from the module.
+                klass = getattr(module, name)
+        self.classes[tag] = klass
+        return klass
+
+    def get_class(self, name):
+        """ Returns the class with the given name or None if it is not in
+        the package map.
+        """
+        tag = self.base + name
+        try:
+            return self.classes[tag]
+        except KeyError:
+            return self.resolve_class(tag)
+
+    def get_properties(self, klass):
+        """ Returns the map of element tag to property descriptor for
+        the given class.
+        """
+        props = self.properties.get(klass)
+        if props is None:
+            props = self.properties[klass] = {}
+        return props
+
+    def resolve_property(self, klass, tag):
+        """ Returns the (name, kind, converter) descriptor for the given
+        attribute or reference element tag or None if the class has no such
+        property.
+        """
+        prop = None
+        m = len(self.base)
+        if tag[:m] == self.base:
+            # Get the attribute/reference name.
+            prop = self.describe(klass, tag[m:].rsplit(".", 1)[-1])
+        self.get_properties(klass)[tag] = prop
+        return prop
+
+    def describe(self, klass, attr):
+        """ Returns the (name, kind, converter) descriptor for the named
+        attribute or reference of the given class or None if the class has
+        no such property. Descriptors are cached under the property name.
+        """
+        props = self.get_properties(klass)
+        try:
+            return props[attr]
+        except KeyError:
+            pass
 
-def cimread(source, packageMap=None, nsURI=None):
+        meta = klass._meta
+        if attr in meta.attrs:
+            if attr in meta.enums:
+                convert = to_enum
+            else:
+                convert = converters.get(meta.types[attr], to_str)
+            prop = (attr, ATTRIBUTE, convert)
+        elif attr in meta.many_refs:
+            prop = (attr, MANY, None)
+        elif attr in meta.refs:
+            prop = (attr, REFERENCE, None)
+        else:
+            prop = None
+        props[attr] = prop
+        return prop
+
+
+class Interner(object):
+    """ Shares one string between the equal strings read from documents:
+    the UUIDs of objects and of their references, enumeration literals and
+    the values of the given string attributes, which should be those with
+    few distinct values (e.g. category codes).
+    """
+
+    def __init__(self, attributes=()):
+        #: Names of the string attributes whose values are interned, which
+        #: may be qualified by the class that defines them (e.g. "name" or
+        #: "IdentifiedObject.name").
+        self.attributes = frozenset(attributes)
+
+        #: Number of bytes of the strings that have been replaced.
+        self.saved = 0
+
+        # Map of string to the string that equal strings are replaced by.
+        self._strings = {}
+
+    def __call__(self, text):
+        """ Returns the string equal to the given string.
+        """
+        try:
+            s = self._strings[text]
+        except KeyError:
+            self._strings[text] = text
+            return text
+        if s is not text:
+            self.saved += getsizeof(text)
+        return s
+
+
+class Projection(object):
+    """ Selects the objects and attributes to be read from a document.
+
+    Classes are selected by name, including subclasses, so that selections
+    apply to any version or profile of the CIM. Attributes may be given by
+    name (e.g. "name") or qualified by the class that defines them (e.g.
+    "IdentifiedObject.name"). References are always read, but references
+    to objects that are not selected are dropped.
+    """
+
+    def __init__(self, include=None, exclude=None, attributes=None):
+        #: Names of the classes to be read, or None for all classes.
+        self.include = _class_names(include)
+
+        #: Names of the classes not to be read.
+        self.exclude = _class_names(exclude) or set()
+
+        #: Names of the attributes to be read, or None for all attributes.
+        self.attributes = None if attributes is None else set(attributes)
+
+        #: UUIDs of the objects in the documents read that were not
+        #: selected.
+        self.excluded = set()
+
+        # Cached results, by class and by element tag.
+        self._classes = {}
+        self._properties = {}
+
+    def accept_class(self, klass):
+        """ Returns True if objects of the given class are to be read.
+        """
+        try:
+            return self._classes[klass]
+        except KeyError:
+            pass
+
+        names = set([c.__name__ for c in klass.mro()])
+        accept = (self.include is None or bool(names & self.include)) and \
+                 not (names & self.exclude)
+        self._classes[klass] = accept
+        return accept
+
+    def accept_property(self, tag, prop):
+        """ Returns True if the property with the given element tag and
+        descriptor is to be read.
+        """
+        try:
+            return self._properties[tag]
+        except KeyError:
+            pass
+
+        attr, kind, _ = prop
+        accept = kind != ATTRIBUTE or self.attributes is None or \
+                 attr in self.attributes or \
+                 tag[tag.find("}") + 1:] in self.attributes
+        self._properties[tag] = accept
+        return accept
+
+
+def _class_names(classes):
+    if classes is None:
+        return None
+    return set([getattr(c, "__name__", c) for c in classes])
+
+
+def get_registry(packageMap, nsURI):
+    """ Returns the class registry for the given package map and namespace
+    URI. Registries are shared between calls to L{cimread}.
+    """
+    key = (id(packageMap), nsURI)
+    try:
+        registry = _registries[key]
+    except KeyError:
+        pass
+    else:
+        if registry.packageMap is packageMap:
+            return registry
+    registry = _registries[key] = ClassRegistry(packageMap, nsURI)
+    return registry
+
+
+def cimread(source, packageMap=None, nsURI=None, include=None, exclude=None,
+            attributes=None, interned=None, bulk=False, freeze=False):
     """ CIM RDF/XML parser.
 
+    The source is read in a single pass. Objects are instantiated and their
+    attributes set as the elements are parsed. References are collected in
+    a table of pending links and bound once the end of the document has
+    been reached, so the source need not be seekable (e.g. pipes, sockets).
+
+    Sources compressed with gzip or bzip2 are decompressed as they are
+    read. Every XML document in a zip archive is read and the documents
+    are merged into one model as by L{cimread_many}.
+
+    The objects and attributes that are read may be restricted using
+    C{include}, C{exclude} and C{attributes} (see L{Projection}). Elements
+    that are not selected are skipped without being converted or
+    instantiated.
+
     @type source: File-like object or a path to a file.
     @param source: CIM RDF/XML file.
     @type profile: dict
@@ -41,6 +366,26 @@ def cimread(source, packageMap=None, nsURI=None):
     @type profile: string
     @param nsURI: CIM namespace URI used in the RDF/XML file. For example:
     http://iec.ch/TC57/2010/CIM-schema-cim15
+    @type include: list
+    @param include: Names of the classes (or the classes) of the objects to
+    be read, including subclasses. Defaults to all classes.
+    @type exclude: list
+    @param exclude: Names of the classes (or the classes) of the objects not
+    to be read, including subclasses.
+    @type attributes: list
+    @param attributes: Names of the attributes to be read (e.g. "name" or
+    "IdentifiedObject.name"). Defaults to all attributes.
+    @type interned: list or L{Interner}
+    @param interned: Names of the string attributes (e.g. "name" or
+    "IdentifiedObject.name") whose equal values are to share one string,
+    or an L{Interner}, which counts the bytes saved. UUIDs and enumeration
+    literals are always shared.
+    @type bulk: bool
+    @param bulk: Suspend the cyclic garbage collector while the objects are
+    created (see L{bulkmode}).
+    @type freeze: bool
+    @param freeze: In bulk mode, move the model to the permanent generation
+    of the garbage collector once it has been read.
     @rtype: dict
     @return: Map of UUID to CIM object.
 
@@ -49,144 +394,873 @@ def cimread(source, packageMap=None, nsURI=None):
     # Start the clock.
     t0 = time()
 
-    # A map of uuids to CIM objects to be returned.
+    projection = None
+    if include is not None or exclude or attributes is not None:
+        projection = Projection(include, exclude, attributes)
+
+    if isinstance(interned, Interner):
+        interner = interned
+    else:
+        interner = Interner(interned or ())
+
+    with bulkmode(bulk, freeze):
+        documents = _documents(source)
+        if len(documents) == 1:
+            d, pending, about = _parse(documents[0], packageMap, nsURI,
+                                       projection=projection,
+                                       interner=interner)
+        else:
+            d, pending, about = _merge([_parse(doc, packageMap, nsURI, True,
+                                               projection, interner)
+                                        for doc in documents])
+
+        # References to objects that were not selected are dropped.
+        _bind(d, pending, about,
+              projection.excluded if projection is not None else ())
+
+    logger.info("Created %d CIM objects in %.2fs.", len(d), time() - t0)
+    if interner.saved:
+        logger.info("Interning strings saved %d bytes.", interner.saved)
+
+    return d
+
+
+def cimiterparse(source, packageMap=None, nsURI=None, objects=False,
+                 about=False, projection=None):
+    """ Iterates over the CIM objects in a RDF/XML document.
+
+    Objects are generated in document order as L{CIMRecord}s of class name,
+    uuid, attribute values and (reference name, uuid) tuples. Each element
+    is discarded once its record has been generated, so memory use does
+    not grow with the size of the document.
+
+    @type source: File-like object or a path to a file.
+    @param source: CIM RDF/XML file.
+    @type packageMap: dict
+    @param packageMap: Map of class name to PyCIM package name. See
+    L{cimread}.
+    @type nsURI: string
+    @param nsURI: CIM namespace URI used in the RDF/XML file.
+    @type objects: bool
+    @param objects: Generate CIM objects, with their attributes set, instead
+    of records. References are not bound.
+    @type about: bool
+    @param about: Also generate records for C{rdf:about} descriptions.
+    Ignored if C{objects} is True.
+    @type projection: L{Projection}
+    @param projection: Selects the objects and attributes to be generated.
+    @rtype: iterator
+    @return: Iterator over records or CIM objects.
+    """
+    context, root, ns_rdf, registry = _start(source, packageMap, nsURI)
+
+    if objects:
+        return _instances(_records(context, root, ns_rdf, registry,
+                                   projection=projection), registry)
+    else:
+        return _records(context, root, ns_rdf, registry, about, projection)
+
+
+def _instances(records, registry):
+    """ Generates a CIM object, with its attributes set, for each record.
+    """
+    get_class = registry.get_class
+    for name, uuid, attrs, _, _ in records:
+        obj = get_class(name).new(uuid)
+        for attr, val in attrs.iteritems():
+            setattr(obj, attr, val)
+        yield obj
+
+
+def cimread_many(sources, packageMap=None, nsURI=None, workers=None,
+                 processes=False):
+    """ Parses several CIM RDF/XML documents into a single model.
+
+    Each document is parsed on a pool of worker threads (or processes) and
+    the resulting objects are merged into one map. References, including
+    those that point into another document, are bound once all documents
+    have been parsed. Objects extended by C{rdf:about} descriptions in
+    other documents (e.g. the CDPSM profile files of a model) receive the
+    attributes and references given by those descriptions.
+
+    @type sources: list
+    @param sources: File-like objects or paths to CIM RDF/XML files, which
+    may be compressed or zip archives of several files (see L{cimread}).
+    @type packageMap: dict
+    @param packageMap: Map of class name to PyCIM package name used for all
+    documents. See L{cimread}.
+    @type nsURI: string
+    @param nsURI: CIM namespace URI used in the RDF/XML files.
+    @type workers: int
+    @param workers: Size of the worker pool. Defaults to the number of
+    sources, up to the number of CPUs.
+    @type processes: bool
+    @param processes: Parse on a pool of processes instead of threads.
+    The workers return the parsed records (see L{_records}) from which the
+    objects are instantiated and linked by the calling process.
+    @rtype: dict
+    @return: Map of UUID to CIM object.
+    """
+    # Start the clock.
+    t0 = time()
+
+    if  bool(nsURI) != bool(packageMap):
+        raise ValueError(
+                'Either pass "packageMap" AND "nsURI" or none of them.')
+
+    sources = [doc for source in sources for doc in _documents(source)]
+    if workers is None:
+        workers = max(1, min(len(sources), cpu_count()))
+    if [doc for doc in sources if isinstance(doc, _Member) and
+            not isinstance(doc.archive, basestring)]:
+        # Members of an archive file object share its file pointer.
+        workers = 1
+
+    args = [(source, packageMap, nsURI, True) for source in sources]
+    if workers == 1:
+        results = map(_parse_args, args)
+    elif processes:
+        pool = Pool(workers)
+        try:
+            parsed = pool.map(_read_records, args)
+        finally:
+            pool.close()
+            pool.join()
+        # Instantiate the objects from the records parsed by the workers.
+        results = [_materialise(records, _get_registry(packageMap, ns))
+                   for ns, records in parsed]
+    else:
+        pool = ThreadPool(workers)
+        try:
+            results = pool.map(_parse_args, args)
+        finally:
+            pool.close()
+            pool.join()
+
+    d, pending, about = _merge(results)
+
+    _bind(d, pending, about)
+
+    logger.info("Created %d CIM objects from %d documents in %.2fs.", len(d),
+                len(sources), time() - t0)
+
+    return d
+
+
+def _merge(results):
+    """ Merges the objects, pending references and descriptions parsed
+    from several documents. The first definition of an object is kept.
+    """
     d = {}
+    pending = []
+    about = []
+    # Objects replaced by an earlier definition of the same uuid.
+    duplicates = {}
+    for dd, pp, aa in results:
+        for uuid, obj in dd.iteritems():
+            if uuid in d:
+                duplicates[obj] = d[uuid]
+            else:
+                d[uuid] = obj
+        pending.extend(pp)
+        about.extend(aa)
+
+    if duplicates:
+        logger.warning("%d objects defined in more than one document.",
+                       len(duplicates))
+        pending = [(duplicates.get(obj, obj), prop, uuid2)
+                   for obj, prop, uuid2 in pending]
+
+    return d, pending, about
+
+
+def cimread_parallel(source, packageMap=None, nsURI=None, workers=None,
+                     chunksize=1 << 24):
+    """ Parses a large CIM RDF/XML file on a pool of processes.
+
+    The file is split into chunks at the start tags of C{rdf:ID} elements,
+    found by scanning the bytes of the file. Each worker parses a chunk,
+    wrapped in the root element of the document, into records of class
+    name, uuid, attributes and references (see L{_records}). The objects
+    are instantiated from the records and linked by the calling process.
+    Documents that can not be split (e.g. nested object descriptions) are
+    parsed by L{cimread}, as are compressed files and archives.
+
+    @type source: string
+    @param source: Path to a CIM RDF/XML file.
+    @type packageMap: dict
+    @param packageMap: Map of class name to PyCIM package name. See
+    L{cimread}.
+    @type nsURI: string
+    @param nsURI: CIM namespace URI used in the RDF/XML file.
+    @type workers: int
+    @param workers: Number of worker processes. Defaults to the number of
+    CPUs.
+    @type chunksize: int
+    @param chunksize: Approximate size of the chunks in bytes.
+    @rtype: dict
+    @return: Map of UUID to CIM object.
+    """
+    # Start the clock.
+    t0 = time()
 
-    # Obtain the namespaces from the input file
-    namespaces = xmlns(source)
-    ns_rdf = get_rdf_ns(namespaces)
     if  bool(nsURI) != bool(packageMap):
         raise ValueError(
                 'Either pass "packageMap" AND "nsURI" or none of them.')
-    elif (nsURI is None) and (packageMap is None):
+
+    if workers is None:
+        workers = cpu_count()
+
+    chunks = None
+    if _magic(source) is None:
+        chunks = _split(source, max(1, chunksize))
+    if chunks is None or len(chunks[2]) < 2 or workers < 2:
+        return cimread(source, packageMap, nsURI)
+
+    header, footer, bounds = chunks
+    args = [(source, header, footer, start, end, packageMap, nsURI)
+            for start, end in bounds]
+
+    pool = Pool(min(workers, len(args)))
+    try:
+        parsed = pool.map(_read_chunk, args)
+    finally:
+        pool.close()
+        pool.join()
+
+    for ns, records in parsed:
+        if ns is None:
+            logger.warning("Unable to parse chunked document (%s).", records)
+            return cimread(source, packageMap, nsURI)
+
+    d = {}
+    pending = []
+    for ns, records in parsed:
+        _materialise(records, _get_registry(packageMap, ns), d, pending)
+
+    _bind(d, pending)
+
+    logger.info("Created %d CIM objects from %d chunks in %.2fs.", len(d),
+                len(args), time() - t0)
+
+    return d
+
+
+def cimapply(d, source, packageMap=None, nsURI=None, reverse=False):
+    """ Applies a difference model to a map of uuid to CIM object in place.
+
+    The forward differences of the document describe the objects and the
+    properties that are added to the model and the reverse differences
+    those that are removed. Objects described by type in the forward, but
+    not the reverse, differences are instantiated and those described by
+    type in the reverse, but not the forward, differences are removed and
+    unlinked from the rest of the model. Properties in the reverse
+    differences that are not restated in the forward differences are reset
+    and references are set and removed through the properties of the
+    objects, so that both ends of each association are updated. Documents
+    of C{rdf:ID} and C{rdf:about} elements (e.g. incremental updates) are
+    applied as forward differences.
+
+    The work done is proportional to the size of the difference model, not
+    that of the model it is applied to.
+
+    @type d: dict
+    @param d: Map of UUID to CIM object to be updated.
+    @type source: File-like object or a path to a file.
+    @param source: CIM RDF/XML difference model.
+    @type packageMap: dict
+    @param packageMap: Map of class name to PyCIM package name. See
+    L{cimread}.
+    @type nsURI: string
+    @param nsURI: CIM namespace URI used in the RDF/XML file.
+    @type reverse: bool
+    @param reverse: Apply the reverse differences, undoing the changes
+    made by applying the forward differences.
+    @rtype: dict
+    @return: Map of UUID to CIM object, updated in place.
+    """
+    # Start the clock.
+    t0 = time()
+
+    context, root, ns_rdf, registry = _start(source, packageMap, nsURI)
+
+    # Map of uuid to the records of the forward and reverse differences.
+    forward = {}
+    backward = {}
+    section = forward
+    for record in _records(context, root, ns_rdf, registry, True, objects=d,
+                           containers=_differences):
+        if isinstance(record, basestring):
+            # Start of a container.
+            if record == REVERSE:
+                section = backward
+            elif record == FORWARD:
+                section = forward
+        else:
+            section.setdefault(record.uuid, []).append(record)
+
+    if reverse:
+        forward, backward = backward, forward
+
+    def typed(records):
+        return [r.name for r in records if r.name is not None]
+
+    describe = registry.describe
+
+    # Retract the properties that are not restated.
+    removed = []
+    for uuid, records in backward.iteritems():
+        try:
+            obj = d[uuid]
+        except KeyError:
+            continue
+        restated = forward.get(uuid, ())
+        if typed(records) and not typed(restated):
+            removed.append(uuid)
+            continue
+
+        # Names of the restated properties and the restated references.
+        attrs = set()
+        links = set()
+        for r in restated:
+            attrs.update(r.attributes)
+            attrs.update([attr for attr, _ in r.references])
+            links.update(r.references)
+
+        for r in records:
+            for attr in r.attributes:
+                if attr not in attrs:
+                    setattr(obj, attr, _default(obj, attr))
+            for attr, uuid2 in r.references:
+                if (attr, uuid2) in links:
+                    continue
+                val = d.get(uuid2)
+                if describe(obj.__class__, attr)[1] == MANY:
+                    if val is not None and val in getattr(obj, attr):
+                        getattr(obj, "remove%s" % attr)(val)
+                elif attr not in attrs and getattr(obj, attr) is val:
+                    setattr(obj, attr, None)
+
+    # Remove objects and the references to them.
+    for uuid in removed:
+        _unlink(d.pop(uuid))
+
+    # Add objects and set their properties.
+    pending = []
+    for uuid, records in forward.iteritems():
+        obj = d.get(uuid)
+        if obj is None:
+            names = typed(records)
+            if not names:
+                logger.error("Described '%s' object missing.", uuid)
+                continue
+            obj = d[uuid] = registry.get_class(names[0]).new(uuid)
+
+        for r in records:
+            for attr, val in r.attributes.iteritems():
+                setattr(obj, attr, val)
+            for attr, uuid2 in r.references:
+                pending.append((obj, attr, uuid2))
+
+    # Bind references once all objects have been added.
+    for obj, attr, uuid2 in pending:
+        try:
+            val = d[uuid2]
+        except KeyError:
+            logger.error("Referenced '%s' [%s] object missing.",
+                         obj.__class__.__name__, uuid2)
+            continue
+
+        if describe(obj.__class__, attr)[1] == MANY:
+            if val not in getattr(obj, attr):
+                getattr(obj, "add%s" % attr)(val)
+        elif getattr(obj, attr) is not val:
+            setattr(obj, attr, val)
+
+    logger.info("Applied differences to %d CIM objects in %.2fs.",
+                len(forward) + len(backward), time() - t0)
+
+    return d
+
+
+def _default(obj, attr):
+    """ Returns the default value of the given attribute of an object.
+    """
+    return obj._meta.defaults.get(attr)
+
+
+def _unlink(obj):
+    """ Removes the references to and from the given object.
+    """
+    meta = obj._meta
+    for attr in meta.many_refs:
+        values = list(getattr(obj, attr))
+        if values:
+            getattr(obj, "remove%s" % attr)(*values)
+    for attr in meta.refs:
+        if getattr(obj, attr) is not None:
+            setattr(obj, attr, None)
+
+
+def _split(source, chunksize):
+    """ Splits a RDF/XML file into chunks of top-level elements.
+
+    Returns the document header, up to and including the start tag of the
+    root element, the end tag of the root element and a list of (start,
+    end) byte offsets of the chunks. Returns None if the file can not be
+    split.
+    """
+    f = open(source, "rb")
+    try:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return None
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    finally:
+        f.close()
+
+    try:
+        # Find the start tag of the root element, skipping the XML
+        # declaration, processing instructions and comments.
+        i = buf.find("<")
+        while i != -1 and buf[i + 1] in "?!":
+            i = buf.find("<", i + 1)
+        if i == -1:
+            return None
+        j = buf.find(">", i)
+        header = buf[:j + 1]
+        qname = header[i + 1:].split(None, 1)[0].rstrip(">")
+        footer = "</%s>" % qname
+
+        # The prefix bound to the RDF namespace.
+        prefix = "rdf"
+        for k, v in re.findall(r'xmlns:([\w.-]+)\s*=\s*["\']([^"\']*)["\']',
+                               header):
+            if v == RDF_NS:
+                prefix = k
+        pattern = "%s:ID=" % prefix
+
+        close = buf.rfind(footer)
+        if close == -1:
+            return None
+
+        bounds = []
+        start = j + 1
+        while True:
+            k = buf.find(pattern, start + chunksize, close)
+            if k == -1:
+                break
+            # Split before the start tag with the rdf:ID attribute.
+            end = buf.rfind("<", start, k)
+            if end <= start:
+                break
+            bounds.append((start, end))
+            start = end
+        bounds.append((start, close))
+    finally:
+        buf.close()
+
+    return header, footer, bounds
+
+
+def _read_chunk(args):
+    """ Returns the namespace and records of a chunk of a RDF/XML file, or
+    None and the error message if the chunk can not be parsed (e.g. if it
+    splits a nested element). Parse errors can not be pickled.
+    """
+    path, header, footer, start, end, packageMap, nsURI = args
+    f = open(path, "rb")
+    try:
+        f.seek(start)
+        data = f.read(end - start)
+    finally:
+        f.close()
+    try:
+        return _read_records((StringIO(header + data + footer), packageMap,
+                              nsURI, False))
+    except SyntaxError, e:
+        return None, str(e)
+
+
+def _read_records(args):
+    """ Returns the CIM namespace and records of a RDF/XML document.
+    """
+    source, packageMap, nsURI, about = args
+    context, root, ns_rdf, registry = _start(source, packageMap, nsURI)
+    return registry.nsURI, list(_records(context, root, ns_rdf, registry,
+                                         about))
+
+
+def _get_registry(packageMap, nsURI):
+    """ Returns the registry for records of the given CIM namespace.
+    """
+    if packageMap is None:
+        nsURI, packageMap = get_cim_ns({"cim": nsURI})
+    return get_registry(packageMap, nsURI)
+
+
+def _parse_args(args):
+    return _parse(*args)
+
+
+def _parse(source, packageMap=None, nsURI=None, about=False,
+           projection=None, interner=None):
+    """ Parses the CIM objects in a RDF/XML document.
+
+    Returns a map of uuid to CIM object, the unresolved references as
+    (object, property, uuid) tuples and, if C{about} is True, the
+    C{rdf:about} descriptions of objects as (uuid, attributes, references)
+    tuples, where the references are (property, uuid) tuples.
+    """
+    context, root, ns_rdf, registry = _start(source, packageMap, nsURI)
+
+    return _materialise(_records(context, root, ns_rdf, registry, about,
+                                 projection, interner=interner), registry)
+
+
+def _start(source, packageMap=None, nsURI=None):
+    """ Begins parsing a RDF/XML document.
+
+    Returns the parse event iterator, positioned after the start of the
+    root element, the root element, the RDF namespace and the class
+    registry for the CIM namespace of the document.
+    """
+    if  bool(nsURI) != bool(packageMap):
+        raise ValueError(
+                'Either pass "packageMap" AND "nsURI" or none of them.')
+
+    context = iter( iterparse(_open(source), ("start-ns", "start", "end")) )
+
+    # Obtain the namespaces declared up to and including the root element
+    # ({http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF).
+    namespaces = {}
+    for event, elem in context:
+        if event == "start-ns":
+            prefix, ns = elem
+            namespaces[prefix] = ns
+        elif event == "start":
+            root = elem
+            break
+
+    ns_rdf = get_rdf_ns(namespaces)
+    if (nsURI is None) and (packageMap is None):
         nsURI, packageMap = get_cim_ns(namespaces)
 
+    return context, root, ns_rdf, get_registry(packageMap, nsURI)
+
+
+def _records(context, root, ns_rdf, registry, about=False, projection=None,
+             objects=None, containers=None, interner=None):
+    """ Generates a L{CIMRecord} for each CIM object in the document.
+
+    The name is that of the class, the attributes are a map of attribute
+    name to converted value and the references a list of (name, uuid)
+    tuples. Described is True for C{rdf:about} descriptions, which are only
+    generated if C{about} is True. Only the objects and attributes selected
+    by the projection, if given, are generated. Records are tuples, so they
+    may be pickled between processes.
+
+    Objects described in the property elements of others (e.g. a Terminal
+    in ConnectivityNode.Terminals) are generated before the enclosing
+    object, which references them through that property.
+
+    Untyped descriptions (e.g. C{rdf:Description}) of the given objects,
+    a map of uuid to CIM object, are read using the class of the object and
+    generated with no name. The local names of the elements that contain
+    CIM objects in place of the root element (e.g. the differences of a
+    difference model) may be given as C{containers}, in which case the
+    local name of each container is generated before its records.
+
+    UUIDs, enumeration literals and the values of the attributes named by
+    the interner, if given, are replaced by the strings it returns.
+    """
     # CIM element tag base (e.g. {http://iec.ch/TC57/2009/CIM-schema-cim14#}).
-    base = "{%s#}" % nsURI
+    base = registry.base
     # Length of element tag base.
     m = len(base)
 
-    ## First pass instantiates the classes.
-    context = iterparse(source, ("start", "end"))
+    rdfID = "{%s}ID" % ns_rdf
+    rdfAbout = "{%s}about" % ns_rdf
+    rdfResource = "{%s}resource" % ns_rdf
+
+    if interner is None:
+        enum = to_enum
+        interned = ()
+    else:
+        enum = interner
+        interned = interner.attributes
 
-    # Turn it into an iterator (required for cElementTree).
-    context = iter(context)
+    # Classes and property descriptors resolved from previous elements.
+    classes = registry.classes
 
-    # Get the root element ({http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF).
-    _, root = context.next()
+    # The class of the element currently being parsed, its property
+    # descriptors and the fields of its record.
+    klass = None
+    props = None
+    name = uuid = attrs = refs = None
+    described = False
+
+    # Depth of the current element. The root element is at depth 1, CIM
+    # objects at depth 2 and their attributes/references at depth 3.
+    depth = 1
+
+    # Depth of the element containing the CIM objects and the elements
+    # containing those nested in containers.
+    level = 1
+    parents = [root]
+
+    # Depth of the element of the current object, or None between objects.
+    odepth = None
+    # Tag of the current property element of the current object.
+    ptag = None
+    # State of the objects enclosing the current object, if it is nested in
+    # a property element (e.g. a Terminal in ConnectivityNode.Terminals).
+    enclosing = []
 
     for event, elem in context:
-        # Process 'end' elements in the CIM namespace.
-        if event == "end" and elem.tag[:m] == base:
+        if event == "start":
+            depth += 1
+
+            if odepth is None:
+                if depth != level + 1:
+                    continue
+                if containers is not None:
+                    local = elem.tag[elem.tag.find("}") + 1:]
+                    if local in containers:
+                        level = depth
+                        parents.append(elem)
+                        yield local
+                        continue
+            elif depth == odepth + 1:
+                ptag = elem.tag
+                continue
+            elif depth == odepth + 2 and (elem.get(rdfID) is not None or
+                                          about and elem.get(rdfAbout)):
+                enclosing.append((odepth, ptag, klass, props, name, uuid,
+                                  attrs, refs, described))
+            else:
+                continue
+
+            odepth = depth
+            klass = None
 
             # Unique resource identifier for the CIM object.
-            uuid = elem.get("{%s}ID" % ns_rdf)
-            if uuid != None: # class
-                # Element tag without namespace (e.g. VoltageLevel).
-                tag = elem.tag[m:]
+            uuid = elem.get(rdfID)
+            described = False
+            if uuid is None:
+                if not about:
+                    continue
+                uuid = elem.get(rdfAbout)
+                if uuid is None:
+                    continue
+                uuid = uuid.lstrip("#")
+                described = True
+            if interner is not None:
+                uuid = interner(uuid)
+
+            try:
+                klass = classes[elem.tag]
+            except KeyError:
+                klass = registry.resolve_class(elem.tag)
+            name = None if klass is None else klass.__name__
+
+            if klass is None and objects is not None and described:
                 try:
-                    mname = packageMap[tag]
+                    klass = objects[uuid].__class__
                 except KeyError:
-                    logger.error("Unable to locate module for: %s (%s)",
-                                 tag, uuid)
-                    root.clear()
+                    logger.error("Described '%s' object missing.", uuid)
                     continue
-                # Import the module for the CIM object.
-                module = __import__(mname, globals(), locals(), [tag], 0)
-                # Get the CIM class from the module.
-                klass = getattr(module, tag)
 
-                # Instantiate the class and map it to the uuid.
-                d[uuid] = klass(UUID=uuid)
+            if klass is None:
+                if elem.tag[:m] == base:
+                    logger.error("Unable to locate module for: %s (%s)",
+                                 elem.tag[m:], uuid)
+                continue
 
-        # Clear children of the root element to minimise memory usage.
-        root.clear()
+            if projection is not None and \
+                    not projection.accept_class(klass):
+                projection.excluded.add(uuid)
+                klass = None
+                continue
 
-    # Reset stream
-    if hasattr(source, "seek"):
-        source.seek(0)
+            props = registry.get_properties(klass)
+            attrs = {}
+            refs = []
 
-    ## Second pass sets attributes and references.
-    context = iter( iterparse(source, ("start", "end")) )
+        elif event == "end":
+            depth -= 1
 
-    # Get the root element ({http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF).
-    _, root = context.next()
+            if odepth is None:
+                if depth == level - 1 and level > 1:
+                    # End of a container.
+                    level -= 1
+                    parents.pop()
 
-    for event, elem in context:
-        # Process 'start' elements in the CIM namespace.
-        if event == "start" and elem.tag[:m] == base:
-            uuid = elem.get("{%s}ID" % ns_rdf)
-            if uuid != None:
-                # Locate the CIM object using the uuid.
+            elif depth == odepth - 1:
+                # End of an object.
+                if klass is not None:
+                    yield CIMRecord(name, uuid, attrs, refs, described)
+                nested = uuid if klass is not None else None
+
+                if enclosing:
+                    odepth, ptag, klass, props, name, uuid, attrs, refs, \
+                        described = enclosing.pop()
+                    if klass is None or nested is None:
+                        continue
+
+                    # Reference the nested object from the property of the
+                    # enclosing object that contains it. Properties that
+                    # can not be resolved are logged at their end.
+                    try:
+                        prop = props[ptag]
+                    except KeyError:
+                        prop = registry.resolve_property(klass, ptag)
+                    if prop is not None and prop[1] != ATTRIBUTE and \
+                            (projection is None or
+                             projection.accept_property(ptag, prop)):
+                        refs.append((prop[0], nested))
+                else:
+                    odepth = None
+                    klass = None
+                    # Clear children of the containing element to minimise
+                    # memory usage.
+                    parents[-1].clear()
+
+            elif depth == odepth and klass is not None:
                 try:
-                    obj = d[uuid]
+                    prop = props[elem.tag]
                 except KeyError:
-                    logger.error("Missing '%s' object with uuid: %s",
-                                 elem.tag[m:], uuid)
-                    root.clear()
+                    prop = registry.resolve_property(klass, elem.tag)
+
+                if prop is None:
+                    if elem.tag[:m] == base:
+                        logger.error("'%s' has not attribute '%s'",
+                                     klass.__name__,
+                                     elem.tag[m:].rsplit(".", 1)[-1])
                     continue
 
-                # Iterate over attributes/references.
-                for event, elem in context:
-                    # Process end events with elements in the CIM namespace.
-                    if event == "end" and elem.tag[:m] == base:
-                        # Break if class closing element (e.g. </cim:Terminal>).
-                        if elem.get("{%s}ID" % ns_rdf) == None:
-                            # Get the attribute/reference name.
-                            attr = elem.tag[m:].rsplit(".")[1]
-
-                            if not hasattr(obj, attr):
-                                logger.error("'%s' has not attribute '%s'",
-                                             obj.__class__.__name__, attr)
-                                continue
-
-                            # Use the rdf:resource attribute to distinguish
-                            # between attributes and references/enums.
-                            uuid2 = elem.get("{%s}resource" % ns_rdf)
-
-                            if uuid2 == None: # attribute
-                                # Convert value type using the default value.
-                                typ = type( getattr(obj, attr) )
-                                setattr(obj, attr, typ(elem.text))
-                            else: # reference or enum
-                                # Use the '#' prefix to distinguish between
-                                # references and enumerations.
-                                if uuid2[0] == "#": # reference
-                                    try:
-                                        val = d[uuid2[1:]] # remove '#' prefix
-                                    except KeyError:
-                                        logger.error("Referenced '%s' [%s] "
-                                                     "object missing.",
-                                                     obj.__class__.__name__,
-                                                     uuid2[1:])
-                                        continue
-
-                                    default = getattr(obj, attr)
-                                    if default == None: # 1..1 or 1..n
-                                        # Rely on properties to set any
-                                        # bi-directional references.
-                                        setattr(obj, attr, val)
-                                    elif isinstance(default, list): # many
-                                        # Use 'add*' method to set reference.
-                                        getattr(obj, ("add%s" % attr))(val)
-#                                    else:
-#                                        logger.error("Reference error [%s].",
-#                                                     default)
-
-                                else: # enum
-                                    val = uuid2.rsplit(".", 1)[1]
-                                    setattr(obj, attr, val)
-
-                        else:
-                            # Finished setting object attributes.
-                            break
-
-        # Clear children of the root element to minimise memory usage.
-        root.clear()
+                if projection is not None and \
+                        not projection.accept_property(elem.tag, prop):
+                    continue
 
-    logger.info("Created %d CIM objects in %.2fs.", len(d), time() - t0)
+                attr, kind, convert = prop
 
-    return d
+                # Use the rdf:resource attribute to distinguish
+                # between attributes and references/enums.
+                uuid2 = elem.get(rdfResource)
+
+                if uuid2 is None: # attribute
+                    if convert is None:
+                        continue
+                    try:
+                        val = convert(elem.text)
+                    except (ValueError, TypeError):
+                        logger.error("Invalid value for '%s.%s' [%s]: %s",
+                                     klass.__name__, attr, uuid,
+                                     elem.text)
+                        continue
+                    if interned and val.__class__ is str and \
+                            (attr in interned or elem.tag[m:] in interned):
+                        val = interner(val)
+                    attrs[attr] = val
+                else: # reference or enum
+                    # Use the '#' prefix to distinguish between
+                    # references and enumerations.
+                    if uuid2[0] == "#": # reference
+                        if kind != ATTRIBUTE:
+                            uuid2 = uuid2[1:]
+                            if interner is not None:
+                                uuid2 = interner(uuid2)
+                            refs.append((attr, uuid2))
+                    else: # enum
+                        attrs[attr] = enum(uuid2.rsplit(".", 1)[1])
+
+
+def _materialise(records, registry, d=None, pending=None, described=None):
+    """ Instantiates the CIM objects for the given records.
+
+    Returns the map of uuid to CIM object, the unresolved references and
+    the C{rdf:about} descriptions (see L{_parse}).
+    """
+    # A map of uuids to CIM objects to be returned.
+    if d is None:
+        d = {}
+
+    # Unresolved references as (object, property, uuid) tuples. These are
+    # bound once all objects have been instantiated.
+    if pending is None:
+        pending = []
+
+    # Properties of objects described in other documents.
+    if described is None:
+        described = []
+
+    get_class = registry.get_class
+    get_properties = registry.get_properties
+
+    for name, uuid, attrs, refs, about in records:
+        klass = get_class(name)
+        props = get_properties(klass)
+
+        links = []
+        for attr, uuid2 in refs:
+            try:
+                prop = props[attr]
+            except KeyError:
+                prop = registry.describe(klass, attr)
+            links.append((prop, uuid2))
+
+        if about:
+            described.append((uuid, attrs, links))
+            continue
+
+        # Instantiate the class and map it to the uuid.
+        obj = d[uuid] = klass.new(uuid)
+        for attr, val in attrs.iteritems():
+            setattr(obj, attr, val)
+        for prop, uuid2 in links:
+            pending.append((obj, prop, uuid2))
+
+    return d, pending, described
+
+
+def _bind(d, pending, described=(), excluded=()):
+    """ Sets the properties of described objects and binds references.
+    References to missing objects are dropped and logged as errors, unless
+    the objects were C{excluded} by a projection.
+    """
+    if described:
+        pending = list(pending)
+        for uuid, attrs, links in described:
+            try:
+                obj = d[uuid]
+            except KeyError:
+                logger.error("Described '%s' object missing.", uuid)
+                continue
+
+            for attr, val in attrs.iteritems():
+                setattr(obj, attr, val)
+            for prop, uuid2 in links:
+                pending.append((obj, prop, uuid2))
+
+    # Bind references now that all objects have been instantiated. Both
+    # ends of each association are appended to without scanning the lists
+    # of references, which are made consistent once all are bound.
+    linker = BulkLinker()
+    link = linker.link
+    for obj, (attr, kind, _), uuid2 in pending:
+        try:
+            val = d[uuid2]
+        except KeyError:
+            if uuid2 not in excluded:
+                logger.error("Referenced '%s' [%s] object missing.",
+                             obj.__class__.__name__, uuid2)
+            continue
+
+        if kind == MANY or getattr(obj, attr) is None: # 1..1 or 1..n
+            link(obj, attr, val)
+
+    linker.finish()
 
 
 def xmlns(source):
@@ -196,7 +1270,7 @@ def xmlns(source):
     """
     namespaces = {}
     events=("end", "start-ns", "end-ns")
-    for (event, elem) in iterparse(source, events):
+    for (event, elem) in iterparse(_open(_documents(source)[0]), events):
         if event == "start-ns":
             prefix, ns = elem
             namespaces[prefix] = ns
@@ -205,11 +1279,167 @@ def xmlns(source):
     return namespaces
 
 
+#: A document in a zip archive, given by path or as a L{ZipFile}.
+_Member = namedtuple("_Member", "archive name")
+
+
+class _Decompressed(object):
+    """ Read-only file-like object that decompresses a stream as it is
+    read. Streams of several concatenated members are supported. Streams
+    that are C{owned} are closed once they have been read.
+    """
+
+    blocksize = 1 << 16
+
+    def __init__(self, f, decompressor, data="", owned=False):
+        self._f = f
+        self._owned = owned
+        self._new = decompressor
+        self._d = decompressor() if decompressor is not None else None
+        # Compressed data yet to be decompressed.
+        self._raw = data if self._d is not None else ""
+        # Decompressed data and the position of the next byte to be read.
+        self._buf = data if self._d is None else ""
+        self._pos = 0
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buf) - self._pos < size:
+            if not self._fill():
+                break
+        if size < 0:
+            end = len(self._buf)
+        else:
+            end = self._pos + size
+        data = self._buf[self._pos:end]
+        self._pos += len(data)
+        return data
+
+    def close(self):
+        self._f.close()
+
+    def _fill(self):
+        raw, self._raw = self._raw, ""
+        if not raw:
+            if self._owned and self._f.closed:
+                return False
+            raw = self._f.read(self.blocksize)
+            if not raw:
+                if self._owned:
+                    self._f.close()
+                return False
+
+        if self._d is None:
+            data = raw
+        else:
+            try:
+                data = self._d.decompress(raw)
+            except EOFError:
+                # The previous bzip2 member ended with the last block.
+                self._d = self._new()
+                data = self._d.decompress(raw)
+            if self._d.unused_data:
+                # The data that follows the end of a member.
+                self._raw = self._d.unused_data
+                self._d = self._new()
+
+        self._buf = self._buf[self._pos:] + data
+        self._pos = 0
+        return True
+
+
+def _gzip():
+    return zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+
+def _magic(source):
+    """ Returns the leading bytes of a compressed or archived file, or
+    None for other files and sources that are not paths.
+    """
+    if not isinstance(source, basestring):
+        return None
+    f = open(source, "rb")
+    try:
+        head = f.read(4)
+    finally:
+        f.close()
+    for magic in (GZIP_MAGIC, BZIP2_MAGIC, ZIP_MAGIC):
+        if head.startswith(magic):
+            return magic
+    return None
+
+
+def _documents(source):
+    """ Returns the documents in the given source: the members of a zip
+    archive with XML or RDF extensions, otherwise the source itself.
+    """
+    if isinstance(source, basestring):
+        if _magic(source) != ZIP_MAGIC:
+            return [source]
+        archive = source
+        names = ZipFile(source).namelist()
+    elif hasattr(source, "seek") and hasattr(source, "tell"):
+        try:
+            pos = source.tell()
+        except (IOError, OSError):
+            # Pipes and sockets have the methods of files but can not seek.
+            return [source]
+        try:
+            head = source.read(len(ZIP_MAGIC))
+        finally:
+            source.seek(pos)
+        if head != ZIP_MAGIC:
+            return [source]
+        archive = ZipFile(source)
+        names = archive.namelist()
+    else:
+        return [source]
+
+    members = [_Member(archive, name) for name in names
+               if name.lower().endswith(_extensions)]
+    if not members:
+        raise ValueError("No CIM RDF/XML documents in archive.")
+    return members
+
+
+def _open(source):
+    """ Returns a file-like object (or path) from which the uncompressed
+    document may be read by a single pass.
+    """
+    if isinstance(source, _Member):
+        archive = source.archive
+        if isinstance(archive, basestring):
+            archive = ZipFile(archive)
+        return archive.open(source.name)
+
+    owned = isinstance(source, basestring)
+    if owned:
+        head = _magic(source)
+        if head is None:
+            return source
+        if head.startswith(ZIP_MAGIC):
+            f = None
+        else:
+            f = open(source, "rb")
+            f.read(len(head))
+    else:
+        f = source
+        head = f.read(len(ZIP_MAGIC))
+
+    if head.startswith(ZIP_MAGIC):
+        raise ValueError("Zip archives may contain several documents. "
+                         "Use cimread or cimread_many.")
+    elif head.startswith(GZIP_MAGIC):
+        return _Decompressed(f, _gzip, head, owned)
+    elif head.startswith(BZIP2_MAGIC):
+        return _Decompressed(f, bz2.BZ2Decompressor, head, owned)
+    return _Decompressed(f, None, head, owned)
+
+
 def get_rdf_ns(namespaces):
     try:
         ns = namespaces['rdf']
     except KeyError:
-        ns = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+        ns = RDF_NS
         logger.warn('No rdf namespace found. Using %s' % ns)
 
     return ns
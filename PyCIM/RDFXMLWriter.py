@@ -19,94 +19,631 @@
 # IN THE SOFTWARE.
 
 import logging
+import re
+import sys
 
+from collections import namedtuple
+from multiprocessing import Pool, cpu_count
 from time import time
 
-from CIM15 import nsURI, nsPrefix
+import CIM14
+import CIM15
 
-from PyCIM.SimpleXMLWriter import XMLWriter
+from PyCIM.BulkMode import bulkmode
+from PyCIM.RDFXMLReader import CIMRecord, get_registry
+from PyCIM.SimpleXMLWriter import escape_attrib, escape_cdata
 
 nsPrefixRDF = "rdf"
 nsRDF = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
 
 logger = logging.getLogger(__name__)
 
-def cimwrite(d, source, encoding="utf-8"):
+# Number of bytes of serialised objects buffered between writes.
+BUFFER_SIZE = 1 << 20
+
+# Map of (class, CIM namespace prefix, CIM namespace, encoding) to
+# serialisation plan.
+_plans = {}
+
+# Name of the CIM version package in the name of a module, e.g. CIM14 in
+# CIM14.CDPSM.Balanced.IEC61970.Core or PyCIM.Slots.CIM15.IEC61970.Core.
+_version_name = re.compile(r"(?:^|\.)(CIM\d+)(?:\.|$)").search
+
+# Types whose string values never need escaping.
+_NUMERIC = frozenset([bool, int, long, float])
+
+# Characters that must be escaped, or encoded, in text and attribute values.
+_cdata = re.compile(r"[&<>\x80-\xff]").search
+_attrib = re.compile(r"[&<>'\"\x80-\xff]").search
+
+# Target of a reference of a record.
+_Reference = namedtuple("_Reference", "UUID")
+
+# Emitter and objects shared with the worker processes of
+# cimwrite_parallel.
+_shared = None
+
+
+def cimwrite(d, source, encoding="utf-8", bulk=False, packageMap=None,
+             nsURI=None, nsPrefix=None):
     """CIM RDF/XML serializer.
 
-    @type d: dict
-    @param d: Map of URIs to CIM objects.
+    Each class is compiled, on first use, into a serialisation plan of
+    rendered tags and the defaults of its attributes (see L{_plan}), so
+    that each object is serialised in a single pass over its plan.
+
+    The CIM namespace is that of the CIM version (e.g. CIM14) of the
+    package map, if given, or otherwise of the classes of the objects,
+    including those of profiles, unless given explicitly.
+
+    Objects may also be given by an iterable, e.g. a generator over the
+    rows of a database query, which is serialised as it is consumed, so
+    that memory use does not grow with the number of objects::
+
+        cimwrite(cimiterparse("model.xml"), "copy.xml")
+
+    @type d: dict or iterable
+    @param d: Map of URIs to CIM objects or an iterable of CIM objects
+    and L{CIMRecord}s.
     @type source: File or file-like object.
     @param source: This object must implement a C{write} method
     that takes an 8-bit string.
     @type encoding: string
     @param encoding: Character encoding defaults to "utf-8", but can also
     be set to "us-ascii".
+    @type bulk: bool
+    @param bulk: Suspend the cyclic garbage collector while writing (see
+    L{bulkmode}).
+    @type packageMap: dict
+    @param packageMap: Map of class name to PyCIM package name used to
+    resolve the classes of records. Defaults to that of the CIM version.
+    @type nsURI: string
+    @param nsURI: CIM namespace URI.
+    @type nsPrefix: string
+    @param nsPrefix: CIM namespace prefix.
     @rtype: bool
     @return: Write success.
     """
     # Start the clock
     t0 = time()
 
-    w = XMLWriter(source, encoding)
+    objects = d.itervalues() if isinstance(d, dict) else d
+
+    emitter = RDFXMLEmitter(source, encoding, packageMap=packageMap,
+                            nsURI=nsURI, nsPrefix=nsPrefix)
+    with bulkmode(bulk):
+        emitter.extend(objects)
+    emitter.close()
+
+    logger.info("%d CIM objects serialised in %.2fs.", emitter.count,
+                time() - t0)
+
+
+def cimwrite_parallel(d, source, encoding="utf-8", workers=None,
+                      chunksize=20000, packageMap=None, nsURI=None,
+                      nsPrefix=None):
+    """ Serialises CIM objects on a pool of processes.
+
+    The objects are partitioned into chunks of consecutive objects. Each
+    worker renders a chunk to a string, using the class plans of
+    L{cimwrite}, and the strings are written under the root element in
+    the order of the chunks, so the output is that of L{cimwrite}. The
+    objects are inherited by the forked workers, not pickled, and are
+    serialised by the calling process where processes are not forked.
+
+    @type d: dict or iterable
+    @param d: Map of URIs to CIM objects or an iterable of CIM objects
+    and L{CIMRecord}s.
+    @type source: File or file-like object or string
+    @param source: Output with a C{write} method that takes an 8-bit
+    string, or the path of a file to be written.
+    @type encoding: string
+    @param encoding: Character encoding of the document.
+    @type workers: int
+    @param workers: Number of worker processes. Defaults to the number of
+    CPUs.
+    @type chunksize: int
+    @param chunksize: Number of objects in each chunk.
+    @type packageMap: dict
+    @param packageMap: Map of class name to PyCIM package name used to
+    resolve the classes of records. Defaults to that of the CIM version.
+    @type nsURI: string
+    @param nsURI: CIM namespace URI. See L{cimwrite}.
+    @type nsPrefix: string
+    @param nsPrefix: CIM namespace prefix.
+    """
+    global _shared
+
+    # Start the clock
+    t0 = time()
+
+    if workers is None:
+        workers = cpu_count()
+
+    objects = d.values() if isinstance(d, dict) else list(d)
+    bounds = [(i, min(i + chunksize, len(objects)))
+              for i in range(0, len(objects), max(1, chunksize))]
 
-    # Write the XML declaration.
-    w.declaration()
+    emitter = RDFXMLEmitter(source, encoding, packageMap=packageMap,
+                            nsURI=nsURI, nsPrefix=nsPrefix)
+    if workers < 2 or len(bounds) < 2 or sys.platform == "win32":
+        emitter.extend(objects)
+    else:
+        # Declare the namespace before the workers are forked.
+        emitter._detect(objects[0])
 
-    # Add a '#' suffix to the CIM namespace URI if not present.
-    nsCIM = nsURI if nsURI[-1] == "#" else nsURI + "#"
+        _shared = (emitter, objects)
+        pool = Pool(min(workers, len(bounds)))
+        try:
+            for text, n in pool.imap(_write_chunk, bounds):
+                emitter._write((text,))
+                emitter.count += n
+        finally:
+            pool.close()
+            pool.join()
+            _shared = None
+    emitter.close()
 
-    # Start the root RDF element and declare namespaces.
-    xmlns = {u"xmlns:%s" % nsPrefixRDF: nsRDF, u"xmlns:%s" % nsPrefix: nsCIM}
-    rdf = w.start(u"%s:RDF" % nsPrefixRDF, xmlns)
+    logger.info("%d CIM objects serialised from %d chunks in %.2fs.",
+                emitter.count, len(bounds), time() - t0)
 
-    # Iterate over all UUID, CIM object pairs in the given dictionary.
-    for uuid, obj in d.iteritems():
-        w.start(u"%s:%s" % (nsPrefix, obj.__class__.__name__),
-                {u"%s:ID" % nsPrefixRDF: obj.UUID})
 
-        mro = obj.__class__.mro()
-        mro.reverse()
+def cimwrite_profiles(d, profiles, encoding="utf-8", bulk=False):
+    """ Serialises CIM objects to the documents of several profiles in a
+    single traversal of the objects::
+
+        from CIM15.CDPSM import Asset, Connectivity, Balanced, Geographical
+
+        cimwrite_profiles(d, [(Asset.packageMap, "asset.xml"),
+                              (Connectivity.packageMap, "conn.xml"),
+                              (Balanced.packageMap, "equip.xml"),
+                              (Geographical.packageMap, "geo.xml")])
+
+    Each object is written to the document of each profile whose package
+    map includes its class, with the properties of the class of the
+    profile. It is defined by C{rdf:ID} in the first of these documents and
+    described by C{rdf:about}, if any of its properties are in the profile,
+    in the others, so that the documents may be read together by
+    L{cimread_many}. The CIM namespace of each document is that of the CIM
+    version of the profile.
+
+    @type d: dict or iterable
+    @param d: Map of URIs to CIM objects or an iterable of CIM objects.
+    @type profiles: list
+    @param profiles: (packageMap, source) tuples of the package map of a
+    profile and the output of its document (see L{RDFXMLEmitter}).
+    @type encoding: string
+    @param encoding: Character encoding of the documents.
+    @type bulk: bool
+    @param bulk: Suspend the cyclic garbage collector while writing (see
+    L{bulkmode}).
+    """
+    # Start the clock
+    t0 = time()
+
+    objects = d.itervalues() if isinstance(d, dict) else d
+
+    emitters = [RDFXMLEmitter(source, encoding, packageMap=packageMap,
+                              profile=True)
+                for packageMap, source in profiles]
+
+    # Map of class to the emitters of the profiles that include it.
+    routes = {}
+
+    n = 0
+    with bulkmode(bulk):
+        for obj in objects:
+            klass = obj.__class__
+            try:
+                route = routes[klass]
+            except KeyError:
+                route = routes[klass] = [e for e in emitters
+                                         if e._project(klass) is not None]
+            about = False
+            for emitter in route:
+                emitter._write(emitter._render((obj,), about))
+                about = True
+            n += 1
+
+    for emitter in emitters:
+        emitter.close()
+
+    logger.info("%d CIM objects serialised to %d profiles in %.2fs.", n,
+                len(emitters), time() - t0)
+
+
+def _write_chunk(bounds):
+    """ Returns the serialisation of a chunk of the shared objects and the
+    number of objects serialised.
+    """
+    emitter, objects = _shared
+    start, end = bounds
+    count = emitter.count
+    text = "".join(emitter._render(objects[start:end]))
+    return text, emitter.count - count
+
+
+class RDFXMLEmitter(object):
+    """ Serialises CIM objects to an RDF/XML document.
+
+    Objects are rendered by the plans of their classes into a buffer that
+    is written to the output in chunks of at least C{buffer_size} bytes.
+    Numeric values, and text without markup or non-ASCII characters, are
+    written without escaping. The document is completed by L{close}, or
+    on leaving the block of a C{with} statement::
+
+        with RDFXMLEmitter("model.xml") as emitter:
+            for row in cursor:
+                emitter.append(to_cim(row))
+
+    Objects are given as CIM objects or as L{CIMRecord}s, whose classes are
+    resolved by name using the package map. Records of C{rdf:about}
+    descriptions are not serialised.
+
+    The CIM namespace is declared when the first object is serialised: by
+    default that of the CIM version of the package map or, if no package
+    map is given, of the class of the object.
+    """
 
-        # Serialise attributes.
-        for klass in mro[2:]: # skip 'object' and 'Element'
-            attrs = [a for a in klass._attrs if a not in klass._enums]
-            for attr in attrs:
+    def __init__(self, source, encoding="utf-8", buffer_size=BUFFER_SIZE,
+                 packageMap=None, profile=False, nsURI=None, nsPrefix=None):
+        """
+        @type source: File or file-like object or string
+        @param source: Output with a C{write} method that takes an 8-bit
+        string, or the path of a file to be written, and closed by
+        L{close}.
+        @type encoding: string
+        @param encoding: Character encoding of the document.
+        @type buffer_size: int
+        @param buffer_size: Number of bytes buffered between writes.
+        @type packageMap: dict
+        @param packageMap: Map of class name to PyCIM package name used to
+        resolve the classes of records. Defaults to that of the CIM
+        version.
+        @type profile: bool
+        @param profile: Serialise objects as instances of the classes of
+        the same name in the package map (e.g. that of a profile), writing
+        only the properties of those classes. Objects of classes that are
+        not in the package map are not serialised.
+        @type nsURI: string
+        @param nsURI: CIM namespace URI.
+        @type nsPrefix: string
+        @param nsPrefix: CIM namespace prefix.
+        """
+        self._owned = not hasattr(source, "write")
+        if self._owned:
+            source = open(source, "w")
+        self.source = source
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+        self.packageMap = packageMap
+
+        # Map of class to the class of the same name in the package map.
+        self._profile = {} if profile else None
+
+        #: Number of objects serialised.
+        self.count = 0
+
+        #: CIM namespace URI and prefix.
+        self.nsURI = nsURI
+        self.nsPrefix = nsPrefix
+
+        # CIM namespace URI with a '#' suffix, set once declared.
+        self.nsCIM = None
+        if packageMap:
+            self._declare(_version(packageMap.itervalues().next()))
+        elif nsURI is not None:
+            self._declare(CIM14 if nsURI.rstrip("#") == CIM14.nsURI else
+                          CIM15)
+
+        # Text in an ASCII compatible encoding is written unchanged.
+        try:
+            plain = u"<&'\"/>".encode(encoding) == "<&'\"/>"
+        except (LookupError, UnicodeError):
+            plain = False
+        self._plain = plain
+
+        self._buffer = []
+        self._size = 0
+        self._empty = True
+
+        self._rdf = escape_cdata(u"%s:RDF" % nsPrefixRDF, encoding)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # The root element is left open if the block raised an exception.
+        if exc_type is None:
+            self.close()
+        elif self._owned:
+            self.source.close()
+
+    def append(self, obj):
+        """ Serialises a CIM object or record.
+        """
+        self.extend((obj,))
+
+    def extend(self, objects):
+        """ Serialises each CIM object or record of the given iterable.
+        """
+        self._write(self._render(objects))
+
+    def _render(self, objects, about=False):
+        """ Generates the serialisation of each object of the given iterable,
+        or if C{about} the C{rdf:about} descriptions of those with
+        properties to be written.
+        """
+        encoding = self.encoding
+        nsPrefix = self.nsPrefix
+        nsCIM = self.nsCIM
+        plain = self._plain
+        plans = _plans
+        profile = self._profile
+
+        for obj in objects:
+            if nsCIM is None:
+                self._detect(obj)
+                nsPrefix = self.nsPrefix
+                nsCIM = self.nsCIM
+
+            klass = obj.__class__
+            if klass is CIMRecord:
+                obj = self._view(obj)
+                if obj is None:
+                    continue
+                klass = obj.klass
+            if profile is not None:
+                try:
+                    klass = profile[klass]
+                except KeyError:
+                    klass = self._project(klass)
+                if klass is None:
+                    continue
+            try:
+                plan = plans[(klass, nsPrefix, nsCIM, encoding)]
+            except KeyError:
+                plan = _plan(klass, nsPrefix, nsCIM, encoding)
+            start, described, attrs, enums, refs, end = plan
+            if about:
+                start = described
+
+            out = []
+
+            # Serialise attributes.
+            for attr, default, open_tag, close_tag, empty in attrs:
+                val = getattr(obj, attr)
+                if val != default:
+                    text = str(val)
+                    if not text:
+                        out.append(empty)
+                    elif plain and (val.__class__ in _NUMERIC or
+                                    not _cdata(text)):
+                        out.append(open_tag + text + close_tag)
+                    else:
+                        out.append(open_tag + escape_cdata(text, encoding) +
+                                   close_tag)
+
+            # Serialise enumeration data-types.
+            for attr, resource, dt, elements in enums:
                 val = getattr(obj, attr)
-                if val != klass._defaults[attr]:
-                    w.element(u"%s:%s.%s" % (nsPrefix, klass.__name__, attr),
-                              str(val))
-
-        # Serialise enumeration data-types.
-        for klass in mro[2:]: # skip 'object' and 'Element'
-            enums = [a for a in klass._attrs if a in klass._enums]
-            for enum in enums:
-                val = getattr(obj, enum)
-                dt = klass._enums[enum]
-                w.element(u"%s:%s.%s" % (nsPrefix, klass.__name__, enum),
-                          attrib={u"%s:resource" % nsPrefixRDF:
-                                  u"%s%s.%s" % (nsCIM, dt, val)})
-
-        # Serialise references.
-        for klass in mro[2:]: # skip 'object' and 'Element'
+                try:
+                    out.append(elements[val])
+                except KeyError:
+                    element = elements[val] = resource + escape_attrib(
+                        u"%s%s.%s" % (nsCIM, dt, val), encoding) + "\" />"
+                    out.append(element)
+
+            # Serialise references.
             # FIXME: serialise 'many' references.
-            refs = [r for r in klass._refs if r not in klass._many_refs]
-            for ref in refs:
+            for ref, resource in refs:
                 val = getattr(obj, ref)
                 if val is not None:
-                    w.element(u"%s:%s.%s" % (nsPrefix, klass.__name__, ref),
-                          attrib={u"%s:resource" % nsPrefixRDF:
-                                  u"#%s" % val.UUID})
+                    uuid = val.UUID
+                    if plain and uuid.__class__ is str and not _attrib(uuid):
+                        out.append(resource + "#" + uuid + "\" />")
+                    else:
+                        uuid = escape_attrib(u"#%s" % uuid, encoding)
+                        out.append(resource + uuid + "\" />")
+
+            uuid = obj.UUID
+            if not plain or uuid.__class__ is not str or _attrib(uuid):
+                uuid = escape_attrib(uuid, encoding)
+
+            if out:
+                self.count += 1
+                yield start + uuid + "\">" + "".join(out) + end
+            elif not about:
+                self.count += 1
+                yield start + uuid + "\" />"
+
+    def _write(self, texts):
+        """ Buffers the given serialised objects, writing the buffer to the
+        output once it holds C{buffer_size} bytes.
+        """
+        buffer_size = self.buffer_size
+        buf = self._buffer
+        size = self._size
+        empty = self._empty
+
+        for text in texts:
+            if empty:
+                # Close the start tag of the root element.
+                text = self._header() + ">" + text
+                empty = False
+            buf.append(text)
+            size += len(text)
+            if size >= buffer_size:
+                self.source.write("".join(buf))
+                del buf[:]
+                size = 0
+
+        self._size = size
+        self._empty = empty
+
+    def close(self):
+        """ Closes the root element, writes any buffered output and flushes
+        the output stream.
+        """
+        # Close the root RDF element.
+        if self._empty:
+            if self.nsCIM is None:
+                self._declare(CIM15)
+            self._buffer.append(self._header() + " />")
+        else:
+            self._buffer.append("</%s>" % self._rdf)
+
+        self.source.write("".join(self._buffer))
+        self._buffer = []
+        self._size = 0
+
+        # Flush the output stream.
+        if hasattr(self.source, "flush"):
+            self.source.flush()
+        if self._owned:
+            self.source.close()
+
+    def _header(self):
+        """ Returns the XML declaration and the start tag of the root
+        element, without its closing bracket.
+        """
+        encoding = self.encoding
+
+        # Write the XML declaration.
+        if encoding == "us-ascii" or encoding == "utf-8":
+            header = ["<?xml version='1.0'?>\n"]
+        else:
+            header = ["<?xml version='1.0' encoding='%s'?>\n" % encoding]
+
+        # Start the root RDF element and declare namespaces.
+        xmlns = {u"xmlns:%s" % nsPrefixRDF: nsRDF,
+                 u"xmlns:%s" % self.nsPrefix: self.nsCIM}
+        header.append("<%s" % self._rdf)
+        for k, v in sorted(xmlns.items()):
+            header.append(" %s=\"%s\"" % (escape_cdata(k, encoding),
+                                          escape_attrib(v, encoding)))
+        return "".join(header)
+
+    def _declare(self, version):
+        """ Declares the namespace of the given CIM version package (e.g.
+        CIM14), in place of the URI and prefix not given explicitly.
+        """
+        if self.nsURI is None:
+            self.nsURI = version.nsURI
+        if self.nsPrefix is None:
+            self.nsPrefix = version.nsPrefix
+        if self.packageMap is None:
+            self.packageMap = version.packageMap
+
+        # Add a '#' suffix to the CIM namespace URI if not present.
+        nsURI = self.nsURI
+        self.nsCIM = nsURI if nsURI[-1] == "#" else nsURI + "#"
+
+    def _detect(self, obj):
+        """ Declares the namespace of the CIM version of the given object.
+        Records are resolved using the package map of CIM15 if no other is
+        given.
+        """
+        if self.nsCIM is None:
+            if obj.__class__ is CIMRecord:
+                self._declare(CIM15)
+            else:
+                self._declare(_version(obj.__class__.__module__))
+
+    def _view(self, record):
+        """ Returns a view of a record for the plan of its class or None
+        if the class can not be resolved or the record is a description.
+        """
+        name, uuid, attributes, references, described = record
+        if described:
+            logger.error("Description of '%s' not serialised.", uuid)
+            return None
+        klass = get_registry(self.packageMap, self.nsURI).get_class(name)
+        if klass is None:
+            logger.error("Unable to locate module for: %s (%s)", name, uuid)
+            return None
+        return _RecordView(klass, record)
+
+    def _project(self, klass):
+        """ Returns the class of the same name as the given class in the
+        package map, or None if there is no such class.
+        """
+        registry = get_registry(self.packageMap, self.nsURI)
+        projected = self._profile[klass] = registry.get_class(klass.__name__)
+        return projected
+
+
+class _RecordView(object):
+    """ Presents the attribute values and references of a record as those
+    of a CIM object of the given class. Unset attributes take their
+    default values and unset references are None.
+    """
+
+    def __init__(self, klass, record):
+        self.__dict__.update(record.attributes)
+        for ref, uuid in record.references:
+            self.__dict__[ref] = _Reference(uuid)
+        self.klass = klass
+        self.UUID = record.uuid
+
+    def __getattr__(self, name):
+        return self.klass._meta.defaults.get(name)
+
+
+def _version(name):
+    """ Returns the CIM version package (e.g. CIM14) of the named module,
+    or CIM15 if the module is not in a CIM version package.
+    """
+    match = _version_name(name)
+    if match is None:
+        logger.warning("Could not detect CIM version of %s. Using CIM15.",
+                       name)
+        return CIM15
+    return __import__(match.group(1))
+
+
+def _plan(klass, nsPrefix, nsCIM, encoding):
+    """ Compiles the serialisation plan of a class: the rendered start tags
+    of its objects, up to the value of C{rdf:ID} and of C{rdf:about}, and
+    end tag and, in the order in which they are written, its attributes as
+    (name, default, start tag, end tag, empty element) tuples, its
+    enumerations as (name, start of element, enumeration type, map of value
+    to element) tuples and its single valued references as (name, start of
+    element) tuples.
+    """
+    meta = klass._meta
+    owners = meta.owners
+
+    def tag(name):
+        return escape_cdata(u"%s:%s.%s" % (nsPrefix, owners[name], name),
+                            encoding)
+
+    resource = escape_cdata(u"%s:resource" % nsPrefixRDF, encoding)
 
-        w.end()
+    attrs = []
+    enums = []
+    for attr in meta.attrs:
+        if owners[attr] == "Element":
+            continue
+        t = tag(attr)
+        if attr in meta.enums:
+            enums.append((attr, "<%s %s=\"" % (t, resource),
+                          meta.enums[attr], {}))
+        else:
+            attrs.append((attr, meta.defaults[attr], "<%s>" % t,
+                          "</%s>" % t, "<%s />" % t))
 
-    # Close the root RDF element.
-    w.close(rdf)
+    refs = [(ref, "<%s %s=\"" % (tag(ref), resource))
+            for ref in meta.refs if owners[ref] != "Element"]
 
-    # Flush the output stream.
-    w.flush()
+    t = escape_cdata(u"%s:%s" % (nsPrefix, klass.__name__), encoding)
+    start = "<%s %s=\"" % (t, escape_cdata(u"%s:ID" % nsPrefixRDF, encoding))
+    about = "<%s %s=\"#" % (t, escape_cdata(u"%s:about" % nsPrefixRDF,
+                                            encoding))
 
-    logger.info("%d CIM objects serialised in %.2fs.", len(d), time() - t0)
+    plan = _plans[(klass, nsPrefix, nsCIM, encoding)] = \
+        (start, about, attrs, enums, refs, "</%s>" % t)
+    return plan
 
 
 if __name__ == "__main__":
@@ -0,0 +1,161 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+
+import re
+import sys
+
+from types import FunctionType, ModuleType
+
+#: Prefix of the names of the modules in which slotted classes are defined.
+PREFIX = __name__ + "."
+
+# Map of CIM class to slotted class.
+_classes = {}
+
+# Map of module name to the globals of the functions of slotted classes.
+_globals = {}
+
+_identifier = re.compile(r"^[A-Za-z_]\w*$")
+
+
+def slotted(klass):
+    """ Returns a variant of the given CIM class with C{__slots__}.
+
+    The slotted class has the same name, attributes, properties and methods
+    as the original class, and derives from the slotted variants of its
+    bases, but its instances have no C{__dict__}. Each attribute, and the
+    private attribute of each reference, is held in a slot. The class is
+    defined in a module of the same name prefixed by L{PREFIX} (e.g.
+    C{PyCIM.Slots.CIM15.IEC61970.Core.Terminal}), so that its instances
+    may be pickled.
+
+    @param klass: CIM class (e.g. C{CIM15.IEC61970.Core.Terminal}).
+    @return: Slotted CIM class.
+    """
+    try:
+        return _classes[klass]
+    except KeyError:
+        pass
+
+    if not hasattr(klass, "_attrs"):
+        raise TypeError("%s is not a CIM class" % klass.__name__)
+
+    bases = tuple([b if b is object else slotted(b) for b in klass.__bases__])
+
+    # The instance attributes set by the constructor of the class.
+    names = list(klass.__dict__.get("_attrs", ()))
+    for ref in klass.__dict__.get("_refs", ()):
+        if isinstance(klass.__dict__.get(ref), property):
+            names.append("_" + ref)
+        else:
+            names.append(ref)
+    slots = []
+    for name in names:
+        if _identifier.match(name) and name not in slots:
+            slots.append(name)
+
+    g = _module_globals(klass.__module__)
+
+    ns = {"__slots__": tuple(slots), "__module__": PREFIX + klass.__module__}
+    for name, value in klass.__dict__.iteritems():
+        if name in ("__dict__", "__weakref__", "__module__") or name in slots:
+            continue
+        ns[name] = _rebind(value, g)
+
+    twin = _classes[klass] = type(klass.__name__, bases, ns)
+
+    # Methods refer to the class (e.g. super(Terminal, self)) and its bases
+    # by the names in their module.
+    for name, value in sys.modules[klass.__module__].__dict__.iteritems():
+        if isinstance(value, type) and value in _classes:
+            g[name] = _classes[value]
+
+    # The module is created before the class is set on the package, which
+    # has an attribute of the same name.
+    module = _module(ns["__module__"])
+    setattr(module, klass.__name__, twin)
+    setattr(_module(ns["__module__"].rsplit(".", 1)[0]), klass.__name__, twin)
+
+    return twin
+
+
+def slotted_map(packageMap):
+    """ Returns a package map of the slotted variants of the classes in the
+    given package map, with which L{cimread} reads slotted CIM objects::
+
+        from CIM15 import nsURI, packageMap
+        d = cimread("model.xml", slotted_map(packageMap), nsURI)
+
+    @type packageMap: dict
+    @param packageMap: Map of class name to PyCIM package name.
+    @rtype: dict
+    @return: Map of class name to slotted package name.
+    """
+    slottedMap = {}
+    for name, mname in packageMap.iteritems():
+        module = __import__(mname, globals(), locals(), [name], 0)
+        twin = slotted(getattr(module, name))
+        slottedMap[name] = PREFIX + mname
+        setattr(_module(PREFIX + mname), name, twin)
+    return slottedMap
+
+
+def _module_globals(mname):
+    try:
+        return _globals[mname]
+    except KeyError:
+        g = _globals[mname] = dict(sys.modules[mname].__dict__)
+        return g
+
+
+def _rebind(value, g):
+    """ Returns a copy of the given function, or the functions of the given
+    property or method, with the given globals. Functions defined in other
+    modules (e.g. those shared by the Element classes) are not copied.
+    """
+    if isinstance(value, FunctionType):
+        if value.func_globals.get("__name__") != g.get("__name__"):
+            return value
+        f = FunctionType(value.func_code, g, value.func_name,
+                         value.func_defaults, value.func_closure)
+        f.__doc__ = value.__doc__
+        f.__dict__.update(value.__dict__)
+        return f
+    elif isinstance(value, property):
+        return property(*[_rebind(f, g) if f is not None else None
+                          for f in (value.fget, value.fset, value.fdel)],
+                        doc=value.__doc__)
+    elif isinstance(value, (staticmethod, classmethod)):
+        return type(value)(_rebind(value.__func__, g))
+    return value
+
+
+def _module(name):
+    """ Returns the module of the given name, creating it and its parents
+    if necessary.
+    """
+    try:
+        return sys.modules[name]
+    except KeyError:
+        module = sys.modules[name] = ModuleType(name)
+        parent, child = name.rsplit(".", 1)
+        setattr(_module(parent), child, module)
+        return module
@@ -0,0 +1,115 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+import unittest
+
+from CIM15.IEC61970.Core import ConnectivityNode, Terminal, BaseVoltage
+from CIM15.IEC61970.Protection import ProtectionEquipment
+from CIM15.IEC61970.Wires import Breaker
+
+from PyCIM import BulkLinker
+from PyCIM.BulkLinker import _describe
+
+
+class BulkLinkerTestCase(unittest.TestCase):
+    """Test bulk binding of references.
+    """
+
+    def testSingle(self):
+        """Test binding of references from the single valued end.
+        """
+        n1 = ConnectivityNode()
+        n2 = ConnectivityNode()
+        terminals = [Terminal() for _ in range(10)]
+
+        with BulkLinker() as linker:
+            for t in terminals:
+                linker.link(t, "ConnectivityNode", n1)
+            linker.link(terminals[0], "ConnectivityNode", n2)
+            linker.link(terminals[1], "ConnectivityNode", n1)
+
+        self.assertEqual(n1.Terminals, terminals[1:])
+        self.assertEqual(n2.Terminals, terminals[:1])
+        self.assertTrue(terminals[0].ConnectivityNode is n2)
+
+    def testMany(self):
+        """Test binding of references from the many valued end.
+        """
+        bv1 = BaseVoltage()
+        bv2 = BaseVoltage()
+        breakers = [Breaker() for _ in range(10)]
+
+        linker = BulkLinker()
+        for b in breakers:
+            linker.link(bv1, "ConductingEquipment", b)
+            linker.link(b, "BaseVoltage", bv1)
+        linker.link(bv2, "ConductingEquipment", breakers[0])
+        linker.finish()
+
+        self.assertEqual(bv1.ConductingEquipment, breakers[1:])
+        self.assertEqual(bv2.ConductingEquipment, breakers[:1])
+        self.assertTrue(breakers[0].BaseVoltage is bv2)
+
+    def testManyToMany(self):
+        """Test binding of many-to-many references.
+        """
+        pe = ProtectionEquipment()
+        breakers = [Breaker() for _ in range(3)]
+
+        with BulkLinker() as linker:
+            for b in breakers:
+                linker.link(pe, "ConductingEquipments", b)
+                linker.link(b, "ProtectionEquipments", pe)
+
+        self.assertEqual(pe.ConductingEquipments, breakers)
+        for b in breakers:
+            self.assertEqual(b.ProtectionEquipments, [pe])
+
+    def testInverses(self):
+        """Test that inverses are taken from the class metadata.
+        """
+        self.assertEqual(Terminal._meta.inverses["ConnectivityNode"],
+                         "Terminals")
+        self.assertEqual(ConnectivityNode._meta.inverses["Terminals"],
+                         "ConnectivityNode")
+
+        # A setter wrapped by another function still links in bulk.
+        class WrappedTerminal(Terminal):
+            def setConnectivityNode(self, value):
+                Terminal.ConnectivityNode.fset(self, value)
+            ConnectivityNode = property(Terminal.ConnectivityNode.fget,
+                                        setConnectivityNode)
+
+        self.assertEqual(_describe(WrappedTerminal, "ConnectivityNode",
+                                   ConnectivityNode),
+                         ("_ConnectivityNode", False, "_Terminals", True))
+
+        n = ConnectivityNode()
+        terminals = [WrappedTerminal() for _ in range(3)]
+        with BulkLinker() as linker:
+            for t in terminals:
+                linker.link(t, "ConnectivityNode", n)
+
+        self.assertEqual(n.Terminals, terminals)
+        for t in terminals:
+            self.assertTrue(t.ConnectivityNode is n)
+
+
+if __name__ == "__main__":
+    unittest.main()
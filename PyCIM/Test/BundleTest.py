@@ -0,0 +1,74 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from os.path import join
+from zipfile import ZipFile
+
+from PyCIM import cimbundle
+
+
+class BundleTestCase(unittest.TestCase):
+    """Test bundling of compiled CIM packages.
+    """
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testBundle(self):
+        """Test importing a profile from a bundle.
+        """
+        path = join(self.tmpdir, "balanced.zip")
+        n = cimbundle("CIM14.CDPSM.Balanced", path, docstrings=False)
+
+        names = ZipFile(path).namelist()
+        self.assertEqual(len(names), n)
+        self.assertTrue("CIM14/Element.pyc" in names)
+        self.assertTrue("PyCIM/Element.pyc" in names)
+        self.assertTrue("CIM14/CDPSM/Balanced/IEC61970/Core/Terminal.pyc"
+                        in names)
+        self.assertFalse([name for name in names
+                          if name.startswith("CIM14/CDPSM/Unbalanced/")])
+
+        # Import the profile in a new interpreter, without the source tree.
+        out = subprocess.check_output([sys.executable, "-c",
+            "import sys; sys.path[0] = %r\n"
+            "from CIM14.CDPSM.Balanced.IEC61970.Core import Terminal\n"
+            "print Terminal.__module__, Terminal.__doc__, "
+            "Terminal(sequenceNumber=1).sequenceNumber\n"
+            "print sys.modules[Terminal.__module__].__file__" % path],
+            cwd=self.tmpdir)
+
+        self.assertEqual(out.splitlines(), [
+            "CIM14.CDPSM.Balanced.IEC61970.Core.Terminal None 1",
+            join(path, "CIM14", "CDPSM", "Balanced", "IEC61970", "Core",
+                 "Terminal.pyc")])
+
+
+if __name__ == "__main__":
+    unittest.main()
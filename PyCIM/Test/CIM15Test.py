@@ -159,6 +159,115 @@ class CIMTestCase(unittest.TestCase):
         self.assertEqual(te3.PowerTransformer, None)
 
 
+    def testManyToMany(self):
+        """Test many-to-many bidirectional references.
+        """
+        pe1 = ProtectionEquipment()
+        pe2 = ProtectionEquipment()
+        l1 = ACLineSegment(ProtectionEquipments=[pe1])
+        l2 = ACLineSegment()
+        pe1.addConductingEquipments(l2, l2)
+
+        self.assertEqual(pe1.ConductingEquipments, [l1, l2])
+        self.assertEqual(l2.ProtectionEquipments, [pe1])
+
+        l1.setProtectionEquipments([pe2])
+
+        self.assertEqual(pe1.ConductingEquipments, [l2])
+        self.assertEqual(pe2.ConductingEquipments, [l1])
+
+
+    def testLargeAssociation(self):
+        """Test references to an object with many associated objects.
+        """
+        cn = ConnectivityNode()
+        terminals = [Terminal(ConnectivityNode=cn) for _ in range(100)]
+
+        self.assertEqual(len(cn.Terminals), 100)
+        self.assertEqual(cn.Terminals[0], terminals[0])
+        self.assertEqual(cn.Terminals[-1], terminals[-1])
+
+        for t in terminals[10:90]:
+            t.ConnectivityNode = None
+
+        self.assertEqual(cn.Terminals, terminals[:10] + terminals[90:])
+        self.assertFalse(terminals[50] in cn.Terminals)
+        self.assertEqual(cn.Terminals.index(terminals[95]), 15)
+
+        cn.Terminals = cn.Terminals
+        self.assertEqual(len(cn.Terminals), 20)
+        self.assertTrue(terminals[95].ConnectivityNode is cn)
+
+    def testNew(self):
+        """Test construction without calling the default property setters.
+        """
+        cn = ConnectivityNode()
+        t1 = Terminal(UUID="_1", phases="AB", ConnectivityNode=cn)
+        t2 = Terminal.new("_1", phases="AB", ConnectivityNode=cn)
+
+        self.assertEqual(t1.__dict__, t2.__dict__)
+        self.assertEqual(cn.Terminals, [t1, t2])
+        self.assertEqual(Terminal.new().__dict__, Terminal().__dict__)
+        self.assertRaises(TypeError, Terminal.new, "_2", foo=None)
+
+    def testMeta(self):
+        """Test the flattened metadata of a class.
+        """
+        meta = Breaker._meta
+
+        self.assertTrue(Breaker()._meta is meta)
+        self.assertFalse(Terminal._meta is meta)
+        self.assertEqual(meta.attrs[:3], ["UUID", "mRID", "aliasName"])
+        self.assertEqual(meta.owners["UUID"], "Element")
+        self.assertEqual(meta.owners["normalOpen"], "Switch")
+        self.assertEqual(meta.owners["ProtectionEquipments"], "ProtectedSwitch")
+        self.assertEqual(meta.types["ratedCurrent"], float)
+        self.assertEqual(meta.defaults["normalOpen"], False)
+        self.assertTrue("BaseVoltage" in meta.refs)
+        self.assertEqual(meta.many_refs.count("ProtectionEquipments"), 1)
+        self.assertFalse(set(meta.refs) & set(meta.many_refs))
+        self.assertEqual(Terminal._meta.enums["phases"], "PhaseCode")
+
+    def testLazyImport(self):
+        """Test that package classes and subpackages are imported on access.
+        """
+        import CIM15
+        from CIM15.Element import LazyModule
+        from CIM15.IEC61970.Wires.Breaker import Breaker
+
+        self.assertTrue(isinstance(CIM15.IEC61970, LazyModule))
+        self.assertTrue(CIM15.IEC61970.Wires.Breaker is Breaker)
+        self.assertTrue("Breaker" in dir(CIM15.IEC61970.Wires))
+        self.assertTrue("Breaker" in CIM15.IEC61970.Wires.__all__)
+        self.assertRaises(AttributeError, getattr, CIM15.IEC61970, "Foo")
+
+    def testEmptyAssociation(self):
+        """Test that unset many-valued associations share empty storage.
+        """
+        cn1 = ConnectivityNode()
+        cn2 = ConnectivityNode()
+
+        self.assertEqual(cn1.Terminals, [])
+        self.assertTrue(cn1.Terminals is cn2.Terminals)
+        self.assertRaises(TypeError, cn1.Terminals.append, Terminal())
+
+        t = Terminal(ConnectivityNode=cn1)
+        self.assertEqual(cn1.Terminals, [t])
+        self.assertEqual(cn2.Terminals, [])
+        self.assertFalse(cn1.Terminals is cn2.Terminals)
+
+        # The storage is shared with the classes of other versions and
+        # profiles.
+        from CIM14.Element import RefList as CIM14RefList
+        from CIM14.CDPSM.Balanced.IEC61970.Core import BaseVoltage
+        from CIM15.Element import RefList
+        self.assertTrue(cn1.Terminals.__class__ is RefList)
+        self.assertTrue(CIM14RefList is RefList)
+        self.assertTrue(BaseVoltage().VoltageLevel is cn2.Terminals)
+        self.assertTrue(BaseVoltage._meta.__class__ is
+                        ConnectivityNode._meta.__class__)
+
+
 #    def testManyToMany(self):
 #        """Test many-to-many bidirectional references.
 #        """
@@ -0,0 +1,158 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import re
+import unittest
+
+from StringIO import StringIO
+from os.path import dirname, join
+from sys import getsizeof
+
+from PyCIM import cimread, cimwrite
+from PyCIM.Columnar import columnar, numpy
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+
+def _descriptions(d):
+    """ Returns the sorted RDF/XML descriptions of the given objects.
+    """
+    out = StringIO()
+    cimwrite(d, out)
+    return sorted(re.findall(r"<cim:(\w+) rdf:ID=.*?</cim:\1>",
+                             out.getvalue()))
+
+
+def _size(objs):
+    """ Returns the number of bytes of the given objects, the associations
+    of their owners and the values of their attributes.
+    """
+    n = 0
+    owners = {}
+    for obj in objs:
+        n += getsizeof(obj) + getsizeof(obj.__dict__)
+        n += sum([getsizeof(getattr(obj, name)) for name in obj._meta.attrs])
+        owners[id(obj.Location)] = obj.Location._PositionPoints
+    return n + sum([getsizeof(points) for points in owners.itervalues()])
+
+
+def _table_size(table):
+    """ Returns the number of bytes of a table of columns, its blocks and
+    the objects in its columns.
+    """
+    n = getsizeof(table) + getsizeof(table.__dict__) + \
+        getsizeof(table.owners) + table.offsets.nbytes
+    for column in table.columns.itervalues():
+        n += column.nbytes
+        if column.dtype == object:
+            n += sum([getsizeof(value) for value in column])
+    return n + sum([getsizeof(block) for block in table.blocks()])
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class ColumnarTestCase(unittest.TestCase):
+    """Test columnar storage of CIM objects.
+    """
+
+    def setUp(self):
+        self.d = cimread(RDFXML_FILE)
+        self.expected = _descriptions(self.d)
+        self.n = len(self.d)
+        self.size = _size([obj for obj in self.d.itervalues()
+                           if obj.__class__.__name__ == "PositionPoint"])
+        self.store = columnar(self.d)
+
+    def testColumns(self):
+        """Test the columns and views of position points.
+        """
+        self.assertEqual(len(self.store), 1302)
+        self.assertEqual(len(self.d) + len(self.store), self.n)
+        self.assertFalse([obj for obj in self.d.itervalues()
+                          if obj.__class__.__name__ == "PositionPoint"])
+
+        self.assertEqual(len(self.store.tables), 1)
+        table = self.store.tables[0]
+        location = table.owners[0]
+        block = location.PositionPoints
+        self.assertTrue(block.table is table)
+        self.assertEqual(len(table.blocks()), len(table.owners))
+
+        points = list(location.PositionPoints)
+        self.assertEqual(len(points), len(block))
+        self.assertEqual(block.column("sequenceNumber").dtype, numpy.int64)
+        self.assertEqual(list(block.column("sequenceNumber")),
+                         [p.sequenceNumber for p in points])
+        self.assertEqual(table.column("xPosition").dtype, numpy.float64)
+        self.assertEqual(table.column("zPosition").dtype, object)
+        self.assertEqual([repr(x) for x in block.column("xPosition")],
+                         [p.xPosition for p in points])
+
+        p = points[0]
+        self.assertEqual(p.__class__.__name__, "PositionPoint")
+        self.assertTrue(p.Location is location)
+        self.assertTrue(p in block)
+        self.assertEqual(block[0], p)
+        self.assertTrue(isinstance(p.sequenceNumber, int))
+        self.assertTrue(isinstance(p.xPosition, str))
+
+        p.zPosition = "1.0"
+        self.assertEqual(block[0].zPosition, "1.0")
+        self.assertRaises(TypeError, setattr, p, "Location", None)
+        self.assertRaises(TypeError, block.append, p)
+
+    def testNumbers(self):
+        """Test setting string attributes held in numeric columns.
+        """
+        table = self.store.tables[0]
+        p = table.owners[0].PositionPoints[0]
+
+        p.xPosition = "2.5"
+        self.assertEqual(p.xPosition, "2.5")
+        self.assertEqual(table.column("xPosition").dtype, numpy.float64)
+
+        x = list(table.column("xPosition"))
+        p.xPosition = "2.50"
+        self.assertEqual(p.xPosition, "2.50")
+        self.assertEqual(table.column("xPosition").dtype, object)
+        self.assertEqual(list(table.column("xPosition"))[1:],
+                         [repr(v) for v in x[1:]])
+
+    def testMemory(self):
+        """Test that the columns are smaller than the objects they replace.
+        """
+        size = sum([_table_size(table) for table in self.store.tables])
+        self.assertTrue(size < self.size / 2, (size, self.size))
+
+    def testWrite(self):
+        """Test writing and restoring stored objects.
+        """
+        d = dict(self.d)
+        d.update(self.store.views())
+        self.assertEqual(_descriptions(d), self.expected)
+
+        self.store.restore(self.d)
+        self.assertEqual(len(self.d), self.n)
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(_descriptions(self.d), self.expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
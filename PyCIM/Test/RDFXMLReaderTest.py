@@ -19,11 +19,21 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import bz2
+import gzip
+import logging
+import os
+import shutil
+import tempfile
+import threading
 import unittest
+import zipfile
 
-from os.path import dirname, join
+from cStringIO import StringIO
+from os.path import basename, dirname, join
 
-from PyCIM import cimread, RDFXMLReader
+from PyCIM import cimread, cimread_many, cimread_parallel, cimiterparse, \
+    cimapply, RDFXMLReader
 
 from CIM15 import nsURI as nsURICIM15, packageMap as packageMapCIM15
 from CIM15.CDPSM.Asset import packageMap as assetMap
@@ -39,6 +49,72 @@ CONN_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_CONN.xml")
 EQUIP_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_EQUIP.xml")
 GEO_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_GEO.xml")
 
+def _feed(fd, path):
+    """Writes the contents of a file to a file descriptor and closes it.
+    """
+    f = os.fdopen(fd, "wb")
+    try:
+        f.write(open(path, "rb").read())
+    finally:
+        f.close()
+
+
+NESTED_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
+    xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+"""
+
+NESTED_NODE = """  <cim:ConnectivityNode rdf:ID="_node%d">
+    <cim:ConnectivityNode.Terminals>
+      <cim:Terminal rdf:ID="_terminal%da" />
+      <cim:Terminal rdf:ID="_terminal%db" />
+    </cim:ConnectivityNode.Terminals>
+  </cim:ConnectivityNode>
+"""
+
+DANGLING_MODEL = """<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
+    xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">
+  <cim:ConnectivityNode rdf:ID="_node" />
+  <cim:Terminal rdf:ID="_t1">
+    <cim:Terminal.ConnectivityNode rdf:resource="#_node" />
+  </cim:Terminal>
+  <cim:Terminal rdf:ID="_t2">
+    <cim:Terminal.ConnectivityNode rdf:resource="#_missing" />
+  </cim:Terminal>
+</rdf:RDF>
+"""
+
+DIFFERENCE_MODEL = """<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#"
+    xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+    xmlns:dm="http://iec.ch/2002/schema/CIM_difference_model#">
+  <dm:DifferenceModel rdf:about="#_diff">
+    <dm:forwardDifferences rdf:parseType="Statements">
+      <rdf:Description rdf:about="#_6697f8dc7c74437983801f587d56dc1">
+        <cim:EnergyConsumer.customerCount>20</cim:EnergyConsumer.customerCount>
+      </rdf:Description>
+      <cim:ConnectivityNode rdf:about="#_node">
+        <cim:IdentifiedObject.name>New node</cim:IdentifiedObject.name>
+      </cim:ConnectivityNode>
+      <rdf:Description rdf:about="#_ec779cc5cbc840d5bfbf3d7ed962525">
+        <cim:Terminal.ConnectivityNode rdf:resource="#_node"/>
+      </rdf:Description>
+    </dm:forwardDifferences>
+    <dm:reverseDifferences rdf:parseType="Statements">
+      <rdf:Description rdf:about="#_6697f8dc7c74437983801f587d56dc1">
+        <cim:EnergyConsumer.customerCount>15</cim:EnergyConsumer.customerCount>
+        <cim:PowerSystemResource.Location rdf:resource="#_aa85c78ae6d34d89a1d4872236ae6149"/>
+      </rdf:Description>
+      <cim:Location rdf:about="#_aa85c78ae6d34d89a1d4872236ae6149"/>
+      <rdf:Description rdf:about="#_ec779cc5cbc840d5bfbf3d7ed962525">
+        <cim:Terminal.ConnectivityNode rdf:resource="#_c7c0a7ce29de4d73bf6413f55538af2d"/>
+      </rdf:Description>
+    </dm:reverseDifferences>
+  </dm:DifferenceModel>
+</rdf:RDF>
+"""
+
 
 class RDFXMLReaderTestCase(unittest.TestCase):
     """Test CIM RDF/XML parsing.
@@ -51,6 +127,95 @@ class RDFXMLReaderTestCase(unittest.TestCase):
 
         self.assertEqual(len(d), 5894)
 
+    def testStream(self):
+        """Test CIM RDF/XML parsing from a non-seekable stream.
+        """
+        class Stream(object):
+            def __init__(self, f):
+                self.read = f.read
+
+        f = open(RDFXML_FILE, "rb")
+        try:
+            d = cimread(Stream(f))
+        finally:
+            f.close()
+
+        self.assertEqual(len(d), 5894)
+
+        # A pipe has tell and seek methods which raise errors.
+        r, w = os.pipe()
+        writer = threading.Thread(target=_feed, args=(w, RDFXML_FILE))
+        writer.start()
+        f = os.fdopen(r, "rb")
+        try:
+            d = cimread(f)
+        finally:
+            f.close()
+            writer.join()
+
+        self.assertEqual(len(d), 5894)
+
+    def testCompressed(self):
+        """Test CIM RDF/XML parsing of compressed files and archives.
+        """
+        data = open(RDFXML_FILE, "rb").read()
+        tmp = tempfile.mkdtemp()
+        try:
+            # Stream of two gzip members.
+            buf = StringIO()
+            for part in (data[:len(data) // 2], data[len(data) // 2:]):
+                gz = gzip.GzipFile(fileobj=buf, mode="wb")
+                gz.write(part)
+                gz.close()
+            d = cimread(StringIO(buf.getvalue()))
+            self.assertEqual(len(d), 5894)
+
+            path = join(tmp, "combined.xml.bz2")
+            f = open(path, "wb")
+            f.write(bz2.compress(data))
+            f.close()
+            self.assertEqual(RDFXMLReader.xmlns(path)["cim"],
+                             nsURICIM15 + "#")
+            self.assertEqual(len(cimread(path)), 5894)
+            self.assertEqual(len(cimread_parallel(path, workers=2)), 5894)
+
+            # Files opened by the reader are closed once read.
+            f = RDFXMLReader._open(path)
+            f.read()
+            self.assertTrue(f._f.closed)
+            self.assertEqual(f.read(), "")
+
+            # Profile documents of one model in an archive.
+            path = join(tmp, "profiles.zip")
+            z = zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED)
+            for name in (ASSET_FILE, CONN_FILE, EQUIP_FILE, GEO_FILE):
+                z.write(name, basename(name))
+            z.writestr("README.txt", "Not a CIM document.")
+            z.close()
+            d = cimread(path)
+            self.assertEqual(len(d), 5893)
+            ec = d["_6697f8dc7c74437983801f587d56dc1"]
+            self.assertEqual(ec.customerCount, 15)
+            self.assertEqual(ec.Location.UUID,
+                             "_aa85c78ae6d34d89a1d4872236ae6149")
+            self.assertEqual(len(cimread_many([path], processes=True,
+                                              workers=2)), 5893)
+            self.assertRaises(ValueError, cimiterparse, path)
+        finally:
+            shutil.rmtree(tmp)
+
+    def testNested(self):
+        """Test reading objects described in the properties of others.
+        """
+        d = cimread(StringIO(NESTED_HEADER + NESTED_NODE % (0, 0, 0) +
+                             "</rdf:RDF>\n"))
+
+        self.assertEqual(sorted(d), ["_node0", "_terminal0a", "_terminal0b"])
+        node = d["_node0"]
+        self.assertEqual(node.Terminals, [d["_terminal0a"], d["_terminal0b"]])
+        for uuid in ("_terminal0a", "_terminal0b"):
+            self.assertTrue(d[uuid].ConnectivityNode is node)
+
     def testProfile(self):
         d = {}
 
@@ -61,6 +226,236 @@ class RDFXMLReaderTestCase(unittest.TestCase):
 
         self.assertEqual(len(d), 5894)
 
+    def testMany(self):
+        """Test parsing of several documents into one model.
+        """
+        sources = [ASSET_FILE, CONN_FILE, EQUIP_FILE, GEO_FILE]
+        for processes in [False, True]:
+            d = cimread_many(sources, workers=2, processes=processes)
+
+            # IEC61970CIMVersion is defined in each of the documents.
+            self.assertEqual(len(d), 5893)
+
+            # Described in the EQUIP and GEO documents.
+            ec = d["_6697f8dc7c74437983801f587d56dc1"]
+            self.assertEqual(ec.customerCount, 15)
+            self.assertEqual(ec.Location.UUID,
+                             "_aa85c78ae6d34d89a1d4872236ae6149")
+            self.assertTrue(ec in ec.Location.PowerSystemResources)
+
+            # Reference from the ASSET document into the EQUIP document.
+            end = d["_30a5fb19766a44c08e31e6b2c0d534d2"]
+            self.assertEqual(end.TransformerEndInfo.UUID,
+                             "_30a5fb19766a44c08e31e6b2c0d534d2_WI")
+
+    def testParallel(self):
+        """Test parsing of a document split into chunks.
+        """
+        header, footer, bounds = RDFXMLReader._split(RDFXML_FILE, 100000)
+        self.assertTrue(header.endswith(
+            'xmlns:cim="http://iec.ch/TC57/2010/CIM-schema-cim15#">'))
+        self.assertEqual(footer, "</rdf:RDF>")
+        self.assertTrue(len(bounds) > 2)
+
+        d = cimread(RDFXML_FILE)
+        dd = cimread_parallel(RDFXML_FILE, workers=2, chunksize=100000)
+
+        self.assertEqual(len(dd), 5894)
+        for uuid, obj in d.iteritems():
+            other = dd[uuid]
+            self.assertEqual(obj.__class__, other.__class__)
+            self.assertEqual(getattr(obj, "name", None),
+                             getattr(other, "name", None))
+            if hasattr(obj, "ConnectivityNode"):
+                self.assertEqual(obj.ConnectivityNode.UUID,
+                                 other.ConnectivityNode.UUID)
+
+        # Chunks that split nested elements can not be parsed.
+        tmp = tempfile.mkdtemp()
+        try:
+            path = join(tmp, "nested.xml")
+            f = open(path, "wb")
+            f.write(NESTED_HEADER)
+            for i in range(2000):
+                f.write(NESTED_NODE % (i, i, i))
+            f.write("</rdf:RDF>\n")
+            f.close()
+
+            self.assertTrue(len(RDFXMLReader._split(path, 10000)[2]) > 2)
+            dd = cimread_parallel(path, workers=2, chunksize=10000)
+            self.assertEqual(len(dd), 6000)
+            for i in range(2000):
+                node = dd["_node%d" % i]
+                self.assertEqual([t.UUID for t in node.Terminals],
+                                 ["_terminal%da" % i, "_terminal%db" % i])
+                self.assertEqual(node.Terminals[0].__class__.__name__,
+                                 "Terminal")
+
+            # Documents of one chunk are read without a pool of processes.
+            self.assertEqual(len(RDFXMLReader._split(path, 1 << 24)[2]), 1)
+            pool = RDFXMLReader.Pool
+            RDFXMLReader.Pool = None
+            try:
+                dd = cimread_parallel(path, workers=2)
+            finally:
+                RDFXMLReader.Pool = pool
+            self.assertEqual(len(dd), 6000)
+        finally:
+            shutil.rmtree(tmp)
+
+    def testIterparse(self):
+        """Test iteration over the CIM objects in a document.
+        """
+        records = cimiterparse(RDFXML_FILE)
+        first = records.next()
+        self.assertEqual(first.name, "NameTypeAuthority")
+        self.assertEqual(first.uuid, "_c354e390-236e-11e0-8cca-005056c00008")
+        self.assertEqual(first.attributes, {"name": "Default",
+                                            "description": "Default Authority"})
+        self.assertEqual(first.references, [])
+        self.assertEqual(sum(1 for _ in records), 5893)
+
+        terminals = [r for r in cimiterparse(RDFXML_FILE)
+                     if r.name == "Terminal"]
+        self.assertTrue(terminals)
+        for r in terminals:
+            names = [name for name, _ in r.references]
+            self.assertTrue("ConnectivityNode" in names)
+
+        d = cimread(RDFXML_FILE)
+        n = 0
+        for obj in cimiterparse(RDFXML_FILE, objects=True):
+            self.assertEqual(obj.__class__, d[obj.UUID].__class__)
+            n += 1
+        self.assertEqual(n, 5894)
+
+    def testRegistry(self):
+        """Test resolution of element tags to classes and properties.
+        """
+        from CIM15.IEC61970.Core import Terminal
+
+        registry = RDFXMLReader.get_registry(packageMapCIM15, nsURICIM15)
+        self.assertTrue(
+            RDFXMLReader.get_registry(packageMapCIM15, nsURICIM15) is registry)
+
+        base = "{%s#}" % nsURICIM15
+        self.assertEqual(registry.resolve_class(base + "Terminal"), Terminal)
+        self.assertEqual(registry.classes[base + "Terminal"], Terminal)
+        self.assertEqual(registry.resolve_class(base + "Foo"), None)
+
+        self.assertEqual(registry.resolve_property(Terminal,
+            base + "Terminal.ConnectivityNode"),
+            ("ConnectivityNode", RDFXMLReader.REFERENCE, None))
+        self.assertEqual(registry.resolve_property(Terminal,
+            base + "IdentifiedObject.name"),
+            ("name", RDFXMLReader.ATTRIBUTE, RDFXMLReader.to_str))
+        self.assertEqual(registry.resolve_property(Terminal,
+            base + "Terminal.Measurements"),
+            ("Measurements", RDFXMLReader.MANY, None))
+        self.assertEqual(registry.resolve_property(Terminal,
+            base + "Terminal.foo"), None)
+
+    def testConverters(self):
+        """Test conversion of attribute values.
+        """
+        self.assertEqual(RDFXMLReader.to_bool("false"), False)
+        self.assertEqual(RDFXMLReader.to_bool(" True "), True)
+        self.assertRaises(ValueError, RDFXMLReader.to_bool, "yes")
+        self.assertEqual(RDFXMLReader.to_int("42"), 42)
+        self.assertEqual(RDFXMLReader.to_int("42.0"), 42)
+        self.assertRaises(ValueError, RDFXMLReader.to_int, "4.2")
+        self.assertEqual(RDFXMLReader.to_str(None), "")
+
+        d = cimread(RDFXML_FILE)
+        switches = [o for o in d.itervalues() if hasattr(o, "normalOpen")]
+        self.assertEqual(len(switches), 115)
+        self.assertEqual(len([o for o in switches if o.normalOpen]), 5)
+
+    def testProjection(self):
+        """Test reading selected classes and attributes.
+        """
+        d = cimread(RDFXML_FILE, exclude=["Location", "PositionPoint"])
+        names = set([o.__class__.__name__ for o in d.itervalues()])
+        self.assertFalse(names & set(["Location", "PositionPoint"]))
+        ec = d["_6697f8dc7c74437983801f587d56dc1"]
+        self.assertEqual(ec.Location, None)
+        self.assertEqual(ec.customerCount, 15)
+
+        d = cimread(RDFXML_FILE, include=["ConductingEquipment", "Terminal"])
+        self.assertTrue(d)
+        for obj in d.itervalues():
+            self.assertTrue(obj.__class__.__name__ == "Terminal" or
+                "ConductingEquipment" in [c.__name__ for c in
+                                          obj.__class__.mro()])
+        ec = d["_6697f8dc7c74437983801f587d56dc1"]
+        self.assertTrue(ec.Terminals)
+        self.assertEqual(ec.BaseVoltage, None)
+
+        d = cimread(RDFXML_FILE, include=["EnergyConsumer"],
+                    attributes=["IdentifiedObject.name"])
+        ec = d["_6697f8dc7c74437983801f587d56dc1"]
+        self.assertNotEqual(ec.name, "")
+        self.assertEqual(ec.customerCount, 0)
+
+        # References to objects that are not selected are dropped without
+        # error, but missing objects are still reported.
+        errors = []
+        handler = logging.Handler(logging.ERROR)
+        handler.emit = lambda record: errors.append(record.getMessage())
+        logger = logging.getLogger(RDFXMLReader.__name__)
+        logger.addHandler(handler)
+        try:
+            d = cimread(StringIO(DANGLING_MODEL), exclude=["ConnectivityNode"])
+        finally:
+            logger.removeHandler(handler)
+        self.assertEqual(sorted(d), ["_t1", "_t2"])
+        self.assertEqual(len(errors), 1)
+        self.assertTrue("_missing" in errors[0])
+
+    def testInterned(self):
+        """Test sharing of equal strings read from a document.
+        """
+        interner = RDFXMLReader.Interner(["Terminal.phases", "name"])
+        d = cimread(RDFXML_FILE, interned=interner)
+        self.assertTrue(interner.saved > 0)
+
+        terminals = [o for o in d.itervalues()
+                     if o.__class__.__name__ == "Terminal"]
+        names = {}
+        for t in terminals:
+            self.assertTrue(names.setdefault(t.name, t.name) is t.name)
+            self.assertTrue(t.phases is terminals[0].phases)
+
+    def testApply(self):
+        """Test application of a difference model.
+        """
+        d = cimread(RDFXML_FILE)
+        n = len(d)
+        ec = d["_6697f8dc7c74437983801f587d56dc1"]
+        terminal = d["_ec779cc5cbc840d5bfbf3d7ed962525"]
+        node = terminal.ConnectivityNode
+        location = ec.Location
+
+        cimapply(d, StringIO(DIFFERENCE_MODEL))
+        self.assertEqual(len(d), n)
+        self.assertEqual(ec.customerCount, 20)
+        self.assertEqual(ec.Location, None)
+        self.assertFalse("_aa85c78ae6d34d89a1d4872236ae6149" in d)
+        self.assertEqual(location.PowerSystemResources, [])
+        self.assertEqual(location.PositionPoints, [])
+        self.assertEqual(terminal.ConnectivityNode.name, "New node")
+        self.assertEqual(terminal.ConnectivityNode.Terminals, [terminal])
+        self.assertFalse(terminal in node.Terminals)
+
+        cimapply(d, StringIO(DIFFERENCE_MODEL), reverse=True)
+        self.assertEqual(len(d), n)
+        self.assertEqual(ec.customerCount, 15)
+        self.assertEqual(ec.Location.UUID, location.UUID)
+        self.assertEqual(ec.Location.PowerSystemResources, [ec])
+        self.assertFalse("_node" in d)
+        self.assertTrue(terminal.ConnectivityNode is node)
+        self.assertTrue(terminal in node.Terminals)
+
     def testGetNamespaces(self):
         ns = RDFXMLReader.xmlns(RDFXML_FILE)
         self.assertEqual(ns, {
@@ -76,6 +471,5 @@ class RDFXMLReaderTestCase(unittest.TestCase):
 
 
 if __name__ == "__main__":
-    import logging
     logging.basicConfig(level=logging.INFO)
     unittest.main()
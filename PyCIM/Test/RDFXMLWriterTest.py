@@ -18,13 +18,23 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import gc
 import unittest
 import StringIO
 
-from PyCIM import cimread, cimwrite
+from PyCIM import cimread, cimread_many, cimwrite, cimwrite_parallel, \
+    cimwrite_profiles, cimiterparse
+from PyCIM.RDFXMLWriter import RDFXMLEmitter
 
 from os.path import dirname, join
 
+import CIM14
+
+from CIM14.IEC61970.Core import ConnectivityNode, Terminal
+from CIM14.CDPSM.Balanced import packageMap as balancedMap
+from CIM14.CDPSM.Balanced.IEC61970.Core import Terminal as BalancedTerminal
+from CIM15.CDPSM import Asset, Connectivity, Balanced, Geographical
+
 
 RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
 
@@ -48,6 +58,137 @@ class RDFXMLWriterTestCase(unittest.TestCase):
 
         self.assertEqual(len(dd), 5894)
 
+    def testBulk(self):
+        """Test reading and writing with the garbage collector suspended.
+        """
+        d = cimread(RDFXML_FILE)
+        dd = cimread(RDFXML_FILE, bulk=True, freeze=True)
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(len(dd), len(d))
+
+        output, bulk = StringIO.StringIO(), StringIO.StringIO()
+        cimwrite(d, output)
+        cimwrite(dd, bulk, bulk=True)
+        self.assertTrue(gc.isenabled())
+        self.assertEqual(bulk.getvalue(), output.getvalue())
+
+    def testEmitter(self):
+        """Test buffered serialisation and escaping.
+        """
+        d = cimread(RDFXML_FILE)
+        obj = d.values()[0]
+        obj.name = "a < b & 'c'"
+
+        output = StringIO.StringIO()
+        cimwrite(d, output)
+
+        buffered = StringIO.StringIO()
+        emitter = RDFXMLEmitter(buffered, buffer_size=100)
+        for o in d.itervalues():
+            emitter.append(o)
+        emitter.close()
+        self.assertEqual(emitter.count, len(d))
+        self.assertEqual(buffered.getvalue(), output.getvalue())
+
+        self.assertTrue("a &lt; b &amp; 'c'" in output.getvalue())
+        output.seek(0)
+        self.assertEqual(cimread(output)[obj.UUID].name, obj.name)
+
+    def testStream(self):
+        """Test serialisation of iterables of records and objects.
+        """
+        d = cimread(RDFXML_FILE)
+
+        output = StringIO.StringIO()
+        cimwrite(cimiterparse(RDFXML_FILE), output)
+        output.seek(0)
+        dd = cimread(output)
+
+        self.assertEqual(len(dd), len(d))
+        for uuid, obj in d.iteritems():
+            for attr in obj._meta.attrs:
+                self.assertEqual(getattr(dd[uuid], attr), getattr(obj, attr))
+
+        output = StringIO.StringIO()
+        cimwrite(d, output)
+
+        streamed = StringIO.StringIO()
+        with RDFXMLEmitter(streamed) as emitter:
+            for obj in d.itervalues():
+                emitter.append(obj)
+        self.assertEqual(streamed.getvalue(), output.getvalue())
+
+    def testParallel(self):
+        """Test serialisation of chunks of objects on a pool of processes.
+        """
+        d = cimread(RDFXML_FILE)
+
+        output = StringIO.StringIO()
+        cimwrite(d, output)
+
+        parallel = StringIO.StringIO()
+        cimwrite_parallel(d, parallel, workers=2, chunksize=1000)
+        self.assertEqual(parallel.getvalue(), output.getvalue())
+
+    def testProfiles(self):
+        """Test serialisation of the documents of several profiles.
+        """
+        d = cimread(RDFXML_FILE)
+
+        profiles = [(Asset.packageMap, StringIO.StringIO()),
+                    (Connectivity.packageMap, StringIO.StringIO()),
+                    (Balanced.packageMap, StringIO.StringIO()),
+                    (Geographical.packageMap, StringIO.StringIO())]
+        cimwrite_profiles(d, profiles)
+
+        dd = cimread_many([StringIO.StringIO(output.getvalue())
+                           for _, output in profiles])
+
+        # IEC61970CIMVersion is not in the profiles.
+        self.assertEqual(len(dd), len(d) - 1)
+
+        ec = dd["_6697f8dc7c74437983801f587d56dc1"]
+        self.assertEqual(ec.customerCount, 15)
+        self.assertEqual(ec.Location.UUID, "_aa85c78ae6d34d89a1d4872236ae6149")
+
+    def testNamespace(self):
+        """Test serialisation in the namespace of the CIM version.
+        """
+        node = ConnectivityNode(UUID="_node")
+        terminal = Terminal(UUID="_terminal", ConnectivityNode=node)
+
+        output = StringIO.StringIO()
+        cimwrite([node, terminal], output)
+        self.assertTrue('xmlns:cim="%s#"' % CIM14.nsURI in output.getvalue())
+
+        output.seek(0)
+        d = cimread(output)
+        self.assertTrue(isinstance(d["_terminal"], Terminal))
+        self.assertTrue(d["_terminal"].ConnectivityNode is d["_node"])
+
+        # Profile classes are written in the namespace of their version.
+        output = StringIO.StringIO()
+        cimwrite([BalancedTerminal(UUID="_terminal")], output)
+        output.seek(0)
+        d = cimread(output, balancedMap, CIM14.nsURI)
+        self.assertTrue(isinstance(d["_terminal"], BalancedTerminal))
+
+        output = StringIO.StringIO()
+        cimwrite([terminal], output, nsURI="http://example.com/cim",
+                 nsPrefix="ex")
+        self.assertTrue('xmlns:ex="http://example.com/cim#"' in
+                        output.getvalue())
+        self.assertTrue('<ex:Terminal rdf:ID="_terminal">' in
+                        output.getvalue())
+
+    def testEmpty(self):
+        """Test serialisation of an empty model.
+        """
+        output = StringIO.StringIO()
+        cimwrite({}, output)
+        self.assertTrue(output.getvalue().endswith(" />"))
+        self.assertEqual(len(cimread(StringIO.StringIO(output.getvalue()))), 0)
+
 
 if __name__ == "__main__":
     import logging
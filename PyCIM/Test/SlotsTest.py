@@ -0,0 +1,81 @@
+# Copyright (C) 2010-2011 Richard Lincoln
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+import cPickle
+import unittest
+
+from StringIO import StringIO
+from os.path import dirname, join
+
+from CIM15 import nsURI, packageMap
+from CIM15.IEC61970.Core import ConnectivityNode, Terminal
+
+from PyCIM import cimread, cimwrite
+from PyCIM.Slots import slotted, slotted_map
+
+
+RDFXML_FILE = join(dirname(__file__), "Data", "EDF_AIGUE_v9_COMBINED.xml")
+
+
+class SlotsTestCase(unittest.TestCase):
+    """Test the slotted variants of CIM classes.
+    """
+
+    def testClass(self):
+        """Test instances of slotted classes.
+        """
+        SlottedTerminal = slotted(Terminal)
+        SlottedConnectivityNode = slotted(ConnectivityNode)
+
+        self.assertTrue(slotted(Terminal) is SlottedTerminal)
+        self.assertEqual(SlottedTerminal.__name__, "Terminal")
+        self.assertEqual(SlottedTerminal._attrs, Terminal._attrs)
+
+        cn = SlottedConnectivityNode(name="cn")
+        t = SlottedTerminal(name="t", ConnectivityNode=cn)
+        self.assertFalse(hasattr(t, "__dict__"))
+        self.assertRaises(AttributeError, setattr, t, "foo", 1)
+        self.assertEqual(cn.Terminals, [t])
+        self.assertTrue(isinstance(t, slotted(Terminal.__bases__[0])))
+
+        t.ConnectivityNode = None
+        self.assertEqual(cn.Terminals, [])
+
+        t = cPickle.loads(cPickle.dumps(t, 2))
+        self.assertEqual(t.name, "t")
+
+    def testRead(self):
+        """Test reading and writing of slotted CIM objects.
+        """
+        d = cimread(RDFXML_FILE)
+        ds = cimread(RDFXML_FILE, slotted_map(packageMap), nsURI)
+
+        self.assertEqual(len(ds), len(d))
+        for obj in ds.itervalues():
+            self.assertFalse(hasattr(obj, "__dict__"))
+
+        a = StringIO()
+        cimwrite(d, a)
+        b = StringIO()
+        cimwrite(ds, b)
+        self.assertEqual(a.getvalue(), b.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
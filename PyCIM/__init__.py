@@ -18,7 +18,14 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
-from RDFXMLReader import cimread
-from RDFXMLWriter import cimwrite
+from RDFXMLReader import cimread, cimread_many, cimread_parallel, cimiterparse, \
+    cimapply
+from RDFXMLWriter import cimwrite, cimwrite_parallel, cimwrite_profiles, \
+    RDFXMLEmitter
+from BulkLinker import BulkLinker
+from Slots import slotted, slotted_map
+from Bundle import cimbundle
+from Columnar import columnar
+from BulkMode import bulkmode
 
 __version__ = "15.13.2"